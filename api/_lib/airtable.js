@@ -297,6 +297,17 @@ const cancelSubscription = async (subscriptionId) => {
 
 // ============ UTILITIES ============
 
+// Top no-show drivers precomputed by ml-training-data/batch_score.py (JSON text field)
+const parseRiskDrivers = (value) => {
+  if (!value) return [];
+  if (Array.isArray(value)) return value;
+  try {
+    return JSON.parse(value);
+  } catch (error) {
+    return [];
+  }
+};
+
 const generateReservationId = () => {
   const today = new Date();
   const dateStr = today.toISOString().split('T')[0].replace(/-/g, '');
@@ -434,7 +445,8 @@ const getUpcomingReservations = async () => {
     no_show_risk_score: r.fields['ML Risk Score'],
     no_show_risk_level: r.fields['ML Risk Level'],
     prediction_confidence: r.fields['ML Confidence'],
-    ml_model_version: r.fields['ML Model Version']
+    ml_model_version: r.fields['ML Model Version'],
+    risk_drivers: parseRiskDrivers(r.fields['ML Risk Drivers'])
   }));
 
   // Sort by date and time (earliest first)
@@ -569,5 +581,6 @@ module.exports = {
 
   // Utilities
   generateReservationId,
-  generateServiceId
+  generateServiceId,
+  parseRiskDrivers
 };
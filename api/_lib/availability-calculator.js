@@ -2,18 +2,86 @@
  * Restaurant Availability Calculator
  *
  * Calculates table availability considering:
- * - Dining duration based on party size
+ * - Dining duration based on party size (and weekday/hour when learned durations exist)
  * - Overlapping reservations
- * - Restaurant capacity
+ * - Restaurant capacity (plus simulated overbooking allowances when they exist)
  * - Time slot management
  */
 
+/**
+ * Load the learned duration tables (generated by ml-training-data/dining_durations.py)
+ * Returns null if they have not been built - getDiningDuration then uses its fixed blocks.
+ */
+function loadDiningDurations() {
+  try {
+    return require('./dining-durations');
+  } catch (error) {
+    return null;
+  }
+}
+
+const DINING_DURATIONS = loadDiningDurations();
+
+/**
+ * Load the overbooking allowances (generated by ml-training-data/overbooking.py)
+ * Returns null if they have not been built - availability then stops at capacity.
+ */
+function loadOverbooking() {
+  try {
+    return require('./overbooking');
+  } catch (error) {
+    return null;
+  }
+}
+
+const OVERBOOKING = loadOverbooking();
+
+/**
+ * Get the seats that may be booked in the slot containing a time
+ *
+ * The simulator allows booked seats beyond capacity while the probability of
+ * more guests showing than there are seats stays within its risk limit. Only
+ * used for simulated nights at the simulated capacity; otherwise capacity.
+ *
+ * @param {number} restaurantCapacity - Total restaurant capacity
+ * @param {string} time - Time (HH:MM)
+ * @param {string} date - Reservation date (YYYY-MM-DD), optional
+ * @returns {number} Bookable seats
+ */
+function getBookableSeats(restaurantCapacity, time, date = null) {
+  const night = OVERBOOKING && date && OVERBOOKING.capacity === restaurantCapacity
+    ? OVERBOOKING.nights[date]
+    : null;
+  if (!night) return restaurantCapacity;
+
+  const [hours, minutes] = time.split(':').map(Number);
+  const slot = Math.floor((hours * 60 + minutes - night.startMinute) / OVERBOOKING.slotMinutes);
+  const bookable = night.bookableSeats[slot];
+
+  return bookable ? Math.max(restaurantCapacity, bookable) : restaurantCapacity;
+}
+
 /**
  * Get expected dining duration in minutes based on party size
+ *
+ * With learned durations, looks up [party size][weekday][hour] (or
+ * [party size][hour] without a date); otherwise fixed blocks by party size.
+ *
  * @param {number} partySize - Number of guests
+ * @param {string} time - Reservation time (HH:MM), optional
+ * @param {string} date - Reservation date (YYYY-MM-DD), optional
  * @returns {number} Duration in minutes
  */
-function getDiningDuration(partySize) {
+function getDiningDuration(partySize, time = null, date = null) {
+  if (DINING_DURATIONS && time) {
+    const party = Math.min(Math.max(parseInt(partySize) || 1, 1), DINING_DURATIONS.maxPartySize) - 1;
+    const hour = parseInt(time.split(':')[0]);
+    const day = date ? new Date(`${date}T00:00:00`).getDay() : NaN;
+
+    const byHour = isNaN(day) ? DINING_DURATIONS.byPartyHour[party] : DINING_DURATIONS.byPartyDayHour[party][day];
+    if (byHour && byHour[hour]) return byHour[hour];
+  }
+
   if (partySize <= 2) return 90;  // 1.5 hours
   if (partySize <= 4) return 120; // 2 hours
   if (partySize <= 6) return 120; // 2 hours
@@ -71,7 +139,7 @@ function getOccupiedSeatsAtTime(reservations, checkTime) {
   reservations.forEach(reservation => {
     const resTime = reservation.fields.Time;
     const partySize = reservation.fields['Party Size'] || 0;
-    const duration = getDiningDuration(partySize);
+    const duration = getDiningDuration(partySize, resTime, reservation.fields.Date);
     const endTime = addMinutesToTime(resTime, duration);
 
     // Check if this reservation overlaps with our check time
@@ -92,10 +160,11 @@ function getOccupiedSeatsAtTime(reservations, checkTime) {
  * @param {number} partySize - Number of guests
  * @param {Array} existingReservations - Array of existing reservations for that date
  * @param {number} restaurantCapacity - Total restaurant capacity
+ * @param {string} date - Reservation date (YYYY-MM-DD), optional - used for learned durations and overbooking
  * @returns {Object} { available: boolean, reason: string, occupiedSeats: number }
  */
-function checkTimeSlotAvailability(requestedTime, partySize, existingReservations, restaurantCapacity) {
-  const duration = getDiningDuration(partySize);
+function checkTimeSlotAvailability(requestedTime, partySize, existingReservations, restaurantCapacity, date = null) {
+  const duration = getDiningDuration(partySize, requestedTime, date);
   const endTime = addMinutesToTime(requestedTime, duration);
 
   // Check every 15 minutes during the dining period
@@ -108,14 +177,15 @@ function checkTimeSlotAvailability(requestedTime, partySize, existingReservation
   for (let i = 0; i <= timeChecks; i++) {
     const checkTime = addMinutesToTime(requestedTime, i * checkInterval);
     const occupied = getOccupiedSeatsAtTime(existingReservations, checkTime);
+    const bookableSeats = getBookableSeats(restaurantCapacity, checkTime, date);
 
     if (occupied > maxOccupied) {
       maxOccupied = occupied;
       problematicTime = checkTime;
     }
 
-    // Check if adding this party would exceed capacity
-    if (occupied + partySize > restaurantCapacity) {
+    // Check if adding this party would exceed capacity (or the overbooking allowance)
+    if (occupied + partySize > bookableSeats) {
       return {
         available: false,
         reason: `Restaurant will be at capacity around ${problematicTime}`,
@@ -143,16 +213,17 @@ function checkTimeSlotAvailability(requestedTime, partySize, existingReservation
  * @param {number} restaurantCapacity - Restaurant capacity
  * @param {string} openTime - Restaurant opening time (HH:MM)
  * @param {string} closeTime - Restaurant closing time (HH:MM)
+ * @param {string} date - Reservation date (YYYY-MM-DD), optional - used for learned durations
  * @returns {Array} Array of available time suggestions
  */
-function getSuggestedTimes(requestedTime, partySize, existingReservations, restaurantCapacity, openTime = '17:00', closeTime = '22:00') {
+function getSuggestedTimes(requestedTime, partySize, existingReservations, restaurantCapacity, openTime = '17:00', closeTime = '22:00', date = null) {
   const suggestions = [];
   const timeSlotInterval = 30; // Check every 30 minutes
 
   // Try earlier times (up to 2 hours before)
   for (let i = 1; i <= 4; i++) {
     const checkTime = addMinutesToTime(requestedTime, -i * timeSlotInterval);
-    const result = checkTimeSlotAvailability(checkTime, partySize, existingReservations, restaurantCapacity);
+    const result = checkTimeSlotAvailability(checkTime, partySize, existingReservations, restaurantCapacity, date);
 
     if (result.available && checkTime >= openTime) {
       suggestions.push({
@@ -165,10 +236,10 @@ function getSuggestedTimes(requestedTime, partySize, existingReservations, resta
   // Try later times (up to 2 hours after)
   for (let i = 1; i <= 4; i++) {
     const checkTime = addMinutesToTime(requestedTime, i * timeSlotInterval);
-    const duration = getDiningDuration(partySize);
+    const duration = getDiningDuration(partySize, checkTime, date);
     const endTime = addMinutesToTime(checkTime, duration);
 
-    const result = checkTimeSlotAvailability(checkTime, partySize, existingReservations, restaurantCapacity);
+    const result = checkTimeSlotAvailability(checkTime, partySize, existingReservations, restaurantCapacity, date);
 
     if (result.available && endTime <= closeTime) {
       suggestions.push({
@@ -198,6 +269,7 @@ function getSuggestedTimes(requestedTime, partySize, existingReservations, resta
 
 module.exports = {
   getDiningDuration,
+  getBookableSeats,
   addMinutesToTime,
   timeRangesOverlap,
   getOccupiedSeatsAtTime,
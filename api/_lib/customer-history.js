@@ -6,6 +6,7 @@
  */
 
 const axios = require('axios');
+const crypto = require('crypto');
 
 const AIRTABLE_API_KEY = process.env.AIRTABLE_API_KEY;
 const AIRTABLE_BASE_ID = process.env.AIRTABLE_BASE_ID;
@@ -332,6 +333,58 @@ function calculateDaysSinceLastVisit(lastVisitDate) {
   return diffDays;
 }
 
+// ============================================================================
+// SNAPSHOT LOOKUP (generated by ml-training-data/customer_features.py)
+// ============================================================================
+
+let SNAPSHOT = undefined;
+
+function loadSnapshot() {
+  if (SNAPSHOT === undefined) {
+    try {
+      SNAPSHOT = require('../ml/customer-snapshot');
+    } catch (error) {
+      console.warn('[CustomerHistory] No customer snapshot available:', error.message);
+      SNAPSHOT = null;
+    }
+  }
+  return SNAPSHOT;
+}
+
+/**
+ * Snapshot key: sha256 of the lower-cased email, else 'tel:' + normalized phone
+ * (must match customer_keys/hash_key in customer_features.py)
+ */
+function snapshotKey(email, phone) {
+  const normalizedEmail = (email || '').trim().toLowerCase();
+  const normalizedPhone = (phone || '').replace(/[\s\-\(\)]/g, '');
+  const key = normalizedEmail || (normalizedPhone ? `tel:${normalizedPhone}` : '');
+  if (!key) return null;
+
+  return crypto.createHash('sha256').update(key, 'utf8').digest('hex').slice(0, 16);
+}
+
+/**
+ * Customer history from the precomputed snapshot, shaped like an Airtable
+ * Customer History record ({ fields }) so features.js can read it directly.
+ * Returns null for unknown customers (features.js then uses new-customer defaults).
+ */
+function findSnapshotCustomer(email, phone) {
+  const snapshot = loadSnapshot();
+  const key = snapshotKey(email, phone);
+  if (!snapshot || !key || !snapshot.customers[key]) {
+    return null;
+  }
+
+  const values = snapshot.customers[key];
+  const fields = {};
+  snapshot.fields.forEach((name, i) => {
+    if (values[i] !== null) fields[name] = values[i];
+  });
+
+  return { id: null, source: 'snapshot', snapshotGeneratedAt: snapshot.generatedAt, fields };
+}
+
 // ============================================================================
 // BACKFILL HISTORICAL DATA
 // ============================================================================
@@ -444,6 +497,7 @@ module.exports = {
 
   // Stats
   getCustomerStats,
+  findSnapshotCustomer,
   calculateDaysSinceLastVisit,
 
   // Backfill
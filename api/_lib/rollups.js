@@ -0,0 +1,38 @@
+/**
+ * Daily Analytics Rollups
+ *
+ * Shared loader for the rollups generated by ml-training-data/analytics_rollups.py
+ * (api/_lib/analytics-rollups.js), used by api/analytics.js and
+ * api/predictive-analytics.js.
+ */
+
+// Rollups older than this are ignored (the rollup job has stopped) - full scan instead
+const ROLLUP_MAX_AGE_MS = 36 * 60 * 60 * 1000;
+
+/**
+ * Load the daily rollups
+ * Returns null if they have not been built - every record is fetched instead.
+ */
+function loadRollups() {
+  try {
+    return require('./analytics-rollups');
+  } catch (error) {
+    return null;
+  }
+}
+
+const ROLLUPS = loadRollups();
+
+/**
+ * True if the rollups exist and were generated within ROLLUP_MAX_AGE_MS of now
+ */
+function rollupsAreFresh(rollups, now = new Date()) {
+  return Boolean(rollups) && now.getTime() - new Date(rollups.generatedAt).getTime() < ROLLUP_MAX_AGE_MS;
+}
+
+module.exports = {
+  ROLLUP_MAX_AGE_MS,
+  ROLLUPS,
+  loadRollups,
+  rollupsAreFresh
+};
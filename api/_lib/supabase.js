@@ -5,6 +5,7 @@
  */
 
 const { createClient } = require('@supabase/supabase-js');
+const { parseRiskDrivers } = require('./airtable');
 
 // Initialize Supabase client
 const supabaseUrl = process.env.SUPABASE_URL;
@@ -74,7 +75,8 @@ const getReservations = async (filter = {}) => {
           'ML Risk Level': r.ml_risk_level,
           'ML Confidence': r.ml_confidence,
           'ML Model Version': r.ml_model_version,
-          'ML Prediction Timestamp': r.ml_prediction_timestamp
+          'ML Prediction Timestamp': r.ml_prediction_timestamp,
+          'ML Risk Drivers': r.ml_risk_drivers
         }
       }))
     }
@@ -158,6 +160,8 @@ const updateReservation = async (recordId, fields) => {
   if (fields['ML Confidence']) updates.ml_confidence = fields['ML Confidence'];
   if (fields['ML Model Version']) updates.ml_model_version = fields['ML Model Version'];
   if (fields['ML Prediction Timestamp']) updates.ml_prediction_timestamp = fields['ML Prediction Timestamp'];
+  // '' clears drivers once a reservation is no longer high risk
+  if (fields['ML Risk Drivers'] !== undefined) updates.ml_risk_drivers = fields['ML Risk Drivers'];
 
   const { data, error } = await supabase
     .from('reservations')
@@ -745,7 +749,8 @@ const getUpcomingReservations = async () => {
     no_show_risk_score: r.ml_risk_score,
     no_show_risk_level: r.ml_risk_level,
     prediction_confidence: r.ml_confidence,
-    ml_model_version: r.ml_model_version
+    ml_model_version: r.ml_model_version,
+    risk_drivers: parseRiskDrivers(r.ml_risk_drivers)
   }));
 
   return {
@@ -872,5 +877,6 @@ module.exports = {
 
   // Utilities
   generateReservationId,
-  generateServiceId
+  generateServiceId,
+  parseRiskDrivers
 };
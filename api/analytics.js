@@ -2,6 +2,7 @@ const {
   getAllTables,
   getActiveServiceRecords
 } = require('./_lib/supabase');
+const { ROLLUPS, rollupsAreFresh } = require('./_lib/rollups');
 
 const axios = require('axios');
 
@@ -10,6 +11,16 @@ const AIRTABLE_BASE_ID = process.env.AIRTABLE_BASE_ID;
 const RESERVATIONS_TABLE_ID = process.env.RESERVATIONS_TABLE_ID;
 const SERVICE_RECORDS_TABLE_ID = process.env.SERVICE_RECORDS_TABLE_ID;
 
+const DAY_NAMES = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday'];
+
+function timeSlotName(hour) {
+  if (hour >= 11 && hour < 14) return 'Lunch (11AM-2PM)';
+  if (hour >= 17 && hour < 19) return 'Early Dinner (5PM-7PM)';
+  if (hour >= 19 && hour < 22) return 'Prime Dinner (7PM-10PM)';
+  if (hour >= 22) return 'Late Night (10PM+)';
+  return 'Other';
+}
+
 async function getAllReservations() {
   try {
     const url = 'https://api.airtable.com/v0/' + AIRTABLE_BASE_ID + '/' + RESERVATIONS_TABLE_ID;
@@ -42,7 +53,108 @@ async function getAllServiceRecordsData() {
   }
 }
 
+/**
+ * Same analytics from the daily rollups: only tables and active parties are fetched live
+ */
+async function calculateAnalyticsFromRollups(rollups) {
+  const [tablesResult, activePartiesResult] = await Promise.all([
+    getAllTables(),
+    getActiveServiceRecords()
+  ]);
+
+  if (!tablesResult.success) {
+    return { success: false, error: 'Failed to fetch analytics data' };
+  }
+
+  const tables = tablesResult.tables || [];
+  const activeParties = activePartiesResult.service_records || [];
+
+  const now = new Date();
+  const thirtyDaysAgo = new Date(now.getTime() - 30 * 24 * 60 * 60 * 1000).toISOString().split('T')[0];
+
+  const recentDays = rollups.daily.filter(day => day.date > thirtyDaysAgo);
+  const recentHours = rollups.hourly.filter(row => row.date > thirtyDaysAgo);
+  const totals = rollups.totals;
+
+  const totalReservations = recentDays.reduce((sum, day) => sum + day.reservations, 0);
+  const totalCovers = recentDays.reduce((sum, day) => sum + day.covers, 0);
+  const totalCapacity = tables.reduce((sum, table) => sum + table.capacity, 0);
+  const currentOccupancy = activeParties.reduce((sum, party) => sum + party.party_size, 0);
+
+  const avgPartySize = totalReservations > 0 ? totalCovers / totalReservations : 0;
+  const avgServiceTime = totals.turnCount > 0 ? totals.turnMinutes / totals.turnCount : 90;
+
+  const statusCounts = {};
+  const dayOfWeekCounts = {};
+  recentDays.forEach(day => {
+    Object.entries(day.byStatus).forEach(([status, count]) => {
+      statusCounts[status] = (statusCounts[status] || 0) + count;
+    });
+    const dayName = DAY_NAMES[new Date(`${day.date}T00:00:00Z`).getUTCDay()];
+    dayOfWeekCounts[dayName] = (dayOfWeekCounts[dayName] || 0) + day.reservations;
+  });
+
+  const timeSlotCounts = {};
+  recentHours.forEach(row => {
+    const slot = timeSlotName(row.hour);
+    timeSlotCounts[slot] = (timeSlotCounts[slot] || 0) + row.reservations;
+  });
+
+  const tableUtilization = tables.map(table => {
+    const timesUsed = totals.servicesByTable[table.table_number.toString()] || 0;
+    const rate = totals.completedServices > 0 ? (timesUsed / totals.completedServices * 100).toFixed(1) : 0;
+
+    return {
+      table_number: table.table_number,
+      capacity: table.capacity,
+      location: table.location,
+      times_used: timesUsed,
+      utilization_rate: rate
+    };
+  });
+
+  const last7Days = [];
+  for (let i = 0; i < 7; i++) {
+    const date = new Date(now);
+    date.setDate(date.getDate() - (6 - i));
+    const dateString = date.toISOString().split('T')[0];
+    const day = rollups.daily.find(d => d.date === dateString);
+    const days = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'];
+    last7Days.push({
+      date: dateString,
+      dayName: days[date.getDay()],
+      reservations: day ? day.reservations : 0,
+      completed_services: day ? day.completedServices : 0
+    });
+  }
+
+  return {
+    success: true,
+    analytics: {
+      overview: {
+        total_reservations: totalReservations,
+        total_completed_services: totals.completedServices,
+        avg_party_size: parseFloat(avgPartySize.toFixed(1)),
+        avg_service_time_minutes: Math.round(avgServiceTime),
+        total_capacity: totalCapacity,
+        current_occupancy: currentOccupancy,
+        current_occupancy_percentage: ((currentOccupancy / totalCapacity) * 100).toFixed(1)
+      },
+      reservations_by_status: statusCounts,
+      reservations_by_day: dayOfWeekCounts,
+      reservations_by_time_slot: timeSlotCounts,
+      table_utilization: tableUtilization.sort((a, b) => b.times_used - a.times_used),
+      daily_trend: last7Days,
+      rollups_generated_at: rollups.generatedAt
+    }
+  };
+}
+
 async function calculateAnalytics() {
+  if (rollupsAreFresh(ROLLUPS)) {
+    return calculateAnalyticsFromRollups(ROLLUPS);
+  }
+
   const results = await Promise.all([
     getAllReservations(),
     getAllServiceRecordsData(),
@@ -108,8 +220,7 @@ async function calculateAnalytics() {
   const dayOfWeekCounts = {};
   recentReservations.forEach(r => {
     const date = new Date(r.fields.Date);
-    const days = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday'];
-    const dayName = days[date.getDay()];
+    const dayName = DAY_NAMES[date.getDay()];
     dayOfWeekCounts[dayName] = (dayOfWeekCounts[dayName] || 0) + 1;
   });
 
@@ -117,11 +228,7 @@ async function calculateAnalytics() {
   recentReservations.forEach(r => {
     const time = r.fields.Time || '';
     const hour = parseInt(time.split(':')[0]) || 0;
-    let slot = 'Other';
-    if (hour >= 11 && hour < 14) slot = 'Lunch (11AM-2PM)';
-    else if (hour >= 17 && hour < 19) slot = 'Early Dinner (5PM-7PM)';
-    else if (hour >= 19 && hour < 22) slot = 'Prime Dinner (7PM-10PM)';
-    else if (hour >= 22) slot = 'Late Night (10PM+)';
+    const slot = timeSlotName(hour);
     timeSlotCounts[slot] = (timeSlotCounts[slot] || 0) + 1;
   });
 
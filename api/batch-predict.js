@@ -3,10 +3,15 @@
  *
  * Predicts no-show risk for multiple upcoming reservations
  * Useful for populating ML fields for existing reservations
+ *
+ * The nightly backfill is ml-training-data/batch_score.py --apply, which scores
+ * every pending reservation as one matrix and writes the ML fields (and risk
+ * drivers) in bulk. This endpoint only scores reservations that still have no
+ * score, i.e. the ones booked since that run.
  */
 
 const { getUpcomingReservations, updateReservation } = require('./_lib/supabase');
-const { getCustomerStats } = require('./_lib/customer-history');
+const { findSnapshotCustomer } = require('./_lib/customer-history');
 const { predictNoShow } = require('./ml/predict');
 
 module.exports = async (req, res) => {
@@ -60,8 +65,8 @@ module.exports = async (req, res) => {
       try {
         console.log(`  Processing: ${reservation.customer_name} (${reservation.reservation_id})`);
 
-        // Get customer history
-        const customerHistory = await getCustomerStats(
+        // Get customer history (precomputed snapshot)
+        const customerHistory = findSnapshotCustomer(
           reservation.customer_email,
           reservation.customer_phone
         );
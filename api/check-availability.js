@@ -57,7 +57,8 @@ module.exports = async (req, res) => {
       time,
       partySize,
       existingReservations,
-      capacity
+      capacity,
+      date
     );
 
     if (availabilityCheck.available) {
@@ -79,7 +80,8 @@ module.exports = async (req, res) => {
         existingReservations,
         capacity,
         openTime,
-        closeTime
+        closeTime,
+        date
       );
 
       return res.status(200).json({
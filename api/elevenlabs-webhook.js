@@ -276,7 +276,8 @@ async function handleCheckAvailability(req, res) {
       time,
       partySize,
       existingReservations,
-      effectiveCapacity
+      effectiveCapacity,
+      date
     );
 
     if (availabilityCheck.available) {
@@ -299,7 +300,8 @@ async function handleCheckAvailability(req, res) {
         existingReservations,
         effectiveCapacity,
         openTime,
-        closeTime
+        closeTime,
+        date
       );
 
       const response = {
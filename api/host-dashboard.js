@@ -13,6 +13,20 @@ const {
 const { logCustomerShowedUp, logCustomerCancelled } = require('./ml/data-logger');
 const { validateServiceRecord, sanitizeInput } = require('./_lib/validation');
 
+/**
+ * Load the nightly seating plan (generated by ml-training-data/seating_plan.py)
+ * Returns null if it has not been built - check-in then searches free tables.
+ */
+function loadSeatingPlan() {
+  try {
+    return require('./_lib/seating-plan');
+  } catch (error) {
+    return null;
+  }
+}
+
+const SEATING_PLAN = loadSeatingPlan();
+
 module.exports = async (req, res) => {
   res.setHeader('Access-Control-Allow-Origin', '*');
   res.setHeader('Access-Control-Allow-Methods', 'GET, POST, OPTIONS');
@@ -145,6 +159,35 @@ async function handleDashboard(req, res) {
   });
 }
 
+/**
+ * Recommendation for a reservation's planned tables, if all of them are free
+ * Returns null without a plan entry, when a planned table is still occupied,
+ * or when the party has grown past the planned seats.
+ */
+function plannedRecommendation(reservation, availableTables) {
+  const planned = SEATING_PLAN && SEATING_PLAN.assignments[reservation.reservation_id];
+  if (!planned) return null;
+
+  const tables = planned.tables.map(number =>
+    availableTables.find(table => String(table.table_number) === String(number))
+  );
+  if (tables.some(table => !table)) return null;
+
+  const totalCapacity = tables.reduce((sum, table) => sum + table.capacity, 0);
+  if (totalCapacity < reservation.party_size) return null;
+
+  const waste = totalCapacity - reservation.party_size;
+
+  return {
+    tables: tables.map(table => table.table_number),
+    total_capacity: totalCapacity,
+    match_quality: waste === 0 ? 'perfect' : waste <= 1 ? 'good' : waste <= 2 ? 'acceptable' : 'waste',
+    score: 100,
+    reason: `Planned seating for tonight (${tables.length > 1 ? 'combined tables, ' : ''}${totalCapacity} seats)`,
+    planned: true
+  };
+}
+
 async function handleCheckIn(req, res) {
   const { reservation_id } = req.body;
 
@@ -176,7 +219,10 @@ async function handleCheckIn(req, res) {
   }
 
   const availableTables = tablesResult.tables.filter(t => t.status === 'Available');
-  const recommendations = findBestTableCombination(availableTables, partySize);
+
+  // The nightly plan already weighed every party of the night; search only if its tables are taken
+  const planned = plannedRecommendation(reservation, availableTables);
+  const recommendations = planned ? [planned] : findBestTableCombination(availableTables, partySize);
 
   if (recommendations.length === 0) {
     return res.status(200).json({
@@ -491,3 +537,6 @@ async function handleUpdateTableStatus(req, res) {
     }
   });
 }
+
+// Exported for unit tests
+module.exports.plannedRecommendation = plannedRecommendation;
@@ -0,0 +1,99 @@
+/**
+ * Unit Tests for the Learned Durations and Overbooking Lookups
+ *
+ * The generated modules (ml-training-data/dining_durations.py and
+ * overbooking.py) are replaced with small hand-written tables.
+ */
+
+const HOURS = 24;
+
+function hours(values) {
+  const row = new Array(HOURS).fill(0);
+  for (const [hour, minutes] of Object.entries(values)) row[hour] = minutes;
+  return row;
+}
+
+jest.mock('../../_lib/dining-durations', () => {
+  const week = (values) => Array.from({ length: 7 }, () => hours(values));
+
+  // Parties of 1, 2 and 3+; Fridays (day 5) at 19:00 run longer for two-tops
+  const byPartyDayHour = [week({ 18: 70, 19: 75 }), week({ 18: 80, 19: 85 }), week({ 19: 110 })];
+  byPartyDayHour[1][5] = hours({ 18: 80, 19: 100 });
+
+  return {
+    maxPartySize: 3,
+    byParty: [75, 85, 110],
+    byPartyHour: [hours({ 18: 72, 19: 76 }), hours({ 18: 82, 19: 88 }), hours({ 19: 112 })],
+    byPartyDayHour
+  };
+}, { virtual: true });
+
+jest.mock('../../_lib/overbooking', () => ({
+  capacity: 60,
+  maxRisk: 0.05,
+  slotMinutes: 15,
+  nights: {
+    '2026-11-06': {
+      startMinute: 17 * 60,
+      slots: ['17:00', '17:15', '17:30', '17:45'],
+      bookableSeats: [66, 64, 58, 62]
+    }
+  }
+}), { virtual: true });
+
+const { getDiningDuration, getBookableSeats } = require('../../_lib/availability-calculator');
+
+describe('getDiningDuration (learned durations)', () => {
+  test('looks up party size x weekday x hour when a date is given', () => {
+    expect(getDiningDuration(2, '19:30', '2026-11-06')).toBe(100);  // Friday
+    expect(getDiningDuration(2, '19:00', '2026-11-04')).toBe(85);   // Wednesday
+  });
+
+  test('uses party size x hour without a date', () => {
+    expect(getDiningDuration(1, '18:15')).toBe(72);
+    expect(getDiningDuration(2, '19:45')).toBe(88);
+  });
+
+  test('caps party size at maxPartySize', () => {
+    expect(getDiningDuration(8, '19:00', '2026-11-06')).toBe(110);
+    expect(getDiningDuration(12, '19:00')).toBe(112);
+  });
+
+  test('treats invalid party sizes as one guest', () => {
+    expect(getDiningDuration(0, '19:00')).toBe(76);
+    expect(getDiningDuration('abc', '19:00')).toBe(76);
+  });
+
+  test('falls back to the fixed blocks for empty cells and without a time', () => {
+    expect(getDiningDuration(2, '12:00', '2026-11-06')).toBe(90);
+    expect(getDiningDuration(8, '18:00')).toBe(150);
+    expect(getDiningDuration(4)).toBe(120);
+  });
+});
+
+describe('getBookableSeats', () => {
+  test('returns the simulated allowance for the slot containing the time', () => {
+    expect(getBookableSeats(60, '17:00', '2026-11-06')).toBe(66);
+    expect(getBookableSeats(60, '17:14', '2026-11-06')).toBe(66);
+    expect(getBookableSeats(60, '17:15', '2026-11-06')).toBe(64);
+    expect(getBookableSeats(60, '17:59', '2026-11-06')).toBe(62);
+  });
+
+  test('never goes below capacity', () => {
+    expect(getBookableSeats(60, '17:30', '2026-11-06')).toBe(60);
+  });
+
+  test('uses capacity outside the simulated slots', () => {
+    expect(getBookableSeats(60, '16:45', '2026-11-06')).toBe(60);
+    expect(getBookableSeats(60, '18:00', '2026-11-06')).toBe(60);
+  });
+
+  test('uses capacity for nights that were not simulated or without a date', () => {
+    expect(getBookableSeats(60, '17:00', '2026-11-07')).toBe(60);
+    expect(getBookableSeats(60, '17:00')).toBe(60);
+  });
+
+  test('ignores the simulation when the capacity differs', () => {
+    expect(getBookableSeats(80, '17:00', '2026-11-06')).toBe(80);
+  });
+});
@@ -0,0 +1,55 @@
+/**
+ * Unit Tests for the Probability Calibration Lookup
+ *
+ * calibrate() maps raw packed-tree probabilities through the knots fitted by
+ * ml-training-data/calibrate.py
+ */
+
+const { calibrate } = require('../predict');
+
+describe('calibrate', () => {
+  const CALIBRATION = {
+    x: [0.1, 0.3, 0.6, 0.9],
+    y: [0.05, 0.2, 0.5, 0.8]
+  };
+
+  test('clamps below the first knot', () => {
+    expect(calibrate(CALIBRATION, 0)).toBe(0.05);
+    expect(calibrate(CALIBRATION, 0.1)).toBe(0.05);
+  });
+
+  test('clamps above the last knot', () => {
+    expect(calibrate(CALIBRATION, 1)).toBe(0.8);
+    expect(calibrate(CALIBRATION, 0.9)).toBe(0.8);
+  });
+
+  test('returns the knot value on an interior knot', () => {
+    expect(calibrate(CALIBRATION, 0.3)).toBeCloseTo(0.2, 10);
+    expect(calibrate(CALIBRATION, 0.6)).toBeCloseTo(0.5, 10);
+  });
+
+  test('interpolates linearly between knots', () => {
+    expect(calibrate(CALIBRATION, 0.2)).toBeCloseTo(0.125, 10);
+    expect(calibrate(CALIBRATION, 0.45)).toBeCloseTo(0.35, 10);
+    expect(calibrate(CALIBRATION, 0.75)).toBeCloseTo(0.65, 10);
+  });
+
+  test('binary search finds the right segment among many knots', () => {
+    const x = Array.from({ length: 101 }, (_, i) => i / 100);
+    const calibration = { x, y: x.map(v => v * v) };
+
+    // Between the 0.55 and 0.56 knots: 0.3025 + (0.3136 - 0.3025) / 2
+    expect(calibrate(calibration, 0.555)).toBeCloseTo(0.30805, 10);
+    expect(calibrate(calibration, 0.011)).toBeCloseTo(0.0001 + 0.0003 * 0.1, 10);
+    expect(calibrate(calibration, 0.995)).toBeCloseTo(0.9801 + 0.0199 * 0.5, 10);
+  });
+
+  test('is monotonic for monotonic knots', () => {
+    let previous = -Infinity;
+    for (let p = 0; p <= 1; p += 0.01) {
+      const calibrated = calibrate(CALIBRATION, p);
+      expect(calibrated).toBeGreaterThanOrEqual(previous);
+      previous = calibrated;
+    }
+  });
+});
@@ -0,0 +1,63 @@
+/**
+ * Unit Tests for Check-In Recommendations from the Seating Plan
+ *
+ * The generated plan (ml-training-data/seating_plan.py) is replaced with a
+ * single assignment.
+ */
+
+jest.mock('../../_lib/supabase', () => ({}));
+jest.mock('../data-logger', () => ({ logCustomerShowedUp: jest.fn(), logCustomerCancelled: jest.fn() }));
+
+jest.mock('../../_lib/seating-plan', () => ({
+  generatedAt: '2026-11-06T12:00:00Z',
+  nights: [],
+  assignments: {
+    'RES-20261106-0001': { date: '2026-11-06', time: '19:00', tables: ['3', '4'] },
+    'RES-20261106-0002': { date: '2026-11-06', time: '19:30', tables: ['5'] }
+  }
+}), { virtual: true });
+
+const { plannedRecommendation } = require('../../host-dashboard');
+
+const TABLES = [
+  { table_number: 3, capacity: 2 },
+  { table_number: 4, capacity: 4 },
+  { table_number: 5, capacity: 4 }
+];
+
+describe('plannedRecommendation', () => {
+  test('recommends the planned tables when all of them are free', () => {
+    const recommendation = plannedRecommendation({ reservation_id: 'RES-20261106-0001', party_size: 5 }, TABLES);
+
+    expect(recommendation).toEqual({
+      tables: [3, 4],
+      total_capacity: 6,
+      match_quality: 'good',
+      score: 100,
+      reason: 'Planned seating for tonight (combined tables, 6 seats)',
+      planned: true
+    });
+  });
+
+  test('grades the fit by spare seats', () => {
+    const perfect = plannedRecommendation({ reservation_id: 'RES-20261106-0002', party_size: 4 }, TABLES);
+    expect(perfect.match_quality).toBe('perfect');
+    expect(perfect.reason).toBe('Planned seating for tonight (4 seats)');
+
+    const waste = plannedRecommendation({ reservation_id: 'RES-20261106-0001', party_size: 2 }, TABLES);
+    expect(waste.match_quality).toBe('waste');
+  });
+
+  test('returns null when a planned table is not free', () => {
+    const available = TABLES.filter(table => table.table_number !== 4);
+    expect(plannedRecommendation({ reservation_id: 'RES-20261106-0001', party_size: 5 }, available)).toBeNull();
+  });
+
+  test('returns null when the party no longer fits the planned tables', () => {
+    expect(plannedRecommendation({ reservation_id: 'RES-20261106-0001', party_size: 7 }, TABLES)).toBeNull();
+  });
+
+  test('returns null for reservations without a plan entry', () => {
+    expect(plannedRecommendation({ reservation_id: 'RES-20261106-0099', party_size: 2 }, TABLES)).toBeNull();
+  });
+});
@@ -0,0 +1,69 @@
+/**
+ * Unit Tests for the Flat-Array Tree Evaluator
+ *
+ * Uses a hand-packed two-tree model so expected margins can be worked out by hand
+ */
+
+const {
+  loadPackedTrees,
+  predictMargin,
+  predictPackedTrees
+} = require('../tree-evaluator');
+
+function encode(TypedArray, values) {
+  return Buffer.from(new TypedArray(values).buffer).toString('base64');
+}
+
+// Tree 0: x[0] < 24 ? (x[1] < 1 ? 0.5 : -0.5) : 1.0   (missing x[1] goes left)
+// Tree 1: x[1] < 1 ? 0.25 : -0.25                     (missing x[1] goes right)
+const PACKED = {
+  format: 'packed-trees-v1',
+  version: 'test',
+  featureNames: ['booking_lead_time_hours', 'has_special_requests'],
+  numFeatures: 2,
+  numTrees: 2,
+  numNodes: 8,
+  baseMargin: -0.5,
+  arrays: {
+    feature: encode(Int16Array, [0, 1, -1, -1, -1, 1, -1, -1]),
+    value: encode(Float32Array, [24, 1, 1.0, 0.5, -0.5, 1, 0.25, -0.25]),
+    left: encode(Int32Array, [1, 3, -1, -1, -1, 6, -1, -1]),
+    right: encode(Int32Array, [2, 4, -1, -1, -1, 7, -1, -1]),
+    defaultLeft: encode(Uint8Array, [0, 1, 0, 0, 0, 0, 0, 0]),
+    roots: encode(Int32Array, [0, 5])
+  }
+};
+
+describe('Tree Evaluator', () => {
+  const trees = loadPackedTrees(PACKED);
+
+  test('decodes typed arrays', () => {
+    expect(trees.feature).toBeInstanceOf(Int16Array);
+    expect(trees.value).toBeInstanceOf(Float32Array);
+    expect(Array.from(trees.roots)).toEqual([0, 5]);
+  });
+
+  test('sums leaf values along each tree path', () => {
+    expect(predictMargin(trees, [10, 0])).toBeCloseTo(-0.5 + 0.5 + 0.25);
+    expect(predictMargin(trees, [10, 1])).toBeCloseTo(-0.5 - 0.5 - 0.25);
+    expect(predictMargin(trees, [48, 0])).toBeCloseTo(-0.5 + 1.0 + 0.25);
+  });
+
+  test('splits strictly on x < threshold', () => {
+    expect(predictMargin(trees, [24, 0])).toBeCloseTo(-0.5 + 1.0 + 0.25);
+  });
+
+  test('routes missing values by default direction', () => {
+    expect(predictMargin(trees, [10, null])).toBeCloseTo(-0.5 + 0.5 - 0.25);
+    expect(predictMargin(trees, [10, NaN])).toBeCloseTo(-0.5 + 0.5 - 0.25);
+  });
+
+  test('returns probability via sigmoid', () => {
+    const margin = predictMargin(trees, [10, 0]);
+    expect(predictPackedTrees(trees, [10, 0])).toBeCloseTo(1 / (1 + Math.exp(-margin)));
+  });
+
+  test('rejects unknown formats', () => {
+    expect(() => loadPackedTrees({ format: 'other' })).toThrow('Unsupported tree format');
+  });
+});
@@ -0,0 +1,58 @@
+/**
+ * Unit Tests for the Model-Based Waitlist Quote
+ *
+ * The generated wait-time model (ml-training-data/wait_times.py) is replaced
+ * with hand-picked coefficients so quotes can be worked out by hand.
+ */
+
+jest.mock('../../_lib/supabase', () => ({}));
+jest.mock('twilio', () => jest.fn(), { virtual: true });
+jest.mock('resend', () => ({ Resend: jest.fn() }), { virtual: true });
+
+jest.mock('../../_lib/wait-time-model', () => {
+  const byHour = new Array(24).fill(10);
+  byHour[19] = 20;
+
+  return {
+    timezone: 'UTC',
+    turningAfterMinutes: 60,
+    quoteStep: 5,
+    minQuote: 10,
+    maxQuote: 120,
+    byHour,
+    perPartyAhead: 12,
+    perTurningTable: -2,
+    partyOffsets: [0, 3, 6],
+    defaultTurning: 2
+  };
+}, { virtual: true });
+
+const { modelEstimatedWait } = require('../../waitlist');
+
+describe('modelEstimatedWait', () => {
+  const EVENING = new Date('2026-11-06T19:30:00Z');
+  const MORNING = new Date('2026-11-06T10:30:00Z');
+
+  test('adds hour intercept, queue, turning tables and party offset', () => {
+    // 20 + 12 * 2 - 2 * 3 + 3 = 41 -> 40
+    expect(modelEstimatedWait(4, 2, 3, EVENING)).toBe(40);
+    // 20 + 12 * 1 - 2 * 0 + 6 = 38 -> 40
+    expect(modelEstimatedWait(6, 1, 0, EVENING)).toBe(40);
+  });
+
+  test('buckets party sizes like the fixed formula', () => {
+    expect(modelEstimatedWait(3, 1, 0, EVENING)).toBe(30);  // 32, small
+    expect(modelEstimatedWait(5, 1, 0, EVENING)).toBe(35);  // 35, medium
+    expect(modelEstimatedWait(8, 1, 0, EVENING)).toBe(40);  // 38, large
+  });
+
+  test('uses the hour in the model time zone', () => {
+    // 10 + 12 * 2 = 34 -> 35
+    expect(modelEstimatedWait(2, 2, 0, MORNING)).toBe(35);
+  });
+
+  test('clamps to the minimum and maximum quote', () => {
+    expect(modelEstimatedWait(2, 0, 5, MORNING)).toBe(10);
+    expect(modelEstimatedWait(2, 20, 0, EVENING)).toBe(120);
+  });
+});
@@ -6,12 +6,18 @@
  *
  * Data Collection Strategy:
  * 1. Log reservation at creation time (with ML prediction)
- * 2. Update outcome when:
+ * 2. Log outcome when:
  *    - Customer shows up (seated → completed service)
  *    - Customer no-shows (reservation time passes, not seated)
  *    - Customer cancels (status changed to cancelled)
  *
- * Export Format: CSV compatible with train_model.py
+ * Storage: append-only event log (one JSON object per line, one segment file
+ * per UTC day). Reservations and outcomes are separate events, so recording
+ * an outcome is a single append instead of a full-file rewrite.
+ *
+ * ml-training-data/training_log.py compacts the events into
+ * restaurant_training_data.csv (the table retrain_custom_model.py reads),
+ * processing only segments written since the last compaction.
  */
 
 const fs = require('fs');
@@ -19,48 +25,22 @@ const path = require('path');
 const { promisify } = require('util');
 
 const appendFileAsync = promisify(fs.appendFile);
-const writeFileAsync = promisify(fs.writeFile);
 
 const TRAINING_DATA_DIR = path.join(__dirname, '../../ml-training-data');
 const TRAINING_LOG_FILE = path.join(TRAINING_DATA_DIR, 'restaurant_training_data.csv');
+const TRAINING_EVENTS_DIR = path.join(TRAINING_DATA_DIR, 'training-events');
 
 // Check if we're in a writable environment (local dev) vs read-only (Vercel production)
 let isFileSystemWritable = false;
 
 try {
-  // Ensure directory exists
-  if (!fs.existsSync(TRAINING_DATA_DIR)) {
-    fs.mkdirSync(TRAINING_DATA_DIR, { recursive: true });
+  // Ensure event log directory exists
+  if (!fs.existsSync(TRAINING_EVENTS_DIR)) {
+    fs.mkdirSync(TRAINING_EVENTS_DIR, { recursive: true });
+    console.log('[DataLogger] Initialized training event log:', TRAINING_EVENTS_DIR);
   }
 
-  // Initialize CSV with headers if it doesn't exist
-  if (!fs.existsSync(TRAINING_LOG_FILE)) {
-    const headers = [
-      'reservation_id',
-      'created_at',
-      'reservation_date',
-      'reservation_time',
-      'customer_email',
-      'customer_phone',
-      'customer_name',
-      'party_size',
-      'special_requests',
-      'booking_lead_time_hours',
-      'is_repeat_customer',
-      'customer_visit_count',
-      'customer_no_show_rate',
-      'days_since_last_visit',
-      'ml_predicted_probability',
-      'ml_predicted_risk_level',
-      'actual_outcome', // 'showed_up', 'no_show', 'cancelled'
-      'outcome_timestamp',
-      'seated_at',
-      'completed_at'
-    ].join(',') + '\n';
-
-    fs.writeFileSync(TRAINING_LOG_FILE, headers);
-    console.log('[DataLogger] Initialized training data log:', TRAINING_LOG_FILE);
-  }
+  fs.accessSync(TRAINING_EVENTS_DIR, fs.constants.W_OK);
 
   isFileSystemWritable = true;
   console.log('[DataLogger] File system is writable - data collection enabled');
@@ -69,6 +49,22 @@ try {
   console.warn('[DataLogger] Training data will only be collected in local development');
 }
 
+/**
+ * Segment file for an event (one file per UTC day, e.g. events-2025-10-26.jsonl)
+ */
+function getSegmentFile(date = new Date()) {
+  return path.join(TRAINING_EVENTS_DIR, `events-${date.toISOString().slice(0, 10)}.jsonl`);
+}
+
+/**
+ * Append one event to today's segment
+ * A single appendFile of one line is atomic enough for our write volume
+ */
+async function appendEvent(event) {
+  const record = { ...event, logged_at: new Date().toISOString() };
+  await appendFileAsync(getSegmentFile(), JSON.stringify(record) + '\n');
+}
+
 /**
  * Log a new reservation (at creation time)
  */
@@ -80,30 +76,26 @@ async function logReservationCreated(reservation, mlPrediction, customerHistory
   }
 
   try {
-    const row = [
-      reservation.reservation_id || '',
-      reservation.created_at || new Date().toISOString(),
-      reservation.date || '',
-      reservation.time || '',
-      reservation.customer_email || '',
-      reservation.customer_phone || '',
-      reservation.customer_name || '',
-      reservation.party_size || 0,
-      `"${(reservation.special_requests || '').replace(/"/g, '""')}"`, // Escape quotes
-      calculateLeadTime(reservation),
-      customerHistory ? (customerHistory.fields['Completed Reservations'] > 0 ? 1 : 0) : 0,
-      customerHistory ? (customerHistory.fields['Completed Reservations'] || 0) : 0,
-      customerHistory ? (customerHistory.fields['No Show Risk Score'] || 0.15) : 0.15,
-      customerHistory ? calculateDaysSinceLastVisit(customerHistory) : 999,
-      mlPrediction ? mlPrediction.noShowProbability : '',
-      mlPrediction ? mlPrediction.noShowRisk : '',
-      'pending', // Will be updated later
-      '', // outcome_timestamp - filled when outcome known
-      '', // seated_at - filled when seated
-      ''  // completed_at - filled when service complete
-    ].join(',') + '\n';
-
-    await appendFileAsync(TRAINING_LOG_FILE, row);
+    await appendEvent({
+      type: 'reservation_created',
+      reservation_id: reservation.reservation_id || '',
+      location_id: reservation.location_id || process.env.LOCATION_ID || '',
+      created_at: reservation.created_at || new Date().toISOString(),
+      reservation_date: reservation.date || '',
+      reservation_time: reservation.time || '',
+      customer_email: reservation.customer_email || '',
+      customer_phone: reservation.customer_phone || '',
+      customer_name: reservation.customer_name || '',
+      party_size: reservation.party_size || 0,
+      special_requests: reservation.special_requests || '',
+      booking_lead_time_hours: calculateLeadTime(reservation),
+      is_repeat_customer: customerHistory ? (customerHistory.fields['Completed Reservations'] > 0 ? 1 : 0) : 0,
+      customer_visit_count: customerHistory ? (customerHistory.fields['Completed Reservations'] || 0) : 0,
+      customer_no_show_rate: customerHistory ? (customerHistory.fields['No Show Risk Score'] || 0.15) : 0.15,
+      days_since_last_visit: customerHistory ? calculateDaysSinceLastVisit(customerHistory) : 999,
+      ml_predicted_probability: mlPrediction ? mlPrediction.noShowProbability : null,
+      ml_predicted_risk_level: mlPrediction ? mlPrediction.noShowRisk : null
+    });
     console.log('[DataLogger] Logged reservation:', reservation.reservation_id);
 
     return { success: true };
@@ -135,8 +127,8 @@ async function logCustomerCancelled(reservationId, cancelledAt) {
 }
 
 /**
- * Update outcome in CSV file
- * Note: For production, consider using a database instead of CSV for easier updates
+ * Record an outcome as its own event (O(1) append)
+ * The latest outcome per reservation wins when the log is compacted.
  */
 async function updateOutcome(reservationId, outcome, outcomeTimestamp, seatedAt = '', completedAt = '') {
   // Skip updating if filesystem is read-only (Vercel production)
@@ -146,40 +138,50 @@ async function updateOutcome(reservationId, outcome, outcomeTimestamp, seatedAt
   }
 
   try {
-    // Read entire file
-    const fileContent = fs.readFileSync(TRAINING_LOG_FILE, 'utf-8');
-    const lines = fileContent.split('\n');
-
-    // Find and update the line
-    let updated = false;
-    const updatedLines = lines.map(line => {
-      if (line.includes(reservationId)) {
-        const cols = line.split(',');
-        // Update outcome columns (indices 16, 17, 18, 19)
-        cols[16] = outcome;
-        cols[17] = outcomeTimestamp;
-        cols[18] = seatedAt;
-        cols[19] = completedAt;
-        updated = true;
-        return cols.join(',');
-      }
-      return line;
+    await appendEvent({
+      type: 'outcome',
+      reservation_id: reservationId,
+      actual_outcome: outcome,
+      outcome_timestamp: outcomeTimestamp,
+      seated_at: seatedAt || '',
+      completed_at: completedAt || ''
     });
-
-    if (updated) {
-      await writeFileAsync(TRAINING_LOG_FILE, updatedLines.join('\n'));
-      console.log(`[DataLogger] Updated outcome for ${reservationId}: ${outcome}`);
-      return { success: true };
-    } else {
-      console.warn(`[DataLogger] Reservation ${reservationId} not found in training log`);
-      return { success: false, error: 'Reservation not found' };
-    }
+    console.log(`[DataLogger] Logged outcome for ${reservationId}: ${outcome}`);
+    return { success: true };
   } catch (error) {
     console.error('[DataLogger] Error updating outcome:', error);
     return { success: false, error: error.message };
   }
 }
 
+/**
+ * Read every event from all segments (oldest first)
+ */
+function readAllEvents() {
+  if (!fs.existsSync(TRAINING_EVENTS_DIR)) {
+    return [];
+  }
+
+  const segments = fs.readdirSync(TRAINING_EVENTS_DIR)
+    .filter(name => name.startsWith('events-') && name.endsWith('.jsonl'))
+    .sort();
+
+  const events = [];
+  for (const segment of segments) {
+    const content = fs.readFileSync(path.join(TRAINING_EVENTS_DIR, segment), 'utf-8');
+    for (const line of content.split('\n')) {
+      if (!line.trim()) continue;
+      try {
+        events.push(JSON.parse(line));
+      } catch (error) {
+        // Partially written last line - picked up on the next read
+      }
+    }
+  }
+
+  return events;
+}
+
 /**
  * Get training data statistics
  */
@@ -202,35 +204,22 @@ function getTrainingDataStats() {
       };
     }
 
-    if (!fs.existsSync(TRAINING_LOG_FILE)) {
-      return {
-        totalSamples: 0,
-        showedUp: 0,
-        noShows: 0,
-        cancelled: 0,
-        pending: 0,
-        completedSamples: 0,
-        noShowRate: 'N/A',
-        readyForRetraining: false,
-        samplesNeeded: 100
-      };
+    // Latest outcome per logged reservation
+    const outcomes = new Map();
+    for (const event of readAllEvents()) {
+      if (event.type === 'reservation_created') {
+        if (!outcomes.has(event.reservation_id)) outcomes.set(event.reservation_id, 'pending');
+      } else if (event.type === 'outcome') {
+        outcomes.set(event.reservation_id, event.actual_outcome);
+      }
     }
 
-    const fileContent = fs.readFileSync(TRAINING_LOG_FILE, 'utf-8');
-    const lines = fileContent.split('\n').filter(line => line.trim().length > 0);
-
-    // First line is header
-    const dataLines = lines.slice(1);
-
     let showedUp = 0;
     let noShows = 0;
     let cancelled = 0;
     let pending = 0;
 
-    dataLines.forEach(line => {
-      const cols = line.split(',');
-      const outcome = cols[16]; // actual_outcome column
-
+    outcomes.forEach(outcome => {
       if (outcome === 'showed_up') showedUp++;
       else if (outcome === 'no_show') noShows++;
       else if (outcome === 'cancelled') cancelled++;
@@ -241,7 +230,7 @@ function getTrainingDataStats() {
     const readyForRetraining = totalCompleted >= 100; // Need 100+ samples to retrain
 
     return {
-      totalSamples: dataLines.length,
+      totalSamples: outcomes.size,
       showedUp,
       noShows,
       cancelled,
@@ -290,5 +279,6 @@ module.exports = {
   logCustomerNoShow,
   logCustomerCancelled,
   getTrainingDataStats,
-  TRAINING_LOG_FILE
+  TRAINING_LOG_FILE,
+  TRAINING_EVENTS_DIR
 };
@@ -321,6 +321,12 @@ function calculateHistoricalNoShowRateForTime(reservation, historicalStats = nul
  * Calculate occupancy rate for this time slot
  */
 function calculateOccupancyRateForSlot(reservation, historicalStats = null) {
+  if (historicalStats && historicalStats.occupancyByDayHour) {
+    // Per (day of week, hour) table from ml-training-data/slot_stats.py - 0 is a real value here
+    const rate = historicalStats.occupancyByDayHour[calculateDayOfWeek(reservation)][calculateHourOfDay(reservation)];
+    if (typeof rate === 'number') return rate;
+  }
+
   if (historicalStats && historicalStats.occupancyBySlot) {
     const hour = calculateHourOfDay(reservation);
     return historicalStats.occupancyBySlot[hour] || 0.7;
@@ -0,0 +1,57 @@
+/**
+ * ML Model Trees (Inline for Serverless Compatibility)
+ *
+ * GENERATED by ml-training-data/export_model.py - do not edit by hand.
+ *
+ * Flat-array export of the XGBoost booster, evaluated by tree-evaluator.js.
+ * Arrays are base64-encoded little-endian typed arrays:
+ *   feature (Int16), value (Float32), left/right/roots (Int32), defaultLeft (Uint8)
+ *
+ * Version: 2.0.0
+ * Source: no_show_model_v2.json
+ * Trees: 100 (49636 nodes)
+ */
+
+module.exports = {
+  "format": "packed-trees-v1",
+  "version": "2.0.0",
+  "exportedAt": "2026-10-17T22:24:24.702881",
+  "sourceModel": "no_show_model_v2.json",
+  "featureNames": [
+    "booking_lead_time_hours",
+    "hour_of_day",
+    "day_of_week",
+    "is_weekend",
+    "is_prime_time",
+    "month_of_year",
+    "days_until_reservation",
+    "is_repeat_customer",
+    "customer_visit_count",
+    "customer_no_show_rate",
+    "customer_avg_party_size",
+    "days_since_last_visit",
+    "customer_lifetime_value",
+    "party_size",
+    "party_size_category",
+    "is_large_party",
+    "has_special_requests",
+    "confirmation_sent",
+    "confirmation_clicked",
+    "hours_since_confirmation_sent",
+    "historical_no_show_rate_for_day",
+    "historical_no_show_rate_for_time",
+    "occupancy_rate_for_slot"
+  ],
+  "numFeatures": 23,
+  "numTrees": 100,
+  "numNodes": 49636,
+  "baseMargin": -0.5305085698599943,
+  "arrays": {
+    "feature": "AAAAABAAEAAQAAAADAAAAAAADAAMAAAADAAAAAAAFAAUAAwADAAKAAwACAAUAAsACwAKAAoACwD//wgAAAAKAAwAAAAMAP//CgAMAAwAAAAAAAAAAAAMAP//DAAKAAwACwAUAAsAFAALAAAADAAUAP//DAAKAAAADAAHABQACgAMAAwADAAIAAwA/////xQA//8KAAwADAAMAAwADAAKAAAAAAD//wAAFAAMAAoADAAAAAAACgAUAAsAAAAKAP//AAAMAAwACAALAAwA//8UAAwAAAAAAAAACgAMABQACAAHABQA//////////8MAAgADAAUABQA//8MAAwA//8HAAgAFAD///////8AABQADAAMAAwA//8UAAwACAAMAAwAAAAUABQAFAAUAP////8KAAwADAD//woADAAAABQADAD//xQADAAUABQAAAAUAP////8UAP//DAAMAAAAFAAMAAsADAAAAAwA//8AAP//AAD//wwADAAMAAwAAAAKAAgAFAAMAAwADAAUAAAAFAD///////8MAAoA//8UAP///////wwABwAKAP//DAD//////////////////wwADAAAAAwA/////wwAFAD///////8AABQA////////DAAIAAwAAAAUABQADAD//wwADAAUABQAFAAMAAAADAAAAAwADAAKAAwA//8KABQAAAD//wAAAAAAAAAAAAAKAP//////////DAAUAAwADAAMAAwADAAKAAAAAAAUAAsAAAAMAP////8KABQADAAMAAwADAAAAAwADAAMAAoAAAD//wwAAAD///////8UAP///////wwADAAUABQADAAMAAAACwALAAwAFAD//wwAAAAAAAAAAAAKAAwADAAMAP//AAAKABQADAAMABQA/////wwACwAMABQA//8KAP//DAAHAAwADAD//wAA//8MAAwAAAAKAP//AAAKAP////////////8KAAoACAAMABQA//8AAP//DAD//wAADAAMAP//DAAUAAwAFAAUABQAAAD//wwAAAAMAAwAAAAUAAwA////////CgAMAAwAFAD//wwA//8MAAwA//8UAP///////wAACgD//////////wwAAAAMABQA/////wwAAAAMABQA/////wwADAAMAAwAFAAAAAoADAAUAP//AAD//wAAAAAAAP//DAAMAAAA////////AAAKABQADAAKAAoADAAUAP////8AAAAAAAAAAAwADAAMAAAA//8MAP////8MAAwA//8KAAwADAD/////FAD//wAAAAD//wAA//////////8MAAoAFAAAAAAAAAD/////FAD//wwAAAAMAAwAAAAMAAgA//8MAAwADAAMABQAAAAMAP//DAAAAAAAAAAMAP//AAAMAAAAAAD/////AAD//woAFAAUAAwADAAMAAAA//8MAAwAAAAMAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wkAAAAIAAAAEAAAAP//EAAQAAAADAAFAAAAAAAAAAwADAAAAAwAAAAAAP//DAALAP//FAAMAAkAFAAFAAUABQAKAAUACwAKAAUACwD//wUADAD/////CAD//woABQACAAwABQAMAAwACgAKAAUAAAAFAAoAAgAMAAwAAAAUAAwABQAUAAsACgAAAAgA//8AAAgABQAIAP////8CAP//DAACAAgAAAACAAoADAAAAP//FAAMAAwABQAMAAkAAAAMAAwADAAUAAUAFAACAP//CQD//wIAAAAFAAIACgAFAAAADAAFABQACwAFAAAADAAIAAsABQACAAwA//8FAAkADAAAAAwACQAFAAAABQD///////8MAP//BQAMAAAACQAFAAAABQAFAP////8JAP////8JAP///////wwA//////////8MAP//CAAMAAUADAAAAAoAAAAMAAoAFAAMAAwAAAACAAAA//8CAAAA/////wwADAAMAAwAAgACAP//AAAMAAwAAAAUAAwADAACAAsAAAAAAAwAAgAMAAwAAAAMAAAA//8MAP//DAD///////8FAAwAAAAMAP////8AAAAA//8MAP//AgAAAAUAAAAKAP////8MAAIAAgAMAAwAAAD//wwADAD//wUADAAMAAUACAAUAAUABQAKAAUAAAD///////8MAAgACAACAP////8MAP//AgAJAP////8FABQABQAFAAwAFAAMAAAADAAAAP//AAAAAAwA//8FAAwA/////wwADAAUAAwA//8CAAAADAD///////8MAAAABQAFAAIA//8FAAwADAAAAP//DAD/////CgALAAUAFAAUAAAADAAMAAsADAAAAAAACwAAAAwA//8MAAwAAAAMABQABQAMAAAAAgAAAAoADAD/////CwAAAP//////////DAAKAAwA//8AAAwAFAAAAAUAAAAKAAAABQAFAP//////////DAAMAAAA//8AAAUAAAACAAIADAAMAAwA////////DAAUAP//AgAAAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8JABMAEwATABAACQD//xAAEAATAAwADAD//xMADAAMAAwAEwAMABMAEwD/////CgAUABMADAAKAAUACQAFAAUABQAKAAUACwD//wcABQAHAAwAEwAKAAkADAAMAAoACQAFAAwADAAFAP//EgAMAAoADAALABMAFAALAAoAEwATAP//BQAJABMACgAUAP//BQAFAAoADAAHABMA//8UABQADAAUAAUAEgD//xMA//8TABMAEwAUAAoAEwAKABQAEwAFAAwABQAMAAwAEwAMABMACwAFAAsABQAMAAwACwAFAAUACgD//wUAFAATAAwA/////wsADAAFAP//////////FAD//wwADAAFAAwA//8MAAkAFAAMAP//FAD//wwABQAFAP//FAD///////8TAAcAFAAMAAwADAAFABMADAAUAAoABQATAAwAFAATAP//EwASAAwADAAMABMAEwAFAAwADAALAAwABQAFAAUADAATAAwAFAATAAwADAAUAAsABQAUAAwAEwAMAP//DAAKAP////8FAAwADAATAP////8TAAUABQAMAAwADAATAAoAEwD///////8TABMA//8MAAwABwAFAAwADAD//wwADAAMABQAEwD//wUADAAUAAwA////////DAD/////FAD/////AwD/////FAD//wUACQAFAP//EwAMAAoABQADAAwAEwAUAAUA//8TAAUAEgD//wUAFAATAAUA/////wUA/////xMA//8TABQA//8TAAUABQAMAP//DAD//wwAEgATAP//EwAMAP//EwAMABMACwAFABMADAAKAAwAFAAMAAoADAAMAAUAEwAKABMADAAMAAUACgAKABMADAASABMADAAFAAUADAAMABMACgD///////8MAP////8DABMA/////wUAFAATAAwACwAMABMADAATABMAFAATAAoA//8MAAUAEwAMAAwAFAATAAUAEwATAAwABQAMAAwA//8MAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wkAAAAIAAAAEAAAAP//EAAQAAAADAAMAAgAAAAMAAwACAAAAAwAAAAAAP//CQD//wAACgAIAAkAAAAFAAUABQAIAAUABQAKAAUACAD//wgADAD//////////wUADAAFAAkACQAKAAwADAAIAAwADAAAAAoAAAD/////DAAAAAsAAAAMAAAACgAAAAsACQAMAAkABQAFAAUAEgAFAAwADAAMAAgADAD//wkA/////wAADAAKAAwABQAJAAUAEgAMAP//BQAMAAUAAAAMAAwAAAAMAAwADAAAAAsABQAKAAwAAAALAAsABQAFAAwA//8FAP////8MAAUACgD/////DAAAAAwACAAFAP//////////CQAMAAUABQAKAAoADAD/////BQD//wAACAAMAAUA//8FAAUADAD//wwABQAKAP//DAAAAAUA/////wAADAAMAP//DAAAAAwADAAFAAwADAAMAP//DAAMAAsAAAAKAAoABQAMAAwABQAFAAUADAAAAAoADAAFAP//DAD/////BQD/////CwAFAAwADAAAAP////8AAAAAAAD//wAAAAAAAAoACwAMAAAAAAAAAP//AAAFAP//////////BQD/////DAAAAAUA/////wAADAAMAP////////////////////8FAAwADAAFAP///////wwA/////wUACgAAAAAADAD/////AAAAAAAADAD//wwABQAAAAwAAAAFAAUACgAMAAwAEgAMAAUABQAMAP////8FAP////8FAAUACgAMAAwAAAAAAAAAAAAMAAwAAAAFAP////8MAAwAAAAAAP//DAAKAAAADAAMAAAADAAAAAoADAAAAAAABQAAAAwA//8AAP//AAD/////BQASAAAADAAMAAwAAAAAAAwAAAAFAAUA/////woACgAMAAUA//8SAAwABQAAAP//AAAAABIA//8AAAwADAD//wAAEgD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////CQAAAAgAAAAQAAgA//8QABAAAAAMAP//AAAAAAwADAAIAAUADAAAAAAA/////wwACAAJAAAABQAFABQACQALAAAADQAFAAgA//8IAAUADAACAAwACQD//w0AAgAMAA0ADAAAAAUABQAMAP//AAAMAAwACwAAABQAAAACABQACwAJAAAACQAUAA0ADAAFAAwABQAFAAUACAACAP///////wUADAAMAAIAAAAUAAUAEgAUAAUADAAMAAIAAAAFAP////8NAAAACwAFAAwA//8UAA0ABQAMAAUACwAMAAwAAAAAAAAA/////w0ABQAFAP////8AAAAABQAMAAcADQD//xQA//8HAP//BQACAAwAAgAAAP///////wAA//8MAAUA//8FAAUADAACAAUAFAAAAAAABQAUAAwADQASAP//AAACAP//DAAFAAwADAAMAAAADAAMAAIAAgAAAAwAFAANABIADAAMABQADAALAAIADAAMAP//BQAMAP//CwACAAwACwALAAUADQANAAwA////////FAAUAP////8AAAUADQAUAAUA//8MABIAAAAAAAAA//8UAAgA//8CAAcAAgAFAAUADAAMAAAAAAAMAAwADQD//wUADAD//wkADQD//wwADAD//wIAEgACAAwAAAAJAAwA//8MAAAADAANAA0AAgAFAAwADAAMAAAABQAAAAwAAAD/////AAANAAwA//8UAAIABQAUAP//DQAAAAwADAAMAAUABQAMAP//DAD//wAADAAFAAAAAAAAABQADQAAAA0ACwAAAP//////////AAD//wAAAgAFAAsABQAMAAwAAAAUAP//BQAMAAAA////////AAD//wAAAgAMAP///////wUACwALAAAADAACAAAAAAD/////BQAAAAUABQANAA0ADAAMAAwADAAAAAAADAAHABIADAAMAAAADAAAAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wkAAAAAAAAAEAAFAP//EAAQAAAAAAD/////AAAJAAUABwAAAAoAAAAAAAIAAgAHAAAACgAKAAUACQAFAAUAAAACAAUABQACAP//CgACAAoAAAAAAAkACQAFAAkAAAAFAAAABQACAP////8KAAAACwAKAAUAAgAAAAAAAAAHAAsACgD/////BwD//wUABQACAAAABQAKAAoAEgAFAAIA//////////8HAP//EgAKAAAAAAAFAAcABQACAAUAAgACAAUABQAAAAAACwAAAAAAAAD/////AgAFAAUABQD//wUAAAAFAAkABQD//wAA//8FAP//BQAFAP//BQAHAAAABQAFAAUABQASAAAACgD//wUACgD//wAABQD//wIACQAFAAIAAgAFABIACQASABIABQACAAAA//8KAAIACgAAAAoABQAAAAAABQACAAAACgAAAAIAAgAAAAAAAgALAAsAAAAFAAsABQAFAAUA////////AAD//wUA//8CAAsAAAACAAAACgAAAP////8AAAUAAAAFAP///////xIA//8FAAIABwACAAkAAAAFAP////8AAAIA//8KAP//BQAFAAAA/////////////wUABQAFAAIA////////AgAAAP//////////AgAFAAUAAAAFAAAAAgAAAAIA//8CAAIAAAAFAAAAAAAAAAAAAgACAAAAEgAAAAAA/////woAAgACAAAACgACAP//AAD/////AAAKAAsAAAAAAAIAAgAAAAsACgAFAAoAAgAAAAAAAgAAAAAABQAAAAAAAAAAAAAACwD//wsAAgAFAAUACgAAAP////////////8AAP////8AAP//AgD//woACgD//wIABQAAAAAABQACAAoAAgAFAAIAAAAFAAIAAgAAAP//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////CQAGAAgABgAQAAYA//8QABAABgAGAAwA//8GAAkABQAMAAYADAAIAAwA/////woADAAHAAgADAAMAAwADAAMAAUACgAFAAwACQD/////BwAUAAgAEgAKAAkA/////wwABQAFAAIABQAMAAwADAAUAAwACwAUABQADAAKAAwACwAGAP//DAACAP//CAAFAAUACQACAAIABQAMAAUACQAUAAgAFAAGAAwABgAFAP//BgAFAP//DAAGAAYACAAFAAoABgAFAAYABgALAAwACgAFAAwADAALAAUADAD//wYABgD//wIABQD//xQABQAFAAUACAAMAAwAAgAMAAgADAAMAAUABQD//wwABQD//wYA//8GAP//CAAFABQADAAJAAUADAAKAAwAAgAMAAwAAgAMAAwAEgD//xQAAgAGABQADAAFABIAEgACAP///////wwABQAGAAIACgAMAAYAAgACAAgABgAMAAwACgAGAAYADAAGAAwA//8LAAYA//8FAAUADAAFABQA/////xQABQAGAAoADAAGAP//////////////////FAAMAP//AgD//woADAAGAAoABgASAP////8MAP////////////8MAAYAFAD//wIAEgACAAwACAD///////8SABIA/////wwADAD//wwA//8SAAUA//8SABIAAgAMAAYABQD//wwAFAACAAYADAAGAP////////////////////8GAP//BQAGAAwA//8FAAIABQD/////BQAFAAwADAAFAAYADAAGAAYABQD/////FAAMAAwABgACAP//DAAGAAIAEgAFAP//DAAMAAsACwAFAAYABgAGAAYADAALAAoA/////xQADAD/////AgD//wYA//8GAP//DAAUAAYABgAMAAsAFAAMAAUABgAGAAUADAAGAAYADAAGABQABgACAP//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////CQAAAAgAAAAQAAAA//8QAAUAAAAMAAwA//8MAAwAEAAMAAAADAAAAAAA/////wgADAAJAAAADAAIAAwADAANAAUADQAFAAgADAAMAAAAAAAJAAIA//8FAAwACAAMAA0ABQANAAkABQAUABQABQAMAAUACwAUABQACAANAP//BQAJAAIADQAFAAUABQAMABQABQAIAAIADAAMABQABQD/////DAAMAAUADAACAAAAFAAFAAUAAAD/////AgACAAgABQAAABQAAgAMABQADAANAAAAAAAMAAwAAAAAAAwAAAD//wwABQAAAAIA////////AgD/////AAAFAAIADQALAAUAFAD//wwABQACAAwA/////wUAAAAAAAUA//8AAAgADAAAAAAAAgAFAAkA////////DAAFAAwACQAMAAIAAAAUAAAAAgAMAAIABQAMAAIABQAMAAAADAD/////AAAQAAwAAAAMAA0ADAAQAAAACQAMAAUAAgACAAwADAACAA0AAAACAAsAAAANAAIADQAFAAwADAD//wsACwALAAwADAACAAwAAgAAAAUA/////wwAAAAAAA0ADAAAAAUAAgAMAP//AAAUAP////8MAAcADAAFAAUAAAAAAAwA/////wUACQD//wUAAgD/////////////BQAAAAAAAAAIAAAABQACAAUA////////DAD//wUAFAAMAAwAAgAMAAwADAAMAAwADAAAAP//AAACAP//DAACAAAA//8AAAUADAAFAAUAAAAAAP//AAD//w0AFAD/////DAD/////BQAMAP///////xAABQD//wwADAAMAAAADAACAP//DAAMAAIAAgD//wwABQD///////8MAAwABQAFABQAFAAAAA0AFAAMAAUABQACAP//BQAMAAsADAAAAAsADAAMAAAAAgAMAAIA//////////8FAP//DAALAP///////wIACwAMAAAAAAAAAA0AAAAMAAAABQAMAAAAAgD//wIAAAAFAA0ADAACAAAAAAD//wwAAgACAAAAAAACAAwAAgAMAAwADAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////CQAAAAAAAAAQAAUAAAAQABAAAAAAAP//DAAFAP//AAAMAAwADAAAAAwADAAMAP///////wcABQAMAAkAAAACAAUABQACAAUADAAMAAwABQAAAAwA/////wIA//8CAAIABQAFAAIAAgAMAAwABQAMAAUABQAUAAUABQAHAAwABQAMAAUADAAAAAwADAAAAAcAAAASAP//DAD//woADAAMAAUABQAAABQABQAMAP//DAASAAUADAAMAAAAAAAKAAoACgAFAAAAAAAKAAIAEgAMAAUADAAMAAAACQAMAAwAAAAMAAUADAD/////CgAUAP//AgAKAAwAAAAAAAUABQAUAAkADAAMAP//////////BwAMAAUADAAAAAwACgAAAAwAAgAMAAUA//8MAAAAAAAJABIACQD//wAA/////wAADAAMAAAABQAMAAwADAACAAUAAAACAAAA//8AAAAAAgAAABQADAAMAAcAAAD//wwACgD//wUAAgAFAAwABQD//wUAAAAUAAAA//8AAAoAAgAAAAAAAAAAAAAABQAUAAwACgAFAAwA/////wwA//8FAP//AgAUAP//AAD//wAADAAKAAAADAAMAAAADAD/////CgD//wAACgAFAP//DAAHAAwAAgD//woADAACAAoACQAMAAAABQAKAAwA/////wwAAgAFAP////8FAP//AAAAAAIAEgD//////////wUA//8FAAwABQD//wUAAgAKAAIAAAAKAP//BwAMAAAABQD//wIADAAMAP//AgACAAAADAAUAAwA//8AAP////8UABQADAD/////////////DAAFAAUAAAASAP//AgACAAwA/////wAA/////wwABQAUAAwAAgACAAwA//8MAAUADAAMAAUADAAAAAAAAgAJAAAADAAAAP//DAAMAAIA//8CAAUAFAAAAAIADAAAAP//AAAKAAAAAAACAAIADAAFAP////8AAP///////////////xQA//8AABQADAAAAAwABwD//xQADAAMAAIADAAFAAoAAgAAAAAA//8UAAAAAAACAAIA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////AAAAAAAAAAAMAAsADAAFAAwAAgAMAAAABQACAAUAAAAFAAwABQAMAAoAAgAAAAUAFAAAAAUADAAKAAIAAAAMABQAAgAMAAUABQAMAAIADAAFAAAABQAMAAAA/////wAACgAMAAAADAALAAsADAAKAAsADAAMAAUADAAUAAwA////////DAACAAoACgAMAAUADAAMABQAEgAMABIACgAAAAAADAAAAAoABQD//wAAAAAMAAUADAAUAAAACgAFAAIAAAAAAAIA//8LAAAADAAMAAwAAgAAAAUA//8KAAAABQAAAAwABQALAAwABQAFAP//DAASAAAADAD//wwADAAAABIABQAMAAwAEgAMAAoACgAKAAUAAgAAAAwAAAAAAAwAAAAFAAwAAAAMAAAABQACAP//BQAUAP//AAAMAAwACgAFAAAADAAKAAUAAAAMAAwABQAMAAwAAgACABQACgAAAAUADAAFAAwABQAFAAwAAAACAAUADAD/////AAALAAsADAD//wsABQD/////DAD///////8CAAwAAAD/////AAD///////8LAAAA//8LAAwADAAMAAwACgAMAAAADAD//wwADAD//wwABQACABIACgD//wAADAD///////8AAAIAAgAUAAwAEgAFAAIABQAMAAwAAAAUABIA//8MAP//CgAUAAwACgAFAAAA//8FAP//////////DAD///////8KAP////8CAP//AgD/////EgAFAAoAAgASAAUABQAAABIADAASAAwAAAACAAwAAgD///////8SABIABQD/////AgAMAAUA//8FAAwABQAFAAAAAgAFAAwAAAAAAP//DAAKAAoADAAMAAwACgACAAIADAAAABQAAgASAAIADAAAAAAABQAMAAwAAAAFAAUADAAFAAoAFAAKAP///////wwA//8LAP////8LAAwA//////////8AAAoA/////wIA//8AAAIAAgD//xIADAACAP//BQAAAAAACwAMAAwA//8MAAIABQAFAAUADAAFAAwACgAAAAUAAAAMAAoA//////////8MAP//DAAMAP//////////DAAMAP//DAAMAP//////////FAD//woADAACAAwADAAFAP//AgAFAAwADAAUABQAFAAKAAIADAAUAAAADAACABQAAAAAAP//CgAMAP//BQAAAAwADAAUABIABQAKAP//DAAFAP//DAD//////////xIABQAFAAoA/////wUA//////////8MAP//AAD//wAADAD/////////////CgD//wAADAACAAUAAgACAAAABQAMAP////8CAAwA/////wUAAAAMAAAA/////wIABQAAAAAAAgAMAAwABQAAAAUAAAAFAAAAAAAMAAwABQAFAP////8MAAUADAASAAwAEgAAAAwAAAACAAwADAD//xIADAAMAAwADAAAAAAABQAAAAAADAAMAAUAAgAMABIA//8AAAwAAAAMAAwAAAAFAP//DAAAAAwAEgAKAAUADAAMAAAADAAMAAUADAAMAAwADAAMAAUAAAAMAP//BQALAAwAEgAMAAIAAgD//woA/////wUA//8CAP//BQD//wIA/////wUA/////wAAAAD///////8FAP////////////8CAAIA////////AAAAAP////8AAP//DAAAAP////8AAAwAAgAAAP////8MAAUADAAAAAwA////////////////EgD//wIA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////CQAGAAgABgAQAAYADAAQAAUABgAIAAwACAD/////BgAMABAABQAIAAwABgAJAP///////wYAFAAIAAkACAAMAAgABQAMAAUACQANAAwADAAMAAgADAD/////BQAFAAwACQAMAA0ABgAJAAwABgAFAAkABgAIAAwADAAGAAYA//8JAAwADAAMAAwABgANAAwA/////wUA//8SAP//FAAMAAIABQAMAAgAAgAMAP///////wwADQAMAP//CAANABQADAAMAA0A/////xQAEAACAP//AgAUAAwADAAGAAwADAAGAAYA//8MAP//DAAUAAwA//8NAAUABgAFAAwAFAASAP////////////8NAAwABQAHAAUADQACAAwABgAMAP///////wkABwAFAAUADQAMAAwA/////wYACQACAP//DAAFAAUABQAFABIAAgAGAP//DQAGAAwADAAGAAYABgD//wYABgD//wIAEAAGAAUABgAMAAwADAAGAAUABQD///////////////8FAP//////////BgD//wwABQAFABQAEgACAAYABgD//wUADAD//wwABwAMAP///////wwA//8FAAwADQANAAYADAACAP//FAAUAP//BgAFAAkABQD//wIADQD//wYA//8SAAUADAAGAAUACQD/////DAAMAAUAAgAGAP///////wwAAgAMAA0A//8GAAwABQAMAAwAAgACAAwADAAMAAIA//8MAAwA//8GAP//EAD//wwADQAGAAIA//8MAAwABgACAAwAAgAGAAYAFAAMAAUADAAMAAwABgAMAA0AAgAGAAgAEgAGAAwA//8GABQABgAFAAYAFAACAAwABQAFAAwABgAGAAUABQAFAP//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////AAAAABAAEAAIAAAADAAFAAwAEAAIAAgADAAAAAgAAAAAAAAACgAMAAwA/////wAACwAKAAUACwAMAAAACgACAAoAFAAFABQABQAAAAwABQAMAAwACgAKAAsAAAD//xQACwACAAUACAD//xIA//8KAAUADAAIAAoA//8SAAAACgAKAAIADAAFAAwADAAKAAUA//8UAAUABQACABQADAAAAP//FAAAAAsADAALAAAACAD//wwADAAAAAsACgAMAP//AAAFAAgA//8AAAwABQAMAAUA//////////8MAAwAAgACAAoA//8SAAgACgAMAAwADAAMAAwAAgAFAP////8UAAwAEgAAAAwA/////wIA//8CAAIADAAMAAAAAAD//wUAAgAMABQADAAMAAwABQAMAAUAAgAFAAIABQD//woACgAUAAUABQAMAP//AAAMAAAA//8MAAwABQAKAP//AAAMAAAA//8FAP////8AAAAAAAAFAAIA//8CAAAA//8MAP////8IAAwA//8MAP///////wUAFAAFABIABQAFAAwACgAMAAwA//8IAAUA//8FAAwACgAAAAgA//8MAAAAAgAMABQAEgACAP////8MAAwAAgD//wAAAgAMAAwABQAFAAUADAD/////AAAMAAAAAAAFAAwAEgAMAAUABQACAAUADAAMABQABQAMAAIA/////wAABQAMAAIADAAMAAsABQD/////DAD///////8CAP//AAD///////8UAAIAAgD///////8AAAwADAAMAAUACgALAAAA//8MAAIADAAFAAUAAAD//wwAEgAUAAIADAAFAAIADAAFAAwAAAAAAP//CgD/////AAD//wAA//8MAAIA/////woADAD//////////wIADAAMAAIABQACAAAA//8AAP//EgD//wIAAgD//wIABQACAP//DAASAAwADAAMAAwABQD/////DAACAAoA//8MAP//BQAKAAIABQAMAAUAEgAKAP////8FAP//DAAMAAAABQAAAAIABQASABQADAD/////AAAMAAUADAAKAAIA/////woA/////xIAFAAKAP//AAD//wUA//8SAP///////wwAEgD///////8AAAwA/////wwABQAAAAwABQAAAAwAAAAFAP//AAAAAAwAAAAFAAwADAAMAAoADAAAAAAAFAAMABQAFAD//wAA/////xQA/////wUACgAAAAAA/////wAACwD//wUADAACAAwADAAKAAAA//8AAP//AgAMAAAAAAAMAAIACgAAAAwADAD/////DAAMAAwADAAFAAwABQAAAAUAAAAAAAwAAAAKABQADAAFAAAA//8KAAUAAAAKABQADAACAP//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////CQAAAAgAAAAQAAAAAAAQAAgAAAAIAAwA//8MAP//AgAJABAACQAAAAwAAAAJAP//CQD/////DAAMAAgAAAAMAAAACQAMAAoACAAMAAwADAAMAAgACgD/////CgD//wkAEgAMAAwACQD//woAAgAMAAoACAAUAP//AAAMAAwACgAJAAIADAAMAAwAAAAAAAwA/////wkA/////wIACAAAAP//AgACABQAAgAIAAkA/////wAAFAAKAAwADAAMAAwACgD//////////wkA//8UABQACgAAAAAAAAD//wIA/////woAFAAMAP//CgAMABQAFAAKAAwAEgD//////////wAAAAAJAAIADAAMAAoADAAMABIAFAD/////AgAIAAwA//8CAAwAEgAMAAIAAAAUAAwAFAAAABQAEgACAAoAAgD///////8CAAAA/////wwADAAAAAoADAAAAAwAAAAAAAkADAD//wAADAD///////8CABQA//8AAAAAAAAUAAwAFAACABQA//8AAP////8KAAAAAgAMAAwADAAMAAwADAAMAP////8AAAoA/////woA//8MAAwAEgD//wkA//8KAP//AAACAP//DAAAAAwADAAMAAAAEgASAAwAAAAAAAAADAAAAAoA//8MAAwACgAMAAwAAAAMAAwADAACAP//AAAMAAwADAACAAAAAAAUAAAA////////CgAMAAAADAAAAAoAAgD///////////////////////8AAP//////////AAAKAAwAAgAMAAAADAAMAAAADAACAAIACgD//wIADAAMAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8JAAAACAAAABAAAAD//xAACAAAAAgA//8AAAAABwAQAAkABwAMAAAACQAMAP//AgAIAAAACQAMABQA//8IAAAACQAMAAwACwAMAP//DAAQAP//DAAMAAwACQAAAAwA//8MAAwAAgAAAAwAEgD//wwAAgD//wAAAAAMAAwADAAAAP//AAD/////////////DAAMAAwADAAUAAIAAgAUAAwADAAMAAIACQD//xQADAAMAAwADAAAAAwADAD//wkADAAMAAwAAgACAP//////////FAAMAP//DAAAAAwADAAMAP//BwAAABIABwAMAAwADAAMAAwADAAMAAwADAAAAP////8MAAwAAgAMAAwADAAAAAwA//8AAAwAAAAAAAwAAAD//xQADAAMAAwADAAMAAIADAACAP///////wAAAAAMAAAAAAAAAAwADAAJAP////8LAP////8AAP//DAACAAwAAAAMAAAAEgAMAAIACAAHAAgAAgAAAAIADAACAAIADAD//wwA//8MAP//DAAMAAwADAAUAAIAAgASAAAA/////wwADAAMAAIADAAMAAIA/////wwAFAAMAAAAAgAAAP//AAD/////AAD//xIA//8AAAIADAAMAAwADAAAAP//DAAMAAwA//8MAAIAEgAMAP//DAASAP////8SAAwADAAMAAAADAACAAwADAD//wAADAAAAAsADAAMAAsAAAAMAP////8MAP//////////////////AAAMABQADAAMAAAADAAMAP//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////CQAGAAgACAAQAAYABgAGAAkABgAMAAIADAAFAP//EAAFAAYABQAHAAwACwAGAP///////////////wUADAAQAAUABgAUAP//CAAGAAkACgAMAAYA//8FAAYABgAMAAoAAgACAAUAAgAMAAYACAD/////CgAJAAUACgD//wYADAAMAAYADAAIAAwABgAMAAUADAACABQABQAFAAUADAD/////DAAMAAwADAAUAAYABgACAAwABQD/////BQD///////8KAAwABQAGAAIACAAMAP////8UAP//AgAFAAwABgAJAAUA//8MAAoABgAFAAUABQAUAP//DAAUAAwADAACAAYA//8MAAIABQAFAAwABgAMAAwABQAMAAwADAAUAAwADAACAP//DAAMAAwADAAJAP//FAAFAAwA//8CAAUABQAGAAsABgAFAP//////////CAD///////8GAP//BQD//wwAAgD//wwABQD//woA//8SAAIABgAMAAwAEgAMAAIABgAGAAwABgAUAP////8MAP////8MAAwA//8MAAoADAAMAAoACgACAP//DAAMAAwAEgACAAYA//8SAAwADAD/////DAAMAAoACgAGAAwAEgD//wUABQAKABQA//8MAAYACgAMAAwAFAD//wIAFAAGAAwADAAMAP//FAAMABAADAAMAAUA//8MAAUADAAMAAIABgAFAAYABQALAAYABQAMAAwA////////CwD//////////wYA//8GAAYABQAUAP///////////////wYADAAGAP//AgAGAAUADAAGAAwAEgD//wwAAgAUAAYACgAUAAwACgASAAUA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wkAAAAIAAgAEAAAABQAEAAJAAAACAADAAAAAAD//wAAAAAMAAgACAAMAAAACQD/////BQD///////8FAAUABQAMAAUACQAFAAwABQAJAA0AFAAFAAAACQAIAP//DQAMAAwAFAAMABQABQAUAA0AAAAIAA0A/////wMA/////wAAAAD//wwADAAMAAwADAAFAAwAAAAMAP///////wwAAAD/////DAAUAAwADAAAAAwAAAAMAAwAAAAAAAUADAAMAAUADQAAABQA//8MAP//DAD//wAADAAMAAUACAAFAAwA//8MABQAAAD/////DAAMABQAFAAMAAUABQAAAP///////wcA////////DAAMAP//DAAFAAMAAAAFABQAAAAMAAUABQASAAwA//8AAAwAAAD//wMABQD//wwABQASABQAFAAIAP//AAD//w0ADAD//wAA//8SAAAABQAAAAwADAAMAAAAAAAMAAUA//8IAP///////wAA//8FAP//AAANAAUAAAANAAAAEgAMAA0AFAAFAAAABQAMAAwAEgAMAP//DAAMAAcADQAFAAUADAAAAAAABQAAAAwABQASAAwABQADAAwADQAMAAwAAAAMAAwA////////FAASAAwADAAMAAAADAAMAP///////wMAAAD///////8UAAwA//8MAAwADAAFABIAEAD///////8QAP////////////8AAAwADAAUAAwAAAAUAAAABQAMAAAADAADAAwADAAMAAUACAD//////////wUA/////wAA////////DAAMAP//BQANAAwAEgAFAAUADAANAAAADQAAAAUAFAADABQADAAUAAwADAAMAAAAAAAFAA0A/////xIA//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8AAAAAAAAIAAwACAAMAAAADAAIAAwABQALAAoADAAFAAwADAAIAAAAAgACAP//CwALAAAA//8AAAAAAgAMAAAABQAFAAUABQAUAAAAAAAAABQADAD//wwAAAAAAAwACwAFAAgAFAAFABQADAACAAoAAAALAAAADAAMAAIAAgAFAAwA/////wUACAAIAP////8FAAwA//8FABQAAgAMAAgADAAMAAwAAAACAAAABQALAAIAAgD//wAADAAHAAUAAAAIAAwABQAMAP//DAAAAAwADAAAAP//BQAAAAUAAAAFAAwA/////wwAAgAMAAwACgAHAAwADAAAAAwAAgACAP//////////DAAIAAwA//8FAAwABQAMAAAAAAD//wAAAgD//wAAAAAFAAUAEgAAAAwADAAMAAwACgACABQADAAAAAsACwAMAAIADAD//wwADAAAAAAAAAD/////DAAAAP////8CAAwAAAAMAP////8UAAUA//8UAAIAFAAFAP///////wIA////////AAALAP////8FAAAACwAAAAIAEgD/////AgAMAAoADAAMAAUABQAMAAwAFAAAAAAAFAAMAAIACgAIAAcAAAD//wwAAAAAAAwA//8SAAUADAAUABQADAAFAAUADAAUAAIAAAAFAAUAAAD///////////////8FAAAABQAMAAoAAAAFABIADAAMAAwACgD//wwAEgASAAAADAD//wwADAD//xQAAAAMAAwABQAMAAAA////////DAAMAAwADAD//wwA/////wwADAAAAP////8FAP////8MAAUADAD//wUAAAD/////AgAMAAAAAAD//xQA/////wwADAALAAwA//8MAP////8CAAAAAAAAABQADAAMAAwABQAKAAUADAAMAAoA/////wIA/////wwAAAAKAAwA//8FAAwAAgAAAAUADAAKAP//DAAMAAAA//8CAAAADAACAAwAAgAAAAwADAACAAUADAAFAAUAAAD//////////wIABQACAP//AgASAAwA/////xQADAAMAAwADAACAAUADAAFAAwAAgD//woA/////wwACgAMAAoADAAFAAUABQAMAAwAAAD//wwACgD/////AAAAAAwAAAAMABQAAAAMAAAAAgAAAAIA//8FAAwADAAFABIABQAFAP//DAAFAP////8KAAAADAAMAAwADAD//wwA//8MAAwADAD//xQADAD//wwAAAD/////BQD//wwA//8MAAwABQAFAAAAAAAAAAAA//////////8AAP///////xQA////////DAD//wAA/////wsABQD/////FAAAABQADAAUAAwABQAAAP//CgD//wsADAAFAAwADAD//wAA//8MAAwADAACABQABQAKAP//CgACAAsACgD///////8MAAUAAAD/////BwAAAAIA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wkAAAAIAAAAEAAAAAUAEAAIAAAACAAMAAAA/////wUACQAQAAkACgAMAAsACQAFAP//BQD//wAABQAHAP//BQAMAAgABQAFAAwACgAFAAwA//8IAAoA/////wkAAgAIAAAABwAJAAoACgAKAAwAAAAMAP//CQD//wIABQAAAAoAAAAMAAsADAAMAAUADAD///////////////8QAP///////wwADAACAAUACgD//wIAAgAFAP//DAAAAAAADAAMAAUADAAFAP//////////AAAMAAsABQAAAAAADAAAAAwA//8MAAsADAAMAAAADAAMAAAAAAAAAAgA//8CAP//DAAMAAAABQAIAAgABwAHAAAADAAMAAwACQACAAwADAAMAAAAEgAMAP//DAAKAAwABQAFAAIAAAAAAAwAAAAMAAwACgAAAAsAAAALAAwABQAFAAUABQAMAAIAAAD///////////////8AAP//DAD//wwA//8MAAUADAAMAAUADAAAAP//BQAFAP////8CAP//DAD/////AAAMAAUACgAFAAwABQD//wAA/////xIADAAMAAUADAD//wwAAAD//wwA//8JAAAA//8MAAIAAAAMAAwADAAMAAoADAAMAAwADAACAAwACgACAP//DAAMAAwAAAAMAAwAAAAMAAIAAAAMAAIAEgAMAAwADAACAAIADAAFAAAABQAFAP//BQAFAAwAAAAMAAIABQAAAAAADAACAAwAAAD///////8AAAwAAgAAAAwADAAMAP////8SABIADAAAAAAACwAAAAoAAAAMAAAAAAASAP//AgAFAAoACgAAAAUA//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8JAAAAAAAQABAABQD//wAADAAAAAsA//8AAAUACgAFAAAACgAMAAAA////////AAAFAAIABQAAAAUABwAFAAwABwAMAAUAAAAMAAIAAgACAAwAAgAMAAwACgAAAAwAAAAAAAwADAAFAAIAAAAAAAAA//8FAAoADAAMAAcABQAMAP//CgD//wIADAAMAAwADAAMAAAADAACAAAADAAKAAIADAASAP//CgD//wwA//8CAAUADAAAAP////8MAP//DAD//wIADAAMAAwABQAFAP////8MAAsADAAMAAAADAAMAAkAAgACAAwA//8MAAwADAAMAP//CgAMAAoAAAAMAAwABwAMAAoAAAACAAUADAAMAAwADAAMAAwADAAFAAUAAgAMAP//DAAMAAwAAAD//wcAAgAKAP//DAAKAAIABQAFAAwAAAAMAP////8AAAwABQAMAAwABQD//wwADAAMAAsAAAD///////8LAAwAAAD//woADAD//wAADAAFAAIABQAFAAIABQAFAAIADAD/////DAD//wwA/////////////xIAAgAMAP//AAAMAAoA/////wcAAAAMAAoADAAFAAIADAAMAAwADAAMAAwADAAFAAUADAAMAAwADAD//////////wAABQAMAAIA//8AAAAA//8MAAwAAAAFAP//BQAKAAwA//8MAAUA//8AAP///////wwABwAMAAUADAAFAAUAEgD//wUABQAKAAUADAAMAAwAAAAFAAwAAgACAAwAAAAFAAwABQAAAAwABQD//wUAAAAMAAwABQAAAAwACwAMAAwA/////xIA////////EgD//xIAEgAKAAAAAgAAAAAAAAAMAAwA//8KAAUA//8MAAwAAAAMAAwADAAFAAUACgD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wkAAAAAAAgAEAD//wgAAAAJAAAACAAIAAAAEAAQAAgACAAIAAwADAAJAAwABQD/////DAAMAAwADAAAAP//FAAAAAoACQAKABQAAAAFAAgADAD/////DAAUAAAAFAAMAAoACgAMAAUABQAJAP//AAAMAAUA//8UAAwA//8AAAwADAAMAAwABQD//wwACgD///////8SAP//////////BQAFAAwAFAAUAAUADAAAAAwADAAMAAAAAAASABIADAAMAP////////////8IAAkADAAMAAUABQAFAP//DAD//wwAFAAAAP////8MAAAABQAAAAwADAAAAP////8UAAoACgAUAP////8FAAUABQAFAAwAFAAMABQACgAAAAAAAAAMAAwACgAAAAUA//8AAAwAFAAKAAwABQAAAAAAAAAMAP//////////BQAFABQADAAMAAwABQAKAP//CAD///////8AAP//DAD//wwACgAUAAAAAAAMAAAAAAD//wAAAAAFAAoA/////xQA//8HAAwAFAAMAAwADAAMAAAADAAMAAwACgAFAAAAAAAUAAwA//8FABQA//8MAAUAEgAFABQAAAAFAAwADAAAABQA//8UAAwABQAUABQADAAAABIA//8AAAwAFAAMAAwA/////wAADAAAAAwADAAMAAUACAAIAP//DAAAAAAADAAMAAAAAAAAAAwAAAAMAAUAAAAUABQAAAD///////8FAP//DAD//////////wwA/////wwA//8UAAwADAAFAAAAFAAAAAoAAAAAAAAAAAAAAAAABQAFAP//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////CQAAAAAACAAQAP//CAAQAAkAAAAIAAAA//8AAAAADAACAAoADAALAAkABQD//wUAFAAFAAoAAAAKAAwACgAAAAwACgACAAAA//8FAAwA//8KAP//FAAFAAwADAAMABQADAAMAAwA////////AAD/////BQAMAAAACgAMAAsADAAFAAAADAD//wgACAD//wAA//8KAAoACgAKAAUADAAMAAIAAgAAAAwAAAAFAAwABQD/////EAD/////CgAFAAUABQAAAAUACgACAAwA//8AAAsA//8FAP////8UAAUAAAD/////////////DAD//wIADAAKAAwADAACAAwADAAAAAwABQAAAAUAAAD//wwADAAMAP////8AAP//BQAFAAUAEgAFAAUACAAFABIA//8MAAUAFAAMAAAABQAAAAAAFAACAAAADAAAAAUABQD//////////wwA//////////8MAAoAEgAMAAwABQAMAP///////wwADAD//wwAEgAFAAwA//8FAAwADAAMAP//AAAMAP//CgAAAAoABQAAAAUAAgAKAP////8FAP////////////8FAAUADAASAAUA//8MAP//BQAUABIA//8MAAwA/////wgACAD/////BQAFAAAAAAAUAAAAAAAAAAAABQAKAAwADAAAABQADAAAAAwA//8FAAAAAAAAABQADAAAAAwADAD//////////wwAFAAMAAAADAAUAAwADAD//wAA//8KAP//AAD///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8JAAYABgAHAAcABQAGAAYABQAGAAkACQAMAAYA//8KAAUACQAMAAUADAAFAAYA/////wwA/////wcABQAFAAoABQAKAAYAFAAGAAsACwADAAYA//8GAAUADAAGAAkAAwD//xQABQAFABIABQAUAAwADAAUAAwADAD//wYACQAKAAkABgALABQABQAMAAUAFAAFAP//////////BQAGAP///////wYA//////////8DAP//DAAGABQACgAMAAYABQAMAAwA//8MAAwABgAFAP//FAAUAAwA/////wYA//8MAAUAFAAJAAoADAAMAAwABgAMAAsADAAMABQABgD//woADAAUAAYA/////////////////////wMA//8UABQA//8GAAwADAAMABIABgAMAAYABgAKAAwADAAGAAwABgAUABQAEgAFAAYA//////////////////////////8MAAwA/////wMA/////wwADAAGAAYACgAMAAwA//8LAAsACwAFAAUADAALAP//CgAGAAwABQAFABQABQD//xIADAALAAwADAAMAAwACgAUAAwACgAMAAwADAAUAAwA/////wwABgAMAAwAFAAMAAUABQAMAAwADAAMAAYABQAMAAwADAAGAAoA//8KAAYAFAAMAP//BgD//wYABQAFAP////8MAP//////////////////FAAFAAYABgAMAAUABQAKAAYAFAAFAP//DAD//xQA//8FAP//BgD//wwABQD/////CgD/////FAASAP//BgD//wsA//8FAAwA//8MAAUADAAGAP///////wUABgAMAP//DAAFAP////8GAAwA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wkAAAAIABAAEAAAAAIABQAAAAAACwAFAAwABQD//wAAAgAFABQACAAMAAAA/////wIA//////////8CAAIACgAFAAIABQAMAAwAAAAJAAoAAgAIAAwADAD//wgA//8AAAIADAD//wwABQAMAAoADAACABQABQAFAAIAAAAFAP//CAAUAP//DAAMAAwACQACAP///////wwA////////DAAMAAwADAAMAAAABQAMAAkAAgAFAAwADAACAAwADAD/////DAAMAAUAAAAMAAwABQAFAAUAAAAMAAUADAD/////DAALAAoABQAFAP//CAD//wwADAAAAAwAAAACAP//CgAFAAoAAAAKAAwAAAD//woADAAAAAwACgAFAAwADAAMAAAACAAMABIAAAAUAAwADAAMAAkADAD//xQADAAFABIADAD/////DAAMAAwA//8KAAAAAAAFAAwAAgAMAAIAAAACAP////8MAP////8FAAAA////////BQAAAAUAEgD//xIA//8SAAwA//8MAAoADAD/////////////AgAMAAwABQACAAUADAAMAAwADAASABIA/////wAAAAAMAAwADAAMAP//DAAMAAUA////////DAD//wUADAAMAP//BQAKAP//BQACAAAAAAAMAAIADAD//wAADAAMAP//DAAMAAAA//8CAAwA/////wwABQAMAAwA//8CAAwADAAMAP//BQD/////AAAAAAwAAAAAAAwAEgAKABQACgAMAAsADAD//wAA//8SAAUA/////////////////////xIAAAAAAAIAAAAKAAAAAgAKAAAADAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wkAAAAAAAgAEAAHAP//EAAJAAAACwACAAAADAAAAAwAAAAIAAwACAD///////8JAP//DAACAAwADAAMAAIAAgD//wwACQAMAAIAAgAJAAwA//8MAAcADgAMAAAAAAAMAAwAAgAAAAwA//8IAAkAAAAAAAkACQD//wIADAAMAAwADAD//xIA/////wIAAgASAAIADAAAAAAAEgAMABIADAAUABQADAAAAAwACAAIAP//FAD/////AAAIAP////8LAAwAAAAAAAAACQAMAAAA//8MAAsADAALAAwAAAAAAAIAAgAAAAkABwAMAP//AAAMAAAA/////xQA//8MAAwADAAAAAwADAAMAAIAAgAUABIADAAMAAAAAAAUAP//FAACABQAAAAMAAcAAAACAP////8AAAwACAAAAP//CwD//wwADgAMAAwAAgD//wAA/////wAAFAD//////////wAA////////AgASAP///////wAADAAAAAwAAAAAAAAADgD//////////wwADAAAAAwADAAUAAAADAAMAAAADAAMAAwA/////wwADAD//wwADAAAAAwAAAAAAAAAAgAMAAwAAgAMAAwADAD//////////wIADAD//wwAAgD//////////wwA//8UAAwAAAACAP//EgAMAP//EAAIAP//EAAQAP///////////////wkAAAAAAAwADAAAAAAAFAD/////FAAAAAIAEgAMAAIADAD//////////////////wAA//8AAAwADAAAAAwAAgD//wwAAAAAAAAADAACAAIA//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8JAAAACAAAABAAAAAMAAgADAAAAAsAAgD/////FAAQAAkADAAUAAUADAAAAP////////////8UAAwAAAACABQABQAAAAIACwAKAAwAAgAIAAwAFAAKAAUADAACABQACAD//wAAAAAMAAIABwAMAAwAAAAUAAAADAAUAP//CgAMAAwABQAJAAwA//8AAAAADAAMAAUADAACAAUACAAAAP////8FAAkAAAAKAAUA//8MAAAAAAAAAAwADAAMAAUADAAMAAwAAAAAAAwABQAUAAAADAACAAAADAD/////DAALAAoAAAAFAAAADAAAABQACgAMAAwABQAKAAwADAAFABQADAAKAAwADAAFAAUACgAAAAgACAAFAAAABQD//wUAEAAFAAAABQD/////AAAAABAAAgAMAAAAEAAFAAwABQD/////AgAKAP//DAAAAAAACgAAAAwADAAMABAAAAAAAAAADAALABQADAAAAAAABQAFAAwAAAAFAAUACwD///////8CAAAA/////wwAAAAAAAoACgD///////8UAP///////wAABQAHAAwAAAAMAAwADAAFAP////8FAP//DAAMAP//AAAKAAwADAACAAAABQAAAAwA/////xQA/////wAAAgD//wUA/////wwADAD//xQADAD///////8IAAkA//8UAAIAFAAFAAkAAgD/////AAAMABAABQAAABQA/////wwADAAMAAwADAAFAP//DAAAAP//DAAMAP////8CAP////8FAAUACgD/////DAAMAAwADAAMAAAA//8FAAUA//8AAAwAAAAAAAwADAAMAAwAAAAMAAwAAAD//wsAAgD///////8MAAIAFAAAAP////8FAAwAAAAMAAAADAAFAAoACwAMAP///////////////wUADAAKAAwAAAAAAAUABQD///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8JAAAAAAAHAAcABwAMAAoACQAAAAkAAgAAAP////8CAAAAAAACAAwADAD//wwA/////wkADAD/////CgAMAAwACgAMAAkAAAAUAAwACgAAAAwADAD///////8MAAwADAACAAIACgAUAP//CQAMAP////8LABQAAgAAAAoAAgAAAAwAFAD//wAAAAD/////DAD//wAAAAAMAP//DAAKAAwADAAMABQAAgAMAP//AAD//wwACwD//wAADAASAAAAAAD//wIA//8MAAwADAAMAAwA//8CAP///////wkA//8MAAwAEgACABIADAAMAP////8MAAwA//8KAP//AAAMABIA//8MAAwADAD//wwA//8MAP///////wAADAAMABQADAALAAAAAAAAAAAA/////wIACgD//wAADAAMAAwAAgAAAAwAAgAUAAAACQD/////FAAUABIADAD//wwA//8MAP////8MAP//DAAMAAIAEgAUABQAEgD/////FAAAAAwA////////EgD/////////////////////DAAMAAwA//8MAAwADAAMAAoAAAALAP//AAD//wAA/////woAAgAKAP///////xIA//8KAAoACwAMAP//AgACAAoAAgAUAAIAAAAUAP///////wwA////////AAD///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8JAAAACAAIABAAAAAAABAACQAAAAgABQAMAAwA//8AAAwACgAUAAoADAAFAAkA//8CAP//////////BQAMAAwADAAIAAUABQAFAAwAAAAKAAwADAAAAAUACgAMAP//FAAFAAwAAgAUAAwADAAFAAwAAAD//xAACAAFAP////8AAAAAAAAMAAwADAD//wUAAAAAAAwADAD//wgACQD///////8MAAwAAgAFAAwABQAAAAUADAAFAAUADAAFAAUABQAMAAUAFAAIAAgA////////DAD//wkAAgAMAAwADAAMAAwADAAKAAwA//8MAAwADAAAAAIAAAAAAAwAFAAAAAwA////////////////DAAMAAwADAAMAAAAAgAMAAwAAAAMAAUAAgACAAIADAAMAAUAAAD//wIABQAAAAUABQAMAAUADAAMAAoADAAUAP//BQAFAAUA//8UAP////////////8MAAwADAAMAAUAFAD//wUADAAMAAIAFAACAAIAAAAMAP//////////BQD//////////////////woAAAAAAP////8AAAwABQACAAAABQAAAAAAFAAAAP//AgAMAAwA//8MAP//DAAMAAUABQAAAAUAAAACAAIAFAD//wwADAAMAAUADAAAAAwABQAMAAUA/////wAADAAKAAIADAD/////BQD//xQA//8KABQADAAAAAAABQD/////AgD//wAA//8UAAIA//8FAAUAEAD//wAADAD/////BQD/////AAACAAwABQAUAAUADAAFABQAAAAAAAwAFAAAAAAAFAAUAAwAAgAFAAwAAgAAAAwA//8AAAIAAAACAAAAAgD//////////wAAAAAAAP//AAAAAAwAAAAAAAwABQACAAAA/////xQABQD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////CQAGAAcAEAAQAP//BQAFAAcABgALAAYABgAGAAgABgAJAAoACgAGAP///////wYA//8DAAoABwAJAAUAFAAFABQABgAGAAYAFAAHAAUA//8SAAoABQAJAAgABQASAP//FAAFABIABQAKABQABgAGABIABgAFAAsABQD//xQABQALAAUACQAGAAYA/////wUA//8GAAUABgAGAAYA//8UAAYABQAUAP////8UABIACgAKAAoABgAFABIA//8FAP//BgD//////////wUABQAGAAYABQASAP//AwASAP////8FAAUACwAGAAYACAAJAP///////wYACgAFAP//EgAKAAUABgAFAP//FAAUAAYABgAKABQAFAD//////////wYABQAUAAoABgAGAAoA//8GAAYABQAGABQABQAFABQABQAKAP////8GAAYABgAFABQABQAGAAoABgAGAP///////////////wYA//8FAP///////xQABgAGAAUA//////////8SAP//FAAIABQABwD/////BgAKABQABgAIAAUAFAAUAP////8FAAUAFAAKAAMA//8GABIACgAUAAUAFAD//wUACgAFAAUABQAUABQABgAUAAoAAwAUAP//BQAFAAYABgADAAUABQAKAAUAEgAFABIABgAGAAUABQAUAP///////wYABgALAAoAFAASAP//BQADABQABgAGABQAEgD//wYABQAFAAYABgAGAP////8DAAYABgAGAAYABgAUABQAFAAFAAUA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wkACAAAABAACQAFAAwAAAAAAAAAAgAJAAAACAD//wAADAAAAAsADAAIAAwABQAAAP//CQAFAP//CQAMAAUADAACAAwABQAAAP//CAAMAP//CAAIAAgACAAJAP///////wwA//////////8MAAwAFAALAP//CwAMAAUABQAMAA4AFAAAAAwADAAAAP//DAAAAAUA/////wAA//////////8CAAAA//8MAAAAFAAMABQAAAAAAAsAAgALAP//AgAFAAIAFAAMAAIADAAMAAAAAgAMAAUABQAFAAIAAgAFAP////8FAAgA////////////////BQAMAP//DAAFAAUAAAAAAAUAAAALAAAADAAMAAwADAAFAAwABQAAAP//DAD/////////////DAD/////BQAMAAUADAACAAAAAAAFAAwADAAFAAwADAAFAAUA//8AAAwAAgAUAP//////////BQAAAP///////wwADAAAAP//DAAAAP///////wsABQAAAAAAAgACAAwABQAMAAUAAgAAAAwA/////xQAAAAMAAwADAAMAP//DAD//xQABQAMAAIACwD/////DAD//wwA/////wwADgAAAAwADAAMAAAAAAD//wAA/////wIAFAD//wwABQAUAAIAFAAMAAwABQAAAAAADAAMAAIADAAFAAwAAAAFAAUAAgAFAAUADAAFABAABQAIAP////8UAAwA//8MAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8QAAAAAAAIAAwABwAIABQABwAMAAUABQAMAAAABQAAAAwAAAAIABQADAAUAAwADAAMAAgACAAAAAwADAAIAAAAAAAMAAAABQD//wAACAAKAAUA//8FAAwABQD//wAABQAMAAAADAAFAAUABQD//wUABQAMAP//AAAAAAAA//8AAAAADAAMAAAABQAAAAUA//8AAAwAAAAFAAwA//8AAAUAAAACAP//DAAMAP//AAAMAAAAAAAUABQAAAACABQAAAACAP////8MAAoA/////wUABQAMAAwAAAAAABQABQD//wAA/////wIADAAUAAAABQAFAAUADAACAAIAAAAFAAAADAD//woA//8MAAAADAD//////////wAA//8FAAUABQAMABQAAAD//wAA//8MAAIAAAAMAAwA//8CAP////8KABQAAAAAAP////8FAAwAAAD/////////////AAACAAUA//8MAP//DAAKAAIADAACAAwABQAAAP//DAD//wUA/////////////wAABQAMAAwADAACAAwADAAMAP//////////BQAMAAIACgAAAAcABQAAAAAAAgAMAAwAAAAAAAwACgD//wwAAAAAAAgADAD//wAA/////////////////////woADAAAAAAADAAAAP////8KAAAAAAD//xQABQAMAAwAAAAFAP////8FAAoABQAAAP//AgD/////AAAMAAUADAAFAAAA//////////8UAAIA/////wwACgAMAAAABQAMAAwAFAAAAAAADAAMAAwAAAAAAAUA////////////////BQAMAAwA//8AAAAACgAMAAwADAD//wwAAgAMAAwADAAMABQA//8MAP////8CAP///////wUA////////AAAAAAAAAAD//wAAAgAFAAAADAAMAAwABQAAAAUAAgAAAAAA////////////////FAD//wUADAAMAAUA/////wIAAAAMAP//////////////////DAAMAP//DAAFAAAADAACABQADAD//wwACgAMAAwAAAD//wAAFAAFAAAAFAAMAAUA/////wUA//8CABQAAgAFAAwADAD//wwADAD///////8MAP//CAD//wwAAAD//wIADAAMAAwAAAAMAAwADAAMAAoAAgAAAAwA/////wwADAAMAAAAAAAAAAwAAgACAAwAAgAFAAAACgD///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8QAAAAAAAAAAUABQALAAoAAAAFAAIABQAAAAUA//8FAAAABQAFAAAAAAAKAAoAAAACAAUACgAAAAAACAACAAUABQAFAAIA//8CAP//AgAKAAAAAAAAAAAA//8IAAAAAAAAAAcACAAFAAIAAAD//wAAAgAFAAAABQACAAIAAgAAAAUAAAAFAAUAAgAFABIAAAAAAAUABQAFAAAAAAD/////AgAAAP//CgD//wgAEgAIAAoACgASAAAAAAAKAAIABQAAAAAA//8AAAAACAAFAAUAAgAAAAAAAgD//wcACAAAAAAAAAAHAAcAAAASAAAAAAAAAAAAAAALAAsAAAALAAAAAAACAP//////////CwD//wAAAgACAP//BQAKAAUAAgAAAP///////wAAEgD///////8CAP//AgAKAAgA/////xIACgAFAP////8CAAAA/////wIABwASAAIAAAAAAP//AgD//wUAAAD///////8AAAgAAAACAAAA//8AAP//AAASAAAAAAAAAAAAAAAAAAAA//8AAAUABQAFAP//////////BQAFAAIABQD/////AAACAAAABQAFAAIAAAACAAoAAAAAAAAABQALAAAA//8AAP////8LAAAABQACAAUABQD/////AgD//wIAAgAAAAoA/////wIAAgD//woABQAFAAoAAAD///////8HAAoA/////wUA//8AAP//BQACAAUA////////CgAKAAIAAgASAAAACgD/////////////AgAIAAUAAgD//woA/////wAAEgAAAAIAAAAFAP////8FAAIABQAFAP//BQASAP//AAAAAAIABQAFAAIACAAAAP//AAAFAAAABQD//wAA//8FAAAA//////////8FAAAACgD//wUA//8FAAoAAgAFAAIAAgAAAAUAAAAAAAIABQAKAAUAAAAAAAoAAgD//wIA//8AAAIABQAAAAAACwALAAoAAAD//woAAAD//wAA//8AAAIAAAD//wAAAAAFAAUA/////////////wAA//8FAAIA//8CAAUA/////xIA////////CgD//woABQALAAIAAAALAP////8AAAAAEgACAP//AgACAAIA//8FAP////////////8CAP//CgASAP//EgACAAAAAgASAP//AgAFAAUAEgAKAP//AgACAP//AAD/////AAD//wIAAAACAAUAAAAFAAAA//8AAP//AAAFAAUABQD///////8SAP//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////CQAAAAAACAAQAAUADAAAAAkAAAALAAkADAAAAP//DAAQAAAADAALAAwADAD//wUA//8AAP//AAD//wwADAAMAAUADAAIAAwADAAHAAAADAAAAAwADgD///////8MAP//DAAMAP////8FAAAAAAAAAAIABQASAAkA//8QAP////8FAA4ACQALAAwA/////wwA//8AAAAABwACAP//////////DAAFAAIAEAAFAAUAAAAMAA4ADAAMAAwABQASAAUAEAAIAAIA//////////8MAAUAAAAAAP////8MAAwADAAFAAwADAAAAAUABQD///////8MAAcAAgAFAAwABQAMAP//DAAFAAUAAAACAA4AAAAMAAwAAAAMAAwADgD//wwABQAMAAgAAgAQAP////8IAP//AAD/////EgAMAAwADAAFAP////8IAP//CwALAP//CwAFAP//DAD//wwADAASAP//AAAFAAwABQAAAAAADAASAAwABQAFAAwADAACAP////8FAAwA//8MAAwAAgAMAAwADAAMAAUADAAMAAwADAAFAAAAAgAAAAwAAAASAAwADAAFAP//AgACAAAAEgAFAAUAAAAMAAgA//////////////////8FAP//AAAMAP////8MAAIAAAAFAAAAAAAAAAwA/////wwAAgAAAP//AAAMABIACwD//xIAAgAAAAAADAD/////AAAFAA4AAAAAAAUAAgAAABIADAAFAAAA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wkACAAAABAACQAFAP//AAAAAAAADQD//wcAAAAMABQADAACAA0ACAAFAP//AAAFAAwADQAUAA0ADAAUAAwABQAMAAUACAACAAAA//8IAAwA//8MAAwABQAAAAwAAAAMABQADQACAAUADAAFAA0AAAAMABAABQAMAAUAAgAIAP////8MAAAACAAAAP//////////DAD//wwADAACAAAAAAD//wwA//8MAP////8AAAwAAAAFAAwAAAD//wUADAAFAAUABQAAAAwADAAUAAAAAAANAAwA//8FAAUACAAIAAgA//8UAAAADAAJABAA/////////////wgA//8CAAIADAAHAA0ADQAMAAUAAAAAAAUAAAD//////////////////wIADAAMABQABQAMAAwAAAD//wwADAAMAAUAAAACAP//DQAMAAwAAAAAAAwAAgAMAAAABQAAABQAAAACAAAADAAAAAUACAD//////////wwACAAAAP//DAD/////////////DAAAAP///////////////wIADAAMAP//AgD//wIA//8FAP//DAACAAwADAAUAAwAAAANAAwABQAAAAAA//8CAP///////wwABQD//wwADAAMAAIADAD/////AAD/////DAD//wAA//8MAP///////wwA//8MAAAA//8FAAwAAAAMAAAABQAMAAwAAAAAAAIADAAAAAAADQAAAAAAAAANAAUAAgAFAP//DQAFAP////8NAAIAAgAMAAAADAD//////////w0ACAD/////DAD///////8IAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8JAAgAAAAQAAkABQAIAAwACwAAAAwACQAKAAwAAAAAAAUAAAD//woACAAIAAAADAD//wAADAD/////FAD//wAACgAAAAoABQAAAAkABQAKAAgAFAAJAAAAAAD/////DAD/////////////AAAAAAAADAD//xQAFAAAAAAAAAAAAAUABQD//wwAEAAMAP//AAD/////FAD//wAA//////////8AAP//CgAMABQAAAAMABQAAAAUAAAAAAAMAAwABQAMAAwADAAKAAAADAAFAAAADAAMABQABQD/////////////////////DAD///////8FAAAAAAAFAAwABQAMAAwABQD/////EgD//wUADAAMABQA//////////8FAAwABQAFAAAAAAADAAAADAAFAAUADAAFAAoAAAAUAAwAAAAAAAwADAAFAAwACgAIAAwA/////////////////////xQAEgAMABQACgAMABQADAAFAAwADAAMAAUADAAUAAUA//////////////////8FAAwABQAFAAoADAAFAAAACgD//wMA/////xIAAAD//////////wwA/////wUACgAAAAwADAD//////////wUADAAFAAwAAAAAAAoAAAAUABQADAAUABQADAAKABQABQAUAAwAAAASAAwAEgAMAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8GAAgABgAKAAgACgAFAAoA//8IAP//BgAHAAUAAgALAAYABgAIAP////8CAAgAFAAKAP//BgAFAP////8FAAgACAD/////FAAGAAYABgALAAYABgAGAAYABgAHAAcAEgAUAAgA//8IAP//CwAGAAYABQAKAAYABgAFAAoA//8CAAYAAgAGABQAFAAKAAIA//8GAAUABQAKAAoABgAFAP////8CAAUABgAFAAsABQAGAAsABQAKAAYABQAFAP//BQAFAAUA//8FABQAEgACAP////8GAAYABQACAAIABQAGAAYA//8FABQA//8FAAUAAgD//xQABgAKABQA//8GABQAEgAUAAUAFAAFAAUAAgAUAAgABwAGAAIABgALABQACgD//wYABQAGAAYABgAGAAYABgAGAAoABgAFAAUABgD//////////wgA////////CAD///////8GABIA/////wIABgAKAAUAFAAFAAUACwAGAAYAAgD//wIAEgD/////////////BgACAAoAEgAGAAYABgACAAYAAgD///////8CABQA//8GAP//BQD/////FAAGAP//BgAUABQA//8SAAYAEgAFAP////////////8FAAIABgAUAAIA//8GAAIAAgD///////8GAAUABQAFAAUABgD//wsA//8KAAUABQAGAAUABQAGAAoA//8LAAUACwAGAAYABgD/////////////////////EgAKAP////8GAAYACgAFAP///////woACgAGAAYABgAFAAYAFAD//wYABgACAAYABQD//wUABQD///////8SAP//AgASAP////8CAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8JAAAAAAAIAAgABQAMAAUACQAAAAkACQAIAAgA//8FAAAAAAACAAwAAAAAAAcADAD//wIABQD/////DAAAABAAAgAMAP//BQAFAAIADAAAAAUA//8AAP//EgD///////////////8HAAAADAANAAAAAgANAAwADAAMAP////8IAP//BQAMAAwABQAMAAwABQAQAP////8AAAkAAgD//xIAAAAMAAwAAAAAAAcADAAFAAAADAD//wwADAAIAAgA//8MAAUACAAAAAUADQAFAAwA//8CAAwADAAMAAUADAAMAAsAAgAAAP//////////AgAMAP//////////BwAFAAIADAAAAAUAAAACAAIADAD//wIADAAMAA0ADAAMAP//DQAAAAwAAgACAP///////xIAAgAQAAAA//8JAP///////xAA//8FAAwA//8FAAIADAAMAP////8FAAAAAAACAAUA//8FAAwAEAAAAAAACwD//wAA//8AAAwAAAAMAAwAAAD//wAAAgAAAA0AAAANAAwADAACAAwADAAMAAwADAAMAAIAAgD//wUADAAMAA0AAAAMAP//DAAMAAAADAAAAAIA//8CAA0ADAAAAAwA//8SAAAADAAQAAUABQD///////////////////////8FAAwA//8NAAwAAAAFABAADQASAAwABQAAAAIAAgAQAAAAAAAMAAwAEAD//w0ABQAMAA0ADAAMAAAADAACABAAAAAAAAAAAgD///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8AAAgAAAAAAAoACgAAAAoACgAUAAAAAAADABQAAAAHAAMAAAAQAAgAAAAUABQA/////wsACwAKAAAACwAQABQA//8KAAoAFAAUAAAACgAAAAAACAD//xQA//8KAP//CwAAAAsACwAAAAAAAAAUABQAFAAKAAAAAwD//woA//8AABQAFAAQAAAAAAALAAoAAAAUAAcAAAAAAAAAEAD/////EAD/////AAAAAP//CwALABQA//8LABAAEAD///////8KAP////8KAAAAFAD//wAAAAAUAAMA/////xQAFAAUABQAEAAQABQAEAD/////AAAUABAAAAAUAP//FAAUABQABwAAAAoA//8QAP////8IAAgA/////wAAAAD/////AAAAAAsAAAALABQACwALAAAACgD//wsAAwD///////8UAAMAAAAQAAoAAwD/////FAAAAAMACwD//xQAAAAAABAAEAAQAAAAEAAQAP//EAAAAP//AAAKABQA////////FAADAAAAAAAAAAAA//8AABQAAAAUABQA//8DABQAAAAAAP//AAADAAAAAAAAAAgA//8IAAgA//8IAP//CAAUAAgAFAAUAAAAFAALAAsACwD/////AAAAAAAAAAD//woA//8AAP//AAAKAP//FAD//xAAAwD//xQAEAADAP////8QAAAA//8QAP///////xQACgAAAAAACwAUAAAAAAD//xQAFAAAAAAAAAAUAAcAFAAQABQA/////////////////////xQAFAAAAP//AwAUAAAAAAAUABQAAAD//xQAAAAAAP////8AAP//EAAAAAAAAAAAAP///////////////wAAAAADAP//FAAAAAoAAwD/////AAAAAAAAAAAUABQA//////////8QAP//AwAAAP////8AAP//BwD//woAEAAAABAAFAAIAAAA////////CwALAP////8UAAAA//8LABQAFAAAAP////////////8AAP////8AAP//AAD/////EAAQAP///////xQAAAAKAAAAAAADAP///////wMA//8AAP//AAD/////FAADAP///////wMA////////////////AAD///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8JAAYABwAUAAcADAAGAAwACgAKAAkA/////wYADAAMAAwABgD//woAAgAKAAYACQACAP////8MAAwADAAGAAwADAAGAAIABgAGABQA//8GAP////////////8MAAoAAgAMAAoABgACAAYADAAHAAIADAD/////DAAMAAYABgAMAAwABgD/////AgAMAAIABgAGAAIABgD//wYADAAMAP////8MAAwACgAMAAcACgAMAAwABgAMAAoABgACAAwADAAMAAYADAACABIA//8GAAYADAD//xIA//8MAAwABgD///////////////8SAP///////wwACgASAAYABgAMAP//DAASAP//DAD//woAAgAKAAkA/////wYADAAMABQADAAGAAYABgD//xIADAAMAAwADAAGAAwABgAGAAYADAAGAAwADAAGAP//DAACAAYA/////wwADAAMAAwABgD//xIA//8MAAoAEgACAP////////////8MAP///////wwAEgAGAP//BgD//////////wwAAgASAAwAEgD//xQAAgACAP////8UAAIAEgAMAP////8MAP//DAAKAAYA//8SAP//BgD/////FAAHAAwADAAGAAYABgAMAAYADAAGAAIABgAGAAYACgAGAAwADAAMABQADAAMAAYABgAGAAwAEgD///////////////8MAAwADAAGAAYADAAGAAwA//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8JAAgACAACAAkAAAAMAAwACwAAAAUAAgAMAP////8AAAwACwALAA0ACAAIAAIAAAAAAAgA//8AAAwAAAAMAAAABQD//wwABQAFAP//BQAUAP//AAAJABIA//8SABQA//8AAAAACwAMAAAAAAAMAAAADAAAAAAADAD//wsABQAFABQADAASAP//////////BQD/////CAD/////////////AgD/////CwAMAAAABQAFAAAADAAFAAwABQAMAAAABQAMAAIABQAAAAwADQAFAAAADAAMAP//CwAMABQAFAD/////BQD/////////////FAAAAP////8LAAUABQAFAAUABQAMAAsAAgD//wwABQAMAAUADAAMAP//EgAAAAwAAAAAAAAABQAAAA0ADAAAAAUAAAAFAAAADQAMAAwADAAFAAUADAAAAP///////wwADAAMAP//////////AAAMAAAA////////AAASAP//CQACAAUA////////////////AgAAAAAAAAD/////DAAMAP////8NAAAA//8AAAsADQD/////AAD//wAA//8MAAUAAAD//w0ADAAFAAAADQAAAP//AgAAAP//AAAMAAAAAAAAAAAA//8FAAIADQASAAAADAAMAAUADQAMAAUAAgAMAAAADAAFAAwADAD//wwA//8AAAwABQAMAAUABQASAAwA/////wwADAAAAAwA/////////////wwA//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8JAAgAAAAAAAwACAAMAAwABwAJAAkABwAAAP////8AAAoAAAD//woAAgAAAP//CQAAAP////8MAAcAAgD//xQADAAAAAgACQAJAP////8JAP//AAAAAAIABwAMAP///////wwAEAAMAAwACAAIAAIAAgD/////FAD//////////wAA//8AAAoAAAAMABQAAAACAAIADAAMAAwAFAAMAAIADAAMABQADAAAAP////8MAP//DAD//wAA//8MAP////8MAAwAFAAAAAwADAD//wwADAAKAAwADAAMABAAAgAMAAwACgAMAAAADAAKAAIAAAAQAAAADAAMABQAAAAMAAAAAAD//wAA//////////8IAP///////wwA//8MAP//DAAMAAoA//8MAAwA/////wwAAgAUAAIAAAAMAAAAAAAMAAwAAgAAAAAAAAAMAAwAAAAMAAwA/////wwADAAMAAAAAAAAAAAA//8CAAAAAAACABQAAAD//wAADAAQABQAAgAUAP//AAAIAP///////wAAAgD/////////////DAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wkABwAAAAgACQAAAP//AAAJAAAAAAAHAP//AAACAAIAAAACAAgA//8AAP//AgAKAAoAAAACAAgAAAAJAP//CAAAAP//AAAIAAAA//8AAAAAFAAKAAIA//8SAP//EgAUAP////////////8AAAAAFAD///////8UAAgAAAAKABQA//8AAAIAAAAAAAAAAAAAAAAA//////////8CAAgACAD//wgA//8KAAgA/////wAA//8UAP//EgD///////8CAAoAAgAAABQAAgD//wAA//8CAAAAAAAAAAAAAAAAAAAA////////EgD///////8IABQA//8IAP///////wAAFAD//woAAAACAAIACgACAAoAAgD//wAAAAAAAP//////////AAAUAAIACgAAAAIA//8SAAAAAAD//wAA/////////////wAACAAAAP//AAAIAP//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////EAAFAAsABQAAAAwA//8AAAwACwAFAAAADAAAAAIAAAAMAAsABQAMAAAABQAFABQADAAAAAwAAgAMAAwAAAAAAA4AAAD///////8MAAAABQACAAAAEgAMAAAADgAAAAAABQAMAAAAAAAMAAwADAAMAAwADAAMAAwAAAAFAP//AAAMAAAABQAMAAAADAACAAwA//8MAAwABQACAAIAAAAAABQAAAAMAAUAAAAFABIAAAAAAAUADAAAAAAAAgAMAAwABQAFABQABQAMAAAA/////wwAAAD//wwADAAMAAAAAgAMAAsADAD/////AAAUABQAAgALAAwAAgAMAAAADAAAAAwAAAAMAAwADAAOAP//AAAAAAAAAAAAAAUADAAMAAAAAAAUAAwAAAAUAAwABQAAAAUADAAMAAUAFAAAAAwA//8AAAwA//8AABQABQAAAAwAAAACAAwADAAMAAAAFAAMAAUAAAAAAP//DAAMAAAADAAAAAAA/////////////////////wAA/////wAAAAAUAAUADAAUAAwAFAAFAAUAAAACAAAACwAMABQAAAD/////AAAAAAAAAAAMAAAA/////wIA//8MAAwADAAAAAAAFAAAAP//AAAOAAAAFAACABQAFAAUAAwA//8SAAIA//8MAAwAAAACAAwAAAAAAAUADAAMAAAABQD/////DAD/////AAAMAP////8CAP////8AAAAAEgAFAAUAFAAMAAUAAAACAAwADAD//////////wAAAAAAAAwAAAAFAP//DAAMAAAAAAD//wUAAAAFAP//BQAMAAwAAAAUAA4AAAAAABIADgAOAAwADAAMAAwADAD/////AAAMAAAADAD//wwAFAAMABQA////////AAACAAIADAAMAAsAAAALAP//BQD/////AAAUABQABQAAAAAADAACABQAAAAAAAAAFAAAABQA/////wAADAAFAAAAAgAAAAAAFAAUAP//EgAUAAAAFAAFAAwAAAAFAAwA/////wUADAAMAAAAAAAFAAAAAAAMAAwA//8CAAIAAgAFAA4AAgAMAAwAAgD/////AAAMAP//AgAMAP//AAD//wIADAD/////AAAMAAAADgD//wAA//8AAAwADAD//wUAFAAFAAAACwAMAAwADAAAAAUADAAMAAAABQAMAAwADgAAABQA/////wwAAAAUAAAA////////AAAUAAwADAAAAAIABQAFAAAA//8FAAUABQD/////DAAFAP//DAD//wAAFAAUAAAAAAAMAAAAFAAUAAAAAAAAAAAA////////DAACAAAADAAUAP///////////////wwADAD//xQAEgAFAAwADAAMAAwAAAAAAAIA//8FAAUAAAAAAAUABQACAAwADAAAAAwAAAAMAAAAAgASAAwAAAD///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8JABAABwAAAAcA//8AAAAAAAALAAkABQD//wUAFAAUAAAABQD//wUACQD//wAAAAALAAUABQAFAAUAFAACAAoAAAAAAAIA//8FAAUAAAAKABQAAAD//wUACgAKAAoABQAAABQAFAAHAAAAAAAFABQAAAAFAAUAAAD//wAA//8AAP////////////8FABQAAAAAAAUAFAAFAP////8FAAUABQD/////AAAAAAAA//8CAP//BQAFAAUAAAAAAAAA/////wUACwAAAAAAAAAAAAUABQACAAoAFAAFAAoA/////wUAFAAUAAUAAAAAAAUAAgAAABQAFAAAAAAABQD//////////wUA//8FAP//AgD//wAA//8KAP////8UAAIABQAAAAAAFAD/////AAD//wUABQD//wIA//8LAAAAAgACAAIAAAAKAAAAAAACAAIAAAAAAAAAAgAAAAIA/////wUABQAFAP///////wIAAAAFAAAABQAFAAAACgACAAoABQAKAAUAAAAFAAUACgAKABQABQAAAAIACgAFAAIA////////BQAKAAoA//8AAAoA/////wAAAAAAAAAACgD//wAA//8AAAAABQAKAAAABQD//wAABQAAAAIACgD/////AAD/////////////AAAAAAIAAgAAAAAAAgACABQAFAAKAAAACgAAAAAABQACABQAAAAAAAAAAAAAAAUABQAFAP///////wIA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wkAAAAAAAwABQAFAAwAAAAFAAUAEAAKAAwA//8AAAsABQAUAAAADAALAAAADAD/////BwAAAP////8HAP//DAAMABQA//8AAAAAFAAUAAAACwAMABIAFAAMAP//EgD/////DAAMAP//DAAFABAAAAAAABQADAD//wwADAAMAAAABQAMABQAEAAAAP//DAAKAAwAFAD//xQAFAD/////AAAMAAkABQD//wwAFAAMAAoADAD//xQA/////woACgD/////FAASAAwADAAMAAoAFAAMABAADAAFABQAAAAFAAAA//8MAAwA/////wAA/////wAA//8MAP////8AAAAABQAQABQAFAAKAAkACQAAABAA//8SAAUA/////wAA//8MABIADAAKAAAADAD//woAAAD//wAAAAALAAAAAAAKAP///////wwAEAAMAAwABQAMAAwADAASAAAAAAAMAAwA//8MABQAAAD//wAAEgD//wUA//8AABQA//8UAP///////xIAFAAAAAAAFAAAAAUAAAAUAAwADAAMAAUABQAAABQAAAAKAAwADAD///////8AAAUA//8MAAwA//8MABQA//8UAP//FAAAAAoAAAAUAAoAAAAAABQA/////wAAAAAUAP//BQD//wwAAAD//woAEgASAAwAFAAMAP//EAAAABQAAAAAAP//AAAKAAAABQAMABAA//////////8UAAAADAAAAAUA//8MAAAAFAAMAP//AAD/////CwD//xQA/////wAAAAD///////////////8AAP//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////CQANAAcABQAAAP//AAAHAAUABQAFAAUA//8AAAgAAAAAAP////8NAAUA//8AAAsABQAFAAkAAAAAAAsAAAAAAAAAAAAAAAAAAAALAAsAAAAAAP////8AAA0AAAAAAA0AAAAUAP//AAAAAAAAAAADAP//AAAQABQAAAD//////////wsAEgAQABIAFAAUABQAEAAIAAkAAAAUAAAAFAADABQAFAAAABQACwAAAAAACwAFABQABQAAAAUA//8FAP//AAAUAP//EgAUAAAAEgAFAAAABQAFAAUAFAAAAP//CwALAP//AAAUAAAABQAUAA0ABQAAABAAAAAAABQAFAD/////AAAAAAAAAAD//xAAAAADAAAAAAAUABQA/////wAACwAAAAUAAAAUAAAA//////////8LAAAAAAADAAMAFAAAABQAFAD/////EgAAAP//AAD//wUAAAAUAAUAAAAAABAAAAAUAAAAEAD//////////wAA//8FAAsA//////////8QABQA//8AAAAA//8QABQAEAAAAAAAFAADABIADQAUAAgA//8QAP////8JAP////8IAAAAFAANABQAAAALAP////////////8UAP//EAD//wAAAAAAAP//FAASABQA//8AABQAAAAAAAAAAAD/////AAAAABAAAAAUAA0ABQADAAsA//8NAP//AAAAAAUAEgD//wAABQAQAAAAAAAQABQAAAAAABAAAAD//////////xQA//8AAAAAEAD///////8DAAAAAAADAP////8SABAA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////CQALAAAACwAMAAwADAAIAAwADAD//wwA//8IAP//DAAJAAoAAAALAP//AAD//wAACQAMAAoAAAAMAAwAEAALAAAAAgD///////8AAP//EgD//wwAEAAMAAwACgD//xIA//8LAAAAAAAAAP//DAAMAAAA//8MAP//////////DAAKAAAAAAAQAAAAAAAKAAIAAAAIAAAACwAAAP////8LAAoA////////CwALAAwA//8MAP//DAAAAAwAAAAAAAoAAAAAAAwA/////wIAEAACAAwACgAMAAkAAAAMAP//DAAMAAwACQALAP//AAAAAAAA//8MAP//CwD//////////wwA/////wsA//8CAAIAAAAAAAAA//8AAAAAAAAMAAoAAAAAAAwAAAACAAwAAgAMAAwAAAASABAAAAAQABAADAD//wgA//8MAAIAEgD//wAA//////////8MAP//////////AAALAAsA/////wIAAAALAAAA//8LAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8JAAAABwAFAAcADAAAAAgADAAKAAkA/////wAA//8KAAkADAAMAAAADAAIAAAAAwD//wwAAAAHAAAADAAAAP//BQD/////BQAFAAAAAAD//wAA/////wwADAAMAAUA//////////8AAAAA//8UAAAAEgAAAAwAAAD/////////////BQAJAAwAFAASAAAA/////wwADAAIAAoA//////////8MAAMAAAAUAAwADAAAAAwABQAAAP////8MAAUABQD//wwAAAD//wUAFAAAAP//DAAAAAAACAAUAAwAFAAAAP//DAAMAAwAAAAMAAMAAAAMAAAADAAMABQAAAAMAAAAAAAFAAAAFAD///////8MAAwABQAFAAAADAD//wAADAAUAAUABQD/////BQASAAwAEgAAAAoABQD//wAACQD/////AAAMAP//DAD/////CgAUAAAA//8MAAwAAAAMABQAFAAAAAwABQAMAAUADAAAAAwAAAAAAAAA//8AAAAA////////AAAUABQAAAASAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wkAEAAGAAYABQAFAAgABQACAAYABgACAAUA//8JAAYABgASAAUABgACAAUAFAAFAP////8KAP////8GAAoABgAGAP//BgAKAAIABgAGAAYABgAKAAUABgAFAP////8GAP//BgAGABQA//8UAAIABgACAP////8GAAYA//8GAAYABgAGAAIABgAGAAoA//8CAAIAAgACAAUABQAGAAYA/////wYABQAFAAUABQAFAAUAAgAFAAUABgAUAP//BgD///////8SABIA//8GAAYABgAKAP////8GAAYABgD//wYA//8UAP//CAACAAUABQAIAAUAFAAKAAUABgAGAAYABgAFAAUABgAGAAYAAgAKAAIAAgACABQA//8GABQABgAGAAYABgAGABQABgACABIABgACAAYABgAUABQAFAACAP////8CAAIAAgACABQAFAAGABQA//8GABIABgD//wYAAgD//wYACgAGAP//BgAGAAoABgAKAAYABgACAAoACgAGAAYABgAGAAYABgAGAAUABgAGAAYABgAGAAYABgASABIABQAGAAoABgAGAAoABgAGAAIABQAUAAoABgAKAAIABgAGAAoABQD//wYABgAGAAYA//8GAAYABgAGAAYABgAGAAYA//8FAP///////wYA/////wYAFAAFAP///////wUA//8GAAUAFAASAP//////////FAASAP//EgACAP//BgD//wYABgAGAP//BgD//wYABgAKAAYA////////AgD///////8SAP//BgAGAP//EgD//wYA////////BgAGABIAAgACAAYABgACAAIAAgD/////BQAFAAYABgAKAAYABQAGAAYABQAFAAYABQAUABQACgAGAAUACgAUAAYAFAASAAYABgAUAAIABQAFAP//BQAGAAYA//8GAAYA//////////8SAAUABgAFAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wkACAAHAAwACQAMAAgADAACAAwABQD/////AAD//wwAAgAFAAAAAAAUAAwAAAAMAP//DAALAAUADAAAAAAA//8AAAAADAD//wwAAAD//wwAAgAUAP//AgACAAUACwAAAAAADAAMAP////8FAAAA/////wUACAAIAP////////////8JAP//BQAMAP////8AAAwABQAAAA4AAAD//wAAAgALAAsADAAAAAwABQAAAAUA//8UAAAABQACAAgA/////wAA////////BQAMAAAAAAAMAAwAAAAAAAAA//8FAAAAFAACAAAA/////wAAAAACAAwACwAAAAUADAAAAA4AAAAFAAIAAAAFAAwA//8AAAAAAgACAAIACAAIAP//CAAMAAwA//////////8FAP//CQAJAAAABQAMAAUADAAMAAAAAAAAAP////////////8UAAAABQD//wAABQAAAAAAAAAMAAAADAAAAAwAAAD//wUAAAD//wsACwAMAAsADAAMAAUAAAD//wUABQAMAAAAAAD///////8AAAwAAAAMAP//////////AAAFAAAAAAD//wUAAgD//wwABwD/////////////////////CQD//wkA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////CQAMAAcADAAKAAwAAAAKAAsADAAUAAAA//8MAP//AAAQAAoACwAAAAAACgAMAAIADAAAAP//AAACAAwADAAFAAUA//8AAAAAAAAMAAwADAAMAAwADAD///////8MAAAA//8AABAADAAMAAwADAAMAAUAEAAAAAIAEAD///////////////8MAAUAAAAUAAIABQAUAAUADAAAAAoAAgD//////////wAABQD/////DAAMAAwABQAMABQAAAAMAAwABQAAAAAAAAAUAAoAAAD///////8FAAAAEgAFAAUABQALAAUADAAMAAwA//8AAP//////////DAAAAAoACgAMAAUAEgAFAAAABQAMAAwADAACABAAAAAMAAwAAAD//wwAAAAMAAUABQAAAAAAAgAFAAIAAAAAAAUAAAAKAAAABQAAAAIAAAACAAUADAAQAP////8FAAwADAAAAAUAAAAAAAAAAAAUAAAA//8QAAAAAgACAAAADAAQABIABQAAAAwABQAFAAwAAgD//wAA//8AABAABQASABAAAAAMABIADAAMABQAFAAAAAsADAAUAAAA//8MAAAAAAAAAAwABQAAAAUA//8AAAwA//8MAAIAFAAMAAAABQD//wAADAAFABQABQAAAAoADAAFAAAAAAAFAAAAAgAFAAAAAAAFABIADAAFAAIA//8MAAAA/////wwA//8SAP//////////BQAFAP//AAAFAAwAFAD//wwA/////wIABQAAAAwAAgAUAP////8MABAA//8CAAAA//8FAP//AgAAAAwAAAAFAAAA/////wAADAAFAAwAAAAMAAwABQAMAAoAEAD//wUAAAAMAAAACgAAAAAADAAFAAUAEAD//wAA//8AAAAABQAAAAIAAAD//wIAAAAFAAAAAAD/////DAAAAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wkABwAHAAoAEwATABMAEwATAAwACQAUAP//CAD//wsAEAATAAUACAAFAP//FAD/////DAD//wwADAAMAAwADAD/////EwAFAAwACQATAP////8FAP//CAATAAwA//8KABQADAD//wUABQATABQA/////wwADAAUAAUACAAIABMA//8QAAkAEwAUAAwACwAMAAwADAAFAP//DAATABMADAAFABIAFAD/////FAAIAP//BQAMAAoA//8IAP//DAD//wwA/////wwACwAKABMAEwAUAP////8UAP////8MAP///////wwA/////wUA/////wUA/////wUAEwAMAAUADAAMAP////8SAP//DAD///////////////8MAAUA/////////////wkA//8MAAwADAD//xMA//8FAP//EwAQABQAFAD//////////xIA////////BQAMABMA/////xAADAAFAAwABQAMAAwADAAUAP////8FAP////8QAP///////wgA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wkABQAHAAwADAAMAAUABQAMAAUADAAMAP////8MABQADAACAAwADAAUAAoAAgD//wwACgD//wUABQACABAAEAACABQAAgAUAAUACgAMAAUABQACAAwA//////////8KABIADAAMAAUAAgACAAUABQAMAAsAEAAQAAIADAAMABIAEAAMAAIADAAQAAoADAACAP//AgACAAwADAAFAAwADAAQAAwAEAAKAAwAAgAMAAwADAALABIACgAMAAwA//////////8FAAwA//8FAAwACgAUAAoA//8MAAoADAAMABAACgAUABQA/////wwADAAQAAUAAgASAAwA//8MAAIA/////////////xAAEAAMAAwACgAMAAoABQAMAAwAFAAMAAwABQAUAAwADAACABIA/////wUADAACAAgADAAMAAwA//8IAP//BQAMAP////8FAP//FAACAP////8FAAUADAASAAUABQAUAP////8SAP////8FAAUADAAMAAIADAAFABAACgAFAAIAAgAKABIA//////////8MAAIADAACABQADAAMAAUACgAUAAoABQAMAAoAEAASAP////8LAAwABQALAAwABQAMAAUAEAAMAAUADAD/////DAAMABAADAD/////CwAUABQA//8MAAwACgD//wIAAgAKAAUADAAQAAwADAAMAAwAEgAFAAUAEAAKAP//BQD///////8KAP///////woABQAKAAwA////////EgD/////AgD//xQAAgAFAAUA/////////////wUABQAFAAUABQAMAAoA/////xAADAAQAAUADAAKABQADAACAAIADAAKAAIAAgD//wIABQAQAAoABQD//wUA/////xAAAgAQABIACwAMABIA//8SAAwA/////xIA//8MAAwADAD//wIADAACAAIA//8CAAUAAgACAP////////////8MAAwA//8MAAoACgALAAsACgAFAAoABQAFAAwADAAMAP////8MAAwADAD//wwACgAFAP//CgAFAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8JAAgACAAAAAkAAAD//wwAAAANAAwABQAMABIAFAAUABQABQAIAAIAAgANAP//DAAAAAIADAAAAAUADAAMAAwADAD//wAABQD//wAADQD//wgA////////////////DAAMAAwADAAMAAwABQAUABQADAAFAAwAAAAMAAwABQAAAAgADAANAAAA////////DAAMAA0ABQANAAUAFAAMAAIAAgAAAAwADQAFAAAADAAMAAwADAASAAAABQAMAP////8MAAIAAAACAAIADAAFAAAABQAFABIA////////////////BQAFAP///////wAAAAANAA0ADAAFAAUAAAAMAAAADAACAAwABQD//w0AAAANABIAAAAFAAwADAD//wIAAAAAAAAAAAAMAAwADAAMAAIABQAAAAAAAgASAAIADAAFAP//BQAFAAAAAAACAAwAAAAAAAwADAAAAAUADAAMAAUADAAAAAAACAAUAP///////xQA//8IAP////8AAAwABQAAAAIA//8AAAAABQAAAAAABQACAP//DAAAAAUADQAAAAAABQAMABQAAgD//wIABQAFAAwADAAAAAAABQAAAAwAAgASAAUABQAFAP//////////EgAMAAwADAAAAAAAAAACABIADAAMAAAADAAMAAwA//8FAAwADQACAAwADAAFAAwA//////////8MAA0A////////////////BQAFAAUAAAAFAAAAAAACABQADQAAAAAADAAAAAAADAAFAAwADAAMAAUAAAAAAAwADAAAAAwADAAAAAwAAAAAAAAAAAAAAAkA//8MAP//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////CQALAAAADAAMAAUA//8CAAUACgAMAP//CgAMAAwA//8KAAwACwACAAwAAAAAAAwADAAMAAwAAgAQAAsA//8KAAwA/////wUA/////wAA/////wIAAAAAAAIABQAFAAoADAAAAAUAAAAAAAwADAAQAP//DAD//wwACwD//wIAAAAMAAAABQAAAAAADAAFAAAAAAD//xAAAAAFAAAADAD//xAAAAAAAP//AgD//wAAAAALAAUAAAAAAP//AAD//wIA//8AAAUA/////wUAAAAAAAAABwAMAAAAAAAQAP//AAAAAAAADAAAAAwAAAAAAAAACgAFAAwADAAAAAAABQAMAAUABQAFAP////8FAAUAAgD/////AAD/////CwD//wIA/////wUAAAALAAUADAD//wsA//8AAP//BQD//wwACgAFAAUAAAAHAAUABQAAAAUADAACAAAADAACAAwABQAFAP///////wUAAAAAAAUACgAMAAAADAAAAAUABQAQAP//AAAKAAAAAAD//wUAAAAFAAUADAAAAP////8FAAAAEAAAAAAA//8FAP///////wwAAAD///////8CAAIAAAAAAP//////////////////DAD///////8MAAUADAALAP////8FAP///////wwADAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wUABwAAAAUACAAFAAAAAAAQABQAFAACABQAFAACAAAAAAAAAAoABQAAAAgACgAFABQAAgAKABAAEAAAAAIAAAAUABAAFAAAAAAABQAAAAIA////////EAAIAAUAFAAAAAIACgAAAAAAAAAAAAoABQAKAP////8AAAAAAAAAAAAAAgACAP//BQAAAAsAEAAAAAoAFAAKAAAAAAAAAAUA////////AAAAAP////8IAAUAAAAAAAUAAAAAAAcAAAAKAAIAAAASAAoAAAD/////AAD//woA//8FAP//AAAKAAAAAAAAAAAABQAKAAAABQAFAAoA/////wAAAAAAAAAAAAD//wAAAAAUAAIABQAUAAsACgAAAAAAAAAFAAAAAAASAAUAAAASAP//////////BQAIAP//AAACAP//AAASABIA//8KABIAAAAAAAAAAAAQAAAABQAAAAoAEAAAAAAACgAAAP///////wAAAAAAAP///////xIAAAAFAP//AAAFAAoAAgAAAAAA/////wsAAAAKAAAAAAAAABAAAgAUAAIAFAAQAAIA//8CAAAAAgAAAAAABQAKABAABQAAAAAAFAAUAAUAAgAFAAsAFAAFAAUAAAAKAP//CwACABQAAAACAAAAAAAKAAAAEgAFAAIAAgAUAP////8AAAIA//8AAAIAAgAAAAIAAAAIAP//////////CAAAAP///////////////wAAAAAAAAAA/////wsAAAAFAP///////xIAAAAAAAUA//////////8AABIAAAAQAP//EgD//wIA/////wAAAAD//wAA//////////8FAAUAEgACAP//AAD/////AAD///////8KAAAAAAAAAAAA//8SABAABQACAAAAAgAAAAAAAAAAAAIAAgAAAAIABQAQAAoABQAAAAAABQD//wAAAgAAAAAAAAACABQAAAACAAUA//8FAP////8UAAAAAgAAABIAAAAAAAoAEgD//wUAAAACAAAAAAAAAAAABQD//xIABQD/////AAACAAAABQAAAAAAAAAFAAAABQALABIAEgAAAP//BQAUAAAACwAFAAAACgAAABQABQACAAAAFAAUAAIAAgACABIABQACAAAAAAAKAAAABQAAABQAFAAKAAoAAAAAAP////8AAP////8AAAAA//8AAAgAAgAFAAAAAAD//xAAEgD//xAAAAAAAP//EAACAP//AgD//woAAAAAABIAAAAAAAoABQAKAAAACgAAABAA/////wIAEAD/////EgAAAP//CgAAAAAAAAAAAAoAAAAAAP////8AAP////8FABAABQD//woAAgAAAP//CwAFAAUAEgACABAA//8CABIAAAAAAAoAAAD//wAAAAAAAAAABQAAAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wAACwAMAAsADAAMAAAACwALAAsA//8KAAIACwAMAAsADAAAAAAA//8LABQA//8KAAwADAD//wwAFAAAAP//CgAAAAsADAAMAAsAFAD//wAA/////wAADAAMAAAADAACAAIADAAKAAAADAD///////8AAP//FAAMAP//AAAMAP//EAAMAAwA//8QAP////8AAAAAAAAMAAIAFAACAAoA//8MABQAEAAKAAwADAAMAAAADAACAAwA//8UAP////////////8MAAsACwAKAP//AgD//////////wAAAAAMAAAAAgD/////CwAMAP//CgAKAP//FAAMAAIAAgAMABQAFAD///////8AAAIAFAAMAAwA////////AAAKAAwADAACABAAFAAMAAwA//8AAAAA//////////8AAAsA//////////8MAAwA//8CABAA/////xAADAD//wIADAAQAP////8AAP//////////AAACAAIADAAAAAAADAAAAAAADAAMAAwA//////////8QABAA/////wwAAgAQAAwADAD//woADAD/////AAAAAP///////wwA/////wsACgD/////AAD//wAADAALAP///////////////////////wAADAAMAAwADAAQAAwAFAACAAIA//8CAAwA//////////8KAAIADAAMAP//EAD/////AgD/////DAACAP//AgD/////DAAMAAAADAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wkACAAGAAsADAAKAAwACwAMAAYACQAFAAgACAAGABQADAAMAP//BQAJAAYADAAIAAwADAD/////////////DAAMAAwADAAMAP//FAAIAP//BgAGAP//CAAMAAwAFAD//wwA/////wwABQAMAAUACgAFABQACwASAP//BQD/////////////BgD///////8FAAwA//8GAP//////////BQAFAAMACgAGAAYADAAFAAYABgADAAYA/////wsADAAMAAYA//8SAAgABQD//xQA//////////8MAAUABgAFAAwABgAMAAUADAAMAAYADAAGAAwADAAMAAYACwAMAAUA//8LAAUA//8LAAsACwD//wwA//8FAAwAFAAUAAwACAAGABQA/////wwABgAGAAwACgAGABQACgAMABQABQAUAAMABQAFAAYADAAFAAwADAAMAP//BgAMAAYABgAGAAYABQAGAAwABQALAAYACwAFAP//BgALAAsA////////DAD//wYABQAGAAsA//8FAP////////////8FAP////8FAAwABQD///////8UAP//FAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wkADAAAAAAABQAFAAwAAAAFABQABQAMAP//AAADAAAABQAFABIAAAD//wAAEgAFAP////////////8MAAwAFAAMAAwADAD//xQA//8AAAwAEgADAAAA/////wwAEAAMABQADAAMABAADAAFAAwADAAAAAAAAwD//wAAAAAFABQAAAAAAAwA//8MAAwACgAKAAAABQAUAP//DAAMAAAAAwAMAP////8MAAwADAAMAAUADAAKAAAADAAAAP////8QAP//DAASAP//AAD//woAAAAFABQAFAAMAAwACgAAAAAACgAMAAwADAAFABQAFAAAAAAADAAAAAwAAwAAAAMA/////xQA////////AwD//wwA/////wUA/////wwAFAAMAAAAFAAMAAwADAAMAAAA//8MAP//DAD/////FAD///////8AAAoAFAD/////CgAQAAwA//8AAAAAAAAAAAoA/////xAAAAD//wAACgAAAAAAEAAMAAUAAAAAAAwADAAAAAUAAAASABIAAwAAAAAAEgD//wwA//8FABQA//8MAAwA/////xQAFAAAAP//EAAMABIA//8FAAwABQAAAAAAEAD//wMAEAD//xIAFAAAABQAFAD/////AAAFAP//DAAMAAUA//8MAP////////////8QAP///////////////wAA//8AABQA/////xQAAAD//wwAFAAKAAAAAAAAAAoA////////FAAAAP//FAAUAAAAAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wkACwAGAAsAEgAGAP//FAALAAYACwAHAP//AgAGAAsABgALAAsA//8GAAIABgAKAAoABgAGAAYA//8GAAoA//8CAAIA//8GAAsA/////wYABgAGAAYABgAGAAoABgAGAAYABgALAAsABgALAAYA/////wIA//8CAP//////////////////BgAGAAYAFAAGAAYACgAGAAYABgAGAAoACgAGAAoABgAGAP///////////////wsABgAGAAsAFAD//////////wYAAgASAAIABgACAAYABgAGAP//BgAGABIACgAGAAYABgAGAAoABgASAAoA//8SAAYABgD//wYABgAGAP//CgAGAP//CwACABIA//8SAAYACwALAAsABgAGAAYA//8CAAIA//8GAAIABgAGAAoABgAGAAYACgAGAAYABgASAP//BgAGAAYABgASAP//BgAGAAYAEgAKAAYACgASAAYABgAGAP//BgAGAAYAEgD/////CgAGAAYA/////woABgD//wYA//8GAAYACwD/////BgACAP///////wsA////////BgALAAYACgD//xIA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wkADAAHAAIABQAMAAUADAAMAAAABQD//wAA//8MAAAAEAAMAAwA//8FAAAAAgD/////AgD//wwAAAAMAAwABQAFAA0ADAANABAABQAAAP//FAD/////AAAHABAAAAAAAAAADAAAAAAABQD//wUAAAAAAAUAAAD//wwA/////wAABQAMAAwA/////wIADAACAAwAAgAFAAwABQAFAAAAAAAAAAsAAAACAP//BQAHAAAAAAAMAAAAAAAFAAAAAAAAABIAAAAAABAABQAAAP//AgAUAP////8AAAAACwAAAAwA//8AABIAAAD//wAAAgAAAAAAAgD//wAAAAAAAAAADQAAAAAADAAMAAAABQD//wAAAAASAAAAEAASAA0A//8AAAAAAAAAAP////8AAAUADAD///////8FAAwAEAAFAP//////////AAAFAAwADAD//////////xQA//8NAAAA/////wIAAAD//wAADQD//wAABQASAAUAAAAAAAAAEAACAP//AAAFAP//AAAAAAIAAAD//wUA//8SAAUAAAAMAP////8UAP///////wUAAAAMAAUADAACAP//BQAMAAwADAANAP//AgAFAAUAAAAAAAAAAgD//wAAAAAAAAAA//8NAP////8AAAAA//8FAAUABQD//wAADAAAABIAAAAAAAwAEAASAP////8FAAAADAAAAAUADAAMABAADAAMAAwAAAAAAA0AAgAAAAUAAgAAAAAADQD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wkACgAAAAgAAAAMAP//BQAJAAAABQAAAP//BwAMAAoAAAAAAAIAAgAQAAAA//8SAAoAAAACAAwABQAJAAwABQAKAP////8AAP////8MAAAA//8FAAUAAgD//wAAAgAHABAADAAUAAIACAD//wUAAAAFAAIADAAFAAwA//8MAP///////wIAAAAMAAAADAD/////DAAMAAAAEAAAAAAAAAAMAAwAAAAMAP///////////////wAABwAFAP////8FAAoAFAD//wwABQAAABIA//8CAP////8AAAUADAAFAAwAAAAAAAwAFAAFAAAA//8KAAwAAAD//wwABQAMAP//AAAMAAUADAAMAP////8AAAwA//8AAP////8JAP////8FAAwAEgD/////EgAMABIAAAAMAP//FAAMAP///////wwABQAMAAAADAAFAAoABQAFAAAADAAKAAIAEAAMAAwAAAAAAAAAAAD///////////////8SAP//AAAAAAwADAD/////AAAMAP//AAAMAAwAEgAAAAwAAAD///////8IAAIACQD///////8MAAwA//8MAAAA/////wwABQAAAAAADAAAAAAADAD///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8JABAAAAAMAAsADAD//wUABQAFAP//BQD//wAADAAAAAwADAAAAAwA//8AABQADAAOAP//AAAUAAAADAACAAwADAACAP//DAACAAAAAgAMAAIAAAAAAAAA//8OAAIABQAAAAAAFAAMAAIABQAMAAwAAAAMAAcADAACAAUAAAAMAAAADAAMAAwAAAAMAAAAAAAFAAUAAAAUAAwABQAFAA4AEgAFAP//AAD//xIAAAAMAAAAAAAMAA4AAAAMAAUAAgAMAAAAAAAOAAwA////////BQAMAAAAEgAUAAwADAAMAAIA////////DAD//wwADAD//wwAAAASABQAAAAAAAAAAAAMAAAADAAMAAwABQAAAAAA/////wUA/////wUAAAAAAAAABQAAAP//AAAMAAUA//8MAP//AAAAAAUAEgD/////DAD//w4AAAAAAAAAEgAOAAAADAAMAAwABQD//wIADAAMAAwABQAUAAUABQAAAAwACAAAAAwADAAMAAwAAAD//wwADgD//wwADAACAAwA//8MAAwA//////////8MAP//DAACAAAA//8AAAAAAgD//wAA//8AAAUAAAAFAAUAAAAFABQAAAAAAAwAAAAUAAwAFAAAAP//DAAMAP//BQAFAP////8AAP///////wAAAAD/////////////////////AAACAAIAAAAMAP//AAAMAAUADAD//////////wwA/////wAA//8AAP//AAD//wwA/////wwAAAAMAP////8SAAwADAAAABIADAAOAAIA//8FAAUADAACAAAAAAAFAAAADAD//wwADAD/////AAAAAA4ADAAFAAgA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////AAALAAAAAAD//wUABQAMAAIADAAMAAIAAAAMAAwADAAMAAwADAAAAAwABQAAAAIADAAMAAAABQANAAwADQAMAAUADAACAAIADAD//wwADAAAAAsAAAACAAIADAAAAAwADAAMAAAABQAAAAIAEAAAAA0ADAAMAP//DAAMAAwAAgAAAAIA//8MAP//DQAMAP//DAD/////EgD/////BQAQAAsABQALAAAADAAMAAUADAAMAAUADAAQAP//AgACAAwADAAAAAAABQAAAP//AAAAAAAA//8AAAwAAAAMABAABQD/////DAD/////DAAMAAwADAASAAwADQAFAP///////////////wIADQALAAwA//////////8AAAAA//8LAAwADAAMAAsADAAMAAwADAAAAAAADAAMAAIAAgD/////AAD//wwA////////DAAAAAIADAAFAAAAAAAMAAwAAgAFAAUAAgAFAAAAAAAMAAwAAAAAAAwAAAD//wIADAAFABAABQAAABAAAAAFAAwA/////wAAAAACAP//AgD//wAADQAAABAAAgAMAAAADAANAAwA//8SAP///////wUAAAAMAAwAAgAFAA0AAgD//wwAAgACAAwAAAAMAAwADAAMAP//DAAFAAwAAAAFAAwAAAAFAP//DAAFAAwADAAMAAAA/////wIA//////////////////8AAAIAAAAQAP////8AAAsAAAAAAAAAAAAAAAUAAgAAAAAAAgAAAAAADAAAAAIADAAAAAIADAACAAUADAACAAwA/////wAAAgD//wAA//8AAP///////wAABQAQAAwABQAMAAAA/////wwAAAAFAAAAAAACAAUADQD/////BQAMAAwA//8FAAIABQAFAP//DAD//wwAAgD//wUA//8MAAUA//////////8AAP//EAAMAP//////////AgACAP////8CABIAEgAFAAUA//8CAAIAEgAFAAUA//8SABIABQAAAAUADAD/////AAAMAAUAAAAAAAwAAgAFAA0ADAD/////DAAMAAwAAAAAABAAEAAAAAwAAAAMAAwA/////wwADAAMAAwAEgD//wAAEAAFAAAA////////DAAMAAUA//8AAP//AgASAAwA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////CQAFAAcAEwAMABMAEwATAAUAEwACAAwADAATAP//DQAMAA0AEwAMAAwADAAMAP///////xIAEgD//wgAAgANAA0AEwAMAAUADAAMAAwAAgAMAAwAEwACAAwA//////////8FAAkA//8TAAUADAAMAAIA//8MABMADAACAAwADAAMABMADQACAAwA////////FAATABMADAATABAAEwATAAwAEwAFAP//CQATAP///////xAABQAFAAIABQAMABQAAgAFAAwAEwAFAA0AEwAQAAIAEwACAAwADQATABMADQATAAIAEwASABMA/////xIAEwD/////EwD/////DAAMABMADAATABMAEwATABIAEwACAA0AEwD/////BQD//wIA/////wwA//////////8MAP//AgACAAwADAAMABMADAACAAwAAgATAP//DAAMABMAEwATABAAAgACAAwADAATAAIAEwATAAUADQAMAAwAEwAUAP//FAATABMA/////xMADAATAP//AgATABIA////////DAATABMA//8MABMADAD//wwAEwD//xMAEAACAAwADAD//wwAEwATAAwAEwAMABQADAATABQAEwATAAwA////////////////EgAMAAwAEAATAAUA/////xMAEwACABQA//8MABMA//8TABMAEwATAP//EwAMABMAEwAMAAwAEwD///////8QAA0ADQAMAAwAEwAFAP///////wwADAATAAUAFAAMABMABQATAAIADAATABMAEwD//wwAEwAFAAwAEwD//xIA/////wwAAgD//wwADAD//////////w0A/////////////xQAFAATABIA//////////8NAP////8TABMA//8TAP///////////////xIAEgD/////DAATAAIAAgATAAwADAAMAAwADAATABMAEwD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wkACwAAAAsADAAAAA0ACwAMAAwA//8MAAwAEAAMAAwADAAAAAAADAD//wgACAD/////DAASAP//FAAUAAUA//8LAAAADAALAAAACwD//wAACQD/////CAAAAP//////////DAAMABQAAAD//////////w0A////////BQAAAAsA//8NAAwA////////////////DAAFAAwADAD//xQAAAAQAAsAEAAUAP////8MAAwA////////AAAIAAUAAAAMAAwADAAAABQADAD/////AAASAP//AwAMAAwADAD///////8MAP//BQAMAAAA////////BQAMAP//BQAAAAAADAANABQAAAAUAAAAEAADAAAADQAFAAUAAAAAAAAA////////DAD//wAAFAD/////////////AAAMAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wwADAAAAAwAAAAAAAwADAAFAAUAAAAAAAUAAAAMAAwADAAFAAAAAAAAAAIAAAAUAAUACgAFABQAAAAAAAoABQAAAAAACgAAABAABQAUAAUAFAAAABQAAgAFABAA//8KAAwAEAAKAAwADAAMAP//AAAMABQAAAAUAAAAAgAAAAIAAgAFAAUAEAAFABAAAgAUAAAAAAAAABQA/////woAAgAAAAUACgAAAP////8QAAAA////////BQAAAAUABQAMAAwADAAMAAAAAgD/////BQAMAAUAAgAAAAUACgAQAAUADAACAAUA//8FAAwABQAMAAAAAAACAAwADAAMAAAAAAAUAAAAAAAFABQACgAAAAUAFAAFAAwAAAAKABQAAgAAAAAABQAMAP////8AAP////8AAAIADAAAAP//BQAFAAoA/////////////wAA/////wwADAAAAAUADAAAAAAACgAMAP//FAAMAP//DAAMAAwACgAMAAAADAACAAIAAAD//wIAFAAMAP//DAD/////DAAFAP//DAD//wwAAAAFABAAAAD//woAAgAFAAwAEAACAAAADAAAABAABQAUAP//DAAFAAIADAAMAAwAAAAMAAAA////////AAACAAIAEAD//wUABQAFAAAA//8AABAADAD//wAABQAAAAUAAAAUAAoAAAAQABQAAAAAAP///////wwA//8AABQAFAAAAAoAAAACAAAA//8AAAAABQD/////AAD//wAA/////wIA/////////////wwADAAAAAAAAgACAAAAAAAMAAAAAAAAAAUADAACAAIA////////AAD//wwAFAAMABAA//8FAP//DAAAABQADAAMAAIA//8CAAwAAAD///////8MAAIA////////DAACAP////8AAP//DAD//wAABQAMAP//BQAUAAUABQD//wAA/////wAACgAUABQAFAAUABQAAAAFAAAAAAAQAP////8AAAwAAgAAAAAAFAAQAAwADAAFAAIADAAMAAUAEAAMAAAAEAD//wwADAAMAAAADAD//wAA//////////8FAAoABQAAAP//BQD///////8FAP////8AAP//AAAUAP//////////BQD//wAAEAAMAAAABQAAAAUAAAD//wwA/////wAAFAD//wAA////////AAAAAAAAAAAMAP//////////AAAAAAAA//////////////////8QAP//AAAAAP///////////////wwABQD//wIA//8AAAAAFAD/////AAAKAAoACgAAAAwADAD//wAAAgAFAAAAAAAFAAUAAAAAAAAAAAAMAAUAAAAFABAA/////wAAAgD///////8MAAwADAD//wwA////////AgAMAAwA////////FAD/////CgAQAP//DAAMAAIAFAD//xAADAAFAP//DAAMAP////8CAP////8FAP//BQD//wwABQAKAAAADAD//wAACgAAAP////8QAP//BQAAAAIAAAAAAP//EAAAAAwACgAAAAwAFAAAAAAAAAAQABQAAAAMAP//DAD/////DAD//wwAAAACAAIA/////woADAACABQA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////CQAIAAAACwAAAAAADAAAAAwADAAJAAkAAgAIAAIAAAAAAAwA//8FAAwA/////wUAAAD///////8JAP////8AAAwADAAFAAwA//8AAAAACAAMABIA//8MAP//AAAMAAsADAAMAAwABQAMAAAAAAALAP///////xIAAAACAP//AgAMAAAACQAMAAUADAD///////8AABIABQAMAAUABQAFAAwADAAMAAwA//8CAAIAAAAMABIA//8FAAgABQD//wAAAAAFAP//BQAMAAkA////////DAD/////////////AAAAAP////8MAP//DAACAP////8MAP////8NAA0ADAD//wIADAD//wIA//8MAAIADAAMAAsADAAMAAAABQALAP////////////8FAP////8IAP////////////8FAAwA/////wAA//8FAA0ADAALAP////8FAAUA//8SAAwA////////BQASAAIADAASAAwA//8FAP//DAAMAAwADAAAAAwADAAAAAwABQALAAwADQAAAAUADAACAAwA//8MAP//BQD///////8AAP////8MAP//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////CQAIAAAABwAHAAUA//8AAAUACQAAABQA//8FAA0AAgAFAAUA//8JAAAAAAACAAIAAgAAAAAA////////AgAAAAUABQAAAP///////wUAAAAFAAAAAAACAAUAAAAAAP//AAD//wAACAD/////AAAUAAUACAAUAAUA/////////////wAABQAUABQADQAAAAIABQAFABQAAgACAAUA//8CAP//////////////////AgAUAAgA//8AAP//AAACAAUAEgAFAA0ABQAFAAIADQASAAUABQD//wAAAAAAAAIABQACAAIABQAFAAUAAAAAAP//AAAFAAUAAAD//wUA/////wUA//////////8AAP////8AAAUABQANAA0A//8AAAAADQAAAA0ABQAFAAUAAgAAAAAAEgD//w0AAAASAAUAAgACAAUAAgD//wIAAAANAA0AAAAFAAUABQD//wAABQAUAA0ABQAAAAUAAAAFAAAA/////////////wIAFAACAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////xQADgAAAAAAAAAAAAAAAAAAAAAABQAAABAABQAFAAUAAgAOAAUA////////EgAAAAUAAgAAABIABQAAAAAAAAAFAAAABQAAABAABQAAAP////8AAAIABQAOAA4ABQAFAAUABQAAAA4ADgAFAAAAAgAAAAAAAgAAABAABQAFAAAABQAFAAUAAAAFAAAAAAAQABQAAAACAAUABQACABAAAAAQAAUAAAAFAAAA//8FAA4AAgAQAAAABQAOAAAA////////BQAFABAADgAAAAAAAAASAAAAEgAQAAAAAAAAAAAAAAD//xIADgD//wAA//8CAAUAFAD//wIAFAACAAUAAAD//wAAAAD//wAAAgAOAAUAAAAAAAUAEgAOAP//BQAQAP//AAAAAAUADgAFABAAAgASAAAAAAAAAP//AAD//////////wUABQAAAP////8FAAIAAAAFAP//AgAFAAAA//8CAP//AAASAAAADgAOAAUAAAAAAP///////wAA//8AABAAEAAUAAUABQAAAAUABQACAAAAEAAAAAAAAAACAAAAAgD//wUAAAAAAP//BQAAAP//AAAAABAAEAAFAAIAAAD///////8AAAAAEgAAAAUABQAUAAAAEgASAAAAAAAAABQAAgAQAP//AAAAAAAAAgAFAAIAEAAFABAAEAAFAAUABQAFAAUA/////wAAAAAFAAUAAgACAP//BQD//wAAAAAAAAUAAAD//wIA/////wAABQAOABIAEgAFAP////8CAAAA//8FABAAAgAQAAIAEAD//wUA////////AAASAP////8CAAAAAgAFAAUA//8FAP//AAACAAUAAAD/////AgD//wAAAAACAA4AAAAAABIAEgD//w4AAAD//w4AAAAFAA4AAAAAAAAA//8AAAIAAAAAAAIAEAACAAAABQAAAAAABQAFAAUAAAAAAP////8FAAUA/////xIA//8QAP//AAACABIADgAFAAIA/////wAABQAFAAAA/////wIAFAD//wAA/////xIABQAAAAAAFAAFAAUAEAAAAAIAAgAAAAAAAAACAAIAAAAAAAAAAAAAAP//AAAAAP//////////AAAAABAAAAAOAAAABQAAAAUAEAAAAAIA//8QAP//////////EgD//wUA//8FAP////8SAP//AAAAAP//AAAAAAAAEgAAAP//AAAAAAAABQD//wUA////////BQD///////8SAP////8FAAAABQD//wUA//////////////////8FAP//AAD/////////////DgACAP///////////////wUABQD//wIA//8CAP////8QAAAABQAQAAAAAAD//xAA/////wIA/////wAAAAAAAP//AAAAAAAA/////wUA//8QAP////8AAAIA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////AAACAAAADAAMAAUADAAMAAUADAAFAAwADAAUAAUADAD//wUADAAMAP////8FAAwAFAAMAA0ACwAMAAwABQAFAAUA//8SAP////8NAAUA/////wwAAgAMAAwAAAANABQADAALAAAADAAMAAAAAgAAAP//EgAFAP///////wwAAgAUAAwADQAFAAUA/////wwA////////BQACAAwAAgAAAAIA/////wsAAAAFAAwADAANAAAADQAUAP//EgD//xIAAgANAP//DAANAP////8MAAwAEgD//wwAAgACAAwADAAUAAwAAgD/////BQAUAAcADAAFAAwADAD///////8FAAUACwD/////FAD//wAADAAMAAwADQAAAAUAAAAFAAwABQD//////////xQADAAMAAAA/////wUABQAFAP//DAAFAA0ABQD/////////////////////DAD//xIA//8MAAAA//8SAP////8MAAwAEgD//w0ABQANAP////8MAP//////////DAD/////DAANAAUA//////////8MAP//DAAMAA0AAAAFAAUAAAAAAAwAAAAFAAAABQD//wAADAAFABIA//8AAP////8AAAAA//8SAAUABQD///////8MABIADQAFAAIABQAMAP//DAAMABQAAgANAA0A//8CAAwA/////xQA//8MAAwA/////wwADAD/////EgASAP///////////////wwAAAAMAAUABQAAAP//CwAFAP//DAAAAAAABQAAAAUAAAAMAP//////////BQAMAAUAAAAAAAAAAgAAAAAAAAAAAAAAAAAFAAIAAAAMAAwAAgD//wwAAAAMAAUAAgACAP//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////CQAMAAAADAAMAAUA//8MAAAAAAACABQADAAMAAAABQAAAAwABQAMAAwA//////////8UABAAAAAMAAAA//8QAAUADAAFAAUA//8CAAwAAAAFAAwADAAAABQAAAAQAAAAAgD/////BQAUAAIAEgAAAAAADgACAAAA//8MABAABQAMAAwADgAMAAAAFAAAAAwAAAD//wUABQAAAAAAAAD//wIADgD//wAABQAUAAAAAAAFAAAA//8AAAAABQAFAAAAAgACAAAAAAAAAAUA//8LAAIAAAAFABAADAAMAAAAAAAQABAAAAAAAAUADAAAAAwABQAAAAAAAAAMAAAAEAAFAA4A//8FAAAADgAAAAwA//8UAP////8AAP//BQASABAAEAAOAAAA//////////8AAAUA////////BQAAAP//AAAUAAAADAACAAUAAAAOAAAABQD//////////xAAAAAFABAAAgACAAwADAAAAAwAAAAFAAIADAAFAAIADAAQAAAAAgAAABAAEgACAAAABQAFAAwAEgAFAAwAEgAAAAAA//8AAAwAAgAMAAwAAAAFAAwADAAMAAUAEAAMAAAA//8AAAwAAAAUAAAA////////EgD//wUA//8FAAIADgAAAP///////wAABQAFAP//////////AAD//wAA/////wUAFAAFAP//AgAUAP////8AAP////8AAAAABQD//wIAEgAFAAUA//8MAAAA//8AAP//AAAQAAAAAgD/////FAAAAAAAFAAAAAAAAAAMAP//AAAFAAUADgAFABIABQAFAAwABQAAAAwADgAMAAAAAAAAAAAAAAAQAP//AgACAAAABQAFAAUADAAFAAwA////////DAAFAAwAAAAFAAAAAAAAAP///////wAABQAOAAwAEgAAAAUAEAAAAP//AAAMAAAA//8FAP//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////CQAIAAAAAgAAAAAACAAMAAwAAgAIAAAA////////DAAMAAwACgAJAAAACQAAAAAAAgAAAAAAAAAMAAwADAASAAAACAD//wcAAgAAAAIADAAAAAwA//8MAAwAAAAMAAAAAAAAAAwACgAMAAwAAAAAAAAADAAAAAAAAAAIAP////8AAP////8IAP//////////////////AgACAP//////////AAAMABIA//8AAP///////wwAAAAAAAAAAAAAAAAADAAAAAAAAgAKAAAAAAAAABIAAAAMAAAA//8MAAAACgAAAAwACAAMAAwAEgD//wAA////////AAAUAAwAFAD/////AgD//wAAAAD/////////////CgAMAAIADAAMAAAAAAAAAAoAAAAAAP////8AAAwADAAAAAAA//8AAAAAAAAAAAwADAD///////////////8CAAwADAASAAAAAAAMAAwADAAMAP//EgD///////8IAP////8JAAkAAgAKAAwADAAAAAAA//8AAP////8AAP//AAAKAP////8AAAAAAAAAAAAADAAMAAsADAACAAsADAASAAAADAAMAAwADAAMAAAAAAAKAAoAAAAAAAAAAAD//wIAAgACAAAA//8SAAAADAD//wwAAAAMAAoAAAD/////AgAAAP//CgAMAAAADAAAAAIAAgAMAAoAEgAAAAAA/////xQADAD//////////wAA//8IAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8JABQAAAAAAAwACgD//wAAAAAMAAwAFAAFAAAABQAMABIAAAAQAAUABQAAAAwA/////wwACgAMAAwA/////wwADAAAAAAADAAFAAMACgAAAAwA//////////8FAAAACgD//wwA//8AAAUADAAAAAwA//8AAAAACgAMAAUABQAAAAAA//8AABQACgAAAAAAEAAMAAAAAAAQABIA//8QAAwA/////wAADAAMAAwA/////wUADAAQAAAAEgAKABQADAASAAwAAAAKABQAAAAAAAwAAAADAAUA//8QAP////8AAP//AAAFAAwAAAAUAAAACgAMAAAAAAAAAAAA//////////8AAAwA/////////////wwABQAQAAAA////////DAAAAP////8MAAwADAD/////AwAMABAABQASABQABQAAAAUA//8AAP//AAD//xIAAAD//wUADAAAABQABQADAAUAAAAMAP///////xQAAAAMAAwAFAAMAAAADAAMAAAAAAAUAAAADAAAAAUAEAAAAAAA//8KAAUAAAAFAAwAAAD//wwA//8MAP//BQD///////8AAP////8FAP///////xQABQAAABQA//8FAP////8AAAwAAAAMAP//////////DAD//wwAEAAFAAAA//8KAP////8AAAAAFAD//xIA//8AAAAA//8DABIAAAD//////////////////wAAAAD/////FAAAAAAAAAAAAAAACgAFAAUADAAMAP//DAAMAAwAAAAMAAwAAAAMAAwADAAAAAAADAAAAAwAEgAAAAwAAAAUAAAAEgAAAAAADAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wsACwAKAAsAFAD//wsACwAFAAAACwAFAAAACgD//wUACwAFAAsAAAAFABIAAAD/////AAAFABQA//////////8UAAAAAAD/////AAAAAAAACwAAABQAAAAFAAUAEAALAAAA//8KAAsA//8LAP//EgD//wUACwD///////////////8SAP//AAAUAAsAAAAUAAAAAAASAP////8AAP////8AAP////8UABIA/////////////xIA/////wAAFAAFABAAAAALABQAEAAAAAUAFAAAABQAAAAAABQACwD/////EgD///////////////8AABAAEAAQABQAAAAFAAUABQAAAP////8UABQAFAAAAAUABQAAAAAA/////wAAAAASAAUAAAAAAAAAAAAUAAAACgAKAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8JAAUABgAMAAYAAgD//wIABQAGAAwADAAMAAUABQAMAAwADAAGAAwADAAMAP//CAD//wYABgACAAwAFAAFAAIABgAMAAUADAACAAwABgAUAAYABQD//wYA//8GAP//BgAGAAYABgAMABQABgAGAAwADAASAP//BgAGAAYABgAGAAYA//8CAAwADAAMAAIAFAAMAA0AAgAFAAYA/////wYA//8MAAYADAAFAAwABgAGAAYABQAMAAYABQAMAAYABgACAAYABQAGAAwABgAMAP////8GAAYADAAGAAUADQD//w0ABgD//wUABgD/////EgAMAAYADAANAAYABgAGABIABQAUABQAFAACAAYADAAGAAYAAgASAAIA//////////8MAAYADQD/////////////BgAFAP//DAD//wYAEgAFAAwABwACAAYADAAUABQA//8MAAUABgAGAP//////////BgAGAAYABQAIAP//FAAGAAwADAAMABQAAgACAAwADAAMAAwADAAFAAUADQACAA0A//8CAP///////wYABQAFAAwABgASAP//DAAMAAYA//8GAAYAAgD///////8MAAYADAD//wYADAANAAwA//8GAAYADAAMAAUADAAMAAYA//8NAAYADQACAAYACAD//wYADAAGAP//BgAGAAYABgAMAAYABgAFAAYADAANAAwABgAGAAwAEgASAP//BQAGAAwADQAGAAYABQAGAAUABgASAP////8CAP//EgAFAA0A/////wYAAgAGAP//AgANAAwACQAMAAIABgAGABQADQAMAA0ADAAMAAIA//8MAA0ABgAGAAYABgAMAAwADAAMAAwABgAUAAwABgAUAAYADAD/////AgD/////DAD/////DQD//wwADAAGAAYABgAMABIA//8MAAYA/////wwABgAFAAUA//8CAAYABQAGAAYA//8GAAwA/////wwA/////wwA//8GAAYA/////wYACwASAAYADAD/////BgACAAYADQAGAP///////wYAAgAMAA0ADAAGAAYA//8CAAwAFAAMAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8MAAkAEwAKABMAEgATABMAEwATAP//FAAUABQAEAAHABMAFAAIAAUACgACABMAEwATAAoAEwD//woABQD///////8HAAwAEwAJABMAAgD/////////////AgATABMAEwD//xQAFAD/////FAD//wUA//8MAAwAEgAMABMAEwD//xAAFAASABMAFAAQAP////////////8TAP//BQAKAP//EwD/////BQD//wwA//8FAAUABQAMAAcABQATAAUABQAMAP//////////////////BwAIABMACgD/////FAD//xIAEwD/////////////EAD//wUADAAIAAwAAgAFAAgA//8MAP//DAAMAAUADAACAAwADAAMAAoADAD/////DAD//xMACAD///////////////8TAP//DAAMAAIA//8FAP///////wwADAAMAAwA//8KAAwA////////CgD//wwA//8MABMAAgAMAAIABQAMAAwADAAKABMADAAMAP//BQAMAAkA////////////////AgD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wkACAAAAAwAAAAMAP//CgAAAP//AAACAP//AAAAAAwACgD//wAA//8HAAAADAAAAAAAAgAMAAAADAAMAAIA//8AAAwADAAMABQAAAAMAAAAAAASABIACgACABQAAAAKAAoA//////////8MAP//CgACAAAADAAKAAwADAAMABIADAACAAwAAAACAAAA//8CAP//AAACAP//AgACAAAADAAAAAAADAAMAAwAAAASAP////8AAAIAEgD/////DAD//wwAAAAUABQACgAAAAoAAAAUAP//AAD//wwA/////wAAAgAMABQADAAAABQA/////xQA//////////8SABIADAD//wAA//8SAAwAAgAAAAAAAgD/////AAAMAAAAAAAAAP///////wwAAgAMAAwAAAACAAwA//8MAAwAAAAMAAwADAAAABIAAAAAAAAAAgAMAAAAAgAMAAoAAgAMAP//AgAUAAAAAAD/////AAAMAAwADAACAAAAAAAMAAwAAAAAAP//////////AgAAAP//CgAMAP////8CAAIADAD//////////wIA/////wAAAAAAAAAACgAAABQAAAAMAAwA//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8JAAUABQALAAAADAAUAAsACwAAAAoA////////DAALAAwADAAAAAAADAAMAAwA/////wAA//8MAAUADAAAABQAAAAMAAwADAAMAAwAFAAMAAwABQAMAP////8MABQAAAAAAP///////xIACgALAAAAAAAFAAwA/////xQAAAAAAAwADAAAAAwAAAAAAAwADAAFAAwADAAAAP///////////////wwA/////wwADAD//wsADAAMAAwADAAAAAwA//8MAP//BQAAAAwAAAASAAwAAAD//////////wAAFAD//wAADAD/////DAAMAAAADAAHAAwABQAAAAwA//8SAP////8MAAwAAAASAP//CwAMAAAAFAAMAAoADAD//wwAFAAMABQACwAUAAwA/////xQAFAD//wUA/////wAA//8MAAAA//8AAAAAAAD//////////wwA//8MAAwAAAAUABQADAAMAAwADAAFAAwABQAUAAAAAAAKAAAADAD///////8MAP////8AAAsA////////DAAMABQAAAAAAP///////xQAAAAAABQAFAD//wwAEgAKAAwADAD//wwAFAD/////BQAMAAUADAAFAAUA/////////////wAAFAD//wUA//8UAAAADAD//xQAFAD//wUAFAAAABQA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////CgAMABMADAAMABMAEwAMABMAEAAMAAwADAAMABAADAATABMAEwATABMAEwACAAwADAD/////EgAQAAwAEwAUAAIAEwAUABMAAgACABMAFAATABMAEgATABMADAAMAAwAEwAMAAwAEwACABQAAgAMAP//AgATABMAEwATAAIAAgACABQADAATAAIACwATAP//FAAQABQACgATAAoAEwACABMAAgAUABMAEwD//wIADAACABAACgATAAwA//8TAP////8QABMAAgATABMAAgATABMA//8TABQAAgATAP//DAAMABMAEwATABMA/////xAA//8KAP//AgAMABMAEwD//xMAFAAQAP//EwAMAP//DAAMAP//DAASAP//EwAMAP////8TAAsAFAD/////FAD/////FAATABQA//8TABMAEwAUAP//EwD//xMADAATAAwADAATAAwAEwAMABMA//////////////////8TAAwADAD//wwAFAATAP////8MABMAEwD//wwAEwAMABMADAD/////FAD/////DAAMABMAEwAMABMADAATABMADAAMAP////8TAP//EwATABIAEwACABIAEwATAP////8TABMAEwD///////8TABMAEwATABMAAgAMAP//////////////////EwD//xMA//8TAAwAEwATAP//EwD//xQA//8MABQADAATAP////8TAP////8CAP///////xMAEwATAAoAEwAMABAAEwATABMAEwAMAAwADAATABMAEwASAAIAEwAMABMA//8MAP//DAAMAP//AgAMAP////8TAP//EgAUAP////8UAP//DAACAAwAEwD//wwA/////wwA//////////8UABMAEwAKABAAEwAMAAwA//8KAAwAEAATAP//DAAMAAsAEwD//xMA/////////////xIA//8CAAoAAgACABMA//8TAP//FAAQABMAEwACABMA//8TABMAEwATAP///////wIAAgAQABMA////////////////EwACABQAAgAUAAIAEwATAP////8TAP////8TABMAEwD/////AgD//xMAEwD/////AgATAP//EwALABMADAD//wwACwATAAsADAAMABMADAAMAAIACgATABMAEgATABMA//8MABAADAATABMADAATAAIAEwD/////EwAMAP//EAATAAwA//8TAAIADAD///////////////8QAP//DAD//////////wwA//////////////////8TAAwA/////////////wwA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////BwAJAAgACAAKAAUADAACAAAAEAAFAAkADAAAAAAADAAMABIACAAMAP////////////8CAAAABQD//wAAAAACAAwADAAKAP//EAD//wIA/////wIA//8KAP//CgAMAP//////////DAACAAAACgAMAAwAAAAKAAwA/////////////wUA//8IAAIA/////wAACgAAAAAACgAAAP//EAAAAAUABQAMAP////8AAAAA//////////8IAAwABQD//wAAAAAAAAUADAAQABAAAAAAAAAAAAAAAAAAAAAAAAAA//8AAAAAAAAAAAUAAAD/////AAAAAAUA//////////8AAAUABQAKAP//BQAMAAAAAAAKAAAADAAAAAIAAAAAAP//BQD//wIAAAD/////AAAAAAUADAAAAAAACgAQAAUAAAAQAP//EgAMAAUAEgD//wUADAAAAP///////wwAAAD//wAA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////DAAHAAwACgAUABQACgAUAAwAAwAMAAAADAD//wwA//8AABQAAAD//woAFAAMAAoAAAAAAAAAAAAAAAAA//8AAAAACgAAAAAA//8QAAwAAAAAAAwADAAAAAwAEAAAAAAA//8MAAsAAAAKAAMA//8KAAAAAAAAAAAADAD//wAA/////wAAAAAAAP///////////////xQAFAD//wAAAAD//wAAAAAAAAwADAD/////DAD//wwADAAKABAACgD///////8AABAAAAAAAAAA//8AAAAADAAMAAAADAD//wwACgD//woA//////////8HAP////8AABQAAwAAAP//DAAAAAAAAAD//////////wwADAAMAAAADAAMAP//AAAUABQAAAAUAP//AAAQAAAAAAAAAAAAAAAAABQA//8AAP//CgAUAAwAAwAMAAMA//8AAAMAAAD/////AAD/////////////AAAMAAAAAAAKAP///////wAA//8MAAMAAAD//wAA//8AAAAADAAUAAMAFAAQAAAAFAAMAAwA//8AAAAAAAAAAAAA//8AAP///////wAAFAAAAP//FAD//wAAAwAAAP///////wAAAAAQAAoA//8UABAA//////////8AAP////8UAP//FAAAAAAADAAAAAAAFAAAAAAAAAAAAP//AAAAAAAA////////DAAAAAAA//////////8DAAAAAAD/////////////////////DAAKAAoADAD/////BwAMAAAA/////wAAAAD//wwADAAMAP////8AABQA//8AABQAFAD///////8AAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8IAAkADAAMAAAADAAJAAwADAACAP//AAAAAAUAEgAAAAUAAAAMAAwADAAJAAIA//8QAP//////////AAACAAAAAgAAAAIADAACAAIA////////CAAJAAUADAAFAAAAAAACAAwADAD///////8QAAIAEAAAABAAAAAAAAIADAD/////DAACAP///////wkADAAFAAgADAD//wAAAgAMAAAADAAAAAIADAAMAP////8CAP//BQACAP////8OAAIADAAAAAAAAAAFAAwADAAMABIADAD//wgAAAD//xIACAASAP//AAD/////////////AAAAAAwAAAAMAP//EAAMAAIADAD//wAAAAAFABAA/////wUABQD//wIA////////BQACAAUAAAAOAAUAAAD//wUABQAMAAwAEAAFAAUAEAAMAAwAAgAFAP////8IAP//BQD//wUABQAJAAgA//////////8AABAADAAAAAUABQD///////////////8MAAwA/////xIABQD//wAABQAFAAwAAAD/////////////AAD//wAA/////wAABQACAAAA//8AAAUADAAAAAIABQACAP////8CAAIABQAFAAwAAAAFAAAADAAAAAAAAAAMAAAAAAAAAAUAAAD//////////////////wcA////////////////AAAAAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8JAAAAAAALAAwAAgAJAAAAAAACAAwAAgACAP////8LAAIA//8MAAAAEAACAAIADAAMABIACgALAAIADAAMAAIADAD/////CgAMAAAAAAAMAAwAAAAMAAkAAAD/////AAD//wsAEgD/////DAACAAIA////////CwAAAAAAAAASABIA//8AAP////8MAAwAAAAMAP////////////8IAAAA////////CwALAP///////xAAAgAMABIA/////wwA/////wwA//8MAAwA//////////8CAAAAAAD//wAAEgAMAAAADAAMAP////8SAP//CgD/////AAD///////8MAP//////////////////////////CwACAP//////////DAAMAAwA//8MAAwA//8MAP//////////AgAAAAAA//8MAAAAAgALAP//////////AAD//xAA//8CAAwA/////xAADAAMAAAACgD//wAAAAD//woA//////////////////////////////////////////////////////////////////////////////////////////8GAAYAFAAGAAwAEAAGAAYAEgAMAAwABgAGAAwADAAGAAMACgAMABQA/////wwADAAGAAYACgAUAAwABgAMAAsAEAAUABAADAD//wwA/////xAAFAAMAAwADAAGAAwABgAUAAwA//8SAAwA//8KAAwADAAUAAwACwALAAsAAwAMAAsADAAMAAwADAAUAAwADAD/////CwD//wwADAD//wYA//8MABQA//8UAAYAFAD/////DAAMAAwADAAMAAwADAD//wwAFAADAAwABgAMABIAFAALAAYABgAGAAwAAwAMAAwADAAMAAwADAAMAAwA//8MABAADAAGAAYADAAMAP//EAAMAP///////wMADAAMAP//EgADAP//DAAGAAYADAD//woADAAMAP//BgD///////8MAP//DAAMAAYA/////woA//8SABIA//8QAAYA////////EAASAAwABgAGAP//DAD//wYADAAGAP//CwAMAAwADAD//wwAFAASAP//DAAUAP//DAD//////////woADAD/////////////////////BgD//xAADAAMAAwADAAMAAMA//8MAAYA//8MAAwA////////DAAGAP////8MAAwA////////BgALAAwA////////BgAMAAMA//8MAAYA/////wYA//8DAP//////////////////DAD/////DAAUAP//EgAGAAMADAAGABAABgAGAP//EgD//woADAAMAP///////woACgD/////FAAGAP//DAASABQA/////woA//8MAAwA/////wwA//////////8MABIA/////////////wsABgAMABQA////////////////DAAQABAABgAMAAYA//8MAP///////wsADAAMAAsABgD/////DAD/////////////DAAMAP////8MAAwA////////DAAMAP////////////8GAAwAEAD/////DAD/////EAD///////8MAAwADAAMAAwA//8MAAwAAwASAP//////////DAD///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8MAAAACQAAAAAACAAIAAAABQAUAAAACgAFAAAA//8AABAADAAFAAUAAAAMAAwA//8MABQADAAAAAwABQAAABQADAAAAAAADAAMAAwACgAFAAwABQAKAAwAAAAUAAwA/////////////////////wwADAAQAAUABQAUAAwA//8QAAUADAAMAAwAFAAAAAAAEAD//wUA//8KAP//BQD/////AAD/////AAAFAP//FAAMAAAAFAAMABQAAAAHABQAFAAMABAAAAAAAAUADAAFAAAAAAAKAP//AAAUAAAAEAAUAP//BQAAAP////8AABAA//////////////////8UAP//FAAUAAUADAAAAAAAEAAAAAAABQAAAAAAAAAMAAAABQAAAAAADAAUAAAACwAJAAgADAAFAAUA//8UAAAAAAAAABQABQD///////8MAP//FAD/////BQAMAAUA/////xQAFAAAAAUABQAQAAwABQD/////AAAUAP//AAD///////8MAP////8KAP//////////FAAMAP//CwAMAAUACgAAAAUA//////////8FAP//AAAAAAoABQAQAAAAFAAAAAoABQAUABAADAAMAAAAAAAKAAAAAAAUAAwAFAAMAP//FAAIAAUADAAAAAUABQAMAP//BQD//wwAFAAAAP//DAAKABQA//////////8FAP//////////BQD///////8AAP////8AABAABQAAAAAA//8UABQADAD//wAAFAAAAAAADAAAAP//AAD//wwAAAD//wUA////////AAD//xAA//8MAAAA/////////////wUA//8UAP//AAAKABQA//8AAAUAAAAAAAAABQAUABAABQAAABAABQAUAAUABQAFAAoABQAAABQABQAFAAAABQAAAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8MAAwADAACAAUABQACAAAADAAQAAUAAAAFAAIADAAAAAAADAAFAAIAAAAQAAIAAAAAAAAAAAAMAAwAAAAFAAAADAAFAAIADAAAAAAAAAACABIAAAD//wAAEgAAAAAA//8SAP////8KAAAABQAFAAwABQAMAAwAEgAQAAAAAAAAAAAABQAFAP////8MAAUADAAAAAAA//8KAP//BQAAAAIADAD/////AgAFAAAA//8AAAAA/////wAAEgD//wIA//////////8AAAUABQAQAAAAAAAAAAUAAAAMAAAADAAFAAwABQAMAAwAAAAMAAoAAAAQAAUABQAQAAUABQAMAAwAAAAFAP//AAAAAAAAAAAAAAUAAgD/////EAASABAAAAAAAAIAAAAAAP///////wwABQAAAAwA//8AAP///////wAA/////wUAAgAKAAAAAAAAAAAAAAAAAAUAAAD//wAADAAKAAAABQAFAAUABQAKAAwAEAAAAAIAAAAAAAUACgAMAAwABQD//wUACgAAAAwADAAFAAwAAAAAAP////8MAAUAAAACAAUADAAMAAwAAAACAAUADAASAAUACgASAP//BQAAAAAAAAD//xIA/////wUAAAAFAAAA/////xIABQD/////DAAAAAAAAAD///////8SAP////////////8AAAAA////////BQD/////AAD/////AgD/////DAAQAAIAAAD/////AgAAAAoADAAAAP///////xAAAAAAAP//AAD//wAAEAACABIAAAAMAAwAAAAAAAoABQD//wAA//8MAAoAAAAAAAAAAAAMAAwAAAAFAP//EAAFABAADAAMAAwA//8CAAwAAAAFAAwAAAAFAAAA/////wUA//8AAAUAAAAFAAIAAgAFAAUAAgAMAAAADAACAAwAEgAFAP//DAD//wwADAAMAAUADAAKAAAAAAAFAP////8MAAwA//8MAAwAAAD//wIA////////AAASAAwA////////BQAAAAwABQAMAAAAAAD///////8KAAwAAAD//xAA////////AAAAAP////////////8MAP///////////////wAAEgAAAAIA//8AAP///////wAA////////////////CgAQAAAAEAASAAIADAAAABIA/////wAAAAAFAAAA/////wAADAAAABAADAAMAP////8MAAAADAAAABAADAAAAAUAAAAAAAAA//8AAP//EgD/////AAAAAAAAEAAAAAUABQASAAAAAAAAAP//DAAFAAUADAAAAAUAAAAAAAoA/////wAADAAMAAwAAAACAAIAAgAKAP//AAAMAP////8AAAUABQAAAAwACgD//////////wAADAAFAP//AAD///////8AAAwAEgAMABAAAAAAAAAAAAAAAAAA//8KAAoAAAAQAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8AAAAACgAMAAAAEgAMAAAAAAAUAAwA//8UAAwADAAMAAoADAAAAAwADAAMAAwAFAAMABAA//8UAAAADAAAAAAAAAAUABQADAAKAAwAFAD//wwADAAMAAoAAAD//////////wIADAAAAAAADAAAAAwAAAAAAAAAEAAMABQAFAAQABIAAAAMAAIAAAAAAAwADAAMABAAEAASAP//DAACAAoADAAAABAADAAMAAwA//8SABIA/////xAAEAD//////////wwACgAAABQAAgASAAIADAAMAAAADAD//wwADAAMAAwAAAAAAP////8MAAIAAAAAAP//CgD/////AAAAAAoADAACAAoA//8KAP////8MAAwACgAKAAwADAAAAAAAFAAQAAoAAAACABIAFAAUAAIADAAQAAwAAgAMAP//////////DAD//xQAAAAQAAoACgAAABIA//8UABAAEgAAAAwACgAMABIAAgACAP//DAD//////////wwADAAMAAwADAAMAAwAAgD//woAAAD//xQAAAD//xAA//////////8AAP//DAACAAwAFAAAAAAAAgACAAwAAgD/////AgD//wwA//8MAP////8MAP////8KAAAACgAKABAAAAAAAAAAEAAAAP//AAAMAAAAAgAUAAIA/////xAAAAAAAAAADAD//wwAAgD//woADAAKAAoA////////AAD/////DAD//wwAFAAMAAwAFAD//wAAAAD//xQADAAUAAAAAAD//wAACgAAAAwAAgD//wwAAgAUAP//////////AAAKABAA/////wwADAAMABQACgAMAAwAEAD//wwA//8SAP//DAD//wwACgD//////////woAAAAAAAoADAACAP////8CABAA////////////////EAD//wAAFAAAAP////8CAP////8QABAAAgD///////////////8MAAwADAAMAAAADAAMAAIAAAAAAAAA/////wAADAAUAAAAFAAAABAAAAD/////AAD//wAADAAQAAAAAgAAAP//AAD/////AAAUAAwAAAACAAAAAAAAAAwAFAAMAP//DAACAAAAAAAAAAAAFAAMABIAEgD//wAA//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8AAAIACgAMAAwAAAAJAAwABQAMAAwA/////wwADAAMAAwADAAMAAUADAAMAAwADAAMAAAA//8MAAwACgAMAAIADAACAAwA//8FAAUABQACAAwAEAAMAAwAAAAQAAwAAgD//wwADAAFAAwA//8AABAAAAD//wwA/////wwADAAMAAAABQAKAAIAAAAFAAwAAAAMAAUADAD//wIA//8FAAwABQAKAAAABQAAABAABQD/////DAAAABQA//8FAAwAAAAFAAwA/////////////wwA/////////////wUA//8FAAUABQAQAP//EAAAAP///////wwADAAAAAwADAAMAAAADAD//wIAAgAAAP//EgD//wAADAACABAABQAFABQAAgAMAAwABQAAAAoAAAAAAAoADAAMAAcABQAFAAUA/////woAAAD//wwA//8MAAAACgAAAP///////wwAAgACAP//DAAAAAAAAgAAAP////8SAP//AgAAAAAA////////DAAFAP//BQAFAAoAAgAFAAUAAgAKAP////8SAAwADAD/////BQAKABQABQACAAAABQAKAAAAAAAMAAAADAAMAP////8KAAAAAAAFAAAABQAAAAAAAgAUABQAFAAUAAwAAAAMAAAADAAAAAUAEAAAAAoADAAMAAwA////////DAAMAAAABQAFAP//AgAMABIABQD//xQAAAD//////////wUADAAFAAwAEAD///////8FAAUA//8SAP////8QAAoA//////////8MAAUA/////wUADAAFAAwA/////wUA////////AAAMAAwADAD//wUA/////wIADAAQAP////////////8KAAwAAAAFAAAAAAAAAAAADAAAAAAAAAAAAAwADAAAAP//DAAAAP//AAACABAAAAAUABQAAAAFAP//AAD//wAA//8MAAoACgAAAAUABQAMAAIA//8AAAAAAAAMAP////8AAAAAAAAAAAAAAAACAAwAAAACAAAADAD///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8JAAwAAAAHAAwAAAAJAAoACAAAAAgADAD///////8MAAAAAgAAABQAAAAMAAAAAgD//xQAAAAFAP///////xQACQAKAAcAAAAMAAAACgAMAAgAEAAAAAAAEAAAABQAAAAFAP//CAAFAAAABQAAAAwAEAAAAAAAAgAFAAAAAAD//wUADAASAP//BQAMAP//BQAIAAAABQAAAAIABQAQAAwAAAAAABIAAAD//xIA//8QAAgA////////BQD/////AgAKABQA//8AAAUAAAD//xAAEAAUABAABQAAAP//AAAMAAwA/////xAADAAUAP////////////8FAP//BQAAAAAABQAFAAAAAAAAAAUAAgASAP////////////8AABQA/////wAA/////wUA////////////////DAAFABIAEAD/////AAAMABAAAAAQAP//AAAAAAAA//8FABQACgAAAAoA/////wUA//8FABQADAACAAIAAAD/////DAAMAP////8AAAAAAAAKAAAA//8AAAAAAAAKAAoAAAAAAAIAAAAFAP//AAACAAAAEgD//////////////////////////xAA//8FAP////////////8MAAUABQACAAwAAAAMAAIA//8SABIAAAAAAP//DAD//wAA//8QAP//////////EgAAAAAA//////////8AAAAADAAMAAUAAAAUAAUA//8CAP//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////EwATAAUAEwAMAAMABQATAAwADAAMABAADAAFABAAEwAFAAUABQAFABQACgAMAAsADAATAAwAAwAMAAwAAwATAAUADAADAAUAEwATABQA/////wUADAAMAP//FAAMABMAEwAUAAwAFAAUABMABQAMABIAEwAQAAwADAAMAAwACwAFAAoABQADABQAEwAMABQADAAMAAUA/////wwADAD/////////////BQASAAwAFAAMAAwAEwD//xIABQATAP//FAAQAAwAFAAMABQADAD/////DAAMABMAEwAMAAwAEwAMAP//DAATAAwAEgAMAAUACgATAAUAFAAUAAUADAATAAoA//8TABQADAAFAAwAFAAFAAUABQAKABMA//8UAAwA//8FAAwA//8MABQAFAAFAP//EgATAAUADAAUAAwA/////wUABQAMAP///////wwAEwAFAAoADAAFAAwABQAMABMAEAALABIA//8MABMABQAFABMADAAMABQADAAMAAwADAATAAsADAATABMAEwAUAP//DAATAP//FAAMABMAEwD//xIADAD/////EwAMABMADAAKABMADAAMAAMADAAMAAwACgAMAAoAEwAFAP//DAAFAAUADAD//////////woADAD/////AwAMAP////8MAAwA//8UAP//DAAMAP//////////DAD//woA//////////8QAP//BQD/////BQAQAP//EwAUAAwA/////wwA//8UABQA//////////////////8FABMA/////////////wwADAD//xAADAAMAP//DAAQABMA////////DAAMABAAEwAQAP////////////8UAAwADAAMAAwAEwAMAAwADAATAAwAEwATAAwA//8MAAwADAAQAP//FAAMAAwAEwAUABMAEwAUABMA/////xQA//8MABIA/////xQA////////////////DAD//xMADAAFAAUA//8SABMADAAMAAwAFAALAAwAEwAMAAwADAAUABAAFAAMABAAEAAMABMADAAMABQAFAAQABAADAATAP//DAAQAP//DAAMAAMADAADAP///////xIA//8MAAwAEwD///////////////////////8MABQADAD///////8DAAwA//////////////////8QAAUA/////wUADAASAAUAEgD/////DAATAP//////////EwD///////8MAAwA/////////////xMA////////DAAMABQABQD//////////wwAEAAUAAwAEwATABMAEwATAAoA/////wwA//8TAAUADAAMABMA//8MABMADAAMAP//EgAMAP////8UABMA//8TAAMAEwADABQADAATAAwAEwAMAP//CgAUAP//EwD//wwAFAATAP////8SABQA//////////8MAP//DAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wcACQAAAAgABQAAAAkAAAAAAP//AgAAAAgA//8AAAsAAAAFAAgA/////xAAFAD///////8AAAAACwAQAAUA//8SAP//AAAFAAgACQACAAUA//8FABQAFAD//woABQAFAAAA//8CAP////8IAAUAAgAAAP//AgAJAAkA/////wUABQASAAoA/////wIAAgACAAAACgAKAAoAAAD///////8JAAkACgD/////FAD///////8IAP////8CAAAAAAAAAAAABQACAP//BQAUAP//BQAFAAoAEgACABIAEAAAAAAABQAAAAAAAgAAABQACQAUAP//AAACABQA/////////////xQAAAAQAAoABQALAAAACgACABQACgAFAAUAEAD//xQA//8FAAUAFAD//wUACgAAAP//////////FAAAABQAAAACAAIAAAAFABQAAgAQABAACwD//wAA//8FAAUA////////AAD//////////wkACQD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////DAAMABAADAAMAAAAAgAMAAUABQACAAIAAAACAAAAAAAAAAAAFAAMAAAABQAMAAUAAAASAAIABQAAAAAAAAAAAAUACgACAAIAAAAFAAAAAAACAP//FAAMAAwADAAKABQA//8AAAAA//8AAP///////wAAAAD///////8SAAAAAAAFAAUADAAAAAAAFAAFAAwADAAFAAAAAgAFAAAAAAACAAUAAAAAAP////8MAAwADAAMAAwAAAAQAAUA//8CAAoA//////////////////8AAAoA/////wUA//8AABAADAAFAAAAAAAMAAwAEgD//wUAAgD//wIA/////wIACgAAAAAAAAAMAAIABQD/////CgAKAAAABQAQABAAEgAUAP//AgAAAAUACgAAAAAAAAACAAwABQAAAAwADAAAAAAAAAAMAAwADAAMAP//////////AAAAAP//////////AAAAABQAAgAUAP//DAAUAAwACgAMAAIAAgASAP//AgACAP//////////AAAFAP////////////8FAP////8AABAA/////wAA//////////8CAP//BQD/////AAASAP//EgAFAAAA/////wwAAAAAAAAAAAAFAAAABQD//xQAEAD/////AAAFAAAAAAAQAAUAAAAMAAAABQAFAAAAAAACAAUACgAAAAAAAgAAAAUADAAMAAUAAAAMAAUAAAAAAAAABQD///////////////8AAAUABQAFAP//DAASABQAAAD//wwA//8MAAwAEgAFAAAAAAAMAAUADAAAAP//DAACAP///////wAAAAAAAP//////////AgD///////////////8AAAAAAAAFAP//AAD/////////////////////////////BQAAAAwABQAAAP//AAD//////////wAAAAAKAAoA//8AABAAAgAFAP//AAASAAAABQASAP//AgD//wwAFAAAAAAACgAAAP////////////8CAAwACgAAAAoAAAD//wUACgAAAAUA/////wAAEgAFABAAAAAAAAAA//8AAAwA//8FAAwADAAFAAAAAAAAAAAAAAD/////EAAFAP//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////AAAAAAAACwAKAAIAAAALAP//AgACABQACgAUAAAACAAAAAIAAAASAP//CgAKAP//CgACAAoAAgAUABIACAD/////AAASABIAAAACAAAAAgAAABIA//8SABIAAgASAAIAFAAAAAoAAAAAAAAAAAD/////FAACAAAA/////wIAAgASAAAAAAD//woAAAAKAAIAFAD//wAAAAD///////8SABIA//////////8SAAIAEgAUAAAAAgALAAAAAgAAAAAACgAAAAAA//8KABIAEgD//////////xIAEgACAP//////////AgACAP//FAAUAP//EgD/////FAD//////////////////////////////////wAACgD//woAAAAAAP//AAACAP//FAAKABIAAAAKAAAAAgAUAAAAAAAKAAoAFAAUAP//AgAAAAAACgAKAP//////////////////AAD///////8CABIACgAAAAAA//8CAAAAAgACAP///////xIAAgACAAIAAAACAAAAAAASABIAAAALAAAAAAAAAAAAAgASAAsAAAAAAAAAAgAKAAIAAAAKAAAAFAAUAP//AgAAAAoAAAAAABIA////////////////AgD//wIA/////xIAEgD///////8CAP///////////////woAAAAKAP//AgAAAAAAAgD//xIA/////woAAgACAAIA/////woAAAD//wAAAgACAP//AgAUAAIAEgAKAAAACgAKAAAACwD//woACwASAP//AgD//woA//8AAAoA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wUAAAAKAAAAAAAMAAAAAAAMAAUAEgAAAAwADAAMAAAADAAMAAwAAgAKAAwAAAAAAAUAAAAAAAUAAAD//wAABQAAABAADAAMAAIABQAMAAoAAAACAAwADAAKABAAAgAAAAwAAgAKAAAAAAAAAAwAAgAAAP////8CAAAADAAAAAUACwD//wUADAAFAAUADAASAAUADAALABQAAgAQAAwAEAAAAAwA//8UAAIADAAFAP//EAAAAAAADAAAAAAAAAAAAAAAFAAAAAwAAAAAAAoAAgAAAAwAEAAMAAwAAAAUAAwAAAD/////FAAAAAwAAAAMABQADAAFAAAAAAD/////DAAMAAwAAAACAAUAFAAFAP////8MAAwAAAAMAAUADAD/////DAAMAAwABQD///////8MAAUADAD/////CgAAAAAAAAAFAAAA//8CAP//FAAFAAwADAD/////DAAMAAwAFAAMAAoAAAACAAIAAgAAAAAADAD//wAA/////wwAAAAMAAUAFAD//wIA/////wAABQAMAAwA/////xQAAAAMAAAAEgAMAAwADAD//wAA//8UAP//DAAAAAwAAAAAAAIADAAUAAIADAAKAAoADAAKAAAAAgD/////BQAFAAIADAASAAIACgAMAP//BQD/////AgD///////8MAAAA//8AAAUAAAD//wUADAAMAP////8QAAIAAgAAAAwAAAACAAAA//8MAAwAFAACAAoAAAAUAAwA//////////8MAAoADAAFAAUADAAMAP////8CAAoAFAAAAAwADAD/////FAAMABQAEAAAAAAA////////////////BQAAAAwABQD/////BQAAAAAA//////////8SAAwA////////BQAUAAwAAAAKAAwA/////wAA//8AAAwAAAAMAAwA//8SABIABQAMABQADAD//////////wUAAAAMAAAA//////////8SABIAFAACAAwAFAAMAAwAAAASAAwA////////BwACAAAACgAAAAoABQASAAUADAAUAP//DAAMAAIA//8AABAADAAKABQAFAD//////////xQAAgAQAAwADAAAABQAEgAMABAA/////wAA//////////8FAP////////////8AAAwAFAACAAwADAAKAP//AAAMAAwADAAFAAIADAAMAAwA//////////8AAAwA//8MAAwADAAMABAAFAAMAAIADAAMAAwADAAQAAwAAAD/////EAD//wwADAAQAAwAAgD/////DAD//wwA/////xQAAgD//woADAAMABQAAgAUAAoABQD/////AAD/////BQAUAAwADAAMAAUA//8MABIA//8CAP//AAAKAP////8MAAAA//8AAP////8AAP////////////8UAP//AgAAABAABQD//wAA/////xIACwAUAAwAEAACAAAADAD//////////wsADAAMAAwADAD//wsADAD//wwAAgD///////8CAP//BQAMAP////////////////////8CAP////8AAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wIACAAAAAgA//8AAAwACwD//wAA//8MAAwACwAMAAAAAAAMAAAAAAAAAAsACwALAAwAAAAMAAwADAASAAwA//8MAP///////wwACwAMAAAACwAMAAAAAAD//wAAEAAMAP//DAAMAAwADAAAAAAA//8MAP////8KAP//CgACAP//AAALAAAACwACAP//CwD//xIA/////wAADAAAAAAAAAAMAAwA////////DAAAAAAAAAD///////////////8MAAwAAAAJAAoAEgD///////8LAAwA//8MAP//DAAMAP//////////AAAMAAwADAAAAAwAAAAAABAADAAMAAAADAD//wwA//8KAAAAAAD//wAAAAAMAAAA/////wAAAAAAAAIA//8AAP//////////////////DAALAAwADAALAAoADAAMAP//DAAMAAAA//8MAAwA/////wwAEgAMAAwA/////xAA//8AABIAAAD//wwA//8MAAwA/////xIADAD/////AAAMAAwADAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////CwALAAwACwAFAAsA//8NAAwABQAMAAIADAAAAAUA/////wwA////////DAAMAAsA//8AAAcADAAMAAwADAAMAAAADAAAAP//DAAAAAwACQAJAAAADAAUAAwA//8UAP//AAAAAAAA////////BQD//wwADAAAAAUABQAAAAwADAAMAAAACQD/////AgAFABQA//8FAAwA//8MAP//CwAMAAsADAD/////AAD//wwAAAD///////8MAAwABQACAAUAAgAUAAwADAAMAP//////////FAACAAUABQACAAAAAAAMABQA//8MAAwA//8MAP////8AAP//DAD//////////wwA/////wIA//8MAAwAAgAMAAAADAAMAAwAAgAMAAwAAAAFAAIAAAAAAAwABQAFAA0A//8AAP//AAAMAAwADAACAP///////wwAAAD//////////wUAAgAAAAUAAgD/////////////DAD///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8MAAAADAAMAAwAAgAMAAwADAAMAAAAAAACAAwADAAMAAAACgAAAAwAAAAUAAwACgAAABAADAAMAAAAFAAMAAsAAAAUAAIAAAACAAAAAAAKAAAAFAAMAAwADAAMABQAAAAAAP//AAAAAAAAAAAAAAAAFAAAABAAFAAAABAADAAAAP////8CABIAEAAAAAoAAgAAAP//AAAAAAIACgAAAP//FAAMAAwAAAAMAAAAAgAMAAAAAAAKAAwAEgD//////////wAADAD//wwA////////AAD//wIACgAAAAAADAAUAAAAEAD//wwACgAAABAADAAAAAAAAAAAAAIAAAAMAAAAFAD///////////////8KAAAA/////wAAAgD/////AAAUAAwACgAAAAAAFAAAAAoACgACAAAA/////wwACgAMABIAFAAMAP//EAAAAAwADAAKAAoADAACAAwADAAMAAAA//8AAP//////////////////AAAAABAACgAAAAAAAAAMAAAAFAD//////////xQAFAACABQA//8AAAoAEgAKAAIAEgD//xIA//8MAAIAAAACAAAAAAAMAAwAAAAMAAAAAAD/////AgAAAAAAAAD//xQAEAAAAP////8AAAAA//8MAP////8MAP//AAACABAA////////AAAAAAIAAAD//wAACgAAAAAACgAAAP///////wAAAAAQAP//DAAMAP///////wwADAD//xQACgD/////AAD//wIACgAMAAIA/////xAAAAAMAAAA//////////8AAAAAEAAAABAA//8AAAAA/////xIACgAQAAAAEgACAAwAFAACAAAADAAAAAwADAD//wAA//8AAAAAAAAAAAAAEgD//wAAAAALAAAAAAAAAP///////woAEgAUAAAAAAAAAAIAAAAMABQA//8UAP//DAAMABAAAAAAAAIADAD//xAAAAAKAAwAAAAAAAAA//////////8AAP////8KAAAAAgAAAAoACgAUAAIA//////////8SABQAEAD//////////xQAAAAAAP//DAAKAAAA//8SAP////8KAAwADAAMAP//FAD///////8AAAAAEAD/////FAASAP////8AAP////8MABIAAAD//wAAFAACABAAEgAAAP//AAAAAAAA//8AAAAA/////wwAAgD//xIA/////xAA/////////////wAAAAD//wIACgAAAP//////////AAAAAP//AAAMAAwADAAAAAAAAgAAAAAAAAAAAAIADAD/////AAD//wIAAAAAAAIAAgACAP///////wAA//8AAAAADAASAP//DAD//////////wIAAAD///////8MAP//AAASAP//DAD//wAAAAD//xQAAAAAAAAADAACAAwA/////wwAAAAAAAAAAAD//wAADAACAAAADAAKAAwAAAAMAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wYABgAGAAYAFAAUAAYABgAKAAoACgAGAAoAFAAJAAYAFAACABQACgD//xAAAgAKAAIAAgAGABQAEAAHAAYABgAQAAoACgACAAYAEAAKABAACgACAAIAEAAQABAABgAQABAABgAGAAoABgAKAAIA//8KAAgACAD/////AgACAAoAAgAKAP//AgAUAAYAEAACABAABgACAAYABgAGAP//EAAQAAIABgACAP//BgACAAIAAgAGAAYAAgAGAP//BgAGAAYABgD//wIABgAGABQACgAQAAIA//8KAAoA/////wIACAAJAAgABwAGABAAAgACAAIACgAKAAYACgAQAP//CgAGAAIA//////////8CAAIAAgAUAAIABgAGAP//BgD//wYA/////wYAAgD//wIA/////wIAAgD/////CgACAAYACgAKAAYACgAGAAoABgACAAYA/////wYA/////////////////////wYA//8GABAAEAACAAIABgAKABQAEAAUAAYACgAQABAA//8CABAABgAGAP///////////////woAFAAGAAYAAgD//woAAgACAP////8CAP////8CAAIA//8CABAA//8CAAIAFAAUABAA////////////////////////AgAKABQABgAKAAIA/////xAAEAD//////////wYABgD///////////////8CAAIA//8KAAIA//8GAP//////////CgD/////CgD//wIABgAGAAoACgD//wYA//8GAP//BgD///////8UAAIABgAUAAYAAgACABAABgAQAAYAEAACAAoABgD//wIA//8CABQA//8QAP//////////EAD//xQA//8GAAYACgAGAAYABgAIAAIACgAIAAoAEAAKAP//AgAQAAoACgAUAP//AgD//woACgD//wIA/////wYABgAGAP///////xAABgAGAP//////////CgACABQABgAKAP//CgACAP//AgAKAP////////////////////8CAP//////////////////////////////////BgAGAAYAAgD//wYAAgACAP////8GAAIA//8GAAYA//8GAAYA////////FAD//wYABgAQAAYABgAGAAYABgAGAAIAAgACAAYABgAGAAYAAgAGAAIABgD///////8CAAoA//8KAAIA//////////////////8GAAYABgAKABAAFAACAAYA//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8AAAwACQAMAAwAAAAKAAwAAgAMAAwAFAAAAAcA//8MABQAEAAAAAAAFAAAAAAADAAMAAwABwD//wkACwAUAAwACgD//wAAFAAKABQAAAAKAP///////wwAFAAUAAwADAAKAAoADAAMAAkACAD//wwA//8AABAAAAAUABIAAAD/////DAAAAAIAAgASAAAAAAAAAAIA//8CAAoAFAD//wIACgAMAAwADAD/////DAD//wIA//8MAAwADAD//////////xIAAAAAAAIAEgAAAAAAEAAQAAwAAAAAAP////8MAAwAAAAKAAwAAAAMAP//AgAAAP////8MABQAFAAMAP////8UAAAAAgAMAAwADAAMAAAADAAMAAwACgAMAAwADAASAAAADAD/////EgAQAAwAFAAAAAoAAAAMAAAAFAAMAAoAAAD//wIA//8MAAIA//////////8KABIAAgAMAAwA//8AAP//AAACAP////8AAP//EgD//wAAAgAMAP///////wAADAD//wAAAAAUAAoAAAAMAAoACgAMAP//////////AAD///////8CAAAAAgASAP////8KABIAAAAAAAwA//8UAAAA/////xIAAAAMAAIAEAD//xAADAAAAP//EgAMAP////8MABQADAACAAAAAAAMAAAAFAAMAAwADAAMABAA//8CAP//////////DAD//wAAEAAAAP//AAD///////8AAP////8MAAAAAAAAABAA//////////8AAP////8KAP//////////////////////////AAAAAP////8KAAwADAAQAP//EgD//wwA//8MAAIAAAD///////8AABIADAD/////DAAMAP///////wwA//////////8QAAwAEgAMAP////8QAAAADAAMAAIACgAKAAAAFAD//wIADAD//wwAAAAMAP///////wwA//8MAP///////wwAAgAMAAwADAAMAAAAAAAAAAAAAAAKAP//AAAKAAAADAAAAAAAAAAMAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wUAEgAJAAAAAAALAAwADAAMAAAACgALAAsACgD//wwACgAAAAAADAAMAAAABQAFAAAABQAKAAkACAAKAAoAAAAKAP//AAAFAAAADAAMAAwADAAMAAwADAAQAAAACgAAAAAADAALAAwA//8FAAUA/////wAAAAAFAAUA/////wAAAAD//wwAAAAMAAAAAAAMAAoADAAMAP///////wwABQAMAP////8MAAoAAAAAAAAADAAFAAAAAAD//////////wwA/////wAAAAAAAAgABQAMAAwACwAAAAwA/////wwAAAAAAAAACgAKAAwACgD/////EAD//wAACwAMAAAAAAAKAP//AAAAAP//BQAMAP///////////////wAACgAAAP//DAAAAAwADAAAAAwADAAAAAAA//8AAAAA/////xIA//8MAAAA//8LAP////8FAP//AAD//wwA//8MAAwADAD//wUADAAAAAAA/////xAADAD///////8MAAUA////////AAD/////////////AAAKABAADAD//wwAAAAMAAwADAD/////AAD//wAAAAD//wwACwAAAP////8AAP//DAAQAAwA////////DAD//wwA//8MAAwAEAAMAAAAEAALAAAA/////wAABQAMAAwA//////////8AAAwADAAAAAAA//8SAP///////wAAAAAAAAAADAAMAAAAAAD//wwADAAMAAwA//8AAP///////////////////////wwADAAMAP//AAAFAP///////wwAAAAMAAwA//8IAP//AAAMAP//AAAMAAwACgAMAAUAAAAAAP//AAAAAP////8MAAwA/////wwA////////DAD//wwADAAAAAwADAAAAP//DAAMAAAAAAAAAAAAEgAMAAAAAAAMAAwABQD//wwAAAAMAP////8SAP////8MAAwA//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8=",
+    "value": "AAAWRAAAQEMAAIA/AACAPwAAgD8AgMFFMzOyQwAAwEEAAPBCZqa7Q5qZ20IAgAJFMzMFQwCgCUYAQJJFaBPQPpc9qD4AAFtEAADqQgAAAEAzA35EAACAP6gpyj4AABBCAAAQQQAAAEAAAABAAACAP6tqFr4AAIA/AKAJRgAAgD8AAFJDAABAQgCANkSSrQq+AAAAQAAAAEEAAAJDAADAQwAAtEMAAMxDAACQQwAAxEIAfBS+AECSRAAAAEAAAIxCAABwQqgpyj4AAGBCN8vSPgAAmEIA4CNGzUyfQ6gpyj7Oqx2+AAA9RAAAAEAAQONFAIA2RAAAgD8Yjq4+AAAAQAAAXEMAAFhCzewjRAAAgD8AAKBEW8EEPfo+1b1oE9A+Gl4YvgAAAECamUBDAACqQwAAkEIAACJDmpnbQgAAAEAAABBEAABwQ6OXUD4AAIRDGI6uPs0sFUQAAEBAAMABRAAAwEMAAMNEAACAQDfL0j4AAIxCAIC+RQAAAECbPoQ+AIBTRQAAwEIAAMhCAACAPwCAvUNmZsJDp7BnPjfL0j4AALRDAIDBRQBAlUUAACJEAAAAQGamDkQ3y9I+AACAPwAAgD83y9I+DN4XvPzEiT0gmvS9lNAQvgAA8EEAAIBAAABgQjfL0j43y9I+g7ulvQAAeEIAgKFC9IkEPgAAgD8AAPhBqCnKPmua9T0HYP69K3m4vAAAKEMYjq4+AAA+QzOzdUMAAGFDkzIUPZc9qD4AAHxDAACAPwCAhUMAAPBBAADAQ2gT0D6oKco+lz2oPmgT0D56F1k9KOnfOwAAQECamcBCAADWQg5kCr4AAABAAAAYRAAA8EMYjq4+AMCBQ/ve9z1oE9A+AABzQyX8uD4l/Lg+AACWRJc9qD4YLh6+YLBQvSX8uD5Ngtq9AABzQwAA0kMAAI1FN8vSPvaoKkMAAOJCAADwQQCA3EUAAABB2Pf8vQCA3EXDG6+9AIDWRfdIdj72qCpDmgkJRAAAVUMAAGhDAADtRQAAgEAAAIA/GI6uPgAAsUIAAHxDAAAoRCX8uD4AAMlEGI6uPsMbr716F1k9WZwHvgDAAUQAAABA2Pf8vSX8uD5kt8m9phUJvjAdIb0AAABBAACAPwAAgD/bUW69AABYQjCp5b1O1Ug+MB0hvQSRkr1fOQG+r+h7PtOt472amZxCZuYTQwAA8EIAAABBs4oOvjAdIb0AAFtEaBPQPjAdIb0Wlso9DN4XvAAAKEOoKco+5xjLPQ+5Db5SkuW9AAAqQwAAAEAAAABBAADwQ5c9qD4l/Lg+AAANQ1Wp470AAHNDACCKQzfL0j43y9I+N8vSPmbmh0MAAKhDAMABRAAAqEMAQCtEzazhQwAAAEAAgEpEoyu3PQAAAECXPag+AACcQyjp3zsAAJxDAACQQwAAWEMAAJBDAADMQwAAQEAScn08/TohPgzeF7z3TYy9AABPQ2gT0D4AABlDAACMQwAAaEMAgNNDMzN7QgAAQEAAAN5EAADkRDfL0j4AAOBBAAA6RAAA8EOzr789gMVcPgAAAECXPag+AAA9Q2am+0MAAGxDZmZgQwAAB0VmZmBDAADhQjMzjkMAAABAAACcReW2Bb4AAKpCAIDWRXUHWz4KkZE9brOAPjfL0j7+u4c+4DDnPcMcCL4AABlDAABGQyX8uD4Yjq4+AAANQwAAXEMAgBRGAAA5QwAAjEJm5qRDN8vSPguVTT4AAGxCAAAoRADAzEUAwNJFAABGRQAAoEAAAGZDAAB/Q80sFUSKGe09AABhRQAAAEAl/Lg+AABwRAAAUkQ3y9I+wxuvvQzeF7xmpvtDAACAPwAA+ENoE9A+p7b4vQAAAECIVgu+mplAQwAAgD8AACBDAADwQWUmhz0AAPBCTzMaPgAAtEIAAERDAABAQgAAAEAwHSG9AADwQgAAQECb9am9t0/yPSt5uLxL/si9DN4XvAAAAEAAAABAAACAP/aoKkOXPag+KOnfOwAA5EOftL29AACIQoiBjr0AAPxDAACqQgAAkkOpUgO+AACMQjfL0j5mZl1DN8vSPiX8uD4l/Lg+AAAKRGS3yb0AAEBCAAAERJoZj0MAIIpDAADMQxiOrj4AAAxEcLMSPr+i/L1TwGi9AABAQM3sI0QAwAFEN8vSPo8ypr1mpg5EjKYoPgAAKESkcNZDHL2XPagpyj69cAa+ECywPPf3vb0AAJBDAAAAQG+sCb0LDOq9MB0hvQzeF7wAAFpDAAAQRGZm5kIYjq4+ehdZPSjp3zsAwGREAADYQ2Zm5kI3y9I+EnJ9PM1E4b0AAAJDZqb7Q83M9EIAgJ1DN8vSPgAACkQAAIBAAAD4QxiOrj4wSeu9AABSRBy9lz0AAMZEAADhRAAAxkSDdP69AACZQs1Mn0MAANJEW8pzPijp3zsfND4+AACHRAAAoEAYjq4+ZmZdQwAAQEAAAABAAAAWQyX8uD79OiE+kEUwvQAAEEUAgB1FAMC3RQBAlUVmpg5EAACEQwAARkMAAApFLxAHvgAAGUMUBQu+b6wJvQAAWEMAALFCHMYUvgAAAEAAAHhCAAC4QhaWyj1gsFC9Jfy4Pu+vhj4AwMlFAIACRkGtCb4AQPtFCP0oPijp3zswHSG95xjLPQAADEMAAEBAqCnKPgAA7UUAQONFAOAjRvPdcT7DG6+9Jfy4PpHhAb4AgKFDAIAURrj+tUPNLBVEAADYRAAAjEMAAIBAEnkSvgAAbENmZmBDzUyfQwAAB0M3y9I+AICFRc1MMUMJ0xQ+AABVQwCA8UUAAKVFAECnRQAADESftL29AABDRTOzv0MAgDJFAABSRJ/1Wj3ttzA+AAAQRa/Vd70AAIBAlz2oPmgT0D4AgEpEpHDWQwAAIEQAAKVFCKbvvQAg30OaCQlEAEDmRQAAUkSv1Xe9SYUzPRDH771cR7s9KOnfO5+0vb1jcQ++21FuvbW4Ur0ixPq92+G3vXtLDLzbUW69MyIKvuepBby7/cC9OhrvvROCy72XCde9KuFwvaCRSz4wHSG9W8EEPTAdIb1nlQu+LUK3vfzEiT0K27m9Q/WPvd3M9r23T/I9jyxIvTAdIb02LgW+GroIu7bFJr3/+P69MB0hvQfjyT1gsFC9QbidvcProbv3rtQ8Qz/AvWjDKLzZsza9w+HpPHyasL03fJ69LzVwvEPy+L2QRTC9txYdPhJyfTzNDpm9GwUUvCFjs7u+cTs96vvrvc/0Sr0O+Zi90cEiPhPfAD56FWg8902MvSjp3ztfEpK9TzbzOv4fO70Yp6g9x6wZvZMyFD34xNO818wCPeqX/D0augi7ExZiPT6FBj7bDqg921FuvYoZ7T0o6d87OuTOPatnSz2sq8i9CxStvFo70b3HrBm9Shi0vYFuKL1Dweu9v+CxvecYyz17AY+9LdzlvSt5uLxvrAm9ir7Ovchycr0W+rG97ty8vMh/xL2nseO9d2EDvU8fjT0POlm9D5sLPijp3zsyeH+9H/mEPZpOqb2KsA29P2I3vcsn3L1l4/28poeevX/wDb0TxqS9WOLDu2ua9T3fapK9MPnLOvIBrbvywHu9y4CwvO869DzFS969wFtkvW+sCb1vHGc+fJqwvW3o1D2tag0+/tiKO/2S2T1HX6o8q+n2PbfnDbzj2Zc9vmEzPTrkTT1bTfA9u1oEPgzeF7xztIE9m4xVvW2knj2dqH+8ijjdO8R3sj2nBxY+pZmiPTAdIb0dWgy+N4ZSvRQUvr0HwDE+LaYPPQMBDz0utT4+PfrrvRJyfTzDG6+9m45ePZirUz4o6d87PCYAPtPaoj16IU49KXhAvUddEb0BDbk9W8pzPt9NUry7Wrq9YzxhPp7tKz14yHM+lVDcvSX8Mz7SBlo+mDpdPeGYir0vEAe+clt6PkgcPz4rebi8wxwIvmeAUj56F1k9+0rgO6EAqL3RwSI+CwzqvZVpeT6H1jc9szz6vUVnXDzAZUI+zv2tPYwaur2jJGa80gZaPqPf2T3L5xM9BnY9PpBFML1cR7s9Ze0HvlBqOL1AP1Y+nOk5PY2IqT0Xilk+F6WCvSeBrrxXDJS9EDNpvWS3yb0o6d87mIGZvOcYyz1gAlO9czsJvtYtL733rtQ866JTPvhiSD2lsVq7Yx6bvRsTuL1JhTM9oYc0vSheb73vxiW9KRCtPfI+672YOl09Y3cpPjAdIb3wB/u8x/DsPL4bnbwcvZc9j4JGvXjuNbwts3c8i6WavXRLKj1ew4K9+EN/vPHFKr0cvZc9DN4XvFskk7z8xIk9gOzwvEwglL2nx6i8XQu4PKYVCb5C6s+8xGyVPc3Nwb38xIk933w2PigEY7xwO1I8K1TuPJHhAb7DMSo+r94TPRNRHz2LzRE+orJEvNdG6z0AAAA/AADYQwAAQEAAAEBDAACAPwAAQEJClr29AACAPwAAgD8AwMxFAADPQwAAgEAAgMFFAADAQQAAKENmprtDmpnbQgCAAkUzMwVDAKAJRgBAsEXfs6+9mpnbQgAAgD9zr28+aBPQPgCANkTNzEw+aBPQPgAAEEEAAOBAAAAAQAAAQEAAABBBAABgQQAAAEAAADBBAACAP9iKDb4AAEBAACAERE4ZSD3LrS0+AACAPx0Haz4AAIA/AADgQAAAwEAAQJJEAADAQAAAQELNLBVEAAAAQAAAAEAAAEBBAACoQwAAMEEAAEBAAABAQAAADUMzA35EAACcRBiOrj4AALRCAAAgQTfL0j4AAC9DAAAAQACAAkYAAIA/6BIWvgAARkQAAIA/AAAQQQAAgD/bVYU+n627PQAAgD+tawG+AAAYQgAAgEAAAIA/AABAQgAAgEAAAEBAAMBkRAAAQEIIWfK9GI6uPgAA+ELN7CNEAABAQAAA7UNVVVU+AAC0QwAAMEIAAJRDMzMcRDfL0j4AABBBN8vSPgAAoEA/IGg9nJWfPZMm1b0AAKBAAAC0QwAAMEEAAABAAABAQAAA4EAAAN5EAABLQwAAIEGoKco+AADiQgAAQEEAQC1GAABwQgAAgD8AgL1DAADgQAAAgEAAgC9DfF2cOwAAQEAIIQQ+ACDfQwAAYUUAAD1EsdzTPQAA4EAAwLdFAADAQP/8vr2qGVQ9WE7DvQAAAEGJwgC+AAAwQQAAVUMAAPBCtbQ0PgAAQEAAAChDAAAQQQAAwECJCg8+V3TbPJqZGT4e0B48kUYDvvHw8D1iwd49U2wOvcmVEL4AAAJDThgiPaEWrb2o3au94/unPQAAuELQrg08AACAPwAAMEIAAEBAAAAZQwAAtEMAAEBAAACQQ3tUmkMAAEBAGI6uPgAA7UMAgOVDAACEQwAAoEAAAJxDO421vQAAgEAAALRDTYwDvsjABL0AAAxDAAACQwCAh0QAgDZEAAAAQAAAoECiNta9AACoQwAAjEIzM45DAADSRKgpyj4AgKxDAAAAQQAAoEAAALBBAABMRQDAn0UAAHxDAACAQAAAEEMAgIJDAABeRQAAh0MAgNZFCu9hPAAAAEGqgPm9AAC0QvTrp72VUO299z5WPgAAwEAAAMhDAIDWRQAAWEOSWzo9wuJrPgAAz0QAwMlFU/4WvgAAAENnc767AACgQAAADUUAAABAAMCTRQAAAECvHBO+12cYPgAA80MAAIA/AAAAQKRw1kMAAENEAMDSRcv8x70AAPBBAACCQtjiCr4AAEBBAIB4QwAAEEMAACBBAAD4QRiOrj4AAABAAAAQQQAAgEAAAEBAAACQQi9mnj3iXNI9NdPyvDOzdUMAACBBAACAPwAAAEC/o2e8NWzgvQAAmUKTbdi9AACAPwghBD7AhFw8tgoYPgAAAEAYjq4+AACgQAAAoEAAABhCJfy4PgCArEMAAJBDAAAZQwAAnEMUmTw+AACoQwAAnEPNrOFD2jc7vQAAoECamdlDUt1APqVmHT6aCQlEAEArRKgpyj4AAMhDDItKvAAAAEAAAMxDAACIQm+FLz2XafW9OGsZvc3M9EIAAJxDAACgQAAA4EAAAKBAhNkRPQAAQEEzA35EACAERAAAzEO3W8G9ZuY0Q/1u67zvQ8c9AAAAQAAAQEAAAOBAN8vSPqgpyj4AANVEzazhQwAAoEQAAHBBAGCuQwAA9kQAAOdEAABwQgAAyUQAAExDIX8VvgCAoUIAAJlCAIBTRQAADEIYjq4+AAAgQQAAXEMAgKlFAACgQAAAbUUAAABAAADIQ3baCr5cYzU9AADGQgCAJkUsqgI9c7gAvifu5DwDZl4+AACFQgAAQEAAoKdDl600PgDgI0YAAMpDGI6uPgCA3EUAAKBAAADPRQAAAEAAQPtFAAAwQQAAAEGlqfq8v3zQPcDr+b0L9uE7zewjRAAAKEQAwIFFL4+qvQCAhUUAAABBAADJRAAAgEAAAIA/AAD4QwAg30NmpvtDa+qVPQAR7zv/hfI8AADwQzfL0j5fazi8AACAPwCgCUbNf9I6fQ5pvWsu9bzXY7+97gS7vT+lLj0G0C4+LNeVvUNZ2r32tri9GbeCvQIv4r3z+g6+T1oZvWiDsb03l089g93ZvZrBMT6C8ve9c4+LvFS9q73laMK70bGqvbnBIj2lJPq8H3fQvf8AC75IOu+9KNWxvRuuy7oFYeq9R10OvisRsr2XyWU8SjbqvCgjdjyCzX67TDiWvazDE7651ji9PwYDveWxsL2fRs48aNgMvWoD57yK+sq9tXTBPWfrJrxMCbq9DdRaPA1DRT0DlrO9KCbdvVs4Db3wKe+9FigjPabvC77897W6a4+HPQqgWL0ZzAM8X3eyvVm8CryGwbe9M/mAPPauBz5uKTw+2zaiPGh25j1DnJI6u+djvSSVvjy3qsu9oR0MPehXGjysIbU9wecjve9/Bb7mdAS9LFCPPfBCGD5WiDg9XzztvVKd3rwHRAm9W6zYvcsiET05dBK99/bwPMnNm71nDru95BEbPh+Pvb3HDoW9g56DvX6FTLy7epw9dxmqva6Mtr16m0K9FX7yvSFtQL1Leuk9DJgUvVVemb3bTlo8wA3tPCVyRD6hyKk9UidavO/5+T2zIFs9otLnPVOkbz2lAh+97+94PetfLryXGyM977CjPQl8D71Hcp69Y1AVvjpMHT7AMPW8jKlLPidVPz1OBwQ996qevW/aYb13wQg+J0tEPSq2VL3HH2k+w4C9PN2giT1xwK+9MdGXvfhQXLy1t8E9i3hBPr75Jz4vEbi9CCZxPS+MLrtNJnQ9zWEMPlFWDLybcqM9w+avPSe4GT4Q9he89+ZPPndlCT6gdGY+Soj0vUN/Gj65iQm+IVORPeo7WT4PG0I7ZyU1vQ0qDb66KFE+W16fPfoeZj4nDyc9yLyqO77Dyb1/QgS+VMYhPXxIKz7vH9W8T3vavY9GID7nVYu9geglPbX27D2ImUQ+c96wvf/t3j3c97u9YsAovSOcpTxQWeO95953vXbTHb0zZNI8mN2DvRfwt7u7BfE9W3kePg9PkDxCZxi9HS3PPVerIr23Sqe9P9auPKo1Vr1PnBA++t8lO3s9D72VM8i7dQQMPSJmWL23saM9D8UQO63gezxFk/G9C1y7PYrhvrwDAAu+XTB1vXu1ND7VkVw9HJCJPc/ne7uSYoc9K+55vQAAAD9mZsJDmpmBQs3MLEMAAIA/5DgOPzqyWT4AAIA/AACAP2ZGuEW4/rVDZuYTQ4H9xb3NzKxBpHDWQwAAsEOamdtCMzOXRDMzBUOaufdFAKCeRetMPD3d4Rs+AACAP5c9qD4zMxdDAADzQwAAAEAAAMBAj8L1PQAAEEEAABBBAADgQAAAAEAAADBBAACAPws/BL4AAIA/AAAQQQAAgD/NTDFDzcwsQgAAAEDNzEw+AAD4QgAA8EMAAABA6aKLPgAA4EAAAAxEAABbRAAAAEDDBZU8AACAPzOzGkMAAEBAAABEQwAAYEFm5upEN8vSPgAAL0MAAABAZubqRc1MukV4QA6+AABAQCa0lz2aufdFAACAQCX8uD5q9/u9AAAAQAAAwEAAAABAZqYORAAAgD/NzCxCt6j6vRiOrj5oE9A+AAACQ5c9qD4AAMBAAACAP20O5L1mZoxDZVAPPmZmQkOamYFDMzOXQzfL0j4AAEBAmpmBQwAAQECXPag+AACiQwAAoEAAABZDAABAQQAAjEMAAOFCMzMyRM1Mn0Nm5plEAAAnQwAAEEEAAGhCAADAQAAAcEIAALRCAIC9QwAA4EAAAOBAAABAQPjQkzsAAEBAGI6uPgAAPUQAAD1ExwsLvnBRH70AAIA/pHDWQwAAMEEvHgs+C9X8PYAG0jvcRQO+GI6uPkh8BL4AAFxDAAAAQQAAMEFmZh5DrJKaPQAAQ0Tpoos+GI6uPgAAlkKDpQU9qCnKPofZCb4AACBCAAAQQQAAQEEFRJY7Jfy4PsWMfz17jeW8alpGPJqZgUIAAIA/lz2oPntUmkMzMwVDAACuQgAAQEGamYFDAIAGRBiOrj4AAEBAAABAQWZmjEMzA35EJfy4PpqZbUPbz1k9mpmBQwAAgD8AACBEAAAMRGZm5kIAAFhDmpltQwAAMEEAANJDMzOyQwAAQECaGY9DAADAQAAA4EAAACBBAACIQs3MR0QAgKxDN8vSPgBAgEUAABBDAAB8Q6gpyj4AAIA/AAAgQagpyj6amZxCzewbRgAAAEG7OO29AACFQgAAQEATT+W9Vn4/PgAAwEBmZsJDAACWQ5pZ2UXf708+dcWqPZpZWUUAADBBAAAQQTNzlkMAIN9DAADPQ5r5hEUAAABAACDiRat44r0QQuG9A58xvQBgpUUAYKVFPzD5vQAA8EEAAFhDAACAPwAAEEEAAHhCAAAAQRWWTTwAAM9CAABEQwAAbEIl/Lg+MzMXQ19pQLsAACBBAADcQzfL0j4AALhCSIbsvZNY/bzOAT48AACuQoWu2LxPvw4+GI6uPuVOCDxayfa9AACAP4NIxb31UlM6Jfy4Pk4mC74AAEBAAAAAPQAAQEAHmCk8AABYQ5qZQEMAAEBAAABAQQAAgD8zs3VDmpltQ6gpyj4AAIBAst8svZqZgUMAAKBAAACAP28avD0AABBBaBPQPmZmQkMAAABBJxFLPR7ew70AAABBss0ZPh/V6r1mZoxDw33cvWZmjEM3y9I+Z0X7vWZmjEMAAKBAAACAQAAAQ0TCMGY9AIA2RK2tu70zM45DAACAPwAAokNAHyi9mpmBQzOzv0Nz+wC+zcysQzOzv0MAAAdEAABgQQAAQEBmZkJEAACxQgAAgEAzMxxEGI6uPgAAWEIAAEBAAABYQgCAoUIAACBBAABzRAAAQEDNzOJDAADwQgAAEUMAAIBAAAAAQAAAAEDNTFVFAABsQwAAgD+aGcVEAACIQgAAMEEAADBBAACqQkihokOaWT5FAAAAQM5Po71jtcY9Z84FvgAAAEHPqtY8PIZGPgAAgD9mZt1FABpLPr0TkT0AAIBAqCnKPs18E0YAAMpDAADAQACgp0NmRtNFAAAiQwAAh0TNbI5FqCnKPpoZj0QAAEBAS9EMvpqZ5EIAAKBAzcwRRAAAPUQAgL1DN8vSPs3M4kMAAMBAZua0RGYmZEUAAMxDAADgQAAg30PNzBFE+1YIvQAA80NQ5cG9dd3mvZOuib254Bg+qwDWvV11/jzYnsG9S7m1PK9ORj5zspy9UgmKvZju6r2w3Jm9924Ivg7ITD1J8qG9x9muvRMy173Reju9vm8sPVjdBL7AZaC9ZwWOve3O7b06PO29fKM/vdAe0b3tTny8gdc9vFJng73bXsi9Lim4vMCyhL3IUti9OAf1vJe21r1jByW9kfWbvW0s7Dzx9be9MvrivVi4Dbsqcdy9m72Gvf3ZQj0buRe92wpzPXf8/brbdQC+q6YmPKgYvL20gBG9n9KvvScMyLzt6eG8cCTcPfcWZzyzOtI9YCLsvdU2Vj1WGAY9c5MaPgu2br1rOBA+D7I2PlRflT1s3ya9RddIPCGOi7xeIcm9z4yGPejqeb2/SYg8t1ukvcPDMT6tYhI972ddujC3Nj1TM5e80fWIvcDbirqp+bC9zaLavUDKmbx9y1e9hVbGvYCIqD3+GKq8iu1PvVnOwDyYzvm9eN/MvAun3L1zjt08H8f4vFO+iL3bKwG+inZWvdAA/Dsjptq9BbktPmj0cDz7k869I9IcvX0N8L31qhO9Q20QPgPQd7yNOZi8YdONPDOdWT7KutC8i+VFvd88RT6J9Ss8YM5XPUiv5T2DIZO9xy3IvfPsI72Yg7g9ISgtPgC+1T0pwh09yzglPX+8gb3qXLG9hX6PPEfadL3YBvO9aKW6PWS8Db0OaqI9c2tCvU8oGD5PBI27ECjZvZL2xrqS1tQ9EjHLvIQ7gj1XvkQ+563kO+MDiL37Gg09VOugPZ/u3b2byGo9jQhHvS9FBz4IneI9M3pOPhbMmDv7lC8+yPz3vYbRG70iugw7j84vPVl2r706OK09QcQZPO8sY73qPQ6+H7OePV6fTL0DpEU9yvWFPchu9j1rIvC9yLHRvCr45b2kgS4+vQO/veJ7yD1zhPQ9MYFHPqDTar0tkjg+l6/cPQz6NL0hKYy86XgjPt++Ab6XYhg9uQAXPiaXFL1xjjQ+LhujPerfh727N5c9AWDGPBEzNT5SYAg+yilVvRePR704AF28RZfRPTUAB73Ex4K9uglOvX+lgL03ozW8x2RcvRB6QT1bWMc9IeiuvIoVXL19ydE9XHqCvUuttTxwM9y9D2pDu01cRz2oWIq98ySnPfPK4bxD9Ja9oyUmvU3DrjwDfs+8g279Pc874TzfrlS8pms6vUMCqD3fAKE8Dq6SvCQYDj7l2X+9rTLHPUsi+72XHnu8FosUPr+S6zwAAAA/AAC0QwAAQEAAAEBDAACAPwAAkEJ/scK9AACAPwAAgD8AwMxFAAC0QwAAGEIAAIA/AADAQQAAC0NmprtDAACAPwAAqEQzMwVDAKAJRgBAsEUqMLS95DgOP9H7Qz4AAIRDAACAPwAAgD8AAIA+AAAoQwAAEEEAAKBAAAAQQQAAyEEAABBBAADgQAAAAEAAADBBAACAP0WN+70AAIA/AIAGRBZgGj7Nz9Q7i4apPMTiAT4AADBBAABIQwAAIEG1tDQ+6aILPgAAAEBm5hNDZuY0QwAAgD8AAKpDmgkJRAAAhEMAAEBAAACEQ58oCL7NQ+K8ACCKQwAAXkQAAGBBAIACRQAAqkIAAOFFAAAAQACAAkYAAIA/CCEEPgAAPUSclZ89AAAQQQAAwEAAAKBAAACAPwAAAEAAAFxDAACgRGZmLUMAABhCAADAQkgr8r0K1yM+1dN4vUvbNj0AAPBCAABbRAAAAEDNLBVEAABAQAghBD4AACBBAACAPwAAykMVBRk+AABAQc0sFUQAAKBAAABwQwAAQ0OamcBCAAAcRJoZj0MAAFtEAABwQwAAq0QAAOJCAAAQQQAAAEAAAABBAMDYRQAAL0MAAJBCAADgQAAA4EAAgC9DfbyLOwAAAEAaUAi+rv8KvgAAAEMAAIBAAAAAQNWhCL6CS609AADSQwDAt0UAAFtEAACAPwAAQEClroW9nnYhPbjkKbwTXgC+MQxDPgAAWkMAAKBAAAAAQAAAAEAAAIBAMzMcRFs9AL7vZO+8AADgQC2q4j0AAJBCAACAQAAAEEMAAOBAlyLfvQAAEEEAAOBAAAAqQ0+fxb0zMxxEAAAAQAAAAEAsZAi+AACZQgAAkEMAADBBuM9YvRyIoT0AAIRDzazhQwCANkTt/U89ACDfQwAAnEMAAPhDAABcQwAAAEEAQJJEAAAAQQAARkPIiea9M7MaQwAAqkIAAEBAAACQRAAAQEAAAABAAAAwQQAAiELNTJ9DAAAAQAAAgEAAAEBAAAB8QwAArkQAAEBAZuakQwAAAEEq+eu9AABwQn+Ay7yCNfW9AADgQKVY0r3LnDg+AIC9QwAAwEBmZsJDAICdQwDA0kXhOBA9TnU6PgAAQ0UAQKdFAIA+RbKU6T0AAC5EAMCTRQAAw0QAAEBAAACAP82s4UMAgLVFAMDMRQBA5kU7rAS8AMDDRQAAAEHYIRa98E7FPLKA2r2yghe9AADgQIeU7T0DLfu9ZuaHQwAA8EIAAEBAax4NPr+uKbkAAPBCAADwQgAASUOap/88CNbOvbuHDD1g9Vo9M12UvdqjELyLSvG9PSjOvQAAgEAAABBDAAAMQwAAgECoPYE9S/fjvFir0j0AACVDgZoxPeiysD0AAABBAAAAQAAAnEMAAJxDzUwxQ4dpUL3pc8w9AABwQwAAnEMAAIRDzUwxQ0lXFj4zs79DAACAQAAAhEOkcNZDAABYQwAAEEEAAABBAAAAQDMDfkQAAMxDAACAP2bmNEMAAOBAAABAQHtUmkPFzNu98DAJvQAAMEE7vAS+toSOPQAAQEEAADBBAABAQAAAAEEAAFJDAABwRAAAdkQAAChEAACZRGbmpENIoaJDAAAWRAAAIEHnyUQ7P3crPgAAeEIAgKFCAACHRAAApUTf1VK9mhmPQwAAAEAAAI1FAADPQgAAPUMAwMlFAADIQwAAq0QAAABAAABMQwAA4UQAADdFAAAgQQCAvkUAAIRDsHM0PgCgCUb3KTg+AMDYRSHLib3bZi0+AACAQAAAgD8AQBtGAIDlQwAAC0MAoKdDAIDQRQCA3EUAAFhCAAClRQAAMEEAAMBA12igveStGzwAAABAAAAAQGamu0MAAKBAo7IBPgAAgD8AgIdEAADgQAAA7UXLj8y9AIDBRQDAukUAAIA/D0v5PQDAw0UAAO1DMzMcRIrVIz0AgL5FAACAPwwCsr1fJ+q6ol7wvXOqA71nc3q9H9TTvcI8z71A2169cX06vWxlib3dAM69CIIEvnuDlL2DXUI9T+UNvau8u72flM+9a5t0vGeCtb1/kNo8IkCXPdoBxLxJFEQ8cjLSvdKE6b3XmMy8oyXLvI/Wur3DCIq9lOohvK33bL34DL29iKXPvCH8yr1Dt588hEK1vP0c2r1yF2i9wfMVPnIsVL3nNJW9+1z2vYqcqr1UGAy9S3uwPW/MVr2blLi9oMg0vONl5T1zm7K7Q5EqPJPv571kOYk9GSimvK5WEjv/fJ29juYuPX7yvz1T2l48f99zvQ+R9rtrfqA9EgOkvWlUFr1lb9I9gbuZPH1FLb39MAg9DbAfvUuckL2HEoQ6Y4rZvf9rwj3KE3q9U/PJvVs1drx1+ta93567vMeccr3blJk9B+m/vYbKNr3gHnW8E9WfvcqIXjxvISy98Dv3PL7+Jju/O5q8AkZCPqq8Tj1jfzw+djqHvfIRDz2rqL+6O8slPXkGHT5rWqM9T+K9var+NL3qw047dy82vR0ifb0ipQe+s5mIPTMH3byDmDE+FiSJOwl1DL3yru09nUUVPh8UFT3Xc728hX9RPRGejj23i788JDQgPjqTTLzC3uE9sF85PnOF+Ls/wiA+PYj4vXvWTT2DX8E9HGqbveXxJbpU5y89LWP8u+Njdr1ekQU9+GwBPqg/hD0bImG9rzONPUg2ND5jHAg9//DEvQ7Klz0Ygjw9Xe2QvVm4GT7K7dk9L1d2vFLWoj0wR1i9aPULPoOzqjwdHvS9HBe4vOOFFz7P27W8z1H/vPBFEj7EUI29RueMPY8nbzyIgkM+B5ZgvQsBHj3qT6i9JLIwvPrApD1sOBu9HTFcvXffAr1Hwvs8P6okvTJOcT3bmKK93SmwPXXZHruofri8SzIrvT0aez2KuMC8aXpDvfjeiT21OZa8aWCuPDMr2DyA9yy9C36LPQcIG70Jrq69l+0BvQvEKr0LsKc8nw+qvSsWCT2bLqq9BSsoPaytA753NDK9TwWZPZJZQD7u7CA9rTOnvb1z5zxIy3o9AAAAPwAA2EMAAEBAAABAQwAAgD8AAIA/nFvEvQAAgD8AAIA/AICpRQAAz0OUEzM+AACEQwAAwEEAAPBCM3OWQwAAgD8AAOBAMzMFQwCgCUYAgKNFub22u8iN9j3NTDFDAACAPwAAgD4AAPBCAAAQQQAAoECoKco+0Qu9PQAAgEEAAN5EAAAAQAAAMEEAAIA/pRzqvQAAgD8AABBBAADwQQAAgEAAAAxEtbQ0PmUj6L0AAABAAADAQJqZQEMAAABAAAAAQQAAwEMAADBBAAAAQQAAAkN7xAO+AACEQwAAjEP2qCpDAACwQQDAn0U3y9I+AADhRQAAgEAYjq4+AACAPwghBD4AgGJFJrSXPTfL0j4AAEBAAAAAQQAAQEEAADRDAADAQAAAIEEAAOBAAAAYQgAAAED85MC94uoqPV3G1L0AAABAAAA+Q6Rw1kMAAIA/AABYQxiOrj4AADBBAACAPxiOrj4AABBBe1SaQwAA3EMAAABAAAC0QwAAgEDCz9O8pQvVPAAAAEAAAGFFAAC6QgAAQEAAAEZD/e8Ovqgpyj4AAABAAACgQAAAcEIAAOBAAACQQgAAaEMzc5BDAMDSRQDA/0UAgNBFCkwEviuIB74AAABAAABAQAAAwEB4gQK+usV5PQCgCUYAgLVFAAAwQZoJCUQAAIA/AAAAQB135b1oE9A+I2KCPQAAgD9IfvO9AAAQQQAAwECamTdDAACAQAAA8EJIp/S9SmvZvH1okL0AAEBCi7kjPQAA+EMAAMBALPq6PQAAMEEAAOBAAABAQgAAoEAAAEBAGI6uPgAAkEMAAJBDAAAgQWgT0D4AAD1EAABAQAAAgD//uBw+AACQQwAAwECZFxA+AADPQwAAoEAAgOVDAAA9Q/aoKkMAAKhDAABYQgCANkQAAKBAAACgQAAAqESaGY9DGI6uPgAAAEAAAIA/AABYQwDAw0MYjq4+AABMQwAAdEIAAKBAAICdQ/aoKkMxTZY9AAAQQQAAAEESw+W9AADKQgAAQEAAAJlCAIC9QwAADEIAAKBAAAAAQAAAQEAAABhEkfICPqGmLD6TqWo9qCnKPhiOrj6ALpA7rUUPPgAAE0UAAMBAAAAAQKgpyj4AAKBAX6ewvQAA80MAAIA/AICpRQDAukUAgLVFypfePWgT0D4AAOBA+zupvQAAoEAAAIA/AACAQAAAMEEAAABBAIB4QzMzskMAAPBCAABAQgAAbEIAAElDAACAQF9uGz4AADBBAIBKRJ6bL73poos+AAAAQKWIKrz2qCpDAAACQ40R270AAIBAAACAPwAAAEAAADBCAAC0QwghBD4AAJRCdYjQvTMzBUMAAJxDAADAQgAAAEAAAABAAACAPwAAIEEAAFxDMzMFQwAAKkMAAMBDAACAQAAAhEMAgDZEAABYQ5OdprzOiq89AABYQwAAQEDNTJ9DMh0hPSX8uD4AAIBAAABAQBiOrj5YxJs9AAAAQAAAzEMAAMZDAAACQzMDfkQAAABAAAAAQAAAGELY2PG9AAB/Qze+wz0AALRDAAAZQwAAAEAAAIdFAAClRAAAukRoE9A+AAAAQADAgUUAAEBAAACoQQAAOkUQ9eO91T9WO5J91b0XCuk9AAA6RWXnCjwAADREAACgQAAAEEEAAIA/AAAgQQAAh0NmZmBDAAD2RBiOrj4YKp49AAAQQQCAoUMAwLdFukP9va/zzTteHSc+AICsRXYrur0AwMxFAADAQAAAlkKwACw+jHShvXPvHT4AAOBAAACiQgAAMEMAoAlGAIB4QwAAwEAAAOFFAMDqRWql2bxBjLY9AABAQAAAE0UAAMBAAAAAQQAAAEAAAIBAZqYORAAA0kMAgOVDZuboQwCAaEUAQJ5FACAERAAAgD8AAIA/ACAERAAAQ0QAgNZFZuboQwCAskVLYEa9foZGPfUKWT2rxmK9wZPEvV9RCr0n4fW9uoLpvGclmj0facy8RTHhvQzCCD1jnMK904axPYqs5L2H1me9DT7NvZP9tj0ScqI9gwlUvaLCtr3VE6q8qcKjvfZWQL01m+M8nQ+DvRNNwL3gq+69G7BCOwLFl719wWM9sZQyvfdRx70g8WU8zJ0BvQ/0Xz2BkC8+qt5iu6OuE70T2+i9w5fKvXf48bz4vWE9un54vdqam72ziRI8uwfWOkoflb2vAYm96L/fvQIGkbzUtzg+sw6KvWf7Nz1zeqi9MK9xPZ8kh711e+E87tyovZZii7ykSUg9Q4AjvKfph72w+qu7xAwMvcvMtr2MtbC9BPVEPZ9yg7xKLVS9oyDjvMWtyL2dV5+9AneOO58r9L1yU6698hLHveY0Lb0vzBi9g6AKPc1J3LzV3m49UiBVvX4BAT6mYIU8LiERPu9pwjxSUiI+SsF9unyLl73Dr5I8SgDLPWY6HryKM+q9F0fbvTtAkbygukU9Nk4CPsYKir3bTOe9OqsuvTIRjb04hYE9p9oxveiM/b1qUy+9HRCEvbee571YR3O91dZHPeAd1b29AYA8kv54vKQYoL0OJqK9ZxDCPKetwb06Fr06Q0N4vcfu7r1n7Hi9i610vMLesz1it9i8NSDGvUPG97tbhJs9sEPgvV6qsjwcMq29t87hPWkRQD0K6Qw9R54sPjk4tj3/+w89tq2dvTMusTxDvQo+hxaCPHqjIT4WFYG93RpTPQs2KD7hKEU9z1UtPgQDyr06Yiq96VAXvasNtDyrTV0+Z70XvPcUbDxfW04+VbudPO82Yz1fohW9PYwGvp4CxTtbTI09YxIEvUnwoj17qVm8eDMTvje3PT0dUuy9E2i1PTjkpDw2pDA9kcKtvQXKOL0ygTE+FQsKvoY4Fr3a9GE9dR0bPpmdDD6vLIy9L9iWOyXVs7018DY+ddFpPMLnPj5QMcA8Z3rWPN1y8D3Y/q+9csPEPbohHD4K2389oKYvvVcvQj3A5KY9p7o5PnDf9bzzq1O9dJYyvYjZ0rwL3Tg9p9HKvTwBOj2oKGW8qI7QPbWWkrxtw/w9EUuJvFLEZr0EQse7JhMjPU91pbx1UfO8M6LSveCo0D14h947kP/NvZeVUb0HvXe8CCzrvXJC8DqTJic+8jHwPONohr2D7nq9W5XVPHyFBT4Q8Fy8LzfkvQIcs7t2Jy69CJMHPVdBp73KVnQ9hjAGvsPyhL0AAAA/AADwQwAA8EIAAEBDAACAPwAAgECatCY+AACAPwAAgD8AoAlGAKAJRhvr5b3GggY+AADAQQAAgD4AABBBAACAPwAAk0QAAABAAECwRQBAG0YAAIBAAADAQAAAgD8AAEBCAAAAQAAAAEAAABBB0Qu9PQAAEEEAAOBAAOAjRgAAAEAAAEBAAAAQQQAAgD+QXvW9AACAPwAAoEAAAABAAABAQgAAEEPx8PA96aKLPgAAwEBVVVU+AABYQwAAMEEAAJxDAACgQAAAoEBirAO+d+O3vAAAQEAAAFJEAABwQQAAAEAAACBBAABAQADgI0YAgBRGAADPRAAAgD8AAIA/AACAQAoinjy6oci9AACAP1JT0L0AAABBAAAAQAAAgEAAAEBCAABAQAAAgEAAAKBAAACAPwAAQEEAAEBACymPPRcKzrxgy5e9H56ivAAAgD+/jMQ9AACAPwAAQEAAAIRDAAC0QwAAQEEAAIA/AAAAQAAAgD8AACBBAADAQAAAgD8AAMBAAAAgQQAAikQAwMZFAAAnQwCAvkUAgAJFAIAURhWp6L1DYle9AACgQAAA4EAAABBBAAAgQcbWID4AAABAAADeRAAAMEFVVVU+AADAQGM98L0AwLpFL7XvPQAAEEHSJtC9AADgQAAAEEFzyvy9AABAQAAAgD8AAPBCAAAwQQAAIEEAAABAAAAQQQAAgD8AAPBCAACAP5h9tLwAAIBAAAAAQM3n+r0AAMBBAABAQEBeqzwAAMBACCEEPgAAAEAAAKBAAACAQAAAwEAAAIA/JUkSPgAAgD8AAIA/AAAgQQAAoEAAANhDExnqvQAAAEAAAMBAAACAQAAAtEMAAABAAABAQQAAhEMAAORDAACgQAAAwEAAAI1EAACAQAAATEQAAIA/AADAQAAAkEQAgI5FAACAPwAAKEIAAGxDAMC3RQAAMEEAAHBBAAAgQQAAwEAAAABB79YXPm+5RDyZORY+AGAQRlCrIj4AACBBk2kSPgAAoEAAAIA/AABARAAAoEAAAApFAACAQAAAokSyz/S9cywEPQCA8UUAAOBAAIC1RQAAMEG8bA89CKXHPTc8tb0AAIA/S5uFPQAAQEEAAMBAAACAPwAAQEDpoos+AACQQgAAwEDqwbO9b7rvvQAA8EIAAABA/xDRvQAAAEBLQt69AAAgQQAAIEEAAChDw+qovQEdCz4Dp/68qhvSvSiF770AAABBAADAQAAAEEEAAABAeLHgvRHsiTwjmNa9AACAPwAAzEO19v29NEWJPIC1nLx9Say9AAAAQAAAwEAAAEBAAADkQwAAAEAAAJxDAAAAQAAAcEMAAIA/beryPAAAQEAAAABAAADkQwAAQEEAAHBDAABYQwAAWEMAAJBDAACgQAAAwEAAANhDAACAPwAA2EMAAMBDy0Oyva9+9LsAAEBAAACgQAAAQEAAAMxDAAAAQAAAAEDFkpW9AACQQwvItb07mEE9AABwRAAAAEAAAIA/AACHRAAAh0QAAEBAAACgQAAAZEQAAMBAAAAAQAAAQEEAAEBAAABAQAAAfEQAAI1EAABAQAAAakUAQJVFAACgQABA5kUAQJhFAIBQRQDAyUUAwNhFAACAPwKcTj4AAIA/AAAAQAAAMEEAADBBAABAQABA+0WtqVC9+2fPPeekw70jwGs8R+DBPQBAG0ZaOeu9mTkWPgBgEEaJEg8+AADAQOcSzb0AAABAAAAAQMMhJD4AAMBAAAAAQACAcUUAgA5FAADgQAAAgEAAAEBAAACAPwAAoEAAAKBAAAD2RQAAMEEAAEBAAABAQACA8UXrRqK9+45Su47cp72LoAw8r8a3vDN4jb0DxdO9Rfl0vfxCpb1HxNC9PRrpvbPVKTyd+Vm9VuGwvahfVz1T0uy88zZgvb3g2rzKO9S9euyMveu0LD4y8Be7q0fOPFpWD72Nv2q9l6PdvSuTQr0LbJM8w/2QvfY9yr2HgL29D6aKOHaTk73XEtq9HE8NPbBwl71YWT67/9M9vU7ACr2tfbU9lcMhvTO+/DwdbOG9KDXSPG4zJr1gfgc6UOQsO/UMlz17Gn+8lpSWPUIyeL2CMc88a2VBPFM73b0XdOi7UcYZPWhxkL2l4PG9wKHdvXilY70tTTe7bHikvdSUrrtEPpy9U0h7PQgyIL0a1+69XoekvBcWRb16Ety9O+h6vCC/tzw9veS9nAOwPFvdHb0lQlo8G0tQPXqgfr2Z/iw9WYSlvVMtI72N96O9u16ZvX8LGr3T/pm9AgnsvVd+G70VU6C9y3SpurxpN73f08S9UoE1PXvvub23/Q+9M3Wfvccr5b0Ok8q9MPxYvVWcjz1zsze9n+DWvHIQmL27Js+8xVX2PEPixzzgvAU+T7j0vE8iZT2ip509xc0KPuNo+j0YD6a9k9IaPfNQ1Lxya6o9EiS6PFXezjtBNzY+cyEfPHra5r1gReG8Cwe2PWYOib2as6o8ro02vO1aej1HbrO90FCGPShEBr2Aydm9WhfkPNA0dL1e/Tk9LyepPecH3L1DHRU9HxnVPdiETr16jPY9wWyoPSRHJD4dLx07abKavQrE5D11sQ+90aeBPdupJr3uGL69aFCJO/qK6L1FFuu9KTXLun+O6j0wZNQ8GMnhPPtKFL3/aQW+aO3PPVgWwzyjopA9XU+SPSgHub2v6bK9WiHtOx8VST1DUIa9U6vYu8/sVL2CSIO7mK14vV1dqL37Rqm8H7W+vR0gfjy3hFS9yItVPGvxrDxUKYc9QgczvSdvDr2I/Qk9JGkmvfVZgr2YoAK9K8EWvLLR2jyHESK9XwRWPXyjvr00Pwk8/wVYvWEChTxCCts7OD7XPcynhL3TXCs8v+aZPaCXnry6S9a9DpKGvXtiK73xLsA9AAAAPwAAcEEAAEBAAAAAQQAAgD8AAEBADaezvQAAgD8AAIA/AICIQwCAt0MAACBC6+0cPgAAgD/x8HA+AAAQQQAA1kIAAGBCMzMFQwAAgD8zMxxEUjoAvWe41T0AAIA/AEArRAAAgD8AAEBAzcyIQwAAz0MAAPBBAAANQwAAhUIAAOBAAAAAQAAAMEEAAPBDCCEEPt1a5b2XNvq8AACAP2gT0D4AAIA/AACAPwAAAEDpogs+wCAnPd9/gb0AAPBBAACgQAAAMEEAAMBAAABAQAAAWEIAAAdDAICHRCX8uD4AAHBEAABgQagpyj43y9I+mpmcQgAAAEAAgC9DAACAPwAAXENF2AK+AAD4QgAAAEBVrNq9AADgQAAA4EAAACBBtbQ0PgAAgD8AAIBAAACgQDMzBUMAAEBBCtcjPiX8uD4AAIA/GI6uPgAAQEGamZxCAABAQQAAQEHtnuU9AABAQQAAwECPFPu9AACFQgAAEEEAACBBAACAPwAA4EAAAABAAAA8QgAA4EAAAPhBAABkQgAAYEJm5qRDAAAAQAAAwEAAAHBCAACFQgAAgD8AAOBAZuakQ93zoTwAAKFDAAC4QkJs/L0AAABAAADAQJPjfb03y9I+AACgQAAAgEAAAABAAABQQQAAGEIAAE9DAADAQACABkQAACBCXI+nQgCAh0QAAOBAAADgQCOmkT2kcNZDAAAgQYA/070AAKBAp6jwvQAAgD8dkRA9AACAQAAAgEBoE9A+zUwxQ6EO6j0AAABAAAAgRAAAAEBmZjBEAAAAQGZmHkMAAK5CAABAQABAK0QAAO1DAACAP7Io3D0l/Lg+AACgQAAAMEFoE9A+mpnkQgAAMEEAAIA/AACAPwAAoECTmOq9X/fzPfqYdr0AAABBAAAAQQAA2EEAAEBAAABAQAAAREMAAIBBAACgQAAAQEAAAIA/AABTQwAAWEMAAGBCAAAAQAAAJEMAgIZDAACCQgAA50MAAABBz1rOvQAAmEIAAKRD8asXPgAAIEEAAMBAZmbCQwAA4EA3y9I+oJ4cPjdd0jyoKco+AACgQAAAFkMAAABAACAERAAAk0PWfSw+YzQ0PezdBj5nJDg9cIgFvQPMbjyaOui9GI6uPgAADEIELrm9AACAQELiz70AAABAAABcQwAAAEAAAABAAACAQAAAgD+Scd29u52wvAAAIELKztg9Ci2MPffQHr0zpfY9t6rjPAAAW0QAAKBAqCnKPkv8eT0AAMBAAACAPwAAgD+amUBDAACAP9cz370oviQ8XzTSvQAAgD8AAIA/iw3VvWWq0bwAAPhCAABJQy8h9r0AAIVCt7upPQAAgD8AAABAZ/0YPgAAgD8AAIA/AACAQAAAcEQAADBBAAAgQTgi5L0AACpDaBPQPgAAoEAAAFBBAABaQwAAUEH+Mr48f7GkvBVeyz2zDay9VYDfvAci7b0Q8ti8bUyuvQAAQEGAMNa9AADAQAAAEEEAALFCW77NPQAAEEEAAMBAAABAQVWxAbz+wp69AADgQAAAAEEAgDJDAAAZQwAAQEAAAChCMzN7QgAAHEIAAMBBAABAQMiFJL0raP29Jfy4PmZm5kIAgKFCAAAUQgAAgEAbDy0+AICHRAAACEIAAIA/AACAPwAAgEBkfBi+AAAAQwCAgkMAAIBCAADSQgAAIEEAAH5DAAAmQwAA6EIAALhCAABVQwAAUEIAAEBAYJkpvW/l7T0Yjq4+AAAAQcNsXTzOKRU+AABAQHM2rL0AAJNDu6v4PQAAk0PFAPs9AKCnQ6gpyj4AgNpDAACkQwAAC0MAAIA/Jfy4PgAAsEMAAOBAAACoQgAAIUMAADBBAEArRAAANEMAAIZCAAA9RAAAdUMYjq4+AABiQwAAwEBIZde9i4W4vUGCFb0C7dE8c5Z6vfhZTzwyUda9CnhXvd22+j1/Hkm94gywvSvuSr1joog8XRqCvYvimb3BE8e9eiyIPQ5WG717kEA94P08vbkPQz0KYE+9SPbOvWpl5Lvlu/O9DxG0vasjdb3cBbs6zwqAvU+j1b0Eb5W9J7PNvfIcFr3E5K29sBafvetbNT1h4T29AF3dPNX+jj132IU8Ou4lvZp7qjwbyaq9MxosvfBWN71TlbU9omTbvbOmG72PCTa9CNxiPSOBvT1VWwu95/O9ve9P57yJJ6Y8YkzhPa/afb0v3zI9FGqiPWMVjr3Nxzq8K8mqvXKDcD01eb298W8AvocixLzcV4O8mdepvX/1ATs+naq9tDCYPW3brr1gieG9eSTKvKM2ab2f3308zQhUPZhUXb04hme9LS/lvcztLrwv+aq9VZdUvVtgPD1A84y9CPibu08akT3nJaq9Dt0EPXOFEr0/IjM+56YhPVnvvL1jXHG9LXdaPaIZaL17heS9aDf6vBqv8L2jVHi8W5yHPWMt3L3f/qQ7FN6nvW/Wmb2IBvW9JisYu9l2gr2lN627kszrPPVJZ7ybvJE9Kg/EPDAzHb3nV1m8K/oLPWTFjbz8eDc9vqKgvW/ijD2xwgE9ZGYbPvM8hj3C+iI+1gAovTZEMj0rO6o8AiE7PauOxj2HCBw+eGXcvLhW2j07Gqa9sl+iPa5RET7c/LM7G6m+u/btmz0vrZG8XU3YvdX3UD05jik+DcV1OYgAMT1aF0e9+J+xPeiS1r1UUUE9tt8wPSv2Iz7cWxS+Iqi2vPBUKL34rPO9q+elvQqovz3Oebg95yQUPhe8H74RmgW9xaWmvTiepLynVco78GLSvdJX47xw9Rw+xyjbvUvLBT0Dubi9DfLwPb9M0bw3Vt49py8LO9/J/z1hyMW7a458Pf/UC77GdBO82A1fvb1sGL3bJAK9mEiMvTfcq7yKOAE9ia8VvXpGJjvAfhC9s5Neu7O9qb0oZM68T0rUPXcFqbxnJK28YpluOreMTD03opK9+o2xPIOCAj7LPWU98CX5u1ueYz1PDQW9AAAAPwAAtEMAAEBAAABAQwAAgD8AAJBCir2VvQAAgD8AABBBAMDMRQAgikMAABhCazMVPgAAGETNzPRCAACAPwAA8EIAAF5EMzMFQwBA+0UAgLJFtwS2vXIF4j0AAIA/AACgRAAAgD4AAChDzazhQwAAgD8AADBCAAAiQwAAAEAAAOBAAAAAQAAAMEEAAIA/AADcQgAAPUQAoAlGAADAQTEMQz4AAIBAKXMCPgAA4EAAAIJCAACAPwAAAkMAAABAAADAQAAAQECclZ89AAAwQTfL0j4l/Lg+AABAQZoJCUQAACBBAAAAQKgpyj43y9I+AACAPwAAAEA3gxA+AAAAQNObXj4AAIBAAABAQAAAQEAAAMBAAAAQQQCANkRoE9A+AAAgQQAADEIAAABAzewjRABAK0Q3y9I+AAAAQW+Mjr2RF4Q9AABbRAAAtEMAABBBAACUQwAAgD8AAFhDJfy4PgAAAEEAAIBAAABwQ0KY8L0ot++8AAAAQAAAwEAAAOBAAAAgQQAAnENoE9A+AACgQAAAlEM3y9I+AIBKRAAAQEAAAORDAABqRAAAEENIoaJDAABkRADgI0YAAHBCAADhRYfovb2amUBDAADgQAAAAUUAAIBAQ4j9vag/ST0PDf09AADAQCdh1r0CXmq8AADGRAAAQEEAAIBAAABAQAAAgD8AADBBN8vSPnDW6DwAAPBBAAAAQQAAwEAAADpDp5HWvY3q1LwAAMBAAABAQgAAkEIAACBBeihivQAAkEIAAKBBAAAYQgAAEEMAAJBCAACAPwAAEEG1tDQ+BokQvXN7O72gIew9ZuY0QwAA4EAAAEBCCCEEPjNzlkMAAKBAAACEQzfL0j4AAJxDAAAAQAAAGEQAAKBAAABAQAAAyEMAAIA/AAAgQQAAGEIAAJBDAABsQrjxi7xuYaQ9AACEQwAAgD8AAAdDAABwQwAAAEMAAABAAADIQwAAgD8AAIRDmpkZPgAAQEIAAEBBAAAAQAAAoEDNzH1DmpnAQgAAgD8AAABAAACHRAAAoEAAAPBCAADhRAAAAEAAAIBAAAAAQAAAwEAAAHhCAAAAQWCTsb0AAC9DAACQQgAANEIAAElDZuakQwAAgEAzM3tCAACgQACA3EUAADBB+IXcvE//q70AQCtEAIAyRQAAFkQAAEBAMwN+RAAAFkQAAOBAAACAPwAAykPDfsi9AMC3RSX8uD6y79u9dTjovAAAAEEAAIA/AADwQQAAEEEAAKBAAABAQgAA8EIAAElD10G0vdy0uLwAAABB6aKLPganL70AAKBAAACAP4gSMj2oWm88QIj6PcWo270rE5i8AAAAQAAAKEMAAJBCAAAoQwAAoEAAAPBCAACAQAAAAEAAAMBAxTNuPbLc9L2TRCq9AAAqQ3+N570AAIBAN8vSPgAAMEIAACJDAACAQAAAhUIzMwVDAICdQ2ZmYEMAAFpDAMABRAAAqEO/3g8+AACcQwAAoEDHnEg9AABbRAAAgEAAAJBDD2gVPgAAqEMAAOBAZuboQwAAAEEAAABAAACoQwAAhEO705s9AABwQ03ox70AAABAaBPQPtugMTtOg8I9AABYQu0A070r9969AAAwQVwPCUMNzNy9K/b3PKiU8LwAAIA/AAAwQdWunT0AABlDAABEQwAAykMAAJxDZqYORAAAoEArMeu9M7O/QwAA7UMAAKBAAACAPzPJzb0AAPBCAAAAQSwfEj70tR49bl4lPgAAKEQAAABBAADgQAAAEEEYjq4+N8vSPgAAHEQAAEBAqCnKPgAAUkMAAKBAAAAAQAAAgD8LcQk+AAAAQAAAfEMAAHBBAABgQgAAw0QAAIA/ZmZgQzMzBUMAAHZFAACAQJqZnEIAAEBAFOMLvb1usz06Ok88mLsNPgAA4EDH7au9AAC0QgCAvUNyT/q92okFve/hIj4AAIBAAADAQACgp0MAwNJFAADPRQAA5EMAAIBAAECeRQAAGEIAgKxFAAAAQQAASUMAAJ9EAACAP1885T0AAIBAAAA3RQAAEEEAAIBAAAD/QwAAoEAAgA5FAADMRELiNL0AgEpEAACAPwAAAEAAALREAAAQRAAAgD/NrOFDAACAQGamDkSkcNZDAAClQ3Uxrb3Hjn495z7IvUeiWD03yoO8Mny0vWMYtDy5MYS9dSGLvc/yH73jQ9889fBNvcZfm70CcM69VFXFO55Whb179ns8mU0vvR4CHT5ijQA86Ff9PfCwcDyrmDW91jG/vT12Oj3CaS69ogvPvR9TlrwTgy+9G3u8vY+MDT6BZ6G9DSTbvaFvEr3jKnq91nXGvacbArwpO6m9ePvSvfn8q72Ix4E8w9Stvadyj70fuzw8jRmBvSW9ZT3rQay9hEC7vC73ALtAiTs+buTGvbORyjyre5u97aTGvPREGLs3gaM9B8SgvatMHb2Tfwc+y5USvf+WG72Lstc7IhznPKaGmL3HzgI9GrjEvRC3Ej2Y3e89gn68PaUReb0IzLS9p1Cauhjawz3wY2+6ro0xveakET1WBJm9OvUnvXDqAL0GPKO9tg4IvVA/pTw7jCS8NecCPr+mur1Vbng8ys7FvNmhw73EqIa95hSSPK9C4zv1jdS9OxTNvTxbvjx627y9h9o0vd1crbwfYpI9dNmwvSgM2rvxUpa9Z6npPcIBLTv6hZi92XahvctMET2YXx096/oUPl0Rqr3L2og87TQwPUFUi70JC6S9yFjovcSoDL2Fl829p2OZPXIta72C+Hq9yyyRPF/qHD5lwJg8RD65vGr3WD0jE4a9c1aqvCUEWjwfAAs+cJZ6PUZLHbxoqms9vlu4vcum8DzwMG+9eXk4PTGUm7zx4Q89huyIvVTJrj3pFQy8iNAIPCk8xb03U6E9NzJ1vXINir1P1Ks9iCGTvdc767tCGeo8b19JPn+jrrxioec9u7PqvBgIOj2pbqo9d2MJPch4hz184KK90OemO+4iCD4LvMk9ttqtvbhlyrzcAgO+gt5WPW60Hbw3sXG9CPfoPcKA1zwbWgG+Lju/PNaLOz6fi7S8h9/tvSvwdTzgspO96qBrPAOkMz1Xq769ePD5PTvFHr2Skeq9kFEOPj3Eaz07tt89DRYSPvRIkL1f0AY+86aTvS9ELz0f3+09nOYcPad9Cr6vFl892XLBPSonr7xvbcS9smqZPQr1ELxDXqu99VogvCG6vj33Wvw8K8KdvUVFcL27/Os91cY2vXpjlb0z4uY9+9a/vcJNIL3UNq286iwevdZJlTw+mzc8eP0YvVWw0z1zjws6uzLYvT+kDz1viBG9fV2yvTUc57xrexq7xw2pu4SurL0Q+aM9VypQvU6kkz0VmjQ7H2MpPXwmyr00QyA9k/4bPgoxdz1b05i91+w9vFPnojz/lK69ftqsPDqMIT1V4Uq9lRAKvRwMkD39IOO8MxPvPNVywz2rlCe9ROi2vbsXWbxzECI+sHRdPRhxxL2hW8w7AAAAPwAA8EMAAPBCAABAQwAAgD8AAIBAAACQQwAAgD8AAIA/AKAJRgCgCUYb8Nm9AAAYQgAAgEA8yw4+AADAQc3M9EIzc5ZDAADqQgCAUEUAACJDAADKQwCANkSOq5m8+okIPtaysr0AAIA/AAAAQDMzHETpogs+AADwQgAAgEAAAOBAAAAQQQAAoEAAADBBAAC0QgAA8EEAgGVDAAAAQADAw0UAADBCkGHZPFmRCz4AAKBAuHXWvQAAgEAAAMBAAADgQAAA4EAAAKBAAADAQAAAAkMAAFhCAADAQAAAW0QAAEBBAADAQDfL0j4AABBBAADgQAAAgD8zM3tCAAAgQTMz+0IAAOBAMzMFQwBAG0aaGY9DAABYQgBAkkUAAIA/AMDJRQAAgD9PDNq9XI+nQuVX1D0AAIA/AABYQ1yPp0IAAEBAAACAQAAA8EKoKco+AAAAQQAAgkKMaYs9AICHRAAAgD8AAEBAAAAdQwAAMEIAAORDAADYQwAAAEAAAEBAAABAQAAAEEEAALRDAABYQwAAAEAAAKBAAACAPwAA8EIAAEBBAABSRDOzGkMAAJNEAAAAPQAAYEIAAK5CAMDMRQAAlkIAAOBAAABIQ5W+Kj2njeK9AAAAQDfL0j43OBK+AACAPwAAAEAAAENEAABtRQAA9kQAADBBAADAQBiOrj7poos9AIBKRACABkRgTby98o0+vf6Ehb3agHg9AACAPwAA8EEAAEBAAABcQwAAKEMAALhCAAAAQAAAkEIAAKBEAACAPwDAZEQAAABBpVfcvQAAuEIAABBDAACQQquqKj4AAIA/0Qu9PedCtbwAAJBCPVLavVCYmL0AAChDAAALQwAgBEQAAORDAACAQAAAvUIAAChDAAAWQwAAwEAAABBBAACQQwAAoEAAAFhDAWUKPgAAnEMAAJBDAADAQAAAhEM3y9I+AACWQpqZ5EIAAIA/AADMQ/dZ5b0AADBCAAAAQOR7pb0AAOBAAACAPwAAIEEAAJRDAADAQIciLz0AACBBAADMQyX8uD4AgCxFyicYvgAApUQAAABAAADAQAAAQEQAgEdFAIB0RQCA3EUAAIpFAABAQagpyj4AAOpCAAAAQAAA4EAAALhCx8EKPscrJT4zsxpDYh4AvgAAAEGFJW+6AACAQCX8uD6tYmY9AACKRBSVTD0AAFJEAAAHQwAAoEAAAKhEAAA9Q83MfUMAAF5FAMBkRAOX5733Omw8AABAQJmOOb0AwOpFAABAQAAAMEEPgbW9AAAAQQAAgD8AANJCAACgQIPtCz4AAEBAAAAgQgAAgEAAAABAmpkZPgAAAEEAAMBCAAAQQQAAAEAAAFtE7t+QPaHeojwAQCtEAACAPwAAIEHDShK9XWe3PQAAwEAfAOS9AADAQQAAKEMAAEBAAACAP33l7TyFkNu9q3KWvVDMnD0AAEBBEJ7ZvAAA4EBmZpVDAAAAQaN4/j0AAEBAAACAPwAAAEAAAEBAAAC0QwAAAEDQoKm9AACAPwAAtEIAANhDAABAQIe6Ar4AAKBAAMBYQwpXq0KW1gw+AADAQAAAoEAAAIRDmpnbQjfL0j4AAJxD36S2vAAAzENau+A9hWq1vBiOrj4Yjq4+AEArRDU+dz2k/i49c2NAvanqFz66QMy8AAAAQQAAAEAAAEBAAAC0QwAAgD97+rC9AACgQAAAgD8AAPBBnK7AvZJhpT0AAIRD1PUJvcBwFD4AAJRDAACgQDfL0j4AABFDAACAPwAAQECamUBDFS3evQAAAkMAAEBBzcx9QwCAvUMAABBBAACUQgCAGkUAADpFAACAPwrXIz4AAEZEAAAMQgAAakR0tDq9AACgQgAAlkIAAABAUhQhPgAAoEAAAEBAaBPQPgAA9kUAAIBAAAAgQgDAn0W4cco8AACKRQAAQEAAAIdFAIDcRQAAoEAAAIBAAABJQwAAMEElKgo+pUjJvQBgEEZLrPw9KMGRvQ/zKT4IMTE+v609PVjMAL5oE9A+1e7NvQAAokRoE9A+e1SaQwAAXkUAAIZDAACAP1K86z0Yjq4+ZmYtQwAA0kIAAIA/AABmQwAAEEEAAEBAAAAAQABAlUUAgLVFIJEvPiX8uD4AgNBFAADtRQAAoEAAAMBAwgH8uhV/Dz6iIaW9K8k9PVc0vr2Nlmm9eRQ7vZMSOD1LQmu9AKazvdYdBLxbO7u93xmBvTfJu72jeHO9p/DcPeLbjr2fT3c92mhqvctnyz2is929PP0TPl9YRr27Z+W9WrXTvbdUE71a3YS9E9SYu/nVAj3Q2VS9BgzKPL1KFz5b/Q68v9/dvZMEUj0X30e9v9iovXu0C7u9MGC821+hvcPH/j3uJpy9gW+wvShd5r0aLr+91wlovYBttb0UTYm924GvPaXfibw1vLC9lwaqvKV/pDwloJ68GjbgvEwGvb3rdLM9ABlRvBjC2L3HqJO9zaZDPO5Cwr3/nMm8PfmnvT8IgzzgGcY9k0QzPjeOhL3/M4G9mE8Cvt5uL71vdw09hbbrvQUmXTz0cJu9qy/MOrNMUT3sabS8E0OmvRd1nD2OccG9bw79PMXnXr1jsNi9TwIUvU0bt7287xm9TtOHPFflKj0eXoW8sL5yPdvzbL0FN8I9g1+uPKpGXj0gJre9qHCLvXqpUz2jVqe9x2gePQcpmzuuO8m9/ZjRPRditTyaV4a9rVnDvXb8oDxawfe8NSX3Pc82h7ziyc69wJvivJMz5D3ngTy9g5NFvZTBmT2ONYe96z4APIXbxr2oE/e8XTJFvQU9j7y/YYe9kAHrujiaUL0jcte9pzFHPINin70HzZG87CfFPWuN1rxh6JG9wJwJvenwsj0RRR4+iDdnPAD0nL1L9cy8bTECvQXZ6z2o4Qs7SvZNvU/jPL360e08i6nmPIU5bD1/V6W8P0C+PEJRPrtTB609MyTZvR+/cDtbQ1y95QR1PTjjsb3hdYm8C+qDva+GH76YgMO9CB1tPGez/zyiLw8+cJagu2q7PL1f8pu9SGB1PW3l9z2ez4y9EYQJPihanzt45Oy8ECqfPcV+Ar3gdBo+DTHsPW9yqr3nVq68MsgQvrX9Vrskxwg+HHYWPqPoMjyQvaK8DA68PSeAmb2nV+w9+5PJvUbfrTsVXh68mtSOPYLvOD7NpWo9aGauPDc9qz2t0888DP82veNCUz2qAXm9zZSIPU9jh70KfOU7Z7uIPdsmjbzfZcG9GFAEPqmiMD0rJzy8qzSSPVJgD72QP8e9roWPvU/FA73ukbw8L8CnvAv8JD0aTlG976oyva1IQz1h5B+9S1LAvUBl6jxONBe9QB1yu7iY/LxYYH+991qUvBK9iLxfYFc8BR4zPEGJnL347kS9O/uePbdjtTwyiKm9RysIPqWlSryzmeK6i8eBPUNbqj2i72W9AAAERAAAQEMAgMFFAABAQgAA3EIAAEBAMzMFQwAAAEAAAAxEAABAQACAu0QAgFBFAADgQAAAgEAAADBBAADAQQAAQEAAgC9DAADgQAAAWEIAAEBAAACAQAAAkEMAAEBAJfy4PgAAgUQAAEBBAAAMQgAAAEAAAIBAAADPRQAAlEMl/Lg+AADAQPaoKkMAADBBAAAwQc3sI0QAAABAAAAwQgAAEEEAAPxDAAAAQM3M9EIAANhD0z7uPDtPBT4AAGREAACAQAAAwEIAgL5FMzN7QgAAYEIAALBBAACHQwAAgEAAAChCAADAQgAA+EIAAKBAZmZdQyX8uD7NTDFDswvRvb7AzLxRhsq9mpnbQgAAoEAAAABAAACAP2ZmXUMAAKBAAAAMQmbmNEM3y9I+AACAPwBAkkQAAIA/AACAQAAA5EMAAPxDAADSQgAAtEMAAABAAACAQPhTGj0AANhDAADkQzNzlkMAAABBAAACQ6gpyj4AAGpEAAAAQAAA4EAAAIA/AACNRQCAqUUAAIBAl8NsPQAAcEEAAPlEAABYQwAAwEIAABlDAAAAQACAJkUAAKBARzKsPQAAAEAAwNhFAAAwQQCA0EUAAOFCAADgQAAAgD8AAGhDAAAAQQAAIEFl0xM+AAA9QwAAgD8AQOZFAAC0Qh85v70AoKdDAABYQgAAwEEAAIA/AACgQAAAhUIAwFhDAACAPwAAIEIAAABAAABAQAAAgEAAAABBAABAQAAA8EIAAFpDAADwQgAAEEMAAFtEAADwQgAAIEEAAChEAACQQmZmMEQAAJxDAAAgQQAAgD/vfp29AADAQBiOrj43JOC9AADYQwAAvUIAAIxCAAAAQAAAIEEAAJxDAACMQgAAAEAAAOBAAABwQwAAnENmpvtDAAAgQTMz+0IAAAdDAACAPwAAgECoKco+AAAAQACALEUAADBBZmYwRAAAEEEAAFhCAADAQAAA4ECameRCAICLRQAAoEAAAMBAAAC4QtdU2Dz9hfa9AACHRAAAEEEAAJJCAADKQ2/hPzsAAEBBAAAwQQvoAb6Xvn29AACQQjKmYL0NoQS+q8OIPQAAQEAAAMhCAMDMRWfazz1IJqa9AOAjRsPrYj29uS+9J0/tPQAAT0MAwNhFLRiXvQAAgD8AgGVDAAB8Q83MYkNm5odDAAAAQAAARkMAQONFAADPQ0Kc3T0AANJDAAAZQ/O92z0AAJRDAABAQQAAQEAAAIA/AACAP84+LzwAAMBBAADSQljmfbxGNxM+jB+4vQAAwEEAAABAAACAQGgT0D5cj6dCAACAPwAAAEEAAIA/AABAQQAADEIAAJBCAAAoQxiOrj4AAIA/CCXBPAAAyELIHvm8AAAAQGgT0D4AAIdDAAAAQAAAQEEAABBDeR4FPgAAQEHsIoe9Xg7MPDywDz73zM08AIBKRAgJ1L1vrwI+21q9uwAAQEA1Me09o3SKvQAAgD/DDLK8AACgQFkui729lBg9AACAPwAAAEEAAABAAACAPwAAgD8AAEBBAAAAQAAAnEMAAIA/AADWQgAAgD8AAL1CAABYQwAAgEAAAHBCAADAQFerEz5vtBG8ixqivQAAgD8AAIA/AABAQW+fNz3TPqC9AAAAQAAA8EIAAIBA05drPAAAgEAAAAJDAADAQAAA4EAAAMBDAADAQAAAEEEAACJDAADkQwAA8ENLlti9mpnZQwAAAEAAAABAAAC9QjMzBUMAAGFDAAAAQAAAwEAAAKBAAACWQwCAPkUl/Lg+AACAPwAAgD8AAEBAMzOOQwAAZEQAwJNFAAAQQQAAmUIAAIhCAICIRQAAMEEAACBBAKCnQwAA4EAAAABAN8vSPgAAQEAHWZS8MrLovSuXCb6amcBCvfsXPgAAuEGCItW9tdUBPgAAcEIAALFC/xQEPn/517yizUE90IUkPgAAB0UAAABAK4UlvazTID4AAIA/0/IWvACA0EUAAEBAAABAQBtwBz4AAIA/AABAQgAAwEDPH6m9AADgQABA40UAwMlFAIC9QwAAJUMzs79DogLiPQAAyEMAAEBAAADgQAAAIEEAACBBmpk3QwAA4ED2qCpDAAAAQADAxkUAAKBAAIDxRQCA5UMAAABAx5grPD13Iz0qan+9jw8MPgCArEP8VYu9ZmZgQwAAWEJG1K69EwyjvbN4ET6KhPE7AADwQQAAMELqJN89AACZQpqZ20JWPjq9lDCgu/OOrj2mzR29GI6uPm8tMbwAAABAAAAwQgAAgEAAALRCAIAvQwAAwECk6ZG9AACAQAAA4EAAwGREzcx9Q2gT0D5oE9A+N8vSPgAAQEAAAMBAAAAoQyX8uD4AAPBCAAC+QgAAQEBoE9A+AADwQgAAkELf8T69AABAQACAMkNjGeM8AAAgQQAAkEIAAEhDAABqQ6gpyj4AAIA/AABAQQAAAECIbmk9MzOOQwAAgEA7WKM9AAAoROy3Ir3WeBs8HbYmvaMSzr0AAIA/AACAQAAAMEEAAABA2fnFvQ1Dtr0AAIBASxLgPX8r6LyrVxc9h2AFPgAAQELxwpE9AABYQ0Seqb0AAJBDAACIQtIkwD3VjLM852S2PdZ1q70q+r+9AAAAQMWr3L0AAPBDAABsQgAAwEAAAABBAACgQAAAwEAAAFhDAACgQM3Mx0JTY0e9uJuEPQAAwEAAAKBCW//dvVLc/7wAAIBAAABwQwAA6kIAAMBDvBEdPXlIAD4AAIA/AADAQAAA8EMAAORDAACAP3tUmkMAAFtEAABAQQAAtEMAAEBAAACcQwAAgEAAAMxDAACEQwAAFkMAAO1DAAAgQQAAwECBHy89u2QePs1MukMAAOBAAAAgQgAAgD8AAMZDAACAPwAACkQAAEhDAAAiRAAAoEAAALhCAICsQwbaPj4AAIA/M7MaQwAAiEJm5jRDAABsQgCAKUUAALpEAAAQQQAATEUAABlFAAB4QjNzlkMAAEBBAACAPwAA8EMAAIA/cNAiPgAAWEQzA35EAAAoRAAAUkQAAABBAICjRQAAwECtSQm+AABYQgAAikUAAPBBAACAPwAAAEAAAKBAAIChQzOzdUMAgLVFzczHQgAAnEMAAKBAAACgQgAArkIAAFVDAAAYQs3MYkMAAKBAAICsRQAAUkP5Dxg+AADgQAAAgEFIgYBDAACAPwAAC0MAAMBAAACAQMDi+L0AAABASVkYPY9NGD4AAABB5+0UvgAAQEA78Qg+AAAgQRIQtL0AAIA/92sPPoYDzL0AAOBA2iSIvQrQmj0AAOFFAMDYRTt1VTt4Zvg9BdEQvgAAAEEnnyc9hcIGPnJvqr1jAvI9ETimvQAAgD8AAABAs5QtPo8N0r1vw1A9AIDQRQCgCUbI0aQ9X0IHvgDA2EXXhf+9zazhQwDgBUYIl/S9L7mBOwBA+0UAAExDAACgQADgBUZBl666OZUTPntUmkMAAOBASIGAQwCgCUYAAHND19Xtvc1m0j2r8Dw7/RfRvKca0r3z8H29AACAP3c3oLsAAIBAQ1cAPfWsqbwP33m9v8m7vcoGIb3L/Jw8WTAivatJvb3zg9I9YE2tvSW8ZbyoCtO9JimSveN3s72+cL695RKHvM8P673I7KS9O3tQvTekr72yyzS7lYu5vcFHm70EZQ28S0WPvAnNDT69GZQ9uLmivH/Vm70Ixe48+sRevV+5zr3m5bQ7T0OPvXtUk73Y2+M7t5uRPL0okL3H8sm9MgXDvEypiL2XUzO7s+uVvdD5/jy2w4K975MsPXhqY72jOgs9kT0VvRDvgr0je+Y7PDe0vQPKvb0ntBG8exanvUVD5r2A7ou8n5Stvc9NsD2X4SW9r47uvKfUxb0v8r690Uw8vTCOrb0Bezm9wMdcPaU5IL12Tp69rrg+vRpwQ73Qrsi9wEKJvcVW9Twdb6Q96s7rvIvDqr0TOo+8NxytvP/Usr1tcAM8TTd9vTd0h73+s409lJ+OvaOebzx/OIW9Q/vWO7uLU73HFcW9EIilvfe2mbxab7k9JXL8vKMngrzca7e9AADtPWdphb2S8oK8OtY0PltRzDvAJ+m9CaWMPfr1vTss/KA8VBORvY+tTT12hky9E7a5vS9oDL197Rq7QwmKPdsDp70IkMa7SFZ9vYNeMbxkxqA9tWNCvKP0Cry4W2O9p6DfvS8xO701A3q9VmKPPVsRt714cQq9wJnYPFDuU73SNX09dFUsPmi8br2/XI49KKDdveu09LzFvIW8qLO/vSVvVDzLJZG9FyzWvQWtN72oYf+8V15JvapL6zy1sD694PoNPn2StTvDcjk4vBbBPSkjSr2wem48yvhNvFiCez1Y8aG9g0UXvIjsIz3PJtg98N9xPatNj73dnfu8MgC1Para1bwfC8K9QheKvCOSoz3kaxa9TycyPfD4QbtvCAg+mhuHPTJKFL2WMRg8c3aXvbvoTTu8Gpc9ewrJvV+zCj6VKW29t9lnOzr70b2/28M9DEUbvEoci70PQhg+d85+vVprxL2jSyS8R6GBvTAPsDzEhYo9ywcAPNxsA7wKbwU+JUi7vd48PT2fwrU8NaTpPQ+5lb18bBQ8gGkAPg6CPL35Xr89gulYPF9YtT2rwBC9VwOrO0tH7D2nAto7wBHGPWBv7b3y4xs8Z0s2PYpUt73PX3C8GSOZOsmdjr0dDM07wzqZOxmviT1jJxe9Q9pavB/8lrwfIII9bydzvLtsfj2/iQc92s4CPurszL3fbr68323SPEWw+LyLItg8eCU4vVFxiz1CK8G7q1xsvaJZHz2wIfo9N/SxvGZotr03fvM84EtPPR319L1L8U49rvsqPslKlrwOBQI+gty9vR8jGb2vYbw9SUiGPKPpwrx/YC8+q73avGM6SDu5g5S9SdEDPtMhLT5qoFA9YZwrPbvIu72D2dW8mJahvY8JiD1zdtC7kpLEvb3QWj0lHKk9m5JlOuvp371Qynk9K8AMPgcDrjs7pAg+48uSPYfs6T3D1vO7UvsxPeAVyLxfIEy9X6KwPQ3ZnD3wns283eYru/soyj1msrC93folPIBTw7zyat274kpdvRPkAr4CuXK98SrKPfo1Mj37aAc+cUzBvQOqpj0osTM9HIyivUmwt7y72t896pSLPeiNQ7wqN+A9eI13vTUHXjzYIo29vxZUPYcG7D1yZ9Y9kB0VvaVI17xLIci9F+33vNp4WD1SgEI7E2jwPf7Dsr2wLlk9XT2jvWvQwjziJxu80A3gPW/+Br0DHLQ8jlauPfKT/r0R7qk9MOOdvatnRD0by/u9jOaRPQvsHj6gguA8WM2xvaE+ID4TU908x3YlvYdizDx0STA9mBqDvTvonD0DrGe9tbPVvVynjj3Lbgg+BHkdPdou7z2+ARA9t23bPgAAcEEAAABAAAAAQQAAgD8AAABAmpmcQgAAgD8AABBBAIC3QwAAgD+amZxCAACAP63qoL1AvuM8AACAPwAA8EIAAIA/AAAwQQAAgD8AACJDAIC3QwghBD5A0cq85+GyPQYZBz4AAARCaBPQPgAAgD8AAIA+AACAPwAAh0MAAIA/AAAgQQAA8EIAAOBAAAAAPQAAAEAAgGVDAADtQwCANkQAACBBAIChQrOCLzwsF589AAAAQAAA4EBmprtDtbQ0PgAA1kIAAABAAADgQLW0ND4AAHxDAABgQQAAoEDRC709AABAQQAAgEAAAABBAAAdQwAAC0MAAK5Cs5IUvumiiz4AALhCAAD8QpqZUkOaGY9DAICXQwAAAEAAADBCh3AnPc3G+70AABBB+2CXvQAAgD89CdO9GI6uPgAAGEIAAIBAAAAgQaRw1kMAABhCAAAAQAAAz0JqsNu9y6pIvRphgD0AAFtEAAAAQAAAtEOl+9m8AACAPwAAQECoKco+AAC4Q80sFUQAAEBAC+LmvaO3xbwl/Lg+AACAPwAAgEDQPJY8AACgQDfL0j4AABlDzUwxQwAACEMKV6tCZuY0QwCAp0MAAGhCYl0DPgAA8EHZw8C9AAAAQWgT0D4AAEZDy/UQvgAAAEAAABBBAADQQQAAEEHN7CNEGI6uPgAAgD/TDdG9zRK+vcudHD0qwRQ+ixcmPQAAAEAAAPBBAADAQAAAgD8AADBBAAAAQAAAwECamTdDAADAQAAAPUThWsi9t964vCVdTb3poos+AACAPwAAAEEAAIBAAAAAQAAAHUPNLBVEYh/pvVEvNL0AAFBB6aKLPgAAQEDBmyE8AECSRAAA4EAAAKBAAACgQAAAAEAAAIA/AACAPwAAMEH3qc29AAAAQAAAUEEAAEtDAAB4QgAAYEEAADBBAABAQSZys70AAEBBAAAgQb+DGD4AAKBAAACAPwAAB0MAAIBAAABuQzMz+0IAACpDAABMQwAAlkMAABBBAADAQJUwsL3j9r690WkDPls3oTyMCgM+i1MRPgAAwEDaPOm92xIaPthY6juCIxU+AADnQ8u49L0AABlDAABAQAAAoEA3y9I+AACAPwAAgEAAgIZDAAA6Q94oqr0AAOBAAAAHQwzDxr0AAABBAACAPwAAAEFGnag88zSYvVi63L0AAIJC8xfVvQAAIEEAAGBCAAAAQAAAAEAAAIBAAABJQwAAAEAkIRI+qCnKPjfL0j4s+Zs9AABAQAAAMEHx8PA9AACgQCm+v70AAMBAAABAQHOElD0AAIBAcBrqPQAAgD8AAEBAMzMcRAAAQEEAAKBAoQ7qPbsR4z2C1/e9AMCBQwCAoUMAAIBAAACAQAAAQEGPhZ69tLulPYxgBD4AAPBDAAAAQAAA0kIAAIBArm8OvQAAIEEAAIRDAADgQDMzskMAACpDAACgQAAAAEAAAElDAAAiQzMzskMAAABAou/WvQAAjEMAACJDvO60vQAAUEEl75Y8AACAPx6Su70AAFhCAAAAQAAAQEEAAIA/z8MPPAAASEMAAPhDAADmQgAAgEAAAAtDAACgQAAAI0MAgJBDJfy4PgAASEMAAABBAIAvQwAAS0MAAFxDAACwQgCAoUMAAEBAAACAPwAAGEIAAABBAACAPwCA2kMAAD1Ek1dhPQAAgEFoE9A+AAAIQwAAMEEAgJlDJfy4PgAAgD8Urm5DAAAAQQAAMEEAgEpEAABEQgAAFEMAABBBAAAgQQAAwEB9bEK9/jOnvCmNpb2zw1S887l/vZeJwj3h5KW9g3cLvT85db0kz6a80q0hPVDDQL1TN2K8Jo3Mvetg2j1LpNQ70Fxpvf5hAb3fksA8sh9bvcMFeL1Tna+9x+FAPHfJdr1SoOw90gpHvTZpTLya9o29KNVcPRRhE71dRaI8euQfvQUgor1Gjsm9+rXQvRNAM727lxm9V6/SPeK+uL0r2Ru7sJuUvX/iW70dOq+9frpIvOsgnL2WFok8QzXPvShaXL2UoqA92iosvfK9ebw5paM8XQO4vN1Zc72b/ue9y72dvItKlb1rL9g8v9u8PPafjLzoUqk9/FC0PD0eFDwrodU93o+EvQIP1z34Q2m9/ch/PXfVjr3jvQi87/amvS57NL37zdQ9n0C7vC2Avb13xxi9uBB2u9+2Ar1DsL+924W4PLso6707GP28Q5z7vPminj31Fpy9Is+FvHffjzzoLgQ+XEyovXhQNz2v+j29icyiPa133r3qkdy8i36gvFNopb15WKe9LzvxuWmAlz3ro148acQCPbZTJb21jK89+rmoPBV7BDz7ewc+EwOauz/Wx72Kafs9UuCIvSZ5L711LeC9BUvJPfa+sjrPHlu9+EH5PKs02zxDJFa4aFUTvJHyLj7KMj+9OqMevm9WjTw3SSC+e2VTPV1FjL0Ttd8979wUPKtibT3SMAE+P10uO6XjWj149H88Qly5vIAK3L26WSe9vs4oPC8UNT6wx3+9f9MBPGzlAD6Mu7c84ovlPUi4oTydb3k9ntIpPrzGLT7LktK9Y3eKvbcsLT2zMxk6BNEPPl+6h72gQJG8RtkrPfP17j0Oh8G9p8UfPbUIwr0i31S9DcAxvZiQYbxtYjm8CMksPauo7LxJJCK8ND++PfGDy71tAjq8SAWbPUqCWjwr8ta9OH0PPrLl8zuTQ7+7yd2QvXDlXT1yDZK9DngQPHsPqT2FazI+l9SfPQ1Yq7y65ki9SNTgPNP0pb0gJTy8BdZyPNoOlT3vuuc7AACQQwAA8EIAAIA/AACAPwAAgD8AgMFFAAC0QwAAAEAAgL1DAACAPwAAHEIAAIA/MzMFQwCgCUYAAIA/AADAQQAAwEEAAEBCAAAAQADAw0MAANhCOojMvff7tTsAAMNEAACAPwAAAEAAADBBAACAPwAAMEIAQJJFAAAAQAAAAEAAAEBAqCnKPgAAQEBoE9A+AAAAQAAAkEIAAPNDAADAQACA00MAALhCAAAAQAAAQEAAAOJCAACuROfXnD03y9I+AACYQgAAgEAAAEBBAACAP9AL7L0AAIA/kH7JvQAAQEAAAKBAZqYORAAA4EAAAABA+DDbvQAAgD8AAJBCAACAPwAAAEAAAMBAXI+nQgAA4EAAALRDAACUQgAAQEAAADBB7riYPRiOrj4AAIBAAACAQAAAQEAYjq4+MzMcRAAAhEOzK9W9aBPQPgAAcEMAALBBAADhQgAAEEEAAJxFAAAAQe7cCL4AAMBCAADIQgCA3EUAgL1DAAAAQACAoUPzLgU+AMDJRQAAAEAAACBBAnitvQCAFEYAAD1EAADgQAAgBEQAABBBBMCDvfY7qjzXUsG9OtXAvAAAmUIAAAxCAACAQAAAQEAAAIBASF7tPAAAgD8AAOBAAACAPwAARkMAAABBAACuQgAAhUIAAKpCAABAQAAAAEGQZ8K91kwRvTfL0j4AAAJDAACAPwAAkEJm5uhDT4tmPXChvL0AAIBAA/yKvAAAwEAAAIA/AADAQgAAqkMAAChDAABYQyuxFz4AADBBAACAQAAA8EEl/Lg+MzMFQxSubkMAgIdEAACAQAAAjEIAAABBAAAAQAAA4EAAAIBAAADgQNdR/r0AAABAAAAAQBiOrj4AADBBAAAgQQAAAEFIzq69AMDYRQAAAEEAgNZF/ZHiPWZmwkMAAGhDAAAAQQAAQECnFxk+AMDSRQAAWEIAgIhFXoW8vQAAMEF0Pzu9B3RtvAAAjUUAALdEAABPRQAAIEEAAEBATLgYPgAAAEAAQJVFyrfUvQAA4UKCqF88fp6WvQAAgD9mZl1DumnZvQAAuEIfpZS8g1eOvd/Zyj0AABBBGI6uPgAAgEAAAIA/AACgQAAAQEEAAFxDAAAAQGam+0MAABhCLSDYvQAAgD8AAABBeqrUPQAAIEEAgHhDAAAAQAAAwEEAAIA/Goe+vQAAIEIAAMBCAACgQACAoUIYjq4+AACAPwAAgEBNeM+8dRy0vQAg30MAAMZDAACAP5PbdrwAABBDAACAQAAAsUIzM/tCAAAQQQAAEEEAACBBAABAQkoi97xByJM9AACEQwAA8EMAAHBDAABYQwAA4EAAAJBCAACAPwAAWEIAAIBAAAAAQAAAgEAAABBBmpnbQgBAkkQYjq4+AAAAQQAA8EEAAMBAMwK5vNql+b0AAKhEAADAQAAAIEQAAIBAzcx9Q5qZUkMAAGBCAABAQa+6oL0PCMk9mpk3Qyb6Ab5jQuK8B3WFPQAAgD+/zIw9AMDMRdBT4jv2LqU8oDHtPWgT0D4AAIBAAABAQFp6+T3JjTc9FMSzvQBA+0UAAMpDzcxiQ2bmh0MAAOBAAAAAQAAAgD8AgNZFa9ObvQAAkkMAAIA/ZuY0QwAAMEEAAMBAAADYRBE+hj0AAM9DAACAPyX8uD4AAIBAMzMcRAAAgEAAAIA/ZmbCQwAAgEAAgL1DAECVRQBA40XVruU9AACAQL//kDznIpu9AACQQrdMwb0AAMBCti+kvAAArkIAAMBARr2BvHcvyzwAAABAZmaMQ9m7IT2LMSa94aQpvXClBDwAAIBAAACEQwAA8EEAAKBAAAAAQQAAgEAAAJBCWJk5vQAAkEIvX7E9AACAPxqIGz4AAIA/AADAQP8f7b0AAKBAAAAAQQAAQEDwnNG9M3OWQwAAgD8AgC9DZuYTQwAA8EJcj6dCAABAQY5QlD3wxnO9AACxQgAAoEAAAABAr0vsOwAAYEKb8s+9AABAQQAAAEAAAKBAAADgQEiBgEMAADBBAACAPwAAQEBjElY60+C6vQAAAEGwrcq9zcz0QgAAz0IAAHBDAABAQAAAKEMAAEBAAACgQAAAgD8Yjq4+AAAwQpr1gb1uT6A9AAAQQwAAQ0MAABBBMzN7QgAAQEAAAIBAv/+LvT9uCD4AAIBAaU+BvbX7Dj4AAIA/qCnKPgAAQEB3F9q9AAAoQ6ckob0AAABBAkXRvAAAgD/xR6i9DcXQPXguuDwAwAFEAACAP2u1Hz6EzqK9+OVrPQAAQEMAAAtDzC2PPct4xryamTdDAAAAQAAAhEMAABlDAAAAQQAAikQAgKFCAAC0RAAAwEAgN/A9AACBRAAArkQAAIdDAADAQwAAMEEAAHBEAABDQwCAgkMAAABAAABcQwAA9kQAQJVFqCnKPgAAh0MYjq4+Jfy4PhP6Gj0A4CNGKrdhPIrI0D0l/Lg+p2UEPvUT1D0AACBBAABAQADA/0UAgNBFu7LLvfuH7z0AgNZFAACAP5Nl9r0AACBBAACMQwAAoEAAAGpD9qgqQwAAQEAAAOFFcmjdvQDAyUVihf89AACAQABgrkMAAAFFAADkQwCAL0MAAKBAAACgQAAAq0QAAExDe1SaQ4sawb0h+hI8M7O/Q82s4UOaCQlEAAAgRAAAwEAAAKBEAAAAQQAAB0UAAIBAAIAIRQAAW0XNzBFEAACNRAAAgEBoE9A+AAAgRAAAQEAAgLJF5cnWPAAAQEAAAOBAAIDWRQAAAEBoE9A+AADMQwAAAEC8hMs7rJ+HvaL44717CSS9vLeCvToDZjw1BNq9BmOavJLCnL21gsG9LDCVvXuBD70pmcK9YuNyvF+32b1E66K8ZTCSu4D7ZL2gjVw9W5eEvfSdCrubA9Q9q1u5vVOmRby6VpY8hSYlPq9eVb3Iwa29etXJvdPQLT2McaO9HgknvVig271F5jG9sxG9vZX2erygWDe9Z359vNmCE71oqJu98U6fuxEPt70m+JA9IsNuvb71lb39jGm8IAVTvB3zpz3LFJS7DHWxvdhYx71/poG9LPGIvYXJBTwYSq+7CuEKPkt6LbzHqoe9E++avB+kxL0GmbK9FbIpvacNxb0NxRK9G2/cvCaEkb2HxZY94N/7vPf9mjs71bm9+9WAvTpA/DyjiNm9sKp4vDh4mTyDXnK9h5OivLsltz3jeY29vSgZPEw2Kj7kvCi8N5WLvfNpPD2Xxn69YYoiPZtrCr13BdQ8J0x5vVu6Nj2RjTg+KVyRvdZ9hrzeHMy9qvJJvee1/TzO14a7e5lWvVJwAr2xzp29AgmCvIAqrz1T54e94ERgPTocJL3P7se9C1PZPVVvLr3VV5G9sLWoOyafmD1X3ii9tptJPR2z6bzUPiK9QPqZPV9Nu72VE5k8gYA2vW+qBj2RcLq9ExkQvYk+C7x2SoC96FUNPi67wzzvY569OGGCPKV6Fb0TeO490KB0verftz0zAb29wgtXvUE3Hb1CGQc9s5/QvCev173TCE49r05JvGCX4zxwAGG9FejRPOMDuLwrmAi9uDOVvb1XZz1m70E8G8PavCj3hT2S8VM9LxRpvdpu/Dy66pG9eyGwvXpXhTxyX5Y9o14xPUsp6bljxeQ9VB+0PKzdPb1Bfh89LB+8Pd2rRjyVudi8W97YPZO74TyBosQ7K05IPVp2X731mOE8+zLivI8e9j1a+848CnX9PR2h2b2H6TA8g37uPWZfgr2noRC9J+TBvWo4W7w7Loc9NUOwvUdEYzyzCuA9KrhoPXMprz0A5Ry+f9e1vfqdnT3HhOc8uIvQPVQNqr1TZzc7rzQePUJ+WL3/KV68CJ2TPcoU6j3YUO698Pcnvk+Wyjyrvt09e9G9PLvhor1IMs49HVPUPQnNG7zNEO89i/+tPDV9Nb0fshk9vdmfPfWm/Ly6luk9wZsAPXa4HL3p8so9O51/vDstpT2j7vs84yGNvS9mDTyD4Bg+1mcEPOuygb0AIPi8zVLePTENCr2DLyI8parfOXVmaj1zaxS9V2UqPJUnubsfAym9FzohPH3FWLzwxos8JReNva3b272DIqw701jFPZcEzruD9ow9w9p9velNO72SPs07iSQ7vc2qWj2ILsQ60rU3vWpxBz3PTwW9McEHPRmlkr0MnCI9X/8FPuf6jb20qIy7E31xvW92pbzHJ5y7ib3JvZMSNz03ibW82C8PPRSLRr17Jwo9030WPlmFnL2fL988Ex4VPm+/gzynQPe6MswLvcvy3T2A/aQ7wBKaPaoru7tB+ze7CC1lvRoT5T2jwwu8AAAAPwAAtEMAAIA/AADwQgAAgD8AAJBCAACEQwAAgD8AAIA/AKAJRgAAgD8AACBC4ZUBPpqZnELg0X49AACAQPHwcD4AAIA/AACAPgAAXkQAACJDAKAJRgghBD5priy95DgOP9PYrL3U3pq8AACgRAAAT0MAAIA/AABAQjMzskMAAFhDCCEEPgAAAEEAAABAAACAPwAA8EEAgGVDAADtQwCANkQAACBBAAAAQKpn2j0Xive7AACAP8pCbj3pogs+AACAPwAAW0QAABhC6aKLPsc7n70AAABAAAAAQAAA8EIAAEBAAAAcQiX8uD7DQos9AABYQ5oJCUQzA35EAACAQAAAAD0AAMBAMzMFQ5qZUkOaGY9DAEDjRQDAw0UAADBCIxi+PAin8L05jmM9L18EvOmrBT4AAABAAACAPwAAwEFOMZY9AACgQAAAwEAYjq4+AABAQAAAQEC1tDQ+zk6iPfqCtbwAAJxDGI6uPgAAAEBmprtDAAAAQQAAHUMAgL1DAACgQM2O3r0D3IS8PpmvvbU0czzpoos+ZlervTfL0j43y9I+AABAQAAAQEQAAGpEAMC3RZnyD74AAEBATFS7vQC/7rsAAABAN8vSPgAARkMiLge+AAAAQAAAQ0SoKco+GI6uPgAAAEAAIAREAACAP19Du71+twg998+svZiyez0AAMBBAABAQjEMQz4AAKBAMzN7Qs1Mn0MAAEBASIGAQwAA80MAAIA/aBPQPkqQjb0HfU49AACAQAAAwEEAALRDMaqOvAAAgD8AAFJDAACAPwAAREMAAIA/AAAQQ6gpyj4AAMpDJfy4PgAAQEM3y9I+AACAPwAAoEAAAABAAADAQKdc2zxqjIQ92500vAAAoEAAAMxDQmIJPsWvXrsAAChEAABLQwAAKEQAAIBAZmaMQwCAO0UAABhEAEDjRQAACkWhDuo9AAC4Qp1U8T0A4CNGM7MaQ/XY3b2m6w8+Mr0BvQAAQEAl/Lg++Q+6PQAAHEQAwNhFAMD/RWgT0D4AAChEGI6uPgAAgD8l/Lg+7W+fvQCAFEbEhKy94WyJvAAAgEAAAJBCAACAPwAAkEIAAGBCAACgQgAAcEIAAJlCAMBYQ2am+0OCCu69dYk0PAAAkEIAAEBAY7udvfxKAD0AAEBApCHGvQAg30MAAABBAACAP3MFpb2amRk+WAxqvAAAQED2p7e8AACQQwAAgECRw8S9AABsQwAAkEPNzIhDAAAiQwAAWkMAAEBDAACAPwAAgD8AgIdEAABYQwAAnEMAAIRDZqb7QwAAKEMAAABAmcbHvQAAkEIAAAtDAAAAQKRw1kNmZsJDAACQQwAA8EIAAAxEAADKQwAAgEBD/cq9AABMRAAAHUMAwIFDAABAQgAAoEAAAEZEAABYRDfL0j4AABxEzhAbPi8mYbwi62w9AAAAQAAAykMAgC9FAAC0QgAAq0QAAKBAAACAP/zgGj7BUqW9QE6Nu4r/gLud4/A9hzn7PV/Evr1XpAw+iWwkPQBgEEZjgec9hRcSPq88fj1KzeW9AGAQRgAAgEAAAIxDAACAQAAAIEMAAPZFAAALQwCAeEMAAO1FAADwQwAAgEAAAABAAACgQIBh1L0AAEBAZmYwRM3MEUSrKjG9ti8evPB5gr3I6829TlsDvahCe71yeGe9lfe8ve5XgL2iEZI9ql4HPMzWhr3uuZ+9ZzNjvbxSJ734HMk9V3OxvSvvP71dQIa9oBmTPMiikr0jBZS8FDkCPkofmrw1eKy8YEXSPSdem71Ggsa8X7KMvU3l8LxcVyy9ZaWlvXiGJr377Hs8meTGvbUqM71ltde9Q2KtvBNXhrwNbdI9JU1gvX7Cm7xjnKM9p4epvWKCET3yd/K84vlTvBjX5L0/JYe8CxaAvWd5Qj3Nu7u8764JvbAOkjwwtwU+1EpGPJPvsrz5QQw+gpxrvW/eWD3Un4i7/zi2vTl8orx0lLo9yxgJPl/WpTxordm7nGIuPT/uTb1fjsS9cuC0PfgIEbv79ca9LdgxvRakDr04Zyw8ghfTPSS6nDz6GHu9N3dEu5AJWL0k9LK9inZpvW/JCb3HTii9BdxqPNZsuT0QOYe8JhgaPVLr5bzhJpm9F1UXvQzOQL2gHMq9P0qQPJDxjL0305i9RxmBvPFQs70rKgw9J1MSPP/AhLyhph69Q9HqvaKNGLzsTaI96j9PPVO0jbriv8c9v4aQvcfawz1wKqS7UT4QPu56gDwKM3A8lazXvOD2ebqA2vQ85ZUjPKP9Kj1BZJQ9+UCFvXQPGj4il2o95Aw3PajY7Lwod/c8UWPAvJurOb2tG1o9r/LuvCTWkryXi8+8eFhZvH1x9b2Hh9S810RTvZ99lD2udrm8TZDfvccL1z0LTuA8v3mgPTmUJr2gdPU9JylAvAuUxjwvqug9atkavc1jgboYmfW7j6rbvX9ZYD0yYzO9QC44PeLturyj5xa8CvNwPauqqj4AALRDAABAQAAAQEMAAIA/AADAQb+Fk70AAIA/AACAPwCgCUYAAIA/q3iZvQAA8EIAAEBCAACAPwAAgD/RC709AACAPwAAIkMAoAlGsdzTPQAAWEITvfs9AACAQAAAgD8AAEBC8fDwPWamu0OoKco+qFrZvQAAuEEAAJNEAAAAPQAA8EEAgGVDAAAAQACANkTrtua9AIChQgAAgD+IQ9I99qgqQwAAS0MzsxpDtbQ0PgAAwEEAgNNDtLy9vQAAoEIAAEBCAAAAQAAAkEMAAIJCAACAP+eXkT0AADpDAACAQOvPDL4AAK5EAEAbRgAA/EKamVJDmhmPQwDAw0V1Be+9AIAURqBbOjy68ze9X5WKPV8gMz2ee5S9AADwQZqZN0MAAHhCAABcQ6gpyj4AAEBAAACAPyX8uD4AAB1DAAC4Qs3M9EIAAKBACtcjPhHJKj0l/Lg+AACZQgBAkkQAAMpDACCKQwAAnEMAAABBAICHRLN3pTyamRk+AAAqQwAAcEQAgGVDAADAQAAAgEAYD6i9QLqgvEZnt70DkuY9aBPQPgAARkPlygK+zcx9QwCAFEYAAD1EuF6YQ2bmNENVzMK9AACAPwAAwEEAAIA/AACAPwAAcEJmZuZCAABYQwAADERcj6dCAIChQgAAtEMAACpDMzMFQwAAKEOvmNC8zJC/PQAAWEIAgDJDAACgQACANkQAAIJCZuYTQwAAkEIAgAZE6ZdMvAAAQEIAADBCAACcQwAAcEMAALRCAACoQyPBmz1oE9A+ACDfQxSubkNmZsJDAADPQgAA4UIAAKBAAABgQgAAoEDdG2w9eoCavIFBkb0AANhDAACHRAAAoEMAAMBDAMDMRQAA7UUAAIhCAACIQomICD5ctDi8BHQEPgCAvUOyp9i9zn4GPgBALUajAAc+AAAYRAAAgD8AAFhCAIC1RQAA3EIAwMlFAACAPwAAxkMAAIA/AACAPwAAgD8AAABAAAAAQAAAwEEAAIA/AABzQwAAoEAAAMBAAACxQgkDp70AAFJDf1PlPQAAkkM+igE9AABAQgAAuEIAAKBCAACxQhiOrj4AAABAAACAQAAAgD8AAChDAMW4PDLh3L0AAIVCAAAwQgAAAkMAAIBAM3OWQwAArkIAAMBAg0G4vX+sWbwAAGBCqCnKPgAADUMAAChDAAAAQAAAKEMFn5I9AADwQjwut70Fznu8AACcQ3ex8T0AAIA/EN0sPQAAWEMAAABAAACxQgAAvkIAwMNDzSwVRAAAhEO+GQw+AADSQwCABkQAAGpDfVfavWamu0MAAABAAACAP2ZmMESSi8i9AAANQwAAgD90twQ+9wTZvQAAgD8AALFCAAAAQ5qZ20IAAGpEAIAvQwAAwEAAIIpDAICsQ3Vv07wAAPxDAABEQwDA0kUAAMhCAABzQwAAQEIAAHBCAADGRAAArkK9ink82lwTPgAAC0Pbhdg9vK9FvbKC0T1VO/O9BNC0vAfmjb2Vrmg9AADkQwAAlkI3y9I+AACgRAAAeEIAwP9FM7O/QwCAvUOTSkG9e0vtOtNYyL1l2dW8DzFfvTQuHrqPod69Xw1KvRXdrr1w0WW9s3ZYvZmbuL2YVou9K5/Ju/qN8j1Ddvm88SMBveZXhr2bvmu9u92APUscYLzQYHi9Xl+dvWMNBD7QCbC9u5LbvG0zejwwhv25VIElvfvAq73HvQe9eh2LvWfkjz24Tgm99iNCvd+k1D0tzs+9MlNcvZ4vlb04ocO8uyChPBB/Kr0iBeC8/5bJPVOvBL0sP5E8FmmdvbM9FryEqom8hUKovaPlnL1yTxY9AQDDvXtNbr1qjMY9mD1TvaWYPr0iHqq9h1G8vevQojuUhMO8TnuBvfiNer17R028fWy5vSI5jr31fbS8VOUlPUNBjr3nzCO9piKTvaJXBj3rZ2i9bqCDvHpOuzu3YKO9miYYPF4qhLz0cSa9Uv3JvSaLm71HDI09lAaPvGFWl708cL+8z/0TPk8SpL1fe5O8sCrHvbW7A73y3YY9IpR2PIk1tT2tQTu9/3mIPKyFkr0DCa09wIHcPFKoir1ams49bddnvKuuvD1JVaK95RP2vPJh2D2vEhg9pV99vNXFi73j33U9++gWvQeQpb3ZYr88G96QvWtTdDxZIQY9umTyvNHhJ72Klwo8tcpPvWcR5LtUX5o700KzvH9AmL0kywG9QPFlPdMEIb0+8y48Kz5RPYOjW72ERbs7n3YJPsd5iD3+g6A7madHvSo7BD4HdBY9nbTjPEDQfL2dZ7k9kgFpvRvXWDz0oku9zo8PPWOYwj167ym9o6O2PW71u72X2ZG69PBKvaLzQj21XKi9y5GDOiDAWr3fN6S83LWlO+/L3rxpmLi9w91JPbP7aL3e8Is9MlR2vBhMpr3LCeQ7X/bOPXZ4Pz1v2is8AAAAPwAAcEEAAIA/AACAPwAAgD8AAABAAAAEQgAAoEDx8HA+AIC3QwAgikMAAIBAMwN+RAAAoEDQb6c9AACAPwAAIEEAAGBBAACAQAAAgD8AACJDAACAPwAAbkPfPIA9zpgZvcfd9T0BkRQ9O33MvY+llzwAAABAAABbRAAAgD8AADBBAACgQCX8uD6vTqq9AABAQAAASEIAAAA9AAAAQACAZUMAgMBDBeLgvQAAQEAAgLdDAACAPwAAPUQAAABAAABAQAAAgEAAAKBAAACgQAAA8EIAAEBAAABMQoufjb2iTek8AAAAQOmiiz4AACBBAACAQLgLBb4AAABCAAC4QgAA/EIAAM9DmhmPQwAAgD8AADBCAACCQgBAK0QAABBBAIA2RAAAAEAl/Lg+AABAQAAAgEAAAKBAAAAgRKvihL29CaQ9AECSRAAA3EMAAPBDAABzQxiOrj4AAGBBAABAQQAAQEAzc5ZDAAAAQRUS1r0Anmu8AAAQQTKKGj4VOIy8Z8GRvQAAAEAAgGVDAADgQACAl0MAAIA/AACgQAAA8EESebe9yH7tPWgT0D7zifO9AACAPwAAAEEAAENEAABEQgghBD4AAOBA9WXHvTNzkEMAAEBAAACoQQAAwEAAAOBAAAAwQagpyj7scIK7AADhQmgT0D7NzGJDAIAvQwAAwEAAAABA8sTbPQAAoEQAAIBAAAAwQQAAIEEAAChEAADAQACAu0QAAFVDAADgQAAA4UIAgIdEAABqQxiOrj4AADBCAACUQgAAwEBbdIg9AAAMQgAAIEIAAGpDAACUQ7Hc0z3g0ru7N8vSPgAAIEEAAKpC17qjvQAAoEAAAIBAAAAwQQAAFEIAAHBBAICnQwAAEEGTEhE+tjiZPCXP9D2SkKA9AAAgQRw4or0/JNE95w31PQCAwEOQVtm9AAAAQWP7Az5IgYBDAACgQE7krj0AAAtDAAAwQUjX1r0AAABAY4KNvQAAgD8AAEBAAAAsQjMDfkQAAM9DAACAPzMzjkMAAMBAAACYQQAAoUMAYK5DAAB1QyX8uD4+m7O9PUbKvAAAgkJOH7W9yK7WvZqZnEKamdtCx+JoOwAAEEMAAEBAAIChQwAAGEIAAIA/AAAAQAAAgECVRoM9zUyfQwAAIEIKV6tCAACAPwAAgEAAAIBAQjyJPQAAgD8KV6tCAABAQhFezDzlJto9zcz0Qs3MYkMAAABAAACAQAAAMEFmZuZCAACAP85dvD0AAMBAAADgQAAAAEBoE9A+dKqiPWamDkQAACBBAACAQAAAGEIzM45DaBPQPlM9xL0AAMBAaBPQPgAAYEEAIIpDAAAdQ5oJCUSjzrS9GI6uPgAAAEEAAIA/AABYQgAAeEIAAOBAopjHPQAADEQAAABBmpk3QwAAKEQAAKBAAAAEQgAAQEEAABhCAAAAQAAAMEMAAJZDAAAQQQAAXEMAgOVDx6vZvfvwFzvt8sw9AIC9Q6/Xdb2V/vw9GxlbvcBnwj0AAOdDOxOsPAAAPEIAAIBBAABAQGgT0D5AP0m9uz3wPd1BNL29Imo797BHOy7mAz4AAAhCzcwRRAAAzkIDyzW9AAAAQAAAEkMAABBBAICdQwAA+EJmZpVDAACAP2veIz4AQJJEAACAP6gpyj4AAKRDAABAQCX8uD4AIN9DAABAQAAAgD8AAEBB0Bd7vRAN1TzsJaG9BcATveclyr0Kv0m9o4r3vLdojT1gR8+9xPMFvW2POr0yUo49eJw+vRNkuT2/n948aEZWvfcyS70Lzaa8aK8zveU5Bz1b/8a9VTZcvOvQDD2ge3i9jfKxPJKnUr0MPDa9kLPQvSfme72fWZW9ijrBvawEQ7z3vqC9GGD7vOmDLr3wZv08curROr1I9bw6sCq85kcdPdtux72XWQW8a0CePPCF+z26Jlk8216MvUW5s73TkvS8M7lYPbbzL736Dhk9PTVDveuIPb0GUsy7xropPjD9Q7wJLri9kl3HucsAjr0lwRK92vuevdmZiDyEMqO9A/XuvB2gw73b6b+8Y2RjPQBrCb2IZb69s8ffvFC1+LxYQsa9tQpKvDOoyj2HRIu9UoutOlq1nL00vJK8awhSPWsszbyrovU8HPQxvQ2NgT0a2U69cG3oPGBbnr3SFFa952nDvZi3br2rzm88Y3a3PSETAr06RbW9u7xmPDvGjb1ZFbY9p/0VvX6YnT0KSEg9gYuVvWcVnbwbqqk8SMfNPGOlm7xpXpW9EBR7vB3HOb3dd1o7vrpAvZPF6DzZ+Qs+6JFZvOrfgj38bJQ87g+lPY0sLbzCBRM8mn+hPYANrj3rnKm9kpwQvTyyRj0PEfw9R42FPYJRg7sTmdA9jUv/vRCUUr1LSRe9zMu/va5gDj0Vkam8pIgOPCoJ27yMnC6847j2PC5SiLwzN349/iKDvXXKzjwAFf89PXpcPRUB3r3ye5o8bcnjPYJDdL2Z3sU76xVsvQ/bAzy688i9dqgOvBNkmD2aqka94peEvKuQxLyNEXQ9YX/EPV+3p7wZ9kE8EqyGvFRWHT0WeoA7n50IvnNacTxnpRc+MuFyvI9SFDyIM1w9KMfSvAUn/D1SJYa9+HQIPYvJFz7ftDY9pNGVPV8KA70AAAA/AABYQwAAgD8AAIA/AACAPwAAQEJoE9A+AACAPwAAgD4AoAlGAACAPwAAgD8AAJBDAAAoQ8Hqmb0AAMBBAAAoQwAAGEIAAEBAAACAPwAAIkMAABxECCEEPgektj35BhG9AAAAQdWF8j3gBHE683+rPQAAAEAAACBBAADAQAAA2EIAAIBAMQxDPgAAQEAAAEBCAADgQAAAAD0AAABAJfy4PgAAEEEAoAlGsdzTPQAAoEA1WE29AAAAQJqZnELNTDFDN8vSPgAAKkMYjq4+AAAgQWgT0D4AAABAAADAQQAAoEAAAEBAFcnWOtJ+Pb0AAIA/Z0+RvPMMrb0AAE9FAIACReUP7r0AALhCAIChQgAA/EIAAENEAABGQwAAoEAAAOpCAECwRQAg30OV0ty97/yTvH+92T0AAMBCAABYQxfA8T1d6MC9AACgQmgT0D4AADRDMzMcRAAAKEMAAGBCAADwQgAA3EMAACBEAADwQgAA8EIAAABAAAAAQQAAHUMAAOBAAAAAQAAAwEKXPag+6NXSvbhemEPWTQW9AABYQm0g4T0AAExFAAC0QpqZN0MAACBBAAAgQQAAwEAAAPBBPPaxvQAAAEFoE9A+AEAtRv8wjz1mQL69mhmPQ80sFURoE9A+N8vSPgAAIEMAAEBAAAAQQQBgEEZJxJ47RvGMvYXvQz0AAIA/pbcCveG5rD3qP6+9AADwQQAAmUKXsOA9ZuaHQwAAAEEAAIA/AABAQgAAQEAYjq4+AADAQgCAgkMAADBBAAAAQAAAgD8AAGBC4o+DPAAAwEGamUBDAADAQvBBx70AAIA/AABAQRy9hD0AALRCAACAQAAAgD+XPag+N8vSPgAAAED4NZm9AACQQlG5t70AAABAAAAMQvc/wb0AAEBC75qYvQAAgD8AgEpFAACAQABAsEUzM/tCAAAqQwAAPkMAAAdFAOAFRgAAAEEAAABBn73zPQAAQEDoe6y9r1vaPTpBZDsAYBBGW0DrPQAAwEAlDP29ACA+RgAAAEAAACBBAADkQwAAQEAAABZEAACAPwAAbEIAAABAaBPQPgAAQEEAgHFFAAAwQQAAakNmpg5EAACAPwAAMEJYzb49XI+nQgAAAEEAAIA/AAAAQAAAQEAAAKBAAADGQwAA8EIAAMBCAAAQQQAA8EIAALhCAAAAQQAAgD8AgKFCAAAwQQAAgD9mZh5DAACAQADAWEMAAAxEAAAoQwAASEMAgKFCy9vNveIAWz0TRY+9qCnKPgAAgD8AAJZDAIDTQwAA8EIAABBDAIC9QwAAhUIo89Y8AkbGvGrv370AAIA/AABAQ+Db4zzg+mY8YvftPagpyj4Urm5D2mmvvQAAlEMAgOVDZmaVQwAAQEAAAIA/AACAP60Z/TwQ3w09aD12vQAAgD/o0Hm8cEbmPEJtp71X3Pg7WjazPQCALEVm5jRDAAALQ2gT0D4AADBCAMDYRagpyj4AgI5FAAAAQQCAL0MAANJEAABLQwAAgD9cj6dCAIAGRAAASEMAAMBAAADgQJpaBT41y/e8KiIxveRtjD0AAABBk0XsPXftx7wA4CNGhyrTPX+0r734FSE7ZmZdQ7j+tUOrcqg9AAAAQAAAgEAAAChEAACAPwAAAEEAAABBAAAWQwAAAEAAAPxDAAAAQAAAtEMAAEBBJfy4PgAAgD+XPag+AACUQ5c9qD4AAPhCAADzQwAAMEIAAPZFAMDJRQAAMEEAAEBALZ86vXiFczoAAIA/ncm3vTCcqruHUoY9he9YvcZ2nT1aR5W9c5qwPfqOVL2KP3A8bsCBOxANgL0bK6S9AiESOfKdKr0DAay9FAkTvUVpGLzDnBM8D/rLvMBSYzxcJ6G90NT0PMfA/T2gBiW9qXKpvee98LvjkI+9tf7tPDM5AL1AlJ+8GpjevTvAPT3THji9U4N8vYNDkryjh4+9MvlCvGej1b0zrKo8AjWcvaajIj3SW8i9CouXuhvvjb0Xk+66fSqwPWox7zrnu729NlAFvbfUjb1WO7W80zervUvgWb2NypS8k2eWvYwGlL1UzSu9H50IveaBST1HnvC8YOqLvUMTpr2DN/G8vwLtPSXU/rw4kZe9+tXzPJo+l70dba68lbijvWNsjryXMQw9Q+DlvIgMo7zP9+Y8FUxgvVv8t70NslS962zwPGHHqbwvRxU+EHUBPah+pr06+K+9q1bdvBLFs72Xqj291d2NPF/nEbzc9xA+2ZTAO/9BibxDBBm+surZvYYmKzsgNNA8dUuBvaPM7j2h9cq84/QvPVc07j0VwU09vc4MPEo87jtOCq+8AqTVvY4HE70KY9M8SBsrPrL1Sr3ci447rI+dvEJ4Ej6CFHm9n6YGPJf1Dz2PpQ+9z3zLuaqk7r2q0eq8BfjbPOLDwb2LaNW88y/MPQXF2Lwq0uc86/DJPfKYaj0FFvM9K/jsux8W1r1ANOe8ql1rvWN8zbwn4Mo9/xl0PFGqCD5z9nY8fO+BvYvT8rwSOAq8urnXO2ghtT3LNAC9HY1EPVD2zD0bBMW8DFOPvSlpBr1aWVq9FfrIvXbHxT26XZ68On2DvaFugjzomya8AZbMPeTFJ7yZ74q9Z8F9vJIjgL15Yoa9t6HnPDgEGb1W5o47B/gDPvDiEj0dL62899gJvO/nfT31nHK7K2HzvHlZmT1HTDQ9aMJNPCdYg73XLQM8FV/gPBfyAD5QiJO9XW0DvQAAHEQAAEBDAICpRQAAgD8AANxCAACAP83MYkMAAEBCAAAYQgAAgD8AgLtEAADgQAAAQEEAAABAAABqQwAAAEAAAKBEAAAMQgAAgEAAAJxDAABAQAAAgECbAsA9AABAQAAAsEEAAK5EU4CdPQDgI0YAAOFFAACAQAAAnEMAAMBBAABAQAAAIEEAAABBAAAwQWgT0D4AAMBBAADAQQAAkEM3y9I+AAAAQTOQy70AALRDAAAQRAAApUUAAFhDAABgQQAAMEEAACBBN8vSPgAAAEE3y9I+AABcQwAAwEAAAABAAADPRQAAQUMAAO1FAACUQ5qZ20IAAKBAAACgQAAAoECamTdDNR65PUiC67wAABBBAADgQAAAEEFmRAI9N3PHvQAA4EAAgKFCTcvevQAAwEAl/Lg+AACgQAAAGEIAAIBAAAC+QgAA8EIAAMhDAADYQwAAoEAAgKNFAACgQAAAUEIAAKBAAADAQIPFDz4AAF5FAAAZQwAAgD8AAMBAAABDRQAAgEAAAHhCAAAQQQAAQEICqtA9AABYQwDA0kUAAABDAAAoQwAA4UUymvG9AADAQACgCUYAAMBAAMDJRQAAIEEAAPBDY7atvTrUlrwAALRCAACgQAAA8EEAAHhCAACAQAAAgD/NzBFEzcx9QwAA8EIAAEhDAAAAQAAAwEAzD8+9b+2/vOnLj72IiyE9AAC9QgAAAEAAAGBCpAS0vQAAQEAAAFhCAAAgQQAAsUIAAMxDAAAWROdIx70AAAREAACAP4tZnb0AAHBDAAC0QwAAAEEAAEBBAACAPwAAFkQAAFxDMwN+RFwPCUMzMwVDAACAQAAAAEA3y9I+AADzQwAA+UQAAJJCAADSQmamu0MAAKBAAABgQhco+b0AAJRCAADSQgAAXkUAAExEAACERBOP3TubqOA9AIC7RAAAW0VKMXS9cMeWOwAAgEAAAD1DAEDmRQAAAEHEJoW9oPilO2gT0D4AAKBAw5MOPjfL0j4AAIBAN8vSPgAAgECDEhg+tyaKPaySML0AAMBAa5TrvcNmDT7f4rG9AIDcRQAAyEHziSK9O+P9vQAAEEEAQLBFAAAgQwCAAkYAAIBAAACAPxIA172HH4u8AABAQAAAkEIAAABAAADWQgAASUMAADBBAAAgQQAA8EEAIIpDaBPQPgAAkEIAAJBCJfy4PgAAAEEAAIBAAABAQAAAoEAAAIA/AADAQe87hT0AACBCAABAQgAA8EIAAJlCDuyUvQAAgD8AAABAAABAQhiOrj6oKco+XI+nQgAAMEEAAEBBAAC4QhiOrj4AAIA/AAAERAAAAEEAAIBAAAAKRDOKF7yhO4E9EKLUvEMyw72fXH69+oO/PAAAwEAAAJxDAACAQACAL0MAAABAAAAQRAAA4EAAAIA/AAA+QwDAw0MAABhEAACAQBsF3L3NzIhDAACAPwAAgD8AgFBFAIDlQ+QoJr0AACBDzczHQv4XIz5oE9A+AECnRTMzBUMzMwVDAACAQAAAKkMAgKBFq0Jlvaelw73tH7s8AABcQwAAFkMAAAxCAAA9RKuYi70AgKFC7A3MvYcqHz4zM45DAACHQwAANERmcKq9t7y7vQAAAEGIW/G9gVi6vAAAakMAAOBAAAAAQX2inL0AAEBAAKAJRusyGz6Xl028AACAPwAAyEIAgMFFAIDWRfwckT03y9I+wxoqvWc3iT0AAABBAADSQgAAX0MAAFhDHGamPQAAeEJHpY49XfBhvAAAAEAAgPFFAOAFRgCA0EUl/Lg+AGCuQwCA5UMAoKdDAAAQQQAAAEAAABBBAACgRAAAhUIAAABAdPiFvdv7+D0AAIA/ktWhPbdBu70AALRCAADAQQAAQEAAAMRCBXSzvQAA4EBmZl1DAACAQAAAwEEAABBBAABwQwAAAEC6Gdk9AAAgQgAA80MAABBDaV2SvQAAwEAAAPBCZqb7QwAAoEAAAAxCAABAQAAAKENmZi1DAABGQwAAoEAAADBBAIB4QwAAwEAAAIBAAADAQZJ8uL2AQF27hTGWvSlPSLwAAKBAAACgQAAAoEDDCsm9AAAAQAAAgD8AAAdDz1cNvbMZJz2oKco+AACxQgAAMEIAANJCAAAAQQAAQEAAAOBAMzN7QgAAwECamcBCAAAAQEHtyj0AAABAv5TUPFMzMz4AANZCAAAAQAAAwEIAAABAAACZQgAAQEEAAEBBAACAQAAAMEIAAJlCAADYQ6qb/z0AALFCAAAAQOY5HT6v5qy9AAC0QwAA2EMzM/tCAADwQ3tUmkMYjq4+AACcQ2amu0MAABZEAABAQAAA8EMAAEBAGTQUvQAAgECamUBDAICdQwAAwEAAAIA/AACgQAAAAEGq//M9mpk3QwAAMEHwSH89kEOWvAAAgEAAABZEAIChQgAAcEMAALRDAIA2RJudu7tIoaJDpTTaPQAAlEMAAIVCAIChQxBB0j1oE9A+AABwQpFnrb0AAOFCAMCZRYOk+b3KVxa9AAAAQIIc2j1mZoxDk7O6vAAAWkOaGY9DAAAAQQAAMEEAAHxFAADnRAAAH0UAgBRF45myPTmQlbzwQgG+f0BXvAAAYUXiP/S9UgySPRuZJzwYjq4+SsJ5vfdpxzzPutu8AAANQ0o50r0AwMlFQrDOPVs4ZzwAAHhCAADAQB5ciL0CT3I8aBPQPgCAwUU3y9I+mpnkQiX8uD4AADBCAAAgQQDAyUUNE+87AABAQACl5z0AAJBBAAD4QgAAoEAAABlDAABPQ3X5270AoAlG1bPGvc3MiEMAgHhDAIB4QwAAgEBoE9A+AAAgQQAAAEBoZCa+AABAQAAAQEAAAIA/AACAQJ9HCb5tqyM85a71PQCArEMAAMBAAIDxRc3n9T3f2io8AACAPwBA+0UAAIBAwna2PVXJLb2zWx89Fw36u+Xlsb2IKcy87aeSvU7VoLpB1Ki9407bPKzOCz5Z24Y8kNyPvachGb3fxoM9sAxpvSWXKL2b0u48eUE7vQ352L3bIxy980iPPcqcbb2cuoa9Jdxeu49xv72znyW8BmXBvCILuL03oAC9+MVUvboHVbzV6bi99q+WPTVMmLzB0BM9Zf6WvdPbLr1rLQq7ssbgvRs4Aj08FCK9uEnxO48WCb0xucq9u/5aPYu2Mr3DX2e98Q6BO9ttxb1KjLK83X4lPWvJIz5BII29YMrwOxOGab1FutG8ih+jPT2D9rx1r1S9pPEUPN9GxLwH0rS9ByPqPCeDjL1QksG9YwQEvSNa0T0L3xu92MeuvYe2i7xqltc8/76JvWdFDr3Kjvo9PzNavOckd711gIa9DaKzPZNrT70D2sS9v1CwPBNcFj5wpzi9hDLCPeq7Nb2My5w9MK5nvT3x1b2wJyG80amjvZgGjj2mexW8bcFzPVPm7D1/cpW9VY+iPW80z7yczaa9NiYivX0JyL2iVHi96PKsPCqEgr3gW/E8I4W1vQu8C71oiF298KavOof5r70Vdcq8/vK5vOIE0zyjiJ+9SwcmPEsUVTz9xvg9/OMTvXcaWDynaHg82kqfvWeVQT2YF+i8UPEovaoJjT1KaFQ9kPTlvKeT1T1w0Xa96mijvE87gL37/a88VyHnvEXwLbzDG7y9ux84PY4aQb29XsW9ZNcBPQEiIz1ovcw9l40eve9zLjzhSQ4+P0fMu0OvYzxo4+G8uzYVvZRGRzu/VA4+OOduPO/tIL1vkC47x+gWPom6uDw4osm8E5xmvYajFz1C22q8JF0xPJMIBz3zyUk97AOIvYApGz0mjCY7Gm2qPMWl3D03+I29rwwEPTUJ070XdQc9R95wvRA+YjydYsA8zklHutdliDo3Vfc81OKqPIVVCr2YMlc98wfZPYh5Jj6kpxY9Qy0CvpPnLj0TQ0e9x98OvuQswL0oSgo9tfpkvcqgdj20e4e9b/oJPRM0yj2tQE+8UGbrPYRSDj1/JcQ9UCODvZjF+z0jda49+xkYvLfP8b0Ofpw8x6LiN69RqLyI6ig9ZwMKPGK8FL1D78Y7TxKhvUaeMD07Tys+bbUlvFHzJr2qOIC8M00xPfxqBz6xAjk9hvMjPT38ELxkSIK9csxePCv+jz39PDi9+tPQvcMqgbxTwNY9Yr3nOxHJw713W8+8mF2Hvdc+mT37Ps87H8a5vZ5VrzzHX469j7mxPXv4ijxmLcG9EPyyPbigkD3d/Ei9QT5MvVMECb7VMgu9J5KXPYxbxz1fJJo8rg6PvS2Rzj2wHda8M2HKPZzXgj1IXtG9ly14O+fs5z2d3Jg9I31PvT1xXT3h80S9gFEaPTo58z3yfpk9uoKFvUDI5z2zEEy88AEyPFMViz1qSDk8D9jbvRPoub05TbU9bUiSvAs6HT2Gs4s9dcbvO0UygjzXvuY9heeJvY2npz23vQC+aIePPdfLr70la3k8G1nTPAgaAL5elgE9Q6OrvaOUDb2Aovk99UWPvXjttTyrqqo+AAC0QwAAAEAAAPBCAACAPwAAQEIAAOBAAACAPwAAgD8AgAJGAACAPzOzGkMAAJBDcCegvRrmRD0AAABA8fBwPgAAgD8voT0+AABAQDMzBUMAAABACCEEPgAAIEF+cqk9AACAQG2F7D0AAMBBAAAgQQAAgD8zVBU9AAAAQQAA6kIAANBBAACgQAAA4EAAYK5DAAAAQAAA4EAAAIxDJRPpvQAAMEEAAABAwVmZvSXROzwAALA+AAAAQAAAgEAAAEBCAACAPzEMQz0AAABAAACAQAAAAEAAAEZDAABwQwAARkO3C8290Qu9PTr65LwAAABAAACAQACAAkUAAIBAAAD5RACAoUIAAIA/AACcQwAAIkMAAEBAMzOOQ32A373LVyi9igIHvccelD08m7k8O/u+vQAAgD/NbuQ9iEKqvd8GZrwAgC9DAIAvQwAAgEAAABBBAACAPycDjj0AAIBAAACAQAAAQEEFAei7AGCuQwAAKEMAAChDAABIQwAA8EEAAMBAAAA9QwAAQEFEfIm93EeYPQeC9ryCqM09AACcRc0sFUQAALBBAAAgQQAAvUQAAEBEuP61QwCALEUAAABBvGWkvQAAAEEAgL1DAMBYQ5qZ2UMAgBRGzcx9Q5qZwEIAYBBGAIDWRQBAp0UAAIA/bdu2PQAAwECH66i9AAAgQgAAT0MAAEBCAABAQAAAgD8AAIA/AACAPwAAgD8AAEBCAAD4QzNzlkMAAEBCoQ7qPQAAAEAAAGxCpHDWQwAAuEIAAFhDAACAPwAAYELnct09AGCuQwAAQEAAAJBCAABAQAAAEEEAAKBAAABYQwAAQEMAALRDAABbRQAAiEIAALRCAAAAQAAA7UQAAHBCAAAHRQAAxkIAAOFCAACgQAAAgEAAABBBAAAQQWamu0MAAIA/AABGRRKQn71LYd49gqgkPSMS5j1Pk8m9Sz/FPQCgCUZftP49MzOyQ/tcbT0AABFDrxTvPZqZUkMAAABBAAC0QgAAC0MAAOBAAAAwQgAALkXG9bq9AABAQAAAEEHNDnW9txmHPQAAAEA2A569AAAYQk91yb2b/uA8AADAQgAA8EEAAIBAAAAAQAAAAEEAABBDAACAQKRtEj4AAJBCEMetPUn4hr0AAIA/AACqQgAAqkIAAKBAAABAQkhBxz3NzIhDAABAQmySwr0AALFCcQe4vQrXIz4AAMBBhRqevQAAMEIAAEBAAABwQwAAGEQAAJBCM7MaQwAAz0IAAEBAmpnbQgCAL0MAAEBCAADwQgAAQEDNTLpDAAAAQAAAQEDx8cq9AADAQlyPp0IAAOFCAACcQ5qZ20IAAPBCAABwQ5qZQEMAAIBAAAAQQwAAlEMAAABAAACAPwAAlkMAgIdEAABsQgAAAEAAAMBAAAC4QgAAwEAAAAdFAAAwQQAAEEFbRPO9AAAgQQAAEEEAAK5CAADhRZqZUkMAAIA/AAAAQQAAkEUAgMFFmplSQwAAoEBmZi1DAACKRDEoBD7lzOm86jzkvQAA0kQAAPhDAADAQAAAOkUAgIdEAAA9QwAAB0M3Tsi9Dy6+vAAAgD8AAIA/AABIQwCgCUYA4AVGAACAPwAAZEQAAEBAAAClRAAAIEMAgIhFAIA+RQAAgD9vXam9AACAQAAAAEEAAABAAABAQACAAkYAADBBO/F0vbA5gTyEBIG9MVBGPb1VXb2CHdu736GfvMvYVr2op5A8dykMvdWZaj2r+5S8EXsSvc8nCjuXUty98kOBvA0JIb1Onqi9SaGYvecdij1Is4S9TWE6vdCOhr2KtOE9MvlwvWpOvr0IlXy94x/KO7/lKT371yq9J7pRvQTerj3Oeby9s9havXg+R71TYZG9I+lZPfMvq71j57I9lbxxvQtXzLxPaqc9RxplvY13h7xxTiE+5ZbqvEs/hL3Lml095yO9vIeURz64Wzu9hePYPDvG2ju0MBa9ewt2Oj+9Nj0b0Ye9CwCCPALj1r1vlhO9YlFevIcXaz1a8Z+90iEFvUUePzwqylG9Ep6cPRoX3jthvJu8LoeVvU7PSL3PwYg9LuYjvRvMob3OKqk8B/6OvVnzqb3N35G8QkZ5PQWg+bzXzXi9y2tTPZu4Tz3zDBm9mF/6vC9tGz2Y/D8+tCHCvPN1T72+zQo9xQTkvB9Li71L/0G9pLenvPNOmz1c3pG9YugDPltNmLx2RDo8gOv+vGO9mb26CRQ+Ee8jPaUhlb3TQcg8SZjLPYl4qbxgMTU9vLQDPvcf1Tz1w9A7vewbPp9R4zkXktW9la3XOko7rLxtkik8E1GXvS7ymb0D1xM+DrKSvGBUDD69jny9Px4vuu0v0Dx5Qr89IxdAPRW8Ar5P2aQ9axaCvTcTYj3HTqE7V82WvWi/Xj1WqIE8b1WeveeOBD4jnBG9R2iMvUJjmDyYOvg6OA5UPYPNMrvjdc09lGAXPVfisLsIvmg9nmklvQCz1D19OJy6SyW2PAOBLL27RTs9H3bTPXamP7obKcY9w9cuO8VCr71HA789k2YrPA1w0b1BnJk7sAubvWTqrj0pKgy93UDmvZ9+WjzL0bo9u/E4vYcLFT2hx7688sCCPAKr9D2Do6C9ZoyfvUfaljyFohA9X7oZvNAP/bxUjsE6e7e/u8dMBL1mrou9QMxavFu0Oj11PIe8PToUPh/+Wb0L6LQ9WyLeOyJ0+7vpE6i8QWCjPBNfJb0TS0G9uzByPAAAAD8AAHBDAABAQwAAgD8AAIA/AACAQPDv6D0AAEBCAADqQgCAAkYAAABA/RzdvQAAKEMAAABAAAAAQAAA4EAAAChDAAAAQDMzBUMAoAlGSjLjvXVdzj2ZIaE8AADAQQAAQEAAAIBAAAAQQQAAQEMAAABBAACAPwAAQEHNTJ9DAACAPwAA8EEAABBBAMDDRQCANkQAAABAAABAQAAAoED2qCpDAABAQDNzlkMzMxxEAACAQAAAwEIAANhCAAAoQwAAQEJm5hNDAAACQwAAMEEAAIBAAICORQAAukQAAHxFXV7zvQAA4EAAAABAAIBlQ5qZUkMAAIA/AAAQQQAg30MIbn49AAAAQDOVuL0AAABAAABAQmZmHkMAAHhCAACFQgAAXEMAAEBDAAAoQwAAoEAAAPBCAAC4QgAAgEAAAKBAAADhQgAAgD9rWrS9AABAQEcZoT0AAL1CTde2vQAAAEAAADBBAAANQwAAwEEY2o68S2e1vQAAlEMrUci9AIB4Q9EbwLwAAKBAAABGQwAA3EMAgKFDAAAwQQAAMEFzKU09Rnm5vQCAoUIAAIA/AAAiQwAAnEMAgBRGAIC9QwAAB0MIIQQ+AABAQAAAQEAAAElDUxe2vJqZnEIAAAxCAACZQgAAlEJxBre9AAAAQAAA8EEAAABAAADAQQAA0kIzM3tCAACAPwAAT0MAAEBAAACQQgAAAEAAAIBAmplAQzMze0IAAIxCAAAMRAAA+EMAALFCAABoQwAAoEAAAMBAAAAAQAAAtEJNXjC9ZmYtQwAAIEIAgKFCAABYQ9B+zjwAAIA/AABAQAAAAEArfry9AABsQgAAQEAAAABAAACAQAAAEEEAgNNDAABYQwCAnUP7Atk9pd3fPABAgEUAAABBAACgQM3MiEMAAMZDAAAwQRTqHz4AALRDAABMQ82s4UMAAKhBAECwRayJzD3ULaW9p9XcPQCAvUMAAAtDAKAJRpGzAj4AAEBAAAARQzty1T0AoAlGzazhQwAAIEEAAIBAAAAgQQAAwEAAAABAAADgQAAAMEEAAMBAAAALQ7szwr2vHLu9mpnkQtP/LT0AALRC3dCfvc/lBrydy8k9jFczvXhM8TwAAIA/AAAAQJqZnEJHIeg9AADAQQAAAEEAAABAps3DvYjX8T0AAIA/AADAQQAAsUIAAABAmpk3QwAAEEEAAIA/zSwVRAAAmUIAACBCAADAQgAAz0IAAAxCAABYQgAAAEEAAKBAAABAQgAAQ0MAACBCAADPQvoUgr1y83k88l8SPi3eWDwAAPBCAABAQAAAWkMAAIA/6iTyPQAAwEIAAEBDgkO4vWamu0MAAMhCAADwQgAAQEHzwwY+AAAwQQAAAEAAAFhCR4G8vQpXq0IAAIBAsf/JvQAAwEHsxzW9JmCRvEI8i70AAEBCAACAPwAAQEIAACBBAADWQgAAQEEAAMBAAACAP4Y6BL0AAMBAAACgQAAAQEAAAEBBAADzQwAASEOamVJDAABYQwAA4EBmZmBDAAAAQAAAwEAzM/tCAECVRQAAQEEAgIJDAACgQAAA/EMAAMhDAAAQQWfcAT4AACBBAADbRAAAS0MAAFxDAABAQQAAHEQAALRCAACQQgAAuEKameRCcwhKvbWOuz0AAIA/5VwCPpBAXD3LWtC9AACAP4OCAD4AAIA/AACAPwAAAEAAgBRGAAAAQADgBUYAQLBFAABkRAAAfEMzsxpDMLHcvQAAAEAAAIBAAH8ZvQAAhkNm5qRDAMDqRQAAbEPNLBVEmhmPQwAAIEEAADBBAAAAQHjwGj07Ix89+UGFvftOubyHPY+9d4eovR/a27wVP429Ob+sPU8FqL0Nj169haTHPGUvU70GDEK9WtyzPNJnAj5KzTk9pKkFvWBcl70gg2897uCQvJ+5rb3Ctma9CpCBvTB3mD1vZgg80K5wvStL1D249mO9EnXoPIgnJ71NJNG9dDupvBifZb3gNUE9RY6JvEjubL13qZg9I3PeO+hBcL2v97Q75T8mPDPegr3/2Wy9C27Yvdo6AD4y2nq8L8IGPKgxjL2ujjg9rWxrPpjCLr3YpEM9Mzg8vV4Owr0DWak9UO5avWQVAb2MJ4g8B1wVvZFwLz6uUqO8nybJvW+Mkj3DbzO8y6zOPZJjyDtfNki9N3a4Pb/njb1QEEC8d2uGvX+CnTyqk2g8WJGCvX7yvr1muAC8UOBevc9hpz0hDgI99leAvau2OL2sFKK9cuN3PYtnP723AYq9l549uyeHvT1/qbY80oqEvS0caD3sAbO9oyIyPPD7z7zcBg0+GiPuvE3kor2sVom9wWIpvHl+IT34OPW8axCQvfs1QT1lBdC8RnaqvU+IKz6XIKw8awWfvXUXxjyIL8m9CCuwvABhg72rl5W7o9EQu8CfWr0NfPk7tTdovbvgtb0d+d28z/RWO2M4Cj6WVaM7m6RIvc0lHL0/CRo8qVjFvcpA+z1VMQG+mxzIvB0DcT0kZ7q8qOzLvYIHJz1IDdu9CuMxPc1m67z2qwc+zUlRPTcGGL4FaRG9F8u8vV+Y4D3lGY29d9ZEPfFVyr36Vdu9kx7zPVEiGD62hoE9p1iCPMGyIT7UVki9Vm8LPD1lDb3oXnc77H82PSus5L19QAO9HZ6OPG/K1z1fprk8KFTVPQC8ObxFGHs9p1PhPXV37Lxk4hm8zUt8vfg5CD0e+pw9vavYPG9Ppb0jg5G8ND8bveLx+71/MXE9BpjGvUKI/z31NeO8t1Dyvcs09bxgxtS8E36bvRu8Jb0iDEs8Dt6/vJNpVrzLpYs8F58UvIPn+jxiyMK9O0bbu7XV2j19gDs9vNelu48W8j1KC9w804wgOhqrbL3z21m8u69jPRvT0L3lVj478yYVvZ8l2j0C0bk9FSGGOk9Gxr2siDa68vy+vGeHor3poos+AAD8QwAAwEEAAIA/AACAP285kL0AAEBAAABYQwghBD4AoAlGAACAPwAAgD8AAMxDAACAPwAAgD8AACxCAACAQAAAgD8AACJDAADGQ7Hc0z0zA35EAACAQEEGor37gag9ZqYORDMz+0IAANxDMzP7QgAA8EKfcJo8Jfy4PgAAnEMAAIBAAAAAPQAAAEAl/Lg+AGAQRgAAQEAAACBBAAAAQ5205D3objc9AAAwQmgT0D4AAMBBlz2oPgAAvUIAAABAAAAAQAAAW0QAAEBAAACgQLdt2z2A29G9AADAQgAAIEIAAMBAxpeGPZc9qD4AAPNDl+XzvQAA/EQAALhCAAD8QgAAPUQAAEZDAABAQPd9or3NrOFDAACgQPhz2r1LPjA8JGCUvQAAgD/fZsO8e/YtPJAwyT1zts08AAAAQAAAIEFmZjBEqCnKPiX8uD4AAABAAIDlQwAAwEEUrm5DAIDTQ80sFUQAAMBDAACEQwAAgD8AAIA/AICdQwAAGELuOBg8Yn5sPUOHDr01oqY8F1fsPQAAIEEoryE+AACIQgAAiEIAABBBAADgQAAAwEBrUI69AAAAQasZnr0AAABBaBPQPgBALUa60DM9o3SxvZoZj0MAAExFAAAwQQAA80QAAP9DAAAgRAAAqERjD7Q9F+yYOxiOrj4AAIA/AABAQGgT0D5TQsw9MeemPAAAIEEAAOBAAACgQAAAMEEAAM9CGI6uPjMzBUOXPag+AABAQAAAQEMAAPBDAACcQzNzkEOkcNZDAAAAQAAAnEMAAMBAF/3kPQAAcEOamcBCN8vSPgAAgEAAABFDAABAQAAAtEMAAPBDAADAQQAAYELR0wi9vRU2Pd2/Qbx72Kq9AACgQAAAgEAl/Lg+AIChQjMzskMAgOVDAACgQAAAoEDrpCy8AAAAQYyRjb3Cmr49ExN3OwBgEEZi8dI9M7MaQ+XJ4r0AgKxDAAAAQKgpyj4AgEdFAMCTRQAAlkMAADREAAC0RKtNFT4AAHZEAABbRQAAwEAAAABASa+svNdf3L2XPag+s8W3vQAAgD8AAAdDGI6uPgCAeEOamTdDAADqQgCAu0QAAMBCAMBkRADAZEQAgKFCAAAAQAAAwEAAAEBCAABAQmgT0D4AAOpC++C7vQAAwECoKco+XaVLvJoJCUQAACBBAACAPwAAQEEYjq4+AACcQwAAQEAzM45DAACwQwAAwEMl/Lg+V/Hrvagpyj4AAP9DAABAQCX8uD43y9I+AABwRAAAkEMAAIA/syO+vQAA8EMAAOpClz2oPgAAYEIAAOpCFEMVPTUV270AAHBDAADwQwAA8EMAAA1DAABoQwAAqkMAAABBAAAAQAAAYEHT5tK9AABsQgAAxkQAAFtFFK5uQwAAtEIAAChFAABeRQAAikUKV6tCAMCBRQAg30MAAEBBAACZRKgpyj43y9I+AABPRaxbmr3bisI8tJ4HPgAAAEHFX989AAARQ3g12T1zW5M8bk0MvR9oHrxmZl1DD3Wyvd337DwAAOFCqtmwvTfL0j4AAB1DmhmPQwAAEEEAABBEaBPQPgAAh0QAAEBAAABGRAAAE0UAALREAACQRQCAKUUAgBRFAAAgQQAAEEG/ZJW9Brmqu7qkwT1xkqW9FDM4vUvehLxDdt+6+auvvJzvj71SNiS8YVsivXAFmblEZZ69zbA8vTrB5rw7eJM9Pyc7PLZqvD3i0rw99fuxO534Kr1fn1s9MrLHvR2k4LwHzsC8P86DvQF6I721YEI8gwPHvcb6O71Raqi8nyScvR+3jryawOU9Y+6AvVUTBz0PIrq8H+21PacYkr29Kya8eiL4PRdW4jzIR+O8w/ytvY32sj2sPQS9wkVZvZwMtbzxB5K9D94xvGcHE7t0+SW9h9iuvfExnz23JXy9pkiaPIuX2b3r6ti7iuX5uoPyvrzoHr28dooLPXBRd733lxu7WOyWPbHzn73PotO8fdlsPeeXub16DKe8JIgGPXNbjb0XNdw96HzPPB0cVL0LxLM75X12vVf8ZzySHKg87P09vclxrr06xmI9KDXSugiDZ70E+4G9kZGfPZNhiL1/UIm8PV+HvcudlzsHWjG988hbPaj/pr2fBb67x382PQBm8bzDndE6vmpEPQWMZb0jr6+8IgbbvLPS5b1dUWk75S+CvXKtmb0/bTW8GmBkPBcwlL1Y7Ms87+PJPVgIArz4UGA9PMYcvYX/yb29dIW9DNoqu9VG2DxJ5Yi9pUmEvbRCnLuX64M9r17Nvdh8RL2wM1U8rGvFPK36Sb3tg2S9f20jPcR9xz3vB8E8EMm6vTbiBD16gXI8BdTJPWsWBT7wJks93cnSPGAvhj1mybM9Nq83vc3INz1slwa9NV83PThg4T10dxw8afU+vEY1sT2YpK68L5YmPCmQjL3A9pK8vEBCvQMVGrvkpQ69c2BhvHhlnL0wgQ+8UVScPL05mTsxpCc+Tw6YvY14gDsnAoG95/DJPWWl+L0HBhW8onysu+vx6j27B6y9JTlrPVuQDr3zcTw8YJqOPCypkLnnPO48MxAKProO0bsT8VO9q6qqPgAAWEMAAMBBAACAPwAAgD+IcZO9AABAQAAAgD/NzEw+AIAURgAAgD8AAJxDEz02vQAAwEEAAEBCAAAYQgAAQEAAAEBAmplSQwAAAECx3NM9AACAQIdP4z0AAABAN8vSPgAAMEEAAABAAADAQQAAQEAAAIJCAAAAQAAAXkQAIN9DAAAAQAAAAEAAoAlGKHXevQAAIEEzMwVD5JUvvQAAAEA9kpu9aBPQPgAAEEEAADRDM3OWQ5oZj0Ml/Lg+AACWQgAADEIAAAxCI72nvWq40rzUdZy9AABAQgsjlTzf5r49AAAgQQAA80MAAChFAACgQAAAuEIAAGBDzcx9QwAAEEEAQJJFZmYwRCj12L0AAIBAAACgQLtdmD0AAHBD22ngPQAAgD8AAABAAACAQAAAgEAAAEBAAABLQ2ZmjEMAAIBAAACAPwAAwEEAAPhDAAAQQwAA4EAAgKFCAABAQDtlKj1C5Jm9AACAP9q0bD1bjZS8AAAAQAAAMEEAAOBAAABAQQCAHUUAAABBAACAQAAAgEAAAPBBnVCIvQBALUYAgL1DmD3PvQAAAEHWl8g9AxiLu6gpyj4AAMBAAIAURqu+iD3MG7S9X1XIPHFKtzw3BY+9XI+nQjvv6LwAAABAAAAqQwAAgD8AAJlCAACgRAAAQEAAAGpDAADhQgAAwELNzPRCAADgQAAAKEMAAIBAAADAQS8Ltb0AAMZDAABsQgAARkMfpWe9yBqEPQAAkEIJnbc9AAAgQQAAIEEAAEBAAACAPwAAIEEAAABBAAAQQQAAgEAAAIA/+u/mPAAAGEQAAEBAaBPQPmbmNEMAADpFAAAgQQCAjkUAAJBFqCnKPgAAAEAAwOpFAABcQwCAEUUAAOBAAADAQJGCAr7qt3i96oDTPdcK5z0AAPxCssOQvUzouj2zYa09P/SGvQCAh0QAAABAAACAP83MfUMAAElDAADAQAAAAEGvb+A9cNWhPTJydL0AAPBBAAA0Q9+JwDsAACBDAACAPwAAQECamcBCd+S4PQAAAEHNTJ9DAABgQgAAf0MPFzS9AAAQQwAAhUJwC9s9AAAAQAAAQEMAAABAAABAQQAAkEIAAIBAAACgQAAAAEDS2KU92yDKvAAAAEHKFZC9QfOWvRUMEz0z8tG9byOEvAAAgEAAAOBAAAD4QgAAgD8AAMBA2ayvvAAAAEGIxry9AAAAQSX8uD4AAIA/q30QvQAA80MAAPBDafiwvdPwVrwAAABAAAAAQfP9wbucNpC9AAAAQAAAgEAAAMBDAAA6RCX8uD4AAFhEAABGRAAAIkQAgCxFAACAQAAAAEAzM45DAAD/QwBAkkVoE9A+AAAYRAAAt0QAANJCXPKWvAAAwEAAADRFAAD2RQAAeUU3y9I+AIA2RAAAh0UAgDZEZqYORF2X/DxzHi29Q8XSPXcrQL0zA35EGI6uPpqZ20IAgAhFAADzQxiOrj4AAGZDSIGAQ/gqszwAYBBGRbhjvAAAAEB9m3s9AAAQQxi8Bb3S7Fq9KvxdPfc4Eb0ngpO93OO9vKn6oj1YJ9Q6+Z+CPeSToLxcI4o6+yp+vCIOzL1zGv28kA+CvfseqT2wXGK8395ovRLc9T3/to68ufwIPXUIKD5RF5C9aigDPIQ/gr1XRay8/lzCvUU04LxSMx0+fzQePYVgbr2jvfY9r4qJvYOIIbtg1e47SP7IvQuflr3J/6C8ZdszvCaVSr1RJLe8m94yPWPVZL2zb/M9Z/PCvWQeLb3idIe9neoYu/vc2D0g8x29V8ahPL+w7T2PPNu7IWyjvQ87wjxax5K957AcvVgozjxqMTs+Fcl/ulhtzrwq4Zi9Gz9xvSerfLzzhgE+G2+xvL8cQ7ygb4m9aYWevR1ierwgsAk+Rz2kPKttJTyXhv68N9ibPKKWhLySnnG9VUTduk6lyL2aBGk87GEdvWMKFD3P3CA9hfEivV9xWDztKhC9ZxAWvH8HBj32ThK9uwKGuvmJxTtInlg9iulkvWd/Djwl9eO9gMD3vNTsGb6w/ve8AwspPBcpuj0UaYM8YJqSvMazLL3CIQE9gNpZPQ8SHT50zL69pIWLvPRjDT27fPE9OjU8Pf8Cjb3gO349spN2vQqfPj2XIU69wDd+PR0ijzx352095WzrPc6MPLp4GFo9k+Z5vI/3ib3anH+8WFVJPQqnjbwHgwE9ytFmvEKD2blVQte7V9CyPUfJoTyLcXw9bXqSvMA8rL22uAg+qbyLuWUBtL2QCpq8Zyf8vJNJrb1yoIM8x1Bmvauqqj4AAIhBAAAAQQAAgD8AAIA/AACAQAAAUEEAAKBAAAAQQQAAlkMxuYI9AACwPpqZwEIAACBB1cPfPQAAgD8AABBB8fDwPQAAeEIAAOBAAIAyQwAAMEEAAOBBy3C1vANn2r0AAABBNYXiPcf00z0AAIA/AACgQAAAIEEAAABAAAAwQQAAAEAAADBBlz2oPgAAgD8AAEBAAAAoQgAAgD8AAJ5Dql7svQAA4EEAAOBAMzMFQwAAoEAAAAA/AACAP8tpbr2oKco+AAAwQQAAwEAAAIA/AAAAQBiOrj4AgIdEAADwQ2gT0D5m5jRDAACqQt8p1z0AAIA/MQxDPQAAAEA2lFc9AAAKQwAAMEM3y9I+AAAwQTMzBUMAADBBJfy4PgAAEEFHiVE86tG6vexfNbvCG/k9AACgQAAAAUMXgau7PdTIPYvqGb0AAEBArN+zPPZ9rD2Aqsg95WiEPAAAgD83e7o9AECSRAAAAECXPag+AACAQGbmE0MAAFBBAACgQDMzBUMAAM9DF6DZPZqZ20IAAAxEAACAPwAAQEByStO9qCnKPhiOrj6amdtCNRXHvAWMAT0AAOBAx0i7vAAAjEIAADBBGI6uPgAAwD0AAIBAClerQgAAEUMAAMhDAABiQwAgikMAAMhCAACHQwAA8EEl/Lg+AICcQ9dK2T0AAIBAAABGQzfL0j4AAKFDCYkMPVO00b1XhWg961+TvNi8Kz2VmtG8ITq3vWMO5TwAAIA/M9HVPWgT0D5oE9A+ghbRvQAAAEAAAABBAIAvQwAAtEIAAIA/AABAQQCAZUMAAGBBAADAQAAAQECamUBDAIC9QwAAAEEAAABBAACAQRiOrj4l/Lg+AACAPwAAAEEAAEBA6M6QvciaBT0Z0aK9po8evEKpor0Qxuo8oF29vA8nqr1zheK8V1mvPQAA4UIAALRC42eNPVIjeLwAAIA/6FZzPZvrZL0AgKFCZmYwRAAAfkMAADxDAAAAQADAAUQAAHxD5S8KPQAAsEEAAIA/AACAPwAAIEEAAABBmhmPQwAAoEK9Zde9AACAQACAnEMAAB1DAAAQQQAAgECXPag+AAAgQZIN7z0AAIA/ACDfQwAAgD9m5qRDSIGAQwCAvUMAAAxCAAAAQKgpyj4AAPBBAAAAQGZmXUOaGY9DAACFQhiOrj4AACBCdoccvaXP6T0AAIxCAADgQEgBqUMAAJxDqCnKPpqZ20IAAABBAACAQAAAFkMAAJBCAAAQQwAA80MAAIBBAAAAQAAAPkMAAERDAAAwQgAAEEEAAABAJ4vAvQAAAEAAAEBBN8vSPmZmwkMFDjY8AABQQdtWbj0AACBBAACAQAAAgEDac729728GvQAAGEIh1KM9uQeDvVmjKD0oTxQ9/7OEPo2nvb1RT8G7aBPQPgAAwEAAAOBCAACaQgAADEIAAIBAAACAQAAAAEAAANRCaBPQPgAAAED0Vau9M7N1Q5Wc8b0Yjq4+r6LivQAAMEHXAhI+AAD+QnMoCT5IAalDAAAwQQdoP71V5Pi9AAAAQM2I7b2n1hA+qCnKPgAAgD9QVIA9AICZQzCW4D0AAIA/CYkMPgAA4EBm5hNDb8/dPQAA3EIAAMBAAAALQwCAl0OSRYg9QRumvOhC/b0AAEBBAICXQzNzkEPQ3h2+AABoQwAA4EBhSgY+NxK0OwCAwENmpvtDQ+d8vNqkUr33rZc7qLQSvRdCAL3IJna9AK6LPQiAlbxSGdy8oXqHPMx1hLzsX5e9NxGLvRP2tTwNhm08V48zvXBmsDw8jw+9utqVvffoIr2tyQ+8xMewPSj4Orz7tMq94vFIvEfrlj0FV1U+ougAPTJsIb1k8KA8oGXFPXegvrqkkJS9ehCzO6n3g71YyOo8qDEXu+qDWL3rC0i9+84XPRVHBD4sg6Q8h0qhPJ/dBL1jfii8s0BgvSPpdzzzmKq9/3QcPM+8Bz6rLeK9qBdAvEdIUbxUukK9S5AqvSebrT2bCIA9GziAvQseMb0VGOw8nZSivWvgzrzTBLq8872+PKD7Zz1V0lm9qkcvPh85QT0ZyBY8qH1yvSf4ob1L5Qm9ilRIvEcqe73IQpc8Dx0yvX3Knjy/Kly9ozqfu+5+BjyDeqQ8DWQtvcU74j0Xcx89TZtrOUtHb71F5Iq9VWL9PeeUjLydNiI9C9Ovveh5UjxFmaA8j5+/vUuLoD1d9ra8fAu+OwuKxz2/SY29/WfWPcgEJ7xqsPI58FCJO5gkbj3buL68Zeh/vbiUE70NXeY6qlOUPTxkuLzHEoe9K7YcPX/Pib1H7r09oytkOze/wb1RwLw9M8vUPMS8g706Za49rh8IvNes7j07gpg7koTUvf8pGb06ucu9E6BaPSWaG73jI888hMS3PSPkHTwvjjK9/BqzPStLn7zXTAS93y0ZPUEwgT3IEOE74w6PvbJfaT11FuG9IG4VPe0o370PBeO7h4VdPSDuT70AAAA/AABYQwAAgD8AAIA/AACAPwAAkEMAAKBAAAAAQAAAKEMAgBRGAACAPwAAgEAzA35EAACgQJh6Xz0AAPBCAACAQAAA4EBoE9A+AACAPwAA/EIAoAlGr4ncvfTHxL0AAABAzUPePRY9AT1MnrG9MJqrOwAAoEAAAIA/AACAQAAAIEEAAIBAAAAAQQAAlEIUrm5DAICpRQAAAD0AAABAAAAAQAAAgD8AgDZEAAAdQ4cJzz0AAIA/A/KwvQAAKEMAAKBAAACxQkRfyL0AQCtEAABAQQCAeEMAAABAZuYTQwAAQECoKco+AACAQAAAIEEAAIBAAAClRQAAMEFlZNi9AAAgQWgT0D4K9tg9AAAiQwAAC0OamVJDsdzTPQAAgEC4FWs9wGx+vXyBnT0AAKBCxwzAvRi87j0KBiG7AACuQgAAGUMAAPBBAAC4QjMze0IAAPBCAAAwQTOzGkMoryE+AACAPwAAoEAAAEBCAACZQgAAgEAzM45DAAAdQxMStb273sS8mpnAQgAAsEMAAEBAAABAQwAAsEMAAJxDAAAwQQAAoEAAABBBAECwRQAAuEIAABBBAAC4Qi80pj2F0cA9AIBlQwCAvUMAAABAAADgQAAAQEE2OMm9AAAAQA3Zzb0AAGhDAACZQgAAwEIAAIhCAABAQwAAwECaygA+AACAPwAAEEEAAABAAADAQQAAAEAAAE9DAACQQl2N3j0AAABAzczHQgAAwEEAADRDAABAQAAAoEC4XphDAMCBQwAA/EIAAEBCAAAAQAAAtEIAAIA/AADAQRiOrj64/rVDzcyIQwAAIEQAAAA9AACEQ4/M8zyoKco+AAAZQwAAAEEAAIA/zcz0QlVg1jy7P6K9ZuakQzMzHETNzH1DQXDCvQAAQEAAAHlFAECnRQAAMEEAACBDAACAQAAADEIAAIA/AACHRAAAgD+wTfQ9gFcAvAAA8EFP05a9cZrKvQAAAEEAQBtGHhixPayBk7wDiNc9AABAQAAAkEQAABBBAACAP4f03T0AAIA/N2+NvQAAgD8AAIVCb6/uPQAA4UIAAABAAAAgQosqRz3SbNG9bqiovIfRXD37+IO9AAAAQAAAAEGamZxCAAAwQQAAQEAAAKBAAADGQ5qZ5EIAAGBCAABYQgAAgD8AAIA/3V5FPaVFpLsAAJBCAABAQgAAiEJmZpVDAABYQgAA8EHqiAU+AABVQwAAGEIAAMBA1eLdPHjYfr1FWyA+mpnZQzptDT0AAIBAAAAgQpqZQEP2mRc+AADAQAAAQEAg7Dy8AABAQAAAwEAAAMBBAADAQmZm5kIAAKBASIGAQ3Mhrr0AAJBCAIAGRAAASEONMgQ+AADwQwAAQ0QAAEBCTyABPQAAgEAAALhD0bm9vR3bVbwAANhCAACgQAAA80MAAM9D4ScWPQAAgEAAALhCAABIQwAAlEO2pIu9AAAAQcZTtrx8g469AABAQwAAIkQAIIpDAACNRADAmUUzM45DAACAPwAAQEBoE9A+AAAAQGbmNEMAAIA/ZmZdQ8PD0j0AgKxFq/T2PQAAgD8AAOBAm0C+PP2Y8bs/oLo9kxxyvZtHIT0cUrA9G92lvSr5XT0AAIA/AACWRACAUEUAAABAAABPRQAAQEAAgCxFAACAPwAAQEAAgD5FAADAQjt5eb0VO+Y6OMlsvZ969DshEB29hFawvfB9mb0zmSc91hDEu3L1m71B75U9J84UvXUo7bxzvCE8xzV9vYRLBL0Vh+W6u2FVvbD0mr2fmV+8zqQUPPDQET6HRva8U42+vR6XhjyvMpW8t+XBO619Cj6uXwu8Y4zKvZ+DHLzUiyu9IE8IvWoKOT2TAsG9V9L7vPLqGr2VRv48BlKYvZEhkDwostm93jShvE/dqL2w9s09qw+yO9x4yr0k/429gi9iPWf8QL35C5u9TuiwvdkYyD2CP9A7F66RvXBgBL11jZ+9M/GXuw9+tb1F23095ykNvedzQby8zpY9/EXKvSYuqrzg62w89y9/vQpWfb0HuJ074ftGPWBNubklhJu9GtmbPEjSIj1Pe3S9x1PrPTsyjbmAL/W7kEzmvCShuzvfoKS94k3rPSL1cb3D/4C87yN+vVj1q73LHtq8ZRR6Pdua77w52rW9Qi1qvajSEz3vehG9boy2vb7Tw7xX1EW9WsvePBz3pjyqzHa9e9sfPsbak7wmiDU935xlveKmNbylBo69dFSkPR+Sgr3LM/o9b6g8PV2hgr2C2RQ9ahbCPFH5Bj6/mY084SeiPWNi4bv/uxA80PLjOwea8jzv+7M6lzXXvB2PpT0CCIu9UuPYPSnuQz2wuiG8K6ylvfo5ub2to1E8czMdPKg94T3//R68XRygPV4fjL0YOXA84zcuvVuUgD14zlo9NEczvRfCyj3DgQG+Q1hZPfr/zj1T1L298jxoO6raubyCqJ29O5qjvJLuJTx31AO9CjEbvESeOr0KBzC8T9aMPPiyo7yz4vw6cUKIvGr+ZrxGqxW9wsl2PdlXLbwzW608EwabPUI+Wby/aZ89fcKIveChdLoAAAA/AABwQwAAkEMAAIA/AACAPwAAgD/70ds9AACAP9ELvT0AgBRGAAAAQAAAgD8AAChDM7MaQwAAEEMAAIVCAABAQwAAgD8AAPxCAACAPwjk1r277NM8FWXQPZqZGT+/eKi9AAC4QgAAgEAAgNNDMzP7QgAAgkIAAIA/AACAQOMSxz0AAHBE2YkdPgAAAEEAAABAAACAQLHc0z0AABhCzXk9vQAAsUIAAIA/AACAPwAANEMAAJBCAABAQgAAAEFmZh5DAACAPwAAwEEAAAdD27i6vQAAgEDpoos+AACTRAAAfEQAAAA96aKLPngNSL0AAKBAAAAiQwAAC0MAAFVDAIC7REgSwr0AAIA/W/QcPD71vz0AAMBAAACAPwAAgD8AAABAAECSRAAAkEIAAEBCAACAPzNzlkMAAIA/ZuboQ2gT0D4l/Lg+AACQQgAAQEMAgDJDAAAAQAAAwEE4T4o9Jfy4PhQbiL1WmCi8AACQQgAAYEGrSfo9z+wOvQAAsEHNrOFDAACQQwAA9kUAAExEBxKtPQAAmUIAAAREn3LTPQAAuEIAAIA/zcx9QwCAvUOaGY9DAADhRQDA/0UAAMBAAADAQACAPkWmpaU+AACAPwAAbELywfG8AADwQpqZ5EIAAPBClsxAPoDeurwYjq4+LILLPQAAS0NmZmBDAIAyQwAAEEMAwFhDAABDQ2ZmjEMAAIBAAABAQBiOrj4AAIA/AABSRGamDkQAAJBCAAAoQ2gT0D74Lce9Jfy4PgAAgD8l/Lg+AABYQwAASEMAAIA/AADAQgAAgEAwjbS7g42bvQAAkEIAAIxCAABAQAAAwEGAHnA8AABAQKPJ5L0AANxDAACAPwCAh0QzA35EAABAQC+5CD4AABZEKCLuvWN4hz0AACJEGI6uPiuUSz0Drdw9dw7BPPpTrz0A4CNG4O5/PBhehT3XCMi9AACAPwAAgD9rGak9ey+zPfwDnTwAgItFMzMFQwBA+0UAAFxDAADPRADA2EUAgEdFAACAP8cryjxPzck9kqIlvZNo2TwAAHBCMzN7QgAAwEEAgKFCAAC0QmgT0D4AAMBBAADqQgAAwEIAAEBDzUy6QwAAT0MAgC9D2UbLvdMit71m5qRDAAAiQ9p9HD0AACpDZmYeQwAAKEMAAFxDAADAQQAAWEMAAEBCAACAQAAAyEO4/rVDAACAP2bmpEMAAIdDZmZgQ1RBID2/S4C9L76wvRmIlbwAAABAZmYwRLsFZTzNrOFDAACAP9vbUr3DuPs9B+65PFepn70AAMBCGZABPjfL0j4AAA1DAABYQwAAgEAchbW9AACAPwAAlkOESCs9AACAPwAA4EAYRTm6AACAPwAAgD8KaV69U++fPTP/tLwXRq091sqSvfhWW7woryE+AAAQQwAAjUSamUBDAIDTQwDAk0UAAARFqCnKPlfpNz1XIXC9qCnKPgAAQEQAAIA/AACAPwDAgUMAAIBAAABAQn/qv73gZ4g8RIGOvRGxgr1VPYI96ql0vWbZkD0A4CNGpRGvvAAAikUAAABBAADwQQCA8UUAAGFDAACAP4P7Ej1mZpVDAADDRAAA5EQAwLdFAABwRAAAoEAAAKBAE/Q+PrkxFD37WX68xcw3vVUj1L2aiXE9orUYvWcvA7yoxNI9WLFMvUv18D2RAQO9peHjPUldi73Dv1u93oiJPBK5rr2MBA29uaTGvTkNGL0YErK9hU0YvdfzRr1PuaS7cawKPZ7agrw3J369uq0aPTraej1wYf68KJxjvCR/Or1jv5g9EoncvALXLz5DGpk91GyxvXDtTbsiilY98lpgvLG0l72OnTM7G+A9PSfdpbws4h+9aO1wvL/GlT2DDX+9/2nEveUYFLwkwzO9ku3WPMSjlr1n5Bm7Fp+pvfX7MjsLq6a9v9nIvE/ii7xzCoC9J3i3vHEVxz0YC369J6bJPEX2eLwk4YC9gYqTvNeuET3PAYU8axw8vdOBgbjxV6w9i8qJvGyrkr1PY0g9NVomvRzBh72azNC7HxT4PY58hbz4DEy92n+Zu3StirgoiV+90Sirvedw0Lv8yru9L4ZwvTvSf7y3sqy9GMUbPTrahb0nKrW9aTwkvOAsibpSlP6867YFvdZaAT4jDTA8F5s5vfjzpTwsmAs+SEVwPJOw0LzvQsU8hn9JPQHUhT2tqMC8iy7qPWfkMT1rqYw83xh4PXghZbyORhk9UkHNvU8gRrzLwlG9ikUKPWAgXDwD7xK9Bx+bvHV9mL1j+a+8K574PfKg8jx0BYO9CyyKunVdCz5fM/g9IH5SvQjIgDzOVBm8y0VLOyvlkz265tO9P8EfvSOztLug30a9S1gmPeWhCDt5JUq8N0g4PYnmP70odPW9KyFUPdebxr3qeoO8eDKrPQAAAD8AABxEAACAPwAAQEMAAIA/AABAQgAAMEIAAIA/AADcQgCAFEYAAIA/AABAQANd2D0Qh469qCnKPgAAgD85juM9AAAAQRiOrj4AAOBAAAD8QgCgCUbd0tW9iD1WPUx1Jb3NE3g9y/w6vDfL0j6kcNZDAADwQgAAoEBoE9A+AACgQAAAEEQAAIBAAACAQQAAAEAAAPBBAAAAQAAAgD8AgDZEaBPQPgAAAEAAADBBAADzQwAAgD83y9I+AACAQC4Cnz0AAJxDAAAQRAAAxEIAAKBAAACAPwAAzEMAAPBCAADYQyX8uD4AgNxFAICCQ6gpyj7TeOa8AAAAQAAAIkMAAAtDAACgQLHc0z0AADBCO+IMPQAAwEEAABBDAIAyQwAAh0MAAKBAAABsQwAAAEAAABBBAAAAQAAAkEJkU729A/YWvQAAwECPwvU9AACQQwAAQEAAAEBBB1jLvAAAvkIAAPBDAADYQwAAFkRcDwlDZmYeQzMzBUMAAKBAAADqQgAAlEMAwAFEAADkQwBAp0UAAIxCAADAQGgT0D4AAHZFZuaHQwAAgD8AAFJEAIChQppS1D2jGYc9zcx9QwCAvUMAAABAAIBxRQAA4EAAADREAAAAQwCAFEY3y9I+AACAP2amu0MAAE9DAADAQAAAgD9mZl1DM7N1QwAAgECoKco+AABDQwAAAEAAIIpDACDfQwAAIEEAAEBAAABAQAAAwEIAACBBAAC4QQAAEEEAAJBCAAAAQQog8TwAAMBAAACAPwAAIEEAABZEAACgQIg52b3jENy8AAAKRAAAqEMAAIA/AAAAQAAAuEIAAApEAACAPwAAIEEAAAdDAAAAQAAoibyTg8W9AAAAQAAAQEDno7w9AADwQwAAkEMAAHBDAABAQAAA/EMAgJ1DZqYORJoJCUQAAIA/AACcRQDAzEUAAM9FAAANQwAAKEJoE9A+AAAZQwDA6kUAAF5FAABAQQAAEEEAwMNDAMDGRQAAEEEAABBBAABYQuOwsz1VQ369YHnFvQAAgD8AQBtGzhGfPW/jkbyaGY9DAAATRQBA5kUAAIBAAABAQH/KGz3zKc692ok0vTfL0j4OTSu9+7RkvOTgrb0AgBRGAAAQQQAAgD9m5jRDAABAQgAAz0JmZl1DAAB/QwAAEEFKAto7P/KTvQAA4EC9Kbq9AABaQ83MfUNDboy8AADwQgAAAEAAACBCAAA+QwAAQEAAABBDAABAQQAAwEIAALhDYm2nvG8rp72oKco+lLEHvYOQJz0AABBDAAAAQE8Rjr0AAABAE15+veCppb0AAAxCZuaHQyrhors3y9I+AABgQkCTW7xn35C9pBq0PQAAQEAK1yM+04+4vSX8uD4AAEBAJfy4PgAAMEGx3NM9AACAP0snvLxj5d69AAD8Q5qZnEIAAIA/AABAQAAAhENoE9A+ty4VvXb2BL4AAKpCAADSQgAAWEIAAM9CAACuQgAAIEFzZvA9AABYQgAAqEPT7Qs+AAD4QwCAMkNNP/a84ElPPQAAAEBTKHs7bEAAPQAA4EAAAKBAAAAAQF60uLzl8lU+zcx9QwAAT0MAAJxDAEArRAAAlEMAAKhDGKb7PQAA4EAAAMBATwEwvQAAEETNzBFEAADeRADAn0UAAOFCAABoQwAAWEIAAHhCAADeRAAAUkPNzPRCAIBQRSXx6D0AAHhCAAAAQGKtL74qf6c8f03KPfaoKkMAAMBAqCnKPgDAk0VzFY69fzgxPgAAIEEAIN9DAAAuRAAAhkMAAOFFAABgQgAAAEEAAEBAAAAoQgCAoUOrbWy9ApOnPeLjYD1Y8EG9Yr7dPZQqjDwAAIBAmplSQwAAAEAAANxDAIAyRQBAsEUAABBBAAAwQUceuz2yqKu7CyUoPd40kr2J5BK8v8CYPftFI73jQ1q8nwwtvKimD71XL6w9p0MkuWV4sjsvChq97Xr8Pe5bKTvBPRc+ah5dPIMRvL3rODk85dAUPmVmi70hH4C8SFa9vU8gMT4R9oW7IKCkvcazB71suMO9d3ptvTU4LD0/+SS94g2avKvgkT0s8JW9vRURvQd5hb2bHKA8HLuDvR/iw70GQUa8rxArPpgvgr0bzTM98in8PQ+TyjxC7Rm9v1bGvbGUgj03zP467YNgvfbjKD0rVmK9F9uYPDuAlL1w2PG7u8CwvXOKizyT5sK8U7WEPVhTdr1dOWQ9A+OKPGNEQb3lC4I8J3CGvZDgkL1ySj+7Bmi/PT+lg70xP4W94FlVPWYfvLyzSIw9z2kXvcYGoD2LNsS8fXyOPTTPr73DhoS7xRvGPEerh73EUyA+hYb8PO8CdL1Ggx49BUzDvYTtnbx3HYC8k3pKPaUamL1Ae4U8owGqvCFeqL3j0Rq9uJx8PVUx6b03WzG9cdmHvYU6h7z8YQE9KuWJvWpBHL0VIEU95MJIPFSxtD37LDG9hnU0vAV/9L0e6oe9orDiPGc/n73BgT0+2gAKu1vnUD0pVrK9HdZ7vLsjI72JZrK8/w+2vZt7Sj26Ram7IGRNPJ0lsz3Ljr24A3aSPfoKbTkfmH+9WV2XPWNMXrzgWNU9wOpGPbX/Rj1caii4n5QTO5RWl70twoQ8EycIvC6ADD7VQM88EPj2PIMF6b3z4GQ9r6smvSMz2LxfndK9Z9SPPRurNrwz5w08I41gPaO387tzVbM8/ioPvIW/0T0qSk29BOgGPcwMqDzAqnw9mKMvPfyoob2rZ9S62h5nvZiI6D2wbW69R8NovU/21L3LH4C9bd4aPZcRuL0LFfY8erDXPWDBbTxzN4w9zXduurdW4T2Nrfw8ultvOi9Nvz0mp508QhjRvG+GSr36fXc9otuNvVPljjvrXWI8dbz9vbJR0D3uIcq9ImKbu92L0rzg0ZO8gIgFPWX09LyjL3Y9M8uzvfLsZzybdey8Q1G+u0JZlj26ZRS9wKHpO1H0AbyoBsO85lknPbdt2z4AAEBDAACQQwAAgD8AAIA/AACAPzMDfkQAAIA/OY7jPQAA4UUxuYI9AACAPwAAEENHt9c92cGtPAAAoEAAAPBCAABAQgAAQEAAgLtEZuY0Q7en3b0AALhCb6GBPLKbxT2amRk/XI+nQjhtjz0OLR29AACAQAAgBEQAAKpCAABAQAAAhULpoos+AACTRDfL0j4AAPBBAACAQAAApUQAAD5DAAAwQkpG37wXNM+9xW6lvABAkkTNzH1DAADzQwAAAEAAAIA/AAAAQDfL0j5ldXi8CtcjPgAAuELpHY89/SSZvAAAsEE3y9I+AAAAQACAAkUAAIBAAACAQAAA7UUAgIdEqCnKPkUZt70AAK5EAAAlRR9VmLypVZs9MzN7Qo17Zz0AAMBBAABAQgAA8EM7tsu9ZqYORAAAgEAAABhCAABgQgAA+EJoE9A+AACAPwAAhUJjM1A9AADwQu/mk70zM/tCAABAQIrs370AAJ9EAABoQwAAgD8AAMZEAACoRJOQrL0AAMBAM5aYPTMzBUMAAAtDACDfQwAAaEMzMxxEh4T5PQAAAEAltoW9SUK3PSzPwzyrqqo+svMiPQAAbEKamZxCAACAPwAAAEAAAIA/AIA2RAAAVUOwiKU9Yw7wPQAAcEQAAD1ELl0MPQAAAEDiJom9AADAQQAAhUIAAIA/OGKZvQAA4UIAANJCAADPQrtpub0AAEBCn/SavQAADEKU3oI9b516PGRVAb0AAI1EmplAQwCAoUKoKco+AAARQwAAxkIAQJ5FAAClRAAAqEMAAPlEbT6Bu4dIsD0AAIA/AAAAQLfj0j0AAO1FAADYQmZmLUMAAEhDAACAQABA+0UAAHNDAABAQBiOrj4AAORDAADAPVe/h72/C2W8Jfy4PhiOrj4AAIA/AAC0QpZvqr3NTDFD7HgCvQDAWEMhOZa8yeaRvc2s4UNkuC29zUwxQwAAtEMAAIA/AACAPzfL0j5oE9A+AACAPwDLDL1+DKy9GI6uPgAAwEEAAIxCdPqRvNfCdz0qA+87AACAPw3dLz3oMuG8DdlyvdHCILxCYOK8nKQwPf7Cjr0/Rjo8MwN+RM1MukMAALhCTy8CPgAAjEJmpg5EAIChQgAAiEIAAABAAAC3RAAAgD/bFN69AABeRSiLdz0AABxEHMW/PQJkozwAAEBAAACgQAAAgEAcOBW8AAvvvV8dgb0AAIA/OvTMPQAAAEAAAABAAIC9QwAAJUOnA8k9AACAQAAAwEAAAEBAAACgQDfL0j4AAKBAAAD2RTfL0j5fkbQ8MI7rPYnrpD0AAHBEjep3vSs/QDx6w7s9AAC0QyuzCr3VeBO87q+3PWAY8bydFxq9qIeBvZw1KjgrYfK8vzAxvahrLz1VC9O9NY0CvWtiCztYF5A9hF+CvCCFEj225yS9n4i0O73JJj1M0oC9PtILOzsZwz2YAq084N6/vO3wpr2v5ly8q+mAPAFvMrsbwI29mhSLvPQMjz0Y7IO9KeORvBhXqb1W4wo9ZxfwPYsFprsPTPs8RtMfvbcliDxLxBk8wtvkvc1C8DyHAxg+Eam1PH+EWL0HeWc8rjKNu11457z3Exk8zRNCvRopYDyn3fW9cxsevaBqRTuqgro98ryIOxj1vr3swpI9dmk3vWWBQj1YzfU9uD/1PLc6wL0Ltb49K+SiPMlnD72iGvC6pX5avXu7dDwemjW9WldYPd+UfL2h86c9q6q0PQ/mxb1aLoo8ibOtveuNhz0j8RO9W43BvazAtT17lm09A6WqvLvztj23C6m9d6mTvZMxfj21P/I9jdCOu5/HT7s1gnO9uNq4vedPGT0TBU897yqluwAAAD8AAFhDAACAPwAAgD8AAIA/AACQQwAAzEMAAIA/T+xEPgCAFEYAAIA/AACAQDMDfkSamZxC2D1yPQAA8EIAAPBCAAAAQKgpyj4AAABAmplSQwAAAECPwvU9GwGjvQAAAECH+dY94NoDPLEPkr1aAoq7AAAAQDOzGkMAAL1CZuYTQwAAoEAAADBBAADgQAAAIEEAAKBDAIBoRQAAAEAAgGVDAABYQgCgCUYAACBBAAAAQDOzGkMKMbc9qCnKPgAAQEAAAOFCAACAQCX8uD4AAM9CAAALQwAAEEEAAABBAADAQYHVwr0AAIA/AAAAQAAAAEF69Jk9gs0qvACAjkUAALpEAABkRTNzlkMAgKFCAAD8QlHYtb0AABBBAADAQwAAQ0UAAMhDAIA2RAoSz70AAIBA8fBwPoYevz1UkwG9rdKSPQAAAEEAAIVCAADAQAAAoEAAALRCAADgQAAAKEMAAIBAAIChQgAAMEEAAABBAADWQgAAEEEAACBBAACAQAAAbEMAADBBaBPQPgAAMEEAADBC4baIvSgi0zxLrq28XI+nQlbNPT23bVs+AACgQAAARkMAANxDAIChQwAATEMAAJRDAACWQwAAQEAAAFhC40qQvQAAAEEAAAtDMzOyQwBAG0YAAKBAAACZRACAO0UAAM9CqCnKPgAAukQAADBC0DwSPaM4oL0djuo8V2cyPZBeH73vtLC9AAAgQgAADEKamdtCAIChQwAArkIAAJBCAADAQAAAbEIAALhCAABAQwAA+EIAADBBAABAQAAAwEAAAMBAAAAMQgAAqkIAABBBAACQQjmsyL0AAKBAAAAAQQAAQEMAAOBAAAAwQQAAEEMAADBBMzMcRAAAQ0QAAABAFK5uQyX8uD7b0Zi9AACAQAAAwEAAAEBAJ/qovTfL0j5rTUg8wrikvYLjtLwPqwE9mlqOvWZmYEMAAAJDmpnkQs3MiEMAAKBAaBPQPopyDz4AAMBAAABLQwAAXEMAAKBAGI6uPgAAgEAAAEBAAMC3RQAAKERnvoC7B0GpPW1S5jwnXNE9AAAgQdtYxz3bp8897/jJvIB3W7xnjo+90p7MvD0UOT0AAABAAADYRACAJkVXDK69D30SPgCASkUAAGxCAACgQAAAAEAAANtEAADgQABAG0YAAEBCGI6uPgAAQELXeqO9AACgQAAADEOamTdDt4SaPQAAGELiAMq9mpnbQhSubkMAABBBAABAQQAAKEMAAEBAAAAoQwAAQEAAAABAaBPQPs/Ys70AAAJDAIAyQwAAQ0MAABBBZuY0QwAAQEMzc5BDAABAQTOzv0MAAKBA/Ue9vbWc4j0AAMBCAACWQgAAAEAAAEBAAABsQppHo70V7Ks8AACgQK8tjr0Yjq4+EEVtPAAAAEBoE9A+AAACQwAAkEIAAPBCAACAQI+cdb0PAPM8AADAQKP5mz0AAMBB5gG/vWgT0D4AAKBAkp/+PQAAMEEAAEBAAACAPztex70AAChDAABYQkebpr021ZY9AADgQFk+yr2P/yK9AACuRAAAgD8AAGxCAACgQDfL0j4AACBBAICFQwAAoECoKco+AABwRAAAhEOaCQlEN8vSPgAA2EQAgBRFaBPQPmgT0D5mZl1DAACAPwAA4EC4/rVDAACgQACA3EUAALRCESsVPgBAg0UAAIBAAIDBRQAAwEAAwIFFAACAQIMtlT3fZKa8MOzTvX3m6zwAgGhFAAAcRQAALkXzOs89AIBoRQCAU0UAANZCAABYRQCA8UUAgLtEAADAQAAAgD8AAOdEhzsivY+Aazk3y9I+AAAAQdLmYblEnZc9k0UcvXyosr0vDm29Dt+HPY27ZD2fREi8i1qbvWCf4bzA/oG89RmSvccHpLzcmwU++zwCvfhjor1jtQ697n2VPQemFrrcOJW8dbBKvfuFjjyxBCu8N24BPX5fRDzbR4S9SwkNPq7SubyFZ009mDj4vM9D8bxLcc69kgSivF4vkr30hAI+TKoyvdxIyj30FBm6O/wSvQUD6j1quEU8Y3tSvWXphzslV9C952owPiiY8zwsDiy9Fe2hPbzMGL0QDd493/bqPRsbBbzPN5m9wxLtvB/5oL1tJ0w8GUEBvUeX0Dt6lv090pSMvD/Gl7xLBLq9AlV0vb/Y9zwZTwI9/SwuPkAGxryfJ7W98s4/PasCLL3RUby9/+0svOfjCT7d5B29p5qFvFmrir0XkRy9UtOkPTxyAT1FoCo+H0VqvZtAyjxVrcg8pi2KvDeJlb2VeWU9V9q/vQR1QL0InWC9Hel7uj+32ryQSUQ9ZbNkvadx+LtQ9Di9NwgFPR/y6bzqNOg9wc2JveO8Fj1jXWK7F8NavXR9n73Qxv88K3agvH9DYz1asKK9lPsXPcOHgL39gU49/QzlvYKDar32F7C8E8T+PZhP+DzYrf+9a/tevZyNIj27PFm9ezkEvtWgdr3taI49jAWgvbmUhD3DXH29mJ/OPVZeFT4KxVs9X/v0OofG5DwFLBm9vtwmPk6VgTwm7L+9JpTCPen5FztryG29toUvvgWL1j1K0l295uKCPZjU3r1YvHo9KSEevd8IsrvkkDU91UwWvOubLj3KIdo98PdJPJ6hnzzVAaq8Z9+bvQ8udrz3Pke73ayKPeKU9z3b1E494iKUPJp+Ob31FWK9p1d6tsDdVDxtZVq9PDoTPv+hkDwM/i29sKL/PJvjHjxnBw690Q4mvRuGSbzF39u7x2ofPUNuLLwbTWE9z5uXuzsw171vv6W7ixStPP5mBzyjOUi9B8qRPTdZ5rvotmy9c8v3PJ8uq73cZDm9AAAAPwAAcEEAAIA/AACAPwAAgD/Ir9Q9AACgQAAAIEEAAIA/AADGQwAAAEAAAARCAACIQQAAAEAAAIA/AADAQOmiCz4AAEBAAAAAQACAt0O3ccy9UujUvXDxhD0AAMBA+62+PQAAgD8AAABAAACAP4wuuj0AAABBqCnKPgAAQEEl/Lg+AABiQwCAnEMAgNpDqCnKPgAAgD8AAABBiKyXPQAAgD8AAIBAAAAAQFVVVT4AAIA/AAAwQQAAgD8vkaK9Jfy4PgAAoEAAAIA/AAAQQQAAAEAl/Lg+AACAPwAAAEAAAIA/AABcQwAAMEEAAIA/AAAQQVStgb1oE9A+AADgQAAAgD8AAEBACCEEPgAAxkMAgMBDcxRtPOPULL0AAABBIOi2vQAAgD8AAEBAAADgQAAA4EAAAOBA5vmHvSX8uD4AAEBBAABAQagpyj513429M91PPagpyj4AAIA/AAAAQAAAgEAAAEBAAAAAQQAA4EAAAIA/n7LCvQAAEEGL8IQ9AACAQMu5lT0r9Ik88FXaO5vPkb0AAOBAAACgQAAAeUMAgIhDAAAAQQAAgD8qR9g9AACAPwAAgD/1EaU964PBPQAAIEEAAMBAAIC9QwAASEIAgIJDAAAwQQAAgD5gB828o7mqvVMAtr0AAOdDAACAPwAAEEGkUKS9AACAPwAAAEAAAABBAABAQAAAwEAIZd49Jfy4Ppc9qD4AABBBAABgQQAAAECoKco+GI6uPqK7Az5rUj68CWgaPWqqdr0AAABAAABAQKgpyj4AAABAAABAQAAAoEAAAEBABIdHPQAAQEEAACBBAAAgQQAAQEFoE9A+AAAgQQAAAEFoE9A+AABAQAAAAEBAPWa9YCtgvAAAU0MAAFVDAABfQwAA4EAl/Lg+AACAQACAhkMAAABAAACMQgAAkEKrFQ6+5Z+LvIPeDb2DYZM9IrO8vNdsxjwAgP1DWE+LPQAAoECC89c963eVvURamT2XPag+AABTQwAAdUMAABBBG+LTvWIP9rtU2ie8r/shPQAAgD+mISO9Jfy4PgAAIEEl/Lg+AACAP5m/o73WSQs9AACAPwAAQEBoE9A+AACAPwAAgD8AAABBGI6uPpc9qD6m2Ja6Vk0ePQAAgEAAAKBAN8vSPgAAQEAAAIA/oy7oOwAAQEEAAIA/AACAQGgT0D4AAEBBqCnKPlxukb0AAIBAAAAAQAAAgEAAAOBAAADgQBiOrj4l/Lg+AAAAQBiOrj4AAEBAAACAPzfL0j5ar5i9AACgQAAAQEAAABBBAABgQQAAgD8AAEBBAABAQQAAAEAAAKBAAACAPwAAEEEAAIA/AABAQQAAMEEAAIBAAABAQKgpyj7AZrC9RkqYvfrZUz0AAD5DAABaQwAAsEEAAABAqCnKPgAAgD+VFgO+AAAQQQAAgD83y9I+AACTQwAAgUMYjq4+AACAP2rGVjwAgKdDAADgQAAAoEAAAIpCAACkQgAAz0PcWpG93xy5PQAAgD8AABhCAABAQgAAIUMAgIxDAABrQxiOrj4l/Lg+GI6uPgAAIEEAABBB8tl8Pf1rkTuSHxW9KSWpPAcsMj0BHDy8m75evQuESD1+D7w6ROnJPcNtdTx71pO9RV0evWFOhrqIq/082xeXvELtvzzPhZ6919gnvTN4mTs/af68azWYPG9dhT3z6Si9nRxrvdsfyDsfTbM7vzAGPX0fF7z3C3i9xcziOnAlrzyfwEy9FaapvaOfE72LN729lDMUPUsZs7xt/Fi8LFSaPXgInL37R6y8oJPZPPdFrz2Tj528vD0qPWvEBL3D+YC9qj6MPBIlq7z12KS9RMqouzvjgjyLDYY9GzMTvAUWF705s7u89qc1Pb83nb03JAW9tugDvT/kiz2tRqw8r3CFvbCbm72s+gK9f7x2vR19iTvnhNa898OfOxZTJb0TZXy8mwE0PSAihrylhSC97cUtPQ/rn72l8VK8BTlwPae0+7wQh4i9WxQtPT8nq72XDh69FweAvUBde7yHacw9aIwyPDgctb2S1o08b1knPRcMLj5Ztzc9Z2spvYdwuzyu0gq90j9XvUeC5jsrZku9MEAuPMYuOjw9lE+91x7xPCMjb727I9Q7sfUovQNdLj1rowo+aTyAuueEJb2Y6dm9mKmgvJttmz2f+lq8Kz2QuxvNnL1CO3K8h7S5vfzeMr1fFzs9uVujPXNIg7yP4Nw9p5spPW+Yib3j0646VQdHvTuByj1l39G9kGq/OxD00D3AvcE88gTyPBUiy7vVcxK9HAY5PBUOqTuQMW+9P7HcPZ8VET27Iau8NicHPSssAjzlTJY9ypJsvZB+sLs9dMw7amCSvVFgkDwaR3c9C0AjvZe6mTxvpf+7hOSoPH0IrzyLahm9MH1qu+ozmzxzDKK919O/u1GJgb2jzQU86HhfPR2Z27zpoos+AACAPwAAnEMAAIA/0Qu9PQAAoEAzA35EAIAURgAAzEMAAPBCAAAAQAAAsD4AAHBDAAAAQHgKFT0AAJZEAAAiQwAAQEMAAIA/AAAYQgAAIEEAgKFCAACAQAAA8EJn07u9AACwPgAAMEF74tQ9mpmZPs3MiEMAAABAAADwQQAAAECkcNZDAAAQQQCgCUYy+Me9AADAQAAAQEL3aMq9AABAQQAAMEEAAMBAAAAgQY/C9T0/bUc8wGT3vC9GCrsAAIVCcJU+vaFZhD0DXqE997WeuwAAf0OaGY9DaBPQPgAA4EBrN+G8AABgQ83MfUMAAABBAADAQACA5UMAAIA/N8vSPgDAw0UAADBCAAAMQgAAQEKrtbe9AABsQgAAIkQAAABBznO6vSNgw7sAAChDrZiGvaTPkb1BlJ285f/qPQAAgEAAAJBCMhrKPQAAaEMAAGREqCnKPgCAu0QYjq4+AIAyRQAAmUQAAChCAACgQACAvUOV5ba9AACAPwAA4EAAAEBAGI6uPgAAlEMAAIBAzSwVRACAnUMAAJBDAACgQAAAykMAAEBAAAAQQQAA4EAAAIA/AACAPwAAQEAs/6S9em0bvAAAgEAAAMBAyAiVuzXthT1fKLK9640AvHBygbw3McU9AADAQAAAhUK+gYK7AABsQgAAIEEAAABBAACQQwAAikQAAEBAAAAoRAAAgEAAABBDAAC4QgAAfEMAAGhDzcyIQwAAEEEAgGVDAAAwQQAA20RaTsc9AAC4QlXoXr2YJpo9nAEPvVMGuD360ac9ACCKQ0sHyDwbu8g9AAAAQAAAB0MAAABBAIC9QwAAAEAAAPBCAAAQQwAAQEAAAJZDzUy6QwAA4EDNzH1DAABoQwAAIEEAACBBK5apvQAAlkQAAFhDAABAQKgpyj6RY0a9r8kPPPoqIrxlfoO9AADAQAAAwEGXvLQ9Fp0bvFwmC70AAFhCXI+nQgAAwEEXjxk9AACQQgAAQEPdXPi8nGehPVKZeDwAAEBAAAAwQQAA5EMAADREAACAQAAAgD8AwIFDAAAwQQAgikMAADBBAACAQAAAZEQzc5ZD2ODXvV/QgDqoKco+AAA3RWZmYEMAAJBCAACMQwAAlkLTbvE8AAAgQ4sXzT03y9I+AAAwQQAAVUMAAKBAAABwQfyIr71fCdG9ZuaHQ/XKnj0AAMBCJ1oOPAaLEL0AAJlCAACAPwAAwEJm5hNDZuYTQwCAgkMAAPBCAADAQnfo9LwAAEBCfzSIvQbVmTwAAKBAN8vSPvMG/z0AABhEAADgQBiOrj4AAKBAN8vSPjMzskN7VJpDAAAAQAAAwEMAAMBDFK5uQwCA00MAAMBA9qgqQwAAMEEAAIxCAACcRAAA4EAAAEBBAAAAQAAA4EAAADBBAAAdQwAAgEAAAIA/AABAQAAAAECasLa7zUs5PTfL0j4AAMBCzhuUPTMzBUOwiYa9Dz9dPEdt4T1Ps6k8Zua5u211ej2asAu9bFQnvM3DgDyHXTa9gx3nPHhB8T1rFdM8LQNcvZPtnbtKjrK9h8qAvCVoBD7l2uG98+1GPcaFBj4Lr8g8ymbbvMjmy726o369q1ZrPV3xDT7/OAG9+2X2vHN8XDsd9PQ9+9xzPbXJWb01gQQ+fc3fvWMzuDs/cfu8kvL1PdPl0r1txnM8periu0djAb6D1mc9bsmnvNmoRjyF/tu9ZJAkPoQtFT2zd08770IRvQhLTTwCIkO8q/dGOrr95D2aOBc9WugjvWfTc70hNI09pjeTvdPhlTwOZrm9ftkIvQNw7byH05K9T4+MPS8rDL1DXwI97iImvQ94DL3VZA09eqnFvU10Sb3YQsA8wjpOvW/vAj3LaA4+N6oZvU+DMD35n7m914Gfu4fyqz2TaAe98eIfvBtEnDwOlI08oon/Pcijhr0IU+E85Vq5vBMP/DzYt229jq9HPK0Qwj04SYC8A0qtvHLn3L1Yrmy9Z9Y5PX0qsr1sYZq8FGiaPThS4bxlbJ69CxPQPGTypDzfkw29u7tKO8PXzz3nHpe9ULaxPP3H/jyDnlK8A6mvPZ8gaTyVMqq8KWebuz8rvbsv45U8KaYhPH5AhT1Z4K28E5+4PF8gtb0j9Yo8WFSIvaMtZT29vPM8/ddpvW2dXrzFP+Y9E5lpvYEBkTya9MK8fACWvdsBvr0HEA+9bQorPYdViL3Rf6C9K1m2uwAAgD8AwMxFAABAQwAAgD8zMwVDAACAPwAAgD+oKco+AACAPwAA+EIAADBBAAAwQQAAwEIAoAlGAAAgQQCAvkUAAIVCAICLRQAAIEEl/Lg+AAD8QjfL0j5mZi1DAABwQgAAbEMAAIA/AACAPwAACkQAgDZEmgkJRAAAIEEAgGhFAIDBRQAAAEEAwMlFAADAQNUdZzwAABxEAABQQQAAAEAAACBB0qnUPQAAIEEAAExDAACgQHgKpbwAgPFFAAAQQQAAlkIAAChDACCKQwAAQEAAACBBAAAAQfOWt70AABBBAAAAQGbmNEPSkBg9AABGRQAAAUUAALRDQHbPPQAAwEEAgG5FAADSQwAAykMAADpEAAAAQQCAqUUAAKBAmx++vQAAwEEAALhCAICIRQAA4EAzMwVD59CWPACA0EUAAKBAAIDcRQAAQEA/2sc9AAANQwAAXEMVRwc+AEDjRUgBqUMA4AVGAACQQiX8uD43y9I+AADwQgAAAEBoE9A+AADAQgAAgEAPmLO8H7mxvQCAoUIAAABA+OZdvc+rbjsAAKBAAABAQZqZnEJmZpVDAIAURgDgI0Y3y9I+AACgQN9MDDwAAFhF67KIPMf6or0AAIA/AIChQiX8uD4AgHFFAAAgQQAA4EAAACBBACAERAAAgEAAAIBAAAAERQAAIEEAgItFe1SaQ9NR2jwAAABAFviqPDMzBUMAAJBCAADAQmG6p73vUw671Lq/PZo4fDwAAFhDkfwmPQAAwEAAAKBAAAAAQAAA8EE3y9I+AKAJRvY5mT0AwP9FUPK4vQAAPkMAAKBAAMDSRTMzjkN7VJpDTU7fPQAAQEB40Qm9sNF1PQAAAEBoE9A+AADAQQAAwEK51si9Jx9IvAAAAECamUBDAADAQiTJmL3YQYO9y5qFPc6bhrwmcBE+AABAQgAAoEAAAEBAxdg7PQAAYEKVdd89AIA2RAAAQEAAAKBAAMBYQwAAgEAAAMRCAAAgQQCAo0WMX8s8AAAAQdzbv70AAABB68vCvS8E3LzfbcU6D3eFvXvMd70AgKNFAACAQDOzv0MAAKBCAACuQgAAAEAAAIZDmplSQwAAuEKage69VPoIvdine70dDSo9AADgQGZmYEMAAIA/AACAQAAAwEEAAIA/AACAQAAAOkUAAN5EAACAQAAAeEIAAGBCAICFRQBAkkUAALhCAABAQO9W3TsAAPxCAACQQgAALkQAAOBAAAAAQda5qD0AAMBBQ+eNvfS2Sbx6Mpo9ALaAO1o15TyHUtE98SnGPLDL1j0AAABAAACCQgCA1kUAwNhFMzN7QgCAFEaTd++9y423vAAAAEAAQONFAADhRdU5jT0Yjq4+AAAQQQAAPUPNTJ9DAED7RQAAwEAoY528I6KAPQAAoEAAAEBAAADgQAAAwEJLq2K9AAAAQFw2hDwDwFY+AABAQgAAsUIAAMBAmplSQwAAQEEAAPBCQELEPKhtub2vH4A9WF8mvGgT0D4AAABAn82DvSrcHj3NzPRCAABAQAAAAkMAAJBDAAAgQQAA8EIAAEBCaBPQPgAAOkUAAJxEAAC4QjMzBUMzc5BDAABeRAAAZEUAABBBmiauvM29gL0vPH+9rHC8vFpTaLvypZS8AABAQAAA4UIAoKdDNEeqvQAAxkQAAJxEAAAAQAAAuEIAwMNDAAC0QsSMELyamdlDAABAQAAAQ0QAAFhCAADqQjNzlkMYjq4+m/LrPTNzkEOjmRU91L0DPgAAgD9PPrc9dyIcvT59vb0AABBBcfupvaOxYj1zVYG9AABkRABAg0UAAJZEAADkREfmgT0AAIpFAACgQAAAEEEAAPxEMzN7QgAAZkMAANJDAAAgQQBAmEUAACBBAACAQACAwUUAQLBFXwvdvO/SOb5nZMm8pP+7vX/lPD0HyIu9Jfy4PrP6ajwAAMBAAAAwQgAAKEMAAMBACseQvT/dFrwAAKBAAED7RZqZnEI72iO+SuzeveA/uT2KUgy9OBnGPZ53x70bt4A99qgqQwAAOkM/FPg9AABIQwAAAEEAoAlGZmZdQwAAQEBoE9A+SKGiQ/ZkBr4AAFxDAAAAQAAA/0Nm5odDAIACRliw870AQPtFJfy4PgAA4EAAAMBBqCnKPgAAWEIAAABBcthdPft7hL0AACBBeXMKvQAAAEAl/Lg+AACAQAAAgEAAAAdDAAA6Q92lrb2kcNZDAABYQivIqr0rVpw9B14fvQAAAEFD3gI9AACAQPcQuL2ameRCAADAQ7A0/j0AAEBAzczHQgAAc0MAgNNDAACoQwDAgUOamTdDAADPQmZmHkMAAABAAACAPwAA/EMAgL1DX8jqvWM9dDwAAFhCAADwQQAArkIAAC5EAACuRAAATEQAAAdDAACAQAAAgEBm5jRDAACAPwAAwEAAAO1FAACAQC9sE70IFqW9sNlku938YD3NjQ+9tBmdPbPrabsbJvE8K/aUvT4nHD6ftOI6BG64vVh7Sj0t7JO7Y2t+PQAw8rxtI4k9YfeIvW1CEj4DBUo9w5wSPjMMqr1TSK69F86yPDQlCz2PxGO9UCmgPcGKFzwxN6Y9ymHlvYtJ7rt4Ovi9xfvkvarJmD2beX28GBvXvWgnmLy7/2Y9jBApvWpOBr6dwSU9fffcvVCjcLsf9c69n4IOPqP2STyi1Pa9s/uSvc1p4j2K4WW9YF1eu89JOj7Gwje8EW2kPXNAk70Ya0w81yUzO/fzljydErk9EP1XOjQFqr3L+Q09OR49PdCHs7yOFbC9T5yCPcrOTDw/l7A9QP51vRV6fTzvBN+8HxtzPTcpn70fmAG9KgVHvGKKfD0QQKa9ApyFvMnajr2Hpbi7U2cvPSdmDL2MvEE9Yu7PPb5WLL3+p4s9pOoMvj9pjDu4ZdA8sz+tvYNpnD3b/I29KR89PAzjpD0wtwS+M3LdvPjn6jyBH469oi/DPeqvzL19Ivc9BCuPvZqFYzzr6pA9ydWHvKX+i70uaxE91bD1vT0xiL1nJuk9GDPXvYBKWj3jW+A91ElKvL5Txb1l/je8n071vB19KD1zf52990nEPM+vWT76Amw9AuDcPH1OgL2Pv6k9uMzduwO6lr3pOhq8ltWNPeTBgb1+NLE9vEqFu0ovuzy3WWK9hHsHPkMBmDyDB4i9ZyCdPWCAnL2rUga9Cwd7vfAj0Ty0dgY92i42PrGEA72T5HS7PY+GvVEgLj34p447D/mFvdJURDyvgVW9BsuQvLAV9z1wBXK8+8BBvV98nL2xpJA9K+UAOjtNLb3b7UI9EFdsujRHHD2eSDS96DHQveE0i7yChlY81/YsvYYoFb0YAJe9QpgNveMJqb3f5q09hti1vLE0O72rqXg9pyObOgM2cL3N/hK9niwQPsPC5D0zp4u7to+2vYWqqTw4ikc9Rk6XvItg/j3D8iO9IeJCPi82Uz3uN6m9Sr/CPCLJZj3NuhU8wiCQvHgFl7u3Tby8Z0qhvc29UL2X1JG6p3KgPA9f4LtG+DU8V2YyuyAM/zyMz7O8vPSbPBU9Ebwqi1y8MrOgPQAAgD8AgKlFAABAQwAA2EMAADBBAADAQAAAAEAAAABAAECnRQAAgEAAAKBAAABAQAAAwEIAAEBApxPKvQAAEEEAAEBCAAAwQQAAwEAAgLJFAECwRQAAAEAAAEBAAADAQQAAoEAAABBBAABAQADA/0UAoAlGAAAAQAAAQEAAAABAAABAQAAAgEAAAABAzRj5vQAAoED6ipK9AAAAQAAAQEAAgLJFAADhRQBAsEUAAPZFfv2wPQAAoEAAAPBCAAAoQwAAKEMAAIA/AACAPwAAQEEAAIBAAMDSRXuQr70AQONFAACgQAAAAEAAAJxDAAAwQQAAwEAAAEBAAAAAQAAAkEIAAOBAAAANRQAA4EAAAEBBAACgQAAAMEEAAIA/AIC1RQDAyUUAAMBAAADgQAAAwEAAwLpFAMDJRaU6sD2UC8a7AACAQADAxkUgMno9AAAAQD0+LbwAAIBAAACAPwAAYEEAAABAAABAQAAAgD8AAMBBAACQQgAAAEAAAABAAAAgQQAA8EIAABBDA026vQDAyUUAwOpFAACAPwAAoEAAABBBAADAQAAA8EIAAJBCAABAQOcGkTwAAIA/AACAPwAAwEMAAEBCAADAQQAAgD8AAIA/AADAQQAAgD8AAMBDAADMQwAAwEIAAApFAAAZRQAAUEEAALBBAECSRQAAgD8AAORDAABVRQAAgEAPOz89H/havSfu7j1qOtS9AAAwQiuw8j0AAM9FAAAAQAAAoEAwQoI9AAAQQQAAAEAAACBBAAAAQACAwUUB1Zg9LV9kvYix2T0AgNxFAACAPziP5L27cKa9n/IzvQAAgEB8e4G9AACgQAAAQEAAAIA/bwcFPRAeeD0AAIA/AAAAQAAAoEBXWYm9OiisPAAAgEAAAEBC59WTvWvO/bsAAIBAAACAPwAAgD8AAKBAAADwQgAA8EL5zxg+AAAAQF+qZj0AABBBAIBxRQIK073nGwI+KI3dPADA2EUAAIBAAMDqRQAAAEAAQBtGFRGgvQBALUbFN1q9AACQQgAAgD8AAMBBAAAoQwAAwEIAAMBBAABAQgAAQEMAAMxDP0GLvQAAQEIAADBBAAAgQQAAMEHiEd+8iCW4PI0QoL3/C+O7AAAgQQAAEEEAAMBAAADgQIVjo70I1hm9AAC0QwAAQEAAAJBDAACgQAAAAEEAAIA/AACcRAAAQEAAAABAAAAoRQCAjkUAADpFAAAgQQAAyEIAAHlFf2qsvQCAR0WXTu28uFPpPQAANEIAgEpFAABAQQAAgD8AACBBAAAAQE+KuD3LLuW8AACgQIUGe70AAIBAAACAQACArEUAAIBA+enGPNtIr70AAIBAAACAPz0iZroAAEBAAAAQQQAAEEEAAABAAIDWRfvQwz1Jn5K8B5eFPQAAgD8AAABAIsC8vVVY9rwAAABAd9qdPQAAwEEDspe9AACAQAAAQEAAAKBAOCq4vTWOSLv3BGK9AAAAQAAAAEAAAKBAAACgQAAAgD8AAEBCAABAQJvkVTssRyQ8q//kPREjmL2dZGA9AABAQAAAAEAAADBBAADAQCPxIT0AAABACRucvUePYLwAAGFFAACAPwDA0kUAAKBAAAC0QwAAIEHKJ/i812DQvQAAEEEAAEBAAADgQAAAAEFJSDk9AAAAQQAAgD8iXJ29AAAQQwAAqEMAAABAAABAQAAAAEEAAKBAAADgQAAA8EKrSxE9AAAoQwAAIEEAAJBCAAAgQVithL0AALRDEw6FvQAAIEEAALRDT27DvV7bxzygAm09eTqIvAAAIEEAAPBCAACAQDcJn70AAIBAPk+iPQAAgEAAAEBAAACgQAAAIEEAAMBAAACAQAAAzEMAAABAAABYQwAAnEMAAIBAAADAQAAAQEAAADBBAAC0QwAAkEMAAEBAAACgQNf9KD4AAKBAs94KvgCAEUUAAKBAAAAAQACAcUUAQJVFAAAoQgAAwkIAAABAAAC9RJ3B5r0AAABAAACBRIrj7j0AAMxEl0MHPgAAt0QAAEBAAAAHRbcpD74AAJBFAECYRQAAAEEAABBBOs0DvbuqAb67UU89kFtTvfp2zD0AQPtF2E05OwAAoEAAAEBAo2XtPQAAwEAAABBBChXavXWinbwAAIA/kz2iPYcxMb1YQfy9AAAAQCofkj0AAEBAAAAgQQAAgD8AAEBAAEDjRQAAkELrx8o99fj6vQAAQEIAAEBCAACAPwAAwEBedoi9AACAQAAAAEAAAIA/Dj7JvAAAoEBcY6Y8pX+OvUbPlb2q7ho9a1fgvAAAgD8wKic9AABAQAAAgD9rNK+9AACAPwAAwEAAAJBCAACAPwAAgD/gw6I9AAAAQAAAQEEAAABBAACAPwAAAEBN02q9AAAAQAAAAEAdVZ+9AAAQQ2RhGT0THaW9AAAKRLyKlb0AAEBAAACcRQAAgEAAAABBAIDcRQAAAEEAAJBDhVelvQCAFEXoQ2k9AMDqRQAAMEEAAOBAAADgQFavCr2rGCQ9ApWsvQAAgD91D0i8ePNavZXshrwHezq9N5++PB9DhL1/Kkg761CCPcSunTx+YCO9tztpPYNrxLoHufa8PYklO30CgbxMJ8s8UyTAvcNCgLyTKRE9cg13vdN6mr39KrM8+SDBvZgcJL1TI3Y8F6UuvUlmK71IXcg9UzyWOyz4rj21pcS850yrvWNlIb0lPG88O3DUvO1svL3nTg89LVROuoN3prxKF5G9q0k6vBwAjr20jS498pbOOwA3l73PGyk7RWCSvf9HkLyvGcs7mMvRvNOFwLqIV0e9mn2rOpXDjj1nE968xNRFPdlsi7wN2J29YhuaOxLTSD2wwSK9jBMEu7O/wz3kbiM9oiHnvA9QRD1bBqI7chpTvbMNbj3Qjqe7B+/+vJPyxr0Psme84p7aO7QEHrx+YrA8HCYJPXVLvLwFRe68iq6MPZOp1L1A5VW8lQmOPdNpd715phE9P9Uzva78Gzz9mEI9pd/+vTZolTwIjd48466nvfDTxz0zOyY8WDnnvOvPhDt6yT28mOEQPaCsar3Eop89GQedPGdB/bx8Lok9XlkGPb9k4bxyY4O9L/u6vE+y1D1rv7O8YxtQPXuoX71UJhc9H8LZPdZWDrwuEMe9U58xPb3YJD3u34W9eIOoPfNy0rvLmjQ8Ls6APa8u4D0ohD69k1XVPeeMPz0ugw282uj0vSvl8zwe55S8J74cvSHvrL26Is891xmevJUp+LxsWJo9RUa4vRMzqz03E4o9oWUhvVNxWL1ucKm7Cj/DPI+Xlbwl6HO9CRESPcDS/T1tAL+7KpaRPagddrwblxm9/TcePdM187wBLSE9v2mCvW+KVj1mCw68uEdZves0XT0UCy28mBDoPecZcT0jnra9n2WcvKYcPb3Q9H47hOYBPaAZeL1/VrY9rMODvO/4ArobRHK9i+JVvO92pr3TSws9wrVcvaJZLL0nv6m9/DAivVAVmjsfstm8m4AKPTp9tLwpEaa9EHJkPUaNgjwX3ai82fUePrWxXbxBPpG9yFlTPejQZb17Qq27By8FPE71CT3zwJq8fTOWPb9LhjuHzxi8d8aLu6YfkT3TG5e81rSevRgmtTyQIMS9FaX0OL3Gdb3FLk08Vm2KvW6AwjzYyim95DofPN/ymr0bi5k8uH/4PT5izDwR8hW8XRwbPZ9DbrzIkF46q6qqPgAA/EMAAEBDAACAPwAAgD8AAMBAMwN+RAAAQELNzEw+AIAURgAAAEAAALA+mpnAQgAAkENitvo8M3OWQwAAgD8AAMBBAABYQgAAgEEAAPxCAAC0Q3LWxb0AAIBAM02svQAAwEJooKw9AABwQwJP0z1mZpVDAGCuQwCArEMAACBBAAAYQgAAMEIAAPBBAACZQgAAgD8AAN5EAADwQQAgPkZIAalDAAAAQLCHc7x6QSk7DYPmvAAA8EHsNco9AAAAQ/aoKkM7sAc+OcO1vQAAEEEAAMBDAADwQgAAzEMAAABAAACgQAAAgD/x8PA9y7gePQAAgD+j73K9yjndPQAAoEAAAIA/AAAAPQAAsEFm5odD/mIFvefJuz0AgGVDhuO0vQCAFEYAAE9FAACAPwAAgEAL/Ko9W+ejvFLsVz3lkDS9AAC4QgAAoEAAAIA/AACAPwAAIEEAADBBAADAQgAA0kMAAIA/AAA9RM0sFUQAACBDAABAQAAAgD8AADBBAACAPwAAoEAAAABA0kKJPCvzZLzTJZI9JPsxvQDAAUQAAKBAAAAcRAAApUTzDtg9XW3XvQAAbEMzM45DmplSQwAAEEEAAGxCAAAwQgAAUkQAAMBAAAAAQCjepb0CLc+91fu8vAAAsUIAAIA/AAAAQAAAEEEAANJDAADAQAAAykN79qa9mplAQwAAQEEAAMBAAADMQwAAAEAAAIA/AADYQwAAW0QAANJCAACQQjMzHEQAAFJEAACAPxIggD0zM/tCAABAQQAADEIAAEBAAACAPwAAgD/pYrq9IC6qvAAAgECBlJS9AADwQl9Uxr0zsVe9AACAPwAA/0MzA35EAIDlQwAA4ECn3Qi82mrjvQAAIEGVTnC9AAAoQgAAQUMMcAm+AADCQgAAwEBbW6q9mhmPQ3VdkjwAACBCMzN7QgAAgD9BppK9AAAoRAAAQEAzM7JDAADgQAAAw0QAALpEAACIQgAAgD8AAM9CAAAQQQAAAECamTdDZuaHQwAAQECtLSQ9I6vvvAAAgEAAIN9DmYgPPgAA3EMAACVDAACAPwAAYEIAABlDAAAAQwAAWEIAAEBBZmaMQ2bm6EMAAD1EAIC9QwAAgEAAAMxDAACAPwAAKEMAwGREAACEQwAAgD8AgKxDuF6YQwAAAEGym6q9AABAQAAAgEAAAChDAACAPwAAMEEAADBBAACQQmZmXUMAAIBADmCtPSha/z1HFxq8VF8mvPkFgb3unQO9T8GhPQAAgEBXlTM9AACQQgAAAkO/1qS8/lUzPQAA+EMAAEBAAAB5RQAAgEAAQJJFAABDRQCAO0WamVJDSx6pPAde1j0AAHhCAAAAQACAU0UL1Mm9AIBTRQAAyEMAAIA/AABgQ3wJvj0AAIA/AACAPwAACkQAgGhFAACMQ1BgYb1IYBs7AAAWRAAAMEEAAIA/AAAfRQBAkkUAAKBAAAAAQAAAXkUAAIA/AIA2RAAAwEAAANtEvUddvGsXIb02DoW8yqzZPT8Okr0Ryw69o1yIvf11aj5lQHW9A+/0PHE8tLzbWay9NDI0PfKrSb0X1p88BBORvb1kXL37+qU8EiAWvaTExr1oaHi9NLMjPcxvmTrDbiI9EkMAPbbOpLygBNO7TDwnvb+9lrwn6RY9kgxNPC5WzLyAo+24gt12vb/q8D2XH0w9NY8TPIPDub1VvfE9tvrGvPzagb0Oah49EVW5vLRzxL0dcNg8gNwHveUQJz3iHe68aJ9MPIcYxD0bdjA986ywujtk1D3rJak886opvXAh8Dp/mIw7WtxRvEBSZz2Ceoe9o0hxvZ/9iLzwkEq7w4q+PKcf7zwqJQc+50CXvHNUVD3ulR+9pnq0vY8Tkr2ueAo9smllPOxXAb17leW8I13GPeAj9Tw74mq9aPqQvX0umDyMfou99FsUvJsihL0Tzyq5wDt2vYJPVDrX76u96wQovdqwIzs6PX69+HaQvMqi8j2/l/W7y48SvcEBvT1l3V08sHzXvPuclD07gzA9UNA6va23UT3d3OC7hpoOvBE0mTzXvna9h/nLPRtgI71xTAs9JcG6u1Wp8T02qi29Pxq2PYqswb3QAbg7eB71Ob48Er2hy6s9MCfXPESyPTuNrl89Ag8RPScpHLxvhiY+31AJPYKmk70zaQy827gCvFi2Kjv6msy9e1p+vKbOCj5xe4u9vxEsvYPBoTz/+Ii9Xcv/vEjK5D1tjv88D4WWvQ+kED061fA8q77RvcwisT34Zl+7vYSfvSsbjzwTJ7M9g/IOPOneBLz4xmE8V1i8vHCBfzoAAAA/AACAPwAAkEMAAIA/CCEEPgAAgEAg4NA9AKAJRgAAKEMAAPBCAAAAQIqDpL0AAIA/AABAQgAA/EJoE9A+AAC0QwAAgD8AAABAAACAQAAAgEDnZr09AAAQQwAAAEAAgLtEAAAAQCX8uD4AAIBAAIAvQ6gpyj4AgL1DAADAQApXq0IAAABBAACgQAAAAEAAAJxDExRZvQAAQEEAABhC2BeAvQCAL0MAAElDAADgQADAmUUAgKFCAGAQRgAAIkNoE9A+AAAAQAAAwEAAAMBAAICCQwAA4EAAAABAAACrRAAAxkMAAIA/AAAwQQAAgkIAAKBAAACgQAAAIEHTAdi9BsnKvFwPCUMAAEBCAABAQQAAikSA7vI9nerAuyK8UDu7XLQ9AACxQliIqr1cDwlDAABcQwAAgD8AgAJFAABYRfeEAT4AAABBt+GMvZqZ20Kj+c09E86hPQBALUaaGY9DAEAbRgAAgEAAAPBCAACQQoo8br0AAIBAAACxQgAAAEEAAEBAAABAQAAAOkUAAIRDAACUQxiOrj4AAMZEAACcQwAAAEAAABhCOqyZvQAAAEEAAEBBAABAQAAAwEAAAABApTS/vTfL0j4AAKVEAAACQ+miiz0AAIA/NzmLPF8hB7wT0qE9Fs6zvXNvMbwAAMBACSpLvQAAQEAAAIBAAAAHQwAAgD8AAIBAAABAQACAoUIAAMBAAADwRAAAJUUAAOBAAECARZ3abL3Tc6M9I2zwvPAzkT3VSb69yh5ZPEnLyj0AAEBAAAARQ5qZQEOoKco+AAAwQQAA1kLNzPRCAADAQfXy7j0AALhCAAAQQwAAlkIAAEBBAADwQgAAgEB0Za49AAAAQABgrkMAAKVDAABYRACAaEUAAHxDAACAQDNzkEMAAO1EAACgQAAAHEQYjq4+AAD8RAAAgEAAAEZEZqb7QwCAo0UAAIBAAAAAQOHIrTy36JM9mayKvUQVGT0AABhCAACQQQAAkELoI7Y9AAAdQ9ivib2S9La9f5sUvflHDj0rK4G9AABAQgAAtEPX0LM9n2EDvS4QjL3cVoo8KxkKuwi/oj0AAABAmpmcQgAA4ULaw5o9AACAQNXJpj0AAABA/ugzPQAAwECHVf68ZuaHQwAAoECamZxCe1SaQzfL0j4AAOFCAADeRAAAAEAAAE9DAAAgQQAAh0QAAARF7Zy0vQAAgEBQlFG7hreHPYOQyzxm5hNDAAAgQYuTvT0zs3VDAABYQjMzBUMAAEBAAADPQluTtr1jTrM9AADAQgzpFD1BgB+9AACuQiKjqb0AAEBCjpEePgAAMEKu4TE9YULCvdsOvLwAAGpDVA23PAAAS0MAAEBCMqv4PAAAMEEAAJRDAADnRAAA6kIAgKlFAAAQQQAAMEJcj6dCAAB8RQAAnEMAAIBAM3OQQwCAR0UAwMZFAACAQAAA20QAAPZEAABYRAAAQEAAAEBBAACAPwAA4EB4v2A+AABAQAAA4EAaRQk+u4rauQAAAEAAAMBAAAAAQM3sI0QAAGRFAADKQxYnDD3wil69eEJ8vauEtLsAAABAAAAAQLvLvb3mLYW7AACgQsPqvT0H66m8ctqYPQAAAEAH5K29c1V+PT9gg73YV0y9uJFUPagbqb3aG/m8XqYGPTUdN718nrO8909Xui9zgrxHSGG9Qxx4OgqK3z1QnAg9e5W4vN+ev73S85A8Y67SO4CtED79F/+8RC6hOzGIyzvLOAq8w2W7vPJWuDxFQvq7s6OmPF+g7b0lDcG8Ey1MPZJ77DpSkva7KoNgPL8e2j0bYd483Wylu8dMhT1IqAG9u9YoPVelHb0Fr+C9xdjSvCAMfD1ByLu9pQbyPGI2tT1VcmG9ELBoPaoeoLyPEDm8iGifve/36bweYo090+DfvOcbDzsrKCm9Y+/qPUkyqzt4XF+9zcSnvbJK0rxKLpK9opdWO5n1GT1zXhg+Tc1jvTA0aD3UjKW9Y+tbO3/h2LtFUVk91ErLvZq8wbwu6xS9k1JnvNVUib2whtU8wP/APFNg6rzzXE09e8oIPMjFyDwkDo69xK07Pad7uLxXwX49HkGVOz0MXD7/qiI9s6mBvG1ylb1N72g995aAvYaAhLvwn+28rh6bvb6hRj1BfqO7YhygvdPmMD5qt5A8yGCqvT0fPzyfA+k9f5bVvAHGB73S9Os91l25vSRYIL3n8qg97RqKvaZ9iL23dYM8GJtvPc8GALvPD7e9+knEPBIqKL1XPDc9PD2OvZuh0DvOCiE9JmOhPTg79LrtZke893KiPU0ZdzvN1/o8S2OUvc81p7277JG7o4qovVNDBj3akcg81nqGvQAAgD4AAIA/AACcQwAAgD/RC709AACAQAAAgD8AAHBEAADAQAAA8EIAALhCAACwPgAAAEAAAHBEAABGRACgCUYAAIBAAAAoQ4MQxL0AAABAAAAgQQAA4EAAAJxDAACZQiFquL0AAIRDAAAAQTow0j1BZwM8Jfy4Pq/btD0AAFJEAAAAQAAAcEMAAIBAAAAgQQBAkkUAAAA9AAAgQQAAAEAAAEBBlz2oPrHc0z0AAPBCAIBHRZj5c7z32JE7AACqQu6KIL0JBx49L87PPWZnODxtVuO8AAA6RAAAakQA4CNGAAD8QpMjk7wYjq4+aBPQPgDAk0UAAJBCAADAQQAAYUUAAMBAAAAwQUeLnL0AAFJDAACAPwAAhEPLRdK9AAAoRDnNnb3AnkQ9Jfy4PqYSRjwAAMBBvEEHPcwZG716RAA+swuKPAAAkEKl5649AAAAQAAAAkMYjq4+AACBRACAoUJoE9A+AGAQRiX8uD4AAJZEAADAQwCAh0QAQJJEAADgQACAh0Qzc5ZDAADSQgAAAEAAAPBCAADPQwAAoEAAQJ5Fzcx9QwAAGEIYjq4+AAAAQPqT4LstgYG9U14+PbJzlb2uhRO8fZtxPYhMqbozi4m9AABsQpCWJDws14+9alpfvQAAIEEAAC5EAAAiRAAAAEBmZh5DAAAQQQAAmUIAAEtDAAAAQGOXVDwyHr69AACAP7BviD0AAABBAABYQgAAGUNoE9A+VSfDPSJ2zLtYBxA9u+DwPQAAwEAAgLtEAAAAQQAA4EAAABZEAADtRAAAgD8AwJlFAACUQwAAgEAAABBBmplAQwAAMEEAAEBAAADAQpc9qD4zs79DAAA3RQCAcUUAQCtEAADPQgAAgEAAAGZDAACAQAAAAEAAAKBC4B49PVNpsb1m1ca8r9y6vcqzB70D3Jc9RWVkPWqxz7yXPag+AACAPwAArkI3y9I+AAAAQAAAAEE3y9I+AAAiQwAAgEAAgKxDAACUQgAAWkMAAIBAAABMQ6gpyj4AAIBAifofvFuFuDwsXIs9u9WhvXMIsTzMUMs9t8ZlPQAAEEGaGY9DAADAQAAAoEAAAEBAAACgRAAAAEEAgCxFAABAQNcY2T0AAIA/+QZKPLCB3z0AAIA/AABPRTT+oj21pWq9eZQVPVNR9D2amVJDVwoOPoh/pb0AAOBAAAAAQAAA8EIAgC9DAACSQ47UHz3appq9/eC6vVbMt7wAAEBBAACCQgAAMEEAACBCAABYRQAARkQAAABAAAA6RWgT0D4Yjq4+zcwRRKgpyj5oE9A+ZuY0QwAAAEAYjq4+AABAQZc9qD5IgYBDAIDcRQAAgD8AAAxCAACAPwAAwEI7QEk8k3w2vHcP3b0xnaO8cgBdvILvVzutcAQ8IN+iPYBS/r0Nf+88+vscvd94SD02L7u9Np1HvPch7j3rORS9aLV+vdzaEj2Lgcm9JpkoPId28Tyo6xQ+g++5vLDESD2JJY2924ldvACEDz4TvXy8B2NTPSNBs7xLirq7kDGAOygJLDz6+Nu9T7bHPWuSKDt3PRq9M0sMPcQYpDzDcLW9cS+sPVMPb7yzETI8kIQLvaTvpLs6LY09spJpvVZHGL4rw2i997mTPVfPY71FGtk8Z5fQPfrxCbzrkVu9o3IuPQRqO7wQ59w8xQ37PF8KSb3aG6O9RbU1vYBa5TxgfCu8BQ2fuyWcwT3LoYu99FgSu4TdKrwwH4m98sHcPe8q4rmNA2m9M26CPZ3mWbyFzK69oeiCu/D+7DxPeZU8OwY7vZ4DAT3i0WC6d8a4PcPttjwg3na9UKOhPSi+sD3sqgk9MJi0vPf6pb0v7aa8LxftPJ+wOz6O/Iw9m5NAvRBzgD16P8a9c4kWvCVMcLx6bxE9b1AYvM8SXz1DQ4U9H/2PvV9R2j168a47iW2bvccWUTyjGIu8o1MIPiCCF72T7sI9IMqTvY4nm7xU+MY9HhwIvQAAQEEAAIA/AABuQwAAoEAAADBCAACAPwAAMEEAAIBAaBmbPQAAUEHXKiY9AAD+QgAAgD8AAIBAAACAPwAAgD8AAABAAAAAQAAA2EHD9wW+VHarPAAAwEAAAIBAqCnKPgAAgEBTF+M9AACWQwAAIEG3PJM9JBCOvQAAQEEAACBBAACgQJ38tL3DP5S8N8vSPgAAmEIAANBBAADgQQAAMEIAgIZDAAB5QwCAkEMAAHlDAICZQwAAgD8AAIA/AACAP6gpyj4AAEBAJsuCPQAAAECnTqe9AAD0QgAAGEIAAIRCAABAQAAAAEAAADhDAADIQQAAoEAAAABA6gKxPQAAoEAAAIpDAACAPwAAgUMl/Lg+aBPQPgAAQEAAAEBAhvrJPQAApEMAAIBAAAAQQQAAgD8AAABAAACAQAAAoEB/YMU9ytKuPAAAgD8AACBBAADgQAAAAEEAAMhCAAAQQQAAFEIAAIA/AACAQAAAAEAAAPRCAACAQAAAwEC1nmG9AABAQAAA4EAAACBBUEDwPQAAgECoKco+AACAPwAAQEDG1Mo97RXqPACAiEMAgKdDAADgQAAAoEAAAIA/AAAQQQAAikMAgIRDnFmBPQAAAEEYjq4+iz5pPAAAQEEAAEBBAACAQE+2vz0Yjq4+AAAgQQAAQEAl/Lg+Z5BePQAAgD8l/Lg+AACAP6gpyj4AAEBAGI6uPgAAAEEAAEBAAACAQDfL0j4AAKBAAACAPwAAEEEAAIA/AADgQAAAoEJoE9A+AAAAQI8GwL0AAABCAAAgQQAAeEIAAIZCAABQQQAAQEIAAJRCAACIQgAA6kIAAEBAAABFQwAAoEAAAKBAAACYQQ0xML0iEMO9BQm6PJL2K70AAMBA93KDvVGVQL0SvlI9AAAwQaayQTysa7+9+wm6OgCAhkMAAIA/gzmYvHsQwb0AAKBAAICqQwAAAEAAABBBN8vSPgAAAEEAAOBAAACAPwAApEMAgIxDAAAAQN0aarwAAIBAAACAP6+mBz40eyI9UoYzPa+QBj7tgWQ9AAB+QwAAgEAAAEBAAACAPwAAoUMAAIBAAACAQAAAoEAAADBBAACAP0Mygrzvy7Q841EePgAAoEBoE9A+0sTAPAAAgD9i99E9AABAQUoGJb2QRs88aBPQPgAAMEEUnaO8AAAgQSX8uD4Yjq4+RVV1vQAAgD8AAIA/AACAPwAAQEAW/AY9QXAgvQfuID1Fn+m7f/mZvQAAoEAAAABAAACgQDfL0j4AAEBA0JXuvAAArkIAAKBAAAAAQGj6zD2dm2e9MYCRPQAAsEEAAOBAAABAQAAAQEEAAKBAAACCQl8KT70AADxCD/eyPQAAAEAAAOBAAADAQAAAikIAAEBAAACgQAAAlkIAAABAB4X/vQAAgD8AAABAAADAQAAATUMAAOhCAADGQtFHkrzjdpc9qiNyva9QGryPnJw9qc6fvPb4qr0Jr7C8AACAPwAAQEAIooS8OApZvQCAmUMAgJBDAAAAQAAAQEB/K1G8N3OgvR+kuj0AAABAAAAAQAAAckMAAHJDAAByQwAAwEAAAH5DqCnKPs7ysD0AAJ5DAIDAQwAAAEAAgJxDAAAAQR8F6T0AAABBAADgQAgl9b22cye95+XjPAAAgD9oBmw9AACgQAAAgD/1Yts9EI9bvAAAQEBHlKs9Z8mvu4iVH7vfsCG9fdmPvIv0Dbs7cnC7TUOAvPPqFD2Fz0q8R/CevLeIzb1NhZO8ND+vvZerMbzjUMq8mMqPvWJPKrz145q8yBegPYq3Kz3eohS9HQmuvcTBl7y3c6w968I1vDQkibzh9ZW984uRvc+bTT0D7OM7WKbOPdgNlb02Vb47Mn90vV74hD1SotC89zqzvSmXCTqSFXU9zyhJvJiWjL3dzzw9z97uvEn7t717m4g8SdiLPMhpjD3DQ4W5gLmaO8eBa71xs5s9YLgSvcBh6DzP2x68V3cGPTDn4bqGFKy9O02lve1m2jwXZvk95rVLvGsuI73SLGm8E8BvPaL5ErwzJ8Q9MyH2PIg+gzy4aPW8YY2iPMVXQzsvHTm9s1SdOWxJwzsHuQI+uQqCuzVwMr2/Ztw98yXLvOLo7ry7TSk9/xWJPfaNnbtv6tg9P2B9PMOGMD07wiW9WGWuvfLslDxQqug9b0eAvRM5DL01Qos9CvELvWocaryowU69YhDaO1BlbT1P/C67t2uXPZVnZr3HCtY8g/ACPnPvnjyttsW9pbLCPLpYxT1SFNG8FwmfvSc6AT68rEo9MDgkPQgM9bxbSGY9YJO2vEgi3r2LIiU8uwKPPWfp0b3D2v09zeQ2OxQpib2z4QW9U803PDfBtbznlkE9QmnkO3Dzbb1+5ks9t3hgvS4KvLt/jpe8qw+sPcKViDty1829HtyzvFsYkj25zB696F0nvme96r2/8CO8O9+8u1HWiD3th1S9diwhvOmiiz4AABxEAACQQwAAgD8AAIA/AADAQDMDfkQAACBBL6G9PQAALkQAAAA9AACwPgAAgD8AAKBA5679PAAAgEAAAORDAADwQgAAgD8AAMBCAICpRQAAKEQAAIA/AACgQiezlr0AAIA/AAAAQR8Hzz2lusw8AAA9RAAA2EMAAIA/AABAQAAAGEI5XJq9AACAQAAAMEEAAIA/mhmPQwAApUUAADBBHAXDPAAATEQHOHE9AACAP/0p8bwCxmo9QaTCvPJ1tj1hR6Y9L1dAvQAAgD8AAChDAACCQgAAAEAAANhDAACgQAAAgEAAAPhCAAAMQgAAQEJsbyi8Yp+JvQAAwECf9RW9AACgQAAAMEIzM45DAABAQQCAoUIAAFJDAAAQQQAAgD9CXv28cjjUvQAArkQIIQQ+AACAQCnXvL0AAIA/AAAKRAAAAEEAALFCAAAKRAAACkQAAIA/AACFQgAAQEEAAJBCAAA9RIugYz0AAGxCAABzQwAAwEAAAABAt3yuvQAAhUIAAOBAAAAgQQAAKEQAAABBAAAAQAAAoEAAAHxDM8MEPgAAgD8zM7JDAACgQgpXq0IAADBBFK5uQwAAIkMAAIA/AACAPwCArEVz/C49W5TQvImLFLwdaJ+9AACAPwAA8EMQW5M9w2mHvdis7D12ghs8AACAPwAAwEAAAIBAAAC4QgAA5EMAAMBAAAAERAAAQEAAAIA/AACqQpatjb0AAKBAzcz0QjMz+0IAAABAAAAgQ2bmNEOWcio9AABAQAAA/EMAgGVDAADAQAAAgD81s5m94mqGvJGmtz0AAIA/AACAPwAAgD8AAEBCu657vbKQBT6adZa9WlKIPKbuRj4AAIA/J/qMPQAAgEAAALRCkEz3vQAAgEAAAIA/AIChQwAAyEMTrpM8vAUfPgAAEEEAAMZEAECVRQAAwEAAACBBA4CtPQAAwEAAAKpDAACAPwDAukUAwNJFAACOQoN34T0AAOFF7y0fPgAA9kUAgIVDAADkQwAAf0PN7CNEAADAQ7fztb0AAChDAACAQAAAwEIAAABAAADAQQAAQEDNzPRCAABqQwAAoEDNzMdCAABYQgAAwELN7CNEAIDTQwCABkQAAEBAAACgQMtjEj4AADBBAAAqQ1yPp0IAAEBAAADAQmZmwkOnJac7AAAAQQAA6kIAABBDAADAQgAAFkQAAKBAckKXvQAAoEAAAEBAAAAlQwAACkQzs79DJKoaPQAAgD8AAMBBAACCQgAAgD8AAIBAAACAQBM/27ynX2A9gPGyPDd/1T14qoY9BfGCvAffmj35/QW9r+yjvQAAIEEAAJlCD5XFvQAAAEDNzPRCAAAoRAAAgEAAAIA/AAAAQAAAgD/NrOFDAABAQAAAw0QAAKBAAACgQAAAgD8AQJ5FAICjRQAArkJmZi1DAACAP/8aKb0AAEBAAACgQACABkQAAABAM7MaQ2bm6EMAgMFFAAC9QgAAQEAAAIA/AIACRgDAyUUAgPFFAACgQMf8+z0viIG8L9o1PU/3lrzs6UO9PTrIur8/Lb0w0dY9TWybvAFVBzwPdna9kg55vQw4nj2CU0M+jzDFvAY8tL2sXxC9gewkPRN8Wr14U/+868upPTETmLtBSKW8MBoOvdWi4D0DkB69M6Knve9Skr2fU2Y93lILPH/syj3hrUE9hCkKPC1Qib27FWo9V+oAPEI8vD1zn8E4/SBvvXKJCb1bdLA9g4o6PFLoPrzn1mi9psoKPY8QNT33VA4+63z1PFaXozsb0Bu9fffnPOTpgr2nhem8oyGwvfNNB712MUQ8NmYkvcIotryFyaW9wdYku7LQvT1NxQ09HNw4vVWnmL1nMaE8KnmrvShsAb2LhCu9vw/TPLHPgz16p1m9LI+0va+KtLyCN3E9O8sSvVM/iD3fNVo+T2OjvV1xZDu+IDm899hfPZVK1Dur0nG9VbWRvcPIVz0LHbg9pPCPu1pkfb1nWCc9FW/JvLsdob26qYO8ysSvPHjGLL2bnLw8g89vPd9vvbyjsAI+hwB9PZEVjT1jCeS8gIcvO0vC6L0Sf2e9M0sGPi0WtzyP7qS9w5KwOxa0jL2I7q49ARUJPKvpsTz0W5m8i6ABvEzqHD3DhPs98CfJvPRAqr2yJOQ9Yo5xvc66Q7y0hsk9p0gyvVwmBjpxikI9RaLovdA0ILw/f928oNz/vSqXEr4KryW9uCsbPmiPiTzlJ1890QSsvb3K1DwzQAC9ON5/vI9Aej1teDu81QsiPrgpMD1VGn28ne0qvd82Aju30Ly9SuNiPBJXpb3vKYO88znHPY/tb709uma9HLUSPZhcgT19Ftu8eufOPWJjXz0kp8O81xVTPQAAFkQAAIA/AEDjRQAAQEIAAABAAACAPwAA7UUAAIA/AAAAQCX8uD4AAEBCAAB5RQAAgD8l/Lg+AIACRgAAgD8AAIA/AACQQgAAgD8AAEBAAACoQ2gT0D43y9I+epP+vYuOzTwAAHxCAAB4QgAAQEAAwOpFAACgQQAAgD9oE9A+quyQvQAAgEAAAABAN8vSPjfL0j4AABBEAABAQAAAEEMAANhDAADQQQiOZz0Yjq4+KruOvQAAQEAvpF28AAAAQACAU0UAAChCAADAQgDA6kUAQOZFAEDmRTfL0j5oE9A+N8vSPgAAAEAAoAlGAACAP2BU1T0AAABAZ5GKvQAAwEGXPag+aBPQPgAAgD8AAJxDAABwQwAAgEAAAEBAAADwQhiOrj4AAIA/AACcQwAAwEEAAORDAACAP+Iddj03SYS9AACAPxmvsL0s64a8AACrRAAADUXtHs69AADGQgAAcEFoE9A+Y1XjPQAAyEIAAIA/AACAP/J+eTyDTaM9paOAPQAAQEAritk9/zoWPQAAgEAAwP9FaBPQPuXkqz0A4AVGAEAbRpc9qD4AAIA/ukJgPdCL3bwYjq4+Jfy4Ppc9qD5oE9A+AACAPwAAgD+oKco+AACAP91Xv7p6JXe7AACQQ5c9qD4AAIA/AACEQzfL0j5i0Zq9Jfy4PiX8uD5oE9A+AACAPwAABEQAAIBAi2YwPQAAgD+gHXy9vJwavAAAwEAAANhBA0t5PBUK57wAAFhDAACQQiuW5LzB6IQ9AACoRAAAt0QAALhBAMDSRQAAgEKoKco+AACAPwAABEIAANJEAAAAQDfZVL0AAE9DAACAP4OLjr3Pide9CxS4O2gT0D4AAIA/AIDxRQAAgD8AAEBAAACAP0BeCb7VFCS9aBPQPgDgI0YAAIA/AAAgQp/ZWr1oE9A+AEAbRgCAFEYAAIA/AACAPwAAgD8AAMBBAACAPwAAgD8zHo89AACAPwAAwEGfhJe9AADAQQAAQEAYjq4+i4kKvYg97zw2lbE9aBPQPgAAgD8AABBEAAC0QwAAWEMAABBDKi+SPQAAqENoE9A+AACoQxiOrj5oE9A+29CMPAAAgD+oKco+AACQQgAAtEPyJnG9AADkQwAAgD8AAJBDAADYQwAAkEIAAABAiouSvQAAMEEAAIBAU5PCuwAAAEAzY2G9AAAAQDfL0j4AABBBqCnKPiX8uD4AALpEJfy4PgAAcEIAAKhBAADIQfCZIr0dht09AIBxRQCA0EUAgNxFAAATRdsUyT0AAABAeZervQAAXkWHau69AMCTRQAAAEAH+ZK9GI6uPhp0Pr0AAIA/AACAP3ssnr1oE9A+AACAPwAAgD93ts49eFgbPAAAgD8AAPZFBXROPQAAgD//jrA837OkPW9BgL1oE9A+AABAQABgEEYAQC1GAIC9QyX8uD4A4AVGAIAURqt+p71oE9A+lz2oPgAAwEEAAMBBAADAQagpyj4AAIA/GI6uPgAAgD+oKco+t60LPAxEtz1adVS99RYBvEsSljyLNfq8B4lAvSFljLtoE9A+aBPQPgAAwEHJaJG9AACAPyX8uD4AAFhDAADwQhiOrj6XPag+AADMQ0Ghir0l/Lg+AADMQwAAQEMF8I29PRmouwAAQEO4o4O9AACAPwAA/EMAAJBDAABwQwAACkTvSXC97XSQPUZ4yr1gNy29jKLLPQbPGD0AAMBCAADAQgAAgD/hXhe9GI6uPgAAwEMAAIBAAACAPw5hmjz3jay9AACEQwAA2EMAAJxDAADwQxiOrj4Yjq4+rZqVvX290DxzTH49J690vQAAgD8HJby9AACAPwAAwEJnvny89EqwvQAAKENKAh89AACAP/O8wD0AAABAAACAPwAAtEQAAIA/Jfy4PgAAgD8AAFJEq6bZPcVt170dsNs9AABAQQAAdEJp/MA9nyKcvRiOrj4AwMlFW/q7vQCAgUOXPag+aBPQPgAAikQ7owG+cBNsvWsRHT2x9so9OkCjvQAAOkWliuG9OphyvQCA0EWIVKE9AEDmRfUZvT3LI6g8AACAPwAAgD9KJPu8Zz5HPU3Ubr2oKco+AAD2RQAAQEAAQPtFAAD2RQAAgD8PpYg9uoX7PEMIzrwAAIA/NReQPQCgCUYgmY49AKAJRmJ0qT1CUMI9GI6uPgAAgD+rpow9a5kYO/gl3z0AAIA/2gJpvTLzYr3vi4g8Ct6rPFdTsbxSWzK9AEAtRipfuLvY2Sc9ICxTvAoWYb0oXxi9xXLTvDOzAr23Q4m9tbrcvFf3FLxgoiu94a3DvEKsTrpIY/w8m+acOUrGNr3I/W28CpXrPDVJIztH1YC9M3AIvTZQvjta3WY9MAxgPGvp2LudI4A8LBaFvHTfBL3LIe68sgZaPcWOiD183B49R02BvCM2gDy69/q8LXflPO3/mLwnE6u9/y+TvJCvFb3Syhm9uJ/6umA1Qz06VXY84K7KO5/OgT0+caq6J8uYPIZaHbq7xsA8akemuuhIQj2nr/u8HXkKPU8a2rxHlt27QIZHPP8Fq7yvLde8Pal8u+g40jv3MBa847+EPOVzrDr/DZQ8Ay5AvSUu7Dwmxck9lXrNvLd5Rj34nJ29jqTBvCEHRzxv8yO9qBePPaW7OjtSgqi98/sFPTWZqz32BqQ7Cj6Svfpz1zw5DyQ88nmgPaM5AL3fsY088zNvvVV7a7sqzd853q2dvfOuGT1Gt7Y9DifFvXMJfD0joaw8EHNTvZodf7227SU7QvPAvKuMpD2rQ2q7Q0CDvZvyLb0lI4Q9jxugPTtGZ71/sdM9y2doPRAkqbw1Svw8gxSHvXGZErwwxuu6Y2/Bvefj5LnnosA7NDyjvSwcAD0W4Y29O/hNvJM5iL3d7lc9Yxq3PdD6fLuPAiy8dXqyumu7xTz6dbA9OMcOPOewCb3VCcQ9gJtoux97iL2CKeg6SJI6PfPXMr2rZv+7Als+vWQntr2QENQ8s6IYPTnCGL2q2048PtGrvHP+Djt398s8rq0wPf7xFb1b0I89ZYQSPRc2/7u66Rq9WKPQPK3UKbxhlwo80K4evQAAAD8AAEBBAACAPyX8uD4AAIA/MwN+RAAAQEEAAGxDAACgQAAAgEAAAMA9u5POPQodgDsAAMBAAABzQ5qZQEMAAJxDAAAAQPPL3T0AAIA/AACAQAAAAEAAAAVD5DgOPwAAAEDvgqY9kAVePAAAPUMAAFJDM3OWQwAAQEAAAPBBAABgQgAA5kIAAMBAAACTQwAAgEGoKco+N6rhvQAAYEEXTC28QxxGPT6KCrweTLK9LoeMvAAANEMAAABAAAAAQJqZUkMAAABAAACAQAAAgD8AAIBAAAAAQQAAgD8AAKBAAABsQhss8L2d0wU9AACMQgAAeEIAAOZCAACeQ2amu0MAIIpDAABgQfsCa7sfii27AACAP/aoKkMAAIA/AABAQAAAwEAAAIA/AACgQN4qnD0AAMBAAABzQwAAh0OCwma8T5QfPgAAzEMAALBDAABAQACAh0QAAIA/AAAAQAAAMEIAABBDAABAQAAAAEEAAABAAAAwQQAAgD8AgKFCAAAMQgAArkIAAIZCZqYORAAAAEAAAIA/xt2nvQAAYEEAAHRCAAC0QzXP/7sAAIA/9wiCuwAAmUIAACBDAADgQFSTIr387sC9XNetPY8PFL2FMdK8Q1tFPgAAgD+CS8695Rd6vbTEjT0AAFhDAAAAQAAAgD8AAIA/AAAAQGbmh0M4O2S9MzMcRAAAgD8KpJ69ZuboQ62Tm70AAABAAACAPwAAAEAAAIA9brEPvXetFT4AAIA/AABgQgAAwEJoE9A+AAAAQQAA4EAAAIBAAACAQCjr/j0AAIA/AACMQjOzGkMAAFhCAAAAQQAAOENcj6dCAACCQgAAmkIAAPhCAAC4QgAA4EFmZjBEzUyfQwAAQEM9Js49AAAgRAAAAEAAAKRDq01bPfr8jL0zsxpDAIB4QwBgrkMAAMZDAADYQar2uL0AAIA/BEy9PTMzBUMAAEBAAACAPwAAAEB36sO68cOwvVswhrx8wZ29oB97PQCAZUMzRjI8U2kmPR1X7TxmZoxDAACAPwAAQED9ygk+AACAP/fJiz0HXza8Vc4YPGiQZb0AALhDAACAPwAAgD8AAD1EAACAP8eNlz03y9I+AACAQAAAQEAr87Q8ysqxvWgT0D4AAIBAAACAPwAAqkK+baS9oPDuPQAAVUOfCCu9AAAgQgAAAEAAAABByaA0vQAAgD8Hjby9AADAQNTHBr1Ty0A9aBPQPgAAgD8AABZDAICsQwAA4EIAAAhCAACSQgAAQEIAABhCAACQQgAAH0MAAIBAAABYQgAAiEIAAAhCAAAAQAAAHEIAAIhCAAC0QgAA7UMYjq4+mpnZQwAAKkMAAJhCAABcQwAAIUMzA35EAACAPyLpbD36rKE7r/R7vc993DzI54+8L5TIPTMz+0IAAEtDZmZdQwAAUEMAACBCMzOyQwAA0EIAAMxDEy2RvSMotTtvkq68n0RoPYRLg7w31Do8PzeZvcGKoTwGV7Q8SVwDPsSwgr3BzAs9vO6uvXdyhjzT+Mi9IuhKvNczdr1z82S8Swr6PXBK0ruXLwA+L3cBPfCWgTwg//c9UstWvfu8hz2FZRA9l0AMvVjw27zzG6G9UzMzvbUeCz2Dz4Y90kXkvKe88zwqoXS9rwvVu+Motr3n/1Y9eYCVvcFBurx660k9glbtvP9ZIry4pdi8XRcEPgoylT2rgrK8ocXBPXcKczxbzMm8uCnAvddXrz26nAO9XI6BvJgCPj3smL68SUqRvSrhcL2BVbM86jkjO9/AEr25LT28Y9PkPVX6jL0mspg6JXwVPSX6JbyLvTA9Ap5xve9heb0j7dW9t82LPDXN2rw6yZW817ZLPQA5MT0n+Km9ZSiqvb0l2j1kASC61MWfOxrM6ztHb1q9iArzPc7sqDs1Pno9531vvWOeEz7MTqg9XzslvTelpL3yDvE9oFQyvVpDI7k3yvg9nVhwvG/KMDzrzKU9utrnO9BzJr0b3fw6+42OvWkLiT2HoqA9WqQPvbhH9Lwua4g9J/OyvW0qEb3S1JM7y8Jkvf0+yrs33rA9y8PkPLI6mL0tYtI9zUvlPGnXmbwfrEQ9JawBvmQJtDxs9Lq7JhuYPXvpOj7rLUE9E1mvvR8pnjzr7ew9wIrzPKuqqj4AAIA/AAAAQAAAgEDRC709AACcQwAAiEIAgHhDAACKQgAAQEMAAIBAAAAAQDMDfkTIdoq9r2jvOwCA3EUAgIJDAAAEQgAAwEIAAABAAAAgQQAAcEEAAABAAACEQwAAQEIAAIA/AgxMPAAAYUUzMwVDAABkRAAAjEMAgAJFAAAwQcvt5T1m5jRDAAAwQQAAIEHI/LG9AAAAQRiOrj5aK9A8AADwQ4/C9T0AAIA/U3BOvQAAgD9oE9A+3TLNPQAARkQAAF5FAAAAQAAA8EEAgPFFAACEQwAAgkMAwJlFmhmPQwAA+UQAAARFAACFQqxPqj0AgL1DAADgQAAAAEEYjq4+AAA6QwAAgD8AtF69BVjmPF1uY7z2YKS9AADAQF3iIz0cz8A9AADAQK+iND2iHOK8XS8EvXBBDD2bI8E9AACAQCKq9Dtv5ps9AAB0QgCAMkMAgGhFAACAQAAAEEEAwOpFAABsQwAAwEAAAHxDAADAQEiBgEMAAMNEAABAQWbmh0MAAEBAAAAgQQAA3kQAAFJDAABAQAAAAEAAAF5FAAAAQ5qZwEJnjXY9AABfQwAAtENoE9A+Jfy4Pr9x6rsQZpS9AAAAQJkumrwvzGO9E2whPbK9sTxTYa+9aBPQPgAAnEM6Uyw9YYGFvAAAQEAAACBBAADgQAAAwEAAAKBAAAAwQQAAWEMAAOJCAAAAQBNqiT0AAPhCAAAgQc3MYkMAAMBAAABaQ5qZUkMq7+49AACAPwAAUkRIgYBDAIBHRQAAtEQAAIREAAAQQQAArkQAAEBAAICFQwAAnEUAACBBAAAoRAAAEEEAAL1EAAAAQADAWEMAAL5CAABqQwAAQEEAABBBAABwQgAAE0UOaYI9iESMOtf7Ab4AACJDAACUQjMzBUMvTtg9sMsCveNqlr3PzIG6AADAQQAAWEIAAJBCrvONvRUCe7y9zLa9AABAQgAAgD/n+Im98fBwPgAAQEAAAABAeiTzvAMDyL2o/XS9OJR+POnoHj6N7fE8AABAQAAAZEUAwLdFAICpRT1p3L1C69E9mplSQwAAREMgPZY6EJW4vQAAAEAAQONFYj3UPQCAFEYAAIpCAAAAQN9hLT0Pbgg+AKAJRuvkyD0AgBRGiJXnvUiBgEMAABBBAADkQ2hn4rwAAEBAAACCQwAAoEAAQINFAAAAQABAkkX9phg+AACAPwBAp0WWqSK9AABwRAAAhEMAgB1FAAC0RACgCUYAgKxF619BPgAAwEAAAIA/AABAQAAAgD8AgItFAICsQwCAvUMAAEBBAAAAQAAA8EMAAIBAAACgQGZmYEMAAPxEZmYtQwAA4EAAQJJEzczHQnMhVr0AgL1D9bDGvQCADkXNTDFDAAAAQQAAc0MAAOBAAADgQAAAgD8KV6tCQtbfvR0H4LwAAMBCAAAAQQAAwEEKV6tC25/GPCCoED4aUFU8C5CmPbFuGz0AAIVCK/ZPPfc5DbtKUOu6v+F9vDg6M70wb6s93Lchvt1lVr2/B249722WvbbEvbw3SZe9xUh1vZt1rD1jyQA+7vmVPaP6bzyfVcG9ICDBPO/2pL0APK89k5/nPIq7V7w9yqs9Cqm3PTIH5LzRHBq88QaSvdf/hjzsBBW90En1vKfzST3DUJC9ykYyPeMVGTyza6o9AfaQvWuq7L1Kxby9L9EZPYgGBz53xSm9/c/cPUOBGjzeVaW9jeuKPVRcJT5LQXy8vFIDvnEmjDxotR89IDzlvQwPCD7rvxq9gAG4vNB46zxQzi07DVCDvT9RND0F/xs+WF4UPEtABr5CF3W9qNe/Pe6vNT4dJmc9zZ1lPLpSzb2e68k927flO9fFnr1c/yk9+92jvHvJ7r013NU9+GpGvQW5H7ztncA6cvJPvScAALxns6e8gzaoPP+PrT37nJk8mSpFuJjQrT0Gczi81x4Kur6hlD0TufA7GFzeved8trsXI8G9y4ePPadVA77te1e9KDcLPskWNby4W+W8s0/hPZNOCz1iRus9fyd2PTOBh71HhH49bVuPvZZAwD2oijw8L5JCvafs9TydLxs8C3MRu4969LyNqTU9SuhMvRDh6r1+YI69xp+5vIdmvz3YP427xeu3PGh9fL2DCgq93CmuvZ+SiD2BKDK9COvkPV+K2TyCQ2k8kNg5vQAAQD4AAIA/AABGRAAAFkQAgDJDAACAQDMDfkQAgLtEAACAP9ELvT2x3NM9AACAPwAAQELvZ809ElIYPQAAQEIAAEBAAAAuRKon5b0AAABAAAAAQAAAQEL7Zb+7t23bPgAAcEPNhV+8lUuRvQAA+EIAAIA/AACAPz3MBzw3y9I+AABYQgAA8EIAAABA6aILPpqZGT6k8Ru91+rCvemiiz7lj8A9AADAQQAAnEMAAIA/AACAPwAA+ELqKq+9Wzl/POUnzD0AgHhDAACAPwAAGEIzM3tCAABAQAAAIEEAAIA/AACgQER1QL33y5c8qCnKPmW6V7oNCFw90mQDve+P4LwAAEBDB2yfvQAA/EMAAIA/AADAQfaoKkNoE9A+AAAERAAAgEAAAIA/M3OWQzMzskNm5qRDJfy4PgAAIEIAAMBAAIChQlyPp0I3y9I+zcz0QgAAHER1Lfa8LAW9vQAAAEFwv448AACFQnrrWDwAABBDyKbEPQAA4UJVDDW9oypSPZqZ20LNzPRCGI6uPgAAwEEAAFxDAAA0Q/CB1LwAACBCAADEQgAAAEBIoaJDZuYTQwAAQ0MAAIA/AACAPwAA1kIAABhEAAAAQAAAz0MAAMNEAAAAQQAAAEAAAEBAAAAlRQAAgD8AAIpFClerQgAAGEIYjq4+AADAQgAAbEIAAEBDAACQQ8+Yir0AAEBEZx0GvH+CoL25D7U9k51NOwAAAEC/+F+8Qrp0PC+HjT0AAKBCKukLPQAAtEKWEbY9AADhQgAAIEIAAABAz/6AvQAAT0Mzs3VD8HsyPB9g2j0AAPBBAACAQDfL0j4AAIA/AACQQjMz+0IAAApEAAAQRAAAeEIzsxpDAAAAQAAAHEQAAChEAAAcRAAAnEMAAMpDAAAoRM3M9EIAgOVDReB8vffAgrtm5jRDAADMQzMzHEQAALdEAADnRAAAOkQAQJJFf78hPgAAgEAAgBpFAAD5RAAAoEBoE9A+AIAmRabUh70AgHFFAACQQgAAgD8l/Lg+AACAQBiOrj6ASl29AADAQQAAIEFQKmY8u30oPUPNiLsAAChDAADAQA0kXr3IZfc8rv28PXQxuTuzqJ49AACIQudICb2f0qG9DkADu/oLEb27Tno8vJyOPv+ICT39AYS8q4yxPNvJOL3LvI67ebtHPeHglr2Ofb284EL5uTMg/Tw3KlO7wMmdvF4jI72MX5k9sgwBPpFkwr3TP888adi3vFXNjz18ZZO7r88PPBOFOD1Y/iG8CE+HvcNXnDyVDs49eodhvYMGwjyNYWq9SK/2O5du07z/uq09SLbmvSJVN73/Yyg8lbdovW0ulz3CqSu93eK1vFoZCj3tI1o9YJWmvZlwLT7EiY89t/4dvTUXnD0jYvq8l9ehveJdkD1fHUE+8z9EvQpC6TzX/eU7kmpvvSKcmz3vg+o7TBZEPXW1lL22E4y8LyavPdR+iT0UOq684Kv8vIiUhz07un49zk2VPOtenL3I0188U7P7vaMHKD2PpwY8Rr0DPvd7bTyNUu89cAyTPNwcjb1mh0i9cxaiO5tphbum8JQ6mtioPOtX0D0LHwc7BHCOvbdW1jzn4xQ+Y3SkvXhbIjsGup694js9Pdgivb0nf9+819A6vSQBTD0AAAA/AACAPwAAkEMAAIA/0Qu9PQAAcEMwBcY9AOAjRi+hPT4AAEBDAADAQQAAgD/V4Xu9AADYQwAAgD8AAMBAAADkQwAAgD8AACBBv+mkvQAAEEMvE509AAAAQAAAgEAAAIBAACA+RgAAoEAAAIBBAAD8ROmiiz5+5Kk9AAAAQAAAKEPK8dq9AAAiRAAAQEAAACJENwsDvQAAwEIAAMBDN8vSPgAAgD8AAKBAa7heOgAAgD9pvUY9AACAPzfL0j6iXFg7iYMYPZ94Zr2Vx6c8H4IJvQAAQEIAAMBCaBPQPj/ZUjxyy3y8lh4nPRiOrj4AADBBAACoQwAAAEBoE9A+ijMXPQAAtEMAAIBAAADAQgAAtEMAADpFAICORQCA3EUAAM9Fsg/gu88OLr360Qo9O+uWuwAAgD8AAABAAACAP4284bwAABBBfHgAPQAAAEAAAABAC0qGPTv3A7wAAJBC/CYDPRiOrj57e9s9AACAPyNEVj0yeom80e67PAAAwEAAAEBAAACAPwAAzEOoKco+AAAAQFCxl70AAMBDQ23svQAAQEAAwIFFAECSRQBAlUUAQONFAAAZRQAA4UUAAMBC5/rGvWNQbb33LBo9AACAP3hBSz1bHaC9MwERvAAAgD8Yjq4+UHOIvQAAQEA3OJa8zIiSva0kg70AAJBDqCnKPgoESjwAAIA/AACoQwAAQEAAAIBAAABAQAAAQEAAAABAAACgQNI+dL0AAMBBAAC0QwAAQEP3N2g9ameHvQRPgz19x/K8AAAiRWgT0D4AAIBAAAAAQAAAkEUAAIA/2jbrPQAAgD8AAMBEAICORZIT3r0AAO1FayNKPM20oL1fCCU9v3zXvImEqb0AAMBBAACAPwAAwEHeRgk8AADAQQAAwEDP2EI6Rl2pvdDqort6HNg8qfoxu710O7xa1nQ94TgNPf0bMzw7ONG9bYMhurKPeLznh4G9h7jZPLkyBbynI4S9DsISvcMYbDxVZmy8+sEKvaxEjjqduyu9iOD+PGWV3DzP9a672sKwOqyvFrsjRAq6G+v5PLiberyxi5O99vu5vJTJKTv/20w7slpuPUoRijwflGC9g6pFPMVBYD1vJss8h3ImvM/FYD0DAmA8x+Gsu7uZkT0lZs27EnlkvVuDwLzOt4u9f30BPN+8ST36ul68YEKEvdXzsT2qxJ08AACAPwAA4EAAAMBAAACAQACAAkUAAAtDI9u+vQCAo0UAAPhDAABwQgAAAEEAAJZEAAAgQwAADUUAAKBAAIA7RWam+0MAALBBAAAgQQAAh0MAAARFAABAQQAAIEE3y9I+mplSQwAAnEQAAA1DAAAAQAAAHUMAAIxDAACNRQCALEUAAIA/AADtRNuz1b2aTju9N6f6PQAAS0MAQJ5FAAAwQQAAoEAAAJBEAACAPwAAvkIAwJ9FAACAPwAAnEMAAJxEAABAQQAAUkQAAKtEAAAZRWbm6EMAAIRDAACIQgAAeEIAgKFDAABEQwAA8EMKV6tCAECVRQAAoEB9Fjq+AMCBRWamDkQAAOdEAAAQQQAA3EIAgEFFM3OWQwAAQEAzMxxEECcUvmZmHkMAACJDAABAQAAAgD8AAABAAABGRACAvkU3y9I+AADzRAAAmUIAAEBBAECDRQAAwEAAAIA/AACQRAAATEUAABBBzUyfQwAA8EMAAChDAACgQAAASUMzM3tCAAAAQAAAAEA3y9I+AABAQHtUmkMAwP9FivTwPbnfnb0AAOFCAEDmRa23Uz0AAD5DAABSQ7j+tUMAANJEAABAQADAw0MAAIA/MzP7QoL18LzdSlg9AIB9RRiOrj4Yjq4+AACAQAAA4EAAAHhCAACAP5qZUkMAAChFmpnkQgAADUUAAHNDAACHRQCANkQAANJDAIChQwAAgD/L/au9AIDcRQCA8UUAgB1FAAA6RQAAikQAAOBAAAAAQQCAoUIAAPBCAAB2RBiOrj4AACBCAIBBRRiOrj6amcBCAACAQAAApUQAAEBBAAAAQQAAxEIAAABBqCnKPgAA8ENm5hNDo4CIvQAAEEMAAB1D/UazvQAAwEE3y9I+AADgQAAAWEUAwFhDAIAsRQAAoEAzM7JDAAAQQwAAxEIAAMBCqCnKPgAAmUIAAABAAAC0RAAACkXmwz89AIChQgAAbEIAgB1FzcxiQwAAKEUAAB9FeMjHvVO/8jwSF/a9mO3cPGvYtz3vMji9PAOBPf2Bzz0AwMxFl+XlO1PR870AAM9EAADwRCX8uD4AAKBAMzOyQyX8uD4AAPNDN8vSPgAAwEAAAKBAAABqRQAAAEAAgI5FAABwQgAAtEI3y9I+AAAuRYv1BD7rvxS+AIDcRQAA9kQAALFEAACEQzMDfkQAAJlEt9rIPSTYy70AAKBAMAzOvQAAIEMAAHhCAABzQwCAFEUAgFBFqCnKPgAA7UXltOO9AAAfRQAAgD8AgL5FGI6uPgAAgEA3y9I+aBPQPhiOrj4AIAREzbDEPQAAgD8AAIBAjRupPAAAkEIAABFDAICjRQAAAEAAAJBCAABbRQAACkUAACBBAAAHQwAAqkIAAChDAAAAQfcuiL1lsdw9AACMQncKyb0pibE9AADwQwAAAEGLnBs9kDayvQAAoEA1mOq8K9zBvQCAHUUAAFtFAACAPwAAgEAAAEBAaBPQPgAA4UIAAKBAAACZRAAAAEAAgKFCAADhQhdnEr2gqM+96D2SPSahh70AgFNFAIApRQAAAUUAABFDAABwQwAAgEBonRA+AAAZQwAAFkMAAHBDAABMRRTXkT0AAMBAAADwQgAAoECapKG9AACgQGZmLUMAAEZDAIBoRagpyj4AAIA/AADPRABAsEUAAIA/AACAPwAAgD8AIAREZmbmQgAAEUMAAIxCZmbmQohAbj3rYRe9AABSRDMDfkQAAKVEAACHQ98CUT0AgHhDJfy4PlwPCUNoE9A+RLXLPbIqMb287Qa+AAA3RQAAgEAAAIA/AADAQgAAPkMAAKBAAAAfRQAAqEIRko69AABAQBMB4LxI3KI9AADDRCX8uD43y9I+AADAQACAJkUAAKhEAICCQwAAgEBoE9A+AADMRAAAOkUAADRFJfy4PgAAq0Ql/Lg+Esi7vQ2c4r0AAGRFAAAAQQAAwEAAAGRFAACAQABAg0UAQINFN8vSPjfL0j7Q3Mc9AACAP6gpyj4AgKlFaBPQPgAAoECaCQlEAIBTRQAAoEAAAAxEQ1s0Pcgu8b0AAMBAmgkJRAAAUkQAAFtFAECwRQAAwEAAAJZEAAC6RGbmNEMAACVD0rMcPgAAQEAAAKBAAACAPwAAIEEAAIA/AACAQAAAlEIAAABBAACAQHvUCz43KhM9AECeRQCAMkOKHOQ9AACAPwAAWEMQ64k8AMCERer7aT0AAABAACCKQ0ix8L3DB188AACHRc3MEUQAABlFAACAP/J4oj0AwMZFUSgCPgDA2EUAgDZEAADPQzaOCj0AABBBGI6uPgAAQEEAQPtFAACAP2ZmLUMAoKdDAACwQwBgEEYAABBBMzP7QjMze0IAwJ9FAAAgQQDAZEQAAPNDAACAPwAAwEFoE9A+480tPgd6wLwAAABDAABGRDfL0j4AAIpEJb1tvTc6WDx193W9AABeRKgpyj4AAGBCMzP7QgAA2EMAAMBAAADgQAAAAEAAAGRFs+6HvQAAwEAAAEBAAAAAQRpTzz01ANu9AADqQgAA4ECuYzo+MzP7QsgRfb0AANVEqCnKPqgpyj4AANtEAADYRAAAeEIAgBdFqCnKPqgpyj4AAKtEAECYRQAABEUAQLBFCXykPaGDur20Ao88M7MaQwAAQEAAAJBDZuYTQxiOrj6HTjO9RQ1BPcUJdb0YcvE8S4y5PEKv1z0AABlDM7MaQwd1e71oE9A+AACAPwAAQEEAgC9DAAA+QwAAIkMAAEhDAACoRAAAz0QAAKBAytE0vQAA4EAAAABAAAA6RQAA80QAAOBAAADgQAAAwEAAAPNDZqb7QwDAt0Uzc5BDAMCBRQDAgUMAAMxEAACAQAAAgD8AAO1DAMC3RcmIgLqzM1m9s7EJPpcb4Ts6Mf28YEQjPcf2uL07H0S8Y9LhPbrRFj0fo+m86a6WPZliA7yzCKu9fyzePRjwTjzU7qu9Ivvju+hkzz1n1wC+cwFUO4i+hz0NAn294zcIPVVqJb2Ta6G5jZTSvA3L9j1z/SI+wWOOvBa/Kr3NzGU9kQiVPO+26L08Dju9QOrOPSGmvL0j+WU9D0fXvTWh0TzsE7C54FnuPeBRKTyX2pg9l3tKvRWYzjr3MHK9C1KIPQ0BHz6hsEC9DroOvCoGxD0dKsm8i3ENvqDJCj3+usK9mt97vabRsjzfkrQ7fXhPPZNJmzoLL9Q9eSwRvSnDsj35GK48/6e8vcn4Bz6sNzM9soC9PXeQ9LwKdKy8BZzBPfrszjynymu9Qp9oPdOLsL25ico9I3HxvOtWND0mQiO9RaOxPcZ8JD3sAge+iE1rPS9Plzwl0v69i0iVPT4xBr5iDwK+tyjTPBwayL09sk09KAUrPXjOGb19XAg+z2abPe/Z7zqJf5I9w+aXPWOjQb3NEsq8khelPHBs672wlOa8e0gVvgy4Hr2iROI9PoDDvANWDrsTKLK9HqOGPWOoFb2M25G9O4Sku2UnWj26EoC8m3POPXixgDzx9Ii85qo/PbjakbtCtoE9EZsJvVcCeTpfndq780XZPf9brD2VW169R8xiPWc7h7tcmK29qGLbPTe1Hz0nga+9m5AkPvfAyjx6A22984RFPblEDz0LWKi9P6TDOiutxD31Ds+73yIfvgk+Ez3WhiS9O7uJPGf7sr3YcsM9eAvQvPDWqj3XPpa9/5mRveVO4r1TEgu8o1zOvWTNk72jYaY9L2RUPLvFBj6VoLm8QvC0vZ892Dyhw8Y9hmc4vQPdJj1r0Om9u3UOPdd7170Ll6e7CsvSvPPtoT0//8+9zanxPGheBb1tBA49vCkoPRQ4DD4T2P29gCf4PGF/g73ZUBw9Sz64PfkEHT2dYIW9c+loPRy9tz14m3w6XWR/PTvCprwXvlW99gUzPS4Anr0DACU9axn9vQ7MvT0jlgk+/3iUOo1tmr1dv0M882CZPV0x77sLp8Q9+xwXvu+qnr0fkHI9rU5WvX/CrjztsVg8ly3HPRccXb2TicO750HnPWO59jwYYHi9DGgsPOPbL7yoLyG9sym0uY3l2z1d83S8NbqhvTNyzz27BHi8QOYQPRILdL1j/rq90wwjvYfPfr3texo9YP7wvFpKjj3V+iE8JZ7UvL9XzTx15wI+O8KxPTo3ob1fYOQ9E8VIvCrSTD3tjs+84xRAPHIGRL1HGhk+Eo7hPIAP9bzj0JM6yCyUvYMjYTyUxKq8URSTPfN0hL1j4XA92sSLPVLosb2rkww80PgLPhZPsj0a5Sq9UxJGvQX08DsjKzY9Y/QaPmWtIL1gsHI9iG+9PSCXuL1zgI28ePFbPksrPD3fcRa8QCz/Pf7bujzHDiw7ooz7PfAVlr3eZI896bkpPrN2ij3Y+vQ8S+gsvZfhlz06P+a6X7+KPc8L17z75JS8+7Wvvaiqm70ilac8pyWePaNMAr0REQ0+BUJcO+sGsL13rDq71/CuO0c1Mb3oBoO9/tEwPcPjNz6fqsE8JT/kvVegurx/mK+9DMqJu7C0uL37p0U9UwDrOwEyOb0Xz4U78nEiPtC5a7qBTMS9P72xveE3Gjr2h4u9t1GcPau7vj1ScO48UFmFu/uW2TvjJtc74NS1vDLRu7xJwQs9OIU3Orwuuz2XEAS9FbiSvbgzhz01zQe9awIdu2bWij21Q8M954IVvXOK0b0nhOm7+/m3Pdp5FL3Acri9BGeHPEo1jr0yDQ8+a6UTPEp1mj1TWhq9i1V0PQAAAD8AAIA/AACAPwAAUkQAAIA/ZMPKPQAARkQAAExEAABqRAAAwEDx8PA9AACgQKLumD0AAOBAGI6uPhiOrj4AQBtGAAAAQJ6Yub0AACBBCtcjPqNJfb0AABBDAADwQgAAkEEAABBBAAAQQQAAEEEAAABAN8vSPgAAgD8AAABAAAA6RAAA8EIAAEBAEseHPQAAwEAAADBBAACQQwAAAEBoE9A+AADAQvFByD0AAOBAAAAAQAAAAEAAAABAAACAQAAAZERoE9A+N8vSPgAAgD8AALpEAEAtRgAAAEEl/Lg+AAAKRQAAgEAAAIBAAADAQbz2w70AAFhDS4CAvQAAQEJUfoe91mGPPSOJZjyRd0y9K2wbPQAAAECoKco+AADkQwAAFkQAAABBqCnKPgAAwECajz691hQhvAAAMEEAAABAAAAAQNp7L73N9vS9AABYRAAAWEQAAF5EMJd5PQAAQECZD529AACAQAAAEEEAAABAAAClRAAAsUQAAMNE13hWuzu/27wAAKBAAACAPwAAhEQAAEBDAAB8RAAALkUAAEBAAAAgQQAAgD8AAABAGI6uPgAAQEAAAABABUyEPVuZNz0AAIBAaBPQPjfL0j4AAIBAAADAQgAAwEMAAKBAAACAQAAANERoE9A+N8vSPgAANEQAAEBEAACgQFh2lT3Afk48lzL+PWa4Br4AAKBAM1eiPQAAAEGO+8a9AAAAQIjJBT4AAGRExyftvQAAAEAd4/08u6MCPmgT0D4AAIA/AADgQAAAZEQAAIdEqCnKPiDxAbylS9G9AACuRL0rz70AAEBAAAAwQehimD0AAIBA8h3PPQCAvUMAAMxDAAAAQAAAgEAAAIBAAADkQwAAQEAAgBdFAAA3RQAAgEAAAIA/AAA0RAAAEEQAgEpFAAAAQAAAw0QAAIA/n1DJvJnvqr0AAABAAACgQAAAQEGQjm09zU/rvHRSjrsAAEBAAABAQgAAQEAAAJBCAABAQAAAoEAAAMBBAACAQAAAAEAAAIBAAAAAQAAAAEAAAIBAAABAQwAAAEAAAKBAAABAQAAAQEAl/Lg+AAAwQQAAKEMAAABAAAAAQAAAQEEAAABAIs2bvZkWvjxfwLC8AACAQAAAQEAAAABAx1UdvQAAXkQAAEBAR91pPMY4m70AAGREAABeRAAAWEQAAF5EAAAAQMdgpL0AAF5EdOE3vQAAhEQAAL1EAABAQAAAAEAAAKhEAACAQOjAGz4AAMBEAAAQQQAA80QAAABAAAAAQMNtB71OaYA9AACQQ3iDkb0e+Ki8Imd7PUAXX7xTjGo9AAC3RAAATEQAAMBAAABAQAAA/EQAAPlEAABAQAAAAECoKco+N8vSPgAAAEAAAEBCAABAQAAACkQAABBEAADgQAAAoEBoE9A+AADDRACAbkUAADdFAECeRQAAkEQAAEBBAADgQAAAIEHIFeK7x8FhPYpfgr0AAEBAM9GFvVgY+LuVJRO964e2vXkaPD0CAn68XXj0PBMtHzrETie9WBHwu05EDb1zj2y9hfQKPROoC72XBhI8aoIAvXfMqD2wvu+8O3RiPP28u7swq/g8cJjaPcyWOL1QaUK8eT8/vQmXMz2qidC8VcwOPOMQjz0g23o8DiUivZYmij0ju8G89W2TPS4NkL3HX6S8gYM2PZ9o9bwIe2a7XWOyPJBOsruPKHi9WIXivEo667tm0Aa899aWPQAnEL1zNU68M+iWvTxnEDzKG7Q8kxFCvEjHG7wzb469UVG7PCP4TL3X3Ry98KPLPeFIvDwIree9Y53bPbPbIL3DzJw9G0vbPDNifD2KznK92i5RO10akz1FFX08FD0YvQ5Pyz1xRZQ7PNGcO4BeAD4oWlS9+MLfve6kuz1Le7U76F3rPJP2X7q/efW7+IUoPDWAvby/YKW93iiyPZuUdjxHmVs9k5gSvWjvBTuFH/G8WZ+ZvctOXT0SFm49s0FjvKA457v3B5Y9L4dHvUnrxj0gnSM+E1RIPbXFeD3O3wS8QfWPvGXUSD2YT9874NNQPYNuJb0b8gg962MyPetHyL0fMXs9ozcFvX9V4TtgdOI9HoSpvQ9VHrxHWvM8gzI8vaAFgL26o6q85+CKPX8wI7zaI/I8/iyGvdoPXL2SGJq8K2kHuwN5lTy4VGm6twZgvYrfmbyzHBc8Pr0DvT2zlL1vjw+90nP4PO8nwr1zFJ08SYTGPEpWpD37Fxw8piAMvcfHLjz5aqI9pAmEO1hrYL1YXeW7k+Y0PBLgE7zz/PE6Z2vpvBieMLurqqo+AICpRQAAkEMAgIdEAAAwQQAAgEBmZsJDAAClRQAAwEAAABBBAACAPwAAAEBcj6dCR0bIPQAA80QAAOJCAACgQGgT0D4AAHZFAAAiQwAAgD8AQLBFAAAiQ5A8LjyfL5C9AACAPwAAcENTpja9I+iwPQAAgD9NId29mpnkQgAAqkOoKco+zYDSPQAAakUAAHxFN8vSPjfL0j4AwNJFAACOQgAADEIAAIA/N8vSPgAAWEMtkEY9AACAP8EBuT0/XrO8AABYQjMze0JdOu89zcxiQwAAMEEAAIA/AAAoQwAARkSoKco+AIC7RKy8nr0AgLtEAADhQjMz+0IAgKxFAACgQFyPp0KXPag+AACAPwDA/0V8LpM99qgqQwAAQEAAAJBCJfy4Phehsb1oE9A+Jfy4Pn6Kgr1ncQs9AECVRQAAjEIor6E9AAAQQcePAb4AANJDlz2oPgCAeEMAAEBAzcwRRKmPJr0Yjq4+pjUkPd3OgL0AAIBAAAAAQEoV3j3DlY08N8vSPgAAgD8AANZCZuYTQwAA8EEAAABAJfy4PgCAL0MAAIA/zUy6QwAAIEE3y9I+AMDYRQAAIEEAgNZF+I5bvZoZj0PNrOFDDEeJvVfpSjwAwMxFhxb6vNLg0TwAgNBFL0eCvVwPCUNyCd88XbT+PQCAtUUAgL5FAAAAQAAAgD+XPag+lz2oPgAAAEC1tDQ+jC46PgAAwEEAAIA//6dZvQAAgD8AAMBANoivPfgVG70AQKdFH9IFPWbm6EMAAIA/AECSRAAAAEAAAAdFAECSRANalj0AAIBAAECeRfgbvT0AQJJFAACcRQAAykIAwOpFAADPRQAAAECjNCM8hSPUPefNpr0AAAtDAACAPwAAKEQAACVDAADAQGZmlUMAAJxDZuakQwAAgD8AgLJFAMC6RQCgp0MAAKBDpVzcPQAA+EM3y9I+AMDqRR2l8D0AgNxFAACAPxtbnL0AACBBBSSkvQDAyUVoE9A+VfPlPWgT0D67wJA94ulfun+bob0AAIA/aBPQPgAAz0UAAIpEJfy4PgAAnEUAAIBAAIAmRWgT0D6amZxCAIChQgAAGEIAAEBBAABAQAAAkEIl/Lg+AAAQQwAAAEAAAAdDAAC4Q16aED69vBK9chmXPQBAp0UAACBB43UFvs3sI0QAAMpDvykCPgAAW0Ql/Lg+vCxJvZc9qD40C5Q8Jfy4PgAA+UQAAEBAAACHRJc9qD4AAEBAAABqRACAiEUYjq4+8e7LvS182LwAAI1FAMCfRWgT0D5yHJK9AAAAQdIbHb0zMwVDAMDYRWBhcb0AAEBAAACAPwAAgD/NrOFDlz2oPgAAQ0OWKYi9AACAPwCAvkUl/Lg+AAD2RQDAzEWbnv89AEDmRQAAQEAAQONFAAAAQQAAyEMAAIA/IphXvLt4Ar6fKWm9L3e4PCX8uD4AQLBFAAAQQwCAskUAACBBa/N0PQAAGUMAgPFFaBPQPgAAEUNrPKu9AADtReXpgDw3PaG8AABgQ8t4rj0Yjq4+FXHJveek0D0AAPZFAAD2ReMvwD3bWhQ+R5YyPXp7pD09WDm9d3PSvQBA5kUvpTS9x3oUPV7dPDwI29u7ThMdPZuXAD7TCBM+6NR/vbNA2LznNf09AG0TvUM48jufr1i9m7kgvH6coTy3UTW6mk3PvC8ml71zp7694P+ROzalOrzKGo095SZjvciHhrx/2Y+9D7aBvD9OkrzXl4o9PZ+PPINmEz5glGo8KoWyvZxhxLxD+5w9La/6vI8P+L1zohW9lJ/GvfNTOTwjy5C9pU2VPZNhg72gklC8herlPTEFs7zu1cW9zx/OPUhjljuUsQ0+E7Z9PRUJvjxqZn29bRjuPMUq+j2ZW8Q95hU4vB+CoTwI5Eq9kgsTuoKkRb0ii+o9JbUkvMAq4zwAHvu8A6raPQcxATxS8l89UcSZvcCe5j2nujK9lzIWPSGkhbxScfA9LnisPMB3170flma8WnQPPt9MAr1lT9k9ByCsu9NB6bwDDne7a2fNPRPHrTyCaaG9NaMAu4mZA71wT1g9gjv8vHqE+j3XS1I9EyWavXcrnTyIOve9t2TWu9hpEz3DDlC7UXAYPWrgTzyRAq09JfLUPS115rzqrgm+ceA5PbIeYb3P+SY8Y+bWvf/sobyuUSI9th1FvX8vBb21sxE9f82OvJekST24Ibm93b2xu39JED1XDbu9u/ajveijJT09ur69u9xpvFqTyz0X4Ie9AMvsPf9W6bzf5hG+41y9vZUOxDxaz4O9ZKXKPVvSWDxL0c871fMlvOfd1zsD5a49iySGPdJfo7qXR2m9syNuPe9FVT27SIO9AAAAPwAAgEAAAIA/AAAQQQAAQEJ5ocE9AABGRAAAgD8AACBBAAAwQQAA4EAAAKBAfXmVPQAA9kUAAIA/AIAURQAA2ESdj4C9s1hTPAAAoEAAABBB80DHvQAAEEMAAIBBAADAQAAAAEHx8PA9AIACRQDAk0UAADBBAMDSRQCAaEUAANtEAMDYRQAAvUQAAEBCAACQQwAAgEAAAEFDAOAFRgCAFEaS/NC9DV4PvAAAQEIAAABAAAD2RAAAB0UAAABAAECVRSX8uD7nir+9AIDQRQCA3EUAgBpFAAB5RQAAgD/8eQI9AADPRQAAgD83y9I+AIBTRSnyGDz6p3M9iOaLvYMsrTwAAIA/AACAPwAAgD8AAIA/GI6uPjfL0j4l/Lg+AACAPwAAQEAxuYI9AABAQmgT0D4AAIdEN8vSPgAAgD+oKco+N8vSPgCAi0VoE9A+AABAQQAA1UQAAMlEAADiQgAAQEGXPag+AAAwQQAA8EQAAKBAh7rtPQAAwECvks69AACWRGgT0D7Cwva9AACAPyX8uD4AAExEAACAPwAAQEEAQINFAACAQAAAQEAAAIBAaBPQPgAA4UVRpKu9AABsQwAAX0Obs2I9AED7RRiOrj4AID5GAADgQGgT0D4AAABAAAAAQQAAwEEAAIA/AABAQwAA/EMYjq4+Jfy4Pnhi6Txg6Uu9AABeRAAAtEQAAAFFAAABRbq8M70AAIA/AAAKRQAAgD8AADdFAIB0RWgT0D5oE9A+eiFUPJvkIj4AYBBGAAAoQgAAnEQAADBBAABeRGgT0D4AAPBEBMKtvXP34D1aBJQ8uZi1PQAAgD8AgBRGAMD/RQAAgD8AAIA/lz2oPgAATEUYjq4+qCnKPhUXVDyfc5+8AACAPwAABEXfQME9AAD2RWp/EL0AAABBAABARJc9qD4AACBBAABMRAAA7UQAAIA/AABqRWgT0D4AwIRFAACAP0322D2D9pM8y6sNvnvb9bwAAL1EmH+ZPQAAoEAAAMhCI73xO/gAhLzHfw+9RNywvQAAgD83y9I+kUmIuwBgEEYAgBRG4QOGPQAAgD8Yjq4+AACAPwCAAkYA4CNGJfy4PgAAgD8AAIA/AAAAQCX8uD4AAKBApkiTvQAAgD8Lz5+9m8t+vQcSrT1qa/A8uhsdvQAAwEAAAK5EJfy4PgAAAEAl/Lg+AADGRAAAgD930WC9CzkhPQdzur2zJPI94Qe3PCX8uD6tX8E9AACAPxqq1L0AgBpFAIB9RQCAaEVPEu29qCnKPgAAgD8l/Lg+x9IJvgCA8UUl/Lg+AMDSRQCA3EUAAJBEAAC9RH20Bz43W/G8AAAuRAAAakQAAIA/AADSRGgT0D4AAABAAABAQQAAgD8AACBDfx3GPQAAAEBMNMY9AAA0RAAA8EIAAKBAAACAP8AgbDwAAEZFAADAQAAAgD8AwJlFAECwRQAAgD9oE9A+AACxRAAADUUAAIA/AECVRcLwAb205Y89IpXNPaypTLxoE9A+krLJPQAAfEQAAJBEAACAP2tt1L0xrsC8gpsqPQAAgD8AgBRFAAAQRQAAgD/HfKK8M/D7vQAAgD8AAIA/MOKxu6eSAT0tzHM7r6Qeu+pRgzzWuwS+TraBPPXJjD1Tb9e9pHmiPZFcTD3bVBa9mG6GvehANbk1Huk9i+1sPR8Qq70T1Q68VZjlvLdlur2LBXs98A59vIO6bj1TMw8+6EIKPSMrmj2YBoG9x64lPBtuBzxApI89B6afvTgEFr0bzBa9S10mPHBBYTzlKYi9FRKEvD0b1T3N32W9yMwdPRXIo7z23YG9R8CDPUcSILzUQLK8juyZPb0Mrz2QUjy7CBmBvEM99zvBqwm9XKmZPac/CLxxxYy9bIvIPCdAUbzL6++98QU0vQUdWj1JYDO9uTIivStJxDzHvsW7TJUlPtVxZb3Xsd49IoLYvb94TT1KkBO9GwLkvbvZVL0QG+k7h2CYvd/KZT01ra68QlWHvTKyfb26cog9fxPZPc2g8jupjca92poWPXUagrxPjiY99X17vfsUIbrwgnu7x1z9vDvqfz1g8ow6LwuLve+4yTzqz6W90zAjve2ViTy2c409/lKku6DOaDxPTu29eiVNPMIorD3tRtM7v/f9vHxgBz23+Lu8h9hoPQo19Ty6FB+8X2ZSvRJHHj1PbEc9QmkoPgWAnT2dtEC7YWCOvdsu6LtjKV29EGTlPN25EL3AxBY+S1hnvb1vtT2SWek9z8KhPAp61T2S6aU87VnWve3NSztNoOI8a1zfvLLP/LurHwQ9S02IvQqgKLy4FPA8kBiKvecoCT22aZm89larPeiZcTz9AtK9/I+IPNvaJT3S34S9gGUgPtiiPz3iNKy88xPyPSLV7j3rt4I8c8+bPHFNg73vSKk8M4noPdCGyDzXNZO9q6qqPgAAMkMAAEBDAACAP5oZj0OamcBCMwN+RAAAgD9m5odDM7N1QzJx1r0AACBCuhpsPQAAgD8Aaug7ZmbCQ4mICD4AAABAAECYRQCAvUPror89AADAQrNlSL0AAJBDkiTJPrj+tUMAAABAAAClRFwPCUMAAGhDAACAPwAAoEAAAO1FAACAPxh/Tz33e/G6CGRjPQAAhEMkWsc9AACAP0LoA70AALRDAACAPwDAw0MAAMpDAAAAQLtmwr0AAIA/tNSlPQAAqEEAgFNFAADeRACAU0XzAr89M3OWQwDAw0MAgAJGOxMPvAAAPUM7Co89td1OvDub+zw2rcw9AAANQwAAAEAAgAhFAIAvRQAAgD8AAMxDAIACRQAAoEAAAABAAADAQgAAoEAAAChDAACAQQBAgEWVqWW9p6LVPQAAsEEAAEBAd7qlu/fTmL3PV/i9AACaQgAAwEIAAMhDIHHZvc2s4UNpE8y9AABLQwBA40UAABlDAACQRAAAH0UAAABAAAAuRQAAGUUAgL1D5PIGvssJzjoAAEBAAACAPwAAwEAAwMNDAABAQACAh0QxuYI9AAAQRJqZN0OPDLC9AADAQgAAAEEAACBCMQxDPgAAMEGHBq09AAAiRQDA0kUAAORD4VXLvQAAbEOYF3i9AABwQopq0r1yc8k9uOwfPXFjrb0AIN9D6lmgPTNNq70AgIFD+9GcvQAAoEAAAIBAAADJRABA+0UAAMxDKDz4PQAAyUQAAChFAAAQRM1MukMAAEBAAABGRQAADUVmprtDAADhRQAAgEAAANJDAACgQACA00MAAP9DAADkQwAAgD8AAIA/AIA7RQAAgD8AAIA/ACAERJgzST0AAMBAp1uvvQAAYEIAAKBAAACAP8djOz0AAJBCK5wdPXPJxj34FzE8ILhqvQAAhUKhoJM46zGMvRPKMD0JW7W9AAAHRQAAJEIAAMpC7we8vWEwlr0AAIA/AMCZRQAAIEIAgCxFY2K4PQAAkEIkRp2921vRPYdUr72q9Gi7W/aXO55/iT1A3Hs665KKuqu2Db03Fga7T+ECvVbKgz0wpaC9Cr2XPINGWb39FRQ+0rXSPCVjBz0DmpG9m6K7vHccVTwntum9s0EkvaAH6TzbQoG9MLxNvOT+pz0yb1S9aurpvT/1qzxVAZo9lF4avTv7/TwNLXW9R+sbPfrtQL1TdpU896PXPa8UJz3Mv6m8wgZCPcIhZj3YnY27wP5PO0cbxr2Ko9c9gRqHPAIOoT3/cTI8Wj8SvMFzQDqnR1U8EjRuuyZAsrtFw+K9jXH/vJZ2JjyzvvC8rw+RPPUm5jyIBd894G2avbURb7zfWn29z1dCu/IQSz2qOmg7xkWZvYrFfD0jPKW8d7revSt6qz3/dH29SkdXPBDX2T0NUBU9/YSiPaiNJz17h+s9yI7dvcsDEbsr3K88kyv4Pbdt2z4AAHBDAACAPwAAIEEAAIA/AIBKRAAAzEMAAMBAzUwxQwAAgD+x3NM90qfFPbD12TsAABBDggOaPQAAgECamRk+AAAdQwAANEMAgD5FAIC7RAAAIEEAAJxDAACAP1Cypb0AgIVDAABAQgAAgD8AAMBBAAAZQwAAwEE2HSc+AAAwQTiq5r1TBvg8AAAQQQAAEEEAAJxDAAAiRNPOT70AAApEEnJ+PagPzbszs3VDZmaMQwAgikMAAEBAUGVtvI8Yn72TNSo9wpvNvAAA8EIAAEBDZz/5vBiOrj4AAChDAACAPwAA9kUAAGxCAACoRJt51z3AuoW8SVjDvSsZK7z/PCw9AAAAQfHwcD4AAHNDaBPQPgAAgD8AAJBCqGORvYtiiLsAAGpDAAAqQwAAAEAAAEBATkQhPUahHD7TGI+8j8PFvQAAGEQAAIA/AACQQqgpyj4AALRCe1SaQwAA3kQAAHhCAADgQAAANEWDKZU916ofPGZm5kIAAMBAAACgQCgns73NzH1DAAAQQ3NFsr0AAMBAGI6uPgAAwEKHNiS9ACAERAAAEEMAAMBCAACAP2gT0D4AAAxCGI6uPgAAwEKleoY8AABJQwAAjEMAYK5DAABYQwAgikMAAIA/AABGRQAAvUIAgBRGZuboQwAADEIl/Lg+AIAaRQAAUkQAAC5EAACHRAAAAEEAwJlFGI6uPkm5hD1kPJA7SGebvQAAWEMAAGpDAADAQAAAoEAAAJBCAAB/Q+sQi70AAMBCAAAMRGgT0D4AAKBAAABAQMdkMT7vK+Y7AAAAQQAAgD8zM7JDAACAPwAAkEIAAABAAABAQTOXgL0AAChD1g2mPdt8pz0WV7I7AABAQgAASENzUwc9ZmbCQ09RmTxnJ709AAAAQKgpyj4AAPBC6jvvPADAgUNm5qRDAABAQpqZUkNoE9A+qCnKPgAA/EMAAMBCAADgQAAAuEIAAABBAAAMRAAAn0QAADBCAIAvRQCALEUAALpEAjDZvQDA0kUAAEBE37yxPRWUabuCktG9AACTRBiOrj6oKco+AIBuRQAAgD9mGA09nTAqvUeeubvT7Xe9ohHwOn+6mT2UDsA9MICFvHNPpb117Yk8JSySPVpfaj5lwks9Vy1DvReFKj3glvG8+IuzvWi30LzaWnA86VNBva/C3j071/47g6fcPMcZJLzp85y9a2T6PJ3b8Dz38wk+QSKTvfOLmT1GO6S9yy/yvDuxl7yYQjo8S62pvW0OZryQ8t49vZ/hvKrrOr2N7Zg8Iv+WvR+c8TwToIi93lSjPJDg0LsYeLu9wICYvY3swrusmyU9xe1yvb+SAT73gOw87PC5vV9xFb0bJvw8Vp07PkJYir1zGmE93597vYXXiD2f76e8pyJ/vc4JpTtV/Na84+jiuyz5Rb0cG429wQ5LPbLxEb2C0Pk690YgPQVh5z27tBs9b56bvAPgLr3CE+A8v6DCPc7gOTyPorS6YOjwvG9MiD3Xkd26QCjPPQTxwTzYMZ69VVcjPcsqeL0OnDk9O7MYu3rtobyo8ig9JOGXvfr6tT13mK29YdSFvRfXjz3rGw0+M+oNPO3iWrqbnUu9ZuHJPJWDkz2rqqo+AACAPwAAUEEAAM9DAAAAQAAAoEAAAIA/AAAQQQAAgD8AAMpCAADQQQAAgEAAACBBK2XAPZIkyT4AAKRDAACuQgAAgD8AAABBAAB8QgAAAEAAAKBAN8vSPgAAQEA3XYi9CkC0PQAAAEDyNng9QdoBvQAAPkMAAEBAAACkQgAAoUMjY4g6AADnQwAAAEAAAIBAAAAwQQAAjEIAAAJDAAB+QwAAAEAAABBBAADSQgAAgEDDWjE9Tyk/vQAAwEBt01I9AAAbQwAAR0Ml/Lg+vAPHPRiOrj4AAKBAAACWQwAAgD/qdSC84XwpvQAA50MAAOdDDlrIPQCA2kMAAIBAAAAAQgAAhEIAAKBAAAD6QgCAhEMAAIBARycfvQAAoEAAAABAAACgQAAAoEAAAMBAAACgQAAAnkIAAOhBGxr9uhJqW70AAOZCAACAQAAA4EAAAKBAAADAQAAAwEAAAEBBAACAPwAAQEEAAEBBAICMQyX8uD7iFe09AIC3QwtSPb3/w7g8vmqYPQAAgD8AAIA/f0JaPQAAAEAAAABBAADoQQAAAEC9n/K82H63vQAAkkIAAJ5CAADeQud6uL0AAGtD31zEPagpyj5AC029AABQQQAAwEAAAIBAAACAQAAAgEAAAOBAN8vSPgAAAEAAAKBAAACsQgAAEEMAgIZDAAAEQgAAQEAAAMBAAAAkQgAAzkIAAPBCAACAQAAAAEAAAIBAAACgQAAAoEA3y9I+sS2WPQCAp0M3y9I+AACuQwAAlEIAAFRCAABUQgAATEI3y9I+AACoQgAAwEAAAIA/AICIQwAAwEAAgJlDAICcQxiOrj5oE9A+N8vSPgAAQECfX2U8Dx+rvAAAgEAAAEBAAADAQAAAoEA3y9I+aBPQPgAAMEIYjq4+4F9HPQAAtEIAAIA/AACuQq/cob0AAO5CAACAP4RHqL0AAOZCAABAQAAAUEGP8Sw9AABQQQAAkEEAAEBAAACoQQAAQEAAAJhBAADAQQAAQEAAAABAAACAQAAAkEEAAIBAAACAQAAAgEAAAMJCAADoQQAApkIAACBBAAAFQwAAFkMAgIRDAICIQwAA8EEAADRCAABHQwAAgD8AAIA/AAAgQQAADEIAAABAAAC8QgAA1EIAAABAAAAYQwAAMUMAAKBAAACgQDfL0j4AAABAAABFQwAAgEAAAMBAAABQQwAAX0MAAABAAADAQLDFAT0AgLJDAICyQwCAskMAgKpDeBemPQAAPEIAAJ5CAAAgQgAAlkIAABxCAABYQgAASEIAAGhCn0m2vQAAIEHQnpe9FxiOPdWgnj0AAKhCUc2WvcQ2OLwAgIZDGI6uPgAAQEFvk9E9cHXqPDiTyLwAADBBgaLBPQCAqkMAADBBGI6uPgAAgD8I25A9FX+nPF+nHr0vyKQ8GI6uPgAAgD/42BK9AACAPwAAgD9PlF89AAAQQQ9vpr0AAOBBAACQQQAA8EFbvP89AAAMQvPRED4AAFRCAAAIQgAAAEAAALxCuoJnPAMTX73TIQ8+AADAQEUiET0mR5K7/zSZPQAAgD84AhA+AAAKQwAAS0PmAsA9AACAP/tSqr0AAOBApyGiPBOmpr2YFVK8AACgQQAAqEEAAIA/AACAPwAAgEAAADBBAAAQQQAAwEAAAIBAAACAQCP8nL1dcsM7AADAQAAAwEAAAKBAAADgQAAAAEAAAKhBAAAwQQAAwEEAAABAAAAwQQAAQEEAAMBAAABAQBiOrj4l/Lg+AACAQAAAjkIAAEBBAABAQCX8uD4AAOpCGI6uPgAAgD8AgIRDAICCQ6gpyj4AAEBAAAAQQQAAQEBSY9M9AABAQAAAdEIAABJDDwP8PAAAG0MAADpDOcREvbABNjwQ2rM9AdujvAAAgD8AADBBAABgQgAAAEGd5ZM7FtDKvIVEcT0fvRE8QXvJvVDizzqCg0W6WCcSve7fBr5xiIY9UE7CPZ9eF72roMO9y+vFPQNpCTwYHSk9Mt/HvcmsI7zLk+u9rZ1qvY2QQL3ezYM92F5oPSSCAb25f5m9lwOOPR+0RD1rSSK8C6FavUPVIjy//HC9qunWuylQib197KG8q2gMvK+plT1gEXe6GpqbvQCzIT3/+xq9h8+1vEknQr2fc5E9N5+vvW876zrBW4U9YECevd8pnLzKoeU7/6divQzCFz6D/iA9vW32uPJYsz07mIa91zvAuwI3qr3VM/E8z1EtPMrOcrxFruY7f3fVvXqQ6b2gIsA9p2SKvfqw6TzLMea8v4GsPav4Yr1VX7I8psi+vWgrUjzqmuC8JvSRPe8goL3o1Gk77MtIPX4GLbw9coi9C0qjvPNbxT1EwAs90645vFf1pr0Pnjw9B2jwurc7Ez225x+9/OQ+O7MgvL0j2Ic9enTbvNMKPT0zD6C95yawvZRBlzzC4VK9WCRrPFK3qDwb+oa9bsg+PesNkryRlUw971ktvYkFkz187Iu9kAIRPFappz2jIrA8Ap2rPYWphb3Yo4a8GE32PLQlBT6MPyE9h6W4PQpV+bzo/5M8bssXvVvlt73R0cu8DMSNPRMsLL0Iztu70LExu9hwj72jDPA6qsQLvZkxSz0t0jS9D27jOcOkmjyfSYk9hXBivYCb2rw/bc49xS4JvZoWir3XrAO9/dV1PJQkFrwDPpO9PP4uPLKpsrymI5S9EYgover2pb1p0xS9/TbHPFjFT70Vc7+8oCVbPbdLwr17xQS8j7GfvEv4ib13k4g9gCwGPCvSJTwnED+86shAvW3dhD0frCY+Rh4rvGgXOb1nrGY9a5pTOyd3uTzQz2u9t2gLPT878jzDRZC8QqGHPdhpzjwT4Ka8NDUvPPredz2q63S9cuNjPT1RRT7lC+c85/YuvdpJDrxoW109L5Fmu6zgx71Sfn68A5oYPsMm3Dt7Zwq9RbSLu9qMXz1t/bG9LerNvLfnND34SB29YErTu3cB6r3PoyU9zE0WvW2szj0j17E8UhpHvcXPIbzxWJe9GJ/UvBgw3z2igds77HOovCcqk7u3bds+AACAPwAAgD8AgLtE0Qu9PQAAQ0QAAIA/AIBlQwAAwEBcDwlDAACAQI7GvT0KicQ7AACQQ+J1eb0AAGFDAACgQAAAwEAAADpFAADwQjfL0j4zMwVDAABAQjOzGkMUjpI9ZmZgQwAAgD8AAKBAAADwQwAAfEQAAIdED0ILPgAAh0UAAJBCAAD4Qv2Gv71mZoxDAACQQrfejjwAALhCAAAAQKgpyj7ixd88AACgQAAAoEAAAOBAAACKQgBAg0UAAO1FAABzQwAA80MrkqQ9fVYhPAAAIEEAADRF7z6MvamJnj0AAOBAAACgQAAAIEHfum48Csdpu0vEW73FDV68D9ygvU/sRD7Jksk8AADgQAAAbEJX/FS9wZ1CPAAAz0VmZl1DAACAQAAAWEQAAIA/AAC3RNeAuD0AgFNFAABAQAAAMEMAAMhCmhmPQwBAg0UAwIFDAAAAQQBA40UAAABBB8BWPRiOrj4AgKxFAABAQAAAgD8AAABAT00AvffYjL0AAApEapzpu+iIc73PWjW9AAAAQQAAAEEAAC5EAIC+RTMzBUMAAD1DAAANRQAA7UQAAOFEGxZkPQAAoEAAAMBDN8vSPgAAQEAAgB1FC6y5u4++0L0AgG5FAACiRAAAQEAAAHxDAACMQgAAeUUAAABBZuboQwCAO0UAAIA/AIC1RQAAgEAAAMBAAADPRAAAAEDN7CNEmAEIPAAA/EMAAApFAACAQAAAgEAAAIA/AACgQAAAQEACYIW8AACgQAAAAEEAAAxC069fve28/DyUKIo9KU0BvQAA4ED6GjG9jC46Pumiiz4AgKlFAADAQAAADEIAADBBZuY0Q5qZQEMAAApEAAA6RQAAikS7ROc9k6QwPi05VbuoJ+C9J3HvvKgpyj4AQJ5FAACgQBQJtr0AAMxDAAAgQQCAFEUAgDtFAABqRWbmh0MAAGpEAADMQwAAnEUAIAREAMDJRWIMpL0AAABBAIBTRdBsur0AADJDAAAgQhSubkMAACBDACAERAAAbEMAAOBAAECwRRf8yD0AAABAAACgQAAAuEMAAL1EAADYRBtu/T1JRbq8cATevQAAqEMAgDZEAIACRmZmMETH9AC9nS7hvZsHszx+Pqy9AADbRAAAAEEAAG1FAABtRVeeqj0AAABBAACAQP6uHDwAAAxCAACAP68ns73a9zu8D2qBPS0zdL0lBMe7mqcIPrVQkLyrNng9j8L1PfnSvj3x8HA+pZdwPeDK8LsGBBQ9PYmDPdrDgr1WYoG9NdFuPR3F5rtPZZQ9TnOFO/MNIb1sSrI9r3HTuqqw2rz06Qa+X6CLPbj/yr1JP6Y9sCeavRo3rj1nkou9w+nJvS0u1btwf9s9x51DvdYjCT1lBlm9T5PZvaASWr1BsqS54OkqPguuxb1VEPq7Yu9+u/Ah8z3A/Be+uq2BveqrnTxn31C9aB0fPTICaLrNKs88/93GPWLpMz3673a9k/TqO0fWqz0QMfu6e+CTO/6KMb1XC+k9WO/LPK86cr1bAbM9klsuOy+Asb3rrjU7Tz6jvUD+sT1ap5w9WlT2vNDjwrxs8zE9ed4dPnpHhT1wqqC9i5q8PMQmqD2tEKm95CmIvMuN/z0Xx6q8ubCNvQ/uKTzx3Ie8DGVIveB1vzuoC2C8XxGrPTj6GbwIpt8756sTPpUo1Dz04Km9p1/0PKN7Mj3uQAU+pG2IPSpqzbs5chG8admDvYkQi7wiiI09dfK+vBAimT3EEpK9art/PBE7yj1lIZw8S1LcPNlDm72rHJg9ecGtvLvQWzyHZDO9AAAAPwCAZUMAAIA/AABhQwAAAEAAAENEAABGRAAAAEAAAIA/AABoQ2gT0D4AAJBD4PSMOwAAPUNzJ4M9AIAsRQAAgD8AAEBAAACKQgCAEUUAADpEAACgQADAAUQAAEBAZmbCQwAAKEMQ9PU8AIApRQAAoEAAAFVDmplSQwAAwEAAAKBAEMCvPQCAU0UAABBEAMDJRQAg30MAAHxDAIC7RACABkQAAP9DAECSRB3y9ru/qIc9O7/HPQAA8EMAAJBC73O3vQAAyUQAAIA/AADIQvaoKkMAAFJDAABcQ5qZQEMAAOBAAACAPwAAt0QAAIBAAACAP7NRybxAsqS991aKvSVFCbsvAiQ+R08sOxSubkMAAABBAAD5RGgT0D4AAEBAAABAQBiOrj4AAOBAmhmPQwAA3kQAAEBAAACAQN9mPzqix3U9w309vTAv1TsAAGREAADgQEdLGj7FHpO9AACgQgAATEPNzPRCAAAAQQAATEM3y9I+AAAuRGZmXUMAAD1DAAAgQQAAkEQAAFhEAADAQzfL0j4AAABAAACKRe+e5joD59I9DRRpPQAAIEEAAORDAACAPwAAwEAAADBBAADAQAAAgD8AAKBAAMCBQwCAeEMAIAREBZDVPQAAhEQKv448Z+5Mvb+z9LwVoPm9AACMQwAA7UUAAEBAAABAQAAAQ0QAADBBAACAPwAA4EAAAExEAAAwQc3M9EJmZi1DAABwQgAAgD8AAIA/AIA7RQAA0kIzsxpDAICLRSwHSL0AAEtDAACQRJqZUkMAAMBAAACAQACAJkUAADREAACAPwAAIEEAAABAAADkRAAAjUUAAMBAAABPRQAAQEAAQJVFAABAQABAnkUAAMBAAADVRAAAAEAAAEBBzcxiQwAAgD+y2sK9Q1TyPAAAQEAAAGpDAADGQwAAqEMAAKBAAACEQwAA8EMAAEBDAADPRCX8uD4AgIhFE1rJPQAAgD8AAM9EAACAQAAAgEAAAKhEAICCQwAAgD8AAIA/AAAQQQAANEUAAIRDAADgQAAAEEFm5qRDAACAQPdg6b0AgG5FUuK4PAAANEQAAIA/AADgQAAAgD8AAIA/AIBKRQAAoEQAAIA/M7MaQwAAoEJoE9A+qCnKPgCAFEUAAIA/AAAgQxiOrj4AQJhFYxrWvQAAuEIAQJhFAIAyRQCAMkUAwFhDAACAQAAAeUUAACBBwP/vvQBAg0UAAD1DyOCKPAAANEMAAIBAqCnKPgAAT0MAAGREAACgQPWyYT0AwMxFAMBYQwAAoEAl/Lg+AADAQAAAEEMAAEBAZmZgQwAAAEEAAIFEAADVRAAAoEAAAENFAACgQAAAAEEAAPBCAICsRQAAQEAAAIA/AABcQwAAwEAAAEBAulOPvQAAVUMAwJ9FA6OovHqbhz3NzGJDQj4pOgAAgD+wLhg9IDKRu+xtpj11oJw9AAAgQQAAIEExZbI8AIAdRQAAEEHNzGJDaBPQPk8zOz4AAGxDypxZPSKqqb0AAABAAAAwQQAAhEMAAIRDAABAQCX8uD4wclA8s3UVPgAAQ0QAAIA/X7P3vAAAQEAAALFES8S8PQAAEEE+rio+AADAQAAAikUAgL1DAIA+RQAAwEAAANhE270gPum5AL0AAGpEAICsQwAAAEEUrm5DAAAKRQAAhkMAAHNDAACAQACAh0QAAIBAAACAP6yNhD0AAABBAIBQRQAAakMAwJlFAABAQAAAQ0UAgL5FAACUQwAAEEEAAOBAAACAP/3DpT0AAApF0iUOPgAAwEMAAFJEAAAAQQAApUUAAIBAAABeRUUFiLwAAIBAAIBoRQAAAEEAAJ9EAMCBRUCC/j1tq/88AIC7RAAAeUVfmp675hiHPPMgxr1TZ228U2GKPC5HR71SdbQ8G93fPcp2lzxFuNK9Gr/WvdtDqD2Sghg7FasxPvN7DT2AlK69hYvSvEIMPz2qOnM8r32YvUzOFD42NZk8f2UQvqGNpb2yMeI9gW87vQ4fBDwKMv29rQfNvbM8iD24RxU8RTFrvWtCDD7NUJS8zEGBvZoG4T2EQ8I8RLMYPvVdnzoQTaY84Vy9vXXfEz7300k9QsMmvR5KCr6wys68SjXZu/8dET6MroE9h90tvfML4b1oqik9wzOwvfrAPD1Gzx8+G0c9PRuzArwlrgW+2lLevX4IiLqS44u8iRK4vS+t6T1I/Ci9eM3aPLgs/D0HqK69CM3ZPAfqELuEVYO8LGORu5Na3TzjWou3H94WPoCZdLyYEpM90xcDPSfBgb2TtEO9u7RFPMN/Dj2XhJW9cqv3PQjuqb3jiTU9Z+GpvQo+ejvgrzg+uxXUPQ/LvDyBUj09ZBMSvVtARrzjRLs9kP+ovbpZ17wZCQE+QJZYvPv2r73ERBS+hWzqvMfpz73S+MG9gEPCO5XUG70izem99DIaPVqPmL3zqfw85HYFPjjiVTtbDAy+HSOnPe7bJr0bpIk9d2euvGk9Ab1LcKW9O+0rPTfHdL2YLqG87xyzPXZfyr2VVJm8JpawPbhajDxThpG9j8oSPYUvrb3V24G8dUaOvW3Ehj3CPuc8Iw/8PaQkBLv/4NO9mh6nva9amj2Y8fW93GG0vJps0D1AYW+9jiuqveFiDD2QkKk9q/hjvUi7xL2HW6k8K93fPW9/9zzkG6o92cGlu2z0uT0BWMc8G1nQvFDhWT0R+R68d8eavYs7P7sgkK89jM8bvfPRKbq34oI88Or8vBL1x7xfZmc70p/ZOYfiGL2T+eg7DcpgPSWqizvkSMu9c58QPB0VnD1yjF29b3G7PNejn7zY8808/RPmvNJ3WD2IKLQ9QyH6vE+0IL03qao9Q+OVOxq5Kj3xi8u9g4vwulvZez2QTVS9LXPNvUrLyDuHXrs8aANFvRC+9D19YJe9+7SyvPlrjj3XGuC947KIvBpaB77tXYm9w1CYvGcEjz0dpM85e9x7PTjW9Lwt7UM80oz1PTfO6TyPbp088Ze7PQO+Tb2QlSg9JY3qvS92Nb3kFMY920NUvYCjW71XgWs9DVvlPKOYzj0AAAA/AACAPwAAgD8AAIBAAICURJqZgUMzMzJEZqYFRjMTw0UzM3tC2YkdPiX8uD7xw8c9AACAPyrCgT0AADJDAACAP82svUUAAOBAAACAPwAAEEGYf829aBPQPhx7oLsQsXM9AAA9QyDqgL0AgLtEmhmPQwAAIkMAIAREAACFQlNVAL7TC8o9ZmbdRQAAQEAAABhCjC46Ps3MrEHlFZM8RkU6vQAAMEHfcFw9AACAP2aGlkUAAD1DwinRvQAAAEAl/Lg+AAAwQi6Tiz0AAABBAADgQACAykUYjq4+PTncvCu7rL0AAAxCAABAQjfL0j4AAEBAAACAPwAAAEAzMxdDt1brPAAAgD/pogs+zYwYRSX8uD4AABlDAABfQwCAoUIAAPxCzcx9QwAAAEG1+lA7AIBlQzMz6ERmZkJEzcwRRAAAEEEAAIA/aBPQPqQJmryDIt09qCnKPgAAAEDAv669AACgQAAAoEIAAABAu4CsOgAAQEBhYw4+AACQQkCLq70zMwVDQ63Nuc0Cbr0AAAtDAAAAQAAAAEDNzOJDmhngRBiOrj7fXvg9MB5LvBiOrj5Q+vq9mTq1PQAAREMoZBM93+UQvSOJvz0AAAdDR/qjvUMf2TsAAOBA+EiTPTqEer0AAABBDxi0vY6HDD0AABBBZua0RAAAhEMAAKBAAAA9Q2ZmMESzQsg9uWetvAAAgD8yVp+9AAAAQWJ5kr3bsy+8TbWnPf2yWTzPO2C9rASYvQpXq0IAAKBAgghtvUeXmT1WL5Y8Kg6sPZfQf70AAAA9BWR4vQAAAEMAADRDAAALQ9OHs72amTdEIG28vQAA4ECXpbs9zczHRAAAgD+XPag+aBPQPmu2yTzzCLS9SoFCPa/3t70AAIA/KaGlPZTyhz3iRWm8AADgQDOzdUMAAFhDCJpjvcrTAT4AAIA/zcxiQwAAoEAAQCtEAADAQGbmE0MAAEhDAAAYRJc9qD6EOrC8w+UtPQAAoEB3wWy9R/MkPQAAgD/uqrI9wttRvOsa9j0AAMBA5k1FOyBs0DxT4GW8dwwjOkhs77sPIQu6U7aqu0bgmr3NwIa9GAOlPH9y2jwPL1+9h5kOPSfv8D1GyQ+9WyLgvZhKXz0HKIm9E2sjPY9Lc7zr+7S7oxyCvYvydTx/Lo686sKiPF3DGL0wUFg9t/SDvd852TzvALg9PZIFvd9Z0zzjKnY9MDbUOwDK4D0rNS09NpQnPbpPqL2rBKU9B9gIvO9H6zxvWsM9oGeZPfSNprwmuw49vUhWvPvnoLyhv469i8RYPdFEHL0AAAA/AAAQQQAAgD+amZxCAABsQgCANkQAAKBAAACgQACAoUIAADBBAAB4QmZmwkPaNS47WmtjvVyPp0KoKco+AACMQgAAgD9cj6dCAAAAQagpyj4AAABAAADAQDk0vT0AAPNDAAAAQJdRhj0AAABAAAAAQAAAgD8AAIA/AACAPwAAoEBoE9A+AACAPyX8uD4AACBBAAAAQAAA8EEAAEBBAABAQQAAoEAAAH9DNeiOO2jzWz3PhhK9Ek3nPAAAAEAAAIA/AACQQgAAWEIAAABBAAAAQAAAgD8AAABBAADgQAAAoEIAAIA/AACAPwAAgD8AAIBAAADAQgAAz0IAAIA/AACAPwAAWEIAAIA/AAAMQgAAgD8AAEBAAABYQgAAgEABsr+9AABAQAAAoEBmZh5DZuY0QwAAIEEAAIRDAACQQgAAgD8AAJZCAACAPwAAAEAAAJlCAACgQAAAgkIAAHhCAAB4QgAAgD8AAIA/AAAAQAAAkEIAAJRCyfuFvW1w9j2H1gy9C304PQAAgEAAAKBCdZ7VPQAAwEAAAKBCAABAQBiOrj4AAABAahHlvQAAtEIAAABAAAC0QgAA0kIAAIA/AAAAQDfL0j5oE9A+m3sZPod3jLwAADBCAAAwQgAAgD8AAEBBAACAPwAAgD8AAABBgjBZvAAAQEIAAKBAxbsTvJeFzD3cyhq9H5vivYdhbb0AAIA/AACAPwAAKkMKV6tCAABAQJqZ20IAAABAAAAwQQAAkkMAAAxCJfy4PgAAiEIAAFhCAABAQCX8uD4AAGxCAAAAQQAAgEAAAIA/Yv3vPeWkxjwAAIBAAABAQgAAoEAAAEBAAAAAQTMze0IAAABB+4+DvQAAgD9/LWI9AADgQAAAAEHQKOM8GHMJvAAAwEDgw/a9qCnKPgAAQEBuPa+9bzxjvAAAgEAAAOBAAACgQgAAgD8AAABAAABAQCX8uD7ib3E9WQGbPQAAgD902Qy9mvsVPAAAoEAAAABAzUyfQwAAIkMAAKBAAAC4QgAAoEAAAIA/AAAAQAAAIEEAAABAAACAPwAAAEAAAIA/lancPYJ2pr1SwyS9msyWPAAAIEIAAEBAAAAAQQAAAEAYjq4+AAAgQgAADEIAAEBBAABAQBiOrj4AAABAAABAQQAAGEIAAABAAACAPwAAgD+cBAs9/UyRvQAAJEIAAIJCAAAwQQAAEEJcj6dCAAAgQWZmlUMAAEBBAACAPwAAT0MAAEBBAABhQz47HT71osI8ZmaMQwAAlkMAAIA/AAAgQvOYDr0vvfK9AACAPyX8uD4Yjq4+0m62vQAAkEIAAEBCAAAAQJfdCD4AAEBAAABAQAAAAEAAAEBAAAAYQgAAgD8AAIVCAAAwQgAAIEIAACBCAACAPwAAQEAAAIBAAACAPwAAAEAjA7I9AADAQC3Wpb3VE7o9PTcOvQAAAEBiNig9e8PHvYuPPbwAAABAAAAAQQAAAEAAADBCjd9kPXiRz73YvZK9AACAPxvTnTygZ+Q9AABAQFiLib03y9I+AABAQAAAQEAAAEBAkUiMvVBB+7sKdKA9k1GrvUlxzLwAAOBAAADAQAAAoEAAAIBAAADAQApXq0IAAABAHa99PHj4tb0AAIA/AIChQwAAgD8AAABBAACqQgAAAEA3y9I+zczHQgAAgEAAAKBAAAANQwAAQEAAAIA/AAAAQM1b37wAAABAAAAgQQAAgD8AAEBAAAAgQZwlor0AACBBBL3MO1unCb0AAIA/AAAAQAAAgD8AAIA/AACAPwAA8EEAAIA/Dh0avQAAgD8AACBCU5wBvZLzbD0AAIA/pbqiPAAAAEEAAEBCAAAAQQbeCj0AAABAAAAAQQAAgEAAAKBAhfCXvQAAoEAAAEBBAACAQAAAoEBlKbu9xCsBPqL5LjwBy707GF1xvQAA8EJcDwlDaQQUPgAAEUMAAABAAAAAQAAAQEEAAIhCAAAAQAAAIEEAAABAAABAQQAAIEEAALBDAABDRADAAUT87MW9SpvduwAAGUMUrm5DAACqQuPf4LwAAFVDAABAQAAAIEFa1Jq9AAAAQAAAMEFsh6C9jxjTu4fLrz2lZfm8iu9hvG+1hj37j8M8lSvvPfgIUb0MNQQ7g+0DPYM/lb3I5008iU+HvS0MNTxlyoq9XJuPu8qAWj3PT5g92z5CPN3hG71K3iY9+zJTu8WrTr3yFgY+L6aOPOfAgb3yD+w9UyKVvXQ4ujzi32q9OJxHPZsY/zsKMCK9r1DYvQ5wu7zC9eG8S3kEPR1g8j2DYBQ9g8BMvUvoXT2hV8C94ggNvfukUL1/LY+822kfPdN9OjxYsz69G+cOO9ftSz1TMJC7s7P6vELZsztY74G9IYu8vPl/yz0v/t+8bqgVvbNKKDzf+dG8PczLPQvcML1D28G9r52hPXlMCrvlLcE9WI7Gux9oMj08jwY+p9OePDKloD1TNeC96412vFLIS73jXL08gqavPVtckjuD26W9qEOsPOuNr72rN/o7g3e0Paa1l7yr0IS9SHgEPOy5Dz6bDPO8yIdCPaI/Drxzdgi88xEyPPWc9z09A3U8svTfPPe0yLy3GZA93CEQvU0GyjtwzTQ93+4gvhzlBr1DE4o93eZjvecwjjw/OVE736+NOmmvEbxvyFw9p4kavR+FeDvS5U090JlUPS016Dv7F2Y9uBlsPOCz/juBjEu9pH6wvZfchD2AgXm8nyY7PMJhVb3JozO83PemPR6OHb1EWZs9Cz7SvR6ug71fZN89LgebPUQoGz47I6U952CMvIEwlr3LjWA9g7mHPaC5ULx+kMQ8gD3SvG87h7xcwJG94q0DvX1nc7pMErk7i2FSve1Jub0dPiA9L80jvc68HTxz7Ii9M0tHPTPPUD0ZERo+RyceveIO1L0bWoi94e4/u6qH/Tyz3NS8FyvXu6bZpL2zmVY9j7DEN4x9RjvikSE9kh8WvLSSLL1QL9u6r+DmPQFrtjuLIw69KxxPPWsLhr0tiwo+q1RsPeqYIbtAomw9O0java2NJrzCDRI9qOUTO3INubyb6sG9Vqyxvc5EnDxaK2Q9wywBO2+E0r3LTRC9Yqf5PPuIK70rchw95+40vebZmb0jtWY9F6kIPejmRr26d+Q9LzFUvUjQO738aMi9kUghvS0L3DzabO29hedOPZfWQL12roE7mpSsvKFrBj6s2re7qOcmPQAAAD8AAIA/AACAPwAAHETx8PA9AABAQ8JifrwAAPxCAAAuRAAAAEAAAKpCAAAwQWZmwkMAAIA/GI6uPmgT0D43y9I+AAAAQAAAoEAAAKBAAACAPwAAAECV+IQ9AAAAQQCAF0UAAIBAzczHQgAAEEQAAEBBM7N1Q5qZ5EIAAFhCAABoQ4RNkL0AAExEAABAQFM1c7sAALRDAAAAQCcJI70AAIBAFwskvQrZ+jxNF948rxbIPUTqR73/BYg9AADSQgAAxEIAALFCAADSQlwPCUMAIAREAAAQQTfL0j6oKco+zcyIQwAA4EDNzPRCAAB2RAAAhUIAABFDAACgQAAAFkQAACBBAACFQgAAQEAAABBDMzabvYytyDs4BYk9AADhQgAA+EIAAABAAADgQAAAAEAAAABAGI6uPgAAuEIAAMBAAAAAQAAAQEMAACJDAABAQAAA4EAAALRDAAAgQwAAHUMAAH9DAADAQgAAgD8AAChEAABAQZqZwELwHcG91fQbPjMzBUMAAABAAADnRAAAwEAAAMBAAAD4QgAAgEAAAKJEAADAQAAAMEEAAIA/K/WbvcCLtbzFbHm73zGMvP8Tw71xva+8AACAQAAAoED/QqM8pimgPbrwZT0AAApFAACcQwAAQEAAAEBAAADcQgAAIEEAAABBAADwQwAA+EIAAApEClerQgAAoEAAAMBCAAAQQTNUdDwAAABAAABAQwAAAEAAAIA/AACQQwAAAECamTdDAAB8Q7txxj0AAABAAACEQwAAzEMAANhDAAAKRAAAFkMAwFhDAABEQwAg30MAAIA/AACAQAAAIkQAAChEAAAAQAAAgD8AAIA/MzOyQwAAQEDqBWq9AACgQAAAgEAAAExEAABMRAAAgD8AABhCAIC1RQAADUUAgKFCAAA9RADAukUAAABBAABaQwAASUMAAABAAAAgRACALEUAwNJFAAAAQBiOrj69SdM9T6tUvCRYoDwYjq4+WRIHvQAAgEDk+y29k+s+PAAAkEMAAL5CAAAgQQAA2EMAAIA/Uw0MPgAAcEMAAMBBAAAAQAAAtEMAABZEAAAwQQAAoEDi5fm8AADhQgAAhEMAAABAAAAAQAAAKEMAAMBCAAAAQAAAtEI3y9I+AACgQGA6t70AAIBAAAAQQQAAIEEAANZCmpnbQgAAwEEAAMBBAADAQAAAqEMAABZDAAAAQAAAgD8AAKBAAACgQAAAgECXHRG9RcpmPRor0Dyvo4y9AACAP83MiEMzMxxEMzMcRAAAnEMAAPBDAAC0QwAAgD8AAIA/AAAZQwAASUMAAApEAAAZQwAAYUO4XphDRKk4PQAAoEAAAABBAAAAQAAAAEAAABZDAADwQgAAAEFmZuZC0kyqvApB673VPKm94McVPQCAoUMAAIBAI/qXvJiRDD4DiLw9gmrxPGdm7Ttl2La9AABAQAAA4EAAADBBAABwRAAAIEEAAFhEAACNRAAAQEAl/Lg+AAAAQAAARkUAgNxFAAB4QgAARkUAQJhFClerQgAAgEAAAFJEAADcQs3Mx0IAAMBAAIACRgAAdkQAAGFDAAA9QwAAQEQAgJ1DAADtQwAATEUAAFtEAACoRADAyUUAgKlFAIDxRQAAQEMxuYI9MS0xu5qZ20ImwIy8ewaVvYt8oz1lUkc8yaMRvNjunT0qxGe9KAxePBs15jx7CKC87xGEveNec7v6NFg9MCaSvLXeXL00L4097SbzPAu/4D3X1hm9eiZVPYOWpL0/LNi7/Y7qvLsepT3D/Bk9lzzcvCOH4j3PrGS8uyUXvTfbtL1DTai9taGbPAORAL2kSDE8700ePQ//rL1fdt6828MGvALBwLx7sJ29uwEqPiCOFjxoF1s+rLOaPTcxir0k8xU9HfDPu5dehj3Qk2q92vzGPGUxBz4h5wK9nbzrvFKztj1VlX09xyKKvXw2nr1LOHC7hp+6Pf/tprozjtm7RwuuvU/Ifb0KR6U9bdj8PSVQRj1YfnE8qhJava3QMb0Coee9AnOePfdPmrzTMeu8BgQ4u++dlb3Hfrw8iFGnvMm3yL0boSu81tWGPL+Z7bzy7ke743kEPfpqT7zSiIQ7gXgEPTMXkDx6E1S9gTA+PnbiBjqR7De8PK8pvQheUL367x49Jx+CvU2DgT0g3089CCEqPhGJEzz3qoq9LTRjPRf8V71Yv369qL8Hu3QHAj5lwrM8RfC3vVKKPL1Tb3i9nUTpPbAHoTuaQs69BFnAPQx8Bb09uCI9Yo7jPVpc4b34yqy8MTiJPXDRlr3K1oE9y/0ovW/5qLs7CSa9TZlVPWggib24zU+7YVClPUcUD7zzOc49S0tRvGqlPT2UQMy95bTVvMeeXLzJ1qe9C/K1PZ/Nuby749m9ZdNvvBpyGj7STE090yVsveP4zTx1dFc7T40cvUPK/z0IeeA8Ybm5vCQXob0Pk6o9LBK2vE5yp7zPb869AJjQPcVd27vf5eM8TehxvbCS4rwm3gY7Q6/zvDgmxbsqvGc9UoyIO48Eq7xNBq8850ecPUDb5L1eZD49uhrmPSVJab2IXpY9Bjylu28jvr24iSE9N7UfvTdCEr2PD908wfOiPT1/f711Euk9m7WavGpeWb1tf3A9vIRDPcAaCTwqL/i9Jz6Pu7dvsjuHXqu95sMcPOfKmb2r07Q63rQYvbtJmT33TgC9D5A0Pahgb7065T+84nOUvWmFq71Cmo+8AAAAPwAAQEAAAI1EAIC7RGbmh0MAAKBAIlPEPQAAwEAAAMBAAAAAQDMzjkPTi0G9AAAAQAAAjEIAAHhC8yekPQAAgEAAAGhDAABPQwAAQEAAwAFEAAAoQwAAkEIAAFhCAACQQgAADEIAAK5CAACAPwAAgD8AAChCdR+pPQAAQEAAAEtDwyzuvfI69bwAAKBAxwq5vT99Wz0AAJBDB7ygu97FqD0AAIA/AABqRAAAHEQAAIBAAACgQAAAAEAAAABAAAC4QgAAhEQAAABBAACfRAAAVUVcDwlDAIChQgAAgD/bsa29AAA9Q8PCpb0AAMhDAACaQopiW70AAABAAABwQwAAAEEAAEBEAAAQQQAAzEMAAJZEAAC0QwAAwEAAAMZEAIA+RTNj2r0AAIA/AAA6RQAAMEEAgBFFAAC9Ql8XObwAAIA/AADbRABAkkUMlyy9AACAP+Ky2L0AgItFAAA3RQAA4EEAAMBAAICyRQAAOkU6BZq9AMDqRSUUkz0AAABAEkFEPQAA80QAAOBA2yZePULTbrwAACBBAAAoRQAAtEMAAFtFAACAPwAAiEIAgLJFAAC3RAAAgD83Vb29AABkRACAcUUAACJFuP61QwCAMkUAAJZCAACxRAAAzEQAAMBBAACAQAAAMEEAADBCmpmcQgAAQ0UAgBFFAABAQQAAtEIAABBBAABAQAAAwEAyDmG7H/P6PQAA4EAAAOBAAADAQCCVxD1ynSO8AICIRaUrcT2HU6q9AAAwQQb0FDwAAEBAxtfDPT+dwz0AAEBBAAAiRQAAykIAAIBAAABsQ96iqr0AgL1DqALwPACAcUXTZjm9AADAQBOubz0AgL1DAAAAQAAAMEEAAMBAAIAyRQAAgD8AAEBAAAAwQQAAYUUAAABAAACFQgAAgD8AAFJEAACCQgAAgEAAAIVCAAAgQQAAAEBd2I6921ADPfvNCT4AAIBAAICIRQCAGkUAADBBAAAAQAAA80MAgCxFAACZQgAAikUAAOBAAAAAQAAAgD/Aq+s9AIACRQAAAEAAABlFAIC+RUEwqT0AAEBAAAAWRAAAQEEAAMBAAACMQgCAJkWrbMU9KvdWPAAAgEAAgEFFAACAPwAAB0UAAEBEBeiBvQAAwEBiEsq9A6YGPAy8B77N7CNEAADVRM4Dlz1H1Cu9yM3bvQAAAEAAAEBAAAAfRQCADkWBzIM8t5+hOl9H270dImq9i2JOPZWvm721QE28AAANQ/tk0729WYk8os/wvDMze0IAADBBAABhQwAAIEIOPxW870pPPQAAQEDwP969X7VmvGjR1z0zc5BDAADKQy9gjDytXC+8n2eXvSfobLu7GkQ9hm8zPHH9Ab4n+J48Tx+lPMGjEL3SbFy8eT6dvcfdDzx9iea8+3bUPfyAkTwL1F88TozLvAJRjT0iWGO9jFSJveS5ED6yA8G8fhy5vev1mL1SAvK7w4qfPQ1c5juS6sy9COyOvEuK9D1Yilq8FBm5PQdnNLzWVqQ9erj5varH5D0fUSm8DVE6u/8fYT07oTe8IEXTPGIS0T2CfNA8WJDlO8MPR7tOlbs76kuXvcu4Db1/BOQ8OFBavEdP2L2TYC288N3UOmUsCb2HGVM8H0cGvqA4m7zl+1C9wDhQPSGWi7q8Cpa9jLm9Oad6Hj2jYEK9UUkXPHPK7T102ZA90FbgPEvaJL217GQ8i77dPQccQjwPdK69s1zHvdXHAL2P3pk9c/m7vSprc71319O9aXgQPaMYlr133LU9iO/gvDvms70LhAM9roaIPVMvAr3IIHs91x4YPohIhrzLuYs9XbOpPJNBTbyjbTm9t3NIPJsaLD0eDBS9iBStPe8SwDznO7484bjHPf+v0Ty7CGK90wIOPh1qcz27tRS96zOKPce8lD2visS6uJXnPFsG5z3z2sS999ppPXQtpjwR/8W9uWWoPfQLxrwAABBBAACAPwAAXkQAAIBAAACAPwAAQEEAAGREAAANRQAAgD83y9I+GI6uPgAAAEA3y9I+N8vSPgAAAEAAAApFAMCERQAAjUUAAEBAAAAAQQAAwEIAAMBAAAAAQAAAMEFoE9A+AACgQAAAAEAAAIA/AACAPwCAfUUAAEBAAADzRDfL0j4AAIA/Jfy4PgAAXkUAAJxFAADgQABAp0UAAIA/b7dEvHW2Wr2lhPY8AACAPwAAMEEAAABAaBPQPgAATEQAAIA/AABAQAAAQEQAAEZEAADAQgAACkQAAEBAAABAQQAAQECqP+A9vd27PACAdEUAgIhFAMDSRQAAikQAAN5EAABAQAAAAEDa8WO9AAAAQAAALkUAADBCAACAPwAAWEUAAABAaBPQPgAAAEAAgCxFAAA6RQAAwEEAAABBKZCYvMpJwr2jlLi9AABAQgAA/EPHQ3O9qy5/vQAAgEAAAEBAAAAuRQAARkQAACBBAABAQgAAQEQAAIA/AACQQgAAgEAAAIBAAAAuRAAAgD8AAEBAAADwQpn6mb3eIQU8AAAQRA1tsb0AAABAukKbPAAAMEF4k9W8AABbRQAAAEAAwIFFAACKRQDAzEUAgNxFAAAgQQAAAEAAANtEAAAAQAAAQEAAAABAOER9vE3q/z0AACJFAABbRQCAJkUAgDJFAECeRT2Jbz0AQPtFAECeRRiOrj4AAIA/AACgQDfL0j4AABBBAABAQACArEUAQKdFAABYRAAAwEAAAHBDAMCfRQAAgD8AAOBAAICpRQAAgD99EHI7M5/tvFW6bD0D7m87AABAQAAAMEHn/fs8AABAQwAAgEDZAC07AADAQgAAgD8AAIA/8yzGvQAAAEAAAIA/AADwQgAAUkQAADREAABwQwAAgD8AAIRDAAAgQQAAQEMAAEBAAACAPwAAHEQAADREAAAAQAAAUkRew5+96qOdu6Uh4z0AAKhDAADAQgAAQERWwEi9w1AFvrFymz0AAIA/AADGRAAAMEG6Ceo9AAB2RQAAIEEAAEBAAACAPwBAkkUAgClFU1fwPVw7Ar4AAIA/AACBRAAAAEAAAHZFAADbRAAAokQAAIA/AACAQGgT0D4AAIA/GI6uPgAAgD8AAIBA3i2YvQAAgEAAgFBFAACAQAAAIkUAAChFAAAAQAAAQEAAAIA/AAAAQABAsEUAwP9FN8vSPjfL0j4AAMBAAACAQAAA4EAAAIA/qCnKPgAA4EAAAABBAAB8RQAAAEAzYrc9AACAPwAAgEAYjq4+AMC6RQAAgD8AgKlFAAAoQwAAAEAAgEFFAACAPwAAAEEAAEBAAACAPzfL0j4KVzg+gjtfOwAAT0UAAIA/zzIVPgAA7UUAAEBAAABAQAAAwEEAAIBAAADAQgAAgEG6CGi9fzBSPLSSwbxzkbW9AACAPwAAWEPzxc09n4XOPEUjeT1/Lm+9Cm73PQROBDwAAORDAADAQwAAkEIAABxEel/aOwo59zwAAOBAAAA6RAAAMEHQQKC8ctQaPoQCljwAAIA/AAD8QwAAQEIAADBBqwXrvGx9s70i1sq9j2N8uwAARkQAAIA/AAAERAAAgD9Ij9q9AACAP1/bDz0AAABAo1TCvCAwYj0AAHBDAADAQ8MeI70AALRD81G3vVlBCD2igNU8tXfuOwAAIEEAADBBAACAPwAAgD9Sam49AAB8RWuVc710ay89AMCERVCWAr4g5WM8+60bPgAAQEAAAJxFAAAoRQCAtUUAoAlGp9aHPQAAgD8AAIA/AAAwQQAAoEAAgHFFAADAQAAAyUQAABlFAACfRAAAq0QAAEBAAAAAQAAA50QAAKBAAABAQAAAgD8AAIBAAAAAQAAA/EQAAARFAABAQJWNHD4AAAFFAADAQAAAZEUAgCxFAAAZRQAAoEAYjq4+AIBxRQAAwEAAAEBAa1kXPgAAAECLAS875yHjvRiOrj4AAFtFAAAAQACAjkUAAIA/AIDQRQAAjUUAAEBAAACAP+/hqT0AAEBAAACNRQAAoEAAQOZFAAAoRQAA2EQAAE9FAADAQHOBN70AAIA/AADgQMvzgT36tPi9AIB0RQAAQEAAwIRFAADAQAAAYUUAgGJFAECARQAA4EAAgI5FAADAQAAAwkIAAIA/AACAPwAApUU1/s69AADgQDfL0j4AgKNFAABQQgAAwEAAgKxFAAAAQAAAhEMYjq4+AADAQAAAoEAAAFhFaBPQPqgpyj4AAMBAAACAQAAAAEAAAIA/AAAAQQAAAEAAgNZFAIDxRQAAgEAAAGFFAAAAQQAA80Q3y9I+Jfy4PgAAgEAAAIBAAMDSRQBAsEUlQ9S7AuwDPgAA8EKjfLI9fCGgvQAAqEMAAEBEhd9cvQAAQEIAAABAAACAPwAAIEEAAHBDAABGRKmHkL0AAIA/AACAPxOjXD0AAIA/AAAuRAAAzEM60KY9AACAPwAAQEB4Vrs9AABAQCfBh70AAIBAAADMQwAAHEQAAIA/AACEQwAAwEIAAABAAAAwQQAAAEAAAFhEAAAAQAAAwEEAAIA/z4IAPiZdBj0AAEBAAACAP9CnKz7dVYs9AACAPwAAkENlD/k9AAAAQAAAWEMAANhDAACuRAAAnEQAAABAAAA6RQCAcUWhyL29M8UCPgCAaEX30928NcowPQAAIEEAAIA/AAAwQUvLBz0AAABAAACAPwAAdkTD4By+AACgQgAAIEEAADBBAACAPwAAwEAAAIA/Gt0HPgAAgEAAAIA/AAB2RAAAfEQAAEBAAIACReLszD0AgH1FAMDDRQAAsUQAAM9EAAAwQQCAO0WaOKu5B11OvepRXD2Fyti6oIaAu2HXFb4CpJS9tckwPWi1p7z7j9e9VPS9PZOoSL2Q9tA9N9kUvQrv5z3bSpA7/faoPQMYNb2IYc69e8OzvOq+hD3cR6C93z3uvTvURL0Hn9s9dxn0Oxha6LyFiVE9T01XvYGACz0ZPpG8ko5iPWhR2D3+KxU9ufqYvWKm2rxl++E9G1ervSBEnbvR0wK+d7LfvdMlOz1tyAQ9a6VPvUTklr1ndsE8ROOVPaWzZzwbDgM9/2D/u99sArwuwa+9e/MsPRUCkr2XLC28o3m/PV2f8LyrhEc991uMvRp1s7z/c689yDNqPKfAwT26+Ao75cx3vb+s+burRKE8UjqwPf0U2D2b3Ku9wVqhvSZICrvZBZc9hx7XvLXXlLvODQc9IiITPXVfaTtveHa7wLTsPOkNojyv5RS7K9LBvDUscD1qPQG+yAdjvd21rDxacRi9GnZLPdVwAD4xzxE9nqqMvaMaAj0HiIm8F3HZPbcDCD1bGKM9WyT/O2uG3j0VSSo9w0fOvcdO/jyTetM8l2x5vLerwb1Yfn29slKkPe88d72jyc09N67FO9vSpb3h1Zw7oL8GPtYZqb0v2/u83l0EPqlBI73cuiU9B+6jPa9uFb3Ct0088iPMPdqk6L2D2va6CglpPUPpsTr0wQQ9Os4cvYAC+zwAnWc7HKQmvYUSLj3Tqwm9J07kuznLKD1ngOI9CMqTvPHipDwXOmM8NzEnvcJpTb0iEpa8wiFru3uMTT2wNZS7+4omvXTrjDxKyUQ9Mw/KPCvtmTtYJWo9grPZvDMjLr1VfP+7ptQRPVm0p7p93jy9EtPzPB+pm7yEkZY8A538PeqK9Ds7Qoq8svIePcMLl7z7rQ+986tePbcmeTwfBnu99TUhPSqLabowLZ+9KupQPOqb5j0iqsu8kmW/PbfUSjxTSp29g27QPI9WxrwTxwQ9Dpm2vJtloD135YM7v9szvVK1nL2ZeRA9wJlMuy2tWLwDK/U8I8ynvKNGNL27oFc86iFevVeCmz24w5o82ipKPMPYNb1E7r85Xs+XvQsqpL3b4SO9Wl7FO/b+Jr0vObK6xzTOvAnAAj6S4Ma8wxBgvaFtNjxp6cE86Y6KvJMTn7wDD+s81SRVPIV96j1aX3e9w/UhPeVU5zsAZpq9LcP/PAjUPrt4JVE8ad4ovcruAT29Fia8QuCcvGtR1b2i8HG9xaZUPTvFTjzNB5+9rZshPhLDLz0TnFc9fPs8PCeCvrzPLGy9L5+8vfo6BbzCR1s9F9gwvLSyDj3AQX28T1+nvaIjULwKWfc971yJvOAsozzy1W09hCyhvGhe+zwHXDs9nRLtvKB4hrsd1xa9gsTbPYDnnTz3GRW8fB6fPUdZYL37ykQ9QoVovdsisrsH2Z49gjOivMfa2b1EEaw5m6euvYdlELsfMio+yWfEPLN4ITxhfxW98ziGPXt57bwZuww9GhFDvQ0Tw70NTFG8Q++cvUuxBDw0QZk795wXPVieoDxTBHm9BLGPvLe7FT7gK6O8gSubPDxCkb33Vq27N9epvCgJEj6nMky9D/dWvNscNz3NcrG9Qm3ivHt4TTyqtNm9IjkQvQ8Abz3PZ9m8MByGvLvnizz2MZK9RxD/vOfzDz1rUka71ZjPvMuxxTsAQONFAAAyQwAAOkMAAJhBmhmPQwAA8EEAAO1FAACAQAAALEIAAE9D/QjHvQAAQEAAAEBAAACAPwAA7UMAAEBAMzN7QgAA9kQAQJVFn0GXPQCAgUOoKco+W6YgPQAAAEAAAPhCSKGiQ0qVsj0AAMpDaBPQPgDAukUHrME9AAAAQAAAdkQAALBBZmbmQgAAh0MAAFBCN8vSPt98t70AgAJGAHIjPFf3gDsAQC1GAAC9QgAA/EIAQOZFAADSQwAAgD8AAMBAzSwVRAAAQEAAgLJFAACFQgapt7xglcM9YgPuvQAAyUTf4Kw9qCnKPgAAmUKgpcc9AADbRACAnUMLE7y9AACAPwAAGUMAAERDlCWRvQAAgD/a99g9PatyPACAAkYAAPZFAMDqRQAAC0MAAIA/N8vSPgAAoEAAAEBA36ulvQBgrkNoE9A+AACAPwAAQEDN7CNEAICHRM3sI0QAAI1FAAACQwAAQEAAAKBCx5pnPTfL0j6Asam91MO7vLvVrj2OXIe9ov3Bvc3MYkMAAEBCAACQQgAAAEAJNIG9AAAAQI5xk71KY+Q9FaeWvQs1OzwAgBRGAIDxRTMze0IAgPFFAACgQAd1nzybxME9AIC9QwAAJUMGYyu9AABAQAAAAEBhJ0S7N8vSPgAAuEMAAKBAAACAQGbmpEOoKco+GI6uPuBi5L2sUUI7R6H8PACAAkYAAIA/GI6uPgAAcERmZjBE/H8rPepnXD3hyBu7AICFRQAAAEAAAOFCMzOOQwAAgD8AAIA/qCnKPgAArkIzMwVD79//PAAAJUUAAF5FLzmOvIcyA74YHfU8ktm6vQCAskUAADBD1cTYPJ9pbb3noZI7L2aXvVyPp0IAAJRCmjLSPQAAoEAAAIA/vf6KPfv6P74AAIA/MzMFQ6+pWz0AAKBAzUwxQwAAgD+YX1Q8869YPADA6kWHJgE+W5AIvA54g73P99U8AEDmRQAAwEAAAEBAAIA2RABA+0UAQC1GAADGQwCA8UUAwP9FmpnZQ2am+0MAgAZEJFmnvRwMhD1VVN28vfLOvQAAgD8AAIA/R4q3veanDL0AAIxDAACAPwAAgD8AAOpCAADPQvM6570AAEBAM7O/Q1tdFTzItcC9AIDBRQCA0EXhQwa9B+vzvRr9/T0AAHNDdzafvBfjBL4AAIxCAAAAQBNHCz2LRM89AICjRUI7Tz0AwNhFAADIQwAAgD9NBO89MsYLvIVe873F7Zi8RxKOPWgdGT3cb7G9X5eEO7KvO70AYBBGAAAHQzOzGkMzsxpDAAAoQwAAgD8AAEhDN8vSPgAAQEAAAKBAL/T9vQAAAEAAIN9D1bXcPYPu2T2yjww9cBEYvQAAgEAAAKBAAAB8QwAAqkO2ijA9AACAP+BWuz0ga5A8AACAQCL+0L1vn/S8AADPQwAAQEA7QjA+AABAQGhaSr2G1co8AABDRAAAW0QAAPZFAECSRAPnkbr1ciI70AAlvTUSuTz371i9Qx8ju+LcujyE1qi75TpBvTejtz0G/589FNoFvatZCb2amu08hr1BvFe3rz07Mj49oxO5vRuur7yCp2c6IjPYPfqpi71ALrW9jysXvF9febzGNIq9UqjFPQy/iDxc9Z29jum3PbEgKLzrov88z8q+vTAWkbxLg+W7jr01vROOIzxzT6U9n/zVPf+tTjswAOW9iNLqvNP6nT1bmJs8o5rSunJD0D0aB9+8ECqLPYgjT73uPA2+g6bSvTaqET3/SaK9nlQIPMUOoz1GPiK80cynvPHhLT33zO085HiFvVDRQb1aFE480pLJvXcBRbyVm6m9m9efPKykBT0V8AE+VRuYvPps6L2HDDI978JTvZcDID3aQNA9xVhjvXr7AD0Qdmg9WrPtPUpR1rv3jL09ipSSvPbgxb0AAIA+AACAPwAAYEEAADBDAAAYQgAAAEBmZsJDAACAPwAAyEMAAKBA0Qu9PQAAAEEAAEBAAABAQAAAokI3y9I+ZuaHQ5oZj0PSLBY9AAAwQfHwcD0AAOBBAAC4QgAAAEAAAABBAAAAQUv8WLxkdsI994QZPK7Akb1qHJY9AEArRAAAakMAAFhDMzOOQzOzdUNdTM+9N8vSPgAAQEAaz6q9AADIQQAAyEHDMbS9AABAQQAAPkMAAIVCGI6uPuOvezyamcBCBYxPvEcorz0AAChEAACgQAAAQ0MAAKBAAAAAQAAAIEGoKco+AADCQgAAgD/VIJs9AAAAQE7+BL0KzA+7/3pkvVbltLw4DT49AAAAQJgJ2z2CcXi9JGw+uwAA4EAAgIJDBzqXPQAAAEHCJiQ8pSTTvEtccr1gcJq8AABAQAAAwEAAAIA/AAAAQAAAk0MAAEBAAAAgRAAAAEEAANhCAACMQgAAgD8AABRDQL/tva1X5bsAAHhCmpnZQwAAS0MAAJZDOFcNvQAAgD8AAMBAAAAAQVJUoDwl/Lg+72ojvZ/uOjzlMuy7EkUNPQAAXEMAAIBAAABIQgAAAEEAwGREAACYQQCANkQAAEBBAAA+QwAA/EIAAABAZmZgQwAAWEIAAFtEMzMcRBSubkMAAJRCAADCQjMze0IAAMBAzkjHPQAASEIAADBBAxWoPQAAoEAAAJpCAAAgQ6Ap3r0AAD1DIJBNvQAAoEAzMwVDJfy4PhiOrj4AACBDAAAAQQAAQEAYjq4+2xGFPDxayj0AAAdDAAD0QgAAOkMAAD1DAABAQAAAtkIYjq4+AAAAQAAAQ0QYjq4+AACAQJc9qD4AAIA/AAAwQQAAMEEAAI5CAAANQwAA4EAAAPhCAAALQ5qZUkPq2iQ+AAAtQwAAYUMAAARCAAD+QgAADEIAAIJCAADAQAAAPkMAAGxDAAAwQQAAIEEAALRCAAAgQgAAwEBDXRo+AAAkQgAA3kIAAJBCQ+C+vcvjiT1gdKu9AABzQz2n1z0AAF9DAACgQAAAR0MAANJCdiSiPQAAwEAovJU9N1z1vAcg072S5eW8FwUBPAAAwEDQan+92JEAvQAAgEAAAGxCAADAQMMAtj2qF8C8103avDfL0j5j5kY9qCnKPhMjI7q7Bcs86xZlvBnhJT0j6Ru8K+PWPK1MBLv/6AA7Z7iTvah7+Tsy1/09IPmCPAOmRb0rft294zuoPQdOLL0jNYO8mHKJPaQymr1nB2A8YtjgPGsoGb3DKco98O9YPZfmAj4cqZW8iOfoO5+7pD3j1BI7C1uUPc/T1Tq9o829avHUOcuj2Lzni9M9FFcGvdHQDz0Nj8c9sIFpvSTBzDx3uy69nybOPN+4ib1pyAy8js2uPdCIAL3jAQA92igcvQc9JT3IIn07h2SyvG3N2b3A0309zTzPvCPr2bwyZm27tn+HvZBUXDzzM4w68gIWPjciQjyCUta82oFLPf1Rqb3Wp5U8A/24PQdpKbx7NrW9T9KwPT81q7yjWum953MqvZzjwjtSM649zd24PXZlhDx2gjm9SPKMPLcaub2zPNs89Q/jO3Jw2j1LR7O9bVSQPUyKS7xUc5a9f1UrvSs46jzgZCc8lfqMPYHzHD4o/GA8n8Hru8wWib24sDI9QwvFu0Q7tr23kwe9O2GSvRfTxjoAAAA/AICHRAAAkEMAQONFAACAQAAAQEFmZsJDAIDWRQAAMEFoE9A+AAAAQQAAIkMiLYA9AADYQwAAgD8AgNBFAADAQAAAEEEAAIA/AAAoQ7+QwD0AAMxEAACAPwAAIEFQ7zE9p1HHPOx5wj1IBIg9SFgpvTMDfkQAANJDqCnKPgAAgkIAAJZDAADwQ+Supz1oE9A+SCwUvQAAKEQAAKBEAACAPwAAgD8AAMBDYFwquwz6ir0AgKxDAACAPwAAhkOXPag+AABzQzMz+0IAAIA/zcz0QgAAAEAAYK5DZuYTQwCAAkYAAPZFAACAP7Rktz0AgGhFAABAQwAA4EAYjq4+AIAIRQCAskUAAKBEyD7XvQCAu0QAAJxDAAAAQAAAQEAAAPNEAADAQCX8uD4jfr49AAAMRAAAGUMAgNxFAACAP2bmpEPdBpU9KBCIvQAA4UIzMwVDAAAlQwAgikMAAABBAADKQwAAAEAAgPFFAADzQwDgBUbysJq92KEUPQAAgD+3j849AACgRAAAgD9LKSq9AABqROtonj0AAIBAAIAaRQAA4EAl/Lg+N8vSPgCAu0QAgLtEAACAQAAAHEQAADREAACAQGZmlUMAgJ1DAAC4QwAAAEFoE9A+GI6uPgAAn0QAAKVFAABSQwDA0kVIoaJDAACAPwDA0kUAAIA/uqqcPRsoz70l/Lg+OyThPdpisD1nb7G9AACAPx2vXT3NzMdCZOcCvmLz3j0AACBBg1bEPDgZ2b0AgIVDN8vSPmbmpEMAgPFFJfy4PgAAW0QAAABBAADwQgAAT0MAYBBGxRUXPmamDkT+scS9zcwRRKW4MT0beAG9GI6uPmcRKz1dF648O6urPQAAHEQAAIBAJfy4PoOALTybdIS8AACAQAAAgD8AgLtEDsupvAAA4UQAgHRFAICORQAAKEQAAEBAaZ+avZ2dNj0AAIA/AADDRLv2gT0AALpEAABAQAAANEUAAO1EAACAPwAAkkMAAMBAAAC3RAAABEUAALRDAADGQwCAfUUAABBBAACKRAAAgD8AAIA/AACAPwAAKEQAALREAACAPySfuzwAALhCVrUevQAAEEGXPag+U/aDPTMzskMAoKdDPjqhuo8LAb4Yjq4+qCnKPgDA0kVoilS9AACAPwAAREMAAIA/evPJvQAAEEEAALhDAAAwQQBgEEYA4AVGAACAPyMV67wAAIA/AACAP0DC4T0AAIA/GI6uPgCA8UVoE9A+GI6uPmCxf7072Yu8AIACRgAAIEGX8ii+AIChQwDAw0MAACBBck4yvc3sI0RVXpe9uJK5PaizzbzvJMe9uKj+PQAAgD/dKik+ZDKRO5sdaLxob8296AzcvZ2hKbwAAJxF2ge/vQAAakUl/Lg+ehr8vP3jAr5oE9A+AECARVVl7L0AAKBEGI6uPgAAQEAAgD5FAADSRAAAT0UAAEBAArm9vNu2DT13Lgq9aBPQPgAA8EPCVFW7N8vSPmgT0D4AAJlEAAAiRYdU+Dwl3qq9d1C/ucbLo7w43xQ9Ug/5uf/pBz36Mt299ZaWvBuwBzuWN8K6WZPGPe8mUb2rZK48khfwu39oRTzXSGE841dnuqCXYTsthtw915IDPTPYyr08EjQ8dzPfvdsjbj2ziRq9IJqCPLZqgb1DucE9ez8fPEO63r1+5Uu9sG/gPANf4T1cyCG92hmePWcqVD0mCEK9Y/E0vccvsDwZdwo+szl0PbobXj2sXiW9/psuPJZ+uD1VqdQ815etvVJg0z0nBQy9q0uMvKvHuL3SGNG8anjoOldieD2TpK87xZCTPMOcXb1nG+y9992bOmPzNT2flEY7//SMvU2LoD0QcMc9s7XDPFOaBj1TCui9UgPnvfbRIrxCl+i8IvhZPIEssj1rsoi9fF9KPQ6AxT0Ne3c7Y60tvSCH6juMmrE91uQBPbvJQL0UsIy7nlouPRB82D1Zrya9r0S5vXNYPDpdvO08LUGWvQef2T0Zi8M7X06KPTfLrL3K+k29WM1vPI+Y+rxloYs8q0UdvCjYgz09FeI90v5oPOqK1b1qOpE9aCJpPGh8rrypo5w9iuJ7vbNTrz3lUtU8DdatuldJ172h0b+8wl2RPTAq/b1lNAa9j0qJvS81zzwS47m74XCWPcvrpbpmKMU9dOmNvUUA6rrfkWS85W9VPX3saz2Hyu28YZsDPhukTz0AAAA/AAAwQwAAokIAAEBAAACAPwAAOEKQJcA9N8vSPgAAKEIAAItDAAAyQwAAgD93jxO9AADAQAAAGEIAABxCAAANQwAAMkMAgIFDiZkhPAAAlkMAAABAAADAQAAAAEAAAABAAADQQQAADkMAAI9DF1G/PQAAkkIAAABAK4eJvQAAQEAAAIBAWF68vACAiEMAAGBDepvjPF8EoD0AAEBAAAAAQQAANEMAADFDAAAoQwAAQEAAAEBAAAAUQgAACEMAABxDAABuQwAAFEIAAEBCAACgQgAAmEIAAJ5DiB6RvC15+LoAAEBA81brvAAAQEDZmJa9EorpufJsXrzH2yy8duchPYp1WL0wc2U8AAAmQwAAQ0MAAClDaBPQPgAAIUMAAEtDAABAQAAAgUMAACBBAACoQQAA+EEAAEBAAABAQAAACkMAAIBAAAAfQwAAR0PpYLQ9iXXIvRswk7yC1dm8DxC9vULRpz0AAHRCAAAYQwAAZkMAAMJCaBPQPqW3nzwFEJg9y2mTPO7NRb0AAOZCAACAPwAAgD8AAIA/AAAbQwAAoEAAAFxDAAA0QwAADUP9rQo+AABAQwAAj0MAAIA/AACAQAAAQEIAgJBDAADgQAAAMEEAAIBAAADIQQAAgD8AAABANXGTPQAAgD8AAHhCAAAFQ/H8nr0AAAtDAAAbQwAAFEMbFGK9AACAQAAABEMoEfe9AABkQgAAgEAAAIA/1m61vQAAgD8AAH5DAABIQgAAyEIAAMZCAICqQwAA4kIAAP5CZG6RvQAAoEAAAKBAexHJvQAAWkMAAEBAAAAYQwAAHkMAAEBAAAAvQwAANkMAgIRDAACAQAAARUMAAP5CAAAeQwAAgD9+1wi9AABmQwCAp0MAAABAAACAPwAAgD9AV3S9AAA4QgAAREIAgIxDAACAPwAAAEAAABBBAAAAQAAAgD8AAIA/AACIQQAAwEFAHn69AADoQQAA8EEAAABCAACAP+DXfL37Caw8AAAAQAAAgkIAAPhCuhDaPRv/aLsAAEBAAAAYQxNkgj0AABJDANfePAAAOkMAAEtDAADIQdJBvj2vsWO9AAC8QgAAAEACMz89L3i8ux9oR70AANJCuwGbPJEhgj3/XEE8AAArQwAAUEIAABZDAABAQEBd1L0AAIA/qXCaPVNoVLxadJO6p+cAPptVtb15lQI8C2vFPbp+nzxUtJO94n4MPXa9nb3gXce8G0i4PNuwv7zzItE6xTF2vYgGLj2cmqi6yGA0vXWImrvEWTk8UMJhvUg3ObyQD2Y8r0abvGWCEjzrDrE979/OvW2EoLxJOZY85rURPFM6kD2tXCm9ZQ7gvRhW5L3SdU29+w5DuwDrdD0dmDy8x6t6vamokb1Tl5q8zT71vDEPgbx9vp49P3SEvBOQNbqxCQU9fy6TvSX62LvfMt48bcnEPY9pRL1yn5E8W5+KvPP+zTsHjfO8qIRlvJfNsz1lySs972E8PC+ycLyDJQM99/8IvX9iIL0IzuK9h5euPBKF1D2TqTk9n0Sau0ZSJz1esao9eNqbPcCZODzNWUG7qDkWveflAjynAfC8SOFxPYXtObydoiY8LaA9vetnQL2f4IS8C+YKPe0bMrwYK2e7qjavvdxXwzv9Uwa8WqKiParqKDs/Yxg9iVGNvS8u8Dw1w7U9t4PJvfuoXr13NTS8ukOCvTjkEj3y9K29ULL1PG1Huj1H7oQ8Wz+NvUNEQT14hpe9dC65O451DL0AAAA/AICHRAAAgD8AAMBAAACAQGZmwkMAAKBAAACMQgAAeEIAAEBDAAAwQbTlvT0AAC5FgpVNvVyPp0IAAOdEAACAPwAADEIAALRCnfbfvAAAQEAAAKJEAAAAQKN8R72b93M9AABAQCoNmD0zM3tCAABbRQAAkEIzA35EAACgQAAAAEAAAABAAAC4QgAAAEAAAIA/AAAAQQAAqESYv8u8qCnKPh4FkL2SKI48AADDRAAAgD8AAIA/AABkRQAAHEQAAOdEAMBkRADAxkUAAIpEAAAgQWdXy70AAEBAAAA6RQCAEUUAABBBAADeRMOBsD0AAKBEF+vTPWMlCD0AAJBEAAAQQQAAoEQAgLtErZgLPr1A/DwAAIA/AAB4QgAAQEAAAIVCAACAPwAAQEEzM3tCAAAwQQAAAEAAAKtEAADJRAAA7UQAAABAAABSRAAAgD8cRpk9AAAAQAAAgD8AAF5EAADeRAAAMEIAAOdEAIAURQAAAEAAAHZEAAAiRQAAukQAAIA/AABGRAAAbUUAAIA/AAAAQAAAakRAzYC9AACAQCX8uD4bzAA+tQ7BOACAQUUAALdEAACAPwAA8EIAAFhCo+odPgAAwEMAAIA/AABwQ0kOurwAAChFAABAQACAPkUAgEFFAACgQGK5Ej4AgLVFAICpRQAAqEMAAJBCAAAAQACAcUUAAJZEAIAGRAAAAkMAgCxFAADgQClXp70AAChDAAB2RAAAgD8AAO1EAACAPwAAgD8AAIBARcwmvQAAWEQAAGREAACfRAAAIkUb7HY8uwLoPQAAHEQAAKBAAACQQvuu5r1ozb09pznHPAAAMEEAAKBCAACAPwAAAEAgtyy9f8YEPjc0oL2LX+a7AAA6RAAAwEAAAEhDAADEQjY6or1llJm7Xz16PUdDlDwYjq4+tQjiPQAAQEAAAGRESDjvPa/HcL0AAIBAAICsRUep4z0AQKdFAABAQIPa7j0AAMBCAAAAQAAAgD8AAABBAACQQwAAwEQAAJNEAACAPwAAAEAHgiC8AAAHRQAA4EAM9hG+AAAiRQCAMkUAAIA/AAD8ROqTbz0AAOBAZBLHPQAAgD8AACBBAMCTRQAAbEKtzbc9E4m0vGgT0D6vnsm9d1OnvCccBj4AAIBAAICIRQAAS0MAAEBAAADwQwAAgEA/jAY+AACgQAAAmUKamZxCmplSQwAAQECLKOg8AACgQAAAAEEAABBBAABeRQAAxkQAAJxDAACAQOV44b0AACJEAAAKRAAA2EMAAN5Ed30BvQAAQEALZ7g9qo3uvQAAakQAAIdEQLCuvQAAQEEAADBBAACAQAScv70AgBpFAABgQgAAnEQAAIA/AABkRAAAHEQAAJlCAACAPwAAgD9mJkE+sPqOPQAA4EAAABxEAMDDQwAAjUQAAABBAAAiQwAAyEMAAIA/AADhQgAAoEQAAKBEAADwQwAAzEMAAEBAAADAQAAA+UQAAABBAACAQADA2EUAwJ9FAABAQGxiSDxHJhi9xU0guqokqD3DF4K9jfxlvMH+KruYQ2U90qK8vT/lIDw5u4+99/J8PRtAxr2gY5G65Yf5PO1i9rzfgom9gE9gOphgsDuy5O0931TcvY3DpT0VvBa+gBInPYCYP71mecS9s/Cfu9tGKT6sFK+9H/upvB1Q7by6GfK9N/CWPCnquL3gz6S9furAvPP6wzydZJa9z9YxPLIqAT5tV888RZ1PvSwfPb2eQ6Y936bFuuZjCr5QDt49r8qft1dojbvf6UQ7vFdJPe+XCTvVaXy801XuvbOCILwIbtM9ACWnvOVzkT3lVfA9OovYO8X4W71lyts6UpZJvJlxjTl/cYk7HcFKvK0Idb382zk8L5lwO7hUTT4ekRs9iHxHvXcD17yyf6G96msYvepq/z2H1Ym9D8QuPN/K2r1owP+8WX0FPaeckb3v+NW8o4rkPEoZsDydQ5Q9GwuUPfm4Cz1QKUw8pdhJvXQlnD2X/868HR1EPKA20T3nrQE+OxKjPMpWgjyzivi9uAvpvNaVjj3IYI09eBHgvYMW9D3o6PU7VwLKvfDNS7zPL6s901gIuwj7ZL0yerQ8//6JvDPR6D2Zccm9gt9UO6/pC753vFu9+19fuvynB70zjry9o/3FO6gzjrzSQQ49jmTDva4DADxVFvM8Q9XTvPIBej0Sic47owmhvH6fJT0Ybn+9z5itvIhP8r0aC/C8ON+xPYgblbosbJ+9jFpDPb+shz1jJNy7eJTOvbvEdrq40Y68G6b2vfpgwb0x4qo8RpumPW+mNb16k4O7x+AuvTn2Ej1jLJS8G9EzPcIAIDvlfXq9ziPBPACeczy+N6u9G5a0PYZnSTwAAAA/AACAQAAA80QAAIA/AIDcRTOzv0Oler09AAAQQdELvT0AwNJFAAAAQQAAkEP4wYG9AACAPwAAbEIAAABAAACcQwAAkEMAAEBAAADAQAAAgD8AAHBDgeWhPQAAgD8AAEBAAICyRQAAwEAAAMBCAABAQI/C9T0zMwVDAAAwQQAAoEAl0Wu88mDjvQDA6kX/96e7FMaOPQAAcEQAAEBCxZuXvQAAgEAAAKBAAACAP/9vQ7wAAIpFAADAQAAAgD8AAIA/AACgQjfL0j4AAEBAAACgQEjMYT0AAABAAAAiRAAAAEEAAIBAAAC0QwAA4EAAIN9DaiLVPc3sI0TbGqm9BU9sPfIM+bwAAEBAAADzRDMzHEQAgBpFAAC0Qj+ws7x36cS9AAAMQgAAAEEAwNhFAACAPwAANEQAAMBBAIDBRQAAIkMAAIVCAACQQlwPCUPAaww9GW2Hu5OOvLxFvL69FcHOu94WszwAAHBDAACAPwAAoEDdr649W5S+uwAAQEAAAKBAqCnKPt/Y5T1mZjBEAAAQQQAAXkQAAIA/NcaWPQAAQEDC3+y7kphOPQAA7UQAAABAMzOyQwAAoEAAAPBBAAAfRQAAwEEAAFhDqCnKPgAAMEEAgKNFx+cKPgAAAEAAAPBBAIDQRbWRZ70AAFtEAAAgQQAAqkJa7oy9AECDRTNzkEMAAEBBAAAqQwAAYEIUCp69tJegPQAACkQAAAJDL96rvQAAEEMPz5+9EVYHvbW0ND6+ZYi7k7JrvQAAAEAAAPNDAACAP6cqxj1TdmQ9AACAPwCAgkMAAIA/AACTRACAeEMqH5K9aBPQPs0sFUQ3LPK9B/IiPY0Z7LyamcBCAAAAQAAAuEIAwIRFAACcQwAAwEAAAABAAADgQAAAAEAAAA1FM3OQQwAAAEAAAMBAAACAPwAASEMAAGhDAADhRAAA20QAAPBCAAA0RFtzXz1zLdq880G+vGJm971pDwW9SBc2PQAAgD9iNXY9AAAuRAAAqEMAAIJCMzN7QsUo0DyYziU+AAB8RQCA00NDpZK9AMDqRVwPCUNcj6dCAACAPwCACEUAABhCAABAQxsZb71d6W89uL+IvQAAgEAAAKBAVVVVPvwbxT2did48VA0DvQAA7UMAgGVDsw/NvQAAOkMAAPBCfeZVvbPr4jwAACpDAACgQAAA50QAAPxDZmaVQwAAQ0UAANhDAIChQ4+nDDugUwI+akxOvVrsXD1vh/k7K+3gu8QSj72HVdQ9m86jPXmdDTzzH/K8LWI1O+fTrDsX1Fy8mAmgupnpiTxXLRm9RTVdPdSeA73njXE6buiDvIZaGz2Y/SW7OCQEvfci2j24XhS9+lK2vOBsWTzDRzE9ey/XvKu3Br0IFD68ozROOx51JD1bHQm99pKtuz7Vnbu+byg9C9lmvA3iw71QRcQ99QfKPMnAybxS7jY9H98zPToN2bzdJzO8txaSvUuyOjz1kAg+57vfPXspJ7z0j5O9O9ODO7IYJb1Y/549gAu7vUTEFrw77+Q9jTa/vDD517urxoK9bBOjvLm1ur3XTxQ+zUGpPKL6wjxiA8y8f+wdvIX0Ur32wJg9P64BvSMNEbz7TRg9rfBcvd3wWzyg3aa8izRVPYuwoT1pIw+8E8O0vc2Sh7zrF9M7H0GFvepv6bxTQRc9SWC0u0Wejz0fl3u8C73HPE9NlD3r7J+87XaqPJVyrD1POxq9mqIiPRXJ5LzQc/45uL8hvW48nT2711q9+J63PAAAgD4AAIA/AAAKRQAAcEQAAMBAM7O/QzTvwz0AAIBAAACAQAAAQEAgQKy9AABAQbxyO70AAJxFZuboQwAAKEMAgIdEAABzQwAAKEMAAHxDfzKdPQAAW0UYjq4+AADcQwAAgD+GI8a8AABqRWgT0D4AAMZEAABsQwAAoEAzM45DAADWQgAAgD+vFWM9AAAMRAAAgEAAwLpFAACAQACA00MAAEBAAAAERQAAEEQAAHBEikHWPQAAgD8AAIBAAAAgQQAA9kUAAMBBN8vSPs2s4UMAAMBAAADAQACA00MAAL5CAABAQwAAAEEAAIA/AACWQwAAgD8AAEBAAIBxRQAAc0MAwNJFAACHQwCAoUMAANJDAIC+RQAg30MAALREAADARAAAoEAAAOBAAABeRGgT0D4AAKBEAADAQAAA4EAAAIA/AACAPwAA4EDxyMs9AIDQRQlyqj0AAIA/AACWRBSubkMAAEBEAMDDRWam+0MAAIA/AAAKRAAADUMAADBBAADAQM2s4UMAAJZEAECSRQAAgD/NzPRCkvayPJsBvr0lUVw9AAAQQQAAcEIAAMxEAACAPzfL0j4AABBDAAAiQwAAAEMAAMBANc/svfIvyDzez7U9AAAZQ81hzT0AAJxDAACcQx383z0AAMxDAECDRQAAgD9oE9A+AMC6RQAAYUUAAJBDAIBKRQBAK0QAANJEzcwRRAAA7UMAAENEAAAAQQAARkQAAJ9E/iiuPSRntjwAAEBARUVRPcumr70AABBBAAA3RQCAbkUAgCxFAAAAQQAAwEQEdwK+AABAQwAAoEQAAABB2hewvQAAWELfl629AACQRAAA4UQAAABAAACAP4p4vbyXHPe9AADcQxQ6gL0AAIA/AACEQwAA2EMAAPBDAACAPwAAgD8AAJBCZuYTQwAAbEMAAGxDAADAQEVPKz0AAIBAZmYwRAAAoEIAgKFCAABAQWgT0D4AAOBAAAAAQQDA2EVcDwlDAAAAQAAAKEMAAFhCAIChQjNzlkMAgJ1DAABGRF4/BbwAAFtEAACAPzjUv70AAD5DAADPQgAAAEAAAKBCWwsMvkgBqUMAAGxDuIZpPd+wK72H/429RzeRPQAAeEK4VJ29ZmbCQwAAQEAAAKtENLqnvQAA/EQAAMxDAAAAQOxijL0AADdFyekmvQAA9kQAAOBAAABAQwAAAEEAAABBAMDqRQAAEEFoE9A+AADPRAAA9kQAAPhDAIBTRWgT0D5mpg5EN8vSPgAAcEM4D/u9zSwVRAAgBER4Quk9AADgQAAAAEGNxg690uoCPQCAL0XfnDW8GxunPcmGKTwAAJBEAICIRRjOGzyUuMe9tZf+Oouuqz1abIA631qQvc0GbDzLtpk9AACoRAAAoEAAAMBAAIBBRQAADEIf2pO9AACERAAAvUIAAABAAIChQnVE77tf82E9U5vAvdPuybwzc5BDdVn9PXVstr0AADREWMACPgAAdkR+pr+8AAAlRSsIor1mpvtDrIUsPrHPNL0AAMZDAABVRQAAAEH3Y7C9Z+E3PgAAgD8AADpDAACMQwAA8EIAAIA/SAGpQwAAgD8AAABA/kexvAAA4EAAAABBAAB4QgAAwEAAAIdFAACKRQAAIEEAAL1EmpnAQmDIKj4AACJDAAAdQ2vup70zdf88AADARAAA9kUAAIA/M7MaQwAAoEAAAKBAhQodO4pyjr3Qaxq8ZE+rvcRumDz+Rii6zx3TvbFsALugXwm+01wAvd0/y70DEnC8ACzoPRo5Vzw/rKW99k6JPW86rT0pgL28+EjivaN66z2M9py8laoWvt8CZr29Y4w95TXJPa890Tq4bg89+9e9veZZLL2X6Ek9B2wdO2DC4zxXJZ29ow6Nu8dAaLx7rq494LpCvSQnGjtOHUW7WMqqvR4GvzzwK/89B2QbPeeUAj63l5A8bwrFPXnzFr6NBQc855qZvRVQBrwXqr09w32GPNcFvr1/46M8y6DpPAWh7722rY48ZTYivb1F9LwvTr+9iPSKPCX5/T0tS628aiRRPZMdGT3Kyyy+gCa5vBtq7T24J9K9/IMvunt8H7sf/cO8FeBcPVhR1rup3Dg8D6VXvaBylr3npU89hwP8vLvxgD3H5hA9EjCCvZsAITxxgio91ebqPfKnij3Tryw9n7x+vS0Gtz3wxHk7Ubw+PecdRL2ytWi9XlOfPBedLLxjlae9Vx+nvFLz/DxbCpW8BEiwPUD4crkyrz49Qm7OPLDmvr1YHzA8LMuePcdTDr2CZfI7oFuMPbYUujw9FnC9AdOYPDh+Lr2r40M9U43jva9ft7yH4O07nS3ePX6Fprwvi5g9NJ+zvWLv4Dzt9r48F0FEvYulhb2DC6A8ME2gO0dTTD1RPYe9zTw4PVart7w6Lqu92Fnzu4Pl2T1IRGi9nO6QPBh2rb0W/iC8J3FtvIWADz5DJvu74+qgveSFir0y9R09m/UdvINegL1ndhM9n9eSvSRoqzwnPW+8y+TYvPiJHD34xzK9r7FXuwdBEb2VXO+9g9a/vbEHJzxX7we8GzzxPe5TiD1XW028wz7FuAkYGz07tsW9d7X8vIKU2LwiTCc9JxRPPE14vLo6qKw82gyNPX1QXr245bQ8AACNRQAA4kIAQJJFAICFRZC/zr0AACBBAAAwQQAAjEMAAIA/AADwQgAAPUMAAKBAAAClRUiBgEOaGY9DAIA2RAAAzEMAAK5CAABEQwAAkEXNzGJDAACgQABA40UAAKBAMzN7QgAAfEMAAMBEAAAwQQAAAEAAAK5CAABAQAAAgkMAAABBAABsQgAAoEAAAIA/AABPQ7teDb4AAAdDmplAQwAAkEUAAIA/AACcRQAAwEAAAMBAAKCnQwDAn0UAAGxCAACHQ5qZQEMAAIREAAAwQQAAxkQAAKBAAACAPwCAEUUAAEBAClerQpqZ5EJDzgU+AMBkRAAAIEMzM45DAADAQACAi0UAAKBA9y2vvQAAvUJdiQc+AABAQDOzGkP99tw9zUyfQwgHMjzbZWi9AACAP2jkKD5fZqK9AAAwQQAAgD8AAKhCAAAQQQAAqEEAwJNFMzP7QgAAvUIAAOBAAAAWQwAg30MAAEBB9qgqQwAAgD8auP69AAAAQAAAgEAAAD5DzcxiQwAAFkQAAENFAACgQAAAcEQn4g++AECDRQAAKEQAAJlEr8zQvQAAfEQAAMZDAIB9RQCA00MAAIA/AAAQQTu3Ez7XOwC+AABDQ7+jVj3z4429AAB4QgAAIkMAAIRDAACwQwAAgD8AgDZEAABAQAAAEEE/8ds9X86gvJsPfj13omS9AG/6PRfkZjwAAMBAAABAQAAAgD8AALhDnRAevWAxUj0p+Ce9sHbpPQAAnEUAgNZFow8rvgAAykK4/rVDAAAqQxSubkMAAJZCMzMFQwCAoUIAAKBCAABYQwBALUYAQPtFAAAlQwAAcEQAAIBAAACAQHHVsT0koBK9AECYRRWd9j0AAJlCvcNXPcQZoj2Rb4y9AABVQwCA3EUAAABAAICdQwAAQEEAAPlEAACoRBSubkMAAH9DAACAPwAAoEAAAKBAAABAQAAAIEEAAPBDAACuRAAAgkMAgIJDAAAKRAAARkRmZoxDAAA3RX9Vn70AAEBAM7O/QwAAAEEAAIA/AADAQAAAZEUAAIA/AECDRQAAIEEAAGBCwa3DPZu9rD0AgIhFAACKRQAAgEAr60m+AACAQGP7Dj4AAIdFAAAAQACAi0UAAIA/AAAAQACABkQAgIhFAIBKRAAAgEAzA35EK0QHvQAAgD/rdbi9Uwj2vYLL2LsAAKBAAICORQBgrkMAAFJEAABAQAAAgEAAAABAAAAAQEICjD0AAHxDAAAAQAAAAEAAAOpCAMCZRc3MYkOaGY9Dmpk3QwAAc0M/Gf09AADzQwAAAEGamUBDAIC+RQAAIEFmZh5DAACcRQAAEEFboKw7uP61QwAAoEAAAAtDAADSQwAAyEMAgPFFAwOmvfdtnT0AAIA/8nj0vbug1rwzrq499cIsuweVrr0AWdA9CCEPPQDAyUUAAEBAAIC1RQAAgD9YCwk9QO/8PQDAhEUAAGBBAADYQwAAZEUAAJ9EAECARQAA1UQAAEBBAAAAQAAAzEMAAEZEAADAQAAAlkQAALdEzcx9QwCAYkUAAABAAMCBQwAAhEQAAABAAACHQwAAgD8AAEBBAICFQwAAQEAAgIJD1Shbvl+xpbwAAPBDAAAAQGrA/j0AAF5Ex9E+PgAAQETb+wG+2glwPVim7D0AANtEAADAQAAAgD8AAMxDAAAwQc1Mn0MAAFhFihmtu+4bB74AANJDAIBuRQAAQEEAAEBCAMCBRQAAgEAAAOBAAACAQFzMxb0bSda8AADgQAAAfEMAAFhCuH04PQAA4EAAAMBAAAAQQQAAAEHAgAE+ACCKQ9hupj0zc5BDAABAQFqRW70AAOBArT7XvQCANkQAAKBAHtGnPWhex73tSc09yI6WPAAAh0ViJOU9AACAPzMDfkRZ3Cc+lgESPcCxVj1aLo67AACgQAAAoEApQoQ9bQBJPAAAQEAAAIA/AACAPwAAAEEAAEBAmxtOPQAAAEAAAIBAAACAPwAAQEAAAABAeiPPvQAAgD8AAIA/AADgQADAmUUAAOBAAABwRKhoxT3KJy2+AECVRQAAz0MAAOBAAIDBRQAApUVmprtDAACAQAAAwEAAAABAAADIQ/dYJr1wPXg9AACUQgAAgkJm5hNDAMC3RQCAqUUAAIA/AACAPwCArEUAAAJDAMDJRWamDkQAAGxD3b/bPVJQ/TwAAMhCZmbCQ0iBgEMAAAtDAACAP4eDpz0AQPtFAACAPwAAAEEAgAJGizeLO8Trob3fANe9AABLQwAAKkMAAEBBiYtJugCAAkb9D669AACAPwAAgD8AgOVDjQPROoBqjL17aWW8kg2hPbpJdz3a4QS9+lTvPQ/NiTuCdcS7wbmJPW3A6by3dGo9/HIdPKmqKj0CIAu8GYGXvRoOM73sOLM9JCC4vb3fBD1feCG9DmwuPYMm1702KLq8fpFFvQEXxT3aAc09chD0O8IYFb7HsaO8kCFPvda6qj2zq/C8StvQvf3jqr0HZGA7g4XyPCAD/rxQwLu9N/01vEfJvzuap/Y9D7i0PEOhn71fTqA9OCEqPvdgnTxLvqO8x3v5veX4U72Ydoo9v4AGvSVDfLxnU6w9WaIePV9YBL6qU4K9V7szPaPVib1ZI4M9gHImvXerHT2gZSm9ttscPFhk3r0LxBO9jTDuPXpx9zzpiDG9/foHPfsVJbzfiI49s38TPAdNr72rZgW797orPQ35jz1tIpg7fxkovJ1yrb27D6K9v2jBOgX/YjxxrLm9TxDxPW8unLv7F707uslZvMRnLz3wjge9ZxMevZ3v1r1Alsu9hEw7vA7zxLzol9699cvovd0gQz26e7c9mSobvbWesT07jJa9BwGTvWUk0jwqwIy9zRZePeWMPz3qZmS9cRUOPS/Uzz0Hxyc9O7WzvRROtT0CoQm9oyQGPfZORr0PK5K9n7nCPKrmC76ut5K8+KTCPUeeIrwtP9A8iqW9vZ0V4b2ejKK8KwiCvSe1KD0bHhY+qZPHPEnwPLyfxKq9Q6NuPZfGg73aklE8AOfBvXu4FL3n4ow9x8H1Pd+asDy6Jcu9On+AOsqfAb26Tjg9tSZGPYUB3bwYK4Y9YcMFvY4Dx71SVg298dyoPZsE47ztIIS9P2JvPPvtTT0heq28pzntPLXL7T3XjAA+zwa1vNAsSD4zYhQ89EuCPH+Jubz7/+O9V9kAvXQrjD21hIs8SNTYvAedEDtLHt08L9vCvBIblrvMzbU9ADSivWhRKj3x0q+98Xm9uxu0Cr1D//c9493KvKow8L2Hiby8rc08PbW43LwXHYy9SoRnvLEOA74Tz6U9YlzRvHey7z2AErc8d6dGPX9Szb0dGvu9FQ1xPfABrL2X2ws80imtvSqWtTwNJLk9qPZWOwXnJL0Ds9M9W/xRvSUs6TwwHb+8GA+AvZXrhL2gdHM9yrdcvQuubbsuSQW+rPyAvGvnY7uw79Q8IBCzPVbHAb1ore4938sHvSOLKT2GJQW9WyYBPjs5hzz7Y+e9CZu0PH0Y2z0s+sI810C+Pd8UHz1TAko9UtLPvHPT0L2f65O8AAAAPwAAQEEAAIA/mhkPRQAAEEOamYFDmpm3Q80MC0UAAKBAZmZCRQAAgD/NzPRCZmbCQ5qZAUMim+c8AACgQJqZwEIAAABAM3MrRQAAtEIAAHhCAACCQwAAKkPE5x49vzU5O3mPuz0AAIA/AACAP+p8ib0AAFBBAABAQAAAAEAAAABAAIAURQAAwEIAAOBAAAA9QwAAmUIAAOFCAABAQAAA1kIAAGpDmpmcRAAAgEAAwFhD+xvIOpX3Tz1y0KG82BABPQAAwEDRC709HTfuvWbmmUQAAMBAMzN7QgCAoUMAAIA/NbzlvQAAiEIz825FAADPQgAAgD8AAIVCAAAZQ2ZmXUNmZt1EAABAQAAAQEAAAPBCDZZWPeX7271HBdE9aBPQPgAAokNmZt1EmgkJRDMzskQAAIA/M7OkRM1MVUUUrm5Dzcz9RAAAIEGW7J+9spAFPgAAB0RvvZS9N8h8PON1L70AAIA/AADgQAAAwEAAAABAAAAQQWZmwkMYjq4+AADAQAAAAEAKV6tCAECbRQAAgEAAAABAM7MkRQAAgD8AAMBAZkbTRQAAoEAAAFxDAAAAQJqZbUQzswlFAAAAQJqZgUQAAIA/zUzVRAAAgD8zMxdFE2e+vYBzcT0AAIA/zQwLRffFrb2SYky8ZmZCRKnKCT17MLq9AKCnQ2ZmHkMzM+hEAAAdQ2ZmDEUAAKJEzcx9RQDAKEUAAIA/Zmb4RAAAAEAAAEBAmhmqRMUAxzwi8Ya9AACAQIiWoD0AAEBA0EEDPhHrDT4AALRCb/YFPmZUM72Y/kQ92tDVvQAAqkPKKQ8+AAAAQAAAgEAAAGxCAAAAQWbmNENmhpZFAACIQgAAwEAAAJBCAACgQJpZPkXzj4K9AABEQwAg30MAQBtFzcwRRc2MGEUAAIA/AACAQAAAQEAAAJZCAABbRDNzkEUAAIBAAIDKRc0ssEUAAOBAAABAQAAAoEMAAGhDmplSRDfL0j6rQO69qCnKPgAA2ETNTLpEAyyhvHNcvr0AgJREzczHQpqZt0QAt+S9AACgQDOziUQAAIA/muzIPU+zybjPXEK9AABEQ2amO0XNzBFEZhBIPs1Mn0OamVJFAAAZQ09j1j0AACBDZmZCRYv9MD5mZvhDAACAPwAAoEAAgC9DAABEQ2xxBD4AAElDmpkBRZr5hEUAAP9DZuaZRAAAQ0RoE9A+ZuaHQ81MBEUYjq4+AABYRAAAokQAAFJDjz8MPWDoVb2a59e9JFmxPP+/qb2C0uw9AACAP82s4UMAIIpDAACAPwDADUUAAKBArvwvvIc63z3NTDpFmhl7RQAAoEBoE9A+qk67vQCAeEMAQBtFWHnRPWYmLkUzMxdFzYyYRWZmeEU1ANU9ZsaPRc3Mx0JmZnhFmtkVRQAAUkMAAJZDAEBRRQ3xKD3KHQ2+o12aPQAAgD8AAABAAAAAQAAAoEKaCQlEMzMXRQAAIEHKnoU93x0yPvFvrb2amZxCSKGiQwAAIkUAACBBGI6uPjMzBUPNTNVFAAAAQc1M1UUAAMBAAAAlQ2ZmeEWa2WZFZqa7RYacELwAAIxDZiZkRQAAAEEAAHNDMzNNRGvc070AAIA/1YyRvXhOiT0zM3tCAACAQMcjvb0AAK5CAACqQpW8n7xcU7y9GprKPf9fVTwAAABAQJwePeMJVz2qnzW967ldPW8EHD5oE9A+GI6uPgAAokQAAIA/XGGLvYV5bj0bUus9oSYQvQAAQEAioqG9sFMIPmamoEUzM+hEM82gvWZmQkSbMoS9+j6vvf3lTbyiFVy9dwP0PSW9zb0AAIA/AACAP4RCgbxLvba9AAA0Q2amBUUAAMBAAACAQJpZo0UAAGpDAIBlQwAAaENmZl1DAICsQ5qZAUXNzJFEZmbdRI8Wtbq/j9Q8S5qUPSiO27uRnbq9T7sRvIgRGL26z048/0mAPJotXzvfdmi85LGUOq/XCbwd9mG9U6rkPLfPZLyVYv44b/y7vXUs6j3DrSe8h5xOPY9s071gYLW9nSosvO8ZTbqnVq+9uDP/PcYkFT1IW7W8e7jTPVdCzL0F7vK8Cz6UvfKhTzwtN1W8W1ZmPb/agTxTWfi6gpdePSu1Pr04F0S9BzXCvcMI7b0LSDA9Iwi2PYBi+Dud7qc84BiQvTcLyrxOEpo9YB+VPW3TIj50Nbg8VWL0PU3tyL29wfs8mZvJvWRlF7vrxUU85yBEPXqGmb27AiQ9ahgEvEK7mL1/qh6+L0oCvcCQpD1LmRW8GR9FPWiv3L0le6E8uoRyvfvs2D1TtK67D9KJPCIx2r37Gp89k/ghO4gllLwn/ri9gP2IPfNWBL1dFQm82lYOPU3s4Twto/q82QaUPWunrjyxP689+PTMvIe+p72ryim99wTPPb7KDbycEK48CKFqvbN6Ez6yoq48DNafPf9fxjub6lG9I1qMPJCiCD7jVh08n2yYPB+0u73oZqQ9Z0mCPBLhlr13e2u7PrsDPZfwq7v3jYC8byrUPQdLGzyyLZk92Wy8vfKGDDwFNGe9C60CPoX0gLxcEMY9mbssPhgSgDwj6L68tLqwvViy3b3u6Ce9y7yavRTZyTrCQHc9eb1HPsPUpj1Xlz+90XmvPOD39j19Pra8NPqrPdUHgT1sq6I8NFKGvEPnBD6nrcE9MdeFvV9iZT1v3C4+6y3PPbvar7yTK4u92yEvu3fKB74/4Qu9HjRHvOSjwr1yEII90JPWvGglbDyPBAs+8445Pm339zxzfO+9VzMMPa9zOrwR8KY9sxycvDGekjwrxJI8OC3xvb6/Bz2BJxE+8nB3vSczgzw5juM9AAAvQwAAnEMAAJhBAADIQwAAcEMAAABAAABAQWbmh0OaGY9DqUCSPZqZ20IAAAxCAACAP2ZmwkMAgLtEMzN7QgAA3kQAQJVFM7N1Q7Y5x70AAOBAAABAQDsFijyAnKS9AAAwQgAAgD/3ScA9aBPQPpc9qD4AAMBAc9KMPQAAgEEAAChEAABsQwAANEIAAO1FAIC9Q9SnqD0AAEBCCtcjPrkOij36zXO8AACAQAAAsUSAaZs692GKvQl0kj1HNxK9ZmZdQwAAjEIl/Lg+AACcRRubAL5AKpW8MU+YPczbub0AAABAPL+0PUsRkLzUU7i9AADAQACAAkYAgIFDE/pBPQAAAEAAAIVCpsauPUoOUbxvGe+8G7/bPFNlnz1Tl5I8AABVQwAAQEEAAFhCzcz0QpVUqT1oE9A+AAA0RQAAgD8AAChCAACAPyX8uD4o1ro95SGvvc2s4UMAAD1DnS3QvbApqb37q9e7AAAoQwAAQEAAABBBAAAoRM3MYkMAALRDAAAAQQAAakRoE9A+AAD8Qh1uAL3r5mA9AABqRAAAgD/zxNc9AACAP83M9EKamUBDAADwQm9fiL3WEzC9OBSIPQAAykMLj429AADAQAAAS0MAAPBCswPpu2Oksjp3Mm+9AADgQAAAbEJ7TIy9AADAQACAL0UAAJBEuF6YQwAAQEAl/Lg+AIBxRWgT0D4AAMNEAACAPwAAgD8AwMxFAAAAQAAAEEEAAABBAAB5RQAAbUUAAM9FZzFYPas1dr1nEMU9AAAZQ56IvL0AQJVFGI6uPuJxij2JVKc7tBmrvc2X1zxhErM9AMDJRQAA8EGngaw9gnMMOj9ZdDzDZ747yh79vCcm0DxrYas9AzVfvW8Y0b0vug87Uhh+vFiiTD2ghAG9mRkfPgkohzzgMFI7j3kIvY7VsDvzfXU92DoyvF2Z6zwCVHm9FO+NvK2niTz15HO7ROC0O+fzh7x2bRS9YySgPZ97rrvwGnQ6tnBEvcDvtjwzCTM8FV1rPboNNbywkKa9OFETvb7kDz06E6K9z/kVPdWD77xpZZk9f+JIvJoGoz1jvqq9cSqIPXmfITvSlpa9yJbsPPIhDLvNrOFDAADcQwAAYUUAgNNDAECVRQCAU0UAQCtEZmbCQwAAIEEAABBBAMC6RQCAR0UAAABBAIBxRQAAUkQzs79DAMDDQwAAwEAAAEZEAABhRQAA4UQAAKBAAED7Ragpyj4AAOBAAAAAQAAAMEFoE9A+AMCBRQAAakUAAEBAAABAQQAAFkQAAPlEAAAAQAAAWEUAAIA/AABAQRiOrj4AAEBAJfy4PgAAh0RoE9A+AACAPwAAoEAAAIA/KhRFPQAAAEAAACBEAACAPwAAQEAzMxxEAAAYRAAAPUSsqLO9AABqRQAA/0OoKco+AAClRRiOrj4AAIdFAADAQAAAz0UAAIBAAACgQAAAIEEAAIBAAACAPwAA4EAAAIA/AAAAQBiOrj4AAO1FAIAURQAAIkSoKco+CMcJPVDB9T0AAEBAAABAQACAPkUAAABBAABAQAAAcERfiRc+V8ezvQAAgD8AgKlF7dD2PZOvwD1WSUy9AAAQQQDA0kUAAABBAABAQQAA/0MAwGREAADzQzMzHEQAgFBFAABAQANnEbztPu49AADgQAAAUkQAABBBAACAPwCAaEUAAOBAAABAQAAAgD8AAMBAZuboQwAAgD8AADBBP8i+vQAAAEEAAD1EAADgQAAAcEQAQIBFAICFRQAAwEDNzPRCAIAvQwAA4UIAAFhFAACoQyX8uD4AAHZEAECSRQAAgEAl/Lg+AABAQAAALkUAADBBaBPQPgAAgEAAANJDAADbRAAAQEAYjq4+AAAAQAAAKEMAACVFAAAAQaRw1kPXy5+9r1RvvAAApUTyPMo9oXe9PQAAqEQAAIA/ACDfQwDAgUVr6R49AADgQAAAAEEAAEBA03mWvUrOYD03v628BRbPPfpJ8LwAwMxFlweNvc+tub0AIN9DAAD4QwCAKUUAACBBAAAgRAAAvUQAgAJFAABAQABAkkQahVy7aBPQPmbm6ENLpcK9AADwQwAADEQAAKBEAACAQACABkQAAF5FZmYwRAAAAEAAAIA/AABbRQOkKD4AAABAqCnKPgCABkSCoRq+Zqb7Q4SzuD14VZE8AIAGRAAA4EC7EdK9zewjRCd6/b0AwAFEAICgRQAA4EAAAIA/AIC+Rdi/Iz4AAEBAAAAAQAAAAEEAgDZEAACAPwAAgD8AAPZFMwN+RACAiEUAAIA/AADgQDfL0j5sMC+9AADwQgAA4EAAAKBAAABYQwAAwEJmZuZCAABGRQAAuEIAAEBDIgOSPaux7z3i3hY9AAAoRAAAgEAAAIA/AACAP/vBrD0AAABBAADgQAAAoEAAgLVFR70fvQAAKEUAAIA/AADGQ9UbhL0AgLVFAADgQAAAukQAAMBAAACHRagpyj4AAABAAAAfRQAAgD9oE9A+AAClRQAAh0UCSvy61JynvUHzFL2amdlDF6MAPgDAukUl/Lg+aBPQPgBAnkUAAEBAAAB8RAAAQEAAAPBDB12FPQCAF0UAAARFAAAAQQie0bzXSuC9AICLRaIZ5j0AAHlF8S68vc8EYj0AAIA/u5gEPkcXI7z/dCY9k+6wPB9Xrb0AgOVDAAD/QwAA1UQAADdFAACAPwAAgD8AACJFAADGRAAA80MAAPNEAABMRACADkUAAABBZmYwRAAAoEAAAKBALegWvoxLHr2URQC9AABPRd/zEz0AAD1EJfy4PmZmMEQAAIA/FIGAvAAAAEE6fnY9AADzQwAAWEUl/Lg+AADzQzMzHEQAAKBAUzcDPgAAgEAAAAxEAABbRW9BKD5kiB68w03XuwDAZEQAAIA/O7xaPcsJyT0Pmue6AADzQwAAwECHqYi9mFY/PQAAakVtP8a9AAAgRMJg270AAHZFAACgQAAA8EObFfg9AACAQGgT0D4AAIBAAAAAQcqT1T0AwMlF6OM8PRNN8roAgH1FAABAQKgpyj5oE9A+qCnKPqgpyj5oE9A+AECYRQAA4EAAgHFFAMCZRQAAgD8zREo84U++vQBAg0UAQJJEAABAQACAdEUAAJxFGI6uPgAAgD8AAHBEAADSQgAAoEAAAIA/AAAQQwAAIEMAAABBAACAPwAAXEMAAKhEAACAPwYmID5mprtDAACMQwAAWEIAQJVFAMCBQxbBkr0AAIRDE32/O9tU6T2yUoO9CC1lPAAAEEEAAEBAAADgQADAt0V3edK9AAAgQWkCqr1gQ2a8SA3tPAAAAEHd0v490gjyPACAF0WrcCg+AECSRTfL0j4/1r88Ai3ZPf9Ny73FRmM8AADAQHSPBj4AAI1EAACAPwAAxkMAQJhFAADgQACAiEUAAOBAAABtRWZPOb2kcNZDQhDcvSDmYT0AAAFFaBPQPi0K870AAJBEY3wrPZ6Pjb1uxDA+AIC+RQAAgUQAALdEAACQRaRw1kMjp2M9xzyOvZuyRDw/XiM+AABYRQCAtUUAAKhEef7KvYPzsbv6kZg9oBn5O4NQyb3MOJ+8QPm3vQAAgD/c78s9AADtRAAAE0WtqPy92gj3vOx5ET04jKW9gx96vfIyrT0AIN9DAAAgQVylOrwAAABAl+rIvQAAnEMAAMxDJfy4Po+N7jwafeo9AAAHRQAAQEAAAEBAAABAQAAAnENmpg5EAABSRMecBb4AAApEAACgQAAAIEEAgCxFAAAWRAAAQEAAAABBAIAXRQAAkEMAAFJEAADAQwCANkQAAABBAAABRQAA4EAAAIA/F9wVPINLET4AgEpFAACgQI1KyrtHBs29QivmPQAAUkQAAFtEzcwRROcAsL0AAENEm61yPJpn5r2C3i+8AABAQGam+0NmpvtDS3eaPQudNb0vtNi9GI6uPhDfCb7C2WM8AABAQAAAgD+6POi9MzMcRADAAUQAAABAqCnKPtXf/j0AAIA/AADzQwAAAEHK29E8AIAGRM3MEUTdjEi9+D5SPQAAAEAJeBA+AEPLPAAAAEGf9/89AADgQKkbnr0AwAFEAABAQAAAgEAAwJlFAMABRD6Olz0AAPZFAABAQACAqUVXM+c79m4MPQAAgD8aYvE9AAAAQQAAeUUAAEBAAIBxRQCAdEWjewA8AACAPwDAt0UAAD1EAACAQACA3EUAgDZEaBPQPgDAw0UAgMFFAECDRQAAgD83y9I+AMCTRTMDfkTyPLc9AECSRPps9DvMyCI+AABbRPKw8D0AwGREAABtRQAAoEAAAKBAT+tiPMqhyj0AAIBAAABbRAAAgD8Yjq4+076DvY8S+Dx39By78/uVPE98hr3+27s9DyFLvKs0VjvmPha9Nfaquy086rvCLS69RzrXulXKZTy3Wew81ThVOlAFO73lDAs7sG7lu33R9TxztWC8M9S9vZUnqDyBtjK90vCtuyTNpr0UhzU7qzPYvZLn4T1K5RW9w5fTvUC19z3golk9iPlhvSJZ3TtIt5G9fPTFvanDCb2QEwy+qA2qPKjJ3D0LrbI8J+YNPI/SHr1y/zI+b5h6Pb7WpD1kzjS9IxNjPZh+uLvngIW9w2gNvL2SeTxCVp29fxSQPZYLFD5rHoG98nxPPdoGcD0PN5W9U7GXvMtaND14wlO8ao9oPEoQID5zUK08VY7QPXt48zsfTLI86CDTvbcrCz6QHlW7SSMzPfcGJr2PPF+8dcLYvVfPt710RIc8j2fIO40y6z2cJ4q9XFkQvgyXsb3mpMg8K+BEve9KAr6bTzo9/4c/vVru3rwC7L496BjUvSDzUjzRmJ48E8JTvW7kQr0fXxU901rtvPLrwL14aWQ9tWkwvRoaCj6acPG8Ei4+PQIhRr0dnxs9H9QBPnpxr7t9sIA9GnFxvQIRmjxaKY+86cIlvqrl6br1NOa8s+U5PCoeNrv3GN49a0HFPF+h07w7rz89T/FtPfAuVb3EtyQ+B1HevNJQPb0Onhc9CEVwPY0FLzu3yW+94SZDPUce372bs7+8LHgSO99zg73z3N26OGZpvYur6T11EJA7pi4svL/KBD4iumi9A38NPaCyszyeWIW9Ghh/vYPjzLv6L/48gERQvc+VwT1nvL+7Gyh+vdY6Jj1bXwA9MobRPe6KlD0wbD280YabvCT4yL1O24O8z27mvR8SkL0luVA9ouZLvV+atz1lO/89CwsePXPCqLxEV5Y9x7lZPVhGcr10l0A8IFTkPQlzhj0QGBK9ac+OPHesGT5yZji9TThYPVo6170HMfS8eYcVvU2TTT2/ugc92utGveWziT3VC1S9hW/gPSNpoDy9mpM963OgvIv1Hz0XP6G9nWVIvVfq5r03eVE8+rvDvUCVPb031gK+L6W5uxZ2C71sd5Y8te5nvcTUBz5PmCk9JZ14vdj/ND3aWp49kaswvItTub0yLo49YdG9vXBjijwN70i9kBZNvNltRj1N38+8WXIlvbCn8TqDGwY7Zy5wPYLeYj1uh8i8zv2oPQHgGb0X1NG97retPJ4ZDj7rTPQ7RfGNvbuj8jtC2FQ8RSP4PY2b2ryR2Ae+lSPtvX9XgbxmwoQ9PTtavQJp3T2ji3i8iNGaPH89kb0/Vq09zfXfu4xUur2PgWQ8VLmxPIOKGD6r1lK90HIWPeE6QLzYusC9kqVOvM3ljj3v04e9CtxPPR4Trb2ewku8EWhMvFvYnT0vi3Y97+R2vcIvRD1DcZK86LB4PW/sIr3gRIQ9yPoavKKFbzzF2/I9qt+dPUttWL1qNpa9S388PZtorr3ZAzG8cxHXvYqVz7sFTYM7XflcPVcExDxfdPk9JUkSPgAAgD8AAJxDAAAwQwAApUQAAHBDZmbCQwCAqUUAAMhDAAAAQQAAAD3poos+AACAQAAAAEAAAIBAAAClRQCArEWaGY9DZxAmPQAAQEAAAIJCHhCyvbw9SbwAADBBAABAQ1pGqr0Dnpm8jz22PfHwcD5ptEg9emuNvQCAo0UAAFJDAAAMRAAAwEAzs3VDd5i/vQAAkEIAAMBBAAAgQQAAhUIAAIA/pzd2vJqZwELyBIU9AAD8RAAAkEIAAOJCAAAqQwAADEIAAGxDAAAQQQAAcEQAQOZFAEDjRQCAvUMhqJg9HpuOvcNPsjwAAIA/AAAcRAAAQEBbs4g8AABAQAAAoEIAAMBCt21bPgAAYEIAAOBAAAAwQlAmczqjIw081nZFvQAAn0QAAIA/AAAAQXtUmkMAAOBAAAAgQQAAwEAAAMhDAAB4QgBgrkMAAFJEygTRPAAAAEAAAEBAAIDWRWbmNEMAAIA/7Ic1PQAAAEEAAABAAADAQBVfkz0AAChDAABAQgAAIEHdILi8AAAwQQAAwEJVVVU+aMjpO7jv97zLVf48AAAYQvNJjr3xjS+8Tv4SPfaajjy2j8I9AACTRAAAokS7osm9McOevAAA2EIoi+G9AABsQwAAgD+4tru8YhAlPWZmLUO9lui9O1DSOwAAQEAAAEBAzewjRI/qVr0AAIA/AAANQ3sSy70AAABA7ZrAvQAAC0MAAKBAM3OQQzMz+0IAAIA/AABwRAAAgkIAgPFFAADAQAAAYEMqsc68cXyWuzP2xT1dgO08HiGGvQAAIEFY5La9RzOXvAAAAEArUoW9yyzvPBWDwz2SyZu9IEhEvAAA4EDNzPRCpSLUPQpT0DwAAMBCu5EIPQAAIEEAAABAzcx9QwAAtkK6Ke08LTCHvQAA4EAAAMBAOPjQPQAAgD8AAChD+v3Zva6tAj4G+xI9AACgQAAAgD8AAABAAABwRAAAgD8AAMhD2AUtvAAAIEGpJ729zSwVRAAAAEEAAFJDZuY0QwCAtUUAAEZDAADtQwAA7UWkcNZDAAAgQQAA8EIAALhDAABAQAAA9kUAAABBAABwQwAAoEAAAD1DqzdSPAAAGUO4SN+9AAAAQcT2gb222Lu8X6GIPQAAkEJwYQi90E2WvVwPCUPVXpK9p+8HPJ8+Bzs1EpS7V/ONPVpGHjytcam7H/aDvbOtuLo3NxM91ebNPXsLt70NKms9gy8OPsdSUL11zvQ8a6UivXALBT5VPko8EdeGvaPk6ryqydg92z6sPa8aXTznfS69+LDaPGq7kr0prJA8FZJHPRq39z3UOUi8nuywPSixH73b/AI9XyMWvKeWnD14Gue91FpDOBQXvToLAHI9+UacPX+f1rwYZUa8YwXePao3yLz0xDw9y2xyvYnPOj3Ltiq9Qz3vPCu66LsCOXw858+gPZeVDDwnxlW81aBqvUzRGLwnTco9O7+yvTt2Sbt7BXw9UszEPDX6xrwoiP88xHnIvCN0PD0uJYW93sQ3PAoXWDxxmjq9Agbou8W0jj2I/ek9euCWvK4rKT2QCCe9AACAPgAAgD8AAPNEAACAPwAAgD8AAEBBBLK4PQAA8EIAABBBtbQ0PgAArkRoE9A+/eiXPQAAAEEAAKBAAACAPwAAIEEAABBBmkviPNELvT0AgD5FAADAQQAAgEAAAIA/AABAQAAAq0QAAJxDa1HuvG32w717YP09AACAPwAAkEIAACBBAAAAQAAAnEMD2pW9nOSHvMCxML0AADBBAABAQwAA4EAAAJBCAADAQgAAAEAAACBBAACoRAAAtERvLSk9AICjRRtMQz0AAMBBAAAAQEqGtL2BIZ07AAAiRKgpyj4AAEBAAABgQSX8uD4AAIBAvYmJvD9UI71jeYQ9b1vdvWy6K7wAAEBCAACAQBiOrj5oE9A+AABAQAAAwEIAAIBAAABAQQAAIEFoE9A+AACAPwAAgEAAAEBATAAbPQAAgEDHwYu9IJDfPLmEmb3DFJK9z8b7O9ZYk72bOKS8AACAQDfL0j4AAIBAmn1WPQAAIkQKooc9AAAoQwAAgD8AAIBAAACAPwAAQEAAAABAAACgQAAAAEAAAMBAAAAAQAAAgD8AAEBBAAAwQfPZ5T0AAMBBAABAQgAAwEEAAIBAAACgQAAAoEAAAIA/AABAQQAA4EAAAEBAAAC3RAAAt0Q1DvY6AAAZRQAAQEEAADBBAADAQT2IfbwAACBBIYiYvVLp3DwAAKBAv6+8PEeMaLsoJ7i8j3RsPAAAhEN3+Xc9MmdSvQAAwEEAAKBAAABAQAAAAEAAAABAEcK9vQAAwEIAAMBBAAAAQAAAQEIAAIBAAADAQAAAQEAAAEBAAACAQAAAwEIAAMBCAACAP4vaED0AAABAAABAQgAAgD8AABBBAADAQAAAwEAAADBBAACAQMogR70AAKBAAAClRAAAAEAAAABAAACERAAAgEAAABBBAACgQIjGtz0AALFEAAAgQTfL0j4AAEBAAACAQAAAukQAAEBAAADARAAAAEEAAGpFzq5EvWPNNTv3rzg8v6CcOpPbBTwAAABAqCnKPgAAQEDOahO8vbWSvdqM0jwMrBu7SL3BO+HDQr2lR2M8C6aVPStT3zyKa4a8l5SsvaebMLuaEk89mgDfvOafnLtaJKC9I0ZZvOW3Bz2n1ao8/EQtvSqlIr27srK73zcEvBrnCj0vbRi9o1YHu5/jjrz8nau9jQ5wvfNCFrtI2Km8o1LcPN9nmztlBQy9fsmtOxtGKT3fWuG7K+Gbvcpt/bzosKQ8btiEPHgd0T0HUVg9LimoPBzQArws5bq9zfZwvEsXID2Fxzg9TLaOvGdxM73xkp29Qn83PZIfAb0VGH090Ad4ugYJozi9Kvu89zerux9S+TsKWdA7Fad2vE+44rqL8Ac9GI7mvYf3szzeLLA9gdaIvEIU3DtKNsi9ZfjTPPGYsj3wzXO9ZzmXPIoX9b13qcM8zE+cvCt+FD1l4Bo96t5ovdfNGT2u6hi7v5WTvfIdcz3/IZi8O53dOp8IAb7V3em8g7v7PMjGvb34Lc88EMHrPayaCb3U9Uc9qvpqPcPaiL2oKco+AAAAQACAi0UAACJFAAANRQCAhUUAQJJFAAAZRQAAN0UAAChDAADgQAAAdkUAAIA/AAAgQQAAMEEAAMBAAACAPwAAgD8AACBBK6pCvIB6zb3BxUw9AACAPwCAcUUAAOBAAACgQAAAh0UAAIA/AAAwQQBAmEUAAJxFAADeRAAA4EAAgBpFAACAQAAAJUUAAIA/AAAQQQDA0kUawXq9aCjNOwAAbUUAAIBAAACAQAAAgD8AAIA/AAAgQQAAoEAAACBBAADgQAAAjUUAAIA/AACAPwAAgEAAwJlFAACgQACArEUAANhEAAAAQAAAHEQAAIA/AACgQAAAMEEAAB9FAACgQAAAQEEAAEBBAIAmRQAAIEEAgGhFAAA6RQAAgD8l/Lg+AABVRQAAoEAAAIBAAAAwQQAAoEAAAIA/AECDRQAAgD8AAMBAAACKRQAAEEEAAIdFy+L+PQAA4EAAAIA/AACgQAAAgD8AAJBFAACAQAAAgD8AAI1FNo6MvXCbur0T0XQ9AABAQAAAEEEAAIA/AACAPwBAmEUAQJVFAAClRQAAgD8AAMxEAACAPwAAgD8AABNFAACcQwAA2EQAAFhEAADYRJ7LsL0AAIA/AACAP+IQgb0AgBpFmiK9PQAAQEAAAMBAJfy4PheUCT0AAIA/GI6uPgAAAEAAAABBAAAlRcfzwD0AAGFFAABtRX/nxT0AAExFAABAQAAAgD8AADBBAMDqRQAARkUAAMBAAACAPwAAgD8CfwK+AADAQAAAgD/Ci3m9AECARQAAfEUAAMBAAACAPwAAEEEAAIA/AACgQAAAgD8AAIdFAACHRQAAh0UKGrU9AICIRYNAwr2v2bU9UVcQPfqkbr0AABBBAACgQAAAikV9EaU7WDMEPgAAwEAAAIBAAICORQAAAEHFyrs9AACgQAAAEEEAgI5F7/sFvQAAoEDd4Se8AECVRQAAgD8AQJVFAACAPwAAgD8AAABAAAClRQBAlUUH2K+9wtrOPZ8fazwAwJ9F+9oGPgAA4UUAAIA/AACAPxiOrj4AAEBAAACgQAAA/EQAAKBAAACgQAAAQEAAAJBDAACAPwAAzEQAAOdEAAAuRAAAAEAAAJBDAAAAQH+lvz0AAABBAIAdRQCAHUWv7uQ5AABAQAAAH0Urbaq9AIAdRQCAHUUAAIA/AACAPwAA4EAAAABAAIAyRZXU7r1jYoK74UMGPgAALkUAgCxFAACAPwCAMkUAAEBAAACgQCX8uD4AwMZFAACAPwAAgD8AwIFFAABeRQAAkEUl/Lg+AAAAQAAAgD/lveG9AOAFRgAA3kQAgEdFAACAQAAAIEEAAIBAAACAPwAAoEAAAIA/AACAPwAAIEEAAABBAAAQQQAAQEAAAEBAriCoPULbETsAQINFAECDRQAAoEAAAMBAAACAQAAAoECyGvO9AAAAQc/jxT0AwIFFAECARQBAgEUAAKBAAACKReCtAz4AAIBAfdx7Pb0Y5r0AAIdFAAAAQQAAgD8AAIA/AACAPwAAEEG1UrM9dz9CvQAAoEAAgI5FI2KAvQAAoEAAAIA/AACAQAAAgD8AAIBAAACAP1/Gc7oAAKBAwgf7vcvYPL3XJzg8AICORQAAgD+FVI67GDAoPgAAgEAAQJVFAACgQAAAIEEAABBBqxcNvQAAAEFTnIg9AMDMRQAAoEAAAMBAAAD2RRYPIb35MD89AACgQK+VLL0AwMlFAIACRgAAoEAAAIA/AACBRAAAQEMAAIA/AACAP4jSEb0AAIA/AADbRCrTjTwAAIA/AAAHRQAAAEAAAIA/AIACRQAAB0UAgBdFig+4PQAAEEMAAIA/AADkQwAAEEQAAABAAACAPwAAAEAAAAFFAABAQQAAUkQAAHZEAABAQQAAAEEAADBBAADkRAAAE0UMUbo7FyMyPQAAwEAAAKBA389NPRsgSr0AAIA/LxPLvQAAgD/K2bO9AIAaRQAAAEAAAIA/AACAPwAAEEEAAIA/Iy/AvAYRlDwAgC9FAAAgQQAAwEAAAC5FBA+pPQjVWr0AAEBAGI6uPvE/wj0AgC9FWFOqvHO4sL0AAIA/AAAAQQCAU0UAgD5FGI6uPgAA4EAAAOBAAACAPwDAukUAAIA/AAAAQACAQUUAAFhFAECSRQAAAEAAAABAAABGRQBAgEUAwIRFAECeRQAAW0X+Gw0+AMD/RQCA8UUnbbA9a3CDuzqNhD3f0Vi9AADJRAAA7UQAAIA/AABMRQAAgD8AgGJFAAAAQQAAZEUAAMBAAACAPwCAbkUAAIBA4w3yvQAAgD90FDm9jUACPVD1yDySTSg+AACAP2Vr0j0AAMBAC+oOPgAAwEBaxFe9ImpmPQAAgD/RLJi9AECDRQCAfUV/VPg9AAB8RQDAhEUAAHlFAACAPwBAg0XDawW9AIB9RQDAgUUAAHxFAAAgQZPCzb0AABBBrVl0PStQOL37ca88AAAAQfCdqr0lH2m8EsCIvQAAgD/NdsY9AUuevAAA4EAAgIhFAADAQDNMuT0AAOBAn+lzPSCv8T2wZ7g8qBuvPXPmGr0T9228aeO8PAAA4ECe5qe9AICORYikubyIwGc93CSfvQJRlz0awK48AACAPwAAgECf/R49dzIWPkHYAbynzXg92Cm0ujO1ir0AAABBAADgQFQ3yb0AAKBAizAFPgAAgECY76+8ZRO4PAAAgD8AwJNFAACgQAAAgD8AwJNFAMCTRRgQ270AAIA/FJ+/vVWxLL4AAIBAy616vfNJ1T0AwNJFAADtRQBA40WK3067AICgRQDAukUA4AVGP96zPACJ8D0AAEBB2GytvQAAgD/P6bq8SOKvPQDAyUUAAIBAhKcwvV9QN7ulpX08y5smvfkhtrtb8j48b3H+vCuoB73vBoq9H39uPeCyazvPdBQ+b/GPPb8V0b3zkr+8Dx9YPEC3Wr2FTTi92IdvPClAmr0f+hE9C666vGZutTzE/wM5g22mvfUgk7uXkIC9cM3ePOx8LrsDCZi8GwAsPihh2Dy/CRy9yQeKveud/zz6hBG6MixwPRJ/9z0rZxM9+ecvveLvAr4LE8a8AzvIPNja0bvI6Jg8DgqHPLVfZT1nWhi9cfM1O/M0nrz0SrS9X3yaPINderw6ZtE7E+3KuyW9sj1OR7E8P+AzPAI4bL2V0e09o1jUPDdLhr0y2rc9twxhvZOEQzyT0d890O7qvCejjDyIaf29BuEtvSvD0D04wsk9nTxlPHoj1bzCYms9BkTDveP4DLw9USo8lESpvZfO5rw/lqC9S7YrvNE6Lj1vVzY9uWmivERGK72CRhk7ACfXvcAQwbt7tlC8kkqkPUUA+by1DAM9FR5nvNBg7jypp669CoLhOxK9lD3/4La8M3HBvF9J+jodn667u7r/vRNlFz11mju9V2ucvbUe/jwgOtw9UwdyvHVqtzpiWwa9woBovE/dhTyiMWK91YF+PUMUXb2sdgW+sCtoPdBCKb3WIw29btmUPC29rj2vdUg8HKoNukvvnT2jIwc8BNyivSo2aj0d3t+7OZGCvMt9yb07O6k9WfuKvDmNgz0rqXy8yBRovQoMsbu2AJI9/9JOvYvJ8znVkY68xy+/PM66lDu1nd+9/37GvAq44zuCaQa9gSOyPaSQlbyfrOC6HHeGPfR+Ojzvztu8WrGgPSPyrbyqFdG9hBY9vcqs9LzjE/Q9nd2eu9dlnT03VHM8yzcTvYQhqry046y9puwyvYFOE7tBqqo9N88APMuo5jw+MZg9ahzFvaebZr2fWv49JbbQO8I86T2jD1e9Ee8AvjsKqD0r0Du+jXYePe/8/j2t3/y8iX6gvR4cprzaUEM9/j40PlujsT0PJd28TQYtvVAGTD1FocS98Jl3vYgrF73vNWU9KFtKPYbJEL3Hxtc7TW4RvVw4sry5vx087QTxPbtQTD2jDnc7OnWQPa3xGj0n8n+9s2iTvLWA672bhZS9ClLtvN3Ftr1BTh+9UK2EPSdZBr1VOk084MFZvaZjH76z8PO7f8+VPXYAnb0ttI69Ff/rvHik5D1Tp5+7h3v+PO+XRb2bQBw934WYvTtmcb0LRHc8h+glPG3G4j278ky9HokLPmg2Lz1TrVs8Ev9vPV7YmL2HSQq9ksRjPFod+rxrm149KMQCPDd7Hrz1g5+8QmvXPNPkbL2rS8+9IF1pPHvLG70NxI09jbl8vBQIL71tRW49rUeePa23CLqFY3w9H5jkvH9V/buNCbc9AADAQQAAgD8AAJBCAAAgQwAAxkMAAEBAAICHRAAADEMAABBBuP61QwAAwEAAACJDAADcQ6gpyj4AAIBAmpnbQkfEWr0AAIBAZmaVQ81MMUNZs6s9qx2bvAAAIEEAABBDJfy4PgCAgkMAAEBAAABoQgAA0kMAQJJEAABAQQAAQEAAABBBbiikvAAAgD/DDbW8jcy2uwAAQEAAAMBAdx6yvXPxnLyamcBCAABAQAAAf0NmZsJDAABAQgAAQEAYjq4+AADzQwAADEIAgFNFZmbCQwAg30MAAEZFAABAQAAAqEMjLJ29AACAPwAAIEGS6aE8P4iIPSyOJz4AAGhDAACgQBiOrj5IgYBDAAAAQAAAAEAAAABA1dtBPmK9zTwAAGFDvnSEvW6Nlr3eW6M6AABAQQAAwEAAgL1DAACAQAAAQEIAAEBAbA0XPTPiY70AAABCAADDRAAAMEFm5odDuP61QwAAAEAAgClFAABAQBiOrj6XCGw9AACAPyPLuj0AAIA/AACAPwAAAEBQ45m9AAAAQQAAAEAr3Lg91V9HvAAA8EEAANJCAACAP5PKxr2amTdDAABAQAAAgEDNTJ9DAACxQiX8uD4AAOFCAACAQL///Tx3XAI+AACAQBiOrj4AAIA/AAAAQQAAgEAAANJDe1SaQ6Sakz1o6m09KjCCvQAAIEEAAABBAACAP/exoL2iNIq9GI6uPmuzuL0AAA1FAABsQwAAqkMAALRDAABAQAAAbUUAAOBAAAAcRAAAIEHNrOFDAAAgQVjqajybIou971HTOQiwZj0Yjq4+AIC7RAAAoEQAAMBD84/xPLElrLwAAABBAACgQAAAMEG7coS9AAAAQQAAQEEAAABAAACAQDvLTj3wRb68i9+/u6FJt73TT7A9bahtveKmnb2KRwo7ZmaMQ4EXgL0AAIA/AujiPQAAYEIAAEBCAfaZPQAAgD+/U1m8HYOUvQAAQ0MzM/tCAACAPx/wtr0AAABAAAAgQQAAAEBsorK9RrdJvACAhUNTZqs9kfeKvRs76Lv48Xu9ZqYORPMXDDtTzRm9mgkJRAAAoEAAAABAnTeCO+XbxT3X4tc97/OOvZqZUkMDQLo9AICdQ82s4UMAAKBAAAAcRQAA4EAAAABBAAABRQAAikUAAMxDAICIRQAAAEEAAJZEAADAQAM2TT0AgHRFAIDlQwAAoEAAAIA/tNsrPQAAkEPv9sS9LZJzvAAAZEQAgKxFHFO8PQAAgD8AAMBAAAAQQQhKaL1uGcW7SIZAvQAADEIAAIA/AAAAQAAAMEEAAIBAAAAAQQAAAEFnhSw+AAAAQ2ZmXUOoKco+AACAQAAAAEAAAABAQpYOPgAAgEAAACBCHZOHPFfJcr0Yjq4+02w3PVyPp0IAAFJDZ8VNvUgyET1m5jRDAABcQ+jdPb0RWSW8AACAPwAAgD9xE668cAK/vcjvVT6yXWc9p1jzPVhqWrwAAD1EAAAZRTMze0IAACBBAADAQAAAnEWj+QG+AADiQgAAwEBhw5G9AAAAQQAA5EMAAFhEAAAAQQAAwEQAABBBAAAlRQCAvUNP5989A/QgPceej71TZhQ9AADAQAAAz0MAADBBAMDMRQAAkEMAAJBDAACgQAAAE0UAAFtFAABkRQAA0kQAQJhFAAA6RQAAEEEAAKBAAAAoQwAA7UMAAO1DAACAP7oOdjwAQJJEAIB0RQCAu0QAAABBAACgQAAAgEBX/Po8ZigDveuhoD37gTw8xlgFPIIgxD2Rbwa901cAPe86MLxPkwY+l5qAvKj8pr1lTWu8WKraPdjb1jwbnmm9zRaevVRcKb0HH469ebpLOwgFaD3/I/O8Q1fsPJzCBD49M489ltoOvc5NgL1n81W7Swt+vUjjqz3d4SW9RS/DPfvsQzwupkS9D9CkvB8nqb2jZOi777l+PU+LEL2n/FY9Z8k7PThC/z1aHRE8lwKyPdsWkb2bXmi8s3J1vF+kCj3f0RG7ngGgO9he5b1hgwE9PFSYPIfonr0x6JA992+uvP/PbTsYCaY9HePmvQoK5LrPlpy6oMmMvXOMeLwob589GE3avBerqzq2f5i8x48QPq8uPj0NIdu8kmarPaNOuTsLnwI8405/vYcPtTwJ/ie9HjvDO/d7pD00RKe88MrGvVNuhDzIwAu9awWkvetXXjpfIVo9YJilvIZNAL2/rl89h0FkvJeNAb4zj4O7SzmfPXgkTT0RlBC9FNAmvRrk0DxK5c298OPWPMiMQL0+Oaq9Kg8aPZWrYr3qVvI9q8ACPTuZpr3RD568fWmUu+p/17wqxIM8ygmBPT44lT1UmTg7K6TBPZiuprttWsu8EXTLPXU5Vb1Rphq8tezgPH8hy72YtrE9o3lfPN9gK707H/I8Tb7yPWP1r7xQ+Qs8HWAUvbFFlLyLSQ09AAAAPwCAZUMAAPNEAABhQxSubkMAAOBAjR60PQAAXEMAADREAMCTRQAAoECoKco+AAAYQgAAWkMAAEZFAAAwQQAAW0UAAGxDAABAQQCAoUMzc5BDJUyqu0NtoL3tCHO8FVuIPTfL0j4AAIA/AAAuRWZmXUMAAMBBjHsHvAAAgD8AAOBAAABoQwAAEEEAABBByoWXPQAAgEAAAKpDAACERAAAIEEAAD1DAABJQwAAwEEl/Lg+AAAZRQAAgD8AgNBFAACAQEMBMLxRK7e9AABAQRiOrj4AAKBAAACAPwAAukQAgFBFAACAPwAAAEAAgPFFU3bJvTOzdUMAAIA/AAAgQc2s4UMAAHNDAACAPwCANkQAAHZFaBPQPgAAakQAAPxCAABARIM/lD0AAOBAAADAQAAAkEQAAMlEAAAfRXqV570AAIBAAACAP7LugLwAwMlFAAAAQagpyj4AAARFAAC9RAAAwEAAQJ5FNP0cPQAAbUUAwLpFAACAQAAAAEEAADdFAAAAQAAAgEAAAF5EAABwRAAAFkQAAABBGrrePQAAgD8AAABAAABYRQAAoEAAAIA/AKCnQwAA3EMAgDJFAABARAAAgD8AAIA/AADwRADA6kUAAKBAAAC4QwDAhEVm5jRDAABAQAAAUkQAAHBEAMC6RQAAB0MAAChEAACAPwAAoEAAAIA/fdWlvQAA4EAAAFhEAACAPwAAUkRmZmBDqCglPmgT0D5YBpe9axUpPQDAhEXa7wS8AADgQAAAgD8AAIA/AACAPwAAgD8AAIFE94s6vbdn9z1DWFU7vx8RPgCACEUAACBBjmYTvuCeVL1/P6O9AAAwQQAAh0WsO6c8AAAoRBiOrj4AQINFAABmQwAAQEAAAMBAAECDRQAAgD8AAORDAADgQCTwk712UAQ9HQ0Kvdm7DT0AAIA/AACuRAAAwEAAAIA/AAAAQAAAAEDNTJ9DAACgQwAABEQAAHNDAABYRQAAAEEAAIA/ZuakQwAAQEEAAEBAAIDTQwAAgD8AANhEAACAPwAA/EMAAIA/AACAPwAAwEAAAHZFAADAQAAAoEAAAHxDAACAPwAAoEAAAFtEAACAPwAAKEMAADpFvFQmPgBAkkUzsxpDAABAQFyPp0IAAPhCAADwQgAAgEAAAE9DmplAQwAADEIAACBBAACAPwAAC0MAAIRDd+TFPQCAFEYAAFVDAABwRGgT0D4AAENFQ/huPUGEhz3KM+a8AACAP3eHo70AAMBAdikrPgAAoEAAAIBAAACAPwAA1USeISy83E2sPT2gHT4AQJJFAABAQAAAIEHyOxq8Mxu5PI2eEr5xGhq9AICpRRgzn70AgDtFHy7tPUWRbzwAAKBAaBPQPgAAoEAbi629AABAQCX8uD5H7rm8VuKNuwBAmEUUzBK9U3zbvQAAOkQAAJlEAACAQPIC27wAAIBAAACAPwAAMEEAAABBS475vQAAakMAAF5FQ0bsOgAAeUXtLqm8AABYQwAAgD8AAPxDAACgQDVwQD0gKVU+aBPQPgAAtEQAwMZFqCnKPgBAp0UAgLVFAADkQwAAc0Nxkaw9AMDYRQAAMEEAAMBAAACAPwAAwEAAAIA/AADAQAAAEEEAAIdDAABAQABAp0UAgHhDAACAPwCgp0MAAPxEAECeRQAAfEQAAAdFAACcRAAAgD+VGrs8AABAQAAAQEAAAHZFAADAQAAA4EAAADBBAEArRAAAoEAAAHBDA9AIvd86OT7PkqI8zcyIQwAAQEDNzH1DAABMRAAAoEAAAIdFAADwRAAAt0TgWus7Er3MvZtLY7wAAFVFAAAAQAAAgD8AgKxDAACAPwCACEUAAIBAAACAPwAAB0Vx3689AIAdRQDAw0MAgGJF+5FYvQAAQEGws9Q3Aak1PMU097uNfW6993s8vcqvuzxoOLS8buKsu8IXF71Vbs46e2SzO8s7nr31o/U988Z0vZMFIz2Fd5s7C+M1vSOsYDubmMs9W7yuvKCWkr1BNUm7ehlUPV67S7yYPZk9QNBevbP50r2jw309BzRUvcCwcD35lIA8n2PZvRNO0j24NFE8BTUVvls3HL0gy5e6f3wNPp/rAT6POE69p3hjvRV2vjzydNM9OaoavTbvxL0fC4W6F3SevcUgdT2nHR+9q/vgPe51BT3J+RA+USs6vdOpvz2X4fs8+wznvFUWI70vi3A9HeQEvoTzhL2OGp+9AFK9PJsiIT6LhU49eSPEOTFbiz1uSxQ7akC8Pajm/73/w7y8Tc7ROyrqyr2SKF89N/lkvUK3/zt94go+tHXKux6cob3YGMg9Fe1Qu0gxaT2SxXy8orpgPAOuaL0FWfo8OvmAvdNfWLxibeW9U/j0PaJ0DD3zFhe9xYUJPtdLcr1UaME8ED7fO8rX4z0fA5Q9JwezvSsn9Duz08y9I+I/Pu/cmD2HRkc83WCLvdUQIr3yEuO9PVZrvSvbBD5H5rC8lwXEvRL3/zxrcYG9PxuQOy9zhL1P7RW97aGAPb3Bcjvl8W09GxTZPYZkybzdlKw7RcTyvPOfy70rai+87k+kvIQNFj35yKQ9PDMjPcoazjpKDAs+P6+ovQMNZjyLVQU9ikN+vQB43T3hN8W9x3lWvfbxMD0Klwk8ojd7vQuSvb17PkM9p/r9uxfeJL3qfQi8X/h1PbM2QzzCDmu96npUvM9u3D3ggbU9TKfBvRA53b3X9va8N3BHO9eHZzxGjQC8/rYgvag0vzzbI6A9N60pPRBrsLw6mtc7KDLpu8hUZjwojim9I3a2u4J5pjy60im9L4UOvNwcBzwgVYE9WAl0vX8aZj1IuYe7nR7bvR6fsL0Q0d47eN7MPNIb8z2Tseu95HmFvfpDeD3U+TW9lcZLvYjC/jzrTPQ7FYCjvUj+6T3rKp88eMYzPXM3zrqkpJ+8n/rtO0JEcr1rWiq8ZzFVumRFlD2jOvc9VKDEPJ2gPz26dMi8pqfGO2c3xrxaUz683T/6PJJ6WL3wiPM8yP+yPX+4MTwnV9m9XDo+O9UxID3y0+o92YkdPgAAgD8AABNFAACAQAAA8EIAAO1EAACgQAAA0kJmZjBEAABAQAAAIEEAAJBDbDpHvVJOtD1VXlo8AADPQs3M9EK4/rVDAAAAQDG5gj0AAJBCsdzTPQAAHEQAAHBDAACAQADA6kUAAPxEAICyRTOzGkMAAKpDZqa7QwAAgD8AAKJEAAAgQY39E70AAIA/AACAQAAAQEMAAEBAAADwQgAAQEQzMwVDa3sRvQAAWEIAAOFCAAAfRQAAAEEAAHxEAAA3RQBAnkUAANxCAAAAQAAAIkNIAalDAABPRQAAnEQAANVEAMBkRAAAzEMAAPxDAICIRQAAQEAA/Vs99UrrOwAAwEG/CII9OLrYvAAAAEA+k6S99/4IvUdb8Tz3KYe9jkgkPMxduT3lrzm5AACgQAAAgEAdoGK7l4+lPWCnuDuSkTS9AAAZRQAAxEIAAIA/kvPYPQAAKESW4x6+C62Lu1fthT0AAPBCAICjRQDAw0UAwLpFAABAQwAAH0UAALpEAAAlQwCAqUUAAJNEAADAQAAAQEAAAGpEAIDcRQAAz0QAAIA/AACHRACAh0QAAPBCbO0DPgAAPUQAABxEAACAQABA40UAAEBCAACAQAAADEIAAEBCAACAP3erjL0AAJBC9mwpPaAFhj2IG306AADnRBiOrj4AAK5CGI6uPg5SJD0QY4q9AAAAQKP/YD0AgIVFAAAcRKTtET7M3xY9uNoEPi6gH7ybbf+9AAAAQAAAAkMAAEBAAAD8QjMzBUMAALRDAICFRQCAMkUAAABAAICgRQDAukVfWfi8+7rlvQAAN0UAYK5DAAC0QwDAyUUAAKhDKZcVPgAAt0QAQOZFAADARAAA0kQAAMxDAADGQ2KB1bsazXO9Aa+PPQETADyAqWQ9s5FHvQAAoEAAAHBEAABDRAAAgD8AgG5FAADPRACAu0QAAKBEAAAYQgAAhUIVNYy9AACAP27kvbxdbJm9Wql0vQAAAEDdOjw9METNulVVVT4AAIA+AACAPwAAQEAAAL1CAIChQgCAMkUAgItF13YMPgAATEVtnqy90gzgPAAANEWoyKG9AAAERAAAAECcs5O9KR7JPQAAKEMAAJBCAACZRACAjkUAAHZEAAAWQwAA+EIAAIA/ZmYeQwAAAEAAAIA/ZmYeQwAAgD8AgItFAAAgRAAAREMAAM9CAABSQwAAxEIAgNxFAAA0RQAAQEAAAABAAACKRAAAXkUAAF5FAIBoRZezPLsAAKBAAADAQAAAwEAAAM9EyauMPQAAgD8AAEBEzewjRIcC4T0AAPNDAADtRAAA80MAAEBAAADkRNC/7juUDqc9AADAQAAAqEOqNWY8AACAQACANkQAAGREAECSRAAAdkUAAKBAAADAQAAAW0QAAIBAAACAPwBA+0UAAEBCy7RZvSEOjT0Yjq4+AAB4QhdgAb1vMiW8W+0+PeuFhz0AAEBC65GAvQAAgD+rCzc8dcoNvFNibr2YxWE9B/ElPcOJHLxA5+A952OqPFpmUr2x/LW6Ih/evco9fDyI+Fs9q+b2vDIRCTzS2E092hP5PLzFtr1FPbo8sPmyPbL2xjyHYhE+kNMyPWvtUL1vrE29W5WjvVdedrxzFKa9gbErPWMN171rGVw8nQj/vGdi7L0MJpA988onvN9YsD3cvEo9GAwxvc88gj369AU+FfMQu7bavz17Reu91JhLuiA6srwfgeu9ajEHPkibmrxdwWE7bGNFPdHSCTwLDQi7hmyqOwPtHrq2Pi69RzaMPN8hHL3TJ2M9+LIiPINXV7yT8Dc8bGwBPodXxb3bnjy8kKexvQJc6jwvvYi8c6PGvQCqyT1vl8o8q5p4vf9vwT1rK7g8/68MPuV2vz03UqC9CsfKvSufG7zXuwy+2wu9u02lHz3C1H29ghDiOn/rCb12chO8H3PXPLLpYr3rGoc9Q2GwvXXuED6uB8i9YfkzPWIcrrzex7M7I1OUvcSxnbvDSEo9YJaFvJx2L71TAVY9PMYBvOe1kz3V28y9FjCAOhM1jT26vGC9360RvW9S2TwWEqc83f+ovKuJsz0Kwsk8ku79PICnBz6KRVY9U8odvIq8KLtOFwm9vvOyPZiH5jt9UKI9h2FRO2dfob3GXYA7sDTwPIRZrLyrn/S80fQLPWvP+7tDgaU9dTBbvb8ghTwitQO9b6TqOwAAAD+XPag+AACNRACA3EUAAM9CAAAAQPtHsz0AgMFFAADhRQAAwEIAANJCJfy4PgAAIEEAwLdFAADAQGZmwkMAAIA/AABGRQAAgD8AAKBAAAAQQQAAhEOamZxCQiVDvEUdXj0AgLtEAABAQACArEMAAMRCU6TZvBu94r0AAMxDAABbRAAAk0QAAFtFmpnAQgAAgEAAAIA/AAAAQAAAq0QzsxpD6yd8vCCwh70/rwK7cDrkPAAAoEAAgCxFAAAAQJ0qkz0AAGZDH1WnvQDAyUUAAABBAAAZQwCA8UUAAPBDzdaBvQAAjUQAAJZEAAAAQAAAvkIAACBBAAAAQAAAukQAgHRFTTwLvgAAakRoE9A+AABAQAAApUQAAE9FAACAP2ZmLUMAADpFAAAiRQAAgD8AAIA/v7qXOgAAgD8AAOFCy3MKPhcVtj0AwNJFZmZdQwAAc0MAANJCP3jovXWFhz0AAABBAABYQwAAgD8AAHBDAACAPwAAAEBoE9A+AACUQgAAgD8AALRCAACKRQAAAEAl/Lg+AAD2RADAgUUAAMRCAAAlRQAAgD8AACBBr+awvQAAgD9dJvK92r4nPAAANEWZwsi9AABqRAAAAEEAgHhDAACNRagpyj4AAMBEAAAAQACAL0MAgDJFAABDRQCAFEUAgH1FIGx+PIEjuT0yABy97RI6PQCAvkUAAGpDupjaPAUvvb064N298AdUPRMHFD6kcNZDAAAQQQAAgD8AAPZFZVsRPfqAo71jwBg8AAAoQwAA7UVgL+M9WvsNPAAAsUIAALhCAABYQv0j7L05KcC8AACAPwAAkEIAAIA/AAAQQQAAgD8l/Lg+AAAAQQAAZEUAAMBAEM30vQDAyUUtg2u8AAB2RdOhyD0AAIA/AAA0RPiynDwAAMBAAADIQgAACkQYjq4+AABAQAAAgD8AABBBAABVRQAAxEIzfOM9g0+CPfTdLr2oKco+AABtRQDAZEQzMwVDqCnKPjOzv0MAALREAICCQ5qZUkMAAJxFAABARGgT0D4AAGpEAADwQgAAcEQAADBBAACAPwCA8UUAgCxFB6fNvQAAQEAAAIBAAADkRAAA4EAAAJRCAMCERfe//724XphDd6CWvQCgp0NW1as7AADgQBuLvTw3HLG9IK2/PQDA0kUDxcK9sHCKvAAAgEBi0Kk9dqCdvTsQ77wl/Lg+AADgQAAAIkRoE9A+OQUMPQAAAEB4hA8+K4fIPAAAKEUAgKFCAIAIRTMze0L9Ss29SxRPPLB/gbwCaL48AAAAQb938L0AAABBAACAPwAAIEEAAPZFuI/ZPQAAAEBbzqU9p4K9vAAAnEMAgIVFaBPQPuuzyr0AAIA/osv8vQAAHEUAgDJFWgABPgAAgD8AAIA/AACBRPPy3zzrV8G9TZlpPQe9az5XENA9DFcCvffo2b0AAMxEAABwQ5jNk73HFKC9Jfy4PgAAfEQAAN5EAABeRQDA0kUAAFhEAACAQAAAQEAAAABAAMABRGam+0PFhdS9ZqYORM3M9EIUrm5DAABDRQAAjEMAANxCAICIRQAARkMAANxCAADhQgCAGkUAAIpEAAARQwAAXkSameRCAACAPwAATEUAAB1DAICsRWgT0D4AAIREAACAPwAATEQAwJNFAIC9Qz70y7snknQ9mif0PdUw4DrqCGq8c58zPXs6rjrp5ay8veZvPAtNhD29dD47xU/zvLkyCz3ARFq8QE13vQIBhzxtReM9RUV7vV1P1T1Qg7k8/fLHvJCpcj0UGqQ9GeqRvJlpKLzzUjQ8NWF1PZpzW7zrr2y8buw1PLuEv715wBA9t1KSPIj1mr3cqi08XQgBvZ0GUz1nlzs8Ff+vvGqt173R1Cy9hUeiPQLNk73JBkI7XgUAO8pMtb1jy0O9oiTZPcv5yTzdkNc95fR8vO5tlD0d3b+9VETGPF9pnjxLDhM+cL74vUds5T1Wu7g8MHFyvUpKfDznJLK96GWLPKACAj5tUZI8mz4DvnfqWb3got08zrOdvYJw+zyrI+I9bCcDvSqYSb2vrt48/w+DvUBjObxr64G9rQJPPWPdEz5FPqE60KprOkMuwL1BYzA9VwzyPVhpWL1YcZ49ZzmYO81zujxN1wi9iDxOPX/Ul71AQfy7lBw5PX6cgbtQTcU9X4oRvTruYztK2OY96Q/LPadnN73MqIE9eZikvQpGb7v/Tmq9lnsyPU1ejL3bMiS93EssuzrsZb0YBt4854ZJO0upAz0X02u9bfWtu+cDlT2gbLE6vd8jPd/dsbw02JW94u9xvN5pPr270Do9AOpjvJ3BXr3vEQY6/8EBPuKO1jsKa6S9axf5POJACT7zDcs8wJhsvYP1lT2d3fS8YcEbPnE0Ar0PKps8FZiVvfePjLzSvWU9bwhTvQeE+71y3Yg9v2AZvR2Fcrv8zqA82CZ9vbOHNDwAADBDAACIQgAAAEAAACxCqCnKPjegir0AgIFDAAAcQgAAMEEAAF5FAAC6QgAAoEAAwNhFAACAQOPftj0AAOBAAAB0QgAAIEEAAMBCAADtRQAAwEAAAIA/AMDYRYWmpL2daY28AMC6RQAAEEEYjq4+TSPQvc/zwT03Fni9/mctvCX8uD4AAO1FAMD/RdqSvT11WTw8AECVRQBAp0UAwMlFAAA7QwCA0EUl/Lg+AECSRQAAMEEAAOBAAACAPwAAfEIAgLJF4sWsvQAAAEAAAKJCgOSnvQAA4kKmCsM8AACAPxWPuD0AACBBAADaQtTttr3ZYb+8wn4Cuu8phDwIxnY7bTNEPQAAgD8/5Ai9AICORTfL0j4AAHBBAADPRWgT0D4AAJBCAAB2RAAAgD9LtHA9dxOtvABAmEXbZQk9z3mLvQCAJkWTrcA9vgnDPBiOrj4AAIA/JbYkvW6Igj1LXUM9/oeaO4F6Lr0AAIA/F7cQPAdeyrwAwIFFN8vSPgAAAEEAAIA/AMDqRQAAEEIl/Lg+AACAPwAAk0QAAKBAGI6uPgAAzEMYjq4+AIBTRQAAtEQ3y9I+AABQQsI2/b3i4O68AACAP4cCPL3dBNg7uAmVvVsVk7yfSJA7ICnevAAAH0UAAIA/AACAPwAAgD9oE9A+AECVRQAAAEEAAOBAAADAQACA8UXFhrM9tH8SvRiOrj5oE9A+Jfy4PgAA7UUAAMBAAAAAQAAAWEUAgKxF55HSu9ISj70AAJxDAADkQwAAgD8AAEBBAAC6RABAg0UAAJxDAIAsRagpyj4AAO1EAAAAQAAAAEC3l5w8EBSbvHjuArr9kn+7NZmBPHZ5h7vI33y9qZgwvGGpiT1ahie9U9IAPLwqMj1TteU86vzau6o9RL23iy88teHzPCEEwryLifw6MIZ9vFeQgTyGR4m72/aEuqP7cD0xC6y923YMuzWWrD3qsvQ8k9g9vOYurz0jD1w8QmMMvZzAo7zG5yU9yk10vMA4or3nwM87xuuzPY9nAbz7Mp09YsjLve/iL7yv+ag9b9pnuR8dpjyAwkm9lHoGPQv+nT1LKTW9Tzk4PTkByDsqap696mFmPcBabL2+Gko9KnL2vEXP/T08fb87wuFsvY/MRT2DRdg7IdYivSVJEj4AACBBAAD+QgAAoEIAAI5CAACAP8I5sz0AAIA/AAAQQQAAVEIzc5BDmplAQ2bmpEMAAABAAACgQACAoUIAAKpCAAAoRAAAWEIUrm5DAIDlQwAAAEGHNR89AABAQXfnN70AAB5DAADUQgAAwEAAAIxCaBPQPgAAAEEAAIBAAAD+QgAADEQAADBBmpnkQgAAoEAAAFxDAAD6Qqgpyj4AAMZCAADgQLpWvL0AAGBBSG07vQAAoEDLvW89AADMQgAA7kIAANhCAAA4QgAAAEE3y9I+AAAIQgAAMEFcj6dCZmbmQgAAgD/H7+y9AACuQgAAQ0MAABRCAACgQAAAKEIAALBBoRe/PQAAwEBcj6dCpHDWQwAAWkMAAMBAaBPQPgAAc0MAAABAAACAQAAAMEEAAEBDIEcEPaKoJLoAABBBfbijPQAAAEEAABBBAACCQgAAgEAAAPBBAAD+QgAA0EIAAJ5DAAAAQAAAiEIAAHBBAAAAQQAAmUIAAOBAAADAQAAAwEAAAEBAAACAQAAAFkMAAKpCAACAP2ZmHkPo1+W7jSiOvQAApkIAALRCAGCuQwAAVkMAAEBBAAAAQBcSfz0AAEBAAADoQZewzz0AAEBBAAAcQiuy1729zae8AACAPwAAHUMAAIBCAIDlQwAAAEAAAK5CAADwQgAAB0MAAIA/AAAwQSX8uD4l/Lg+Jfy4PgAAAEAAALBCAICsQwAApkIAAJpCAAAAQAAAgD8AAKBAcf8YvWNkqL0yQUa7rYRSPTMze0IAAMBCAAAAQHM7/j1cVq48NVb7vb3Azrwl7Ls9AAASQwAAQECQid09AACQQuuAkD0AAFBBAACAPwAAQEAAAJlCAACAPwAAgEAAAE1DAACCQmgT0D6oKco+wQKCvZqZnEIAAABAAAAwQQAAAUOKYGu9aP2NveQNEz7ztPS9AABAQwAAaEIAAFVDAACgQAAAQEBkqqm9GI6uPgAA+EEAACVDAICdQ5qZUkOoKco+AACAQAAAgD8AAD1EAACGQzMz+0IAAHNDAAARQwAAMEEAADBBAAAAQAAAoEAAAABA+wm+vQAAAECYozS9GPLePQVC3zsAAIZCAAAwQQAAQEEAADRDAAB0QgAAgD/zXdg9mgkJRGZmLUMAAEtDba8CPgAAIUMAALxCAAAAQGds0b1tI+I7Q8zuvQAAhEMAAKRCAIB4Q8MT5L0AAHJDZmaMQwAAQEC4XphDTUTSvQCAhkMAANhCAAC4QwAAlEMAADBBZqa7Q5oJCUQAALhCU7rSvQAAQEAAAAJDAABAQAAAgD8AgIRDAACAQP0CiD0AACBCAACMQgAAIEEssJe9AADIQQAAUEEAAAdDAAAkQwAAhUIAAIA/AABuQwAAAEAAABBBAACMQgAAAEAAAPBBAACIQgAAB0MAAJRCAACAPwAAgD+7RKa9AAAQQQAAkEEAAGxCAAAAQAAABEMAAIFDAADAQAAAL0MAAABBAABMQgAAgD9Sp5y8GIZivQAAQEA3Q6u9AACAPwAAgEAAAABAi1ZAvE/DkD0AAOBBAADAQAAAR0N32iy9AACgQAAAAEAAAMxDOY7jPQAA4UIAAIA/AABQQQAAEEJoE9A+AAAAQAAAbEMAAABAmpnkQgDAgUMAAEBA3wjWPQAgikMAAABAAAA8QwAAOkMAACRDAAAoQ81MMUNm5qRDmpnbQgAAPUMAAGxDAAAMQjfL0j4AAB1DAAAYQiX8uD4AAEBCAABsQ1+VCDxHCdu9AAAAQPOYSD3QDYW9AIBKRC9xyLrXQbc9AAAAQMjX3T0AAHhCAACWQgAAfEIAAIRCAABsQgAAOkMAAIA/YnjmvQAAUkMAAIpCMxR8vdq3YD0AACBDAABaQwAAMEEAADBBRw0avgAAgEAAAKhCAABAQQAAa0MAgKdDPU7GvQAA0EIAgIVDq1bSvSgXbz0AAIxDsklnPDtbLb3NzH1DX3eCvQCAqkMAAEtDROcNPEcK9D0AAARDAACAPwAAgD8AgIxDAACgQ5lzsL1Z8wi9AABQQwAAoEAAALhCAABAQAAAR0MB4jA+eiwEPftDsb0AAMJCAAAAQM3sI0QAAEBAAIA2RAAAykIAANRC326EPQAAgEAAAO1DGI6uPgAAWEIq2J28SDEgPCMybL37zL698qDju7dlyzkyxsM8MyxqvfexDz7CE7o82yP6vbJrxLzxz8K97oLBPbi7krygDFu871/XPPNO1TxKAg29N5Ofveva5DzIOrA9BhIRvdfMi71PDki70OjQvf0m4LxwHfI8R3/TvKOGOD347Xa7bz/wPQVBCj3TUhu8q2mNPQECMb3SaOm99y5PPU2y67zEbqY8D0Jnu+OH373bXDq8z8afvd8Rp7yznrE8MKZ6vTUVpLwaD6M93AcEPr8fjTzFz2q9v19QPYu/rrsPAcu9dMeMPKHotL1QECG9C0HjvcOHz73HZrg9jLkbPjpX9rvw7rw8srQaPuf2Sb3DAJM8y2bmPXteMz0rx/I9Gx99vSVRN72JspQ9n/fkvUUKwDyJkhY9i+/4PaDE7T1X5mI8wFt8vTu9PjznxsI5ytmBu3cxqr0qERA8kydyPSOAfT5YmBe9b8cSPXRcF7zv/LO91vGQPaiTBbyPOr49OEpeva9ZnLzPeIo774SKuzYYGj3UbZq9hWANuiplkjo+z8a9ctvHPQ4Bpr0lrYW9W3tjvKqr0z1y62o7vleePa0qZ73F5O+9vWzpvDLOEb2Krty9FUskPdcSirxuoRu9dKsDvuAGp7x8lQU+0uvrvcc+AjxUAA68MJUEPpKme71qCli8o4dCu/mWvT2oq968PMPGva/KvLoY4oO96BzXPXkmqDywTaQ9cIxAvSVMDT2j4/w9j2Z+Ox8pmT1yk+K8y+hDPNPkIT03XbO908hSPfPDCb1T+L69gD5VPBt+F72C/fA9G8QrPq6YOTxYDem9wH60vEfG/j1+P569q4PqPWn1KTzI4s29l7kSO3o27zzr4IK9eNyhvedCBbrvWD09fbZlveCMMbyJ/gU+MjTHvQbXkzzJ8yI9cXsruesx+rzSCSg9TcTzvcdG3T2He709zAY5vVsFqz3Mbhg+0vevvShs5TsVBVU9p6mlvX8cLTxreHu9S1ZLPDVsUbyVYVO9JOM+PUuq5juvotQ9pJGVPPgelb2LhOS91en7O8g55rsYMFc95yedvWBNXT1zlB29IomlPT6Uoj0NKtG8/8E0vRu+ij1l/rc95b9YPBo/SrxzoPo9qXaIPcUDsL3jv8u9GmziPJt6vrwHFy496pKFO+eHwj1njwE9V46PveTnBT7P3z28NDG9PYpRJb2v1ZC9P5IePLtUzTvLJdS98yuXPVKXk7xnKb29lsGsPAMA57tIa8s9sWLFvQcV1Dyvs528PdBbPQCAu0TRC709ZqYgRQAAgD9mpgVFAACAP2aGlkXNzCxCzcysQWZmeETnmqQ9GI6uPiX8uD43y9I+AACAPwAAgD+aWVlFaBPQPgAAoEAAAIBAAAAAQAAAAEAzM5dDZmaMRJpZCEUAAIBAM1OGRYFGuT0AAEBAAAAQQRKEbr0ry9y9ucmpPAAAgD8AAKBCzcx9RQAAgD3NzCxDAACAPwOhpL0xVK08blSxvPDleT0Yuxk8AACgQM3M4kNmZvhEmhnFRCNOgT0Yjq4+GI6uPg8jsL0bbDI7GI6uPm/1Ub0AAKBA5oTBPTMzskMAAHhCAACAPwAA2EKaWVlFAKCDRaNlpr0AAIA/GI6uPgAAgD/NzCxDaBPQPgAAgD/ivu07nNSTPSsMbr2FY+I9RT8xOzMzzUMpsK+9AAAAQQAAQEAle509AECARdMnwD2aEpe8AABAQD1+6LwAAKVD0NuMvQAAIEEAAMBAAABAQAAAlkIAAIA/AAAQQWamVkUAAOBAAAAgQQAAtELSQAk9axdavWeUFTz7BHK960yPu4rsmzxaeEu9AACAPwAAQEEzMxdDAABAQIsaFT5JIJC9aBPQPjd7ob0AAIA/M/NuRVvRAD7nhd+9/u4Hu9IogDwbeoA9AACAP3SSsj0AAKBAAAAAQQAAAEAAAKpCAACAQAAAgEAAAIA/H7C8PQAA0kLOTDW6mpnZQwAAhEMAADBBAAAMQwAAQEBcj6dCAAAMQ5qZQEMAAIBAAADhQu+Gw7yhBzo9AABAQnmVNbvNzCxCAACAP5zXvj1Gfwo8ogKVPYf+Pb2Y3um8Ny8fPJoZRUVbmjY9AACFQjMzBUMAAABA/WyjvQAAMEETuWO9L6GFvScMHD0AAIVCAAAAQwAAMEIAABhCfmQ4PgAAAEAAAGBCOPKJPYtwoL0fpqe7AAAAQLpsgb0AACJDhGWvPAAAVUMAwChFAAAAQAAgikMAAABAAACAQAAAAEGamcBCAACuQgAAQECamYFFzcxiQwAAkEJSX6w9AAAQQQAAPUPpoos+C2aKPZ/bTbvlr4Q9FwI6PL34Kr1/mxA9AACgQAhDZ7yrPRi92hsAvdXyTj1rT7O6sON3vXS5gj3xHDg8AnybPYaNpLwCfDE+cRSLPWFMmz0fpLM8q6LJPFjFh72Taai7EuWWPTjyoLsDsKC9fTnpvHIgID0DrCm8zYjAvVLy7zpGpby6H1a0uxdCdTy12EQ9nQbBvSIYQj1vWRa9vwahPPSKk7374iu8MT8RPdXFnbxA66I9siCtvVQ3mjm4FiC9qjOkPQ37U72X0nA8B0vUvVG7jjzivw0+Mo2QvKyplbvHYAG9f9pjPVNyozs6lFO8zhg2OmvVhT2JNLi8nxCvvXqZVrwAAAA/AAAwQQAA80TN7CNEAABAQjOzv0N/Pak9AACAQAAAnEMOUpa9AADwQgAAgD+P02K9AABqRAAAtEMAgEpEAAAAQI+LtzwAACJEjnQEvQAAgD8AAF5EAACqQwAAQEMAAGRFAACgQADAZEQAgBpFAAA9RAAA8EIAAABAP9CRPQAAKEMAACBEAACUQgAAnEMl/Lg+AABAQmbmh0MAgEdFAIDcRQAAgD8AAIA/AAAAQAAAQEAl/Lg+AECeRQAAQEAAAKBAOTqGvQOWTruT1d08+5GovAAAMEIIAVu8AAAAQAAAoEAAAGREAACZQgAAAEAAgJ1DAAAMRAAAIEQAAIA/AACFQgAAQEAAAMxDAAA6RQAAgEAAAM9FtlqEPQAAgD9Qjd29AAAQQwAAwEC7uZs9AAAAQAAAAEAAAIRDAIA2RAAAyUQAAEZFAABSRAAAKEQAAChEAIAURgAAgD8db6872TYAPQAATEQAAKBAAACAPxdRgL19udS9AAB4QjpE0T0AAPNDAACfRDfL0j6oKco+AAAAQAAA2EQAAABAAACTRGgT0D7tdbC9AADAQUpRH70AACpD7xkAvVDPvb0AAIRDAACAQAAA8EIl/Lg+ZqYORAAAWEUl/Lg+K9X6vTeorjw3y9I+mkyYvM0YfL1swie7vyB8PQAAgD8AAIA/AIC7RLgTpr0AAChDCMaAvQAAgD8AAENEAACAQACACEUAAB9FAAAAQBeY8D2I5G48AIBBRQBAK0QAAFhEAADkQwCAAkYedJk9h8LoOzu/wL0AAIJDAABAQAAAxEIAoKdDAABYQwAAAEAAAPBBeyQjvWZmjENmpg5EAACcRDMz+0IAALRCAACUQwAAk0QAAIA/AIAaRQBAmEUAAM9EAACAPwAAIEQAAJBEAACAQM3MEUQAAEBAAACAQAAASEML/Iy9AACAQBiOrj4AAHBDAACcQ7mjyr27Bxe9AACxRDMz+0LNrOFDAABoQwAAgD8AAFVFAABPRQAA7UPNTLpDAECDRQAAcENz/Uc63zovvfcVCDzLyos9AABAQAAAEEO5Ei89AAAAQACAh0RjKAI+A1YpPQAAgD8AAIA/AMBkRGd/wT0qsfW9Bd4CPdLhh70AAIBAIt+4vO03A74AAC5FAMDJRQAAIkUAADdFAACAQACAMkWoKco+AADnRAAAQ0QAAKBEy3ZGOjfJWrwH3Z29b+iUPE8BaTwQUlY7KYe3t88UsbzghlA9qlMnPquuC73b37w9g9YdPRqTKD7nsjg8+F5PPVuOj72IwGg9VF1KPKIF9T2bVE07mg+rvE0OnLsGLoY7l6wxvOV49jzAa3g86z7hvRL0dTr3L2K9xyCHvfKhej3o2Ca8WBkcvSMQOTnzfKI9xf48PHdfS7w7fb07HnjMPT6JET25H8W8eh7+vL+MNDzvAPI7cEzkPO+0ub2VPrI7V3advaKfXT2+1jM9t36vvPM847ybXZ89/l2jvRfbozzA72a8MC5avZN2xz0U5DW97kc1vNp8kr3dbyE+X/DsO8/E5L3TBq68Ox2lPQxLSr20xC08JuyRvb9asz0LgHW80M9tPZDOKT7HJsE7i0SuPbctEj0/+Au9z2XavSpAy7zH5Me8qb2uvcX02zwkVce8l0AyvJWdf713g5g8/7rxvGBlb7ysEK49txolPNV9tb207g89JJrDPS/zB7w7Q5M9FccuO6TsgD2y3348wCbiPQW2ML0fNQ89F+KlvPibzr3GVBu9LTz2ueMt4bswsqw9qCrCvfU5vrxTraC9ktGpPP6WNz1jWxA8YQORPOLttrnrAKi9baCpPAAAAD8AACBBAADgQAAAmEEAgDtFZuY0Q5c9qD4AAIBAAAAoQgCALEUAAABAZq6PPJNDLr3lsLW8AAAYQgAAQEAzM3tCAICCQwCAUEUAgBRFAACCQntUmkMAAIVCvthJvCqBuj0AAPBC6J67PQAAcEIAAKBAzcz0QgAAgUSoKco+AIDQRQAAuEMAAFpDAAAMQjOzGkMAAHBCJfy4PgAAbEIAgKFCAABAQAAADUP66l08G5e5PTMzBUMl/Lg+AABeRQCAoEU+Joy9HVn8OZCXrb0AAIA/AAAAQAAAgkIAgBFFAIAIRQAAQEEAAFxD4giUvfvICT5oE9A+AAA6RQAAeUUAAGxDM7O/QwAAYUUAAFhCAIBBRQDAyUUAALFCAICdQwAAAEEAAAdDAAA9QwAAdkRagty9dIiRvdqSgD3GPJW9J25UPdOrzj0AAEtDGycKvTCiXbsAAFhDAMDDQ16ut70AAJBCAKCnQwAAIkMAAMhDAADGQwCAHUUAAABDyq4FvgCAZUPAYPa9AAAwQQAAN0UAAERDAABMRQAAgD+amVJDAIBTRVVy9D2IRxw9e/qyPGdjY70AQJJFqCnKPn/7FzwAQKdFmpmcQuvUk70getm9AADSQpqZN0MAAJBCAAAHQwAAgD8AAAJDAABAQAAAukSamUBD3om3vQAAgD+infu8b+BcPQCAoUJm5odDAECVRQAAgD/8tpM9AADIQrhemEMAALpElz2oPgAAKkMAAEBAmpnZQ4KGn70AgNNDaBPQPgAA4UKXPag+AACAPyX8uD4AAPhDi7STPbo/u72oKco+aBPQPpoRsz0AAEBBNzQGPfCp3z0AAIpFkwCMvQAAPUMAgKxFd1q8PABAkkUAgGJFAECwRfty1j0Y8c08P/vuvVc1Rb0AAJRCenASPpqZwELNzPRCAADAQSX8uD4l/Lg+AICsQwAA0kJcDwlDAAAgQgAAEEEAAABDAACAQDfL0j4AAPxEAAC0RAAAAEAAAPNEAABSQ9PAu7wAOEU7+8YZPQAAEEO8s6Q9Y/AcvQBAgEUAACdDE8jGvSjWCT1gYJy9MzMFQwAAlkMYjq4+AAC0QwAAB0WB8aA9Gs/fvdD2GT4l/Lg+AADkRAAALkRoE9A+N8vSPnrv7j0AgAZEAACAPwAAAEAAAJZCAAAdQ6f6WT0AAJRCaBPQPm87pD1wLw8+AAAwQQAAbEMAAEBBAGCuQwAAQEEAADBBeyQXvn57kr2Ra6c9jrADvewShj0AAJxFN8vSPk+XAj4AADBBn5rhvWgT0D4AAFhFAAAAQRX25D2XPag+aBPQPiN6IDwAADBBaBPQPgCAiEU3y9I+HZdxvK6eODzHUFk8RxbKvQ+Thr2KgDA8Pr80PoI/gz2v61y8p9dLvZ0f4z3KAR+8y6N8PCKetLsYfH+9QqqaPeKwgjpo9lI909XBvf2Z/zsPSL09cLzUvE0uJzktOU8949OCOt9BgD3bGW+96HBfvH3A7TsHeGc911FkvDNqprmnDr293nkAvI0Bjz31EN+807uvPQzYpzwO50u9rxmyPFqhnbpF2Im9/so0vXIZID0Ty9w8cCRgvfOVMD2MzZa9FvS8vcVk4zxaYfQ8+tuxPaplUT3BB4O9yBZivNHriL03E2M7+1NiPbw+x7xz+7E982OqPfTBsztn8R49zqEFPktTVDtxAzI+4jbkvfLwejwjING9C1bNO9dWzLwz3Hw9jXBJvXof7z3Vfsu9XYRgPHkMTDsTQeO98/mavVewczzlrWg9Vw1WvR/xl7x/F6I9emICPKqdVb22jrK9GJbkvG3wLb03Enk90OM5Pbw9tr1q6oe8uh+8Pbbhor2FsxC8MUsaPTPkRL1e3b49xNM0PZtwKL1PdZU9Gl/pPQ/bJT1MmaM8ynuuvcaxqjwDflI6AACAQAAAWENmZkJFAABSQwAAXEMzsz9FZiaTRQAATEMAoINFAACAP2ZmXUMAAOFCAMABRM0sFUQAAIA/AABLQwAAvUQAgJREMxOoRTMzF0QAgJREMzMyRQAAoEAKV6tCAAAAQ2ynND6/SM08AACAPwAAgD8AQJJEAGClRWgT0D4AAIBAmpkBRDfL0j4zM2hEAACAQAAAgD9mRrhFJfy4PgBAG0UAAFhDAACAPwCAlEQAQFFFAIBlQwAA8EMAAIVCzcysQgAA8EIAABBDAEBsRQAAgEBoE9A+AACAPwAAcETUCMc9AADAQDMTw0UzM5dEAGClRWZmeEQAAKBAAADAQAAAoEBoE9A+AABPQ5qZN0QAAKBAAACIQgCAykSxaEg+aBPQPgAAgD+oKco+AAAAQDMzl0MAAEBAmpkcRQAAQEAAAD1EAACgQGgT0D7NzEdEMzPNRJs9Dz4AAIBAAABhQwAAgEAAAIA/AAAAQGamIEUAAJlCvYdOvJqZgURvi9885MgLPgAAgD8AQBtFAADAQJr5hEUzU4ZFAADAQM2MaUUAQFFFkMvTvc0MXEVoE9A+AABAQGamoEUkP4e8AACEQwAA7UMAgJREmpm3RDMzF0Qzc6tFvf79vCc3570AAIA/Uy7jvAAAQEBbqZc9AACAQAAAT0PNDAtFAABzRWMa6r2amRxFqCnKPgAAgD8xxio+zcx9RJqZUkPn0Yw8AABVQwAAVUOrg6E7AABVQwAAgD8O0qy9MxPDRZqZUkNxoZI9NxuXvZqZbUMAAIA/Jfy4PmVtmD0oKg8+qCnKPiFnuz2CfA69aBPQPs3MR0QYjq4+U/wmPs3MfUVmJq5FAADYQqgpyj5o2xa+AEAbRW1mCDsAoINFZmZgQ5qZgUUAgHhDMzOOQwAA80Qzs3VDzcwsQwCABkRm5rREQTlKPa0+1T2yX+M8PqPBvWWxnryLzaS9jTKVvM3MEUUzA35EAIAyQ/qoVj3NzGJDaBPQPppZWUWIgcW95P8SvmbmNENmplZFmhl7RZ/Hw7wzA35EzUxVRQCASkTNTLpFAACMQ9th/Tybbae9aBPQPpCJDLzimOc8AIA2RACAnUNmRtNFzUyERAAAHUMAgK9EAABJQ83MEUSaGapEAACCQjMzBUODVwk+qwoFPTMzzUNGfkM9mhmqRDOzpEQAAIA/AABYRAAAQEAAAIA/M3MrRTNzkEWmg0Y8fXfYvM3MEUSambdDMzNNRPctxb1QOck8snEivTMzzURmpjtFmpm3RM3MrETNDFxFAADAQJqZUkM7yRM+OhzOvOtO3zweihe9ukENPCxnCj0lBQQ+zcysQUjiKj7NzOJDxRuUPTOzv0QAwFhDAEBsRc1MukWYJ6C9AADYQygaKz2oKco+CxP8vADAWEMYjq4+AMBYQwDAKEUJDUk98CH6PTMzzUMckwo+nQj7vAAAQECyKOu9COYKPaBb2z3NjGlFAABYQ2Zm+EQAAEBAAMANRQCAgkMAAIA/zUzVRZqZ7UQAACJFAMANRQAAf0PNLBVEAAAMRABAG0UAAD1EzUyERAAAgD8AAABAmtkVRQCANkQAACJFlDgqPM2s4UPb7IG8ACDfQ2ZmXUOPKci9AABAQAAg30NLTFE9Y0epvZqZUkV7Y9g9AACAPxiOrj66RdU9gFL5PKgpyj49Luc9AEArRAAAwEDNTLpDZobMRX2web3N7CNEELitPThybDwAAPhD82nXvfuKxTwWN4i9FrG1PWgT0D7NzH1EM7OJRAAAQEAAAIA/ZuaZRAAAsUIAAD1D9f3HvQAAQEAAANhCAACAPwCAr0RfTcu8AAAqQwAA+EIAADRCAACiQz8Xz72amYFEysbfPTY9Bj4bAKy8RSjOvbdRvrwAAIA/puQmvQAAAEAAAEBAAABAQAAAgD+aGeBE01TQvc3MfUWieaY8GI6uPgAAgD/NzKxBZmYMRAAAQEBmZl1EjzJIPZoZRUUzMzJFmtlmRZoZqkTZsIY9KtHXOnBX5b0AAMBAAACgQAAAgD8zs3VFFfDVPV8Fib0Da509ZP0wvVfGGjzQ/aW9ZmZ4RAAAgD9oE9A+AACgQBiOrj4AAABAM5O1RWZm3UXdXds8r5wrvZqZgUQvi6K9TaviPTOz9URmZidFmpkBRe0mTr0PSmE9AACAQBOhzr2amQFDmpntQwUJ5j3JWAm9AACAP81sjkXAsW29AACHRAAAgD8AwA1FzcxiQ+BEvDwUrm5DAACAPzMzTUQAAMJCAABoQwAAakMAAHNFAABSRAAAc0MAAMBAAABAQADAKEVmZl1EAACAPwAAokMAAIdE/WCOvQAAPUQAAIA/zSwVRM3MLEQzU4ZFzSwVRM3MYkQAAMBAzcyRRCrazrw5WcO9M7OkRADAAURW5wI+AACAP82MM0UAAFtElIAjPc1MOkUAAABAAMABRJBVGT5y6SA9DvWyPCeaBr0lOGq7DHS1vQAAgD/AIYY9AMBkRPYDnr2nFsC9oviTu63U37wAgIdEiqEPvT6wIj3d+OS8W/GNPZ8ewb2OMrw8/PG0PTNzq0UAgDZEyGeTPbx9Qz3t2tK8nEiuvWjhDz0AgIdEk3WrPTXk6bm0Dsa8jZVgPQeJNTwobNy94mZRPEoQ+D3m85K9y2VnPXGZqzv4vqI9bqEKu5thoTrDEO48O0Z2OxXKNb269ky8f0YCPkL7Ab3bQ2K79k+gPZrs67vIHNk9yscTPdbOkrsXL5w9OVLEvLchFT1fHFe96sFmPJmtFD1RTYi9yu1ivHcYdD13Bpu7l2zgPYtP172oW+w8Rdu0vWXMnLv6xlq8MwjmvYwRvb2LA3Q90BazPEjqCj4zwhY8qsmKvSMberw7aS8+A3vpvNCH5D38ExS9GMFnPawZsr0AOxs8k5KpPQsja73C+fG9eDnnvFxGvrzPaig+jVHQvcKPObwvgq29p+EVvA9P6z1vvo48w5MKPRjKz71h+Ls8l6fXvTGbqj3GFio8NfcTvHPY5b2T8Qy9xiuLPX1hyb0fupK8qxYIvkRdHLxNrye8gyvuPRx4vr1vBbs6EjtLvXef9L0zi/Y9VwZ0veKoIr3TjQs9Zq4avY35ZT3sFIA9w0CUvXEkMjuzQRo+E3F3PVgdbr0PdqS87/bYvaPh6T2X8Qu9teswPfo5Vr312uk96y08O7rnGz5GPD89erdRvR6OkD0a7dI9d89zvA8r2buAqf69R4arPOOmc7yHQga9+9eOPao3D73hW8U87EgUubD7S710Rac9uDDTPPfCzbyV0iA8Pe2nO9vLgLxh18u96FVWPcuKhDxwCLC8KTupPc+Bf734raS9nXbsurOeKz0TBtm8iSW0POadPL0fQ548o8/RPaMnPT2rip69z0YYPMp/Xrwfkl27Hdf5PHDt8D2p26e8UKSovdNCOz3zJQ89ykx8vVRUOj2xlwW9Y0MiPR/pDb0AR0o9YLJ0O3UzlL3ree27y9/bO5Zbgz2tL248yJ38vCVPATw9b9U8DcCTPdCHTb2H+vy8UJoWPVJPwT2tq1O8amjtvUd0K7tFa6S8Qhz9vUs6Jj064Zi95yowPXjO0LynmGO938TSPUdrhT1iB8K6t+jHO2OplD0OuqO9PhoDPXuIpb1vEZm8AACAPy+hPT4AAIA/AACAPwAAAEAAABBBM7MaQwAAwEAAAMBCAACAPwAA4EAAAAA9AACuQgAApUQAAJlEAACMQgBAkkQAAIA/AAAAQAAAHUM63VC9l2EePN8Ktj2bTMW9vUthugAAoEAAAORDAABAQZOFeb0AAEBCAIBBRQAAgD8AAJBCAAB4QgAAQEBVwpi9AACAP1qaqr0AAABAgsXfvBO8iD0AAEBAVzcJPAAAQEBUOD29AAAAQAAAgkIbvRA7Lb6mvRezGj1PliG9AABYQgAAQEAAABxEAACAPwAADEKamZxCAAClRAAAgEAAAAxCetiqPdNuir2nZiE94ZSpvYN10bwAADBBz5YevAAAgEEAAKBAeJaBvTvkkrwAAHZEAAAAQAAA/EMAAOREAAAAQAAACkVSSrO9AACAPwAAxkQAAABAAAAAQAAAoEJYrVm914nlPQDAgUUAgCZFoQgjPSpOArzJqg8+pzH3PAAAIEEAAIVCAAAAQabvGz0AAAREAACWRAAAnEMAAABBAAAMQgAAgD8AAIA/AABbRQAAQEIAAMBBAADeRABAgEUAQBtGAEAbRgAAkEQAAMxETGS7vQAA50QAAHBEAAB2RAAAE0UAAIBAAAD8REloob3TL9U9AABqRQAAkEIAAIBAm+R0vXpOVzx8j429NUz4uwAA5EMAAKBAAADgQAAAAEB7Iy+8AACgQAAAiEIAADREAADwQgAAAEAAAHZEAABAQgAAw0QAAKBAAIBKRQAAZEWbq2y9AABAQDQdFD0AAEBAAACrRDUGKj6io/G9AICIRQCAi0UAAABBClerQgBALUYAAIpEAAAAQAAAgD8AABBBAABAQgAAgD9fIq29AACAPwAAlkIAAIBAAACAP8VC3rwAAABAClerQgAAikTi6JQ93YRuvRb0RD0AACBCAAAcRIOJrz0AAIRDjY+Xuh84cT0Lp5G9e+NSvOlPgT07eiA+z3eNPYKJkLq/TdG9kv8zvVZThT3/HrC93gzDPLTDm739kz89tVnavB0Tvrp9xH+9RmUyvdPCur05e7S9slHYPHI2Drw3KQs9P3oJvN4VID1Vat+8wETPvR+eoz2rxoy7cK8IPmzaGDw77r+86kbHvTv/wj24laS9s6LAPeNNPTsDNCw7xw0suwS4iDwLGl49sDNFPLVQaLqZnZa90gTqvKPRIbrjHHc96oHNPDsAd73wbdE9jYKSvUxhwrua3dY8eSuuPVWUArxHdMo9OwqBPDH1uD1UosQ8MjVqvfhVRTzmW7+9xlAGvau/Kj7Jmxc9mKNkPF+u6ryK2Da93GsDu1E+M7wzxpu9Pn+wPLBZyLyb3zk9aiwMvRbMgbyb+/o8AABYQgAAgD8AAIxCAACAPxiOrj5oE9A+AACAP5c9qD4AAABBAACAPwAADEIAAEBCAACFQl5Ktb0AgLtEiX0QvQCAJkUl/Lg+AMCERX2Qkb0AAABAqCnKPgAAGEIAAABAAECwRQCALEUAANhDAADAQQDAmUUAAPBC8QQHPgAA/EMAAFhDAAAAQABAsEUAAMBCt7IrvQAAgD8AAABBAABAQgAAwEEAAHhCMzN7QgAAakUzM3tCAACAPwBAkkUAAMBCrJG6vQCA5UMAADJDAABhRQAAgEAAAIA/GsqSvQAAAEAAAHxFAAAoQwAAN0UAAMBBAADwQfIK8z0AAM9F+5wKPd2D3bsAAFhDAABAQgAAwEGuBIG7OzvSPYF/JbyPlnK9i5nUPOowtz0Yjq4+GI6uPodK+zwAgBRFAICpRW9ngb0AgNZFAAAoRAAA2EQAAHBCAABwQlwAN71i/nY9zUwxQ+/3rr0AAJBCmhmPQwAAQEAAAIA/AABAQJvqHDzBALE9U1F3PAAAwEMAAIA/AIBxRQBAkkUAAPBC8Oi6PQAA20QAQIBFAAAgQgAAIEIAAMBBAAAMQudJiL0AACBCAAAAQCNo7DwAAABA0BUTvZ7+oL3zA70595iCPQAAgD8LXpi8qxGdvQAA2ESXPag+AACAPwCArEX7cg4+AACFQgAAkEIAAMlEAACQQ9cBBrt4OIw8Wg4tPnJgpz0AAIJCAAC0QgAANEMAAHxEAACWQjOzdUPdTqW9AAD5RKgpyj6oKco+AICORSX8uD6o+dA9AACQQwAAgD8AAPBDAADkQwCAaEUAAHlFAICFRQDAmUWoKco+My6jvQAA0kQdCOW9AAAAQDfL0j4AAPBBAACAPwAA8EEAAIA/HK8JPgAA8EIAAIA/AACcQ+fLQbuEzMA9AADAQvpQZr1OYyg8Gr+kPVg0bL0AKI28AADDRAAAeEIAgCZFAIAmRQAAAEBv6sq92C4+PH5glLwAgNxFeJ91vQAAYEIAAIA/AAB8RDPOcjwAAJBCL2yvvQDA/0UAQJVFAACxQjfL0j4AAIA/aBPQPgAAgD8AAKtEN8vSPgAAz0IAAEtDZxeOPQAAHEQAAEZFAAClRAAAxkQAgIhFYqt+PADAhEWPEiq9SfiJPc+M5LwAAIRDGI6uPgAA5EPwW6m9GI6uPtCre70AAJxDAACAPwAAW0V/75O9n4HpPaUW0jwAQINFAACKRQAAgD8AAEBAqemjPWgT0D4AAIA/2nL7PVStP72Z0gU+1+2yvQAAz0Wt54280TKxvRiOrj6H53O9qCnKPgAAEEMAABBDAAAwQgAAQEIAAPxDJfy4PgAA5EMAABBDAADkRAAAkEInNGG9AACNRAAAxkQAAOFEKqXvvbM8aL2QQNg9AACCQgAAXkUAgI5FT5o7vCPcZT2s7h+81baxPQAAgD8AAHBDAABwQ0jOJDrJ5aO9gMV1vacn/zwokei96XuRPGDgjrwqAG49mpmcQgAAAEAAAABAAADSQj+XBD7B+I28AACAPwAAVUMAAMBDQ/OuvRcw1z0AQIBFAAC3RKO94T0AAMBCAADSQgAAPUPago69p5ydPQAAqEQYjq4+ClSfuwAAQEQYjq4+aBPQPvF2mb2zfrK9jkKKvAAAeUWvAG494o44vARZhb0LBW08uSsfPUASG73tcxq8zmzCPD2ykbva+Yi70jgxva8Yoz2tCV0874xBPHCBZz11d1y9T4oBPiHMrb19V6+8XASKvBJdzD2g9VK8RhuPPVOvNb3DxoA72yEAvbJij735UYw94KhFuxP6lLzN0c09gQ6QvQv8Bj2bftU9u3QEPXkyF7woVF49XX2vPGehT72QR3C8CAGKvQQWyT1Y27y8MDaEPS8SRb3+xgq9iq3KvcCXtrxHIHy9c3nxPDPYnrzLdh+8n8oTPTZlnLxTaoK9SFPvPaRFgDxfy7+9c4oOPUsyvzw397E9+qNQvRG2oT2l96C9IN2YvJPg9TxoaWy9Wwv1vEKW4z2MnRU+R/hIO9fTIr2hDUI8JQzQuy3KIj4PL8m8hX9HvXiWir2I5C09ulJ8vBNmaD1jTy280+8APUuv1TxLQ4S8d1tGvRs1UD294WG9haLluYp/bborHYY8fdElvUWt6blSdwu9hzDyPHgcab2KGt88vFI0PU/19D00W4o7k0CIvXLNmbr68LA96x1SPfNetLxaa/c8XZWYvQAAgD8AAAA9AABGQwAATEMAAPNEzcz0QrW0ND4AAEtDAABPQwAAgEBIIqI9AADAQQAAwEEAACBBAACAPwBA40UAAABBAACQRACAZUNcj6dCAAAHQyivIT4AAABAy6txvQAAgD+GWLG9QDfyu2rUfz11WDe9AMDYRQAAgEAAAC5EAABAQAAAtEMAAIA/AABhQwAAoEAAAEBAgjeNPSGkgTynyqW9AACAQPHwcD4AAMBAXI+nQgAAEEEAAEBDAMDMRQAAAEAzMwVDZuY0Q3VhfLyBb7q9BkoyvQAAgD8AAKBAAACAPwAA4UQAAIA/AECVRQAAfEQAAIBAAACUQ8iXJr3D6s08AAAYQgAAgD8bqly9zl8NvPDfvb3poos+AAAAQQAAwEAAAEBAMzMFQ2OSeb0AAEZEAACgQAAAPkMAAOFFAACCQgDA6kUAAIA/MzMFQwAARkNpLQI+jWcmPAAAgD9APIY8AAAQQQAAoEDSPDW9bPrKPQAAgD8AAIBAZmZgQwCAvkUAAF5EAACQRAAAAEEAAJJDAABzQwAA8EMAAIA/AACxQn2sNrwAAABBAAAcROQsPj0AAIA/AAAAQAAAgD9QjiO9AAAQQzZ5wDyXKP68s16qPNNpiT1A5sC7AMDJRQAAtEQzMwVDAIDQRQAAGUO2er89AACAP83M9EIAAEBAAAAAQX/E6LwAAO1FAIDxRQAAoEAAAIA/ABUvPIuEQ7wAAABBAABAQNKq7bwAAEBAwuSTveq0370rjHi8AADgQAAAoEAAAOBAAABYQwAAgD8AAABBAABSRJD6670AAIBAAADAQAAAZkPNLBVEAACAPwAAEEEAAOBAAACAPwCA00MAAPNDAACAPwAA4EAcZKK9WyUpPQAAwEDfCVw8AADgQAeyET0AAOBAAADAQAAAAD0AAIBAhT7ZPc61NjyOEh0+l0vYPAAALkQAAIA/ZuY0QwAAt0QAAIBAAADAQC6Awj0fOSA9jxlUPTv7pb2zCp09QleQvQAA3EIzMwVDPRsqPVXYcr0AAIA/AAAgQbTHrj0AgAJGAADgQAAAoEAAAB1DAEDmRcvMMr5uBkS9FeSmvc+FjrwfQRw7AABSRJVZJ70AABBESVGkvNctob0AAFVFAADAQAAAAEAAADREgKRrvQAAtEMAAIBAAABVQwAAz0UAAIBAAAAwQQAAAEDHsNA9NfElvQAAgEAAAIBAAADgQAAAoEAAwAFEAAAuRQAA4EAAwMZFAACWQwAAKEUAABxFAABeRAAAhkMAADdFAMC6RQAAukQAABBBAIC1RQ9itby4HGe76iSfPfclljzl8eE8isPjPR1KEbwAAIA/n0lDuxL7bT0ewb08qBhdvV/5pr2OXwa8AABAQwAAEEPHtmY7Q1pluykqAb4Xp3M8y5RkOUfhGr35ZrA9Rar1O9MNjb0lglc9t2kkPT/grL1A1FC9wKXivZdJjD1Y+zm9khAjPWe0Z70Xm789VUTvPNs7arxCNvI8LkSzvA/Ekz3I+hA938ckvSPmhz2gbOq9W0f6u1Vkwj2fff89H2T9OxYhqbyq/JM9GdGLPU24VbvjZ6G9gYEPPPo9C70d3Vw8aOfdPC/QF727JTg+M/YqPRoWkr0jnZ09o+27vdWCejzYfLG98rNiPI8fTrxkQbU9sNmJvTcCYjxrXru8R4PSPBPc1r07i+e825HbO1tUN71HiNw6CzlUPtjlOjuQKca7fyqAO8VYV7zLUqG6iK/FPJ/8yjwDyUg9ngcRPM/yJr0zyIa9mLDUOy2uf7tTWGO9iZYVvIdDgz0zOG49OHsOvf8Ejb1lTZS8qyLxO7sGVr0nlLM7kxvYvB+5kLvRnR69GWSPPYlNjr3CCa86v4+fPPDEHbxXr6a9z21YPersi72k9469JZhVvNELvT0AAPZFAIAURQAAMEMAACVDAACAQNObXj4AgPFFAMDJRQAAAEBmZmBDAACAPwAAoEDoEDc8JQOePQAA+kIAAKBAE9+3vQAAPUMAQC1GAACAPwAAoEAAAIBAAAAAQQAAWEIAAIA/AAAAQAAA4kIAAKBAAABzQwDAZEQAAABAmhmPQ0ufuD0uBIC7AAAAQFyPp0IAgAJGAIACRpqZ2UNmZpVDAACQQwAAHUO1tDQ+AACiRM1SirlLREq9AACQQ6DGXj0AAIhCAACAP5xBhD1D4qU8AACZQgAAAEAAAMBATHKDvYVV4LxX6qC9AABfQwCA0EUA4CNGAIACRgAAgD8AAIA/kTetvQBgEEYrx349avyUOgAAykMAIAREAOAFRgCArEPD2yo9Y60GvP5Ksr3vttw8RN0WPQAAAEAAAEBDtS54ukO2mzxz0D+9AACAQgAAmkJNX5+9VCSMvMBOhL0AAIA/AACAPwCAvUMAAIA/kxq3vGkJlj0AAERDqY6ZvVOswTwAAHBCAmmPPJqZ20IzMwVDexLxOtgOOz3Sbq6831CgvQAAQEAAQBtGAKAJRgoI370AgAJGAACAPwAAcEMAYBBGAIChQ80sFUTSKHE81a5OvQAAgD+e2p89AACgQAApnb2gt6g9AIBTRQ9clT0C3vy8nvmsvQAAyEPy4tq9t5IvvWXbwj0yr8g5/b9ZPQcxgr2PGCE8G6Cfvbve9b1wnEM9AACAPwAAgEB/DZU9BW/6vNP1o73LlIm8zUy6Q83MfUNm5uhDZ/+avAAAW0QAAChEYr0EPmbmh0PMqz29C6yru5Dj5L3Cr+C8AACgQABA+0UAAEBCCBFgPQCAZUMAAKtEAACAQAAAwEKsL4M9RQLMvNeArT0fNt88AGAQRqEshD0AAIA/fzOLPQAAQEAAAIxD4inuPOMwGj4AAIA/AECSRGamDkQAQPtFAAAAQHQFsD0AwP9FAMD/Ra2qj70AAEBApbipPITvGr3/8YO6GzJqOu+IIzxdyFK9qWSPvcokXD3vAKA9iI9JO8lWCz05GzG83FCEvTJ9GzwLMnu9t0vMOlIzyj1V0aQ7o6DGvdNXFTuVVm89nX2SvGOeDr2dgZA9kyxNPWZTO72IVk49egV8vf0Dc73IxHA7Owv7PfK3wDyztgC71Ry0PQCAl0MAAI9DJfy4PgCAiEPNzPRCAACAPwAAnkMAgIZDAACAPwAA3EIzMwVDAAChQwCAqkMAACBEuF6YQwCAhEMAAIA/AACAQAAAcESXPag+MJ3evVg6zz3NTDFDAACGQwCAt0MAgKdDAABAQGgT0D5mZjBEAACuQwBAK0QAAJ5CAACAPyX8uD4AAIA/SAGpQ/YGgL0AAPNDG3O2PajTfz0AAIA/GI6uPgCAMkOamVJDAABwRACAp0MAABlDAAChQxiOrj6amdlDHz77vQAAgD8AABZDv8KJvQAAgECamVJDAAC4QmgT0D4AgIdEAAA4QgAA4kIAAARCAACAP2amDkQAAIA/AICFQwAAnEMAAKBCAMDDQxiOrj4zMxxEAAC4Qld2qL2nnIY9AACAP3dqtz0AAD1DAAAlQ/K+hz0AgJxD6ubzPGZmlUMYjq4+76RiPRiOrj4AgJxDGI6uPmURiD0FFeS7AADcQgAAPUQAAIZDzUy6QwAA0kJm5jRDAABDRCdJsLwAAD1DqCnKPgAAgD+amdtCAICnQ2bmpEMAAIA/aBPQPgAAHEIAAJJCAAAUQwAAU0MAAHxDAACAPzOzv0MAAFhDAACGQwCASkQAANJDAAB8QwAA4UIAAPNDGJ76PQAAykMAAIA/AABMQwAAikMAAItDmpnZQwAAjEOHbri9AACAPwAAhULOY4895RnxvY+MoLwAAIA/uP61QwAAtEKlbFu9AACAPwAAgD9iWps9zewjRACAqkMAAK5DM7N1Q8c4jL0AAEBAZmaVQ5oJCUTv/JG9AIDAQ9Q9rL3TE2U98cybvAAAC0MzaPc9zcxiQwAg30MAgJxDJku0vbykyT0AAABA/LqRPQAAgD8AAIA/12zIvQAAgD8AgKdD81oyvOd2uT0zGg6+AACAPwAAgD8AAAxEAAChQwCAqkPoRKM9AABwRLpYUL0AgKpDZmbmQgAAkkKH5a69AABkQjMzBUMAACVDAAAAQZIYHD1mZmBDqCnKPgAAgD+NyZs8ZuakQyX8uD7FR7c7AABzQ69ekD2g6au9Otj4PXUuNrsAAABAAMABRKfSaz33V2W9mnPsvH5GBb6xrD09M8M5vZLkfLt6raY9AICMQ6+qSr0AAIA/AABcQ7j+tUO4/rVDAADzQwCABkQAAIA/LVduPQAAWEMAAIpDet3IPQCANkQAAAxCUy2kvY8zoL1iaqK8ZuakQwAAk0MGNoO9kbWRPc1MukMAIN9Df6vTvT4TCr27WoK9AACkQwAAgD/NLBVEzqwJPpZ1ljyrDgW9AADGQ7j+tUMAAIA/T08HPM1MukMAAKRDSyumvQi+gT0AAMZD4PCyPQAAgD/5Ho892yvrvXXaxT3q7KK7ijCIPJOEoD3oErU9AICdQ2wqF71neiI9zUwxQzfL0j79lrK9AACAPwAApEMAAIA/AACHQwCAwEMAAIA/AAChQwAAxkOuVJE8AACAPw7+LL0AAEBAAAAMRAAAUkTfIJo9j9ATPV6HwjsAAEBAAABAQGkbwLxTvL89qCnKPgAAokKi8ZM9SIGAQwAAgD8Yjq4+X+gPvFhdt70AAABAVVz/vc2s4UMAwAFE+s58vZs7eDzNTJ9DLzNLvYitujwJKwI+PZfFvQAAzEMAAIA/7Xz4vU/Nnj36pI29/daUPWN24bwAABBCAACLQwAAVUOoKco+iAq4PbU/vb1tA7692iD3upPe0T0DFTS8AIDTQwAAgD8AAIA/AACKQwAAPkMAgIxDrzzEPQCgp0N5eAU9TGWPvYGeHb0AAIA/SKGiQwAAtEMAAHBBAACWQ2Afpb2TC6i7M3OQQ3U8/7zT6HK8z1RzPY6lODtnlGG9AACSQwCANkQKJOK8NPsuPQAAC0NmZjBEXSucPcNUhjz1N7w9AAD4Q2ZmlUOj6IU91+xivLewhb1ZZ7Y8xmcuOwCAmUOaCQlEAACAP/1y+Lx2xMC9AAD8QpqUvTwf0cM9AACAP9ixAD4jtiq9YilDPQAAEUOaGY9DAIBlQxSubkMzM7JDl056vbj+tUMzM7JDAACAPwAAgD8XU+Q9AycoO4iy2r3Gso+8ZuboQ3GPk727au48vo8cvTUnNzu7Vqu8m06lul9+TTvNM/w8Fq+Gvctduj02isa7t2G7vHfplb3TkOO8mmEsPW7NlDwjWq09ZYQeu1VTuD0Ft+k9uLM3PI+vd7zPO/g9hbCTvNkIRj3faZA9S9fTvQ4Arr3rQMS643/FPV4iwTxFv+O80W2cPfk/M7uUWq69S0G8PfS7NDza7TA98+VpvRdJwjuhM4o9/70CvlNAtrg9MjS9I8oqPRKQcDtrEIU94eacvS9KvTywCpg92vJ/vFLyfT05EC+7Z1ZSu6Ka570HqcI9d8dcPBJbi7214t88w8cOPZ3BZr1A+8W8OvZgPeo57zsJSZE9+w/pvApv9DxTGpG9eKIYPJuH5r0iQ568UhEYvQr4SD3oHZC9duGjOvvDJT2fhom9WGtlPZcXnLtC/ok8LBKvPTe1Dz04Xwq8LbS5PYiztb0jYlE9W9LYO40/tD2Nrsg8qKQAPl/kUL3asmO99Zr2uw1Jxbw483c90sU3PQ9eArzRewi8yLLOPUQ9ob2BUKW8hGQNPYdu1rz8tzC80xmBPQpXq0IAAEZFCtcjPgCAAkUAAFtFAABAQAAAEEEAAOdEAAAQQRiOrj4AAGRFAACAPwAAIEEAAJxDptwevQAAw0QAAIA/AAAAQQAAQEEAAOBAAIBKRQAAlEIAAKpCaTSYvQAAuEI3y9I+MzMFQwAAcEMAAHBEAABAQAAAzESXPag+AACgQgAAB0UAgDtFAACgQgAAmUIAAABBAABAQAAA4EBcj6dCAACAQAAAAECamZxCAECVRRiOrj4AAMBCY9+uveNfOTwI5no9+InIvMp6JT0kXoq95+6sPW7lwbwAAEBCAABAQgAAgD8AAOBAAAAAQWgT0D4AABhC0wudvQAAgD8AAMBAAACZQgAAlEIzM3tCGI6uPgAAGUUAgBpFAACAP3+0zbsAAABBD4pLvAAAAEByaX49AABAQM2jsjsYBJC8AABhRVjnWz0tN3O9AIBxRQAAwEC9gZy9Jfy4PgAAsUIAgAJFqCnKPpqZwEJoE9A+AABkRAAAgD9oE9A+Jfy4PgAAeEIAAIA/AADhRAAA9kQAADBBAAB4QgAAoEAAAPBEAADzRAAAQEBQLba8AAATRRiOrj4AgC9FAACAPyX8uD7RnxM+AAAwQQCADkV3M489+xC+vQAACkUAAIA/KCnsPey4vrwTez89+3VGPlDfdLy6FK+9OVbLvCX8uD7TVza8aBPQPiX8uD4AAOBAAAB4QgAAeUUAQJ5FAACAPwBAmEUAwJ9FAAAwQQAAIkUAAL1EAABhRQAAvkIAAORDAADgQAAANEUAAJxDAAAYQqgpyj4AAGpEAABAQCivoT0AAIA/AACgQgAAwEAAAABBPj6tvagpyj4AAOFEAADPRAAA3kQl/Lg+AACgQAFotb2VhD89PvoYPAAAMEK6leO9N8vSPoCZFD1XfmY9AACgQAAAhUIAAEBAMu7pPI8Szj2XPag+lz2oPgAAGUUAAABBAADAQAAAgD8AAKpCAACgQFR5rD21i2G9AIAIRZc9qD4b/1a8AIAURc+9Cb2i3te9/ba2PQAAbEJcu728r722vQAAAECWPhu9zKUbPotejj2fS8o9lz2oPgAAQELFlPe9AACAPwAAlEIAAEBAAAAAQABAkkUAAOBA92SSPDv8u7sDwUK9c0oFvAAAAECrD9k9AADAQwAAikUAAABAAAAgQQAAgD8AgIVFlz2oPgAA5EMAAABAAACAQBiOrj4AAIA/AADSQgAAz0IAAJBDAACKRAAAAEAAAFhDAACQQmgT0D4AAJRCJfy4PgAAAEFKeq09lz2oPgAAwEAAABBBAACFQgAA2EMAAMBAAACAQAAAAEH0vrW9AABAQRdzyryamZxCaBPQPgAA5ESNx7C9AACQQgAAAEAl/Lg+T+cJPvB0ZL3PhYE9MNRUvQAA4EA227w8QJbmuy97s72RKRQ9AAAgQRsWar2jYoU85U9bvAAA9kSxpgG+tXTkvACAMkUAAIA/AAAAQQCAPkUAgDJFtyaMO2gT0D5oE9A+AACCQouB4zwAAChFJfy4PgAADUUAgC9FAAAAQQAAE0XvxaY8AIAURZxIBj4AAIxCAAAiRQjR070AABBB9/byvXDzN71fnQE9AIBoRdibrD0AAIA/hh4JvAAAAEEAwJlFq2qMPCPl7z3t61g9fywNvfDS270AABBBS7BXvZc9qD50oYM9AAB8RAAAAECXPag+SEbxvQAAz0UAAMBAAAB2RAAAxkQAANhEAACgQGgT0D4AAIA/AACgQACAAkUAAIA/AADgQJc9qD4AAABBAAAgQQAAAEAAAABAAABAQAAAhERoE9A+AAAwQQAAAEAAAC5FAACgQAAAjUXlDXC8aFp/PXiRc73dr3Q8TOS7PeZcHLlouVq9e6gaPUJv+zyQReS8ROEWPQXmXrspvIU8ME/xPWIzgz2RyBa9DLUhu5RkSjzAUNE5fwZ1vZFpPLwKmHc9BoUPvWu1Nby2+JI9p3+yvCuDtDzqX0e9koLiPWi4ATyN9Zc9gCcDPudCmz1tkFe9nendPbAYszsJ/b49n50hvM+eTTx31vS9VmILvpmyODxN9Zs9g9THvLukKD2hT7W8P1oAvjYtsDyERrG8zOG6vYvDvb1UUgy8FXwGPrvXXTzcWAs92BLnvXLr5r0HdL885Q7YvN2N5r0N5448XevNvaq3qzxYJuA9u9uKPT2fJr2aTNG9XpQZPu3RTr39iOC9ejrYvdN94rxLkba9K4L5PXUDrD0zQJS9GKcEPiM/przzCfk9J0AdPbroHr2xQkw9i1jRvXPuXz33uwQ+yMZZvGfdVT1kqS083bCzvc8miDtCHpA8fTFyvZ901z2bDC08bwnQvNUNzDudst07XA+GvQ0NjD0w8H+9oMDGvCXrBT5XxKm97/MhPNj6pb3g56Q9UXKMPcqHNT5/uvk9twScPJjMgL0d7uo8WjgHPZBmYb2pPhM+RxyCPahkyL2/PeU8Y9MgvcUtB75fcZS9MQKBPdWhzD0QGLM8pLKEPU3h4rzN+1e8MCb0vdfgmbsTZaI9e+CJPUWtQr2SPFi8Gq70vV4GIj0L4229O5yjvQvpEjwO5rU8q5fmPVMqrb1KAGg8S72yvTewAjzijXY9+asDPkgBBj09Eve9kIbIve6cGbz8EMW9h5BuvHObTTqjfrO82JuUPQf1RLq5N6s74i7nupqZQEMAAD1DAABIQwAAoEAAAMBAAAAAQAAAoEAAAOFFZuY0QwAAgD8AADBBAABeRAAAQEAAAIBAAEArRACAi0UAQONFAIAvQwAAgEAAAMBAAICLRQAAgD8AAABAAAD8QwAApUQAAJlEAABGRAAAUkMAAFVDAAAKRAAAoEAAwIFFAAAZQwAAEEEAAIBA9qgqQwDAw0UAgEdFAADzRAAAQEAAAIA/AABARL1S2z0AwMlFAACAPwAA5EQAAJNEiqNhPQAAgD9g5Pc9c40VvQAAAEAAANtEAADgQAAAMEEAAEtDAACgQAAASUMAAGZDAACAPwAAgD8AAPBDAIA7RQBAgEUAAIdFAADgQAAAAEEQSNo9y4XmPAAA/EIAADBBAAAoQwAAOkQAwIFFPV/wPQAAQECiUBU+AADgQACAL0UAAABAAAA+Q/dy6L2WxBo9AACgQAAAAEAAQJJFyuUIvgCACEUAAChEMjdQPlr+TT0AAApEAACAP3w6vL0AAEBAv1cEvYiNBL58azU9sq7PvQAAQEMAAEBBAADgQAAAgD8AgGhFAECSRQBAg0UAAABBAAB5RQAATEMAwIFFMzOOQwAAAEB7VJpDAACAQDMzHEQAgEpEAIAIRQDAZEQAAEBAAADzRAAAgD8AAABBAAAAQQAAgD8AAEBBAACAQAAANEMAAPBBAOAjRgAAoEDf6pU9AAAiRQBAnkUAAFhDAACBRACASkUAACBBAADAQMAZ5D2GdA2+AACAPwAAgD8AAIA/AAClRAAA7UQAAKBAAAAoQwAAnEPi+vk9pGcRvZA+270AAD5DAAAgQQAAWEMAAD5DpeelPQDAw0WduSW9ByBFPgHEkr0AAMNEH4BlPCWfNr0AAKBAAACgQAAAAEAAALRDAICpRQCAo0UAgEFFAABwRAAAvUQAAMBAAICFRTUZ3b0AAG1FZmZdQwAAAEAAAAREAADAQAAA4EAAAABBAADgQAAAQEBmZl1DAACAPwAAh0UAAMBAAADAQwAAqEMAAEBBAACAQAAAIEQAABhEAADgQJVwmL0AAIBAAACAQACAcUUAgEpEAECSRAAAEEEAwGREAADSRAAAE0VrzcW9DySlPAAAHUMAABBBAICIRQAAgD8AAKBAAADhQjMzBUMzMwVDAECYRQAAgD8AADBBZuY0QwAAgD8AACBBAAAAQAAAgD+IU349AADgQAAACkUAgClFAAA6RB2Pmr0AAIA/zufAvRBf1z0AAIBAAADwQwAAgEAAAIdF6/q8PGVwrb0AAIA/AAAgQVKFvr1mh609AAA6QwAAnEUAAJBFAABGRHMHBj6rud68H5ELvgAAgD8ziCI9/1LfO5Vt/j3sZTG9MFcUPQAAk0QAAEBDuh/cPQJ6Fz2yF+U9AAAgQRom5Ty33zI+AAB2RXvYlz3LMb68AACAQGN9zbpLRHG9AABGQwAAgD8AAEBAAADAQXq2ID5TFYq9AACAQAAA4UUAAABAAABGQwAAt0Qv77O9r0gMvfu2170AAIA/AIApRQBA40XrBds9AACQRN0s1j0AAGpFAACAPwAAAEAAAIA/AADMRAAAgkMAQJJEAMDDRQAA7UQAAABAAADAQDPQbr0AACVFipEAPgAAT0MAAEBAAAAQQwAAgUQAwMlFAACNRQAAjEMAgIJDAAD5RAAAEEH9/7m8AACAPwAA4EAAAIA/AACMQ2ZmjEMAACBE3uKMPQAAwEAAAM9DAIDxRQAAAEEAAFJDAABwRAAAgEAAAEZFjwWNPX59Or0AAEBAA62EPAAAOkUAAIBAAAD8RAAAAEEAAMBAAADAQAAA4EAAACBBAADAQABAkkQAAMZEAAA0QwAAgEDNzMdCAACAPwAAoED9sXa9M7MaQ//q2r0AABFDAADwQQAAHUMAAEBAZuYTQwAAAEAAQJhFAMDMRQAAMEGos1E8jc7gPQAAIEPNTDFD+O/xPDOzGkP2qCpDAMC6RdonBD4AAEBApDgtPBAKdb1c/709AEAtRgAAgD/NTDFDlaJRu7c3Q73tyOa9AAAQQQAAB0VcDwlDAADgQAAAIkMAAIRDAABwRJs4fr1dWx89Zd/ZvQAAgEDNTDFDAABeREVqHz4AAIA/ZGQJvVeOD76dRSi9AABYRAAAnEMvpUm9oPULvafAZj2k7rC9ClWgvJqZN0Nua0K9Z3upvZ1V6ruT+kM7n9X5vU5mo70AAAFFAACAPwAAWEQAAKBArkgbvQAAsUQ7jo29TxR5PXOETjwAALRDhTflPN9CrTzCdYa9X1VUvZcRSD2Db/U7AABAQAAAgD8AAENFAACAPwAAgD8AAIBAAABGQwDAt0UAAIA/TWdSvefkjz0AAJxEAACEQwAAEEEAADRFsw3WvUcy5LwAAHxEAABPQwCAPkUAAIA/AABzQ0iBgEMSH2k92OzBvQCABkQAAI1FAABzQwCALEUAAIA/AICCQwAAzEMAABBBAMC6RQDAzEUAAExEwsvQvQAABEWWJQ6+AACAP5UG5z1zXnG9AABeRQAA0kQAgLVFAACAPwAAXkQAAKBAAADgQAAAgD8AAPBEAECYRQCA8UUnSF49AABhQwAAAEEAAMBASIGAQwAAWEQAAEBAAAAKRQAA7UUAAEBAO2YdPa4XFz4AAFhDAIAGRAAAhEMAgIVDAACEQwAAwEAAAMBAAADAQAAAAEBntSU9AAB8Rc1Mn0Pn8rC6zCaCPQBAp0UAAKBAAADAQAAA20QAAElDAACAQLNor7w7F6K9jPECu3Vg7z0AANtEAAAgRAAAAEBk3ws+AAAfRccCxr2jhJq84VrLPQAAukQAAD1EAACAPwAAW0QAAIA/AIAIRQAArkQAAKVEAMC6RQAARkUAQIBFKrrHPAAAgEAAAIBAAABeRQAAgD+hL4m6U/scvcJwkzyyQ789ZkgUvM2SfL1DLLK8wB/gO7KDaz0xGQM+2WufPR3pTb3trlo9TYZtvZMBb72ZMBE9aT+JPdXyiL2oaVE9kNLdPSMsMj3z1s09/0aqPFNhzD3HTla96EAEPR+6Rj3b2X+9IzEWvc2HzzzAVuy9F4rBu7gN5D1TUZG8OaKXvQwiLz13/AM9LWjQvQJH272K+va8C0uRPQkUNb0z/La9BOqSvC/GRr3Ah1g9audsvQ9Jnzx2hZo84UC6PXxSOT1yXiu9LyxhOy2qxL3pFx89bQDPvIv6l701fBa8N4xvuVtTSL2O3I09LHlHvWuBNj64IGI9BsCtu27cx734UGC82VLIPRbRir05mJ88S/+4PQtSSL31znA87PuSPYu+h7xros09ENpovBJxkD1M4hA+ehW6OtPao7zL2as9DevfvYeRHb2BIaA9g7GNvUNGgr0rjsI8FGQEPT++ZT7c/8S9sATGvDETqr0w4yM7JVEnvZ0Jrjyq2O07TyMDPrhXrb13Zm091xi0vRkmjbwOXEs9x3/vvNgg4L3Qtyq9n9NvPX/n1LxvJ8a8ez7bPW4xh72BMiw+rvwBvrkItbxPZnM9Q1+6vaoZCb3kLhk+MO+9vQBHk7tUmYA7e7UUvfCd3T0bnPm84VpFPAaBCr4cwKa9M2nzPHDwLT0XqIy8i5XTPYeyRj0bB8o9a3odvduHhD2cZDo77RxAvfd4oTvH5rw9WKzku/VbgbpaFte8Xeb0vcLADr0Kk3Q7X7p/PdL2Tb2GiYW7hehQvPfdBj4Sr4s7ZMi9vS+PIz0IYNI5T6BKPc3kuby6m0c98uaWvYOapj2JyyO9/0MuPZSnwbwqPco8yLfovZ9ThLwP5ao9Kb7BvG2FyL0xv5S9PxuHPJcbHj4jjzq9a9NSPRjv/T3LlJ69qrTtPU7mOLzgvsa9C/gwPKwdRT3YrPs9VOciPN2KOTrGJKW9eIUlvdViVD22WjQ9l98fvP2Klz3h0hs8CGrSu9efob1fVpa987YOPS14fr0aJdQ7qNgcPTvfo71B0As+4w0YPT30cr0L1089vXZ8u3eXor2ilv280xP4PQq33j13EYY77/qmvdJx0jz5x567uSqJvfgiNL3TmuA8wwoovYIPqL2IwhO8AJ8evX/n3bzcBK89R/4IPNHGEr76Bnw9v6DJvI0gAj2CZIu9ZM8YuzFmDz1uyKU7/cLgPVUOTTxzacS9S2usPRq9UrtHjF+9VwZAPZSFQbzGXME9OFBlvX/3EbuP6Cq9I2oEPclHvL1EITY7eIaYPYNAmjyI0xy9QNBMPSMlMjx79a69xQbVvM64lT2NN029t82OPUT/Bz5mTgw95qwBPN5/xL2ylX09iNDgvF3nrL3Dnog95wTgvW8bM72kozk9e6MKvQDgBUYAAJ9EAAAAQACANkQAAKJEAACAP5qZUkMAAJZEAAA0RGgT0D4AgKxDt+x9vWgT0D4AAB1DAAAgRDMzHEQAAABAAABDRAAARkRm5qRDmpnkQgAAnEO4/rVDqCnKPgAAIkMAAIA/ytKgPSX8uD4AoAlGzcwRRAAAWEQAAJxEAACcRDfL0j43y9I+AICHRAAAQEAAAElDGI6uPg8fCD0AACBEZmaVQwCAnUMAAABAAACoRFM247s2XkI912NWu3DaW70AAKBAAAAwQgBALUYAoAlGAABSRACAFEYAAAxEAAD8QwAACkQAAHZEAACAPwAADUM3y9I+Jfy4PgAAgD8AAIA/AAAoRDMDfkQAAKBAAAA6RAAAk0QAwGREXA8JQ5qZUkMAAIA/AACAPwAAgD+tQis9AACEQwAAgD8AAEBAAIChQwCAYkUAAIA/Zqb7Q2ZmwkOamdtCL1mmPQAAgD8AAIA/036tvQBgaLwAAIA/AACAPy/6CT51iWW8OhqAvbSyMD2aCQlEAACAQAAA5EM3y9I+AACAPwAAgD8AAIBAAEArRApXq0IAAJlEAIChQnaoOz4AgDJDzUyfQwCAoUMAABlDAABwQwAAtEOHpqw9Nw0yvQDAZEQAAIA/AABYQwAAzENSLfS9AABAQHpuJT3iijq9AACQRAAAnEQAAIBAAECSRAAAgD8AAABAxbsBPgAAQEAb+3A9kw2rvc3sI0RmpvtDAAAAQAAAQEAAAH9DAACMQwCAo0UAAHZFN8vSPgAAgD8AAABAAABtRQAAwEAAAIA/qCnKPjfL0j4AAIA/AACgRAAAgD8AwMNDAABAQAAA/EKilRS9v/ERPTBbHjzLsVm9AACSQ7FhCzw3y9I+AOAjRgAAgD8AAIBAAABAQAAAqEMAAIA/zzHGPRiOrj4AAIA/AACAPwAA2EMAACBEAABAQGZmMEQAAIA/AABAQAAAoEBFSM29MzMFQ6uDAz46Mum7AzDGPesxRL0AAAdDZmaMQwAAEUMAgNNDAAAWQ2amDkTNzMdCAACgQFilB70AAABAAABAQ0TkST2oKco+AAAQRMf9yrsAAIA/M08LvQcl4b0H5W097BFCvQAAQERU+oy9AAA9RAAAgD8AgEpEJfy4PgAAcEQAAIREAACAQAAAgEAAAGBCAADAQEP6Dr16lMa9AABAQM3s3T0AAMZDMCusvGamu0OwjpG9Z4OzvAAAUkOrnQS+R9UFvQAAAEAAwIRFAAAAQAAAAEAAAIA/AICpRQAAZEUAAJxFAACAPwCAQUV7qKY9AACKRQAAoEMAABBFAACAQKgpyj4AAIA/vQtqvUPv470AAIA/AIBHRQCAKUUAAB9FMzOyQ16jy70AIN9DAADAQOqpS70AAEBAAIC9QwAAQEAAAKBA6Cw6PBZWpL26IaE9AEAtRmdWpb2lqNa8mhmPQ/KT97wAAJxDaBPQPgAA3EMAAAtDGI6uPuVqEL4AAAREAAB8RANFlr1oE9A+AAAYRCX8uD4AABxEAACERHM7Er0AADpEAABAQAAAEEMAAChEAACgQFW2iDsAAChEAACgQKgpyj6d/eO98m5xPFXsVL06O609AACQRAAAQEAAAIA/k3W2vQOdkz0AAHNDAACZQmbmE0NoE9A+AABAQAAArkIAAGpDAACAPzO5Rb0AANZCVc7XvQAAgD/P9p+9mpmcQnN8m70AAHNDAABAQKLR/LwIYO29IxcKPWuarr0AAEBAAABwQwAAqEMAAEBAAICHRAAAAEDYgRM93UIpvQAAQEAAAIA/HBExPIcSXT2ykmw7UyDGvVGkjz0GeSW9AACAP5K0Ar4AAGREqCnKPgAAcETKg2u9YnjTvQAAoEA/bQ8965yrvQAAgD8AAIA/AACAP9O3tb3avce8L17wvRRkl73j32w9ZdjVvQBgrkMAAPhCAADAQkiBgEMAwJ9FAACHQwAAhkMAAMBAAAANRQAA+UQAgCxFwpb/PQ3wRzsAAC5FM3OWQzfL0j4AwNhFGI6uPgAALkUAAIA/AECYRfe4m7xfk6S9AIApRYOU1z0AANtEzUyfQwAAgD8AgFNFAAAAQACAqUV7o5g8AADGRFxOAb0iN289AAA3RRiOrj4AYK5DAAA0RQAAgD8AgClFAICLRQCAKUUAgL1DGI6uPgAA/0MLdq28zUy6QwAAgEAAAMZEAAD8RAAANEUAAC5FGI6uPgCABkQAAIA/AACAP6tCtz0AgBRGOPuEvbgpE7vfx5e8nh06PBv/wTpfyXo8uKLbu6OMtDo6odc8GpsWvQVxVjwzHmI90xgQPm8bjbwI7ne7H98tPW35oL3b9xW8oaqDPYANfLxja4k9oZsyvX/Pyb0HFpC86wOoPYeuFrwPdR0+vl7AO/s/xj1HJ2i7k54UPf8rwLxcRrS9SCLIPMsB8T23cWY9eDpjPMMqer2VHfQ9r0a5vNA9073wN+a7mIp8vCpl0D1r5jI8rMkePj/ymb0E5ZE8O6Q5Pbxnwbx+Exk+q7qZPbVO9Ly/2w49v7+JPc9YrbxoipK9AyVwPaoTvr2Ae6C8qPLTPNts8T1YJnu9ExLEPLP+UD1L9pk7yisevS+fPz3qAkM7vYWYPR/rYr0DMcQ9+2iRPX5zTLw0+xI9mMCRvVOU/LzdfCA9bZDZvDppxb1/zl+7d9KZPdLQ0TzvTxo+uBu5vcMmizsTT9u8UD9RPHBsLT1fxa29W668OzjU872fneo9j6ZaO7AV8rz+eQU+i4eTPZs41ryofR89MhHxPSfUyLqIIz481AQTvebGkjxU1DK7dZekvb8aJjuHcaC8ZynCuymJrjqQPFk9rzaivFt2zj0ajqY80/2sPRLRzbvDcl290Di4vHPukr2p9jk8meQEPe+SLLsLS0k8CrIcvoAlQL3TSjw9xwwbPSsYO7xKa/E911KkO+b1rr340uw8lHCBPQ0J5Lw+goa8Mr30vfeu47ufb5+9YCfTvY2vVzo9N1M95+BZvQRVoDwXN7W9wOLCu7Nqgz1vyou9DiEGu1YDir3s4Re8nnaWPO6Oqb1yBl45AmC1PYsKEDlSgE29GOn/PKJp6T26myu8/ST7vSuOVD0vH5m5edihvY8Uvj07rci9jaFLPW+0tr25kxg7DywKProAVDy3O8m9ymMQvZhqzLu6M1G9luwxvZPKvD0q+s+9EATNu0ceFj6Ubpg94mulvaCv1rwam1g9c7G/vHdX6j3TRi88rfSPPONwWr2JQoI8gVe0PaOj5zyusEC9/2++u4HWQTvntAc8EkHGvaf0iztTNzo9GJZkum6NLb3vyre8MwX2PAAA8EIAAEBAAACAPwAgikOamdtCAECARbdt2z4AAENDAACAQAAAAEEAAMZDWFXFvfonmT0AgKxDZmbCQwAAB0MAgHhDzazhQ3tUmkMAAABAAAAMQgAAUkNmpvtDAIChQ7j+tUMAAMxDZSAVvQAAAENm5hNDAAAAQACAgkMAAIA/zcwRRAAAgD9mprtDZ6pwvQAAMEEAABBBAACAQAAAgEBmZl1DAACAPwAgBERmZpVDAIB0RQAAgD/NTLpDAAAAQP2coj0AAM9CMzMFQwAA4ED2qCpDHq+lvQAAwEIAAIA/AADAQrtNPj4AAMpDz7+MvcxHCD0AAJRDAACSQwAAsEMAAJBCAAAAQQAAAEAAAKBAAABAQgAAQEAAADBCAADAQQAAAEMAAIBAAABwQyoQyb0AAIBAy7aRPQAAQECamUBDAACAQAAAAEAAAHxFAACgQAAA3kQAAIA/AAAAQGUCJL2Hhik9AACqQgAAwEEYjq4+SLG1uwAAAEAAABFDAADAQgAAwEAAAFxD5biavSDrGz5yJC+8TlWwvQUI/TwAAJZD4Dy+PUc2aLzQChM+R7EePdqthb0AAABB52muvQAA4EAAAABBAADgQAAAgD8doaS8AACAPwAAQEKhlrK7w7RRvM0Vc70AANJCAADPQgAAkEIAAM9CAAD4QgAAPkMAAMBCAAARQ1XWf70AAKBAAACgQAAAwEJGSBG7AACAP5HkLz0AAEBCAAA9QwAAoEAAAIA/AADAQAAAgEAYjq4+AACAQAAAqkMAALRDAADAQAAAZEQAAABAAECYRQAAN0UAAIBAM7O/QwCAoUIAAIA/AAAgQQAAAEEAAMBA8mepvS9EUrwAAABAAADAQZN/zz0AAB1Dc9ZnPc1MMUMAAEBCAABAQAAAQEKaVwA9Hxu6vEi5Gz0AAKpDAAAAQAAAgD+9bpu9AADzQwAAwEIAAEBCAADAQAAAQEIPOZi9gwUouwAAgD+nqd49AADAQAAAwEEAAMBC0VwgPTEkoL1vO+e7AADEQgAAAEF3sus9AAAAQQAAAEEAAABAAACgQAAAEEEAAKBAAACgQAAAAEAvHXi7jCu/vQAAgD/NzH1DSKGiQw+PhL1I7+a7AAAQQQAAQEBoE9A+AADAQAAAgEAAAApEAAAAQAAAQEAAANtEAABDRWbmpEMAADRFAKCnQwAAqkMmmcE9K3WUvAAAAEAAAM9FAABwQwAAgEAAAHBEAADgQAAAEEQAAKVEAACAQDfL0j6oKco+aBPQPhiOrj4AALhDAAC6RAAA+EMAAMNEZmbCQwAAwEIAAIBAAACAPwAAwEEAAABAAADqQgAA1kKameRCqaGGvRK4RLqDXzo+AAANQwAAC0MAAJBCAACAQAAA4ECyQpY8AAAAQAAANEMAAIA/AACgQDRHnTwYjq4+AACQQj24nr2lhO88ksb2PDrFBz4AABBBZqb7QwAAIEEzMxxEAACAP4NQqb1nLq29o6Y7uwAAIEEAACBBe/6ivQAAgD+/5RE9ESEcPAAAgD8AAABAr4EAPlSJqzwjYJ29sjVbvAAAwEIAACBBdNiGvJlBob0AAMBAAIAyQwAAwEDNzPRCzXrhPRbgrbwAABBBDsfGvb9/Tz3oJXi9AADAQjMzBUP2qCpDAAAWQwuvLT4AABBBe+rAO3LnHL0AAIBAZuakQwAAgD/7mx68EOUzvW7vmj2T4a+9PVnjuwAAAEAAACBDAADtRAAA4EAAAKtEAMCERQAAqEMAACJFAICdQwAAqEMAAKhEAAANRQAAdkQAAJZDAACWQwBAp0V6z1m9AACqQwAAakQlfhA9AAD8RAAAAEAAAIA/AABGRagpyj6oKco+AICORQAAIEHkJKO9AMCBRUvWKL0AgHFFQ0eePQAAsEMAAABAAAAAQAAA8EMAADBBAACAQABgrkMAAIA/zmIkOQCAMkUAAG1FAAD8RAAAuENf0fW98sfXvAAAWEQAAFhDAMCBRQCAdEUAABZEAADtRAAAgEBmZjBEAACKRAAAoEAAAEZEAMDDQyKc5rtA0Bo9OQEoPuuZWj33Kzi9mGOxvYS1yT3f0gO9Snq1unM9pr0nrKa8OueJPVUTrD1rRX28azQ+Pl5BEj2N6wc+3VZtvZnTArwwGYq9TqW0Pat6ZL0TDO27kSW3vQUKOz1nMUm9MFmdvXB6kryS8hk+GydMPYuGMb03o1A9b+jaPK+Ppr0bnNA7X2qDvdgltz3zr4A86wShPY8uijyqZN88JlaCvUgh2T3CzO28N9qMvfUG9LtG/Tq8HTFRPc2iPbsQB2e9K1prPTM2WTzVTXy8wHbfPM8C4bypYrc8HO2/PejLCL1GxMQ8jIWLvX11Ez4Dfo+8qpA5Oo5VnL3wbNM9OyAIvZ3UPr1gCSg9mXi1PO8wnr1UGEy93qUiPTcu0z3loHu9FJkYPVtPKL0/9gO91SWTvSdInb0ihGm7eomEPUsPA7xrNlO9yrh5PV8UNb0rpnK7VdEAPqjbjzzvvqS75lVJO8XUELujwYS8J08mO+VVuT2THFK9wh3vPFioaDvXMxm8NmaYOYudzzxr0ii7KLMyPa07/bx+2Za7AeXHPRAdaLsuz4A9n0xwvc0w+Dvpjrc915eSvc1AIz3IcYo7k213vfBd9Lyo62U9qKWgPQsAWDw3wnu9D12qPDeswT0VlJK8wxVkvfDi1r1dOfA80Gt6vZuDzb2fY468ElAcvbU8izzvTys9lDsuvcgXnLwHigQ+83MSO0DuA72GECy9VAnGPRgAAj36wfO9e+e+PEt/3T3V/fg98hdivf+MgrwIFdy98M3VPafE/TywXHq94bilPEf4ErxJ7Ma9qoSOPQNu6rsoWtG8SejLvYB1fD1GsSa9QqVgPBHgwj2/+eG7Cp2hPMWGCjttC6C9c2vIPAFpu7zvK0S8fKStvchjJr3rBpU9A2+nPdPIJr1oJcC9tUdrPVBrVD4tyEs8vQcfPUPLQLyimrw9JHoWPZs6kT1SHv28EAflvXnjFrxL6g88Q3vZPRqa/zs6K0+9ZwtwPO8LZb3XKw89lrQXudObXj4AAEBCAACNRAAAgD8AAIxCAABARJqZmT4AAIBAAACAPwAAQEIAAIA/AAA9Q1XgQr3I/Iw8P2KpPQAAAEEAAJxFAADAQAAAwEEYjq4+AAANRQAAkEIAABBDAAAAQN2PZz0l/Lg+AMCERQAAAEFbKZ89CB61vZXF07wYjq4+KK+hPQAAAEAAAIA/AADhRDMze0IAAApFAACAPwAAuEIAAEBAAACAPwAAQEIAwIRFAACAPwAAYUVoE9A+AIAyRQAAQEE586a8AACgQAAAQEAAAORDAACAQAAAwEEAAHBCAACAPwAAw0QAgAJFAADAQAAAMEEAAIFEAECARdXSmr0AAABAAACZQgAAgD81IbC9AAAQQQAAMEJjuuE8AAAAQQAAQEAAAMNEAADAQAAA8EIAAKBAAAAwQQAAgD8AABhCAMDGRQAAXkQAAIA/AAC3RMgGYr0AAIA/4TKvPQAAgD8AAIBAwpobuyj+BT1l79c9AAAgQU/oj733JSg9AACAQAAAAEBoE9A+2hJjvQAAjUQAAMBAAAD8RLoI+L0AAIA/AACAPyX8uD4AAIA/AAAwQQAAq0Tijru9AICIRQAAxEIAAJRCZcN0OuqDmr0AAIA/mpnAQjfL0j5qhMQ8iFVBvMQQn703yMs83CFFvQAAoECfC+K8AAAAQAAA7UQAAIpFAAAgQQAAAEEAADpFAABYQwAApUQAAABBAADAQAAAgD9TGL+9SxTXPRz1Pzy/Zoi9Td/nPAAAKEQYjq4+dlcsvbN2HD0AAAREcpJTvJkJHL0AAIBAvtGBvShsGj3L+6y9+t+TvAXHX73AnJQ9AABgQgAAQEEAAIA/AACAP7MQ2D2F1Yg7AAB8RAAAWEIAAIA/AADPRAAAgD+ry9Q8AIAXRQCAi0UAgC9FrdTmvAAAoEA3y9I+AAAAQAAAOkUAAABAkhZ9vT2+4T0AAOBAyoizPQAAgEA3y9I+AAAZQwAAgD8AAMBAAADAQcPC17yO8A89mplAQ5qZQEN0riQ7u7qrPAAAwEIAAIdEAACiRAAAQEAAAFtFS0GBvQAAkEUAQJJFAIDBRQAAAEAAAABAAADDRAAAz0UAAIBAAACZRAAAMEHT2jg+AACEQwAAwEAAALpEAACAP1vmd72LQGk9K9WYvd1gQD2DQv+92y07vX0U17kNUX894x+qPW1RZzoAAIA/6xEUPQAAoEARyak9Fx5BPT9wCb08KYu9cYBEvDMze0IAAEBAAABAQAAAQEAzM3tCAADbRAAAbEIAAKBAhIzGvQAAgD8AAIA/AADtRQCAaEVqo2O9AABsQoigTDwAAENFazGTPAAAgD8T86Q9j8uFu9ji+z0icts9AACAPwAAHEQAABxEv0z+PUotw72DbhY9qFovvQAAZEQAABBDzczHQgAAIkMAAABBAABYRBiOrj4AAIBAqpBQvAAAAED/m5C9kX8XvGAYjr2+zoC844doPHN+hT1Pbm69T/CTPSfa9TsmIJW80+GNPUYevLuFQJ86h1pXPcGkvz2bRp48q3fYvSXPT72QK1m9DooAPcDVLr19Mtc8Pb+LPaB03bwDSR690q3uvUbNCjzimVa9XG+8PadWA70LcI69gv9dvF7igD2Ioeu8gxzXPG4LQLy+Qpg9geiUvaLAYjndL5i9B8KcPHvJ1z0NPWu9E6RDu6uNJT2TCY+9xmIGvAUr+rxejRM+Ebm+vJQsnL3vKZE9eOJAvT2gub13yAC+AhjQvI/4/7za5MA9u2I5O0HLwz0oYeU8Fqk/vbrVxTzoRFq9PzTLPYC9vL351ay97y8cPXtInjxvQx0+d8MMPW7rwz3fPb09m7e7PF47A72nOBc9OXK1vVmJs7xLq6A98lFdvc1CLr33kVk9M1uJPHpEiT2n+pI9Nc6WvcDo+73nDQy98GuyPVNihjt3TCM8SyKEPXgSPTyWOkG9wiSDO+PojDnYvqO86tBfOmYFPT7dmEA9ZmaMRWYGiUUAAKBAmvmERQAAC0MAAIA/AAAwQQBAgEUAANJDmpmcQmbmNEMAAIA/M7N1QwAAEEEAAIA/mllZRQAAIEEAABBBAADgQAAAgEBoE9A+AABAQAAAjEMAAIA/AICFQwDgskXNzBFEAACAPwAANEMAAPBCAACAP5oZRUUAAOBAMzMFQwAAgD8AAMBAM1OGRTNThkVoE9A+C1UXPc8zvr0AACBBAADPQgAAFkNLbag8aBPQPgDAw0MAgJRFM3OrRRiOrj5IoaJDlz2oPmgT0D4AYKVFAACAQAAAqkIAAIA/M3OrRQAAgD8AACBCZuakQwAAlENmZmBDAAA4QgAAgEAAAABAAAAAQQAAgD9oE9A+mpmBRQCAeEM3y9I+ZuakQwAAeEIAAEBBQpipOxbmDT7NrOFDZqb7Q+e2wT2Tuok8H5obPZ8E8rx3BBC+AADgQAAAgD8AAFhDJfy4PgCA00Mzs79DMxOoRZKG/jwAAIA/AABAQACgnkVY8PU9qCnKPgAAgD8AABFDlz2oPgAASUNoE9A+MzOyQ9C71rcRAaU9AAAAQTOzv0Mzc8ZFZmbdRZqZ20Jm5hNDM3OrRQAAkkMBJ8E9AADWQs2MmEUAgKxDAACAPwAgBEQAAEBBAABAQGamO0UAADBBGI6uPhiOrj4AAKBAAABIQwAAc0UAAEBAo0aAvQCgg0WoKco+e1SaQwAAQEEAAD1DaBPQPgAAMEEAAIBAAACgQAAAQEAzU4ZFmi5HvKgpyj6amUBDtyDKPQAAAEEAAO1DRiUOPAAAPURoE9A+aBPQPgAAAEHA3Lu9AACAPwBgikUAAABBM3OWQzfL0j5m5uhDxxIEPlthGbwAAABAAACAQLj+tUOh/Z48sHtrO1u51D0AAChDMxPDRQAAgEAAAEBAAACqQgAAQEAAAA1DAACAQAAAGUNmRtNFAACAPwAAgD8AAIA/B5HRvQAAqkMzc8ZFAADgQAAA4EBmRrhFACDfQwDAZESXPag+AICHRGZmLUMAACBCAADqQs0ssEUAAIA/AACcQ2ZGuEUAYKVFZka4RWgT0D64fOS9ZuYTQ5pZ2UWN/by9Jfy4PgAAIkMAYKVFzSywRapHCD0AAIA/AAAlQ2heGD5nPPA7mpk3RQAAxEIAACJFAAAZQwAAAEDNzEdFZmZdQ2ZmlUMAAIA/AIChQwAAQ0MAAElDAABAQABAK0QAAABAzYxpRQAAEEHN+ec9SIGAQwAAoEAAAKBAZqa7Qz/jZb0NoOg74w+BvOZKEj4AAABAzcxiQ8bVAL30uLM9AACAPwAAjEOLkcK9aWSiO2ZmlUMAAFhD+tKRvSX8uD74thU9uF6YQwCAoUL/Kd+91GkEPE5qwz1sQwW+AMABRLcKBD4AAEBAICJQve2N8r1wKHm9+6VrPQAAgD8dLrI9AAAQQQvlqj166lM8AAAQQQAAgD8flD08AGCKRTfL0j4AAMhD80+xvJVA9r1mZjBE/ZCWPSX8uD4l/Lg+/bnrPX8hEbxyXKe9HQpMPYe9nL2v5/m92wGvvAAAAEAzc6tFX7QCvnwHqDz35MQ9K0ZpvP+9RzwAAABBAAB4QvGJv70AAIA/AABIQwAAC0PRe8q9AACQQgAAgD/NTNVFZxSNvbwEiT2f+yi8AAC4QwAAtEMAAIA/zUy6RQAAgD9LBiK9K5FcvUtyvj0rS9A91SEHvagpyj4AAFxDAADcQwAA+EMAAENEZoaWRQCASkTNTLpDAAAlQ2ZGuEUAALhCmrn3RWYmk0UAAMRCgJ0HPgAADEMAALhCAAD4QgAAgD+K5TM9N8vSPgAA0kMAAHBDzUy6RWgT0D7NLOZFZqagRTfL0j5mJpNFe42rPRt9rD0l/Lg+YSmgPWZmXUMAAIA/vcqrPdJPeb0l/Lg+X8q7PJ8Kv72ypNq9+sdjPONwmz1DSLi8zcz0Qjiy1b0AQDZFAAC9QgAAgEAAAMBAgKG9vQAAgD/NzBFFzcxiQwAAWEMAAD5DJfy4PgAAdEIAACVDAEBRRTMzBUMzc5ZDAICFQ5c9qD4AAIA/Jfy4PgAAKEMAAIA/AACAPwAAbEPNTHBFAABmQwAAFkOoKco+aBPQPgAAgD8AAIA/AABSRJqZgUXnK/E9AAAoQwAAgD8h2cK9AAA9RACAMkMAAIA/AGCuQwAAgD9Y7PO8z9qDPWoo8bwAAIA/Z4P4vDMzBUPNzMdCM1OGRb6gCb7zlDu9/ANDPbtbdr26XFm9xUO6PR0T9T1dCeI8kEVdvQAAAkMYjq4+AAAYRP8fVz2qk245dcLcvQAAgD8AAEhDK5hkvXVzLD0Mah4+vy6Ku3Q+lb3hR0m9sRQ8PAAAgD8AABBBea2APJW66z0AAMBAAABwRAAAgD8AAIBAAACAP0krnD1nCmc9ZmbCQwBAm0VDx9Y9XefVvD9Ppr31IyC9AICURc/boD0zQcO8HnQuPgAAVUMAAABBnIuFPX1uxLua1OE9wzSHPXF4lr3NrL1F43tiPbJf270WgTQ9AACUQwAA0kNoE9A+AABAQCX46D1/D8W5y34BvlLSNL0AAPBCAACAP6gpyj4AAGpDM3OQRQDgskVmprtFzWyORWbGj0UAAEBANe4oPA3Zob0AgAZEowwjvGaGzEUAAABBAAARQwAAPkMAQJtFGmvNPQAAeELNfBNGAAA9RLj+tUNQDZ09AACAP5qZwEKgdxm++hn7vWgT0D5mJq5FweIAPgDgskUAAIA/APABRgAAgD8Yjq4+AABcQzMTqEVm5uhDM5O1RTNzkEMPAMg9AAAAQBiOrj7bz9G9MxPDRWe1mr0AAMpDGI6uPmZG00WfpoA8/NuhvQAAgD8Yjq4+7nSmPTdSZr3e6IA9e1o6vQAADERX4e09ACCKQ6lin71POqU9PNuJuXO/8zxTHbK9ff+Du5e0LD0LdsK9QNknPZKDYTu7P9q8YM0uuLRstj1XCJ48pQKYvEi0Z71qE3G92DoPPZxgvT1ouMG5egAvvZP+Nj2EsaW9d8L1PK1cXbwMeD09cf+Ovd0Li7zU+p08PX0LvfHauD3pow08JHaSvbt1/zwnYuu8Pak4PTff1T0CVEo7ypLWvVizMbx/znW8r4FoPTYTur05RB09Tx4CPoFDkb33sT+9HGCOPA8dnrxrvz09Y3HLPVv62DuAjsg7z5uWvVvVSz2X7bq8w0i1PNGqmL3Y89s814qBulR3ND3Lpi69+2rHvEdcrL2axVY96rhxvdZ/nr0TZCc9VjCFvXJj0LxglOA9h8UAvCDF4r3GVKc9p29qvXux6r2b/448k63wPVOAS72Lf/08sdsDve/E2b1beoq6Iy4EPrWUaTwfbUK9pVggPnqZeTp5acE9hQjpPM9owbxQn889z5qdvd/yB7sjLIE9AGKWuhewPj3hx6E7I1AOvqnuK712WrS9qz41PYIgVb2Dp8s8yVe5vWJjxjkHA7u9CcTIvDp0Az0QgNe8SHUnPUzMkb3XpBQ9n1uzvcPMeT1LJ5W89Z7FvJPqoj3LNU28b12NPeBG2Dyzh5e9jqMGPIgvr73l2008/wv5PTRHsLw/mi487qo3ve8tiz1luQG9eh3xvUWYhLr71Fi9ZLgmvKLmSj0/AKI9bgCjPFYSkL16R7o7U2T5PX2Xn7xruP49323+OxBUq7yW38a9Q7usvSr+yjvfURa82b0EPVowGT2WbBQ+ueYPvSck2r2PlQa9gjoWPYi/Cr0d5oM9o2wOvI8M2T1/R3W9GGAqvN9Omz0aBPG8mZulPZOt2zvTacq9Nl8lvJrM7j1ts987pDLJPFNNnb04FIi91T0pvNIksr0nDE493fLtOyugo70Zy5C9aVOkPQI/xb38WKa8yuOdO+JmjT2+Fwu+jQr3vNDjcr0HBwA9uuNzO9ID0z1jvOK9eAWXPSN7pL1/lyw94xayPWOYtLwnPYI9ks3ovRJZC74i1BG9M+QxvaMGhTtfrKK9ac0lvCGXMLsk1ZM9DaIGPXH0Sr2TEMY9TZRzvMIBzL2V51u8uBY7vdFPNz2TEJC8O3zAvZXgpDzrbJs9HQRePRIR37wAAIA/tbQ0PgAAKEQAAIA/AADgQAAA8EOclZ89AAD5RAAAwELPqJm7AAAAQAAAEEMAAOBAQ5iyvQAAh0QAALhBAAABRQAAQEAAAEBAg83JPGC+oj0AAIA/Jfy4PqUk4bvTqK09/1ZcvQAARkUAAPNEAABwQgAAgD8AACBBM0+GvQAAgD8aPKq9AAAiRAAAAEEAAABAKK8hPgAAQEAAAKBAF8blvAAAoECoKco+N8vSPkzPjT0AAABAAAAwQQAAoEAAwNJF+APYvAAAAEA8f4G9ZbKUPAAAgD8AADBBAACAPwAAwEILXaW9AACAP1VVVT6MLjo+ZbB1PSSSybsAAIBAAAAwQQAAgD8AAABAg+ezvT07zbwAAKBAAACAPwAAwEAAAPxEAAAAQAAAAEAAAABAAIDcRSD9rz2Xcb08lFmpvQAAAD1VVVU+AAAAQDRryzoM1o69qCnKPiBIcL1KqnA8I2HfvAAAoECWbiW9Ur+OvQAAgEAAAKVEAAClRAAABEQAAI1EAACgQAAAAECgKOs9AAAwQRiOrj7ofIq6AACgQAAAEEEAAABAAACAPwAAgD8AAIA/AACAPwAABEUAgCxFAAAAQQAAE0UAgEdFAADAQACAFEaoKco+WjeYPhiOrj7A8XO8AADAQQAAgEAYjq4+KxRePSWuhj397aw7vXQLPawVMb1oE9A+AACrRAAAgD8AAABAAADAQAAAUEEAAHZEAABAQAAAQEAl/Lg+AABAQAAA4EAAAABBAACAP7tzxrw3y9I++xh5PQAAIEEAAIBAN8vSPsk4NDwAABBBAABAQAAA/ESzCS89kCX6vPsSJzzn49s9GI6uPgAAE0WoKco+AAAQRQAAAEAAAIA/AIAyRQAAEEFoE9A+AAAAQAAAgD8AAIA/AACAPx+4hT0AQPtFV4CuPQAAwEAAAEBA0waQvWcAjjxrKtY9AADAQfn7kr33FDG7UJt/uxLu7Tzpogs+oQ7qPUYfnrsdsHY7qmZSPb/QCDyR+A48q4CEvKoz2zwXcQ29QONBPNv2gLsTrrI7RkOgPbslWDm9bZw8i+LEvGeFfDwT2c69u+2vPJtU97x9cTg9pu0OPVMx8j2FD+u8phCgPJsM9TzpSL095e+hvcCRND11jAW+x3fpvF/Nm73fuxi7PQHWvA6FPj1II2C9e09MPVqrbr3bWOm9u08LPS1sZbzA8Iu9MPzzuqR0zDoVPy+97IwFPovbJrlCNFa9y0CgPRLoW7yKd+s7R1XbPfuzBrwtpFy9KriCPIN1lbwj2oW7MoDjO0snRbw8L4M9yzFZvdytJDx+oBy9HzdZvL31tDybGOs8Izn/u//0l70FnSs910fYPEgJjLy/qTO8kFV1Pc1ReT2HE2s8gl9iPZ+AULxPXW667zaaPT/Whr3Fxi68AIC7RJqZQEMAAIA/AAA9QwAASEMAAF5FAACAQAAAOkMAAMBAAABAQQAAoEAAAIBAAECVRQAAgD8AACVFAABDRQAAXkUAAPlEJfy4PgAAREMAAMBDAAAAQWZmlUMAACBBAAAERQAAgD8AAABAAAAAQQCAtUUAAF5EAABtRQCAO0UAAEBBAAAAQAAAgEAAAIBAAABkRQAA4EAAQJVFAACiRAAAgEDpRhI+N8vSPgAAUkMAAExDM7N1QwAAgEAYjq4+4X1IvQAAxkQAgD5FgPTZvQCAiEUwPfM7GJiePdunRD0AAF5FAAD8RCnRqzyRjEi8/GirPQAAgD8AgKxFAAA3RQAAoEAAAMBAMzN7QgAAkEQAAKhDGI6uPgAAgEAAAD5DAAA+QwAAgEAAgHFFAACAPwAAMEEAwIFFAMDJRQAAAEAAAABAAAAWRAAAQ0XEt7S9UE1ePQAASUMAAFVDAABJQwAAXEMAAGpDAAAKRAAAgD8AAEBByEFBPQAAQEAAAEBAEMPJvY83uz0nl9y7yiujvNOyMzzJoIo9P7qVvQAAw0QAAIBAf2cWuE/tsr0AAABBF3OUvQAANEUAAIA/AADhQgAAAEEAgEpFAEDjRQAAbEIAACpDAACAP63U1L0AABBBAACAQB4qx70AAEBARqWJvLt6Db4AAABAAAAAQAAAIkQAAEBEAAA0RQAAPkMAAEBAAACAQG8qwb2P6588AAAAQAAAAEAAgDtFAAAQQQAAgD8AAIA/AACAP2gT0D5Ti+E9AACgQAAAtEMAAIBAAACAQAAATEUAgGhFAADYRAAAgD/N7CNEAAAwQQAAhEMAAFpDZmZdQwAAz0UAACJFAADkQwDAgUMAAD1EZqYORACgp0MBKZi96FXgPXG7Mj1sESu9AACKRAAAOkS47jE9eka7vT8STztyQc89AACcRQAAtERoE9A+AABAQBiOrj4oMvs9AAAoQ2gT0D4AAPBCAAAAQJqZN0MAAKBAAACAQAAAgD8QN+W9AADAQAAAgECLn4C9nclJPXXPxr0zs1m8AACBRAAAQEH1SGQ9U8d2u9vGYT0KzmI7vjVJvAAAAEAgipW9w/GSPAAAKEMAAIA/8Ln1vSKD/z0AACVFiEfwPVDEuL28rhS8MAnwPQAAgEBRQTO9AAAQQYpWWD3gpDU+AAAoQwAAgD84fKe9AACAPwAAQEEAgLVF8874vbgW9jwAAENDAADwQwAAEEMAABxEAACQRQAA4EAAAJBCAABAQPWZ170Yjq4+AACAP+oQyj1FtO89AABeRQAAwEAAQJJFAAAQRAAAgD8AAOBAAIC1RTMzHEQAABxFAAAgQQAAQEEAAEBCAAA6RAAAgD8AADBBAABAQAAABEQAAIpFAADAQAAAakQAAOBAAACEQ2bmh0MAAABBAAAoRAAAnEMAAABBAAATRQCAskUAABBEAADAQNfsgDrvFp49janxu2M5or37Ppe9MwWFPQAAq0QAAOBAAACgQAAAwEC7KsY8zcz0QgAAgD83y9I+AIA+RfyaBz4AACpD807avQAAuEIzsxpDAACAPwAAAEAAAExFAACQRQAAC0MAAABBAADwQQAA7UVHDw29AAAgQgAAgECJgYe9oAewuVseyr0AAChEAAA3RQAArkTP9Lq9SIIHvR8L8L0HAgu7AADAQBBfaD3JHq69oWbBvc1ouj3H4S290CKiPQCAFEUAAEZEAACQQgAAMEG1b+g9AAB5RcMQO71pqSU84WKkPXVS/by4Li69BMmWPCOmwb1i/wc9y63IPCN+CD5AVxi8AAAAQAAAzEMAAENDAACgQACAo0V3nZy9AIBQRcp6hrmil7a9dirGvMS1BT4AAMxEAADARAAAQEAAAABAelHSvQDAzEUAAIA/AAAAQAAAwEDP2ms8AAAoQwAAgD8AAOFFAACgQAAAgD/TIpA9AACAQNSjtL0zs3VDN8vSPgCAF0UAAENFAAAAQAAAQEOQS+w9TdARvRlPFT17QIC9qDdOPgAAgEAAwFhDAABAQACAUEUAAEBAAADDRCdP0b0AAEBBAABAQAAAbUUAAIBA8nfNPdiS8DwAAFhEAACAPwAAoEAAAIA/AADYQwAAnEMAAPBDOisoPgCAvkUAAH9DYibZvQAAQEAzc5ZDAICdQwAA4EAAADREAIAIRQAAW0UAAKVFAADhRa//kbcdUvQ9AACAPwAAEEG9jSo4aEbGvEGwNbosXEU8RbupvXerkDwDaZq8ewQsPoBS171DwB69oqL3O3cMpr2V89Y96M2FvT/bsbxncty9KB7XvBWjUT2Fa+E8t2qLvR7ANT7oLf282qMBvfXMhDxbkPs8OSOTvV3ckD3vjqs7KywGPnty27yKnEm8M6IdvVPyuLzhKAc8ZcTjvJ11Iz2nQf48lU5NvO12cTuj4A4+HeLVPDXSqT0qr5m9r20/PaNug72neOA8BPPDPVPRFj1a7vo9s1GWOm+ZCj5zzhM9th4QvVO1YD1a10O9+rd/PaM0lL2gR9e525tNvQ/Uxzyj6UO9TuLEveJ6DL2qNMo94NaivQ98dTybb607msFgvc9H+z0LLf+8fewkPkHtNbwWhpw9p6CpvJjz572Lgxq9HVjRvdIAqTyHjsU9NmERvS95ID2PMGm9yxHLPKmZm71tkDO9dzPpvdKIGj3jKPI9r2B+PBBt1r3LrRk866KZPW2U871EtJw7oC33PJ+El71gzcy8Srfnvb8c/TzbXcY9HzgWvP+g9zm1tC09f+Mcvaw1nbub6qw9A+1RvSN5MrwVKpY9Wv3qu5b6HDw/j6K9nWoxvdMVAT4CkG89hxecvQmrwLosYJq9mSa7vTphAjxaAt+8kaoFPgWlkTxPI9g9H36CvKn2nDyg7gw7TiWBPFBBZLxQ/Rc9rwm4PDeFjb2yiL870wscPvX5M7sZjcq9uzugPEry6z01qjW91et6PaplgD2XgIu9azUYOwFSi73WnSm95os5PXALr73RucQ8UJiNvT5nEz0vDTw9//nWvBBwYL3/Jiw9G5vAvTiAZrxBfbu7pp03PQzZnb2pZBS8ccS6O2oWj70+vyw9JZqQO5trbLwnwom9UuSWPcU8VLse44U9yLiaO7sPXrrJRBQ9AMCTRQCAjkUAQJhFAADYQgAAQEAAAMBAAMCZRQAAtkL9B429AACgQAAAwEA3y9I+AAAAQCX8uD4AAKVFAACAQQAAXkUAAIBAAACQRQAAgD9X4pm9AABAQAAAQECGmqa9AABAQAAAAEAAAEBAAACAQGgT0D4AAIA/AABAQiNuBz3ybJ09AACQRQAAgD8AAIA/AECSRQAAgD8AAJBFAACgQABAlUUAAIA/wbO1PQAAgD8AAIA/AACAPwAAgD8AAKBAaBPQPgCAo0UAAEBAAMDGRQDAyUUAAK5EAADVRKIanr2LZHM8GI6uPgAAgD8AQJJFosCzveK1jz0AAMBAAADAQAAAgD8AQJJFAACQRWsgRb0AAIBAAECVRQAAAEAAAKBAaBPQPn/dFj0AQJVFAECVRYOck7y9xqO9d8jSPAAAgD8AAIA/XaSjPJ0VBz5q+7C905gUvQAAgD8AAIBAAACAPxiOrj4AwJ9FAACgQAAADEIAwMlFAACAQAAAz0UAAKhEAABAQAAA0kQAAN5EpfzVvQAAAEAAAIA/AACAP1rTD73vFsM8sk99PSv2jb0AAIA/AACAPwAAwED4jBY96Vqtvb9lKTynP3I9AABAQAAAAEC2awo7GI6uPhiOrj4bAp09AACAP+E5D779kJQ8GI6uPi8foL3rsqS7PT60PN4NuLx6yfA8Th4qPZo11rmiexm8ggsDvY844Dr3SmK9B0RAvHPIqD0AgKBFAACAQNOOQr0AAEBAAECeRQCAoEVD5qC9AMCfRQAAwEAoJqc9Jfy4PgAAAEAAAIA/AICpRQAAAEAAgNZFAACAQGgT0D4AAN5EAICIRQAAoEAAAABAJfy4PmgT0D4kTqu9AABAQABAkkUAQJJFAAAAQAAAAECT8BG7az32vKoVU73AbH289yTxPE2Ue7094Fo9AECSRQsx9DwX1s0932flPQAAQEAAAIA/AAAAQABAlUUAQJVFXfq7vAAAQEAAQJ5FAABAQAAAQECYtHG9Pzy1Pdcx0DwAAIA/AACgQAAAoEAAAKBAAACcRQAAwEAAQKdFAECnRQAAgD8AAIA/AMDYRQAAkEIAgMFFAICsRQBAp0UAwMZFAACAQAAAgD8AACJDAIAURgAAn0QAAKJEAADAQAAAAEAAAKBAAAAHRQAAgEAAAIpFaBPQPmgT0D5pecw9AADAQAAA2EQAAABAAAAKRQAAB0UAAIA/7IlCva/rLrshD6y8jS3/vK8om70zaqW9AABAQI92iT0AAABAWBFnvWNm5jsAAIA/AACAP7uzj7vOBju9JqwHvQAAgD9dHou8VI44vek0TLu95mM9Z5NvPSChYjwAAABAAMCfRQAAQEDKPLG9AAAAQACAoEUAAJxFAADAQJGRSL0AAIA/NfNDPqCGLrwAAABAAADAQAAAwEAAAMBAI7CPvedOzTsAAEBAAMC6Rct+jD0AgMFFAAAAQAAAAEDIlpw9AABAQKgpyj4AAEBAAACAPwAAQEAAgKxFAABAQAAAQEAAgLVFAADgQOBGBb0AAIBAAACAPwAAgD8wkhG9AACAQEZWib0AAABAPCkavQDgBUYAAABAszDcO48NhrziADK61C7HPF+0LT3K5vw7nDdHvTDpbDwz/XC88dzJOwgo1zuOapy6LZVRPEWKkrt1mbm92zZ8ulqQQrrvSdO7SyJDvLIW7z0WLJm9qtVNPTKbHz1kDKk9d6hRvXYgOzzgSBi8GowTO4e6rTw9pAA7//zGvJWODjxXgKG8wAeeu/QdFz0w3bm8BiwIPSHRNr3ubjq81dWQPS96hTxC2lw9l+RpPR83A7xeaD89aJcAOb5iAL3dN8c9jx3CPO/IjT371dY8AmS4vUPZULxzMDo8sMEJPYa1xbz06RY9JzgnvY+aI71RyJ27J+V9PXOeArvFYKa9NVTKO6PkJD2m/iM70W4/vfLb8jyv/Fy6AQqnvFP33bs3cms9USGTPND6X73Cz8i6YpnRPRAFtDzbMsK8bVqTvcIgObzVkCM88oKSvGvOVjxIzOs5ND9IvPPM570mDCQ9gRepvFmPnz0qc2a7QoGhvb+Q9DxitGQ8Ku2VvJ1EGTmsdSY917swPYU127ySOW27r+kvPXtVOzx723Q9GtqsvfBarTy607A9RNIZPRF1hTr7LKy8QMFIvGLU+DwAABBBAICjRQAAgEAAAI1FAMC6RQCAoUIAAL1EAICFRQAADEMAAOBAAACAPwBAlUUAAMBCAABSRAAAIEMAADpEmpmcQgAAtEJmZsJDAAAAQAAAAEAAQJJEAAD2RQAA/EQAADBBAIAIRQCA8UUAAEBBAADwQxte7D0AANVEAABAQAAAQEQAAIA/AADMQwAAMEIAAIA/AACgQADAw0MAAEBAAAClRQAAgEAAwGREAIBKRAAAQEAAAIA/AACAPwAA50QzM3tCAADAQAAAAEAAADpEAICLRQDA6kUAADpDAAAAQAAAWEOcwxQ9MwDSvQAAgEAAAApFZmYwRAAABEQAAMBAAACIQivNvb0AAKBAAACCQwAAAEEAAMBAAACuQgAAgD8AAABBZuY0QwAAgD9oE9A+AAAAQAAAgD9m5uhDAACAPwCAqUXNzIhDbisIvWgT0D4AAIA/MzMcRAAAwED6FcS9AACAPwDAxkUAgPFFmpnZQwBgEEYAAOFEAADzRAAAIkUAAApFN8vSPgCAvkUAAJRCAMDJRQAAwEEAAEBAAACAQABAmEUAAPBCAACAPwAA8EIAwMNDAAAQRKgpyj4AAFhDAACZRAJeFD70JQm8N8vSPgAAQ0UAAMhDAAAQRAAAKEQ3y9I+AABYQwAAAEEAQINFAIBiRYMF7z0+l6y9AABzQwAAhEMAAFtEAACKRQAAQEAAAABBN8vSPgAAwEB9WyA+F5k1PQAAvULNzPRCAECVRZqZQEMAAOBAZuaHQ9+LzT3A2mO9pHDWQ2bm6EMAAPBDAACAQGhZjz17RbQ8v6PdPQAAfEMAAKBAAABYQxYgQj4BkKU9AABAQADAt0UAQLBFAICpRQAAgEAAwOpFXcqgvAAAAEBSEXo9Jfy4PgAAgEAAAL5CAABoQ2Xjs732G8K9AAA9RGZmLUMAALhCGI6uPgAAAEEAAABAAAD2RAAAoEAAAKBAAACgQAAAE0UAgNxFAAAwQlNfYL0AwNhFj1eVPJ1+m70AAHhCAIDQRQAAtEIAADBBN8vSPog5y70AAIA/lV7xvV9xtD0AwMNFAAAwQQAAEEMAAM9D3dMfvSB0371oE9A+AGAQRmam+0MAALRDAACAP5oJCUTNTJ9DAAAWQ2dUpz0AAEBEsGIwPSX8uD7kL649zewjRABAg0UAABlDAABwQwAAKEMAAIBAAAAgRDfL0j4AAMBAAIA2RAAAAEAAAIBAAABYQwAAQEAAwIFFAACAP1N0lzzFh5k9AADgQAAAwEAAAIA/SKGiQwAAgD8AAKBAAABAQDMDfkSXqsw9AACAQPK3nL30ghI9AADAQDfnob1CRwW+Uo+cPAAAuEIAQJJFkCDyPQBAmEUAAIBAAECYRSOt+z0AAIBAAABIQwDAWENzaKs9SyUlvAAAgD8AAIA/AABAQACAjkWamdtCAICpRQAAgD8AgKlF0K6GvQAAf0MAgIVDN8vSPgAAoEAAAEBAAECwRRiOrj7NTJ9DawCjPSPD7Lz9NNg9aOLoPACAu0QAAEBAAAAlQwAAAEEAAABBAABwRAAAcETRaLW9K9MIPAAAoEAAAEBAqCnKPgDAyUUAALhCACCKQ2P9ZTzL5l27N8vSPmZmlUOoKco+AACAPwAAn0QAALdE+GvaPXrTf71R3jM9vx7NvS71hj1Wp6y9AAAgQQCAGkUAAEBCAAAwQeXPkD3Krs69AAAwQQAANEUAgLVFoTAiuzvpvbx7o3Y9NgOAPQAAgD8AAGxC2+4APnDvir0sFrU8AAAwQWgT0D4KV6tCAABwQwAAAEAAAK5CSlzZvUgtiT0AgKlFGORcPQAAEEQAAOFCAAAcRACgp0PNzGJDElMIPAAAgD8AAIA/AAAwQQCAhUMl/Lg+ZqYORHm8gL0CCJ89OVKuvIq11L0AACBBAABqRGZmjEMAADREPyi6O2JbBL2d3da9TsccvQAAgD8AAIA/N8vSPgAAAEAzMxxEJfy4PgAAxEIAACBDAABAQwAAgD8AQJJEo33FPbNMg716VG08AACAPwAAgEAAAHBDAABAQAAANEQAAEBAAACAQAAAgD8AAIBAAAAoQ2gT0D4B4r48MzMFQ2bm6EMAAIA/Zii0vQCAfUUAAIA/AIA2RAAAAEA3y9I+Jfy4PgF+rLtSX9W9CJg/PFvb+j1oE9A+AACAQAAAgD9mpg5EAACgRACAiEUYjq4+AACAPwAA/0MAAIA/GOdAPTdtIrwAQJJFi1KRvbuK4j1T/iQ9xx+9vQAAwEAu40q9SmjOPV3BvbwFnN29z4jKPQAAnEUAAJZDN8vSPgAAAEAAAElDAAA9QwAAQEDzhPy9AECVRc2s4UMAIN9DAADSQwAAAEEAAKBAAADzQwAAvUIAAHNDkMtRPZMUVLyiLWe8x3yJPQBAp0UAAMpD/+TmPZoJCUQAAM9CAADSQwAAhUIAAIA/N8vSPpqZ5EIAAKBAAADzQ83sI0QAAD1EAADzQwAAgD8AAIZDAECnRVB9172m4J68AACAP/BRxL0AABlDAABqQwAAgD/N7CNEAACAQHtcKTw/RuC8AICHRDLu5D0zA35EPgOsPHdulD1oE9A+AACAQHNEhDwAAABAAADIQwAAc0MYjq4+AABAQDfL0j4AAABAAADAQLW+Tz3pSAA+AED7RftXUrxa/cQ9AAAAQWgT0D4AAGBCAAAYQgAAjEIAADBBk/8iPQAAGEIAAIA/xjcAPgAAgD/FjgI+AABVRQAAAEDzBvs7eq3+PQAAlEIAAExFPeLYvQCAvkUyb768JQUkuwCArEUCKOS7pJ4nPqp8kztFp2m9aSepPCX8uD7gaNS9AACgQAAAqEMAAIA/AAAwQe8cjTwAAIpED167vYp/tbwAAIA/AACQQWgT0D6ameRCAACAPwAAgEAAwMxFAACqQ2edMDx3is49R3O5PY1zUrwAABxCAAARQwAATEMAgHhDzcx9Q4eYh70AANJCAADMQ/bqrr0zMxxEAABAQGt7Kj5rnOm8bL9EPQAAgEAoiKO9AAAgQQAAyEN4mWg9bB6KvAXyGb1H7QO+xRkQPtvbP7x3+O68l2zvPAAAQEAg3/E8QIfPPQCArEWysSo6yzUTvRWyrT0TExw6foGBvEuXez2CSte849OYvRJJM73XZiY8uzZOO8vWqbwCLdQ9w+oRvJWAfzywPn28pVewvQeMAbwLPB883R4AvTOoRz3j07S8CeSoPdXbFD3JCMk8jM+fvVIvAD7hoMy8SzBQvXoTDz1zttW9vvM5vW/+gj1TU6e9R9gbPjkVQLx2fJ69bVB6Pdggqrkof5i8aBV/PTem0LxWjss91Xc4vFxflT13GEa9ONKvvMrUez3DnDG9dpWVPacBhr1uCMU8cqcCPbMTCD7YrZ+8v0/Cvb5MSb0YVmU8e4QQPW0Emb3D4uw9mLT2vANbDT5Hnye7cPBXO2fXvb1oMo08zfL6PUZlPj2iZJK9rcNOvUK25rowteA8Pf5HvXKhfb1PPaw8B2LNPKdb2b2IZHw9TLEhveuD+7vLQ7y9q3WYPSM7Zb0mgSS94giGPf+YZ70dyH07MPBZvSpyQj1+EoK9J6OgPLzhvj3peC+9FeLTPD1nCz7fRcs7XHewvdrc570A8QQ9g1BpvV+csjtjCJu9yx2nPeevEb5XypC9jatovX2crT19ft+8n9ygvYaFEb0zqbg9uJCOPeMtoL2tUI89i9iqOy/r9jxUpKe98gyive/tkT2QYLw9ggx0PMff1jyivLO9f/AMvZLY0jyMBjS7bVn7PTzztD3Yd7W8qcqDO8OhFT6evKG9hgokvPCy+byXh1o9Og//u9mepD3lixU9VvpFvULikjwyehW9GKrlPLvp4D0vGpO8woqPPFPYu7t1jls9tR7VvZf+C70r8c68KRoMvj+nhT1hF5E8GybxvMOnPz36T9q9IvgUu7rQBroDKpo9uya3vC0O4b09Bmq8aqLHPWC2EDzq6eW8HCAAvWlgrj3GzL48tmCEvbIjuj3/OaW7x1qkPRkkPzrtY2U8N6HEvZ89SD1SBjU6UQTGvJCYpj0ltpG9rH0gvO+TiTw/h2e9FtmuvXkJrjo3xRW7I76NPAsyqj2weJy7s+D8vcWL3rx9jbs90wuiPLX8mT1/gVe9flwxvcA8+Dv/6Jy8iPDSvVXcn71bD5875JFHPfk0tj1sgII9u/m9vcittz3sOcw8n7GivbiB9jp+J4W9CykJPB+bAz68eiU6d+k6PQPXv72ChIw8N/6kPRxkwLzl87W9GZYAPSLYkb2A2PU8q/UtvUBynrsjrIW95suaPWIO8byAcqu8bOQ5PWfWgL0/ZdW7HbYdOlt1DD06/LK9f+6gu6ytTL3JDAo9t//tOlCLRz0DGPi8XxrCvV+JKb1rgZE8C1KfvB45oz3L69s96cgAPRNZM7wxdYS9STOvPfDtGb3HcnA9q30AunN1eL3iUu881bXcPGsi9T1DF149ID6yvLLutr2ihwu8bb40PXGBK70AAMBAAADIQQDA2EUAAIBBjyhPPQDA0kUAAMxDAAAyQ/MThb0AACJF+lilPZqZQEOamdlDAACYQQAAS0MAABNFAIApRQAAC0MAgPFFAADtRQAA4UUAACBBAAAsQgCAgUOaGY9DAAAHRQAA7UMAgIJDAAAlQwAAgD9mZh5D0nXkvWZmlUPoe+s8WsDbPfCX070AAKBEAABAQDMze0IAAPZEAABkQgAAEEMAgNxFAIDQRdwvm70AALFEAACAPwAAz0JYcvg9AABIQwAAcEQAAOFCAAAqQwCAFEYAgBRGR6fMPQAAKENsTEq7p2kwvQAAQED7G6K9AAAAQAAAgEDtc7g8AAAKRQAAuEEAgNZFAABUQgAAQEB1EYG9AABXQ2H2qr0AAIA/p9b+O+fDjb0AAKJEAABSRACAEUUAgA5FAAAZRQCAoUMAAM9C+sPaPYXC4r32jgs9AADcQgCAL0UAgHFFAABtRU++ur0A5ja8R5+zvJ+1izy4ELe9p7BNPQAAQ0QAwGREAABYRPHwcD4AAABAAACAPwzNv71ZX5o5aE2FPQAA8EFmZuZCUC6bvAAAUkPjVZ28mplSQwAAAkO6nQ+7S+3APXdmozwf17K8AABYQwAAPUQAgDZEAIC7RACADkUAAE9DAIAIRQAAEEUAAIA/AAB4QmZmLUMAgB1FAACgQkSVuL0AAJBCk8alPQAAAEAAQJJFAIBTRX3Xq70AAExFAMCERQAAKEQAAPZFG5JmvcLl2TsAAExEAABqRAAAwEEAAIBA+pWTvAAARkSIC1a87k02vW+FuL0j2vK8j/LDPFtryj1Wk7m9zcxiQwAAdEIAAFhDClerQgAAikIAAABAAAAdQwAAwEL4hbk9Zqb7QwCASkQAAPBEztEhPQAAlEMAAGxClfuDPdCtvLy4XphDAACAPwAAyEPNzH1Dnc4SPWcPmr0AAIA/ilTnPQCAFEUAAIA/AAAZRX0QzDwAAABBWB1QPQAA8EEKV6tCS6PVvEV34z0AAIA/MzP7QhMTLz3OvBA+AAAuRQAAQ0OkcNZDuF6YQ5HjPD1Dvk29f2WmPcZFy7sHjxe7YgBEvVVaUT3XYYE76LsQPIvBkLqiGZs9N++Hu3jB7TyrSMA9wx/NPJbsg71767Q9oiz4Ox1M2b1z+1u85TsKPWOYgLw4rSe71m+ZPVMqfzzzpH+8x+llPHMeDDlbgIC9Kqa2vH8NmjyjCw69x7kHPqKWkTuP9Ka8GPK+vZ++Zr2aUyM9Pfqpu/Pivb2vZxm96/IcPj/qAbxCudO98xvxPekEl7xV3wG9bu+wPNPjmT3IV508k629vQlAgru6F9I5UQygPeRzBL2Qdum9hTxau6Z0ub1wurK7p/eOPTuch70uXA+7a34wvTvmtr33Lys9izgdvfecI721+Gw8DheDPR/6LL04wY49FwrfvEuE57x7LaU8AACIQgAAMEIAgOVDAAAcQgAAMEEAADJDJ/2UvQAAgEDNzMdCAADgQAAADUMAAEBAmhmPQwAA8EMAAOBAA9VmPMgDqT0AAFhDV6vOvTZOgz1sQiM8AADIQwAAAkMAAE9D362UvQAAwEMAAIA/AACFQgAAKkMAgKFCAABzQ2bmh0MAAO1FAACCQgAA9kX4kZo9AABLQwAAQEMAgKxDoQ7qPTG5gj0AAOFEAABwRDfL0j4AAD1DQ50MPWgT0D7U3ZM9AABkRQCAU0UAgL5F/7DSPXYjkTztXKk9AAAAQGXrqT0AACJDAAA9QwDAyUUAAEBBAABAQQAAzEO4/rVDAMABRGZmwkMAACJEKK8hPp6Vvb0gVFw6AACgQAAAoEBoE9A+x8JfvQAAQEEzM7JDcfG4vTMzBUP6upK9AAB0QgAAREMAAOJCM3OWQ98rub1aP2Y9AECVRfrpez0AALRDAMDqRfIPAD0CilC82NaKvQAAIEIAAFhCAADAQAAAQEAAADBBAABAQCX8uD5mprtDAADtQwAgBET7C6o9mvMEvYs24LuTMKu9GI6uPgAAAEAAAKBAAADAQAAAgEAAADRFAICjRZqZ20JoE9A+hZuOPGbmh0MAgL1DW8WWvfaoKkPxB4o9E9OqvAAA/ESzwvi7mplSQ+9RNLzM+oK92n7xPJ/EQL0KV6tCyh6YvfKDBD0AAABAmm7UPAAAAEEAADBCAAAAQAAAYEIAAIRDM7MaQwDAAUQAAABBAADAQAAA1kIAAChDAADkQwAAwEAAAIBAAADYQwAA5EPNrOFDAADAQAAAgEAAAABAWzknvAAAQERbOYo6AIAURQAAlEMAAPNDAIDlQwAAwEDy0y69LwKvPSeM3T0AgIdEAABhRfBx0z3Dgoc8rfv5PZ+Psr0AAABBAABAQAAAcEQAAABBAACAQAf6sbwTxnQ8J0QTvFPspb2mOr49AIBlQ0FvEj2X/qA7AvpQvKWrdr2v9yI6vfUTPYX2er2ZH6q7jqILvHs/nr1L6s498Ti3vKdvVTyDb4c6i3TlOx8Bdby0S0w9WvqXvVuEsj0Roga8ynRxve/gSrwCXka8E3KnPeaTQLzo6GC95TMTvIeMmTyP/9Y6ZRyivV3MGT7bISM9K+TZvTfr7TySpEc8gPzSvLNy7LnuOI+8kE2fvKutoDyLr7c9g1AkvZNvqzxfZoS7K8NNPTSoMTobklC9N+G6u1rCDj3Isr28xjEeu12jWj1ftu88N32kPfnIS729eg495w6XO5ROij1IMcQ811PEveXTnTxlEai9TxQ0PbGcIL0pYR+7+8COPb8nVjzTFce92OKKvLek7Dvln/C8hy+mPQAAPUMAgItFmplAQ81MMUMAAOpCAAAAQAAAUkMAgC9DAIAyQwAAtEIAAOFFAAClRAAAQEAAAExDAABVQ2ZmLUMAAKhDAABAQAAA+UQAAIhCAIC1Ragpyj5m5jRDAAAAQACAKUUAAIA/AAA+QwAAS0MAALdEN8vSPgAAXEMAALpCAABAQqgpyj4AAIA/AAAoQwAAoEAAAOdEAAA0RQAAgD8AAPZFJfy4PgAA3EIAABlDAAA0Q81MMUNoE9A+AAAQQwAAjURT3949AABbRQAATEQAAGREAABeRACAaEUAQIBFaBPQPgAAsUQAAIA/GI6uPgAAOkQAAIA/ZmZdQwCAcUXKe+m97z6zPQAAgD8AAIA/AACAPwAAUkQAAEBAAACAQACAPkVBTje9AADtRAAA2EQAAIBAAABAQACAPkWIU809N8vSPgAAmUIAAJlCAECYRZqZ5EIAAPZFAACgQDMzBUMAwJNFAACcRQAAAEAAACVDAACAP6Af6LqqC/i9BJwuPdfZs70AAExEAAA+QzN7ib0AAD5Dre4pvVhq870wAJI9AIBiRfjO4b0AAKBAAABAQABAkkUAAMxEAABIQxiOrj4AAGpEAACAPxCU0j0AAE9DAAAAQAAAh0QAAIA/mplSQwBA5kUAAC5EAAClRAAARkUAAKBAAABtRQAADEMAAHxEN8vSPhTrqrw+0ag9lBuMvb+p7LtnEH49XWLdvQAAAEAAAGRET+LIPdVjaL0AAO1EAAAAQI+cAT2HecY9AACQRGgT0D6amTdDAABAQAAAJUUAgBdFJfy4PgCASkUAAABAAAAAQAAAgEAAQJ5FD91/PENDij0AANJCAAAAQAAAwEIAAIA/aBPQPgAAvUIL0OC9AACAPwAAnEVm5hNDAAAoQwAAgEAAAEBAZmYtQwAAgEAAADpDAAAdQwAAKEMAAO1F44MBPgAAcEM0BB8+EoizPFoTZL1zwQo+dFIVPXACpb0o3ZM9AIAIRQAAnEUAAIA/AACAQADAhEUAwMlFAACiRAAAREMAAJxFaBPQPhcCNbwTi8a9T5/3vGB23z2oKco+qCnKPgAAgD9oE9A+sW0EPgAAkEUAAEBAAACAPwAAQEAAAIA/AACAP1rg0D0AAIA/6lloPQAAWEMAAMBAAAD8QwAAgD8AgCxFAIDQRZoZj0PNzGJDAABqRQAAHUMAAHlFAECDRZocj7st0IU9AACgQACAAkUAAJBEAABGRDKdmb2oKco+AACAPwAAKEUn0vm8wGXuvQAALkQAAKtEal/YvZqZN0O3YdC9kceOPQAAOkOwJBu9AAATRQAAoEAAAIA/IJvPPWpRyjzwnvk9AABDRQAAZEUAAIA/AAClRQ/D7z0AwLpFAAAAQACAwUUAQJVFAAAAQACAjkUfesi9kHiPvJ/33z0AAJxFAAClRQAAgD+LQAo+AADWQs3Mx0J8iwE9e2wkvkXOoT2ameRCMzP7QuhK4L0Yjq4+AAAAQAjzdb2zu6Q9AIDBRX96kjwAAKBAAACAQAAAEUMAAKBAz/p+vLGgub0AAIA/AECYRQAA/EIAAO1FS6C1vSft4LuSkJo9sy36vAAAEEMAADpEAACAPwAAkEUAAIA/uewYvAAAkEIAAFJEdKHAvc8pgj0AAIA/AAAAQAAAgD8AwMxFAACAPwAAAEAAAENDGI6uPgAAgEAAwLdFAABJQwCAoEUAAE9DAABPQwobqb0AAChEabrJuwAA0kQAADdFAIAORQAAHEUAgKBFAACAP1OC7j0AANVEAAD5RAAA0kIAAHZEAIApRQAAnEUbJCY9rT+YvQ4+wL0AAABAAACAPzfL0j4AgCZFAADVRAAAQEMAAKBAAAAcRQDAWEOoKco+U569vagpyj7X1si8AACMQwAAqkMAAIA/AMDqRQCAU0UAAMBAAAC9QhbAHT0AAIA/AMCBRQAAQEAAACBDAAAWRAAAKEQAAF5EEGTBPSLprLyt9B49ercWPgAAZESb4867PPeSPQAAAEAAANhDAACgQAAANEUAAIBAAAAAQDfL0j4AAMBADk+EvUyISjxahP09ANwQPAAAgD9oE9A+AACAP32R+DxG1UI8wqaNvXyyLzwYjq4+AABVRQBAgEXn8bs8AACCQgAAQEAAQKdFvNuPvQAAgD+uX6C9bYJlPQAAAEAAAJRCClerQlyPp0LZEho9qCnKPvvzAjsjfAM+OaDGPQBAp0UAgKNFAACAPzqZaz23cUE8Jfy4PgAAgD+uaho9Bf/sPQDgI0ZB25y92JxXPQAAAkMAAIA/AICjRXD7mL0AQJ5FJfy4PgAAQEAAAIA/AACAPwDAk0X/q/68AMDDRQDA0kUAAM9F0MZwPAAAz0UAgKxFtzrpvGeqsr0AAPhCAACgQJh60j0AAIA/uAmuvG9JHz4AAIA/JEaLvfiROj1mgsW8i/Sqve006DsAgDJFAADAREe3d70AAMBAAAAAQAAADUXZjgY9xCypu6l6h701ifC8AACcRQCAtUXfpdC9AEDjRQAAQ0MAAEhDAABGQwAAqEQAAN5EAACgQAAAKEUAAAdFAACQRQDAk0UAAEBAAABGQ47mrT29/6i9AMCfRfyOybsAAEBAAABwRAAAwEMAAIBAAACgQAAAoEBw9fW74I7ZvfJF5b0AAIdFstHIvQBAkkUAAO1EAABPQwAAgD+soSy9mplSQ/isQT2Ea727N3jRvWUlb70AAABAAACBRB+LBL3cRUk9OrlcvZqZUkPDYJ28AAAQQwAAgD/mE4o9mplSQ8K/j70AAJBCAACEQy7hRr1oE9A+AIBBRQAAZEQAACVFAABYQwAAoEAAAFhDby2+vX2y/jsAwFhDAAA6RQCAO0UAAPBDAADwQtVEDj4AAHxFzcyIQwAAQEAAAMBCzazhQwAAgEBmZmBDAECDRQCArEPTMoW6/jiUvBNXoT33TFW99+ETvZmwy71gmJk91019PP2ELr0L7Q88wATTPd16KLufxCY9B5ZUvRWd6Ly7K8W9AVmVvZfefjxPSVo8vdSTvQmDvLyBX7Y9rrIZvUhK7L3WTY29xB6HPB8Piz131P67jaT7vJcmsTsxgSo7+NtCPSIQ7zyAJm29ZMGXPcpEj71+/hK9nvcHPmpp+L2iczm9d8VSvbEiND2V5w2+VM0kvc9R7bz/OAW+R5irvCIAwz3vu3C955DoPF5Cur0jsfY86FIBPR1qYr1QX3q9ogaYO1+ADD2HSO27R8DIvGj60L1HuMY313t8vYC2f71Xx7E8y1DePfUdJ7u3Ep29j+bAvB8nJ7xENZk8W4kBO8jM+b1z79E9SXATvWv7372euS+7X6DAPZsJRTzTzIg8I+mOvGOfyb3TVPa7XXFKPjr/pjvwPNo8XY9+vQ+BIr3XRFA9243gvXA/Pb0c3qS9mLpyPejC8r1Xq069X+SQvWgWVT2HwQu8597jPS/bbr2F5fk8jiUMPeckqr2pPMm9viKnvEo9+j0zahU96xuCvajLaDyVhEq9CXSUPbhncryysXc9mFZnPXXntDqb5vS8o1fmPK0j0LubBak911wYPmjqDz1akcM9H8tmu369qT0BQhs9ikmRvXgvkT13x/Q8UP2hPcf2PTzSc/W8p2C0PZBrq7sK+6u99ynCvLpqBrvFrw89XwHnvTLVhD3avwI+XXngPHqYy70aDVU74qJpPN7EAz5bWsi9TLgePXY8Er0Ps5y9HRFnvc/vuT27bbM9Zz1tOzsQJLsMMZi9Lwttve6+Dj38eJk9L6csPisIAz3qmQQ+To+nvKMUZT0jl8C84/Slverlrr0R7rY8g3WrvS+SRztniXU9s2VNvd/Wdj0d3NC9GZwNPrVj17uz+AC9jrUrPYm+sLwONLW94CjHPP/l5T3hQIW9Awn9PJjeez0oKOi8fgccPSvGuD1hH7W8h/agvd27f717WVo9S/TSvOvjor0r1Ly9tA4KPfsCkLxfmM0859cJPPzrtz0AnRS934HXva/HYT26REu9O+WoPOLenr2aT/09dBaDPCLEIbxP5Ym9EOfyPNLm1D09KWk8UtJDvRGVBT7s0AU9TxEOvdUxqTxSltw9xK/BOU9mZb1B4Ks9TgqMPe0Gcb0JxhI9hnzHPaaTkzsfo9C8jQa+OyOoMj07PFO9lL6Zu0sYnTvXkJW642mOvescRTsvYj+9Apw+Pd2tQruvamW8hJsCvU2GDz0AABxCAAAUQgAASEIAAAhCGI6uPhiOrj4AAExCAAAAQgAAAEAAAIBAAAAAQAAAQEIAAABAN8vSPqalpT4AAPhBGI6uPgAAQEA3y9I+AAAAQH5ElL0AAIA/AACAQAAAQEAAAABAAACAPwAAOEIYjq4+AACAPwAAgD8AAO5CAADwQQAAgD8AAIBAAAAAQAAAAEAAABBCAACAPwAAQEAAAIA/AABAQAAAQEAAAIBAAACAPwAAgD8AAIA/AAAgQgAAgD8AAIA/AABAQgAAJEIAAEBAAABAQgAAQEAAAIA/AnF0vQAAQEAAAIA/AADgQP+q6Dqh1ZE9AADAQAAAAEAAAABAAACAPwAAAEAznNC8AACgQDfL0j4AAAxCAACAPwAAoEAAAIA/AAAMQgAAwEAAAAxCAAAMQgAAGEL3jou9AACAPwAAgD8AAIA/AAAYQgAAgD+GhQ09AAAYQgAAQEAAAKBAAACgQAAAKEIAAChCAAAAQAAAOEIUlUU9AABEQgAAREIAAERCAAAkQheA2T0AAEBAAAA0QgAALEJoE9A+AACAQAAAgD8AAABAJEM8vQAAQEAAAEBADfxYvBPnKTwAAIA/AAAAQLW0ND4AADBBAACAPwAA4EEAAIA/AACAQAAAwEAAAIBAAABAQAAAQEAAAARCAABAQAAAgD/YH329AABAQAAABEIAAIA/eXiKvbayzL3nWAm8RvEOvQAAwEAAAKBAAADAQBiOrj4AAMBAAAAMQgAAEEJYQ5i9AAAQQtNbyT0AABBCcsS+vGlDwboAABhCAAAAQE04VD0AAABAmsBoPbXdC70AAIBAAACAQBIdjr27IZ+8AABAQAAAgD8AABhCAABAQAAAQEAAABhCAABAQAAAGEIAAABAAAA8QgAAAEAAADxCLL2zvZpSHD0AADRC9xGuPYyeh70etUK8te+hvSVoJL1rCR+9sqwyPDTZjb0AADxCZ289PgAAIEIAAIA/AACAPwAAgD8AAKBAAAAkQgAAgEA3y9I+AACAPzfL0j4AAERCAAAAQAAAgD8AAIA/jaPvPQAAQEAAAIA/AACCQgAAWEK/HHu9380hvFTwqb1Cn1G8g2aZPIFVK7wAAIA/aBPQPgAAgD8AAOhBAACAP63VbL0AAABAAACgQAAAoED/umi9kLm1vQAAwEBFTGu9N4TZPAAAQEAAAEBAQzBIPAAAAEAAAIA/CiNXPQAAgEAAAIA/aBPQPmgT0D4AAIA/OXw+vanorzvdbeG8rW0CPVgXGr0zrRI+f5xLPYuFqL2JfD49AAAAQAAAQEAYjq4+AAAQQgAAQEAAAKBAC2mGve9SOj0AAIA/AACAPz/pk70HfzI8e9wNvZqWHD0AABhCAAAYQhehgr1KvZu8XTfHPReIdrwQ9KA8G+XRPQAAQEAAAEBAlJIMPQAAQEAAAIA/2pXkPAAAGEK8bRQ9iV2yvd9PAT0/BzG9AABAQA2+Oj2fzLY9AABAQNIBgz0AAABAAAAkQgAALEIAAABAAAAAQMAFeD0AADRCpIYjPQAALEJYo0q9AAA4QlGRpr3Vnxi8GXKmvWgT0D4AAIBAAAA8QmgT0D4AACRCAABAQAAAQEAAAIA/AAAgQgAAgD8AACRCAACAPwAAgD8AAEBAAAA8QmVpYr0AAKBAjCWnvQAAgD83y9I+d/YDPQAAgD968U+7onK3Pe07WzomfJk9AACAP7oMXD1oE9A+DfdfvQAAcEIAANhCAAAAQAAAZEIAAABAAAAAQAAAgEEAAIBAAAAAQAAAAEAAAEBAAACAPwAAAEBcTiW9AABAQAAAgD8AAABAAABAQDfL0j60iJ89AACgQMD4Hr0AAABAAAAAQKjHlz0AAKBAwx7jPNS/oz0AAARCAAAEQgAABEJhzIW80+8iPMftvj0AAIA/AAAEQgAABEIMk5i9wxZdPRoVBbtP7uI8AABAQAAAQEBoE9A+AAAQQgAAQEBmnY89AABAQAAAQEAqDsE9AACAPwAAQEBnVDI9XZZEvcc2Ir1JlBc9Ly64PEOvVrwHezA9U+zMPQAAgD9+Aqc9MxcMPTgX/7xBsh+9cgWxPPG7mDwVxFS6C8wMvJuiU72WgJA8f60fvK8oQbwzqjw7AAAgQgAAIEIAACBCAAAAQGjdjT0AADRCAAAAQAAAAEA71ZK9IKizvAAAMEIAAABAU66MPQAAMEIAACxCEivzPAAALEIAAChCK5eIPW+mib1IIOA9aBPQPpaDh70AADhCAAAgQgAAgD8AACRCAAAkQgAAMEIAADBCAAA0QgAAMEIAAIA/AABAQAAAQEAAADRCAAAgQgAALEIAACRCAACAQAAAPEIAAEBAAAA8Qi5unjwvmgo8QPNRPQAAgD8AAEBA8tPBPQAAQEAAAIA/OR0uPWxRSTxj1ge91KokvEeWqj3qR408B4rnugAAbEIAAHhCAADOQgAAAEAAAIA/qCnKPgAAQEAAAHBCQ1VtPXkQxLzjE6O7gQsWOx9mvTzPVNi8JE6zOw07DL05pBu7ved9vcLlgbsHemG9W2aLPdvHETwPzrg8X1GFu8gX4DwCKia84yAFuWUlcb3qNJ495ZYnPbdia7os5Ui9C7tAPUJN2LuOkrq6qaMfPV/hb7zqL9E8UP2KvZWVBzxmCIs9U6TIPErnZbyD3ZW9jhUgPTe3V7q+Sai7aXGJPII7bT08jTa8eVYrvN88BTxTVuc7H9WtPdf3fruXwSA9DeiDPENSMbwTdBY6j18kvQfUfL1nFnA8oqf9O9RwGb2NT7A8ekfUO52khbxk/S49zeObvCW9+jyTpMa8pCkXPP1Bbb1Nq6k85SdqPWk1mzwvZ589H0envas1jr1SYkA9j5PHvPjDHj2Kpo48JACIvTO3rjwHMko9rQXcPRA5ZbwzNCu9jb5lOrndI73Id5a7BX37vO3+qL2BAZM5ID87PSwwPDxKQuy8O7r8vQih4ry9S2I9k527vQPojT3n2hO9xBqlPXLrXbsSpe88v2uFvTfMFTzPZng9u+ANvOvVC72vgWG8EyCcu8socrxFogI9ewkFPUCV4Lt37Ua94BC7PBtqq7uiR2k9qCm/PBTBi72DJz495XqNvMMP7rtVS3y9Byi+vfMe9Lo4mgy9y2/2u2UTdz1dyYk8TTMEPKcWr712LgE8b+IoPccGT72kvjE7j9STvbch7rwkLgg8JYvyvH/2BL2ghgy8XihGPUIU+bwPttu87MoUPa+iIL1lPiy7KoM5O6W9FT2P9Jq80ARDvZE7GTtDCZo9otX6vPVUkDvVmTi8zcHlPZ/9xzsf5Ny82wUFPaWyh7tuiSi8X8aWuAAAIkQAgAZEsdzTPQAA80MAwGREAAA6RAAAAEAAIN9DAACAPwAAW0QAAHBEN8vSPgAAQEQAAIA/N8+oPQAA0kM3y9I+AACAPwAA2EMAAEBDqCnKPgAAwEIAALRDZmbmQgAAlEMAAFhCAACAP8gcZj3x8HA+AACAP6gpyj7NrOFDAABAQBMa9L0AAKhDaBPQPgAAQEA3y9I+AACcQwAAQEAvWxa91JUFPXjzur0AQJJEN8vSPhiOrj4AADpDACCKQwAAAEAAAABAmpmcQqRw1kMmtJc9AADAQLfYJL0AAMxDCROqvQAAcEMAAIA/AADAQxiOrj4AAIA/AAC0QwYgkL0CLo07AMABRAAAkEMAAIBAAABAQAAAgD8AABBDAABwQwAAtEMAAIA/P8x7vAAAoEAAAEBAJfy4PlD0hL0AAABAAAAAQAAAKEMAgHhDAABYQ7LX3D3TdMy9AADMQ+TKqT0AAMBAZzLhvQAAtEIAAM9DAADcQ2/rm72wkAm8eM1GvDWPKj0AAIA/AADwQwAAkEIAAEBAAACAPwAABEQAAPBCAACAPwAAgD8AAO1DAAC0QwAA2ENYoDi9Hzl2PGam+0MAIAREAABAQwAAQEBmpvtDAAAQRGam+0OXFt+9AAAAQAAAwEETg6m9G4BEPWZmMESoKco+N8vSPpoJCUQzJQo9gZ4OPjfL0j4AAHBDAACAQAAAoEQAAKBEAACgRAAAwEIAAC5EAADAQpqZ5EJcDwlDAAAAQGZmYEMAAFJEAABDQwAAgD8AADREzazhQwr4DL3DE0g9AACAPwAAgD8AAMxDGI6uPgAAIkUAAABAAAD8QwAA+EIAAMBCqCnKPpqZ2UMAAEBAAAD8Q8Mx0TwAAKBAfssAvpqZ2UMAAIBAFASNPbNafb0/+Xc8bdLzPQAAQEAAAIA/AABAQAAA8ENm5uhDvzH7PQAAhEPdlO68AAC0QwAAAEDE/7O9hLedPAAAkELXWcw9AACAPxe4azsAAPxDAABAQGam+0P9lgW9UBy3vDCNZjwAAMBCAIA2RJ8NZr0AAPBCAABYQxiOrj4AAABAAACEQwBAK0QAAEBAAAAAQAAADERlrXO92g2MvFNPI73tas88AADAQs+tC7xQ3OY8N0GevQAAgD8AABBEAABAQAAAgD+Lgt+94rKvvAAAQEAAAIA/AAAoRAAAKEQAAMRCju0bPhiOrj4AAChEcMHHvOBAvL0AAIA/AAA0RM3MiEMAAIA/AACAP6krDT4AAIA/AIBlQwAAKETDuPc8AACAP2bm6EN+yAc+f4dTvAAAc0Ml/Lg+ZmbCQwAAgD8AACJFAADtRZqZ2UMAgC9FqCnKPs2s4UNm5jRDAAAAQQAA8EEAAIA/Yyu6PQAAQEC86i4+O+xWvM/ld70XiAK8mpnZQ0QokLwAAPBDAACAPwAAwENQ6ta9AACcQ9sdn71LKoo8ndiMPQAAnEMvWf893uWlvWbm6EMAAJBCAABwQwAABEQAAIA/sv5HPCUUYj3lafK856hyPQAAwELvMNo9JAKuuwAAAEAXCM88UxJavUMOn73STuy8mtuvvUuorj0vpc69QFDFvMrFkTzHQuA9AABAQgAAEENdAqi93y2kvAAAAEAAABhEMzMcRAAAgD+1P/A9AACAP3U5ZjvN7CNEM/RAPc3MEUQAAKBAAACoQ/9Sq72EVR89b1yqvAAA2EMAAIA/ZqYORNTatjsonaE9AICHRABAkkT8iIQ92aSDvAO65j0zA35ESDJePa0wCL2akGm9sMzfPAAAgD8AAABBAACAPwAAIEIcFxy9VvkRPgAAgD8AADREMzP7QgAA8EIAAEBAAAAAQAAAAEAAAC5EaBPQPutaEj4AAEBAzSwVRB2ATL0AAKBEAAAuRAAAB0Nv79W9h6SwvFW0TL0AgHhDFoGdPGZmwkNHRY67g1QdPoNTuL0zMxxEAACAP83sI0S4XphDuF6YQzOzv0MAAJZEAABkRQCACEUAANtEAECeRQAAgEDrGLC9AAC0RAAAQEAAAChFmpnZQwCAskUAALdEAIB0RQAA8EMDZCk5RgwdvAiEyTzv4ZC8VmCzOx5ULbzvITc8ArrMu3hUj73QZ4I89wPIPb7qrjwtmQm9jkcOPSfaRrwRjMW9/kuVvcc7hD1EqkA9mRUcvc+HxTwuKJE9ADCHPRKT3rxz2No8ny2cvZqibr2yCp08qGPTPdJn2Tn0QKS9CozkuvPbCD1HtCa9JzSaPE+hFz7zpqk8BYTNvAUm6z3zkmA89yHAPNv4BT6Qu5M91iQ1PKHuob2LkjO8M0ljvTLThD2dPiW9YTQmPSiFC71MNMO9tbM8PRNz97zCmvU9UPSQPC4ONz0lmlm9HFcwPCdZ9T0l3tU7tfb2vRcRuj2RsZm7KorYvAZswb2AU7y8nh+IPcu3gjvhyTg9AKLfPc/IWbl/LTq818g9PKuzt7yIoMI9soflPPfW6r1nIsQ98J9SPY8gTr2KmqA9EbaMvZOglD1S5/88MA3RvdIpzbxbpiE+JPazPWdE9bzsQ5G9XpsHPDBw5D17nxQ8CzFcvKC1mj0fQay9hEEauqWImrtd3jC93QMFPhI/xTzaCZU9hLrDvAxntL132Qy9B6zCPROXmjs6SwC+IJiQPA/9aT29Rfy6UcYoPUvNC73mirO9OLdfPS9uwr3D8po8ysGaPV9mGr0be+45UK0lvV/CgrxD4508qZvDvETLAT7zFLe8jWGBvf5cQLxeNqO9rWiNPXbRD72oZh49Z1cRvT1y/7wyYNu98CSWOuoN2b3NH0891AkXPup+UbwR55a9OIrOPKzUoj0XQJU9HgYkvZJ5Brw37ys9CUWBvIt+ArsAAIBAAACAP9ELvT0AgClFAECARQAAokJmZsJDAAAgRAAAkEIAAHlFAAAAQAAAiEIAANZCAAAAQKVkMr0AwAFEAAAAQACAL0UAgDJFAADEQs1MMUMAQLBFAABAQAAAoEAAAO1FAABAQQAAQEDx8HA+AABAQAAAAEAAAABAAACoQwAAQEDdnso9AAA6RQAAAEAAgIhFAADAQgAA/EIAAPhCAICFQwAAZkMAABBDAAAdQwAAgD8AgBpFAACAPwAAB0UAAPZFAABEQwAAxkKamVJDTWXSvQAAwEAAABBB6ryUPdpemzwAAKhEAAAKRQAAQEAAAABAgKvfO13yuT0AABBEAABMROy3kr0zM3tCAIAsRQAAREMAAF5FAECYRQAAvUIAAABAzcz0QgAAAkNhiwq957o+PeWU7L24XphDAABAQGbmh0N/Eqk8SduMPQAAoEIAAEBAAIC1RQAAnEUAgBdFAAAoQwAAMEEAQJhFAAD8RFfnsj1vhYe9f/iTPJsVyr0zc5ZDxT1oPTIJ4LwAgNZFAAB5RQAAIkQAAHBBAADgQDMzBUPNTDFDAACAPwCAAkUUrm5Dyy5xPSzKi7xmpg5EAADwQwAAhEMAAOFEAACAQAAAgEAAAAxCAAAAQPx1RT0XNye8AACAPxU65r0AgFBFAAB0QjMzBUMAgNZFAADAQQAAAEBQgs28AABeRAAA/EPd1QC+AAAAQAAAB0PL75O87Y90OxG+D7uCsL29Cv4lPfW2+rwAQJ5FAABAQADA0kWQb6c9ACDfQwBA+0Vm5jRDAICFQwAAEEVmprtDAAAdQwCAPkUAACVFElWDPADAk0UAwJlF/MkGPcIpbr0AAIA/CbaCvQAAlEIAAOFFjYHNvQAAOUOnGa+8CH3dPAAAMEF1H/47AACQQ4+qbz0AACBC5poGPQAAGUMAgIJDSKGiQ5mSOD0AAEBAAACQQgCAJkUAACJFgkWTPG9BXrwAAIA/MzMcRGh7lLsA6Wg9bMexvTMDfkQAAEBAN6mFPRIWFj6y5h49AACNRVr9l73X5DQ8uATXPRagmb2Yr4c9AIBBRQAAQEAAAIA/AABYQ862jb0AAD1DAIDBRc1MukMAALFCAAAAQf12r7yZZLC9AADMQ4YpNT4AAIRDAAAZRWdx7LwAAABDAACAPwCAKUXuL0s9Wh+3vQCAskWocmg8FK5uQwAAgD8AgJ1Db6ajPbo/hz3SUXM7AADPQlbhET4AAFVDj2h3PQAAz0IAAEhDAACAPwDAw0MAAB9FAACAPwAAIEIAgGhFACylvV0Y8zwAgI5FAADgQAAAvUIKV6tCJ+y4O49HV7xFLJk7zca+PQDA2EUzMwVDmhmPQwDAzEUAACJET34HPAAAgD8jbQS9CFphPOsOiL0AAJxEAAC0QwAALkQAAMBDMzP7Qmamu0MAAIdEAAA6RM+/7DxmZpVDAADPQgAA6kJIgYBDYtw0vQAAcEMbh4W9yEi2vTQBrLr1O+48V47xvFss6LsisX29eECuPalSlLsAAIdDzcx9QwAAC0Ne1MW8AECARQAAAEAn7RA76OMEPRod5D0AIAREAIC1RQCAhUNIgYBDeImaPAAAgD+M4ck9AADbRAAAjEJEywc+AAAQRGZm5kIAANJCAABAQAAAz0IAAEBAAADMQwAAlkR3R7I8AIAmRQAANEVYivk8SlvXPQAAKkMAAJxDmx6MPbWrYTwAAFpDwqDOvdKagj2gVTM8mpmcQmAdd73NzMdCAADSQgAAE0UAgIJDAABsQwAAGUXf2tg9ACAERAAAmUIAACVFAACNRQAAYUUAgCZFAACAP6Rw1kMAgH1FAICIRQAAS0MAAJJDAAAQQaAMCj0AACpDAECeRQAArkIARpS6hcxVvQAAgD83eU89d4Z8PQAAyEMAAHxDX+uCvbUEnz3PtoE8vsgeu2erIz23FsS7BkSIPc4aszwF5gM+x7WpvJiX6L1m8KS9gw4dPTkHH71HIOa9CyIwPaS9mbwmwsS7OdeVPELDhzvLkbK8I/uzvSrDjLvTzt88WkxYvcu1Hb2jr8M9HwsBPmNHdD0/H9C8KOx3PYvyGj3duUC9z8mSvY+Lj7ztNNI9MgFGPahszb0Po867tsSmvWuKBLxpOBQ9MCcGvVLU8bvwt5u9k2cau+iuqz2crAy9tia2veOcPb1D4rg8JwMZPY8ZdL2KD9y7UIlrPK+Znrzv3Vc9VyeOO1v+rb3h+IK8r92QPaPXkL2bK8w8YNCTPbMvO7yvI1Y9zzwZvADghTu90Pk94vRNvZvdAL4LfIk7rZ2ZPSLZtL2LxL87GwLivDf9q72Lq3A9IBaHvQvLP70KTVg94cdMPdCUe7hTPx48qmjXPeAKBr5uOZK7BUwFvocVuTwbjwE+gItZPJsegr3Tmh2+6BBjvexihz1C9Fq9HzowPdq03j31iVO94zvCvaJ9mjvvPSu+qLNevRdhjL2ioZg8e5CNPNCrYj35lAq9iJ6Eu+348jt4qZ+9ug9sPQr5VDxvQIQ54yQsPPvyVjy29aq8Sl4QPOPGwz0rnZK84Gi8PKNwwb3Hafe8r8tQPQjv67wCPxY+t0qjupAQWjxCqXa89kFBveCKwDwHOqA8oJ58vQ==",
+    "left": "AQAAAAMAAAAFAAAABwAAAAkAAAALAAAADQAAAA8AAAARAAAAEwAAABUAAAAXAAAAGQAAABsAAAAdAAAAHwAAACEAAAAjAAAAJQAAACcAAAApAAAAKwAAAC0AAAAvAAAAMQAAADMAAAA1AAAANwAAAP////85AAAAOwAAAD0AAAA/AAAAQQAAAEMAAAD/////RQAAAEcAAABJAAAASwAAAE0AAABPAAAAUQAAAFMAAAD/////VQAAAFcAAABZAAAAWwAAAF0AAABfAAAAYQAAAGMAAABlAAAAZwAAAGkAAAD/////awAAAG0AAABvAAAAcQAAAHMAAAB1AAAAdwAAAHkAAAB7AAAAfQAAAH8AAACBAAAA//////////+DAAAA/////4UAAACHAAAAiQAAAIsAAACNAAAAjwAAAJEAAACTAAAAlQAAAP////+XAAAAmQAAAJsAAACdAAAAnwAAAKEAAACjAAAApQAAAKcAAACpAAAAqwAAAK0AAAD/////rwAAALEAAACzAAAAtQAAALcAAAC5AAAA/////7sAAAC9AAAAvwAAAMEAAADDAAAAxQAAAMcAAADJAAAAywAAAM0AAADPAAAA/////////////////////9EAAADTAAAA1QAAANcAAADZAAAA/////9sAAADdAAAA/////98AAADhAAAA4wAAAP///////////////+UAAADnAAAA6QAAAOsAAADtAAAA/////+8AAADxAAAA8wAAAPUAAAD3AAAA+QAAAPsAAAD9AAAA/wAAAAEBAAD//////////wMBAAAFAQAABwEAAP////8JAQAACwEAAA0BAAAPAQAAEQEAAP////8TAQAAFQEAABcBAAAZAQAAGwEAAB0BAAD//////////x8BAAD/////IQEAACMBAAAlAQAAJwEAACkBAAArAQAALQEAAC8BAAAxAQAA/////zMBAAD/////NQEAAP////83AQAAOQEAADsBAAA9AQAAPwEAAEEBAABDAQAARQEAAEcBAABJAQAASwEAAE0BAABPAQAAUQEAAP///////////////1MBAABVAQAA/////1cBAAD///////////////9ZAQAAWwEAAF0BAAD/////XwEAAP////////////////////////////////////9hAQAAYwEAAGUBAABnAQAA//////////9pAQAAawEAAP///////////////20BAABvAQAA////////////////cQEAAHMBAAB1AQAAdwEAAHkBAAB7AQAAfQEAAP////9/AQAAgQEAAIMBAACFAQAAhwEAAIkBAACLAQAAjQEAAI8BAACRAQAAkwEAAJUBAACXAQAA/////5kBAACbAQAAnQEAAP////+fAQAAoQEAAKMBAAClAQAApwEAAKkBAAD/////////////////////qwEAAK0BAACvAQAAsQEAALMBAAC1AQAAtwEAALkBAAC7AQAAvQEAAL8BAADBAQAAwwEAAMUBAAD//////////8cBAADJAQAAywEAAM0BAADPAQAA0QEAANMBAADVAQAA1wEAANkBAADbAQAA3QEAAP/////fAQAA4QEAAP///////////////+MBAAD////////////////lAQAA5wEAAOkBAADrAQAA7QEAAO8BAADxAQAA8wEAAPUBAAD3AQAA+QEAAP/////7AQAA/QEAAP8BAAABAgAAAwIAAAUCAAAHAgAACQIAAAsCAAD/////DQIAAA8CAAARAgAAEwIAABUCAAAXAgAA//////////8ZAgAAGwIAAB0CAAAfAgAA/////yECAAD/////IwIAACUCAAAnAgAAKQIAAP////8rAgAA/////y0CAAAvAgAAMQIAADMCAAD/////NQIAADcCAAD//////////////////////////zkCAAA7AgAAPQIAAD8CAABBAgAA/////0MCAAD/////RQIAAP////9HAgAASQIAAEsCAAD/////TQIAAE8CAABRAgAAUwIAAFUCAABXAgAAWQIAAP////9bAgAAXQIAAF8CAABhAgAAYwIAAGUCAABnAgAA////////////////aQIAAGsCAABtAgAAbwIAAP////9xAgAA/////3MCAAB1AgAA/////3cCAAD///////////////95AgAAewIAAP////////////////////99AgAAfwIAAIECAACDAgAA//////////+FAgAAhwIAAIkCAACLAgAA//////////+NAgAAjwIAAJECAACTAgAAlQIAAJcCAACZAgAAmwIAAJ0CAAD/////nwIAAP////+hAgAAowIAAKUCAAD/////pwIAAKkCAACrAgAA////////////////rQIAAK8CAACxAgAAswIAALUCAAC3AgAAuQIAALsCAAD//////////70CAAC/AgAAwQIAAMMCAADFAgAAxwIAAMkCAADLAgAA/////80CAAD//////////88CAADRAgAA/////9MCAADVAgAA1wIAAP//////////2QIAAP/////bAgAA3QIAAP/////fAgAA/////////////////////+ECAADjAgAA5QIAAOcCAADpAgAA6wIAAP//////////7QIAAP/////vAgAA8QIAAPMCAAD1AgAA9wIAAPkCAAD7AgAA//////0CAAD/AgAAAQMAAAMDAAAFAwAABwMAAAkDAAD/////CwMAAA0DAAAPAwAAEQMAABMDAAD/////FQMAABcDAAAZAwAAGwMAAP//////////HQMAAP////8fAwAAIQMAACMDAAAlAwAAJwMAACkDAAArAwAA/////y0DAAAvAwAAMQMAADMDAAD///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////82AwAAOAMAADoDAAA8AwAAPgMAAEADAAD/////QgMAAEQDAABGAwAASAMAAEoDAABMAwAATgMAAFADAABSAwAAVAMAAFYDAABYAwAAWgMAAFwDAAD/////XgMAAGADAAD/////YgMAAGQDAABmAwAAaAMAAGoDAABsAwAAbgMAAHADAAByAwAAdAMAAHYDAAB4AwAAegMAAP////98AwAAfgMAAP//////////gAMAAP////+CAwAAhAMAAIYDAACIAwAAigMAAIwDAACOAwAAkAMAAJIDAACUAwAAlgMAAJgDAACaAwAAnAMAAJ4DAACgAwAAogMAAKQDAACmAwAAqAMAAKoDAACsAwAArgMAALADAACyAwAA/////7QDAAC2AwAAuAMAALoDAAD//////////7wDAAD/////vgMAAMADAADCAwAAxAMAAMYDAADIAwAAygMAAMwDAAD/////zgMAANADAADSAwAA1AMAANYDAADYAwAA2gMAANwDAADeAwAA4AMAAOIDAADkAwAA5gMAAOgDAAD/////6gMAAP/////sAwAA7gMAAPADAADyAwAA9AMAAPYDAAD4AwAA+gMAAPwDAAD+AwAAAAQAAAIEAAAEBAAABgQAAAgEAAAKBAAADAQAAA4EAAAQBAAA/////xIEAAAUBAAAFgQAABgEAAAaBAAAHAQAAB4EAAAgBAAAIgQAAP///////////////yQEAAD/////JgQAACgEAAAqBAAALAQAAC4EAAAwBAAAMgQAADQEAAD//////////zYEAAD//////////zgEAAD///////////////86BAAA/////////////////////zwEAAD/////PgQAAEAEAABCBAAARAQAAEYEAABIBAAASgQAAEwEAABOBAAAUAQAAFIEAABUBAAAVgQAAFgEAABaBAAA/////1wEAABeBAAA//////////9gBAAAYgQAAGQEAABmBAAAaAQAAGoEAAD/////bAQAAG4EAABwBAAAcgQAAHQEAAB2BAAAeAQAAHoEAAB8BAAAfgQAAIAEAACCBAAAhAQAAIYEAACIBAAAigQAAIwEAACOBAAA/////5AEAAD/////kgQAAP///////////////5QEAACWBAAAmAQAAJoEAAD//////////5wEAACeBAAA/////6AEAAD/////ogQAAKQEAACmBAAAqAQAAKoEAAD//////////6wEAACuBAAAsAQAALIEAAC0BAAAtgQAAP////+4BAAAugQAAP////+8BAAAvgQAAMAEAADCBAAAxAQAAMYEAADIBAAAygQAAMwEAADOBAAA0AQAAP///////////////9IEAADUBAAA1gQAANgEAAD//////////9oEAAD/////3AQAAN4EAAD//////////+AEAADiBAAA5AQAAOYEAADoBAAA6gQAAOwEAADuBAAA8AQAAPIEAAD/////9AQAAPYEAAD4BAAA//////oEAAD8BAAA///////////+BAAAAAUAAAIFAAAEBQAA/////wYFAAAIBQAACgUAAP///////////////wwFAAAOBQAAEAUAABIFAAAUBQAA/////xYFAAAYBQAAGgUAABwFAAD/////HgUAAP//////////IAUAACIFAAAkBQAAJgUAACgFAAAqBQAALAUAAC4FAAAwBQAAMgUAADQFAAA2BQAAOAUAADoFAAA8BQAA/////z4FAABABQAAQgUAAEQFAABGBQAASAUAAEoFAABMBQAATgUAAFAFAABSBQAAVAUAAP//////////VgUAAFgFAAD/////////////////////WgUAAFwFAABeBQAA/////2AFAABiBQAAZAUAAGYFAABoBQAAagUAAGwFAABuBQAAcAUAAHIFAAD/////////////////////dAUAAHYFAAB4BQAA/////3oFAAB8BQAAfgUAAIAFAACCBQAAhAUAAIYFAACIBQAA////////////////igUAAIwFAAD/////jgUAAJAFAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////5MFAACVBQAAlwUAAJkFAACbBQAAnQUAAP////+fBQAAoQUAAKMFAAClBQAApwUAAP////+pBQAAqwUAAK0FAACvBQAAsQUAALMFAAC1BQAAtwUAAP//////////uQUAALsFAAC9BQAAvwUAAMEFAADDBQAAxQUAAMcFAADJBQAAywUAAM0FAADPBQAA0QUAAP/////TBQAA1QUAANcFAADZBQAA2wUAAN0FAADfBQAA4QUAAOMFAADlBQAA5wUAAOkFAADrBQAA7QUAAO8FAAD/////8QUAAPMFAAD1BQAA9wUAAPkFAAD7BQAA/QUAAP8FAAABBgAAAwYAAAUGAAD/////BwYAAAkGAAALBgAADQYAAA8GAAD/////EQYAABMGAAAVBgAAFwYAABkGAAAbBgAA/////x0GAAAfBgAAIQYAACMGAAAlBgAAJwYAAP////8pBgAA/////ysGAAAtBgAALwYAADEGAAAzBgAANQYAADcGAAA5BgAAOwYAAD0GAAA/BgAAQQYAAEMGAABFBgAARwYAAEkGAABLBgAATQYAAE8GAABRBgAAUwYAAFUGAABXBgAAWQYAAFsGAABdBgAAXwYAAP////9hBgAAYwYAAGUGAABnBgAA//////////9pBgAAawYAAG0GAAD/////////////////////bwYAAP////9xBgAAcwYAAHUGAAB3BgAA/////3kGAAB7BgAAfQYAAH8GAAD/////gQYAAP////+DBgAAhQYAAIcGAAD/////iQYAAP///////////////4sGAACNBgAAjwYAAJEGAACTBgAAlQYAAJcGAACZBgAAmwYAAJ0GAACfBgAAoQYAAKMGAAClBgAApwYAAKkGAAD/////qwYAAK0GAACvBgAAsQYAALMGAAC1BgAAtwYAALkGAAC7BgAAvQYAAL8GAADBBgAAwwYAAMUGAADHBgAAyQYAAMsGAADNBgAAzwYAANEGAADTBgAA1QYAANcGAADZBgAA2wYAAN0GAADfBgAA4QYAAOMGAAD/////5QYAAOcGAAD//////////+kGAADrBgAA7QYAAO8GAAD///////////EGAADzBgAA9QYAAPcGAAD5BgAA+wYAAP0GAAD/BgAAAQcAAP///////////////wMHAAAFBwAA/////wcHAAAJBwAACwcAAA0HAAAPBwAAEQcAAP////8TBwAAFQcAABcHAAAZBwAAGwcAAP////8dBwAAHwcAACEHAAAjBwAA////////////////JQcAAP//////////JwcAAP//////////KQcAAP//////////KwcAAP////8tBwAALwcAADEHAAD/////MwcAADUHAAA3BwAAOQcAADsHAAA9BwAAPwcAAEEHAABDBwAA/////0UHAABHBwAASQcAAP////9LBwAATQcAAE8HAABRBwAA//////////9TBwAA//////////9VBwAA/////1cHAABZBwAA/////1sHAABdBwAAXwcAAGEHAAD/////YwcAAP////9lBwAAZwcAAGkHAAD/////awcAAG0HAAD/////bwcAAHEHAABzBwAAdQcAAHcHAAB5BwAAewcAAH0HAAB/BwAAgQcAAIMHAACFBwAAhwcAAIkHAACLBwAAjQcAAI8HAACRBwAAkwcAAJUHAACXBwAAmQcAAJsHAACdBwAAnwcAAKEHAACjBwAApQcAAKcHAACpBwAAqwcAAK0HAACvBwAAsQcAAP///////////////7MHAAD//////////7UHAAC3BwAA//////////+5BwAAuwcAAL0HAAC/BwAAwQcAAMMHAADFBwAAxwcAAMkHAADLBwAAzQcAAM8HAADRBwAA/////9MHAADVBwAA1wcAANkHAADbBwAA3QcAAN8HAADhBwAA4wcAAOUHAADnBwAA6QcAAOsHAADtBwAA/////+8HAAD////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////yBwAA9AcAAPYHAAD4BwAA+gcAAPwHAAD//////gcAAAAIAAACCAAABAgAAAYIAAAICAAACggAAAwIAAAOCAAAEAgAABIIAAAUCAAAFggAABgIAAD/////GggAAP////8cCAAAHggAACAIAAAiCAAAJAgAACYIAAAoCAAAKggAACwIAAAuCAAAMAgAADIIAAA0CAAANggAAP////84CAAAOggAAP////////////////////88CAAAPggAAEAIAABCCAAARAgAAEYIAABICAAASggAAEwIAABOCAAAUAgAAFIIAABUCAAAVggAAP//////////WAgAAFoIAABcCAAAXggAAGAIAABiCAAAZAgAAGYIAABoCAAAaggAAGwIAABuCAAAcAgAAHIIAAB0CAAAdggAAHgIAAB6CAAAfAgAAH4IAACACAAAgggAAP////+ECAAA//////////+GCAAAiAgAAIoIAACMCAAAjggAAJAIAACSCAAAlAgAAJYIAAD/////mAgAAJoIAACcCAAAnggAAKAIAACiCAAApAgAAKYIAACoCAAAqggAAKwIAACuCAAAsAgAALIIAAC0CAAAtggAALgIAAC6CAAAvAgAAL4IAADACAAA/////8IIAAD//////////8QIAADGCAAAyAgAAP//////////yggAAMwIAADOCAAA0AgAANIIAAD/////////////////////1AgAANYIAADYCAAA2ggAANwIAADeCAAA4AgAAP//////////4ggAAP/////kCAAA5ggAAOgIAADqCAAA/////+wIAADuCAAA8AgAAP/////yCAAA9AgAAPYIAAD/////+AgAAPoIAAD8CAAA///////////+CAAAAAkAAAIJAAD/////BAkAAAYJAAAICQAACgkAAAwJAAAOCQAAEAkAABIJAAD/////FAkAABYJAAAYCQAAGgkAABwJAAAeCQAAIAkAACIJAAAkCQAAJgkAACgJAAAqCQAALAkAAC4JAAAwCQAAMgkAADQJAAD/////NgkAAP//////////OAkAAP//////////OgkAADwJAAA+CQAAQAkAAEIJAAD//////////0QJAABGCQAASAkAAP////9KCQAATAkAAE4JAABQCQAAUgkAAFQJAABWCQAAWAkAAFoJAAD/////XAkAAF4JAAD/////////////////////YAkAAP//////////YgkAAGQJAABmCQAA//////////9oCQAAagkAAGwJAAD//////////////////////////////////////////24JAABwCQAAcgkAAHQJAAD///////////////92CQAA//////////94CQAAegkAAHwJAAB+CQAAgAkAAP//////////ggkAAIQJAACGCQAAiAkAAP////+KCQAAjAkAAI4JAACQCQAAkgkAAJQJAACWCQAAmAkAAJoJAACcCQAAngkAAKAJAACiCQAApAkAAKYJAAD//////////6gJAAD//////////6oJAACsCQAArgkAALAJAACyCQAAtAkAALYJAAC4CQAAugkAALwJAAC+CQAAwAkAAMIJAAD//////////8QJAADGCQAAyAkAAMoJAAD/////zAkAAM4JAADQCQAA0gkAANQJAADWCQAA2AkAANoJAADcCQAA3gkAAOAJAADiCQAA5AkAAOYJAADoCQAA/////+oJAAD/////7AkAAP//////////7gkAAPAJAADyCQAA9AkAAPYJAAD4CQAA+gkAAPwJAAD+CQAAAAoAAAIKAAAECgAA//////////8GCgAACAoAAAoKAAAMCgAA/////w4KAAAQCgAAEgoAABQKAAD/////FgoAABgKAAAaCgAA/////xwKAAAeCgAAIAoAAP////8iCgAAJAoAAP//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////JwoAACkKAAArCgAALQoAAC8KAAAxCgAA/////zMKAAA1CgAANwoAADkKAAD/////OwoAAD0KAAA/CgAAQQoAAEMKAABFCgAARwoAAEkKAABLCgAA//////////9NCgAATwoAAFEKAABTCgAAVQoAAFcKAABZCgAAWwoAAF0KAABfCgAAYQoAAGMKAABlCgAA/////2cKAABpCgAAawoAAG0KAABvCgAAcQoAAP////9zCgAAdQoAAHcKAAB5CgAAewoAAH0KAAB/CgAAgQoAAIMKAAD/////hQoAAIcKAACJCgAAiwoAAI0KAACPCgAAkQoAAJMKAACVCgAAlwoAAJkKAACbCgAAnQoAAJ8KAAChCgAAowoAAKUKAACnCgAAqQoAAKsKAACtCgAArwoAALEKAAD///////////////+zCgAAtQoAALcKAAC5CgAAuwoAAL0KAAC/CgAAwQoAAMMKAADFCgAAxwoAAMkKAADLCgAAzQoAAM8KAAD//////////9EKAADTCgAA1QoAANcKAADZCgAA/////9sKAADdCgAA3woAAOEKAADjCgAA5QoAAOcKAADpCgAA6woAAO0KAADvCgAA///////////xCgAA8woAAPUKAAD///////////cKAAD5CgAA+woAAP0KAAD/CgAAAQsAAP////8DCwAA/////wULAAD/////BwsAAAkLAAALCwAADQsAAA8LAAD///////////////8RCwAA/////xMLAAAVCwAA/////xcLAAAZCwAAGwsAAB0LAAAfCwAAIQsAACMLAAAlCwAAJwsAACkLAAArCwAALQsAAC8LAAD/////MQsAADMLAAD/////NQsAADcLAAA5CwAAOwsAAD0LAAA/CwAAQQsAAEMLAABFCwAARwsAAEkLAABLCwAATQsAAE8LAABRCwAAUwsAAFULAABXCwAAWQsAAFsLAABdCwAAXwsAAGELAAD/////YwsAAGULAAD/////ZwsAAGkLAABrCwAAbQsAAG8LAABxCwAAcwsAAHULAAB3CwAA////////////////eQsAAHsLAAD//////////30LAAB/CwAAgQsAAIMLAACFCwAA/////4cLAACJCwAAiwsAAI0LAACPCwAA/////5ELAACTCwAA/////5ULAACXCwAAmQsAAJsLAACdCwAAnwsAAKELAACjCwAApQsAAKcLAACpCwAAqwsAAP////+tCwAArwsAAP////+xCwAAswsAAP////+1CwAAtwsAAP////+5CwAAuwsAAL0LAAC/CwAAwQsAAMMLAADFCwAA/////8cLAADJCwAAywsAAM0LAADPCwAA0QsAANMLAADVCwAA1wsAANkLAADbCwAA3QsAAN8LAADhCwAA4wsAAP//////////5QsAAOcLAADpCwAA/////+sLAADtCwAA7wsAAPELAAD/////8wsAAPULAAD3CwAA+QsAAPsLAAD9CwAA/wsAAAEMAAD/////AwwAAP////8FDAAABwwAAAkMAAALDAAADQwAAA8MAAARDAAAEwwAABUMAAAXDAAAGQwAABsMAAD/////////////////////HQwAAP////8fDAAAIQwAACMMAAAlDAAAJwwAACkMAAArDAAALQwAAC8MAAD/////MQwAADMMAAA1DAAA////////////////NwwAAP////85DAAAOwwAAD0MAAD///////////////8/DAAAQQwAAEMMAABFDAAARwwAAEkMAABLDAAATQwAAP//////////TwwAAFEMAABTDAAAVQwAAFcMAABZDAAAWwwAAF0MAABfDAAAYQwAAGMMAABlDAAAZwwAAGkMAABrDAAAbQwAAG8MAABxDAAAcwwAAHUMAAD///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////94DAAAegwAAHwMAAB+DAAAgAwAAIIMAAD/////hAwAAIYMAACIDAAAigwAAP//////////jAwAAI4MAACQDAAAkgwAAJQMAACWDAAAmAwAAJoMAACcDAAAngwAAKAMAACiDAAApAwAAKYMAACoDAAAqgwAAKwMAACuDAAAsAwAALIMAAC0DAAAtgwAALgMAAD/////ugwAALwMAAC+DAAAwAwAAMIMAADEDAAAxgwAAMgMAADKDAAAzAwAAM4MAADQDAAA0gwAANQMAAD//////////9YMAADYDAAA2gwAANwMAADeDAAA4AwAAOIMAADkDAAA5gwAAOgMAADqDAAA7AwAAP//////////7gwAAP/////wDAAA8gwAAPQMAAD2DAAA+AwAAPoMAAD8DAAA/gwAAAANAAACDQAA/////////////////////wQNAAD/////Bg0AAAgNAAAKDQAADA0AAA4NAAAQDQAAEg0AABQNAAAWDQAAGA0AABoNAAAcDQAAHg0AACANAAAiDQAAJA0AACYNAAAoDQAAKg0AAP//////////LA0AAC4NAAAwDQAAMg0AAP////80DQAANg0AADgNAAA6DQAAPA0AAP////8+DQAA/////0ANAAD/////Qg0AAEQNAAD/////Rg0AAEgNAABKDQAATA0AAE4NAABQDQAAUg0AAFQNAABWDQAAWA0AAP////9aDQAAXA0AAP////9eDQAAYA0AAP////9iDQAAZA0AAGYNAABoDQAAag0AAGwNAABuDQAAcA0AAHINAAB0DQAAdg0AAHgNAAB6DQAA/////3wNAAB+DQAAgA0AAIINAACEDQAAhg0AAIgNAACKDQAAjA0AAI4NAACQDQAAkg0AAJQNAACWDQAAmA0AAJoNAACcDQAAng0AAKANAACiDQAApA0AAKYNAACoDQAAqg0AAKwNAACuDQAA////////////////sA0AAP////+yDQAA/////7QNAAC2DQAAuA0AALoNAAC8DQAAvg0AAMANAAD//////////8INAADEDQAAxg0AAMgNAAD////////////////KDQAA/////8wNAADODQAA0A0AANINAADUDQAA1g0AANgNAAD//////////9oNAADcDQAA/////94NAAD/////4A0AAOINAADkDQAA///////////////////////////mDQAA6A0AAOoNAADsDQAA////////////////7g0AAPANAAD/////////////////////8g0AAPQNAAD2DQAA+A0AAPoNAAD8DQAA/g0AAAAOAAACDgAA/////wQOAAAGDgAACA4AAAoOAAAMDgAADg4AABAOAAASDgAAFA4AABYOAAAYDgAAGg4AABwOAAAeDgAA//////////8gDgAAIg4AACQOAAAmDgAAKA4AACoOAAD/////LA4AAP//////////Lg4AADAOAAAyDgAANA4AADYOAAA4DgAAOg4AADwOAAA+DgAAQA4AAEIOAABEDgAARg4AAEgOAABKDgAATA4AAE4OAABQDgAAUg4AAFQOAABWDgAAWA4AAFoOAABcDgAAXg4AAP////9gDgAAYg4AAGQOAABmDgAAaA4AAGoOAAD//////////////////////////2wOAAD//////////24OAAD/////cA4AAP////9yDgAAdA4AAP////92DgAAeA4AAHoOAAB8DgAAfg4AAIAOAACCDgAAhA4AAIYOAACIDgAAig4AAIwOAACODgAAkA4AAJIOAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////lQ4AAJcOAACZDgAAmw4AAJ0OAACfDgAA/////6EOAACjDgAApQ4AAKcOAACpDgAA/////6sOAACtDgAArw4AALEOAACzDgAAtQ4AALcOAAC5DgAA//////////+7DgAAvQ4AAL8OAADBDgAAww4AAMUOAADHDgAAyQ4AAMsOAADNDgAAzw4AANEOAADTDgAA1Q4AAP//////////1w4AANkOAADbDgAA3Q4AAN8OAADhDgAA///////////jDgAA5Q4AAOcOAADpDgAA6w4AAO0OAADvDgAA8Q4AAPMOAAD1DgAA9w4AAPkOAAD7DgAA/Q4AAP8OAAABDwAAAw8AAAUPAAD/////Bw8AAAkPAAD/////Cw8AAA0PAAAPDwAAEQ8AABMPAAAVDwAAFw8AABkPAAAbDwAAHQ8AAB8PAAAhDwAAIw8AACUPAAAnDwAAKQ8AACsPAAD/////LQ8AAC8PAAD/////MQ8AADMPAAA1DwAANw8AADkPAAA7DwAAPQ8AAD8PAABBDwAAQw8AAEUPAABHDwAASQ8AAEsPAABNDwAATw8AAFEPAABTDwAAVQ8AAP////9XDwAAWQ8AAP////9bDwAAXQ8AAP////9fDwAAYQ8AAGMPAABlDwAAZw8AAGkPAABrDwAAbQ8AAG8PAABxDwAAcw8AAHUPAAB3DwAAeQ8AAP////97DwAAfQ8AAP////9/DwAA/////4EPAAD/////gw8AAIUPAACHDwAAiQ8AAIsPAACNDwAAjw8AAJEPAACTDwAAlQ8AAJcPAACZDwAAmw8AAJ0PAACfDwAAoQ8AAP////+jDwAApQ8AAKcPAACpDwAAqw8AAK0PAACvDwAAsQ8AALMPAAD///////////////+1DwAAtw8AALkPAAC7DwAAvQ8AAL8PAADBDwAAww8AAMUPAADHDwAAyQ8AAMsPAADNDwAAzw8AANEPAADTDwAA1Q8AANcPAADZDwAA/////9sPAADdDwAA/////98PAADhDwAA4w8AAOUPAADnDwAA///////////pDwAA6w8AAO0PAADvDwAA8Q8AAPMPAAD/////////////////////////////////////9Q8AAPcPAAD/////+Q8AAP/////7DwAA/Q8AAP8PAAABEAAAAxAAAAUQAAD//////////wcQAAD//////////////////////////wkQAAALEAAADRAAAP////8PEAAAERAAABMQAAAVEAAAFxAAAP///////////////xkQAAAbEAAA//////////8dEAAAHxAAAP////8hEAAA/////yMQAAAlEAAA/////ycQAAApEAAAKxAAAC0QAAAvEAAAMRAAAP////8zEAAANRAAADcQAAA5EAAAOxAAAD0QAAD//////////////////////////////////////////z8QAAD/////QRAAAEMQAABFEAAA/////0cQAABJEAAASxAAAP//////////TRAAAE8QAABREAAAUxAAAFUQAABXEAAAWRAAAFsQAABdEAAAXxAAAP//////////YRAAAGMQAABlEAAAZxAAAGkQAAD/////axAAAG0QAABvEAAAcRAAAHMQAAD/////dRAAAHcQAAB5EAAAexAAAH0QAAB/EAAAgRAAAIMQAACFEAAAhxAAAIkQAACLEAAA//////////+NEAAAjxAAAP//////////kRAAAP////+TEAAA/////5UQAAD/////lxAAAJkQAACbEAAAnRAAAJ8QAAChEAAAoxAAAKUQAACnEAAAqRAAAKsQAACtEAAArxAAALEQAACzEAAAtRAAALcQAAC5EAAAuxAAAL0QAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wBAAAMIQAADEEAAAxhAAAMgQAADKEAAA/////8wQAADOEAAA0BAAANIQAADUEAAA/////9YQAADYEAAA2hAAANwQAADeEAAA4BAAAOIQAADkEAAA///////////mEAAA6BAAAOoQAADsEAAA7hAAAPAQAADyEAAA9BAAAPYQAAD4EAAA+hAAAPwQAAD+EAAAABEAAAIRAAAEEQAABhEAAAgRAAAKEQAA/////wwRAAAOEQAAEBEAABIRAAAUEQAAFhEAABgRAAAaEQAAHBEAAB4RAAAgEQAAIhEAACQRAAAmEQAAKBEAACoRAAAsEQAALhEAADARAAD/////MhEAADQRAAA2EQAAOBEAADoRAAA8EQAAPhEAAEARAABCEQAARBEAAEYRAABIEQAAShEAAEwRAABOEQAAUBEAAP//////////UhEAAFQRAABWEQAAWBEAAFoRAABcEQAAXhEAAGARAABiEQAAZBEAAP//////////ZhEAAGgRAABqEQAAbBEAAG4RAABwEQAAchEAAHQRAAB2EQAAeBEAAHoRAAB8EQAAfhEAAIARAACCEQAAhBEAAIYRAACIEQAAihEAAP////+MEQAAjhEAAJARAACSEQAA////////////////lBEAAP//////////lhEAAJgRAACaEQAAnBEAAJ4RAACgEQAAohEAAP////+kEQAAphEAAKgRAACqEQAA//////////+sEQAArhEAALARAACyEQAA/////7QRAAC2EQAAuBEAALoRAAC8EQAAvhEAAMARAADCEQAA////////////////xBEAAMYRAADIEQAAyhEAAMwRAADOEQAA0BEAANIRAADUEQAA1hEAANgRAADaEQAA3BEAAN4RAADgEQAA4hEAAOQRAADmEQAA6BEAAP//////////6hEAAOwRAADuEQAA8BEAAPIRAAD0EQAA9hEAAPgRAAD6EQAA/BEAAP4RAAAAEgAAAhIAAAQSAAAGEgAACBIAAAoSAAAMEgAADhIAABASAAASEgAAFBIAABYSAAAYEgAAGhIAABwSAAAeEgAAIBIAAP////8iEgAAJBIAACYSAAAoEgAAKhIAACwSAAAuEgAAMBIAADISAAA0EgAA//////////82EgAAOBIAADoSAAA8EgAAPhIAAEASAABCEgAARBIAAEYSAAD/////SBIAAEoSAAD//////////0wSAABOEgAAUBIAAFISAABUEgAAVhIAAFgSAABaEgAA//////////9cEgAAXhIAAP////9gEgAAYhIAAP//////////////////////////ZBIAAGYSAABoEgAAahIAAGwSAABuEgAAcBIAAHISAAB0EgAA////////////////dhIAAP////94EgAAehIAAHwSAAB+EgAAgBIAAIISAACEEgAAhhIAAIgSAACKEgAAjBIAAI4SAAD/////kBIAAJISAAD/////lBIAAJYSAACYEgAA/////5oSAACcEgAAnhIAAKASAACiEgAApBIAAKYSAAD/////qBIAAP////+qEgAArBIAAP//////////rhIAAP//////////sBIAALISAAD///////////////+0EgAAthIAAP////+4EgAAuhIAALwSAAC+EgAAwBIAAMISAAD/////xBIAAMYSAADIEgAAyhIAAP/////MEgAAzhIAAP///////////////9ASAADSEgAA1BIAANYSAADYEgAA2hIAANwSAADeEgAA4BIAAOISAADkEgAA5hIAAOgSAAD/////6hIAAOwSAADuEgAA8BIAAPISAAD0EgAA9hIAAPgSAAD6EgAA/BIAAP4SAAAAEwAA/////////////////////wITAAD/////BBMAAAYTAAD///////////////8IEwAAChMAAAwTAAAOEwAAEBMAABITAAAUEwAAFhMAABgTAAAaEwAAHBMAAB4TAAAgEwAAIhMAAP////8kEwAAJhMAACgTAAAqEwAALBMAAC4TAAAwEwAAMhMAAP////80EwAANhMAADgTAAA6EwAAPBMAAD4TAABAEwAAQhMAAEQTAABGEwAASBMAAP//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////SxMAAE0TAABPEwAAURMAAFMTAABVEwAAVxMAAFkTAABbEwAAXRMAAF8TAAD/////YRMAAGMTAAD/////ZRMAAGcTAABpEwAAaxMAAG0TAABvEwAAcRMAAHMTAAD///////////////91EwAAdxMAAHkTAAB7EwAAfRMAAH8TAACBEwAAgxMAAIUTAACHEwAAiRMAAIsTAACNEwAAjxMAAJETAACTEwAA//////////+VEwAA/////5cTAACZEwAAmxMAAJ0TAACfEwAAoRMAAKMTAAClEwAApxMAAKkTAACrEwAArRMAAK8TAACxEwAAsxMAALUTAAC3EwAAuRMAALsTAAC9EwAAvxMAAMETAADDEwAAxRMAAMcTAADJEwAAyxMAAM0TAAD/////zxMAAP/////REwAA0xMAANUTAADXEwAA2RMAANsTAADdEwAA3xMAAOETAAD/////4xMAAOUTAADnEwAA6RMAAOsTAADtEwAA7xMAAPETAADzEwAA9RMAAPcTAAD5EwAA+xMAAP0TAAD/EwAAARQAAAMUAAAFFAAABxQAAAkUAAALFAAADRQAAA8UAAARFAAAExQAABUUAAAXFAAAGRQAAP//////////GxQAAB0UAAD/////HxQAACEUAAAjFAAAJRQAACcUAAApFAAAKxQAAC0UAAAvFAAAMRQAADMUAAD/////////////////////NRQAADcUAAA5FAAAOxQAAD0UAAA/FAAAQRQAAEMUAABFFAAARxQAAEkUAABLFAAA/////00UAABPFAAAURQAAFMUAABVFAAAVxQAAP////9ZFAAA//////////9bFAAAXRQAAF8UAABhFAAAYxQAAGUUAABnFAAAaRQAAGsUAABtFAAAbxQAAHEUAABzFAAA/////3UUAAB3FAAAeRQAAHsUAAB9FAAAfxQAAIEUAACDFAAAhRQAAP////+HFAAAiRQAAP////+LFAAAjRQAAI8UAACRFAAAkxQAAP////+VFAAAlxQAAJkUAACbFAAA/////50UAACfFAAAoRQAAKMUAAClFAAApxQAAKkUAACrFAAArRQAAK8UAACxFAAAsxQAALUUAAC3FAAA//////////+5FAAA/////7sUAAD/////vRQAAL8UAAD/////wRQAAP/////DFAAAxRQAAMcUAADJFAAAyxQAAM0UAADPFAAA0RQAAP//////////0xQAAP/////VFAAA1xQAANkUAAD/////2xQAAN0UAADfFAAA4RQAAP/////jFAAA5RQAAOcUAADpFAAA6xQAAO0UAADvFAAA8RQAAPMUAAD1FAAA///////////3FAAA+RQAAPsUAAD///////////0UAAD//////xQAAAEVAAADFQAABRUAAP////////////////////8HFQAA/////wkVAAALFQAADRUAAP////8PFQAAERUAABMVAAAVFQAAFxUAABkVAAD/////GxUAAB0VAAAfFQAAIRUAAP////8jFQAAJRUAACcVAAD/////KRUAACsVAAAtFQAALxUAADEVAAAzFQAA/////zUVAAD//////////zcVAAA5FQAAOxUAAP//////////////////////////PRUAAD8VAABBFQAAQxUAAEUVAAD/////RxUAAEkVAABLFQAA//////////9NFQAA//////////9PFQAAURUAAFMVAABVFQAAVxUAAFkVAABbFQAA/////10VAABfFQAAYRUAAGMVAABlFQAAZxUAAGkVAABrFQAAbRUAAG8VAABxFQAAcxUAAHUVAAD/////dxUAAHkVAAB7FQAA/////30VAAB/FQAAgRUAAIMVAACFFQAAhxUAAIkVAAD/////ixUAAI0VAACPFQAAkRUAAJMVAACVFQAAlxUAAJkVAAD//////////5sVAAD///////////////////////////////+dFQAA/////58VAAChFQAAoxUAAKUVAACnFQAAqRUAAP////+rFQAArRUAAK8VAACxFQAAsxUAALUVAAC3FQAAuRUAALsVAAC9FQAA/////78VAADBFQAAwxUAAMUVAADHFQAA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////yhUAAMwVAADOFQAA0BUAANIVAADUFQAA1hUAANgVAADaFQAA3BUAAN4VAADgFQAA4hUAAOQVAADmFQAA6BUAAOoVAADsFQAA7hUAAPAVAADyFQAA9BUAAPYVAAD4FQAA+hUAAPwVAAD+FQAAABYAAAIWAAAEFgAABhYAAAgWAAAKFgAADBYAAA4WAAAQFgAAEhYAABQWAAAWFgAAGBYAABoWAAAcFgAAHhYAACAWAAAiFgAA//////////8kFgAAJhYAACgWAAAqFgAALBYAAC4WAAAwFgAAMhYAADQWAAA2FgAAOBYAADoWAAA8FgAAPhYAAEAWAABCFgAA////////////////RBYAAEYWAABIFgAAShYAAEwWAABOFgAAUBYAAFIWAABUFgAAVhYAAFgWAABaFgAAXBYAAF4WAABgFgAAYhYAAGQWAABmFgAAaBYAAP////9qFgAAbBYAAG4WAABwFgAAchYAAHQWAAB2FgAAeBYAAHoWAAB8FgAAfhYAAIAWAACCFgAA/////4QWAACGFgAAiBYAAIoWAACMFgAAjhYAAJAWAACSFgAA/////5QWAACWFgAAmBYAAJoWAACcFgAAnhYAAKAWAACiFgAApBYAAKYWAAD/////qBYAAKoWAACsFgAArhYAAP////+wFgAAshYAALQWAAC2FgAAuBYAALoWAAC8FgAAvhYAAMAWAADCFgAAxBYAAMYWAADIFgAAyhYAAMwWAADOFgAA0BYAANIWAADUFgAA1hYAANgWAADaFgAA3BYAAN4WAADgFgAA4hYAAOQWAAD/////5hYAAOgWAAD/////6hYAAOwWAADuFgAA8BYAAPIWAAD0FgAA9hYAAPgWAAD6FgAA/BYAAP4WAAAAFwAAAhcAAAQXAAAGFwAACBcAAAoXAAAMFwAADhcAABAXAAASFwAAFBcAABYXAAAYFwAAGhcAABwXAAAeFwAAIBcAACIXAAAkFwAAJhcAAP//////////KBcAACoXAAAsFwAALhcAAP////8wFwAAMhcAAP//////////NBcAAP///////////////zYXAAA4FwAAOhcAAP//////////PBcAAP///////////////z4XAABAFwAA/////0IXAABEFwAARhcAAEgXAABKFwAATBcAAE4XAABQFwAAUhcAAP////9UFwAAVhcAAP////9YFwAAWhcAAFwXAABeFwAAYBcAAP////9iFwAAZBcAAP///////////////2YXAABoFwAAahcAAGwXAABuFwAAcBcAAHIXAAB0FwAAdhcAAHgXAAB6FwAAfBcAAH4XAACAFwAA/////4IXAAD/////hBcAAIYXAACIFwAAihcAAIwXAACOFwAA/////5AXAAD/////////////////////khcAAP///////////////5QXAAD//////////5YXAAD/////mBcAAP//////////mhcAAJwXAACeFwAAoBcAAKIXAACkFwAAphcAAKgXAACqFwAArBcAAK4XAACwFwAAshcAALQXAAC2FwAAuBcAAP///////////////7oXAAC8FwAAvhcAAP//////////wBcAAMIXAADEFwAA/////8YXAADIFwAAyhcAAMwXAADOFwAA0BcAANIXAADUFwAA1hcAANgXAAD/////2hcAANwXAADeFwAA4BcAAOIXAADkFwAA5hcAAOgXAADqFwAA7BcAAO4XAADwFwAA8hcAAPQXAAD2FwAA+BcAAPoXAAD8FwAA/hcAAAAYAAACGAAABBgAAAYYAAAIGAAAChgAAAwYAAAOGAAAEBgAABIYAAD///////////////8UGAAA/////xYYAAD//////////xgYAAAaGAAA/////////////////////xwYAAAeGAAA//////////8gGAAA/////yIYAAAkGAAAJhgAAP////8oGAAAKhgAACwYAAD/////LhgAADAYAAAyGAAANBgAADYYAAA4GAAA/////zoYAAA8GAAAPhgAAEAYAABCGAAARBgAAEYYAABIGAAAShgAAEwYAABOGAAAUBgAAFIYAABUGAAA/////////////////////1YYAAD/////WBgAAFoYAAD/////////////////////XBgAAF4YAAD/////YBgAAGIYAAD/////////////////////ZBgAAP////9mGAAAaBgAAGoYAABsGAAAbhgAAHAYAAD/////chgAAHQYAAB2GAAAeBgAAHoYAAB8GAAAfhgAAIAYAACCGAAAhBgAAIYYAACIGAAAihgAAIwYAACOGAAAkBgAAJIYAAD/////lBgAAJYYAAD/////mBgAAJoYAACcGAAAnhgAAKAYAACiGAAApBgAAKYYAAD/////qBgAAKoYAAD/////rBgAAP////////////////////+uGAAAsBgAALIYAAC0GAAA//////////+2GAAA/////////////////////7gYAAD/////uhgAAP////+8GAAAvhgAAP//////////////////////////wBgAAP/////CGAAAxBgAAMYYAADIGAAAyhgAAMwYAADOGAAA0BgAANIYAAD//////////9QYAADWGAAA///////////YGAAA2hgAANwYAADeGAAA///////////gGAAA4hgAAOQYAADmGAAA6BgAAOoYAADsGAAA7hgAAPAYAADyGAAA9BgAAPYYAAD4GAAA+hgAAPwYAAD+GAAAABkAAAIZAAD//////////wQZAAAGGQAACBkAAAoZAAAMGQAADhkAABAZAAASGQAAFBkAABYZAAAYGQAAGhkAAP////8cGQAAHhkAACAZAAAiGQAAJBkAACYZAAAoGQAAKhkAACwZAAAuGQAAMBkAADIZAAA0GQAANhkAADgZAAA6GQAA/////zwZAAA+GQAAQBkAAEIZAABEGQAARhkAAEgZAAD/////ShkAAEwZAABOGQAAUBkAAFIZAABUGQAAVhkAAFgZAABaGQAAXBkAAF4ZAABgGQAAYhkAAGQZAABmGQAAaBkAAGoZAABsGQAAbhkAAHAZAAD/////chkAAHQZAAB2GQAAeBkAAHoZAAB8GQAAfhkAAP////+AGQAA//////////+CGQAA/////4QZAAD/////hhkAAP////+IGQAA//////////+KGQAA//////////+MGQAAjhkAAP///////////////5AZAAD//////////////////////////5IZAACUGQAA////////////////lhkAAJgZAAD//////////5oZAAD/////nBkAAJ4ZAAD//////////6AZAACiGQAApBkAAKYZAAD//////////6gZAACqGQAArBkAAK4ZAACwGQAA////////////////////////////////shkAAP////+0GQAA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////txkAALkZAAC7GQAAvRkAAL8ZAADBGQAAwxkAAMUZAADHGQAAyRkAAMsZAADNGQAAzxkAAP//////////0RkAANMZAADVGQAA1xkAANkZAADbGQAA3RkAAN8ZAAD////////////////hGQAA4xkAAOUZAADnGQAA6RkAAOsZAADtGQAA7xkAAPEZAADzGQAA9RkAAPcZAAD5GQAA+xkAAP0ZAAD/GQAAARoAAP//////////AxoAAAUaAAAHGgAACRoAAAsaAAANGgAADxoAABEaAAATGgAAFRoAABcaAAAZGgAAGxoAAB0aAAAfGgAAIRoAACMaAAAlGgAA/////ycaAAApGgAAKxoAAC0aAAAvGgAAMRoAADMaAAA1GgAA//////////83GgAA/////zkaAAD/////OxoAAD0aAAA/GgAAQRoAAEMaAABFGgAARxoAAEkaAAD///////////////9LGgAATRoAAE8aAAD/////URoAAFMaAABVGgAAVxoAAFkaAABbGgAA//////////9dGgAAXxoAAGEaAAD/////YxoAAGUaAABnGgAAaRoAAGsaAABtGgAAbxoAAHEaAABzGgAA/////3UaAAD/////dxoAAHkaAAB7GgAA/////30aAAB/GgAAgRoAAIMaAACFGgAAhxoAAIkaAAD//////////////////////////4saAACNGgAAjxoAAJEaAACTGgAAlRoAAJcaAACZGgAAmxoAAJ0aAAD///////////////+fGgAAoRoAAKMaAAClGgAApxoAAKkaAACrGgAA//////////+tGgAArxoAALEaAAD/////sxoAALUaAAC3GgAAuRoAALsaAAC9GgAAvxoAAMEaAAD/////wxoAAMUaAADHGgAAyRoAAMsaAADNGgAAzxoAAP/////RGgAA0xoAAP/////VGgAA1xoAANkaAADbGgAA3RoAAN8aAADhGgAA4xoAAOUaAADnGgAA6RoAAP///////////////////////////////+saAAD/////////////////////7RoAAP/////vGgAA8RoAAPMaAAD1GgAA9xoAAPkaAAD7GgAA/RoAAP//////GgAAARsAAP////8DGwAABRsAAAcbAAD///////////////8JGwAA/////wsbAAANGwAADxsAABEbAAATGwAAFRsAABcbAAD/////GRsAABsbAAD/////HRsAAB8bAAAhGwAAIxsAAP////8lGwAAJxsAAP////8pGwAA/////ysbAAAtGwAALxsAADEbAAAzGwAANRsAAP//////////NxsAADkbAAA7GwAAPRsAAD8bAAD///////////////9BGwAAQxsAAEUbAABHGwAA/////0kbAABLGwAATRsAAE8bAABRGwAAUxsAAFUbAABXGwAAWRsAAFsbAABdGwAA/////18bAABhGwAA/////2MbAAD/////ZRsAAP////9nGwAAaRsAAGsbAABtGwAA/////28bAABxGwAAcxsAAHUbAAB3GwAAeRsAAHsbAAB9GwAAfxsAAIEbAACDGwAAhRsAAIcbAACJGwAAixsAAI0bAACPGwAAkRsAAJMbAACVGwAAlxsAAJkbAACbGwAA/////50bAACfGwAAoRsAAKMbAAClGwAApxsAAKkbAACrGwAArRsAAK8bAACxGwAAsxsAALUbAAC3GwAAuRsAALsbAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////vhsAAMAbAADCGwAAxBsAAMYbAADIGwAAyhsAAMwbAADOGwAA0BsAANIbAADUGwAA1hsAANgbAADaGwAA3BsAAN4bAADgGwAA4hsAAOQbAADmGwAA///////////oGwAA6hsAAOwbAADuGwAA8BsAAPIbAAD0GwAA9hsAAPgbAAD6GwAA/BsAAP4bAAAAHAAAAhwAAAQcAAAGHAAACBwAAAocAAAMHAAADhwAABAcAAASHAAAFBwAAP////8WHAAAGBwAABocAAAcHAAAHhwAAP////8gHAAA/////yIcAAAkHAAAJhwAACgcAAAqHAAA/////ywcAAAuHAAAMBwAADIcAAA0HAAANhwAADgcAAA6HAAAPBwAAD4cAABAHAAA/////0IcAABEHAAARhwAAEgcAABKHAAATBwAAE4cAAD/////UBwAAFIcAABUHAAAVhwAAFgcAABaHAAAXBwAAP////9eHAAAYBwAAGIcAABkHAAAZhwAAGgcAAD/////ahwAAGwcAABuHAAA/////3AcAAByHAAAdBwAAHYcAAB4HAAA/////////////////////3ocAAB8HAAAfhwAAIAcAACCHAAA/////4QcAACGHAAAiBwAAIocAACMHAAAjhwAAJAcAACSHAAAlBwAAJYcAAD//////////5gcAACaHAAAnBwAAJ4cAACgHAAA//////////+iHAAA/////6QcAACmHAAAqBwAAKocAACsHAAArhwAAP////+wHAAAshwAALQcAAC2HAAAuBwAALocAAC8HAAAvhwAAMAcAADCHAAAxBwAAMYcAADIHAAAyhwAAP/////MHAAAzhwAANAcAADSHAAA1BwAANYcAAD/////2BwAANocAADcHAAA/////94cAADgHAAA4hwAAOQcAAD/////5hwAAOgcAADqHAAA/////+wcAAD//////////+4cAADwHAAA8hwAAPQcAAD2HAAA//////gcAAD6HAAA//////wcAAD///////////4cAAAAHQAA/////wIdAAD///////////////8EHQAABh0AAAgdAAAKHQAADB0AAA4dAAAQHQAAEh0AABQdAAAWHQAA/////xgdAAAaHQAA/////xwdAAAeHQAAIB0AACIdAAAkHQAA/////yYdAAAoHQAAKh0AACwdAAAuHQAAMB0AADIdAAD//////////zQdAAA2HQAAOB0AAP////86HQAAPB0AAD4dAABAHQAAQh0AAEQdAABGHQAASB0AAP//////////Sh0AAEwdAABOHQAAUB0AAFIdAABUHQAAVh0AAFgdAABaHQAAXB0AAF4dAABgHQAAYh0AAGQdAABmHQAAaB0AAGodAABsHQAA//////////9uHQAAcB0AAHIdAAB0HQAAdh0AAHgdAAB6HQAAfB0AAP//////////fh0AAP///////////////4AdAAD/////gh0AAP///////////////4QdAACGHQAAiB0AAP///////////////4odAACMHQAAjh0AAJAdAACSHQAAlB0AAJYdAACYHQAA/////5odAACcHQAAnh0AAKAdAACiHQAApB0AAP////+mHQAAqB0AAKodAACsHQAArh0AALAdAACyHQAAtB0AALYdAAC4HQAAuh0AALwdAAD/////vh0AAP//////////wB0AAP/////CHQAA/////8QdAADGHQAA///////////IHQAAyh0AAP/////////////////////MHQAAzh0AANAdAADSHQAA1B0AANYdAADYHQAA/////9odAAD/////3B0AAP/////eHQAA4B0AAP/////iHQAA5B0AAOYdAAD/////6B0AAOodAADsHQAA7h0AAPAdAADyHQAA9B0AAP//////////9h0AAPgdAAD6HQAA//////wdAAD//////h0AAAAeAAACHgAABB4AAAYeAAAIHgAACh4AAAweAAD//////////w4eAAD/////EB4AABIeAAAUHgAAFh4AABgeAAAaHgAAHB4AAB4eAAAgHgAAIh4AAP//////////JB4AACYeAAAoHgAAKh4AACweAAAuHgAA//////////8wHgAA//////////8yHgAANB4AADYeAAD/////OB4AAP////86HgAA/////zweAAD///////////////8+HgAAQB4AAP///////////////0IeAABEHgAA//////////9GHgAASB4AAEoeAABMHgAATh4AAFAeAABSHgAAVB4AAFYeAAD/////WB4AAFoeAABcHgAAXh4AAGAeAABiHgAAZB4AAGYeAABoHgAAah4AAGweAABuHgAAcB4AAHIeAAB0HgAAdh4AAP////94HgAA//////////96HgAA//////////98HgAAfh4AAIAeAACCHgAA//////////+EHgAAhh4AAP////+IHgAAih4AAIweAACOHgAAkB4AAJIeAACUHgAA/////5YeAAD/////mB4AAJoeAACcHgAAnh4AAKAeAACiHgAApB4AAKYeAACoHgAAqh4AAP//////////rB4AAK4eAACwHgAAsh4AALQeAAC2HgAAuB4AALoeAAC8HgAAvh4AAMAeAADCHgAAxB4AAMYeAADIHgAAyh4AAMweAADOHgAA/////9AeAADSHgAA1B4AANYeAADYHgAA2h4AANweAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////3x4AAOEeAADjHgAA5R4AAOceAADpHgAA6x4AAO0eAADvHgAA8R4AAPMeAAD1HgAA//////ceAAD/////+R4AAPseAAD9HgAA/x4AAAEfAAADHwAABR8AAAcfAAD/////CR8AAP//////////Cx8AAA0fAAAPHwAAER8AABMfAAAVHwAAFx8AABkfAAAbHwAAHR8AAB8fAAAhHwAAIx8AACUfAAAnHwAAKR8AAP//////////Kx8AAP////8tHwAALx8AADEfAAAzHwAANR8AAP////83HwAAOR8AADsfAAA9HwAAPx8AAEEfAAD/////Qx8AAEUfAABHHwAASR8AAEsfAABNHwAATx8AAFEfAABTHwAAVR8AAFcfAABZHwAA//////////9bHwAA//////////9dHwAAXx8AAGEfAAD/////Yx8AAGUfAABnHwAAaR8AAGsfAABtHwAA//////////9vHwAAcR8AAHMfAAB1HwAAdx8AAHkfAAB7HwAAfR8AAP////////////////////9/HwAA/////4EfAACDHwAAhR8AAIcfAACJHwAAix8AAP////+NHwAA//////////+PHwAAkR8AAJMfAAD/////lR8AAJcfAACZHwAAmx8AAJ0fAACfHwAAoR8AAP////////////////////+jHwAApR8AAKcfAACpHwAAqx8AAK0fAACvHwAAsR8AALMfAAC1HwAAtx8AAP//////////uR8AALsfAAC9HwAA/////78fAADBHwAAwx8AAMUfAADHHwAAyR8AAMsfAADNHwAAzx8AANEfAADTHwAA1R8AANcfAADZHwAA2x8AAP///////////////90fAADfHwAA///////////hHwAA4x8AAOUfAADnHwAA6R8AAOsfAADtHwAA7x8AAPEfAADzHwAA9R8AAP/////3HwAA+R8AAP////////////////sfAAD9HwAA//////8fAAABIAAAAyAAAAUgAAAHIAAACSAAAAsgAAANIAAA/////w8gAAD//////////xEgAAATIAAAFSAAABcgAAAZIAAAGyAAAB0gAAAfIAAAISAAACMgAAD//////////yUgAAAnIAAA//////////8pIAAA/////ysgAAAtIAAALyAAAP////8xIAAA/////zMgAAD/////NSAAADcgAAD/////OSAAADsgAAA9IAAAPyAAAEEgAABDIAAARSAAAEcgAABJIAAASyAAAE0gAABPIAAAUSAAAFMgAABVIAAA/////1cgAABZIAAAWyAAAF0gAABfIAAAYSAAAGMgAABlIAAAZyAAAGkgAAD/////ayAAAG0gAABvIAAAcSAAAHMgAAB1IAAAdyAAAHkgAAB7IAAA////////////////fSAAAH8gAACBIAAAgyAAAIUgAACHIAAAiSAAAP///////////////////////////////////////////////4sgAAD/////////////////////jSAAAI8gAACRIAAAkyAAAJUgAACXIAAAmSAAAJsgAACdIAAAnyAAAKEgAACjIAAApSAAAP////+nIAAAqSAAAKsgAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////64gAACwIAAAsiAAALQgAAC2IAAAuCAAAP////+6IAAAvCAAAL4gAADAIAAA/////8IgAADEIAAAxiAAAMggAADKIAAAzCAAAM4gAADQIAAA0iAAANQgAAD/////1iAAANggAADaIAAA3CAAAN4gAADgIAAA/////+IgAADkIAAA5iAAAOggAADqIAAA7CAAAO4gAAD/////8CAAAPIgAAD/////9CAAAPYgAAD4IAAA+iAAAPwgAAD+IAAA/////wAhAAACIQAABCEAAAYhAAAIIQAACiEAAP////8MIQAADiEAAP////8QIQAAEiEAABQhAAAWIQAAGCEAABohAAD/////HCEAAP//////////////////////////HiEAACAhAAAiIQAAJCEAACYhAAAoIQAAKiEAACwhAAAuIQAAMCEAADIhAAA0IQAANiEAAP////84IQAAOiEAADwhAAA+IQAAQCEAAEIhAABEIQAARiEAAP////9IIQAASiEAAEwhAABOIQAAUCEAAFIhAAD/////////////////////VCEAAFYhAAD/////WCEAAFohAABcIQAAXiEAAGAhAAD/////YiEAAGQhAABmIQAAaCEAAGohAABsIQAAbiEAAHAhAAByIQAAdCEAAHYhAAB4IQAAeiEAAHwhAAD//////////34hAACAIQAAgiEAAIQhAACGIQAAiCEAAIohAACMIQAA/////44hAACQIQAAkiEAAJQhAACWIQAAmCEAAP////+aIQAAnCEAAJ4hAACgIQAAoiEAAKQhAACmIQAAqCEAAKohAAD///////////////+sIQAAriEAALAhAACyIQAAtCEAALYhAAC4IQAAuiEAALwhAAD//////////74hAAD//////////8AhAAD/////wiEAAMQhAADGIQAAyCEAAMohAADMIQAAziEAANAhAADSIQAA1CEAANYhAADYIQAA2iEAANwhAADeIQAA4CEAAOIhAADkIQAA5iEAAP/////oIQAA/////+ohAAD/////7CEAAO4hAADwIQAA8iEAAPQhAAD2IQAA+CEAAPohAAD8IQAA///////////+IQAAACIAAAIiAAAEIgAABiIAAAgiAAAKIgAA//////////8MIgAADiIAABAiAAASIgAAFCIAABYiAAD/////GCIAAP//////////GiIAAP////8cIgAA/////x4iAAAgIgAAIiIAACQiAAAmIgAAKCIAACoiAAD/////LCIAAC4iAAAwIgAA/////zIiAAA0IgAANiIAADgiAAD/////OiIAADwiAAD//////////z4iAABAIgAAQiIAAEQiAABGIgAASCIAAEoiAABMIgAATiIAAP////9QIgAAUiIAAFQiAABWIgAAWCIAAFoiAABcIgAAXiIAAGAiAAD//////////2IiAAD/////////////////////////////////////ZCIAAGYiAABoIgAAaiIAAGwiAABuIgAAcCIAAHIiAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////dSIAAHciAAB5IgAAeyIAAH0iAAB/IgAAgSIAAIMiAACFIgAAhyIAAIkiAACLIgAAjSIAAI8iAAD/////kSIAAJMiAACVIgAAlyIAAJkiAACbIgAAnSIAAJ8iAAD///////////////////////////////+hIgAAoyIAAKUiAACnIgAAqSIAAKsiAAD/////rSIAAK8iAACxIgAAsyIAALUiAAC3IgAA/////7kiAAC7IgAAvSIAAL8iAADBIgAAwyIAAMUiAADHIgAAySIAAMsiAADNIgAAzyIAAP//////////0SIAANMiAADVIgAA1yIAAP/////ZIgAA2yIAAN0iAADfIgAA4SIAAOMiAADlIgAA5yIAAOkiAADrIgAA7SIAAO8iAADxIgAA8yIAAPUiAAD3IgAA+SIAAP//////////+yIAAP0iAAD/IgAAASMAAAMjAAAFIwAAByMAAAkjAAALIwAADSMAAP//////////DyMAAP///////////////xEjAAATIwAAFSMAABcjAAAZIwAAGyMAAB0jAAD//////////x8jAAD/////ISMAACMjAAAlIwAAJyMAACkjAAArIwAA/////y0jAAAvIwAAMSMAADMjAAA1IwAANyMAADkjAAD/////OyMAAD0jAAA/IwAAQSMAAEMjAABFIwAA/////0cjAABJIwAASyMAAE0jAABPIwAAUSMAAFMjAABVIwAAVyMAAFkjAABbIwAAXSMAAF8jAABhIwAAYyMAAGUjAAD/////ZyMAAGkjAABrIwAAbSMAAG8jAAD/////cSMAAHMjAAB1IwAA/////3cjAAB5IwAAeyMAAH0jAAB/IwAAgSMAAIMjAAD/////////////////////hSMAAP///////////////4cjAAD/////iSMAAP////+LIwAAjSMAAP////+PIwAAkSMAAP////+TIwAA/////5UjAACXIwAAmSMAAJsjAACdIwAAnyMAAKEjAACjIwAApSMAAKcjAACpIwAAqyMAAK0jAAD//////////68jAAD//////////7EjAACzIwAA/////7UjAAC3IwAAuSMAALsjAAC9IwAAvyMAAMEjAAD/////wyMAAMUjAADHIwAAySMAAMsjAADNIwAA/////88jAADRIwAA0yMAAP//////////1SMAANcjAADZIwAA2yMAAN0jAADfIwAA4SMAAP/////jIwAA5SMAAOcjAADpIwAA/////+sjAADtIwAA7yMAAPEjAADzIwAA9SMAAP/////3IwAA+SMAAPsjAAD9IwAA/yMAAAEkAAD/////AyQAAAUkAAAHJAAACSQAAAskAAANJAAA/////w8kAAARJAAAEyQAABUkAAAXJAAAGSQAABskAAAdJAAAHyQAACEkAAAjJAAAJSQAACckAAApJAAA////////////////KyQAAP////////////////////8tJAAA/////y8kAAAxJAAAMyQAADUkAAD///////////////////////////////83JAAAOSQAADskAAD/////PSQAAD8kAABBJAAAQyQAAEUkAABHJAAASSQAAP////9LJAAATSQAAE8kAABRJAAAUyQAAFUkAABXJAAAWSQAAFskAABdJAAA//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////9gJAAAYiQAAGQkAABmJAAAaCQAAGokAABsJAAAbiQAAHAkAAByJAAAdCQAAHYkAAB4JAAAeiQAAP////98JAAAfiQAAIAkAACCJAAAhCQAAIYkAACIJAAAiiQAAP//////////jCQAAP///////////////44kAACQJAAAkiQAAJQkAACWJAAAmCQAAJokAACcJAAAniQAAKAkAACiJAAApCQAAKYkAACoJAAAqiQAAKwkAAD/////riQAALAkAACyJAAAtCQAALYkAAC4JAAAuiQAALwkAAC+JAAAwCQAAMIkAADEJAAA///////////GJAAA///////////IJAAAyiQAAP/////MJAAAziQAANAkAADSJAAA1CQAANYkAADYJAAA2iQAANwkAAD////////////////eJAAA4CQAAP//////////4iQAAOQkAADmJAAA6CQAAOokAADsJAAA7iQAAPAkAADyJAAA9CQAAPYkAAD4JAAA+iQAAPwkAAD+JAAAACUAAAIlAAAEJQAA/////wYlAAD/////CCUAAP////8KJQAADCUAAA4lAAAQJQAAEiUAABQlAAAWJQAA/////xglAAAaJQAAHCUAAP//////////HiUAACAlAAAiJQAAJCUAACYlAAAoJQAAKiUAACwlAAD///////////////8uJQAA////////////////MCUAADIlAAD/////NCUAADYlAAA4JQAAOiUAADwlAAA+JQAAQCUAAEIlAABEJQAARiUAAEglAABKJQAA/////0wlAABOJQAAUCUAAP////9SJQAAVCUAAP////9WJQAAWCUAAFolAABcJQAAXiUAAGAlAAD/////YiUAAP////9kJQAAZiUAAP////9oJQAA/////2olAABsJQAAbiUAAHAlAAByJQAAdCUAAHYlAAB4JQAAeiUAAHwlAAB+JQAA/////4AlAAD///////////////+CJQAA/////4QlAAD/////hiUAAIglAACKJQAAjCUAAI4lAACQJQAAkiUAAJQlAACWJQAAmCUAAJolAACcJQAAniUAAKAlAACiJQAApCUAAKYlAAD/////qCUAAKolAACsJQAAriUAALAlAACyJQAAtCUAALYlAAC4JQAAuiUAALwlAAC+JQAAwCUAAMIlAADEJQAAxiUAAMglAADKJQAAzCUAAM4lAADQJQAA0iUAANQlAADWJQAA////////////////2CUAANolAADcJQAA3iUAAOAlAADiJQAA5CUAAOYlAAD////////////////oJQAA6iUAAP///////////////+wlAADuJQAA//////AlAADyJQAA9CUAAPYlAAD4JQAA+iUAAP////////////////wlAAD///////////////////////////4lAAAAJgAAAiYAAAQmAAAGJgAACCYAAAomAAAMJgAADiYAABAmAAASJgAAFCYAABYmAAAYJgAAGiYAABwmAAAeJgAAICYAAP////////////////////8iJgAA//////////8kJgAA////////////////JiYAACgmAAD/////KiYAACwmAAAuJgAAMCYAADImAAA0JgAANiYAADgmAAA6JgAAPCYAAD4mAABAJgAAQiYAAEQmAABGJgAASCYAAEomAABMJgAATiYAAFAmAABSJgAAVCYAAFYmAABYJgAA//////////9aJgAA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////10mAABfJgAAYSYAAGMmAABlJgAAZyYAAGkmAABrJgAAbSYAAG8mAABxJgAAcyYAAHUmAAB3JgAAeSYAAHsmAAB9JgAAfyYAAIEmAACDJgAAhSYAAIcmAAD/////iSYAAIsmAACNJgAA/////48mAACRJgAAkyYAAJUmAACXJgAAmSYAAJsmAACdJgAAnyYAAKEmAACjJgAApSYAAKcmAACpJgAAqyYAAP////+tJgAAryYAALEmAACzJgAAtSYAALcmAAC5JgAAuyYAAL0mAAC/JgAAwSYAAMMmAADFJgAAxyYAAMkmAADLJgAAzSYAAM8mAADRJgAA0yYAANUmAADXJgAA///////////ZJgAA2yYAAN0mAAD//////////98mAADhJgAA/////+MmAADlJgAA5yYAAOkmAADrJgAA7SYAAO8mAADxJgAA8yYAAPUmAAD3JgAA+SYAAPsmAAD9JgAA/yYAAP////8BJwAAAycAAAUnAAAHJwAACScAAAsnAAANJwAADycAABEnAAD/////EycAABUnAAAXJwAAGScAABsnAAD/////HScAAB8nAAAhJwAAIycAACUnAAAnJwAA//////////8pJwAAKycAAC0nAAAvJwAAMScAADMnAAA1JwAANycAADknAAA7JwAAPScAAD8nAAD/////////////////////QScAAEMnAABFJwAA/////0cnAABJJwAASycAAE0nAABPJwAAUScAAP////9TJwAAVScAAP////9XJwAAWScAAFsnAABdJwAAXycAAGEnAABjJwAAZScAAGcnAABpJwAAaycAAG0nAABvJwAAcScAAHMnAAB1JwAAdycAAHknAAB7JwAAfScAAP////9/JwAAgScAAIMnAACFJwAAhycAAP//////////iScAAIsnAAD//////////40nAACPJwAAkScAAJMnAAD//////////5UnAACXJwAA/////5knAACbJwAAnScAAJ8nAAD///////////////+hJwAA////////////////oycAAKUnAAD//////////6cnAACpJwAAqycAAK0nAACvJwAAsScAAP//////////sycAALUnAAC3JwAAuScAALsnAAC9JwAAvycAAMEnAADDJwAAxScAAMcnAADJJwAAyycAAM0nAADPJwAA0ScAANMnAADVJwAA1ycAAP/////ZJwAA2ycAAN0nAADfJwAA/////+EnAADjJwAA5ScAAOcnAADpJwAA6ycAAO0nAADvJwAA8ScAAPMnAAD1JwAA9ycAAPknAAD7JwAA/ScAAP////////////////////////////////8nAAABKAAAAygAAAUoAAAHKAAACSgAAAsoAAANKAAADygAABEoAAATKAAAFSgAAP////8XKAAAGSgAABsoAAAdKAAAHygAAP////8hKAAAIygAAP////8lKAAAJygAACkoAAArKAAALSgAAC8oAAAxKAAA////////////////MygAADUoAAA3KAAAOSgAAP////87KAAA//////////89KAAAPygAAEEoAAD//////////0MoAAD//////////0UoAABHKAAASSgAAP////9LKAAATSgAAP//////////TygAAFEoAABTKAAAVSgAAP////9XKAAA//////////9ZKAAAWygAAF0oAABfKAAA/////2EoAAD//////////2MoAABlKAAAZygAAGkoAABrKAAAbSgAAG8oAABxKAAAcygAAHUoAAB3KAAAeSgAAHsoAAB9KAAA//////////9/KAAA//////////+BKAAAgygAAIUoAACHKAAA/////4koAACLKAAAjSgAAI8oAACRKAAAkygAAJUoAAD/////lygAAJkoAACbKAAA/////50oAACfKAAAoSgAAKMoAAClKAAApygAAKkoAACrKAAArSgAAK8oAACxKAAAsygAALUoAAC3KAAAuSgAAP////////////////////+7KAAAvSgAAL8oAAD/////wSgAAMMoAADFKAAA///////////HKAAAySgAAMsoAADNKAAAzygAANEoAADTKAAA1SgAANcoAADZKAAA2ygAAP/////dKAAA///////////fKAAA4SgAAOMoAADlKAAA5ygAAOkoAADrKAAA7SgAAO8oAADxKAAA8ygAAP/////1KAAA9ygAAP//////////+SgAAPsoAAD9KAAA/ygAAAEpAAADKQAABSkAAAcpAAAJKQAACykAAA0pAAAPKQAA/////xEpAAATKQAAFSkAABcpAAAZKQAAGykAAB0pAAD/////HykAACEpAAD//////////yMpAAAlKQAAJykAACkpAAArKQAALSkAAP////8vKQAA/////zEpAAAzKQAANSkAAP////83KQAAOSkAAP////87KQAAPSkAAP//////////PykAAP////9BKQAA/////0MpAABFKQAARykAAEkpAABLKQAATSkAAE8pAABRKQAA/////////////////////1MpAAD///////////////9VKQAA////////////////VykAAP////9ZKQAA//////////9bKQAAXSkAAP//////////XykAAGEpAABjKQAAZSkAAGcpAABpKQAAaykAAG0pAAD/////bykAAP////9xKQAAcykAAHUpAAB3KQAAeSkAAP////97KQAA/////30pAAB/KQAAgSkAAIMpAACFKQAAhykAAIkpAAD/////iykAAI0pAACPKQAAkSkAAP///////////////5MpAACVKQAAlykAAP//////////mSkAAJspAACdKQAA//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////+gKQAAoikAAKQpAACmKQAAqCkAAKopAACsKQAArikAALApAACyKQAAtCkAALYpAAC4KQAA//////////+6KQAAvCkAAL4pAADAKQAAwikAAMQpAADGKQAAyCkAAMopAAD/////zCkAAP/////OKQAA0CkAANIpAAD/////1CkAANYpAADYKQAA2ikAANwpAADeKQAA4CkAAOIpAADkKQAA/////+YpAADoKQAA///////////qKQAA7CkAAO4pAADwKQAA8ikAAPQpAAD2KQAA+CkAAPopAAD8KQAA/ikAAAAqAAD/////AioAAP////8EKgAABioAAAgqAAAKKgAADCoAAA4qAAAQKgAAEioAABQqAAAWKgAAGCoAAP///////////////////////////////xoqAAD///////////////8cKgAAHioAACAqAAAiKgAAJCoAAP////8mKgAAKCoAACoqAAD/////LCoAAC4qAAAwKgAAMioAADQqAAA2KgAAOCoAADoqAAD/////////////////////PCoAAD4qAABAKgAAQioAAEQqAABGKgAASCoAAEoqAABMKgAA/////04qAABQKgAAUioAAFQqAABWKgAAWCoAAFoqAABcKgAAXioAAGAqAABiKgAA/////2QqAAD/////ZioAAGgqAABqKgAAbCoAAG4qAABwKgAAcioAAHQqAAB2KgAAeCoAAHoqAAB8KgAAfioAAIAqAACCKgAAhCoAAIYqAACIKgAAiioAAIwqAAD/////jioAAJAqAACSKgAAlCoAAJYqAACYKgAAmioAAJwqAACeKgAAoCoAAKIqAACkKgAApioAAKgqAACqKgAArCoAAK4qAACwKgAAsioAALQqAAC2KgAAuCoAALoqAAC8KgAAvioAAP///////////////////////////////8AqAAD/////wioAAP/////EKgAA/////8YqAADIKgAAyioAAMwqAADOKgAA0CoAANIqAAD/////1CoAANYqAAD//////////9gqAAD/////2ioAAP//////////3CoAAN4qAADgKgAA4ioAAOQqAADmKgAA6CoAAP/////qKgAA///////////sKgAA7ioAAPAqAADyKgAA9CoAAP/////2KgAA+CoAAP/////6KgAA//////wqAAD+KgAA/////wArAAACKwAABCsAAAYrAAAIKwAACisAAAwrAAAOKwAAECsAABIrAAAUKwAAFisAABgrAAAaKwAAHCsAAB4rAAD/////ICsAACIrAAAkKwAAJisAACgrAAAqKwAALCsAAC4rAAAwKwAAMisAADQrAAA2KwAAOCsAADorAAA8KwAAPisAAEArAABCKwAARCsAAEYrAABIKwAASisAAEwrAAD/////TisAAFArAABSKwAAVCsAAFYrAABYKwAAWisAAFwrAABeKwAAYCsAAGIrAABkKwAAZisAAP///////////////2grAABqKwAAbCsAAG4rAABwKwAAcisAAHQrAAD//////////3YrAAB4KwAAeisAAHwrAAB+KwAAgCsAAIIrAACEKwAAhisAAIgrAACKKwAAjCsAAI4rAAD/////kCsAAJIrAACUKwAAlisAAJgrAACaKwAA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////50rAACfKwAAoSsAAKMrAAClKwAApysAAP////+pKwAAqysAAK0rAACvKwAA/////7ErAACzKwAAtSsAALcrAAC5KwAAuysAAL0rAAC/KwAA////////////////wSsAAMMrAADFKwAAxysAAMkrAADLKwAAzSsAAM8rAADRKwAA0ysAANUrAADXKwAA2SsAANsrAADdKwAA3ysAAOErAADjKwAA5SsAAOcrAADpKwAA6ysAAO0rAADvKwAA8SsAAPMrAAD1KwAA9ysAAPkrAAD7KwAA/SsAAP8rAAABLAAA/////wMsAAAFLAAABywAAAksAAALLAAADSwAAA8sAAD/////ESwAAP////8TLAAAFSwAABcsAAAZLAAAGywAAB0sAAAfLAAAISwAACMsAAAlLAAAJywAACksAAArLAAALSwAAC8sAAD/////MSwAAP////8zLAAA/////zUsAAA3LAAAOSwAADssAAD//////////z0sAAD/////PywAAP////9BLAAAQywAAEUsAABHLAAASSwAAEssAAD//////////00sAABPLAAAUSwAAFMsAABVLAAAVywAAFksAABbLAAAXSwAAF8sAABhLAAA/////2MsAABlLAAAZywAAGksAAD/////aywAAG0sAABvLAAAcSwAAHMsAAB1LAAAdywAAHksAAB7LAAAfSwAAH8sAACBLAAAgywAAIUsAACHLAAAiSwAAIssAACNLAAAjywAAJEsAACTLAAAlSwAAJcsAAD/////mSwAAJssAACdLAAAnywAAP////+hLAAAoywAAKUsAAD/////pywAAKksAACrLAAArSwAAK8sAACxLAAAsywAALUsAAD//////////7csAAC5LAAAuywAAL0sAAC/LAAAwSwAAP/////DLAAAxSwAAMcsAADJLAAAyywAAP///////////////80sAADPLAAA0SwAAP/////TLAAA1SwAAP/////XLAAA2SwAANssAADdLAAA3ywAAOEsAADjLAAA5SwAAOcsAADpLAAA6ywAAP//////////7SwAAP/////vLAAA///////////////////////////xLAAA8ywAAPUsAAD/////9ywAAPksAAD7LAAA///////////9LAAA/ywAAAEtAAADLQAABS0AAActAAAJLQAACy0AAA0tAAAPLQAAES0AABMtAAAVLQAAFy0AABktAAAbLQAAHS0AAB8tAAAhLQAAIy0AAP////////////////////8lLQAAJy0AACktAAArLQAA/////y0tAAAvLQAA/////zEtAAAzLQAANS0AADctAAD/////OS0AADstAAA9LQAA/////z8tAABBLQAA/////0MtAAD///////////////9FLQAARy0AAEktAABLLQAATS0AAE8tAABRLQAAUy0AAP////9VLQAAVy0AAFktAABbLQAAXS0AAF8tAABhLQAAYy0AAGUtAABnLQAAaS0AAGstAABtLQAAby0AAHEtAABzLQAAdS0AAHctAAB5LQAAey0AAP////99LQAAfy0AAIEtAACDLQAAhS0AAIctAACJLQAAiy0AAI0tAACPLQAA//////////+RLQAA////////////////ky0AAP////+VLQAAly0AAJktAACbLQAAnS0AAJ8tAAChLQAAoy0AAKUtAACnLQAA/////6ktAACrLQAA/////60tAACvLQAAsS0AALMtAAC1LQAAty0AALktAAC7LQAAvS0AAP/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////ALQAAwi0AAMQtAADGLQAAyC0AAP/////KLQAAzC0AAM4tAADQLQAA0i0AANQtAADWLQAA2C0AANotAADcLQAA3i0AAOAtAADiLQAA5C0AAOYtAADoLQAA6i0AAP//////////7C0AAO4tAADwLQAA8i0AAPQtAAD/////9i0AAPgtAAD6LQAA/C0AAP4tAAAALgAAAi4AAAQuAAAGLgAACC4AAP//////////Ci4AAAwuAAAOLgAAEC4AABIuAAAULgAAFi4AABguAAAaLgAAHC4AAB4uAAD/////IC4AACIuAAAkLgAA/////yYuAAAoLgAA/////youAAAsLgAALi4AADAuAAAyLgAANC4AAP////82LgAAOC4AAP///////////////zouAAD/////////////////////PC4AAD4uAABALgAAQi4AAEQuAABGLgAASC4AAEouAABMLgAATi4AAFAuAABSLgAAVC4AAFYuAABYLgAAWi4AAFwuAAD//////////////////////////14uAABgLgAAYi4AAGQuAABmLgAAaC4AAGouAAD/////bC4AAP////9uLgAAcC4AAHIuAAD//////////3QuAAB2LgAAeC4AAHouAAB8LgAAfi4AAIAuAAD//////////4IuAACELgAAhi4AAIguAAD//////////4ouAACMLgAAji4AAJAuAACSLgAAlC4AAJYuAACYLgAAmi4AAJwuAACeLgAAoC4AAKIuAACkLgAApi4AAKguAACqLgAA/////6wuAACuLgAAsC4AALIuAAC0LgAAti4AALguAAC6LgAAvC4AAL4uAAD/////////////////////wC4AAMIuAADELgAAxi4AAMguAADKLgAAzC4AAM4uAAD/////0C4AAP///////////////9IuAAD/////1C4AAP/////WLgAA2C4AANouAADcLgAA3i4AAOAuAADiLgAA5C4AAP/////mLgAA6C4AAOouAADsLgAA///////////uLgAA//////AuAADyLgAA9C4AAPYuAAD4LgAA+i4AAPwuAAD+LgAAAC8AAAIvAAAELwAABi8AAAgvAAAKLwAADC8AAA4vAAAQLwAA/////xIvAAAULwAA/////xYvAAAYLwAAGi8AABwvAAAeLwAAIC8AACIvAAAkLwAAJi8AACgvAAAqLwAA/////ywvAAAuLwAAMC8AADIvAAA0LwAANi8AADgvAAA6LwAA/////zwvAAA+LwAAQC8AAEIvAABELwAA//////////9GLwAASC8AAEovAABMLwAATi8AAFAvAABSLwAAVC8AAFYvAAD/////WC8AAFovAABcLwAAXi8AAGAvAABiLwAAZC8AAGYvAABoLwAAai8AAGwvAABuLwAAcC8AAHIvAAB0LwAAdi8AAP///////////////3gvAAD/////ei8AAP////////////////////98LwAA//////////9+LwAA/////4AvAACCLwAAhC8AAIYvAACILwAAii8AAIwvAACOLwAAkC8AAJIvAACULwAAli8AAJgvAACaLwAAnC8AAJ4vAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////oS8AAKMvAAClLwAApy8AAKkvAAD/////qy8AAK0vAACvLwAAsS8AALMvAAC1LwAA/////7cvAAC5LwAAuy8AAL0vAAC/LwAAwS8AAMMvAADFLwAAxy8AAP/////JLwAAyy8AAM0vAADPLwAA0S8AANMvAADVLwAA1y8AANkvAADbLwAA3S8AAN8vAADhLwAA/////+MvAADlLwAA/////+cvAAD/////6S8AAOsvAADtLwAA7y8AAPEvAADzLwAA9S8AAPcvAAD5LwAA////////////////+y8AAP///////////S8AAP8vAAABMAAAAzAAAAUwAAAHMAAACTAAAAswAAANMAAADzAAAP////8RMAAAEzAAAP////8VMAAA/////xcwAAAZMAAAGzAAAB0wAAAfMAAAITAAACMwAAAlMAAAJzAAACkwAAArMAAALTAAAC8wAAAxMAAAMzAAAP//////////NTAAAP//////////NzAAADkwAAA7MAAAPTAAAD8wAABBMAAAQzAAAEUwAABHMAAA/////0kwAABLMAAA/////00wAAD//////////08wAABRMAAAUzAAAP//////////////////////////VTAAAP////9XMAAAWTAAAFswAABdMAAAXzAAAGEwAABjMAAAZTAAAGcwAABpMAAAazAAAG0wAABvMAAAcTAAAP////9zMAAAdTAAAHcwAAD//////////3kwAAD/////ezAAAH0wAAB/MAAAgTAAAIMwAACFMAAAhzAAAIkwAACLMAAA/////40wAACPMAAAkTAAAJMwAACVMAAAlzAAAJkwAACbMAAAnTAAAJ8wAAChMAAAozAAAKUwAACnMAAAqTAAAP////////////////////+rMAAA/////////////////////60wAACvMAAAsTAAALMwAAC1MAAAtzAAALkwAAD///////////////+7MAAAvTAAAP////+/MAAAwTAAAMMwAADFMAAA/////8cwAADJMAAAyzAAAM0wAAD/////zzAAANEwAAD/////0zAAANUwAADXMAAA2TAAANswAADdMAAA3zAAAOEwAAD//////////+MwAAD//////////////////////////+UwAADnMAAA6TAAAOswAADtMAAA/////+8wAAD/////8TAAAPMwAAD1MAAA//////cwAAD5MAAA///////////7MAAA/TAAAP///////////zAAAAExAAADMQAABTEAAAcxAAAJMQAACzEAAA0xAAAPMQAAETEAABMxAAAVMQAAFzEAABkxAAAbMQAAHTEAAB8xAAAhMQAA/////yMxAAAlMQAAJzEAACkxAAArMQAALTEAAC8xAAAxMQAAMzEAAP////////////////////81MQAANzEAADkxAAA7MQAAPTEAAD8xAABBMQAAQzEAAP////9FMQAA/////0cxAAD/////STEAAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////0wxAABOMQAAUDEAAFIxAABUMQAAVjEAAFgxAABaMQAAXDEAAF4xAABgMQAAYjEAAGQxAABmMQAA/////2gxAABqMQAAbDEAAG4xAABwMQAAcjEAAHQxAAB2MQAA//////////94MQAA//////////96MQAAfDEAAH4xAACAMQAAgjEAAIQxAACGMQAAiDEAAIoxAACMMQAAjjEAAJAxAACSMQAA/////5QxAACWMQAAmDEAAJoxAACcMQAAnjEAAP////+gMQAAojEAAKQxAACmMQAAqDEAAKoxAACsMQAArjEAALAxAACyMQAAtDEAAP////+2MQAAuDEAALoxAAC8MQAAvjEAAMAxAADCMQAAxDEAAMYxAADIMQAAyjEAAMwxAAD/////////////////////zjEAANAxAAD////////////////SMQAA/////////////////////9QxAAD/////1jEAANgxAADaMQAA3DEAAN4xAADgMQAA4jEAAOQxAADmMQAA/////+gxAADqMQAA7DEAAO4xAAD/////8DEAAPIxAAD0MQAA///////////2MQAA//////gxAAD6MQAA/DEAAP4xAAAAMgAAAjIAAAQyAAAGMgAACDIAAAoyAAAMMgAADjIAABAyAAASMgAAFDIAAP////8WMgAAGDIAABoyAAAcMgAA//////////////////////////////////////////8eMgAA/////yAyAAAiMgAA/////yQyAAAmMgAAKDIAACoyAAAsMgAALjIAADAyAAAyMgAANDIAADYyAAA4MgAAOjIAADwyAAA+MgAAQDIAAEIyAABEMgAARjIAAEgyAABKMgAA/////////////////////////////////////////////////////0wyAABOMgAA//////////9QMgAA//////////9SMgAAVDIAAFYyAABYMgAAWjIAAFwyAABeMgAA/////2AyAABiMgAAZDIAAGYyAABoMgAAajIAAGwyAAD/////bjIAAHAyAAByMgAAdDIAAHYyAAB4MgAAejIAAP////98MgAAfjIAAIAyAACCMgAAhDIAAIYyAACIMgAAijIAAIwyAACOMgAAkDIAAJIyAACUMgAAljIAAJgyAACaMgAA//////////+cMgAAnjIAAKAyAACiMgAApDIAAKYyAACoMgAAqjIAAKwyAACuMgAAsDIAALIyAAC0MgAAtjIAALgyAAC6MgAAvDIAAL4yAADAMgAA/////8IyAADEMgAAxjIAAMgyAAD/////yjIAAP/////MMgAAzjIAANAyAAD//////////9IyAAD/////////////////////////////////////1DIAANYyAADYMgAA2jIAANwyAADeMgAA4DIAAOIyAADkMgAA5jIAAOgyAAD/////6jIAAP/////sMgAA/////+4yAAD/////8DIAAP/////yMgAA9DIAAP//////////9jIAAP//////////+DIAAPoyAAD//////DIAAP/////+MgAA/////wAzAAACMwAA/////wQzAAAGMwAACDMAAAozAAD///////////////8MMwAADjMAABAzAAD/////EjMAABQzAAD//////////xYzAAAYMwAA//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8bMwAAHTMAAB8zAAAhMwAAIzMAACUzAAAnMwAAKTMAACszAAAtMwAALzMAADEzAAAzMwAANTMAAP////83MwAAOTMAADszAAA9MwAAPzMAAEEzAABDMwAA//////////9FMwAA/////////////////////0czAABJMwAASzMAAE0zAABPMwAAUTMAAFMzAABVMwAAVzMAAFkzAABbMwAAXTMAAF8zAABhMwAAYzMAAP////9lMwAA/////2czAABpMwAAazMAAP////9tMwAAbzMAAHEzAABzMwAAdTMAAHczAAB5MwAAezMAAH0zAAB/MwAAgTMAAIMzAAD/////hTMAAIczAAD/////iTMAAIszAACNMwAAjzMAAJEzAAD///////////////+TMwAA////////////////lTMAAJczAACZMwAAmzMAAJ0zAACfMwAAoTMAAKMzAAClMwAApzMAAKkzAACrMwAArTMAAK8zAACxMwAAszMAAP//////////tTMAALczAAC5MwAAuzMAAL0zAAC/MwAAwTMAAMMzAADFMwAAxzMAAMkzAADLMwAAzTMAAP//////////zzMAANEzAADTMwAA1TMAANczAAD/////2TMAAP/////bMwAA3TMAAN8zAADhMwAA4zMAAOUzAAD/////5zMAAOkzAADrMwAA7TMAAO8zAADxMwAA8zMAAP/////1MwAA9zMAAPkzAAD7MwAA/TMAAP8zAAABNAAAAzQAAAU0AAAHNAAACTQAAAs0AAANNAAADzQAABE0AAATNAAAFTQAABc0AAAZNAAAGzQAAP////8dNAAAHzQAACE0AAAjNAAAJTQAAP//////////JzQAACk0AAArNAAA/////y00AAAvNAAAMTQAADM0AAA1NAAANzQAADk0AAA7NAAAPTQAAD80AAD//////////0E0AAD//////////0M0AABFNAAA////////////////RzQAAEk0AABLNAAATTQAAP////9PNAAA/////1E0AABTNAAA/////1U0AABXNAAAWTQAAP//////////////////////////WzQAAF00AABfNAAAYTQAAGM0AABlNAAAZzQAAGk0AABrNAAAbTQAAG80AABxNAAA//////////9zNAAAdTQAAHc0AAB5NAAAezQAAH00AAD/////fzQAAIE0AACDNAAA////////////////hTQAAP////+HNAAAiTQAAIs0AAD/////jTQAAI80AAD/////kTQAAJM0AACVNAAAlzQAAJk0AACbNAAAnTQAAP////+fNAAAoTQAAKM0AAD/////pTQAAKc0AACpNAAA/////6s0AACtNAAA//////////+vNAAAsTQAALM0AAC1NAAA/////7c0AAC5NAAAuzQAAL00AAD/////vzQAAP//////////wTQAAMM0AADFNAAAxzQAAMk0AADLNAAAzTQAAM80AADRNAAA0zQAANU0AADXNAAA2TQAAP/////bNAAA/////900AADfNAAA///////////////////////////////////////////hNAAA4zQAAOU0AADnNAAA6TQAAOs0AADtNAAA7zQAAPE0AADzNAAA9TQAAP/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////4NAAA+jQAAPw0AAD+NAAAADUAAAI1AAD/////BDUAAAY1AAAINQAACjUAAAw1AAAONQAAEDUAABI1AAAUNQAAFjUAABg1AAAaNQAAHDUAAP///////////////x41AAD/////IDUAACI1AAAkNQAAJjUAACg1AAAqNQAALDUAAP////8uNQAAMDUAADI1AAA0NQAANjUAADg1AAA6NQAA/////zw1AAA+NQAAQDUAAEI1AABENQAARjUAAEg1AABKNQAATDUAAE41AABQNQAA/////1I1AABUNQAAVjUAAFg1AABaNQAAXDUAAP////9eNQAAYDUAAGI1AABkNQAAZjUAAP////9oNQAA//////////9qNQAAbDUAAG41AABwNQAAcjUAAHQ1AAB2NQAAeDUAAHo1AAB8NQAAfjUAAIA1AACCNQAAhDUAAIY1AACINQAAijUAAIw1AAD/////jjUAAP//////////kDUAAJI1AAD//////////5Q1AACWNQAAmDUAAJo1AACcNQAAnjUAAKA1AACiNQAA/////6Q1AACmNQAAqDUAAKo1AACsNQAArjUAALA1AACyNQAAtDUAALY1AAC4NQAAujUAALw1AAD/////vjUAAMA1AADCNQAA///////////ENQAA/////8Y1AADINQAAyjUAAMw1AADONQAA0DUAANI1AADUNQAA1jUAANg1AADaNQAA3DUAAN41AADgNQAA4jUAAOQ1AAD/////5jUAAOg1AADqNQAA7DUAAO41AADwNQAA8jUAAPQ1AAD///////////Y1AAD4NQAA+jUAAPw1AAD//////jUAAP////8ANgAAAjYAAAQ2AAAGNgAACDYAAP////8KNgAA//////////8MNgAADjYAAP////////////////////8QNgAA////////////////EjYAABQ2AAD///////////////8WNgAAGDYAABo2AAAcNgAAHjYAACA2AAAiNgAAJDYAAP////////////////////8mNgAAKDYAACo2AAAsNgAALjYAADA2AAAyNgAANDYAADY2AAA4NgAAOjYAADw2AAA+NgAA//////////9ANgAAQjYAAP////9ENgAARjYAAEg2AABKNgAATDYAAE42AABQNgAAUjYAAFQ2AABWNgAAWDYAAFo2AABcNgAAXjYAAP////////////////////9gNgAAYjYAAP////9kNgAAZjYAAP////////////////////9oNgAA/////2o2AABsNgAAbjYAAHA2AAD/////cjYAAHQ2AAD/////djYAAHg2AAD/////ejYAAHw2AAD///////////////////////////////9+NgAAgDYAAII2AACENgAAhjYAAIg2AACKNgAAjDYAAP//////////jjYAAJA2AACSNgAAlDYAAJY2AACYNgAAmjYAAP////////////////////////////////////+cNgAA/////542AACgNgAAojYAAKQ2AACmNgAAqDYAAP////+qNgAArDYAAK42AACwNgAAsjYAALQ2AAC2NgAA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////7k2AAC7NgAAvTYAAL82AADBNgAAwzYAAMU2AADHNgAAyTYAAMs2AADNNgAAzzYAAP//////////0TYAANM2AADVNgAA1zYAANk2AADbNgAA3TYAAN82AAD//////////////////////////+E2AADjNgAA5TYAAOc2AADpNgAA6zYAAO02AADvNgAA8TYAAPM2AAD1NgAA9zYAAPk2AAD7NgAA/TYAAP82AAABNwAAAzcAAAU3AAAHNwAACTcAAP////8LNwAADTcAAA83AAARNwAAEzcAABU3AAAXNwAAGTcAABs3AAAdNwAAHzcAACE3AAD/////IzcAACU3AAAnNwAAKTcAACs3AAAtNwAA/////y83AAAxNwAAMzcAADU3AAA3NwAAOTcAADs3AAA9NwAAPzcAAEE3AAD//////////0M3AABFNwAARzcAAEk3AABLNwAA/////003AABPNwAAUTcAAFM3AABVNwAAVzcAAFk3AABbNwAAXTcAAF83AABhNwAAYzcAAGU3AABnNwAAaTcAAGs3AABtNwAAbzcAAHE3AABzNwAAdTcAAP//////////dzcAAHk3AAB7NwAAfTcAAH83AACBNwAAgzcAAIU3AACHNwAAiTcAAIs3AACNNwAAjzcAAJE3AACTNwAAlTcAAJc3AACZNwAAmzcAAJ03AACfNwAAoTcAAKM3AAClNwAApzcAAKk3AACrNwAArTcAAK83AACxNwAAszcAAP////+1NwAAtzcAALk3AAC7NwAAvTcAAP//////////vzcAAME3AADDNwAAxTcAAMc3AADJNwAAyzcAAM03AADPNwAA0TcAAP//////////0zcAANU3AAD/////1zcAANk3AADbNwAA3TcAAN83AADhNwAA4zcAAOU3AADnNwAA6TcAAOs3AADtNwAA7zcAAPE3AADzNwAA9TcAAPc3AAD5NwAA+zcAAP03AAD/NwAAATgAAAM4AAAFOAAABzgAAP///////////////wk4AAALOAAA//////////8NOAAADzgAABE4AAATOAAAFTgAAP///////////////xc4AAD///////////////8ZOAAAGzgAAB04AAAfOAAAITgAACM4AAAlOAAAJzgAACk4AAD//////////ys4AAD/////LTgAAC84AAD/////MTgAADM4AAA1OAAANzgAADk4AAA7OAAAPTgAAD84AABBOAAA//////////9DOAAA//////////9FOAAARzgAAP////9JOAAA//////////9LOAAATTgAAP////9POAAAUTgAAP///////////////1M4AABVOAAA/////1c4AABZOAAAWzgAAF04AABfOAAAYTgAAP//////////YzgAAGU4AABnOAAAaTgAAGs4AABtOAAA//////////9vOAAAcTgAAHM4AAB1OAAAdzgAAHk4AAD/////ezgAAH04AAD/////fzgAAIE4AAD//////////4M4AAD//////////4U4AACHOAAAiTgAAP//////////izgAAI04AACPOAAAkTgAAJM4AACVOAAA/////5c4AACZOAAA/////5s4AACdOAAAnzgAAKE4AACjOAAApTgAAKc4AACpOAAAqzgAAK04AACvOAAAsTgAAP////+zOAAAtTgAAP///////////////7c4AAC5OAAAuzgAAL04AAD//////////784AADBOAAAwzgAAMU4AADHOAAAyTgAAMs4AADNOAAAzzgAANE4AAD////////////////////////////////TOAAA1TgAANc4AADZOAAA2zgAAN04AADfOAAA4TgAAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////+Q4AADmOAAA6DgAAOo4AADsOAAA7jgAAPA4AADyOAAA9DgAAPY4AAD4OAAA+jgAAPw4AAD///////////44AAAAOQAAAjkAAAQ5AAAGOQAACDkAAP////8KOQAA//////////8MOQAADjkAAP//////////EDkAABI5AAAUOQAAFjkAABg5AAAaOQAAHDkAAB45AAAgOQAAIjkAACQ5AAAmOQAAKDkAAP///////////////yo5AAAsOQAALjkAADA5AAAyOQAANDkAADY5AAD/////ODkAADo5AAD//////////zw5AAA+OQAAQDkAAEI5AABEOQAARjkAAEg5AABKOQAATDkAAP////9OOQAAUDkAAP//////////UjkAAP////9UOQAAVjkAAFg5AAD/////WjkAAFw5AABeOQAAYDkAAGI5AABkOQAAZjkAAGg5AAD/////ajkAAP////9sOQAAbjkAAP////9wOQAAcjkAAHQ5AAB2OQAAeDkAAP////96OQAA/////3w5AAB+OQAAgDkAAII5AACEOQAA/////4Y5AAD///////////////+IOQAA/////4o5AACMOQAAjjkAAJA5AACSOQAAlDkAAJY5AAD//////////5g5AACaOQAA/////5w5AAD/////njkAAKA5AACiOQAA/////6Q5AACmOQAAqDkAAP////+qOQAA/////6w5AAD///////////////+uOQAAsDkAALI5AAC0OQAAtjkAALg5AAC6OQAAvDkAAL45AADAOQAA///////////COQAAxDkAAP/////GOQAAyDkAAMo5AADMOQAAzjkAANA5AADSOQAA1DkAANY5AADYOQAA2jkAAP//////////3DkAAN45AADgOQAA4jkAAP/////kOQAA/////+Y5AAD//////////+g5AAD/////6jkAAOw5AADuOQAA8DkAAPI5AAD0OQAA9jkAAP//////////+DkAAPo5AAD8OQAA/////////////////jkAAP//////////////////////////////////////////ADoAAAI6AAAEOgAA/////wY6AAAIOgAACjoAAAw6AAAOOgAAEDoAABI6AAD/////FDoAAP////8WOgAA//////////8YOgAAGjoAABw6AAD///////////////8eOgAA/////yA6AAAiOgAAJDoAACY6AAD/////KDoAACo6AAAsOgAALjoAADA6AAAyOgAANDoAADY6AAD///////////////84OgAA////////////////OjoAAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////z06AAA/OgAAQToAAEM6AABFOgAARzoAAEk6AABLOgAATToAAE86AABROgAAUzoAAFU6AABXOgAA/////1k6AABbOgAAXToAAF86AABhOgAAYzoAAGU6AABnOgAA/////2k6AAD/////////////////////azoAAG06AABvOgAAcToAAHM6AAB1OgAAdzoAAHk6AAB7OgAAfToAAH86AACBOgAAgzoAAIU6AACHOgAAiToAAIs6AAD/////jToAAI86AACROgAAkzoAAJU6AACXOgAAmToAAJs6AACdOgAAnzoAAP////+hOgAAozoAAKU6AAD//////////6c6AACpOgAAqzoAAK06AACvOgAAsToAAP////+zOgAAtToAALc6AAC5OgAAuzoAAP////+9OgAAvzoAAP///////////////8E6AADDOgAAxToAAMc6AADJOgAAyzoAAM06AADPOgAA0ToAANM6AADVOgAA1zoAANk6AADbOgAA3ToAAN86AADhOgAA4zoAAOU6AADnOgAA////////////////6ToAAP/////rOgAA7ToAAO86AADxOgAA8zoAAPU6AAD3OgAA+ToAAPs6AAD9OgAA//////86AAABOwAAAzsAAAU7AAAHOwAACTsAAAs7AAANOwAADzsAABE7AAATOwAA////////////////////////////////FTsAABc7AAAZOwAAGzsAAB07AAAfOwAAITsAACM7AAAlOwAAJzsAACk7AAArOwAALTsAAC87AAAxOwAAMzsAADU7AAA3OwAAOTsAAP////87OwAAPTsAAD87AABBOwAAQzsAAEU7AABHOwAASTsAAEs7AABNOwAATzsAAFE7AAD/////UzsAAFU7AABXOwAA/////1k7AAD//////////////////////////1s7AABdOwAAXzsAAGE7AABjOwAAZTsAAP////9nOwAAaTsAAGs7AABtOwAAbzsAAHE7AABzOwAAdTsAAHc7AAD/////////////////////eTsAAP////////////////////////////////////97OwAAfTsAAH87AAD//////////4E7AACDOwAAhTsAAIc7AACJOwAAizsAAI07AACPOwAAkTsAAJM7AAD/////lTsAAJc7AACZOwAA/////5s7AAD/////nTsAAJ87AAChOwAAozsAAKU7AACnOwAAqTsAAKs7AACtOwAArzsAAP////+xOwAAszsAALU7AAC3OwAAuTsAALs7AAC9OwAAvzsAAME7AADDOwAA///////////FOwAAxzsAAMk7AADLOwAAzTsAAP//////////zzsAAP/////ROwAA/////9M7AADVOwAA1zsAANk7AADbOwAA3TsAAP//////////3zsAAP/////hOwAA/////+M7AADlOwAA/////+c7AADpOwAA6zsAAP/////tOwAA7zsAAP//////////8TsAAP//////////8zsAAPU7AAD3OwAA+TsAAPs7AAD9OwAA/zsAAAE8AAADPAAABTwAAAc8AAAJPAAACzwAAA08AAAPPAAAETwAABM8AAAVPAAAFzwAABk8AAAbPAAAHTwAAB88AAAhPAAA/////yM8AAAlPAAAJzwAACk8AAArPAAALTwAAP////////////////////8vPAAAMTwAADM8AAD/////NTwAADc8AAA5PAAAOzwAAD08AAA/PAAAQTwAAEM8AABFPAAA//////////9HPAAASTwAAP//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////TDwAAE48AABQPAAAUjwAAFQ8AAD/////VjwAAFg8AABaPAAAXDwAAF48AABgPAAAYjwAAGQ8AABmPAAAaDwAAGo8AABsPAAAbjwAAHA8AAD///////////////9yPAAA/////3Q8AAB2PAAAeDwAAHo8AAB8PAAAfjwAAIA8AACCPAAAhDwAAIY8AACIPAAAijwAAIw8AACOPAAA/////5A8AACSPAAAlDwAAJY8AACYPAAAmjwAAJw8AAD/////njwAAKA8AACiPAAApDwAAKY8AACoPAAAqjwAAKw8AACuPAAAsDwAALI8AAC0PAAAtjwAAP////+4PAAAujwAALw8AAC+PAAAwDwAAMI8AADEPAAA///////////GPAAA/////8g8AADKPAAAzDwAAM48AADQPAAA/////9I8AADUPAAA1jwAANg8AAD//////////9o8AADcPAAA3jwAAOA8AADiPAAA5DwAAOY8AADoPAAA/////+o8AAD/////7DwAAP/////////////////////uPAAA8DwAAPI8AAD0PAAA9jwAAPg8AAD/////+jwAAPw8AAD///////////48AAAAPQAAAj0AAAQ9AAAGPQAACD0AAAo9AAD///////////////8MPQAADj0AABA9AAD/////Ej0AABQ9AAAWPQAAGD0AABo9AAD/////HD0AAB49AAAgPQAAIj0AACQ9AAAmPQAAKD0AAP////////////////////8qPQAALD0AAC49AAAwPQAAMj0AADQ9AAA2PQAA/////zg9AAA6PQAAPD0AAD49AABAPQAAQj0AAEQ9AABGPQAASD0AAEo9AAD//////////0w9AABOPQAAUD0AAFI9AABUPQAAVj0AAFg9AABaPQAAXD0AAF49AAD///////////////////////////////9gPQAA/////2I9AAD///////////////9kPQAAZj0AAGg9AABqPQAA/////////////////////2w9AAD/////bj0AAHA9AAByPQAAdD0AAP//////////dj0AAHg9AAB6PQAAfD0AAH49AACAPQAAgj0AAIQ9AAD//////////4Y9AACIPQAAij0AAIw9AACOPQAA/////5A9AACSPQAAlD0AAJY9AACYPQAAmj0AAP////+cPQAAnj0AAKA9AACiPQAApD0AAKY9AACoPQAAqj0AAKw9AACuPQAAsD0AALI9AAD/////tD0AALY9AAC4PQAAuj0AALw9AAC+PQAAwD0AAMI9AADEPQAAxj0AAMg9AADKPQAAzD0AAM49AADQPQAA0j0AANQ9AAD////////////////WPQAA2D0AANo9AADcPQAA3j0AAOA9AAD/////4j0AAOQ9AADmPQAA6D0AAOo9AADsPQAA7j0AAP/////wPQAA8j0AAPQ9AAD2PQAA+D0AAPo9AAD///////////w9AAD+PQAAAD4AAAI+AAAEPgAABj4AAAg+AAAKPgAADD4AAA4+AAAQPgAA//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8TPgAAFT4AABc+AAAZPgAAGz4AAB0+AAAfPgAAIT4AACM+AAAlPgAAJz4AACk+AAArPgAALT4AAP////8vPgAAMT4AADM+AAA1PgAANz4AADk+AAA7PgAAPT4AAD8+AAD/////QT4AAEM+AAD/////RT4AAEc+AABJPgAASz4AAE0+AABPPgAAUT4AAFM+AAD/////VT4AAFc+AAD/////WT4AAFs+AABdPgAAXz4AAGE+AAD///////////////9jPgAA/////////////////////2U+AABnPgAAaT4AAGs+AAD/////bT4AAG8+AABxPgAAcz4AAHU+AAB3PgAAeT4AAHs+AAB9PgAAfz4AAIE+AAD/////gz4AAIU+AACHPgAA//////////+JPgAA/////////////////////4s+AACNPgAA/////48+AACRPgAAkz4AAJU+AACXPgAAmT4AAJs+AACdPgAAnz4AAKE+AAD/////oz4AAKU+AACnPgAAqT4AAKs+AACtPgAArz4AALE+AACzPgAAtT4AALc+AAC5PgAAuz4AAL0+AAC/PgAAwT4AAMM+AAD//////////8U+AADHPgAA////////////////////////////////yT4AAMs+AAD/////zT4AAM8+AADRPgAA0z4AANU+AADXPgAA2T4AANs+AADdPgAA3z4AAOE+AADjPgAA5T4AAOc+AADpPgAA6z4AAO0+AAD/////7z4AAP//////////////////////////8T4AAP//////////8z4AAPU+AAD3PgAA+T4AAPs+AAD9PgAA/z4AAAE/AAADPwAABT8AAAc/AAAJPwAACz8AAA0/AAAPPwAA/////xE/AAATPwAAFT8AABc/AAD/////////////////////GT8AABs/AAD///////////////8dPwAAHz8AACE/AAD/////Iz8AACU/AAD///////////////8nPwAAKT8AACs/AAAtPwAALz8AADE/AAAzPwAANT8AADc/AAA5PwAAOz8AAD0/AAA/PwAA//////////9BPwAAQz8AAEU/AABHPwAAST8AAEs/AAD/////TT8AAP////9PPwAAUT8AAFM/AABVPwAAVz8AAP//////////WT8AAP////9bPwAA//////////9dPwAAXz8AAGE/AABjPwAAZT8AAGc/AABpPwAAaz8AAP////9tPwAA//////////9vPwAAcT8AAP////9zPwAAdT8AAHc/AAB5PwAAez8AAH0/AAB/PwAAgT8AAIM/AACFPwAAhz8AAIk/AACLPwAAjT8AAI8/AACRPwAAkz8AAJU/AACXPwAAmT8AAJs/AACdPwAAnz8AAKE/AACjPwAApT8AAKc/AAD//////////6k/AACrPwAA/////60/AAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////7A/AACyPwAAtD8AALY/AAC4PwAAuj8AALw/AAC+PwAAwD8AAMI/AADEPwAAxj8AAMg/AADKPwAAzD8AAM4/AADQPwAA0j8AANQ/AADWPwAA2D8AANo/AADcPwAA3j8AAOA/AADiPwAA5D8AAOY/AADoPwAA6j8AAOw/AADuPwAA8D8AAPI/AAD0PwAA9j8AAP/////4PwAA+j8AAPw/AAD+PwAA/////wBAAAACQAAABEAAAP////8GQAAACEAAAApAAAAMQAAADkAAABBAAAASQAAAFEAAAP////8WQAAAGEAAABpAAAD/////HEAAAB5AAAAgQAAA/////yJAAAAkQAAAJkAAAChAAAAqQAAALEAAAC5AAAAwQAAA/////zJAAAA0QAAANkAAADhAAAA6QAAA/////zxAAAA+QAAAQEAAAEJAAAD/////REAAAEZAAAD/////SEAAAEpAAABMQAAATkAAAFBAAABSQAAAVEAAAFZAAABYQAAAWkAAAFxAAAD//////////15AAABgQAAA//////////9iQAAAZEAAAGZAAABoQAAAakAAAGxAAABuQAAAcEAAAP////9yQAAA//////////90QAAAdkAAAHhAAAB6QAAAfEAAAH5AAACAQAAAgkAAAIRAAACGQAAAiEAAAIpAAACMQAAAjkAAAP////+QQAAA/////5JAAACUQAAAlkAAAP////////////////////+YQAAA/////5pAAACcQAAAnkAAAKBAAACiQAAApEAAAP////+mQAAA/////6hAAACqQAAArEAAAK5AAACwQAAA/////7JAAAD//////////7RAAAC2QAAAuEAAALpAAAD//////////7xAAAC+QAAAwEAAAP//////////////////////////wkAAAMRAAADGQAAA/////8hAAAD/////ykAAAMxAAADOQAAA0EAAANJAAADUQAAA1kAAANhAAAD/////2kAAAP/////cQAAA///////////////////////////eQAAA4EAAAOJAAADkQAAA5kAAAOhAAADqQAAA7EAAAO5AAAD/////////////////////8EAAAPJAAAD0QAAA9kAAAPhAAAD6QAAA/EAAAP5AAAAAQQAAAkEAAARBAAAGQQAACEEAAApBAAAMQQAADkEAAP////8QQQAAEkEAABRBAAAWQQAAGEEAAP////8aQQAA//////////////////////////////////////////8cQQAAHkEAACBBAAAiQQAAJEEAACZBAAD//////////yhBAAAqQQAALEEAAP////8uQQAAMEEAADJBAAA0QQAANkEAADhBAAD//////////zpBAAA8QQAAPkEAAEBBAAD/////QkEAAP//////////REEAAEZBAABIQQAASkEAAExBAABOQQAA/////////////////////1BBAABSQQAA//////////9UQQAAVkEAAFhBAABaQQAAXEEAAF5BAABgQQAAYkEAAGRBAABmQQAAaEEAAGpBAABsQQAAbkEAAHBBAAByQQAA////////////////////////////////dEEAAHZBAAB4QQAA/////3pBAAB8QQAAfkEAAIBBAACCQQAAhEEAAP////+GQQAAiEEAAIpBAACMQQAAjkEAAJBBAACSQQAA/////5RBAAD//////////5ZBAAD///////////////+YQQAA////////////////mkEAAJxBAACeQQAAoEEAAP////+iQQAApEEAAKZBAACoQQAAqkEAAKxBAACuQQAAsEEAALJBAAC0QQAAtkEAALhBAAC6QQAA////////////////////////////////vEEAAP////++QQAAwEEAAMJBAADEQQAA///////////GQQAAyEEAAMpBAAD/////////////////////////////////////zEEAAM5BAAD/////0EEAANJBAADUQQAA1kEAANhBAADaQQAA3EEAAP/////eQQAA4EEAAOJBAADkQQAA5kEAAP/////oQQAA6kEAAOxBAADuQQAA8EEAAPJBAAD0QQAA///////////2QQAA//////hBAAD6QQAA/EEAAP5BAAAAQgAAAkIAAP////8EQgAABkIAAP///////////////whCAAD/////CkIAAP////8MQgAADkIAAP////8QQgAAEkIAABRCAAAWQgAAGEIAABpCAAAcQgAAHkIAACBCAAAiQgAAJEIAACZCAAAoQgAA//////////8qQgAALEIAAC5CAAAwQgAAMkIAADRCAAA2QgAAOEIAADpCAAA8QgAAPkIAAEBCAABCQgAAREIAAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////0dCAABJQgAAS0IAAE1CAABPQgAAUUIAAFNCAABVQgAAV0IAAFlCAABbQgAAXUIAAF9CAABhQgAA/////2NCAABlQgAAZ0IAAGlCAABrQgAAbUIAAG9CAABxQgAAc0IAAHVCAAB3QgAAeUIAAHtCAAB9QgAAf0IAAIFCAACDQgAAhUIAAIdCAACJQgAA/////4tCAAD/////jUIAAI9CAACRQgAAk0IAAJVCAACXQgAA/////5lCAACbQgAAnUIAAJ9CAAChQgAAo0IAAKVCAACnQgAAqUIAAP////+rQgAArUIAAK9CAACxQgAAs0IAALVCAAC3QgAAuUIAALtCAAC9QgAAv0IAAMFCAADDQgAAxUIAAMdCAADJQgAAy0IAAM1CAADPQgAA0UIAANNCAADVQgAA10IAAP//////////2UIAANtCAAD/////3UIAAP/////fQgAA4UIAAONCAADlQgAA50IAAOlCAADrQgAA7UIAAO9CAADxQgAA80IAAPVCAAD3QgAA//////lCAAD7QgAA/UIAAP9CAAABQwAAA0MAAAVDAAAHQwAACUMAAP////8LQwAADUMAAA9DAAARQwAAE0MAABVDAAAXQwAAGUMAABtDAAAdQwAAH0MAACFDAAAjQwAAJUMAACdDAAApQwAAK0MAAC1DAAAvQwAAMUMAADNDAAD/////////////////////NUMAAP////83QwAAOUMAADtDAAD/////PUMAAD9DAABBQwAAQ0MAAEVDAAD///////////////9HQwAASUMAAP///////////////0tDAAD/////TUMAAE9DAABRQwAA//////////9TQwAAVUMAAFdDAAD//////////1lDAABbQwAA//////////9dQwAAX0MAAGFDAABjQwAAZUMAAGdDAAD/////aUMAAP////9rQwAAbUMAAP///////////////29DAABxQwAAc0MAAHVDAAB3QwAA/////3lDAAD/////e0MAAH1DAAB/QwAAgUMAAINDAACFQwAAh0MAAIlDAACLQwAA/////41DAACPQwAAkUMAAJNDAAD/////////////////////lUMAAJdDAACZQwAAm0MAAP//////////nUMAAJ9DAAChQwAAo0MAAKVDAACnQwAAqUMAAKtDAACtQwAAr0MAALFDAACzQwAAtUMAALdDAAC5QwAA/////7tDAAD//////////71DAAC/QwAAwUMAAMNDAADFQwAAx0MAAP//////////yUMAAP/////LQwAAzUMAAM9DAADRQwAA///////////TQwAA1UMAAP/////XQwAA2UMAANtDAADdQwAA30MAAP///////////////+FDAADjQwAA///////////lQwAA/////+dDAAD/////6UMAAOtDAADtQwAA////////////////70MAAPFDAADzQwAA9UMAAPdDAAD5QwAA+0MAAP///////////////////////////UMAAP9DAAABRAAAA0QAAP////8FRAAA//////////8HRAAACUQAAAtEAAANRAAAD0QAABFEAAD//////////xNEAAAVRAAAF0QAABlEAAD/////G0QAAB1EAAD/////H0QAACFEAAAjRAAAJUQAACdEAAApRAAAK0QAAC1EAAD/////L0QAADFEAAAzRAAANUQAAP////83RAAA/////zlEAAA7RAAA/////////////////////z1EAAA/RAAAQUQAAP////9DRAAA/////0VEAABHRAAASUQAAEtEAABNRAAAT0QAAFFEAABTRAAAVUQAAFdEAABZRAAAW0QAAF1EAABfRAAAYUQAAGNEAABlRAAAZ0QAAP////9pRAAA/////2tEAABtRAAAb0QAAHFEAABzRAAAdUQAAHdEAAB5RAAAe0QAAP////99RAAAf0QAAP////+BRAAA/////4NEAACFRAAAh0QAAP////+JRAAAi0QAAI1EAACPRAAA//////////////////////////+RRAAA/////5NEAACVRAAA/////5dEAACZRAAA//////////+bRAAA////////////////nUQAAP////+fRAAAoUQAAKNEAAClRAAAp0QAAKlEAAD//////////6tEAACtRAAAr0QAALFEAAD/////s0QAALVEAAC3RAAA/////7lEAAD//////////////////////////7tEAAD/////vUQAAL9EAAD/////wUQAAMNEAADFRAAAx0QAAMlEAAD/////y0QAAM1EAADPRAAA0UQAANNEAAD/////1UQAANdEAAD/////2UQAAP//////////20QAAP/////dRAAA30QAAOFEAADjRAAA5UQAAOdEAADpRAAA/////+tEAAD/////7UQAAO9EAADxRAAA80QAAP////////////////VEAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////+EQAAPpEAAD8RAAA/kQAAABFAAACRQAABEUAAAZFAAAIRQAACkUAAAxFAAAORQAAEEUAABJFAAD/////FEUAABZFAAAYRQAAGkUAABxFAAAeRQAAIEUAAP////8iRQAA/////yRFAAD/////JkUAAP////8oRQAAKkUAACxFAAAuRQAAMEUAADJFAAA0RQAANkUAADhFAAA6RQAAPEUAAD5FAABARQAAQkUAAP///////////////0RFAAD/////RkUAAEhFAAD//////////0pFAABMRQAATkUAAFBFAABSRQAAVEUAAFZFAABYRQAA/////1pFAAD//////////1xFAABeRQAAYEUAAGJFAABkRQAA//////////9mRQAA/////2hFAABqRQAAbEUAAG5FAAD/////////////////////cEUAAHJFAAB0RQAAdkUAAHhFAAB6RQAAfEUAAH5FAACARQAAgkUAAIRFAACGRQAAiEUAAIpFAACMRQAAjkUAAJBFAACSRQAA/////////////////////5RFAACWRQAAmEUAAJpFAAD//////////5xFAACeRQAAoEUAAKJFAACkRQAApkUAAKhFAACqRQAArEUAAP///////////////65FAACwRQAAskUAALRFAAC2RQAAuEUAALpFAAD/////vEUAAL5FAADARQAAwkUAAMRFAADGRQAAyEUAAMpFAADMRQAAzkUAANBFAADSRQAA1EUAAP/////WRQAA2EUAANpFAADcRQAA3kUAAOBFAAD//////////+JFAAD/////5EUAAP//////////5kUAAOhFAADqRQAA7EUAAO5FAAD///////////BFAAD/////8kUAAPRFAAD/////9kUAAPhFAAD/////+kUAAP/////8RQAA/kUAAABGAAD/////AkYAAARGAAAGRgAACEYAAApGAAAMRgAADkYAABBGAAASRgAAFEYAABZGAAAYRgAAGkYAABxGAAD//////////x5GAAAgRgAA/////yJGAAAkRgAAJkYAAChGAAAqRgAALEYAAC5GAAAwRgAAMkYAADRGAAA2RgAAOEYAADpGAAA8RgAAPkYAAEBGAABCRgAAREYAAEZGAABIRgAASkYAAExGAAD/////TkYAAFBGAABSRgAAVEYAAFZGAABYRgAAWkYAAFxGAABeRgAA/////////////////////////////////////2BGAAD/////YkYAAGRGAAD//////////2ZGAABoRgAAakYAAGxGAABuRgAAcEYAAHJGAAB0RgAA//////////92RgAAeEYAAHpGAAD/////fEYAAH5GAACARgAAgkYAAP////+ERgAAhkYAAIhGAACKRgAAjEYAAP//////////jkYAAJBGAACSRgAAlEYAAJZGAACYRgAAmkYAAJxGAACeRgAAoEYAAKJGAACkRgAA//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////+nRgAAqUYAAKtGAACtRgAAr0YAALFGAAD/////s0YAALVGAAC3RgAAuUYAAP////+7RgAAvUYAAL9GAADBRgAAw0YAAMVGAADHRgAAyUYAAMtGAAD/////zUYAAM9GAADRRgAA00YAANVGAADXRgAA2UYAANtGAADdRgAA30YAAOFGAADjRgAA5UYAAOdGAADpRgAA/////+tGAADtRgAA/////+9GAADxRgAA80YAAPVGAAD3RgAA+UYAAPtGAAD9RgAA/0YAAAFHAAADRwAABUcAAAdHAAAJRwAAC0cAAA1HAAAPRwAAEUcAABNHAAAVRwAAF0cAABlHAAD//////////xtHAAAdRwAAH0cAACFHAAD/////////////////////I0cAAP////8lRwAAJ0cAAClHAAArRwAALUcAAP////8vRwAA/////zFHAAD//////////zNHAAA1RwAAN0cAADlHAAA7RwAAPUcAAP////8/RwAAQUcAAENHAABFRwAAR0cAAElHAABLRwAATUcAAE9HAABRRwAAU0cAAFVHAABXRwAA/////1lHAABbRwAAXUcAAF9HAABhRwAA/////2NHAABlRwAAZ0cAAGlHAABrRwAA//////////////////////////9tRwAA/////29HAABxRwAAc0cAAHVHAAB3RwAAeUcAAHtHAAB9RwAAf0cAAIFHAACDRwAAhUcAAP////////////////////////////////////+HRwAAiUcAAItHAACNRwAAj0cAAJFHAACTRwAAlUcAAP////+XRwAAmUcAAJtHAACdRwAAn0cAAKFHAAD/////o0cAAKVHAACnRwAAqUcAAKtHAACtRwAAr0cAALFHAACzRwAAtUcAALdHAAC5RwAAu0cAAL1HAAC/RwAAwUcAAMNHAADFRwAAx0cAAP/////////////////////JRwAAy0cAAM1HAAD/////z0cAAP//////////////////////////0UcAANNHAAD////////////////////////////////VRwAA10cAANlHAAD/////20cAAP/////dRwAA/////99HAAD/////4UcAAONHAADlRwAA50cAAOlHAADrRwAA7UcAAO9HAADxRwAA80cAAPVHAAD3RwAA//////lHAAD////////////////7RwAA/UcAAP//////RwAAAUgAAANIAAAFSAAAB0gAAP//////////CUgAAP//////////C0gAAP////8NSAAA/////w9IAAD///////////////8RSAAA/////xNIAAAVSAAA/////xdIAAAZSAAAG0gAAB1IAAAfSAAAIUgAACNIAAAlSAAAJ0gAAClIAAArSAAALUgAAC9IAAAxSAAAM0gAADVIAAA3SAAAOUgAADtIAAA9SAAAP0gAAEFIAAD/////Q0gAAEVIAAD//////////0dIAABJSAAAS0gAAE1IAABPSAAAUUgAAP////////////////////9TSAAAVUgAAP//////////V0gAAP///////////////1lIAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////1xIAABeSAAAYEgAAGJIAABkSAAAZkgAAGhIAABqSAAAbEgAAG5IAABwSAAAckgAAHRIAAB2SAAAeEgAAHpIAAB8SAAAfkgAAP////+ASAAAgkgAAIRIAACGSAAAiEgAAP////+KSAAAjEgAAP//////////jkgAAP////+QSAAAkkgAAJRIAACWSAAAmEgAAJpIAACcSAAAnkgAAKBIAACiSAAApEgAAKZIAACoSAAAqkgAAP//////////rEgAAP//////////////////////////rkgAALBIAACySAAAtEgAAP////+2SAAAuEgAALpIAAC8SAAAvkgAAMBIAADCSAAAxEgAAP/////GSAAAyEgAAMpIAAD/////zEgAAP//////////zkgAAP/////QSAAA/////////////////////9JIAAD/////1EgAANZIAADYSAAA2kgAANxIAADeSAAA4EgAAOJIAADkSAAA5kgAAOhIAADqSAAA7EgAAO5IAADwSAAA8kgAAPRIAAD2SAAA+EgAAPpIAAD8SAAA/kgAAABJAAACSQAABEkAAP//////////////////////////////////////////BkkAAP///////////////whJAAAKSQAADEkAAA5JAAAQSQAAEkkAABRJAAAWSQAAGEkAAP//////////GkkAAP////8cSQAAHkkAACBJAAAiSQAA/////////////////////yRJAAAmSQAAKEkAACpJAAAsSQAALkkAADBJAAAySQAANEkAADZJAAA4SQAAOkkAADxJAAA+SQAAQEkAAEJJAABESQAARkkAAEhJAABKSQAATEkAAE5JAABQSQAAUkkAAFRJAABWSQAA//////////////////////////////////////////9YSQAAWkkAAFxJAABeSQAAYEkAAGJJAABkSQAAZkkAAGhJAABqSQAAbEkAAG5JAABwSQAAckkAAHRJAAB2SQAA/////////////////////////////////////3hJAAB6SQAAfEkAAH5JAACASQAAgkkAAIRJAACGSQAAiEkAAP////+KSQAA//////////+MSQAAjkkAAP////////////////////+QSQAA//////////+SSQAAlEkAAJZJAACYSQAAmkkAAP////////////////////+cSQAAnkkAAKBJAACiSQAApEkAAKZJAACoSQAAqkkAAKxJAACuSQAAsEkAALJJAAC0SQAAtkkAALhJAAC6SQAAvEkAAL5JAADASQAAwkkAAMRJAADGSQAAyEkAAMpJAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////81JAADPSQAA0UkAANNJAADVSQAA10kAANlJAADbSQAA/////91JAAD/////30kAAOFJAADjSQAA5UkAAOdJAADpSQAA60kAAO1JAAD//////////+9JAADxSQAA80kAAPVJAAD/////90kAAPlJAAD///////////tJAAD9SQAA/0kAAP//////////AUoAAANKAAAFSgAAB0oAAAlKAAALSgAADUoAAA9KAAARSgAAE0oAABVKAAAXSgAAGUoAABtKAAAdSgAA/////x9KAAD/////IUoAACNKAAAlSgAAJ0oAAClKAAArSgAALUoAAC9KAAAxSgAA/////zNKAAA1SgAAN0oAADlKAAA7SgAAPUoAAD9KAABBSgAA/////0NKAABFSgAAR0oAAElKAABLSgAATUoAAE9KAAD//////////1FKAABTSgAAVUoAAFdKAABZSgAAW0oAAF1KAABfSgAAYUoAAGNKAABlSgAAZ0oAAGlKAAD/////a0oAAG1KAABvSgAA/////3FKAABzSgAAdUoAAHdKAAD//////////3lKAAB7SgAAfUoAAH9KAACBSgAAg0oAAIVKAACHSgAA/////4lKAACLSgAA/////41KAACPSgAAkUoAAP////+TSgAAlUoAAJdKAACZSgAA/////5tKAACdSgAAn0oAAKFKAACjSgAApUoAAKdKAACpSgAAq0oAAK1KAACvSgAAsUoAALNKAAC1SgAAt0oAALlKAAC7SgAAvUoAAP////+/SgAAwUoAAMNKAADFSgAAx0oAAMlKAADLSgAAzUoAAM9KAADRSgAA00oAANVKAADXSgAA2UoAAP/////////////////////bSgAA////////////////3UoAAP///////////////99KAADhSgAA///////////jSgAA5UoAAOdKAADpSgAA60oAAO1KAADvSgAA8UoAAPNKAAD1SgAA90oAAP/////5SgAA+0oAAP///////////////////////////UoAAP9KAAABSwAAA0sAAAVLAAAHSwAACUsAAAtLAAANSwAAD0sAAP///////////////xFLAAATSwAA/////xVLAAD/////F0sAAP//////////GUsAABtLAAD/////HUsAAB9LAAAhSwAA/////yNLAAAlSwAAJ0sAAClLAAD//////////////////////////ytLAAAtSwAAL0sAADFLAAAzSwAA/////zVLAAA3SwAAOUsAAP///////////////ztLAAA9SwAAP0sAAEFLAABDSwAARUsAAP////9HSwAA/////0lLAABLSwAATUsAAE9LAABRSwAAU0sAAFVLAABXSwAA/////1lLAABbSwAAXUsAAF9LAABhSwAAY0sAAP//////////////////////////////////////////ZUsAAGdLAAD//////////2lLAABrSwAAbUsAAG9LAAD///////////////9xSwAAc0sAAHVLAAB3SwAAeUsAAHtLAAB9SwAAf0sAAP////+BSwAAg0sAAIVLAACHSwAAiUsAAP////+LSwAAjUsAAP///////////////49LAAD/////kUsAAJNLAAD//////////5VLAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////5hLAACaSwAAnEsAAJ5LAACgSwAAoksAAKRLAACmSwAAqEsAAKpLAACsSwAArksAALBLAACySwAA/////7RLAAC2SwAAuEsAALpLAAC8SwAAvksAAMBLAADCSwAAxEsAAP/////GSwAAyEsAAP//////////yksAAMxLAADOSwAA0EsAANJLAAD/////1EsAANZLAADYSwAA2ksAANxLAADeSwAA/////+BLAAD/////4ksAAP///////////////////////////////+RLAADmSwAA6EsAAOpLAADsSwAA7ksAAPBLAADySwAA9EsAAPZLAAD///////////hLAAD/////+ksAAPxLAAD+SwAAAEwAAAJMAAAETAAABkwAAAhMAAD//////////wpMAAAMTAAADkwAAP////8QTAAAEkwAABRMAAAWTAAAGEwAABpMAAAcTAAAHkwAACBMAAAiTAAAJEwAAP////8mTAAAKEwAACpMAAAsTAAA/////y5MAAAwTAAAMkwAADRMAAA2TAAAOEwAADpMAAA8TAAA/////z5MAABATAAAQkwAAERMAABGTAAASEwAAEpMAABMTAAATkwAAFBMAAD/////////////////////UkwAAFRMAAD/////////////////////VkwAAFhMAABaTAAAXEwAAF5MAABgTAAAYkwAAGRMAABmTAAAaEwAAP////9qTAAAbEwAAG5MAABwTAAAckwAAHRMAAD/////dkwAAHhMAAB6TAAAfEwAAH5MAAD///////////////+ATAAAgkwAAIRMAACGTAAA/////4hMAAD///////////////+KTAAA/////4xMAACOTAAA/////5BMAACSTAAAlEwAAJZMAAD//////////5hMAACaTAAAnEwAAJ5MAACgTAAA/////6JMAACkTAAApkwAAKhMAACqTAAArEwAAP////+uTAAA/////7BMAACyTAAAtEwAALZMAAC4TAAAukwAAP////+8TAAAvkwAAMBMAADCTAAAxEwAAMZMAADITAAAykwAAMxMAADOTAAA0EwAANJMAADUTAAA1kwAANhMAADaTAAA3EwAAP/////eTAAA4EwAAOJMAADkTAAA5kwAAOhMAAD/////6kwAAOxMAADuTAAA8EwAAPJMAAD0TAAA//////ZMAAD4TAAA+kwAAPxMAAD+TAAA/////wBNAAACTQAABE0AAAZNAAAITQAACk0AAP///////////////////////////////////////////////wxNAAAOTQAA/////xBNAAASTQAAFE0AABZNAAAYTQAAGk0AABxNAAAeTQAAIE0AACJNAAAkTQAAJk0AAChNAAAqTQAALE0AAC5NAAAwTQAAMk0AAP////80TQAANk0AADhNAAA6TQAAPE0AAD5NAABATQAAQk0AAERNAABGTQAASE0AAEpNAABMTQAATk0AAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////1FNAABTTQAAVU0AAFdNAABZTQAAW00AAF1NAABfTQAAYU0AAGNNAABlTQAAZ00AAGlNAABrTQAAbU0AAG9NAABxTQAAc00AAHVNAAB3TQAAeU0AAHtNAAB9TQAA//////////9/TQAAgU0AAINNAACFTQAAh00AAIlNAACLTQAA/////41NAACPTQAAkU0AAJNNAACVTQAAl00AAJlNAACbTQAAnU0AAP////+fTQAA/////6FNAAD/////o00AAKVNAACnTQAAqU0AAKtNAACtTQAAr00AALFNAACzTQAAtU0AALdNAAC5TQAAu00AAP////+9TQAA/////79NAADBTQAAw00AAMVNAADHTQAAyU0AAMtNAADNTQAAz00AANFNAADTTQAA1U0AANdNAADZTQAA200AAP//////////3U0AAP//////////300AAOFNAAD/////400AAOVNAADnTQAA/////+lNAADrTQAA7U0AAP///////////////+9NAAD///////////FNAADzTQAA9U0AAP/////3TQAA+U0AAPtNAAD9TQAA////////////TQAAAU4AAANOAAAFTgAAB04AAAlOAAALTgAADU4AAP//////////D04AABFOAAATTgAAFU4AABdOAAD/////GU4AABtOAAAdTgAAH04AACFOAAAjTgAA/////yVOAAD//////////ydOAAApTgAA//////////8rTgAALU4AAP//////////L04AADFOAAAzTgAANU4AADdOAAA5TgAAO04AAD1OAAA/TgAAQU4AAP////9DTgAARU4AAP///////////////0dOAABJTgAAS04AAE1OAABPTgAAUU4AAP//////////U04AAFVOAABXTgAAWU4AAP////9bTgAAXU4AAF9OAABhTgAAY04AAGVOAABnTgAAaU4AAGtOAAD/////bU4AAG9OAAD/////cU4AAHNOAAB1TgAA////////////////d04AAHlOAAB7TgAAfU4AAH9OAACBTgAA/////4NOAACFTgAAh04AAIlOAACLTgAA/////41OAACPTgAAkU4AAJNOAAD/////lU4AAJdOAACZTgAAm04AAJ1OAACfTgAA/////6FOAACjTgAA/////6VOAAD/////p04AAKlOAACrTgAArU4AAK9OAACxTgAAs04AALVOAAC3TgAAuU4AAP//////////u04AAL1OAAC/TgAAwU4AAP/////DTgAA/////8VOAAD/////x04AAMlOAAD/////y04AAP/////NTgAAz04AAP/////RTgAA004AANVOAAD//////////9dOAADZTgAA/////9tOAAD////////////////dTgAA304AAOFOAADjTgAA5U4AAOdOAADpTgAA604AAP/////tTgAA704AAPFOAADzTgAA9U4AAPdOAAD5TgAA+04AAP1OAAD/TgAA//////////////////////////////////////////8BTwAAA08AAAVPAAD/////B08AAAlPAAALTwAADU8AAA9PAAARTwAAE08AAP////8VTwAAF08AABlPAAD//////////xtPAAD/////HU8AAB9PAAAhTwAAI08AACVPAAD///////////////////////////////8nTwAAKU8AACtPAAD/////LU8AAC9PAAAxTwAAM08AAP//////////NU8AADdPAAA5TwAAO08AAD1PAAA/TwAA/////////////////////0FPAAD/////Q08AAEVPAAD//////////0dPAAD/////SU8AAP////9LTwAATU8AAE9PAABRTwAAU08AAFVPAABXTwAA////////////////WU8AAFtPAAD//////////11PAABfTwAA/////2FPAABjTwAAZU8AAGdPAAD//////////////////////////2lPAAD//////////2tPAAD/////bU8AAP//////////b08AAHFPAAD///////////////9zTwAAdU8AAHdPAAB5TwAAe08AAH1PAAD///////////////9/TwAA/////4FPAAD/////g08AAP//////////hU8AAIdPAAD///////////////+JTwAA////////////////////////////////i08AAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////45PAACQTwAAkk8AAJRPAACWTwAAmE8AAJpPAACcTwAAnk8AAKBPAACiTwAA//////////+kTwAApk8AAKhPAACqTwAArE8AAP////+uTwAAsE8AALJPAAC0TwAAtk8AALhPAAD//////////7pPAAC8TwAAvk8AAMBPAADCTwAAxE8AAMZPAADITwAAyk8AAMxPAADOTwAA/////9BPAAD//////////////////////////9JPAADUTwAA1k8AANhPAADaTwAA3E8AAN5PAADgTwAA4k8AAORPAADmTwAA6E8AAP//////////6k8AAOxPAADuTwAA8E8AAPJPAAD0TwAA9k8AAP//////////+E8AAPpPAAD8TwAA/k8AAABQAAACUAAABFAAAP////8GUAAACFAAAApQAAD//////////wxQAAAOUAAAEFAAABJQAAAUUAAAFlAAABhQAAAaUAAAHFAAAB5QAAAgUAAAIlAAACRQAAAmUAAAKFAAACpQAAAsUAAALlAAADBQAAAyUAAA/////zRQAAA2UAAAOFAAAP////86UAAA/////zxQAAA+UAAAQFAAAP///////////////////////////////0JQAAD///////////////9EUAAARlAAAEhQAABKUAAATFAAAE5QAAD/////UFAAAFJQAAD/////VFAAAP////9WUAAAWFAAAFpQAABcUAAA//////////9eUAAAYFAAAGJQAABkUAAAZlAAAGhQAABqUAAAbFAAAP////9uUAAAcFAAAHJQAAB0UAAAdlAAAHhQAAB6UAAAfFAAAH5QAACAUAAAglAAAIRQAACGUAAAiFAAAIpQAAD/////jFAAAI5QAACQUAAA//////////+SUAAAlFAAAJZQAACYUAAAmlAAAP////+cUAAA/////55QAACgUAAAolAAAKRQAAD//////////////////////////6ZQAAD///////////////+oUAAAqlAAAKxQAAD/////rlAAAP////////////////////+wUAAAslAAALRQAAC2UAAAuFAAAP////+6UAAAvFAAAL5QAAD//////////8BQAADCUAAAxFAAAMZQAAD//////////8hQAAD/////ylAAAMxQAADOUAAA/////9BQAAD/////0lAAAP//////////1FAAANZQAADYUAAA2lAAANxQAADeUAAA4FAAAOJQAADkUAAA5lAAAOhQAADqUAAA7FAAAO5QAADwUAAA8lAAAPRQAAD2UAAA+FAAAPpQAAD8UAAA/lAAAABRAAACUQAABFEAAAZRAAAIUQAAClEAAP///////////////////////////////wxRAAAOUQAAEFEAABJRAAAUUQAAFlEAABhRAAAaUQAA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////x1RAAAfUQAAIVEAACNRAAAlUQAAJ1EAAClRAAArUQAALVEAAC9RAAAxUQAAM1EAADVRAAD//////////zdRAAA5UQAAO1EAAD1RAAA/UQAAQVEAAENRAABFUQAAR1EAAElRAABLUQAA/////01RAABPUQAAUVEAAFNRAABVUQAAV1EAAP////9ZUQAAW1EAAF1RAAD/////X1EAAGFRAAD/////Y1EAAGVRAABnUQAA/////2lRAABrUQAA/////21RAABvUQAAcVEAAHNRAAB1UQAAd1EAAHlRAAB7UQAAfVEAAH9RAACBUQAAg1EAAP////+FUQAAh1EAAIlRAACLUQAAjVEAAI9RAAD/////////////////////kVEAAP//////////k1EAAP//////////////////////////lVEAAP//////////l1EAAJlRAACbUQAAnVEAAJ9RAAChUQAAo1EAAKVRAACnUQAAqVEAAKtRAACtUQAAr1EAALFRAACzUQAAtVEAALdRAAC5UQAAu1EAAL1RAAC/UQAAwVEAAMNRAAD/////xVEAAMdRAADJUQAAy1EAAP//////////zVEAAP//////////////////////////z1EAANFRAAD//////////9NRAADVUQAA11EAANlRAADbUQAA3VEAAN9RAADhUQAA41EAAP/////lUQAA51EAAOlRAADrUQAA7VEAAO9RAAD/////8VEAAPNRAAD1UQAA91EAAPlRAAD7UQAA/VEAAP9RAAABUgAAA1IAAAVSAAAHUgAACVIAAAtSAAANUgAAD1IAABFSAAATUgAAFVIAABdSAAAZUgAAG1IAAB1SAAD///////////////8fUgAAIVIAACNSAAD/////////////////////JVIAACdSAAApUgAA////////////////K1IAAC1SAAD/////L1IAADFSAAAzUgAA////////////////////////////////NVIAADdSAAA5UgAAO1IAAP//////////PVIAAD9SAAD//////////0FSAABDUgAA/////0VSAABHUgAASVIAAP//////////S1IAAP////9NUgAA/////09SAABRUgAAU1IAAP////9VUgAAV1IAAFlSAABbUgAAXVIAAF9SAAD/////YVIAAGNSAAD/////ZVIAAGdSAABpUgAAa1IAAG1SAABvUgAA/////3FSAABzUgAAdVIAAHdSAAB5UgAAe1IAAH1SAAB/UgAAgVIAAINSAACFUgAAh1IAAIlSAACLUgAAjVIAAI9SAACRUgAAk1IAAP////+VUgAA/////5dSAACZUgAAm1IAAJ1SAACfUgAAoVIAAKNSAAClUgAA//////////+nUgAAqVIAAKtSAACtUgAA//////////////////////////+vUgAA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////7JSAAC0UgAAtlIAALhSAAC6UgAAvFIAAL5SAADAUgAAwlIAAMRSAADGUgAAyFIAAMpSAAD//////////8xSAADOUgAA0FIAAP/////SUgAA1FIAANZSAAD/////2FIAANpSAAD//////////9xSAADeUgAA4FIAAP/////iUgAA5FIAAOZSAADoUgAA6lIAAOxSAAD//////////+5SAAD/////8FIAAPJSAAD0UgAA9lIAAPhSAAD////////////////6UgAA/FIAAP5SAAAAUwAAAlMAAARTAAAGUwAACFMAAP//////////ClMAAP////////////////////8MUwAA/////w5TAAAQUwAAElMAABRTAAAWUwAAGFMAABpTAAAcUwAAHlMAACBTAAAiUwAAJFMAACZTAAAoUwAAKlMAACxTAAAuUwAAMFMAADJTAAD//////////zRTAAD/////NlMAAP////84UwAA/////zpTAAD//////////zxTAAA+UwAAQFMAAEJTAABEUwAARlMAAP////9IUwAASlMAAExTAABOUwAAUFMAAFJTAABUUwAAVlMAAFhTAABaUwAAXFMAAF5TAABgUwAAYlMAAGRTAABmUwAAaFMAAGpTAABsUwAAblMAAHBTAAByUwAAdFMAAHZTAAB4UwAAelMAAP////98UwAA/////////////////////35TAAD///////////////+AUwAA/////4JTAAD/////hFMAAIZTAACIUwAA/////4pTAACMUwAA//////////+OUwAAkFMAAJJTAACUUwAAllMAAJhTAACaUwAAnFMAAJ5TAACgUwAAolMAAKRTAACmUwAAqFMAAKpTAACsUwAArlMAALBTAACyUwAA//////////+0UwAAtlMAALhTAAC6UwAAvFMAAL5TAADAUwAA/////8JTAADEUwAAxlMAAMhTAADKUwAAzFMAAP/////OUwAA0FMAANJTAADUUwAA1lMAANhTAAD/////2lMAANxTAAD////////////////eUwAA4FMAAP//////////////////////////4lMAAP/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////lUwAA51MAAOlTAADrUwAA7VMAAO9TAAD/////8VMAAPNTAAD1UwAA91MAAPlTAAD/////+1MAAP1TAAD/UwAAAVQAAANUAAAFVAAA/////wdUAAD/////CVQAAAtUAAANVAAAD1QAABFUAAATVAAAFVQAABdUAAD/////GVQAABtUAAD/////HVQAAB9UAAAhVAAA/////yNUAAAlVAAAJ1QAAClUAAArVAAA/////y1UAAD/////L1QAADFUAAD//////////////////////////zNUAAA1VAAAN1QAAP///////////////zlUAAA7VAAAPVQAAD9UAABBVAAA/////0NUAABFVAAAR1QAAElUAABLVAAATVQAAE9UAABRVAAA/////////////////////1NUAABVVAAAV1QAAP////9ZVAAA/////1tUAABdVAAA//////////9fVAAA/////2FUAAD/////Y1QAAP///////////////2VUAABnVAAAaVQAAGtUAABtVAAAb1QAAP////9xVAAA/////3NUAAB1VAAAd1QAAHlUAAB7VAAAfVQAAH9UAACBVAAA////////////////g1QAAP///////////////4VUAACHVAAA/////4lUAAD///////////////+LVAAAjVQAAP////+PVAAAkVQAAJNUAACVVAAAl1QAAJlUAACbVAAAnVQAAP////+fVAAAoVQAAKNUAAD/////////////////////pVQAAKdUAACpVAAAq1QAAK1UAACvVAAA/////7FUAACzVAAAtVQAAP////+3VAAA//////////////////////////+5VAAAu1QAAL1UAAD/////v1QAAMFUAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////xFQAAMZUAADIVAAAylQAAMxUAADOVAAA/////9BUAADSVAAA1FQAANZUAADYVAAA2lQAANxUAADeVAAA4FQAAOJUAADkVAAA5lQAAOhUAADqVAAA7FQAAO5UAADwVAAA8lQAAPRUAAD2VAAA+FQAAPpUAAD8VAAA/lQAAABVAAACVQAABFUAAP///////////////wZVAAAIVQAAClUAAAxVAAAOVQAAEFUAABJVAAAUVQAAFlUAABhVAAAaVQAAHFUAAB5VAAAgVQAAIlUAACRVAAAmVQAAKFUAACpVAAAsVQAALlUAADBVAAAyVQAANFUAADZVAAD/////OFUAADpVAAA8VQAAPlUAAEBVAABCVQAARFUAAEZVAABIVQAA/////0pVAABMVQAATlUAAFBVAABSVQAAVFUAAFZVAABYVQAAWlUAAFxVAABeVQAAYFUAAGJVAABkVQAAZlUAAGhVAABqVQAAbFUAAG5VAABwVQAAclUAAHRVAAB2VQAAeFUAAHpVAAB8VQAAflUAAIBVAACCVQAA//////////+EVQAAhlUAAP////+IVQAAilUAAIxVAACOVQAAkFUAAJJVAACUVQAAllUAAP//////////mFUAAJpVAACcVQAAnlUAAKBVAACiVQAApFUAAKZVAACoVQAAqlUAAKxVAACuVQAAsFUAALJVAAC0VQAAtlUAALhVAAD/////ulUAALxVAAC+VQAAwFUAAMJVAADEVQAAxlUAAMhVAADKVQAAzFUAAM5VAADQVQAA0lUAANRVAADWVQAA2FUAANpVAADcVQAA3lUAAOBVAADiVQAA5FUAAOZVAADoVQAA/////+pVAADsVQAA/////+5VAADwVQAA8lUAAPRVAAD2VQAA+FUAAPpVAAD8VQAA/lUAAABWAAACVgAABFYAAAZWAAAIVgAAClYAAAxWAAD/////DlYAABBWAAASVgAAFFYAABZWAAAYVgAA//////////////////////////////////////////8aVgAA//////////8cVgAAHlYAACBWAAAiVgAAJFYAACZWAAAoVgAAKlYAACxWAAAuVgAAMFYAADJWAAA0VgAANlYAADhWAAA6VgAAPFYAAP//////////PlYAAEBWAABCVgAARFYAAEZWAABIVgAA//////////9KVgAA/////0xWAABOVgAAUFYAAFJWAABUVgAAVlYAAFhWAAD/////WlYAAFxWAABeVgAAYFYAAGJWAABkVgAAZlYAAGhWAABqVgAA/////2xWAABuVgAA/////3BWAAByVgAAdFYAAHZWAAB4VgAAelYAAHxWAAB+VgAAgFYAAIJWAACEVgAAhlYAAP//////////iFYAAP//////////ilYAAIxWAAD//////////45WAAD//////////5BWAACSVgAAlFYAAJZWAACYVgAAmlYAAJxWAACeVgAAoFYAAKJWAACkVgAAplYAAP////////////////////+oVgAAqlYAAKxWAACuVgAAsFYAALJWAAD/////tFYAALZWAAC4VgAAulYAAP////+8VgAAvlYAAMBWAAD/////wlYAAMRWAADGVgAAyFYAAMpWAADMVgAAzlYAANBWAADSVgAA1FYAANZWAADYVgAA2lYAANxWAADeVgAA4FYAAP//////////4lYAAORWAADmVgAA6FYAAP/////qVgAA7FYAAO5WAADwVgAA////////////////8lYAAPRWAAD2VgAA+FYAAPpWAAD8VgAA/lYAAABXAAD/////AlcAAP//////////BFcAAAZXAAAIVwAAClcAAAxXAAAOVwAAEFcAABJXAAAUVwAAFlcAABhXAAAaVwAAHFcAAB5XAAAgVwAA//////////8iVwAAJFcAACZXAAAoVwAAKlcAACxXAAAuVwAAMFcAADJXAAD/////NFcAADZXAAA4VwAAOlcAADxXAAA+VwAAQFcAAEJXAABEVwAA//////////9GVwAASFcAAEpXAABMVwAATlcAAFBXAABSVwAAVFcAAFZXAABYVwAA/////1pXAABcVwAAXlcAAGBXAABiVwAAZFcAAGZXAABoVwAAalcAAP//////////bFcAAG5XAAD/////cFcAAHJXAAD/////dFcAAP////92VwAAeFcAAP//////////elcAAHxXAAB+VwAAgFcAAP////+CVwAA/////4RXAACGVwAAiFcAAP////+KVwAAjFcAAI5XAACQVwAAklcAAJRXAACWVwAAmFcAAJpXAACcVwAAnlcAAKBXAACiVwAApFcAAKZXAACoVwAAqlcAAKxXAACuVwAA//////////+wVwAAslcAALRXAAC2VwAA////////////////uFcAALpXAAC8VwAAvlcAAMBXAADCVwAAxFcAAMZXAADIVwAA/////8pXAADMVwAAzlcAAP//////////0FcAANJXAAD/////1FcAAP/////WVwAA2FcAANpXAADcVwAA3lcAAOBXAADiVwAA5FcAAOZXAADoVwAA6lcAAOxXAADuVwAA////////////////8FcAAPJXAAD0VwAA9lcAAPhXAAD////////////////////////////////6VwAA/FcAAP/////+VwAAAFgAAAJYAAAEWAAABlgAAAhYAAAKWAAADFgAAA5YAAAQWAAA/////xJYAAAUWAAAFlgAABhYAAAaWAAAHFgAAB5YAAAgWAAAIlgAACRYAAAmWAAAKFgAACpYAAAsWAAALlgAADBYAAAyWAAANFgAAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////zdYAAA5WAAAO1gAAD1YAAA/WAAA/////0FYAABDWAAARVgAAEdYAABJWAAAS1gAAP////9NWAAAT1gAAFFYAABTWAAAVVgAAP////9XWAAAWVgAAP////9bWAAAXVgAAF9YAABhWAAAY1gAAGVYAABnWAAAaVgAAGtYAABtWAAAb1gAAHFYAABzWAAA/////3VYAAB3WAAAeVgAAHtYAAB9WAAAf1gAAP////+BWAAAg1gAAIVYAACHWAAAiVgAAItYAACNWAAAj1gAAJFYAACTWAAAlVgAAJdYAACZWAAAm1gAAJ1YAACfWAAAoVgAAP////+jWAAA/////6VYAAD//////////////////////////6dYAACpWAAAq1gAAK1YAACvWAAAsVgAALNYAAD//////////7VYAAC3WAAAuVgAAP//////////u1gAAL1YAAC/WAAA/////8FYAAD/////w1gAAMVYAADHWAAAyVgAAMtYAADNWAAA///////////PWAAA0VgAANNYAADVWAAA11gAANlYAADbWAAA3VgAAN9YAADhWAAA41gAAOVYAADnWAAA///////////pWAAA61gAAO1YAADvWAAA8VgAAPNYAAD1WAAA91gAAPlYAAD7WAAA/VgAAP9YAAABWQAAA1kAAP////////////////////8FWQAA/////wdZAAD/////CVkAAP////8LWQAA/////w1ZAAD//////////w9ZAAARWQAAE1kAABVZAAAXWQAAGVkAAP//////////G1kAAP////8dWQAAH1kAAP////8hWQAA/////yNZAAAlWQAAJ1kAAClZAAArWQAALVkAAC9ZAAAxWQAAM1kAADVZAAA3WQAAOVkAADtZAAA9WQAAP1kAAEFZAABDWQAA//////////9FWQAAR1kAAElZAAD///////////////9LWQAATVkAAE9ZAABRWQAAU1kAAFVZAABXWQAAWVkAAFtZAABdWQAAX1kAAGFZAABjWQAAZVkAAGdZAABpWQAAa1kAAG1ZAABvWQAAcVkAAHNZAAB1WQAAd1kAAHlZAAB7WQAA////////////////fVkAAH9ZAACBWQAA/////4NZAACFWQAA//////////+HWQAAiVkAAItZAACNWQAAj1kAAP////+RWQAA/////5NZAACVWQAAl1kAAJlZAACbWQAAnVkAAP////+fWQAAoVkAAKNZAAClWQAAp1kAAP//////////qVkAAP//////////////////////////q1kAAK1ZAACvWQAAsVkAALNZAAC1WQAAt1kAALlZAAC7WQAAvVkAAL9ZAADBWQAAw1kAAMVZAADHWQAAyVkAAMtZAADNWQAAz1kAANFZAADTWQAA1VkAANdZAADZWQAA21kAAN1ZAAD////////////////fWQAA///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////iWQAA5FkAAOZZAADoWQAA6lkAAOxZAADuWQAA8FkAAPJZAAD0WQAA9lkAAPhZAAD6WQAA//////xZAAD+WQAAAFoAAAJaAAAEWgAABloAAAhaAAAKWgAADFoAAP//////////DloAABBaAAD//////////xJaAAD/////FFoAABZaAAAYWgAA/////xpaAAAcWgAAHloAACBaAAAiWgAAJFoAACZaAAAoWgAAKloAACxaAAD/////LloAAP//////////MFoAADJaAAD/////NFoAADZaAAA4WgAAOloAADxaAAA+WgAAQFoAAP////9CWgAARFoAAEZaAABIWgAASloAAExaAABOWgAAUFoAAFJaAAD/////VFoAAFZaAABYWgAAWloAAP////9cWgAAXloAAP//////////YFoAAGJaAABkWgAAZloAAP////9oWgAAaloAAGxaAABuWgAAcFoAAP////9yWgAA//////////90WgAAdloAAP//////////eFoAAHpaAAB8WgAAfloAAIBaAACCWgAAhFoAAIZaAACIWgAAiloAAIxaAACOWgAAkFoAAJJaAACUWgAA/////5ZaAACYWgAA//////////+aWgAA//////////+cWgAA/////55aAAD//////////6BaAACiWgAApFoAAKZaAACoWgAAqloAAKxaAACuWgAAsFoAALJaAAC0WgAA/////7ZaAAC4WgAA//////////+6WgAA/////7xaAAC+WgAAwFoAAMJaAADEWgAAxloAAP/////IWgAAyloAAP/////MWgAAzloAANBaAADSWgAA1FoAANZaAAD////////////////YWgAA2loAANxaAADeWgAA4FoAAOJaAADkWgAA5loAAOhaAADqWgAA7FoAAO5aAADwWgAA//////JaAAD0WgAA9loAAP/////4WgAA+loAAP/////8WgAA//////5aAAAAWwAA/////wJbAAD///////////////8EWwAABlsAAAhbAAAKWwAADFsAAA5bAAAQWwAAElsAABRbAAAWWwAAGFsAABpbAAAcWwAAHlsAACBbAAAiWwAAJFsAACZbAAAoWwAAKlsAAP///////////////yxbAAAuWwAA/////zBbAAAyWwAA/////zRbAAA2WwAA/////zhbAAD/////OlsAADxbAAA+WwAAQFsAAEJbAABEWwAARlsAAEhbAABKWwAA//////////9MWwAATlsAAFBbAAD/////UlsAAP////9UWwAAVlsAAP////9YWwAAWlsAAFxbAABeWwAAYFsAAGJbAAD/////ZFsAAGZbAABoWwAAalsAAGxbAAD/////blsAAHBbAAByWwAAdFsAAHZbAAB4WwAA/////////////////////3pbAAB8WwAAflsAAIBbAACCWwAA/////4RbAACGWwAAiFsAAIpbAAD/////jFsAAP//////////jlsAAP////+QWwAA//////////+SWwAAlFsAAP///////////////////////////////5ZbAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////mVsAAJtbAACdWwAAn1sAAKFbAAD/////o1sAAKVbAACnWwAAqVsAAKtbAACtWwAA/////69bAACxWwAAs1sAALVbAAD//////////7dbAAC5WwAA/////7tbAAC9WwAAv1sAAMFbAADDWwAAxVsAAMdbAADJWwAAy1sAAM1bAADPWwAA0VsAANNbAADVWwAA11sAANlbAADbWwAA3VsAAN9bAAD//////////+FbAADjWwAA5VsAAOdbAADpWwAA61sAAO1bAAD/////71sAAPFbAADzWwAA9VsAAPdbAAD/////+VsAAPtbAAD9WwAA/1sAAP////////////////////8BXAAAA1wAAAVcAAAHXAAACVwAAAtcAAANXAAAD1wAABFcAAATXAAAFVwAABdcAAAZXAAAG1wAAB1cAAAfXAAAIVwAACNcAAAlXAAAJ1wAAClcAAArXAAALVwAAC9cAAAxXAAAM1wAADVcAAA3XAAA/////zlcAAD/////O1wAAD1cAAD/////P1wAAEFcAABDXAAARVwAAEdcAABJXAAAS1wAAE1cAABPXAAAUVwAAFNcAAD/////VVwAAFdcAAD/////WVwAAFtcAABdXAAAX1wAAGFcAABjXAAAZVwAAGdcAABpXAAAa1wAAG1cAABvXAAAcVwAAP//////////c1wAAHVcAAB3XAAAeVwAAP////97XAAAfVwAAH9cAACBXAAAg1wAAIVcAACHXAAA//////////+JXAAAi1wAAI1cAACPXAAAkVwAAJNcAACVXAAA/////////////////////5dcAACZXAAAm1wAAJ1cAACfXAAAoVwAAKNcAAClXAAAp1wAAP//////////qVwAAKtcAAD/////rVwAAP////+vXAAAsVwAALNcAAC1XAAAt1wAALlcAAC7XAAAvVwAAL9cAADBXAAAw1wAAP/////////////////////FXAAA/////8dcAADJXAAA/////////////////////8tcAADNXAAA/////89cAADRXAAA/////9NcAADVXAAA11wAANlcAADbXAAA3VwAAN9cAADhXAAA41wAAOVcAADnXAAA/////+lcAAD//////////+tcAAD//////////+1cAADvXAAA8VwAAPNcAAD1XAAA91wAAPlcAAD///////////////////////////tcAAD//////VwAAP//////XAAAAV0AAANdAAD/////BV0AAAddAAAJXQAA/////wtdAAANXQAAD10AABFdAAATXQAAFV0AAP//////////F10AABldAAAbXQAAHV0AAB9dAAAhXQAAI10AACVdAAAnXQAA/////yldAAD/////K10AAC1dAAAvXQAAMV0AAP////8zXQAANV0AADddAAA5XQAAO10AAD1dAAA/XQAAQV0AAENdAABFXQAAR10AAP////////////////////9JXQAA/////0tdAABNXQAAT10AAP///////////////1FdAABTXQAAVV0AAFddAAD//////////1ldAABbXQAA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////Xl0AAGBdAABiXQAAZF0AAGZdAABoXQAAal0AAGxdAABuXQAAcF0AAP////9yXQAA/////3RdAAD/////dl0AAHhdAAB6XQAAfF0AAH5dAAD/////gF0AAP////+CXQAAhF0AAIZdAACIXQAAil0AAIxdAACOXQAAkF0AAJJdAACUXQAAll0AAP///////////////5hdAAD/////ml0AAP////+cXQAAnl0AAKBdAACiXQAApF0AAP////+mXQAA/////6hdAACqXQAArF0AAK5dAAD/////sF0AALJdAAC0XQAA/////7ZdAAD/////////////////////uF0AALpdAAC8XQAAvl0AAMBdAADCXQAAxF0AAMZdAADIXQAAyl0AAMxdAADOXQAA0F0AANJdAAD//////////9RdAADWXQAA////////////////2F0AANpdAADcXQAA/////95dAAD/////4F0AAOJdAADkXQAA5l0AAOhdAADqXQAA7F0AAO5dAADwXQAA///////////yXQAA9F0AAPZdAAD4XQAA+l0AAPxdAAD+XQAAAF4AAAJeAAD/////BF4AAAZeAAAIXgAACl4AAAxeAAD/////Dl4AABBeAAASXgAA/////xReAAD/////Fl4AAP////////////////////8YXgAA//////////8aXgAA/////xxeAAAeXgAAIF4AACJeAAAkXgAA/////yZeAAAoXgAAKl4AACxeAAAuXgAAMF4AADJeAAA0XgAANl4AADheAAA6XgAAPF4AAD5eAABAXgAAQl4AAEReAABGXgAASF4AAEpeAABMXgAATl4AAP////9QXgAA/////1JeAABUXgAAVl4AAP////9YXgAA/////////////////////1peAAD/////////////////////XF4AAF5eAABgXgAA//////////9iXgAAZF4AAGZeAABoXgAA/////2peAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////21eAABvXgAAcV4AAHNeAAB1XgAAd14AAHleAAB7XgAAfV4AAH9eAACBXgAA//////////+DXgAA/////4VeAACHXgAAiV4AAIteAACNXgAAj14AAJFeAACTXgAAlV4AAP////+XXgAAmV4AAJteAACdXgAAn14AAKFeAAD/////o14AAP//////////pV4AAKdeAACpXgAAq14AAP////+tXgAA//////////+vXgAAsV4AALNeAAC1XgAA/////////////////////7deAAC5XgAA/////7teAAC9XgAAv14AAMFeAADDXgAAxV4AAP//////////////////////////x14AAMleAADLXgAAzV4AAM9eAADRXgAA///////////TXgAA1V4AANdeAADZXgAA/////////////////////9teAADdXgAA314AAOFeAADjXgAA5V4AAOdeAADpXgAA614AAO1eAAD//////////+9eAADxXgAA814AAP/////1XgAA914AAP/////5XgAA+14AAP1eAAD//////14AAAFfAAADXwAABV8AAAdfAAAJXwAAC18AAA1fAAD/////D18AABFfAAATXwAAFV8AABdfAAAZXwAAG18AAB1fAAAfXwAAIV8AACNfAAAlXwAAJ18AAClfAAArXwAALV8AAC9fAAAxXwAAM18AAP///////////////zVfAAA3XwAAOV8AADtfAAA9XwAAP18AAP////9BXwAAQ18AAEVfAABHXwAASV8AAP//////////S18AAE1fAABPXwAAUV8AAFNfAABVXwAAV18AAP////9ZXwAAW18AAP//////////XV8AAF9fAAD/////YV8AAP//////////Y18AAGVfAABnXwAA/////2lfAABrXwAAbV8AAG9fAABxXwAAc18AAHVfAAB3XwAAeV8AAHtfAAB9XwAAf18AAIFfAACDXwAAhV8AAIdfAACJXwAA/////4tfAACNXwAA////////////////j18AAJFfAACTXwAAlV8AAJdfAAD///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////+aXwAAnF8AAJ5fAACgXwAAol8AAKRfAACmXwAAqF8AAKpfAACsXwAArl8AALBfAACyXwAA/////7RfAAC2XwAAuF8AALpfAAC8XwAAvl8AAMBfAADCXwAAxF8AAMZfAAD//////////8hfAAD//////////8pfAADMXwAAzl8AANBfAAD/////0l8AANRfAADWXwAA2F8AANpfAADcXwAA3l8AAOBfAADiXwAA5F8AAOZfAAD//////////+hfAAD/////6l8AAOxfAADuXwAA//////BfAADyXwAA9F8AAPZfAAD///////////hfAAD6XwAA//////xfAAD+XwAAAGAAAAJgAAAEYAAABmAAAAhgAAAKYAAA/////wxgAAAOYAAAEGAAABJgAAAUYAAAFmAAABhgAAAaYAAA//////////8cYAAAHmAAACBgAAAiYAAAJGAAACZgAAAoYAAAKmAAACxgAAAuYAAAMGAAADJgAAD/////NGAAAP///////////////zZgAAA4YAAA/////zpgAAA8YAAAPmAAAEBgAAD//////////0JgAABEYAAARmAAAP////9IYAAA/////0pgAAD/////TGAAAE5gAABQYAAAUmAAAFRgAABWYAAAWGAAAFpgAABcYAAAXmAAAGBgAABiYAAAZGAAAGZgAABoYAAAamAAAGxgAABuYAAAcGAAAHJgAAB0YAAAdmAAAHhgAAB6YAAA/////3xgAAB+YAAAgGAAAIJgAACEYAAAhmAAAIhgAACKYAAAjGAAAI5gAACQYAAAkmAAAJRgAACWYAAAmGAAAJpgAACcYAAAnmAAAKBgAAD//////////6JgAACkYAAApmAAAKhgAACqYAAArGAAAK5gAACwYAAA/////7JgAAC0YAAAtmAAAP////+4YAAAumAAAP////+8YAAAvmAAAMBgAAD/////wmAAAMRgAADGYAAAyGAAAMpgAADMYAAAzmAAANBgAADSYAAA1GAAANZgAADYYAAA2mAAANxgAADeYAAA4GAAAOJgAADkYAAA5mAAAOhgAADqYAAA7GAAAO5gAADwYAAA8mAAAPRgAAD2YAAA+GAAAPpgAAD8YAAA/mAAAABhAAACYQAABGEAAAZhAAAIYQAACmEAAAxhAAAOYQAAEGEAABJhAAAUYQAAFmEAABhhAAAaYQAAHGEAAP////8eYQAAIGEAACJhAAAkYQAA/////yZhAAAoYQAAKmEAACxhAAAuYQAAMGEAADJhAAA0YQAA/////zZhAAD///////////////84YQAA//////////86YQAAPGEAAD5hAAD///////////////9AYQAA/////0JhAABEYQAARmEAAEhhAAD/////////////////////SmEAAExhAAD/////TmEAAFBhAAD/////UmEAAP////9UYQAAVmEAAFhhAAD/////WmEAAP////9cYQAAXmEAAGBhAABiYQAA////////////////ZGEAAP///////////////2ZhAAD/////aGEAAGphAAD/////bGEAAP////9uYQAA////////////////cGEAAHJhAAB0YQAAdmEAAHhhAAB6YQAAfGEAAH5hAACAYQAAgmEAAP//////////hGEAAIZhAACIYQAAimEAAIxhAACOYQAAkGEAAJJhAACUYQAAlmEAAJhhAACaYQAAnGEAAJ5hAACgYQAAomEAAKRhAACmYQAAqGEAAKphAACsYQAArmEAALBhAACyYQAAtGEAALZhAAC4YQAAumEAALxhAAD/////vmEAAMBhAADCYQAA/////8RhAADGYQAA/////////////////////8hhAADKYQAAzGEAAM5hAAD////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////RYQAA02EAANVhAADXYQAA2WEAANthAADdYQAA32EAAOFhAADjYQAA5WEAAP//////////52EAAP/////pYQAA62EAAO1hAADvYQAA8WEAAPNhAAD1YQAA92EAAPlhAAD/////+2EAAP1hAAD/YQAAAWIAAANiAAAFYgAA/////wdiAAAJYgAAC2IAAP////8NYgAAD2IAAP////8RYgAAE2IAABViAAD/////F2IAABliAAAbYgAAHWIAAB9iAAAhYgAAI2IAACViAAD//////////ydiAAApYgAA//////////8rYgAALWIAAC9iAAD//////////////////////////zFiAAD/////M2IAADViAAD//////////zdiAAA5YgAAO2IAAD1iAAA/YgAAQWIAAP////9DYgAARWIAAEdiAABJYgAAS2IAAE1iAABPYgAAUWIAAFNiAABVYgAA/////1diAABZYgAAW2IAAF1iAABfYgAA//////////9hYgAA////////////////Y2IAAGViAABnYgAAaWIAAGtiAABtYgAAb2IAAHFiAABzYgAA/////3ViAAB3YgAAeWIAAHtiAAB9YgAA//////////9/YgAAgWIAAINiAACFYgAAh2IAAIliAACLYgAAjWIAAI9iAACRYgAAk2IAAJViAACXYgAAmWIAAJtiAACdYgAA/////59iAAChYgAAo2IAAKViAACnYgAAqWIAAKtiAAD/////rWIAAK9iAACxYgAA/////////////////////7NiAAD/////tWIAALdiAAC5YgAAu2IAAL1iAAC/YgAAwWIAAMNiAADFYgAAx2IAAMliAAD//////////////////////////8tiAADNYgAAz2IAAP/////RYgAA02IAANViAADXYgAA2WIAANtiAADdYgAA32IAAOFiAADjYgAA5WIAAP/////nYgAA6WIAAP/////rYgAA7WIAAO9iAADxYgAA82IAAPViAAD3YgAA+WIAAP/////7YgAA/WIAAP9iAAABYwAAA2MAAP///////////////wVjAAAHYwAACWMAAAtjAAD/////////////////////DWMAAA9jAAARYwAAE2MAAP////8VYwAAF2MAAP////8ZYwAAG2MAAP//////////////////////////////////////////HWMAAP////8fYwAA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////ImMAACRjAAAmYwAAKGMAACpjAAAsYwAALmMAADBjAAAyYwAANGMAADZjAAA4YwAA/////zpjAAD/////PGMAAD5jAABAYwAAQmMAAERjAABGYwAASGMAAEpjAABMYwAATmMAAFBjAAD/////UmMAAFRjAABWYwAAWGMAAFpjAABcYwAA/////15jAABgYwAAYmMAAGRjAABmYwAAaGMAAGpjAABsYwAAbmMAAP///////////////3BjAAByYwAA/////3RjAAB2YwAAeGMAAHpjAAB8YwAAfmMAAIBjAACCYwAAhGMAAIZjAACIYwAAimMAAP///////////////////////////////4xjAACOYwAAkGMAAJJjAACUYwAAlmMAAJhjAACaYwAAnGMAAJ5jAACgYwAAomMAAP////////////////////+kYwAApmMAAP//////////qGMAAKpjAACsYwAArmMAALBjAACyYwAAtGMAALZjAAC4YwAAumMAALxjAAC+YwAAwGMAAMJjAADEYwAAxmMAAP///////////////8hjAADKYwAAzGMAAM5jAADQYwAA0mMAANRjAADWYwAA2GMAANpjAADcYwAA/////95jAAD/////////////////////4GMAAOJjAADkYwAA5mMAAOhjAADqYwAA7GMAAO5jAADwYwAA8mMAAPRjAAD2YwAA+GMAAPpjAAD8YwAA/mMAAABkAAACZAAABGQAAP////8GZAAACGQAAApkAAAMZAAADmQAABBkAAASZAAAFGQAABZkAAAYZAAAGmQAABxkAAAeZAAAIGQAACJkAAAkZAAAJmQAAChkAAAqZAAALGQAAC5kAAAwZAAAMmQAADRkAAD//////////zZkAAA4ZAAAOmQAADxkAAA+ZAAAQGQAAEJkAABEZAAARmQAAEhkAABKZAAA/////0xkAABOZAAAUGQAAFJkAABUZAAAVmQAAFhkAABaZAAAXGQAAF5kAABgZAAAYmQAAGRkAABmZAAAaGQAAP////9qZAAA/////2xkAABuZAAAcGQAAHJkAAB0ZAAAdmQAAHhkAAB6ZAAAfGQAAH5kAACAZAAAgmQAAIRkAACGZAAAiGQAAIpkAACMZAAA/////45kAACQZAAAkmQAAJRkAACWZAAAmGQAAJpkAACcZAAA/////55kAACgZAAA/////6JkAACkZAAApmQAAKhkAACqZAAArGQAAP////+uZAAAsGQAALJkAAC0ZAAAtmQAALhkAAC6ZAAAvGQAAL5kAADAZAAAwmQAAMRkAADGZAAAyGQAAMpkAADMZAAAzmQAANBkAADSZAAA1GQAANZkAADYZAAA/////9pkAADcZAAA///////////eZAAA/////+BkAAD/////////////////////4mQAAORkAAD/////5mQAAOhkAADqZAAA7GQAAP/////uZAAA///////////wZAAA8mQAAPRkAAD2ZAAA+GQAAPpkAAD///////////xkAAD+ZAAA/////wBlAAACZQAA/////wRlAAD/////BmUAAAhlAAAKZQAADGUAAA5lAAAQZQAA//////////8SZQAAFGUAABZlAAAYZQAAGmUAABxlAAAeZQAAIGUAACJlAAAkZQAAJmUAAP////8oZQAAKmUAACxlAAAuZQAAMGUAADJlAAA0ZQAANmUAADhlAAA6ZQAAPGUAAP////8+ZQAA/////0BlAABCZQAARGUAAEZlAABIZQAASmUAAP////9MZQAATmUAAFBlAABSZQAAVGUAAP//////////VmUAAFhlAAD///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////9bZQAAXWUAAF9lAABhZQAAY2UAAGVlAABnZQAAaWUAAGtlAABtZQAAb2UAAHFlAAD/////c2UAAP////91ZQAAd2UAAHllAAB7ZQAAfWUAAH9lAAD/////gWUAAP//////////g2UAAP////+FZQAAh2UAAIllAACLZQAAjWUAAP//////////j2UAAJFlAACTZQAAlWUAAJdlAAD//////////5llAAD/////m2UAAJ1lAACfZQAA/////6FlAACjZQAApWUAAP////+nZQAAqWUAAKtlAACtZQAA//////////+vZQAAsWUAALNlAAC1ZQAAt2UAALllAAC7ZQAA/////71lAAC/ZQAAwWUAAMNlAADFZQAAx2UAAMllAADLZQAAzWUAAM9lAAD/////0WUAANNlAADVZQAA12UAANllAADbZQAA3WUAAP//////////32UAAOFlAAD/////42UAAOVlAADnZQAA/////+llAAD/////62UAAP/////tZQAA///////////vZQAA8WUAAPNlAAD1ZQAA92UAAPllAAD///////////tlAAD///////////1lAAD/////////////////ZQAA//////////8BZgAA//////////8DZgAA//////////8FZgAAB2YAAAlmAAALZgAADWYAAA9mAAD//////////xFmAAD/////E2YAAP///////////////////////////////xVmAAAXZgAA//////////////////////////8ZZgAA/////xtmAAAdZgAAH2YAAP////8hZgAA/////yNmAAD/////JWYAACdmAAApZgAAK2YAAP////////////////////8tZgAA////////////////L2YAADFmAAAzZgAA//////////81ZgAAN2YAADlmAAA7ZgAAPWYAAD9mAABBZgAAQ2YAAEVmAAD//////////0dmAAD//////////0lmAAD///////////////9LZgAA//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////9OZgAAUGYAAFJmAABUZgAAVmYAAFhmAABaZgAAXGYAAF5mAABgZgAAYmYAAGRmAAD//////////2ZmAABoZgAAamYAAGxmAABuZgAAcGYAAHJmAAB0ZgAAdmYAAP////94ZgAAemYAAP////98ZgAAfmYAAIBmAACCZgAAhGYAAIZmAACIZgAAimYAAIxmAACOZgAAkGYAAJJmAACUZgAAlmYAAJhmAACaZgAA/////////////////////5xmAACeZgAAoGYAAKJmAACkZgAApmYAAKhmAACqZgAArGYAAK5mAACwZgAAsmYAALRmAAC2ZgAAuGYAALpmAAC8ZgAAvmYAAMBmAADCZgAAxGYAAMZmAADIZgAAymYAAMxmAAD/////zmYAANBmAADSZgAA1GYAANZmAADYZgAA2mYAANxmAADeZgAA4GYAAOJmAADkZgAA5mYAAOhmAADqZgAA7GYAAO5mAADwZgAA8mYAAPRmAAD2ZgAA//////////////////////hmAAD6ZgAA//////xmAAD+ZgAAAGcAAAJnAAAEZwAA/////wZnAAAIZwAACmcAAAxnAAAOZwAAEGcAABJnAAAUZwAA//////////8WZwAAGGcAABpnAAAcZwAAHmcAACBnAAAiZwAA/////yRnAAAmZwAA//////////////////////////8oZwAAKmcAACxnAAAuZwAAMGcAADJnAAA0ZwAANmcAADhnAAA6ZwAAPGcAAD5nAABAZwAAQmcAAERnAABGZwAASGcAAEpnAABMZwAA//////////9OZwAAUGcAAFJnAABUZwAAVmcAAFhnAABaZwAA/////1xnAAD/////XmcAAGBnAAD//////////2JnAAD/////ZGcAAGZnAAD//////////2hnAABqZwAAbGcAAG5nAABwZwAAcmcAAHRnAAD//////////3ZnAAD//////////3hnAAB6ZwAAfGcAAH5nAACAZwAAgmcAAIRnAACGZwAAiGcAAIpnAACMZwAAjmcAAJBnAACSZwAA/////////////////////5RnAACWZwAAmGcAAJpnAACcZwAAnmcAAKBnAACiZwAApGcAAKZnAACoZwAAqmcAAKxnAACuZwAAsGcAALJnAAD//////////7RnAAC2ZwAAuGcAALpnAAC8ZwAAvmcAAMBnAADCZwAAxGcAAMZnAADIZwAAymcAAP//////////zGcAAM5nAADQZwAA0mcAAP//////////1GcAANZnAADYZwAA/////9pnAADcZwAA3mcAAP/////gZwAA4mcAAORnAADmZwAA6GcAAOpnAADsZwAA7mcAAPBnAADyZwAA9GcAAPZnAAD4ZwAA+mcAAPxnAAD//////mcAAP///////////////wBoAAD///////////////8CaAAABGgAAAZoAAAIaAAA////////////////CmgAAP//////////DGgAAP////8OaAAAEGgAABJoAAAUaAAA//////////////////////////8WaAAAGGgAABpoAAAcaAAAHmgAACBoAAAiaAAA//////////8kaAAAJmgAAChoAAAqaAAALGgAAC5oAAAwaAAAMmgAADRoAAA2aAAAOGgAADpoAAA8aAAAPmgAAP////9AaAAAQmgAAERoAABGaAAASGgAAP////9KaAAA//////////9MaAAATmgAAFBoAABSaAAAVGgAAFZoAABYaAAA/////1poAABcaAAA//////////9eaAAA/////2BoAABiaAAAZGgAAP////9maAAAaGgAAGpoAABsaAAA/////25oAABwaAAAcmgAAHRoAAD//////////////////////////3ZoAAB4aAAA/////3poAAB8aAAAfmgAAIBoAACCaAAAhGgAAIZoAACIaAAAimgAAIxoAACOaAAAkGgAAJJoAAD//////////5RoAACWaAAAmGgAAP////+aaAAAnGgAAJ5oAAD/////oGgAAKJoAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////6VoAACnaAAAqWgAAKtoAACtaAAAr2gAAP////+xaAAAs2gAALVoAAC3aAAAuWgAALtoAAC9aAAAv2gAAMFoAADDaAAAxWgAAMdoAADJaAAAy2gAAM1oAAD/////z2gAANFoAADTaAAA1WgAANdoAADZaAAA22gAAN1oAADfaAAA4WgAAP/////jaAAA5WgAAP/////naAAA6WgAAP/////raAAA////////////////////////////////7WgAAO9oAADxaAAA82gAAPVoAAD3aAAA+WgAAPtoAAD9aAAA/2gAAAFpAAADaQAABWkAAAdpAAAJaQAAC2kAAA1pAAAPaQAAEWkAABNpAAAVaQAA////////////////F2kAABlpAAAbaQAAHWkAAB9pAAAhaQAAI2kAACVpAAAnaQAAKWkAACtpAAAtaQAAL2kAADFpAAAzaQAANWkAADdpAAA5aQAAO2kAAD1pAAA/aQAAQWkAAENpAAD//////////0VpAABHaQAASWkAAEtpAABNaQAAT2kAAFFpAABTaQAAVWkAAFdpAABZaQAA////////////////////////////////W2kAAF1pAAD///////////////9faQAAYWkAAGNpAABlaQAAZ2kAAGlpAABraQAAbWkAAG9pAABxaQAAc2kAAHVpAAB3aQAAeWkAAP////97aQAAfWkAAH9pAACBaQAAg2kAAIVpAACHaQAAiWkAAP////+LaQAAjWkAAI9pAACRaQAAk2kAAJVpAACXaQAAmWkAAJtpAACdaQAAn2kAAKFpAACjaQAApWkAAKdpAACpaQAAq2kAAK1pAAD/////r2kAALFpAACzaQAAtWkAALdpAAC5aQAAu2kAAL1pAAC/aQAAwWkAAMNpAADFaQAAx2kAAMlpAADLaQAAzWkAAM9pAADRaQAA02kAANVpAAD////////////////XaQAA/////9lpAAD//////////9tpAADdaQAA32kAAOFpAADjaQAA/////+VpAADnaQAA6WkAAOtpAADtaQAA72kAAPFpAAD/////82kAAPVpAAD3aQAA+WkAAPtpAAD9aQAA/2kAAAFqAAADagAABWoAAP////8HagAACWoAAAtqAAANagAAD2oAABFqAAATagAAFWoAABdqAAAZagAAG2oAAB1qAAAfagAAIWoAACNqAAD/////////////////////JWoAACdqAAApagAAK2oAAC1qAAAvagAAMWoAADNqAAA1agAAN2oAADlqAAA7agAAPWoAAD9qAABBagAA/////0NqAABFagAAR2oAAElqAABLagAATWoAAE9qAABRagAA/////////////////////1NqAABVagAA////////////////////////////////V2oAAFlqAABbagAAXWoAAF9qAABhagAAY2oAAGVqAABnagAAaWoAAGtqAABtagAAb2oAAHFqAABzagAAdWoAAHdqAAB5agAAe2oAAH1qAAB/agAAgWoAAINqAACFagAAh2oAAIlqAACLagAAjWoAAI9qAACRagAAk2oAAJVqAACXagAAmWoAAJtqAACdagAA/////59qAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////omoAAKRqAACmagAAqGoAAKpqAACsagAA/////65qAACwagAAsmoAALRqAAD/////tmoAALhqAAC6agAA/////7xqAAC+agAAwGoAAMJqAADEagAAxmoAAMhqAADKagAAzGoAAM5qAADQagAA0moAANRqAADWagAA/////9hqAADaagAA///////////cagAA///////////eagAA///////////gagAA4moAAORqAADmagAA6GoAAOpqAADsagAA7moAAPBqAADyagAA9GoAAPZqAAD4agAA+moAAPxqAAD//////moAAP////8AawAAAmsAAP////8EawAABmsAAAhrAAAKawAADGsAAA5rAAAQawAAEmsAABRrAAAWawAAGGsAAP////8aawAAHGsAAB5rAAAgawAAImsAAP////8kawAAJmsAAChrAAD/////KmsAAP////8sawAALmsAADBrAAAyawAANGsAADZrAAD/////OGsAAP////86awAA/////zxrAAA+awAA//////////9AawAAQmsAAERrAABGawAASGsAAEprAABMawAATmsAAFBrAAD/////UmsAAFRrAABWawAAWGsAAFprAABcawAAXmsAAGBrAABiawAAZGsAAGZrAABoawAAamsAAGxrAABuawAAcGsAAHJrAAB0awAAdmsAAHhrAAD//////////3prAAB8awAAfmsAAP//////////gGsAAP//////////gmsAAP////+EawAA//////////+GawAAiGsAAIprAACMawAAjmsAAP////+QawAA/////5JrAAD/////lGsAAP////+WawAAmGsAAJprAACcawAAnmsAAKBrAACiawAApGsAAKZrAACoawAAqmsAAKxrAACuawAAsGsAALJrAAC0awAAtmsAALhrAAD///////////////+6awAAvGsAAL5rAADAawAAwmsAAMRrAADGawAAyGsAAMprAADMawAAzmsAANBrAAD/////0msAANRrAADWawAA2GsAAP/////aawAA3GsAAN5rAADgawAA4msAAORrAAD//////////+ZrAADoawAA6msAAOxrAADuawAA//////BrAAD////////////////yawAA9GsAAP////////////////ZrAAD4awAA+msAAPxrAAD//////////////////////////////////////msAAP///////////////wBsAAACbAAABGwAAAZsAAD//////////whsAAD///////////////8KbAAADGwAAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8PbAAAEWwAABNsAAAVbAAAF2wAABlsAAAbbAAAHWwAAB9sAAAhbAAAI2wAACVsAAAnbAAAKWwAACtsAAAtbAAAL2wAADFsAAAzbAAANWwAADdsAAA5bAAAO2wAAD1sAAA/bAAAQWwAAENsAABFbAAAR2wAAElsAABLbAAATWwAAE9sAABRbAAAU2wAAFVsAABXbAAAWWwAAFtsAABdbAAA////////////////X2wAAGFsAABjbAAAZWwAAGdsAABpbAAAa2wAAG1sAABvbAAAcWwAAHNsAAB1bAAAd2wAAHlsAAD//////////3tsAAB9bAAAf2wAAIFsAACDbAAAhWwAAIdsAAD/////iWwAAItsAACNbAAAj2wAAJFsAACTbAAAlWwAAJdsAACZbAAAm2wAAJ1sAACfbAAA////////////////oWwAAKNsAAD//////////6VsAACnbAAAqWwAAKtsAACtbAAAr2wAALFsAACzbAAAtWwAALdsAAC5bAAAu2wAAL1sAAC/bAAAwWwAAP//////////w2wAAP/////FbAAA/////8dsAAD/////yWwAAMtsAADNbAAAz2wAANFsAADTbAAA1WwAANdsAADZbAAA22wAAN1sAADfbAAA///////////hbAAA42wAAOVsAADnbAAA6WwAAP/////rbAAA7WwAAO9sAADxbAAA82wAAPVsAAD3bAAA+WwAAPtsAAD9bAAA/2wAAAFtAAADbQAABW0AAAdtAAAJbQAAC20AAA1tAAD/////////////////////D20AABFtAAD/////E20AABVtAAD/////F20AABltAAAbbQAA/////x1tAAAfbQAAIW0AACNtAAAlbQAAJ20AACltAAArbQAALW0AAC9tAAAxbQAAM20AADVtAAA3bQAAOW0AADttAAD///////////////89bQAAP20AAEFtAAD///////////////9DbQAARW0AAEdtAAD/////SW0AAEttAABNbQAAT20AAFFtAABTbQAA//////////9VbQAAV20AAFltAABbbQAAXW0AAF9tAABhbQAAY20AAGVtAABnbQAAaW0AAGttAABtbQAA/////29tAABxbQAAc20AAHVtAAB3bQAAeW0AAHttAAB9bQAAf20AAIFtAACDbQAAhW0AAIdtAACJbQAAi20AAI1tAACPbQAAkW0AAJNtAACVbQAAl20AAJltAAD/////m20AAJ1tAACfbQAAoW0AAKNtAAClbQAAp20AAKltAACrbQAArW0AAK9tAACxbQAAs20AALVtAAD//////////7dtAAC5bQAA/////7ttAAC9bQAAv20AAMFtAADDbQAAxW0AAMdtAAD/////////////////////yW0AAMttAAD////////////////////////////////NbQAAz20AANFtAADTbQAA///////////VbQAA120AANltAAD////////////////bbQAA3W0AAN9tAADhbQAA/////////////////////+NtAADlbQAA520AAOltAAD/////620AAP/////tbQAA///////////vbQAA8W0AAP/////zbQAA//////////////////////VtAAD3bQAA+W0AAPttAAD//////W0AAP///////////20AAP///////////////wFuAAADbgAABW4AAAduAAAJbgAA/////wtuAAANbgAAD24AABFuAAATbgAAFW4AABduAAAZbgAAG24AAB1uAAAfbgAAIW4AACNuAAAlbgAAJ24AACluAAArbgAALW4AAC9uAAAxbgAAM24AAP////81bgAAN24AADluAAA7bgAAPW4AAD9uAABBbgAAQ24AAEVuAABHbgAA/////0luAAD//////////0tuAABNbgAAT24AAFFuAABTbgAAVW4AAFduAABZbgAAW24AAP////9dbgAAX24AAGFuAABjbgAAZW4AAGduAABpbgAAa24AAP////9tbgAAb24AAP//////////cW4AAHNuAAB1bgAAd24AAHluAAB7bgAAfW4AAH9uAACBbgAAg24AAIVuAACHbgAAiW4AAItuAAD/////jW4AAI9uAACRbgAAk24AAJVuAACXbgAAmW4AAJtuAACdbgAAn24AAKFuAACjbgAApW4AAKduAACpbgAAq24AAK1uAACvbgAAsW4AALNuAAC1bgAAt24AALluAAC7bgAAvW4AAL9uAADBbgAAw24AAMVuAADHbgAAyW4AAMtuAAD//////////81uAAD//////////89uAADRbgAA/////9NuAADVbgAA124AANluAADbbgAA3W4AAP/////fbgAA4W4AAP/////jbgAA5W4AAOduAAD/////6W4AAOtuAAD/////7W4AAP/////vbgAA8W4AAPNuAAD1bgAA924AAPluAAD7bgAA/W4AAP9uAAABbwAAA28AAAVvAAAHbwAA//////////8JbwAAC28AAP//////////DW8AAA9vAAD/////EW8AABNvAAAVbwAAF28AABlvAAAbbwAAHW8AAB9vAAD//////////yFvAAD//////////yNvAAAlbwAAJ28AAP////8pbwAAK28AAC1vAAD/////L28AADFvAAAzbwAANW8AADdvAAA5bwAA/////ztvAAA9bwAAP28AAEFvAABDbwAARW8AAP////9HbwAASW8AAEtvAABNbwAAT28AAFFvAAD///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////9UbwAAVm8AAFhvAABabwAAXG8AAF5vAABgbwAAYm8AAGRvAABmbwAA/////2hvAABqbwAAbG8AAG5vAABwbwAAcm8AAHRvAAB2bwAA/////3hvAAB6bwAA/////3xvAAB+bwAAgG8AAP////+CbwAAhG8AAIZvAAD/////iG8AAIpvAACMbwAAjm8AAJBvAACSbwAAlG8AAP////+WbwAA//////////+YbwAAmm8AAJxvAACebwAAoG8AAKJvAACkbwAApm8AAKhvAACqbwAArG8AAP///////////////65vAAD/////sG8AALJvAAD/////tG8AALZvAAD/////uG8AALpvAAC8bwAA/////75vAAD//////////8BvAADCbwAAxG8AAMZvAADIbwAAym8AAMxvAADObwAA/////9BvAADSbwAA1G8AANZvAADYbwAA2m8AANxvAADebwAA4G8AAOJvAADkbwAA/////+ZvAAD//////////////////////////+hvAADqbwAA7G8AAO5vAAD/////8G8AAP/////////////////////ybwAA9G8AAPZvAAD4bwAA+m8AAP///////////G8AAP5vAAD/////AHAAAAJwAAD/////BHAAAAZwAAAIcAAACnAAAAxwAAAOcAAAEHAAAP///////////////xJwAAAUcAAAFnAAABhwAAAacAAA////////////////HHAAAB5wAAAgcAAAInAAACRwAAAmcAAAKHAAACpwAAAscAAA/////y5wAAAwcAAA/////////////////////zJwAAA0cAAA/////////////////////zZwAAA4cAAA/////zpwAAA8cAAA//////////8+cAAAQHAAAP////9CcAAARHAAAEZwAAD//////////0hwAAD/////////////////////SnAAAExwAABOcAAAUHAAAFJwAABUcAAAVnAAAFhwAABacAAAXHAAAF5wAABgcAAA/////////////////////2JwAABkcAAA//////////9mcAAAaHAAAGpwAABscAAAbnAAAP////9wcAAAcnAAAP//////////dHAAAHZwAAD///////////////94cAAA//////////96cAAAfHAAAP//////////fnAAAP////+AcAAAgnAAAIRwAAD///////////////////////////////////////////////+GcAAAiHAAAIpwAACMcAAAjnAAAJBwAACScAAAlHAAAJZwAACYcAAA/////5pwAACccAAA/////////////////////55wAACgcAAAonAAAKRwAAD/////pnAAAP//////////qHAAAP//////////qnAAAKxwAAD/////rnAAAP//////////sHAAALJwAAC0cAAAtnAAAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////+5cAAAu3AAAL1wAAC/cAAAwXAAAMNwAADFcAAAx3AAAMlwAADLcAAAzXAAAM9wAADRcAAA03AAANVwAADXcAAA2XAAANtwAAD/////3XAAAN9wAADhcAAA43AAAOVwAADncAAA6XAAAP//////////////////////////63AAAO1wAADvcAAA8XAAAPNwAAD/////9XAAAPdwAAD/////+XAAAPtwAAD//////XAAAP9wAAABcQAAA3EAAP////8FcQAA//////////8HcQAACXEAAAtxAAANcQAAD3EAABFxAAATcQAAFXEAABdxAAD/////GXEAAP//////////////////////////G3EAAP///////////////x1xAAAfcQAA/////yFxAAD/////////////////////I3EAACVxAAAncQAAKXEAACtxAAAtcQAAL3EAADFxAAAzcQAANXEAADdxAAA5cQAA//////////87cQAAPXEAAD9xAABBcQAA/////0NxAABFcQAAR3EAAP////9JcQAA/////////////////////0txAABNcQAAT3EAAFFxAABTcQAAVXEAAFdxAABZcQAAW3EAAF1xAABfcQAAYXEAAGNxAABlcQAAZ3EAAGlxAABrcQAAbXEAAG9xAABxcQAA/////3NxAAB1cQAA/////3dxAAB5cQAAe3EAAP////99cQAA/////39xAACBcQAAg3EAAIVxAACHcQAAiXEAAItxAACNcQAA//////////+PcQAAkXEAAJNxAACVcQAAl3EAAJlxAACbcQAAnXEAAJ9xAAChcQAAo3EAAKVxAACncQAAqXEAAKtxAACtcQAAr3EAALFxAACzcQAAtXEAALdxAAD/////uXEAALtxAAC9cQAAv3EAAMFxAADDcQAAxXEAAMdxAADJcQAAy3EAAM1xAADPcQAA0XEAANNxAAD/////1XEAANdxAADZcQAA////////////////23EAAP/////dcQAA33EAAOFxAADjcQAA/////+VxAAD//////////////////////////+dxAAD//////////+lxAADrcQAA7XEAAP///////////////+9xAAD/////8XEAAP/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////0cQAA9nEAAPhxAAD6cQAA/HEAAP5xAAAAcgAAAnIAAARyAAAGcgAACHIAAApyAAD/////DHIAAA5yAAAQcgAAEnIAABRyAAAWcgAAGHIAAP////8acgAAHHIAAB5yAAD//////////////////////////yByAAAicgAAJHIAACZyAAAocgAAKnIAAP////8scgAA/////y5yAAAwcgAAMnIAADRyAAA2cgAA//////////84cgAAOnIAADxyAAA+cgAAQHIAAEJyAABEcgAARnIAAEhyAABKcgAATHIAAE5yAABQcgAAUnIAAP////9UcgAAVnIAAFhyAABacgAAXHIAAF5yAABgcgAA/////2JyAABkcgAAZnIAAGhyAABqcgAAbHIAAG5yAAD/////cHIAAHJyAAB0cgAAdnIAAHhyAAD//////////3pyAAB8cgAAfnIAAIByAACCcgAAhHIAAIZyAACIcgAAinIAAIxyAAD//////////45yAAD/////kHIAAJJyAAD/////lHIAAP////+WcgAAmHIAAJpyAACccgAAnnIAAKByAACicgAApHIAAKZyAACocgAAqnIAAKxyAACucgAAsHIAALJyAAC0cgAAtnIAALhyAAC6cgAAvHIAAL5yAADAcgAAwnIAAMRyAADGcgAA///////////IcgAA////////////////ynIAAP/////McgAA///////////OcgAA///////////QcgAA0nIAANRyAADWcgAA2HIAANpyAADccgAA3nIAAOByAADicgAA/////+RyAAD/////5nIAAP//////////6HIAAP///////////////+pyAADscgAA7nIAAP//////////8HIAAPJyAAD0cgAA//////ZyAAD4cgAA+nIAAPxyAAD+cgAA//////////8AcwAAAnMAAP////8EcwAABnMAAAhzAAAKcwAADHMAAA5zAAAQcwAAEnMAABRzAAAWcwAAGHMAABpzAAAccwAAHnMAACBzAAAicwAAJHMAACZzAAAocwAAKnMAAP////8scwAA/////y5zAAAwcwAA/////zJzAAA0cwAA//////////82cwAAOHMAADpzAAD/////PHMAAD5zAABAcwAA/////0JzAABEcwAARnMAAEhzAABKcwAATHMAAP////9OcwAAUHMAAP////9ScwAAVHMAAFZzAABYcwAAWnMAAP//////////XHMAAF5zAAD/////YHMAAGJzAABkcwAA/////2ZzAAD//////////////////////////2hzAAD///////////////////////////////9qcwAA/////2xzAABucwAA//////////9wcwAAcnMAAP////90cwAAdnMAAHhzAAB6cwAAfHMAAH5zAACAcwAA////////////////gnMAAIRzAAD/////hnMAAIhzAACKcwAAjHMAAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////+PcwAAkXMAAJNzAACVcwAAl3MAAJlzAAD/////m3MAAJ1zAACfcwAAoXMAAKNzAAD/////pXMAAKdzAACpcwAAq3MAAK1zAACvcwAA/////7FzAACzcwAAtXMAALdzAAC5cwAAu3MAAL1zAAC/cwAA/////8FzAADDcwAA/////8VzAADHcwAA/////8lzAADLcwAA///////////NcwAAz3MAANFzAADTcwAA1XMAANdzAADZcwAA23MAAN1zAADfcwAA4XMAAONzAADlcwAA53MAAOlzAADrcwAA///////////tcwAA/////+9zAAD/////////////////////////////////////8XMAAPNzAAD1cwAA93MAAPlzAAD7cwAA/XMAAP9zAAABdAAAA3QAAAV0AAAHdAAACXQAAAt0AAANdAAAD3QAABF0AAD///////////////////////////////8TdAAAFXQAABd0AAAZdAAAG3QAAP////////////////////8ddAAAH3QAACF0AAAjdAAAJXQAACd0AAApdAAAK3QAAC10AAD/////L3QAADF0AAAzdAAANXQAADd0AAA5dAAAO3QAAD10AAA/dAAAQXQAAEN0AABFdAAA/////0d0AABJdAAAS3QAAP////9NdAAAT3QAAFF0AAD/////U3QAAFV0AAD/////V3QAAFl0AABbdAAA/////110AABfdAAAYXQAAGN0AABldAAAZ3QAAGl0AABrdAAA/////210AABvdAAA/////3F0AABzdAAAdXQAAHd0AAB5dAAAe3QAAH10AAB/dAAAgXQAAIN0AACFdAAAh3QAAIl0AAD/////i3QAAI10AACPdAAAkXQAAJN0AAD/////lXQAAJd0AACZdAAAm3QAAJ10AACfdAAAoXQAAKN0AACldAAAp3QAAKl0AAD/////q3QAAK10AACvdAAAsXQAAP//////////s3QAALV0AAC3dAAA//////////+5dAAAu3QAAP////+9dAAA/////790AADBdAAAw3QAAP//////////xXQAAMd0AAD////////////////JdAAA////////////////y3QAAM10AADPdAAA0XQAAP/////TdAAA///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////WdAAA2HQAANp0AADcdAAA3nQAAOB0AADidAAA5HQAAOZ0AADodAAA6nQAAP/////sdAAA/////+50AADwdAAA8nQAAPR0AAD2dAAA//////h0AAD6dAAA/HQAAP///////////nQAAP////8AdQAAAnUAAAR1AAAGdQAACHUAAAp1AAAMdQAADnUAABB1AAASdQAAFHUAABZ1AAD/////GHUAAP//////////GnUAABx1AAAedQAAIHUAACJ1AAAkdQAAJnUAACh1AAAqdQAALHUAAP////8udQAAMHUAADJ1AAA0dQAANnUAAP////84dQAA//////////86dQAAPHUAAD51AABAdQAA//////////9CdQAARHUAAEZ1AABIdQAASnUAAEx1AABOdQAAUHUAAFJ1AABUdQAAVnUAAFh1AABadQAAXHUAAF51AAD/////YHUAAGJ1AABkdQAAZnUAAGh1AABqdQAAbHUAAG51AABwdQAAcnUAAHR1AAB2dQAAeHUAAHp1AAB8dQAAfnUAAIB1AAD/////gnUAAIR1AAD//////////4Z1AACIdQAAinUAAIx1AACOdQAA/////5B1AACSdQAAlHUAAP////+WdQAAmHUAAJp1AACcdQAAnnUAAP////+gdQAAonUAAKR1AACmdQAAqHUAAKp1AACsdQAArnUAALB1AACydQAAtHUAAP////+2dQAAuHUAALp1AAC8dQAAvnUAAMB1AADCdQAA/////8R1AADGdQAAyHUAAMp1AAD//////////8x1AADOdQAA0HUAAP///////////////9J1AADUdQAA1nUAANh1AAD/////////////////////2nUAANx1AADedQAA4HUAAP/////////////////////idQAA/////+R1AADmdQAA///////////odQAA6nUAAP/////sdQAA7nUAAP/////wdQAA8nUAAPR1AAD2dQAA+HUAAPp1AAD8dQAA/nUAAAB2AAD/////AnYAAAR2AAD/////BnYAAAh2AAAKdgAADHYAAP////8OdgAA/////xB2AAASdgAAFHYAABZ2AAD//////////xh2AAD///////////////8adgAAHHYAAB52AAAgdgAAInYAACR2AAD/////JnYAACh2AAAqdgAALHYAAC52AAD/////MHYAADJ2AAA0dgAANnYAADh2AAA6dgAAPHYAAP////8+dgAAQHYAAEJ2AABEdgAA/////0Z2AAD//////////0h2AABKdgAA/////0x2AABOdgAAUHYAAP////9SdgAAVHYAAFZ2AABYdgAAWnYAAFx2AABedgAAYHYAAGJ2AAD//////////2R2AABmdgAAaHYAAGp2AABsdgAAbnYAAHB2AABydgAAdHYAAHZ2AAB4dgAAenYAAHx2AAB+dgAAgHYAAIJ2AACEdgAAhnYAAIh2AACKdgAAjHYAAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////+PdgAAkXYAAJN2AACVdgAAl3YAAJl2AAD/////m3YAAJ12AACfdgAAoXYAAKN2AAD/////pXYAAKd2AACpdgAAq3YAAK12AACvdgAAsXYAALN2AAC1dgAA/////7d2AAC5dgAAu3YAAL12AAC/dgAAwXYAAMN2AADFdgAAx3YAAMl2AAD//////////8t2AAD//////////812AADPdgAA/////9F2AADTdgAA1XYAAP/////XdgAA2XYAANt2AADddgAA33YAAOF2AADjdgAA5XYAAP/////ndgAA6XYAAOt2AADtdgAA73YAAPF2AADzdgAA//////V2AAD////////////////3dgAA+XYAAPt2AAD9dgAA/3YAAP//////////AXcAAAN3AAAFdwAAB3cAAAl3AAALdwAADXcAAA93AAARdwAAE3cAABV3AAD///////////////////////////////8XdwAAGXcAABt3AAD//////////x13AAAfdwAAIXcAAP////8jdwAAJXcAACd3AAApdwAA/////yt3AAD//////////y13AAAvdwAAMXcAADN3AAA1dwAAN3cAADl3AAA7dwAAPXcAAD93AABBdwAA/////0N3AABFdwAAR3cAAP////9JdwAAS3cAAE13AAD/////T3cAAFF3AABTdwAAVXcAAFd3AAD//////////1l3AABbdwAA/////113AAD//////////193AAD//////////2F3AABjdwAAZXcAAP//////////Z3cAAGl3AABrdwAAbXcAAG93AAD/////cXcAAHN3AAD///////////////91dwAAd3cAAHl3AAB7dwAAfXcAAH93AACBdwAAg3cAAIV3AACHdwAAiXcAAIt3AACNdwAAj3cAAJF3AACTdwAAlXcAAJd3AACZdwAAm3cAAP///////////////////////////////513AAD/////n3cAAKF3AACjdwAApXcAAP//////////p3cAAKl3AAD/////q3cAAK13AACvdwAAsXcAALN3AAC1dwAAt3cAAP///////////////7l3AAC7dwAAvXcAAP///////////////793AADBdwAA/////8N3AADFdwAA///////////HdwAAyXcAAMt3AADNdwAAz3cAANF3AADTdwAA1XcAAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////9h3AADadwAA3HcAAN53AADgdwAA4ncAAP/////kdwAA5ncAAOh3AAD/////6ncAAP/////sdwAA7ncAAPB3AADydwAA9HcAAPZ3AAD4dwAA//////p3AAD8dwAA/ncAAAB4AAD/////AngAAAR4AAAGeAAACHgAAAp4AAAMeAAADngAABB4AAD/////EngAABR4AAAWeAAAGHgAABp4AAAceAAAHngAACB4AAAieAAA/////yR4AAAmeAAAKHgAACp4AAAseAAALngAADB4AAAyeAAANHgAADZ4AAA4eAAAOngAADx4AAA+eAAAQHgAAEJ4AABEeAAARngAAEh4AABKeAAATHgAAE54AABQeAAAUngAAFR4AABWeAAAWHgAAFp4AABceAAAXngAAGB4AABieAAAZHgAAGZ4AABoeAAAangAAGx4AAD/////bngAAP////9weAAAcngAAHR4AAB2eAAAeHgAAHp4AAB8eAAAfngAAIB4AACCeAAAhHgAAIZ4AACIeAAAingAAIx4AACOeAAA////////////////kHgAAJJ4AACUeAAAlngAAJh4AACaeAAAnHgAAJ54AACgeAAA////////////////ongAAP////+keAAApngAAP////+oeAAAqngAAKx4AACueAAAsHgAALJ4AAC0eAAAtngAALh4AAC6eAAAvHgAAL54AADAeAAAwngAAMR4AADGeAAA///////////IeAAA///////////KeAAAzHgAAM54AADQeAAA0ngAANR4AAD/////1ngAANh4AADaeAAA/////9x4AAD/////3ngAAOB4AADieAAA5HgAAP//////////5ngAAP/////oeAAA6ngAAOx4AADueAAA8HgAAPJ4AAD0eAAA9ngAAPh4AAD6eAAA/HgAAP/////+eAAAAHkAAAJ5AAAEeQAABnkAAAh5AAAKeQAADHkAAA55AAAQeQAAEnkAABR5AAAWeQAAGHkAABp5AAAceQAAHnkAAP////8geQAAInkAAP////8keQAAJnkAACh5AAAqeQAA/////yx5AAAueQAA/////////////////////zB5AAD/////MnkAADR5AAA2eQAA/////zh5AAA6eQAAPHkAAP////8+eQAA/////0B5AABCeQAARHkAAEZ5AABIeQAASnkAAEx5AABOeQAAUHkAAFJ5AABUeQAAVnkAAFh5AABaeQAAXHkAAF55AAD/////YHkAAGJ5AAD/////ZHkAAGZ5AAD//////////2h5AAD///////////////9qeQAAbHkAAP//////////////////////////////////////////bnkAAHB5AAByeQAAdHkAAHZ5AAD/////eHkAAHp5AAB8eQAAfnkAAP////////////////////+AeQAA//////////+CeQAA/////4R5AAD/////hnkAAP////+IeQAA//////////+KeQAAjHkAAI55AAD//////////5B5AACSeQAAlHkAAJZ5AACYeQAAmnkAAJx5AACeeQAA/////6B5AACieQAApHkAAKZ5AACoeQAAqnkAAKx5AACueQAAsHkAAP////+yeQAAtHkAAP//////////tnkAALh5AAC6eQAAvHkAAL55AADAeQAA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////w3kAAMV5AADHeQAAyXkAAP/////LeQAAzXkAAM95AADReQAA03kAANV5AADXeQAA2XkAANt5AADdeQAA33kAAOF5AADjeQAA5XkAAOd5AADpeQAA63kAAO15AADveQAA8XkAAPN5AAD1eQAA93kAAPl5AAD7eQAA/XkAAP95AAABegAAA3oAAAV6AAAHegAACXoAAP////8LegAADXoAAA96AAARegAAE3oAABV6AAAXegAAGXoAABt6AAAdegAAH3oAACF6AAAjegAAJXoAACd6AAApegAAK3oAAC16AAAvegAAMXoAADN6AAD/////NXoAADd6AAA5egAAO3oAAD16AAA/egAA/////0F6AAD/////Q3oAAEV6AAD/////R3oAAP//////////SXoAAP//////////S3oAAE16AABPegAAUXoAAFN6AABVegAAV3oAAFl6AABbegAAXXoAAF96AABhegAAY3oAAGV6AAD/////Z3oAAGl6AABregAAbXoAAG96AABxegAAc3oAAHV6AAD/////d3oAAHl6AAB7egAA/////316AAB/egAAgXoAAIN6AACFegAAh3oAAP//////////iXoAAP//////////i3oAAI16AACPegAAkXoAAJN6AACVegAAl3oAAJl6AAD///////////////////////////////+begAAnXoAAJ96AAChegAA/////////////////////6N6AAClegAA/////6d6AACpegAAq3oAAK16AACvegAAsXoAALN6AAC1egAAt3oAALl6AAC7egAAvXoAAL96AADBegAAw3oAAP//////////xXoAAP/////HegAA////////////////yXoAAMt6AADNegAAz3oAANF6AADTegAA1XoAANd6AADZegAA23oAAN16AADfegAA4XoAAON6AADlegAA53oAAOl6AADregAA7XoAAO96AADxegAA83oAAP/////1egAA93oAAPl6AAD7egAA/XoAAP96AAABewAAA3sAAAV7AAAHewAA//////////8JewAAC3sAAA17AAD/////D3sAAP////8RewAAE3sAABV7AAAXewAAGXsAABt7AAAdewAAH3sAACF7AAAjewAA/////yV7AAD///////////////8newAAKXsAACt7AAAtewAAL3sAADF7AAAzewAANXsAAP////83ewAAOXsAADt7AAA9ewAAP3sAAEF7AABDewAARXsAAEd7AAD/////SXsAAEt7AABNewAAT3sAAFF7AABTewAAVXsAAFd7AAD/////WXsAAFt7AABdewAAX3sAAGF7AABjewAA//////////9lewAA/////////////////////////////////////2d7AABpewAAa3sAAG17AAD//////////297AABxewAAc3sAAHV7AAB3ewAAeXsAAHt7AAB9ewAAf3sAAIF7AACDewAAhXsAAId7AACJewAAi3sAAI17AACPewAAkXsAAJN7AACVewAAl3sAAJl7AACbewAAnXsAAJ97AAChewAA//////////+jewAApXsAAP////+newAA/////6l7AAD///////////////+rewAArXsAAK97AACxewAAs3sAALV7AAC3ewAA//////////+5ewAAu3sAAL17AAC/ewAAwXsAAMN7AADFewAAx3sAAP//////////yXsAAMt7AADNewAA/////897AADRewAA03sAANV7AAD/////13sAAP/////ZewAA23sAAP/////dewAA/////997AADhewAA/////////////////////+N7AAD/////5XsAAOd7AAD/////////////////////6XsAAOt7AAD//////////+17AADvewAA8XsAAPN7AAD1ewAA//////d7AAD5ewAA+3sAAP17AAD/ewAA/////wF8AAADfAAABXwAAAd8AAAJfAAAC3wAAP//////////DXwAAA98AAARfAAAE3wAABV8AAAXfAAAGXwAABt8AAAdfAAAH3wAAP//////////IXwAACN8AAAlfAAAJ3wAACl8AAArfAAALXwAAC98AAAxfAAAM3wAADV8AAA3fAAA//////////85fAAAO3wAAD18AAA/fAAAQXwAAP////9DfAAARXwAAEd8AABJfAAA////////////////S3wAAE18AABPfAAA/////1F8AAD/////U3wAAFV8AABXfAAA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////WnwAAFx8AABefAAAYHwAAGJ8AABkfAAAZnwAAGh8AABqfAAAbHwAAG58AABwfAAAcnwAAHR8AAD/////dnwAAHh8AAB6fAAAfHwAAH58AACAfAAAgnwAAIR8AAD///////////////+GfAAAiHwAAP////+KfAAAjHwAAI58AACQfAAAknwAAJR8AACWfAAAmHwAAJp8AACcfAAAnnwAAKB8AACifAAApHwAAKZ8AACofAAA/////////////////////6p8AACsfAAA/////658AACwfAAAsnwAALR8AAC2fAAA/////7h8AAC6fAAAvHwAAL58AADAfAAAwnwAAMR8AADGfAAAyHwAAMp8AADMfAAA////////////////znwAANB8AADSfAAA1HwAANZ8AADYfAAA2nwAANx8AADefAAA4HwAAOJ8AAD/////5HwAAOZ8AAD////////////////ofAAA6nwAAOx8AADufAAA8HwAAPJ8AAD0fAAA9nwAAPh8AAD6fAAA/HwAAP58AAAAfQAAAn0AAAR9AAAGfQAACH0AAAp9AAAMfQAADn0AABB9AAASfQAAFH0AABZ9AAAYfQAAGn0AABx9AAAefQAA//////////8gfQAAIn0AAP//////////JH0AAP//////////Jn0AACh9AAAqfQAALH0AAC59AAAwfQAAMn0AADR9AAA2fQAAOH0AADp9AAA8fQAAPn0AAP//////////QH0AAP////9CfQAA//////////9EfQAA/////////////////////0Z9AAD/////SH0AAEp9AABMfQAATn0AAFB9AABSfQAAVH0AAFZ9AABYfQAAWn0AAFx9AAD/////Xn0AAGB9AABifQAAZH0AAGZ9AABofQAAan0AAGx9AABufQAAcH0AAHJ9AAB0fQAAdn0AAHh9AAB6fQAAfH0AAH59AACAfQAAgn0AAIR9AAD/////hn0AAIh9AACKfQAA//////////+MfQAAjn0AAJB9AAD/////kn0AAJR9AACWfQAA////////////////mH0AAJp9AACcfQAA/////559AACgfQAAon0AAP////+kfQAApn0AAP////+ofQAAqn0AAKx9AACufQAAsH0AAP////+yfQAAtH0AALZ9AAC4fQAAun0AALx9AAC+fQAAwH0AAMJ9AADEfQAAxn0AAMh9AADKfQAA////////////////////////////////zH0AAM59AADQfQAA0n0AANR9AADWfQAA///////////YfQAA2n0AANx9AADefQAA/////+B9AADifQAA/////+R9AADmfQAA6H0AAOp9AAD/////7H0AAO59AADwfQAA8n0AAPR9AAD2fQAA+H0AAP////////////////p9AAD8fQAA/n0AAAB+AAACfgAABH4AAAZ+AAD///////////////8IfgAACn4AAAx+AAAOfgAAEH4AABJ+AAAUfgAAFn4AABh+AAAafgAAHH4AAB5+AAAgfgAAIn4AAP////8kfgAAJn4AACh+AAAqfgAALH4AAP////8ufgAA//////////8wfgAAMn4AAP////80fgAANn4AAP////////////////////84fgAA//////////////////////////86fgAAPH4AAD5+AABAfgAA/////////////////////0J+AAD//////////0R+AABGfgAA/////0h+AAD///////////////////////////////9KfgAATH4AAP//////////Tn4AAFB+AABSfgAAVH4AAFZ+AABYfgAAWn4AAFx+AABefgAAYH4AAGJ+AABkfgAAZn4AAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////9pfgAAa34AAG1+AABvfgAAcX4AAHN+AAB1fgAAd34AAHl+AAB7fgAA/////31+AAB/fgAAgX4AAIN+AACFfgAAh34AAIl+AACLfgAAjX4AAP////+PfgAAkX4AAP//////////k34AAJV+AAD/////l34AAJl+AACbfgAA/////51+AACffgAAoX4AAKN+AAClfgAAp34AAP////+pfgAAq34AAP//////////rX4AAK9+AAD/////////////////////sX4AALN+AAC1fgAAt34AAP////////////////////+5fgAA////////////////u34AAL1+AAC/fgAA/////8F+AADDfgAA////////////////////////////////xX4AAMd+AADJfgAAy34AAP/////NfgAAz34AANF+AADTfgAA1X4AANd+AAD//////////9l+AADbfgAA////////////////3X4AAN9+AADhfgAA434AAOV+AADnfgAA6X4AAOt+AADtfgAA734AAP//////////8X4AAPN+AAD/////9X4AAPd+AAD5fgAA+34AAP////////////////1+AAD//////34AAAF/AAADfwAA////////////////BX8AAAd/AAD/////CX8AAAt/AAANfwAAD38AABF/AAATfwAAFX8AABd/AAAZfwAAG38AAB1/AAAffwAAIX8AACN/AAAlfwAAJ38AACl/AAArfwAA////////////////LX8AAP////8vfwAAMX8AAP//////////////////////////M38AADV/AAD///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////84fwAAOn8AADx/AAA+fwAAQH8AAEJ/AABEfwAARn8AAEh/AABKfwAATH8AAE5/AABQfwAAUn8AAFR/AABWfwAAWH8AAFp/AABcfwAAXn8AAGB/AABifwAAZH8AAGZ/AABofwAAan8AAGx/AABufwAAcH8AAHJ/AAB0fwAAdn8AAHh/AAB6fwAAfH8AAH5/AACAfwAAgn8AAIR/AACGfwAAiH8AAIp/AACMfwAAjn8AAJB/AACSfwAA/////5R/AACWfwAAmH8AAJp/AACcfwAAnn8AAKB/AAD/////on8AAKR/AACmfwAAqH8AAKp/AACsfwAArn8AALB/AACyfwAAtH8AALZ/AAC4fwAAun8AALx/AAC+fwAAwH8AAMJ/AADEfwAAxn8AAMh/AADKfwAA///////////MfwAAzn8AANB/AADSfwAA1H8AANZ/AAD//////////9h/AADafwAA////////////////3H8AAN5/AADgfwAA4n8AAOR/AADmfwAA6H8AAOp/AADsfwAA7n8AAP//////////8H8AAPJ/AAD0fwAA9n8AAPh/AAD6fwAA/H8AAP5/AAAAgAAAAoAAAASAAAAGgAAA/////wiAAAAKgAAADIAAAA6AAAAQgAAAEoAAABSAAAAWgAAAGIAAABqAAAAcgAAAHoAAACCAAAAigAAAJIAAACaAAAAogAAAKoAAACyAAAAugAAAMIAAADKAAAA0gAAANoAAADiAAAA6gAAAPIAAAD6AAABAgAAAQoAAAESAAAD//////////0aAAAD//////////0iAAABKgAAATIAAAE6AAAD/////UIAAAFKAAABUgAAA//////////////////////////9WgAAA//////////9YgAAAWoAAAFyAAABegAAAYIAAAGKAAABkgAAAZoAAAGiAAAD/////aoAAAGyAAAD/////boAAAHCAAABygAAAdIAAAHaAAAB4gAAAeoAAAHyAAAB+gAAAgIAAAP////+CgAAAhIAAAIaAAAD/////iIAAAP//////////ioAAAIyAAAD/////joAAAP////+QgAAAkoAAAJSAAACWgAAAmIAAAP////+agAAAnIAAAJ6AAACggAAAooAAAKSAAACmgAAAqIAAAKqAAACsgAAAroAAALCAAAD/////soAAALSAAAC2gAAAuIAAALqAAAC8gAAAvoAAAMCAAADCgAAA////////////////xIAAAMaAAADIgAAAyoAAAP/////MgAAAzoAAANCAAADSgAAA/////9SAAADWgAAA2IAAAP/////agAAA3IAAAN6AAADggAAA4oAAAOSAAADmgAAA6IAAAOqAAADsgAAA7oAAAPCAAAD////////////////ygAAA//////SAAAD2gAAA+IAAAPqAAAD8gAAA/oAAAACBAAACgQAA/////wSBAAAGgQAACIEAAP//////////CoEAAP////8MgQAA//////////8OgQAA//////////////////////////8QgQAAEoEAABSBAAAWgQAAGIEAABqBAAAcgQAAHoEAACCBAAAigQAAJIEAACaBAAAogQAAKoEAACyBAAAugQAA////////////////MIEAAP////8ygQAANIEAADaBAAA4gQAA/////zqBAAD/////PIEAAD6BAABAgQAAQoEAAESBAABGgQAA/////0iBAABKgQAATIEAAP///////////////06BAABQgQAA////////////////UoEAAFSBAAD//////////1aBAAD/////WIEAAP////9agQAAXIEAAF6BAAD/////YIEAAGKBAABkgQAAZoEAAP////9ogQAA//////////9qgQAAbIEAAG6BAABwgQAAcoEAAHSBAAB2gQAAeIEAAHqBAAB8gQAAfoEAAICBAAD//////////4KBAACEgQAAhoEAAIiBAACKgQAAjIEAAI6BAACQgQAAkoEAAJSBAACWgQAAmIEAAJqBAACcgQAAnoEAAKCBAACigQAApIEAAP////+mgQAAqIEAAKqBAACsgQAAroEAAP////+wgQAA/////////////////////7KBAAC0gQAAtoEAALiBAAD/////uoEAAP///////////////7yBAAD//////////76BAAD/////wIEAAMKBAAD/////////////////////xIEAAP/////GgQAAyIEAAMqBAADMgQAAzoEAANCBAADSgQAA1IEAAP/////WgQAA///////////YgQAA2oEAAP/////cgQAA////////////////3oEAAOCBAADigQAA5IEAAOaBAAD/////////////////////6IEAAOqBAADsgQAA/////////////////////////////////////+6BAAD/////8IEAAPKBAAD////////////////////////////////0gQAA9oEAAP/////4gQAA//////qBAAD8gQAA/oEAAP//////////AIIAAAKCAAAEggAABoIAAAiCAAAKggAADIIAAP////8OggAAEIIAABKCAAAUggAAFoIAABiCAAAaggAAHIIAAB6CAAAgggAAIoIAACSCAAAmggAAKIIAACqCAAAsggAA//////////8uggAAMIIAAP///////////////zKCAAA0ggAANoIAAP////84ggAA////////////////OoIAADyCAAA+ggAA////////////////QIIAAP//////////QoIAAESCAAD/////RoIAAEiCAABKggAATIIAAP////9OggAAUIIAAFKCAAD/////VIIAAFaCAAD//////////1iCAAD//////////1qCAAD/////XIIAAP////9eggAAYIIAAGKCAABkggAAZoIAAP////9oggAAaoIAAGyCAAD//////////26CAAD/////cIIAAHKCAAB0ggAAdoIAAHiCAAD/////eoIAAHyCAAB+ggAAgIIAAIKCAACEggAAhoIAAIiCAACKggAAjIIAAI6CAACQggAAkoIAAJSCAAD/////loIAAP//////////mIIAAP////+aggAAnIIAAJ6CAACgggAA//////////+iggAApIIAAKaCAACoggAA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////q4IAAK2CAACvggAAsYIAALOCAAC1ggAAt4IAALmCAAC7ggAAvYIAAL+CAADBggAAw4IAAMWCAADHggAAyYIAAMuCAADNggAA/////8+CAADRggAA///////////TggAA1YIAAP///////////////9eCAAD//////////9mCAADbggAA3YIAAN+CAADhggAA/////+OCAADlggAA54IAAOmCAADrggAA/////+2CAAD/////74IAAPGCAADzggAA9YIAAPeCAAD5ggAA+4IAAP2CAAD/ggAAAYMAAAODAAD///////////////8FgwAAB4MAAAmDAAD/////C4MAAA2DAAAPgwAAEYMAABODAAAVgwAAF4MAAP///////////////xmDAAAbgwAAHYMAAB+DAAAhgwAAI4MAACWDAAAngwAAKYMAACuDAAAtgwAA/////y+DAAAxgwAAM4MAADWDAAA3gwAA/////zmDAAA7gwAAPYMAAP////8/gwAAQYMAAEODAAD/////RYMAAEeDAABJgwAA////////////////S4MAAP//////////////////////////TYMAAE+DAAD//////////1GDAAD/////U4MAAFWDAAD//////////1eDAAD//////////1mDAABbgwAAXYMAAP////9fgwAAYYMAAP////9jgwAA/////2WDAABngwAAaYMAAGuDAABtgwAAb4MAAHGDAABzgwAAdYMAAHeDAAD//////////////////////////3mDAAD//////////3uDAAD//////////////////////////32DAAB/gwAA//////////+BgwAA/////4ODAACFgwAAh4MAAImDAAD//////////4uDAACNgwAA/////4+DAACRgwAA////////////////k4MAAJWDAACXgwAAmYMAAJuDAACdgwAA/////5+DAAD/////oYMAAKODAAClgwAAp4MAAKmDAACrgwAArYMAAK+DAACxgwAAs4MAALWDAAC3gwAAuYMAALuDAAC9gwAAv4MAAMGDAADDgwAA/////8WDAAD/////x4MAAP///////////////8mDAAD//////////8uDAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////zoMAANCDAADSgwAA1IMAANaDAADYgwAA/////9qDAADcgwAA3oMAAOCDAADigwAA/////+SDAADmgwAA6IMAAOqDAADsgwAA/////+6DAADwgwAA8oMAAPSDAAD2gwAA+IMAAPqDAAD8gwAA/////////////////oMAAACEAAAChAAABIQAAAaEAAD///////////////8IhAAACoQAAAyEAAAOhAAAEIQAABKEAAAUhAAAFoQAABiEAAD/////GoQAAP////8chAAAHoQAAP//////////IIQAACKEAAAkhAAAJoQAACiEAAAqhAAA//////////////////////////8shAAALoQAADCEAAAyhAAANIQAADaEAAA4hAAAOoQAADyEAAA+hAAAQIQAAEKEAABEhAAA/////0aEAAD/////////////////////////////////////SIQAAEqEAABMhAAA/////06EAAD/////UIQAAFKEAABUhAAAVoQAAFiEAABahAAAXIQAAF6EAABghAAAYoQAAGSEAABmhAAAaIQAAP////9qhAAAbIQAAG6EAABwhAAAcoQAAHSEAAB2hAAAeIQAAHqEAAB8hAAAfoQAAICEAAD/////goQAAISEAACGhAAAiIQAAP////+KhAAA//////////+MhAAA/////////////////////46EAAD//////////5CEAACShAAAlIQAAJaEAACYhAAA/////5qEAACchAAAnoQAAKCEAACihAAApIQAAKaEAACohAAAqoQAAKyEAACuhAAAsIQAAP////+yhAAAtIQAALaEAAC4hAAAuoQAALyEAAC+hAAAwIQAAP/////ChAAAxIQAAMaEAADIhAAAyoQAAMyEAADOhAAA0IQAAP/////ShAAA1IQAANaEAADYhAAA2oQAANyEAADehAAA4IQAAOKEAADkhAAA///////////////////////////mhAAA6IQAAOqEAAD////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////thAAA74QAAPGEAADzhAAA9YQAAPeEAAD5hAAA+4QAAP2EAAD/hAAAAYUAAAOFAAAFhQAAB4UAAAmFAAALhQAADYUAAA+FAAARhQAA////////////////E4UAABWFAAAXhQAAGYUAABuFAAAdhQAAH4UAACGFAAAjhQAAJYUAACeFAAAphQAAK4UAAC2FAAAvhQAAMYUAADOFAAD//////////zWFAAA3hQAAOYUAADuFAAA9hQAAP4UAAEGFAABDhQAARYUAAEeFAABJhQAAS4UAAE2FAABPhQAAUYUAAFOFAABVhQAAV4UAAFmFAABbhQAAXYUAAF+FAABhhQAAY4UAAGWFAABnhQAAaYUAAGuFAABthQAAb4UAAHGFAABzhQAAdYUAAHeFAAB5hQAAe4UAAH2FAAB/hQAAgYUAAIOFAACFhQAAh4UAAImFAACLhQAA/////42FAACPhQAAkYUAAJOFAACVhQAAl4UAAJmFAACbhQAA////////////////nYUAAJ+FAAChhQAAo4UAAKWFAACnhQAAqYUAAKuFAACthQAAr4UAALGFAACzhQAAtYUAALeFAAC5hQAAu4UAAP////+9hQAAv4UAAP/////BhQAA/////8OFAADFhQAAx4UAAP/////JhQAAy4UAAM2FAADPhQAA0YUAAP/////ThQAA1YUAAP/////XhQAA2YUAANuFAADdhQAA34UAAOGFAADjhQAA5YUAAOeFAAD/////6YUAAOuFAAD/////7YUAAO+FAADxhQAA84UAAPWFAAD3hQAA+YUAAPuFAAD9hQAA/4UAAAGGAAD/////A4YAAP////////////////////8FhgAAB4YAAAmGAAD//////////wuGAAANhgAAD4YAABGGAAD/////E4YAABWGAAAXhgAA/////xmGAAD/////G4YAAB2GAAAfhgAAIYYAACOGAAAlhgAAJ4YAACmGAAD///////////////8rhgAA/////y2GAAAvhgAAMYYAADOGAAA1hgAAN4YAADmGAAA7hgAAPYYAAD+GAABBhgAAQ4YAAEWGAABHhgAASYYAAEuGAABNhgAAT4YAAP////9RhgAAU4YAAFWGAAD/////V4YAAFmGAAD/////W4YAAF2GAABfhgAAYYYAAGOGAABlhgAAZ4YAAP///////////////2mGAABrhgAAbYYAAG+GAABxhgAAc4YAAHWGAAB3hgAAeYYAAHuGAAB9hgAAf4YAAIGGAACDhgAAhYYAAIeGAAD/////iYYAAIuGAACNhgAAj4YAAJGGAACThgAAlYYAAJeGAACZhgAAm4YAAJ2GAACfhgAAoYYAAKOGAAClhgAA//////////+nhgAAqYYAAKuGAACthgAAr4YAALGGAAD/////s4YAAP////+1hgAAt4YAALmGAAC7hgAAvYYAAP////+/hgAA///////////BhgAAw4YAAMWGAADHhgAAyYYAAMuGAAD//////////82GAADPhgAA/////9GGAADThgAA1YYAANeGAADZhgAA24YAAP/////dhgAA////////////////34YAAOGGAAD//////////+OGAADlhgAA54YAAOmGAADrhgAA/////+2GAAD/////74YAAPGGAADzhgAA9YYAAP//////////94YAAP/////5hgAA+4YAAP2GAAD/hgAAAYcAAAOHAAAFhwAAB4cAAP////8JhwAAC4cAAP////8NhwAAD4cAABGHAAAThwAAFYcAABeHAAAZhwAA/////xuHAAAdhwAAH4cAACGHAAAjhwAAJYcAACeHAAAphwAAK4cAAC2HAAAvhwAAMYcAADOHAAA1hwAAN4cAADmHAAD//////////zuHAAA9hwAA//////////8/hwAA/////0GHAAD/////Q4cAAEWHAABHhwAASYcAAEuHAABNhwAA//////////9PhwAAUYcAAFOHAABVhwAA//////////9XhwAAWYcAAP////9bhwAA//////////9dhwAAX4cAAGGHAABjhwAAZYcAAGeHAABphwAAa4cAAG2HAABvhwAAcYcAAHOHAAB1hwAAd4cAAHmHAAB7hwAAfYcAAH+HAACBhwAAg4cAAIWHAAD/////h4cAAImHAAD/////////////////////i4cAAI2HAACPhwAAkYcAAJOHAACVhwAAl4cAAJmHAACbhwAAnYcAAJ+HAAChhwAA/////6OHAAD/////////////////////pYcAAP////+nhwAA/////6mHAAD//////////6uHAAD/////rYcAAK+HAAD/////sYcAALOHAAC1hwAAt4cAALmHAAD/////u4cAAL2HAAC/hwAAwYcAAP/////DhwAA////////////////xYcAAP///////////////8eHAAD//////////8mHAADLhwAAzYcAAP/////PhwAA/////////////////////////////////////9GHAAD/////04cAAP//////////////////////////1YcAANeHAAD////////////////////////////////ZhwAA24cAAP/////dhwAA/////9+HAAD//////////+GHAADjhwAA5YcAAOeHAADphwAA64cAAP/////thwAA///////////vhwAA///////////xhwAA84cAAPWHAAD/////94cAAPmHAAD7hwAA///////////9hwAA//////+HAAD//////////wGIAAADiAAA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////BogAAAiIAAAKiAAADIgAAA6IAAAQiAAAEogAABSIAAAWiAAAGIgAABqIAAAciAAAHogAACCIAAAiiAAAJIgAAP////8miAAAKIgAACqIAAD//////////yyIAAAuiAAAMIgAADKIAAA0iAAANogAADiIAAA6iAAAPIgAAD6IAABAiAAA/////0KIAAD//////////0SIAABGiAAA//////////9IiAAASogAAEyIAABOiAAAUIgAAFKIAABUiAAAVogAAFiIAABaiAAAXIgAAF6IAABgiAAAYogAAGSIAAD/////ZogAAGiIAAD///////////////9qiAAAbIgAAG6IAABwiAAAcogAAHSIAAB2iAAA//////////94iAAA////////////////eogAAHyIAAB+iAAAgIgAAIKIAACEiAAA//////////+GiAAAiIgAAIqIAACMiAAAjogAAJCIAACSiAAAlIgAAJaIAAD/////mIgAAP////+aiAAAnIgAAJ6IAAD/////oIgAAKKIAAD//////////6SIAACmiAAAqIgAAP////+qiAAArIgAAK6IAACwiAAAsogAALSIAAC2iAAAuIgAAP//////////uogAALyIAAC+iAAAwIgAAMKIAADEiAAAxogAAP///////////////8iIAADKiAAAzIgAAP//////////zogAAP/////QiAAA0ogAANSIAADWiAAA2IgAANqIAADciAAA3ogAAOCIAADiiAAA5IgAAP/////////////////////miAAA6IgAAOqIAADsiAAA///////////uiAAA8IgAAPKIAAD/////9IgAAPaIAAD4iAAA+ogAAP///////////////////////////////////////////IgAAP/////+iAAA/////wCJAAACiQAA/////wSJAAD//////////waJAAAIiQAACokAAP////8MiQAADokAABCJAAD//////////xKJAAD/////////////////////FIkAAP//////////FokAABiJAAAaiQAA/////////////////////xyJAAD/////HokAACCJAAAiiQAAJIkAACaJAAAoiQAAKokAACyJAAAuiQAAMIkAADKJAAA0iQAANokAAP////84iQAAOokAADyJAAA+iQAA/////0CJAAD//////////0KJAABEiQAA/////0aJAABIiQAASokAAP///////////////0yJAABOiQAAUIkAAFKJAABUiQAAVokAAFiJAAD/////WokAAFyJAABeiQAAYIkAAGKJAABkiQAA/////2aJAABoiQAA//////////9qiQAA/////2yJAABuiQAA//////////9wiQAAcokAAP//////////dIkAAHaJAAD///////////////////////////////94iQAAeokAAHyJAAB+iQAAgIkAAIKJAAD/////hIkAAIaJAAD/////iIkAAIqJAACMiQAAjokAAJCJAACSiQAAlIkAAJaJAAD/////////////////////mIkAAJqJAACciQAAnokAAKCJAACiiQAApIkAAKaJAACoiQAAqokAAKyJAACuiQAAsIkAALKJAAC0iQAAtokAALiJAAC6iQAAvIkAAP////++iQAAwIkAAMKJAADEiQAAxokAAMiJAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////y4kAAM2JAADPiQAA0YkAANOJAADViQAA/////9eJAADZiQAA24kAAN2JAADfiQAA4YkAAOOJAADliQAA54kAAOmJAADriQAA7YkAAO+JAADxiQAA//////////////////////OJAAD1iQAA94kAAPmJAAD7iQAA//////2JAAD/iQAAAYoAAAOKAAAFigAA/////weKAAAJigAAC4oAAA2KAAAPigAAEYoAABOKAAAVigAAF4oAABmKAAAbigAAHYoAAP//////////H4oAACGKAAAjigAAJYoAACeKAAApigAAK4oAAC2KAAAvigAA/////zGKAAAzigAANYoAADeKAAA5igAAO4oAAD2KAAA/igAAQYoAAEOKAABFigAAR4oAAP////9JigAAS4oAAE2KAABPigAAUYoAAP////9TigAAVYoAAP////9XigAAWYoAAFuKAABdigAAX4oAAGGKAABjigAA/////2WKAABnigAAaYoAAGuKAABtigAAb4oAAHGKAABzigAAdYoAAHeKAAB5igAA/////3uKAAB9igAAf4oAAIGKAACDigAAhYoAAIeKAACJigAAi4oAAI2KAACPigAAkYoAAJOKAACVigAAl4oAAJmKAACbigAAnYoAAJ+KAAChigAAo4oAAKWKAACnigAAqYoAAKuKAACtigAA/////6+KAACxigAAs4oAALWKAAC3igAA/////7mKAAD//////////7uKAAD/////vYoAAL+KAADBigAAw4oAAMWKAADHigAA/////////////////////8mKAADLigAA////////////////zYoAAM+KAAD/////0YoAANOKAADVigAA14oAANmKAADbigAA3YoAAN+KAADhigAA44oAAP/////////////////////ligAA54oAAOmKAADrigAA7YoAAO+KAADxigAA84oAAPWKAAD3igAA+YoAAPuKAAD9igAA/4oAAAGLAAADiwAABYsAAAeLAAAJiwAAC4sAAA2LAAAPiwAAEYsAABOLAAAViwAAF4sAABmLAAAbiwAAHYsAAB+LAAAhiwAAI4sAACWLAAAniwAA/////ymLAAAriwAALYsAAC+LAAAxiwAAM4sAADWLAAA3iwAAOYsAADuLAAA9iwAAP4sAAEGLAABDiwAA/////0WLAABHiwAASYsAAEuLAABNiwAA////////////////T4sAAP////9RiwAA/////1OLAABViwAAV4sAAFmLAAD///////////////9biwAAXYsAAF+LAAD/////////////////////YYsAAP////9jiwAA//////////9liwAAZ4sAAGmLAAD/////a4sAAG2LAAD//////////2+LAAD//////////3GLAABziwAAdYsAAP////93iwAAeYsAAHuLAAB9iwAA/////3+LAACBiwAA/////4OLAAD/////hYsAAIeLAACJiwAAi4sAAP//////////jYsAAI+LAACRiwAAk4sAAJWLAACXiwAAmYsAAJuLAAD/////nYsAAJ+LAAChiwAAo4sAAKWLAACniwAAqYsAAKuLAACtiwAAr4sAALGLAACziwAAtYsAALeLAAC5iwAAu4sAAL2LAAC/iwAAwYsAAMOLAAD/////xYsAAMeLAADJiwAAy4sAAM2LAADPiwAA0YsAANOLAADViwAA////////////////14sAANmLAADbiwAA3YsAAN+LAADhiwAA44sAAOWLAAD////////////////niwAA6YsAAOuLAADtiwAA74sAAPGLAADziwAA9YsAAPeLAAD/////+YsAAPuLAAD9iwAA//////+LAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////AowAAASMAAAGjAAACIwAAAqMAAAMjAAADowAABCMAAASjAAAFIwAABaMAAAYjAAA////////////////GowAAByMAAAejAAAIIwAACKMAAAkjAAAJowAACiMAAAqjAAALIwAAC6MAAAwjAAAMowAADSMAAA2jAAAOIwAADqMAAA8jAAAPowAAP////9AjAAAQowAAESMAABGjAAASIwAAEqMAABMjAAA/////06MAABQjAAAUowAAFSMAABWjAAAWIwAAFqMAABcjAAAXowAAGCMAABijAAAZIwAAGaMAABojAAAaowAAGyMAABujAAAcIwAAHKMAAD//////////3SMAAD//////////3aMAAD/////////////////////////////////////eIwAAHqMAAD/////////////////////fIwAAH6MAACAjAAA/////4KMAAD///////////////+EjAAAhowAAIiMAACKjAAAjIwAAI6MAACQjAAAkowAAJSMAACWjAAAmIwAAJqMAACcjAAAnowAAKCMAACijAAApIwAAKaMAACojAAA/////6qMAACsjAAArowAALCMAACyjAAAtIwAALaMAAC4jAAAuowAAP////+8jAAA////////////////vowAAMCMAADCjAAAxIwAAP//////////xowAAP/////IjAAAyowAAP//////////////////////////zIwAAM6MAADQjAAA0owAANSMAADWjAAA2IwAANqMAADcjAAA3owAAOCMAAD//////////+KMAADkjAAA5owAAOiMAADqjAAA/////+yMAADujAAA8IwAAPKMAAD0jAAA9owAAP////////////////////////////////iMAAD6jAAA/IwAAP6MAAAAjQAAAo0AAASNAAAGjQAACI0AAAqNAAD/////DI0AAP///////////////w6NAAD//////////xCNAAASjQAAFI0AABaNAAAYjQAAGo0AAByNAAAejQAA/////yCNAAD//////////yKNAAD/////JI0AACaNAAD//////////yiNAAAqjQAALI0AAC6NAAAwjQAAMo0AADSNAAA2jQAAOI0AADqNAAA8jQAAPo0AAECNAABCjQAARI0AAEaNAABIjQAASo0AAEyNAABOjQAAUI0AAFKNAABUjQAAVo0AAFiNAABajQAAXI0AAP////9ejQAAYI0AAGKNAABkjQAA/////2aNAABojQAAao0AAP////9sjQAAbo0AAHCNAAByjQAAdI0AAP//////////do0AAHiNAAD/////eo0AAHyNAAB+jQAAgI0AAIKNAACEjQAAho0AAIiNAACKjQAAjI0AAI6NAACQjQAA//////////+SjQAAlI0AAP////////////////////+WjQAA/////5iNAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////5uNAACdjQAAn40AAKGNAACjjQAApY0AAP////+njQAAqY0AAKuNAACtjQAAr40AALGNAACzjQAAtY0AALeNAAC5jQAAu40AAL2NAAC/jQAAwY0AAMONAADFjQAA///////////HjQAAyY0AAMuNAADNjQAA///////////PjQAA0Y0AANONAADVjQAA140AANmNAADbjQAA3Y0AAN+NAADhjQAA/////////////////////+ONAADljQAA540AAP/////pjQAA/////+uNAADtjQAA740AAPGNAADzjQAA//////WNAAD3jQAA+Y0AAPuNAAD9jQAA/40AAAGOAAADjgAA/////wWOAAAHjgAACY4AAAuOAAANjgAAD44AABGOAAATjgAAFY4AABeOAAAZjgAA/////xuOAAAdjgAA//////////8fjgAAIY4AACOOAAAljgAA//////////8njgAAKY4AACuOAAAtjgAAL44AADGOAAAzjgAANY4AADeOAAA5jgAAO44AAD2OAAA/jgAAQY4AAEOOAABFjgAAR44AAEmOAABLjgAA/////02OAAD//////////0+OAAD/////UY4AAFOOAABVjgAAV44AAFmOAABbjgAAXY4AAF+OAABhjgAAY44AAGWOAABnjgAA/////////////////////2mOAABrjgAA//////////////////////////9tjgAAb44AAHGOAABzjgAA////////////////dY4AAHeOAAD//////////3mOAAB7jgAAfY4AAP//////////f44AAIGOAACDjgAAhY4AAIeOAACJjgAAi44AAI2OAACPjgAA/////5GOAAD/////k44AAP////+VjgAAl44AAP////+ZjgAAm44AAJ2OAACfjgAAoY4AAKOOAACljgAAp44AAKmOAAD///////////////+rjgAArY4AAK+OAACxjgAAs44AALWOAAC3jgAAuY4AALuOAAC9jgAAv44AAMGOAADDjgAAxY4AAMeOAADJjgAAy44AAM2OAADPjgAA/////9GOAADTjgAA1Y4AANeOAADZjgAA244AAP/////djgAA/////9+OAAD/////4Y4AAP///////////////+OOAAD//////////+WOAAD////////////////njgAA6Y4AAOuOAADtjgAA/////++OAAD///////////GOAADzjgAA9Y4AAPeOAAD/////////////////////+Y4AAP/////7jgAA/Y4AAP+OAAABjwAA/////wOPAAD//////////wWPAAAHjwAACY8AAP////8LjwAA/////w2PAAAPjwAA/////xGPAAATjwAAFY8AAP////////////////////////////////////8XjwAAGY8AAP//////////G48AAB2PAAAfjwAAIY8AACOPAAAljwAAJ48AACmPAAArjwAALY8AAC+PAAD/////MY8AADOPAAA1jwAAN48AADmPAAA7jwAAPY8AAD+PAABBjwAAQ48AAEWPAABHjwAASY8AAEuPAABNjwAAT48AAFGPAABTjwAAVY8AAFePAABZjwAAW48AAF2PAABfjwAAYY8AAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////9kjwAAZo8AAGiPAABqjwAAbI8AAP////9ujwAAcI8AAHKPAAB0jwAAdo8AAHiPAAB6jwAAfI8AAP////9+jwAAgI8AAIKPAACEjwAAho8AAIiPAACKjwAAjI8AAP//////////jo8AAJCPAACSjwAA/////////////////////5SPAACWjwAAmI8AAP//////////mo8AAJyPAACejwAAoI8AAKKPAACkjwAApo8AAKiPAACqjwAArI8AAK6PAACwjwAA/////7KPAAC0jwAA/////7aPAAD/////uI8AAP////+6jwAAvI8AAP///////////////////////////////76PAAD/////wI8AAMKPAADEjwAAxo8AAMiPAADKjwAAzI8AAM6PAAD//////////9CPAAD//////////9KPAAD//////////9SPAADWjwAA///////////////////////////YjwAA///////////ajwAA3I8AAN6PAADgjwAA4o8AAOSPAADmjwAA6I8AAOqPAADsjwAA7o8AAPCPAADyjwAA9I8AAPaPAAD4jwAA+o8AAP///////////I8AAP////////////////////////////////6PAAAAkAAAApAAAASQAAAGkAAACJAAAAqQAAAMkAAADpAAABCQAAD//////////xKQAAAUkAAAFpAAABiQAAAakAAAHJAAAB6QAAAgkAAA//////////8ikAAAJJAAACaQAAAokAAAKpAAACyQAAAukAAAMJAAADKQAAA0kAAANpAAADiQAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////zuQAAA9kAAAP5AAAEGQAABDkAAARZAAAP////9HkAAASZAAAEuQAABNkAAAT5AAAFGQAABTkAAAVZAAAFeQAABZkAAAW5AAAF2QAABfkAAAYZAAAGOQAAD/////ZZAAAP////9nkAAAaZAAAGuQAABtkAAAb5AAAHGQAABzkAAAdZAAAHeQAAB5kAAAe5AAAH2QAAB/kAAAgZAAAIOQAACFkAAAh5AAAP////+JkAAA/////4uQAAD/////jZAAAI+QAACRkAAAk5AAAJWQAACXkAAAmZAAAJuQAACdkAAAn5AAAKGQAAD/////o5AAAKWQAACnkAAAqZAAAKuQAACtkAAA/////6+QAACxkAAAs5AAALWQAAC3kAAAuZAAALuQAAC9kAAAv5AAAMGQAADDkAAA///////////FkAAA/////8eQAADJkAAAy5AAAM2QAADPkAAA0ZAAANOQAADVkAAA15AAANmQAADbkAAA3ZAAAN+QAADhkAAA45AAAOWQAADnkAAA6ZAAAOuQAADtkAAA75AAAPGQAAD///////////OQAAD1kAAA95AAAPmQAAD7kAAA/ZAAAP//////kAAAAZEAAP////8DkQAABZEAAP//////////B5EAAAmRAAALkQAADZEAAA+RAAARkQAAE5EAABWRAAAXkQAAGZEAABuRAAAdkQAAH5EAACGRAAAjkQAAJZEAACeRAAApkQAAK5EAAC2RAAAvkQAA/////////////////////zGRAAAzkQAANZEAAP//////////////////////////N5EAADmRAAD/////O5EAAP////89kQAAP5EAAEGRAABDkQAARZEAAEeRAABJkQAAS5EAAE2RAABPkQAA/////1GRAABTkQAAVZEAAFeRAAD/////////////////////WZEAAFuRAABdkQAAX5EAAGGRAAD/////Y5EAAGWRAABnkQAAaZEAAGuRAABtkQAAb5EAAHGRAABzkQAAdZEAAHeRAAB5kQAAe5EAAH2RAAB/kQAAgZEAAIORAACFkQAA/////4eRAAD///////////////+JkQAAi5EAAI2RAACPkQAAkZEAAJORAAD/////lZEAAJeRAACZkQAA/////5uRAACdkQAAn5EAAP///////////////6GRAACjkQAApZEAAP////+nkQAAqZEAAKuRAACtkQAA/////6+RAACxkQAAs5EAALWRAAC3kQAAuZEAALuRAAC9kQAA/////7+RAADBkQAAw5EAAMWRAADHkQAAyZEAAP/////LkQAAzZEAAM+RAAD/////0ZEAANORAADVkQAA15EAANmRAADbkQAA3ZEAAN+RAADhkQAA45EAAOWRAADnkQAA6ZEAAOuRAADtkQAA75EAAPGRAAD/////85EAAPWRAAD3kQAA+ZEAAPuRAAD9kQAA/5EAAAGSAAADkgAABZIAAAeSAAD//////////wmSAAD/////C5IAAA2SAAAPkgAA//////////8RkgAAE5IAABWSAAD/////F5IAABmSAAAbkgAAHZIAAB+SAAAhkgAAI5IAACWSAAAnkgAAKZIAACuSAAAtkgAAL5IAADGSAAAzkgAA/////zWSAAA3kgAAOZIAADuSAAA9kgAAP5IAAEGSAABDkgAARZIAAEeSAABJkgAAS5IAAE2SAABPkgAAUZIAAFOSAABVkgAAV5IAAP//////////WZIAAP//////////W5IAAP//////////XZIAAP////9fkgAAYZIAAGOSAABlkgAAZ5IAAGmSAABrkgAA/////22SAABvkgAA//////////9xkgAAc5IAAHWSAAB3kgAA/////3mSAAB7kgAAfZIAAH+SAACBkgAA/////4OSAACFkgAA//////////+HkgAA//////////+JkgAA/////4uSAACNkgAA//////////+PkgAAkZIAAJOSAACVkgAAl5IAAP//////////mZIAAJuSAACdkgAAn5IAAKGSAAD///////////////+jkgAApZIAAKeSAACpkgAAq5IAAK2SAACvkgAA/////7GSAACzkgAAtZIAALeSAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////7qSAAC8kgAAvpIAAMCSAADCkgAAxJIAAMaSAADIkgAAypIAAMySAAD/////zpIAANCSAADSkgAA1JIAANaSAADYkgAA2pIAANySAADekgAA4JIAAOKSAADkkgAA5pIAAOiSAADqkgAA7JIAAP/////ukgAA8JIAAP////////////////KSAAD0kgAA9pIAAPiSAAD6kgAA/JIAAP///////////////////////////pIAAACTAAACkwAABJMAAP////8GkwAACJMAAP//////////CpMAAP////8MkwAA/////w6TAAAQkwAAEpMAABSTAAAWkwAAGJMAAP////8akwAAHJMAAB6TAAAgkwAAIpMAACSTAAD//////////////////////////yaTAAD/////KJMAACqTAAD/////LJMAAP//////////LpMAAP////8wkwAA/////zKTAAA0kwAANpMAADiTAAA6kwAAPJMAAD6TAABAkwAAQpMAAESTAAD/////////////////////////////////////RpMAAEiTAABKkwAATJMAAP//////////TpMAAP////9QkwAAUpMAAP//////////////////////////VJMAAP////9WkwAAWJMAAFqTAABckwAAXpMAAGCTAABikwAA/////2STAAD/////ZpMAAGiTAABqkwAAbJMAAG6TAABwkwAAcpMAAHSTAAB2kwAAeJMAAP//////////epMAAP////98kwAAfpMAAP///////////////////////////////4CTAAD/////gpMAAISTAACGkwAA/////4iTAAD///////////////+KkwAAjJMAAI6TAACQkwAA/////5KTAACUkwAA////////////////lpMAAP////+YkwAA/////5qTAACckwAAnpMAAKCTAACikwAApJMAAKaTAACokwAAqpMAAKyTAACukwAAsJMAALKTAAD/////tJMAALaTAAC4kwAA////////////////////////////////upMAAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////+9kwAAv5MAAMGTAADDkwAAxZMAAMeTAAD/////yZMAAMuTAAD/////zZMAAM+TAAD/////0ZMAANOTAADVkwAA15MAAP/////ZkwAA/////9uTAADdkwAA35MAAOGTAADjkwAA5ZMAAOeTAADpkwAA65MAAO2TAADvkwAA//////GTAADzkwAA9ZMAAPeTAAD5kwAA+5MAAP2TAAD/kwAAAZQAAAOUAAAFlAAAB5QAAAmUAAALlAAADZQAAA+UAAARlAAA/////////////////////xOUAAD/////FZQAABeUAAAZlAAAG5QAAB2UAAAflAAAIZQAACOUAAAllAAAJ5QAACmUAAArlAAALZQAAC+UAAAxlAAA/////zOUAAD/////NZQAADeUAAD/////OZQAADuUAAA9lAAAP5QAAEGUAABDlAAARZQAAEeUAABJlAAAS5QAAE2UAAD//////////0+UAABRlAAAU5QAAP//////////VZQAAP////9XlAAAWZQAAFuUAABdlAAAX5QAAGGUAABjlAAAZZQAAGeUAAD/////aZQAAP////9rlAAA//////////9tlAAAb5QAAHGUAABzlAAAdZQAAHeUAAB5lAAA//////////97lAAA/////////////////////32UAAB/lAAAgZQAAP////+DlAAA/////4WUAACHlAAAiZQAAIuUAACNlAAAj5QAAP//////////kZQAAJOUAACVlAAAl5QAAJmUAAD///////////////+blAAAnZQAAJ+UAAChlAAAo5QAAKWUAACnlAAA/////6mUAACrlAAArZQAAK+UAACxlAAAs5QAALWUAAC3lAAAuZQAALuUAAC9lAAAv5QAAMGUAADDlAAAxZQAAMeUAADJlAAAy5QAAM2UAAD/////z5QAANGUAADTlAAA1ZQAAP//////////15QAANmUAADblAAA3ZQAAN+UAADhlAAA45QAAOWUAADnlAAA6ZQAAOuUAAD/////////////////////7ZQAAO+UAAD/////8ZQAAPOUAAD///////////WUAAD3lAAA+ZQAAP/////////////////////7lAAA///////////9lAAA/5QAAAGVAAADlQAABZUAAAeVAAAJlQAAC5UAAA2VAAAPlQAA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////xKVAAAUlQAAFpUAABiVAAAalQAAHJUAAB6VAAAglQAAIpUAACSVAAAmlQAA////////////////KJUAACqVAAAslQAALpUAADCVAAAylQAANJUAADaVAAA4lQAA//////////86lQAA/////zyVAAA+lQAAQJUAAEKVAABElQAARpUAAEiVAABKlQAATJUAAE6VAABQlQAAUpUAAFSVAABWlQAAWJUAAFqVAAD//////////1yVAABelQAAYJUAAGKVAAD///////////////9klQAAZpUAAGiVAABqlQAAbJUAAG6VAABwlQAA//////////9ylQAAdJUAAHaVAAB4lQAAepUAAHyVAAB+lQAAgJUAAIKVAACElQAAhpUAAIiVAACKlQAAjJUAAI6VAAD///////////////////////////////+QlQAA//////////+SlQAAlJUAAP////+WlQAAmJUAAJqVAACclQAAnpUAAKCVAACilQAA/////6SVAAD/////ppUAAKiVAACqlQAArJUAAK6VAACwlQAAspUAAP////////////////////+0lQAAtpUAAP////+4lQAAupUAAP//////////vJUAAL6VAADAlQAAwpUAAMSVAADGlQAAyJUAAMqVAADMlQAA/////86VAAD//////////9CVAADSlQAA1JUAANaVAAD/////2JUAANqVAADclQAA3pUAAOCVAADilQAA5JUAAP/////mlQAA6JUAAOqVAADslQAA7pUAAPCVAADylQAA///////////0lQAA9pUAAP/////4lQAA///////////6lQAA//////yVAAD+lQAA/////wCWAAAClgAABJYAAP////////////////////8GlgAA/////wiWAAAKlgAADJYAAA6WAAAQlgAAEpYAABSWAAAWlgAAGJYAABqWAAAclgAAHpYAACCWAAAilgAAJJYAACaWAAAolgAAKpYAAP///////////////yyWAAD//////////y6WAAAwlgAA////////////////MpYAADSWAAA2lgAAOJYAADqWAAD///////////////88lgAAPpYAAECWAABClgAARJYAAP////9GlgAASJYAAEqWAABMlgAATpYAAP////9QlgAAUpYAAP//////////VJYAAFaWAABYlgAAWpYAAFyWAABelgAA//////////////////////////9glgAAYpYAAP////9klgAA/////2aWAABolgAAapYAAP////9slgAAbpYAAP////9wlgAAcpYAAHSWAAB2lgAA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////eZYAAHuWAAB9lgAAf5YAAIGWAACDlgAAhZYAAIeWAACJlgAAi5YAAI2WAACPlgAAkZYAAJOWAACVlgAAl5YAAJmWAACblgAAnZYAAJ+WAAChlgAAo5YAAKWWAACnlgAAqZYAAP//////////q5YAAK2WAACvlgAAsZYAALOWAAC1lgAAt5YAALmWAAC7lgAAvZYAAL+WAADBlgAAw5YAAMWWAADHlgAAyZYAAMuWAADNlgAAz5YAANGWAADTlgAA1ZYAANeWAADZlgAA25YAAN2WAADflgAA4ZYAAOOWAAD/////5ZYAAOeWAADplgAA65YAAO2WAADvlgAA8ZYAAPOWAAD1lgAA95YAAPmWAAD7lgAA/ZYAAP+WAAD/////AZcAAAOXAAAFlwAAB5cAAAmXAAALlwAADZcAAA+XAAARlwAAE5cAABWXAAAXlwAAGZcAAP////8blwAAHZcAAB+XAAAhlwAAI5cAACWXAAAnlwAA/////ymXAAD//////////yuXAAAtlwAAL5cAADGXAAAzlwAANZcAADeXAAA5lwAA/////zuXAAA9lwAAP5cAAEGXAAD/////Q5cAAEWXAABHlwAASZcAAEuXAABNlwAA//////////9PlwAA/////1GXAAD/////U5cAAFWXAABXlwAAWZcAAP////9blwAAXZcAAF+XAAD/////YZcAAGOXAAD/////ZZcAAGeXAAD/////aZcAAGuXAAD/////bZcAAG+XAAD//////////3GXAABzlwAAdZcAAP//////////d5cAAP//////////eZcAAHuXAAB9lwAA/////3+XAACBlwAAg5cAAIWXAAD/////h5cAAP////+JlwAAi5cAAI2XAACPlwAAkZcAAJOXAACVlwAAl5cAAJmXAACblwAA/////////////////////////////////////52XAACflwAAoZcAAP////+jlwAApZcAAKeXAAD//////////6mXAACrlwAArZcAAP////+vlwAAsZcAALOXAAC1lwAAt5cAAP//////////uZcAAP//////////u5cAAL2XAAC/lwAAwZcAAMOXAADFlwAAx5cAAMmXAADLlwAAzZcAAM+XAAD//////////9GXAAD/////05cAANWXAADXlwAA2ZcAANuXAADdlwAA35cAAOGXAAD//////////+OXAADllwAA55cAAP///////////////+mXAADrlwAA7ZcAAO+XAADxlwAA85cAAPWXAAD/////////////////////////////////////95cAAP/////5lwAA//////uXAAD9lwAA/5cAAAGYAAD/////A5gAAP////8FmAAA/////weYAAAJmAAAC5gAAA2YAAD//////////w+YAAD//////////xGYAAD///////////////8TmAAAFZgAABeYAAAZmAAAG5gAAB2YAAAfmAAAIZgAACOYAAAlmAAAJ5gAACmYAAArmAAALZgAAC+YAAAxmAAAM5gAADWYAAA3mAAAOZgAADuYAAA9mAAA/////z+YAAD/////QZgAAEOYAAD/////RZgAAEeYAAD//////////0mYAAD/////S5gAAE2YAAD//////////0+YAAD/////UZgAAFOYAABVmAAAV5gAAP////9ZmAAA//////////9bmAAA/////////////////////12YAABfmAAAYZgAAGOYAABlmAAAZ5gAAGmYAABrmAAA/////22YAABvmAAAcZgAAHOYAAD/////dZgAAHeYAAB5mAAAe5gAAP////99mAAA//////////////////////////9/mAAA/////4GYAACDmAAAhZgAAIeYAACJmAAA/////4uYAAD/////jZgAAI+YAACRmAAAk5gAAJWYAACXmAAA/////5mYAACbmAAAnZgAAJ+YAAD///////////////+hmAAAo5gAAKWYAACnmAAA////////////////////////////////qZgAAKuYAACtmAAAr5gAALGYAACzmAAAtZgAALeYAAD//////////7mYAAD//////////7uYAAC9mAAAv5gAAP//////////wZgAAP/////DmAAAxZgAAP//////////x5gAAMmYAAD/////y5gAAM2YAADPmAAA0ZgAAP/////TmAAA1ZgAANeYAADZmAAA25gAAN2YAADfmAAA4ZgAAOOYAADlmAAA55gAAOmYAADrmAAA7ZgAAO+YAADxmAAA//////OYAAD1mAAA95gAAPmYAAD7mAAA/ZgAAP+YAAABmQAAA5kAAP//////////BZkAAAeZAAD/////CZkAAAuZAAANmQAA/////w+ZAAARmQAAE5kAAP///////////////////////////////xWZAAD/////F5kAAP////////////////////8ZmQAA/////////////////////////////////////xuZAAAdmQAA//////////////////////////8fmQAA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////IpkAACSZAAAmmQAAKJkAACqZAAAsmQAALpkAADCZAAAymQAANJkAADaZAAA4mQAAOpkAADyZAAA+mQAAQJkAAEKZAABEmQAARpkAAEiZAAD//////////////////////////0qZAABMmQAATpkAAP////9QmQAAUpkAAFSZAABWmQAAWJkAAFqZAAD/////XJkAAP////9emQAA//////////9gmQAA/////2KZAAD/////ZJkAAGaZAAD/////////////////////aJkAAGqZAABsmQAAbpkAAHCZAABymQAAdJkAAHaZAAB4mQAA//////////////////////////96mQAA/////3yZAAB+mQAA//////////+AmQAAgpkAAISZAACGmQAAiJkAAIqZAAD/////jJkAAI6ZAACQmQAAkpkAAJSZAAD//////////5aZAACYmQAA/////////////////////5qZAACcmQAAnpkAAP////+gmQAAopkAAKSZAACmmQAAqJkAAKqZAACsmQAArpkAALCZAACymQAAtJkAALaZAAC4mQAAupkAALyZAAC+mQAA/////8CZAADCmQAAxJkAAMaZAADImQAAypkAAP//////////zJkAAM6ZAADQmQAA/////////////////////9KZAADUmQAA1pkAANiZAAD/////2pkAANyZAADemQAA4JkAAOKZAADkmQAA5pkAAOiZAADqmQAA7JkAAO6ZAAD/////8JkAAP/////ymQAA9JkAAP//////////9pkAAPiZAAD6mQAA/JkAAP6ZAAAAmgAAApoAAASaAAAGmgAACJoAAAqaAAD/////DJoAAA6aAAAQmgAAEpoAAP////8UmgAAFpoAABiaAAD///////////////8amgAAHJoAAP////8emgAA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////IZoAACOaAAAlmgAAJ5oAACmaAAArmgAALZoAAC+aAAAxmgAAM5oAADWaAAA3mgAAOZoAAP////87mgAA/////z2aAAA/mgAAQZoAAP////9DmgAARZoAAEeaAABJmgAAS5oAAE2aAABPmgAAUZoAAFOaAABVmgAA/////1eaAABZmgAAW5oAAF2aAABfmgAA/////2GaAABjmgAAZZoAAGeaAABpmgAAa5oAAG2aAABvmgAAcZoAAHOaAAB1mgAA/////3eaAAB5mgAAe5oAAH2aAAB/mgAA/////4GaAACDmgAAhZoAAIeaAACJmgAAi5oAAP////+NmgAA//////////+PmgAAkZoAAJOaAAD///////////////////////////////+VmgAAl5oAAP////+ZmgAAm5oAAP////+dmgAAn5oAAKGaAACjmgAApZoAAP//////////p5oAAP////+pmgAAq5oAAK2aAACvmgAAsZoAAP///////////////7OaAAC1mgAAt5oAALmaAAC7mgAA/////72aAAC/mgAAwZoAAMOaAADFmgAAx5oAAP/////JmgAAy5oAAP/////NmgAA/////////////////////8+aAAD//////////9GaAADTmgAA1ZoAANeaAAD/////2ZoAANuaAADdmgAA35oAAP/////////////////////hmgAA45oAAOWaAADnmgAA6ZoAAOuaAAD/////7ZoAAO+aAADxmgAA85oAAPWaAAD/////95oAAPmaAAD7mgAA/ZoAAP+aAAABmwAAA5sAAAWbAAAHmwAA/////wmbAAD/////C5sAAA2bAAAPmwAAEZsAABObAAAVmwAA/////xebAAAZmwAAG5sAAP//////////HZsAAP//////////////////////////H5sAACGbAAAjmwAAJZsAACebAAD///////////////8pmwAA/////yubAAAtmwAAL5sAAP////8xmwAA/////zObAAA1mwAAN5sAADmbAAA7mwAAPZsAAD+bAABBmwAAQ5sAAEWbAABHmwAA/////0mbAABLmwAATZsAAE+bAABRmwAA/////1ObAAD///////////////9VmwAAV5sAAFmbAAD/////W5sAAP////9dmwAAX5sAAGGbAAD///////////////9jmwAAZZsAAGebAABpmwAA/////2ubAABtmwAA/////////////////////2+bAAD//////////3GbAAD/////c5sAAHWbAAB3mwAAeZsAAHubAAB9mwAAf5sAAIGbAACDmwAAhZsAAIebAAD/////iZsAAIubAACNmwAA////////////////j5sAAJGbAACTmwAA/////////////////////5WbAACXmwAAmZsAAP//////////////////////////////////////////m5sAAJ2bAACfmwAAoZsAAP//////////o5sAAKWbAACnmwAA//////////+pmwAAq5sAAP////+tmwAAr5sAALGbAAD//////////7ObAAC1mwAA/////7ebAAC5mwAAu5sAAP///////////////72bAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8CbAADCmwAAxJsAAMabAADImwAAypsAAMybAADOmwAA0JsAANKbAAD/////1JsAANabAADYmwAA2psAANybAADemwAA4JsAAOKbAADkmwAA5psAAOibAADqmwAA/////+ybAAD/////////////////////7psAAPCbAADymwAA9JsAAPabAAD4mwAA+psAAPybAAD+mwAA////////////////AJwAAAKcAAAEnAAABpwAAAicAAAKnAAADJwAAA6cAAAQnAAAEpwAAP///////////////xScAAAWnAAAGJwAABqcAAAcnAAAHpwAACCcAAAinAAAJJwAAP//////////JpwAACicAAD///////////////8qnAAALJwAAC6cAAAwnAAAMpwAAP////80nAAANpwAADicAAA6nAAAPJwAAD6cAABAnAAAQpwAAEScAAD//////////0acAAD/////SJwAAEqcAAD//////////0ycAABOnAAAUJwAAFKcAABUnAAAVpwAAFicAABanAAAXJwAAF6cAABgnAAAYpwAAP////9knAAAZpwAAP////9onAAAapwAAGycAAD/////bpwAAP//////////////////////////cJwAAHKcAAB0nAAAdpwAAHicAAD/////epwAAHycAAB+nAAAgJwAAP////+CnAAAhJwAAIacAACInAAA//////////+KnAAAjJwAAP////+OnAAA////////////////kJwAAJKcAACUnAAAlpwAAJicAACanAAAnJwAAP////+enAAAoJwAAKKcAACknAAAppwAAKicAACqnAAArJwAAK6cAACwnAAAspwAALScAAD//////////7acAAD/////uJwAAP////+6nAAAvJwAAL6cAADAnAAA/////////////////////8KcAADEnAAAxpwAAMicAADKnAAAzJwAAP///////////////////////////////86cAADQnAAA///////////SnAAA1JwAAP/////WnAAA2JwAANqcAADcnAAA3pwAAP//////////////////////////4JwAAP/////inAAA///////////knAAA5pwAAOicAADqnAAA/////+ycAADunAAA8JwAAPKcAAD0nAAA9pwAAPicAAD///////////qcAAD8nAAA/pwAAACdAAACnQAABJ0AAAadAAAInQAACp0AAAydAAAOnQAAEJ0AABKdAAAUnQAAFp0AABidAAAanQAAHJ0AAP////////////////////////////////////8enQAA////////////////////////////////IJ0AACKdAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////yWdAAAnnQAAKZ0AACudAAAtnQAAL50AADGdAAAznQAANZ0AADedAAA5nQAAO50AAD2dAAD//////////z+dAABBnQAA/////0OdAABFnQAAR50AAEmdAABLnQAATZ0AAE+dAABRnQAAU50AAFWdAABXnQAAWZ0AAFudAABdnQAAX50AAP//////////YZ0AAGOdAABlnQAAZ50AAGmdAABrnQAAbZ0AAG+dAABxnQAAc50AAP//////////dZ0AAP////93nQAAeZ0AAP//////////e50AAH2dAAB/nQAA////////////////gZ0AAIOdAACFnQAAh50AAImdAACLnQAA/////42dAAD//////////4+dAACRnQAAk50AAJWdAAD//////////////////////////5edAACZnQAA////////////////m50AAJ2dAAD///////////////+fnQAAoZ0AAKOdAAClnQAA//////////+nnQAA//////////+pnQAA/////6udAACtnQAA/////////////////////6+dAACxnQAAs50AAP////+1nQAAt50AALmdAAC7nQAAvZ0AAL+dAAD//////////8GdAAD/////w50AAP//////////xZ0AAP///////////////8edAAD/////////////////////////////////////////////////////yZ0AAMudAAD/////////////////////zZ0AAM+dAADRnQAA/////9OdAADVnQAA/////9edAAD/////////////////////2Z0AANudAADdnQAA/////9+dAADhnQAA450AAOWdAAD/////////////////////550AAP/////pnQAA/////+udAADtnQAA///////////vnQAA8Z0AAPOdAAD1nQAA950AAP/////5nQAA+50AAP/////9nQAA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wCeAAACngAABJ4AAAaeAAAIngAACp4AAAyeAAAOngAAEJ4AABKeAAAUngAAFp4AABieAAAangAAHJ4AAB6eAAAgngAAIp4AACSeAAAmngAA//////////8ongAAKp4AACyeAAAungAAMJ4AADKeAAA0ngAANp4AADieAAA6ngAAPJ4AAD6eAABAngAAQp4AAP////9EngAA//////////9GngAASJ4AAEqeAABMngAATp4AAFCeAABSngAAVJ4AAFaeAABYngAA/////1qeAABcngAA/////16eAABgngAAYp4AAGSeAABmngAAaJ4AAGqeAABsngAAbp4AAHCeAAByngAAdJ4AAHaeAAB4ngAAep4AAHyeAAB+ngAAgJ4AAP//////////gp4AAP////+EngAAhp4AAP////+IngAA/////4qeAACMngAA/////46eAACQngAAkp4AAP//////////lJ4AAJaeAACYngAAmp4AAJyeAACengAAoJ4AAP////+ingAApJ4AAKaeAACongAAqp4AAKyeAACungAAsJ4AALKeAAC0ngAAtp4AALieAAC6ngAAvJ4AAL6eAADAngAAwp4AAMSeAADGngAAyJ4AAMqeAADMngAA/////86eAADQngAA0p4AANSeAADWngAA2J4AANqeAAD/////3J4AAN6eAAD////////////////gngAA4p4AAOSeAAD/////5p4AAOieAAD/////6p4AAOyeAADungAA8J4AAP/////yngAA9J4AAPaeAAD/////+J4AAP////////////////qeAAD//////J4AAP6eAAAAnwAA//////////8CnwAA/////wSfAAAGnwAA/////wifAAAKnwAA////////////////DJ8AAA6fAAAQnwAAEp8AABSfAAD/////Fp8AAP////8YnwAAGp8AAByfAAD/////Hp8AACCfAAAinwAAJJ8AAP////8mnwAAKJ8AACqfAAD/////LJ8AAC6fAAD/////MJ8AAP////////////////////8ynwAANJ8AAP//////////////////////////////////////////Np8AAP////84nwAAOp8AADyfAAA+nwAAQJ8AAEKfAABEnwAA/////0afAABInwAA/////0qfAABMnwAA////////////////Tp8AAFCfAAD//////////1KfAABUnwAA////////////////Vp8AAFifAABanwAA////////////////XJ8AAF6fAABgnwAA/////2KfAABknwAA//////////9mnwAA/////2ifAAD/////////////////////////////////////ap8AAP//////////bJ8AAG6fAAD/////cJ8AAHKfAAB0nwAAdp8AAHifAAB6nwAAfJ8AAH6fAAD/////gJ8AAP////+CnwAAhJ8AAIafAAD///////////////+InwAAip8AAP//////////jJ8AAI6fAAD/////kJ8AAJKfAACUnwAA//////////+WnwAA/////5ifAACanwAA//////////+cnwAA/////////////////////56fAACgnwAA//////////////////////////+inwAApJ8AAKafAAConwAA////////////////////////////////qp8AAKyfAACunwAAsJ8AALKfAAC0nwAA/////7afAAD///////////////+4nwAAup8AALyfAAC+nwAAwJ8AAP//////////wp8AAP//////////////////////////xJ8AAMafAAD//////////8ifAADKnwAA////////////////zJ8AAM6fAAD//////////////////////////9CfAADSnwAA1J8AAP//////////1p8AAP//////////2J8AAP///////////////9qfAADcnwAA3p8AAOCfAADinwAA/////+SfAADmnwAA6J8AAOqfAAD/////////////////////7J8AAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////++fAADxnwAA858AAPWfAAD3nwAA+Z8AAPufAAD9nwAA/58AAAGgAAADoAAABaAAAAegAAAJoAAA/////wugAAANoAAAD6AAABGgAAAToAAAFaAAABegAAAZoAAA/////xugAAAdoAAAH6AAACGgAAAjoAAAJaAAACegAAApoAAAK6AAAC2gAAAvoAAAMaAAADOgAAA1oAAAN6AAADmgAAA7oAAAPaAAAD+gAABBoAAAQ6AAAEWgAABHoAAA//////////////////////////////////////////9JoAAAS6AAAE2gAABPoAAAUaAAAFOgAABVoAAA/////1egAABZoAAAW6AAAF2gAABfoAAAYaAAAGOgAABloAAAZ6AAAP////9poAAA/////2ugAAD/////baAAAP//////////b6AAAP//////////caAAAHOgAAD/////daAAAHegAAB5oAAAe6AAAH2gAAB/oAAAgaAAAIOgAACFoAAAh6AAAImgAACLoAAAjaAAAI+gAACRoAAAk6AAAJWgAACXoAAAmaAAAJugAAD/////naAAAJ+gAAChoAAAo6AAAKWgAAD/////p6AAAKmgAAD//////////6ugAACtoAAA/////////////////////////////////////6+gAAD/////saAAALOgAAC1oAAAt6AAALmgAAC7oAAAvaAAAL+gAADBoAAAw6AAAMWgAADHoAAAyaAAAMugAADNoAAAz6AAANGgAADToAAA1aAAANegAADZoAAA26AAAN2gAADfoAAA4aAAAOOgAADloAAA/////+egAADpoAAA66AAAO2gAADvoAAA8aAAAP////////////////OgAAD/////9aAAAP//////////96AAAPmgAAD7oAAA///////////9oAAA/6AAAAGhAAADoQAABaEAAAehAAAJoQAAC6EAAP//////////DaEAAA+hAAD/////EaEAAP///////////////xOhAAD//////////xWhAAD/////////////////////F6EAABmhAAD/////G6EAAB2hAAAfoQAAIaEAACOhAAAloQAA/////////////////////yehAAD/////KaEAACuhAAAtoQAAL6EAADGhAAAzoQAANaEAADehAAA5oQAAO6EAAD2hAAA/oQAAQaEAAEOhAABFoQAAR6EAAEmhAABLoQAATaEAAE+hAABRoQAAU6EAAFWhAAD/////V6EAAFmhAABboQAAXaEAAF+hAABhoQAAY6EAAGWhAAD/////Z6EAAP////9poQAAa6EAAG2hAAD/////b6EAAHGhAABzoQAA/////////////////////3WhAAD/////////////////////d6EAAP///////////////3mhAAD//////////3uhAAB9oQAAf6EAAIGhAACDoQAA/////4WhAACHoQAAiaEAAP////+LoQAAjaEAAI+hAACRoQAAk6EAAJWhAAD/////l6EAAP////+ZoQAAm6EAAP////+doQAA////////////////n6EAAP////+hoQAA/////6OhAACloQAA//////////////////////////+noQAA/////6mhAAD/////q6EAAK2hAACvoQAA/////7GhAACzoQAAtaEAALehAAC5oQAAu6EAAL2hAAC/oQAAwaEAAMOhAADFoQAAx6EAAMmhAADLoQAAzaEAAM+hAADRoQAA06EAANWhAADXoQAA2aEAANuhAADdoQAA36EAAOGhAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////+ShAADmoQAA6KEAAOqhAADsoQAA7qEAAPChAADyoQAA9KEAAPahAAD4oQAA+qEAAPyhAAD+oQAAAKIAAAKiAAAEogAABqIAAAiiAAAKogAADKIAAA6iAAAQogAAEqIAABSiAAAWogAAGKIAABqiAAAcogAAHqIAACCiAAAiogAAJKIAACaiAAAoogAAKqIAACyiAAAuogAAMKIAADKiAAA0ogAANqIAAP////84ogAAOqIAADyiAAA+ogAA/////0CiAAD//////////0KiAABEogAARqIAAEiiAABKogAATKIAAE6iAABQogAAUqIAAFSiAABWogAAWKIAAFqiAABcogAAXqIAAGCiAAD//////////2KiAABkogAAZqIAAGiiAABqogAA/////2yiAAD/////bqIAAHCiAAByogAAdKIAAP//////////dqIAAHiiAAB6ogAA/////3yiAAB+ogAA//////////+AogAAgqIAAP////+EogAA/////////////////////4aiAACIogAAiqIAAIyiAACOogAAkKIAAJKiAACUogAAlqIAAJiiAACaogAAnKIAAJ6iAACgogAAoqIAAKSiAACmogAAqKIAAKqiAACsogAArqIAALCiAACyogAAtKIAALaiAAC4ogAAuqIAALyiAAC+ogAAwKIAAMKiAAD/////xKIAAMaiAADIogAAyqIAAMyiAADOogAA0KIAAP//////////0qIAANSiAADWogAA2KIAANqiAADcogAA3qIAAOCiAAD////////////////iogAA5KIAAOaiAADoogAA/////+qiAAD////////////////sogAA///////////uogAA8KIAAPKiAAD0ogAA9qIAAPiiAAD6ogAA/KIAAP6iAAAAowAAAqMAAP////8EowAABqMAAAijAAAKowAADKMAAA6jAAAQowAAEqMAABSjAAAWowAAGKMAABqjAAAcowAAHqMAACCjAAAiowAAJKMAACajAAAoowAAKqMAAP////8sowAALqMAADCjAAAyowAANKMAADajAAA4owAAOqMAADyjAAD//////////z6jAABAowAAQqMAAESjAABGowAASKMAAEqjAABMowAATqMAAFCjAABSowAAVKMAAFajAABYowAAWqMAAFyjAAD/////XqMAAGCjAABiowAAZKMAAP////9mowAA//////////9oowAAaqMAAGyjAABuowAA//////////9wowAAcqMAAP//////////dKMAAHajAAB4owAAeqMAAP///////////////3yjAAD//////////////////////////36jAACAowAA////////////////gqMAAP//////////hKMAAP//////////hqMAAP//////////iKMAAIqjAACMowAAjqMAAP//////////kKMAAJKjAACUowAAlqMAAJijAAD///////////////+aowAAnKMAAJ6jAAD/////oKMAAP////+iowAApKMAAKajAACoowAAqqMAAKyjAACuowAAsKMAALKjAAC0owAAtqMAAP////+4owAA/////7qjAAC8owAAvqMAAMCjAADCowAAxKMAAMajAADIowAAyqMAAMyjAAD/////zqMAANCjAADSowAA1KMAANajAADYowAA/////9qjAADcowAA3qMAAOCjAADiowAA5KMAAOajAADoowAA///////////qowAA/////+yjAADuowAA8KMAAPKjAAD0owAA9qMAAPijAAD6owAA/KMAAP6jAAAApAAAAqQAAASkAAAGpAAACKQAAAqkAAD/////DKQAAP////8OpAAAEKQAABKkAAAUpAAAFqQAABikAAAapAAAHKQAAB6kAAD//////////yCkAAAipAAA/////ySkAAAmpAAAKKQAAP////8qpAAA////////////////LKQAAC6kAAAwpAAA////////////////MqQAADSkAAA2pAAAOKQAADqkAAA8pAAAPqQAAP///////////////0CkAABCpAAARKQAAP////9GpAAA////////////////SKQAAEqkAAD//////////////////////////0ykAAD///////////////////////////////9OpAAAUKQAAFKkAABUpAAA/////1akAAD///////////////9YpAAA////////////////////////////////WqQAAFykAABepAAAYKQAAGKkAABkpAAAZqQAAGikAABqpAAA//////////9spAAAbqQAAHCkAABypAAA//////////90pAAAdqQAAHikAAB6pAAAfKQAAH6kAAD//////////4CkAACCpAAAhKQAAIakAACIpAAAiqQAAIykAACOpAAAkKQAAJKkAACUpAAA/////5akAAD/////mKQAAP//////////mqQAAJykAACepAAAoKQAAKKkAACkpAAApqQAAKikAACqpAAArKQAAK6kAAD/////sKQAALKkAAC0pAAAtqQAALikAAC6pAAAvKQAAL6kAADApAAA///////////CpAAAxKQAAMakAADIpAAAyqQAAMykAADOpAAA0KQAANKkAAD/////1KQAANakAAD//////////9ikAADapAAA3KQAAN6kAADgpAAA4qQAAP/////////////////////kpAAA5qQAAOikAAD/////6qQAAP///////////////+ykAADupAAA8KQAAPKkAAD0pAAA9qQAAPikAAD6pAAA/KQAAP6kAAAApQAA/////wKlAAAEpQAABqUAAAilAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wulAAANpQAAD6UAABGlAAATpQAAFaUAABelAAAZpQAAG6UAAB2lAAAfpQAA/////yGlAAAjpQAAJaUAACelAAAppQAAK6UAAC2lAAAvpQAAMaUAADOlAAA1pQAAN6UAADmlAAA7pQAA/////z2lAAA/pQAAQaUAAEOlAABFpQAAR6UAAEmlAABLpQAATaUAAE+lAABRpQAAU6UAAP////9VpQAAV6UAAFmlAABbpQAAXaUAAP////////////////////9fpQAAYaUAAGOlAABlpQAAZ6UAAGmlAABrpQAAbaUAAG+lAABxpQAAc6UAAHWlAAB3pQAAeaUAAHulAAB9pQAAf6UAAIGlAACDpQAAhaUAAIelAACJpQAAi6UAAI2lAACPpQAAkaUAAJOlAAD/////laUAAJelAACZpQAAm6UAAJ2lAACfpQAAoaUAAKOlAAClpQAA/////6elAACppQAA//////////+rpQAAraUAAP////////////////////+vpQAAsaUAALOlAAC1pQAAt6UAALmlAAC7pQAAvaUAAL+lAADBpQAAw6UAAP/////FpQAAx6UAAMmlAADLpQAAzaUAAM+lAAD//////////9GlAADTpQAA1aUAANelAAD/////2aUAAP//////////26UAAN2lAADfpQAA4aUAAOOlAADlpQAA/////+elAAD//////////+mlAADrpQAA7aUAAO+lAADxpQAA86UAAPWlAAD3pQAA+aUAAPulAAD9pQAA/6UAAAGmAAADpgAABaYAAAemAAAJpgAAC6YAAA2mAAAPpgAAEaYAABOmAAD/////////////////////FaYAAP////8XpgAAGaYAABumAAAdpgAAH6YAACGmAAAjpgAA/////yWmAAAnpgAAKaYAACumAAAtpgAAL6YAADGmAAAzpgAANaYAADemAAD/////OaYAAP////////////////////87pgAAPaYAAD+mAABBpgAAQ6YAAEWmAABHpgAASaYAAP////9LpgAATaYAAP////9PpgAAUaYAAP////9TpgAA/////////////////////1WmAAD/////V6YAAFmmAABbpgAAXaYAAF+mAABhpgAAY6YAAGWmAABnpgAAaaYAAP//////////a6YAAP////9tpgAA/////2+mAAD//////////3GmAAD//////////3OmAAB1pgAAd6YAAHmmAAB7pgAAfaYAAH+mAACBpgAAg6YAAIWmAAD/////h6YAAImmAACLpgAAjaYAAI+mAACRpgAA//////////+TpgAAlaYAAJemAACZpgAAm6YAAP////+dpgAAn6YAAP////+hpgAAo6YAAKWmAACnpgAA////////////////qaYAAP//////////q6YAAP////+tpgAAr6YAALGmAACzpgAAtaYAAP////+3pgAAuaYAAP////+7pgAAvaYAAL+mAADBpgAAw6YAAP/////FpgAAx6YAAMmmAADLpgAAzaYAAP/////PpgAA0aYAANOmAAD/////////////////////1aYAANemAADZpgAA///////////bpgAA3aYAAN+mAADhpgAA46YAAOWmAADnpgAA6aYAAP/////rpgAA/////+2mAAD/////76YAAP/////xpgAA86YAAP/////////////////////1pgAA96YAAPmmAAD7pgAA/aYAAP+mAAD//////////wGnAAADpwAA////////////////////////////////BacAAP////8HpwAACacAAAunAAD//////////w2nAAD//////////w+nAAARpwAAE6cAAP///////////////////////////////xWnAAAXpwAAGacAABunAAAdpwAAH6cAACGnAAAjpwAAJacAACenAAAppwAA//////////8rpwAALacAAC+nAAAxpwAAM6cAADWnAAA3pwAAOacAAP//////////O6cAAP////89pwAAP6cAAEGnAABDpwAARacAAEenAAD/////SacAAP//////////S6cAAE2nAABPpwAAUacAAFOnAABVpwAAV6cAAFmnAABbpwAAXacAAF+nAAD/////YacAAGOnAABlpwAAZ6cAAGmnAABrpwAAbacAAG+nAABxpwAAc6cAAP////91pwAA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////3inAAB6pwAAfKcAAH6nAACApwAAgqcAAISnAACGpwAAiKcAAIqnAACMpwAA//////////+OpwAAkKcAAJKnAACUpwAAlqcAAJinAACapwAAnKcAAJ6nAACgpwAAoqcAAKSnAACmpwAA/////6inAACqpwAArKcAAK6nAACwpwAAsqcAALSnAAC2pwAA/////7inAAC6pwAAvKcAAL6nAADApwAAwqcAAMSnAADGpwAAyKcAAMqnAADMpwAAzqcAAP/////QpwAA0qcAANSnAADWpwAA/////9inAADapwAA3KcAAP/////epwAA///////////gpwAA4qcAAOSnAADmpwAA6KcAAOqnAADspwAA7qcAAPCnAADypwAA9KcAAPanAAD4pwAA+qcAAP/////8pwAA//////6nAAAAqAAAAqgAAASoAAAGqAAACKgAAAqoAAAMqAAADqgAAP//////////EKgAABKoAAAUqAAA/////xaoAAAYqAAAGqgAAByoAAAeqAAA//////////////////////////8gqAAA//////////////////////////8iqAAA/////ySoAAAmqAAAKKgAACqoAAD/////LKgAAC6oAAD///////////////8wqAAAMqgAADSoAAA2qAAAOKgAADqoAAA8qAAAPqgAAP////9AqAAAQqgAAESoAAD/////RqgAAP////9IqAAASqgAAEyoAABOqAAAUKgAAFKoAABUqAAAVqgAAFioAABaqAAAXKgAAF6oAABgqAAAYqgAAGSoAABmqAAAaKgAAGqoAABsqAAAbqgAAHCoAAByqAAA//////////90qAAAdqgAAP////94qAAA/////3qoAAB8qAAAfqgAAICoAAD///////////////+CqAAAhKgAAIaoAAD/////iKgAAIqoAACMqAAAjqgAAJCoAAD//////////5KoAAD/////lKgAAJaoAACYqAAA////////////////mqgAAJyoAAD/////nqgAAKCoAACiqAAApKgAAKaoAACoqAAAqqgAAKyoAAD//////////66oAACwqAAAsqgAAP//////////tKgAALaoAAC4qAAAuqgAALyoAAC+qAAAwKgAAMKoAADEqAAAxqgAAMioAADKqAAAzKgAAM6oAAD//////////9CoAADSqAAA1KgAANaoAADYqAAA2qgAANyoAADeqAAA4KgAAOKoAADkqAAA5qgAAOioAADqqAAA7KgAAO6oAADwqAAA8qgAAPSoAAD2qAAA+KgAAPqoAAD8qAAA/qgAAACpAAACqQAA////////////////BKkAAAapAAAIqQAACqkAAAypAAD/////DqkAABCpAAASqQAAFKkAAP////8WqQAAGKkAAP////////////////////8aqQAAHKkAAB6pAAAgqQAAIqkAAP///////////////ySpAAAmqQAA/////yipAAD//////////yqpAAAsqQAA/////////////////////y6pAAAwqQAA//////////8yqQAANKkAADapAAA4qQAA//////////86qQAA////////////////PKkAAD6pAABAqQAAQqkAAP////9EqQAA//////////9GqQAASKkAAEqpAAD//////////////////////////0ypAABOqQAAUKkAAFKpAABUqQAAVqkAAFipAABaqQAAXKkAAF6pAABgqQAAYqkAAGSpAABmqQAAaKkAAGqpAAD/////bKkAAG6pAAD/////cKkAAHKpAAB0qQAAdqkAAHipAAB6qQAAfKkAAH6pAAD/////gKkAAP////+CqQAA/////4SpAACGqQAAiKkAAIqpAACMqQAAjqkAAJCpAACSqQAA/////5SpAACWqQAAmKkAAJqpAAD//////////5ypAACeqQAAoKkAAKKpAACkqQAApqkAAKipAACqqQAArKkAAK6pAACwqQAAsqkAAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////7WpAAC3qQAAuakAALupAAC9qQAAv6kAAMGpAADDqQAAxakAAMepAADJqQAAy6kAAP///////////////82pAADPqQAA0akAANOpAADVqQAA16kAANmpAADbqQAA3akAAP/////fqQAA4akAAOOpAAD////////////////lqQAA56kAAOmpAADrqQAA7akAAO+pAADxqQAA86kAAPWpAAD3qQAA+akAAPupAAD9qQAA/6kAAAGqAAADqgAABaoAAAeqAAD/////CaoAAAuqAAANqgAAD6oAABGqAAATqgAAFaoAABeqAAAZqgAAG6oAAB2qAAAfqgAAIaoAAP////8jqgAAJaoAACeqAAD/////KaoAACuqAAD/////LaoAAC+qAAAxqgAAM6oAADWqAAA3qgAAOaoAADuqAAA9qgAAP6oAAEGqAABDqgAARaoAAP////9HqgAA/////0mqAABLqgAA////////////////TaoAAP//////////T6oAAFGqAABTqgAA/////1WqAABXqgAAWaoAAP////9bqgAAXaoAAF+qAABhqgAAY6oAAGWqAAD/////Z6oAAGmqAABrqgAA//////////9tqgAAb6oAAHGqAAD//////////////////////////3OqAAD/////daoAAHeqAAB5qgAAe6oAAH2qAAB/qgAAgaoAAIOqAACFqgAAh6oAAImqAAD//////////////////////////4uqAACNqgAA//////////+PqgAA//////////+RqgAA////////////////////////////////k6oAAJWqAACXqgAAmaoAAP//////////m6oAAJ2qAACfqgAAoaoAAKOqAAD/////paoAAKeqAACpqgAA/////6uqAACtqgAAr6oAALGqAACzqgAA//////////+1qgAA/////7eqAAC5qgAAu6oAAL2qAAC/qgAAwaoAAP//////////w6oAAMWqAAD//////////8eqAADJqgAAy6oAAM2qAADPqgAA/////9GqAADTqgAA1aoAANeqAADZqgAA26oAAN2qAADfqgAA4aoAAOOqAAD/////5aoAAOeqAADpqgAA66oAAP/////////////////////////////////////////////////////tqgAA/////++qAAD///////////////////////////GqAADzqgAA9aoAAPeqAAD5qgAA+6oAAP2qAAD/qgAA/////wGrAAADqwAABasAAAerAAD/////CasAAP////8LqwAA/////w2rAAD/////////////////////D6sAABGrAAATqwAA/////////////////////xWrAAAXqwAAGasAABurAAAdqwAAH6sAACGrAAAjqwAA/////yWrAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////KKsAACqrAAAsqwAALqsAADCrAAAyqwAANKsAADarAAA4qwAAOqsAADyrAAA+qwAAQKsAAEKrAABEqwAARqsAAEirAABKqwAATKsAAE6rAABQqwAAUqsAAFSrAABWqwAAWKsAAFqrAABcqwAAXqsAAGCrAABiqwAAZKsAAGarAABoqwAAaqsAAGyrAABuqwAAcKsAAHKrAAB0qwAA//////////92qwAAeKsAAHqrAAD/////fKsAAH6rAACAqwAAgqsAAISrAACGqwAAiKsAAIqrAACMqwAAjqsAAJCrAACSqwAAlKsAAJarAACYqwAAmqsAAJyrAACeqwAAoKsAAKKrAACkqwAApqsAAKirAACqqwAArKsAAK6rAACwqwAAsqsAALSrAAC2qwAA//////////+4qwAAuqsAAP//////////////////////////vKsAAL6rAADAqwAAwqsAAMSrAADGqwAAyKsAAP/////KqwAAzKsAAM6rAAD/////0KsAANKrAADUqwAA1qsAANirAADaqwAA3KsAAP//////////3qsAAOCrAADiqwAA5KsAAOarAADoqwAA6qsAAOyrAAD/////7qsAAPCrAADyqwAA9KsAAParAAD4qwAA+qsAAPyrAAD+qwAAAKwAAAKsAAAErAAABqwAAAisAAAKrAAA/////wysAAAOrAAAEKwAABKsAAAUrAAAFqwAABisAAAarAAAHKwAAB6sAAAgrAAA/////yKsAAAkrAAA/////yasAAAorAAA/////yqsAAAsrAAALqwAADCsAAD/////MqwAADSsAAA2rAAAOKwAADqsAAA8rAAA//////////8+rAAAQKwAAEKsAAD///////////////9ErAAARqwAAEisAABKrAAATKwAAE6sAABQrAAAUqwAAFSsAABWrAAAWKwAAFqsAABcrAAA/////16sAABgrAAAYqwAAGSsAABmrAAAaKwAAGqsAABsrAAAbqwAAHCsAAByrAAAdKwAAHasAAB4rAAAeqwAAHysAAB+rAAAgKwAAIKsAAD/////hKwAAIasAAD/////iKwAAIqsAACMrAAAjqwAAP////+QrAAAkqwAAP//////////lKwAAJasAACYrAAAmqwAAJysAACerAAAoKwAAKKsAACkrAAApqwAAKisAACqrAAArKwAAK6sAACwrAAAsqwAALSsAAD/////tqwAALisAAC6rAAAvKwAAP////////////////////++rAAAwKwAAP//////////wqwAAMSsAAD//////////8asAADIrAAA/////8qsAAD/////zKwAAM6sAAD/////////////////////0KwAAP/////SrAAA/////////////////////9SsAAD/////1qwAAP//////////2KwAANqsAAD/////3KwAAN6sAADgrAAA///////////irAAA/////+SsAADmrAAA/////////////////////////////////////+isAADqrAAA///////////////////////////srAAA7qwAAP/////wrAAA8qwAAPSsAAD/////9qwAAPisAAD6rAAA/////////////////KwAAP6sAAAArQAAAq0AAAStAAD//////////////////////////watAAAIrQAACq0AAAytAAAOrQAAEK0AABKtAAAUrQAAFq0AABitAAAarQAAHK0AAB6tAAAgrQAA/////yKtAAAkrQAAJq0AACitAAD/////Kq0AACytAAAurQAAMK0AADKtAAA0rQAANq0AADitAAA6rQAA//////////88rQAA/////z6tAABArQAA//////////9CrQAA////////////////////////////////RK0AAP////9GrQAASK0AAEqtAABMrQAA/////06tAABQrQAAUq0AAFStAABWrQAAWK0AAFqtAABcrQAAXq0AAGCtAABirQAAZK0AAGatAABorQAAaq0AAGytAABurQAAcK0AAHKtAAB0rQAAdq0AAHitAAB6rQAAfK0AAH6tAACArQAAgq0AAIStAAD/////hq0AAIitAAD/////iq0AAIytAACOrQAAkK0AAJKtAAD///////////////+UrQAA/////5atAACYrQAAmq0AAP///////////////////////////////////////////////5ytAACerQAAoK0AAP///////////////6KtAACkrQAA/////////////////////////////////////6atAACorQAA//////////+qrQAArK0AAK6tAACwrQAAsq0AAP//////////tK0AALatAAD/////////////////////uK0AAP///////////////7qtAAC8rQAA//////////////////////////++rQAA////////////////wK0AAMKtAADErQAAxq0AAP/////////////////////IrQAAyq0AAMytAADOrQAA0K0AANKtAADUrQAA1q0AANitAADarQAA///////////crQAA/////96tAADgrQAA4q0AAOStAADmrQAA/////+itAADqrQAA7K0AAO6tAAD/////8K0AAPKtAAD///////////StAAD2rQAA//////itAAD6rQAA/K0AAP6tAAAArgAAAq4AAASuAAAGrgAACK4AAAquAAD/////DK4AAA6uAAD/////EK4AAP////8SrgAAFK4AABauAAD//////////xiuAAAargAA/////////////////////xyuAAD/////Hq4AAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8hrgAAI64AACWuAAAnrgAAKa4AACuuAAAtrgAAL64AADGuAAD/////M64AADWuAAA3rgAA/////zmuAAA7rgAAPa4AAD+uAABBrgAA//////////9DrgAARa4AAP///////////////0euAABJrgAAS64AAE2uAABPrgAA/////1GuAAD/////U64AAFWuAABXrgAAWa4AAFuuAABdrgAA/////1+uAABhrgAAY64AAP////9lrgAAZ64AAGmuAABrrgAA/////22uAAD//////////2+uAABxrgAAc64AAHWuAAD/////d64AAHmuAAB7rgAA//////////99rgAAf64AAIGuAACDrgAA//////////+FrgAAh64AAImuAACLrgAAja4AAI+uAACRrgAAk64AAP///////////////5WuAACXrgAAma4AAP//////////m64AAP///////////////52uAAD//////////5+uAAChrgAAo64AAKWuAACnrgAAqa4AAKuuAAD/////ra4AAK+uAAD/////sa4AALOuAAC1rgAAt64AALmuAAC7rgAAva4AAL+uAADBrgAAw64AAMWuAADHrgAAya4AAMuuAADNrgAAz64AANGuAAD/////064AANWuAADXrgAA///////////////////////////ZrgAA264AAN2uAADfrgAA4a4AAOOuAADlrgAA564AAOmuAADrrgAA7a4AAO+uAADxrgAA864AAP/////1rgAA//////euAAD5rgAA+64AAP/////9rgAA/64AAAGvAAD/////////////////////A68AAAWvAAAHrwAACa8AAAuvAAANrwAAD68AABGvAAATrwAAFa8AABevAAAZrwAAG68AAP////8drwAA/////x+vAAAhrwAA////////////////I68AAP////////////////////8lrwAAJ68AAP//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////Kq8AACyvAAAurwAAMK8AADKvAAA0rwAANq8AADivAAA6rwAAPK8AAD6vAABArwAAQq8AAESvAABGrwAASK8AAEqvAABMrwAATq8AAFCvAABSrwAAVK8AAFavAABYrwAAWq8AAFyvAABerwAAYK8AAGKvAABkrwAAZq8AAGivAABqrwAAbK8AAG6vAABwrwAAcq8AAHSvAAB2rwAAeK8AAHqvAAD/////fK8AAH6vAACArwAAgq8AAISvAACGrwAA/////4ivAACKrwAA/////4yvAAD///////////////+OrwAAkK8AAP///////////////5KvAACUrwAAlq8AAJivAACarwAAnK8AAJ6vAACgrwAAoq8AAKSvAACmrwAAqK8AAKqvAACsrwAArq8AALCvAACyrwAAtK8AALavAAC4rwAAuq8AALyvAAD//////////76vAADArwAAwq8AAMSvAADGrwAAyK8AAMqvAADMrwAA/////86vAADQrwAA/////////////////////////////////////9KvAADUrwAA///////////WrwAA/////9ivAADarwAA3K8AAN6vAADgrwAA4q8AAOSvAADmrwAA6K8AAP/////qrwAA7K8AAP/////urwAA///////////wrwAA8q8AAPSvAAD2rwAA+K8AAPqvAAD8rwAA/q8AAP//////////ALAAAAKwAAAEsAAABrAAAAiwAAAKsAAADLAAAA6wAAD/////ELAAABKwAAAUsAAAFrAAABiwAAAasAAAHLAAAB6wAAAgsAAAIrAAACSwAAAmsAAAKLAAACqwAAAssAAALrAAADCwAAAysAAANLAAADawAAD/////////////////////OLAAADqwAAD/////////////////////PLAAAD6wAABAsAAAQrAAAESwAAD/////RrAAAEiwAABKsAAATLAAAE6wAABQsAAAUrAAAFSwAAD/////VrAAAFiwAAD/////////////////////WrAAAFywAAD//////////////////////////16wAAD//////////2CwAABisAAA//////////9ksAAA/////////////////////2awAAD/////aLAAAP//////////arAAAGywAAD/////brAAAHCwAABysAAA//////////90sAAAdrAAAHiwAAB6sAAAfLAAAH6wAACAsAAAgrAAAP////+EsAAAhrAAAP//////////iLAAAIqwAACMsAAAjrAAAJCwAACSsAAAlLAAAJawAACYsAAAmrAAAJywAACesAAAoLAAAKKwAACksAAAprAAAKiwAACqsAAArLAAAK6wAACwsAAAsrAAALSwAAC2sAAAuLAAALqwAAC8sAAAvrAAAMCwAADCsAAAxLAAAP///////////////////////////////8awAADIsAAAyrAAAMywAAD/////zrAAANCwAADSsAAA1LAAAP/////WsAAA/////9iwAADasAAA3LAAAN6wAADgsAAA4rAAAOSwAADmsAAA6LAAAOqwAAD/////7LAAAO6wAAD////////////////wsAAA8rAAAPSwAAD/////////////////////9rAAAP////////////////////////////////iwAAD6sAAA/LAAAP6wAAD/////ALEAAP//////////////////////////////////////////////////////////ArEAAASxAAAGsQAACLEAAAqxAAD/////DLEAAP////////////////////8OsQAAELEAABKxAAAUsQAA/////xaxAAAYsQAAGrEAAByxAAD/////HrEAACCxAAAisQAAJLEAACaxAAD/////KLEAAP////8qsQAALLEAAC6xAAAwsQAAMrEAADSxAAD//////////////////////////zaxAAA4sQAAOrEAADyxAAA+sQAAQLEAAP////9CsQAARLEAAEaxAABIsQAA//////////9KsQAATLEAAE6xAABQsQAAUrEAAFSxAABWsQAA/////1ixAABasQAA/////1yxAABesQAAYLEAAGKxAABksQAAZrEAAGixAABqsQAAbLEAAP//////////brEAAHCxAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////c7EAAHWxAAB3sQAAebEAAHuxAAB9sQAAf7EAAIGxAAD/////g7EAAIWxAACHsQAAibEAAIuxAACNsQAAj7EAAJGxAACTsQAAlbEAAJexAAD/////mbEAAJuxAAD/////nbEAAJ+xAAChsQAAo7EAAKWxAACnsQAAqbEAAP//////////q7EAAK2xAACvsQAAsbEAALOxAAC1sQAAt7EAALmxAAC7sQAA/////72xAAC/sQAAwbEAAMOxAADFsQAAx7EAAMmxAADLsQAAzbEAAM+xAADRsQAA07EAAP//////////1bEAANexAADZsQAA///////////bsQAA3bEAAN+xAADhsQAA47EAAP/////lsQAA57EAAOmxAADrsQAA7bEAAP/////vsQAA8bEAAP////////////////OxAAD1sQAA//////////////////////exAAD5sQAA+7EAAP2xAAD/sQAAAbIAAAOyAAAFsgAAB7IAAAmyAAALsgAADbIAAA+yAAARsgAA/////xOyAAAVsgAAF7IAAP////////////////////8ZsgAAG7IAAB2yAAD/////////////////////H7IAACGyAAD/////I7IAACWyAAD/////J7IAAP//////////KbIAAP////////////////////////////////////////////////////////////////////8rsgAALbIAAP////8vsgAAMbIAADOyAAD/////NbIAADeyAAD/////ObIAADuyAAA9sgAAP7IAAEGyAABDsgAARbIAAEeyAABJsgAAS7IAAE2yAABPsgAAUbIAAFOyAAD/////VbIAAFeyAABZsgAAW7IAAF2yAAD/////////////////////////////////////X7IAAP///////////////2GyAABjsgAAZbIAAGeyAABpsgAA/////2uyAABtsgAAb7IAAHGyAAD///////////////9zsgAAdbIAAHeyAAB5sgAAe7IAAH2yAAB/sgAAgbIAAIOyAACFsgAAh7IAAImyAACLsgAAjbIAAI+yAACRsgAAk7IAAJWyAACXsgAAmbIAAJuyAACdsgAAn7IAAKGyAACjsgAApbIAAKeyAACpsgAAq7IAAK2yAAD/////r7IAALGyAACzsgAAtbIAALeyAAC5sgAA////////////////////////////////u7IAAP////+9sgAA//////////+/sgAAwbIAAP///////////////8OyAAD////////////////////////////////FsgAAx7IAAMmyAAD/////y7IAAM2yAADPsgAA0bIAAP/////TsgAA///////////VsgAA17IAANmyAADbsgAA///////////dsgAA37IAAP/////hsgAA47IAAOWyAAD/////57IAAOmyAADrsgAA7bIAAO+yAADxsgAA87IAAPWyAAD3sgAA+bIAAP/////7sgAA/bIAAP+yAAD/////AbMAAP////8DswAA/////wWzAAAHswAA//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8KswAADLMAAA6zAAAQswAAErMAABSzAAAWswAAGLMAABqzAAAcswAAHrMAACCzAAAiswAAJLMAACazAAAoswAAKrMAACyzAAAuswAAMLMAADKzAAA0swAANrMAADizAAA6swAAPLMAAD6zAABAswAAQrMAAP////9EswAARrMAAEizAABKswAATLMAAE6zAABQswAAUrMAAFSzAABWswAAWLMAAFqzAABcswAAXrMAAGCzAABiswAAZLMAAGazAABoswAAarMAAGyzAABuswAAcLMAAHKzAAB0swAAdrMAAHizAAD//////////3qzAAB8swAAfrMAAICzAACCswAAhLMAAP////+GswAAiLMAAIqzAACMswAAjrMAAJCzAACSswAAlLMAAJazAACYswAAmrMAAJyzAACeswAAoLMAAKKzAACkswAA/////6azAACoswAAqrMAAKyzAAD/////rrMAALCzAACyswAAtLMAALazAAC4swAAurMAALyzAAC+swAAwLMAAMKzAADEswAAxrMAAMizAADKswAAzLMAAM6zAADQswAA0rMAANSzAADWswAA2LMAANqzAADcswAA3rMAAP//////////4LMAAOKzAADkswAA5rMAAOizAADqswAA7LMAAO6zAADwswAA8rMAAP//////////9LMAAPazAAD4swAA+rMAAPyzAAD+swAAALQAAAK0AAD//////////wS0AAAGtAAACLQAAAq0AAAMtAAADrQAAP//////////ELQAABK0AAAUtAAAFrQAAP///////////////xi0AAAatAAAHLQAAP//////////HrQAACC0AAAitAAAJLQAACa0AAAotAAA/////yq0AAD/////LLQAAC60AAAwtAAAMrQAAP//////////NLQAADa0AAA4tAAAOrQAADy0AAA+tAAAQLQAAEK0AABEtAAARrQAAEi0AABKtAAATLQAAP////9OtAAA//////////9QtAAAUrQAAFS0AABWtAAAWLQAAP////9atAAA//////////9ctAAAXrQAAGC0AABitAAA//////////9ktAAAZrQAAGi0AABqtAAAbLQAAG60AABwtAAAcrQAAP////90tAAA/////3a0AAD/////eLQAAHq0AAB8tAAAfrQAAIC0AACCtAAAhLQAAIa0AACItAAAirQAAIy0AACOtAAAkLQAAJK0AACUtAAAlrQAAP//////////mLQAAJq0AACctAAAnrQAAKC0AACitAAApLQAAKa0AAD/////qLQAAP//////////qrQAAP///////////////6y0AACutAAA/////7C0AACytAAAtLQAAP////+2tAAAuLQAALq0AAD//////////7y0AAC+tAAAwLQAAMK0AADEtAAAxrQAAMi0AADKtAAA/////8y0AADOtAAA0LQAANK0AADUtAAA1rQAANi0AADatAAA/////////////////////9y0AADetAAA4LQAAOK0AADktAAA5rQAAOi0AAD//////////+q0AADstAAA7rQAAPC0AADytAAA9LQAAP//////////9rQAAPi0AAD6tAAA/LQAAP60AAAAtQAA////////////////////////////////ArUAAAS1AAAGtQAACLUAAP//////////CrUAAAy1AAAOtQAA/////////////////////xC1AAAStQAA////////////////FLUAABa1AAAYtQAAGrUAABy1AAAetQAA//////////8gtQAA/////yK1AAAktQAAJrUAACi1AAAqtQAA/////yy1AAAutQAAMLUAADK1AAA0tQAANrUAAP////////////////////84tQAAOrUAADy1AAA+tQAA/////////////////////0C1AABCtQAARLUAAEa1AABItQAASrUAAEy1AABOtQAAULUAAFK1AABUtQAA////////////////VrUAAFi1AABatQAAXLUAAF61AABgtQAAYrUAAGS1AABmtQAAaLUAAGq1AAD/////bLUAAG61AABwtQAA/////3K1AAB0tQAAdrUAAHi1AAB6tQAAfLUAAP////////////////////9+tQAAgLUAAIK1AACEtQAAhrUAAIi1AACKtQAAjLUAAI61AACQtQAA//////////+StQAA/////////////////////5S1AAD//////////////////////////5a1AACYtQAAmrUAAJy1AACetQAAoLUAAKK1AAD/////pLUAAKa1AACotQAAqrUAAKy1AACutQAAsLUAALK1AAC0tQAA/////////////////////7a1AAC4tQAA/////7q1AAC8tQAAvrUAAMC1AADCtQAAxLUAAMa1AADItQAAyrUAAMy1AADOtQAA0LUAANK1AADUtQAA1rUAAP//////////2LUAAP/////atQAA3LUAAN61AADgtQAA4rUAAP//////////5LUAAP/////mtQAA///////////otQAA6rUAAP/////stQAA7rUAAPC1AADytQAA9LUAAPa1AAD4tQAA+rUAAP///////////LUAAP///////////rUAAAC2AAACtgAABLYAAAa2AAAItgAA/////wq2AAAMtgAA/////w62AAD/////ELYAABK2AAD//////////xS2AAAWtgAA/////xi2AAD//////////xq2AAD//////////////////////////xy2AAD/////HrYAACC2AAAitgAAJLYAAP////8mtgAA//////////8otgAAKrYAACy2AAAutgAAMLYAADK2AAA0tgAANrYAAP////////////////////84tgAAOrYAADy2AAA+tgAAQLYAAP////9CtgAARLYAAP////9GtgAASLYAAP///////////////0q2AAD/////TLYAAE62AAD//////////////////////////////////////////1C2AAD//////////1K2AAD///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////9VtgAAV7YAAFm2AABbtgAA/////122AABftgAAYbYAAP////9jtgAA/////2W2AABntgAAabYAAGu2AABttgAAb7YAAHG2AABztgAAdbYAAHe2AAB5tgAAe7YAAH22AAB/tgAAgbYAAIO2AACFtgAAh7YAAIm2AACLtgAA/////422AAD///////////////+PtgAAkbYAAJO2AACVtgAAl7YAAJm2AACbtgAAnbYAAP////+ftgAAobYAAKO2AAD/////pbYAAKe2AACptgAAq7YAAK22AACvtgAA/////7G2AAD//////////7O2AAD/////tbYAALe2AAD/////ubYAALu2AAC9tgAAv7YAAMG2AAD/////w7YAAP/////FtgAA///////////HtgAAybYAAMu2AADNtgAAz7YAANG2AADTtgAA////////////////1bYAANe2AADZtgAA27YAAP///////////////////////////////922AADftgAA4bYAAOO2AADltgAA57YAAP///////////////+m2AADrtgAA/////+22AAD/////77YAAPG2AAD/////////////////////87YAAPW2AAD3tgAA+bYAAPu2AAD9tgAA/7YAAAG3AAADtwAABbcAAAe3AAAJtwAAC7cAAP////8NtwAA/////w+3AAARtwAAE7cAAP////8VtwAAF7cAABm3AAAbtwAA//////////8dtwAAH7cAACG3AAAjtwAA/////yW3AAD/////////////////////////////////////J7cAACm3AAArtwAALbcAAC+3AAAxtwAAM7cAADW3AAD/////N7cAADm3AAA7twAA/////z23AAA/twAA//////////9BtwAAQ7cAAEW3AABHtwAA//////////9JtwAA/////0u3AABNtwAAT7cAAP////9RtwAA/////1O3AABVtwAA//////////9XtwAAWbcAAP//////////W7cAAF23AABftwAAYbcAAP//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////ZLcAAGa3AABotwAAarcAAGy3AAButwAA/////3C3AABytwAAdLcAAHa3AAB4twAAercAAHy3AAB+twAA//////////+AtwAA////////////////grcAAIS3AACGtwAA/////4i3AACKtwAAjLcAAI63AACQtwAAkrcAAJS3AACWtwAAmLcAAJq3AAD/////nLcAAJ63AACgtwAAorcAAKS3AACmtwAAqLcAAKq3AACstwAA/////663AAD/////sLcAALK3AAC0twAA////////////////trcAAP////+4twAAurcAALy3AAC+twAAwLcAAMK3AADEtwAAxrcAAMi3AADKtwAAzLcAAP//////////zrcAANC3AADStwAA/////9S3AADWtwAA/////9i3AAD/////2rcAANy3AADetwAA4LcAAP//////////4rcAAP/////ktwAA5rcAAP///////////////+i3AADqtwAA7LcAAO63AADwtwAA8rcAAPS3AAD2twAA+LcAAPq3AAD//////////////////////LcAAP63AAAAuAAAArgAAAS4AAAGuAAACLgAAAq4AAAMuAAA/////w64AAAQuAAA/////xK4AAD//////////xS4AAD/////FrgAAP////////////////////8YuAAA//////////8auAAA/////xy4AAAeuAAAILgAACK4AAAkuAAAJrgAACi4AAAquAAALLgAAC64AAAwuAAAMrgAADS4AAA2uAAAOLgAADq4AAA8uAAAPrgAAEC4AABCuAAA/////0S4AAD/////RrgAAEi4AABKuAAATLgAAE64AAD///////////////9QuAAAUrgAAP////////////////////9UuAAAVrgAAFi4AABauAAAXLgAAP//////////////////////////XrgAAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////2G4AABjuAAAZbgAAGe4AABpuAAAa7gAAG24AABvuAAAcbgAAHO4AAB1uAAAd7gAAHm4AAB7uAAAfbgAAH+4AACBuAAAg7gAAIW4AACHuAAAibgAAIu4AACNuAAAj7gAAJG4AACTuAAAlbgAAJe4AACZuAAAm7gAAJ24AACfuAAAobgAAKO4AACluAAAp7gAAKm4AACruAAArbgAAK+4AACxuAAAs7gAALW4AAC3uAAAubgAALu4AAC9uAAAv7gAAMG4AAD/////w7gAAMW4AADHuAAAybgAAMu4AADNuAAAz7gAANG4AADTuAAA1bgAANe4AADZuAAA27gAAN24AAD//////////9+4AADhuAAA47gAAOW4AADnuAAA6bgAAOu4AAD/////7bgAAO+4AADxuAAA87gAAPW4AAD/////97gAAPm4AAD7uAAA/bgAAP+4AAABuQAAA7kAAAW5AAAHuQAACbkAAAu5AAANuQAAD7kAAP////////////////////8RuQAAE7kAAP////8VuQAA////////////////F7kAAP////8ZuQAAG7kAAB25AAAfuQAAIbkAACO5AAAluQAAJ7kAAP////8puQAAK7kAAC25AAAvuQAAMbkAADO5AAA1uQAAN7kAADm5AAA7uQAAPbkAAD+5AABBuQAAQ7kAAP///////////////////////////////0W5AABHuQAA//////////9JuQAAS7kAAP//////////TbkAAE+5AABRuQAAU7kAAFW5AABXuQAAWbkAAFu5AABduQAAX7kAAGG5AABjuQAA//////////9luQAAZ7kAAGm5AABruQAAbbkAAG+5AAD/////cbkAAHO5AAB1uQAAd7kAAHm5AAB7uQAAfbkAAH+5AACBuQAAg7kAAIW5AACHuQAA/////4m5AAD/////////////////////////////////////i7kAAI25AACPuQAAkbkAAJO5AACVuQAAl7kAAJm5AACbuQAAnbkAAP////////////////////+fuQAAobkAAKO5AACluQAA/////6e5AACpuQAAq7kAAK25AACvuQAAsbkAAP////+zuQAA/////7W5AAC3uQAAubkAALu5AAC9uQAAv7kAAMG5AADDuQAAxbkAAMe5AADJuQAAy7kAAP//////////zbkAAM+5AADRuQAA07kAAP/////VuQAA17kAANm5AAD//////////9u5AADduQAA/////9+5AAD//////////+G5AAD/////47kAAOW5AADnuQAA////////////////6bkAAOu5AADtuQAA77kAAP/////xuQAA87kAAPW5AAD3uQAA+bkAAPu5AAD////////////////9uQAA/7kAAAG6AAD/////A7oAAAW6AAD///////////////8HugAACboAAP////8LugAADboAAP//////////D7oAAP////8RugAAE7oAABW6AAAXugAA//////////8ZugAAG7oAAB26AAAfugAA/////////////////////yG6AAAjugAAJboAACe6AAApugAA/////yu6AAAtugAA//////////8vugAAMboAADO6AAA1ugAAN7oAADm6AAA7ugAAPboAAD+6AABBugAAQ7oAAEW6AABHugAASboAAP////9LugAA/////026AABPugAAUboAAFO6AABVugAAV7oAAP////9ZugAAW7oAAF26AABfugAAYboAAGO6AAD///////////////9lugAAZ7oAAGm6AABrugAAbboAAG+6AABxugAAc7oAAHW6AAB3ugAA/////3m6AAD/////e7oAAH26AAB/ugAAgboAAIO6AACFugAAh7oAAP////+JugAAi7oAAI26AACPugAAkboAAJO6AACVugAA/////////////////////5e6AAD//////////5m6AACbugAAnboAAJ+6AAChugAAo7oAAKW6AACnugAA/////////////////////6m6AACrugAArboAAP////////////////////+vugAAsboAALO6AAD/////tboAALe6AAC5ugAA/////7u6AAD//////////726AAC/ugAAwboAAMO6AAD/////xboAAP///////////////8e6AADJugAAy7oAAP//////////zboAAM+6AAD//////////9G6AAD//////////9O6AADVugAA17oAAP/////ZugAA27oAAN26AADfugAA4boAAOO6AAD/////5boAAOe6AADpugAA/////+u6AADtugAA///////////vugAA8boAAP/////zugAA///////////1ugAA///////////////////////////3ugAA+boAAP/////7ugAA/boAAP+6AAD/////////////////////AbsAAAO7AAD/////BbsAAAe7AAAJuwAAC7sAAA27AAAPuwAAEbsAABO7AAAVuwAAF7sAABm7AAAbuwAAHbsAAP//////////H7sAAP////8huwAAI7sAACW7AAAnuwAAKbsAACu7AAD///////////////8tuwAA/////y+7AAAxuwAAM7sAADW7AAD/////N7sAAP////////////////////85uwAAO7sAAP///////////////z27AAD/////P7sAAEG7AAD/////Q7sAAP////9FuwAAR7sAAP////9JuwAAS7sAAE27AABPuwAAUbsAAFO7AABVuwAA//////////9XuwAAWbsAAFu7AABduwAAX7sAAP////9huwAAY7sAAGW7AABnuwAAabsAAGu7AABtuwAAb7sAAHG7AAD///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////90uwAAdrsAAHi7AAB6uwAAfLsAAH67AACAuwAAgrsAAIS7AACGuwAAiLsAAIq7AACMuwAAjrsAAJC7AACSuwAAlLsAAJa7AACYuwAAmrsAAP////+cuwAAnrsAAKC7AACiuwAApLsAAKa7AACouwAAqrsAAKy7AACuuwAAsLsAALK7AAC0uwAAtrsAALi7AAC6uwAAvLsAAL67AADAuwAAwrsAAMS7AADGuwAAyLsAAMq7AADMuwAAzrsAANC7AADSuwAA1LsAANa7AADYuwAA2rsAANy7AADeuwAA/////+C7AADiuwAA5LsAAP//////////5rsAAOi7AADquwAA7LsAAO67AAD/////8LsAAPK7AAD0uwAA9rsAAPi7AAD6uwAA/LsAAP67AAAAvAAAArwAAAS8AAD/////BrwAAAi8AAAKvAAADLwAAA68AAD/////ELwAABK8AAAUvAAAFrwAABi8AAAavAAAHLwAAB68AAD/////ILwAACK8AAAkvAAAJrwAAP////8ovAAAKrwAACy8AAAuvAAAMLwAADK8AAA0vAAA/////za8AAA4vAAA//////////86vAAAPLwAAD68AABAvAAAQrwAAES8AABGvAAASLwAAEq8AABMvAAATrwAAFC8AABSvAAAVLwAAFa8AAD/////WLwAAFq8AABcvAAA/////////////////////168AABgvAAAYrwAAGS8AABmvAAAaLwAAGq8AAD/////bLwAAP////9uvAAA//////////9wvAAAcrwAAP////90vAAA//////////92vAAAeLwAAP//////////erwAAHy8AAB+vAAAgLwAAIK8AACEvAAAhrwAAIi8AACKvAAAjLwAAI68AACQvAAA//////////+SvAAA//////////////////////////////////////////+UvAAA/////5a8AACYvAAAmrwAAJy8AACevAAAoLwAAKK8AACkvAAAprwAAKi8AACqvAAArLwAAK68AACwvAAA/////7K8AAC0vAAAtrwAALi8AAD///////////////////////////////+6vAAAvLwAAL68AADAvAAAwrwAAP/////EvAAAxrwAAMi8AAD//////////8q8AAD//////////8y8AADOvAAA/////9C8AADSvAAA/////9S8AADWvAAA2LwAANq8AADcvAAA////////////////////////////////////////////////3rwAAOC8AADivAAA5LwAAOa8AADovAAA///////////qvAAA7LwAAP/////////////////////uvAAA8LwAAP////////////////////////////////K8AAD0vAAA//////a8AAD4vAAA//////q8AAD//////////////////////LwAAP///////////rwAAP////8AvQAAAr0AAAS9AAAGvQAACL0AAP////8KvQAA/////wy9AAD/////Dr0AAP///////////////xC9AAASvQAAFL0AABa9AAAYvQAAGr0AABy9AAAevQAAIL0AACK9AAAkvQAAJr0AACi9AAAqvQAALL0AAP////8uvQAA/////zC9AAAyvQAA/////zS9AAD/////////////////////Nr0AAP////84vQAA/////zq9AAA8vQAAPr0AAEC9AABCvQAARL0AAEa9AABIvQAASr0AAEy9AABOvQAAUL0AAFK9AAD/////VL0AAFa9AABYvQAAWr0AAFy9AAD/////Xr0AAP////9gvQAAYr0AAP////9kvQAA//////////9mvQAAaL0AAGq9AAD///////////////9svQAAbr0AAHC9AAD/////////////////////cr0AAHS9AAB2vQAAeL0AAHq9AAD/////fL0AAH69AAD/////gL0AAIK9AAD//////////////////////////////////////////4S9AAD/////////////////////////////////////////////////////////////////////hr0AAIi9AACKvQAAjL0AAP////+OvQAAkL0AAJK9AAD//////////5S9AACWvQAA/////5i9AACavQAA/////5y9AACevQAA////////////////oL0AAP////+ivQAApL0AAKa9AACovQAAqr0AAKy9AACuvQAAsL0AALK9AAC0vQAAtr0AALi9AAC6vQAAvL0AAL69AADAvQAAwr0AAMS9AADGvQAAyL0AAP///////////////8q9AADMvQAA/////869AADQvQAA/////////////////////////////////////9K9AADUvQAA1r0AANi9AADavQAA3L0AAN69AADgvQAA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////+O9AADlvQAA570AAOm9AADrvQAA7b0AAO+9AADxvQAA870AAPW9AAD3vQAA+b0AAPu9AAD9vQAA//////+9AAABvgAAA74AAAW+AAAHvgAACb4AAAu+AAANvgAAD74AABG+AAATvgAAFb4AAP////8XvgAAGb4AABu+AAAdvgAAH74AAP////8hvgAAI74AACW+AAAnvgAAKb4AACu+AAD///////////////8tvgAAL74AADG+AAAzvgAANb4AADe+AAA5vgAAO74AAD2+AAA/vgAAQb4AAP////9DvgAA/////0W+AABHvgAASb4AAEu+AABNvgAAT74AAP//////////Ub4AAFO+AABVvgAAV74AAFm+AABbvgAAXb4AAF++AABhvgAA/////2O+AABlvgAAZ74AAP////9pvgAAa74AAG2+AABvvgAAcb4AAP//////////c74AAP////91vgAA/////3e+AAB5vgAAe74AAP////////////////////99vgAAf74AAIG+AACDvgAAhb4AAIe+AACJvgAAi74AAI2+AACPvgAAkb4AAJO+AAD//////////5W+AACXvgAAmb4AAJu+AACdvgAAn74AAKG+AAD/////o74AAKW+AAD//////////6e+AACpvgAAq74AAK2+AAD//////////6++AACxvgAAs74AALW+AAC3vgAAub4AALu+AAC9vgAAv74AAMG+AADDvgAAxb4AAMe+AADJvgAAy74AAM2+AADPvgAA0b4AAP//////////074AANW+AADXvgAA2b4AANu+AADdvgAA374AAOG+AADjvgAA5b4AAOe+AADpvgAA674AAP/////tvgAA/////+++AADxvgAA//////////////////////O+AAD1vgAA974AAPm+AAD7vgAA//////2+AAD//////74AAAG/AAD//////////wO/AAD/////Bb8AAP////8HvwAACb8AAAu/AAD///////////////8NvwAAD78AAP////8RvwAAE78AABW/AAAXvwAAGb8AABu/AAAdvwAAH78AACG/AAD/////////////////////I78AAP///////////////yW/AAAnvwAAKb8AACu/AAD//////////y2/AAAvvwAAMb8AADO/AAA1vwAA/////ze/AAA5vwAA//////////87vwAAPb8AAD+/AABBvwAAQ78AAP////9FvwAAR78AAEm/AAD/////S78AAE2/AAD//////////0+/AABRvwAAU78AAFW/AABXvwAAWb8AAFu/AABdvwAAX78AAGG/AABjvwAAZb8AAGe/AABpvwAA/////2u/AAD/////////////////////bb8AAP////9vvwAAcb8AAHO/AAD/////db8AAP///////////////3e/AAD//////////3m/AAB7vwAAfb8AAH+/AACBvwAA/////////////////////4O/AAD//////////4W/AAD/////////////////////////////////////////////////////h78AAIm/AAD//////////4u/AACNvwAAj78AAJG/AAD/////k78AAP////+VvwAA/////5e/AACZvwAAm78AAP///////////////52/AACfvwAAob8AAP//////////o78AAKW/AAD///////////////+nvwAA/////////////////////6m/AACrvwAArb8AAK+/AAD//////////7G/AACzvwAAtb8AALe/AAC5vwAAu78AAL2/AAC/vwAAwb8AAP/////DvwAAxb8AAP/////HvwAAyb8AAMu/AAD////////////////NvwAA/////8+/AAD////////////////RvwAA078AANW/AADXvwAA2b8AANu/AADdvwAA378AAOG/AADjvwAA5b8AAOe/AAD/////6b8AAOu/AADtvwAA778AAPG/AADzvwAA9b8AAPe/AAD////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////6vwAA/L8AAP6/AAAAwAAAAsAAAATAAAAGwAAACMAAAArAAAAMwAAADsAAABDAAAASwAAAFMAAAP////8WwAAAGMAAABrAAAAcwAAAHsAAACDAAAAiwAAAJMAAACbAAAAowAAAKsAAACzAAAAuwAAAMMAAADLAAAA0wAAANsAAADjAAAD/////OsAAADzAAAA+wAAAQMAAAELAAABEwAAARsAAAEjAAABKwAAATMAAAE7AAABQwAAAUsAAAFTAAABWwAAAWMAAAFrAAABcwAAA/////17AAABgwAAA//////////9iwAAAZMAAAGbAAABowAAA//////////9qwAAAbMAAAP////9uwAAAcMAAAHLAAAB0wAAAdsAAAHjAAAB6wAAAfMAAAH7AAAD///////////////+AwAAAgsAAAITAAAD//////////4bAAACIwAAAisAAAIzAAACOwAAAkMAAAJLAAACUwAAAlsAAAP////////////////////+YwAAA//////////+awAAAnMAAAJ7AAACgwAAAosAAAKTAAACmwAAAqMAAAKrAAACswAAA//////////+uwAAAsMAAALLAAAC0wAAAtsAAALjAAAC6wAAAvMAAAP//////////vsAAAP/////AwAAAwsAAAMTAAADGwAAAyMAAAMrAAAD/////zMAAAM7AAAD/////0MAAANLAAAD////////////////////////////////UwAAA1sAAANjAAAD/////2sAAANzAAADewAAA4MAAAOLAAADkwAAA5sAAAOjAAADqwAAA/////+zAAADuwAAA///////////wwAAA//////LAAAD0wAAA//////bAAAD///////////jAAAD/////+sAAAP/////8wAAA//////7AAAAAwQAAAsEAAP////8EwQAABsEAAAjBAAAKwQAA//////////8MwQAADsEAAP///////////////xDBAAASwQAA////////////////FMEAAP//////////////////////////FsEAABjBAAAawQAAHMEAAP////8ewQAAIMEAACLBAAAkwQAAJsEAAP//////////KMEAAP////8qwQAALMEAAP////8uwQAAMMEAADLBAAD//////////zTBAAD/////NsEAADjBAAA6wQAA////////////////PMEAAP////8+wQAA/////0DBAABCwQAARMEAAEbBAABIwQAASsEAAEzBAABOwQAA//////////9QwQAAUsEAAFTBAABWwQAA/////////////////////1jBAABawQAAXMEAAF7BAABgwQAA/////2LBAAD///////////////9kwQAAZsEAAGjBAABqwQAAbMEAAG7BAABwwQAAcsEAAP////90wQAAdsEAAHjBAAB6wQAA/////3zBAAD///////////////////////////////////////////////9+wQAAgMEAAILBAAD/////hMEAAIbBAAD///////////////+IwQAAisEAAIzBAACOwQAA/////5DBAAD/////ksEAAJTBAAD/////lsEAAJjBAACawQAAnMEAAJ7BAACgwQAAosEAAKTBAAD/////psEAAKjBAAD//////////6rBAACswQAA//////////+uwQAA////////////////sMEAAP////+ywQAAtMEAALbBAAC4wQAAusEAALzBAAD/////vsEAAMDBAADCwQAAxMEAAMbBAADIwQAAysEAAMzBAADOwQAA0MEAANLBAADUwQAA1sEAAP/////YwQAA2sEAANzBAAD//////////97BAAD//////////+DBAADiwQAA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////w==",
+    "right": "AgAAAAQAAAAGAAAACAAAAAoAAAAMAAAADgAAABAAAAASAAAAFAAAABYAAAAYAAAAGgAAABwAAAAeAAAAIAAAACIAAAAkAAAAJgAAACgAAAAqAAAALAAAAC4AAAAwAAAAMgAAADQAAAA2AAAAOAAAAP////86AAAAPAAAAD4AAABAAAAAQgAAAEQAAAD/////RgAAAEgAAABKAAAATAAAAE4AAABQAAAAUgAAAFQAAAD/////VgAAAFgAAABaAAAAXAAAAF4AAABgAAAAYgAAAGQAAABmAAAAaAAAAGoAAAD/////bAAAAG4AAABwAAAAcgAAAHQAAAB2AAAAeAAAAHoAAAB8AAAAfgAAAIAAAACCAAAA//////////+EAAAA/////4YAAACIAAAAigAAAIwAAACOAAAAkAAAAJIAAACUAAAAlgAAAP////+YAAAAmgAAAJwAAACeAAAAoAAAAKIAAACkAAAApgAAAKgAAACqAAAArAAAAK4AAAD/////sAAAALIAAAC0AAAAtgAAALgAAAC6AAAA/////7wAAAC+AAAAwAAAAMIAAADEAAAAxgAAAMgAAADKAAAAzAAAAM4AAADQAAAA/////////////////////9IAAADUAAAA1gAAANgAAADaAAAA/////9wAAADeAAAA/////+AAAADiAAAA5AAAAP///////////////+YAAADoAAAA6gAAAOwAAADuAAAA//////AAAADyAAAA9AAAAPYAAAD4AAAA+gAAAPwAAAD+AAAAAAEAAAIBAAD//////////wQBAAAGAQAACAEAAP////8KAQAADAEAAA4BAAAQAQAAEgEAAP////8UAQAAFgEAABgBAAAaAQAAHAEAAB4BAAD//////////yABAAD/////IgEAACQBAAAmAQAAKAEAACoBAAAsAQAALgEAADABAAAyAQAA/////zQBAAD/////NgEAAP////84AQAAOgEAADwBAAA+AQAAQAEAAEIBAABEAQAARgEAAEgBAABKAQAATAEAAE4BAABQAQAAUgEAAP///////////////1QBAABWAQAA/////1gBAAD///////////////9aAQAAXAEAAF4BAAD/////YAEAAP////////////////////////////////////9iAQAAZAEAAGYBAABoAQAA//////////9qAQAAbAEAAP///////////////24BAABwAQAA////////////////cgEAAHQBAAB2AQAAeAEAAHoBAAB8AQAAfgEAAP////+AAQAAggEAAIQBAACGAQAAiAEAAIoBAACMAQAAjgEAAJABAACSAQAAlAEAAJYBAACYAQAA/////5oBAACcAQAAngEAAP////+gAQAAogEAAKQBAACmAQAAqAEAAKoBAAD/////////////////////rAEAAK4BAACwAQAAsgEAALQBAAC2AQAAuAEAALoBAAC8AQAAvgEAAMABAADCAQAAxAEAAMYBAAD//////////8gBAADKAQAAzAEAAM4BAADQAQAA0gEAANQBAADWAQAA2AEAANoBAADcAQAA3gEAAP/////gAQAA4gEAAP///////////////+QBAAD////////////////mAQAA6AEAAOoBAADsAQAA7gEAAPABAADyAQAA9AEAAPYBAAD4AQAA+gEAAP/////8AQAA/gEAAAACAAACAgAABAIAAAYCAAAIAgAACgIAAAwCAAD/////DgIAABACAAASAgAAFAIAABYCAAAYAgAA//////////8aAgAAHAIAAB4CAAAgAgAA/////yICAAD/////JAIAACYCAAAoAgAAKgIAAP////8sAgAA/////y4CAAAwAgAAMgIAADQCAAD/////NgIAADgCAAD//////////////////////////zoCAAA8AgAAPgIAAEACAABCAgAA/////0QCAAD/////RgIAAP////9IAgAASgIAAEwCAAD/////TgIAAFACAABSAgAAVAIAAFYCAABYAgAAWgIAAP////9cAgAAXgIAAGACAABiAgAAZAIAAGYCAABoAgAA////////////////agIAAGwCAABuAgAAcAIAAP////9yAgAA/////3QCAAB2AgAA/////3gCAAD///////////////96AgAAfAIAAP////////////////////9+AgAAgAIAAIICAACEAgAA//////////+GAgAAiAIAAIoCAACMAgAA//////////+OAgAAkAIAAJICAACUAgAAlgIAAJgCAACaAgAAnAIAAJ4CAAD/////oAIAAP////+iAgAApAIAAKYCAAD/////qAIAAKoCAACsAgAA////////////////rgIAALACAACyAgAAtAIAALYCAAC4AgAAugIAALwCAAD//////////74CAADAAgAAwgIAAMQCAADGAgAAyAIAAMoCAADMAgAA/////84CAAD//////////9ACAADSAgAA/////9QCAADWAgAA2AIAAP//////////2gIAAP/////cAgAA3gIAAP/////gAgAA/////////////////////+ICAADkAgAA5gIAAOgCAADqAgAA7AIAAP//////////7gIAAP/////wAgAA8gIAAPQCAAD2AgAA+AIAAPoCAAD8AgAA//////4CAAAAAwAAAgMAAAQDAAAGAwAACAMAAAoDAAD/////DAMAAA4DAAAQAwAAEgMAABQDAAD/////FgMAABgDAAAaAwAAHAMAAP//////////HgMAAP////8gAwAAIgMAACQDAAAmAwAAKAMAACoDAAAsAwAA/////y4DAAAwAwAAMgMAADQDAAD///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////83AwAAOQMAADsDAAA9AwAAPwMAAEEDAAD/////QwMAAEUDAABHAwAASQMAAEsDAABNAwAATwMAAFEDAABTAwAAVQMAAFcDAABZAwAAWwMAAF0DAAD/////XwMAAGEDAAD/////YwMAAGUDAABnAwAAaQMAAGsDAABtAwAAbwMAAHEDAABzAwAAdQMAAHcDAAB5AwAAewMAAP////99AwAAfwMAAP//////////gQMAAP////+DAwAAhQMAAIcDAACJAwAAiwMAAI0DAACPAwAAkQMAAJMDAACVAwAAlwMAAJkDAACbAwAAnQMAAJ8DAAChAwAAowMAAKUDAACnAwAAqQMAAKsDAACtAwAArwMAALEDAACzAwAA/////7UDAAC3AwAAuQMAALsDAAD//////////70DAAD/////vwMAAMEDAADDAwAAxQMAAMcDAADJAwAAywMAAM0DAAD/////zwMAANEDAADTAwAA1QMAANcDAADZAwAA2wMAAN0DAADfAwAA4QMAAOMDAADlAwAA5wMAAOkDAAD/////6wMAAP/////tAwAA7wMAAPEDAADzAwAA9QMAAPcDAAD5AwAA+wMAAP0DAAD/AwAAAQQAAAMEAAAFBAAABwQAAAkEAAALBAAADQQAAA8EAAARBAAA/////xMEAAAVBAAAFwQAABkEAAAbBAAAHQQAAB8EAAAhBAAAIwQAAP///////////////yUEAAD/////JwQAACkEAAArBAAALQQAAC8EAAAxBAAAMwQAADUEAAD//////////zcEAAD//////////zkEAAD///////////////87BAAA/////////////////////z0EAAD/////PwQAAEEEAABDBAAARQQAAEcEAABJBAAASwQAAE0EAABPBAAAUQQAAFMEAABVBAAAVwQAAFkEAABbBAAA/////10EAABfBAAA//////////9hBAAAYwQAAGUEAABnBAAAaQQAAGsEAAD/////bQQAAG8EAABxBAAAcwQAAHUEAAB3BAAAeQQAAHsEAAB9BAAAfwQAAIEEAACDBAAAhQQAAIcEAACJBAAAiwQAAI0EAACPBAAA/////5EEAAD/////kwQAAP///////////////5UEAACXBAAAmQQAAJsEAAD//////////50EAACfBAAA/////6EEAAD/////owQAAKUEAACnBAAAqQQAAKsEAAD//////////60EAACvBAAAsQQAALMEAAC1BAAAtwQAAP////+5BAAAuwQAAP////+9BAAAvwQAAMEEAADDBAAAxQQAAMcEAADJBAAAywQAAM0EAADPBAAA0QQAAP///////////////9MEAADVBAAA1wQAANkEAAD//////////9sEAAD/////3QQAAN8EAAD//////////+EEAADjBAAA5QQAAOcEAADpBAAA6wQAAO0EAADvBAAA8QQAAPMEAAD/////9QQAAPcEAAD5BAAA//////sEAAD9BAAA////////////BAAAAQUAAAMFAAAFBQAA/////wcFAAAJBQAACwUAAP///////////////w0FAAAPBQAAEQUAABMFAAAVBQAA/////xcFAAAZBQAAGwUAAB0FAAD/////HwUAAP//////////IQUAACMFAAAlBQAAJwUAACkFAAArBQAALQUAAC8FAAAxBQAAMwUAADUFAAA3BQAAOQUAADsFAAA9BQAA/////z8FAABBBQAAQwUAAEUFAABHBQAASQUAAEsFAABNBQAATwUAAFEFAABTBQAAVQUAAP//////////VwUAAFkFAAD/////////////////////WwUAAF0FAABfBQAA/////2EFAABjBQAAZQUAAGcFAABpBQAAawUAAG0FAABvBQAAcQUAAHMFAAD/////////////////////dQUAAHcFAAB5BQAA/////3sFAAB9BQAAfwUAAIEFAACDBQAAhQUAAIcFAACJBQAA////////////////iwUAAI0FAAD/////jwUAAJEFAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////5QFAACWBQAAmAUAAJoFAACcBQAAngUAAP////+gBQAAogUAAKQFAACmBQAAqAUAAP////+qBQAArAUAAK4FAACwBQAAsgUAALQFAAC2BQAAuAUAAP//////////ugUAALwFAAC+BQAAwAUAAMIFAADEBQAAxgUAAMgFAADKBQAAzAUAAM4FAADQBQAA0gUAAP/////UBQAA1gUAANgFAADaBQAA3AUAAN4FAADgBQAA4gUAAOQFAADmBQAA6AUAAOoFAADsBQAA7gUAAPAFAAD/////8gUAAPQFAAD2BQAA+AUAAPoFAAD8BQAA/gUAAAAGAAACBgAABAYAAAYGAAD/////CAYAAAoGAAAMBgAADgYAABAGAAD/////EgYAABQGAAAWBgAAGAYAABoGAAAcBgAA/////x4GAAAgBgAAIgYAACQGAAAmBgAAKAYAAP////8qBgAA/////ywGAAAuBgAAMAYAADIGAAA0BgAANgYAADgGAAA6BgAAPAYAAD4GAABABgAAQgYAAEQGAABGBgAASAYAAEoGAABMBgAATgYAAFAGAABSBgAAVAYAAFYGAABYBgAAWgYAAFwGAABeBgAAYAYAAP////9iBgAAZAYAAGYGAABoBgAA//////////9qBgAAbAYAAG4GAAD/////////////////////cAYAAP////9yBgAAdAYAAHYGAAB4BgAA/////3oGAAB8BgAAfgYAAIAGAAD/////ggYAAP////+EBgAAhgYAAIgGAAD/////igYAAP///////////////4wGAACOBgAAkAYAAJIGAACUBgAAlgYAAJgGAACaBgAAnAYAAJ4GAACgBgAAogYAAKQGAACmBgAAqAYAAKoGAAD/////rAYAAK4GAACwBgAAsgYAALQGAAC2BgAAuAYAALoGAAC8BgAAvgYAAMAGAADCBgAAxAYAAMYGAADIBgAAygYAAMwGAADOBgAA0AYAANIGAADUBgAA1gYAANgGAADaBgAA3AYAAN4GAADgBgAA4gYAAOQGAAD/////5gYAAOgGAAD//////////+oGAADsBgAA7gYAAPAGAAD///////////IGAAD0BgAA9gYAAPgGAAD6BgAA/AYAAP4GAAAABwAAAgcAAP///////////////wQHAAAGBwAA/////wgHAAAKBwAADAcAAA4HAAAQBwAAEgcAAP////8UBwAAFgcAABgHAAAaBwAAHAcAAP////8eBwAAIAcAACIHAAAkBwAA////////////////JgcAAP//////////KAcAAP//////////KgcAAP//////////LAcAAP////8uBwAAMAcAADIHAAD/////NAcAADYHAAA4BwAAOgcAADwHAAA+BwAAQAcAAEIHAABEBwAA/////0YHAABIBwAASgcAAP////9MBwAATgcAAFAHAABSBwAA//////////9UBwAA//////////9WBwAA/////1gHAABaBwAA/////1wHAABeBwAAYAcAAGIHAAD/////ZAcAAP////9mBwAAaAcAAGoHAAD/////bAcAAG4HAAD/////cAcAAHIHAAB0BwAAdgcAAHgHAAB6BwAAfAcAAH4HAACABwAAggcAAIQHAACGBwAAiAcAAIoHAACMBwAAjgcAAJAHAACSBwAAlAcAAJYHAACYBwAAmgcAAJwHAACeBwAAoAcAAKIHAACkBwAApgcAAKgHAACqBwAArAcAAK4HAACwBwAAsgcAAP///////////////7QHAAD//////////7YHAAC4BwAA//////////+6BwAAvAcAAL4HAADABwAAwgcAAMQHAADGBwAAyAcAAMoHAADMBwAAzgcAANAHAADSBwAA/////9QHAADWBwAA2AcAANoHAADcBwAA3gcAAOAHAADiBwAA5AcAAOYHAADoBwAA6gcAAOwHAADuBwAA//////AHAAD////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////zBwAA9QcAAPcHAAD5BwAA+wcAAP0HAAD//////wcAAAEIAAADCAAABQgAAAcIAAAJCAAACwgAAA0IAAAPCAAAEQgAABMIAAAVCAAAFwgAABkIAAD/////GwgAAP////8dCAAAHwgAACEIAAAjCAAAJQgAACcIAAApCAAAKwgAAC0IAAAvCAAAMQgAADMIAAA1CAAANwgAAP////85CAAAOwgAAP////////////////////89CAAAPwgAAEEIAABDCAAARQgAAEcIAABJCAAASwgAAE0IAABPCAAAUQgAAFMIAABVCAAAVwgAAP//////////WQgAAFsIAABdCAAAXwgAAGEIAABjCAAAZQgAAGcIAABpCAAAawgAAG0IAABvCAAAcQgAAHMIAAB1CAAAdwgAAHkIAAB7CAAAfQgAAH8IAACBCAAAgwgAAP////+FCAAA//////////+HCAAAiQgAAIsIAACNCAAAjwgAAJEIAACTCAAAlQgAAJcIAAD/////mQgAAJsIAACdCAAAnwgAAKEIAACjCAAApQgAAKcIAACpCAAAqwgAAK0IAACvCAAAsQgAALMIAAC1CAAAtwgAALkIAAC7CAAAvQgAAL8IAADBCAAA/////8MIAAD//////////8UIAADHCAAAyQgAAP//////////ywgAAM0IAADPCAAA0QgAANMIAAD/////////////////////1QgAANcIAADZCAAA2wgAAN0IAADfCAAA4QgAAP//////////4wgAAP/////lCAAA5wgAAOkIAADrCAAA/////+0IAADvCAAA8QgAAP/////zCAAA9QgAAPcIAAD/////+QgAAPsIAAD9CAAA////////////CAAAAQkAAAMJAAD/////BQkAAAcJAAAJCQAACwkAAA0JAAAPCQAAEQkAABMJAAD/////FQkAABcJAAAZCQAAGwkAAB0JAAAfCQAAIQkAACMJAAAlCQAAJwkAACkJAAArCQAALQkAAC8JAAAxCQAAMwkAADUJAAD/////NwkAAP//////////OQkAAP//////////OwkAAD0JAAA/CQAAQQkAAEMJAAD//////////0UJAABHCQAASQkAAP////9LCQAATQkAAE8JAABRCQAAUwkAAFUJAABXCQAAWQkAAFsJAAD/////XQkAAF8JAAD/////////////////////YQkAAP//////////YwkAAGUJAABnCQAA//////////9pCQAAawkAAG0JAAD//////////////////////////////////////////28JAABxCQAAcwkAAHUJAAD///////////////93CQAA//////////95CQAAewkAAH0JAAB/CQAAgQkAAP//////////gwkAAIUJAACHCQAAiQkAAP////+LCQAAjQkAAI8JAACRCQAAkwkAAJUJAACXCQAAmQkAAJsJAACdCQAAnwkAAKEJAACjCQAApQkAAKcJAAD//////////6kJAAD//////////6sJAACtCQAArwkAALEJAACzCQAAtQkAALcJAAC5CQAAuwkAAL0JAAC/CQAAwQkAAMMJAAD//////////8UJAADHCQAAyQkAAMsJAAD/////zQkAAM8JAADRCQAA0wkAANUJAADXCQAA2QkAANsJAADdCQAA3wkAAOEJAADjCQAA5QkAAOcJAADpCQAA/////+sJAAD/////7QkAAP//////////7wkAAPEJAADzCQAA9QkAAPcJAAD5CQAA+wkAAP0JAAD/CQAAAQoAAAMKAAAFCgAA//////////8HCgAACQoAAAsKAAANCgAA/////w8KAAARCgAAEwoAABUKAAD/////FwoAABkKAAAbCgAA/////x0KAAAfCgAAIQoAAP////8jCgAAJQoAAP//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////KAoAACoKAAAsCgAALgoAADAKAAAyCgAA/////zQKAAA2CgAAOAoAADoKAAD/////PAoAAD4KAABACgAAQgoAAEQKAABGCgAASAoAAEoKAABMCgAA//////////9OCgAAUAoAAFIKAABUCgAAVgoAAFgKAABaCgAAXAoAAF4KAABgCgAAYgoAAGQKAABmCgAA/////2gKAABqCgAAbAoAAG4KAABwCgAAcgoAAP////90CgAAdgoAAHgKAAB6CgAAfAoAAH4KAACACgAAggoAAIQKAAD/////hgoAAIgKAACKCgAAjAoAAI4KAACQCgAAkgoAAJQKAACWCgAAmAoAAJoKAACcCgAAngoAAKAKAACiCgAApAoAAKYKAACoCgAAqgoAAKwKAACuCgAAsAoAALIKAAD///////////////+0CgAAtgoAALgKAAC6CgAAvAoAAL4KAADACgAAwgoAAMQKAADGCgAAyAoAAMoKAADMCgAAzgoAANAKAAD//////////9IKAADUCgAA1goAANgKAADaCgAA/////9wKAADeCgAA4AoAAOIKAADkCgAA5goAAOgKAADqCgAA7AoAAO4KAADwCgAA///////////yCgAA9AoAAPYKAAD///////////gKAAD6CgAA/AoAAP4KAAAACwAAAgsAAP////8ECwAA/////wYLAAD/////CAsAAAoLAAAMCwAADgsAABALAAD///////////////8SCwAA/////xQLAAAWCwAA/////xgLAAAaCwAAHAsAAB4LAAAgCwAAIgsAACQLAAAmCwAAKAsAACoLAAAsCwAALgsAADALAAD/////MgsAADQLAAD/////NgsAADgLAAA6CwAAPAsAAD4LAABACwAAQgsAAEQLAABGCwAASAsAAEoLAABMCwAATgsAAFALAABSCwAAVAsAAFYLAABYCwAAWgsAAFwLAABeCwAAYAsAAGILAAD/////ZAsAAGYLAAD/////aAsAAGoLAABsCwAAbgsAAHALAAByCwAAdAsAAHYLAAB4CwAA////////////////egsAAHwLAAD//////////34LAACACwAAggsAAIQLAACGCwAA/////4gLAACKCwAAjAsAAI4LAACQCwAA/////5ILAACUCwAA/////5YLAACYCwAAmgsAAJwLAACeCwAAoAsAAKILAACkCwAApgsAAKgLAACqCwAArAsAAP////+uCwAAsAsAAP////+yCwAAtAsAAP////+2CwAAuAsAAP////+6CwAAvAsAAL4LAADACwAAwgsAAMQLAADGCwAA/////8gLAADKCwAAzAsAAM4LAADQCwAA0gsAANQLAADWCwAA2AsAANoLAADcCwAA3gsAAOALAADiCwAA5AsAAP//////////5gsAAOgLAADqCwAA/////+wLAADuCwAA8AsAAPILAAD/////9AsAAPYLAAD4CwAA+gsAAPwLAAD+CwAAAAwAAAIMAAD/////BAwAAP////8GDAAACAwAAAoMAAAMDAAADgwAABAMAAASDAAAFAwAABYMAAAYDAAAGgwAABwMAAD/////////////////////HgwAAP////8gDAAAIgwAACQMAAAmDAAAKAwAACoMAAAsDAAALgwAADAMAAD/////MgwAADQMAAA2DAAA////////////////OAwAAP////86DAAAPAwAAD4MAAD///////////////9ADAAAQgwAAEQMAABGDAAASAwAAEoMAABMDAAATgwAAP//////////UAwAAFIMAABUDAAAVgwAAFgMAABaDAAAXAwAAF4MAABgDAAAYgwAAGQMAABmDAAAaAwAAGoMAABsDAAAbgwAAHAMAAByDAAAdAwAAHYMAAD///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////95DAAAewwAAH0MAAB/DAAAgQwAAIMMAAD/////hQwAAIcMAACJDAAAiwwAAP//////////jQwAAI8MAACRDAAAkwwAAJUMAACXDAAAmQwAAJsMAACdDAAAnwwAAKEMAACjDAAApQwAAKcMAACpDAAAqwwAAK0MAACvDAAAsQwAALMMAAC1DAAAtwwAALkMAAD/////uwwAAL0MAAC/DAAAwQwAAMMMAADFDAAAxwwAAMkMAADLDAAAzQwAAM8MAADRDAAA0wwAANUMAAD//////////9cMAADZDAAA2wwAAN0MAADfDAAA4QwAAOMMAADlDAAA5wwAAOkMAADrDAAA7QwAAP//////////7wwAAP/////xDAAA8wwAAPUMAAD3DAAA+QwAAPsMAAD9DAAA/wwAAAENAAADDQAA/////////////////////wUNAAD/////Bw0AAAkNAAALDQAADQ0AAA8NAAARDQAAEw0AABUNAAAXDQAAGQ0AABsNAAAdDQAAHw0AACENAAAjDQAAJQ0AACcNAAApDQAAKw0AAP//////////LQ0AAC8NAAAxDQAAMw0AAP////81DQAANw0AADkNAAA7DQAAPQ0AAP////8/DQAA/////0ENAAD/////Qw0AAEUNAAD/////Rw0AAEkNAABLDQAATQ0AAE8NAABRDQAAUw0AAFUNAABXDQAAWQ0AAP////9bDQAAXQ0AAP////9fDQAAYQ0AAP////9jDQAAZQ0AAGcNAABpDQAAaw0AAG0NAABvDQAAcQ0AAHMNAAB1DQAAdw0AAHkNAAB7DQAA/////30NAAB/DQAAgQ0AAIMNAACFDQAAhw0AAIkNAACLDQAAjQ0AAI8NAACRDQAAkw0AAJUNAACXDQAAmQ0AAJsNAACdDQAAnw0AAKENAACjDQAApQ0AAKcNAACpDQAAqw0AAK0NAACvDQAA////////////////sQ0AAP////+zDQAA/////7UNAAC3DQAAuQ0AALsNAAC9DQAAvw0AAMENAAD//////////8MNAADFDQAAxw0AAMkNAAD////////////////LDQAA/////80NAADPDQAA0Q0AANMNAADVDQAA1w0AANkNAAD//////////9sNAADdDQAA/////98NAAD/////4Q0AAOMNAADlDQAA///////////////////////////nDQAA6Q0AAOsNAADtDQAA////////////////7w0AAPENAAD/////////////////////8w0AAPUNAAD3DQAA+Q0AAPsNAAD9DQAA/w0AAAEOAAADDgAA/////wUOAAAHDgAACQ4AAAsOAAANDgAADw4AABEOAAATDgAAFQ4AABcOAAAZDgAAGw4AAB0OAAAfDgAA//////////8hDgAAIw4AACUOAAAnDgAAKQ4AACsOAAD/////LQ4AAP//////////Lw4AADEOAAAzDgAANQ4AADcOAAA5DgAAOw4AAD0OAAA/DgAAQQ4AAEMOAABFDgAARw4AAEkOAABLDgAATQ4AAE8OAABRDgAAUw4AAFUOAABXDgAAWQ4AAFsOAABdDgAAXw4AAP////9hDgAAYw4AAGUOAABnDgAAaQ4AAGsOAAD//////////////////////////20OAAD//////////28OAAD/////cQ4AAP////9zDgAAdQ4AAP////93DgAAeQ4AAHsOAAB9DgAAfw4AAIEOAACDDgAAhQ4AAIcOAACJDgAAiw4AAI0OAACPDgAAkQ4AAJMOAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////lg4AAJgOAACaDgAAnA4AAJ4OAACgDgAA/////6IOAACkDgAApg4AAKgOAACqDgAA/////6wOAACuDgAAsA4AALIOAAC0DgAAtg4AALgOAAC6DgAA//////////+8DgAAvg4AAMAOAADCDgAAxA4AAMYOAADIDgAAyg4AAMwOAADODgAA0A4AANIOAADUDgAA1g4AAP//////////2A4AANoOAADcDgAA3g4AAOAOAADiDgAA///////////kDgAA5g4AAOgOAADqDgAA7A4AAO4OAADwDgAA8g4AAPQOAAD2DgAA+A4AAPoOAAD8DgAA/g4AAAAPAAACDwAABA8AAAYPAAD/////CA8AAAoPAAD/////DA8AAA4PAAAQDwAAEg8AABQPAAAWDwAAGA8AABoPAAAcDwAAHg8AACAPAAAiDwAAJA8AACYPAAAoDwAAKg8AACwPAAD/////Lg8AADAPAAD/////Mg8AADQPAAA2DwAAOA8AADoPAAA8DwAAPg8AAEAPAABCDwAARA8AAEYPAABIDwAASg8AAEwPAABODwAAUA8AAFIPAABUDwAAVg8AAP////9YDwAAWg8AAP////9cDwAAXg8AAP////9gDwAAYg8AAGQPAABmDwAAaA8AAGoPAABsDwAAbg8AAHAPAAByDwAAdA8AAHYPAAB4DwAAeg8AAP////98DwAAfg8AAP////+ADwAA/////4IPAAD/////hA8AAIYPAACIDwAAig8AAIwPAACODwAAkA8AAJIPAACUDwAAlg8AAJgPAACaDwAAnA8AAJ4PAACgDwAAog8AAP////+kDwAApg8AAKgPAACqDwAArA8AAK4PAACwDwAAsg8AALQPAAD///////////////+2DwAAuA8AALoPAAC8DwAAvg8AAMAPAADCDwAAxA8AAMYPAADIDwAAyg8AAMwPAADODwAA0A8AANIPAADUDwAA1g8AANgPAADaDwAA/////9wPAADeDwAA/////+APAADiDwAA5A8AAOYPAADoDwAA///////////qDwAA7A8AAO4PAADwDwAA8g8AAPQPAAD/////////////////////////////////////9g8AAPgPAAD/////+g8AAP/////8DwAA/g8AAAAQAAACEAAABBAAAAYQAAD//////////wgQAAD//////////////////////////woQAAAMEAAADhAAAP////8QEAAAEhAAABQQAAAWEAAAGBAAAP///////////////xoQAAAcEAAA//////////8eEAAAIBAAAP////8iEAAA/////yQQAAAmEAAA/////ygQAAAqEAAALBAAAC4QAAAwEAAAMhAAAP////80EAAANhAAADgQAAA6EAAAPBAAAD4QAAD//////////////////////////////////////////0AQAAD/////QhAAAEQQAABGEAAA/////0gQAABKEAAATBAAAP//////////ThAAAFAQAABSEAAAVBAAAFYQAABYEAAAWhAAAFwQAABeEAAAYBAAAP//////////YhAAAGQQAABmEAAAaBAAAGoQAAD/////bBAAAG4QAABwEAAAchAAAHQQAAD/////dhAAAHgQAAB6EAAAfBAAAH4QAACAEAAAghAAAIQQAACGEAAAiBAAAIoQAACMEAAA//////////+OEAAAkBAAAP//////////khAAAP////+UEAAA/////5YQAAD/////mBAAAJoQAACcEAAAnhAAAKAQAACiEAAApBAAAKYQAACoEAAAqhAAAKwQAACuEAAAsBAAALIQAAC0EAAAthAAALgQAAC6EAAAvBAAAL4QAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wRAAAMMQAADFEAAAxxAAAMkQAADLEAAA/////80QAADPEAAA0RAAANMQAADVEAAA/////9cQAADZEAAA2xAAAN0QAADfEAAA4RAAAOMQAADlEAAA///////////nEAAA6RAAAOsQAADtEAAA7xAAAPEQAADzEAAA9RAAAPcQAAD5EAAA+xAAAP0QAAD/EAAAAREAAAMRAAAFEQAABxEAAAkRAAALEQAA/////w0RAAAPEQAAEREAABMRAAAVEQAAFxEAABkRAAAbEQAAHREAAB8RAAAhEQAAIxEAACURAAAnEQAAKREAACsRAAAtEQAALxEAADERAAD/////MxEAADURAAA3EQAAOREAADsRAAA9EQAAPxEAAEERAABDEQAARREAAEcRAABJEQAASxEAAE0RAABPEQAAUREAAP//////////UxEAAFURAABXEQAAWREAAFsRAABdEQAAXxEAAGERAABjEQAAZREAAP//////////ZxEAAGkRAABrEQAAbREAAG8RAABxEQAAcxEAAHURAAB3EQAAeREAAHsRAAB9EQAAfxEAAIERAACDEQAAhREAAIcRAACJEQAAixEAAP////+NEQAAjxEAAJERAACTEQAA////////////////lREAAP//////////lxEAAJkRAACbEQAAnREAAJ8RAAChEQAAoxEAAP////+lEQAApxEAAKkRAACrEQAA//////////+tEQAArxEAALERAACzEQAA/////7URAAC3EQAAuREAALsRAAC9EQAAvxEAAMERAADDEQAA////////////////xREAAMcRAADJEQAAyxEAAM0RAADPEQAA0REAANMRAADVEQAA1xEAANkRAADbEQAA3REAAN8RAADhEQAA4xEAAOURAADnEQAA6REAAP//////////6xEAAO0RAADvEQAA8REAAPMRAAD1EQAA9xEAAPkRAAD7EQAA/REAAP8RAAABEgAAAxIAAAUSAAAHEgAACRIAAAsSAAANEgAADxIAABESAAATEgAAFRIAABcSAAAZEgAAGxIAAB0SAAAfEgAAIRIAAP////8jEgAAJRIAACcSAAApEgAAKxIAAC0SAAAvEgAAMRIAADMSAAA1EgAA//////////83EgAAORIAADsSAAA9EgAAPxIAAEESAABDEgAARRIAAEcSAAD/////SRIAAEsSAAD//////////00SAABPEgAAURIAAFMSAABVEgAAVxIAAFkSAABbEgAA//////////9dEgAAXxIAAP////9hEgAAYxIAAP//////////////////////////ZRIAAGcSAABpEgAAaxIAAG0SAABvEgAAcRIAAHMSAAB1EgAA////////////////dxIAAP////95EgAAexIAAH0SAAB/EgAAgRIAAIMSAACFEgAAhxIAAIkSAACLEgAAjRIAAI8SAAD/////kRIAAJMSAAD/////lRIAAJcSAACZEgAA/////5sSAACdEgAAnxIAAKESAACjEgAApRIAAKcSAAD/////qRIAAP////+rEgAArRIAAP//////////rxIAAP//////////sRIAALMSAAD///////////////+1EgAAtxIAAP////+5EgAAuxIAAL0SAAC/EgAAwRIAAMMSAAD/////xRIAAMcSAADJEgAAyxIAAP/////NEgAAzxIAAP///////////////9ESAADTEgAA1RIAANcSAADZEgAA2xIAAN0SAADfEgAA4RIAAOMSAADlEgAA5xIAAOkSAAD/////6xIAAO0SAADvEgAA8RIAAPMSAAD1EgAA9xIAAPkSAAD7EgAA/RIAAP8SAAABEwAA/////////////////////wMTAAD/////BRMAAAcTAAD///////////////8JEwAACxMAAA0TAAAPEwAAERMAABMTAAAVEwAAFxMAABkTAAAbEwAAHRMAAB8TAAAhEwAAIxMAAP////8lEwAAJxMAACkTAAArEwAALRMAAC8TAAAxEwAAMxMAAP////81EwAANxMAADkTAAA7EwAAPRMAAD8TAABBEwAAQxMAAEUTAABHEwAASRMAAP//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////TBMAAE4TAABQEwAAUhMAAFQTAABWEwAAWBMAAFoTAABcEwAAXhMAAGATAAD/////YhMAAGQTAAD/////ZhMAAGgTAABqEwAAbBMAAG4TAABwEwAAchMAAHQTAAD///////////////92EwAAeBMAAHoTAAB8EwAAfhMAAIATAACCEwAAhBMAAIYTAACIEwAAihMAAIwTAACOEwAAkBMAAJITAACUEwAA//////////+WEwAA/////5gTAACaEwAAnBMAAJ4TAACgEwAAohMAAKQTAACmEwAAqBMAAKoTAACsEwAArhMAALATAACyEwAAtBMAALYTAAC4EwAAuhMAALwTAAC+EwAAwBMAAMITAADEEwAAxhMAAMgTAADKEwAAzBMAAM4TAAD/////0BMAAP/////SEwAA1BMAANYTAADYEwAA2hMAANwTAADeEwAA4BMAAOITAAD/////5BMAAOYTAADoEwAA6hMAAOwTAADuEwAA8BMAAPITAAD0EwAA9hMAAPgTAAD6EwAA/BMAAP4TAAAAFAAAAhQAAAQUAAAGFAAACBQAAAoUAAAMFAAADhQAABAUAAASFAAAFBQAABYUAAAYFAAAGhQAAP//////////HBQAAB4UAAD/////IBQAACIUAAAkFAAAJhQAACgUAAAqFAAALBQAAC4UAAAwFAAAMhQAADQUAAD/////////////////////NhQAADgUAAA6FAAAPBQAAD4UAABAFAAAQhQAAEQUAABGFAAASBQAAEoUAABMFAAA/////04UAABQFAAAUhQAAFQUAABWFAAAWBQAAP////9aFAAA//////////9cFAAAXhQAAGAUAABiFAAAZBQAAGYUAABoFAAAahQAAGwUAABuFAAAcBQAAHIUAAB0FAAA/////3YUAAB4FAAAehQAAHwUAAB+FAAAgBQAAIIUAACEFAAAhhQAAP////+IFAAAihQAAP////+MFAAAjhQAAJAUAACSFAAAlBQAAP////+WFAAAmBQAAJoUAACcFAAA/////54UAACgFAAAohQAAKQUAACmFAAAqBQAAKoUAACsFAAArhQAALAUAACyFAAAtBQAALYUAAC4FAAA//////////+6FAAA/////7wUAAD/////vhQAAMAUAAD/////whQAAP/////EFAAAxhQAAMgUAADKFAAAzBQAAM4UAADQFAAA0hQAAP//////////1BQAAP/////WFAAA2BQAANoUAAD/////3BQAAN4UAADgFAAA4hQAAP/////kFAAA5hQAAOgUAADqFAAA7BQAAO4UAADwFAAA8hQAAPQUAAD2FAAA///////////4FAAA+hQAAPwUAAD///////////4UAAD/////ABUAAAIVAAAEFQAABhUAAP////////////////////8IFQAA/////woVAAAMFQAADhUAAP////8QFQAAEhUAABQVAAAWFQAAGBUAABoVAAD/////HBUAAB4VAAAgFQAAIhUAAP////8kFQAAJhUAACgVAAD/////KhUAACwVAAAuFQAAMBUAADIVAAA0FQAA/////zYVAAD//////////zgVAAA6FQAAPBUAAP//////////////////////////PhUAAEAVAABCFQAARBUAAEYVAAD/////SBUAAEoVAABMFQAA//////////9OFQAA//////////9QFQAAUhUAAFQVAABWFQAAWBUAAFoVAABcFQAA/////14VAABgFQAAYhUAAGQVAABmFQAAaBUAAGoVAABsFQAAbhUAAHAVAAByFQAAdBUAAHYVAAD/////eBUAAHoVAAB8FQAA/////34VAACAFQAAghUAAIQVAACGFQAAiBUAAIoVAAD/////jBUAAI4VAACQFQAAkhUAAJQVAACWFQAAmBUAAJoVAAD//////////5wVAAD///////////////////////////////+eFQAA/////6AVAACiFQAApBUAAKYVAACoFQAAqhUAAP////+sFQAArhUAALAVAACyFQAAtBUAALYVAAC4FQAAuhUAALwVAAC+FQAA/////8AVAADCFQAAxBUAAMYVAADIFQAA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////yxUAAM0VAADPFQAA0RUAANMVAADVFQAA1xUAANkVAADbFQAA3RUAAN8VAADhFQAA4xUAAOUVAADnFQAA6RUAAOsVAADtFQAA7xUAAPEVAADzFQAA9RUAAPcVAAD5FQAA+xUAAP0VAAD/FQAAARYAAAMWAAAFFgAABxYAAAkWAAALFgAADRYAAA8WAAARFgAAExYAABUWAAAXFgAAGRYAABsWAAAdFgAAHxYAACEWAAAjFgAA//////////8lFgAAJxYAACkWAAArFgAALRYAAC8WAAAxFgAAMxYAADUWAAA3FgAAORYAADsWAAA9FgAAPxYAAEEWAABDFgAA////////////////RRYAAEcWAABJFgAASxYAAE0WAABPFgAAURYAAFMWAABVFgAAVxYAAFkWAABbFgAAXRYAAF8WAABhFgAAYxYAAGUWAABnFgAAaRYAAP////9rFgAAbRYAAG8WAABxFgAAcxYAAHUWAAB3FgAAeRYAAHsWAAB9FgAAfxYAAIEWAACDFgAA/////4UWAACHFgAAiRYAAIsWAACNFgAAjxYAAJEWAACTFgAA/////5UWAACXFgAAmRYAAJsWAACdFgAAnxYAAKEWAACjFgAApRYAAKcWAAD/////qRYAAKsWAACtFgAArxYAAP////+xFgAAsxYAALUWAAC3FgAAuRYAALsWAAC9FgAAvxYAAMEWAADDFgAAxRYAAMcWAADJFgAAyxYAAM0WAADPFgAA0RYAANMWAADVFgAA1xYAANkWAADbFgAA3RYAAN8WAADhFgAA4xYAAOUWAAD/////5xYAAOkWAAD/////6xYAAO0WAADvFgAA8RYAAPMWAAD1FgAA9xYAAPkWAAD7FgAA/RYAAP8WAAABFwAAAxcAAAUXAAAHFwAACRcAAAsXAAANFwAADxcAABEXAAATFwAAFRcAABcXAAAZFwAAGxcAAB0XAAAfFwAAIRcAACMXAAAlFwAAJxcAAP//////////KRcAACsXAAAtFwAALxcAAP////8xFwAAMxcAAP//////////NRcAAP///////////////zcXAAA5FwAAOxcAAP//////////PRcAAP///////////////z8XAABBFwAA/////0MXAABFFwAARxcAAEkXAABLFwAATRcAAE8XAABRFwAAUxcAAP////9VFwAAVxcAAP////9ZFwAAWxcAAF0XAABfFwAAYRcAAP////9jFwAAZRcAAP///////////////2cXAABpFwAAaxcAAG0XAABvFwAAcRcAAHMXAAB1FwAAdxcAAHkXAAB7FwAAfRcAAH8XAACBFwAA/////4MXAAD/////hRcAAIcXAACJFwAAixcAAI0XAACPFwAA/////5EXAAD/////////////////////kxcAAP///////////////5UXAAD//////////5cXAAD/////mRcAAP//////////mxcAAJ0XAACfFwAAoRcAAKMXAAClFwAApxcAAKkXAACrFwAArRcAAK8XAACxFwAAsxcAALUXAAC3FwAAuRcAAP///////////////7sXAAC9FwAAvxcAAP//////////wRcAAMMXAADFFwAA/////8cXAADJFwAAyxcAAM0XAADPFwAA0RcAANMXAADVFwAA1xcAANkXAAD/////2xcAAN0XAADfFwAA4RcAAOMXAADlFwAA5xcAAOkXAADrFwAA7RcAAO8XAADxFwAA8xcAAPUXAAD3FwAA+RcAAPsXAAD9FwAA/xcAAAEYAAADGAAABRgAAAcYAAAJGAAACxgAAA0YAAAPGAAAERgAABMYAAD///////////////8VGAAA/////xcYAAD//////////xkYAAAbGAAA/////////////////////x0YAAAfGAAA//////////8hGAAA/////yMYAAAlGAAAJxgAAP////8pGAAAKxgAAC0YAAD/////LxgAADEYAAAzGAAANRgAADcYAAA5GAAA/////zsYAAA9GAAAPxgAAEEYAABDGAAARRgAAEcYAABJGAAASxgAAE0YAABPGAAAURgAAFMYAABVGAAA/////////////////////1cYAAD/////WRgAAFsYAAD/////////////////////XRgAAF8YAAD/////YRgAAGMYAAD/////////////////////ZRgAAP////9nGAAAaRgAAGsYAABtGAAAbxgAAHEYAAD/////cxgAAHUYAAB3GAAAeRgAAHsYAAB9GAAAfxgAAIEYAACDGAAAhRgAAIcYAACJGAAAixgAAI0YAACPGAAAkRgAAJMYAAD/////lRgAAJcYAAD/////mRgAAJsYAACdGAAAnxgAAKEYAACjGAAApRgAAKcYAAD/////qRgAAKsYAAD/////rRgAAP////////////////////+vGAAAsRgAALMYAAC1GAAA//////////+3GAAA/////////////////////7kYAAD/////uxgAAP////+9GAAAvxgAAP//////////////////////////wRgAAP/////DGAAAxRgAAMcYAADJGAAAyxgAAM0YAADPGAAA0RgAANMYAAD//////////9UYAADXGAAA///////////ZGAAA2xgAAN0YAADfGAAA///////////hGAAA4xgAAOUYAADnGAAA6RgAAOsYAADtGAAA7xgAAPEYAADzGAAA9RgAAPcYAAD5GAAA+xgAAP0YAAD/GAAAARkAAAMZAAD//////////wUZAAAHGQAACRkAAAsZAAANGQAADxkAABEZAAATGQAAFRkAABcZAAAZGQAAGxkAAP////8dGQAAHxkAACEZAAAjGQAAJRkAACcZAAApGQAAKxkAAC0ZAAAvGQAAMRkAADMZAAA1GQAANxkAADkZAAA7GQAA/////z0ZAAA/GQAAQRkAAEMZAABFGQAARxkAAEkZAAD/////SxkAAE0ZAABPGQAAURkAAFMZAABVGQAAVxkAAFkZAABbGQAAXRkAAF8ZAABhGQAAYxkAAGUZAABnGQAAaRkAAGsZAABtGQAAbxkAAHEZAAD/////cxkAAHUZAAB3GQAAeRkAAHsZAAB9GQAAfxkAAP////+BGQAA//////////+DGQAA/////4UZAAD/////hxkAAP////+JGQAA//////////+LGQAA//////////+NGQAAjxkAAP///////////////5EZAAD//////////////////////////5MZAACVGQAA////////////////lxkAAJkZAAD//////////5sZAAD/////nRkAAJ8ZAAD//////////6EZAACjGQAApRkAAKcZAAD//////////6kZAACrGQAArRkAAK8ZAACxGQAA////////////////////////////////sxkAAP////+1GQAA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////uBkAALoZAAC8GQAAvhkAAMAZAADCGQAAxBkAAMYZAADIGQAAyhkAAMwZAADOGQAA0BkAAP//////////0hkAANQZAADWGQAA2BkAANoZAADcGQAA3hkAAOAZAAD////////////////iGQAA5BkAAOYZAADoGQAA6hkAAOwZAADuGQAA8BkAAPIZAAD0GQAA9hkAAPgZAAD6GQAA/BkAAP4ZAAAAGgAAAhoAAP//////////BBoAAAYaAAAIGgAAChoAAAwaAAAOGgAAEBoAABIaAAAUGgAAFhoAABgaAAAaGgAAHBoAAB4aAAAgGgAAIhoAACQaAAAmGgAA/////ygaAAAqGgAALBoAAC4aAAAwGgAAMhoAADQaAAA2GgAA//////////84GgAA/////zoaAAD/////PBoAAD4aAABAGgAAQhoAAEQaAABGGgAASBoAAEoaAAD///////////////9MGgAAThoAAFAaAAD/////UhoAAFQaAABWGgAAWBoAAFoaAABcGgAA//////////9eGgAAYBoAAGIaAAD/////ZBoAAGYaAABoGgAAahoAAGwaAABuGgAAcBoAAHIaAAB0GgAA/////3YaAAD/////eBoAAHoaAAB8GgAA/////34aAACAGgAAghoAAIQaAACGGgAAiBoAAIoaAAD//////////////////////////4waAACOGgAAkBoAAJIaAACUGgAAlhoAAJgaAACaGgAAnBoAAJ4aAAD///////////////+gGgAAohoAAKQaAACmGgAAqBoAAKoaAACsGgAA//////////+uGgAAsBoAALIaAAD/////tBoAALYaAAC4GgAAuhoAALwaAAC+GgAAwBoAAMIaAAD/////xBoAAMYaAADIGgAAyhoAAMwaAADOGgAA0BoAAP/////SGgAA1BoAAP/////WGgAA2BoAANoaAADcGgAA3hoAAOAaAADiGgAA5BoAAOYaAADoGgAA6hoAAP///////////////////////////////+waAAD/////////////////////7hoAAP/////wGgAA8hoAAPQaAAD2GgAA+BoAAPoaAAD8GgAA/hoAAP////8AGwAAAhsAAP////8EGwAABhsAAAgbAAD///////////////8KGwAA/////wwbAAAOGwAAEBsAABIbAAAUGwAAFhsAABgbAAD/////GhsAABwbAAD/////HhsAACAbAAAiGwAAJBsAAP////8mGwAAKBsAAP////8qGwAA/////ywbAAAuGwAAMBsAADIbAAA0GwAANhsAAP//////////OBsAADobAAA8GwAAPhsAAEAbAAD///////////////9CGwAARBsAAEYbAABIGwAA/////0obAABMGwAAThsAAFAbAABSGwAAVBsAAFYbAABYGwAAWhsAAFwbAABeGwAA/////2AbAABiGwAA/////2QbAAD/////ZhsAAP////9oGwAAahsAAGwbAABuGwAA/////3AbAAByGwAAdBsAAHYbAAB4GwAAehsAAHwbAAB+GwAAgBsAAIIbAACEGwAAhhsAAIgbAACKGwAAjBsAAI4bAACQGwAAkhsAAJQbAACWGwAAmBsAAJobAACcGwAA/////54bAACgGwAAohsAAKQbAACmGwAAqBsAAKobAACsGwAArhsAALAbAACyGwAAtBsAALYbAAC4GwAAuhsAALwbAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////vxsAAMEbAADDGwAAxRsAAMcbAADJGwAAyxsAAM0bAADPGwAA0RsAANMbAADVGwAA1xsAANkbAADbGwAA3RsAAN8bAADhGwAA4xsAAOUbAADnGwAA///////////pGwAA6xsAAO0bAADvGwAA8RsAAPMbAAD1GwAA9xsAAPkbAAD7GwAA/RsAAP8bAAABHAAAAxwAAAUcAAAHHAAACRwAAAscAAANHAAADxwAABEcAAATHAAAFRwAAP////8XHAAAGRwAABscAAAdHAAAHxwAAP////8hHAAA/////yMcAAAlHAAAJxwAACkcAAArHAAA/////y0cAAAvHAAAMRwAADMcAAA1HAAANxwAADkcAAA7HAAAPRwAAD8cAABBHAAA/////0McAABFHAAARxwAAEkcAABLHAAATRwAAE8cAAD/////URwAAFMcAABVHAAAVxwAAFkcAABbHAAAXRwAAP////9fHAAAYRwAAGMcAABlHAAAZxwAAGkcAAD/////axwAAG0cAABvHAAA/////3EcAABzHAAAdRwAAHccAAB5HAAA/////////////////////3scAAB9HAAAfxwAAIEcAACDHAAA/////4UcAACHHAAAiRwAAIscAACNHAAAjxwAAJEcAACTHAAAlRwAAJccAAD//////////5kcAACbHAAAnRwAAJ8cAAChHAAA//////////+jHAAA/////6UcAACnHAAAqRwAAKscAACtHAAArxwAAP////+xHAAAsxwAALUcAAC3HAAAuRwAALscAAC9HAAAvxwAAMEcAADDHAAAxRwAAMccAADJHAAAyxwAAP/////NHAAAzxwAANEcAADTHAAA1RwAANccAAD/////2RwAANscAADdHAAA/////98cAADhHAAA4xwAAOUcAAD/////5xwAAOkcAADrHAAA/////+0cAAD//////////+8cAADxHAAA8xwAAPUcAAD3HAAA//////kcAAD7HAAA//////0cAAD///////////8cAAABHQAA/////wMdAAD///////////////8FHQAABx0AAAkdAAALHQAADR0AAA8dAAARHQAAEx0AABUdAAAXHQAA/////xkdAAAbHQAA/////x0dAAAfHQAAIR0AACMdAAAlHQAA/////ycdAAApHQAAKx0AAC0dAAAvHQAAMR0AADMdAAD//////////zUdAAA3HQAAOR0AAP////87HQAAPR0AAD8dAABBHQAAQx0AAEUdAABHHQAASR0AAP//////////Sx0AAE0dAABPHQAAUR0AAFMdAABVHQAAVx0AAFkdAABbHQAAXR0AAF8dAABhHQAAYx0AAGUdAABnHQAAaR0AAGsdAABtHQAA//////////9vHQAAcR0AAHMdAAB1HQAAdx0AAHkdAAB7HQAAfR0AAP//////////fx0AAP///////////////4EdAAD/////gx0AAP///////////////4UdAACHHQAAiR0AAP///////////////4sdAACNHQAAjx0AAJEdAACTHQAAlR0AAJcdAACZHQAA/////5sdAACdHQAAnx0AAKEdAACjHQAApR0AAP////+nHQAAqR0AAKsdAACtHQAArx0AALEdAACzHQAAtR0AALcdAAC5HQAAux0AAL0dAAD/////vx0AAP//////////wR0AAP/////DHQAA/////8UdAADHHQAA///////////JHQAAyx0AAP/////////////////////NHQAAzx0AANEdAADTHQAA1R0AANcdAADZHQAA/////9sdAAD/////3R0AAP/////fHQAA4R0AAP/////jHQAA5R0AAOcdAAD/////6R0AAOsdAADtHQAA7x0AAPEdAADzHQAA9R0AAP//////////9x0AAPkdAAD7HQAA//////0dAAD//////x0AAAEeAAADHgAABR4AAAceAAAJHgAACx4AAA0eAAD//////////w8eAAD/////ER4AABMeAAAVHgAAFx4AABkeAAAbHgAAHR4AAB8eAAAhHgAAIx4AAP//////////JR4AACceAAApHgAAKx4AAC0eAAAvHgAA//////////8xHgAA//////////8zHgAANR4AADceAAD/////OR4AAP////87HgAA/////z0eAAD///////////////8/HgAAQR4AAP///////////////0MeAABFHgAA//////////9HHgAASR4AAEseAABNHgAATx4AAFEeAABTHgAAVR4AAFceAAD/////WR4AAFseAABdHgAAXx4AAGEeAABjHgAAZR4AAGceAABpHgAAax4AAG0eAABvHgAAcR4AAHMeAAB1HgAAdx4AAP////95HgAA//////////97HgAA//////////99HgAAfx4AAIEeAACDHgAA//////////+FHgAAhx4AAP////+JHgAAix4AAI0eAACPHgAAkR4AAJMeAACVHgAA/////5ceAAD/////mR4AAJseAACdHgAAnx4AAKEeAACjHgAApR4AAKceAACpHgAAqx4AAP//////////rR4AAK8eAACxHgAAsx4AALUeAAC3HgAAuR4AALseAAC9HgAAvx4AAMEeAADDHgAAxR4AAMceAADJHgAAyx4AAM0eAADPHgAA/////9EeAADTHgAA1R4AANceAADZHgAA2x4AAN0eAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////4B4AAOIeAADkHgAA5h4AAOgeAADqHgAA7B4AAO4eAADwHgAA8h4AAPQeAAD2HgAA//////geAAD/////+h4AAPweAAD+HgAAAB8AAAIfAAAEHwAABh8AAAgfAAD/////Ch8AAP//////////DB8AAA4fAAAQHwAAEh8AABQfAAAWHwAAGB8AABofAAAcHwAAHh8AACAfAAAiHwAAJB8AACYfAAAoHwAAKh8AAP//////////LB8AAP////8uHwAAMB8AADIfAAA0HwAANh8AAP////84HwAAOh8AADwfAAA+HwAAQB8AAEIfAAD/////RB8AAEYfAABIHwAASh8AAEwfAABOHwAAUB8AAFIfAABUHwAAVh8AAFgfAABaHwAA//////////9cHwAA//////////9eHwAAYB8AAGIfAAD/////ZB8AAGYfAABoHwAAah8AAGwfAABuHwAA//////////9wHwAAch8AAHQfAAB2HwAAeB8AAHofAAB8HwAAfh8AAP////////////////////+AHwAA/////4IfAACEHwAAhh8AAIgfAACKHwAAjB8AAP////+OHwAA//////////+QHwAAkh8AAJQfAAD/////lh8AAJgfAACaHwAAnB8AAJ4fAACgHwAAoh8AAP////////////////////+kHwAAph8AAKgfAACqHwAArB8AAK4fAACwHwAAsh8AALQfAAC2HwAAuB8AAP//////////uh8AALwfAAC+HwAA/////8AfAADCHwAAxB8AAMYfAADIHwAAyh8AAMwfAADOHwAA0B8AANIfAADUHwAA1h8AANgfAADaHwAA3B8AAP///////////////94fAADgHwAA///////////iHwAA5B8AAOYfAADoHwAA6h8AAOwfAADuHwAA8B8AAPIfAAD0HwAA9h8AAP/////4HwAA+h8AAP////////////////wfAAD+HwAA/////wAgAAACIAAABCAAAAYgAAAIIAAACiAAAAwgAAAOIAAA/////xAgAAD//////////xIgAAAUIAAAFiAAABggAAAaIAAAHCAAAB4gAAAgIAAAIiAAACQgAAD//////////yYgAAAoIAAA//////////8qIAAA/////ywgAAAuIAAAMCAAAP////8yIAAA/////zQgAAD/////NiAAADggAAD/////OiAAADwgAAA+IAAAQCAAAEIgAABEIAAARiAAAEggAABKIAAATCAAAE4gAABQIAAAUiAAAFQgAABWIAAA/////1ggAABaIAAAXCAAAF4gAABgIAAAYiAAAGQgAABmIAAAaCAAAGogAAD/////bCAAAG4gAABwIAAAciAAAHQgAAB2IAAAeCAAAHogAAB8IAAA////////////////fiAAAIAgAACCIAAAhCAAAIYgAACIIAAAiiAAAP///////////////////////////////////////////////4wgAAD/////////////////////jiAAAJAgAACSIAAAlCAAAJYgAACYIAAAmiAAAJwgAACeIAAAoCAAAKIgAACkIAAApiAAAP////+oIAAAqiAAAKwgAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////68gAACxIAAAsyAAALUgAAC3IAAAuSAAAP////+7IAAAvSAAAL8gAADBIAAA/////8MgAADFIAAAxyAAAMkgAADLIAAAzSAAAM8gAADRIAAA0yAAANUgAAD/////1yAAANkgAADbIAAA3SAAAN8gAADhIAAA/////+MgAADlIAAA5yAAAOkgAADrIAAA7SAAAO8gAAD/////8SAAAPMgAAD/////9SAAAPcgAAD5IAAA+yAAAP0gAAD/IAAA/////wEhAAADIQAABSEAAAchAAAJIQAACyEAAP////8NIQAADyEAAP////8RIQAAEyEAABUhAAAXIQAAGSEAABshAAD/////HSEAAP//////////////////////////HyEAACEhAAAjIQAAJSEAACchAAApIQAAKyEAAC0hAAAvIQAAMSEAADMhAAA1IQAANyEAAP////85IQAAOyEAAD0hAAA/IQAAQSEAAEMhAABFIQAARyEAAP////9JIQAASyEAAE0hAABPIQAAUSEAAFMhAAD/////////////////////VSEAAFchAAD/////WSEAAFshAABdIQAAXyEAAGEhAAD/////YyEAAGUhAABnIQAAaSEAAGshAABtIQAAbyEAAHEhAABzIQAAdSEAAHchAAB5IQAAeyEAAH0hAAD//////////38hAACBIQAAgyEAAIUhAACHIQAAiSEAAIshAACNIQAA/////48hAACRIQAAkyEAAJUhAACXIQAAmSEAAP////+bIQAAnSEAAJ8hAAChIQAAoyEAAKUhAACnIQAAqSEAAKshAAD///////////////+tIQAAryEAALEhAACzIQAAtSEAALchAAC5IQAAuyEAAL0hAAD//////////78hAAD//////////8EhAAD/////wyEAAMUhAADHIQAAySEAAMshAADNIQAAzyEAANEhAADTIQAA1SEAANchAADZIQAA2yEAAN0hAADfIQAA4SEAAOMhAADlIQAA5yEAAP/////pIQAA/////+shAAD/////7SEAAO8hAADxIQAA8yEAAPUhAAD3IQAA+SEAAPshAAD9IQAA////////////IQAAASIAAAMiAAAFIgAAByIAAAkiAAALIgAA//////////8NIgAADyIAABEiAAATIgAAFSIAABciAAD/////GSIAAP//////////GyIAAP////8dIgAA/////x8iAAAhIgAAIyIAACUiAAAnIgAAKSIAACsiAAD/////LSIAAC8iAAAxIgAA/////zMiAAA1IgAANyIAADkiAAD/////OyIAAD0iAAD//////////z8iAABBIgAAQyIAAEUiAABHIgAASSIAAEsiAABNIgAATyIAAP////9RIgAAUyIAAFUiAABXIgAAWSIAAFsiAABdIgAAXyIAAGEiAAD//////////2MiAAD/////////////////////////////////////ZSIAAGciAABpIgAAayIAAG0iAABvIgAAcSIAAHMiAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////diIAAHgiAAB6IgAAfCIAAH4iAACAIgAAgiIAAIQiAACGIgAAiCIAAIoiAACMIgAAjiIAAJAiAAD/////kiIAAJQiAACWIgAAmCIAAJoiAACcIgAAniIAAKAiAAD///////////////////////////////+iIgAApCIAAKYiAACoIgAAqiIAAKwiAAD/////riIAALAiAACyIgAAtCIAALYiAAC4IgAA/////7oiAAC8IgAAviIAAMAiAADCIgAAxCIAAMYiAADIIgAAyiIAAMwiAADOIgAA0CIAAP//////////0iIAANQiAADWIgAA2CIAAP/////aIgAA3CIAAN4iAADgIgAA4iIAAOQiAADmIgAA6CIAAOoiAADsIgAA7iIAAPAiAADyIgAA9CIAAPYiAAD4IgAA+iIAAP///////////CIAAP4iAAAAIwAAAiMAAAQjAAAGIwAACCMAAAojAAAMIwAADiMAAP//////////ECMAAP///////////////xIjAAAUIwAAFiMAABgjAAAaIwAAHCMAAB4jAAD//////////yAjAAD/////IiMAACQjAAAmIwAAKCMAACojAAAsIwAA/////y4jAAAwIwAAMiMAADQjAAA2IwAAOCMAADojAAD/////PCMAAD4jAABAIwAAQiMAAEQjAABGIwAA/////0gjAABKIwAATCMAAE4jAABQIwAAUiMAAFQjAABWIwAAWCMAAFojAABcIwAAXiMAAGAjAABiIwAAZCMAAGYjAAD/////aCMAAGojAABsIwAAbiMAAHAjAAD/////ciMAAHQjAAB2IwAA/////3gjAAB6IwAAfCMAAH4jAACAIwAAgiMAAIQjAAD/////////////////////hiMAAP///////////////4gjAAD/////iiMAAP////+MIwAAjiMAAP////+QIwAAkiMAAP////+UIwAA/////5YjAACYIwAAmiMAAJwjAACeIwAAoCMAAKIjAACkIwAApiMAAKgjAACqIwAArCMAAK4jAAD//////////7AjAAD//////////7IjAAC0IwAA/////7YjAAC4IwAAuiMAALwjAAC+IwAAwCMAAMIjAAD/////xCMAAMYjAADIIwAAyiMAAMwjAADOIwAA/////9AjAADSIwAA1CMAAP//////////1iMAANgjAADaIwAA3CMAAN4jAADgIwAA4iMAAP/////kIwAA5iMAAOgjAADqIwAA/////+wjAADuIwAA8CMAAPIjAAD0IwAA9iMAAP/////4IwAA+iMAAPwjAAD+IwAAACQAAAIkAAD/////BCQAAAYkAAAIJAAACiQAAAwkAAAOJAAA/////xAkAAASJAAAFCQAABYkAAAYJAAAGiQAABwkAAAeJAAAICQAACIkAAAkJAAAJiQAACgkAAAqJAAA////////////////LCQAAP////////////////////8uJAAA/////zAkAAAyJAAANCQAADYkAAD///////////////////////////////84JAAAOiQAADwkAAD/////PiQAAEAkAABCJAAARCQAAEYkAABIJAAASiQAAP////9MJAAATiQAAFAkAABSJAAAVCQAAFYkAABYJAAAWiQAAFwkAABeJAAA//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////9hJAAAYyQAAGUkAABnJAAAaSQAAGskAABtJAAAbyQAAHEkAABzJAAAdSQAAHckAAB5JAAAeyQAAP////99JAAAfyQAAIEkAACDJAAAhSQAAIckAACJJAAAiyQAAP//////////jSQAAP///////////////48kAACRJAAAkyQAAJUkAACXJAAAmSQAAJskAACdJAAAnyQAAKEkAACjJAAApSQAAKckAACpJAAAqyQAAK0kAAD/////ryQAALEkAACzJAAAtSQAALckAAC5JAAAuyQAAL0kAAC/JAAAwSQAAMMkAADFJAAA///////////HJAAA///////////JJAAAyyQAAP/////NJAAAzyQAANEkAADTJAAA1SQAANckAADZJAAA2yQAAN0kAAD////////////////fJAAA4SQAAP//////////4yQAAOUkAADnJAAA6SQAAOskAADtJAAA7yQAAPEkAADzJAAA9SQAAPckAAD5JAAA+yQAAP0kAAD/JAAAASUAAAMlAAAFJQAA/////wclAAD/////CSUAAP////8LJQAADSUAAA8lAAARJQAAEyUAABUlAAAXJQAA/////xklAAAbJQAAHSUAAP//////////HyUAACElAAAjJQAAJSUAACclAAApJQAAKyUAAC0lAAD///////////////8vJQAA////////////////MSUAADMlAAD/////NSUAADclAAA5JQAAOyUAAD0lAAA/JQAAQSUAAEMlAABFJQAARyUAAEklAABLJQAA/////00lAABPJQAAUSUAAP////9TJQAAVSUAAP////9XJQAAWSUAAFslAABdJQAAXyUAAGElAAD/////YyUAAP////9lJQAAZyUAAP////9pJQAA/////2slAABtJQAAbyUAAHElAABzJQAAdSUAAHclAAB5JQAAeyUAAH0lAAB/JQAA/////4ElAAD///////////////+DJQAA/////4UlAAD/////hyUAAIklAACLJQAAjSUAAI8lAACRJQAAkyUAAJUlAACXJQAAmSUAAJslAACdJQAAnyUAAKElAACjJQAApSUAAKclAAD/////qSUAAKslAACtJQAAryUAALElAACzJQAAtSUAALclAAC5JQAAuyUAAL0lAAC/JQAAwSUAAMMlAADFJQAAxyUAAMklAADLJQAAzSUAAM8lAADRJQAA0yUAANUlAADXJQAA////////////////2SUAANslAADdJQAA3yUAAOElAADjJQAA5SUAAOclAAD////////////////pJQAA6yUAAP///////////////+0lAADvJQAA//////ElAADzJQAA9SUAAPclAAD5JQAA+yUAAP////////////////0lAAD///////////////////////////8lAAABJgAAAyYAAAUmAAAHJgAACSYAAAsmAAANJgAADyYAABEmAAATJgAAFSYAABcmAAAZJgAAGyYAAB0mAAAfJgAAISYAAP////////////////////8jJgAA//////////8lJgAA////////////////JyYAACkmAAD/////KyYAAC0mAAAvJgAAMSYAADMmAAA1JgAANyYAADkmAAA7JgAAPSYAAD8mAABBJgAAQyYAAEUmAABHJgAASSYAAEsmAABNJgAATyYAAFEmAABTJgAAVSYAAFcmAABZJgAA//////////9bJgAA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////14mAABgJgAAYiYAAGQmAABmJgAAaCYAAGomAABsJgAAbiYAAHAmAAByJgAAdCYAAHYmAAB4JgAAeiYAAHwmAAB+JgAAgCYAAIImAACEJgAAhiYAAIgmAAD/////iiYAAIwmAACOJgAA/////5AmAACSJgAAlCYAAJYmAACYJgAAmiYAAJwmAACeJgAAoCYAAKImAACkJgAApiYAAKgmAACqJgAArCYAAP////+uJgAAsCYAALImAAC0JgAAtiYAALgmAAC6JgAAvCYAAL4mAADAJgAAwiYAAMQmAADGJgAAyCYAAMomAADMJgAAziYAANAmAADSJgAA1CYAANYmAADYJgAA///////////aJgAA3CYAAN4mAAD//////////+AmAADiJgAA/////+QmAADmJgAA6CYAAOomAADsJgAA7iYAAPAmAADyJgAA9CYAAPYmAAD4JgAA+iYAAPwmAAD+JgAAACcAAP////8CJwAABCcAAAYnAAAIJwAACicAAAwnAAAOJwAAECcAABInAAD/////FCcAABYnAAAYJwAAGicAABwnAAD/////HicAACAnAAAiJwAAJCcAACYnAAAoJwAA//////////8qJwAALCcAAC4nAAAwJwAAMicAADQnAAA2JwAAOCcAADonAAA8JwAAPicAAEAnAAD/////////////////////QicAAEQnAABGJwAA/////0gnAABKJwAATCcAAE4nAABQJwAAUicAAP////9UJwAAVicAAP////9YJwAAWicAAFwnAABeJwAAYCcAAGInAABkJwAAZicAAGgnAABqJwAAbCcAAG4nAABwJwAAcicAAHQnAAB2JwAAeCcAAHonAAB8JwAAficAAP////+AJwAAgicAAIQnAACGJwAAiCcAAP//////////iicAAIwnAAD//////////44nAACQJwAAkicAAJQnAAD//////////5YnAACYJwAA/////5onAACcJwAAnicAAKAnAAD///////////////+iJwAA////////////////pCcAAKYnAAD//////////6gnAACqJwAArCcAAK4nAACwJwAAsicAAP//////////tCcAALYnAAC4JwAAuicAALwnAAC+JwAAwCcAAMInAADEJwAAxicAAMgnAADKJwAAzCcAAM4nAADQJwAA0icAANQnAADWJwAA2CcAAP/////aJwAA3CcAAN4nAADgJwAA/////+InAADkJwAA5icAAOgnAADqJwAA7CcAAO4nAADwJwAA8icAAPQnAAD2JwAA+CcAAPonAAD8JwAA/icAAP///////////////////////////////wAoAAACKAAABCgAAAYoAAAIKAAACigAAAwoAAAOKAAAECgAABIoAAAUKAAAFigAAP////8YKAAAGigAABwoAAAeKAAAICgAAP////8iKAAAJCgAAP////8mKAAAKCgAACooAAAsKAAALigAADAoAAAyKAAA////////////////NCgAADYoAAA4KAAAOigAAP////88KAAA//////////8+KAAAQCgAAEIoAAD//////////0QoAAD//////////0YoAABIKAAASigAAP////9MKAAATigAAP//////////UCgAAFIoAABUKAAAVigAAP////9YKAAA//////////9aKAAAXCgAAF4oAABgKAAA/////2IoAAD//////////2QoAABmKAAAaCgAAGooAABsKAAAbigAAHAoAAByKAAAdCgAAHYoAAB4KAAAeigAAHwoAAB+KAAA//////////+AKAAA//////////+CKAAAhCgAAIYoAACIKAAA/////4ooAACMKAAAjigAAJAoAACSKAAAlCgAAJYoAAD/////mCgAAJooAACcKAAA/////54oAACgKAAAoigAAKQoAACmKAAAqCgAAKooAACsKAAArigAALAoAACyKAAAtCgAALYoAAC4KAAAuigAAP////////////////////+8KAAAvigAAMAoAAD/////wigAAMQoAADGKAAA///////////IKAAAyigAAMwoAADOKAAA0CgAANIoAADUKAAA1igAANgoAADaKAAA3CgAAP/////eKAAA///////////gKAAA4igAAOQoAADmKAAA6CgAAOooAADsKAAA7igAAPAoAADyKAAA9CgAAP/////2KAAA+CgAAP//////////+igAAPwoAAD+KAAAACkAAAIpAAAEKQAABikAAAgpAAAKKQAADCkAAA4pAAAQKQAA/////xIpAAAUKQAAFikAABgpAAAaKQAAHCkAAB4pAAD/////ICkAACIpAAD//////////yQpAAAmKQAAKCkAACopAAAsKQAALikAAP////8wKQAA/////zIpAAA0KQAANikAAP////84KQAAOikAAP////88KQAAPikAAP//////////QCkAAP////9CKQAA/////0QpAABGKQAASCkAAEopAABMKQAATikAAFApAABSKQAA/////////////////////1QpAAD///////////////9WKQAA////////////////WCkAAP////9aKQAA//////////9cKQAAXikAAP//////////YCkAAGIpAABkKQAAZikAAGgpAABqKQAAbCkAAG4pAAD/////cCkAAP////9yKQAAdCkAAHYpAAB4KQAAeikAAP////98KQAA/////34pAACAKQAAgikAAIQpAACGKQAAiCkAAIopAAD/////jCkAAI4pAACQKQAAkikAAP///////////////5QpAACWKQAAmCkAAP//////////mikAAJwpAACeKQAA//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////+hKQAAoykAAKUpAACnKQAAqSkAAKspAACtKQAArykAALEpAACzKQAAtSkAALcpAAC5KQAA//////////+7KQAAvSkAAL8pAADBKQAAwykAAMUpAADHKQAAySkAAMspAAD/////zSkAAP/////PKQAA0SkAANMpAAD/////1SkAANcpAADZKQAA2ykAAN0pAADfKQAA4SkAAOMpAADlKQAA/////+cpAADpKQAA///////////rKQAA7SkAAO8pAADxKQAA8ykAAPUpAAD3KQAA+SkAAPspAAD9KQAA/ykAAAEqAAD/////AyoAAP////8FKgAAByoAAAkqAAALKgAADSoAAA8qAAARKgAAEyoAABUqAAAXKgAAGSoAAP///////////////////////////////xsqAAD///////////////8dKgAAHyoAACEqAAAjKgAAJSoAAP////8nKgAAKSoAACsqAAD/////LSoAAC8qAAAxKgAAMyoAADUqAAA3KgAAOSoAADsqAAD/////////////////////PSoAAD8qAABBKgAAQyoAAEUqAABHKgAASSoAAEsqAABNKgAA/////08qAABRKgAAUyoAAFUqAABXKgAAWSoAAFsqAABdKgAAXyoAAGEqAABjKgAA/////2UqAAD/////ZyoAAGkqAABrKgAAbSoAAG8qAABxKgAAcyoAAHUqAAB3KgAAeSoAAHsqAAB9KgAAfyoAAIEqAACDKgAAhSoAAIcqAACJKgAAiyoAAI0qAAD/////jyoAAJEqAACTKgAAlSoAAJcqAACZKgAAmyoAAJ0qAACfKgAAoSoAAKMqAAClKgAApyoAAKkqAACrKgAArSoAAK8qAACxKgAAsyoAALUqAAC3KgAAuSoAALsqAAC9KgAAvyoAAP///////////////////////////////8EqAAD/////wyoAAP/////FKgAA/////8cqAADJKgAAyyoAAM0qAADPKgAA0SoAANMqAAD/////1SoAANcqAAD//////////9kqAAD/////2yoAAP//////////3SoAAN8qAADhKgAA4yoAAOUqAADnKgAA6SoAAP/////rKgAA///////////tKgAA7yoAAPEqAADzKgAA9SoAAP/////3KgAA+SoAAP/////7KgAA//////0qAAD/KgAA/////wErAAADKwAABSsAAAcrAAAJKwAACysAAA0rAAAPKwAAESsAABMrAAAVKwAAFysAABkrAAAbKwAAHSsAAB8rAAD/////ISsAACMrAAAlKwAAJysAACkrAAArKwAALSsAAC8rAAAxKwAAMysAADUrAAA3KwAAOSsAADsrAAA9KwAAPysAAEErAABDKwAARSsAAEcrAABJKwAASysAAE0rAAD/////TysAAFErAABTKwAAVSsAAFcrAABZKwAAWysAAF0rAABfKwAAYSsAAGMrAABlKwAAZysAAP///////////////2krAABrKwAAbSsAAG8rAABxKwAAcysAAHUrAAD//////////3crAAB5KwAAeysAAH0rAAB/KwAAgSsAAIMrAACFKwAAhysAAIkrAACLKwAAjSsAAI8rAAD/////kSsAAJMrAACVKwAAlysAAJkrAACbKwAA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////54rAACgKwAAoisAAKQrAACmKwAAqCsAAP////+qKwAArCsAAK4rAACwKwAA/////7IrAAC0KwAAtisAALgrAAC6KwAAvCsAAL4rAADAKwAA////////////////wisAAMQrAADGKwAAyCsAAMorAADMKwAAzisAANArAADSKwAA1CsAANYrAADYKwAA2isAANwrAADeKwAA4CsAAOIrAADkKwAA5isAAOgrAADqKwAA7CsAAO4rAADwKwAA8isAAPQrAAD2KwAA+CsAAPorAAD8KwAA/isAAAAsAAACLAAA/////wQsAAAGLAAACCwAAAosAAAMLAAADiwAABAsAAD/////EiwAAP////8ULAAAFiwAABgsAAAaLAAAHCwAAB4sAAAgLAAAIiwAACQsAAAmLAAAKCwAACosAAAsLAAALiwAADAsAAD/////MiwAAP////80LAAA/////zYsAAA4LAAAOiwAADwsAAD//////////z4sAAD/////QCwAAP////9CLAAARCwAAEYsAABILAAASiwAAEwsAAD//////////04sAABQLAAAUiwAAFQsAABWLAAAWCwAAFosAABcLAAAXiwAAGAsAABiLAAA/////2QsAABmLAAAaCwAAGosAAD/////bCwAAG4sAABwLAAAciwAAHQsAAB2LAAAeCwAAHosAAB8LAAAfiwAAIAsAACCLAAAhCwAAIYsAACILAAAiiwAAIwsAACOLAAAkCwAAJIsAACULAAAliwAAJgsAAD/////miwAAJwsAACeLAAAoCwAAP////+iLAAApCwAAKYsAAD/////qCwAAKosAACsLAAAriwAALAsAACyLAAAtCwAALYsAAD//////////7gsAAC6LAAAvCwAAL4sAADALAAAwiwAAP/////ELAAAxiwAAMgsAADKLAAAzCwAAP///////////////84sAADQLAAA0iwAAP/////ULAAA1iwAAP/////YLAAA2iwAANwsAADeLAAA4CwAAOIsAADkLAAA5iwAAOgsAADqLAAA7CwAAP//////////7iwAAP/////wLAAA///////////////////////////yLAAA9CwAAPYsAAD/////+CwAAPosAAD8LAAA///////////+LAAAAC0AAAItAAAELQAABi0AAAgtAAAKLQAADC0AAA4tAAAQLQAAEi0AABQtAAAWLQAAGC0AABotAAAcLQAAHi0AACAtAAAiLQAAJC0AAP////////////////////8mLQAAKC0AACotAAAsLQAA/////y4tAAAwLQAA/////zItAAA0LQAANi0AADgtAAD/////Oi0AADwtAAA+LQAA/////0AtAABCLQAA/////0QtAAD///////////////9GLQAASC0AAEotAABMLQAATi0AAFAtAABSLQAAVC0AAP////9WLQAAWC0AAFotAABcLQAAXi0AAGAtAABiLQAAZC0AAGYtAABoLQAAai0AAGwtAABuLQAAcC0AAHItAAB0LQAAdi0AAHgtAAB6LQAAfC0AAP////9+LQAAgC0AAIItAACELQAAhi0AAIgtAACKLQAAjC0AAI4tAACQLQAA//////////+SLQAA////////////////lC0AAP////+WLQAAmC0AAJotAACcLQAAni0AAKAtAACiLQAApC0AAKYtAACoLQAA/////6otAACsLQAA/////64tAACwLQAAsi0AALQtAAC2LQAAuC0AALotAAC8LQAAvi0AAP/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////BLQAAwy0AAMUtAADHLQAAyS0AAP/////LLQAAzS0AAM8tAADRLQAA0y0AANUtAADXLQAA2S0AANstAADdLQAA3y0AAOEtAADjLQAA5S0AAOctAADpLQAA6y0AAP//////////7S0AAO8tAADxLQAA8y0AAPUtAAD/////9y0AAPktAAD7LQAA/S0AAP8tAAABLgAAAy4AAAUuAAAHLgAACS4AAP//////////Cy4AAA0uAAAPLgAAES4AABMuAAAVLgAAFy4AABkuAAAbLgAAHS4AAB8uAAD/////IS4AACMuAAAlLgAA/////ycuAAApLgAA/////ysuAAAtLgAALy4AADEuAAAzLgAANS4AAP////83LgAAOS4AAP///////////////zsuAAD/////////////////////PS4AAD8uAABBLgAAQy4AAEUuAABHLgAASS4AAEsuAABNLgAATy4AAFEuAABTLgAAVS4AAFcuAABZLgAAWy4AAF0uAAD//////////////////////////18uAABhLgAAYy4AAGUuAABnLgAAaS4AAGsuAAD/////bS4AAP////9vLgAAcS4AAHMuAAD//////////3UuAAB3LgAAeS4AAHsuAAB9LgAAfy4AAIEuAAD//////////4MuAACFLgAAhy4AAIkuAAD//////////4suAACNLgAAjy4AAJEuAACTLgAAlS4AAJcuAACZLgAAmy4AAJ0uAACfLgAAoS4AAKMuAAClLgAApy4AAKkuAACrLgAA/////60uAACvLgAAsS4AALMuAAC1LgAAty4AALkuAAC7LgAAvS4AAL8uAAD/////////////////////wS4AAMMuAADFLgAAxy4AAMkuAADLLgAAzS4AAM8uAAD/////0S4AAP///////////////9MuAAD/////1S4AAP/////XLgAA2S4AANsuAADdLgAA3y4AAOEuAADjLgAA5S4AAP/////nLgAA6S4AAOsuAADtLgAA///////////vLgAA//////EuAADzLgAA9S4AAPcuAAD5LgAA+y4AAP0uAAD/LgAAAS8AAAMvAAAFLwAABy8AAAkvAAALLwAADS8AAA8vAAARLwAA/////xMvAAAVLwAA/////xcvAAAZLwAAGy8AAB0vAAAfLwAAIS8AACMvAAAlLwAAJy8AACkvAAArLwAA/////y0vAAAvLwAAMS8AADMvAAA1LwAANy8AADkvAAA7LwAA/////z0vAAA/LwAAQS8AAEMvAABFLwAA//////////9HLwAASS8AAEsvAABNLwAATy8AAFEvAABTLwAAVS8AAFcvAAD/////WS8AAFsvAABdLwAAXy8AAGEvAABjLwAAZS8AAGcvAABpLwAAay8AAG0vAABvLwAAcS8AAHMvAAB1LwAAdy8AAP///////////////3kvAAD/////ey8AAP////////////////////99LwAA//////////9/LwAA/////4EvAACDLwAAhS8AAIcvAACJLwAAiy8AAI0vAACPLwAAkS8AAJMvAACVLwAAly8AAJkvAACbLwAAnS8AAJ8vAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////oi8AAKQvAACmLwAAqC8AAKovAAD/////rC8AAK4vAACwLwAAsi8AALQvAAC2LwAA/////7gvAAC6LwAAvC8AAL4vAADALwAAwi8AAMQvAADGLwAAyC8AAP/////KLwAAzC8AAM4vAADQLwAA0i8AANQvAADWLwAA2C8AANovAADcLwAA3i8AAOAvAADiLwAA/////+QvAADmLwAA/////+gvAAD/////6i8AAOwvAADuLwAA8C8AAPIvAAD0LwAA9i8AAPgvAAD6LwAA/////////////////C8AAP///////////i8AAAAwAAACMAAABDAAAAYwAAAIMAAACjAAAAwwAAAOMAAAEDAAAP////8SMAAAFDAAAP////8WMAAA/////xgwAAAaMAAAHDAAAB4wAAAgMAAAIjAAACQwAAAmMAAAKDAAACowAAAsMAAALjAAADAwAAAyMAAANDAAAP//////////NjAAAP//////////ODAAADowAAA8MAAAPjAAAEAwAABCMAAARDAAAEYwAABIMAAA/////0owAABMMAAA/////04wAAD//////////1AwAABSMAAAVDAAAP//////////////////////////VjAAAP////9YMAAAWjAAAFwwAABeMAAAYDAAAGIwAABkMAAAZjAAAGgwAABqMAAAbDAAAG4wAABwMAAAcjAAAP////90MAAAdjAAAHgwAAD//////////3owAAD/////fDAAAH4wAACAMAAAgjAAAIQwAACGMAAAiDAAAIowAACMMAAA/////44wAACQMAAAkjAAAJQwAACWMAAAmDAAAJowAACcMAAAnjAAAKAwAACiMAAApDAAAKYwAACoMAAAqjAAAP////////////////////+sMAAA/////////////////////64wAACwMAAAsjAAALQwAAC2MAAAuDAAALowAAD///////////////+8MAAAvjAAAP/////AMAAAwjAAAMQwAADGMAAA/////8gwAADKMAAAzDAAAM4wAAD/////0DAAANIwAAD/////1DAAANYwAADYMAAA2jAAANwwAADeMAAA4DAAAOIwAAD//////////+QwAAD//////////////////////////+YwAADoMAAA6jAAAOwwAADuMAAA//////AwAAD/////8jAAAPQwAAD2MAAA//////gwAAD6MAAA///////////8MAAA/jAAAP//////////ADEAAAIxAAAEMQAABjEAAAgxAAAKMQAADDEAAA4xAAAQMQAAEjEAABQxAAAWMQAAGDEAABoxAAAcMQAAHjEAACAxAAAiMQAA/////yQxAAAmMQAAKDEAACoxAAAsMQAALjEAADAxAAAyMQAANDEAAP////////////////////82MQAAODEAADoxAAA8MQAAPjEAAEAxAABCMQAARDEAAP////9GMQAA/////0gxAAD/////SjEAAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////00xAABPMQAAUTEAAFMxAABVMQAAVzEAAFkxAABbMQAAXTEAAF8xAABhMQAAYzEAAGUxAABnMQAA/////2kxAABrMQAAbTEAAG8xAABxMQAAczEAAHUxAAB3MQAA//////////95MQAA//////////97MQAAfTEAAH8xAACBMQAAgzEAAIUxAACHMQAAiTEAAIsxAACNMQAAjzEAAJExAACTMQAA/////5UxAACXMQAAmTEAAJsxAACdMQAAnzEAAP////+hMQAAozEAAKUxAACnMQAAqTEAAKsxAACtMQAArzEAALExAACzMQAAtTEAAP////+3MQAAuTEAALsxAAC9MQAAvzEAAMExAADDMQAAxTEAAMcxAADJMQAAyzEAAM0xAAD/////////////////////zzEAANExAAD////////////////TMQAA/////////////////////9UxAAD/////1zEAANkxAADbMQAA3TEAAN8xAADhMQAA4zEAAOUxAADnMQAA/////+kxAADrMQAA7TEAAO8xAAD/////8TEAAPMxAAD1MQAA///////////3MQAA//////kxAAD7MQAA/TEAAP8xAAABMgAAAzIAAAUyAAAHMgAACTIAAAsyAAANMgAADzIAABEyAAATMgAAFTIAAP////8XMgAAGTIAABsyAAAdMgAA//////////////////////////////////////////8fMgAA/////yEyAAAjMgAA/////yUyAAAnMgAAKTIAACsyAAAtMgAALzIAADEyAAAzMgAANTIAADcyAAA5MgAAOzIAAD0yAAA/MgAAQTIAAEMyAABFMgAARzIAAEkyAABLMgAA/////////////////////////////////////////////////////00yAABPMgAA//////////9RMgAA//////////9TMgAAVTIAAFcyAABZMgAAWzIAAF0yAABfMgAA/////2EyAABjMgAAZTIAAGcyAABpMgAAazIAAG0yAAD/////bzIAAHEyAABzMgAAdTIAAHcyAAB5MgAAezIAAP////99MgAAfzIAAIEyAACDMgAAhTIAAIcyAACJMgAAizIAAI0yAACPMgAAkTIAAJMyAACVMgAAlzIAAJkyAACbMgAA//////////+dMgAAnzIAAKEyAACjMgAApTIAAKcyAACpMgAAqzIAAK0yAACvMgAAsTIAALMyAAC1MgAAtzIAALkyAAC7MgAAvTIAAL8yAADBMgAA/////8MyAADFMgAAxzIAAMkyAAD/////yzIAAP/////NMgAAzzIAANEyAAD//////////9MyAAD/////////////////////////////////////1TIAANcyAADZMgAA2zIAAN0yAADfMgAA4TIAAOMyAADlMgAA5zIAAOkyAAD/////6zIAAP/////tMgAA/////+8yAAD/////8TIAAP/////zMgAA9TIAAP//////////9zIAAP//////////+TIAAPsyAAD//////TIAAP//////MgAA/////wEzAAADMwAA/////wUzAAAHMwAACTMAAAszAAD///////////////8NMwAADzMAABEzAAD/////EzMAABUzAAD//////////xczAAAZMwAA//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8cMwAAHjMAACAzAAAiMwAAJDMAACYzAAAoMwAAKjMAACwzAAAuMwAAMDMAADIzAAA0MwAANjMAAP////84MwAAOjMAADwzAAA+MwAAQDMAAEIzAABEMwAA//////////9GMwAA/////////////////////0gzAABKMwAATDMAAE4zAABQMwAAUjMAAFQzAABWMwAAWDMAAFozAABcMwAAXjMAAGAzAABiMwAAZDMAAP////9mMwAA/////2gzAABqMwAAbDMAAP////9uMwAAcDMAAHIzAAB0MwAAdjMAAHgzAAB6MwAAfDMAAH4zAACAMwAAgjMAAIQzAAD/////hjMAAIgzAAD/////ijMAAIwzAACOMwAAkDMAAJIzAAD///////////////+UMwAA////////////////ljMAAJgzAACaMwAAnDMAAJ4zAACgMwAAojMAAKQzAACmMwAAqDMAAKozAACsMwAArjMAALAzAACyMwAAtDMAAP//////////tjMAALgzAAC6MwAAvDMAAL4zAADAMwAAwjMAAMQzAADGMwAAyDMAAMozAADMMwAAzjMAAP//////////0DMAANIzAADUMwAA1jMAANgzAAD/////2jMAAP/////cMwAA3jMAAOAzAADiMwAA5DMAAOYzAAD/////6DMAAOozAADsMwAA7jMAAPAzAADyMwAA9DMAAP/////2MwAA+DMAAPozAAD8MwAA/jMAAAA0AAACNAAABDQAAAY0AAAINAAACjQAAAw0AAAONAAAEDQAABI0AAAUNAAAFjQAABg0AAAaNAAAHDQAAP////8eNAAAIDQAACI0AAAkNAAAJjQAAP//////////KDQAACo0AAAsNAAA/////y40AAAwNAAAMjQAADQ0AAA2NAAAODQAADo0AAA8NAAAPjQAAEA0AAD//////////0I0AAD//////////0Q0AABGNAAA////////////////SDQAAEo0AABMNAAATjQAAP////9QNAAA/////1I0AABUNAAA/////1Y0AABYNAAAWjQAAP//////////////////////////XDQAAF40AABgNAAAYjQAAGQ0AABmNAAAaDQAAGo0AABsNAAAbjQAAHA0AAByNAAA//////////90NAAAdjQAAHg0AAB6NAAAfDQAAH40AAD/////gDQAAII0AACENAAA////////////////hjQAAP////+INAAAijQAAIw0AAD/////jjQAAJA0AAD/////kjQAAJQ0AACWNAAAmDQAAJo0AACcNAAAnjQAAP////+gNAAAojQAAKQ0AAD/////pjQAAKg0AACqNAAA/////6w0AACuNAAA//////////+wNAAAsjQAALQ0AAC2NAAA/////7g0AAC6NAAAvDQAAL40AAD/////wDQAAP//////////wjQAAMQ0AADGNAAAyDQAAMo0AADMNAAAzjQAANA0AADSNAAA1DQAANY0AADYNAAA2jQAAP/////cNAAA/////940AADgNAAA///////////////////////////////////////////iNAAA5DQAAOY0AADoNAAA6jQAAOw0AADuNAAA8DQAAPI0AAD0NAAA9jQAAP/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////5NAAA+zQAAP00AAD/NAAAATUAAAM1AAD/////BTUAAAc1AAAJNQAACzUAAA01AAAPNQAAETUAABM1AAAVNQAAFzUAABk1AAAbNQAAHTUAAP///////////////x81AAD/////ITUAACM1AAAlNQAAJzUAACk1AAArNQAALTUAAP////8vNQAAMTUAADM1AAA1NQAANzUAADk1AAA7NQAA/////z01AAA/NQAAQTUAAEM1AABFNQAARzUAAEk1AABLNQAATTUAAE81AABRNQAA/////1M1AABVNQAAVzUAAFk1AABbNQAAXTUAAP////9fNQAAYTUAAGM1AABlNQAAZzUAAP////9pNQAA//////////9rNQAAbTUAAG81AABxNQAAczUAAHU1AAB3NQAAeTUAAHs1AAB9NQAAfzUAAIE1AACDNQAAhTUAAIc1AACJNQAAizUAAI01AAD/////jzUAAP//////////kTUAAJM1AAD//////////5U1AACXNQAAmTUAAJs1AACdNQAAnzUAAKE1AACjNQAA/////6U1AACnNQAAqTUAAKs1AACtNQAArzUAALE1AACzNQAAtTUAALc1AAC5NQAAuzUAAL01AAD/////vzUAAME1AADDNQAA///////////FNQAA/////8c1AADJNQAAyzUAAM01AADPNQAA0TUAANM1AADVNQAA1zUAANk1AADbNQAA3TUAAN81AADhNQAA4zUAAOU1AAD/////5zUAAOk1AADrNQAA7TUAAO81AADxNQAA8zUAAPU1AAD///////////c1AAD5NQAA+zUAAP01AAD//////zUAAP////8BNgAAAzYAAAU2AAAHNgAACTYAAP////8LNgAA//////////8NNgAADzYAAP////////////////////8RNgAA////////////////EzYAABU2AAD///////////////8XNgAAGTYAABs2AAAdNgAAHzYAACE2AAAjNgAAJTYAAP////////////////////8nNgAAKTYAACs2AAAtNgAALzYAADE2AAAzNgAANTYAADc2AAA5NgAAOzYAAD02AAA/NgAA//////////9BNgAAQzYAAP////9FNgAARzYAAEk2AABLNgAATTYAAE82AABRNgAAUzYAAFU2AABXNgAAWTYAAFs2AABdNgAAXzYAAP////////////////////9hNgAAYzYAAP////9lNgAAZzYAAP////////////////////9pNgAA/////2s2AABtNgAAbzYAAHE2AAD/////czYAAHU2AAD/////dzYAAHk2AAD/////ezYAAH02AAD///////////////////////////////9/NgAAgTYAAIM2AACFNgAAhzYAAIk2AACLNgAAjTYAAP//////////jzYAAJE2AACTNgAAlTYAAJc2AACZNgAAmzYAAP////////////////////////////////////+dNgAA/////582AAChNgAAozYAAKU2AACnNgAAqTYAAP////+rNgAArTYAAK82AACxNgAAszYAALU2AAC3NgAA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////7o2AAC8NgAAvjYAAMA2AADCNgAAxDYAAMY2AADINgAAyjYAAMw2AADONgAA0DYAAP//////////0jYAANQ2AADWNgAA2DYAANo2AADcNgAA3jYAAOA2AAD//////////////////////////+I2AADkNgAA5jYAAOg2AADqNgAA7DYAAO42AADwNgAA8jYAAPQ2AAD2NgAA+DYAAPo2AAD8NgAA/jYAAAA3AAACNwAABDcAAAY3AAAINwAACjcAAP////8MNwAADjcAABA3AAASNwAAFDcAABY3AAAYNwAAGjcAABw3AAAeNwAAIDcAACI3AAD/////JDcAACY3AAAoNwAAKjcAACw3AAAuNwAA/////zA3AAAyNwAANDcAADY3AAA4NwAAOjcAADw3AAA+NwAAQDcAAEI3AAD//////////0Q3AABGNwAASDcAAEo3AABMNwAA/////043AABQNwAAUjcAAFQ3AABWNwAAWDcAAFo3AABcNwAAXjcAAGA3AABiNwAAZDcAAGY3AABoNwAAajcAAGw3AABuNwAAcDcAAHI3AAB0NwAAdjcAAP//////////eDcAAHo3AAB8NwAAfjcAAIA3AACCNwAAhDcAAIY3AACINwAAijcAAIw3AACONwAAkDcAAJI3AACUNwAAljcAAJg3AACaNwAAnDcAAJ43AACgNwAAojcAAKQ3AACmNwAAqDcAAKo3AACsNwAArjcAALA3AACyNwAAtDcAAP////+2NwAAuDcAALo3AAC8NwAAvjcAAP//////////wDcAAMI3AADENwAAxjcAAMg3AADKNwAAzDcAAM43AADQNwAA0jcAAP//////////1DcAANY3AAD/////2DcAANo3AADcNwAA3jcAAOA3AADiNwAA5DcAAOY3AADoNwAA6jcAAOw3AADuNwAA8DcAAPI3AAD0NwAA9jcAAPg3AAD6NwAA/DcAAP43AAAAOAAAAjgAAAQ4AAAGOAAACDgAAP///////////////wo4AAAMOAAA//////////8OOAAAEDgAABI4AAAUOAAAFjgAAP///////////////xg4AAD///////////////8aOAAAHDgAAB44AAAgOAAAIjgAACQ4AAAmOAAAKDgAACo4AAD//////////yw4AAD/////LjgAADA4AAD/////MjgAADQ4AAA2OAAAODgAADo4AAA8OAAAPjgAAEA4AABCOAAA//////////9EOAAA//////////9GOAAASDgAAP////9KOAAA//////////9MOAAATjgAAP////9QOAAAUjgAAP///////////////1Q4AABWOAAA/////1g4AABaOAAAXDgAAF44AABgOAAAYjgAAP//////////ZDgAAGY4AABoOAAAajgAAGw4AABuOAAA//////////9wOAAAcjgAAHQ4AAB2OAAAeDgAAHo4AAD/////fDgAAH44AAD/////gDgAAII4AAD//////////4Q4AAD//////////4Y4AACIOAAAijgAAP//////////jDgAAI44AACQOAAAkjgAAJQ4AACWOAAA/////5g4AACaOAAA/////5w4AACeOAAAoDgAAKI4AACkOAAApjgAAKg4AACqOAAArDgAAK44AACwOAAAsjgAAP////+0OAAAtjgAAP///////////////7g4AAC6OAAAvDgAAL44AAD//////////8A4AADCOAAAxDgAAMY4AADIOAAAyjgAAMw4AADOOAAA0DgAANI4AAD////////////////////////////////UOAAA1jgAANg4AADaOAAA3DgAAN44AADgOAAA4jgAAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////+U4AADnOAAA6TgAAOs4AADtOAAA7zgAAPE4AADzOAAA9TgAAPc4AAD5OAAA+zgAAP04AAD///////////84AAABOQAAAzkAAAU5AAAHOQAACTkAAP////8LOQAA//////////8NOQAADzkAAP//////////ETkAABM5AAAVOQAAFzkAABk5AAAbOQAAHTkAAB85AAAhOQAAIzkAACU5AAAnOQAAKTkAAP///////////////ys5AAAtOQAALzkAADE5AAAzOQAANTkAADc5AAD/////OTkAADs5AAD//////////z05AAA/OQAAQTkAAEM5AABFOQAARzkAAEk5AABLOQAATTkAAP////9POQAAUTkAAP//////////UzkAAP////9VOQAAVzkAAFk5AAD/////WzkAAF05AABfOQAAYTkAAGM5AABlOQAAZzkAAGk5AAD/////azkAAP////9tOQAAbzkAAP////9xOQAAczkAAHU5AAB3OQAAeTkAAP////97OQAA/////305AAB/OQAAgTkAAIM5AACFOQAA/////4c5AAD///////////////+JOQAA/////4s5AACNOQAAjzkAAJE5AACTOQAAlTkAAJc5AAD//////////5k5AACbOQAA/////505AAD/////nzkAAKE5AACjOQAA/////6U5AACnOQAAqTkAAP////+rOQAA/////605AAD///////////////+vOQAAsTkAALM5AAC1OQAAtzkAALk5AAC7OQAAvTkAAL85AADBOQAA///////////DOQAAxTkAAP/////HOQAAyTkAAMs5AADNOQAAzzkAANE5AADTOQAA1TkAANc5AADZOQAA2zkAAP//////////3TkAAN85AADhOQAA4zkAAP/////lOQAA/////+c5AAD//////////+k5AAD/////6zkAAO05AADvOQAA8TkAAPM5AAD1OQAA9zkAAP//////////+TkAAPs5AAD9OQAA/////////////////zkAAP//////////////////////////////////////////AToAAAM6AAAFOgAA/////wc6AAAJOgAACzoAAA06AAAPOgAAEToAABM6AAD/////FToAAP////8XOgAA//////////8ZOgAAGzoAAB06AAD///////////////8fOgAA/////yE6AAAjOgAAJToAACc6AAD/////KToAACs6AAAtOgAALzoAADE6AAAzOgAANToAADc6AAD///////////////85OgAA////////////////OzoAAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////z46AABAOgAAQjoAAEQ6AABGOgAASDoAAEo6AABMOgAATjoAAFA6AABSOgAAVDoAAFY6AABYOgAA/////1o6AABcOgAAXjoAAGA6AABiOgAAZDoAAGY6AABoOgAA/////2o6AAD/////////////////////bDoAAG46AABwOgAAcjoAAHQ6AAB2OgAAeDoAAHo6AAB8OgAAfjoAAIA6AACCOgAAhDoAAIY6AACIOgAAijoAAIw6AAD/////jjoAAJA6AACSOgAAlDoAAJY6AACYOgAAmjoAAJw6AACeOgAAoDoAAP////+iOgAApDoAAKY6AAD//////////6g6AACqOgAArDoAAK46AACwOgAAsjoAAP////+0OgAAtjoAALg6AAC6OgAAvDoAAP////++OgAAwDoAAP///////////////8I6AADEOgAAxjoAAMg6AADKOgAAzDoAAM46AADQOgAA0joAANQ6AADWOgAA2DoAANo6AADcOgAA3joAAOA6AADiOgAA5DoAAOY6AADoOgAA////////////////6joAAP/////sOgAA7joAAPA6AADyOgAA9DoAAPY6AAD4OgAA+joAAPw6AAD+OgAA/////wA7AAACOwAABDsAAAY7AAAIOwAACjsAAAw7AAAOOwAAEDsAABI7AAAUOwAA////////////////////////////////FjsAABg7AAAaOwAAHDsAAB47AAAgOwAAIjsAACQ7AAAmOwAAKDsAACo7AAAsOwAALjsAADA7AAAyOwAANDsAADY7AAA4OwAAOjsAAP////88OwAAPjsAAEA7AABCOwAARDsAAEY7AABIOwAASjsAAEw7AABOOwAAUDsAAFI7AAD/////VDsAAFY7AABYOwAA/////1o7AAD//////////////////////////1w7AABeOwAAYDsAAGI7AABkOwAAZjsAAP////9oOwAAajsAAGw7AABuOwAAcDsAAHI7AAB0OwAAdjsAAHg7AAD/////////////////////ejsAAP////////////////////////////////////98OwAAfjsAAIA7AAD//////////4I7AACEOwAAhjsAAIg7AACKOwAAjDsAAI47AACQOwAAkjsAAJQ7AAD/////ljsAAJg7AACaOwAA/////5w7AAD/////njsAAKA7AACiOwAApDsAAKY7AACoOwAAqjsAAKw7AACuOwAAsDsAAP////+yOwAAtDsAALY7AAC4OwAAujsAALw7AAC+OwAAwDsAAMI7AADEOwAA///////////GOwAAyDsAAMo7AADMOwAAzjsAAP//////////0DsAAP/////SOwAA/////9Q7AADWOwAA2DsAANo7AADcOwAA3jsAAP//////////4DsAAP/////iOwAA/////+Q7AADmOwAA/////+g7AADqOwAA7DsAAP/////uOwAA8DsAAP//////////8jsAAP//////////9DsAAPY7AAD4OwAA+jsAAPw7AAD+OwAAADwAAAI8AAAEPAAABjwAAAg8AAAKPAAADDwAAA48AAAQPAAAEjwAABQ8AAAWPAAAGDwAABo8AAAcPAAAHjwAACA8AAAiPAAA/////yQ8AAAmPAAAKDwAACo8AAAsPAAALjwAAP////////////////////8wPAAAMjwAADQ8AAD/////NjwAADg8AAA6PAAAPDwAAD48AABAPAAAQjwAAEQ8AABGPAAA//////////9IPAAASjwAAP//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////TTwAAE88AABRPAAAUzwAAFU8AAD/////VzwAAFk8AABbPAAAXTwAAF88AABhPAAAYzwAAGU8AABnPAAAaTwAAGs8AABtPAAAbzwAAHE8AAD///////////////9zPAAA/////3U8AAB3PAAAeTwAAHs8AAB9PAAAfzwAAIE8AACDPAAAhTwAAIc8AACJPAAAizwAAI08AACPPAAA/////5E8AACTPAAAlTwAAJc8AACZPAAAmzwAAJ08AAD/////nzwAAKE8AACjPAAApTwAAKc8AACpPAAAqzwAAK08AACvPAAAsTwAALM8AAC1PAAAtzwAAP////+5PAAAuzwAAL08AAC/PAAAwTwAAMM8AADFPAAA///////////HPAAA/////8k8AADLPAAAzTwAAM88AADRPAAA/////9M8AADVPAAA1zwAANk8AAD//////////9s8AADdPAAA3zwAAOE8AADjPAAA5TwAAOc8AADpPAAA/////+s8AAD/////7TwAAP/////////////////////vPAAA8TwAAPM8AAD1PAAA9zwAAPk8AAD/////+zwAAP08AAD///////////88AAABPQAAAz0AAAU9AAAHPQAACT0AAAs9AAD///////////////8NPQAADz0AABE9AAD/////Ez0AABU9AAAXPQAAGT0AABs9AAD/////HT0AAB89AAAhPQAAIz0AACU9AAAnPQAAKT0AAP////////////////////8rPQAALT0AAC89AAAxPQAAMz0AADU9AAA3PQAA/////zk9AAA7PQAAPT0AAD89AABBPQAAQz0AAEU9AABHPQAAST0AAEs9AAD//////////009AABPPQAAUT0AAFM9AABVPQAAVz0AAFk9AABbPQAAXT0AAF89AAD///////////////////////////////9hPQAA/////2M9AAD///////////////9lPQAAZz0AAGk9AABrPQAA/////////////////////209AAD/////bz0AAHE9AABzPQAAdT0AAP//////////dz0AAHk9AAB7PQAAfT0AAH89AACBPQAAgz0AAIU9AAD//////////4c9AACJPQAAiz0AAI09AACPPQAA/////5E9AACTPQAAlT0AAJc9AACZPQAAmz0AAP////+dPQAAnz0AAKE9AACjPQAApT0AAKc9AACpPQAAqz0AAK09AACvPQAAsT0AALM9AAD/////tT0AALc9AAC5PQAAuz0AAL09AAC/PQAAwT0AAMM9AADFPQAAxz0AAMk9AADLPQAAzT0AAM89AADRPQAA0z0AANU9AAD////////////////XPQAA2T0AANs9AADdPQAA3z0AAOE9AAD/////4z0AAOU9AADnPQAA6T0AAOs9AADtPQAA7z0AAP/////xPQAA8z0AAPU9AAD3PQAA+T0AAPs9AAD///////////09AAD/PQAAAT4AAAM+AAAFPgAABz4AAAk+AAALPgAADT4AAA8+AAARPgAA//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8UPgAAFj4AABg+AAAaPgAAHD4AAB4+AAAgPgAAIj4AACQ+AAAmPgAAKD4AACo+AAAsPgAALj4AAP////8wPgAAMj4AADQ+AAA2PgAAOD4AADo+AAA8PgAAPj4AAEA+AAD/////Qj4AAEQ+AAD/////Rj4AAEg+AABKPgAATD4AAE4+AABQPgAAUj4AAFQ+AAD/////Vj4AAFg+AAD/////Wj4AAFw+AABePgAAYD4AAGI+AAD///////////////9kPgAA/////////////////////2Y+AABoPgAAaj4AAGw+AAD/////bj4AAHA+AAByPgAAdD4AAHY+AAB4PgAAej4AAHw+AAB+PgAAgD4AAII+AAD/////hD4AAIY+AACIPgAA//////////+KPgAA/////////////////////4w+AACOPgAA/////5A+AACSPgAAlD4AAJY+AACYPgAAmj4AAJw+AACePgAAoD4AAKI+AAD/////pD4AAKY+AACoPgAAqj4AAKw+AACuPgAAsD4AALI+AAC0PgAAtj4AALg+AAC6PgAAvD4AAL4+AADAPgAAwj4AAMQ+AAD//////////8Y+AADIPgAA////////////////////////////////yj4AAMw+AAD/////zj4AANA+AADSPgAA1D4AANY+AADYPgAA2j4AANw+AADePgAA4D4AAOI+AADkPgAA5j4AAOg+AADqPgAA7D4AAO4+AAD/////8D4AAP//////////////////////////8j4AAP//////////9D4AAPY+AAD4PgAA+j4AAPw+AAD+PgAAAD8AAAI/AAAEPwAABj8AAAg/AAAKPwAADD8AAA4/AAAQPwAA/////xI/AAAUPwAAFj8AABg/AAD/////////////////////Gj8AABw/AAD///////////////8ePwAAID8AACI/AAD/////JD8AACY/AAD///////////////8oPwAAKj8AACw/AAAuPwAAMD8AADI/AAA0PwAANj8AADg/AAA6PwAAPD8AAD4/AABAPwAA//////////9CPwAARD8AAEY/AABIPwAASj8AAEw/AAD/////Tj8AAP////9QPwAAUj8AAFQ/AABWPwAAWD8AAP//////////Wj8AAP////9cPwAA//////////9ePwAAYD8AAGI/AABkPwAAZj8AAGg/AABqPwAAbD8AAP////9uPwAA//////////9wPwAAcj8AAP////90PwAAdj8AAHg/AAB6PwAAfD8AAH4/AACAPwAAgj8AAIQ/AACGPwAAiD8AAIo/AACMPwAAjj8AAJA/AACSPwAAlD8AAJY/AACYPwAAmj8AAJw/AACePwAAoD8AAKI/AACkPwAApj8AAKg/AAD//////////6o/AACsPwAA/////64/AAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////7E/AACzPwAAtT8AALc/AAC5PwAAuz8AAL0/AAC/PwAAwT8AAMM/AADFPwAAxz8AAMk/AADLPwAAzT8AAM8/AADRPwAA0z8AANU/AADXPwAA2T8AANs/AADdPwAA3z8AAOE/AADjPwAA5T8AAOc/AADpPwAA6z8AAO0/AADvPwAA8T8AAPM/AAD1PwAA9z8AAP/////5PwAA+z8AAP0/AAD/PwAA/////wFAAAADQAAABUAAAP////8HQAAACUAAAAtAAAANQAAAD0AAABFAAAATQAAAFUAAAP////8XQAAAGUAAABtAAAD/////HUAAAB9AAAAhQAAA/////yNAAAAlQAAAJ0AAAClAAAArQAAALUAAAC9AAAAxQAAA/////zNAAAA1QAAAN0AAADlAAAA7QAAA/////z1AAAA/QAAAQUAAAENAAAD/////RUAAAEdAAAD/////SUAAAEtAAABNQAAAT0AAAFFAAABTQAAAVUAAAFdAAABZQAAAW0AAAF1AAAD//////////19AAABhQAAA//////////9jQAAAZUAAAGdAAABpQAAAa0AAAG1AAABvQAAAcUAAAP////9zQAAA//////////91QAAAd0AAAHlAAAB7QAAAfUAAAH9AAACBQAAAg0AAAIVAAACHQAAAiUAAAItAAACNQAAAj0AAAP////+RQAAA/////5NAAACVQAAAl0AAAP////////////////////+ZQAAA/////5tAAACdQAAAn0AAAKFAAACjQAAApUAAAP////+nQAAA/////6lAAACrQAAArUAAAK9AAACxQAAA/////7NAAAD//////////7VAAAC3QAAAuUAAALtAAAD//////////71AAAC/QAAAwUAAAP//////////////////////////w0AAAMVAAADHQAAA/////8lAAAD/////y0AAAM1AAADPQAAA0UAAANNAAADVQAAA10AAANlAAAD/////20AAAP/////dQAAA///////////////////////////fQAAA4UAAAONAAADlQAAA50AAAOlAAADrQAAA7UAAAO9AAAD/////////////////////8UAAAPNAAAD1QAAA90AAAPlAAAD7QAAA/UAAAP9AAAABQQAAA0EAAAVBAAAHQQAACUEAAAtBAAANQQAAD0EAAP////8RQQAAE0EAABVBAAAXQQAAGUEAAP////8bQQAA//////////////////////////////////////////8dQQAAH0EAACFBAAAjQQAAJUEAACdBAAD//////////ylBAAArQQAALUEAAP////8vQQAAMUEAADNBAAA1QQAAN0EAADlBAAD//////////ztBAAA9QQAAP0EAAEFBAAD/////Q0EAAP//////////RUEAAEdBAABJQQAAS0EAAE1BAABPQQAA/////////////////////1FBAABTQQAA//////////9VQQAAV0EAAFlBAABbQQAAXUEAAF9BAABhQQAAY0EAAGVBAABnQQAAaUEAAGtBAABtQQAAb0EAAHFBAABzQQAA////////////////////////////////dUEAAHdBAAB5QQAA/////3tBAAB9QQAAf0EAAIFBAACDQQAAhUEAAP////+HQQAAiUEAAItBAACNQQAAj0EAAJFBAACTQQAA/////5VBAAD//////////5dBAAD///////////////+ZQQAA////////////////m0EAAJ1BAACfQQAAoUEAAP////+jQQAApUEAAKdBAACpQQAAq0EAAK1BAACvQQAAsUEAALNBAAC1QQAAt0EAALlBAAC7QQAA////////////////////////////////vUEAAP////+/QQAAwUEAAMNBAADFQQAA///////////HQQAAyUEAAMtBAAD/////////////////////////////////////zUEAAM9BAAD/////0UEAANNBAADVQQAA10EAANlBAADbQQAA3UEAAP/////fQQAA4UEAAONBAADlQQAA50EAAP/////pQQAA60EAAO1BAADvQQAA8UEAAPNBAAD1QQAA///////////3QQAA//////lBAAD7QQAA/UEAAP9BAAABQgAAA0IAAP////8FQgAAB0IAAP///////////////wlCAAD/////C0IAAP////8NQgAAD0IAAP////8RQgAAE0IAABVCAAAXQgAAGUIAABtCAAAdQgAAH0IAACFCAAAjQgAAJUIAACdCAAApQgAA//////////8rQgAALUIAAC9CAAAxQgAAM0IAADVCAAA3QgAAOUIAADtCAAA9QgAAP0IAAEFCAABDQgAARUIAAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////0hCAABKQgAATEIAAE5CAABQQgAAUkIAAFRCAABWQgAAWEIAAFpCAABcQgAAXkIAAGBCAABiQgAA/////2RCAABmQgAAaEIAAGpCAABsQgAAbkIAAHBCAAByQgAAdEIAAHZCAAB4QgAAekIAAHxCAAB+QgAAgEIAAIJCAACEQgAAhkIAAIhCAACKQgAA/////4xCAAD/////jkIAAJBCAACSQgAAlEIAAJZCAACYQgAA/////5pCAACcQgAAnkIAAKBCAACiQgAApEIAAKZCAACoQgAAqkIAAP////+sQgAArkIAALBCAACyQgAAtEIAALZCAAC4QgAAukIAALxCAAC+QgAAwEIAAMJCAADEQgAAxkIAAMhCAADKQgAAzEIAAM5CAADQQgAA0kIAANRCAADWQgAA2EIAAP//////////2kIAANxCAAD/////3kIAAP/////gQgAA4kIAAORCAADmQgAA6EIAAOpCAADsQgAA7kIAAPBCAADyQgAA9EIAAPZCAAD4QgAA//////pCAAD8QgAA/kIAAABDAAACQwAABEMAAAZDAAAIQwAACkMAAP////8MQwAADkMAABBDAAASQwAAFEMAABZDAAAYQwAAGkMAABxDAAAeQwAAIEMAACJDAAAkQwAAJkMAAChDAAAqQwAALEMAAC5DAAAwQwAAMkMAADRDAAD/////////////////////NkMAAP////84QwAAOkMAADxDAAD/////PkMAAEBDAABCQwAAREMAAEZDAAD///////////////9IQwAASkMAAP///////////////0xDAAD/////TkMAAFBDAABSQwAA//////////9UQwAAVkMAAFhDAAD//////////1pDAABcQwAA//////////9eQwAAYEMAAGJDAABkQwAAZkMAAGhDAAD/////akMAAP////9sQwAAbkMAAP///////////////3BDAAByQwAAdEMAAHZDAAB4QwAA/////3pDAAD/////fEMAAH5DAACAQwAAgkMAAIRDAACGQwAAiEMAAIpDAACMQwAA/////45DAACQQwAAkkMAAJRDAAD/////////////////////lkMAAJhDAACaQwAAnEMAAP//////////nkMAAKBDAACiQwAApEMAAKZDAACoQwAAqkMAAKxDAACuQwAAsEMAALJDAAC0QwAAtkMAALhDAAC6QwAA/////7xDAAD//////////75DAADAQwAAwkMAAMRDAADGQwAAyEMAAP//////////ykMAAP/////MQwAAzkMAANBDAADSQwAA///////////UQwAA1kMAAP/////YQwAA2kMAANxDAADeQwAA4EMAAP///////////////+JDAADkQwAA///////////mQwAA/////+hDAAD/////6kMAAOxDAADuQwAA////////////////8EMAAPJDAAD0QwAA9kMAAPhDAAD6QwAA/EMAAP///////////////////////////kMAAABEAAACRAAABEQAAP////8GRAAA//////////8IRAAACkQAAAxEAAAORAAAEEQAABJEAAD//////////xREAAAWRAAAGEQAABpEAAD/////HEQAAB5EAAD/////IEQAACJEAAAkRAAAJkQAAChEAAAqRAAALEQAAC5EAAD/////MEQAADJEAAA0RAAANkQAAP////84RAAA/////zpEAAA8RAAA/////////////////////z5EAABARAAAQkQAAP////9ERAAA/////0ZEAABIRAAASkQAAExEAABORAAAUEQAAFJEAABURAAAVkQAAFhEAABaRAAAXEQAAF5EAABgRAAAYkQAAGREAABmRAAAaEQAAP////9qRAAA/////2xEAABuRAAAcEQAAHJEAAB0RAAAdkQAAHhEAAB6RAAAfEQAAP////9+RAAAgEQAAP////+CRAAA/////4REAACGRAAAiEQAAP////+KRAAAjEQAAI5EAACQRAAA//////////////////////////+SRAAA/////5REAACWRAAA/////5hEAACaRAAA//////////+cRAAA////////////////nkQAAP////+gRAAAokQAAKREAACmRAAAqEQAAKpEAAD//////////6xEAACuRAAAsEQAALJEAAD/////tEQAALZEAAC4RAAA/////7pEAAD//////////////////////////7xEAAD/////vkQAAMBEAAD/////wkQAAMREAADGRAAAyEQAAMpEAAD/////zEQAAM5EAADQRAAA0kQAANREAAD/////1kQAANhEAAD/////2kQAAP//////////3EQAAP/////eRAAA4EQAAOJEAADkRAAA5kQAAOhEAADqRAAA/////+xEAAD/////7kQAAPBEAADyRAAA9EQAAP////////////////ZEAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////+UQAAPtEAAD9RAAA/0QAAAFFAAADRQAABUUAAAdFAAAJRQAAC0UAAA1FAAAPRQAAEUUAABNFAAD/////FUUAABdFAAAZRQAAG0UAAB1FAAAfRQAAIUUAAP////8jRQAA/////yVFAAD/////J0UAAP////8pRQAAK0UAAC1FAAAvRQAAMUUAADNFAAA1RQAAN0UAADlFAAA7RQAAPUUAAD9FAABBRQAAQ0UAAP///////////////0VFAAD/////R0UAAElFAAD//////////0tFAABNRQAAT0UAAFFFAABTRQAAVUUAAFdFAABZRQAA/////1tFAAD//////////11FAABfRQAAYUUAAGNFAABlRQAA//////////9nRQAA/////2lFAABrRQAAbUUAAG9FAAD/////////////////////cUUAAHNFAAB1RQAAd0UAAHlFAAB7RQAAfUUAAH9FAACBRQAAg0UAAIVFAACHRQAAiUUAAItFAACNRQAAj0UAAJFFAACTRQAA/////////////////////5VFAACXRQAAmUUAAJtFAAD//////////51FAACfRQAAoUUAAKNFAAClRQAAp0UAAKlFAACrRQAArUUAAP///////////////69FAACxRQAAs0UAALVFAAC3RQAAuUUAALtFAAD/////vUUAAL9FAADBRQAAw0UAAMVFAADHRQAAyUUAAMtFAADNRQAAz0UAANFFAADTRQAA1UUAAP/////XRQAA2UUAANtFAADdRQAA30UAAOFFAAD//////////+NFAAD/////5UUAAP//////////50UAAOlFAADrRQAA7UUAAO9FAAD///////////FFAAD/////80UAAPVFAAD/////90UAAPlFAAD/////+0UAAP/////9RQAA/0UAAAFGAAD/////A0YAAAVGAAAHRgAACUYAAAtGAAANRgAAD0YAABFGAAATRgAAFUYAABdGAAAZRgAAG0YAAB1GAAD//////////x9GAAAhRgAA/////yNGAAAlRgAAJ0YAAClGAAArRgAALUYAAC9GAAAxRgAAM0YAADVGAAA3RgAAOUYAADtGAAA9RgAAP0YAAEFGAABDRgAARUYAAEdGAABJRgAAS0YAAE1GAAD/////T0YAAFFGAABTRgAAVUYAAFdGAABZRgAAW0YAAF1GAABfRgAA/////////////////////////////////////2FGAAD/////Y0YAAGVGAAD//////////2dGAABpRgAAa0YAAG1GAABvRgAAcUYAAHNGAAB1RgAA//////////93RgAAeUYAAHtGAAD/////fUYAAH9GAACBRgAAg0YAAP////+FRgAAh0YAAIlGAACLRgAAjUYAAP//////////j0YAAJFGAACTRgAAlUYAAJdGAACZRgAAm0YAAJ1GAACfRgAAoUYAAKNGAAClRgAA//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////+oRgAAqkYAAKxGAACuRgAAsEYAALJGAAD/////tEYAALZGAAC4RgAAukYAAP////+8RgAAvkYAAMBGAADCRgAAxEYAAMZGAADIRgAAykYAAMxGAAD/////zkYAANBGAADSRgAA1EYAANZGAADYRgAA2kYAANxGAADeRgAA4EYAAOJGAADkRgAA5kYAAOhGAADqRgAA/////+xGAADuRgAA//////BGAADyRgAA9EYAAPZGAAD4RgAA+kYAAPxGAAD+RgAAAEcAAAJHAAAERwAABkcAAAhHAAAKRwAADEcAAA5HAAAQRwAAEkcAABRHAAAWRwAAGEcAABpHAAD//////////xxHAAAeRwAAIEcAACJHAAD/////////////////////JEcAAP////8mRwAAKEcAACpHAAAsRwAALkcAAP////8wRwAA/////zJHAAD//////////zRHAAA2RwAAOEcAADpHAAA8RwAAPkcAAP////9ARwAAQkcAAERHAABGRwAASEcAAEpHAABMRwAATkcAAFBHAABSRwAAVEcAAFZHAABYRwAA/////1pHAABcRwAAXkcAAGBHAABiRwAA/////2RHAABmRwAAaEcAAGpHAABsRwAA//////////////////////////9uRwAA/////3BHAAByRwAAdEcAAHZHAAB4RwAAekcAAHxHAAB+RwAAgEcAAIJHAACERwAAhkcAAP////////////////////////////////////+IRwAAikcAAIxHAACORwAAkEcAAJJHAACURwAAlkcAAP////+YRwAAmkcAAJxHAACeRwAAoEcAAKJHAAD/////pEcAAKZHAACoRwAAqkcAAKxHAACuRwAAsEcAALJHAAC0RwAAtkcAALhHAAC6RwAAvEcAAL5HAADARwAAwkcAAMRHAADGRwAAyEcAAP/////////////////////KRwAAzEcAAM5HAAD/////0EcAAP//////////////////////////0kcAANRHAAD////////////////////////////////WRwAA2EcAANpHAAD/////3EcAAP/////eRwAA/////+BHAAD/////4kcAAORHAADmRwAA6EcAAOpHAADsRwAA7kcAAPBHAADyRwAA9EcAAPZHAAD4RwAA//////pHAAD////////////////8RwAA/kcAAP////8ASAAAAkgAAARIAAAGSAAACEgAAP//////////CkgAAP//////////DEgAAP////8OSAAA/////xBIAAD///////////////8SSAAA/////xRIAAAWSAAA/////xhIAAAaSAAAHEgAAB5IAAAgSAAAIkgAACRIAAAmSAAAKEgAACpIAAAsSAAALkgAADBIAAAySAAANEgAADZIAAA4SAAAOkgAADxIAAA+SAAAQEgAAEJIAAD/////REgAAEZIAAD//////////0hIAABKSAAATEgAAE5IAABQSAAAUkgAAP////////////////////9USAAAVkgAAP//////////WEgAAP///////////////1pIAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////11IAABfSAAAYUgAAGNIAABlSAAAZ0gAAGlIAABrSAAAbUgAAG9IAABxSAAAc0gAAHVIAAB3SAAAeUgAAHtIAAB9SAAAf0gAAP////+BSAAAg0gAAIVIAACHSAAAiUgAAP////+LSAAAjUgAAP//////////j0gAAP////+RSAAAk0gAAJVIAACXSAAAmUgAAJtIAACdSAAAn0gAAKFIAACjSAAApUgAAKdIAACpSAAAq0gAAP//////////rUgAAP//////////////////////////r0gAALFIAACzSAAAtUgAAP////+3SAAAuUgAALtIAAC9SAAAv0gAAMFIAADDSAAAxUgAAP/////HSAAAyUgAAMtIAAD/////zUgAAP//////////z0gAAP/////RSAAA/////////////////////9NIAAD/////1UgAANdIAADZSAAA20gAAN1IAADfSAAA4UgAAONIAADlSAAA50gAAOlIAADrSAAA7UgAAO9IAADxSAAA80gAAPVIAAD3SAAA+UgAAPtIAAD9SAAA/0gAAAFJAAADSQAABUkAAP//////////////////////////////////////////B0kAAP///////////////wlJAAALSQAADUkAAA9JAAARSQAAE0kAABVJAAAXSQAAGUkAAP//////////G0kAAP////8dSQAAH0kAACFJAAAjSQAA/////////////////////yVJAAAnSQAAKUkAACtJAAAtSQAAL0kAADFJAAAzSQAANUkAADdJAAA5SQAAO0kAAD1JAAA/SQAAQUkAAENJAABFSQAAR0kAAElJAABLSQAATUkAAE9JAABRSQAAU0kAAFVJAABXSQAA//////////////////////////////////////////9ZSQAAW0kAAF1JAABfSQAAYUkAAGNJAABlSQAAZ0kAAGlJAABrSQAAbUkAAG9JAABxSQAAc0kAAHVJAAB3SQAA/////////////////////////////////////3lJAAB7SQAAfUkAAH9JAACBSQAAg0kAAIVJAACHSQAAiUkAAP////+LSQAA//////////+NSQAAj0kAAP////////////////////+RSQAA//////////+TSQAAlUkAAJdJAACZSQAAm0kAAP////////////////////+dSQAAn0kAAKFJAACjSQAApUkAAKdJAACpSQAAq0kAAK1JAACvSQAAsUkAALNJAAC1SQAAt0kAALlJAAC7SQAAvUkAAL9JAADBSQAAw0kAAMVJAADHSQAAyUkAAMtJAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////85JAADQSQAA0kkAANRJAADWSQAA2EkAANpJAADcSQAA/////95JAAD/////4EkAAOJJAADkSQAA5kkAAOhJAADqSQAA7EkAAO5JAAD///////////BJAADySQAA9EkAAPZJAAD/////+EkAAPpJAAD///////////xJAAD+SQAAAEoAAP//////////AkoAAARKAAAGSgAACEoAAApKAAAMSgAADkoAABBKAAASSgAAFEoAABZKAAAYSgAAGkoAABxKAAAeSgAA/////yBKAAD/////IkoAACRKAAAmSgAAKEoAACpKAAAsSgAALkoAADBKAAAySgAA/////zRKAAA2SgAAOEoAADpKAAA8SgAAPkoAAEBKAABCSgAA/////0RKAABGSgAASEoAAEpKAABMSgAATkoAAFBKAAD//////////1JKAABUSgAAVkoAAFhKAABaSgAAXEoAAF5KAABgSgAAYkoAAGRKAABmSgAAaEoAAGpKAAD/////bEoAAG5KAABwSgAA/////3JKAAB0SgAAdkoAAHhKAAD//////////3pKAAB8SgAAfkoAAIBKAACCSgAAhEoAAIZKAACISgAA/////4pKAACMSgAA/////45KAACQSgAAkkoAAP////+USgAAlkoAAJhKAACaSgAA/////5xKAACeSgAAoEoAAKJKAACkSgAApkoAAKhKAACqSgAArEoAAK5KAACwSgAAskoAALRKAAC2SgAAuEoAALpKAAC8SgAAvkoAAP/////ASgAAwkoAAMRKAADGSgAAyEoAAMpKAADMSgAAzkoAANBKAADSSgAA1EoAANZKAADYSgAA2koAAP/////////////////////cSgAA////////////////3koAAP///////////////+BKAADiSgAA///////////kSgAA5koAAOhKAADqSgAA7EoAAO5KAADwSgAA8koAAPRKAAD2SgAA+EoAAP/////6SgAA/EoAAP///////////////////////////koAAABLAAACSwAABEsAAAZLAAAISwAACksAAAxLAAAOSwAAEEsAAP///////////////xJLAAAUSwAA/////xZLAAD/////GEsAAP//////////GksAABxLAAD/////HksAACBLAAAiSwAA/////yRLAAAmSwAAKEsAACpLAAD//////////////////////////yxLAAAuSwAAMEsAADJLAAA0SwAA/////zZLAAA4SwAAOksAAP///////////////zxLAAA+SwAAQEsAAEJLAABESwAARksAAP////9ISwAA/////0pLAABMSwAATksAAFBLAABSSwAAVEsAAFZLAABYSwAA/////1pLAABcSwAAXksAAGBLAABiSwAAZEsAAP//////////////////////////////////////////ZksAAGhLAAD//////////2pLAABsSwAAbksAAHBLAAD///////////////9ySwAAdEsAAHZLAAB4SwAAeksAAHxLAAB+SwAAgEsAAP////+CSwAAhEsAAIZLAACISwAAiksAAP////+MSwAAjksAAP///////////////5BLAAD/////kksAAJRLAAD//////////5ZLAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////5lLAACbSwAAnUsAAJ9LAAChSwAAo0sAAKVLAACnSwAAqUsAAKtLAACtSwAAr0sAALFLAACzSwAA/////7VLAAC3SwAAuUsAALtLAAC9SwAAv0sAAMFLAADDSwAAxUsAAP/////HSwAAyUsAAP//////////y0sAAM1LAADPSwAA0UsAANNLAAD/////1UsAANdLAADZSwAA20sAAN1LAADfSwAA/////+FLAAD/////40sAAP///////////////////////////////+VLAADnSwAA6UsAAOtLAADtSwAA70sAAPFLAADzSwAA9UsAAPdLAAD///////////lLAAD/////+0sAAP1LAAD/SwAAAUwAAANMAAAFTAAAB0wAAAlMAAD//////////wtMAAANTAAAD0wAAP////8RTAAAE0wAABVMAAAXTAAAGUwAABtMAAAdTAAAH0wAACFMAAAjTAAAJUwAAP////8nTAAAKUwAACtMAAAtTAAA/////y9MAAAxTAAAM0wAADVMAAA3TAAAOUwAADtMAAA9TAAA/////z9MAABBTAAAQ0wAAEVMAABHTAAASUwAAEtMAABNTAAAT0wAAFFMAAD/////////////////////U0wAAFVMAAD/////////////////////V0wAAFlMAABbTAAAXUwAAF9MAABhTAAAY0wAAGVMAABnTAAAaUwAAP////9rTAAAbUwAAG9MAABxTAAAc0wAAHVMAAD/////d0wAAHlMAAB7TAAAfUwAAH9MAAD///////////////+BTAAAg0wAAIVMAACHTAAA/////4lMAAD///////////////+LTAAA/////41MAACPTAAA/////5FMAACTTAAAlUwAAJdMAAD//////////5lMAACbTAAAnUwAAJ9MAAChTAAA/////6NMAAClTAAAp0wAAKlMAACrTAAArUwAAP////+vTAAA/////7FMAACzTAAAtUwAALdMAAC5TAAAu0wAAP////+9TAAAv0wAAMFMAADDTAAAxUwAAMdMAADJTAAAy0wAAM1MAADPTAAA0UwAANNMAADVTAAA10wAANlMAADbTAAA3UwAAP/////fTAAA4UwAAONMAADlTAAA50wAAOlMAAD/////60wAAO1MAADvTAAA8UwAAPNMAAD1TAAA//////dMAAD5TAAA+0wAAP1MAAD/TAAA/////wFNAAADTQAABU0AAAdNAAAJTQAAC00AAP///////////////////////////////////////////////w1NAAAPTQAA/////xFNAAATTQAAFU0AABdNAAAZTQAAG00AAB1NAAAfTQAAIU0AACNNAAAlTQAAJ00AAClNAAArTQAALU0AAC9NAAAxTQAAM00AAP////81TQAAN00AADlNAAA7TQAAPU0AAD9NAABBTQAAQ00AAEVNAABHTQAASU0AAEtNAABNTQAAT00AAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////1JNAABUTQAAVk0AAFhNAABaTQAAXE0AAF5NAABgTQAAYk0AAGRNAABmTQAAaE0AAGpNAABsTQAAbk0AAHBNAAByTQAAdE0AAHZNAAB4TQAAek0AAHxNAAB+TQAA//////////+ATQAAgk0AAIRNAACGTQAAiE0AAIpNAACMTQAA/////45NAACQTQAAkk0AAJRNAACWTQAAmE0AAJpNAACcTQAAnk0AAP////+gTQAA/////6JNAAD/////pE0AAKZNAACoTQAAqk0AAKxNAACuTQAAsE0AALJNAAC0TQAAtk0AALhNAAC6TQAAvE0AAP////++TQAA/////8BNAADCTQAAxE0AAMZNAADITQAAyk0AAMxNAADOTQAA0E0AANJNAADUTQAA1k0AANhNAADaTQAA3E0AAP//////////3k0AAP//////////4E0AAOJNAAD/////5E0AAOZNAADoTQAA/////+pNAADsTQAA7k0AAP////////////////BNAAD///////////JNAAD0TQAA9k0AAP/////4TQAA+k0AAPxNAAD+TQAA//////////8ATgAAAk4AAAROAAAGTgAACE4AAApOAAAMTgAADk4AAP//////////EE4AABJOAAAUTgAAFk4AABhOAAD/////Gk4AABxOAAAeTgAAIE4AACJOAAAkTgAA/////yZOAAD//////////yhOAAAqTgAA//////////8sTgAALk4AAP//////////ME4AADJOAAA0TgAANk4AADhOAAA6TgAAPE4AAD5OAABATgAAQk4AAP////9ETgAARk4AAP///////////////0hOAABKTgAATE4AAE5OAABQTgAAUk4AAP//////////VE4AAFZOAABYTgAAWk4AAP////9cTgAAXk4AAGBOAABiTgAAZE4AAGZOAABoTgAAak4AAGxOAAD/////bk4AAHBOAAD/////ck4AAHROAAB2TgAA////////////////eE4AAHpOAAB8TgAAfk4AAIBOAACCTgAA/////4ROAACGTgAAiE4AAIpOAACMTgAA/////45OAACQTgAAkk4AAJROAAD/////lk4AAJhOAACaTgAAnE4AAJ5OAACgTgAA/////6JOAACkTgAA/////6ZOAAD/////qE4AAKpOAACsTgAArk4AALBOAACyTgAAtE4AALZOAAC4TgAAuk4AAP//////////vE4AAL5OAADATgAAwk4AAP/////ETgAA/////8ZOAAD/////yE4AAMpOAAD/////zE4AAP/////OTgAA0E4AAP/////STgAA1E4AANZOAAD//////////9hOAADaTgAA/////9xOAAD////////////////eTgAA4E4AAOJOAADkTgAA5k4AAOhOAADqTgAA7E4AAP/////uTgAA8E4AAPJOAAD0TgAA9k4AAPhOAAD6TgAA/E4AAP5OAAAATwAA//////////////////////////////////////////8CTwAABE8AAAZPAAD/////CE8AAApPAAAMTwAADk8AABBPAAASTwAAFE8AAP////8WTwAAGE8AABpPAAD//////////xxPAAD/////Hk8AACBPAAAiTwAAJE8AACZPAAD///////////////////////////////8oTwAAKk8AACxPAAD/////Lk8AADBPAAAyTwAANE8AAP//////////Nk8AADhPAAA6TwAAPE8AAD5PAABATwAA/////////////////////0JPAAD/////RE8AAEZPAAD//////////0hPAAD/////Sk8AAP////9MTwAATk8AAFBPAABSTwAAVE8AAFZPAABYTwAA////////////////Wk8AAFxPAAD//////////15PAABgTwAA/////2JPAABkTwAAZk8AAGhPAAD//////////////////////////2pPAAD//////////2xPAAD/////bk8AAP//////////cE8AAHJPAAD///////////////90TwAAdk8AAHhPAAB6TwAAfE8AAH5PAAD///////////////+ATwAA/////4JPAAD/////hE8AAP//////////hk8AAIhPAAD///////////////+KTwAA////////////////////////////////jE8AAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////49PAACRTwAAk08AAJVPAACXTwAAmU8AAJtPAACdTwAAn08AAKFPAACjTwAA//////////+lTwAAp08AAKlPAACrTwAArU8AAP////+vTwAAsU8AALNPAAC1TwAAt08AALlPAAD//////////7tPAAC9TwAAv08AAMFPAADDTwAAxU8AAMdPAADJTwAAy08AAM1PAADPTwAA/////9FPAAD//////////////////////////9NPAADVTwAA108AANlPAADbTwAA3U8AAN9PAADhTwAA408AAOVPAADnTwAA6U8AAP//////////608AAO1PAADvTwAA8U8AAPNPAAD1TwAA908AAP//////////+U8AAPtPAAD9TwAA/08AAAFQAAADUAAABVAAAP////8HUAAACVAAAAtQAAD//////////w1QAAAPUAAAEVAAABNQAAAVUAAAF1AAABlQAAAbUAAAHVAAAB9QAAAhUAAAI1AAACVQAAAnUAAAKVAAACtQAAAtUAAAL1AAADFQAAAzUAAA/////zVQAAA3UAAAOVAAAP////87UAAA/////z1QAAA/UAAAQVAAAP///////////////////////////////0NQAAD///////////////9FUAAAR1AAAElQAABLUAAATVAAAE9QAAD/////UVAAAFNQAAD/////VVAAAP////9XUAAAWVAAAFtQAABdUAAA//////////9fUAAAYVAAAGNQAABlUAAAZ1AAAGlQAABrUAAAbVAAAP////9vUAAAcVAAAHNQAAB1UAAAd1AAAHlQAAB7UAAAfVAAAH9QAACBUAAAg1AAAIVQAACHUAAAiVAAAItQAAD/////jVAAAI9QAACRUAAA//////////+TUAAAlVAAAJdQAACZUAAAm1AAAP////+dUAAA/////59QAAChUAAAo1AAAKVQAAD//////////////////////////6dQAAD///////////////+pUAAAq1AAAK1QAAD/////r1AAAP////////////////////+xUAAAs1AAALVQAAC3UAAAuVAAAP////+7UAAAvVAAAL9QAAD//////////8FQAADDUAAAxVAAAMdQAAD//////////8lQAAD/////y1AAAM1QAADPUAAA/////9FQAAD/////01AAAP//////////1VAAANdQAADZUAAA21AAAN1QAADfUAAA4VAAAONQAADlUAAA51AAAOlQAADrUAAA7VAAAO9QAADxUAAA81AAAPVQAAD3UAAA+VAAAPtQAAD9UAAA/1AAAAFRAAADUQAABVEAAAdRAAAJUQAAC1EAAP///////////////////////////////w1RAAAPUQAAEVEAABNRAAAVUQAAF1EAABlRAAAbUQAA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////x5RAAAgUQAAIlEAACRRAAAmUQAAKFEAACpRAAAsUQAALlEAADBRAAAyUQAANFEAADZRAAD//////////zhRAAA6UQAAPFEAAD5RAABAUQAAQlEAAERRAABGUQAASFEAAEpRAABMUQAA/////05RAABQUQAAUlEAAFRRAABWUQAAWFEAAP////9aUQAAXFEAAF5RAAD/////YFEAAGJRAAD/////ZFEAAGZRAABoUQAA/////2pRAABsUQAA/////25RAABwUQAAclEAAHRRAAB2UQAAeFEAAHpRAAB8UQAAflEAAIBRAACCUQAAhFEAAP////+GUQAAiFEAAIpRAACMUQAAjlEAAJBRAAD/////////////////////klEAAP//////////lFEAAP//////////////////////////llEAAP//////////mFEAAJpRAACcUQAAnlEAAKBRAACiUQAApFEAAKZRAACoUQAAqlEAAKxRAACuUQAAsFEAALJRAAC0UQAAtlEAALhRAAC6UQAAvFEAAL5RAADAUQAAwlEAAMRRAAD/////xlEAAMhRAADKUQAAzFEAAP//////////zlEAAP//////////////////////////0FEAANJRAAD//////////9RRAADWUQAA2FEAANpRAADcUQAA3lEAAOBRAADiUQAA5FEAAP/////mUQAA6FEAAOpRAADsUQAA7lEAAPBRAAD/////8lEAAPRRAAD2UQAA+FEAAPpRAAD8UQAA/lEAAABSAAACUgAABFIAAAZSAAAIUgAAClIAAAxSAAAOUgAAEFIAABJSAAAUUgAAFlIAABhSAAAaUgAAHFIAAB5SAAD///////////////8gUgAAIlIAACRSAAD/////////////////////JlIAAChSAAAqUgAA////////////////LFIAAC5SAAD/////MFIAADJSAAA0UgAA////////////////////////////////NlIAADhSAAA6UgAAPFIAAP//////////PlIAAEBSAAD//////////0JSAABEUgAA/////0ZSAABIUgAASlIAAP//////////TFIAAP////9OUgAA/////1BSAABSUgAAVFIAAP////9WUgAAWFIAAFpSAABcUgAAXlIAAGBSAAD/////YlIAAGRSAAD/////ZlIAAGhSAABqUgAAbFIAAG5SAABwUgAA/////3JSAAB0UgAAdlIAAHhSAAB6UgAAfFIAAH5SAACAUgAAglIAAIRSAACGUgAAiFIAAIpSAACMUgAAjlIAAJBSAACSUgAAlFIAAP////+WUgAA/////5hSAACaUgAAnFIAAJ5SAACgUgAAolIAAKRSAACmUgAA//////////+oUgAAqlIAAKxSAACuUgAA//////////////////////////+wUgAA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////7NSAAC1UgAAt1IAALlSAAC7UgAAvVIAAL9SAADBUgAAw1IAAMVSAADHUgAAyVIAAMtSAAD//////////81SAADPUgAA0VIAAP/////TUgAA1VIAANdSAAD/////2VIAANtSAAD//////////91SAADfUgAA4VIAAP/////jUgAA5VIAAOdSAADpUgAA61IAAO1SAAD//////////+9SAAD/////8VIAAPNSAAD1UgAA91IAAPlSAAD////////////////7UgAA/VIAAP9SAAABUwAAA1MAAAVTAAAHUwAACVMAAP//////////C1MAAP////////////////////8NUwAA/////w9TAAARUwAAE1MAABVTAAAXUwAAGVMAABtTAAAdUwAAH1MAACFTAAAjUwAAJVMAACdTAAApUwAAK1MAAC1TAAAvUwAAMVMAADNTAAD//////////zVTAAD/////N1MAAP////85UwAA/////ztTAAD//////////z1TAAA/UwAAQVMAAENTAABFUwAAR1MAAP////9JUwAAS1MAAE1TAABPUwAAUVMAAFNTAABVUwAAV1MAAFlTAABbUwAAXVMAAF9TAABhUwAAY1MAAGVTAABnUwAAaVMAAGtTAABtUwAAb1MAAHFTAABzUwAAdVMAAHdTAAB5UwAAe1MAAP////99UwAA/////////////////////39TAAD///////////////+BUwAA/////4NTAAD/////hVMAAIdTAACJUwAA/////4tTAACNUwAA//////////+PUwAAkVMAAJNTAACVUwAAl1MAAJlTAACbUwAAnVMAAJ9TAAChUwAAo1MAAKVTAACnUwAAqVMAAKtTAACtUwAAr1MAALFTAACzUwAA//////////+1UwAAt1MAALlTAAC7UwAAvVMAAL9TAADBUwAA/////8NTAADFUwAAx1MAAMlTAADLUwAAzVMAAP/////PUwAA0VMAANNTAADVUwAA11MAANlTAAD/////21MAAN1TAAD////////////////fUwAA4VMAAP//////////////////////////41MAAP/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////mUwAA6FMAAOpTAADsUwAA7lMAAPBTAAD/////8lMAAPRTAAD2UwAA+FMAAPpTAAD//////FMAAP5TAAAAVAAAAlQAAARUAAAGVAAA/////whUAAD/////ClQAAAxUAAAOVAAAEFQAABJUAAAUVAAAFlQAABhUAAD/////GlQAABxUAAD/////HlQAACBUAAAiVAAA/////yRUAAAmVAAAKFQAACpUAAAsVAAA/////y5UAAD/////MFQAADJUAAD//////////////////////////zRUAAA2VAAAOFQAAP///////////////zpUAAA8VAAAPlQAAEBUAABCVAAA/////0RUAABGVAAASFQAAEpUAABMVAAATlQAAFBUAABSVAAA/////////////////////1RUAABWVAAAWFQAAP////9aVAAA/////1xUAABeVAAA//////////9gVAAA/////2JUAAD/////ZFQAAP///////////////2ZUAABoVAAAalQAAGxUAABuVAAAcFQAAP////9yVAAA/////3RUAAB2VAAAeFQAAHpUAAB8VAAAflQAAIBUAACCVAAA////////////////hFQAAP///////////////4ZUAACIVAAA/////4pUAAD///////////////+MVAAAjlQAAP////+QVAAAklQAAJRUAACWVAAAmFQAAJpUAACcVAAAnlQAAP////+gVAAAolQAAKRUAAD/////////////////////plQAAKhUAACqVAAArFQAAK5UAACwVAAA/////7JUAAC0VAAAtlQAAP////+4VAAA//////////////////////////+6VAAAvFQAAL5UAAD/////wFQAAMJUAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////xVQAAMdUAADJVAAAy1QAAM1UAADPVAAA/////9FUAADTVAAA1VQAANdUAADZVAAA21QAAN1UAADfVAAA4VQAAONUAADlVAAA51QAAOlUAADrVAAA7VQAAO9UAADxVAAA81QAAPVUAAD3VAAA+VQAAPtUAAD9VAAA/1QAAAFVAAADVQAABVUAAP///////////////wdVAAAJVQAAC1UAAA1VAAAPVQAAEVUAABNVAAAVVQAAF1UAABlVAAAbVQAAHVUAAB9VAAAhVQAAI1UAACVVAAAnVQAAKVUAACtVAAAtVQAAL1UAADFVAAAzVQAANVUAADdVAAD/////OVUAADtVAAA9VQAAP1UAAEFVAABDVQAARVUAAEdVAABJVQAA/////0tVAABNVQAAT1UAAFFVAABTVQAAVVUAAFdVAABZVQAAW1UAAF1VAABfVQAAYVUAAGNVAABlVQAAZ1UAAGlVAABrVQAAbVUAAG9VAABxVQAAc1UAAHVVAAB3VQAAeVUAAHtVAAB9VQAAf1UAAIFVAACDVQAA//////////+FVQAAh1UAAP////+JVQAAi1UAAI1VAACPVQAAkVUAAJNVAACVVQAAl1UAAP//////////mVUAAJtVAACdVQAAn1UAAKFVAACjVQAApVUAAKdVAACpVQAAq1UAAK1VAACvVQAAsVUAALNVAAC1VQAAt1UAALlVAAD/////u1UAAL1VAAC/VQAAwVUAAMNVAADFVQAAx1UAAMlVAADLVQAAzVUAAM9VAADRVQAA01UAANVVAADXVQAA2VUAANtVAADdVQAA31UAAOFVAADjVQAA5VUAAOdVAADpVQAA/////+tVAADtVQAA/////+9VAADxVQAA81UAAPVVAAD3VQAA+VUAAPtVAAD9VQAA/1UAAAFWAAADVgAABVYAAAdWAAAJVgAAC1YAAA1WAAD/////D1YAABFWAAATVgAAFVYAABdWAAAZVgAA//////////////////////////////////////////8bVgAA//////////8dVgAAH1YAACFWAAAjVgAAJVYAACdWAAApVgAAK1YAAC1WAAAvVgAAMVYAADNWAAA1VgAAN1YAADlWAAA7VgAAPVYAAP//////////P1YAAEFWAABDVgAARVYAAEdWAABJVgAA//////////9LVgAA/////01WAABPVgAAUVYAAFNWAABVVgAAV1YAAFlWAAD/////W1YAAF1WAABfVgAAYVYAAGNWAABlVgAAZ1YAAGlWAABrVgAA/////21WAABvVgAA/////3FWAABzVgAAdVYAAHdWAAB5VgAAe1YAAH1WAAB/VgAAgVYAAINWAACFVgAAh1YAAP//////////iVYAAP//////////i1YAAI1WAAD//////////49WAAD//////////5FWAACTVgAAlVYAAJdWAACZVgAAm1YAAJ1WAACfVgAAoVYAAKNWAAClVgAAp1YAAP////////////////////+pVgAAq1YAAK1WAACvVgAAsVYAALNWAAD/////tVYAALdWAAC5VgAAu1YAAP////+9VgAAv1YAAMFWAAD/////w1YAAMVWAADHVgAAyVYAAMtWAADNVgAAz1YAANFWAADTVgAA1VYAANdWAADZVgAA21YAAN1WAADfVgAA4VYAAP//////////41YAAOVWAADnVgAA6VYAAP/////rVgAA7VYAAO9WAADxVgAA////////////////81YAAPVWAAD3VgAA+VYAAPtWAAD9VgAA/1YAAAFXAAD/////A1cAAP//////////BVcAAAdXAAAJVwAAC1cAAA1XAAAPVwAAEVcAABNXAAAVVwAAF1cAABlXAAAbVwAAHVcAAB9XAAAhVwAA//////////8jVwAAJVcAACdXAAApVwAAK1cAAC1XAAAvVwAAMVcAADNXAAD/////NVcAADdXAAA5VwAAO1cAAD1XAAA/VwAAQVcAAENXAABFVwAA//////////9HVwAASVcAAEtXAABNVwAAT1cAAFFXAABTVwAAVVcAAFdXAABZVwAA/////1tXAABdVwAAX1cAAGFXAABjVwAAZVcAAGdXAABpVwAAa1cAAP//////////bVcAAG9XAAD/////cVcAAHNXAAD/////dVcAAP////93VwAAeVcAAP//////////e1cAAH1XAAB/VwAAgVcAAP////+DVwAA/////4VXAACHVwAAiVcAAP////+LVwAAjVcAAI9XAACRVwAAk1cAAJVXAACXVwAAmVcAAJtXAACdVwAAn1cAAKFXAACjVwAApVcAAKdXAACpVwAAq1cAAK1XAACvVwAA//////////+xVwAAs1cAALVXAAC3VwAA////////////////uVcAALtXAAC9VwAAv1cAAMFXAADDVwAAxVcAAMdXAADJVwAA/////8tXAADNVwAAz1cAAP//////////0VcAANNXAAD/////1VcAAP/////XVwAA2VcAANtXAADdVwAA31cAAOFXAADjVwAA5VcAAOdXAADpVwAA61cAAO1XAADvVwAA////////////////8VcAAPNXAAD1VwAA91cAAPlXAAD////////////////////////////////7VwAA/VcAAP//////VwAAAVgAAANYAAAFWAAAB1gAAAlYAAALWAAADVgAAA9YAAARWAAA/////xNYAAAVWAAAF1gAABlYAAAbWAAAHVgAAB9YAAAhWAAAI1gAACVYAAAnWAAAKVgAACtYAAAtWAAAL1gAADFYAAAzWAAANVgAAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////zhYAAA6WAAAPFgAAD5YAABAWAAA/////0JYAABEWAAARlgAAEhYAABKWAAATFgAAP////9OWAAAUFgAAFJYAABUWAAAVlgAAP////9YWAAAWlgAAP////9cWAAAXlgAAGBYAABiWAAAZFgAAGZYAABoWAAAalgAAGxYAABuWAAAcFgAAHJYAAB0WAAA/////3ZYAAB4WAAAelgAAHxYAAB+WAAAgFgAAP////+CWAAAhFgAAIZYAACIWAAAilgAAIxYAACOWAAAkFgAAJJYAACUWAAAllgAAJhYAACaWAAAnFgAAJ5YAACgWAAAolgAAP////+kWAAA/////6ZYAAD//////////////////////////6hYAACqWAAArFgAAK5YAACwWAAAslgAALRYAAD//////////7ZYAAC4WAAAulgAAP//////////vFgAAL5YAADAWAAA/////8JYAAD/////xFgAAMZYAADIWAAAylgAAMxYAADOWAAA///////////QWAAA0lgAANRYAADWWAAA2FgAANpYAADcWAAA3lgAAOBYAADiWAAA5FgAAOZYAADoWAAA///////////qWAAA7FgAAO5YAADwWAAA8lgAAPRYAAD2WAAA+FgAAPpYAAD8WAAA/lgAAABZAAACWQAABFkAAP////////////////////8GWQAA/////whZAAD/////ClkAAP////8MWQAA/////w5ZAAD//////////xBZAAASWQAAFFkAABZZAAAYWQAAGlkAAP//////////HFkAAP////8eWQAAIFkAAP////8iWQAA/////yRZAAAmWQAAKFkAACpZAAAsWQAALlkAADBZAAAyWQAANFkAADZZAAA4WQAAOlkAADxZAAA+WQAAQFkAAEJZAABEWQAA//////////9GWQAASFkAAEpZAAD///////////////9MWQAATlkAAFBZAABSWQAAVFkAAFZZAABYWQAAWlkAAFxZAABeWQAAYFkAAGJZAABkWQAAZlkAAGhZAABqWQAAbFkAAG5ZAABwWQAAclkAAHRZAAB2WQAAeFkAAHpZAAB8WQAA////////////////flkAAIBZAACCWQAA/////4RZAACGWQAA//////////+IWQAAilkAAIxZAACOWQAAkFkAAP////+SWQAA/////5RZAACWWQAAmFkAAJpZAACcWQAAnlkAAP////+gWQAAolkAAKRZAACmWQAAqFkAAP//////////qlkAAP//////////////////////////rFkAAK5ZAACwWQAAslkAALRZAAC2WQAAuFkAALpZAAC8WQAAvlkAAMBZAADCWQAAxFkAAMZZAADIWQAAylkAAMxZAADOWQAA0FkAANJZAADUWQAA1lkAANhZAADaWQAA3FkAAN5ZAAD////////////////gWQAA///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////jWQAA5VkAAOdZAADpWQAA61kAAO1ZAADvWQAA8VkAAPNZAAD1WQAA91kAAPlZAAD7WQAA//////1ZAAD/WQAAAVoAAANaAAAFWgAAB1oAAAlaAAALWgAADVoAAP//////////D1oAABFaAAD//////////xNaAAD/////FVoAABdaAAAZWgAA/////xtaAAAdWgAAH1oAACFaAAAjWgAAJVoAACdaAAApWgAAK1oAAC1aAAD/////L1oAAP//////////MVoAADNaAAD/////NVoAADdaAAA5WgAAO1oAAD1aAAA/WgAAQVoAAP////9DWgAARVoAAEdaAABJWgAAS1oAAE1aAABPWgAAUVoAAFNaAAD/////VVoAAFdaAABZWgAAW1oAAP////9dWgAAX1oAAP//////////YVoAAGNaAABlWgAAZ1oAAP////9pWgAAa1oAAG1aAABvWgAAcVoAAP////9zWgAA//////////91WgAAd1oAAP//////////eVoAAHtaAAB9WgAAf1oAAIFaAACDWgAAhVoAAIdaAACJWgAAi1oAAI1aAACPWgAAkVoAAJNaAACVWgAA/////5daAACZWgAA//////////+bWgAA//////////+dWgAA/////59aAAD//////////6FaAACjWgAApVoAAKdaAACpWgAAq1oAAK1aAACvWgAAsVoAALNaAAC1WgAA/////7daAAC5WgAA//////////+7WgAA/////71aAAC/WgAAwVoAAMNaAADFWgAAx1oAAP/////JWgAAy1oAAP/////NWgAAz1oAANFaAADTWgAA1VoAANdaAAD////////////////ZWgAA21oAAN1aAADfWgAA4VoAAONaAADlWgAA51oAAOlaAADrWgAA7VoAAO9aAADxWgAA//////NaAAD1WgAA91oAAP/////5WgAA+1oAAP/////9WgAA//////9aAAABWwAA/////wNbAAD///////////////8FWwAAB1sAAAlbAAALWwAADVsAAA9bAAARWwAAE1sAABVbAAAXWwAAGVsAABtbAAAdWwAAH1sAACFbAAAjWwAAJVsAACdbAAApWwAAK1sAAP///////////////y1bAAAvWwAA/////zFbAAAzWwAA/////zVbAAA3WwAA/////zlbAAD/////O1sAAD1bAAA/WwAAQVsAAENbAABFWwAAR1sAAElbAABLWwAA//////////9NWwAAT1sAAFFbAAD/////U1sAAP////9VWwAAV1sAAP////9ZWwAAW1sAAF1bAABfWwAAYVsAAGNbAAD/////ZVsAAGdbAABpWwAAa1sAAG1bAAD/////b1sAAHFbAABzWwAAdVsAAHdbAAB5WwAA/////////////////////3tbAAB9WwAAf1sAAIFbAACDWwAA/////4VbAACHWwAAiVsAAItbAAD/////jVsAAP//////////j1sAAP////+RWwAA//////////+TWwAAlVsAAP///////////////////////////////5dbAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////mlsAAJxbAACeWwAAoFsAAKJbAAD/////pFsAAKZbAACoWwAAqlsAAKxbAACuWwAA/////7BbAACyWwAAtFsAALZbAAD//////////7hbAAC6WwAA/////7xbAAC+WwAAwFsAAMJbAADEWwAAxlsAAMhbAADKWwAAzFsAAM5bAADQWwAA0lsAANRbAADWWwAA2FsAANpbAADcWwAA3lsAAOBbAAD//////////+JbAADkWwAA5lsAAOhbAADqWwAA7FsAAO5bAAD/////8FsAAPJbAAD0WwAA9lsAAPhbAAD/////+lsAAPxbAAD+WwAAAFwAAP////////////////////8CXAAABFwAAAZcAAAIXAAAClwAAAxcAAAOXAAAEFwAABJcAAAUXAAAFlwAABhcAAAaXAAAHFwAAB5cAAAgXAAAIlwAACRcAAAmXAAAKFwAACpcAAAsXAAALlwAADBcAAAyXAAANFwAADZcAAA4XAAA/////zpcAAD/////PFwAAD5cAAD/////QFwAAEJcAABEXAAARlwAAEhcAABKXAAATFwAAE5cAABQXAAAUlwAAFRcAAD/////VlwAAFhcAAD/////WlwAAFxcAABeXAAAYFwAAGJcAABkXAAAZlwAAGhcAABqXAAAbFwAAG5cAABwXAAAclwAAP//////////dFwAAHZcAAB4XAAAelwAAP////98XAAAflwAAIBcAACCXAAAhFwAAIZcAACIXAAA//////////+KXAAAjFwAAI5cAACQXAAAklwAAJRcAACWXAAA/////////////////////5hcAACaXAAAnFwAAJ5cAACgXAAAolwAAKRcAACmXAAAqFwAAP//////////qlwAAKxcAAD/////rlwAAP////+wXAAAslwAALRcAAC2XAAAuFwAALpcAAC8XAAAvlwAAMBcAADCXAAAxFwAAP/////////////////////GXAAA/////8hcAADKXAAA/////////////////////8xcAADOXAAA/////9BcAADSXAAA/////9RcAADWXAAA2FwAANpcAADcXAAA3lwAAOBcAADiXAAA5FwAAOZcAADoXAAA/////+pcAAD//////////+xcAAD//////////+5cAADwXAAA8lwAAPRcAAD2XAAA+FwAAPpcAAD///////////////////////////xcAAD//////lwAAP////8AXQAAAl0AAARdAAD/////Bl0AAAhdAAAKXQAA/////wxdAAAOXQAAEF0AABJdAAAUXQAAFl0AAP//////////GF0AABpdAAAcXQAAHl0AACBdAAAiXQAAJF0AACZdAAAoXQAA/////ypdAAD/////LF0AAC5dAAAwXQAAMl0AAP////80XQAANl0AADhdAAA6XQAAPF0AAD5dAABAXQAAQl0AAERdAABGXQAASF0AAP////////////////////9KXQAA/////0xdAABOXQAAUF0AAP///////////////1JdAABUXQAAVl0AAFhdAAD//////////1pdAABcXQAA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////X10AAGFdAABjXQAAZV0AAGddAABpXQAAa10AAG1dAABvXQAAcV0AAP////9zXQAA/////3VdAAD/////d10AAHldAAB7XQAAfV0AAH9dAAD/////gV0AAP////+DXQAAhV0AAIddAACJXQAAi10AAI1dAACPXQAAkV0AAJNdAACVXQAAl10AAP///////////////5ldAAD/////m10AAP////+dXQAAn10AAKFdAACjXQAApV0AAP////+nXQAA/////6ldAACrXQAArV0AAK9dAAD/////sV0AALNdAAC1XQAA/////7ddAAD/////////////////////uV0AALtdAAC9XQAAv10AAMFdAADDXQAAxV0AAMddAADJXQAAy10AAM1dAADPXQAA0V0AANNdAAD//////////9VdAADXXQAA////////////////2V0AANtdAADdXQAA/////99dAAD/////4V0AAONdAADlXQAA510AAOldAADrXQAA7V0AAO9dAADxXQAA///////////zXQAA9V0AAPddAAD5XQAA+10AAP1dAAD/XQAAAV4AAANeAAD/////BV4AAAdeAAAJXgAAC14AAA1eAAD/////D14AABFeAAATXgAA/////xVeAAD/////F14AAP////////////////////8ZXgAA//////////8bXgAA/////x1eAAAfXgAAIV4AACNeAAAlXgAA/////ydeAAApXgAAK14AAC1eAAAvXgAAMV4AADNeAAA1XgAAN14AADleAAA7XgAAPV4AAD9eAABBXgAAQ14AAEVeAABHXgAASV4AAEteAABNXgAAT14AAP////9RXgAA/////1NeAABVXgAAV14AAP////9ZXgAA/////////////////////1teAAD/////////////////////XV4AAF9eAABhXgAA//////////9jXgAAZV4AAGdeAABpXgAA/////2teAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////25eAABwXgAAcl4AAHReAAB2XgAAeF4AAHpeAAB8XgAAfl4AAIBeAACCXgAA//////////+EXgAA/////4ZeAACIXgAAil4AAIxeAACOXgAAkF4AAJJeAACUXgAAll4AAP////+YXgAAml4AAJxeAACeXgAAoF4AAKJeAAD/////pF4AAP//////////pl4AAKheAACqXgAArF4AAP////+uXgAA//////////+wXgAAsl4AALReAAC2XgAA/////////////////////7heAAC6XgAA/////7xeAAC+XgAAwF4AAMJeAADEXgAAxl4AAP//////////////////////////yF4AAMpeAADMXgAAzl4AANBeAADSXgAA///////////UXgAA1l4AANheAADaXgAA/////////////////////9xeAADeXgAA4F4AAOJeAADkXgAA5l4AAOheAADqXgAA7F4AAO5eAAD///////////BeAADyXgAA9F4AAP/////2XgAA+F4AAP/////6XgAA/F4AAP5eAAD/////AF8AAAJfAAAEXwAABl8AAAhfAAAKXwAADF8AAA5fAAD/////EF8AABJfAAAUXwAAFl8AABhfAAAaXwAAHF8AAB5fAAAgXwAAIl8AACRfAAAmXwAAKF8AACpfAAAsXwAALl8AADBfAAAyXwAANF8AAP///////////////zZfAAA4XwAAOl8AADxfAAA+XwAAQF8AAP////9CXwAARF8AAEZfAABIXwAASl8AAP//////////TF8AAE5fAABQXwAAUl8AAFRfAABWXwAAWF8AAP////9aXwAAXF8AAP//////////Xl8AAGBfAAD/////Yl8AAP//////////ZF8AAGZfAABoXwAA/////2pfAABsXwAAbl8AAHBfAAByXwAAdF8AAHZfAAB4XwAAel8AAHxfAAB+XwAAgF8AAIJfAACEXwAAhl8AAIhfAACKXwAA/////4xfAACOXwAA////////////////kF8AAJJfAACUXwAAll8AAJhfAAD///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////+bXwAAnV8AAJ9fAAChXwAAo18AAKVfAACnXwAAqV8AAKtfAACtXwAAr18AALFfAACzXwAA/////7VfAAC3XwAAuV8AALtfAAC9XwAAv18AAMFfAADDXwAAxV8AAMdfAAD//////////8lfAAD//////////8tfAADNXwAAz18AANFfAAD/////018AANVfAADXXwAA2V8AANtfAADdXwAA318AAOFfAADjXwAA5V8AAOdfAAD//////////+lfAAD/////618AAO1fAADvXwAA//////FfAADzXwAA9V8AAPdfAAD///////////lfAAD7XwAA//////1fAAD/XwAAAWAAAANgAAAFYAAAB2AAAAlgAAALYAAA/////w1gAAAPYAAAEWAAABNgAAAVYAAAF2AAABlgAAAbYAAA//////////8dYAAAH2AAACFgAAAjYAAAJWAAACdgAAApYAAAK2AAAC1gAAAvYAAAMWAAADNgAAD/////NWAAAP///////////////zdgAAA5YAAA/////ztgAAA9YAAAP2AAAEFgAAD//////////0NgAABFYAAAR2AAAP////9JYAAA/////0tgAAD/////TWAAAE9gAABRYAAAU2AAAFVgAABXYAAAWWAAAFtgAABdYAAAX2AAAGFgAABjYAAAZWAAAGdgAABpYAAAa2AAAG1gAABvYAAAcWAAAHNgAAB1YAAAd2AAAHlgAAB7YAAA/////31gAAB/YAAAgWAAAINgAACFYAAAh2AAAIlgAACLYAAAjWAAAI9gAACRYAAAk2AAAJVgAACXYAAAmWAAAJtgAACdYAAAn2AAAKFgAAD//////////6NgAAClYAAAp2AAAKlgAACrYAAArWAAAK9gAACxYAAA/////7NgAAC1YAAAt2AAAP////+5YAAAu2AAAP////+9YAAAv2AAAMFgAAD/////w2AAAMVgAADHYAAAyWAAAMtgAADNYAAAz2AAANFgAADTYAAA1WAAANdgAADZYAAA22AAAN1gAADfYAAA4WAAAONgAADlYAAA52AAAOlgAADrYAAA7WAAAO9gAADxYAAA82AAAPVgAAD3YAAA+WAAAPtgAAD9YAAA/2AAAAFhAAADYQAABWEAAAdhAAAJYQAAC2EAAA1hAAAPYQAAEWEAABNhAAAVYQAAF2EAABlhAAAbYQAAHWEAAP////8fYQAAIWEAACNhAAAlYQAA/////ydhAAApYQAAK2EAAC1hAAAvYQAAMWEAADNhAAA1YQAA/////zdhAAD///////////////85YQAA//////////87YQAAPWEAAD9hAAD///////////////9BYQAA/////0NhAABFYQAAR2EAAElhAAD/////////////////////S2EAAE1hAAD/////T2EAAFFhAAD/////U2EAAP////9VYQAAV2EAAFlhAAD/////W2EAAP////9dYQAAX2EAAGFhAABjYQAA////////////////ZWEAAP///////////////2dhAAD/////aWEAAGthAAD/////bWEAAP////9vYQAA////////////////cWEAAHNhAAB1YQAAd2EAAHlhAAB7YQAAfWEAAH9hAACBYQAAg2EAAP//////////hWEAAIdhAACJYQAAi2EAAI1hAACPYQAAkWEAAJNhAACVYQAAl2EAAJlhAACbYQAAnWEAAJ9hAAChYQAAo2EAAKVhAACnYQAAqWEAAKthAACtYQAAr2EAALFhAACzYQAAtWEAALdhAAC5YQAAu2EAAL1hAAD/////v2EAAMFhAADDYQAA/////8VhAADHYQAA/////////////////////8lhAADLYQAAzWEAAM9hAAD////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////SYQAA1GEAANZhAADYYQAA2mEAANxhAADeYQAA4GEAAOJhAADkYQAA5mEAAP//////////6GEAAP/////qYQAA7GEAAO5hAADwYQAA8mEAAPRhAAD2YQAA+GEAAPphAAD//////GEAAP5hAAAAYgAAAmIAAARiAAAGYgAA/////whiAAAKYgAADGIAAP////8OYgAAEGIAAP////8SYgAAFGIAABZiAAD/////GGIAABpiAAAcYgAAHmIAACBiAAAiYgAAJGIAACZiAAD//////////yhiAAAqYgAA//////////8sYgAALmIAADBiAAD//////////////////////////zJiAAD/////NGIAADZiAAD//////////zhiAAA6YgAAPGIAAD5iAABAYgAAQmIAAP////9EYgAARmIAAEhiAABKYgAATGIAAE5iAABQYgAAUmIAAFRiAABWYgAA/////1hiAABaYgAAXGIAAF5iAABgYgAA//////////9iYgAA////////////////ZGIAAGZiAABoYgAAamIAAGxiAABuYgAAcGIAAHJiAAB0YgAA/////3ZiAAB4YgAAemIAAHxiAAB+YgAA//////////+AYgAAgmIAAIRiAACGYgAAiGIAAIpiAACMYgAAjmIAAJBiAACSYgAAlGIAAJZiAACYYgAAmmIAAJxiAACeYgAA/////6BiAACiYgAApGIAAKZiAACoYgAAqmIAAKxiAAD/////rmIAALBiAACyYgAA/////////////////////7RiAAD/////tmIAALhiAAC6YgAAvGIAAL5iAADAYgAAwmIAAMRiAADGYgAAyGIAAMpiAAD//////////////////////////8xiAADOYgAA0GIAAP/////SYgAA1GIAANZiAADYYgAA2mIAANxiAADeYgAA4GIAAOJiAADkYgAA5mIAAP/////oYgAA6mIAAP/////sYgAA7mIAAPBiAADyYgAA9GIAAPZiAAD4YgAA+mIAAP/////8YgAA/mIAAABjAAACYwAABGMAAP///////////////wZjAAAIYwAACmMAAAxjAAD/////////////////////DmMAABBjAAASYwAAFGMAAP////8WYwAAGGMAAP////8aYwAAHGMAAP//////////////////////////////////////////HmMAAP////8gYwAA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////I2MAACVjAAAnYwAAKWMAACtjAAAtYwAAL2MAADFjAAAzYwAANWMAADdjAAA5YwAA/////ztjAAD/////PWMAAD9jAABBYwAAQ2MAAEVjAABHYwAASWMAAEtjAABNYwAAT2MAAFFjAAD/////U2MAAFVjAABXYwAAWWMAAFtjAABdYwAA/////19jAABhYwAAY2MAAGVjAABnYwAAaWMAAGtjAABtYwAAb2MAAP///////////////3FjAABzYwAA/////3VjAAB3YwAAeWMAAHtjAAB9YwAAf2MAAIFjAACDYwAAhWMAAIdjAACJYwAAi2MAAP///////////////////////////////41jAACPYwAAkWMAAJNjAACVYwAAl2MAAJljAACbYwAAnWMAAJ9jAAChYwAAo2MAAP////////////////////+lYwAAp2MAAP//////////qWMAAKtjAACtYwAAr2MAALFjAACzYwAAtWMAALdjAAC5YwAAu2MAAL1jAAC/YwAAwWMAAMNjAADFYwAAx2MAAP///////////////8ljAADLYwAAzWMAAM9jAADRYwAA02MAANVjAADXYwAA2WMAANtjAADdYwAA/////99jAAD/////////////////////4WMAAONjAADlYwAA52MAAOljAADrYwAA7WMAAO9jAADxYwAA82MAAPVjAAD3YwAA+WMAAPtjAAD9YwAA/2MAAAFkAAADZAAABWQAAP////8HZAAACWQAAAtkAAANZAAAD2QAABFkAAATZAAAFWQAABdkAAAZZAAAG2QAAB1kAAAfZAAAIWQAACNkAAAlZAAAJ2QAAClkAAArZAAALWQAAC9kAAAxZAAAM2QAADVkAAD//////////zdkAAA5ZAAAO2QAAD1kAAA/ZAAAQWQAAENkAABFZAAAR2QAAElkAABLZAAA/////01kAABPZAAAUWQAAFNkAABVZAAAV2QAAFlkAABbZAAAXWQAAF9kAABhZAAAY2QAAGVkAABnZAAAaWQAAP////9rZAAA/////21kAABvZAAAcWQAAHNkAAB1ZAAAd2QAAHlkAAB7ZAAAfWQAAH9kAACBZAAAg2QAAIVkAACHZAAAiWQAAItkAACNZAAA/////49kAACRZAAAk2QAAJVkAACXZAAAmWQAAJtkAACdZAAA/////59kAAChZAAA/////6NkAAClZAAAp2QAAKlkAACrZAAArWQAAP////+vZAAAsWQAALNkAAC1ZAAAt2QAALlkAAC7ZAAAvWQAAL9kAADBZAAAw2QAAMVkAADHZAAAyWQAAMtkAADNZAAAz2QAANFkAADTZAAA1WQAANdkAADZZAAA/////9tkAADdZAAA///////////fZAAA/////+FkAAD/////////////////////42QAAOVkAAD/////52QAAOlkAADrZAAA7WQAAP/////vZAAA///////////xZAAA82QAAPVkAAD3ZAAA+WQAAPtkAAD///////////1kAAD/ZAAA/////wFlAAADZQAA/////wVlAAD/////B2UAAAllAAALZQAADWUAAA9lAAARZQAA//////////8TZQAAFWUAABdlAAAZZQAAG2UAAB1lAAAfZQAAIWUAACNlAAAlZQAAJ2UAAP////8pZQAAK2UAAC1lAAAvZQAAMWUAADNlAAA1ZQAAN2UAADllAAA7ZQAAPWUAAP////8/ZQAA/////0FlAABDZQAARWUAAEdlAABJZQAAS2UAAP////9NZQAAT2UAAFFlAABTZQAAVWUAAP//////////V2UAAFllAAD///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////9cZQAAXmUAAGBlAABiZQAAZGUAAGZlAABoZQAAamUAAGxlAABuZQAAcGUAAHJlAAD/////dGUAAP////92ZQAAeGUAAHplAAB8ZQAAfmUAAIBlAAD/////gmUAAP//////////hGUAAP////+GZQAAiGUAAIplAACMZQAAjmUAAP//////////kGUAAJJlAACUZQAAlmUAAJhlAAD//////////5plAAD/////nGUAAJ5lAACgZQAA/////6JlAACkZQAApmUAAP////+oZQAAqmUAAKxlAACuZQAA//////////+wZQAAsmUAALRlAAC2ZQAAuGUAALplAAC8ZQAA/////75lAADAZQAAwmUAAMRlAADGZQAAyGUAAMplAADMZQAAzmUAANBlAAD/////0mUAANRlAADWZQAA2GUAANplAADcZQAA3mUAAP//////////4GUAAOJlAAD/////5GUAAOZlAADoZQAA/////+plAAD/////7GUAAP/////uZQAA///////////wZQAA8mUAAPRlAAD2ZQAA+GUAAPplAAD///////////xlAAD///////////5lAAD///////////////8AZgAA//////////8CZgAA//////////8EZgAA//////////8GZgAACGYAAApmAAAMZgAADmYAABBmAAD//////////xJmAAD/////FGYAAP///////////////////////////////xZmAAAYZgAA//////////////////////////8aZgAA/////xxmAAAeZgAAIGYAAP////8iZgAA/////yRmAAD/////JmYAAChmAAAqZgAALGYAAP////////////////////8uZgAA////////////////MGYAADJmAAA0ZgAA//////////82ZgAAOGYAADpmAAA8ZgAAPmYAAEBmAABCZgAARGYAAEZmAAD//////////0hmAAD//////////0pmAAD///////////////9MZgAA//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////9PZgAAUWYAAFNmAABVZgAAV2YAAFlmAABbZgAAXWYAAF9mAABhZgAAY2YAAGVmAAD//////////2dmAABpZgAAa2YAAG1mAABvZgAAcWYAAHNmAAB1ZgAAd2YAAP////95ZgAAe2YAAP////99ZgAAf2YAAIFmAACDZgAAhWYAAIdmAACJZgAAi2YAAI1mAACPZgAAkWYAAJNmAACVZgAAl2YAAJlmAACbZgAA/////////////////////51mAACfZgAAoWYAAKNmAAClZgAAp2YAAKlmAACrZgAArWYAAK9mAACxZgAAs2YAALVmAAC3ZgAAuWYAALtmAAC9ZgAAv2YAAMFmAADDZgAAxWYAAMdmAADJZgAAy2YAAM1mAAD/////z2YAANFmAADTZgAA1WYAANdmAADZZgAA22YAAN1mAADfZgAA4WYAAONmAADlZgAA52YAAOlmAADrZgAA7WYAAO9mAADxZgAA82YAAPVmAAD3ZgAA//////////////////////lmAAD7ZgAA//////1mAAD/ZgAAAWcAAANnAAAFZwAA/////wdnAAAJZwAAC2cAAA1nAAAPZwAAEWcAABNnAAAVZwAA//////////8XZwAAGWcAABtnAAAdZwAAH2cAACFnAAAjZwAA/////yVnAAAnZwAA//////////////////////////8pZwAAK2cAAC1nAAAvZwAAMWcAADNnAAA1ZwAAN2cAADlnAAA7ZwAAPWcAAD9nAABBZwAAQ2cAAEVnAABHZwAASWcAAEtnAABNZwAA//////////9PZwAAUWcAAFNnAABVZwAAV2cAAFlnAABbZwAA/////11nAAD/////X2cAAGFnAAD//////////2NnAAD/////ZWcAAGdnAAD//////////2lnAABrZwAAbWcAAG9nAABxZwAAc2cAAHVnAAD//////////3dnAAD//////////3lnAAB7ZwAAfWcAAH9nAACBZwAAg2cAAIVnAACHZwAAiWcAAItnAACNZwAAj2cAAJFnAACTZwAA/////////////////////5VnAACXZwAAmWcAAJtnAACdZwAAn2cAAKFnAACjZwAApWcAAKdnAACpZwAAq2cAAK1nAACvZwAAsWcAALNnAAD//////////7VnAAC3ZwAAuWcAALtnAAC9ZwAAv2cAAMFnAADDZwAAxWcAAMdnAADJZwAAy2cAAP//////////zWcAAM9nAADRZwAA02cAAP//////////1WcAANdnAADZZwAA/////9tnAADdZwAA32cAAP/////hZwAA42cAAOVnAADnZwAA6WcAAOtnAADtZwAA72cAAPFnAADzZwAA9WcAAPdnAAD5ZwAA+2cAAP1nAAD//////2cAAP///////////////wFoAAD///////////////8DaAAABWgAAAdoAAAJaAAA////////////////C2gAAP//////////DWgAAP////8PaAAAEWgAABNoAAAVaAAA//////////////////////////8XaAAAGWgAABtoAAAdaAAAH2gAACFoAAAjaAAA//////////8laAAAJ2gAACloAAAraAAALWgAAC9oAAAxaAAAM2gAADVoAAA3aAAAOWgAADtoAAA9aAAAP2gAAP////9BaAAAQ2gAAEVoAABHaAAASWgAAP////9LaAAA//////////9NaAAAT2gAAFFoAABTaAAAVWgAAFdoAABZaAAA/////1toAABdaAAA//////////9faAAA/////2FoAABjaAAAZWgAAP////9naAAAaWgAAGtoAABtaAAA/////29oAABxaAAAc2gAAHVoAAD//////////////////////////3doAAB5aAAA/////3toAAB9aAAAf2gAAIFoAACDaAAAhWgAAIdoAACJaAAAi2gAAI1oAACPaAAAkWgAAJNoAAD//////////5VoAACXaAAAmWgAAP////+baAAAnWgAAJ9oAAD/////oWgAAKNoAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////6ZoAACoaAAAqmgAAKxoAACuaAAAsGgAAP////+yaAAAtGgAALZoAAC4aAAAumgAALxoAAC+aAAAwGgAAMJoAADEaAAAxmgAAMhoAADKaAAAzGgAAM5oAAD/////0GgAANJoAADUaAAA1mgAANhoAADaaAAA3GgAAN5oAADgaAAA4mgAAP/////kaAAA5mgAAP/////oaAAA6mgAAP/////saAAA////////////////////////////////7mgAAPBoAADyaAAA9GgAAPZoAAD4aAAA+mgAAPxoAAD+aAAAAGkAAAJpAAAEaQAABmkAAAhpAAAKaQAADGkAAA5pAAAQaQAAEmkAABRpAAAWaQAA////////////////GGkAABppAAAcaQAAHmkAACBpAAAiaQAAJGkAACZpAAAoaQAAKmkAACxpAAAuaQAAMGkAADJpAAA0aQAANmkAADhpAAA6aQAAPGkAAD5pAABAaQAAQmkAAERpAAD//////////0ZpAABIaQAASmkAAExpAABOaQAAUGkAAFJpAABUaQAAVmkAAFhpAABaaQAA////////////////////////////////XGkAAF5pAAD///////////////9gaQAAYmkAAGRpAABmaQAAaGkAAGppAABsaQAAbmkAAHBpAAByaQAAdGkAAHZpAAB4aQAAemkAAP////98aQAAfmkAAIBpAACCaQAAhGkAAIZpAACIaQAAimkAAP////+MaQAAjmkAAJBpAACSaQAAlGkAAJZpAACYaQAAmmkAAJxpAACeaQAAoGkAAKJpAACkaQAApmkAAKhpAACqaQAArGkAAK5pAAD/////sGkAALJpAAC0aQAAtmkAALhpAAC6aQAAvGkAAL5pAADAaQAAwmkAAMRpAADGaQAAyGkAAMppAADMaQAAzmkAANBpAADSaQAA1GkAANZpAAD////////////////YaQAA/////9ppAAD//////////9xpAADeaQAA4GkAAOJpAADkaQAA/////+ZpAADoaQAA6mkAAOxpAADuaQAA8GkAAPJpAAD/////9GkAAPZpAAD4aQAA+mkAAPxpAAD+aQAAAGoAAAJqAAAEagAABmoAAP////8IagAACmoAAAxqAAAOagAAEGoAABJqAAAUagAAFmoAABhqAAAaagAAHGoAAB5qAAAgagAAImoAACRqAAD/////////////////////JmoAAChqAAAqagAALGoAAC5qAAAwagAAMmoAADRqAAA2agAAOGoAADpqAAA8agAAPmoAAEBqAABCagAA/////0RqAABGagAASGoAAEpqAABMagAATmoAAFBqAABSagAA/////////////////////1RqAABWagAA////////////////////////////////WGoAAFpqAABcagAAXmoAAGBqAABiagAAZGoAAGZqAABoagAAamoAAGxqAABuagAAcGoAAHJqAAB0agAAdmoAAHhqAAB6agAAfGoAAH5qAACAagAAgmoAAIRqAACGagAAiGoAAIpqAACMagAAjmoAAJBqAACSagAAlGoAAJZqAACYagAAmmoAAJxqAACeagAA/////6BqAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////o2oAAKVqAACnagAAqWoAAKtqAACtagAA/////69qAACxagAAs2oAALVqAAD/////t2oAALlqAAC7agAA/////71qAAC/agAAwWoAAMNqAADFagAAx2oAAMlqAADLagAAzWoAAM9qAADRagAA02oAANVqAADXagAA/////9lqAADbagAA///////////dagAA///////////fagAA///////////hagAA42oAAOVqAADnagAA6WoAAOtqAADtagAA72oAAPFqAADzagAA9WoAAPdqAAD5agAA+2oAAP1qAAD//////2oAAP////8BawAAA2sAAP////8FawAAB2sAAAlrAAALawAADWsAAA9rAAARawAAE2sAABVrAAAXawAAGWsAAP////8bawAAHWsAAB9rAAAhawAAI2sAAP////8lawAAJ2sAAClrAAD/////K2sAAP////8tawAAL2sAADFrAAAzawAANWsAADdrAAD/////OWsAAP////87awAA/////z1rAAA/awAA//////////9BawAAQ2sAAEVrAABHawAASWsAAEtrAABNawAAT2sAAFFrAAD/////U2sAAFVrAABXawAAWWsAAFtrAABdawAAX2sAAGFrAABjawAAZWsAAGdrAABpawAAa2sAAG1rAABvawAAcWsAAHNrAAB1awAAd2sAAHlrAAD//////////3trAAB9awAAf2sAAP//////////gWsAAP//////////g2sAAP////+FawAA//////////+HawAAiWsAAItrAACNawAAj2sAAP////+RawAA/////5NrAAD/////lWsAAP////+XawAAmWsAAJtrAACdawAAn2sAAKFrAACjawAApWsAAKdrAACpawAAq2sAAK1rAACvawAAsWsAALNrAAC1awAAt2sAALlrAAD///////////////+7awAAvWsAAL9rAADBawAAw2sAAMVrAADHawAAyWsAAMtrAADNawAAz2sAANFrAAD/////02sAANVrAADXawAA2WsAAP/////bawAA3WsAAN9rAADhawAA42sAAOVrAAD//////////+drAADpawAA62sAAO1rAADvawAA//////FrAAD////////////////zawAA9WsAAP////////////////drAAD5awAA+2sAAP1rAAD//////////////////////////////////////2sAAP///////////////wFsAAADbAAABWwAAAdsAAD//////////wlsAAD///////////////8LbAAADWwAAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8QbAAAEmwAABRsAAAWbAAAGGwAABpsAAAcbAAAHmwAACBsAAAibAAAJGwAACZsAAAobAAAKmwAACxsAAAubAAAMGwAADJsAAA0bAAANmwAADhsAAA6bAAAPGwAAD5sAABAbAAAQmwAAERsAABGbAAASGwAAEpsAABMbAAATmwAAFBsAABSbAAAVGwAAFZsAABYbAAAWmwAAFxsAABebAAA////////////////YGwAAGJsAABkbAAAZmwAAGhsAABqbAAAbGwAAG5sAABwbAAAcmwAAHRsAAB2bAAAeGwAAHpsAAD//////////3xsAAB+bAAAgGwAAIJsAACEbAAAhmwAAIhsAAD/////imwAAIxsAACObAAAkGwAAJJsAACUbAAAlmwAAJhsAACabAAAnGwAAJ5sAACgbAAA////////////////omwAAKRsAAD//////////6ZsAACobAAAqmwAAKxsAACubAAAsGwAALJsAAC0bAAAtmwAALhsAAC6bAAAvGwAAL5sAADAbAAAwmwAAP//////////xGwAAP/////GbAAA/////8hsAAD/////ymwAAMxsAADObAAA0GwAANJsAADUbAAA1mwAANhsAADabAAA3GwAAN5sAADgbAAA///////////ibAAA5GwAAOZsAADobAAA6mwAAP/////sbAAA7mwAAPBsAADybAAA9GwAAPZsAAD4bAAA+mwAAPxsAAD+bAAAAG0AAAJtAAAEbQAABm0AAAhtAAAKbQAADG0AAA5tAAD/////////////////////EG0AABJtAAD/////FG0AABZtAAD/////GG0AABptAAAcbQAA/////x5tAAAgbQAAIm0AACRtAAAmbQAAKG0AACptAAAsbQAALm0AADBtAAAybQAANG0AADZtAAA4bQAAOm0AADxtAAD///////////////8+bQAAQG0AAEJtAAD///////////////9EbQAARm0AAEhtAAD/////Sm0AAExtAABObQAAUG0AAFJtAABUbQAA//////////9WbQAAWG0AAFptAABcbQAAXm0AAGBtAABibQAAZG0AAGZtAABobQAAam0AAGxtAABubQAA/////3BtAABybQAAdG0AAHZtAAB4bQAAem0AAHxtAAB+bQAAgG0AAIJtAACEbQAAhm0AAIhtAACKbQAAjG0AAI5tAACQbQAAkm0AAJRtAACWbQAAmG0AAJptAAD/////nG0AAJ5tAACgbQAAom0AAKRtAACmbQAAqG0AAKptAACsbQAArm0AALBtAACybQAAtG0AALZtAAD//////////7htAAC6bQAA/////7xtAAC+bQAAwG0AAMJtAADEbQAAxm0AAMhtAAD/////////////////////ym0AAMxtAAD////////////////////////////////ObQAA0G0AANJtAADUbQAA///////////WbQAA2G0AANptAAD////////////////cbQAA3m0AAOBtAADibQAA/////////////////////+RtAADmbQAA6G0AAOptAAD/////7G0AAP/////ubQAA///////////wbQAA8m0AAP/////0bQAA//////////////////////ZtAAD4bQAA+m0AAPxtAAD//////m0AAP//////////AG4AAP///////////////wJuAAAEbgAABm4AAAhuAAAKbgAA/////wxuAAAObgAAEG4AABJuAAAUbgAAFm4AABhuAAAabgAAHG4AAB5uAAAgbgAAIm4AACRuAAAmbgAAKG4AACpuAAAsbgAALm4AADBuAAAybgAANG4AAP////82bgAAOG4AADpuAAA8bgAAPm4AAEBuAABCbgAARG4AAEZuAABIbgAA/////0puAAD//////////0xuAABObgAAUG4AAFJuAABUbgAAVm4AAFhuAABabgAAXG4AAP////9ebgAAYG4AAGJuAABkbgAAZm4AAGhuAABqbgAAbG4AAP////9ubgAAcG4AAP//////////cm4AAHRuAAB2bgAAeG4AAHpuAAB8bgAAfm4AAIBuAACCbgAAhG4AAIZuAACIbgAAim4AAIxuAAD/////jm4AAJBuAACSbgAAlG4AAJZuAACYbgAAmm4AAJxuAACebgAAoG4AAKJuAACkbgAApm4AAKhuAACqbgAArG4AAK5uAACwbgAAsm4AALRuAAC2bgAAuG4AALpuAAC8bgAAvm4AAMBuAADCbgAAxG4AAMZuAADIbgAAym4AAMxuAAD//////////85uAAD//////////9BuAADSbgAA/////9RuAADWbgAA2G4AANpuAADcbgAA3m4AAP/////gbgAA4m4AAP/////kbgAA5m4AAOhuAAD/////6m4AAOxuAAD/////7m4AAP/////wbgAA8m4AAPRuAAD2bgAA+G4AAPpuAAD8bgAA/m4AAABvAAACbwAABG8AAAZvAAAIbwAA//////////8KbwAADG8AAP//////////Dm8AABBvAAD/////Em8AABRvAAAWbwAAGG8AABpvAAAcbwAAHm8AACBvAAD//////////yJvAAD//////////yRvAAAmbwAAKG8AAP////8qbwAALG8AAC5vAAD/////MG8AADJvAAA0bwAANm8AADhvAAA6bwAA/////zxvAAA+bwAAQG8AAEJvAABEbwAARm8AAP////9IbwAASm8AAExvAABObwAAUG8AAFJvAAD///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////9VbwAAV28AAFlvAABbbwAAXW8AAF9vAABhbwAAY28AAGVvAABnbwAA/////2lvAABrbwAAbW8AAG9vAABxbwAAc28AAHVvAAB3bwAA/////3lvAAB7bwAA/////31vAAB/bwAAgW8AAP////+DbwAAhW8AAIdvAAD/////iW8AAItvAACNbwAAj28AAJFvAACTbwAAlW8AAP////+XbwAA//////////+ZbwAAm28AAJ1vAACfbwAAoW8AAKNvAAClbwAAp28AAKlvAACrbwAArW8AAP///////////////69vAAD/////sW8AALNvAAD/////tW8AALdvAAD/////uW8AALtvAAC9bwAA/////79vAAD//////////8FvAADDbwAAxW8AAMdvAADJbwAAy28AAM1vAADPbwAA/////9FvAADTbwAA1W8AANdvAADZbwAA228AAN1vAADfbwAA4W8AAONvAADlbwAA/////+dvAAD//////////////////////////+lvAADrbwAA7W8AAO9vAAD/////8W8AAP/////////////////////zbwAA9W8AAPdvAAD5bwAA+28AAP///////////W8AAP9vAAD/////AXAAAANwAAD/////BXAAAAdwAAAJcAAAC3AAAA1wAAAPcAAAEXAAAP///////////////xNwAAAVcAAAF3AAABlwAAAbcAAA////////////////HXAAAB9wAAAhcAAAI3AAACVwAAAncAAAKXAAACtwAAAtcAAA/////y9wAAAxcAAA/////////////////////zNwAAA1cAAA/////////////////////zdwAAA5cAAA/////ztwAAA9cAAA//////////8/cAAAQXAAAP////9DcAAARXAAAEdwAAD//////////0lwAAD/////////////////////S3AAAE1wAABPcAAAUXAAAFNwAABVcAAAV3AAAFlwAABbcAAAXXAAAF9wAABhcAAA/////////////////////2NwAABlcAAA//////////9ncAAAaXAAAGtwAABtcAAAb3AAAP////9xcAAAc3AAAP//////////dXAAAHdwAAD///////////////95cAAA//////////97cAAAfXAAAP//////////f3AAAP////+BcAAAg3AAAIVwAAD///////////////////////////////////////////////+HcAAAiXAAAItwAACNcAAAj3AAAJFwAACTcAAAlXAAAJdwAACZcAAA/////5twAACdcAAA/////////////////////59wAAChcAAAo3AAAKVwAAD/////p3AAAP//////////qXAAAP//////////q3AAAK1wAAD/////r3AAAP//////////sXAAALNwAAC1cAAAt3AAAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////+6cAAAvHAAAL5wAADAcAAAwnAAAMRwAADGcAAAyHAAAMpwAADMcAAAznAAANBwAADScAAA1HAAANZwAADYcAAA2nAAANxwAAD/////3nAAAOBwAADicAAA5HAAAOZwAADocAAA6nAAAP//////////////////////////7HAAAO5wAADwcAAA8nAAAPRwAAD/////9nAAAPhwAAD/////+nAAAPxwAAD//////nAAAABxAAACcQAABHEAAP////8GcQAA//////////8IcQAACnEAAAxxAAAOcQAAEHEAABJxAAAUcQAAFnEAABhxAAD/////GnEAAP//////////////////////////HHEAAP///////////////x5xAAAgcQAA/////yJxAAD/////////////////////JHEAACZxAAAocQAAKnEAACxxAAAucQAAMHEAADJxAAA0cQAANnEAADhxAAA6cQAA//////////88cQAAPnEAAEBxAABCcQAA/////0RxAABGcQAASHEAAP////9KcQAA/////////////////////0xxAABOcQAAUHEAAFJxAABUcQAAVnEAAFhxAABacQAAXHEAAF5xAABgcQAAYnEAAGRxAABmcQAAaHEAAGpxAABscQAAbnEAAHBxAABycQAA/////3RxAAB2cQAA/////3hxAAB6cQAAfHEAAP////9+cQAA/////4BxAACCcQAAhHEAAIZxAACIcQAAinEAAIxxAACOcQAA//////////+QcQAAknEAAJRxAACWcQAAmHEAAJpxAACccQAAnnEAAKBxAACicQAApHEAAKZxAACocQAAqnEAAKxxAACucQAAsHEAALJxAAC0cQAAtnEAALhxAAD/////unEAALxxAAC+cQAAwHEAAMJxAADEcQAAxnEAAMhxAADKcQAAzHEAAM5xAADQcQAA0nEAANRxAAD/////1nEAANhxAADacQAA////////////////3HEAAP/////ecQAA4HEAAOJxAADkcQAA/////+ZxAAD//////////////////////////+hxAAD//////////+pxAADscQAA7nEAAP////////////////BxAAD/////8nEAAP/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////1cQAA93EAAPlxAAD7cQAA/XEAAP9xAAABcgAAA3IAAAVyAAAHcgAACXIAAAtyAAD/////DXIAAA9yAAARcgAAE3IAABVyAAAXcgAAGXIAAP////8bcgAAHXIAAB9yAAD//////////////////////////yFyAAAjcgAAJXIAACdyAAApcgAAK3IAAP////8tcgAA/////y9yAAAxcgAAM3IAADVyAAA3cgAA//////////85cgAAO3IAAD1yAAA/cgAAQXIAAENyAABFcgAAR3IAAElyAABLcgAATXIAAE9yAABRcgAAU3IAAP////9VcgAAV3IAAFlyAABbcgAAXXIAAF9yAABhcgAA/////2NyAABlcgAAZ3IAAGlyAABrcgAAbXIAAG9yAAD/////cXIAAHNyAAB1cgAAd3IAAHlyAAD//////////3tyAAB9cgAAf3IAAIFyAACDcgAAhXIAAIdyAACJcgAAi3IAAI1yAAD//////////49yAAD/////kXIAAJNyAAD/////lXIAAP////+XcgAAmXIAAJtyAACdcgAAn3IAAKFyAACjcgAApXIAAKdyAACpcgAAq3IAAK1yAACvcgAAsXIAALNyAAC1cgAAt3IAALlyAAC7cgAAvXIAAL9yAADBcgAAw3IAAMVyAADHcgAA///////////JcgAA////////////////y3IAAP/////NcgAA///////////PcgAA///////////RcgAA03IAANVyAADXcgAA2XIAANtyAADdcgAA33IAAOFyAADjcgAA/////+VyAAD/////53IAAP//////////6XIAAP///////////////+tyAADtcgAA73IAAP//////////8XIAAPNyAAD1cgAA//////dyAAD5cgAA+3IAAP1yAAD/cgAA//////////8BcwAAA3MAAP////8FcwAAB3MAAAlzAAALcwAADXMAAA9zAAARcwAAE3MAABVzAAAXcwAAGXMAABtzAAAdcwAAH3MAACFzAAAjcwAAJXMAACdzAAApcwAAK3MAAP////8tcwAA/////y9zAAAxcwAA/////zNzAAA1cwAA//////////83cwAAOXMAADtzAAD/////PXMAAD9zAABBcwAA/////0NzAABFcwAAR3MAAElzAABLcwAATXMAAP////9PcwAAUXMAAP////9TcwAAVXMAAFdzAABZcwAAW3MAAP//////////XXMAAF9zAAD/////YXMAAGNzAABlcwAA/////2dzAAD//////////////////////////2lzAAD///////////////////////////////9rcwAA/////21zAABvcwAA//////////9xcwAAc3MAAP////91cwAAd3MAAHlzAAB7cwAAfXMAAH9zAACBcwAA////////////////g3MAAIVzAAD/////h3MAAIlzAACLcwAAjXMAAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////+QcwAAknMAAJRzAACWcwAAmHMAAJpzAAD/////nHMAAJ5zAACgcwAAonMAAKRzAAD/////pnMAAKhzAACqcwAArHMAAK5zAACwcwAA/////7JzAAC0cwAAtnMAALhzAAC6cwAAvHMAAL5zAADAcwAA/////8JzAADEcwAA/////8ZzAADIcwAA/////8pzAADMcwAA///////////OcwAA0HMAANJzAADUcwAA1nMAANhzAADacwAA3HMAAN5zAADgcwAA4nMAAORzAADmcwAA6HMAAOpzAADscwAA///////////ucwAA//////BzAAD/////////////////////////////////////8nMAAPRzAAD2cwAA+HMAAPpzAAD8cwAA/nMAAAB0AAACdAAABHQAAAZ0AAAIdAAACnQAAAx0AAAOdAAAEHQAABJ0AAD///////////////////////////////8UdAAAFnQAABh0AAAadAAAHHQAAP////////////////////8edAAAIHQAACJ0AAAkdAAAJnQAACh0AAAqdAAALHQAAC50AAD/////MHQAADJ0AAA0dAAANnQAADh0AAA6dAAAPHQAAD50AABAdAAAQnQAAER0AABGdAAA/////0h0AABKdAAATHQAAP////9OdAAAUHQAAFJ0AAD/////VHQAAFZ0AAD/////WHQAAFp0AABcdAAA/////150AABgdAAAYnQAAGR0AABmdAAAaHQAAGp0AABsdAAA/////250AABwdAAA/////3J0AAB0dAAAdnQAAHh0AAB6dAAAfHQAAH50AACAdAAAgnQAAIR0AACGdAAAiHQAAIp0AAD/////jHQAAI50AACQdAAAknQAAJR0AAD/////lnQAAJh0AACadAAAnHQAAJ50AACgdAAAonQAAKR0AACmdAAAqHQAAKp0AAD/////rHQAAK50AACwdAAAsnQAAP//////////tHQAALZ0AAC4dAAA//////////+6dAAAvHQAAP////++dAAA/////8B0AADCdAAAxHQAAP//////////xnQAAMh0AAD////////////////KdAAA////////////////zHQAAM50AADQdAAA0nQAAP/////UdAAA///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////XdAAA2XQAANt0AADddAAA33QAAOF0AADjdAAA5XQAAOd0AADpdAAA63QAAP/////tdAAA/////+90AADxdAAA83QAAPV0AAD3dAAA//////l0AAD7dAAA/XQAAP///////////3QAAP////8BdQAAA3UAAAV1AAAHdQAACXUAAAt1AAANdQAAD3UAABF1AAATdQAAFXUAABd1AAD/////GXUAAP//////////G3UAAB11AAAfdQAAIXUAACN1AAAldQAAJ3UAACl1AAArdQAALXUAAP////8vdQAAMXUAADN1AAA1dQAAN3UAAP////85dQAA//////////87dQAAPXUAAD91AABBdQAA//////////9DdQAARXUAAEd1AABJdQAAS3UAAE11AABPdQAAUXUAAFN1AABVdQAAV3UAAFl1AABbdQAAXXUAAF91AAD/////YXUAAGN1AABldQAAZ3UAAGl1AABrdQAAbXUAAG91AABxdQAAc3UAAHV1AAB3dQAAeXUAAHt1AAB9dQAAf3UAAIF1AAD/////g3UAAIV1AAD//////////4d1AACJdQAAi3UAAI11AACPdQAA/////5F1AACTdQAAlXUAAP////+XdQAAmXUAAJt1AACddQAAn3UAAP////+hdQAAo3UAAKV1AACndQAAqXUAAKt1AACtdQAAr3UAALF1AACzdQAAtXUAAP////+3dQAAuXUAALt1AAC9dQAAv3UAAMF1AADDdQAA/////8V1AADHdQAAyXUAAMt1AAD//////////811AADPdQAA0XUAAP///////////////9N1AADVdQAA13UAANl1AAD/////////////////////23UAAN11AADfdQAA4XUAAP/////////////////////jdQAA/////+V1AADndQAA///////////pdQAA63UAAP/////tdQAA73UAAP/////xdQAA83UAAPV1AAD3dQAA+XUAAPt1AAD9dQAA/3UAAAF2AAD/////A3YAAAV2AAD/////B3YAAAl2AAALdgAADXYAAP////8PdgAA/////xF2AAATdgAAFXYAABd2AAD//////////xl2AAD///////////////8bdgAAHXYAAB92AAAhdgAAI3YAACV2AAD/////J3YAACl2AAArdgAALXYAAC92AAD/////MXYAADN2AAA1dgAAN3YAADl2AAA7dgAAPXYAAP////8/dgAAQXYAAEN2AABFdgAA/////0d2AAD//////////0l2AABLdgAA/////012AABPdgAAUXYAAP////9TdgAAVXYAAFd2AABZdgAAW3YAAF12AABfdgAAYXYAAGN2AAD//////////2V2AABndgAAaXYAAGt2AABtdgAAb3YAAHF2AABzdgAAdXYAAHd2AAB5dgAAe3YAAH12AAB/dgAAgXYAAIN2AACFdgAAh3YAAIl2AACLdgAAjXYAAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////+QdgAAknYAAJR2AACWdgAAmHYAAJp2AAD/////nHYAAJ52AACgdgAAonYAAKR2AAD/////pnYAAKh2AACqdgAArHYAAK52AACwdgAAsnYAALR2AAC2dgAA/////7h2AAC6dgAAvHYAAL52AADAdgAAwnYAAMR2AADGdgAAyHYAAMp2AAD//////////8x2AAD//////////852AADQdgAA/////9J2AADUdgAA1nYAAP/////YdgAA2nYAANx2AADedgAA4HYAAOJ2AADkdgAA5nYAAP/////odgAA6nYAAOx2AADudgAA8HYAAPJ2AAD0dgAA//////Z2AAD////////////////4dgAA+nYAAPx2AAD+dgAAAHcAAP//////////AncAAAR3AAAGdwAACHcAAAp3AAAMdwAADncAABB3AAASdwAAFHcAABZ3AAD///////////////////////////////8YdwAAGncAABx3AAD//////////x53AAAgdwAAIncAAP////8kdwAAJncAACh3AAAqdwAA/////yx3AAD//////////y53AAAwdwAAMncAADR3AAA2dwAAOHcAADp3AAA8dwAAPncAAEB3AABCdwAA/////0R3AABGdwAASHcAAP////9KdwAATHcAAE53AAD/////UHcAAFJ3AABUdwAAVncAAFh3AAD//////////1p3AABcdwAA/////153AAD//////////2B3AAD//////////2J3AABkdwAAZncAAP//////////aHcAAGp3AABsdwAAbncAAHB3AAD/////cncAAHR3AAD///////////////92dwAAeHcAAHp3AAB8dwAAfncAAIB3AACCdwAAhHcAAIZ3AACIdwAAincAAIx3AACOdwAAkHcAAJJ3AACUdwAAlncAAJh3AACadwAAnHcAAP///////////////////////////////553AAD/////oHcAAKJ3AACkdwAApncAAP//////////qHcAAKp3AAD/////rHcAAK53AACwdwAAsncAALR3AAC2dwAAuHcAAP///////////////7p3AAC8dwAAvncAAP///////////////8B3AADCdwAA/////8R3AADGdwAA///////////IdwAAyncAAMx3AADOdwAA0HcAANJ3AADUdwAA1ncAAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////9l3AADbdwAA3XcAAN93AADhdwAA43cAAP/////ldwAA53cAAOl3AAD/////63cAAP/////tdwAA73cAAPF3AADzdwAA9XcAAPd3AAD5dwAA//////t3AAD9dwAA/3cAAAF4AAD/////A3gAAAV4AAAHeAAACXgAAAt4AAANeAAAD3gAABF4AAD/////E3gAABV4AAAXeAAAGXgAABt4AAAdeAAAH3gAACF4AAAjeAAA/////yV4AAAneAAAKXgAACt4AAAteAAAL3gAADF4AAAzeAAANXgAADd4AAA5eAAAO3gAAD14AAA/eAAAQXgAAEN4AABFeAAAR3gAAEl4AABLeAAATXgAAE94AABReAAAU3gAAFV4AABXeAAAWXgAAFt4AABdeAAAX3gAAGF4AABjeAAAZXgAAGd4AABpeAAAa3gAAG14AAD/////b3gAAP////9xeAAAc3gAAHV4AAB3eAAAeXgAAHt4AAB9eAAAf3gAAIF4AACDeAAAhXgAAId4AACJeAAAi3gAAI14AACPeAAA////////////////kXgAAJN4AACVeAAAl3gAAJl4AACbeAAAnXgAAJ94AACheAAA////////////////o3gAAP////+leAAAp3gAAP////+peAAAq3gAAK14AACveAAAsXgAALN4AAC1eAAAt3gAALl4AAC7eAAAvXgAAL94AADBeAAAw3gAAMV4AADHeAAA///////////JeAAA///////////LeAAAzXgAAM94AADReAAA03gAANV4AAD/////13gAANl4AADbeAAA/////914AAD/////33gAAOF4AADjeAAA5XgAAP//////////53gAAP/////peAAA63gAAO14AADveAAA8XgAAPN4AAD1eAAA93gAAPl4AAD7eAAA/XgAAP//////eAAAAXkAAAN5AAAFeQAAB3kAAAl5AAALeQAADXkAAA95AAAReQAAE3kAABV5AAAXeQAAGXkAABt5AAAdeQAAH3kAAP////8heQAAI3kAAP////8leQAAJ3kAACl5AAAreQAA/////y15AAAveQAA/////////////////////zF5AAD/////M3kAADV5AAA3eQAA/////zl5AAA7eQAAPXkAAP////8/eQAA/////0F5AABDeQAARXkAAEd5AABJeQAAS3kAAE15AABPeQAAUXkAAFN5AABVeQAAV3kAAFl5AABbeQAAXXkAAF95AAD/////YXkAAGN5AAD/////ZXkAAGd5AAD//////////2l5AAD///////////////9reQAAbXkAAP//////////////////////////////////////////b3kAAHF5AABzeQAAdXkAAHd5AAD/////eXkAAHt5AAB9eQAAf3kAAP////////////////////+BeQAA//////////+DeQAA/////4V5AAD/////h3kAAP////+JeQAA//////////+LeQAAjXkAAI95AAD//////////5F5AACTeQAAlXkAAJd5AACZeQAAm3kAAJ15AACfeQAA/////6F5AACjeQAApXkAAKd5AACpeQAAq3kAAK15AACveQAAsXkAAP////+zeQAAtXkAAP//////////t3kAALl5AAC7eQAAvXkAAL95AADBeQAA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////xHkAAMZ5AADIeQAAynkAAP/////MeQAAznkAANB5AADSeQAA1HkAANZ5AADYeQAA2nkAANx5AADeeQAA4HkAAOJ5AADkeQAA5nkAAOh5AADqeQAA7HkAAO55AADweQAA8nkAAPR5AAD2eQAA+HkAAPp5AAD8eQAA/nkAAAB6AAACegAABHoAAAZ6AAAIegAACnoAAP////8MegAADnoAABB6AAASegAAFHoAABZ6AAAYegAAGnoAABx6AAAeegAAIHoAACJ6AAAkegAAJnoAACh6AAAqegAALHoAAC56AAAwegAAMnoAADR6AAD/////NnoAADh6AAA6egAAPHoAAD56AABAegAA/////0J6AAD/////RHoAAEZ6AAD/////SHoAAP//////////SnoAAP//////////THoAAE56AABQegAAUnoAAFR6AABWegAAWHoAAFp6AABcegAAXnoAAGB6AABiegAAZHoAAGZ6AAD/////aHoAAGp6AABsegAAbnoAAHB6AAByegAAdHoAAHZ6AAD/////eHoAAHp6AAB8egAA/////356AACAegAAgnoAAIR6AACGegAAiHoAAP//////////inoAAP//////////jHoAAI56AACQegAAknoAAJR6AACWegAAmHoAAJp6AAD///////////////////////////////+cegAAnnoAAKB6AACiegAA/////////////////////6R6AACmegAA/////6h6AACqegAArHoAAK56AACwegAAsnoAALR6AAC2egAAuHoAALp6AAC8egAAvnoAAMB6AADCegAAxHoAAP//////////xnoAAP/////IegAA////////////////ynoAAMx6AADOegAA0HoAANJ6AADUegAA1noAANh6AADaegAA3HoAAN56AADgegAA4noAAOR6AADmegAA6HoAAOp6AADsegAA7noAAPB6AADyegAA9HoAAP/////2egAA+HoAAPp6AAD8egAA/noAAAB7AAACewAABHsAAAZ7AAAIewAA//////////8KewAADHsAAA57AAD/////EHsAAP////8SewAAFHsAABZ7AAAYewAAGnsAABx7AAAeewAAIHsAACJ7AAAkewAA/////yZ7AAD///////////////8oewAAKnsAACx7AAAuewAAMHsAADJ7AAA0ewAANnsAAP////84ewAAOnsAADx7AAA+ewAAQHsAAEJ7AABEewAARnsAAEh7AAD/////SnsAAEx7AABOewAAUHsAAFJ7AABUewAAVnsAAFh7AAD/////WnsAAFx7AABeewAAYHsAAGJ7AABkewAA//////////9mewAA/////////////////////////////////////2h7AABqewAAbHsAAG57AAD//////////3B7AAByewAAdHsAAHZ7AAB4ewAAensAAHx7AAB+ewAAgHsAAIJ7AACEewAAhnsAAIh7AACKewAAjHsAAI57AACQewAAknsAAJR7AACWewAAmHsAAJp7AACcewAAnnsAAKB7AACiewAA//////////+kewAApnsAAP////+oewAA/////6p7AAD///////////////+sewAArnsAALB7AACyewAAtHsAALZ7AAC4ewAA//////////+6ewAAvHsAAL57AADAewAAwnsAAMR7AADGewAAyHsAAP//////////ynsAAMx7AADOewAA/////9B7AADSewAA1HsAANZ7AAD/////2HsAAP/////aewAA3HsAAP/////eewAA/////+B7AADiewAA/////////////////////+R7AAD/////5nsAAOh7AAD/////////////////////6nsAAOx7AAD//////////+57AADwewAA8nsAAPR7AAD2ewAA//////h7AAD6ewAA/HsAAP57AAAAfAAA/////wJ8AAAEfAAABnwAAAh8AAAKfAAADHwAAP//////////DnwAABB8AAASfAAAFHwAABZ8AAAYfAAAGnwAABx8AAAefAAAIHwAAP//////////InwAACR8AAAmfAAAKHwAACp8AAAsfAAALnwAADB8AAAyfAAANHwAADZ8AAA4fAAA//////////86fAAAPHwAAD58AABAfAAAQnwAAP////9EfAAARnwAAEh8AABKfAAA////////////////THwAAE58AABQfAAA/////1J8AAD/////VHwAAFZ8AABYfAAA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////W3wAAF18AABffAAAYXwAAGN8AABlfAAAZ3wAAGl8AABrfAAAbXwAAG98AABxfAAAc3wAAHV8AAD/////d3wAAHl8AAB7fAAAfXwAAH98AACBfAAAg3wAAIV8AAD///////////////+HfAAAiXwAAP////+LfAAAjXwAAI98AACRfAAAk3wAAJV8AACXfAAAmXwAAJt8AACdfAAAn3wAAKF8AACjfAAApXwAAKd8AACpfAAA/////////////////////6t8AACtfAAA/////698AACxfAAAs3wAALV8AAC3fAAA/////7l8AAC7fAAAvXwAAL98AADBfAAAw3wAAMV8AADHfAAAyXwAAMt8AADNfAAA////////////////z3wAANF8AADTfAAA1XwAANd8AADZfAAA23wAAN18AADffAAA4XwAAON8AAD/////5XwAAOd8AAD////////////////pfAAA63wAAO18AADvfAAA8XwAAPN8AAD1fAAA93wAAPl8AAD7fAAA/XwAAP98AAABfQAAA30AAAV9AAAHfQAACX0AAAt9AAANfQAAD30AABF9AAATfQAAFX0AABd9AAAZfQAAG30AAB19AAAffQAA//////////8hfQAAI30AAP//////////JX0AAP//////////J30AACl9AAArfQAALX0AAC99AAAxfQAAM30AADV9AAA3fQAAOX0AADt9AAA9fQAAP30AAP//////////QX0AAP////9DfQAA//////////9FfQAA/////////////////////0d9AAD/////SX0AAEt9AABNfQAAT30AAFF9AABTfQAAVX0AAFd9AABZfQAAW30AAF19AAD/////X30AAGF9AABjfQAAZX0AAGd9AABpfQAAa30AAG19AABvfQAAcX0AAHN9AAB1fQAAd30AAHl9AAB7fQAAfX0AAH99AACBfQAAg30AAIV9AAD/////h30AAIl9AACLfQAA//////////+NfQAAj30AAJF9AAD/////k30AAJV9AACXfQAA////////////////mX0AAJt9AACdfQAA/////599AAChfQAAo30AAP////+lfQAAp30AAP////+pfQAAq30AAK19AACvfQAAsX0AAP////+zfQAAtX0AALd9AAC5fQAAu30AAL19AAC/fQAAwX0AAMN9AADFfQAAx30AAMl9AADLfQAA////////////////////////////////zX0AAM99AADRfQAA030AANV9AADXfQAA///////////ZfQAA230AAN19AADffQAA/////+F9AADjfQAA/////+V9AADnfQAA6X0AAOt9AAD/////7X0AAO99AADxfQAA830AAPV9AAD3fQAA+X0AAP////////////////t9AAD9fQAA/30AAAF+AAADfgAABX4AAAd+AAD///////////////8JfgAAC34AAA1+AAAPfgAAEX4AABN+AAAVfgAAF34AABl+AAAbfgAAHX4AAB9+AAAhfgAAI34AAP////8lfgAAJ34AACl+AAArfgAALX4AAP////8vfgAA//////////8xfgAAM34AAP////81fgAAN34AAP////////////////////85fgAA//////////////////////////87fgAAPX4AAD9+AABBfgAA/////////////////////0N+AAD//////////0V+AABHfgAA/////0l+AAD///////////////////////////////9LfgAATX4AAP//////////T34AAFF+AABTfgAAVX4AAFd+AABZfgAAW34AAF1+AABffgAAYX4AAGN+AABlfgAAZ34AAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////9qfgAAbH4AAG5+AABwfgAAcn4AAHR+AAB2fgAAeH4AAHp+AAB8fgAA/////35+AACAfgAAgn4AAIR+AACGfgAAiH4AAIp+AACMfgAAjn4AAP////+QfgAAkn4AAP//////////lH4AAJZ+AAD/////mH4AAJp+AACcfgAA/////55+AACgfgAAon4AAKR+AACmfgAAqH4AAP////+qfgAArH4AAP//////////rn4AALB+AAD/////////////////////sn4AALR+AAC2fgAAuH4AAP////////////////////+6fgAA////////////////vH4AAL5+AADAfgAA/////8J+AADEfgAA////////////////////////////////xn4AAMh+AADKfgAAzH4AAP/////OfgAA0H4AANJ+AADUfgAA1n4AANh+AAD//////////9p+AADcfgAA////////////////3n4AAOB+AADifgAA5H4AAOZ+AADofgAA6n4AAOx+AADufgAA8H4AAP//////////8n4AAPR+AAD/////9n4AAPh+AAD6fgAA/H4AAP////////////////5+AAD/////AH8AAAJ/AAAEfwAA////////////////Bn8AAAh/AAD/////Cn8AAAx/AAAOfwAAEH8AABJ/AAAUfwAAFn8AABh/AAAafwAAHH8AAB5/AAAgfwAAIn8AACR/AAAmfwAAKH8AACp/AAAsfwAA////////////////Ln8AAP////8wfwAAMn8AAP//////////////////////////NH8AADZ/AAD///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////85fwAAO38AAD1/AAA/fwAAQX8AAEN/AABFfwAAR38AAEl/AABLfwAATX8AAE9/AABRfwAAU38AAFV/AABXfwAAWX8AAFt/AABdfwAAX38AAGF/AABjfwAAZX8AAGd/AABpfwAAa38AAG1/AABvfwAAcX8AAHN/AAB1fwAAd38AAHl/AAB7fwAAfX8AAH9/AACBfwAAg38AAIV/AACHfwAAiX8AAIt/AACNfwAAj38AAJF/AACTfwAA/////5V/AACXfwAAmX8AAJt/AACdfwAAn38AAKF/AAD/////o38AAKV/AACnfwAAqX8AAKt/AACtfwAAr38AALF/AACzfwAAtX8AALd/AAC5fwAAu38AAL1/AAC/fwAAwX8AAMN/AADFfwAAx38AAMl/AADLfwAA///////////NfwAAz38AANF/AADTfwAA1X8AANd/AAD//////////9l/AADbfwAA////////////////3X8AAN9/AADhfwAA438AAOV/AADnfwAA6X8AAOt/AADtfwAA738AAP//////////8X8AAPN/AAD1fwAA938AAPl/AAD7fwAA/X8AAP9/AAABgAAAA4AAAAWAAAAHgAAA/////wmAAAALgAAADYAAAA+AAAARgAAAE4AAABWAAAAXgAAAGYAAABuAAAAdgAAAH4AAACGAAAAjgAAAJYAAACeAAAApgAAAK4AAAC2AAAAvgAAAMYAAADOAAAA1gAAAN4AAADmAAAA7gAAAPYAAAD+AAABBgAAAQ4AAAEWAAAD//////////0eAAAD//////////0mAAABLgAAATYAAAE+AAAD/////UYAAAFOAAABVgAAA//////////////////////////9XgAAA//////////9ZgAAAW4AAAF2AAABfgAAAYYAAAGOAAABlgAAAZ4AAAGmAAAD/////a4AAAG2AAAD/////b4AAAHGAAABzgAAAdYAAAHeAAAB5gAAAe4AAAH2AAAB/gAAAgYAAAP////+DgAAAhYAAAIeAAAD/////iYAAAP//////////i4AAAI2AAAD/////j4AAAP////+RgAAAk4AAAJWAAACXgAAAmYAAAP////+bgAAAnYAAAJ+AAAChgAAAo4AAAKWAAACngAAAqYAAAKuAAACtgAAAr4AAALGAAAD/////s4AAALWAAAC3gAAAuYAAALuAAAC9gAAAv4AAAMGAAADDgAAA////////////////xYAAAMeAAADJgAAAy4AAAP/////NgAAAz4AAANGAAADTgAAA/////9WAAADXgAAA2YAAAP/////bgAAA3YAAAN+AAADhgAAA44AAAOWAAADngAAA6YAAAOuAAADtgAAA74AAAPGAAAD////////////////zgAAA//////WAAAD3gAAA+YAAAPuAAAD9gAAA/4AAAAGBAAADgQAA/////wWBAAAHgQAACYEAAP//////////C4EAAP////8NgQAA//////////8PgQAA//////////////////////////8RgQAAE4EAABWBAAAXgQAAGYEAABuBAAAdgQAAH4EAACGBAAAjgQAAJYEAACeBAAApgQAAK4EAAC2BAAAvgQAA////////////////MYEAAP////8zgQAANYEAADeBAAA5gQAA/////zuBAAD/////PYEAAD+BAABBgQAAQ4EAAEWBAABHgQAA/////0mBAABLgQAATYEAAP///////////////0+BAABRgQAA////////////////U4EAAFWBAAD//////////1eBAAD/////WYEAAP////9bgQAAXYEAAF+BAAD/////YYEAAGOBAABlgQAAZ4EAAP////9pgQAA//////////9rgQAAbYEAAG+BAABxgQAAc4EAAHWBAAB3gQAAeYEAAHuBAAB9gQAAf4EAAIGBAAD//////////4OBAACFgQAAh4EAAImBAACLgQAAjYEAAI+BAACRgQAAk4EAAJWBAACXgQAAmYEAAJuBAACdgQAAn4EAAKGBAACjgQAApYEAAP////+ngQAAqYEAAKuBAACtgQAAr4EAAP////+xgQAA/////////////////////7OBAAC1gQAAt4EAALmBAAD/////u4EAAP///////////////72BAAD//////////7+BAAD/////wYEAAMOBAAD/////////////////////xYEAAP/////HgQAAyYEAAMuBAADNgQAAz4EAANGBAADTgQAA1YEAAP/////XgQAA///////////ZgQAA24EAAP/////dgQAA////////////////34EAAOGBAADjgQAA5YEAAOeBAAD/////////////////////6YEAAOuBAADtgQAA/////////////////////////////////////++BAAD/////8YEAAPOBAAD////////////////////////////////1gQAA94EAAP/////5gQAA//////uBAAD9gQAA/4EAAP//////////AYIAAAOCAAAFggAAB4IAAAmCAAALggAADYIAAP////8PggAAEYIAABOCAAAVggAAF4IAABmCAAAbggAAHYIAAB+CAAAhggAAI4IAACWCAAAnggAAKYIAACuCAAAtggAA//////////8vggAAMYIAAP///////////////zOCAAA1ggAAN4IAAP////85ggAA////////////////O4IAAD2CAAA/ggAA////////////////QYIAAP//////////Q4IAAEWCAAD/////R4IAAEmCAABLggAATYIAAP////9PggAAUYIAAFOCAAD/////VYIAAFeCAAD//////////1mCAAD//////////1uCAAD/////XYIAAP////9fggAAYYIAAGOCAABlggAAZ4IAAP////9pggAAa4IAAG2CAAD//////////2+CAAD/////cYIAAHOCAAB1ggAAd4IAAHmCAAD/////e4IAAH2CAAB/ggAAgYIAAIOCAACFggAAh4IAAImCAACLggAAjYIAAI+CAACRggAAk4IAAJWCAAD/////l4IAAP//////////mYIAAP////+bggAAnYIAAJ+CAAChggAA//////////+jggAApYIAAKeCAACpggAA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////rIIAAK6CAACwggAAsoIAALSCAAC2ggAAuIIAALqCAAC8ggAAvoIAAMCCAADCggAAxIIAAMaCAADIggAAyoIAAMyCAADOggAA/////9CCAADSggAA///////////UggAA1oIAAP///////////////9iCAAD//////////9qCAADcggAA3oIAAOCCAADiggAA/////+SCAADmggAA6IIAAOqCAADsggAA/////+6CAAD/////8IIAAPKCAAD0ggAA9oIAAPiCAAD6ggAA/IIAAP6CAAAAgwAAAoMAAASDAAD///////////////8GgwAACIMAAAqDAAD/////DIMAAA6DAAAQgwAAEoMAABSDAAAWgwAAGIMAAP///////////////xqDAAAcgwAAHoMAACCDAAAigwAAJIMAACaDAAAogwAAKoMAACyDAAAugwAA/////zCDAAAygwAANIMAADaDAAA4gwAA/////zqDAAA8gwAAPoMAAP////9AgwAAQoMAAESDAAD/////RoMAAEiDAABKgwAA////////////////TIMAAP//////////////////////////ToMAAFCDAAD//////////1KDAAD/////VIMAAFaDAAD//////////1iDAAD//////////1qDAABcgwAAXoMAAP////9ggwAAYoMAAP////9kgwAA/////2aDAABogwAAaoMAAGyDAABugwAAcIMAAHKDAAB0gwAAdoMAAHiDAAD//////////////////////////3qDAAD//////////3yDAAD//////////////////////////36DAACAgwAA//////////+CgwAA/////4SDAACGgwAAiIMAAIqDAAD//////////4yDAACOgwAA/////5CDAACSgwAA////////////////lIMAAJaDAACYgwAAmoMAAJyDAACegwAA/////6CDAAD/////ooMAAKSDAACmgwAAqIMAAKqDAACsgwAAroMAALCDAACygwAAtIMAALaDAAC4gwAAuoMAALyDAAC+gwAAwIMAAMKDAADEgwAA/////8aDAAD/////yIMAAP///////////////8qDAAD//////////8yDAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////z4MAANGDAADTgwAA1YMAANeDAADZgwAA/////9uDAADdgwAA34MAAOGDAADjgwAA/////+WDAADngwAA6YMAAOuDAADtgwAA/////++DAADxgwAA84MAAPWDAAD3gwAA+YMAAPuDAAD9gwAA/////////////////4MAAAGEAAADhAAABYQAAAeEAAD///////////////8JhAAAC4QAAA2EAAAPhAAAEYQAABOEAAAVhAAAF4QAABmEAAD/////G4QAAP////8dhAAAH4QAAP//////////IYQAACOEAAAlhAAAJ4QAACmEAAArhAAA//////////////////////////8thAAAL4QAADGEAAAzhAAANYQAADeEAAA5hAAAO4QAAD2EAAA/hAAAQYQAAEOEAABFhAAA/////0eEAAD/////////////////////////////////////SYQAAEuEAABNhAAA/////0+EAAD/////UYQAAFOEAABVhAAAV4QAAFmEAABbhAAAXYQAAF+EAABhhAAAY4QAAGWEAABnhAAAaYQAAP////9rhAAAbYQAAG+EAABxhAAAc4QAAHWEAAB3hAAAeYQAAHuEAAB9hAAAf4QAAIGEAAD/////g4QAAIWEAACHhAAAiYQAAP////+LhAAA//////////+NhAAA/////////////////////4+EAAD//////////5GEAACThAAAlYQAAJeEAACZhAAA/////5uEAACdhAAAn4QAAKGEAACjhAAApYQAAKeEAACphAAAq4QAAK2EAACvhAAAsYQAAP////+zhAAAtYQAALeEAAC5hAAAu4QAAL2EAAC/hAAAwYQAAP/////DhAAAxYQAAMeEAADJhAAAy4QAAM2EAADPhAAA0YQAAP/////ThAAA1YQAANeEAADZhAAA24QAAN2EAADfhAAA4YQAAOOEAADlhAAA///////////////////////////nhAAA6YQAAOuEAAD////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////uhAAA8IQAAPKEAAD0hAAA9oQAAPiEAAD6hAAA/IQAAP6EAAAAhQAAAoUAAASFAAAGhQAACIUAAAqFAAAMhQAADoUAABCFAAAShQAA////////////////FIUAABaFAAAYhQAAGoUAAByFAAAehQAAIIUAACKFAAAkhQAAJoUAACiFAAAqhQAALIUAAC6FAAAwhQAAMoUAADSFAAD//////////zaFAAA4hQAAOoUAADyFAAA+hQAAQIUAAEKFAABEhQAARoUAAEiFAABKhQAATIUAAE6FAABQhQAAUoUAAFSFAABWhQAAWIUAAFqFAABchQAAXoUAAGCFAABihQAAZIUAAGaFAABohQAAaoUAAGyFAABuhQAAcIUAAHKFAAB0hQAAdoUAAHiFAAB6hQAAfIUAAH6FAACAhQAAgoUAAISFAACGhQAAiIUAAIqFAACMhQAA/////46FAACQhQAAkoUAAJSFAACWhQAAmIUAAJqFAACchQAA////////////////noUAAKCFAACihQAApIUAAKaFAACohQAAqoUAAKyFAACuhQAAsIUAALKFAAC0hQAAtoUAALiFAAC6hQAAvIUAAP////++hQAAwIUAAP/////ChQAA/////8SFAADGhQAAyIUAAP/////KhQAAzIUAAM6FAADQhQAA0oUAAP/////UhQAA1oUAAP/////YhQAA2oUAANyFAADehQAA4IUAAOKFAADkhQAA5oUAAOiFAAD/////6oUAAOyFAAD/////7oUAAPCFAADyhQAA9IUAAPaFAAD4hQAA+oUAAPyFAAD+hQAAAIYAAAKGAAD/////BIYAAP////////////////////8GhgAACIYAAAqGAAD//////////wyGAAAOhgAAEIYAABKGAAD/////FIYAABaGAAAYhgAA/////xqGAAD/////HIYAAB6GAAAghgAAIoYAACSGAAAmhgAAKIYAACqGAAD///////////////8shgAA/////y6GAAAwhgAAMoYAADSGAAA2hgAAOIYAADqGAAA8hgAAPoYAAECGAABChgAARIYAAEaGAABIhgAASoYAAEyGAABOhgAAUIYAAP////9ShgAAVIYAAFaGAAD/////WIYAAFqGAAD/////XIYAAF6GAABghgAAYoYAAGSGAABmhgAAaIYAAP///////////////2qGAABshgAAboYAAHCGAAByhgAAdIYAAHaGAAB4hgAAeoYAAHyGAAB+hgAAgIYAAIKGAACEhgAAhoYAAIiGAAD/////ioYAAIyGAACOhgAAkIYAAJKGAACUhgAAloYAAJiGAACahgAAnIYAAJ6GAACghgAAooYAAKSGAACmhgAA//////////+ohgAAqoYAAKyGAACuhgAAsIYAALKGAAD/////tIYAAP////+2hgAAuIYAALqGAAC8hgAAvoYAAP/////AhgAA///////////ChgAAxIYAAMaGAADIhgAAyoYAAMyGAAD//////////86GAADQhgAA/////9KGAADUhgAA1oYAANiGAADahgAA3IYAAP/////ehgAA////////////////4IYAAOKGAAD//////////+SGAADmhgAA6IYAAOqGAADshgAA/////+6GAAD/////8IYAAPKGAAD0hgAA9oYAAP//////////+IYAAP/////6hgAA/IYAAP6GAAAAhwAAAocAAASHAAAGhwAACIcAAP////8KhwAADIcAAP////8OhwAAEIcAABKHAAAUhwAAFocAABiHAAAahwAA/////xyHAAAehwAAIIcAACKHAAAkhwAAJocAACiHAAAqhwAALIcAAC6HAAAwhwAAMocAADSHAAA2hwAAOIcAADqHAAD//////////zyHAAA+hwAA//////////9AhwAA/////0KHAAD/////RIcAAEaHAABIhwAASocAAEyHAABOhwAA//////////9QhwAAUocAAFSHAABWhwAA//////////9YhwAAWocAAP////9chwAA//////////9ehwAAYIcAAGKHAABkhwAAZocAAGiHAABqhwAAbIcAAG6HAABwhwAAcocAAHSHAAB2hwAAeIcAAHqHAAB8hwAAfocAAICHAACChwAAhIcAAIaHAAD/////iIcAAIqHAAD/////////////////////jIcAAI6HAACQhwAAkocAAJSHAACWhwAAmIcAAJqHAACchwAAnocAAKCHAACihwAA/////6SHAAD/////////////////////pocAAP////+ohwAA/////6qHAAD//////////6yHAAD/////rocAALCHAAD/////socAALSHAAC2hwAAuIcAALqHAAD/////vIcAAL6HAADAhwAAwocAAP/////EhwAA////////////////xocAAP///////////////8iHAAD//////////8qHAADMhwAAzocAAP/////QhwAA/////////////////////////////////////9KHAAD/////1IcAAP//////////////////////////1ocAANiHAAD////////////////////////////////ahwAA3IcAAP/////ehwAA/////+CHAAD//////////+KHAADkhwAA5ocAAOiHAADqhwAA7IcAAP/////uhwAA///////////whwAA///////////yhwAA9IcAAPaHAAD/////+IcAAPqHAAD8hwAA///////////+hwAA/////wCIAAD//////////wKIAAAEiAAA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////B4gAAAmIAAALiAAADYgAAA+IAAARiAAAE4gAABWIAAAXiAAAGYgAABuIAAAdiAAAH4gAACGIAAAjiAAAJYgAAP////8niAAAKYgAACuIAAD//////////y2IAAAviAAAMYgAADOIAAA1iAAAN4gAADmIAAA7iAAAPYgAAD+IAABBiAAA/////0OIAAD//////////0WIAABHiAAA//////////9JiAAAS4gAAE2IAABPiAAAUYgAAFOIAABViAAAV4gAAFmIAABbiAAAXYgAAF+IAABhiAAAY4gAAGWIAAD/////Z4gAAGmIAAD///////////////9riAAAbYgAAG+IAABxiAAAc4gAAHWIAAB3iAAA//////////95iAAA////////////////e4gAAH2IAAB/iAAAgYgAAIOIAACFiAAA//////////+HiAAAiYgAAIuIAACNiAAAj4gAAJGIAACTiAAAlYgAAJeIAAD/////mYgAAP////+biAAAnYgAAJ+IAAD/////oYgAAKOIAAD//////////6WIAACniAAAqYgAAP////+riAAArYgAAK+IAACxiAAAs4gAALWIAAC3iAAAuYgAAP//////////u4gAAL2IAAC/iAAAwYgAAMOIAADFiAAAx4gAAP///////////////8mIAADLiAAAzYgAAP//////////z4gAAP/////RiAAA04gAANWIAADXiAAA2YgAANuIAADdiAAA34gAAOGIAADjiAAA5YgAAP/////////////////////niAAA6YgAAOuIAADtiAAA///////////viAAA8YgAAPOIAAD/////9YgAAPeIAAD5iAAA+4gAAP///////////////////////////////////////////YgAAP//////iAAA/////wGJAAADiQAA/////wWJAAD//////////weJAAAJiQAAC4kAAP////8NiQAAD4kAABGJAAD//////////xOJAAD/////////////////////FYkAAP//////////F4kAABmJAAAbiQAA/////////////////////x2JAAD/////H4kAACGJAAAjiQAAJYkAACeJAAApiQAAK4kAAC2JAAAviQAAMYkAADOJAAA1iQAAN4kAAP////85iQAAO4kAAD2JAAA/iQAA/////0GJAAD//////////0OJAABFiQAA/////0eJAABJiQAAS4kAAP///////////////02JAABPiQAAUYkAAFOJAABViQAAV4kAAFmJAAD/////W4kAAF2JAABfiQAAYYkAAGOJAABliQAA/////2eJAABpiQAA//////////9riQAA/////22JAABviQAA//////////9xiQAAc4kAAP//////////dYkAAHeJAAD///////////////////////////////95iQAAe4kAAH2JAAB/iQAAgYkAAIOJAAD/////hYkAAIeJAAD/////iYkAAIuJAACNiQAAj4kAAJGJAACTiQAAlYkAAJeJAAD/////////////////////mYkAAJuJAACdiQAAn4kAAKGJAACjiQAApYkAAKeJAACpiQAAq4kAAK2JAACviQAAsYkAALOJAAC1iQAAt4kAALmJAAC7iQAAvYkAAP////+/iQAAwYkAAMOJAADFiQAAx4kAAMmJAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////zIkAAM6JAADQiQAA0okAANSJAADWiQAA/////9iJAADaiQAA3IkAAN6JAADgiQAA4okAAOSJAADmiQAA6IkAAOqJAADsiQAA7okAAPCJAADyiQAA//////////////////////SJAAD2iQAA+IkAAPqJAAD8iQAA//////6JAAAAigAAAooAAASKAAAGigAA/////wiKAAAKigAADIoAAA6KAAAQigAAEooAABSKAAAWigAAGIoAABqKAAAcigAAHooAAP//////////IIoAACKKAAAkigAAJooAACiKAAAqigAALIoAAC6KAAAwigAA/////zKKAAA0igAANooAADiKAAA6igAAPIoAAD6KAABAigAAQooAAESKAABGigAASIoAAP////9KigAATIoAAE6KAABQigAAUooAAP////9UigAAVooAAP////9YigAAWooAAFyKAABeigAAYIoAAGKKAABkigAA/////2aKAABoigAAaooAAGyKAABuigAAcIoAAHKKAAB0igAAdooAAHiKAAB6igAA/////3yKAAB+igAAgIoAAIKKAACEigAAhooAAIiKAACKigAAjIoAAI6KAACQigAAkooAAJSKAACWigAAmIoAAJqKAACcigAAnooAAKCKAACiigAApIoAAKaKAACoigAAqooAAKyKAACuigAA/////7CKAACyigAAtIoAALaKAAC4igAA/////7qKAAD//////////7yKAAD/////vooAAMCKAADCigAAxIoAAMaKAADIigAA/////////////////////8qKAADMigAA////////////////zooAANCKAAD/////0ooAANSKAADWigAA2IoAANqKAADcigAA3ooAAOCKAADiigAA5IoAAP/////////////////////migAA6IoAAOqKAADsigAA7ooAAPCKAADyigAA9IoAAPaKAAD4igAA+ooAAPyKAAD+igAAAIsAAAKLAAAEiwAABosAAAiLAAAKiwAADIsAAA6LAAAQiwAAEosAABSLAAAWiwAAGIsAABqLAAAciwAAHosAACCLAAAiiwAAJIsAACaLAAAoiwAA/////yqLAAAsiwAALosAADCLAAAyiwAANIsAADaLAAA4iwAAOosAADyLAAA+iwAAQIsAAEKLAABEiwAA/////0aLAABIiwAASosAAEyLAABOiwAA////////////////UIsAAP////9SiwAA/////1SLAABWiwAAWIsAAFqLAAD///////////////9ciwAAXosAAGCLAAD/////////////////////YosAAP////9kiwAA//////////9miwAAaIsAAGqLAAD/////bIsAAG6LAAD//////////3CLAAD//////////3KLAAB0iwAAdosAAP////94iwAAeosAAHyLAAB+iwAA/////4CLAACCiwAA/////4SLAAD/////hosAAIiLAACKiwAAjIsAAP//////////josAAJCLAACSiwAAlIsAAJaLAACYiwAAmosAAJyLAAD/////nosAAKCLAACiiwAApIsAAKaLAACoiwAAqosAAKyLAACuiwAAsIsAALKLAAC0iwAAtosAALiLAAC6iwAAvIsAAL6LAADAiwAAwosAAMSLAAD/////xosAAMiLAADKiwAAzIsAAM6LAADQiwAA0osAANSLAADWiwAA////////////////2IsAANqLAADciwAA3osAAOCLAADiiwAA5IsAAOaLAAD////////////////oiwAA6osAAOyLAADuiwAA8IsAAPKLAAD0iwAA9osAAPiLAAD/////+osAAPyLAAD+iwAA/////wCMAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////A4wAAAWMAAAHjAAACYwAAAuMAAANjAAAD4wAABGMAAATjAAAFYwAABeMAAAZjAAA////////////////G4wAAB2MAAAfjAAAIYwAACOMAAAljAAAJ4wAACmMAAArjAAALYwAAC+MAAAxjAAAM4wAADWMAAA3jAAAOYwAADuMAAA9jAAAP4wAAP////9BjAAAQ4wAAEWMAABHjAAASYwAAEuMAABNjAAA/////0+MAABRjAAAU4wAAFWMAABXjAAAWYwAAFuMAABdjAAAX4wAAGGMAABjjAAAZYwAAGeMAABpjAAAa4wAAG2MAABvjAAAcYwAAHOMAAD//////////3WMAAD//////////3eMAAD/////////////////////////////////////eYwAAHuMAAD/////////////////////fYwAAH+MAACBjAAA/////4OMAAD///////////////+FjAAAh4wAAImMAACLjAAAjYwAAI+MAACRjAAAk4wAAJWMAACXjAAAmYwAAJuMAACdjAAAn4wAAKGMAACjjAAApYwAAKeMAACpjAAA/////6uMAACtjAAAr4wAALGMAACzjAAAtYwAALeMAAC5jAAAu4wAAP////+9jAAA////////////////v4wAAMGMAADDjAAAxYwAAP//////////x4wAAP/////JjAAAy4wAAP//////////////////////////zYwAAM+MAADRjAAA04wAANWMAADXjAAA2YwAANuMAADdjAAA34wAAOGMAAD//////////+OMAADljAAA54wAAOmMAADrjAAA/////+2MAADvjAAA8YwAAPOMAAD1jAAA94wAAP////////////////////////////////mMAAD7jAAA/YwAAP+MAAABjQAAA40AAAWNAAAHjQAACY0AAAuNAAD/////DY0AAP///////////////w+NAAD//////////xGNAAATjQAAFY0AABeNAAAZjQAAG40AAB2NAAAfjQAA/////yGNAAD//////////yONAAD/////JY0AACeNAAD//////////ymNAAArjQAALY0AAC+NAAAxjQAAM40AADWNAAA3jQAAOY0AADuNAAA9jQAAP40AAEGNAABDjQAARY0AAEeNAABJjQAAS40AAE2NAABPjQAAUY0AAFONAABVjQAAV40AAFmNAABbjQAAXY0AAP////9fjQAAYY0AAGONAABljQAA/////2eNAABpjQAAa40AAP////9tjQAAb40AAHGNAABzjQAAdY0AAP//////////d40AAHmNAAD/////e40AAH2NAAB/jQAAgY0AAIONAACFjQAAh40AAImNAACLjQAAjY0AAI+NAACRjQAA//////////+TjQAAlY0AAP////////////////////+XjQAA/////5mNAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////5yNAACejQAAoI0AAKKNAACkjQAApo0AAP////+ojQAAqo0AAKyNAACujQAAsI0AALKNAAC0jQAAto0AALiNAAC6jQAAvI0AAL6NAADAjQAAwo0AAMSNAADGjQAA///////////IjQAAyo0AAMyNAADOjQAA///////////QjQAA0o0AANSNAADWjQAA2I0AANqNAADcjQAA3o0AAOCNAADijQAA/////////////////////+SNAADmjQAA6I0AAP/////qjQAA/////+yNAADujQAA8I0AAPKNAAD0jQAA//////aNAAD4jQAA+o0AAPyNAAD+jQAAAI4AAAKOAAAEjgAA/////waOAAAIjgAACo4AAAyOAAAOjgAAEI4AABKOAAAUjgAAFo4AABiOAAAajgAA/////xyOAAAejgAA//////////8gjgAAIo4AACSOAAAmjgAA//////////8ojgAAKo4AACyOAAAujgAAMI4AADKOAAA0jgAANo4AADiOAAA6jgAAPI4AAD6OAABAjgAAQo4AAESOAABGjgAASI4AAEqOAABMjgAA/////06OAAD//////////1COAAD/////Uo4AAFSOAABWjgAAWI4AAFqOAABcjgAAXo4AAGCOAABijgAAZI4AAGaOAABojgAA/////////////////////2qOAABsjgAA//////////////////////////9ujgAAcI4AAHKOAAB0jgAA////////////////do4AAHiOAAD//////////3qOAAB8jgAAfo4AAP//////////gI4AAIKOAACEjgAAho4AAIiOAACKjgAAjI4AAI6OAACQjgAA/////5KOAAD/////lI4AAP////+WjgAAmI4AAP////+ajgAAnI4AAJ6OAACgjgAAoo4AAKSOAACmjgAAqI4AAKqOAAD///////////////+sjgAAro4AALCOAACyjgAAtI4AALaOAAC4jgAAuo4AALyOAAC+jgAAwI4AAMKOAADEjgAAxo4AAMiOAADKjgAAzI4AAM6OAADQjgAA/////9KOAADUjgAA1o4AANiOAADajgAA3I4AAP/////ejgAA/////+COAAD/////4o4AAP///////////////+SOAAD//////////+aOAAD////////////////ojgAA6o4AAOyOAADujgAA//////COAAD///////////KOAAD0jgAA9o4AAPiOAAD/////////////////////+o4AAP/////8jgAA/o4AAACPAAACjwAA/////wSPAAD//////////waPAAAIjwAACo8AAP////8MjwAA/////w6PAAAQjwAA/////xKPAAAUjwAAFo8AAP////////////////////////////////////8YjwAAGo8AAP//////////HI8AAB6PAAAgjwAAIo8AACSPAAAmjwAAKI8AACqPAAAsjwAALo8AADCPAAD/////Mo8AADSPAAA2jwAAOI8AADqPAAA8jwAAPo8AAECPAABCjwAARI8AAEaPAABIjwAASo8AAEyPAABOjwAAUI8AAFKPAABUjwAAVo8AAFiPAABajwAAXI8AAF6PAABgjwAAYo8AAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////9ljwAAZ48AAGmPAABrjwAAbY8AAP////9vjwAAcY8AAHOPAAB1jwAAd48AAHmPAAB7jwAAfY8AAP////9/jwAAgY8AAIOPAACFjwAAh48AAImPAACLjwAAjY8AAP//////////j48AAJGPAACTjwAA/////////////////////5WPAACXjwAAmY8AAP//////////m48AAJ2PAACfjwAAoY8AAKOPAACljwAAp48AAKmPAACrjwAArY8AAK+PAACxjwAA/////7OPAAC1jwAA/////7ePAAD/////uY8AAP////+7jwAAvY8AAP///////////////////////////////7+PAAD/////wY8AAMOPAADFjwAAx48AAMmPAADLjwAAzY8AAM+PAAD//////////9GPAAD//////////9OPAAD//////////9WPAADXjwAA///////////////////////////ZjwAA///////////bjwAA3Y8AAN+PAADhjwAA448AAOWPAADnjwAA6Y8AAOuPAADtjwAA748AAPGPAADzjwAA9Y8AAPePAAD5jwAA+48AAP///////////Y8AAP////////////////////////////////+PAAABkAAAA5AAAAWQAAAHkAAACZAAAAuQAAANkAAAD5AAABGQAAD//////////xOQAAAVkAAAF5AAABmQAAAbkAAAHZAAAB+QAAAhkAAA//////////8jkAAAJZAAACeQAAApkAAAK5AAAC2QAAAvkAAAMZAAADOQAAA1kAAAN5AAADmQAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////zyQAAA+kAAAQJAAAEKQAABEkAAARpAAAP////9IkAAASpAAAEyQAABOkAAAUJAAAFKQAABUkAAAVpAAAFiQAABakAAAXJAAAF6QAABgkAAAYpAAAGSQAAD/////ZpAAAP////9okAAAapAAAGyQAABukAAAcJAAAHKQAAB0kAAAdpAAAHiQAAB6kAAAfJAAAH6QAACAkAAAgpAAAISQAACGkAAAiJAAAP////+KkAAA/////4yQAAD/////jpAAAJCQAACSkAAAlJAAAJaQAACYkAAAmpAAAJyQAACekAAAoJAAAKKQAAD/////pJAAAKaQAACokAAAqpAAAKyQAACukAAA/////7CQAACykAAAtJAAALaQAAC4kAAAupAAALyQAAC+kAAAwJAAAMKQAADEkAAA///////////GkAAA/////8iQAADKkAAAzJAAAM6QAADQkAAA0pAAANSQAADWkAAA2JAAANqQAADckAAA3pAAAOCQAADikAAA5JAAAOaQAADokAAA6pAAAOyQAADukAAA8JAAAPKQAAD///////////SQAAD2kAAA+JAAAPqQAAD8kAAA/pAAAP////8AkQAAApEAAP////8EkQAABpEAAP//////////CJEAAAqRAAAMkQAADpEAABCRAAASkQAAFJEAABaRAAAYkQAAGpEAAByRAAAekQAAIJEAACKRAAAkkQAAJpEAACiRAAAqkQAALJEAAC6RAAAwkQAA/////////////////////zKRAAA0kQAANpEAAP//////////////////////////OJEAADqRAAD/////PJEAAP////8+kQAAQJEAAEKRAABEkQAARpEAAEiRAABKkQAATJEAAE6RAABQkQAA/////1KRAABUkQAAVpEAAFiRAAD/////////////////////WpEAAFyRAABekQAAYJEAAGKRAAD/////ZJEAAGaRAABokQAAapEAAGyRAABukQAAcJEAAHKRAAB0kQAAdpEAAHiRAAB6kQAAfJEAAH6RAACAkQAAgpEAAISRAACGkQAA/////4iRAAD///////////////+KkQAAjJEAAI6RAACQkQAAkpEAAJSRAAD/////lpEAAJiRAACakQAA/////5yRAACekQAAoJEAAP///////////////6KRAACkkQAAppEAAP////+okQAAqpEAAKyRAACukQAA/////7CRAACykQAAtJEAALaRAAC4kQAAupEAALyRAAC+kQAA/////8CRAADCkQAAxJEAAMaRAADIkQAAypEAAP/////MkQAAzpEAANCRAAD/////0pEAANSRAADWkQAA2JEAANqRAADckQAA3pEAAOCRAADikQAA5JEAAOaRAADokQAA6pEAAOyRAADukQAA8JEAAPKRAAD/////9JEAAPaRAAD4kQAA+pEAAPyRAAD+kQAAAJIAAAKSAAAEkgAABpIAAAiSAAD//////////wqSAAD/////DJIAAA6SAAAQkgAA//////////8SkgAAFJIAABaSAAD/////GJIAABqSAAAckgAAHpIAACCSAAAikgAAJJIAACaSAAAokgAAKpIAACySAAAukgAAMJIAADKSAAA0kgAA/////zaSAAA4kgAAOpIAADySAAA+kgAAQJIAAEKSAABEkgAARpIAAEiSAABKkgAATJIAAE6SAABQkgAAUpIAAFSSAABWkgAAWJIAAP//////////WpIAAP//////////XJIAAP//////////XpIAAP////9gkgAAYpIAAGSSAABmkgAAaJIAAGqSAABskgAA/////26SAABwkgAA//////////9ykgAAdJIAAHaSAAB4kgAA/////3qSAAB8kgAAfpIAAICSAACCkgAA/////4SSAACGkgAA//////////+IkgAA//////////+KkgAA/////4ySAACOkgAA//////////+QkgAAkpIAAJSSAACWkgAAmJIAAP//////////mpIAAJySAACekgAAoJIAAKKSAAD///////////////+kkgAAppIAAKiSAACqkgAArJIAAK6SAACwkgAA/////7KSAAC0kgAAtpIAALiSAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////7uSAAC9kgAAv5IAAMGSAADDkgAAxZIAAMeSAADJkgAAy5IAAM2SAAD/////z5IAANGSAADTkgAA1ZIAANeSAADZkgAA25IAAN2SAADfkgAA4ZIAAOOSAADlkgAA55IAAOmSAADrkgAA7ZIAAP/////vkgAA8ZIAAP////////////////OSAAD1kgAA95IAAPmSAAD7kgAA/ZIAAP///////////////////////////5IAAAGTAAADkwAABZMAAP////8HkwAACZMAAP//////////C5MAAP////8NkwAA/////w+TAAARkwAAE5MAABWTAAAXkwAAGZMAAP////8bkwAAHZMAAB+TAAAhkwAAI5MAACWTAAD//////////////////////////yeTAAD/////KZMAACuTAAD/////LZMAAP//////////L5MAAP////8xkwAA/////zOTAAA1kwAAN5MAADmTAAA7kwAAPZMAAD+TAABBkwAAQ5MAAEWTAAD/////////////////////////////////////R5MAAEmTAABLkwAATZMAAP//////////T5MAAP////9RkwAAU5MAAP//////////////////////////VZMAAP////9XkwAAWZMAAFuTAABdkwAAX5MAAGGTAABjkwAA/////2WTAAD/////Z5MAAGmTAABrkwAAbZMAAG+TAABxkwAAc5MAAHWTAAB3kwAAeZMAAP//////////e5MAAP////99kwAAf5MAAP///////////////////////////////4GTAAD/////g5MAAIWTAACHkwAA/////4mTAAD///////////////+LkwAAjZMAAI+TAACRkwAA/////5OTAACVkwAA////////////////l5MAAP////+ZkwAA/////5uTAACdkwAAn5MAAKGTAACjkwAApZMAAKeTAACpkwAAq5MAAK2TAACvkwAAsZMAALOTAAD/////tZMAALeTAAC5kwAA////////////////////////////////u5MAAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////++kwAAwJMAAMKTAADEkwAAxpMAAMiTAAD/////ypMAAMyTAAD/////zpMAANCTAAD/////0pMAANSTAADWkwAA2JMAAP/////akwAA/////9yTAADekwAA4JMAAOKTAADkkwAA5pMAAOiTAADqkwAA7JMAAO6TAADwkwAA//////KTAAD0kwAA9pMAAPiTAAD6kwAA/JMAAP6TAAAAlAAAApQAAASUAAAGlAAACJQAAAqUAAAMlAAADpQAABCUAAASlAAA/////////////////////xSUAAD/////FpQAABiUAAAalAAAHJQAAB6UAAAglAAAIpQAACSUAAAmlAAAKJQAACqUAAAslAAALpQAADCUAAAylAAA/////zSUAAD/////NpQAADiUAAD/////OpQAADyUAAA+lAAAQJQAAEKUAABElAAARpQAAEiUAABKlAAATJQAAE6UAAD//////////1CUAABSlAAAVJQAAP//////////VpQAAP////9YlAAAWpQAAFyUAABelAAAYJQAAGKUAABklAAAZpQAAGiUAAD/////apQAAP////9slAAA//////////9ulAAAcJQAAHKUAAB0lAAAdpQAAHiUAAB6lAAA//////////98lAAA/////////////////////36UAACAlAAAgpQAAP////+ElAAA/////4aUAACIlAAAipQAAIyUAACOlAAAkJQAAP//////////kpQAAJSUAACWlAAAmJQAAJqUAAD///////////////+clAAAnpQAAKCUAACilAAApJQAAKaUAAColAAA/////6qUAACslAAArpQAALCUAACylAAAtJQAALaUAAC4lAAAupQAALyUAAC+lAAAwJQAAMKUAADElAAAxpQAAMiUAADKlAAAzJQAAM6UAAD/////0JQAANKUAADUlAAA1pQAAP//////////2JQAANqUAADclAAA3pQAAOCUAADilAAA5JQAAOaUAADolAAA6pQAAOyUAAD/////////////////////7pQAAPCUAAD/////8pQAAPSUAAD///////////aUAAD4lAAA+pQAAP/////////////////////8lAAA///////////+lAAAAJUAAAKVAAAElQAABpUAAAiVAAAKlQAADJUAAA6VAAAQlQAA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////xOVAAAVlQAAF5UAABmVAAAblQAAHZUAAB+VAAAhlQAAI5UAACWVAAAnlQAA////////////////KZUAACuVAAAtlQAAL5UAADGVAAAzlQAANZUAADeVAAA5lQAA//////////87lQAA/////z2VAAA/lQAAQZUAAEOVAABFlQAAR5UAAEmVAABLlQAATZUAAE+VAABRlQAAU5UAAFWVAABXlQAAWZUAAFuVAAD//////////12VAABflQAAYZUAAGOVAAD///////////////9llQAAZ5UAAGmVAABrlQAAbZUAAG+VAABxlQAA//////////9zlQAAdZUAAHeVAAB5lQAAe5UAAH2VAAB/lQAAgZUAAIOVAACFlQAAh5UAAImVAACLlQAAjZUAAI+VAAD///////////////////////////////+RlQAA//////////+TlQAAlZUAAP////+XlQAAmZUAAJuVAACdlQAAn5UAAKGVAACjlQAA/////6WVAAD/////p5UAAKmVAACrlQAArZUAAK+VAACxlQAAs5UAAP////////////////////+1lQAAt5UAAP////+5lQAAu5UAAP//////////vZUAAL+VAADBlQAAw5UAAMWVAADHlQAAyZUAAMuVAADNlQAA/////8+VAAD//////////9GVAADTlQAA1ZUAANeVAAD/////2ZUAANuVAADdlQAA35UAAOGVAADjlQAA5ZUAAP/////nlQAA6ZUAAOuVAADtlQAA75UAAPGVAADzlQAA///////////1lQAA95UAAP/////5lQAA///////////7lQAA//////2VAAD/lQAA/////wGWAAADlgAABZYAAP////////////////////8HlgAA/////wmWAAALlgAADZYAAA+WAAARlgAAE5YAABWWAAAXlgAAGZYAABuWAAAdlgAAH5YAACGWAAAjlgAAJZYAACeWAAAplgAAK5YAAP///////////////y2WAAD//////////y+WAAAxlgAA////////////////M5YAADWWAAA3lgAAOZYAADuWAAD///////////////89lgAAP5YAAEGWAABDlgAARZYAAP////9HlgAASZYAAEuWAABNlgAAT5YAAP////9RlgAAU5YAAP//////////VZYAAFeWAABZlgAAW5YAAF2WAABflgAA//////////////////////////9hlgAAY5YAAP////9llgAA/////2eWAABplgAAa5YAAP////9tlgAAb5YAAP////9xlgAAc5YAAHWWAAB3lgAA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////epYAAHyWAAB+lgAAgJYAAIKWAACElgAAhpYAAIiWAACKlgAAjJYAAI6WAACQlgAAkpYAAJSWAACWlgAAmJYAAJqWAACclgAAnpYAAKCWAACilgAApJYAAKaWAAColgAAqpYAAP//////////rJYAAK6WAACwlgAAspYAALSWAAC2lgAAuJYAALqWAAC8lgAAvpYAAMCWAADClgAAxJYAAMaWAADIlgAAypYAAMyWAADOlgAA0JYAANKWAADUlgAA1pYAANiWAADalgAA3JYAAN6WAADglgAA4pYAAOSWAAD/////5pYAAOiWAADqlgAA7JYAAO6WAADwlgAA8pYAAPSWAAD2lgAA+JYAAPqWAAD8lgAA/pYAAACXAAD/////ApcAAASXAAAGlwAACJcAAAqXAAAMlwAADpcAABCXAAASlwAAFJcAABaXAAAYlwAAGpcAAP////8clwAAHpcAACCXAAAilwAAJJcAACaXAAAolwAA/////yqXAAD//////////yyXAAAulwAAMJcAADKXAAA0lwAANpcAADiXAAA6lwAA/////zyXAAA+lwAAQJcAAEKXAAD/////RJcAAEaXAABIlwAASpcAAEyXAABOlwAA//////////9QlwAA/////1KXAAD/////VJcAAFaXAABYlwAAWpcAAP////9clwAAXpcAAGCXAAD/////YpcAAGSXAAD/////ZpcAAGiXAAD/////apcAAGyXAAD/////bpcAAHCXAAD//////////3KXAAB0lwAAdpcAAP//////////eJcAAP//////////epcAAHyXAAB+lwAA/////4CXAACClwAAhJcAAIaXAAD/////iJcAAP////+KlwAAjJcAAI6XAACQlwAAkpcAAJSXAACWlwAAmJcAAJqXAACclwAA/////////////////////////////////////56XAACglwAAopcAAP////+klwAAppcAAKiXAAD//////////6qXAACslwAArpcAAP////+wlwAAspcAALSXAAC2lwAAuJcAAP//////////upcAAP//////////vJcAAL6XAADAlwAAwpcAAMSXAADGlwAAyJcAAMqXAADMlwAAzpcAANCXAAD//////////9KXAAD/////1JcAANaXAADYlwAA2pcAANyXAADelwAA4JcAAOKXAAD//////////+SXAADmlwAA6JcAAP///////////////+qXAADslwAA7pcAAPCXAADylwAA9JcAAPaXAAD/////////////////////////////////////+JcAAP/////6lwAA//////yXAAD+lwAAAJgAAAKYAAD/////BJgAAP////8GmAAA/////wiYAAAKmAAADJgAAA6YAAD//////////xCYAAD//////////xKYAAD///////////////8UmAAAFpgAABiYAAAamAAAHJgAAB6YAAAgmAAAIpgAACSYAAAmmAAAKJgAACqYAAAsmAAALpgAADCYAAAymAAANJgAADaYAAA4mAAAOpgAADyYAAA+mAAA/////0CYAAD/////QpgAAESYAAD/////RpgAAEiYAAD//////////0qYAAD/////TJgAAE6YAAD//////////1CYAAD/////UpgAAFSYAABWmAAAWJgAAP////9amAAA//////////9cmAAA/////////////////////16YAABgmAAAYpgAAGSYAABmmAAAaJgAAGqYAABsmAAA/////26YAABwmAAAcpgAAHSYAAD/////dpgAAHiYAAB6mAAAfJgAAP////9+mAAA//////////////////////////+AmAAA/////4KYAACEmAAAhpgAAIiYAACKmAAA/////4yYAAD/////jpgAAJCYAACSmAAAlJgAAJaYAACYmAAA/////5qYAACcmAAAnpgAAKCYAAD///////////////+imAAApJgAAKaYAAComAAA////////////////////////////////qpgAAKyYAACumAAAsJgAALKYAAC0mAAAtpgAALiYAAD//////////7qYAAD//////////7yYAAC+mAAAwJgAAP//////////wpgAAP/////EmAAAxpgAAP//////////yJgAAMqYAAD/////zJgAAM6YAADQmAAA0pgAAP/////UmAAA1pgAANiYAADamAAA3JgAAN6YAADgmAAA4pgAAOSYAADmmAAA6JgAAOqYAADsmAAA7pgAAPCYAADymAAA//////SYAAD2mAAA+JgAAPqYAAD8mAAA/pgAAACZAAACmQAABJkAAP//////////BpkAAAiZAAD/////CpkAAAyZAAAOmQAA/////xCZAAASmQAAFJkAAP///////////////////////////////xaZAAD/////GJkAAP////////////////////8amQAA/////////////////////////////////////xyZAAAemQAA//////////////////////////8gmQAA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////I5kAACWZAAAnmQAAKZkAACuZAAAtmQAAL5kAADGZAAAzmQAANZkAADeZAAA5mQAAO5kAAD2ZAAA/mQAAQZkAAEOZAABFmQAAR5kAAEmZAAD//////////////////////////0uZAABNmQAAT5kAAP////9RmQAAU5kAAFWZAABXmQAAWZkAAFuZAAD/////XZkAAP////9fmQAA//////////9hmQAA/////2OZAAD/////ZZkAAGeZAAD/////////////////////aZkAAGuZAABtmQAAb5kAAHGZAABzmQAAdZkAAHeZAAB5mQAA//////////////////////////97mQAA/////32ZAAB/mQAA//////////+BmQAAg5kAAIWZAACHmQAAiZkAAIuZAAD/////jZkAAI+ZAACRmQAAk5kAAJWZAAD//////////5eZAACZmQAA/////////////////////5uZAACdmQAAn5kAAP////+hmQAAo5kAAKWZAACnmQAAqZkAAKuZAACtmQAAr5kAALGZAACzmQAAtZkAALeZAAC5mQAAu5kAAL2ZAAC/mQAA/////8GZAADDmQAAxZkAAMeZAADJmQAAy5kAAP//////////zZkAAM+ZAADRmQAA/////////////////////9OZAADVmQAA15kAANmZAAD/////25kAAN2ZAADfmQAA4ZkAAOOZAADlmQAA55kAAOmZAADrmQAA7ZkAAO+ZAAD/////8ZkAAP/////zmQAA9ZkAAP//////////95kAAPmZAAD7mQAA/ZkAAP+ZAAABmgAAA5oAAAWaAAAHmgAACZoAAAuaAAD/////DZoAAA+aAAARmgAAE5oAAP////8VmgAAF5oAABmaAAD///////////////8bmgAAHZoAAP////8fmgAA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////IpoAACSaAAAmmgAAKJoAACqaAAAsmgAALpoAADCaAAAymgAANJoAADaaAAA4mgAAOpoAAP////88mgAA/////z6aAABAmgAAQpoAAP////9EmgAARpoAAEiaAABKmgAATJoAAE6aAABQmgAAUpoAAFSaAABWmgAA/////1iaAABamgAAXJoAAF6aAABgmgAA/////2KaAABkmgAAZpoAAGiaAABqmgAAbJoAAG6aAABwmgAAcpoAAHSaAAB2mgAA/////3iaAAB6mgAAfJoAAH6aAACAmgAA/////4KaAACEmgAAhpoAAIiaAACKmgAAjJoAAP////+OmgAA//////////+QmgAAkpoAAJSaAAD///////////////////////////////+WmgAAmJoAAP////+amgAAnJoAAP////+emgAAoJoAAKKaAACkmgAAppoAAP//////////qJoAAP////+qmgAArJoAAK6aAACwmgAAspoAAP///////////////7SaAAC2mgAAuJoAALqaAAC8mgAA/////76aAADAmgAAwpoAAMSaAADGmgAAyJoAAP/////KmgAAzJoAAP/////OmgAA/////////////////////9CaAAD//////////9KaAADUmgAA1poAANiaAAD/////2poAANyaAADemgAA4JoAAP/////////////////////imgAA5JoAAOaaAADomgAA6poAAOyaAAD/////7poAAPCaAADymgAA9JoAAPaaAAD/////+JoAAPqaAAD8mgAA/poAAACbAAACmwAABJsAAAabAAAImwAA/////wqbAAD/////DJsAAA6bAAAQmwAAEpsAABSbAAAWmwAA/////xibAAAamwAAHJsAAP//////////HpsAAP//////////////////////////IJsAACKbAAAkmwAAJpsAACibAAD///////////////8qmwAA/////yybAAAumwAAMJsAAP////8ymwAA/////zSbAAA2mwAAOJsAADqbAAA8mwAAPpsAAECbAABCmwAARJsAAEabAABImwAA/////0qbAABMmwAATpsAAFCbAABSmwAA/////1SbAAD///////////////9WmwAAWJsAAFqbAAD/////XJsAAP////9emwAAYJsAAGKbAAD///////////////9kmwAAZpsAAGibAABqmwAA/////2ybAABumwAA/////////////////////3CbAAD//////////3KbAAD/////dJsAAHabAAB4mwAAepsAAHybAAB+mwAAgJsAAIKbAACEmwAAhpsAAIibAAD/////ipsAAIybAACOmwAA////////////////kJsAAJKbAACUmwAA/////////////////////5abAACYmwAAmpsAAP//////////////////////////////////////////nJsAAJ6bAACgmwAAopsAAP//////////pJsAAKabAAComwAA//////////+qmwAArJsAAP////+umwAAsJsAALKbAAD//////////7SbAAC2mwAA/////7ibAAC6mwAAvJsAAP///////////////76bAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8GbAADDmwAAxZsAAMebAADJmwAAy5sAAM2bAADPmwAA0ZsAANObAAD/////1ZsAANebAADZmwAA25sAAN2bAADfmwAA4ZsAAOObAADlmwAA55sAAOmbAADrmwAA/////+2bAAD/////////////////////75sAAPGbAADzmwAA9ZsAAPebAAD5mwAA+5sAAP2bAAD/mwAA////////////////AZwAAAOcAAAFnAAAB5wAAAmcAAALnAAADZwAAA+cAAARnAAAE5wAAP///////////////xWcAAAXnAAAGZwAABucAAAdnAAAH5wAACGcAAAjnAAAJZwAAP//////////J5wAACmcAAD///////////////8rnAAALZwAAC+cAAAxnAAAM5wAAP////81nAAAN5wAADmcAAA7nAAAPZwAAD+cAABBnAAAQ5wAAEWcAAD//////////0ecAAD/////SZwAAEucAAD//////////02cAABPnAAAUZwAAFOcAABVnAAAV5wAAFmcAABbnAAAXZwAAF+cAABhnAAAY5wAAP////9lnAAAZ5wAAP////9pnAAAa5wAAG2cAAD/////b5wAAP//////////////////////////cZwAAHOcAAB1nAAAd5wAAHmcAAD/////e5wAAH2cAAB/nAAAgZwAAP////+DnAAAhZwAAIecAACJnAAA//////////+LnAAAjZwAAP////+PnAAA////////////////kZwAAJOcAACVnAAAl5wAAJmcAACbnAAAnZwAAP////+fnAAAoZwAAKOcAAClnAAAp5wAAKmcAACrnAAArZwAAK+cAACxnAAAs5wAALWcAAD//////////7ecAAD/////uZwAAP////+7nAAAvZwAAL+cAADBnAAA/////////////////////8OcAADFnAAAx5wAAMmcAADLnAAAzZwAAP///////////////////////////////8+cAADRnAAA///////////TnAAA1ZwAAP/////XnAAA2ZwAANucAADdnAAA35wAAP//////////////////////////4ZwAAP/////jnAAA///////////lnAAA55wAAOmcAADrnAAA/////+2cAADvnAAA8ZwAAPOcAAD1nAAA95wAAPmcAAD///////////ucAAD9nAAA/5wAAAGdAAADnQAABZ0AAAedAAAJnQAAC50AAA2dAAAPnQAAEZ0AABOdAAAVnQAAF50AABmdAAAbnQAAHZ0AAP////////////////////////////////////8fnQAA////////////////////////////////IZ0AACOdAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////yadAAAonQAAKp0AACydAAAunQAAMJ0AADKdAAA0nQAANp0AADidAAA6nQAAPJ0AAD6dAAD//////////0CdAABCnQAA/////0SdAABGnQAASJ0AAEqdAABMnQAATp0AAFCdAABSnQAAVJ0AAFadAABYnQAAWp0AAFydAABenQAAYJ0AAP//////////Yp0AAGSdAABmnQAAaJ0AAGqdAABsnQAAbp0AAHCdAABynQAAdJ0AAP//////////dp0AAP////94nQAAep0AAP//////////fJ0AAH6dAACAnQAA////////////////gp0AAISdAACGnQAAiJ0AAIqdAACMnQAA/////46dAAD//////////5CdAACSnQAAlJ0AAJadAAD//////////////////////////5idAACanQAA////////////////nJ0AAJ6dAAD///////////////+gnQAAop0AAKSdAACmnQAA//////////+onQAA//////////+qnQAA/////6ydAACunQAA/////////////////////7CdAACynQAAtJ0AAP////+2nQAAuJ0AALqdAAC8nQAAvp0AAMCdAAD//////////8KdAAD/////xJ0AAP//////////xp0AAP///////////////8idAAD/////////////////////////////////////////////////////yp0AAMydAAD/////////////////////zp0AANCdAADSnQAA/////9SdAADWnQAA/////9idAAD/////////////////////2p0AANydAADenQAA/////+CdAADinQAA5J0AAOadAAD/////////////////////6J0AAP/////qnQAA/////+ydAADunQAA///////////wnQAA8p0AAPSdAAD2nQAA+J0AAP/////6nQAA/J0AAP/////+nQAA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wGeAAADngAABZ4AAAeeAAAJngAAC54AAA2eAAAPngAAEZ4AABOeAAAVngAAF54AABmeAAAbngAAHZ4AAB+eAAAhngAAI54AACWeAAAnngAA//////////8pngAAK54AAC2eAAAvngAAMZ4AADOeAAA1ngAAN54AADmeAAA7ngAAPZ4AAD+eAABBngAAQ54AAP////9FngAA//////////9HngAASZ4AAEueAABNngAAT54AAFGeAABTngAAVZ4AAFeeAABZngAA/////1ueAABdngAA/////1+eAABhngAAY54AAGWeAABnngAAaZ4AAGueAABtngAAb54AAHGeAABzngAAdZ4AAHeeAAB5ngAAe54AAH2eAAB/ngAAgZ4AAP//////////g54AAP////+FngAAh54AAP////+JngAA/////4ueAACNngAA/////4+eAACRngAAk54AAP//////////lZ4AAJeeAACZngAAm54AAJ2eAACfngAAoZ4AAP////+jngAApZ4AAKeeAACpngAAq54AAK2eAACvngAAsZ4AALOeAAC1ngAAt54AALmeAAC7ngAAvZ4AAL+eAADBngAAw54AAMWeAADHngAAyZ4AAMueAADNngAA/////8+eAADRngAA054AANWeAADXngAA2Z4AANueAAD/////3Z4AAN+eAAD////////////////hngAA454AAOWeAAD/////554AAOmeAAD/////654AAO2eAADvngAA8Z4AAP/////zngAA9Z4AAPeeAAD/////+Z4AAP////////////////ueAAD//////Z4AAP+eAAABnwAA//////////8DnwAA/////wWfAAAHnwAA/////wmfAAALnwAA////////////////DZ8AAA+fAAARnwAAE58AABWfAAD/////F58AAP////8ZnwAAG58AAB2fAAD/////H58AACGfAAAjnwAAJZ8AAP////8nnwAAKZ8AACufAAD/////LZ8AAC+fAAD/////MZ8AAP////////////////////8znwAANZ8AAP//////////////////////////////////////////N58AAP////85nwAAO58AAD2fAAA/nwAAQZ8AAEOfAABFnwAA/////0efAABJnwAA/////0ufAABNnwAA////////////////T58AAFGfAAD//////////1OfAABVnwAA////////////////V58AAFmfAABbnwAA////////////////XZ8AAF+fAABhnwAA/////2OfAABlnwAA//////////9nnwAA/////2mfAAD/////////////////////////////////////a58AAP//////////bZ8AAG+fAAD/////cZ8AAHOfAAB1nwAAd58AAHmfAAB7nwAAfZ8AAH+fAAD/////gZ8AAP////+DnwAAhZ8AAIefAAD///////////////+JnwAAi58AAP//////////jZ8AAI+fAAD/////kZ8AAJOfAACVnwAA//////////+XnwAA/////5mfAACbnwAA//////////+dnwAA/////////////////////5+fAAChnwAA//////////////////////////+jnwAApZ8AAKefAACpnwAA////////////////////////////////q58AAK2fAACvnwAAsZ8AALOfAAC1nwAA/////7efAAD///////////////+5nwAAu58AAL2fAAC/nwAAwZ8AAP//////////w58AAP//////////////////////////xZ8AAMefAAD//////////8mfAADLnwAA////////////////zZ8AAM+fAAD//////////////////////////9GfAADTnwAA1Z8AAP//////////158AAP//////////2Z8AAP///////////////9ufAADdnwAA358AAOGfAADjnwAA/////+WfAADnnwAA6Z8AAOufAAD/////////////////////7Z8AAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////CfAADynwAA9J8AAPafAAD4nwAA+p8AAPyfAAD+nwAAAKAAAAKgAAAEoAAABqAAAAigAAAKoAAA/////wygAAAOoAAAEKAAABKgAAAUoAAAFqAAABigAAAaoAAA/////xygAAAeoAAAIKAAACKgAAAkoAAAJqAAACigAAAqoAAALKAAAC6gAAAwoAAAMqAAADSgAAA2oAAAOKAAADqgAAA8oAAAPqAAAECgAABCoAAARKAAAEagAABIoAAA//////////////////////////////////////////9KoAAATKAAAE6gAABQoAAAUqAAAFSgAABWoAAA/////1igAABaoAAAXKAAAF6gAABgoAAAYqAAAGSgAABmoAAAaKAAAP////9qoAAA/////2ygAAD/////bqAAAP//////////cKAAAP//////////cqAAAHSgAAD/////dqAAAHigAAB6oAAAfKAAAH6gAACAoAAAgqAAAISgAACGoAAAiKAAAIqgAACMoAAAjqAAAJCgAACSoAAAlKAAAJagAACYoAAAmqAAAJygAAD/////nqAAAKCgAACioAAApKAAAKagAAD/////qKAAAKqgAAD//////////6ygAACuoAAA/////////////////////////////////////7CgAAD/////sqAAALSgAAC2oAAAuKAAALqgAAC8oAAAvqAAAMCgAADCoAAAxKAAAMagAADIoAAAyqAAAMygAADOoAAA0KAAANKgAADUoAAA1qAAANigAADaoAAA3KAAAN6gAADgoAAA4qAAAOSgAADmoAAA/////+igAADqoAAA7KAAAO6gAADwoAAA8qAAAP////////////////SgAAD/////9qAAAP//////////+KAAAPqgAAD8oAAA///////////+oAAAAKEAAAKhAAAEoQAABqEAAAihAAAKoQAADKEAAP//////////DqEAABChAAD/////EqEAAP///////////////xShAAD//////////xahAAD/////////////////////GKEAABqhAAD/////HKEAAB6hAAAgoQAAIqEAACShAAAmoQAA/////////////////////yihAAD/////KqEAACyhAAAuoQAAMKEAADKhAAA0oQAANqEAADihAAA6oQAAPKEAAD6hAABAoQAAQqEAAEShAABGoQAASKEAAEqhAABMoQAATqEAAFChAABSoQAAVKEAAFahAAD/////WKEAAFqhAABcoQAAXqEAAGChAABioQAAZKEAAGahAAD/////aKEAAP////9qoQAAbKEAAG6hAAD/////cKEAAHKhAAB0oQAA/////////////////////3ahAAD/////////////////////eKEAAP///////////////3qhAAD//////////3yhAAB+oQAAgKEAAIKhAACEoQAA/////4ahAACIoQAAiqEAAP////+MoQAAjqEAAJChAACSoQAAlKEAAJahAAD/////mKEAAP////+aoQAAnKEAAP////+eoQAA////////////////oKEAAP////+ioQAA/////6ShAACmoQAA//////////////////////////+ooQAA/////6qhAAD/////rKEAAK6hAACwoQAA/////7KhAAC0oQAAtqEAALihAAC6oQAAvKEAAL6hAADAoQAAwqEAAMShAADGoQAAyKEAAMqhAADMoQAAzqEAANChAADSoQAA1KEAANahAADYoQAA2qEAANyhAADeoQAA4KEAAOKhAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////+WhAADnoQAA6aEAAOuhAADtoQAA76EAAPGhAADzoQAA9aEAAPehAAD5oQAA+6EAAP2hAAD/oQAAAaIAAAOiAAAFogAAB6IAAAmiAAALogAADaIAAA+iAAARogAAE6IAABWiAAAXogAAGaIAABuiAAAdogAAH6IAACGiAAAjogAAJaIAACeiAAApogAAK6IAAC2iAAAvogAAMaIAADOiAAA1ogAAN6IAAP////85ogAAO6IAAD2iAAA/ogAA/////0GiAAD//////////0OiAABFogAAR6IAAEmiAABLogAATaIAAE+iAABRogAAU6IAAFWiAABXogAAWaIAAFuiAABdogAAX6IAAGGiAAD//////////2OiAABlogAAZ6IAAGmiAABrogAA/////22iAAD/////b6IAAHGiAABzogAAdaIAAP//////////d6IAAHmiAAB7ogAA/////32iAAB/ogAA//////////+BogAAg6IAAP////+FogAA/////////////////////4eiAACJogAAi6IAAI2iAACPogAAkaIAAJOiAACVogAAl6IAAJmiAACbogAAnaIAAJ+iAAChogAAo6IAAKWiAACnogAAqaIAAKuiAACtogAAr6IAALGiAACzogAAtaIAALeiAAC5ogAAu6IAAL2iAAC/ogAAwaIAAMOiAAD/////xaIAAMeiAADJogAAy6IAAM2iAADPogAA0aIAAP//////////06IAANWiAADXogAA2aIAANuiAADdogAA36IAAOGiAAD////////////////jogAA5aIAAOeiAADpogAA/////+uiAAD////////////////togAA///////////vogAA8aIAAPOiAAD1ogAA96IAAPmiAAD7ogAA/aIAAP+iAAABowAAA6MAAP////8FowAAB6MAAAmjAAALowAADaMAAA+jAAARowAAE6MAABWjAAAXowAAGaMAABujAAAdowAAH6MAACGjAAAjowAAJaMAACejAAApowAAK6MAAP////8towAAL6MAADGjAAAzowAANaMAADejAAA5owAAO6MAAD2jAAD//////////z+jAABBowAAQ6MAAEWjAABHowAASaMAAEujAABNowAAT6MAAFGjAABTowAAVaMAAFejAABZowAAW6MAAF2jAAD/////X6MAAGGjAABjowAAZaMAAP////9nowAA//////////9powAAa6MAAG2jAABvowAA//////////9xowAAc6MAAP//////////daMAAHejAAB5owAAe6MAAP///////////////32jAAD//////////////////////////3+jAACBowAA////////////////g6MAAP//////////haMAAP//////////h6MAAP//////////iaMAAIujAACNowAAj6MAAP//////////kaMAAJOjAACVowAAl6MAAJmjAAD///////////////+bowAAnaMAAJ+jAAD/////oaMAAP////+jowAApaMAAKejAACpowAAq6MAAK2jAACvowAAsaMAALOjAAC1owAAt6MAAP////+5owAA/////7ujAAC9owAAv6MAAMGjAADDowAAxaMAAMejAADJowAAy6MAAM2jAAD/////z6MAANGjAADTowAA1aMAANejAADZowAA/////9ujAADdowAA36MAAOGjAADjowAA5aMAAOejAADpowAA///////////rowAA/////+2jAADvowAA8aMAAPOjAAD1owAA96MAAPmjAAD7owAA/aMAAP+jAAABpAAAA6QAAAWkAAAHpAAACaQAAAukAAD/////DaQAAP////8PpAAAEaQAABOkAAAVpAAAF6QAABmkAAAbpAAAHaQAAB+kAAD//////////yGkAAAjpAAA/////yWkAAAnpAAAKaQAAP////8rpAAA////////////////LaQAAC+kAAAxpAAA////////////////M6QAADWkAAA3pAAAOaQAADukAAA9pAAAP6QAAP///////////////0GkAABDpAAARaQAAP////9HpAAA////////////////SaQAAEukAAD//////////////////////////02kAAD///////////////////////////////9PpAAAUaQAAFOkAABVpAAA/////1ekAAD///////////////9ZpAAA////////////////////////////////W6QAAF2kAABfpAAAYaQAAGOkAABlpAAAZ6QAAGmkAABrpAAA//////////9tpAAAb6QAAHGkAABzpAAA//////////91pAAAd6QAAHmkAAB7pAAAfaQAAH+kAAD//////////4GkAACDpAAAhaQAAIekAACJpAAAi6QAAI2kAACPpAAAkaQAAJOkAACVpAAA/////5ekAAD/////maQAAP//////////m6QAAJ2kAACfpAAAoaQAAKOkAAClpAAAp6QAAKmkAACrpAAAraQAAK+kAAD/////saQAALOkAAC1pAAAt6QAALmkAAC7pAAAvaQAAL+kAADBpAAA///////////DpAAAxaQAAMekAADJpAAAy6QAAM2kAADPpAAA0aQAANOkAAD/////1aQAANekAAD//////////9mkAADbpAAA3aQAAN+kAADhpAAA46QAAP/////////////////////lpAAA56QAAOmkAAD/////66QAAP///////////////+2kAADvpAAA8aQAAPOkAAD1pAAA96QAAPmkAAD7pAAA/aQAAP+kAAABpQAA/////wOlAAAFpQAAB6UAAAmlAAD//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wylAAAOpQAAEKUAABKlAAAUpQAAFqUAABilAAAapQAAHKUAAB6lAAAgpQAA/////yKlAAAkpQAAJqUAACilAAAqpQAALKUAAC6lAAAwpQAAMqUAADSlAAA2pQAAOKUAADqlAAA8pQAA/////z6lAABApQAAQqUAAESlAABGpQAASKUAAEqlAABMpQAATqUAAFClAABSpQAAVKUAAP////9WpQAAWKUAAFqlAABcpQAAXqUAAP////////////////////9gpQAAYqUAAGSlAABmpQAAaKUAAGqlAABspQAAbqUAAHClAABypQAAdKUAAHalAAB4pQAAeqUAAHylAAB+pQAAgKUAAIKlAACEpQAAhqUAAIilAACKpQAAjKUAAI6lAACQpQAAkqUAAJSlAAD/////lqUAAJilAACapQAAnKUAAJ6lAACgpQAAoqUAAKSlAACmpQAA/////6ilAACqpQAA//////////+spQAArqUAAP////////////////////+wpQAAsqUAALSlAAC2pQAAuKUAALqlAAC8pQAAvqUAAMClAADCpQAAxKUAAP/////GpQAAyKUAAMqlAADMpQAAzqUAANClAAD//////////9KlAADUpQAA1qUAANilAAD/////2qUAAP//////////3KUAAN6lAADgpQAA4qUAAOSlAADmpQAA/////+ilAAD//////////+qlAADspQAA7qUAAPClAADypQAA9KUAAPalAAD4pQAA+qUAAPylAAD+pQAAAKYAAAKmAAAEpgAABqYAAAimAAAKpgAADKYAAA6mAAAQpgAAEqYAABSmAAD/////////////////////FqYAAP////8YpgAAGqYAABymAAAepgAAIKYAACKmAAAkpgAA/////yamAAAopgAAKqYAACymAAAupgAAMKYAADKmAAA0pgAANqYAADimAAD/////OqYAAP////////////////////88pgAAPqYAAECmAABCpgAARKYAAEamAABIpgAASqYAAP////9MpgAATqYAAP////9QpgAAUqYAAP////9UpgAA/////////////////////1amAAD/////WKYAAFqmAABcpgAAXqYAAGCmAABipgAAZKYAAGamAABopgAAaqYAAP//////////bKYAAP////9upgAA/////3CmAAD//////////3KmAAD//////////3SmAAB2pgAAeKYAAHqmAAB8pgAAfqYAAICmAACCpgAAhKYAAIamAAD/////iKYAAIqmAACMpgAAjqYAAJCmAACSpgAA//////////+UpgAAlqYAAJimAACapgAAnKYAAP////+epgAAoKYAAP////+ipgAApKYAAKamAACopgAA////////////////qqYAAP//////////rKYAAP////+upgAAsKYAALKmAAC0pgAAtqYAAP////+4pgAAuqYAAP////+8pgAAvqYAAMCmAADCpgAAxKYAAP/////GpgAAyKYAAMqmAADMpgAAzqYAAP/////QpgAA0qYAANSmAAD/////////////////////1qYAANimAADapgAA///////////cpgAA3qYAAOCmAADipgAA5KYAAOamAADopgAA6qYAAP/////spgAA/////+6mAAD/////8KYAAP/////ypgAA9KYAAP/////////////////////2pgAA+KYAAPqmAAD8pgAA/qYAAACnAAD//////////wKnAAAEpwAA////////////////////////////////BqcAAP////8IpwAACqcAAAynAAD//////////w6nAAD//////////xCnAAASpwAAFKcAAP///////////////////////////////xanAAAYpwAAGqcAABynAAAepwAAIKcAACKnAAAkpwAAJqcAACinAAAqpwAA//////////8spwAALqcAADCnAAAypwAANKcAADanAAA4pwAAOqcAAP//////////PKcAAP////8+pwAAQKcAAEKnAABEpwAARqcAAEinAAD/////SqcAAP//////////TKcAAE6nAABQpwAAUqcAAFSnAABWpwAAWKcAAFqnAABcpwAAXqcAAGCnAAD/////YqcAAGSnAABmpwAAaKcAAGqnAABspwAAbqcAAHCnAABypwAAdKcAAP////92pwAA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////3mnAAB7pwAAfacAAH+nAACBpwAAg6cAAIWnAACHpwAAiacAAIunAACNpwAA//////////+PpwAAkacAAJOnAACVpwAAl6cAAJmnAACbpwAAnacAAJ+nAAChpwAAo6cAAKWnAACnpwAA/////6mnAACrpwAAracAAK+nAACxpwAAs6cAALWnAAC3pwAA/////7mnAAC7pwAAvacAAL+nAADBpwAAw6cAAMWnAADHpwAAyacAAMunAADNpwAAz6cAAP/////RpwAA06cAANWnAADXpwAA/////9mnAADbpwAA3acAAP/////fpwAA///////////hpwAA46cAAOWnAADnpwAA6acAAOunAADtpwAA76cAAPGnAADzpwAA9acAAPenAAD5pwAA+6cAAP/////9pwAA//////+nAAABqAAAA6gAAAWoAAAHqAAACagAAAuoAAANqAAAD6gAAP//////////EagAABOoAAAVqAAA/////xeoAAAZqAAAG6gAAB2oAAAfqAAA//////////////////////////8hqAAA//////////////////////////8jqAAA/////yWoAAAnqAAAKagAACuoAAD/////LagAAC+oAAD///////////////8xqAAAM6gAADWoAAA3qAAAOagAADuoAAA9qAAAP6gAAP////9BqAAAQ6gAAEWoAAD/////R6gAAP////9JqAAAS6gAAE2oAABPqAAAUagAAFOoAABVqAAAV6gAAFmoAABbqAAAXagAAF+oAABhqAAAY6gAAGWoAABnqAAAaagAAGuoAABtqAAAb6gAAHGoAABzqAAA//////////91qAAAd6gAAP////95qAAA/////3uoAAB9qAAAf6gAAIGoAAD///////////////+DqAAAhagAAIeoAAD/////iagAAIuoAACNqAAAj6gAAJGoAAD//////////5OoAAD/////lagAAJeoAACZqAAA////////////////m6gAAJ2oAAD/////n6gAAKGoAACjqAAApagAAKeoAACpqAAAq6gAAK2oAAD//////////6+oAACxqAAAs6gAAP//////////tagAALeoAAC5qAAAu6gAAL2oAAC/qAAAwagAAMOoAADFqAAAx6gAAMmoAADLqAAAzagAAM+oAAD//////////9GoAADTqAAA1agAANeoAADZqAAA26gAAN2oAADfqAAA4agAAOOoAADlqAAA56gAAOmoAADrqAAA7agAAO+oAADxqAAA86gAAPWoAAD3qAAA+agAAPuoAAD9qAAA/6gAAAGpAAADqQAA////////////////BakAAAepAAAJqQAAC6kAAA2pAAD/////D6kAABGpAAATqQAAFakAAP////8XqQAAGakAAP////////////////////8bqQAAHakAAB+pAAAhqQAAI6kAAP///////////////yWpAAAnqQAA/////ympAAD//////////yupAAAtqQAA/////////////////////y+pAAAxqQAA//////////8zqQAANakAADepAAA5qQAA//////////87qQAA////////////////PakAAD+pAABBqQAAQ6kAAP////9FqQAA//////////9HqQAASakAAEupAAD//////////////////////////02pAABPqQAAUakAAFOpAABVqQAAV6kAAFmpAABbqQAAXakAAF+pAABhqQAAY6kAAGWpAABnqQAAaakAAGupAAD/////bakAAG+pAAD/////cakAAHOpAAB1qQAAd6kAAHmpAAB7qQAAfakAAH+pAAD/////gakAAP////+DqQAA/////4WpAACHqQAAiakAAIupAACNqQAAj6kAAJGpAACTqQAA/////5WpAACXqQAAmakAAJupAAD//////////52pAACfqQAAoakAAKOpAAClqQAAp6kAAKmpAACrqQAArakAAK+pAACxqQAAs6kAAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////7apAAC4qQAAuqkAALypAAC+qQAAwKkAAMKpAADEqQAAxqkAAMipAADKqQAAzKkAAP///////////////86pAADQqQAA0qkAANSpAADWqQAA2KkAANqpAADcqQAA3qkAAP/////gqQAA4qkAAOSpAAD////////////////mqQAA6KkAAOqpAADsqQAA7qkAAPCpAADyqQAA9KkAAPapAAD4qQAA+qkAAPypAAD+qQAAAKoAAAKqAAAEqgAABqoAAAiqAAD/////CqoAAAyqAAAOqgAAEKoAABKqAAAUqgAAFqoAABiqAAAaqgAAHKoAAB6qAAAgqgAAIqoAAP////8kqgAAJqoAACiqAAD/////KqoAACyqAAD/////LqoAADCqAAAyqgAANKoAADaqAAA4qgAAOqoAADyqAAA+qgAAQKoAAEKqAABEqgAARqoAAP////9IqgAA/////0qqAABMqgAA////////////////TqoAAP//////////UKoAAFKqAABUqgAA/////1aqAABYqgAAWqoAAP////9cqgAAXqoAAGCqAABiqgAAZKoAAGaqAAD/////aKoAAGqqAABsqgAA//////////9uqgAAcKoAAHKqAAD//////////////////////////3SqAAD/////dqoAAHiqAAB6qgAAfKoAAH6qAACAqgAAgqoAAISqAACGqgAAiKoAAIqqAAD//////////////////////////4yqAACOqgAA//////////+QqgAA//////////+SqgAA////////////////////////////////lKoAAJaqAACYqgAAmqoAAP//////////nKoAAJ6qAACgqgAAoqoAAKSqAAD/////pqoAAKiqAACqqgAA/////6yqAACuqgAAsKoAALKqAAC0qgAA//////////+2qgAA/////7iqAAC6qgAAvKoAAL6qAADAqgAAwqoAAP//////////xKoAAMaqAAD//////////8iqAADKqgAAzKoAAM6qAADQqgAA/////9KqAADUqgAA1qoAANiqAADaqgAA3KoAAN6qAADgqgAA4qoAAOSqAAD/////5qoAAOiqAADqqgAA7KoAAP/////////////////////////////////////////////////////uqgAA//////CqAAD///////////////////////////KqAAD0qgAA9qoAAPiqAAD6qgAA/KoAAP6qAAAAqwAA/////wKrAAAEqwAABqsAAAirAAD/////CqsAAP////8MqwAA/////w6rAAD/////////////////////EKsAABKrAAAUqwAA/////////////////////xarAAAYqwAAGqsAAByrAAAeqwAAIKsAACKrAAAkqwAA/////yarAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////KasAACurAAAtqwAAL6sAADGrAAAzqwAANasAADerAAA5qwAAO6sAAD2rAAA/qwAAQasAAEOrAABFqwAAR6sAAEmrAABLqwAATasAAE+rAABRqwAAU6sAAFWrAABXqwAAWasAAFurAABdqwAAX6sAAGGrAABjqwAAZasAAGerAABpqwAAa6sAAG2rAABvqwAAcasAAHOrAAB1qwAA//////////93qwAAeasAAHurAAD/////fasAAH+rAACBqwAAg6sAAIWrAACHqwAAiasAAIurAACNqwAAj6sAAJGrAACTqwAAlasAAJerAACZqwAAm6sAAJ2rAACfqwAAoasAAKOrAAClqwAAp6sAAKmrAACrqwAArasAAK+rAACxqwAAs6sAALWrAAC3qwAA//////////+5qwAAu6sAAP//////////////////////////vasAAL+rAADBqwAAw6sAAMWrAADHqwAAyasAAP/////LqwAAzasAAM+rAAD/////0asAANOrAADVqwAA16sAANmrAADbqwAA3asAAP//////////36sAAOGrAADjqwAA5asAAOerAADpqwAA66sAAO2rAAD/////76sAAPGrAADzqwAA9asAAPerAAD5qwAA+6sAAP2rAAD/qwAAAawAAAOsAAAFrAAAB6wAAAmsAAALrAAA/////w2sAAAPrAAAEawAABOsAAAVrAAAF6wAABmsAAAbrAAAHawAAB+sAAAhrAAA/////yOsAAAlrAAA/////yesAAAprAAA/////yusAAAtrAAAL6wAADGsAAD/////M6wAADWsAAA3rAAAOawAADusAAA9rAAA//////////8/rAAAQawAAEOsAAD///////////////9FrAAAR6wAAEmsAABLrAAATawAAE+sAABRrAAAU6wAAFWsAABXrAAAWawAAFusAABdrAAA/////1+sAABhrAAAY6wAAGWsAABnrAAAaawAAGusAABtrAAAb6wAAHGsAABzrAAAdawAAHesAAB5rAAAe6wAAH2sAAB/rAAAgawAAIOsAAD/////hawAAIesAAD/////iawAAIusAACNrAAAj6wAAP////+RrAAAk6wAAP//////////lawAAJesAACZrAAAm6wAAJ2sAACfrAAAoawAAKOsAAClrAAAp6wAAKmsAACrrAAArawAAK+sAACxrAAAs6wAALWsAAD/////t6wAALmsAAC7rAAAvawAAP////////////////////+/rAAAwawAAP//////////w6wAAMWsAAD//////////8esAADJrAAA/////8usAAD/////zawAAM+sAAD/////////////////////0awAAP/////TrAAA/////////////////////9WsAAD/////16wAAP//////////2awAANusAAD/////3awAAN+sAADhrAAA///////////jrAAA/////+WsAADnrAAA/////////////////////////////////////+msAADrrAAA///////////////////////////trAAA76wAAP/////xrAAA86wAAPWsAAD/////96wAAPmsAAD7rAAA/////////////////awAAP+sAAABrQAAA60AAAWtAAD//////////////////////////wetAAAJrQAAC60AAA2tAAAPrQAAEa0AABOtAAAVrQAAF60AABmtAAAbrQAAHa0AAB+tAAAhrQAA/////yOtAAAlrQAAJ60AACmtAAD/////K60AAC2tAAAvrQAAMa0AADOtAAA1rQAAN60AADmtAAA7rQAA//////////89rQAA/////z+tAABBrQAA//////////9DrQAA////////////////////////////////Ra0AAP////9HrQAASa0AAEutAABNrQAA/////0+tAABRrQAAU60AAFWtAABXrQAAWa0AAFutAABdrQAAX60AAGGtAABjrQAAZa0AAGetAABprQAAa60AAG2tAABvrQAAca0AAHOtAAB1rQAAd60AAHmtAAB7rQAAfa0AAH+tAACBrQAAg60AAIWtAAD/////h60AAImtAAD/////i60AAI2tAACPrQAAka0AAJOtAAD///////////////+VrQAA/////5etAACZrQAAm60AAP///////////////////////////////////////////////52tAACfrQAAoa0AAP///////////////6OtAAClrQAA/////////////////////////////////////6etAACprQAA//////////+rrQAAra0AAK+tAACxrQAAs60AAP//////////ta0AALetAAD/////////////////////ua0AAP///////////////7utAAC9rQAA//////////////////////////+/rQAA////////////////wa0AAMOtAADFrQAAx60AAP/////////////////////JrQAAy60AAM2tAADPrQAA0a0AANOtAADVrQAA160AANmtAADbrQAA///////////drQAA/////9+tAADhrQAA460AAOWtAADnrQAA/////+mtAADrrQAA7a0AAO+tAAD/////8a0AAPOtAAD///////////WtAAD3rQAA//////mtAAD7rQAA/a0AAP+tAAABrgAAA64AAAWuAAAHrgAACa4AAAuuAAD/////Da4AAA+uAAD/////Ea4AAP////8TrgAAFa4AABeuAAD//////////xmuAAAbrgAA/////////////////////x2uAAD/////H64AAP////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8irgAAJK4AACauAAAorgAAKq4AACyuAAAurgAAMK4AADKuAAD/////NK4AADauAAA4rgAA/////zquAAA8rgAAPq4AAECuAABCrgAA//////////9ErgAARq4AAP///////////////0iuAABKrgAATK4AAE6uAABQrgAA/////1KuAAD/////VK4AAFauAABYrgAAWq4AAFyuAABergAA/////2CuAABirgAAZK4AAP////9mrgAAaK4AAGquAABsrgAA/////26uAAD//////////3CuAAByrgAAdK4AAHauAAD/////eK4AAHquAAB8rgAA//////////9+rgAAgK4AAIKuAACErgAA//////////+GrgAAiK4AAIquAACMrgAAjq4AAJCuAACSrgAAlK4AAP///////////////5auAACYrgAAmq4AAP//////////nK4AAP///////////////56uAAD//////////6CuAACirgAApK4AAKauAACorgAAqq4AAKyuAAD/////rq4AALCuAAD/////sq4AALSuAAC2rgAAuK4AALquAAC8rgAAvq4AAMCuAADCrgAAxK4AAMauAADIrgAAyq4AAMyuAADOrgAA0K4AANKuAAD/////1K4AANauAADYrgAA///////////////////////////argAA3K4AAN6uAADgrgAA4q4AAOSuAADmrgAA6K4AAOquAADsrgAA7q4AAPCuAADyrgAA9K4AAP/////2rgAA//////iuAAD6rgAA/K4AAP/////+rgAAAK8AAAKvAAD/////////////////////BK8AAAavAAAIrwAACq8AAAyvAAAOrwAAEK8AABKvAAAUrwAAFq8AABivAAAarwAAHK8AAP////8erwAA/////yCvAAAirwAA////////////////JK8AAP////////////////////8mrwAAKK8AAP//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////K68AAC2vAAAvrwAAMa8AADOvAAA1rwAAN68AADmvAAA7rwAAPa8AAD+vAABBrwAAQ68AAEWvAABHrwAASa8AAEuvAABNrwAAT68AAFGvAABTrwAAVa8AAFevAABZrwAAW68AAF2vAABfrwAAYa8AAGOvAABlrwAAZ68AAGmvAABrrwAAba8AAG+vAABxrwAAc68AAHWvAAB3rwAAea8AAHuvAAD/////fa8AAH+vAACBrwAAg68AAIWvAACHrwAA/////4mvAACLrwAA/////42vAAD///////////////+PrwAAka8AAP///////////////5OvAACVrwAAl68AAJmvAACbrwAAna8AAJ+vAAChrwAAo68AAKWvAACnrwAAqa8AAKuvAACtrwAAr68AALGvAACzrwAAta8AALevAAC5rwAAu68AAL2vAAD//////////7+vAADBrwAAw68AAMWvAADHrwAAya8AAMuvAADNrwAA/////8+vAADRrwAA/////////////////////////////////////9OvAADVrwAA///////////XrwAA/////9mvAADbrwAA3a8AAN+vAADhrwAA468AAOWvAADnrwAA6a8AAP/////rrwAA7a8AAP/////vrwAA///////////xrwAA868AAPWvAAD3rwAA+a8AAPuvAAD9rwAA/68AAP//////////AbAAAAOwAAAFsAAAB7AAAAmwAAALsAAADbAAAA+wAAD/////EbAAABOwAAAVsAAAF7AAABmwAAAbsAAAHbAAAB+wAAAhsAAAI7AAACWwAAAnsAAAKbAAACuwAAAtsAAAL7AAADGwAAAzsAAANbAAADewAAD/////////////////////ObAAADuwAAD/////////////////////PbAAAD+wAABBsAAAQ7AAAEWwAAD/////R7AAAEmwAABLsAAATbAAAE+wAABRsAAAU7AAAFWwAAD/////V7AAAFmwAAD/////////////////////W7AAAF2wAAD//////////////////////////1+wAAD//////////2GwAABjsAAA//////////9lsAAA/////////////////////2ewAAD/////abAAAP//////////a7AAAG2wAAD/////b7AAAHGwAABzsAAA//////////91sAAAd7AAAHmwAAB7sAAAfbAAAH+wAACBsAAAg7AAAP////+FsAAAh7AAAP//////////ibAAAIuwAACNsAAAj7AAAJGwAACTsAAAlbAAAJewAACZsAAAm7AAAJ2wAACfsAAAobAAAKOwAAClsAAAp7AAAKmwAACrsAAArbAAAK+wAACxsAAAs7AAALWwAAC3sAAAubAAALuwAAC9sAAAv7AAAMGwAADDsAAAxbAAAP///////////////////////////////8ewAADJsAAAy7AAAM2wAAD/////z7AAANGwAADTsAAA1bAAAP/////XsAAA/////9mwAADbsAAA3bAAAN+wAADhsAAA47AAAOWwAADnsAAA6bAAAOuwAAD/////7bAAAO+wAAD////////////////xsAAA87AAAPWwAAD/////////////////////97AAAP////////////////////////////////mwAAD7sAAA/bAAAP+wAAD/////AbEAAP//////////////////////////////////////////////////////////A7EAAAWxAAAHsQAACbEAAAuxAAD/////DbEAAP////////////////////8PsQAAEbEAABOxAAAVsQAA/////xexAAAZsQAAG7EAAB2xAAD/////H7EAACGxAAAjsQAAJbEAACexAAD/////KbEAAP////8rsQAALbEAAC+xAAAxsQAAM7EAADWxAAD//////////////////////////zexAAA5sQAAO7EAAD2xAAA/sQAAQbEAAP////9DsQAARbEAAEexAABJsQAA//////////9LsQAATbEAAE+xAABRsQAAU7EAAFWxAABXsQAA/////1mxAABbsQAA/////12xAABfsQAAYbEAAGOxAABlsQAAZ7EAAGmxAABrsQAAbbEAAP//////////b7EAAHGxAAD/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////dLEAAHaxAAB4sQAAerEAAHyxAAB+sQAAgLEAAIKxAAD/////hLEAAIaxAACIsQAAirEAAIyxAACOsQAAkLEAAJKxAACUsQAAlrEAAJixAAD/////mrEAAJyxAAD/////nrEAAKCxAACisQAApLEAAKaxAACosQAAqrEAAP//////////rLEAAK6xAACwsQAAsrEAALSxAAC2sQAAuLEAALqxAAC8sQAA/////76xAADAsQAAwrEAAMSxAADGsQAAyLEAAMqxAADMsQAAzrEAANCxAADSsQAA1LEAAP//////////1rEAANixAADasQAA///////////csQAA3rEAAOCxAADisQAA5LEAAP/////msQAA6LEAAOqxAADssQAA7rEAAP/////wsQAA8rEAAP////////////////SxAAD2sQAA//////////////////////ixAAD6sQAA/LEAAP6xAAAAsgAAArIAAASyAAAGsgAACLIAAAqyAAAMsgAADrIAABCyAAASsgAA/////xSyAAAWsgAAGLIAAP////////////////////8asgAAHLIAAB6yAAD/////////////////////ILIAACKyAAD/////JLIAACayAAD/////KLIAAP//////////KrIAAP////////////////////////////////////////////////////////////////////8ssgAALrIAAP////8wsgAAMrIAADSyAAD/////NrIAADiyAAD/////OrIAADyyAAA+sgAAQLIAAEKyAABEsgAARrIAAEiyAABKsgAATLIAAE6yAABQsgAAUrIAAFSyAAD/////VrIAAFiyAABasgAAXLIAAF6yAAD/////////////////////////////////////YLIAAP///////////////2KyAABksgAAZrIAAGiyAABqsgAA/////2yyAABusgAAcLIAAHKyAAD///////////////90sgAAdrIAAHiyAAB6sgAAfLIAAH6yAACAsgAAgrIAAISyAACGsgAAiLIAAIqyAACMsgAAjrIAAJCyAACSsgAAlLIAAJayAACYsgAAmrIAAJyyAACesgAAoLIAAKKyAACksgAAprIAAKiyAACqsgAArLIAAK6yAAD/////sLIAALKyAAC0sgAAtrIAALiyAAC6sgAA////////////////////////////////vLIAAP////++sgAA///////////AsgAAwrIAAP///////////////8SyAAD////////////////////////////////GsgAAyLIAAMqyAAD/////zLIAAM6yAADQsgAA0rIAAP/////UsgAA///////////WsgAA2LIAANqyAADcsgAA///////////esgAA4LIAAP/////isgAA5LIAAOayAAD/////6LIAAOqyAADssgAA7rIAAPCyAADysgAA9LIAAPayAAD4sgAA+rIAAP/////8sgAA/rIAAACzAAD/////ArMAAP////8EswAA/////wazAAAIswAA//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8LswAADbMAAA+zAAARswAAE7MAABWzAAAXswAAGbMAABuzAAAdswAAH7MAACGzAAAjswAAJbMAACezAAApswAAK7MAAC2zAAAvswAAMbMAADOzAAA1swAAN7MAADmzAAA7swAAPbMAAD+zAABBswAAQ7MAAP////9FswAAR7MAAEmzAABLswAATbMAAE+zAABRswAAU7MAAFWzAABXswAAWbMAAFuzAABdswAAX7MAAGGzAABjswAAZbMAAGezAABpswAAa7MAAG2zAABvswAAcbMAAHOzAAB1swAAd7MAAHmzAAD//////////3uzAAB9swAAf7MAAIGzAACDswAAhbMAAP////+HswAAibMAAIuzAACNswAAj7MAAJGzAACTswAAlbMAAJezAACZswAAm7MAAJ2zAACfswAAobMAAKOzAAClswAA/////6ezAACpswAAq7MAAK2zAAD/////r7MAALGzAACzswAAtbMAALezAAC5swAAu7MAAL2zAAC/swAAwbMAAMOzAADFswAAx7MAAMmzAADLswAAzbMAAM+zAADRswAA07MAANWzAADXswAA2bMAANuzAADdswAA37MAAP//////////4bMAAOOzAADlswAA57MAAOmzAADrswAA7bMAAO+zAADxswAA87MAAP//////////9bMAAPezAAD5swAA+7MAAP2zAAD/swAAAbQAAAO0AAD//////////wW0AAAHtAAACbQAAAu0AAANtAAAD7QAAP//////////EbQAABO0AAAVtAAAF7QAAP///////////////xm0AAAbtAAAHbQAAP//////////H7QAACG0AAAjtAAAJbQAACe0AAAptAAA/////yu0AAD/////LbQAAC+0AAAxtAAAM7QAAP//////////NbQAADe0AAA5tAAAO7QAAD20AAA/tAAAQbQAAEO0AABFtAAAR7QAAEm0AABLtAAATbQAAP////9PtAAA//////////9RtAAAU7QAAFW0AABXtAAAWbQAAP////9btAAA//////////9dtAAAX7QAAGG0AABjtAAA//////////9ltAAAZ7QAAGm0AABrtAAAbbQAAG+0AABxtAAAc7QAAP////91tAAA/////3e0AAD/////ebQAAHu0AAB9tAAAf7QAAIG0AACDtAAAhbQAAIe0AACJtAAAi7QAAI20AACPtAAAkbQAAJO0AACVtAAAl7QAAP//////////mbQAAJu0AACdtAAAn7QAAKG0AACjtAAApbQAAKe0AAD/////qbQAAP//////////q7QAAP///////////////620AACvtAAA/////7G0AACztAAAtbQAAP////+3tAAAubQAALu0AAD//////////720AAC/tAAAwbQAAMO0AADFtAAAx7QAAMm0AADLtAAA/////820AADPtAAA0bQAANO0AADVtAAA17QAANm0AADbtAAA/////////////////////920AADftAAA4bQAAOO0AADltAAA57QAAOm0AAD//////////+u0AADttAAA77QAAPG0AADztAAA9bQAAP//////////97QAAPm0AAD7tAAA/bQAAP+0AAABtQAA////////////////////////////////A7UAAAW1AAAHtQAACbUAAP//////////C7UAAA21AAAPtQAA/////////////////////xG1AAATtQAA////////////////FbUAABe1AAAZtQAAG7UAAB21AAAftQAA//////////8htQAA/////yO1AAAltQAAJ7UAACm1AAArtQAA/////y21AAAvtQAAMbUAADO1AAA1tQAAN7UAAP////////////////////85tQAAO7UAAD21AAA/tQAA/////////////////////0G1AABDtQAARbUAAEe1AABJtQAAS7UAAE21AABPtQAAUbUAAFO1AABVtQAA////////////////V7UAAFm1AABbtQAAXbUAAF+1AABhtQAAY7UAAGW1AABntQAAabUAAGu1AAD/////bbUAAG+1AABxtQAA/////3O1AAB1tQAAd7UAAHm1AAB7tQAAfbUAAP////////////////////9/tQAAgbUAAIO1AACFtQAAh7UAAIm1AACLtQAAjbUAAI+1AACRtQAA//////////+TtQAA/////////////////////5W1AAD//////////////////////////5e1AACZtQAAm7UAAJ21AACftQAAobUAAKO1AAD/////pbUAAKe1AACptQAAq7UAAK21AACvtQAAsbUAALO1AAC1tQAA/////////////////////7e1AAC5tQAA/////7u1AAC9tQAAv7UAAMG1AADDtQAAxbUAAMe1AADJtQAAy7UAAM21AADPtQAA0bUAANO1AADVtQAA17UAAP//////////2bUAAP/////btQAA3bUAAN+1AADhtQAA47UAAP//////////5bUAAP/////ntQAA///////////ptQAA67UAAP/////ttQAA77UAAPG1AADztQAA9bUAAPe1AAD5tQAA+7UAAP///////////bUAAP///////////7UAAAG2AAADtgAABbYAAAe2AAAJtgAA/////wu2AAANtgAA/////w+2AAD/////EbYAABO2AAD//////////xW2AAAXtgAA/////xm2AAD//////////xu2AAD//////////////////////////x22AAD/////H7YAACG2AAAjtgAAJbYAAP////8ntgAA//////////8ptgAAK7YAAC22AAAvtgAAMbYAADO2AAA1tgAAN7YAAP////////////////////85tgAAO7YAAD22AAA/tgAAQbYAAP////9DtgAARbYAAP////9HtgAASbYAAP///////////////0u2AAD/////TbYAAE+2AAD//////////////////////////////////////////1G2AAD//////////1O2AAD///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////9WtgAAWLYAAFq2AABctgAA/////162AABgtgAAYrYAAP////9ktgAA/////2a2AABotgAAarYAAGy2AAButgAAcLYAAHK2AAB0tgAAdrYAAHi2AAB6tgAAfLYAAH62AACAtgAAgrYAAIS2AACGtgAAiLYAAIq2AACMtgAA/////462AAD///////////////+QtgAAkrYAAJS2AACWtgAAmLYAAJq2AACctgAAnrYAAP////+gtgAAorYAAKS2AAD/////prYAAKi2AACqtgAArLYAAK62AACwtgAA/////7K2AAD//////////7S2AAD/////trYAALi2AAD/////urYAALy2AAC+tgAAwLYAAMK2AAD/////xLYAAP/////GtgAA///////////ItgAAyrYAAMy2AADOtgAA0LYAANK2AADUtgAA////////////////1rYAANi2AADatgAA3LYAAP///////////////////////////////962AADgtgAA4rYAAOS2AADmtgAA6LYAAP///////////////+q2AADstgAA/////+62AAD/////8LYAAPK2AAD/////////////////////9LYAAPa2AAD4tgAA+rYAAPy2AAD+tgAAALcAAAK3AAAEtwAABrcAAAi3AAAKtwAADLcAAP////8OtwAA/////xC3AAAStwAAFLcAAP////8WtwAAGLcAABq3AAActwAA//////////8etwAAILcAACK3AAAktwAA/////ya3AAD/////////////////////////////////////KLcAACq3AAAstwAALrcAADC3AAAytwAANLcAADa3AAD/////OLcAADq3AAA8twAA/////z63AABAtwAA//////////9CtwAARLcAAEa3AABItwAA//////////9KtwAA/////0y3AABOtwAAULcAAP////9StwAA/////1S3AABWtwAA//////////9YtwAAWrcAAP//////////XLcAAF63AABgtwAAYrcAAP//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////ZbcAAGe3AABptwAAa7cAAG23AABvtwAA/////3G3AABztwAAdbcAAHe3AAB5twAAe7cAAH23AAB/twAA//////////+BtwAA////////////////g7cAAIW3AACHtwAA/////4m3AACLtwAAjbcAAI+3AACRtwAAk7cAAJW3AACXtwAAmbcAAJu3AAD/////nbcAAJ+3AAChtwAAo7cAAKW3AACntwAAqbcAAKu3AACttwAA/////6+3AAD/////sbcAALO3AAC1twAA////////////////t7cAAP////+5twAAu7cAAL23AAC/twAAwbcAAMO3AADFtwAAx7cAAMm3AADLtwAAzbcAAP//////////z7cAANG3AADTtwAA/////9W3AADXtwAA/////9m3AAD/////27cAAN23AADftwAA4bcAAP//////////47cAAP/////ltwAA57cAAP///////////////+m3AADrtwAA7bcAAO+3AADxtwAA87cAAPW3AAD3twAA+bcAAPu3AAD//////////////////////bcAAP+3AAABuAAAA7gAAAW4AAAHuAAACbgAAAu4AAANuAAA/////w+4AAARuAAA/////xO4AAD//////////xW4AAD/////F7gAAP////////////////////8ZuAAA//////////8buAAA/////x24AAAfuAAAIbgAACO4AAAluAAAJ7gAACm4AAAruAAALbgAAC+4AAAxuAAAM7gAADW4AAA3uAAAObgAADu4AAA9uAAAP7gAAEG4AABDuAAA/////0W4AAD/////R7gAAEm4AABLuAAATbgAAE+4AAD///////////////9RuAAAU7gAAP////////////////////9VuAAAV7gAAFm4AABbuAAAXbgAAP//////////////////////////X7gAAP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////2K4AABkuAAAZrgAAGi4AABquAAAbLgAAG64AABwuAAAcrgAAHS4AAB2uAAAeLgAAHq4AAB8uAAAfrgAAIC4AACCuAAAhLgAAIa4AACIuAAAirgAAIy4AACOuAAAkLgAAJK4AACUuAAAlrgAAJi4AACauAAAnLgAAJ64AACguAAAorgAAKS4AACmuAAAqLgAAKq4AACsuAAArrgAALC4AACyuAAAtLgAALa4AAC4uAAAurgAALy4AAC+uAAAwLgAAMK4AAD/////xLgAAMa4AADIuAAAyrgAAMy4AADOuAAA0LgAANK4AADUuAAA1rgAANi4AADauAAA3LgAAN64AAD//////////+C4AADiuAAA5LgAAOa4AADouAAA6rgAAOy4AAD/////7rgAAPC4AADyuAAA9LgAAPa4AAD/////+LgAAPq4AAD8uAAA/rgAAAC5AAACuQAABLkAAAa5AAAIuQAACrkAAAy5AAAOuQAAELkAAP////////////////////8SuQAAFLkAAP////8WuQAA////////////////GLkAAP////8auQAAHLkAAB65AAAguQAAIrkAACS5AAAmuQAAKLkAAP////8quQAALLkAAC65AAAwuQAAMrkAADS5AAA2uQAAOLkAADq5AAA8uQAAPrkAAEC5AABCuQAARLkAAP///////////////////////////////0a5AABIuQAA//////////9KuQAATLkAAP//////////TrkAAFC5AABSuQAAVLkAAFa5AABYuQAAWrkAAFy5AABeuQAAYLkAAGK5AABkuQAA//////////9muQAAaLkAAGq5AABsuQAAbrkAAHC5AAD/////crkAAHS5AAB2uQAAeLkAAHq5AAB8uQAAfrkAAIC5AACCuQAAhLkAAIa5AACIuQAA/////4q5AAD/////////////////////////////////////jLkAAI65AACQuQAAkrkAAJS5AACWuQAAmLkAAJq5AACcuQAAnrkAAP////////////////////+guQAAorkAAKS5AACmuQAA/////6i5AACquQAArLkAAK65AACwuQAAsrkAAP////+0uQAA/////7a5AAC4uQAAurkAALy5AAC+uQAAwLkAAMK5AADEuQAAxrkAAMi5AADKuQAAzLkAAP//////////zrkAANC5AADSuQAA1LkAAP/////WuQAA2LkAANq5AAD//////////9y5AADeuQAA/////+C5AAD//////////+K5AAD/////5LkAAOa5AADouQAA////////////////6rkAAOy5AADuuQAA8LkAAP/////yuQAA9LkAAPa5AAD4uQAA+rkAAPy5AAD////////////////+uQAAALoAAAK6AAD/////BLoAAAa6AAD///////////////8IugAACroAAP////8MugAADroAAP//////////ELoAAP////8SugAAFLoAABa6AAAYugAA//////////8augAAHLoAAB66AAAgugAA/////////////////////yK6AAAkugAAJroAACi6AAAqugAA/////yy6AAAuugAA//////////8wugAAMroAADS6AAA2ugAAOLoAADq6AAA8ugAAProAAEC6AABCugAARLoAAEa6AABIugAASroAAP////9MugAA/////066AABQugAAUroAAFS6AABWugAAWLoAAP////9augAAXLoAAF66AABgugAAYroAAGS6AAD///////////////9mugAAaLoAAGq6AABsugAAbroAAHC6AAByugAAdLoAAHa6AAB4ugAA/////3q6AAD/////fLoAAH66AACAugAAgroAAIS6AACGugAAiLoAAP////+KugAAjLoAAI66AACQugAAkroAAJS6AACWugAA/////////////////////5i6AAD//////////5q6AACcugAAnroAAKC6AACiugAApLoAAKa6AACougAA/////////////////////6q6AACsugAArroAAP////////////////////+wugAAsroAALS6AAD/////troAALi6AAC6ugAA/////7y6AAD//////////766AADAugAAwroAAMS6AAD/////xroAAP///////////////8i6AADKugAAzLoAAP//////////zroAANC6AAD//////////9K6AAD//////////9S6AADWugAA2LoAAP/////augAA3LoAAN66AADgugAA4roAAOS6AAD/////5roAAOi6AADqugAA/////+y6AADuugAA///////////wugAA8roAAP/////0ugAA///////////2ugAA///////////////////////////4ugAA+roAAP/////8ugAA/roAAAC7AAD/////////////////////ArsAAAS7AAD/////BrsAAAi7AAAKuwAADLsAAA67AAAQuwAAErsAABS7AAAWuwAAGLsAABq7AAAcuwAAHrsAAP//////////ILsAAP////8iuwAAJLsAACa7AAAouwAAKrsAACy7AAD///////////////8uuwAA/////zC7AAAyuwAANLsAADa7AAD/////OLsAAP////////////////////86uwAAPLsAAP///////////////z67AAD/////QLsAAEK7AAD/////RLsAAP////9GuwAASLsAAP////9KuwAATLsAAE67AABQuwAAUrsAAFS7AABWuwAA//////////9YuwAAWrsAAFy7AABeuwAAYLsAAP////9iuwAAZLsAAGa7AABouwAAarsAAGy7AABuuwAAcLsAAHK7AAD///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////91uwAAd7sAAHm7AAB7uwAAfbsAAH+7AACBuwAAg7sAAIW7AACHuwAAibsAAIu7AACNuwAAj7sAAJG7AACTuwAAlbsAAJe7AACZuwAAm7sAAP////+duwAAn7sAAKG7AACjuwAApbsAAKe7AACpuwAAq7sAAK27AACvuwAAsbsAALO7AAC1uwAAt7sAALm7AAC7uwAAvbsAAL+7AADBuwAAw7sAAMW7AADHuwAAybsAAMu7AADNuwAAz7sAANG7AADTuwAA1bsAANe7AADZuwAA27sAAN27AADfuwAA/////+G7AADjuwAA5bsAAP//////////57sAAOm7AADruwAA7bsAAO+7AAD/////8bsAAPO7AAD1uwAA97sAAPm7AAD7uwAA/bsAAP+7AAABvAAAA7wAAAW8AAD/////B7wAAAm8AAALvAAADbwAAA+8AAD/////EbwAABO8AAAVvAAAF7wAABm8AAAbvAAAHbwAAB+8AAD/////IbwAACO8AAAlvAAAJ7wAAP////8pvAAAK7wAAC28AAAvvAAAMbwAADO8AAA1vAAA/////ze8AAA5vAAA//////////87vAAAPbwAAD+8AABBvAAAQ7wAAEW8AABHvAAASbwAAEu8AABNvAAAT7wAAFG8AABTvAAAVbwAAFe8AAD/////WbwAAFu8AABdvAAA/////////////////////1+8AABhvAAAY7wAAGW8AABnvAAAabwAAGu8AAD/////bbwAAP////9vvAAA//////////9xvAAAc7wAAP////91vAAA//////////93vAAAebwAAP//////////e7wAAH28AAB/vAAAgbwAAIO8AACFvAAAh7wAAIm8AACLvAAAjbwAAI+8AACRvAAA//////////+TvAAA//////////////////////////////////////////+VvAAA/////5e8AACZvAAAm7wAAJ28AACfvAAAobwAAKO8AAClvAAAp7wAAKm8AACrvAAArbwAAK+8AACxvAAA/////7O8AAC1vAAAt7wAALm8AAD///////////////////////////////+7vAAAvbwAAL+8AADBvAAAw7wAAP/////FvAAAx7wAAMm8AAD//////////8u8AAD//////////828AADPvAAA/////9G8AADTvAAA/////9W8AADXvAAA2bwAANu8AADdvAAA////////////////////////////////////////////////37wAAOG8AADjvAAA5bwAAOe8AADpvAAA///////////rvAAA7bwAAP/////////////////////vvAAA8bwAAP////////////////////////////////O8AAD1vAAA//////e8AAD5vAAA//////u8AAD//////////////////////bwAAP///////////7wAAP////8BvQAAA70AAAW9AAAHvQAACb0AAP////8LvQAA/////w29AAD/////D70AAP///////////////xG9AAATvQAAFb0AABe9AAAZvQAAG70AAB29AAAfvQAAIb0AACO9AAAlvQAAJ70AACm9AAArvQAALb0AAP////8vvQAA/////zG9AAAzvQAA/////zW9AAD/////////////////////N70AAP////85vQAA/////zu9AAA9vQAAP70AAEG9AABDvQAARb0AAEe9AABJvQAAS70AAE29AABPvQAAUb0AAFO9AAD/////Vb0AAFe9AABZvQAAW70AAF29AAD/////X70AAP////9hvQAAY70AAP////9lvQAA//////////9nvQAAab0AAGu9AAD///////////////9tvQAAb70AAHG9AAD/////////////////////c70AAHW9AAB3vQAAeb0AAHu9AAD/////fb0AAH+9AAD/////gb0AAIO9AAD//////////////////////////////////////////4W9AAD/////////////////////////////////////////////////////////////////////h70AAIm9AACLvQAAjb0AAP////+PvQAAkb0AAJO9AAD//////////5W9AACXvQAA/////5m9AACbvQAA/////529AACfvQAA////////////////ob0AAP////+jvQAApb0AAKe9AACpvQAAq70AAK29AACvvQAAsb0AALO9AAC1vQAAt70AALm9AAC7vQAAvb0AAL+9AADBvQAAw70AAMW9AADHvQAAyb0AAP///////////////8u9AADNvQAA/////8+9AADRvQAA/////////////////////////////////////9O9AADVvQAA170AANm9AADbvQAA3b0AAN+9AADhvQAA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////+S9AADmvQAA6L0AAOq9AADsvQAA7r0AAPC9AADyvQAA9L0AAPa9AAD4vQAA+r0AAPy9AAD+vQAA/////wC+AAACvgAABL4AAAa+AAAIvgAACr4AAAy+AAAOvgAAEL4AABK+AAAUvgAAFr4AAP////8YvgAAGr4AABy+AAAevgAAIL4AAP////8ivgAAJL4AACa+AAAovgAAKr4AACy+AAD///////////////8uvgAAML4AADK+AAA0vgAANr4AADi+AAA6vgAAPL4AAD6+AABAvgAAQr4AAP////9EvgAA/////0a+AABIvgAASr4AAEy+AABOvgAAUL4AAP//////////Ur4AAFS+AABWvgAAWL4AAFq+AABcvgAAXr4AAGC+AABivgAA/////2S+AABmvgAAaL4AAP////9qvgAAbL4AAG6+AABwvgAAcr4AAP//////////dL4AAP////92vgAA/////3i+AAB6vgAAfL4AAP////////////////////9+vgAAgL4AAIK+AACEvgAAhr4AAIi+AACKvgAAjL4AAI6+AACQvgAAkr4AAJS+AAD//////////5a+AACYvgAAmr4AAJy+AACevgAAoL4AAKK+AAD/////pL4AAKa+AAD//////////6i+AACqvgAArL4AAK6+AAD//////////7C+AACyvgAAtL4AALa+AAC4vgAAur4AALy+AAC+vgAAwL4AAMK+AADEvgAAxr4AAMi+AADKvgAAzL4AAM6+AADQvgAA0r4AAP//////////1L4AANa+AADYvgAA2r4AANy+AADevgAA4L4AAOK+AADkvgAA5r4AAOi+AADqvgAA7L4AAP/////uvgAA//////C+AADyvgAA//////////////////////S+AAD2vgAA+L4AAPq+AAD8vgAA//////6+AAD/////AL8AAAK/AAD//////////wS/AAD/////Br8AAP////8IvwAACr8AAAy/AAD///////////////8OvwAAEL8AAP////8SvwAAFL8AABa/AAAYvwAAGr8AABy/AAAevwAAIL8AACK/AAD/////////////////////JL8AAP///////////////ya/AAAovwAAKr8AACy/AAD//////////y6/AAAwvwAAMr8AADS/AAA2vwAA/////zi/AAA6vwAA//////////88vwAAPr8AAEC/AABCvwAARL8AAP////9GvwAASL8AAEq/AAD/////TL8AAE6/AAD//////////1C/AABSvwAAVL8AAFa/AABYvwAAWr8AAFy/AABevwAAYL8AAGK/AABkvwAAZr8AAGi/AABqvwAA/////2y/AAD/////////////////////br8AAP////9wvwAAcr8AAHS/AAD/////dr8AAP///////////////3i/AAD//////////3q/AAB8vwAAfr8AAIC/AACCvwAA/////////////////////4S/AAD//////////4a/AAD/////////////////////////////////////////////////////iL8AAIq/AAD//////////4y/AACOvwAAkL8AAJK/AAD/////lL8AAP////+WvwAA/////5i/AACavwAAnL8AAP///////////////56/AACgvwAAor8AAP//////////pL8AAKa/AAD///////////////+ovwAA/////////////////////6q/AACsvwAArr8AALC/AAD//////////7K/AAC0vwAAtr8AALi/AAC6vwAAvL8AAL6/AADAvwAAwr8AAP/////EvwAAxr8AAP/////IvwAAyr8AAMy/AAD////////////////OvwAA/////9C/AAD////////////////SvwAA1L8AANa/AADYvwAA2r8AANy/AADevwAA4L8AAOK/AADkvwAA5r8AAOi/AAD/////6r8AAOy/AADuvwAA8L8AAPK/AAD0vwAA9r8AAPi/AAD////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////7vwAA/b8AAP+/AAABwAAAA8AAAAXAAAAHwAAACcAAAAvAAAANwAAAD8AAABHAAAATwAAAFcAAAP////8XwAAAGcAAABvAAAAdwAAAH8AAACHAAAAjwAAAJcAAACfAAAApwAAAK8AAAC3AAAAvwAAAMcAAADPAAAA1wAAAN8AAADnAAAD/////O8AAAD3AAAA/wAAAQcAAAEPAAABFwAAAR8AAAEnAAABLwAAATcAAAE/AAABRwAAAU8AAAFXAAABXwAAAWcAAAFvAAABdwAAA/////1/AAABhwAAA//////////9jwAAAZcAAAGfAAABpwAAA//////////9rwAAAbcAAAP////9vwAAAccAAAHPAAAB1wAAAd8AAAHnAAAB7wAAAfcAAAH/AAAD///////////////+BwAAAg8AAAIXAAAD//////////4fAAACJwAAAi8AAAI3AAACPwAAAkcAAAJPAAACVwAAAl8AAAP////////////////////+ZwAAA//////////+bwAAAncAAAJ/AAAChwAAAo8AAAKXAAACnwAAAqcAAAKvAAACtwAAA//////////+vwAAAscAAALPAAAC1wAAAt8AAALnAAAC7wAAAvcAAAP//////////v8AAAP/////BwAAAw8AAAMXAAADHwAAAycAAAMvAAAD/////zcAAAM/AAAD/////0cAAANPAAAD////////////////////////////////VwAAA18AAANnAAAD/////28AAAN3AAADfwAAA4cAAAOPAAADlwAAA58AAAOnAAADrwAAA/////+3AAADvwAAA///////////xwAAA//////PAAAD1wAAA//////fAAAD///////////nAAAD/////+8AAAP/////9wAAA///////AAAABwQAAA8EAAP////8FwQAAB8EAAAnBAAALwQAA//////////8NwQAAD8EAAP///////////////xHBAAATwQAA////////////////FcEAAP//////////////////////////F8EAABnBAAAbwQAAHcEAAP////8fwQAAIcEAACPBAAAlwQAAJ8EAAP//////////KcEAAP////8rwQAALcEAAP////8vwQAAMcEAADPBAAD//////////zXBAAD/////N8EAADnBAAA7wQAA////////////////PcEAAP////8/wQAA/////0HBAABDwQAARcEAAEfBAABJwQAAS8EAAE3BAABPwQAA//////////9RwQAAU8EAAFXBAABXwQAA/////////////////////1nBAABbwQAAXcEAAF/BAABhwQAA/////2PBAAD///////////////9lwQAAZ8EAAGnBAABrwQAAbcEAAG/BAABxwQAAc8EAAP////91wQAAd8EAAHnBAAB7wQAA/////33BAAD///////////////////////////////////////////////9/wQAAgcEAAIPBAAD/////hcEAAIfBAAD///////////////+JwQAAi8EAAI3BAACPwQAA/////5HBAAD/////k8EAAJXBAAD/////l8EAAJnBAACbwQAAncEAAJ/BAAChwQAAo8EAAKXBAAD/////p8EAAKnBAAD//////////6vBAACtwQAA//////////+vwQAA////////////////scEAAP////+zwQAAtcEAALfBAAC5wQAAu8EAAL3BAAD/////v8EAAMHBAADDwQAAxcEAAMfBAADJwQAAy8EAAM3BAADPwQAA0cEAANPBAADVwQAA18EAAP/////ZwQAA28EAAN3BAAD//////////9/BAAD//////////+HBAADjwQAA/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////w==",
+    "defaultLeft": "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA==",
+    "roots": "AAAAADUDAACSBQAA8QcAACYKAAB3DAAAlA4AAL8QAABKEwAAyRUAALYZAAC9GwAA3h4AAK0gAAB0IgAAXyQAAFwmAACfKQAAnCsAAL8tAACgLwAASzEAABozAAD3NAAAuDYAAOM4AAA8OgAASzwAABI+AACvPwAARkIAAPdEAACmRgAAW0gAAMxJAACXSwAAUE0AAI1PAAAcUQAAsVIAAORTAADDVAAANlgAAOFZAACYWwAAXV0AAGxeAACZXwAA0GEAACFjAABaZQAATWYAAKRoAAChagAADmwAAFNvAAC4cAAA83EAAI5zAADVdAAAjnYAANd3AADCeQAAWXwAAGh+AAA3fwAAqoIAAM2DAADshAAABYgAAMqJAAABjAAAmo0AAGOPAAA6kAAAuZIAALyTAAARlQAAeJYAACGZAAAgmgAAv5sAACSdAAD/nQAA7p8AAOOhAAAKpQAAd6cAALSpAAAnqwAAIK4AACmvAABysQAACbMAAFS2AABjtwAAYLgAAHO7AADivQAA+b8AAA=="
+  }
+};
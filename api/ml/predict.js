@@ -5,10 +5,127 @@
  */
 
 const { extractAllFeatures } = require('./features');
+const { loadPackedTrees, predictPackedTrees } = require('./tree-evaluator');
 
 // Import inline model data (serverless-compatible)
 const MODEL_DATA = require('./model-data');
 
+/**
+ * Load the flat-array tree export (generated by ml-training-data/export_model.py)
+ * Returns null if it has not been exported or does not match the feature set.
+ */
+function loadTreeExport() {
+  try {
+    const trees = loadPackedTrees(require('./model-trees'));
+
+    if (JSON.stringify(trees.featureNames) !== JSON.stringify(MODEL_DATA.featureNames)) {
+      console.warn('[ML] model-trees.js feature order does not match model-data.js - ignoring tree export');
+      return null;
+    }
+
+    return trees;
+  } catch (error) {
+    console.warn('[ML] No tree export available, using heuristic scoring:', error.message);
+    return null;
+  }
+}
+
+/**
+ * Load the day/hour no-show and occupancy tables (generated by ml-training-data/slot_stats.py)
+ * Returns null if they have not been built - features.js then uses its defaults.
+ */
+function loadHistoricalStats() {
+  try {
+    return require('./slot-stats');
+  } catch (error) {
+    console.warn('[ML] No historical slot stats available, using default rates:', error.message);
+    return null;
+  }
+}
+
+const HISTORICAL_STATS = loadHistoricalStats();
+
+/**
+ * Load the per-location model bundle (generated by ml-training-data/train_locations.py)
+ * Returns null if it has not been built - every location then uses the default model.
+ */
+function loadLocationModels() {
+  try {
+    const bundle = require('./location-models');
+    const models = {};
+    for (const [key, data] of Object.entries(bundle.models)) {
+      models[key] = loadPackedTrees(data);
+    }
+    return { version: bundle.version, locations: bundle.locations, models };
+  } catch (error) {
+    return null;
+  }
+}
+
+const LOCATION_MODELS = loadLocationModels();
+
+/**
+ * Load the probability calibration (generated by ml-training-data/calibrate.py)
+ * Returns null if it has not been fitted or was fitted on a different tree export.
+ */
+function loadCalibration() {
+  try {
+    const calibration = require('./calibration');
+    const { exportedAt } = require('./model-trees');
+
+    if (calibration.modelExportedAt !== exportedAt) {
+      console.warn('[ML] calibration.js was fitted on a different model-trees.js export - ignoring it');
+      return null;
+    }
+
+    return calibration;
+  } catch (error) {
+    return null;
+  }
+}
+
+const CALIBRATION = loadCalibration();
+
+/**
+ * Map a raw model probability through the calibration knots
+ *
+ * Binary search for the segment containing the probability, then linear
+ * interpolation; clamped to the first/last knot outside their range.
+ */
+function calibrate(calibration, probability) {
+  const { x, y } = calibration;
+  if (probability <= x[0]) return y[0];
+  if (probability >= x[x.length - 1]) return y[y.length - 1];
+
+  let lo = 0;
+  let hi = x.length - 1;
+  while (hi - lo > 1) {
+    const mid = (lo + hi) >> 1;
+    if (x[mid] <= probability) lo = mid;
+    else hi = mid;
+  }
+
+  return y[lo] + (y[hi] - y[lo]) * (probability - x[lo]) / (x[hi] - x[lo]);
+}
+
+// Bundle key of reservations logged without a location (UNLABELLED_LOCATION in train_locations.py)
+const UNLABELLED_LOCATION = '__unlabelled__';
+
+/**
+ * Packed trees for the reservation's location (own model or the pooled global one)
+ * Reservations without a location use the bundle's unlabelled entry, like in training.
+ * Returns null for locations not in the bundle.
+ */
+function locationModelFor(reservation) {
+  if (!LOCATION_MODELS) {
+    return null;
+  }
+
+  const locationId = reservation.location_id || reservation['Location ID'] || process.env.LOCATION_ID || UNLABELLED_LOCATION;
+  const key = locationId && LOCATION_MODELS.locations[locationId];
+  return key ? { key, trees: LOCATION_MODELS.models[key] } : null;
+}
+
 // ============================================================================
 // MODEL LOADING
 // ============================================================================
@@ -35,7 +152,17 @@ function loadModel() {
       type: MODEL_DATA.type
     };
 
-    MODEL = MODEL_DATA.model;
+    MODEL = { ...MODEL_DATA.model };
+
+    // Real XGBoost scoring when the packed trees are available
+    const trees = loadTreeExport();
+    if (trees) {
+      MODEL.predict = (featureVector) => predictPackedTrees(trees, featureVector);
+      MODEL_METADATA.scoring = 'xgboost-trees';
+      console.log(`[ML] Tree export loaded: ${trees.numTrees} trees`);
+    } else {
+      MODEL_METADATA.scoring = 'heuristic';
+    }
 
     console.log('[ML] Model loaded successfully (inline data)');
     console.log(`[ML] Version: ${MODEL_METADATA.version}`);
@@ -88,14 +215,27 @@ function predictNoShow(reservation, customerHistory = null) {
     }
 
     // 2. Extract features
-    const features = extractAllFeatures(reservation, customerHistory);
-
-    // 3. Prepare feature vector
-    const featureVector = MODEL_METADATA.featureNames.map(name => features[name]);
-
-    // 4. Make prediction
-    // simplePred now returns probability (0-1) directly
-    const noShowProbability = model.predict ? model.predict(featureVector) : simplePred(featureVector, model);
+    const features = extractAllFeatures(reservation, customerHistory, HISTORICAL_STATS);
+
+    // 3-4. Score with the location's model when the bundle has one, otherwise
+    // packed XGBoost trees if exported, otherwise simplePred (all return probability 0-1)
+    const locationModel = locationModelFor(reservation);
+    let noShowProbability;
+    let rawProbability;
+
+    if (locationModel) {
+      const { trees } = locationModel;
+      noShowProbability = predictPackedTrees(trees, trees.featureNames.map(name => features[name]));
+    } else {
+      const featureVector = MODEL_METADATA.featureNames.map(name => features[name]);
+      noShowProbability = model.predict ? model.predict(featureVector) : simplePred(featureVector, model);
+
+      // The calibration was fitted on the packed trees' outputs only
+      if (CALIBRATION && model.predict) {
+        rawProbability = noShowProbability;
+        noShowProbability = calibrate(CALIBRATION, rawProbability);
+      }
+    }
 
     // 5. Determine risk level from probability
     const noShowRisk = calculateRiskLevel(noShowProbability);
@@ -108,8 +248,10 @@ function predictNoShow(reservation, customerHistory = null) {
       confidence: Math.abs(noShowProbability - 0.5) * 2, // 0-1 scale
       features,
       metadata: {
-        modelVersion: MODEL_METADATA.version,
+        modelVersion: locationModel ? LOCATION_MODELS.version : MODEL_METADATA.version,
         modelTrainedAt: MODEL_METADATA.trainedAt,
+        ...(locationModel && { locationModel: locationModel.key }),
+        ...(rawProbability !== undefined && { rawProbability, calibration: CALIBRATION.method }),
         predictedAt: new Date().toISOString()
       }
     };
@@ -246,7 +388,15 @@ function getModelInfo() {
     trainedAt: MODEL_METADATA.trainedAt,
     type: MODEL_METADATA.type,
     features: MODEL_METADATA.featureNames.length,
-    notes: 'Proof-of-concept model. Use Python XGBoost for production.'
+    scoring: MODEL_METADATA.scoring,
+    historicalStatsAsOf: HISTORICAL_STATS ? HISTORICAL_STATS.asOf : null,
+    locationModels: LOCATION_MODELS ? Object.keys(LOCATION_MODELS.locations).length : 0,
+    calibration: CALIBRATION
+      ? { method: CALIBRATION.method, fittedAt: CALIBRATION.fittedAt, knots: CALIBRATION.x.length, ece: CALIBRATION.ece }
+      : null,
+    notes: MODEL_METADATA.scoring === 'xgboost-trees'
+      ? 'XGBoost trees evaluated inline (exported by ml-training-data/export_model.py).'
+      : 'Heuristic scoring. Run ml-training-data/export_model.py to enable XGBoost trees.'
   };
 }
 
@@ -300,5 +450,6 @@ module.exports = {
   getModelInfo,
   explainPrediction,
   loadModel,
-  reloadModel
+  reloadModel,
+  calibrate
 };
@@ -0,0 +1,94 @@
+/**
+ * Flat-Array Tree Evaluator
+ *
+ * Scores reservations with the packed XGBoost trees exported by
+ * ml-training-data/export_model.py (see model-trees.js).
+ *
+ * Every tree is stored in shared typed arrays, so a prediction is a tight
+ * loop over ~100 root-to-leaf walks with no object allocation.
+ */
+
+const PACKED_FORMAT = 'packed-trees-v1';
+
+/**
+ * Decode a base64 little-endian array into a typed array
+ * (copied into its own ArrayBuffer so the view is always aligned)
+ */
+function decodeArray(base64, TypedArray) {
+  const buffer = Buffer.from(base64, 'base64');
+  const copy = buffer.buffer.slice(buffer.byteOffset, buffer.byteOffset + buffer.length);
+  return new TypedArray(copy);
+}
+
+/**
+ * Decode the exported module into typed arrays (do once at load time)
+ *
+ * @param {Object} data - Contents of model-trees.js
+ * @returns {Object} - Packed trees ready for predictPackedTrees
+ */
+function loadPackedTrees(data) {
+  if (!data || data.format !== PACKED_FORMAT) {
+    throw new Error(`Unsupported tree format: ${data && data.format}`);
+  }
+
+  return {
+    version: data.version,
+    featureNames: data.featureNames,
+    numFeatures: data.numFeatures,
+    numTrees: data.numTrees,
+    baseMargin: data.baseMargin,
+    feature: decodeArray(data.arrays.feature, Int16Array),
+    value: decodeArray(data.arrays.value, Float32Array),
+    left: decodeArray(data.arrays.left, Int32Array),
+    right: decodeArray(data.arrays.right, Int32Array),
+    defaultLeft: decodeArray(data.arrays.defaultLeft, Uint8Array),
+    roots: decodeArray(data.arrays.roots, Int32Array)
+  };
+}
+
+/**
+ * Raw margin (log-odds) for one feature vector
+ *
+ * Splits go left when x < threshold, compared in float32 like XGBoost.
+ * Missing values (null/undefined/NaN) follow the node's default direction.
+ */
+function predictMargin(trees, featureVector) {
+  const { feature, value, left, right, defaultLeft, roots } = trees;
+  let margin = trees.baseMargin;
+
+  for (let t = 0; t < roots.length; t++) {
+    let node = roots[t];
+
+    while (feature[node] >= 0) {
+      const x = featureVector[feature[node]];
+
+      if (x === null || x === undefined || Number.isNaN(x)) {
+        node = defaultLeft[node] ? left[node] : right[node];
+      } else {
+        node = Math.fround(x) < value[node] ? left[node] : right[node];
+      }
+    }
+
+    margin += value[node];
+  }
+
+  return margin;
+}
+
+/**
+ * No-show probability (0-1) for one feature vector
+ *
+ * @param {Object} trees - Result of loadPackedTrees
+ * @param {Array<number>} featureVector - Features in trees.featureNames order
+ * @returns {number}
+ */
+function predictPackedTrees(trees, featureVector) {
+  return 1 / (1 + Math.exp(-predictMargin(trees, featureVector)));
+}
+
+module.exports = {
+  loadPackedTrees,
+  predictMargin,
+  predictPackedTrees,
+  PACKED_FORMAT
+};
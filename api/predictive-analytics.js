@@ -5,11 +5,27 @@
 
 const {
   getAllTables,
-  getActiveServiceRecords
+  getActiveServiceRecords,
+  parseRiskDrivers
 } = require('./_lib/supabase');
+const { ROLLUPS, rollupsAreFresh } = require('./_lib/rollups');
 
 const axios = require('axios');
 
+/**
+ * Load the overbooking allowances (generated by ml-training-data/overbooking.py)
+ * Returns null if they have not been built - the overbooking opportunity is then skipped.
+ */
+function loadOverbooking() {
+  try {
+    return require('./_lib/overbooking');
+  } catch (error) {
+    return null;
+  }
+}
+
+const OVERBOOKING = loadOverbooking();
+
 const AIRTABLE_API_KEY = process.env.AIRTABLE_API_KEY;
 const AIRTABLE_BASE_ID = process.env.AIRTABLE_BASE_ID;
 const RESERVATIONS_TABLE_ID = process.env.RESERVATIONS_TABLE_ID;
@@ -142,7 +158,8 @@ async function predictNoShowRisks() {
       risk_score: parseFloat(riskScore.toFixed(1)), // Already 0-100 scale
       risk_level: riskLevel,
       days_until: daysAhead,
-      recommendations
+      recommendations,
+      risk_drivers: parseRiskDrivers(r.fields['ML Risk Drivers'])
     };
   });
 
@@ -168,45 +185,87 @@ async function predictNoShowRisks() {
   };
 }
 
+/**
+ * Reservation counts of the last 30 days: total, cancelled or no-show, and by hour
+ */
+async function getRecentReservationActivity(now) {
+  const thirtyDaysAgo = new Date(now.getTime() - 30 * 24 * 60 * 60 * 1000);
+
+  // Daily rollups: a few hundred pre-aggregated rows instead of every reservation
+  if (rollupsAreFresh(ROLLUPS, now)) {
+    const since = thirtyDaysAgo.toISOString().split('T')[0];
+    const recentHours = ROLLUPS.hourly.filter(row => row.date > since);
+
+    const countsByHour = {};
+    recentHours.forEach(row => {
+      countsByHour[row.hour] = (countsByHour[row.hour] || 0) + row.reservations;
+    });
+
+    return {
+      success: true,
+      reservationCount: recentHours.reduce((sum, row) => sum + row.reservations, 0),
+      cancelledOrNoShow: recentHours.reduce((sum, row) => sum + row.cancelled + row.noShows, 0),
+      countsByHour
+    };
+  }
+
+  const reservationsResult = await getAllReservations();
+  if (!reservationsResult.success) {
+    return { success: false };
+  }
+
+  // Recent data for analysis
+  const recentReservations = (reservationsResult.records || []).filter(r => {
+    const resDate = new Date(r.fields.Date || r.createdTime);
+    return resDate >= thirtyDaysAgo;
+  });
+
+  const countsByHour = {};
+  recentReservations.forEach(r => {
+    const time = r.fields.Time || '';
+    const hour = parseInt(time.split(':')[0]) || 0;
+    countsByHour[hour] = (countsByHour[hour] || 0) + 1;
+  });
+
+  return {
+    success: true,
+    reservationCount: recentReservations.length,
+    cancelledOrNoShow: recentReservations.filter(r =>
+      r.fields.Status === 'cancelled' || r.fields.Status === 'no-show'
+    ).length,
+    countsByHour
+  };
+}
+
 /**
  * Calculate revenue optimization opportunities
  */
 async function getRevenueOpportunities() {
+  const now = new Date();
+
   const results = await Promise.all([
-    getAllReservations(),
+    getRecentReservationActivity(now),
     getActiveServiceRecords(),
     getAllTables()
   ]);
 
-  const reservationsResult = results[0];
+  const activityResult = results[0];
   const activePartiesResult = results[1];
   const tablesResult = results[2];
 
-  if (!reservationsResult.success || !tablesResult.success) {
+  if (!activityResult.success || !tablesResult.success) {
     return { success: false, error: 'Failed to fetch data' };
   }
 
-  const reservations = reservationsResult.records || [];
   const tables = tablesResult.tables || [];
 
-  const now = new Date();
-  const thirtyDaysAgo = new Date(now.getTime() - 30 * 24 * 60 * 60 * 1000);
-
-  // Recent data for analysis
-  const recentReservations = reservations.filter(r => {
-    const resDate = new Date(r.fields.Date || r.createdTime);
-    return resDate >= thirtyDaysAgo;
-  });
-
   const totalCapacity = tables.reduce((sum, table) => sum + table.capacity, 0);
 
   // Calculate opportunities
   const opportunities = [];
 
   // 1. No-show reduction opportunity
-  const cancelledOrNoShow = recentReservations.filter(r =>
-    r.fields.Status === 'cancelled' || r.fields.Status === 'no-show'
-  ).length;
+  const cancelledOrNoShow = activityResult.cancelledOrNoShow;
 
   if (cancelledOrNoShow > 0) {
     const avgCoversPerReservation = 3; // Estimate
@@ -232,12 +291,7 @@ async function getRevenueOpportunities() {
   }
 
   // 2. Off-peak hour filling
-  const timeSlotCounts = {};
-  recentReservations.forEach(r => {
-    const time = r.fields.Time || '';
-    const hour = parseInt(time.split(':')[0]) || 0;
-    timeSlotCounts[hour] = (timeSlotCounts[hour] || 0) + 1;
-  });
+  const timeSlotCounts = activityResult.countsByHour;
 
   const peakHourAvg = Math.max(...Object.values(timeSlotCounts));
   const offPeakHours = Object.entries(timeSlotCounts).filter(([hour, count]) => {
@@ -291,7 +345,7 @@ async function getRevenueOpportunities() {
     category: 'Revenue Per Cover',
     description: 'Increase average revenue per customer through upselling',
     current_loss: 0,
-    potential_gain: Math.round(recentReservations.length * 3 * 45 * 0.15), // 15% increase
+    potential_gain: Math.round(activityResult.reservationCount * 3 * 45 * 0.15), // 15% increase
     recovery_rate: '15%',
     actions: [
       'Train staff on wine pairing suggestions',
@@ -304,6 +358,39 @@ async function getRevenueOpportunities() {
     estimated_timeline: '1-2 weeks'
   });
 
+  // 5. Risk-based overbooking (from the Monte-Carlo no-show simulation)
+  if (OVERBOOKING) {
+    const today = now.toISOString().split('T')[0];
+    const nights = Object.entries(OVERBOOKING.nights).filter(([date]) => date >= today);
+
+    // Extra covers per night: the largest allowance beyond booked seats (or capacity) in any slot
+    const extraCovers = nights.map(([, night]) => Math.max(0, ...night.bookableSeats.map((bookable, slot) =>
+      bookable - Math.max(night.bookedSeats[slot], OVERBOOKING.capacity)
+    )));
+    const totalExtraCovers = extraCovers.reduce((sum, covers) => sum + covers, 0);
+
+    if (totalExtraCovers > 0) {
+      const avgRevenuePerCover = 45; // Estimate
+
+      opportunities.push({
+        category: 'Risk-Based Overbooking',
+        description: `Accept up to ${totalExtraCovers} extra covers over ${extraCovers.filter(c => c > 0).length} upcoming nights while the simulated risk of turning guests away stays within ${Math.round(OVERBOOKING.maxRisk * 100)}%`,
+        current_loss: 0,
+        potential_gain: Math.round(totalExtraCovers * avgRevenuePerCover * (1 - OVERBOOKING.maxRisk)),
+        recovery_rate: `${Math.round((1 - OVERBOOKING.maxRisk) * 100)}%`,
+        actions: [
+          'Keep the overbooking simulation current (run nightly after batch scoring)',
+          'Overbook only slots where high-risk reservations concentrate',
+          'Hold a bar or lounge fallback for the rare nights everyone shows',
+          'Confirm high-risk reservations before releasing extra seats'
+        ],
+        priority: 'medium',
+        implementation_difficulty: 'low',
+        estimated_timeline: '1-2 weeks'
+      });
+    }
+  }
+
   // Sort by potential gain (highest first)
   opportunities.sort((a, b) => b.potential_gain - a.potential_gain);
 
@@ -10,7 +10,7 @@ const {
 const {
   findOrCreateCustomer,
   updateCustomerHistory,
-  getCustomerStats
+  findSnapshotCustomer
 } = require('./_lib/customer-history');
 
 const { predictNoShow } = require('./ml/predict');
@@ -135,8 +135,9 @@ async function handleCreate(req, res) {
   try {
     console.log('[MLPrediction] Starting no-show prediction...');
 
-    // Get customer history for feature extraction
-    const customerHistory = await getCustomerStats(customer_email, customer_phone);
+    // Customer history for feature extraction (precomputed snapshot, same
+    // aggregates the model was trained on)
+    const customerHistory = findSnapshotCustomer(customer_email, customer_phone);
 
     // Create reservation object for prediction
     const reservationForPrediction = {
@@ -37,6 +37,20 @@ const STATUS_FROM_AIRTABLE = {
   'No Show': 'No Show'
 };
 
+/**
+ * Load the wait-time model (generated by ml-training-data/wait_times.py)
+ * Returns null if it has not been fitted - calculateEstimatedWait then uses its fixed formula.
+ */
+function loadWaitTimeModel() {
+  try {
+    return require('./_lib/wait-time-model');
+  } catch (error) {
+    return null;
+  }
+}
+
+const WAIT_TIME_MODEL = loadWaitTimeModel();
+
 module.exports = async (req, res) => {
   // Set CORS headers
   res.setHeader('Access-Control-Allow-Credentials', true);
@@ -513,12 +527,19 @@ async function getCurrentWaitlist() {
 /**
  * Helper: Calculate estimated wait time
  *
- * Algorithm:
+ * With the fitted wait-time model: hour intercept + minutes per party ahead
+ * + minutes per turning table + party size offset, rounded to 5 minutes.
+ *
+ * Fallback algorithm:
  * - Base wait: 15 minutes per party ahead in queue
  * - Adjust for party size matching (larger parties wait longer)
  * - Round to nearest 5 minutes
  */
 async function calculateEstimatedWait(partySize, queuePosition) {
+  if (WAIT_TIME_MODEL) {
+    return modelEstimatedWait(parseInt(partySize) || 1, queuePosition, await countTurningTables());
+  }
+
   const baseWaitPerParty = 15; // minutes
   let estimatedWait = queuePosition * baseWaitPerParty;
 
@@ -540,6 +561,44 @@ async function calculateEstimatedWait(partySize, queuePosition) {
   return estimatedWait;
 }
 
+/**
+ * Helper: Wait quote from the fitted model (same formula as wait_times.py model_quote)
+ */
+function modelEstimatedWait(partySize, queuePosition, turningTables, now = new Date()) {
+  const model = WAIT_TIME_MODEL;
+  const hour = parseInt(new Intl.DateTimeFormat('en-GB', {
+    timeZone: model.timezone,
+    hour: '2-digit',
+    hourCycle: 'h23'
+  }).format(now));
+  const party = partySize >= 6 ? 2 : partySize >= 4 ? 1 : 0;
+
+  const minutes = model.byHour[hour]
+    + model.perPartyAhead * queuePosition
+    + model.perTurningTable * turningTables
+    + model.partyOffsets[party];
+
+  const rounded = Math.round(minutes / model.quoteStep) * model.quoteStep;
+  return Math.min(Math.max(rounded, model.minQuote), model.maxQuote);
+}
+
+/**
+ * Helper: Count seated parties that have been at their table long enough to turn soon
+ */
+async function countTurningTables() {
+  try {
+    const result = await airtable.getActiveServiceRecords();
+    if (!result.success) {
+      return WAIT_TIME_MODEL.defaultTurning;
+    }
+
+    const turningBefore = Date.now() - WAIT_TIME_MODEL.turningAfterMinutes * 60000;
+    return result.service_records.filter(r => new Date(r.seated_at).getTime() <= turningBefore).length;
+  } catch (error) {
+    return WAIT_TIME_MODEL.defaultTurning;
+  }
+}
+
 /**
  * Helper: Send SMS notification to customer
  *
@@ -696,3 +755,6 @@ async function sendEmailNotification(customerName, customerEmail, partySize) {
     return false;
   }
 }
+
+// Exported for unit tests
+module.exports.modelEstimatedWait = modelEstimatedWait;
@@ -1,4 +1,5 @@
 import { useState, useEffect } from 'react';
+import type { RiskDriver } from '../../types/host.types';
 
 interface NoShowPrediction {
   reservation_id: string;
@@ -10,6 +11,7 @@ interface NoShowPrediction {
   risk_level: 'low' | 'medium' | 'high';
   days_until: number;
   recommendations: string[];
+  risk_drivers?: RiskDriver[];
 }
 
 interface NoShowSummary {
@@ -158,6 +160,24 @@ export default function NoShowPredictions() {
                   </div>
                 </div>
 
+                {/* Expanded Risk Drivers */}
+                {selectedPrediction === prediction && prediction.risk_drivers && prediction.risk_drivers.length > 0 && (
+                  <div className="mt-4 pt-4 border-t">
+                    <div className="font-semibold mb-2">Why this score:</div>
+                    <ul className="space-y-1">
+                      {prediction.risk_drivers.map((driver, idx) => (
+                        <li key={idx} className="flex items-center justify-between text-sm">
+                          <span>
+                            {driver.feature.replace(/_/g, ' ')}
+                            {driver.value !== null && <span className="text-muted-foreground"> ({driver.value})</span>}
+                          </span>
+                          <span className="font-mono text-xs">+{driver.impact.toFixed(2)}</span>
+                        </li>
+                      ))}
+                    </ul>
+                  </div>
+                )}
+
                 {/* Expanded Recommendations */}
                 {selectedPrediction === prediction && prediction.recommendations.length > 0 && (
                   <div className="mt-4 pt-4 border-t">
@@ -22,6 +22,12 @@ export interface ActiveParty {
   is_overdue: boolean;
 }
 
+export interface RiskDriver {
+  feature: string;
+  value: number | null;
+  impact: number;  // Contribution to the no-show log-odds
+}
+
 export interface UpcomingReservation {
   reservation_id: string;
   customer_name: string;
@@ -40,6 +46,7 @@ export interface UpcomingReservation {
   no_show_risk_level?: 'low' | 'medium' | 'high' | 'very-high';
   prediction_confidence?: number;  // 0-100 percentage
   ml_model_version?: string;
+  risk_drivers?: RiskDriver[];  // Top features pushing the risk up (from batch_score.py)
 }
 
 export interface DashboardSummary {
@@ -0,0 +1,372 @@
+"""
+Incremental Daily Analytics Rollups
+
+calculateAnalytics in api/analytics.js and getRevenueOpportunities in
+api/predictive-analytics.js fetch every reservation and service record on each
+request and filter the last 30 days in JS, so dashboard latency grows with
+history. This script keeps the aggregates they need as daily rollups:
+
+    daily[date]          reservations, covers, reservations by status,
+                         completed services, turn minutes (local date)
+    hourly[date][hour]   reservations, covers, no-shows, cancellations
+    tables[date][table]  completed services, covers, occupied minutes
+
+Each run fetches only the Reservations and Service Records modified since the
+last watermark (LAST_MODIFIED_TIME() in the Airtable filter), upserts them into
+the local fact tables and recomputes the rollups of just the dates they touch -
+old and new date, so a moved reservation leaves its old day too. The watermark
+overlaps the previous run by WATERMARK_OVERLAP_MINUTES; upserts are idempotent.
+
+Deleted records never show up as modified: run --full now and then to rebuild
+from scratch.
+
+api/_lib/analytics-rollups.js gets the last EXPORT_DAYS days of daily and
+hourly rows plus all-time per-table and turn-time totals - a few hundred rows
+instead of the full history.
+
+Usage:
+    python analytics_rollups.py                              # incremental update from Airtable
+    python analytics_rollups.py --full                       # rebuild from every record
+    python analytics_rollups.py --reservations res.csv --service-records service.csv
+
+CSV inputs use the Airtable field names as columns, plus the record `id`.
+"""
+
+import sys
+import io
+if __name__ == '__main__':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+import argparse
+import json
+import os
+import shutil
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.join(BASE_DIR, '..', 'scripts')
+
+ROLLUP_DIR = 'analytics-rollups'
+STATE_FILE = os.path.join(ROLLUP_DIR, 'state.json')
+RESERVATION_FACTS = os.path.join(ROLLUP_DIR, 'reservations.csv')
+SERVICE_FACTS = os.path.join(ROLLUP_DIR, 'service_records.csv')
+OUTPUT_FILE = '../api/_lib/analytics-rollups.js'
+
+# Service Records store UTC; dashboards report restaurant days
+RESTAURANT_TIMEZONE = 'Europe/Amsterdam'
+
+# Days of daily/hourly rows exported to the API (analytics.js looks back 30)
+EXPORT_DAYS = 35
+
+# Re-read records modified this long before the last watermark (clock skew, slow writes)
+WATERMARK_OVERLAP_MINUTES = 10
+
+# Turn times outside this range are data errors (never departed, double taps)
+MIN_TURN_MINUTES = 15
+MAX_TURN_MINUTES = 360
+
+RESERVATION_FIELDS = ['Date', 'Time', 'Party Size', 'Status']
+SERVICE_FIELDS = ['Seated At', 'Departed At', 'Party Size', 'Table IDs', 'Status']
+
+RESERVATION_COLUMNS = ['id', 'date', 'hour', 'party_size', 'status']
+SERVICE_COLUMNS = ['id', 'date', 'party_size', 'minutes', 'tables']
+
+
+# ============================================================================
+# FETCHING
+# ============================================================================
+
+def fetch_modified(table_name, fields, since=None):
+    """Records of a table modified after `since` (every record if None), with their IDs"""
+    sys.path.insert(0, SCRIPTS_DIR)
+    import airtable_client
+
+    table_id = {'reservations': airtable_client.RESERVATIONS_TABLE_ID,
+                'service': airtable_client.SERVICE_RECORDS_TABLE_ID}[table_name]
+    formula = f"IS_AFTER(LAST_MODIFIED_TIME(), {airtable_client.quote(since)})" if since else None
+
+    records = airtable_client.AirtableClient().list_records(table_id, filter_formula=formula, fields=fields)
+    return pd.DataFrame([{'id': r['id'], 'createdTime': r.get('createdTime'), **r['fields']} for r in records],
+                        columns=['id', 'createdTime'] + fields)
+
+
+# ============================================================================
+# FACT ROWS
+# ============================================================================
+
+def reservation_facts(records):
+    """One row per reservation: date (Date, else created day), hour, party size, status"""
+    date = pd.to_datetime(records['Date'], errors='coerce')
+    if 'createdTime' in records.columns:
+        created = pd.to_datetime(records['createdTime'], utc=True, errors='coerce', format='ISO8601')
+        date = date.fillna(created.dt.tz_convert(RESTAURANT_TIMEZONE).dt.tz_localize(None))
+
+    hour = pd.to_numeric(records['Time'].astype(str).str.extract(r'^\s*(\d+):')[0], errors='coerce')
+    facts = pd.DataFrame({
+        'id': records['id'].astype(str),
+        'date': date.dt.strftime('%Y-%m-%d'),
+        'hour': hour.fillna(0).astype(int),
+        'party_size': pd.to_numeric(records['Party Size'], errors='coerce').fillna(0).astype(int),
+        'status': records['Status'].fillna('pending').astype(str)
+    })
+    return facts.dropna(subset=['date'])
+
+
+def service_facts(records):
+    """One row per completed service: departure date, party size, turn minutes, tables"""
+    records = records[records['Status'] == 'Completed']
+    seated = pd.to_datetime(records['Seated At'], utc=True, errors='coerce', format='ISO8601')
+    departed = pd.to_datetime(records['Departed At'], utc=True, errors='coerce', format='ISO8601')
+
+    minutes = (departed - seated).dt.total_seconds() / 60
+    facts = pd.DataFrame({
+        'id': records['id'].astype(str),
+        'date': departed.dt.tz_convert(RESTAURANT_TIMEZONE).dt.strftime('%Y-%m-%d'),
+        'party_size': pd.to_numeric(records['Party Size'], errors='coerce').fillna(0).astype(int),
+        'minutes': minutes.where(minutes.between(MIN_TURN_MINUTES, MAX_TURN_MINUTES)),
+        'tables': records['Table IDs'].fillna('').astype(str).str.replace(' ', '')
+    })
+    return facts.dropna(subset=['date'])
+
+
+def load_facts(fact_file, columns):
+    if not os.path.exists(fact_file):
+        return pd.DataFrame(columns=columns)
+    return pd.read_csv(fact_file, dtype={'id': str, 'date': str, 'status': str, 'tables': str}, keep_default_na=False,
+                       na_values={'minutes': ['']})
+
+
+def upsert(facts, changed):
+    """
+    Replace changed records (by ID) in the fact table.
+
+    Returns (facts, dirty_dates): the dates of both the old and the new
+    version of every changed record.
+    """
+    replaced = facts['id'].isin(changed['id'])
+    dirty = set(facts.loc[replaced, 'date']) | set(changed['date'])
+    return pd.concat([facts[~replaced], changed], ignore_index=True), dirty
+
+
+def save_facts(facts, fact_file):
+    tmp_file = fact_file + '.tmp'
+    facts.to_csv(tmp_file, index=False)
+    os.replace(tmp_file, fact_file)
+
+
+# ============================================================================
+# ROLLUPS
+# ============================================================================
+
+def daily_rollups(reservations, services):
+    """date -> reservations, covers, byStatus, completed services and turn minutes"""
+    daily = {}
+    for date, rows in reservations.groupby('date'):
+        daily[date] = {
+            'reservations': int(len(rows)),
+            'covers': int(rows['party_size'].sum()),
+            'byStatus': {status: int(n) for status, n in rows['status'].value_counts().items()}
+        }
+
+    for date, rows in services.groupby('date'):
+        turns = rows['minutes'].dropna()
+        daily.setdefault(date, {'reservations': 0, 'covers': 0, 'byStatus': {}}).update({
+            'completedServices': int(len(rows)),
+            'turnMinutes': round(float(turns.sum()), 1),
+            'turnCount': int(len(turns))
+        })
+
+    for row in daily.values():
+        row.setdefault('completedServices', 0)
+        row.setdefault('turnMinutes', 0.0)
+        row.setdefault('turnCount', 0)
+    return daily
+
+
+def hourly_rollups(reservations):
+    """date -> hour -> reservations, covers, no-shows and cancellations"""
+    counts = reservations.assign(
+        no_show=reservations['status'] == 'no-show',
+        cancelled=reservations['status'] == 'cancelled'
+    ).groupby(['date', 'hour']).agg(
+        reservations=('id', 'size'), covers=('party_size', 'sum'),
+        noShows=('no_show', 'sum'), cancelled=('cancelled', 'sum')
+    )
+
+    hourly = {}
+    for (date, hour), row in counts.iterrows():
+        hourly.setdefault(date, {})[str(hour)] = {name: int(value) for name, value in row.items()}
+    return hourly
+
+
+def table_rollups(services):
+    """date -> table number -> completed services, covers and occupied minutes"""
+    per_table = services.assign(table=services['tables'].str.split(',')).explode('table')
+    per_table = per_table[per_table['table'].fillna('') != '']
+
+    counts = per_table.groupby(['date', 'table']).agg(
+        services=('id', 'size'), covers=('party_size', 'sum'), minutes=('minutes', 'sum')
+    )
+
+    tables = {}
+    for (date, table), row in counts.iterrows():
+        tables.setdefault(date, {})[table] = {
+            'services': int(row['services']), 'covers': int(row['covers']), 'minutes': round(float(row['minutes']), 1)
+        }
+    return tables
+
+
+def refresh_dates(state, reservations, services, dates):
+    """Recompute every rollup of the given dates from the fact tables"""
+    reservations = reservations[reservations['date'].isin(dates)]
+    services = services[services['date'].isin(dates)]
+
+    rollups = {
+        'daily': daily_rollups(reservations, services),
+        'hourly': hourly_rollups(reservations),
+        'tables': table_rollups(services)
+    }
+    for name, fresh in rollups.items():
+        for date in dates:
+            state[name].pop(date, None)
+        state[name].update(fresh)
+    return state
+
+
+def empty_state():
+    return {'watermark': None, 'updatedAt': None, 'daily': {}, 'hourly': {}, 'tables': {}}
+
+
+def load_state(state_file=STATE_FILE):
+    if not os.path.exists(state_file):
+        return None
+    with open(state_file, 'r') as f:
+        return json.load(f)
+
+
+def save_state(state, state_file=STATE_FILE):
+    tmp_file = state_file + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_file, state_file)
+
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def api_payload(state, through, export_days=EXPORT_DAYS):
+    """Last export_days of daily/hourly rows and all-time totals for the endpoints"""
+    first = (pd.Timestamp(through) - pd.Timedelta(days=export_days - 1)).strftime('%Y-%m-%d')
+    recent = sorted(date for date in state['daily'] if date >= first)
+
+    by_table = {}
+    for tables in state['tables'].values():
+        for table, row in tables.items():
+            by_table[table] = by_table.get(table, 0) + row['services']
+
+    return {
+        'generatedAt': state['updatedAt'],
+        'watermark': state['watermark'],
+        'from': first,
+        'daily': [{'date': date, **state['daily'][date]} for date in recent],
+        'hourly': [{'date': date, 'hour': int(hour), **row}
+                   for date in recent for hour, row in sorted(state['hourly'].get(date, {}).items(), key=lambda h: int(h[0]))],
+        'totals': {
+            'completedServices': sum(row['completedServices'] for row in state['daily'].values()),
+            'turnMinutes': round(sum(row['turnMinutes'] for row in state['daily'].values()), 1),
+            'turnCount': sum(row['turnCount'] for row in state['daily'].values()),
+            'servicesByTable': by_table
+        }
+    }
+
+
+def write_js_module(payload, output_file=OUTPUT_FILE):
+    module_js = f"""/**
+ * Daily Analytics Rollups (Inline for Serverless Compatibility)
+ *
+ * GENERATED by ml-training-data/analytics_rollups.py - do not edit by hand.
+ *
+ * Daily and hourly reservation / service aggregates since {payload['from']} plus
+ * all-time turn-time and per-table totals, read by api/analytics.js and
+ * api/predictive-analytics.js instead of scanning every record per request.
+ *
+ * Generated: {payload['generatedAt']} (records modified up to {payload['watermark']})
+ */
+
+module.exports = {json.dumps(payload)};
+"""
+
+    tmp_file = output_file + '.tmp'
+    with open(tmp_file, 'w') as f:
+        f.write(module_js)
+    os.replace(tmp_file, output_file)
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Update daily analytics rollups from modified records')
+    parser.add_argument('--full', action='store_true', help='Rebuild from every record instead of the modified ones')
+    parser.add_argument('--reservations', default=None, help='Reservations CSV (default: fetch from Airtable)')
+    parser.add_argument('--service-records', default=None, help='Service Records CSV (default: fetch from Airtable)')
+    parser.add_argument('--export-days', type=int, default=EXPORT_DAYS, help='Days of daily/hourly rows for the API')
+    parser.add_argument('--output', default=OUTPUT_FILE, help='JS module for the API')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("ANALYTICS ROLLUPS")
+    print("=" * 80)
+
+    state = None if args.full else load_state()
+    if state is None:
+        state = empty_state()
+        if os.path.exists(ROLLUP_DIR):
+            shutil.rmtree(ROLLUP_DIR)
+    os.makedirs(ROLLUP_DIR, exist_ok=True)
+
+    started_at = datetime.now(timezone.utc)
+    since = None
+    if state['watermark']:
+        since = (datetime.fromisoformat(state['watermark']) - timedelta(minutes=WATERMARK_OVERLAP_MINUTES)).isoformat()
+    print(f"\nFetching records modified {'since ' + since if since else '(all - full rebuild)'}")
+
+    changed_reservations = reservation_facts(
+        pd.read_csv(args.reservations) if args.reservations else fetch_modified('reservations', RESERVATION_FIELDS, since)
+    )
+    changed_services = service_facts(
+        pd.read_csv(args.service_records) if args.service_records else fetch_modified('service', SERVICE_FIELDS, since)
+    )
+
+    reservations, dirty_reservations = upsert(load_facts(RESERVATION_FACTS, RESERVATION_COLUMNS), changed_reservations)
+    services, dirty_services = upsert(load_facts(SERVICE_FACTS, SERVICE_COLUMNS), changed_services)
+    dirty = dirty_reservations | dirty_services
+
+    print(f"   Reservations: {len(changed_reservations):,} changed ({len(reservations):,} total)")
+    print(f"   Completed services: {len(changed_services):,} changed ({len(services):,} total)")
+    print(f"   Dates to recompute: {len(dirty)} of {len(set(reservations['date']) | set(services['date']))}")
+
+    state = refresh_dates(state, reservations, services, dirty)
+    state['watermark'] = started_at.isoformat()
+    state['updatedAt'] = datetime.now(timezone.utc).isoformat()
+
+    save_facts(reservations, RESERVATION_FACTS)
+    save_facts(services, SERVICE_FACTS)
+    save_state(state)
+
+    payload = api_payload(state, datetime.now().date(), args.export_days)
+    write_js_module(payload, args.output)
+
+    print(f"\nRollups: {len(state['daily'])} days; exported {len(payload['daily'])} daily and "
+          f"{len(payload['hourly'])} hourly rows, {len(payload['totals']['servicesByTable'])} tables")
+    print(f"State written: {STATE_FILE}")
+    print(f"API module written: {args.output}")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,396 @@
+"""
+Batch No-Show Scoring for Upcoming Reservations
+
+api/batch-predict.js scores one reservation per round trip. This script scores a
+whole day's or week's reservations as a single feature matrix with one
+predict_proba call, then writes the ML fields as chunked bulk-update payloads
+(Airtable accepts 10 records per PATCH; Supabase upserts can take larger chunks).
+
+High and very-high risk reservations also get their top drivers: TreeSHAP
+contributions for all of them in one vectorized pred_contribs pass, stored as
+`ML Risk Drivers` so the dashboard shows reasons without explaining anything
+online in predictNoShow.
+
+If calibrate.py has fitted a calibration for this model, probabilities go through
+it before the risk levels are cut, exactly as predict.js does.
+
+Reservations default to the pending rows of the training log (the data
+logger records every booking there), and their features are built with
+reservation_features.py, the Python port of features.js. Customer history is
+taken as of each reservation and slot rates come from slot_stats.py. Payloads
+are keyed by Reservation ID. --apply resolves those to Airtable record IDs and
+PATCHes the Reservations table, which is the nightly backfill.
+api/batch-predict.js then only has the reservations booked since to score.
+
+Usage:
+    python batch_score.py                                       # today's pending reservations
+    python batch_score.py --from 2025-11-01 --days 7 --apply    # score and write a week to Airtable
+    python batch_score.py --chunk-size 500                      # Supabase upsert
+    python batch_score.py --explain-levels medium,high,very-high --top-drivers 5
+    python batch_score.py --calibration ''                      # raw probabilities
+    python batch_score.py features.csv                          # precomputed feature matrix
+
+A features CSV needs `record_id` (Airtable record ID) or `reservation_id` and
+the model's feature columns.
+"""
+
+import sys
+import io
+if __name__ == '__main__':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+import argparse
+import json
+import os
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.join(BASE_DIR, '..', 'scripts')
+
+DEFAULT_MODEL_FILE = 'no_show_model_v2.json'
+DEFAULT_METADATA_FILE = 'model_v2_metadata.json'
+DEFAULT_OUTPUT_FILE = 'ml_updates.json'
+DEFAULT_CALIBRATION_FILE = '../api/ml/calibration.js'
+
+AIRTABLE_BATCH_SIZE = 10
+
+# Same cutoffs as calculateRiskLevel in api/ml/predict.js
+RISK_THRESHOLDS = [0.25, 0.50, 0.75]
+RISK_LEVELS = np.array(['low', 'medium', 'high', 'very-high'])
+
+DATE_COLUMNS = ['reservation_date', 'date', 'Date']
+
+# Risk levels whose drivers are precomputed, and how many drivers to keep
+EXPLAIN_LEVELS = ['high', 'very-high']
+TOP_DRIVERS = 3
+
+
+# ============================================================================
+# LOADING
+# ============================================================================
+
+def load_model(model_file, metadata_file):
+    """Load the booster plus the feature order and version it was trained with"""
+    import xgboost as xgb
+
+    model = xgb.XGBClassifier()
+    model.load_model(model_file)
+
+    with open(metadata_file, 'r') as f:
+        metadata = json.load(f)
+
+    return model, metadata['featureNames'], metadata.get('version', 'unknown')
+
+
+def filter_dates(df, date_column, date_from=None, days=None):
+    """Rows whose date falls in [date_from, date_from + days)"""
+    if date_from is None:
+        return df
+    dates = pd.to_datetime(df[date_column], errors='coerce')
+    start = pd.Timestamp(date_from)
+    end = start + pd.Timedelta(days=days or 1)
+    return df[(dates >= start) & (dates < end)]
+
+
+def load_reservations(csv_file, feature_names, date_from=None, days=None):
+    """
+    Read a precomputed feature matrix and (optionally) keep only a date window.
+
+    Missing feature columns are an error - silently zero-filling them would
+    produce confident but meaningless scores.
+    """
+    df = pd.read_csv(csv_file)
+
+    missing = [name for name in feature_names if name not in df.columns]
+    if missing:
+        raise ValueError(f"Input is missing feature columns: {', '.join(missing)}")
+
+    if date_from is not None:
+        date_column = next((c for c in DATE_COLUMNS if c in df.columns), None)
+        if date_column is None:
+            raise ValueError(f"--from needs a date column ({', '.join(DATE_COLUMNS)})")
+        df = filter_dates(df, date_column, date_from, days)
+
+    return df.reset_index(drop=True)
+
+
+def upcoming_reservations(table, feature_names, date_from, days, now=None):
+    """
+    Pending reservations of the training log in the window, with their features.
+
+    Customer history only counts reservations before each one (as the API's
+    snapshot would have at booking time); days since the last visit are
+    counted to `now`, as features.js does when scoring.
+    """
+    from customer_features import point_in_time_history
+    from reservation_features import build_features, reservation_frame
+    from slot_stats import load_lookup_tables
+
+    history, _ = point_in_time_history(table)
+    pending = filter_dates(table[table['actual_outcome'] == 'pending'], 'reservation_date', date_from, days)
+
+    now = pd.Timestamp(now or datetime.now()).normalize()
+    features = build_features(reservation_frame(pending), history.loc[pending.index], load_lookup_tables(), now=now)
+
+    missing = [name for name in feature_names if name not in features.columns]
+    if missing:
+        raise ValueError(f"Model expects features reservation_features.py does not build: {', '.join(missing)}")
+
+    df = pd.concat([pending[['reservation_id', 'reservation_date']], features[feature_names]], axis=1)
+    return df.reset_index(drop=True)
+
+
+def load_model_calibration(calibration_file, model_file, model_version):
+    """calibrate.py's calibration if it was fitted on this model (None otherwise)"""
+    from calibrate import load_calibration
+
+    calibration = load_calibration(calibration_file) if calibration_file else None
+    if calibration is None:
+        return None
+    if calibration['sourceModel'] != os.path.basename(model_file) or calibration['modelVersion'] != model_version:
+        print(f"   Note: {calibration_file} was fitted on {calibration['sourceModel']} "
+              f"v{calibration['modelVersion']} - scoring uncalibrated")
+        return None
+    return calibration
+
+
+def record_ids(df):
+    """
+    IDs to address each update by, and whether they are Airtable record IDs
+    (True) or Reservation IDs that --apply still has to resolve (False).
+    """
+    for column in ['record_id', 'reservation_id', 'Reservation ID']:
+        if column in df.columns:
+            return df[column].astype(str).to_numpy(), column == 'record_id'
+    raise ValueError("Input needs a record_id or reservation_id column")
+
+
+# ============================================================================
+# SCORING
+# ============================================================================
+
+def score_matrix(model, X, calibration=None):
+    """
+    Score every row in one predict_proba call and derive the ML fields
+    with vectorized ops (no per-row Python).
+    """
+    probabilities = model.predict_proba(np.asarray(X, dtype=np.float32))[:, 1]
+    if calibration is not None:
+        from calibrate import apply_calibration
+        probabilities = apply_calibration(calibration, probabilities)
+
+    return {
+        'probability': probabilities,
+        # Math.round semantics (round half up), matching batch-predict.js
+        'risk_score': np.floor(probabilities * 100 + 0.5).astype(int),
+        'risk_level': RISK_LEVELS[np.searchsorted(RISK_THRESHOLDS, probabilities, side='right')],
+        'confidence': np.floor(np.abs(probabilities - 0.5) * 2 * 100 + 0.5).astype(int)
+    }
+
+
+def top_drivers(model, X, feature_names, top_n=TOP_DRIVERS):
+    """
+    Features pushing each row's no-show risk up the most.
+
+    One pred_contribs call gives exact TreeSHAP contributions (log-odds) for
+    every row and feature; the top_n largest positive ones per row are picked
+    with a single argsort. Returns one list of drivers per row of X.
+    """
+    import xgboost as xgb
+
+    X = np.asarray(X, dtype=np.float32)
+    if len(X) == 0:
+        return []
+
+    contributions = model.get_booster().predict(xgb.DMatrix(X), pred_contribs=True)[:, :-1]  # last column is the bias
+    order = np.argsort(-contributions, axis=1)[:, :top_n]
+    rows = np.arange(len(X))[:, None]
+    top_values, top_contributions = X[rows, order], contributions[rows, order]
+
+    names = np.asarray(feature_names)
+    return [
+        [
+            {'feature': str(names[j]), 'value': None if np.isnan(value) else round(float(value), 3), 'impact': round(float(impact), 3)}
+            for j, value, impact in zip(order[i], top_values[i], top_contributions[i])
+            if impact > 0
+        ]
+        for i in range(len(X))
+    ]
+
+
+def explain_scores(model, X, feature_names, scores, levels=EXPLAIN_LEVELS, top_n=TOP_DRIVERS):
+    """Drivers for the rows whose risk level is in `levels` (None for the rest)"""
+    explain = np.isin(scores['risk_level'], levels)
+    drivers = [None] * len(explain)
+    for i, row_drivers in zip(np.flatnonzero(explain), top_drivers(model, np.asarray(X)[explain], feature_names, top_n)):
+        drivers[i] = row_drivers
+    return drivers
+
+
+def build_update_payloads(ids, scores, model_version, chunk_size=AIRTABLE_BATCH_SIZE, drivers=None):
+    """
+    Bulk-update payloads with the same fields batch-predict.js writes,
+    split into chunks of `chunk_size` records.
+
+    With drivers, every record also gets `ML Risk Drivers` (JSON text) - empty
+    for rows that were not explained, so stale reasons from an earlier run are
+    cleared when a reservation drops out of the high-risk levels.
+    """
+    predicted_at = datetime.now().isoformat()
+
+    records = [
+        {
+            'id': record_id,
+            'fields': {
+                'ML Risk Score': int(risk_score),
+                'ML Risk Level': str(risk_level),
+                'ML Confidence': int(confidence),
+                'ML Model Version': model_version,
+                'ML Prediction Timestamp': predicted_at
+            }
+        }
+        for record_id, risk_score, risk_level, confidence in zip(
+            ids, scores['risk_score'], scores['risk_level'], scores['confidence']
+        )
+    ]
+
+    if drivers is not None:
+        for record, row_drivers in zip(records, drivers):
+            record['fields']['ML Risk Drivers'] = json.dumps(row_drivers) if row_drivers else ''
+
+    return [{'records': records[i:i + chunk_size]} for i in range(0, len(records), chunk_size)]
+
+
+# ============================================================================
+# APPLYING
+# ============================================================================
+
+def apply_payloads(payloads, by_record_id=False):
+    """
+    PATCH the payloads into Airtable Reservations (scripts/airtable_client.py).
+
+    Reservation IDs are first resolved to record IDs; reservations Airtable no
+    longer has are skipped. Returns (updated, skipped).
+    """
+    sys.path.insert(0, SCRIPTS_DIR)
+    from airtable_client import AirtableClient, RESERVATIONS_TABLE_ID, any_of, equals
+
+    client = AirtableClient()
+    records = [record for payload in payloads for record in payload['records']]
+
+    if not by_record_id:
+        record_id_by_reservation = {}
+        # Resolve in chunks so the filter formula stays short
+        for i in range(0, len(records), 100):
+            chunk = records[i:i + 100]
+            matches = client.list_records(
+                RESERVATIONS_TABLE_ID,
+                filter_formula=any_of(*[equals('Reservation ID', record['id']) for record in chunk]),
+                fields=['Reservation ID']
+            )
+            record_id_by_reservation.update({m['fields'].get('Reservation ID'): m['id'] for m in matches})
+
+        records = [{'id': record_id_by_reservation[record['id']], 'fields': record['fields']}
+                   for record in records if record['id'] in record_id_by_reservation]
+
+    updated = client.update_records(RESERVATIONS_TABLE_ID, records)
+    return len(updated), sum(len(payload['records']) for payload in payloads) - len(records)
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Score upcoming reservations in one batch')
+    parser.add_argument('input', nargs='?', help='CSV of reservations with feature columns '
+                                                  '(default: pending reservations in the training log)')
+    parser.add_argument('--model', default=DEFAULT_MODEL_FILE, help='Saved XGBoost model (.json)')
+    parser.add_argument('--metadata', default=DEFAULT_METADATA_FILE, help='Metadata file with featureNames')
+    parser.add_argument('--from', dest='date_from',
+                        help='First reservation date to score (YYYY-MM-DD, default: today for the training log)')
+    parser.add_argument('--days', type=int, default=1, help='Number of days to score from --from')
+    parser.add_argument('--chunk-size', type=int, default=AIRTABLE_BATCH_SIZE, help='Records per update payload')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_FILE, help='Where to write the update payloads')
+    parser.add_argument('--explain-levels', default=','.join(EXPLAIN_LEVELS),
+                        help='Comma-separated risk levels to precompute drivers for (empty: none)')
+    parser.add_argument('--top-drivers', type=int, default=TOP_DRIVERS, help='Drivers kept per reservation')
+    parser.add_argument('--calibration', default=DEFAULT_CALIBRATION_FILE,
+                        help="calibrate.py module to apply if fitted on this model ('' to skip)")
+    parser.add_argument('--apply', action='store_true', help='Write the updates to Airtable Reservations')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("BATCH NO-SHOW SCORING")
+    print("=" * 80)
+
+    model, feature_names, model_version = load_model(args.model, args.metadata)
+    print(f"\nModel: {args.model} (v{model_version}, {len(feature_names)} features)")
+
+    calibration = load_model_calibration(args.calibration, args.model, model_version)
+    if calibration is not None:
+        print(f"Calibration: {calibration['method']} ({len(calibration['x'])} knots, fitted {calibration['fittedAt'][:10]})")
+
+    if args.input:
+        df = load_reservations(args.input, feature_names, args.date_from, args.days)
+    else:
+        from training_log import load_training_table
+        args.date_from = args.date_from or datetime.now().strftime('%Y-%m-%d')
+        df = upcoming_reservations(load_training_table(), feature_names, args.date_from, args.days)
+    if args.date_from:
+        window_end = datetime.fromisoformat(args.date_from) + timedelta(days=args.days)
+        print(f"Window: {args.date_from} to {window_end.date()} (exclusive)")
+    print(f"Reservations to score: {len(df):,}")
+
+    if len(df) == 0:
+        print("\nNothing to score.")
+        return
+
+    X = df[feature_names].to_numpy(dtype=np.float32)
+
+    start = time.perf_counter()
+    scores = score_matrix(model, X, calibration)
+    elapsed = time.perf_counter() - start
+
+    drivers = None
+    explain_levels = [level for level in args.explain_levels.split(',') if level]
+    if explain_levels:
+        start = time.perf_counter()
+        drivers = explain_scores(model, X, feature_names, scores, explain_levels, args.top_drivers)
+        explain_elapsed = time.perf_counter() - start
+        n_explained = sum(row is not None for row in drivers)
+
+    ids, by_record_id = record_ids(df)
+    payloads = build_update_payloads(ids, scores, model_version, args.chunk_size, drivers)
+
+    with open(args.output, 'w') as f:
+        json.dump(payloads, f, indent=2)
+
+    levels, counts = np.unique(scores['risk_level'], return_counts=True)
+
+    print(f"\nScored in {elapsed * 1000:.1f} ms ({elapsed / len(df) * 1e6:.1f} us/reservation)")
+    print("Risk levels:")
+    for level, count in zip(levels, counts):
+        print(f"   - {level}: {count:,}")
+
+    if drivers is not None:
+        print(f"\nDrivers ({', '.join(explain_levels)}): {n_explained:,} reservations in {explain_elapsed * 1000:.1f} ms")
+        if n_explained:
+            top = pd.Series([d['feature'] for row in drivers if row for d in row[:1]]).value_counts().head(3)
+            print("   Most common top driver: " + ', '.join(f"{name} ({count:,})" for name, count in top.items()))
+
+    print(f"\nWrote {len(payloads)} update payload(s) of up to {args.chunk_size} records: {args.output}")
+
+    if args.apply:
+        updated, skipped = apply_payloads(payloads, by_record_id)
+        print(f"Applied to Airtable: {updated:,} reservations updated" +
+              (f", {skipped:,} not found" if skipped else ''))
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
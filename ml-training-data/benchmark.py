@@ -0,0 +1,477 @@
+"""
+No-Show Pipeline Benchmark (Feature Extraction + Scoring)
+
+Measures what a prediction costs at 1K / 100K / 1M reservations:
+
+    - feature extraction throughput: reservation_features.build_features
+    - batch scoring throughput: full XGBoost booster vs. the compact packed
+      export the API serves (api/ml/model-trees.js)
+    - single-row latency p50/p99 for both models in Python, and in Node for
+      the real API path: extractAllFeatures, predictPackedTrees, predictNoShow
+    - peak memory (RSS) to load each model and score a batch, each measured in
+      a fresh process so the numbers don't bleed into each other
+
+Reservations are synthetic, bootstrapped from the rows of
+ml-training/synthetic_train.csv and turned back into raw reservation fields
+(date, time, booking time, confirmation, customer history) so the feature
+code does its full parsing work.
+
+The JSON report has the same shape on every run; pass a previous report as
+--baseline to flag regressions (exit code 1).
+
+Usage:
+    python benchmark.py                                    # 1K, 100K, 1M
+    python benchmark.py --scales 1000,100000 --output bench_before.json
+    python benchmark.py --baseline bench_before.json --threshold 0.15
+"""
+
+import sys
+import io
+if __name__ == '__main__':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import shutil
+import subprocess
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from export_model import latency, load_feature_names, load_js_module, predict_proba_packed
+from reservation_features import build_features
+
+SOURCE_FILE = '../ml-training/synthetic_train.csv'
+MODEL_FILE = 'no_show_model_v2.json'
+METADATA_FILE = 'model_v2_metadata.json'
+COMPACT_FILE = '../api/ml/model-trees.js'
+REPORT_FILE = 'benchmark_report.json'
+
+API_ML_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'api', 'ml')
+
+SCALES = [1_000, 100_000, 1_000_000]
+LATENCY_ROWS = 2000
+NODE_MAX_ROWS = 100_000     # rows serialized to Node per scale (JSON over stdin)
+PACKED_CHUNK_ROWS = 50_000  # the packed evaluator holds an (n_rows, n_trees) pointer matrix
+REGRESSION_THRESHOLD = 0.20
+SEED = 42
+
+# Metric name suffix -> True if higher is better
+METRIC_DIRECTIONS = {'RowsPerSec': True, 'Us': False, 'Mb': False}
+
+
+# ============================================================================
+# SYNTHETIC RESERVATIONS
+# ============================================================================
+
+def synthetic_reservations(n, now, source_file=SOURCE_FILE, seed=SEED):
+    """
+    n reservations shaped like the training set: rows are sampled (with
+    replacement) from source_file and mapped back to the raw fields
+    features.js reads. Returns (reservations, history).
+    """
+    rows = pd.read_csv(source_file).sample(n, replace=True, random_state=seed).reset_index(drop=True)
+
+    today = now.normalize()
+    reservation_time = (today + pd.to_timedelta(rows['days_until_reservation'], unit='D')
+                        + pd.to_timedelta(rows['hour_of_day'], unit='h'))
+    booked = reservation_time - pd.to_timedelta(rows['booking_lead_time_hours'], unit='h')
+    sent = reservation_time - pd.to_timedelta(rows['hours_since_confirmation_sent'], unit='h')
+
+    reservations = pd.DataFrame({
+        'date': reservation_time.dt.strftime('%Y-%m-%d'),
+        'time': rows['hour_of_day'].astype(int).astype(str).str.zfill(2) + ':00',
+        'booking_created_at': booked.dt.strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+        'party_size': rows['party_size'].astype(int),
+        'special_requests': np.where(rows['has_special_requests'] == 1, 'Window seat', ''),
+        'confirmation_sent': rows['confirmation_sent'].astype(bool),
+        'confirmation_clicked': rows['confirmation_clicked'].astype(bool),
+        'confirmation_sent_at': sent.dt.strftime('%Y-%m-%dT%H:%M:%S.000Z').where(rows['confirmation_sent'] == 1)
+    })
+
+    repeat = rows['is_repeat_customer'] == 1
+    last_visit = today - pd.to_timedelta(rows['days_since_last_visit'].clip(upper=3650), unit='D')
+    history = pd.DataFrame({
+        'Completed Reservations': rows['customer_visit_count'],
+        'No Show Risk Score': rows['customer_no_show_rate'],
+        'Average Party Size': rows['customer_avg_party_size'],
+        'Last Visit Date': last_visit.dt.strftime('%Y-%m-%d'),
+        'Total Spend': rows['customer_lifetime_value']
+    }).where(repeat)
+
+    return reservations, history
+
+
+# ============================================================================
+# PYTHON MEASUREMENTS
+# ============================================================================
+
+def throughput(func, n_rows, repeats=3):
+    """Best-of-N rows/second for a whole-batch call"""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return n_rows / best
+
+
+def load_booster(model_file):
+    import xgboost as xgb
+
+    booster = xgb.Booster()
+    booster.load_model(model_file)
+    return booster
+
+
+def predict_packed_chunked(packed, X):
+    return np.concatenate([predict_proba_packed(packed, X[i:i + PACKED_CHUNK_ROWS])
+                           for i in range(0, len(X), PACKED_CHUNK_ROWS)])
+
+
+def _proc_status_mb(field):
+    """VmRSS / VmHWM from /proc/self/status in MB (None off Linux)"""
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith(field + ':'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+
+
+def _rss_mb():
+    current = _proc_status_mb('VmRSS')
+    if current is not None:
+        return current
+    # ru_maxrss (peak, KB on Linux and bytes on macOS) is the best we have elsewhere
+    try:
+        import resource
+    except ImportError:
+        return float('nan')  # Windows: no resource module
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _peak_rss_mb():
+    peak = _proc_status_mb('VmHWM')
+    return peak if peak is not None else _rss_mb()
+
+
+def _reset_peak_rss():
+    """Reset VmHWM so import-time spikes don't count (Linux only)"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+
+
+def _memory_probe(kind, model_file, X, queue):
+    """Child process: RSS after loading the model, and peak RSS while scoring X"""
+    import xgboost  # noqa: F401 - keep the import cost out of the model numbers
+
+    _reset_peak_rss()
+    baseline = _rss_mb()
+    if kind == 'xgboost':
+        booster = load_booster(model_file)
+        loaded = _rss_mb()
+        booster.inplace_predict(X)
+    else:
+        packed, _ = load_js_module(model_file)
+        loaded = _rss_mb()
+        predict_packed_chunked(packed, X)
+
+    queue.put({'loadMb': loaded - baseline, 'peakMb': _peak_rss_mb() - baseline})
+
+
+def peak_memory(kind, model_file, X):
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=_memory_probe, args=(kind, model_file, X, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+# ============================================================================
+# NODE MEASUREMENTS
+# ============================================================================
+
+NODE_SCRIPT = """
+const path = require('path');
+const dir = process.argv[1];
+const log = console.log;
+console.log = () => {};
+console.warn = () => {};
+
+const rssMb = () => process.memoryUsage().rss / (1024 * 1024);
+const baseline = rssMb();
+const { extractAllFeatures } = require(path.join(dir, 'features'));
+const { loadPackedTrees, predictPackedTrees } = require(path.join(dir, 'tree-evaluator'));
+const { predictNoShow, getModelInfo } = require(path.join(dir, 'predict'));
+const trees = loadPackedTrees(require(process.argv[2]));
+const info = getModelInfo();
+const loadedMb = rssMb() - baseline;
+
+const input = JSON.parse(require('fs').readFileSync(0, 'utf-8'));
+const histories = input.history.map(fields => (fields ? { fields } : null));
+const vectors = input.reservations.map((r, i) => {
+  const f = extractAllFeatures(r, histories[i]);
+  return trees.featureNames.map(name => f[name]);
+});
+
+function timeEach(fn, count) {
+  for (let i = 0; i < Math.min(count, 200); i++) fn(i);
+  const times = new Float64Array(count);
+  for (let i = 0; i < count; i++) {
+    const start = process.hrtime.bigint();
+    fn(i);
+    times[i] = Number(process.hrtime.bigint() - start) / 1000;
+  }
+  times.sort();
+  return { p50Us: times[Math.floor(count * 0.5)], p99Us: times[Math.floor(count * 0.99)] };
+}
+
+function rate(fn, count) {
+  const start = process.hrtime.bigint();
+  for (let i = 0; i < count; i++) fn(i);
+  return count / (Number(process.hrtime.bigint() - start) / 1e9);
+}
+
+const n = input.reservations.length;
+const single = Math.min(n, input.latencyRows);
+let sink = 0;
+
+const result = {
+  scoring: info.scoring,
+  loadMb: loadedMb,
+  extractRowsPerSec: rate(i => { sink += extractAllFeatures(input.reservations[i], histories[i]).party_size; }, n),
+  scoreRowsPerSec: rate(i => { sink += predictPackedTrees(trees, vectors[i]); }, n),
+  predictNoShowRowsPerSec: rate(i => { sink += predictNoShow(input.reservations[i], histories[i]).noShowProbability; }, n),
+  extractLatency: timeEach(i => { sink += extractAllFeatures(input.reservations[i], histories[i]).party_size; }, single),
+  scoreLatency: timeEach(i => { sink += predictPackedTrees(trees, vectors[i]); }, single),
+  predictNoShowLatency: timeEach(i => { sink += predictNoShow(input.reservations[i], histories[i]).noShowProbability; }, single),
+  peakMb: rssMb() - baseline,
+  sink
+};
+log(JSON.stringify(result));
+"""
+
+
+def node_benchmark(reservations, history, compact_file):
+    """Throughput, single-row latency and RSS of the API's JS path (None without node)"""
+    node = shutil.which('node')
+    if node is None:
+        return None
+
+    def records(frame):
+        return frame.astype(object).where(frame.notna(), None).to_dict('records')
+
+    payload = {
+        'reservations': [{k: v for k, v in r.items() if v is not None} for r in records(reservations)],
+        'history': [None if all(v is None for v in h.values()) else h for h in records(history)],
+        'latencyRows': LATENCY_ROWS
+    }
+    result = subprocess.run(
+        [node, '-e', NODE_SCRIPT, os.path.abspath(API_ML_DIR), os.path.abspath(compact_file)],
+        input=json.dumps(payload, default=lambda v: v.item() if hasattr(v, 'item') else str(v)),
+        capture_output=True, text=True, check=True,
+        env={**os.environ, 'TZ': 'UTC'}
+    )
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    timings.pop('sink')
+    timings['rows'] = len(reservations)
+    return timings
+
+
+# ============================================================================
+# SUITE
+# ============================================================================
+
+def run_scale(n, now, booster, packed, feature_names, args):
+    reservations, history = synthetic_reservations(n, now, args.source)
+
+    features = build_features(reservations, history, now=now)
+    X = features[feature_names].to_numpy(dtype=np.float32)
+    sample = X[:LATENCY_ROWS]
+
+    result = {
+        'rows': n,
+        'python': {
+            'featureRowsPerSec': throughput(lambda: build_features(reservations, history, now=now), n),
+            'xgboostRowsPerSec': throughput(lambda: booster.inplace_predict(X), n),
+            'packedRowsPerSec': throughput(lambda: predict_packed_chunked(packed, X), n),
+            'xgboostLatency': latency(lambda row: booster.inplace_predict(row.reshape(1, -1)), sample),
+            'packedLatency': latency(lambda row: predict_proba_packed(packed, row), sample)
+        },
+        'memory': {
+            'xgboost': peak_memory('xgboost', args.model, X),
+            'packed': peak_memory('packed', args.compact, X)
+        }
+    }
+
+    node_rows = min(n, NODE_MAX_ROWS)
+    result['node'] = node_benchmark(reservations.head(node_rows), history.head(node_rows), args.compact)
+    return result
+
+
+def flatten(report, prefix=''):
+    """{'a': {'b': 1}} -> {'a.b': 1} for numeric leaves"""
+    flat = {}
+    for key, value in report.items():
+        name = f'{prefix}{key}'
+        if isinstance(value, dict):
+            flat.update(flatten(value, f'{name}.'))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+def find_regressions(report, baseline, threshold=REGRESSION_THRESHOLD):
+    """Metrics that got worse than the baseline by more than `threshold` (relative)"""
+    current = flatten(report['results'])
+    previous = flatten(baseline['results'])
+
+    regressions = []
+    for name, value in current.items():
+        old = previous.get(name)
+        direction = next((higher for suffix, higher in METRIC_DIRECTIONS.items() if name.endswith(suffix)), None)
+        if old is None or direction is None or old == 0:
+            continue
+
+        change = (value - old) / abs(old)
+        if (change < -threshold) if direction else (change > threshold):
+            regressions.append({'metric': name, 'baseline': old, 'current': value, 'change': change})
+    return regressions
+
+
+def environment():
+    import xgboost as xgb
+
+    def command_output(cmd):
+        try:
+            return subprocess.run(cmd, capture_output=True, text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    return {
+        'commit': command_output(['git', 'rev-parse', '--short', 'HEAD']),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'xgboost': xgb.__version__,
+        'node': command_output(['node', '--version'])
+    }
+
+
+def write_report(report, output_file):
+    tmp_file = output_file + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(report, f, indent=2)
+    os.replace(tmp_file, output_file)
+
+
+def print_scale(result):
+    py = result['python']
+    print(f"\n{result['rows']:,} reservations")
+    print(f"   Features (python):   {py['featureRowsPerSec']:>14,.0f} rows/s")
+    print(f"   XGBoost batch:       {py['xgboostRowsPerSec']:>14,.0f} rows/s   "
+          f"single p50 {py['xgboostLatency']['p50Us']:.0f} us, p99 {py['xgboostLatency']['p99Us']:.0f} us")
+    print(f"   Packed batch:        {py['packedRowsPerSec']:>14,.0f} rows/s   "
+          f"single p50 {py['packedLatency']['p50Us']:.0f} us, p99 {py['packedLatency']['p99Us']:.0f} us")
+
+    memory = result['memory']
+    print(f"   Memory (load/peak):  xgboost {memory['xgboost']['loadMb']:.0f}/{memory['xgboost']['peakMb']:.0f} MB, "
+          f"packed {memory['packed']['loadMb']:.0f}/{memory['packed']['peakMb']:.0f} MB")
+
+    js = result['node']
+    if js:
+        print(f"   Node ({js['rows']:,} rows, {js['scoring']}):")
+        print(f"      extractAllFeatures {js['extractRowsPerSec']:>12,.0f} rows/s   "
+              f"p50 {js['extractLatency']['p50Us']:.1f} us, p99 {js['extractLatency']['p99Us']:.1f} us")
+        print(f"      predictPackedTrees {js['scoreRowsPerSec']:>12,.0f} rows/s   "
+              f"p50 {js['scoreLatency']['p50Us']:.1f} us, p99 {js['scoreLatency']['p99Us']:.1f} us")
+        print(f"      predictNoShow      {js['predictNoShowRowsPerSec']:>12,.0f} rows/s   "
+              f"p50 {js['predictNoShowLatency']['p50Us']:.1f} us, p99 {js['predictNoShowLatency']['p99Us']:.1f} us")
+        print(f"      RSS load/peak: {js['loadMb']:.0f}/{js['peakMb']:.0f} MB")
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark feature extraction and no-show scoring')
+    parser.add_argument('--scales', default=','.join(str(s) for s in SCALES), help='Comma-separated row counts')
+    parser.add_argument('--source', default=SOURCE_FILE, help='CSV the synthetic reservations are sampled from')
+    parser.add_argument('--model', default=MODEL_FILE, help='Full XGBoost booster (JSON)')
+    parser.add_argument('--metadata', default=METADATA_FILE, help='Metadata with the booster feature order')
+    parser.add_argument('--compact', default=COMPACT_FILE, help='Packed tree export (JS module)')
+    parser.add_argument('--output', default=REPORT_FILE, help='JSON report to write')
+    parser.add_argument('--baseline', default=None, help='Previous report to compare against')
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD, help='Relative change counted as a regression')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("NO-SHOW PIPELINE BENCHMARK")
+    print("=" * 80)
+
+    booster = load_booster(args.model)
+    feature_names = load_feature_names(args.metadata)
+    packed, compact_info = load_js_module(args.compact)
+    if compact_info['featureNames'] != feature_names:
+        print(f"\nWARNING: {args.compact} feature order differs from {args.metadata}")
+
+    now = pd.Timestamp(datetime.now(timezone.utc).replace(tzinfo=None)).floor('s')
+
+    report = {
+        'generatedAt': datetime.now(timezone.utc).isoformat(),
+        'environment': environment(),
+        'models': {
+            'xgboost': {'file': args.model, 'trees': booster.num_boosted_rounds(), 'sizeBytes': os.path.getsize(args.model)},
+            'packed': {'file': args.compact, 'trees': compact_info['numTrees'], 'nodes': compact_info['numNodes'],
+                       'sizeBytes': os.path.getsize(args.compact)}
+        },
+        'results': {}
+    }
+    print(f"\nXGBoost: {report['models']['xgboost']['trees']} trees ({report['models']['xgboost']['sizeBytes'] / 1024:.0f} KB)")
+    print(f"Packed:  {compact_info['numTrees']} trees ({report['models']['packed']['sizeBytes'] / 1024:.0f} KB)")
+
+    for n in [int(s) for s in args.scales.split(',')]:
+        result = run_scale(n, now, booster, packed, feature_names, args)
+        report['results'][str(n)] = result
+        print_scale(result)
+
+    write_report(report, args.output)
+    print(f"\nReport written: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+
+        regressions = find_regressions(report, baseline, args.threshold)
+        report['regressions'] = regressions
+        write_report(report, args.output)
+
+        print(f"\nCompared with {args.baseline} (commit {baseline['environment'].get('commit')}):")
+        if regressions:
+            for r in regressions:
+                print(f"   REGRESSION {r['metric']}: {r['baseline']:,.2f} -> {r['current']:,.2f} ({r['change']:+.0%})")
+            print("=" * 80)
+            sys.exit(1)
+        print(f"   No regressions beyond {args.threshold:.0%}")
+
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,325 @@
+"""
+No-Show Probability Calibration
+
+calculateRiskLevel in api/ml/predict.js buckets probabilities at fixed
+0.25 / 0.50 / 0.75 cutoffs. The v2 model learned hotel cancellations (37% base
+rate), so its raw probabilities do not match how often our guests actually no-show
+and the buckets are off. This script scores every resolved reservation in
+restaurant_training_data.csv with the live model (the packed trees in
+api/ml/model-trees.js, the same arrays the API evaluates). It then fits a
+monotone map from raw to observed probability:
+
+    isotonic   pool-adjacent-violators step fit (needs ISOTONIC_MIN_SAMPLES)
+    platt      logistic fit on the raw log-odds (smooth, fine for small samples)
+
+The map is exported to api/ml/calibration.js as knot arrays x (raw) and y
+(calibrated). predict.js interpolates linearly between knots, located by
+binary search, so calibration costs O(log knots) per prediction instead of
+another model call.
+
+Outcomes are split by reservation_id hash: the calibrator is fitted on one part
+and the reliability table / ECE before and after are measured on the other.
+The exported calibrator is then refitted on all outcomes. If the live model is
+the custom one, only reservations in retrain_custom_model.py's holdout are
+used - the rest were training data and would look better calibrated than they are.
+
+Usage:
+    python calibrate.py                      # isotonic with enough outcomes, else Platt
+    python calibrate.py --method platt --bins 15
+    python calibrate.py --force              # write even if ECE does not improve
+"""
+
+import sys
+import io
+if __name__ == '__main__':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+import argparse
+import json
+import os
+import zlib
+from datetime import datetime
+
+import numpy as np
+
+TREES_FILE = '../api/ml/model-trees.js'
+OUTPUT_FILE = '../api/ml/calibration.js'
+REPORT_FILE = 'calibration_report.json'
+
+CALIBRATION_FORMAT = 'calibration-v1'
+
+CUSTOM_MODEL_FILE = 'no_show_model_v3_custom.json'
+
+# retrain_custom_model.py holds out crc32(reservation_id) % 100 < 20 (< 15 on
+# small tables) - buckets below 15 are unseen by the custom model either way
+CUSTOM_HOLDOUT_BUCKETS = 15
+
+# Share of outcomes kept back to measure calibration before / after
+EVAL_PERCENT = 30
+
+MIN_SAMPLES = 100
+ISOTONIC_MIN_SAMPLES = 1000
+PLATT_KNOTS = 33
+N_BINS = 10
+
+RESOLVED_OUTCOMES = ['showed_up', 'no_show', 'cancelled']
+
+
+# ============================================================================
+# DATA
+# ============================================================================
+
+def _buckets(reservation_ids, salt=b''):
+    return np.array([zlib.crc32(salt + str(r).encode()) % 100 for r in reservation_ids])
+
+
+def live_model_scores(table, trees_file=TREES_FILE):
+    """
+    Raw live-model probability and outcome (1 = no-show or cancelled) for every
+    resolved reservation, with features built exactly as features.js builds them.
+
+    Returns (probability, y, reservation_ids, tree_metadata).
+    """
+    from customer_features import point_in_time_history
+    from export_model import load_js_module, predict_proba_packed
+    from reservation_features import build_features, reservation_frame
+    from slot_stats import load_lookup_tables
+
+    packed, tree_metadata = load_js_module(trees_file)
+
+    history, history_as_of = point_in_time_history(table)
+    resolved = table['actual_outcome'].isin(RESOLVED_OUTCOMES).to_numpy()
+    if os.path.basename(tree_metadata.get('sourceModel', '')) == CUSTOM_MODEL_FILE:
+        resolved &= _buckets(table['reservation_id']) < CUSTOM_HOLDOUT_BUCKETS
+
+    rows = table[resolved]
+    features = build_features(
+        reservation_frame(rows),
+        history.loc[rows.index],
+        load_lookup_tables(),
+        now=history_as_of.loc[rows.index]
+    )
+
+    X = features[tree_metadata['featureNames']].to_numpy(dtype=np.float32)
+    y = (rows['actual_outcome'] != 'showed_up').to_numpy().astype(int)
+    return predict_proba_packed(packed, X), y, rows['reservation_id'].to_numpy(), tree_metadata
+
+
+# ============================================================================
+# FITTING
+# ============================================================================
+
+def fit_isotonic(probability, y):
+    """Knots of a non-decreasing step fit (flat beyond the outermost knots)"""
+    from sklearn.isotonic import IsotonicRegression
+
+    iso = IsotonicRegression(y_min=0.0, y_max=1.0, increasing=True, out_of_bounds='clip')
+    iso.fit(probability, y)
+    return iso.X_thresholds_, iso.y_thresholds_
+
+
+def fit_platt(probability, y, n_knots=PLATT_KNOTS):
+    """Sigmoid of a linear fit on the log-odds, sampled at score quantiles"""
+    from sklearn.linear_model import LogisticRegression
+
+    p = np.clip(probability, 1e-6, 1 - 1e-6)
+    logit = np.log(p / (1 - p)).reshape(-1, 1)
+    platt = LogisticRegression(C=1e6).fit(logit, y)
+
+    x = np.unique(np.concatenate([[0.0, 1.0], np.quantile(probability, np.linspace(0, 1, n_knots))]))
+    x_logit = np.log(np.clip(x, 1e-6, 1 - 1e-6) / (1 - np.clip(x, 1e-6, 1 - 1e-6)))
+    return x, platt.predict_proba(x_logit.reshape(-1, 1))[:, 1]
+
+
+def compact_knots(x, y, decimals=6):
+    """Rounded knots with duplicate x and redundant flat-run interior points dropped"""
+    x, y = np.round(x, decimals), np.round(y, decimals)
+    x, first = np.unique(x, return_index=True)
+    y = np.maximum.accumulate(y[first])  # rounding must not break monotonicity
+
+    # Inside a flat run only its two ends matter for linear interpolation
+    keep = np.ones(len(x), dtype=bool)
+    keep[1:-1] = ~((y[1:-1] == y[:-2]) & (y[1:-1] == y[2:]))
+    return x[keep], y[keep]
+
+
+def fit_calibrator(probability, y, method):
+    fit = fit_isotonic if method == 'isotonic' else fit_platt
+    x, calibrated = compact_knots(*fit(probability, y))
+    return {'x': x.tolist(), 'y': calibrated.tolist()}
+
+
+def apply_calibration(calibration, probability):
+    """Linear interpolation between knots, clamped at the ends (what predict.js computes)"""
+    return np.interp(probability, calibration['x'], calibration['y'])
+
+
+def load_calibration(module_file=OUTPUT_FILE):
+    """Calibration written by this script (None if it does not exist)"""
+    if not os.path.exists(module_file):
+        return None
+
+    with open(module_file, 'r') as f:
+        text = f.read()
+
+    payload = json.loads(text[text.index('module.exports = ') + len('module.exports = '):].rstrip().rstrip(';'))
+    if payload.get('format') != CALIBRATION_FORMAT:
+        raise ValueError(f"{module_file}: unsupported format {payload.get('format')!r}")
+    return payload
+
+
+# ============================================================================
+# RELIABILITY
+# ============================================================================
+
+def reliability(probability, y, n_bins=N_BINS):
+    """Equal-width reliability table and expected calibration error"""
+    bins = np.minimum((probability * n_bins).astype(int), n_bins - 1)
+    counts = np.bincount(bins, minlength=n_bins)
+    predicted = np.bincount(bins, weights=probability, minlength=n_bins)
+    observed = np.bincount(bins, weights=y, minlength=n_bins)
+
+    table = []
+    for b in np.flatnonzero(counts):
+        table.append({
+            'bin': f"{b / n_bins:.2f}-{(b + 1) / n_bins:.2f}",
+            'count': int(counts[b]),
+            'meanPredicted': round(float(predicted[b] / counts[b]), 4),
+            'observedRate': round(float(observed[b] / counts[b]), 4)
+        })
+
+    ece = sum(row['count'] * abs(row['meanPredicted'] - row['observedRate']) for row in table) / len(probability)
+    return {'ece': round(float(ece), 4), 'bins': table}
+
+
+def print_reliability(title, result):
+    print(f"\n{title} (ECE {result['ece']:.4f})")
+    print(f"   {'bin':<11} {'count':>7} {'predicted':>10} {'observed':>9}")
+    for row in result['bins']:
+        print(f"   {row['bin']:<11} {row['count']:>7,} {row['meanPredicted']:>10.3f} {row['observedRate']:>9.3f}")
+
+
+def risk_level_counts(probability):
+    """Reservations per calculateRiskLevel bucket"""
+    from batch_score import RISK_LEVELS, RISK_THRESHOLDS
+
+    levels = RISK_LEVELS[np.searchsorted(RISK_THRESHOLDS, probability, side='right')]
+    return {level: int((levels == level).sum()) for level in RISK_LEVELS}
+
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def write_js_module(payload, output_file=OUTPUT_FILE):
+    module_js = f"""/**
+ * No-Show Probability Calibration (Inline for Serverless Compatibility)
+ *
+ * GENERATED by ml-training-data/calibrate.py - do not edit by hand.
+ *
+ * Monotone piecewise-linear map from the model's raw probability (x) to the
+ * observed no-show rate (y), applied in predict.js before calculateRiskLevel.
+ * Only valid for the model export it was fitted on (modelExportedAt).
+ *
+ * Method: {payload['method']} ({len(payload['x'])} knots, {payload['samples']} outcomes)
+ * ECE: {payload['ece']['before']:.4f} -> {payload['ece']['after']:.4f}
+ */
+
+module.exports = {json.dumps(payload)};
+"""
+
+    tmp_file = output_file + '.tmp'
+    with open(tmp_file, 'w') as f:
+        f.write(module_js)
+    os.replace(tmp_file, output_file)
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Fit and export a probability calibrator for the live no-show model')
+    parser.add_argument('--method', choices=['auto', 'isotonic', 'platt'], default='auto',
+                        help=f'auto: isotonic with {ISOTONIC_MIN_SAMPLES}+ outcomes, else Platt')
+    parser.add_argument('--bins', type=int, default=N_BINS, help='Reliability table bins')
+    parser.add_argument('--trees', default=TREES_FILE, help='Packed trees of the live model')
+    parser.add_argument('--output', default=OUTPUT_FILE, help='JS module for the API')
+    parser.add_argument('--report', default=REPORT_FILE, help='Reliability report (JSON)')
+    parser.add_argument('--force', action='store_true', help='Write the calibrator even if ECE does not improve')
+    args = parser.parse_args()
+
+    from training_log import load_training_table
+
+    print("=" * 80)
+    print("NO-SHOW PROBABILITY CALIBRATION")
+    print("=" * 80)
+
+    probability, y, reservation_ids, tree_metadata = live_model_scores(load_training_table(), args.trees)
+    print(f"\nModel: {tree_metadata['sourceModel']} (v{tree_metadata['version']}, exported {tree_metadata['exportedAt']})")
+    print(f"Outcomes: {len(y):,} ({y.mean() if len(y) else 0:.1%} no-show) - mean raw prediction {probability.mean() if len(y) else 0:.1%}")
+
+    if len(y) < MIN_SAMPLES or len(np.unique(y)) < 2:
+        print(f"\nNeed at least {MIN_SAMPLES} resolved reservations with both outcomes - nothing written")
+        sys.exit(1)
+
+    method = args.method
+    if method == 'auto':
+        method = 'isotonic' if len(y) >= ISOTONIC_MIN_SAMPLES else 'platt'
+
+    evaluate = _buckets(reservation_ids, salt=b'calibration:') < EVAL_PERCENT
+    fitted = fit_calibrator(probability[~evaluate], y[~evaluate], method)
+    before = reliability(probability[evaluate], y[evaluate], args.bins)
+    after = reliability(apply_calibration(fitted, probability[evaluate]), y[evaluate], args.bins)
+
+    print(f"\nMethod: {method} - fitted on {(~evaluate).sum():,}, evaluated on {evaluate.sum():,} held-out outcomes")
+    print_reliability("Before calibration", before)
+    print_reliability("After calibration", after)
+
+    calibration = fit_calibrator(probability, y, method)
+    calibrated = apply_calibration(calibration, probability)
+
+    report = {
+        'createdAt': datetime.now().isoformat(),
+        'method': method,
+        'model': {key: tree_metadata[key] for key in ['sourceModel', 'version', 'exportedAt']},
+        'samples': {'fit': int((~evaluate).sum()), 'evaluate': int(evaluate.sum()), 'export': int(len(y))},
+        'observedRate': round(float(y.mean()), 4),
+        'before': before,
+        'after': after,
+        'riskLevels': {'raw': risk_level_counts(probability), 'calibrated': risk_level_counts(calibrated)}
+    }
+
+    tmp_file = args.report + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(report, f, indent=2)
+    os.replace(tmp_file, args.report)
+
+    print("\nRisk levels (all outcomes):")
+    for level in report['riskLevels']['raw']:
+        print(f"   - {level}: {report['riskLevels']['raw'][level]:,} -> {report['riskLevels']['calibrated'][level]:,}")
+    print(f"\nReport written: {args.report}")
+
+    if after['ece'] >= before['ece'] and not args.force:
+        print(f"\nECE did not improve ({before['ece']:.4f} -> {after['ece']:.4f}) - {args.output} NOT written (use --force)")
+        sys.exit(1)
+
+    write_js_module({
+        'format': CALIBRATION_FORMAT,
+        'method': method,
+        'fittedAt': datetime.now().isoformat(),
+        'sourceModel': tree_metadata['sourceModel'],
+        'modelVersion': tree_metadata['version'],
+        'modelExportedAt': tree_metadata['exportedAt'],
+        'samples': int(len(y)),
+        'observedRate': report['observedRate'],
+        'ece': {'before': before['ece'], 'after': after['ece']},
+        **calibration
+    }, args.output)
+
+    print(f"API module written: {args.output} ({len(calibration['x'])} knots)")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+"""
+Chunked CSV Ingestion for Out-of-Core Training
+
+pd.read_csv on the whole reservation log, plus the float64 copies the training
+scripts make of it, stops fitting in memory long before XGBoost does. This
+module reads a CSV in fixed-size chunks with compact dtypes and feeds the
+engineered chunks to XGBoost through a DataIter, so a QuantileDMatrix is built
+without the full dataset (raw or engineered) ever being in memory at once.
+
+QuantileDMatrix walks the iterator several times (sketching, then copying the
+binned data). Engineering features on every pass would repeat the slowest
+step, so the first pass spills each finished (X, y) chunk to .npy files and
+later passes memory-map them back: peak memory stays bounded by the chunk
+size, disk usage is the float32 feature matrix.
+
+Usage (from a training script):
+    def chunks():
+        for raw in read_chunks('hotel_bookings.csv', HOTEL_DTYPES, chunk_rows=250_000):
+            yield build_X(raw), build_y(raw)
+
+    with tempfile.TemporaryDirectory() as spill_dir:
+        iterator = ChunkIterator(chunks, spill_dir)
+        dtrain = xgb.QuantileDMatrix(iterator)
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import xgboost as xgb
+
+DEFAULT_CHUNK_ROWS = 250_000
+
+
+# ============================================================================
+# CSV CHUNKS
+# ============================================================================
+
+def read_chunks(csv_file, dtypes, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Yield DataFrames of at most chunk_rows rows, reading only the columns in
+    `dtypes` and parsing them straight into those dtypes (no float64/object
+    intermediate for the whole file).
+    """
+    yield from pd.read_csv(csv_file, usecols=list(dtypes), dtype=dtypes, chunksize=chunk_rows)
+
+
+def holdout_mask(n_rows, chunk_index, test_size, seed):
+    """
+    Random holdout membership for one chunk.
+
+    Seeded by (seed, chunk_index), so every pass over the file puts the same
+    rows in the same split without materializing a split for the whole dataset.
+    """
+    rng = np.random.default_rng([seed, chunk_index])
+    return rng.random(n_rows) < test_size
+
+
+# ============================================================================
+# XGBOOST ITERATOR
+# ============================================================================
+
+class ChunkIterator(xgb.DataIter):
+    """
+    Feed (X, y) chunks to a DMatrix / QuantileDMatrix.
+
+    make_chunks is called once and must return an iterable of (X, y) pairs.
+    Each chunk is spilled to spill_dir on that first pass and memory-mapped on
+    every later pass. rows / positives count the rows fed, for reporting.
+    """
+
+    def __init__(self, make_chunks, spill_dir):
+        self._make_chunks = make_chunks
+        self._spill_dir = spill_dir
+        self._source = None
+        self._spilled = 0
+        self._complete = False
+        self._index = 0
+        self.rows = 0
+        self.positives = 0
+        super().__init__()
+
+    def _paths(self, index):
+        return (os.path.join(self._spill_dir, f'chunk-{index:05d}.X.npy'),
+                os.path.join(self._spill_dir, f'chunk-{index:05d}.y.npy'))
+
+    def _next_chunk(self):
+        if self._complete:
+            if self._index == self._spilled:
+                return None
+            x_path, y_path = self._paths(self._index)
+            return np.load(x_path, mmap_mode='r'), np.load(y_path, mmap_mode='r')
+
+        if self._source is None:
+            self._source = iter(self._make_chunks())
+
+        chunk = next(self._source, None)
+        if chunk is None:
+            self._complete = True
+            self._source = None
+            return None
+
+        X = np.ascontiguousarray(chunk[0], dtype=np.float32)
+        y = np.ascontiguousarray(chunk[1], dtype=np.float32)
+        x_path, y_path = self._paths(self._spilled)
+        np.save(x_path, X)
+        np.save(y_path, y)
+        self._spilled += 1
+        self.rows += len(y)
+        self.positives += int(y.sum())
+        return X, y
+
+    def next(self, input_data):
+        chunk = self._next_chunk()
+        if chunk is None:
+            return False
+
+        X, y = chunk
+        input_data(data=X, label=y)
+        self._index += 1
+        return True
+
+    def reset(self):
+        # A reset before the first pass finished means XGBoost stopped early:
+        # drop the partial spill and start the source over
+        if not self._complete:
+            self._source = None
+            self._spilled = 0
+            self.rows = 0
+            self.positives = 0
+        self._index = 0
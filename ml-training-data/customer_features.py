@@ -0,0 +1,293 @@
+"""
+Customer History Aggregation (Snapshot + Point-in-Time Features)
+
+Builds every per-customer feature the model uses - visit count, no-show rate,
+average party size, days since last visit - for all customers in one
+vectorized groupby over the compacted reservation table
+(restaurant_training_data.csv).
+
+Lifetime value is not available yet: the training log records no spend, so
+Total Spend is written as 0 (what features.js falls back to without it).
+
+Two outputs, one set of definitions:
+  - customer_snapshot.csv + api/ml/customer-snapshot.js: history as of now, one
+    row per customer, in Customer History field names. The API looks customers
+    up here (keyed by a hash of email/phone) instead of querying Airtable.
+  - point_in_time_history(): the same aggregates as of each reservation (only
+    reservations before it count), used by retrain_custom_model.py so training
+    never sees a customer's own future outcomes.
+
+Feature fallbacks (0.15 no-show rate, 2.5 party size, 999 days) match
+api/ml/features.js.
+
+Usage:
+    python customer_features.py                  # write the snapshot (CSV + JS module)
+    python customer_features.py --skip-js        # CSV only
+"""
+
+import sys
+import io
+if __name__ == '__main__':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+import argparse
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from training_log import load_training_table
+
+SNAPSHOT_FILE = 'customer_snapshot.csv'
+SNAPSHOT_JS_FILE = '../api/ml/customer-snapshot.js'
+
+# Defaults for customers with no usable history (same as api/ml/features.js)
+DEFAULT_NO_SHOW_RATE = 0.15
+DEFAULT_AVG_PARTY_SIZE = 2.5
+DEFAULT_DAYS_SINCE_LAST_VISIT = 999
+
+# Snapshot columns, in Customer History field names (what features.js reads)
+SNAPSHOT_FIELDS = [
+    'Total Reservations',
+    'Completed Reservations',
+    'No Shows',
+    'Cancellations',
+    'Average Party Size',
+    'No Show Risk Score',
+    'First Visit Date',
+    'Last Visit Date',
+    'Total Spend'
+]
+
+# Features of a customer with no history (or no email/phone to key on)
+NEW_CUSTOMER_FEATURES = {
+    'is_repeat_customer': 0,
+    'customer_visit_count': 0,
+    'customer_no_show_rate': DEFAULT_NO_SHOW_RATE,
+    'customer_avg_party_size': DEFAULT_AVG_PARTY_SIZE,
+    'days_since_last_visit': DEFAULT_DAYS_SINCE_LAST_VISIT,
+    'customer_lifetime_value': 0
+}
+
+
+# ============================================================================
+# CUSTOMER KEYS
+# ============================================================================
+
+def customer_keys(df):
+    """
+    Normalized customer identity: lower-cased email, else the phone number with
+    spaces/dashes/parentheses removed (same normalization as customer-history.js).
+    """
+    email = df['customer_email'].fillna('').astype(str).str.strip().str.lower()
+    phone = 'tel:' + df['customer_phone'].fillna('').astype(str).str.replace(r'[\s\-\(\)]', '', regex=True)
+    key = email.where(email != '', phone)
+    return key.where(key != 'tel:', '')
+
+
+def hash_key(key):
+    """Snapshot lookup key - the JS module never contains raw emails or phone numbers"""
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]
+
+
+# ============================================================================
+# AGGREGATION
+# ============================================================================
+
+def _prepare(table):
+    """Per-reservation indicator columns shared by both aggregations"""
+    df = pd.DataFrame({
+        'key': customer_keys(table),
+        'date': pd.to_datetime(table['reservation_date'], errors='coerce'),
+        'created_at': pd.to_datetime(table['created_at'], errors='coerce', utc=True, format='ISO8601'),
+        'party_size': pd.to_numeric(table['party_size'], errors='coerce').fillna(0).astype('float64')
+    }, index=table.index)
+
+    outcome = table['actual_outcome'].astype(str)
+    df['completed'] = (outcome == 'showed_up').astype('int32')
+    df['no_show'] = (outcome == 'no_show').astype('int32')
+    df['cancelled'] = (outcome == 'cancelled').astype('int32')
+    df['completed_party'] = df['party_size'] * df['completed']
+    df['visit_date'] = df['date'].where(df['completed'] == 1)
+
+    return df[df['key'] != '']
+
+
+def build_customer_snapshot(table):
+    """One row per customer, aggregated over every logged reservation"""
+    df = _prepare(table)
+
+    snapshot = df.groupby('key', sort=False).agg(
+        total=('key', 'size'),
+        completed=('completed', 'sum'),
+        no_shows=('no_show', 'sum'),
+        cancellations=('cancelled', 'sum'),
+        completed_party=('completed_party', 'sum'),
+        first_date=('date', 'min'),
+        last_visit=('visit_date', 'max')
+    )
+
+    avg_party = (snapshot['completed_party'] / snapshot['completed'].replace(0, np.nan)).fillna(0.0)
+
+    snapshot = pd.DataFrame({
+        'Total Reservations': snapshot['total'],
+        'Completed Reservations': snapshot['completed'],
+        'No Shows': snapshot['no_shows'],
+        'Cancellations': snapshot['cancellations'],
+        'Average Party Size': avg_party.round(1),
+        'No Show Risk Score': (snapshot['no_shows'] / snapshot['total']).round(3),
+        'First Visit Date': snapshot['first_date'].dt.strftime('%Y-%m-%d'),
+        'Last Visit Date': snapshot['last_visit'].dt.strftime('%Y-%m-%d'),
+        'Total Spend': 0.0   # spend is not logged yet
+    })
+
+    snapshot.index.name = 'customer_key'
+    return snapshot
+
+
+def history_to_features(history, reference_dates):
+    """
+    Model features from history columns (Customer History field names), with
+    the same fallbacks as the calculateCustomer* functions in features.js.
+    """
+    completed = history['Completed Reservations'].fillna(0)
+    no_show_rate = history['No Show Risk Score'].fillna(0)
+    avg_party = history['Average Party Size'].fillna(0)
+    raw_last_visit = history['Last Visit Date']
+    last_visit = pd.to_datetime(raw_last_visit, errors='coerce', utc=True, format='ISO8601').dt.tz_localize(None)
+
+    days = (reference_dates - last_visit).dt.days.clip(lower=0)
+    # A date that is present but unparseable gives NaN in features.js, which extractAllFeatures turns into 0
+    days = days.where(last_visit.notna() | raw_last_visit.isna() | (raw_last_visit.astype(str) == ''), 0)
+
+    return pd.DataFrame({
+        'is_repeat_customer': (completed > 0).astype('int8'),
+        'customer_visit_count': completed.astype('int32'),
+        # features.js uses `|| default`, so a rate/size of exactly 0 also falls back
+        'customer_no_show_rate': no_show_rate.where(no_show_rate > 0, DEFAULT_NO_SHOW_RATE).astype('float32'),
+        'customer_avg_party_size': avg_party.where(avg_party > 0, DEFAULT_AVG_PARTY_SIZE).astype('float32'),
+        'days_since_last_visit': days.fillna(DEFAULT_DAYS_SINCE_LAST_VISIT).astype('float32'),
+        'customer_lifetime_value': history['Total Spend'].fillna(0).astype('float32')
+    }, index=history.index)
+
+
+def point_in_time_history(table):
+    """
+    Customer History fields as of each reservation: each row only sees the
+    customer's earlier reservations (ordered by reservation date, then
+    creation time). Returns (history, reference_dates), aligned with the
+    table; rows without an email/phone get an empty history.
+
+    Running sums per customer are a single cumsum over the sorted table, so
+    this is one pass regardless of how many reservations each customer has.
+    """
+    df = _prepare(table).sort_values(['key', 'date', 'created_at'], kind='stable')
+    groups = df.groupby('key', sort=False)
+
+    def before(column):
+        # Cumulative sum excluding the current row
+        return groups[column].cumsum() - df[column]
+
+    prior_total = groups.cumcount()
+    prior_completed = before('completed')
+    prior_party = before('completed_party')
+
+    history = pd.DataFrame({
+        'Completed Reservations': prior_completed,
+        'No Show Risk Score': (before('no_show') / prior_total.replace(0, np.nan)).round(3),
+        'Average Party Size': (prior_party / prior_completed.replace(0, np.nan)).round(1),
+        # Most recent completed visit strictly before this reservation
+        'Last Visit Date': groups['visit_date'].shift().groupby(df['key']).ffill(),
+        'Total Spend': 0.0   # spend is not logged yet
+    }, index=df.index)
+
+    reference_dates = pd.to_datetime(table['reservation_date'], errors='coerce')
+    return history.reindex(index=table.index, columns=SNAPSHOT_FIELDS), reference_dates
+
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def write_snapshot_csv(snapshot, output_file=SNAPSHOT_FILE):
+    tmp_file = output_file + '.tmp'
+    snapshot.to_csv(tmp_file)
+    os.replace(tmp_file, output_file)
+
+
+def write_snapshot_js(snapshot, output_file=SNAPSHOT_JS_FILE):
+    """
+    Columnar CommonJS module for api/_lib/customer-history.js:
+    customers[hash] = [value per SNAPSHOT_FIELDS column]
+    """
+    rows = snapshot[SNAPSHOT_FIELDS].astype(object).where(snapshot[SNAPSHOT_FIELDS].notna(), None)
+    customers = {hash_key(key): list(values) for key, values in zip(rows.index, rows.itertuples(index=False))}
+
+    payload = {
+        'generatedAt': datetime.now(timezone.utc).isoformat(),
+        'fields': SNAPSHOT_FIELDS,
+        'numCustomers': len(customers),
+        'customers': customers
+    }
+
+    module_js = f"""/**
+ * Customer History Snapshot (Inline for Serverless Compatibility)
+ *
+ * GENERATED by ml-training-data/customer_features.py - do not edit by hand.
+ *
+ * customers[key] holds one value per entry of `fields` (Customer History field
+ * names). key = first 16 hex chars of sha256(lower-cased email, or 'tel:' + phone).
+ *
+ * Customers: {len(customers)}
+ */
+
+module.exports = {json.dumps(payload, default=lambda v: v.item() if hasattr(v, 'item') else str(v))};
+"""
+
+    tmp_file = output_file + '.tmp'
+    with open(tmp_file, 'w') as f:
+        f.write(module_js)
+    os.replace(tmp_file, output_file)
+
+    return len(module_js.encode('utf-8'))
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Aggregate per-customer history into a snapshot table')
+    parser.add_argument('--output', default=SNAPSHOT_FILE, help='Snapshot CSV to write')
+    parser.add_argument('--js-output', default=SNAPSHOT_JS_FILE, help='JS module for the API')
+    parser.add_argument('--skip-js', action='store_true', help='Only write the CSV')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("CUSTOMER HISTORY SNAPSHOT")
+    print("=" * 80)
+
+    table = load_training_table()
+    print(f"\nReservations: {len(table):,}")
+
+    snapshot = build_customer_snapshot(table)
+    print(f"Customers: {len(snapshot):,}")
+    if len(snapshot):
+        print(f"   Repeat customers: {(snapshot['Completed Reservations'] > 0).sum():,}")
+        print(f"   With a no-show: {(snapshot['No Shows'] > 0).sum():,}")
+
+    write_snapshot_csv(snapshot, args.output)
+    print(f"\nSnapshot written: {args.output}")
+
+    if not args.skip_js:
+        size_bytes = write_snapshot_js(snapshot, args.js_output)
+        print(f"API module written: {args.js_output} ({size_bytes / 1024:.0f} KB)")
+
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
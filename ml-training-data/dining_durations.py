@@ -0,0 +1,372 @@
+"""
+Learned Dining Durations by Party Size, Weekday and Hour
+
+getDiningDuration in api/_lib/availability-calculator.js blocks a table for a
+fixed 90 / 120 / 150 minutes by party size. Every overlap check in
+checkTimeSlotAvailability and getSuggestedTimes is built on that number, and
+real turn times vary a lot. A two-top at a weekday 17:00 seating leaves well
+before 90 minutes, so we turn away bookings we could seat.
+
+This script fits the DURATION_QUANTILE of completed dining times (Seated At ->
+Departed At) per (party size, day of week, hour) with one groupby/quantile
+pass. Sparse cells are shrunk toward the coarser estimate:
+
+    fixed rule -> party size -> party size x hour -> party size x weekday x hour
+
+so a cell with few parties stays close to its parent. The result is exported
+as dense nested arrays in api/_lib/dining-durations.js:
+
+    byParty[p]                      minutes (p = party size - 1, capped at MAX_PARTY_SIZE)
+    byPartyHour[p][hour]            when the date is unknown
+    byPartyDayHour[p][day][hour]    day 0 = Sunday, like Date.getDay()
+
+getDiningDuration is therefore still a constant-time index.
+
+Backtest: fit on all but the last BACKTEST_FRACTION of nights and replay the
+held-out nights' parties in seating order through the capacity check under
+both rules. For each rule it shows covers admitted per night, how often a
+party outstays its planned block, and seat-minutes over capacity when admitted
+parties stay as long as they actually did. Only parties that were actually
+seated are replayed - turned-away demand is not logged - so the covers gain is
+a lower bound. The exported tables are refitted on every night.
+
+Usage:
+    python dining_durations.py                          # completed Service Records from Airtable
+    python dining_durations.py --from-table             # seated_at / completed_at in the training log
+    python dining_durations.py --quantile 0.9 --capacity 80
+    python dining_durations.py --backtest-fraction 0.3
+"""
+
+import sys
+import io
+if __name__ == '__main__':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+import argparse
+import json
+import os
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from reservation_features import js_day_of_week
+from slot_stats import DEFAULT_CAPACITY
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.join(BASE_DIR, '..', 'scripts')
+
+OUTPUT_FILE = '../api/_lib/dining-durations.js'
+REPORT_FILE = 'dining_durations_report.json'
+
+# Service Records store UTC; the availability check works in restaurant time
+RESTAURANT_TIMEZONE = 'Europe/Amsterdam'
+
+# Plan for the time 80% of parties are done by
+DURATION_QUANTILE = 0.8
+
+# Parties of a cell's parent estimate blended into every cell
+PRIOR_STRENGTH = 10.0
+
+MAX_PARTY_SIZE = 12
+DAYS = 7
+HOURS = 24
+
+# Durations outside this range are data errors (never departed, double taps)
+MIN_MINUTES = 15
+MAX_MINUTES = 360
+
+BACKTEST_FRACTION = 0.25
+
+SERVICE_FIELDS = ['Party Size', 'Seated At', 'Departed At', 'Status']
+
+
+# ============================================================================
+# DURATION FRAME
+# ============================================================================
+
+def _minutes_between(seated_at, departed_at):
+    seated = pd.to_datetime(seated_at, utc=True, errors='coerce', format='ISO8601')
+    departed = pd.to_datetime(departed_at, utc=True, errors='coerce', format='ISO8601')
+    return (departed - seated).dt.total_seconds() / 60
+
+
+def duration_frame(start, minutes, party_size):
+    """
+    One row per completed party: local date, JS day of week, hour and minute of
+    day it started, party size and minutes at the table.
+    """
+    frame = pd.DataFrame({
+        'date': start.dt.normalize(),
+        'dow': js_day_of_week(start),
+        'hour': start.dt.hour,
+        'start': start.dt.hour * 60 + start.dt.minute,
+        'party_size': pd.to_numeric(party_size, errors='coerce'),
+        'minutes': minutes
+    })
+
+    valid = frame.notna().all(axis=1) & (frame['party_size'] >= 1) & frame['minutes'].between(MIN_MINUTES, MAX_MINUTES)
+    frame = frame[valid].astype({'dow': int, 'hour': int, 'start': int, 'party_size': int})
+    return frame.sort_values(['date', 'start'], kind='stable').reset_index(drop=True)
+
+
+def table_durations(table):
+    """
+    Completed parties from the training log, keyed by reservation date and time
+    (local, and what the availability check is given)
+    """
+    start = pd.to_datetime(table['reservation_date'].astype(str) + ' ' + table['reservation_time'].astype(str),
+                           errors='coerce', format='mixed')
+    return duration_frame(start, _minutes_between(table['seated_at'], table['completed_at']), table['party_size'])
+
+
+def service_record_durations():
+    """Completed Service Records from Airtable (scripts/airtable_client.py)"""
+    sys.path.insert(0, SCRIPTS_DIR)
+    from airtable_client import AirtableClient, SERVICE_RECORDS_TABLE_ID, equals
+
+    records = AirtableClient().list_records(
+        SERVICE_RECORDS_TABLE_ID, filter_formula=equals('Status', 'Completed'), fields=SERVICE_FIELDS
+    )
+    fields = pd.DataFrame([r['fields'] for r in records], columns=SERVICE_FIELDS)
+
+    seated = pd.to_datetime(fields['Seated At'], utc=True, errors='coerce', format='ISO8601')
+    start = seated.dt.tz_convert(RESTAURANT_TIMEZONE).dt.tz_localize(None)
+    return duration_frame(start, _minutes_between(fields['Seated At'], fields['Departed At']), fields['Party Size'])
+
+
+# ============================================================================
+# FITTING
+# ============================================================================
+
+def fixed_duration(party_size):
+    """getDiningDuration's fixed rule, vectorized"""
+    party_size = np.asarray(party_size)
+    return np.select([party_size <= 2, party_size <= 6], [90, 120], default=150)
+
+
+def _party_index(party_size):
+    return np.clip(party_size, 1, MAX_PARTY_SIZE) - 1
+
+
+def _cell_quantiles(frame, keys, shape, quantile):
+    """Dense (quantile, count) arrays over the given key columns (NaN / 0 where empty)"""
+    grouped = frame.groupby(keys)['minutes']
+    values, counts = grouped.quantile(quantile), grouped.size()
+
+    cells = tuple(np.asarray(values.index.get_level_values(key)) for key in keys)
+    dense_values, dense_counts = np.full(shape, np.nan), np.zeros(shape)
+    dense_values[cells] = values.to_numpy()
+    dense_counts[cells] = counts.to_numpy()
+    return dense_values, dense_counts
+
+
+def _shrink(values, counts, parent, strength):
+    return np.where(counts > 0, (counts * np.nan_to_num(values) + strength * parent) / (counts + strength), parent)
+
+
+def fit_duration_tables(frame, quantile=DURATION_QUANTILE, strength=PRIOR_STRENGTH):
+    """byParty / byPartyHour / byPartyDayHour in whole minutes (rounded up)"""
+    frame = frame.assign(p=_party_index(frame['party_size']))
+    P = MAX_PARTY_SIZE
+
+    values, counts = _cell_quantiles(frame, ['p'], (P,), quantile)
+    by_party = _shrink(values, counts, fixed_duration(np.arange(1, P + 1)), strength)
+
+    values, counts = _cell_quantiles(frame, ['p', 'hour'], (P, HOURS), quantile)
+    by_party_hour = _shrink(values, counts, by_party[:, None], strength)
+
+    values, counts = _cell_quantiles(frame, ['p', 'dow', 'hour'], (P, DAYS, HOURS), quantile)
+    by_party_day_hour = _shrink(values, counts, by_party_hour[:, None, :], strength)
+
+    def minutes(table):
+        return np.ceil(table).astype(int)
+
+    return {
+        'byParty': minutes(by_party),
+        'byPartyHour': minutes(by_party_hour),
+        'byPartyDayHour': minutes(by_party_day_hour)
+    }
+
+
+def planned_durations(tables, frame):
+    """Learned block per party of the frame (what getDiningDuration returns with a date)"""
+    return tables['byPartyDayHour'][_party_index(frame['party_size'].to_numpy()), frame['dow'], frame['hour']]
+
+
+def load_duration_tables(module_file=OUTPUT_FILE):
+    """Tables exported by the last run (None if this script has not run)"""
+    if not os.path.exists(module_file):
+        return None
+
+    with open(module_file, 'r') as f:
+        text = f.read()
+
+    payload = json.loads(text[text.index('module.exports = ') + len('module.exports = '):].rstrip().rstrip(';'))
+    return {name: np.asarray(payload[name]) for name in ['byParty', 'byPartyHour', 'byPartyDayHour']}
+
+
+# ============================================================================
+# CAPACITY REPLAY
+# ============================================================================
+
+def replay(frame, planned, capacity):
+    """
+    Admit each night's parties in seating order while planned occupancy stays
+    within capacity (minute resolution); then measure the admitted parties'
+    actual occupancy.
+    """
+    horizon = HOURS * 60 + MAX_MINUTES
+    admitted = np.zeros(len(frame), dtype=bool)
+    over_seat_minutes = 0.0
+
+    starts, parties, actual = frame['start'].to_numpy(), frame['party_size'].to_numpy(), frame['minutes'].to_numpy()
+    for rows in frame.groupby('date').indices.values():
+        occupancy = np.zeros(horizon)
+        real = np.zeros(horizon)
+        for i in rows:
+            block = slice(starts[i], starts[i] + int(planned[i]))
+            if occupancy[block].max() + parties[i] <= capacity:
+                occupancy[block] += parties[i]
+                real[starts[i]:starts[i] + int(np.ceil(actual[i]))] += parties[i]
+                admitted[i] = True
+        over_seat_minutes += np.maximum(real - capacity, 0).sum()
+
+    nights = frame['date'].nunique()
+    return {
+        'coversPerNight': round(float(parties[admitted].sum() / nights), 1),
+        'partiesAdmitted': int(admitted.sum()),
+        'overrunRate': round(float((actual > planned).mean()), 3),
+        'overCapacitySeatMinutesPerNight': round(float(over_seat_minutes / nights), 1)
+    }
+
+
+def backtest(frame, capacity, fraction=BACKTEST_FRACTION, quantile=DURATION_QUANTILE, strength=PRIOR_STRENGTH):
+    """Fit on the earlier nights, replay the last `fraction` of them under both rules"""
+    nights = np.sort(frame['date'].unique())
+    cutoff = nights[int(len(nights) * (1 - fraction))]
+    train, test = frame[frame['date'] < cutoff], frame[frame['date'] >= cutoff].reset_index(drop=True)
+
+    tables = fit_duration_tables(train, quantile, strength)
+    fixed = replay(test, fixed_duration(test['party_size'].to_numpy()), capacity)
+    learned = replay(test, planned_durations(tables, test), capacity)
+    return {
+        'trainParties': int(len(train)),
+        'testParties': int(len(test)),
+        'testFrom': str(pd.Timestamp(cutoff).date()),
+        'testNights': int(test['date'].nunique()),
+        'fixed': fixed,
+        'learned': learned,
+        'coversGainPerNight': round(learned['coversPerNight'] - fixed['coversPerNight'], 1)
+    }
+
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def write_js_module(tables, info, output_file=OUTPUT_FILE):
+    payload = {
+        **info,
+        'maxPartySize': MAX_PARTY_SIZE,
+        **{name: table.tolist() for name, table in tables.items()}
+    }
+
+    module_js = f"""/**
+ * Learned Dining Durations (Inline for Serverless Compatibility)
+ *
+ * GENERATED by ml-training-data/dining_durations.py - do not edit by hand.
+ *
+ * Minutes a party is planned to hold its table: the p{round(info['quantile'] * 100)} of completed
+ * Service Records, indexed [party size - 1][day of week (0 = Sunday)][hour].
+ *
+ * Generated: {info['generatedAt']} ({info['samples']} completed parties)
+ */
+
+module.exports = {json.dumps(payload)};
+"""
+
+    tmp_file = output_file + '.tmp'
+    with open(tmp_file, 'w') as f:
+        f.write(module_js)
+    os.replace(tmp_file, output_file)
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Fit dining-duration quantiles for the availability check')
+    parser.add_argument('--from-table', action='store_true', help='Use seated_at / completed_at from the training log')
+    parser.add_argument('--quantile', type=float, default=DURATION_QUANTILE, help='Planned duration quantile')
+    parser.add_argument('--strength', type=float, default=PRIOR_STRENGTH, help='Shrinkage toward the parent cell')
+    parser.add_argument('--capacity', type=int, default=DEFAULT_CAPACITY, help='Restaurant capacity (seats) for the replay')
+    parser.add_argument('--backtest-fraction', type=float, default=BACKTEST_FRACTION,
+                        help='Share of the most recent nights held out for the replay')
+    parser.add_argument('--output', default=OUTPUT_FILE, help='JS module for the API')
+    parser.add_argument('--report', default=REPORT_FILE, help='Replay report (JSON)')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("DINING DURATION QUANTILES")
+    print("=" * 80)
+
+    if args.from_table:
+        from training_log import load_training_table
+        frame = table_durations(load_training_table())
+        source = 'training log'
+    else:
+        frame = service_record_durations()
+        source = 'Service Records'
+
+    n_nights = frame['date'].nunique()
+    print(f"\nCompleted parties: {len(frame):,} from {source} over {n_nights} night(s)")
+    if n_nights < 2:
+        print("Nothing to fit - need completed parties with Seated At and Departed At on 2+ nights")
+        sys.exit(1)
+
+    tables = fit_duration_tables(frame, args.quantile, args.strength)
+
+    print(f"\np{round(args.quantile * 100)} minutes by party size (fixed rule in brackets):")
+    observed = frame.groupby(_party_index(frame['party_size']))['minutes'].size()
+    for p in range(MAX_PARTY_SIZE):
+        if p in observed.index:
+            print(f"   {p + 1:>2}{'+' if p + 1 == MAX_PARTY_SIZE else ' '} {tables['byParty'][p]:>4} "
+                  f"[{int(fixed_duration(p + 1)):>3}]  ({observed[p]:,} parties)")
+
+    result = backtest(frame, args.capacity, args.backtest_fraction, args.quantile, args.strength)
+
+    print(f"\nBacktest: fitted on {result['trainParties']:,} parties, replayed {result['testNights']} held-out "
+          f"night(s) from {result['testFrom']}")
+    print(f"Replay at {args.capacity} seats ({'rule':<8} covers/night, outstays block, over-capacity seat-min/night):")
+    for name in ['fixed', 'learned']:
+        print(f"   {name:<8} {result[name]['coversPerNight']:>8.1f} {result[name]['overrunRate']:>15.1%} "
+              f"{result[name]['overCapacitySeatMinutesPerNight']:>12.1f}")
+    print(f"   Gain: {result['coversGainPerNight']:+.1f} seatable covers per night")
+
+    generated_at = datetime.now(timezone.utc).isoformat()
+    report = {
+        'createdAt': generated_at,
+        'source': source,
+        'quantile': args.quantile,
+        'capacity': args.capacity,
+        'samples': int(len(frame)),
+        'nights': int(n_nights),
+        'backtest': result
+    }
+
+    tmp_file = args.report + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(report, f, indent=2)
+    os.replace(tmp_file, args.report)
+
+    write_js_module(tables, {'generatedAt': generated_at, 'quantile': args.quantile, 'samples': int(len(frame))}, args.output)
+
+    print(f"\nReport written: {args.report}")
+    print(f"API module written: {args.output}")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
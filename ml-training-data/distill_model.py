@@ -0,0 +1,377 @@
+"""
+Distill the v2 No-Show Model into Smaller Students
+
+The v2 teacher (100 trees, depth 10) packs to ~1 MB of JS, which every cold
+start of the serverless function has to parse. This script trains progressively
+smaller students on the teacher's predict_proba outputs (soft labels) and
+measures, for each one:
+
+    - ROC-AUC on held-out true labels, and the loss vs. the teacher
+    - serialized size of the model-trees.js export
+    - per-prediction latency (p50/p99) in Node with api/ml/tree-evaluator.js
+      (Python reference evaluator when node is not installed)
+
+Students:
+    - XGBoost with few, shallow trees (depth <= 4), trained with reg:logistic
+      on the teacher's probabilities
+    - a binned logistic "scorecard": quantile bins per feature + logistic
+      regression, exported as one small tree per feature so the same packed
+      format and JS evaluator serve it
+
+Usage:
+    python distill_model.py                                  # report only
+    python distill_model.py --max-auc-loss 0.01 --export     # register + promote the fastest student within budget
+    python distill_model.py --data ../ml-training/synthetic_train.csv --label no_show
+
+Data defaults to the feature matrix cached by train_model.py.
+
+Exported students are registered in model_registry.py under 'distilled' and
+replace model-trees.js only when their AUC is within --max-auc-loss of the
+current champion's (python model_registry.py rollback distilled to undo).
+"""
+
+import sys
+import io
+if __name__ == '__main__':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+import numpy as np
+
+from export_model import PACKED_DTYPES, load_feature_names, pack_trees, predict_proba_packed, write_js_module
+from feature_cache import latest_cached_features
+from model_registry import promote, register
+
+TEACHER_FILE = 'no_show_model_v2.json'
+METADATA_FILE = 'model_v2_metadata.json'
+OUTPUT_FILE = '../api/ml/model-trees.js'
+REPORT_FILE = 'distillation_report.json'
+
+REGISTRY_NAME = 'distilled'
+
+EVALUATOR_JS = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'api', 'ml', 'tree-evaluator.js')
+
+# (trees, depth) for XGBoost students
+TREE_STUDENTS = [(10, 2), (20, 3), (50, 3), (30, 4), (60, 4), (100, 4)]
+
+SCORECARD_BINS = 16
+
+LATENCY_SAMPLES = 20000
+SEED = 42
+
+
+# ============================================================================
+# DATA
+# ============================================================================
+
+def load_dataset(data_file, label_column, feature_names):
+    """(X, y) from a CSV, or from train_model.py's feature cache when no CSV is given"""
+    if data_file:
+        import pandas as pd
+        df = pd.read_csv(data_file)
+        return df[feature_names].to_numpy(dtype=np.float32), df[label_column].to_numpy()
+
+    cached = latest_cached_features()
+    if cached is None:
+        raise FileNotFoundError("No cached feature matrix - run train_model.py first or pass --data")
+
+    X, y, metadata = cached
+    if metadata['featureNames'] != feature_names:
+        raise ValueError("Cached feature matrix does not match the teacher's feature names")
+    return np.asarray(X), np.asarray(y)
+
+
+# ============================================================================
+# STUDENTS
+# ============================================================================
+
+def train_tree_student(X, soft_labels, n_trees, depth):
+    """XGBoost student regressing the teacher's probabilities"""
+    import xgboost as xgb
+
+    params = {
+        'objective': 'reg:logistic',
+        'max_depth': depth,
+        'learning_rate': 0.3,
+        'subsample': 0.8,
+        'seed': SEED
+    }
+    booster = xgb.train(params, xgb.DMatrix(X, label=soft_labels), num_boost_round=n_trees)
+    return pack_trees(json.loads(booster.save_raw('json')))
+
+
+def quantile_edges(column, n_bins):
+    """Interior bin edges (unique, float32) at evenly spaced quantiles"""
+    finite = column[~np.isnan(column)]
+    if len(finite) == 0:
+        return np.array([], dtype=np.float32)
+    qs = np.linspace(0, 1, n_bins + 1)[1:-1]
+    edges = np.unique(np.quantile(finite, qs).astype(np.float32))
+    # An edge at the minimum would leave the first bin empty
+    return edges[edges > finite.min()]
+
+
+def train_scorecard_student(X, soft_labels, n_bins=SCORECARD_BINS):
+    """
+    Logistic regression over one-hot quantile bins, fit to soft labels by
+    duplicating each row as a positive (weight p) and a negative (weight 1-p).
+    """
+    from sklearn.linear_model import LogisticRegression
+
+    edges = [quantile_edges(X[:, j], n_bins) for j in range(X.shape[1])]
+    offsets = np.cumsum([0] + [len(e) + 1 for e in edges])
+
+    # Bin index per cell: x < edges[0] -> 0, edges[0] <= x < edges[1] -> 1, ...
+    # (missing values go to bin 0, matching default-left in the packed trees)
+    codes = np.column_stack([
+        np.searchsorted(edges[j], np.nan_to_num(X[:, j], nan=-np.inf), side='right') + offsets[j]
+        for j in range(X.shape[1])
+    ])
+
+    one_hot = np.zeros((len(X), offsets[-1]), dtype=np.float32)
+    np.put_along_axis(one_hot, codes, 1.0, axis=1)
+
+    model = LogisticRegression(C=1.0, max_iter=1000)
+    model.fit(
+        np.vstack([one_hot, one_hot]),
+        np.concatenate([np.ones(len(X)), np.zeros(len(X))]),
+        sample_weight=np.concatenate([soft_labels, 1 - soft_labels])
+    )
+
+    weights = [model.coef_[0][offsets[j]:offsets[j + 1]] for j in range(X.shape[1])]
+    return pack_scorecard(edges, weights, float(model.intercept_[0]), X.shape[1])
+
+
+def pack_scorecard(edges, weights, intercept, num_features):
+    """
+    Express a binned logistic model in the packed tree format: one balanced
+    tree per feature whose leaves are the bin weights. Features with a single
+    bin are folded into the intercept.
+    """
+    columns = {name: [] for name in ['feature', 'value', 'left', 'right', 'defaultLeft']}
+    roots = []
+
+    def add_node(feature, value, default_left=0):
+        index = len(columns['feature'])
+        columns['feature'].append(feature)
+        columns['value'].append(value)
+        columns['left'].append(-1)
+        columns['right'].append(-1)
+        columns['defaultLeft'].append(default_left)
+        return index
+
+    def build(j, lo, hi):
+        # Bins lo..hi (inclusive); split between bins mid and mid+1 at edges[j][mid]
+        if lo == hi:
+            return add_node(-1, float(weights[j][lo]))
+        mid = (lo + hi) // 2
+        node = add_node(j, float(edges[j][mid]), default_left=1)
+        columns['left'][node] = build(j, lo, mid)
+        columns['right'][node] = build(j, mid + 1, hi)
+        return node
+
+    base_margin = intercept
+    for j in range(num_features):
+        if len(edges[j]) == 0:
+            base_margin += float(weights[j][0])
+            continue
+        roots.append(build(j, 0, len(edges[j])))
+
+    columns['roots'] = roots
+    packed = {name: np.asarray(columns[name], dtype=dtype) for name, dtype in PACKED_DTYPES.items()}
+    packed['baseMargin'] = base_margin
+    packed['numFeatures'] = num_features
+    return packed
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def measure_latency_node(module_file, X_sample):
+    """p50/p99 microseconds per single-row prediction in Node, or None without node"""
+    node = shutil.which('node')
+    if node is None or not os.path.exists(EVALUATOR_JS):
+        return None
+
+    script = f"""
+const {{ loadPackedTrees, predictPackedTrees }} = require({json.dumps(os.path.abspath(EVALUATOR_JS))});
+const trees = loadPackedTrees(require({json.dumps(os.path.abspath(module_file))}));
+const rows = JSON.parse(require('fs').readFileSync(0, 'utf-8'));
+let sink = 0;
+for (let i = 0; i < 2000; i++) sink += predictPackedTrees(trees, rows[i % rows.length]);
+const times = new Float64Array(rows.length);
+for (let i = 0; i < rows.length; i++) {{
+  const start = process.hrtime.bigint();
+  sink += predictPackedTrees(trees, rows[i]);
+  times[i] = Number(process.hrtime.bigint() - start) / 1000;
+}}
+times.sort();
+console.log(JSON.stringify({{ p50: times[Math.floor(times.length * 0.5)], p99: times[Math.floor(times.length * 0.99)], sink }}));
+"""
+    rows = [[None if np.isnan(v) else float(v) for v in row] for row in X_sample]
+    result = subprocess.run([node, '-e', script], input=json.dumps(rows), capture_output=True, text=True, check=True)
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    return {'p50': timings['p50'], 'p99': timings['p99'], 'runtime': 'node'}
+
+
+def measure_latency_python(packed, X_sample):
+    """Fallback: single-row latency of the NumPy reference evaluator"""
+    times = []
+    for row in X_sample[:2000]:
+        start = time.perf_counter()
+        predict_proba_packed(packed, row)
+        times.append((time.perf_counter() - start) * 1e6)
+    return {'p50': float(np.percentile(times, 50)), 'p99': float(np.percentile(times, 99)), 'runtime': 'python'}
+
+
+def evaluate_candidate(name, packed, X_test, y_test, X_sample, feature_names, workdir):
+    from sklearn.metrics import roc_auc_score
+
+    module_file = os.path.join(workdir, f'{name}.js')
+    size_bytes = write_js_module(packed, module_file, name, feature_names, name)
+
+    latency = measure_latency_node(module_file, X_sample) or measure_latency_python(packed, X_sample)
+
+    return {
+        'name': name,
+        'trees': int(len(packed['roots'])),
+        'nodes': int(len(packed['feature'])),
+        'auc': float(roc_auc_score(y_test, predict_proba_packed(packed, X_test))),
+        'sizeKb': round(size_bytes / 1024, 1),
+        'latencyP50Us': round(latency['p50'], 2),
+        'latencyP99Us': round(latency['p99'], 2),
+        'latencyRuntime': latency['runtime']
+    }
+
+
+def select_student(results, max_auc_loss, max_size_kb=None, max_p99_us=None):
+    """Fastest (p99) student within every budget, or None"""
+    eligible = [
+        r for r in results
+        if r['name'] != 'teacher'
+        and r['aucLoss'] <= max_auc_loss
+        and (max_size_kb is None or r['sizeKb'] <= max_size_kb)
+        and (max_p99_us is None or r['latencyP99Us'] <= max_p99_us)
+    ]
+    return min(eligible, key=lambda r: (r['latencyP99Us'], r['sizeKb'])) if eligible else None
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Distill the v2 model into smaller, faster students')
+    parser.add_argument('--teacher', default=TEACHER_FILE, help='Teacher XGBoost model (.json)')
+    parser.add_argument('--metadata', default=METADATA_FILE, help='Metadata file with featureNames')
+    parser.add_argument('--data', help='CSV with feature + label columns (default: train_model.py feature cache)')
+    parser.add_argument('--label', default='is_canceled', help='Label column when --data is a CSV')
+    parser.add_argument('--max-auc-loss', type=float, default=0.01, help='Budget: AUC loss vs. teacher')
+    parser.add_argument('--max-size-kb', type=float, help='Budget: serialized size of model-trees.js')
+    parser.add_argument('--max-p99-us', type=float, help='Budget: p99 single-prediction latency')
+    parser.add_argument('--export', action='store_true', help='Write the selected student to --output')
+    parser.add_argument('--output', default=OUTPUT_FILE, help='JS module for the exported student')
+    parser.add_argument('--force', action='store_true', help='Deploy the student even if it does not beat the champion')
+    args = parser.parse_args()
+
+    import xgboost as xgb
+    from sklearn.model_selection import train_test_split
+
+    print("=" * 80)
+    print("MODEL DISTILLATION - SPEED vs. ACCURACY")
+    print("=" * 80)
+
+    feature_names = load_feature_names(args.metadata)
+    X, y = load_dataset(args.data, args.label, feature_names)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=SEED, stratify=y)
+
+    print(f"\nSamples: {len(X_train):,} train / {len(X_test):,} test")
+
+    teacher = xgb.XGBClassifier()
+    teacher.load_model(args.teacher)
+    soft_labels = teacher.predict_proba(X_train)[:, 1]
+
+    candidates = [('teacher', pack_trees(json.loads(teacher.get_booster().save_raw('json'))))]
+
+    print("\nTraining students on teacher probabilities...")
+    for n_trees, depth in TREE_STUDENTS:
+        candidates.append((f'xgb-{n_trees}x{depth}', train_tree_student(X_train, soft_labels, n_trees, depth)))
+    candidates.append((f'scorecard-{SCORECARD_BINS}bins', train_scorecard_student(X_train, soft_labels)))
+
+    rng = np.random.default_rng(SEED)
+    X_sample = X_test[rng.choice(len(X_test), size=min(LATENCY_SAMPLES, len(X_test)), replace=False)]
+
+    print("Measuring AUC, size and latency...")
+    with tempfile.TemporaryDirectory() as workdir:
+        results = [
+            evaluate_candidate(name, packed, X_test, y_test, X_sample, feature_names, workdir)
+            for name, packed in candidates
+        ]
+
+    teacher_auc = results[0]['auc']
+    for result in results:
+        result['aucLoss'] = round(teacher_auc - result['auc'], 5)
+
+    print("\n" + "=" * 80)
+    print(f"{'MODEL':<20}{'TREES':>6}{'NODES':>8}{'AUC':>8}{'LOSS':>9}{'SIZE KB':>10}{'P50 us':>9}{'P99 us':>9}")
+    print("=" * 80)
+    for r in results:
+        print(f"{r['name']:<20}{r['trees']:>6}{r['nodes']:>8}{r['auc']:>8.4f}{r['aucLoss']:>9.4f}"
+              f"{r['sizeKb']:>10.1f}{r['latencyP50Us']:>9.2f}{r['latencyP99Us']:>9.2f}")
+    print(f"(latency measured in {results[0]['latencyRuntime']})")
+
+    selected = select_student(results, args.max_auc_loss, args.max_size_kb, args.max_p99_us)
+
+    with open(REPORT_FILE, 'w') as f:
+        json.dump({
+            'teacher': args.teacher,
+            'budgets': {'maxAucLoss': args.max_auc_loss, 'maxSizeKb': args.max_size_kb, 'maxP99Us': args.max_p99_us},
+            'results': results,
+            'selected': selected['name'] if selected else None
+        }, f, indent=2)
+    print(f"\nReport written: {REPORT_FILE}")
+
+    if selected is None:
+        print("\nNo student fits the budgets - keep the teacher or relax --max-auc-loss")
+        return
+
+    print(f"\nSelected: {selected['name']} (AUC loss {selected['aucLoss']:.4f}, "
+          f"{selected['sizeKb']:.0f} KB, p99 {selected['latencyP99Us']:.1f} us)")
+
+    if args.export:
+        packed = dict(candidates)[selected['name']]
+        targets = {'modelTrees': args.output}
+
+        # Stage the module; the live file is only replaced on promotion
+        with tempfile.TemporaryDirectory() as staging_dir:
+            staged = {'modelTrees': os.path.join(staging_dir, os.path.basename(args.output))}
+            write_js_module(packed, staged['modelTrees'], f"2.0.0-{selected['name']}", feature_names, args.teacher)
+            manifest = register(REGISTRY_NAME, staged, targets, metrics={
+                'rocAuc': selected['auc'],
+                'aucLoss': selected['aucLoss'],
+                'latencyP50Us': selected['latencyP50Us'],
+                'latencyP99Us': selected['latencyP99Us']
+            }, student=selected['name'], teacher=args.teacher)
+
+        promoted, message = promote(REGISTRY_NAME, manifest['hash'], tolerance=args.max_auc_loss, force=args.force)
+        print(f"Registered as {manifest['hash']} ({manifest['sizeBytes'] / 1024:.0f} KB)")
+        if promoted:
+            print(f"Exported to {args.output} (undo with: python model_registry.py rollback {REGISTRY_NAME})")
+        else:
+            print(f"NOT deployed: {message} (--force to deploy anyway)")
+    else:
+        print("Re-run with --export to write it to the API")
+
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
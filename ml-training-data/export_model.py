@@ -0,0 +1,337 @@
+"""
+Export Trained XGBoost Model to a Flat-Array Tree Table
+
+train_model.py saves the full booster to no_show_model_v2.json (~3 MB), which the
+serverless API cannot load. This script flattens every tree into a handful of
+typed arrays (split feature, threshold/leaf value, child offsets, default
+direction) and writes them to api/ml/model-trees.js, where predict.js evaluates
+them with api/ml/tree-evaluator.js - no Python runtime needed.
+
+Usage:
+    python export_model.py                              # export no_show_model_v2.json
+    python export_model.py no_show_model_v3_custom.json --version 3.0.0
+    python export_model.py --verify-data ../ml-training/synthetic_train.csv
+
+The export is verified against xgboost's predict_proba before it is written.
+"""
+
+import sys
+import io
+if __name__ == '__main__':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+import argparse
+import base64
+import json
+import math
+import time
+from datetime import datetime
+
+import numpy as np
+
+DEFAULT_MODEL_FILE = 'no_show_model_v2.json'
+DEFAULT_METADATA_FILE = 'model_v2_metadata.json'
+DEFAULT_OUTPUT_FILE = '../api/ml/model-trees.js'
+DEFAULT_VERIFY_DATA = '../ml-training/synthetic_train.csv'
+
+PACKED_FORMAT = 'packed-trees-v1'
+
+# Objectives whose output is sigmoid(margin) - reg:logistic is used by distilled students
+LOGISTIC_OBJECTIVES = ['binary:logistic', 'reg:logistic']
+
+# Maximum allowed |probability difference| between the packed table and xgboost
+PARITY_TOLERANCE = 1e-5
+
+# Array name -> numpy dtype (little-endian, matches the JS typed array views)
+PACKED_DTYPES = {
+    'feature': '<i2',       # split feature index, -1 for leaves
+    'value': '<f4',         # split threshold, or leaf value for leaves
+    'left': '<i4',          # global index of left child, -1 for leaves
+    'right': '<i4',         # global index of right child, -1 for leaves
+    'defaultLeft': '<u1',   # 1 if missing values go left
+    'roots': '<i4'          # global index of each tree's root node
+}
+
+
+# ============================================================================
+# PACKING
+# ============================================================================
+
+def load_booster_json(model_file):
+    """Load an XGBoost model saved with save_model('*.json')"""
+    with open(model_file, 'r') as f:
+        return json.load(f)
+
+
+def parse_base_margin(learner):
+    """
+    Convert learner_model_param.base_score (a probability for logistic
+    objectives) into the raw margin every tree's output is added to.
+    """
+    objective = learner['objective']['name']
+    if objective not in LOGISTIC_OBJECTIVES:
+        raise ValueError(f"Unsupported objective '{objective}' (expected {' or '.join(LOGISTIC_OBJECTIVES)})")
+
+    # XGBoost >= 2.1 stores base_score as a vector string, e.g. "[3.7039828E-1]"
+    base_score = float(str(learner['learner_model_param']['base_score']).strip('[]'))
+    base_score = min(max(base_score, 1e-7), 1 - 1e-7)
+    return math.log(base_score / (1 - base_score))
+
+
+def pack_trees(model_json):
+    """
+    Flatten all trees of a saved booster into contiguous arrays.
+
+    Node indices are global: tree t occupies [roots[t], roots[t] + num_nodes).
+    For split nodes `value` holds the threshold (go left when x < threshold);
+    for leaves it holds the leaf weight.
+    """
+    learner = model_json['learner']
+    trees = learner['gradient_booster']['model']['trees']
+    num_features = int(learner['learner_model_param']['num_feature'])
+
+    feature, value, left, right, default_left, roots = [], [], [], [], [], []
+
+    for tree in trees:
+        if any(tree.get('split_type', [])):
+            raise ValueError(f"Tree {tree['id']} uses categorical splits, which are not supported")
+
+        offset = len(feature)
+        roots.append(offset)
+
+        for node in range(int(tree['tree_param']['num_nodes'])):
+            left_child = tree['left_children'][node]
+            is_leaf = left_child == -1
+
+            feature.append(-1 if is_leaf else tree['split_indices'][node])
+            value.append(tree['split_conditions'][node])
+            left.append(-1 if is_leaf else offset + left_child)
+            right.append(-1 if is_leaf else offset + tree['right_children'][node])
+            default_left.append(0 if is_leaf else tree['default_left'][node])
+
+    columns = {
+        'feature': feature,
+        'value': value,
+        'left': left,
+        'right': right,
+        'defaultLeft': default_left,
+        'roots': roots
+    }
+
+    packed = {name: np.asarray(columns[name], dtype=dtype) for name, dtype in PACKED_DTYPES.items()}
+    packed['baseMargin'] = parse_base_margin(learner)
+    packed['numFeatures'] = num_features
+    return packed
+
+
+# ============================================================================
+# REFERENCE EVALUATOR
+# ============================================================================
+
+def predict_margin_packed(packed, X):
+    """
+    Evaluate every tree for every row at once.
+
+    Walks an (n_rows, n_trees) matrix of node pointers one level per iteration,
+    so the loop runs max-depth times regardless of the number of rows.
+    """
+    X = np.asarray(X, dtype=np.float32)
+    if X.ndim == 1:
+        X = X.reshape(1, -1)
+
+    feature = packed['feature']
+    value = packed['value']
+    left = packed['left']
+    right = packed['right']
+    default_left = packed['defaultLeft'].astype(bool)
+
+    rows = np.arange(X.shape[0])[:, None]
+    nodes = np.broadcast_to(packed['roots'], (X.shape[0], len(packed['roots']))).copy()
+
+    while True:
+        split_feature = feature[nodes]
+        active = split_feature >= 0
+        if not active.any():
+            break
+
+        x = X[rows, np.where(active, split_feature, 0)]
+        go_left = np.where(np.isnan(x), default_left[nodes], x < value[nodes])
+        next_nodes = np.where(go_left, left[nodes], right[nodes])
+        nodes = np.where(active, next_nodes, nodes)
+
+    return packed['baseMargin'] + value[nodes].sum(axis=1, dtype=np.float64)
+
+
+def predict_proba_packed(packed, X):
+    """No-show probability (positive class) for each row of X"""
+    return 1.0 / (1.0 + np.exp(-predict_margin_packed(packed, X)))
+
+
+def verify_parity(packed, model_file, X):
+    """
+    Compare the packed evaluator against xgboost's predict_proba.
+
+    Returns the maximum absolute probability difference over X.
+    """
+    import xgboost as xgb
+
+    model = xgb.XGBClassifier()
+    model.load_model(model_file)
+
+    expected = model.predict_proba(np.asarray(X, dtype=np.float32))[:, 1]
+    actual = predict_proba_packed(packed, X)
+    return float(np.max(np.abs(expected - actual)))
+
+
+def latency(func, rows):
+    """p50/p99 microseconds of func(row) over single rows"""
+    for row in rows[:100]:
+        func(row)
+
+    times = np.empty(len(rows))
+    for i, row in enumerate(rows):
+        start = time.perf_counter()
+        func(row)
+        times[i] = (time.perf_counter() - start) * 1e6
+
+    return {'p50Us': float(np.percentile(times, 50)), 'p99Us': float(np.percentile(times, 99))}
+
+
+# ============================================================================
+# JS MODULE EXPORT
+# ============================================================================
+
+def encode_array(array):
+    """Base64 of the raw little-endian bytes (decoded into a typed array in JS)"""
+    return base64.b64encode(np.ascontiguousarray(array).tobytes()).decode('ascii')
+
+
+def packed_payload(packed, version, feature_names, source_file):
+    """JSON-ready export of packed trees (what tree-evaluator.js loadPackedTrees reads)"""
+    return {
+        'format': PACKED_FORMAT,
+        'version': version,
+        'exportedAt': datetime.now().isoformat(),
+        'sourceModel': source_file,
+        'featureNames': feature_names,
+        'numFeatures': packed['numFeatures'],
+        'numTrees': int(len(packed['roots'])),
+        'numNodes': int(len(packed['feature'])),
+        'baseMargin': packed['baseMargin'],
+        'arrays': {name: encode_array(packed[name]) for name in PACKED_DTYPES}
+    }
+
+
+def write_js_module(packed, output_file, version, feature_names, source_file):
+    """Write the packed trees as a CommonJS module next to model-data.js"""
+    payload = packed_payload(packed, version, feature_names, source_file)
+
+    module_js = f"""/**
+ * ML Model Trees (Inline for Serverless Compatibility)
+ *
+ * GENERATED by ml-training-data/export_model.py - do not edit by hand.
+ *
+ * Flat-array export of the XGBoost booster, evaluated by tree-evaluator.js.
+ * Arrays are base64-encoded little-endian typed arrays:
+ *   feature (Int16), value (Float32), left/right/roots (Int32), defaultLeft (Uint8)
+ *
+ * Version: {version}
+ * Source: {source_file}
+ * Trees: {payload['numTrees']} ({payload['numNodes']} nodes)
+ */
+
+module.exports = {json.dumps(payload, indent=2)};
+"""
+
+    with open(output_file, 'w') as f:
+        f.write(module_js)
+
+    return len(module_js.encode('utf-8'))
+
+
+def load_js_module(module_file):
+    """
+    Read a module written by write_js_module back into (packed, metadata) -
+    the exact arrays the API evaluates.
+    """
+    with open(module_file, 'r') as f:
+        text = f.read()
+
+    payload = json.loads(text[text.index('module.exports = ') + len('module.exports = '):].rstrip().rstrip(';'))
+    if payload.get('format') != PACKED_FORMAT:
+        raise ValueError(f"{module_file}: unsupported format {payload.get('format')!r}")
+
+    packed = {
+        name: np.frombuffer(base64.b64decode(payload['arrays'][name]), dtype=dtype)
+        for name, dtype in PACKED_DTYPES.items()
+    }
+    packed['baseMargin'] = payload['baseMargin']
+    packed['numFeatures'] = payload['numFeatures']
+
+    metadata = {key: value for key, value in payload.items() if key != 'arrays'}
+    return packed, metadata
+
+
+def load_feature_names(metadata_file):
+    """Feature order the booster was trained with (from the metadata file)"""
+    with open(metadata_file, 'r') as f:
+        return json.load(f)['featureNames']
+
+
+def load_verify_matrix(csv_file, feature_names, max_rows=5000):
+    """Feature matrix for the parity check (any CSV with the model's feature columns)"""
+    import pandas as pd
+
+    df = pd.read_csv(csv_file, nrows=max_rows)
+    return df[feature_names].to_numpy(dtype=np.float32)
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Export XGBoost booster to a flat-array tree table')
+    parser.add_argument('model', nargs='?', default=DEFAULT_MODEL_FILE, help='Saved XGBoost model (.json)')
+    parser.add_argument('--metadata', default=DEFAULT_METADATA_FILE, help='Metadata file with featureNames')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_FILE, help='JS module to write')
+    parser.add_argument('--version', default='2.0.0', help='Model version recorded in the export')
+    parser.add_argument('--verify-data', default=DEFAULT_VERIFY_DATA, help='CSV used for the parity check')
+    parser.add_argument('--skip-verify', action='store_true', help='Skip the predict_proba parity check')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("EXPORT XGBOOST MODEL TO FLAT-ARRAY TREE TABLE")
+    print("=" * 80)
+
+    print(f"\nLoading booster: {args.model}")
+    packed = pack_trees(load_booster_json(args.model))
+    feature_names = load_feature_names(args.metadata)
+
+    if len(feature_names) != packed['numFeatures']:
+        print(f"ERROR: metadata lists {len(feature_names)} features, model expects {packed['numFeatures']}")
+        sys.exit(1)
+
+    print(f"   Trees: {len(packed['roots'])}")
+    print(f"   Nodes: {len(packed['feature']):,}")
+    print(f"   Base margin: {packed['baseMargin']:.6f}")
+
+    if not args.skip_verify:
+        print(f"\nVerifying parity against predict_proba ({args.verify_data})...")
+        X = load_verify_matrix(args.verify_data, feature_names)
+        max_diff = verify_parity(packed, args.model, X)
+        print(f"   Rows checked: {len(X):,}")
+        print(f"   Max |difference|: {max_diff:.2e}")
+
+        if max_diff > PARITY_TOLERANCE:
+            print(f"\nERROR: parity check failed (tolerance {PARITY_TOLERANCE:.0e}) - export NOT written")
+            sys.exit(1)
+
+    size_bytes = write_js_module(packed, args.output, args.version, feature_names, args.model)
+
+    print(f"\nExported: {args.output} ({size_bytes / 1024:.0f} KB)")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
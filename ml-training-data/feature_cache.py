@@ -0,0 +1,145 @@
+"""
+Columnar Feature Cache for Training Scripts
+
+Parsing hotel_bookings.csv and re-engineering all 23 features takes seconds on
+every training run. This module stores the engineered feature matrix (float32)
+and labels once as .npy files and memory-maps them on later runs, so training
+starts straight from the matrix.
+
+Cache entries are keyed by a hash of:
+  - the source file's bytes
+  - the feature names (order matters)
+  - the source code of the feature-engineering function
+so editing the dataset or the engineering logic invalidates the cache automatically.
+
+Usage (from a training script):
+    key = feature_cache_key('hotel_bookings.csv', FEATURE_NAMES, engineer_features)
+    cached = load_cached_features(key)
+    if cached is None:
+        X, y = ...build...
+        save_cached_features(key, X, y, FEATURE_NAMES)
+"""
+
+import hashlib
+import inspect
+import json
+import os
+from datetime import datetime
+
+import numpy as np
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.feature_cache')
+
+HASH_CHUNK_BYTES = 1 << 20
+
+
+def file_hash(path):
+    """SHA-256 of a file's contents (streamed, so large files are fine)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def feature_cache_key(source_file, feature_names, builder=None, inputs=()):
+    """
+    Cache key for a (dataset, feature set, engineering code) combination.
+
+    `inputs` lists any other files the builder reads (e.g. lookup tables);
+    a missing input hashes differently from any present one.
+    """
+    digest = hashlib.sha256()
+    digest.update(file_hash(source_file).encode())
+    digest.update(json.dumps(list(feature_names)).encode())
+    if builder is not None:
+        digest.update(inspect.getsource(builder).encode())
+    for path in inputs:
+        digest.update(file_hash(path).encode() if os.path.exists(path) else b'missing:' + path.encode())
+    return digest.hexdigest()[:16]
+
+
+def _entry_paths(key, cache_dir):
+    return (
+        os.path.join(cache_dir, f'{key}.X.npy'),
+        os.path.join(cache_dir, f'{key}.y.npy'),
+        os.path.join(cache_dir, f'{key}.json')
+    )
+
+
+def load_cached_features(key, cache_dir=CACHE_DIR):
+    """
+    Memory-map a cached (X, y) pair.
+
+    Returns None on a cache miss. X is a read-only float32 memmap, so loading is
+    O(1) regardless of dataset size - pages are read lazily as training touches them.
+    """
+    x_path, y_path, meta_path = _entry_paths(key, cache_dir)
+
+    # Metadata is written last, so its presence means the entry is complete
+    if not os.path.exists(meta_path):
+        return None
+
+    X = np.load(x_path, mmap_mode='r')
+    y = np.load(y_path, mmap_mode='r')
+    return X, y
+
+
+def latest_cached_features(cache_dir=CACHE_DIR):
+    """
+    Most recently written cache entry as (X, y, metadata), or None.
+
+    Lets downstream stages (distillation, benchmarks) reuse the matrix
+    train_model.py built without recomputing its key.
+    """
+    if not os.path.isdir(cache_dir):
+        return None
+
+    entries = []
+    for name in os.listdir(cache_dir):
+        if name.endswith('.json'):
+            with open(os.path.join(cache_dir, name), 'r') as f:
+                entries.append(json.load(f))
+
+    if not entries:
+        return None
+
+    metadata = max(entries, key=lambda entry: entry['createdAt'])
+    X, y = load_cached_features(metadata['key'], cache_dir)
+    return X, y, metadata
+
+
+def save_cached_features(key, X, y, feature_names, source_file=None, cache_dir=CACHE_DIR):
+    """
+    Store (X, y) under `key`.
+
+    Each file is written to a temp name and renamed into place, so an interrupted
+    run never leaves a half-written entry behind.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    x_path, y_path, meta_path = _entry_paths(key, cache_dir)
+
+    X = np.ascontiguousarray(X, dtype=np.float32)
+    y = np.ascontiguousarray(y)
+
+    for path, array in [(x_path, X), (y_path, y)]:
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.save(f, array)
+        os.replace(tmp_path, path)
+
+    metadata = {
+        'key': key,
+        'createdAt': datetime.now().isoformat(),
+        'sourceFile': source_file,
+        'featureNames': list(feature_names),
+        'samples': int(X.shape[0]),
+        'dtype': str(X.dtype)
+    }
+
+    tmp_path = meta_path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(metadata, f, indent=2)
+    os.replace(tmp_path, meta_path)
+
+    return metadata
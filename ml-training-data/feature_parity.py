@@ -0,0 +1,296 @@
+"""
+Feature Parity Check: reservation_features.py vs. api/ml/features.js
+
+Replays the same reservations through both implementations - the vectorized
+Python build_features() and the API's extractFeaturesAsArray() in Node - and
+compares every feature column. Any mismatch is training/serving skew: the
+model would be trained on values the API never produces.
+
+Rows come from the logged training table (with point-in-time customer
+history) plus synthetic reservations that exercise the edge cases features.js
+handles with fallbacks (missing/invalid dates, '0' and non-numeric party
+sizes, blank special requests, future booking times, ...). Both sides use the
+same frozen "now" and UTC, like the deployed API.
+
+Also times build_features() on a large synthetic batch.
+
+Usage:
+    python feature_parity.py                         # training table + 2,000 synthetic rows
+    python feature_parity.py --synthetic 20000 --no-table
+    python feature_parity.py --stats slot_stats.json --benchmark-rows 500000
+
+Exits 1 when any feature differs by more than the tolerance.
+"""
+
+import sys
+import io
+if __name__ == '__main__':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import time
+
+import numpy as np
+import pandas as pd
+
+from customer_features import point_in_time_history
+from reservation_features import FEATURE_NAMES, build_features, reservation_frame
+from slot_stats import STATE_FILE as SLOT_STATS_FILE, load_lookup_tables
+from training_log import load_training_table
+
+FEATURES_JS = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'api', 'ml', 'features.js')
+
+TOLERANCE = 1e-6
+SYNTHETIC_ROWS = 2000
+BENCHMARK_ROWS = 100_000
+MAX_EXAMPLES = 5
+SEED = 42
+
+
+# ============================================================================
+# INPUT ROWS
+# ============================================================================
+
+def _pick(rng, n, values, p=None):
+    """n draws from a list of mixed-type values (keeps None/str/int as-is)"""
+    return [values[i] for i in rng.choice(len(values), size=n, p=p)]
+
+
+def synthetic_rows(n, now, seed=SEED):
+    """Random reservations + Customer History fields, mixing valid values with edge cases"""
+    rng = np.random.default_rng(seed)
+
+    start = now - pd.Timedelta(days=400)
+    reservation_days = start + pd.to_timedelta(rng.integers(0, 800, n), unit='D')
+    hours = rng.integers(0, 24, n)
+    minutes = rng.choice([0, 15, 30, 45], n)
+
+    dates = pd.Series(reservation_days.strftime('%Y-%m-%d'), dtype=object)
+    times = pd.Series([f'{h:02d}:{m:02d}' for h, m in zip(hours, minutes)], dtype=object)
+
+    edge = rng.random(n)
+    dates[edge < 0.02] = None
+    dates[(edge >= 0.02) & (edge < 0.03)] = 'not-a-date'
+    dates[(edge >= 0.03) & (edge < 0.04)] = ''
+    edge = rng.random(n)
+    times[edge < 0.02] = None
+    times[(edge >= 0.02) & (edge < 0.03)] = ''
+    times[(edge >= 0.03) & (edge < 0.04)] = 'soon'
+    times[(edge >= 0.04) & (edge < 0.05)] = '25:00'
+
+    reservation_time = reservation_days + pd.to_timedelta(hours, unit='h') + pd.to_timedelta(minutes, unit='m')
+    # Mostly booked ahead; a few "booked" after the reservation (lead time clamps to 0)
+    booked = reservation_time - pd.to_timedelta(rng.exponential(72, n) - 2, unit='h')
+    created = pd.Series(booked.strftime('%Y-%m-%dT%H:%M:%S.000Z'), dtype=object)
+    edge = rng.random(n)
+    created[edge < 0.03] = None
+    created[(edge >= 0.03) & (edge < 0.04)] = 'yesterday'
+    created[(edge >= 0.04) & (edge < 0.10)] = pd.Series(booked.strftime('%Y-%m-%dT%H:%M:%S'))[(edge >= 0.04) & (edge < 0.10)]
+
+    sent = booked + pd.to_timedelta(rng.uniform(0, 48, n), unit='h')
+    sent_at = pd.Series(sent.strftime('%Y-%m-%dT%H:%M:%SZ'), dtype=object)
+    sent_at[rng.random(n) < 0.3] = None
+
+    reservations = pd.DataFrame({
+        'date': dates,
+        'time': times,
+        'booking_created_at': created,
+        'party_size': _pick(rng, n, [1, 2, 2, 2, 3, 4, 4, 5, 6, 8, 12, 0, None, '4', '', 'abc', 4.7]),
+        'special_requests': _pick(rng, n, ['', '', '', '  ', 'Window seat', 'Birthday', None]),
+        'confirmation_sent': _pick(rng, n, [True, False, None, 1, 0]),
+        'confirmation_clicked': _pick(rng, n, [True, False, None, 1, 0]),
+        'confirmation_sent_at': sent_at
+    })
+
+    last_visit = now - pd.to_timedelta(rng.integers(0, 1000, n), unit='D')
+    last_visit_dates = pd.Series(last_visit.strftime('%Y-%m-%d'), dtype=object)
+    edge = rng.random(n)
+    last_visit_dates[edge < 0.2] = None
+    last_visit_dates[(edge >= 0.2) & (edge < 0.22)] = 'garbage'
+
+    history = pd.DataFrame({
+        'Total Reservations': rng.integers(0, 25, n),
+        'Completed Reservations': rng.integers(0, 20, n),
+        'No Shows': rng.integers(0, 5, n),
+        'Cancellations': rng.integers(0, 5, n),
+        'Average Party Size': np.where(rng.random(n) < 0.2, 0, rng.uniform(1, 8, n).round(1)),
+        'No Show Risk Score': np.where(rng.random(n) < 0.3, 0, rng.uniform(0, 0.6, n).round(3)),
+        'First Visit Date': None,
+        'Last Visit Date': last_visit_dates,
+        'Total Spend': rng.uniform(0, 2000, n).round(2)
+    })
+    # New customers: no history at all
+    history.loc[rng.random(n) < 0.4, :] = np.nan
+
+    return reservations, history.astype(object)
+
+
+def table_rows(table):
+    """Logged reservations with each row's point-in-time Customer History fields"""
+    history, _ = point_in_time_history(table)
+    history = history.copy()
+    history['Last Visit Date'] = pd.to_datetime(history['Last Visit Date']).dt.strftime('%Y-%m-%d')
+    return reservation_frame(table).reset_index(drop=True), history.reset_index(drop=True).astype(object)
+
+
+# ============================================================================
+# JS SIDE
+# ============================================================================
+
+def _records(frame):
+    return frame.astype(object).where(frame.notna(), None).to_dict('records')
+
+
+def _reservation_records(frame):
+    """Missing values become absent keys (undefined in JS), like the API's reservation objects"""
+    return [{k: v for k, v in record.items() if v is not None} for record in _records(frame)]
+
+
+def _json_default(value):
+    return value.item() if hasattr(value, 'item') else str(value)
+
+
+def js_features(reservations, history, historical_stats, now):
+    """extractFeaturesAsArray() for every row, in Node with a frozen clock and TZ=UTC"""
+    node = shutil.which('node')
+    if node is None:
+        raise RuntimeError('node is not installed - cannot run api/ml/features.js')
+
+    script = f"""
+const FIXED_NOW = Date.parse({json.dumps(now.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z')});
+const RealDate = Date;
+global.Date = class extends RealDate {{
+  constructor(...args) {{ if (args.length === 0) super(FIXED_NOW); else super(...args); }}
+  static now() {{ return FIXED_NOW; }}
+}};
+console.warn = () => {{}};
+const {{ extractFeaturesAsArray }} = require({json.dumps(os.path.abspath(FEATURES_JS))});
+const input = JSON.parse(require('fs').readFileSync(0, 'utf-8'));
+const out = input.reservations.map((reservation, i) =>
+  extractFeaturesAsArray(reservation, input.history[i] ? {{ fields: input.history[i] }} : null, input.stats));
+process.stdout.write(JSON.stringify(out));
+"""
+    payload = {
+        'reservations': _reservation_records(reservations),
+        'history': _records(history) if history is not None else [None] * len(reservations),
+        'stats': historical_stats
+    }
+    result = subprocess.run(
+        [node, '-e', script],
+        input=json.dumps(payload, default=_json_default),
+        capture_output=True, text=True, check=True,
+        env={**os.environ, 'TZ': 'UTC'}
+    )
+    return np.asarray(json.loads(result.stdout), dtype=np.float64)
+
+
+# ============================================================================
+# COMPARISON
+# ============================================================================
+
+def compare(reservations, history, py, js, tolerance=TOLERANCE):
+    """Per-feature mismatch counts and a few example rows for each"""
+    diff = np.abs(py - js) > tolerance * np.maximum(1.0, np.abs(js))
+    report = {}
+    for j, name in enumerate(FEATURE_NAMES):
+        rows = np.flatnonzero(diff[:, j])
+        if len(rows):
+            report[name] = {
+                'mismatches': int(len(rows)),
+                'examples': [{
+                    'python': float(py[i, j]),
+                    'js': float(js[i, j]),
+                    'reservation': _reservation_records(reservations.iloc[[i]])[0],
+                    'history': _records(history.iloc[[i]])[0] if history is not None else None
+                } for i in rows[:MAX_EXAMPLES]]
+            }
+    return report
+
+
+def check(name, reservations, history, historical_stats, now, tolerance):
+    py = build_features(reservations, history, historical_stats, now).to_numpy()
+    js = js_features(reservations, history, historical_stats, now)
+
+    report = compare(reservations, history, py, js, tolerance)
+    status = 'OK' if not report else f'{len(report)} feature(s) differ'
+    print(f"   {name}: {len(reservations):,} rows - {status}")
+    for feature, result in report.items():
+        print(f"      {feature}: {result['mismatches']} mismatches")
+        for example in result['examples'][:2]:
+            print(f"         python={example['python']} js={example['js']} {json.dumps(example['reservation'], default=_json_default)}")
+    return report
+
+
+def benchmark(rows, now, historical_stats):
+    reservations, history = synthetic_rows(rows, now, seed=SEED + 1)
+    build_features(reservations.head(100), history.head(100), historical_stats, now)  # warm-up
+
+    start = time.perf_counter()
+    build_features(reservations, history, historical_stats, now)
+    return time.perf_counter() - start
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare reservation_features.py with api/ml/features.js')
+    parser.add_argument('--synthetic', type=int, default=SYNTHETIC_ROWS, help='Synthetic edge-case rows')
+    parser.add_argument('--no-table', action='store_true', help='Skip the logged training table')
+    parser.add_argument('--stats', default=SLOT_STATS_FILE, help='slot_stats.py state (historicalStats); missing = JS defaults')
+    parser.add_argument('--now', default=None, help='Frozen "now" (ISO timestamp, default: current time)')
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE, help='Relative tolerance per feature')
+    parser.add_argument('--benchmark-rows', type=int, default=BENCHMARK_ROWS, help='Rows for the build_features timing (0 = skip)')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("FEATURE PARITY: reservation_features.py vs api/ml/features.js")
+    print("=" * 80)
+
+    now = pd.Timestamp(args.now) if args.now else pd.Timestamp.now(tz='UTC')
+    now = (now.tz_convert('UTC') if now.tzinfo else now.tz_localize('UTC')).tz_localize(None).floor('ms')
+
+    historical_stats = load_lookup_tables(args.stats)
+    print(f"\nNow: {now.isoformat()}Z")
+    print(f"Historical stats: {args.stats if historical_stats else 'none (features.js defaults)'}")
+
+    # Defaults and slot tables are different code paths - check both
+    stats_variants = [('default rates', None)] + ([('slot stats', historical_stats)] if historical_stats else [])
+
+    failures = {}
+    print("\nComparing...")
+    for stats_name, stats in stats_variants:
+        if not args.no_table and os.path.exists('restaurant_training_data.csv'):
+            table = load_training_table()
+            if len(table):
+                reservations, history = table_rows(table)
+                report = check(f'training table, {stats_name}', reservations, history, stats, now, args.tolerance)
+                failures.update({f'table/{stats_name}/{k}': v for k, v in report.items()})
+
+        if args.synthetic > 0:
+            reservations, history = synthetic_rows(args.synthetic, now)
+            report = check(f'synthetic, {stats_name}', reservations, history, stats, now, args.tolerance)
+            failures.update({f'synthetic/{stats_name}/{k}': v for k, v in report.items()})
+
+    if args.benchmark_rows > 0:
+        elapsed = benchmark(args.benchmark_rows, now, historical_stats)
+        print(f"\nbuild_features: {args.benchmark_rows:,} rows in {elapsed * 1000:.0f} ms "
+              f"({args.benchmark_rows / elapsed:,.0f} rows/s)")
+
+    print("\n" + "=" * 80)
+    if failures:
+        print(f"SKEW DETECTED in {len(failures)} feature check(s)")
+        print("=" * 80)
+        sys.exit(1)
+
+    print(f"PARITY OK - all {len(FEATURE_NAMES)} features match")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
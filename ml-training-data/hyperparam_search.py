@@ -0,0 +1,274 @@
+"""
+Parallel Hyperparameter Search for the No-Show Model
+
+Runs grid or random search over XGBoost parameters across a process pool.
+Each trial trains with early stopping on a validation split, so the tree count
+is found automatically. Trial results are cached on disk keyed by parameters +
+a hash of the training data, so re-running a search only trains new trials.
+
+The winner is the cheapest model (trees x depth = work per prediction) whose
+validation AUC is within AUC_TOLERANCE of the best trial.
+
+Used by train_model.py:
+    python train_model.py search                      # grid over depth x learning rate
+    python train_model.py search --strategy random --trials 40 --jobs 8
+"""
+
+import hashlib
+import itertools
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+SEARCH_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.search_cache')
+
+MAX_ROUNDS = 500
+EARLY_STOPPING_ROUNDS = 20
+VALIDATION_SIZE = 0.2
+
+# Accept a cheaper model if it loses at most this much validation AUC
+AUC_TOLERANCE = 0.002
+
+GRID = {
+    'max_depth': [3, 4, 5, 6, 8, 10],
+    'learning_rate': [0.05, 0.1, 0.2, 0.3]
+}
+
+RANDOM_SPACE = {
+    'max_depth': [3, 4, 5, 6, 7, 8, 10],
+    'learning_rate': [0.03, 0.05, 0.1, 0.2, 0.3],
+    'subsample': [0.6, 0.7, 0.8, 0.9, 1.0],
+    'colsample_bytree': [0.5, 0.6, 0.8, 1.0],
+    'min_child_weight': [1, 3, 5, 10]
+}
+
+BASE_PARAMS = {
+    'subsample': 0.8,
+    'colsample_bytree': 0.8,
+    'min_child_weight': 1
+}
+
+SEED = 42
+
+# model_v2_metadata.json "config" keys <-> XGBClassifier arguments
+CONFIG_KEYS = {
+    'nEstimators': 'n_estimators',
+    'maxDepth': 'max_depth',
+    'learningRate': 'learning_rate',
+    'subsample': 'subsample',
+    'colsampleBytree': 'colsample_bytree',
+    'minChildWeight': 'min_child_weight',
+    'treeMethod': 'tree_method',
+    'maxBin': 'max_bin',
+    'seed': 'random_state'
+}
+
+
+# ============================================================================
+# CONFIG CONVERSION
+# ============================================================================
+
+def config_to_params(config):
+    """Metadata config block -> XGBClassifier keyword arguments"""
+    return {param: config[key] for key, param in CONFIG_KEYS.items() if key in config}
+
+
+def params_to_config(params):
+    """XGBClassifier keyword arguments -> metadata config block"""
+    return {key: params[param] for key, param in CONFIG_KEYS.items() if params.get(param) is not None}
+
+
+# ============================================================================
+# TRIAL GENERATION
+# ============================================================================
+
+def grid_trials():
+    names = list(GRID)
+    return [
+        {**BASE_PARAMS, **dict(zip(names, values))}
+        for values in itertools.product(*(GRID[name] for name in names))
+    ]
+
+
+def random_trials(n_trials, seed=SEED):
+    rng = random.Random(seed)
+    trials = []
+    seen = set()
+
+    # Bounded attempts: the space may have fewer distinct points than n_trials
+    for _ in range(n_trials * 20):
+        if len(trials) == n_trials:
+            break
+        params = {name: rng.choice(values) for name, values in RANDOM_SPACE.items()}
+        key = json.dumps(params, sort_keys=True)
+        if key not in seen:
+            seen.add(key)
+            trials.append(params)
+
+    return trials
+
+
+# ============================================================================
+# RESULTS CACHE
+# ============================================================================
+
+def dataset_hash(X, y):
+    """Hash of the exact training arrays (trials on different data never collide)"""
+    digest = hashlib.sha256()
+    digest.update(np.ascontiguousarray(X, dtype=np.float32).tobytes())
+    digest.update(np.ascontiguousarray(y).tobytes())
+    return digest.hexdigest()[:16]
+
+
+def trial_key(params):
+    settings = {**params, 'maxRounds': MAX_ROUNDS, 'earlyStopping': EARLY_STOPPING_ROUNDS, 'seed': SEED}
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def load_cached_trial(cache_dir, params):
+    path = os.path.join(cache_dir, f'{trial_key(params)}.json')
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def save_cached_trial(cache_dir, result):
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, f"{trial_key(result['params'])}.json")
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(result, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+# ============================================================================
+# TRIAL EXECUTION (worker processes)
+# ============================================================================
+
+_WORKER_DATA = {}
+
+
+def _init_worker(X_train, y_train, X_val, y_val):
+    """Ship the data to each worker once instead of once per trial"""
+    _WORKER_DATA.update(X_train=X_train, y_train=y_train, X_val=X_val, y_val=y_val)
+
+
+def run_trial(params):
+    """Train one configuration with early stopping; returns its result dict"""
+    import xgboost as xgb
+    from sklearn.metrics import roc_auc_score
+
+    data = _WORKER_DATA
+
+    model = xgb.XGBClassifier(
+        n_estimators=MAX_ROUNDS,
+        early_stopping_rounds=EARLY_STOPPING_ROUNDS,
+        eval_metric='auc',
+        random_state=SEED,
+        n_jobs=1,  # parallelism comes from the process pool
+        **params
+    )
+
+    start = time.perf_counter()
+    model.fit(data['X_train'], data['y_train'], eval_set=[(data['X_val'], data['y_val'])], verbose=False)
+    train_seconds = time.perf_counter() - start
+
+    n_trees = model.best_iteration + 1
+    val_proba = model.predict_proba(data['X_val'], iteration_range=(0, n_trees))[:, 1]
+
+    return {
+        'params': params,
+        'nEstimators': n_trees,
+        'valAuc': float(roc_auc_score(data['y_val'], val_proba)),
+        'cost': n_trees * params['max_depth'],
+        'trainSeconds': round(train_seconds, 3)
+    }
+
+
+# ============================================================================
+# SEARCH
+# ============================================================================
+
+def select_winner(results, tolerance=AUC_TOLERANCE):
+    """Cheapest trial whose validation AUC is within `tolerance` of the best"""
+    best_auc = max(r['valAuc'] for r in results)
+    eligible = [r for r in results if r['valAuc'] >= best_auc - tolerance]
+    return min(eligible, key=lambda r: (r['cost'], -r['valAuc']))
+
+
+def run_search(X, y, strategy='grid', n_trials=24, n_jobs=None, cache_dir=SEARCH_CACHE_DIR, log=print):
+    """
+    Search hyperparameters on (X, y), holding out VALIDATION_SIZE for early stopping.
+
+    Returns (winner, results) where winner['config'] is ready for the metadata file.
+    """
+    from sklearn.model_selection import train_test_split
+
+    X = np.asarray(X, dtype=np.float32)
+    data_dir = os.path.join(cache_dir, dataset_hash(X, y))
+
+    trials = grid_trials() if strategy == 'grid' else random_trials(n_trials)
+
+    results = []
+    pending = []
+    for params in trials:
+        cached = load_cached_trial(data_dir, params)
+        if cached is not None:
+            results.append(cached)
+        else:
+            pending.append(params)
+
+    log(f"   Trials: {len(trials)} ({len(results)} cached, {len(pending)} to run)")
+
+    if pending:
+        X_train, X_val, y_train, y_val = train_test_split(
+            X, y, test_size=VALIDATION_SIZE, random_state=SEED, stratify=y
+        )
+
+        n_jobs = n_jobs or os.cpu_count() or 1
+        with ProcessPoolExecutor(
+            max_workers=min(n_jobs, len(pending)),
+            initializer=_init_worker,
+            initargs=(X_train, y_train, X_val, y_val)
+        ) as pool:
+            for result in pool.map(run_trial, pending):
+                save_cached_trial(data_dir, result)
+                results.append(result)
+                log(f"   depth={result['params']['max_depth']:>2} lr={result['params']['learning_rate']:<5} "
+                    f"trees={result['nEstimators']:>3}  AUC={result['valAuc']:.4f}  ({result['trainSeconds']:.1f}s)")
+
+    winner = select_winner(results)
+    winner_params = {**winner['params'], 'n_estimators': winner['nEstimators'], 'random_state': SEED}
+    winner = {**winner, 'config': params_to_config(winner_params)}
+
+    return winner, results
+
+
+def write_config(metadata_file, output_file, winner, n_trials):
+    """
+    Write a copy of the metadata file with the winning config in its config
+    block. The live file is left alone - train_model.py registers the copy and
+    promotes it like any other v2 artifact.
+    """
+    metadata = {}
+    if os.path.exists(metadata_file):
+        with open(metadata_file, 'r') as f:
+            metadata = json.load(f)
+
+    metadata['config'] = {
+        **winner['config'],
+        'search': {
+            'valAuc': winner['valAuc'],
+            'trials': n_trials,
+            'selection': f'cheapest (trees x depth) within {AUC_TOLERANCE} AUC of best',
+            'searchedAt': time.strftime('%Y-%m-%dT%H:%M:%S')
+        }
+    }
+
+    with open(output_file, 'w') as f:
+        json.dump(metadata, f, indent=2)
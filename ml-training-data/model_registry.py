@@ -0,0 +1,313 @@
+"""
+Model Registry - Versioned Artifacts with Atomic Promotion
+
+The training scripts used to write their outputs (api/ml/model-data.js,
+api/ml/model-trees.js, the booster and its metadata) straight over the live
+files. That caused three problems:
+    - a crash mid-write served a truncated module
+    - a worse model went live immediately
+    - the only way back was to retrain
+
+Now every trained model is registered first. Its files are copied into
+model-registry/<name>/<hash>/, where hash is the sha256 of the file contents.
+A manifest.json sits next to them with the metrics, the serialized size and
+the scoring latency. Registering never touches the live files.
+
+Promotion copies each file to its live path via a temp file and os.replace, so
+readers see either the old file or the new one, never a partial one. The
+artifact is then recorded as champion in model-registry/<name>/registry.json.
+A candidate is promoted only if its metric is at least the champion's. The
+first promotion registers the files that are live at that point, so there is
+always something to roll back to. Rollback re-deploys the previous champion
+from the registry without retraining.
+
+Usage:
+    python model_registry.py list custom
+    python model_registry.py show custom 3f2a9c1e5b7d0a42
+    python model_registry.py promote custom 3f2a9c1e5b7d0a42 [--force]
+    python model_registry.py rollback custom [--steps 2]
+"""
+
+import sys
+import io
+if __name__ == '__main__':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+REGISTRY_DIR = os.path.join(BASE_DIR, 'model-registry')
+
+HASH_LENGTH = 16
+HASH_CHUNK_BYTES = 1 << 20
+
+DEFAULT_METRIC = 'rocAuc'
+
+
+# ============================================================================
+# STORAGE
+# ============================================================================
+
+def _resolve(path):
+    """Live paths are stored as given (relative to ml-training-data/)"""
+    return path if os.path.isabs(path) else os.path.join(BASE_DIR, path)
+
+
+def _write_json(path, data):
+    tmp_file = path + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_file, path)
+
+
+def content_hash(files):
+    """sha256 over (role, bytes) of every file, in role order"""
+    digest = hashlib.sha256()
+    for role in sorted(files):
+        digest.update(role.encode())
+        with open(files[role], 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b''):
+                digest.update(chunk)
+    return digest.hexdigest()[:HASH_LENGTH]
+
+
+def load_index(name, registry_dir=REGISTRY_DIR):
+    """registry.json for one model name: current champion and promotion history"""
+    path = os.path.join(registry_dir, name, 'registry.json')
+    if not os.path.exists(path):
+        return {'champion': None, 'history': [], 'rolledBack': []}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def save_index(name, index, registry_dir=REGISTRY_DIR):
+    _write_json(os.path.join(registry_dir, name, 'registry.json'), index)
+
+
+def load_manifest(name, digest, registry_dir=REGISTRY_DIR):
+    path = os.path.join(registry_dir, name, digest, 'manifest.json')
+    if not os.path.exists(path):
+        raise KeyError(f"No artifact {digest} registered for '{name}'")
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def list_manifests(name, registry_dir=REGISTRY_DIR):
+    """All registered artifacts for a name, oldest first"""
+    model_dir = os.path.join(registry_dir, name)
+    if not os.path.isdir(model_dir):
+        return []
+
+    manifests = [load_manifest(name, entry, registry_dir) for entry in os.listdir(model_dir)
+                 if os.path.exists(os.path.join(model_dir, entry, 'manifest.json'))]
+    return sorted(manifests, key=lambda manifest: manifest['registeredAt'])
+
+
+# ============================================================================
+# REGISTER
+# ============================================================================
+
+def register(name, files, targets, metrics=None, registry_dir=REGISTRY_DIR, **info):
+    """
+    Store an artifact without deploying it.
+
+    files maps role -> path of the freshly written file, targets maps role ->
+    live path it is deployed to (deployed in this order, so list the file
+    that marks a finished deploy - e.g. an incremental-training watermark -
+    last). Extra keyword arguments are kept in the manifest. Registering
+    identical content twice returns the existing manifest.
+    """
+    digest = content_hash(files)
+    artifact_dir = os.path.join(registry_dir, name, digest)
+    if os.path.exists(os.path.join(artifact_dir, 'manifest.json')):
+        return load_manifest(name, digest, registry_dir)
+
+    # Build in a temp dir and rename it into place: a registered artifact is always complete
+    tmp_dir = artifact_dir + '.tmp'
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    entries = {}
+    for role in targets:
+        file_name = os.path.basename(targets[role])
+        shutil.copyfile(files[role], os.path.join(tmp_dir, file_name))
+        entries[role] = {
+            'file': file_name,
+            'target': targets[role],
+            'bytes': os.path.getsize(files[role])
+        }
+
+    manifest = {
+        'name': name,
+        'hash': digest,
+        'registeredAt': datetime.now().isoformat(),
+        'files': entries,
+        'sizeBytes': sum(entry['bytes'] for entry in entries.values()),
+        'metrics': metrics or {},
+        **info
+    }
+    _write_json(os.path.join(tmp_dir, 'manifest.json'), manifest)
+    os.rename(tmp_dir, artifact_dir)
+    return manifest
+
+
+def register_live(name, targets, registry_dir=REGISTRY_DIR):
+    """Register whatever is deployed right now (None if any live file is missing)"""
+    live = {role: _resolve(path) for role, path in targets.items()}
+    if not all(os.path.exists(path) for path in live.values()):
+        return None
+    return register(name, live, targets, registry_dir=registry_dir, source='live files before first promotion')
+
+
+# ============================================================================
+# PROMOTE / ROLLBACK
+# ============================================================================
+
+def deploy(manifest, registry_dir=REGISTRY_DIR):
+    """Copy each file next to its live path, then os.replace it over the live file"""
+    artifact_dir = os.path.join(registry_dir, manifest['name'], manifest['hash'])
+
+    for entry in manifest['files'].values():
+        target = _resolve(entry['target'])
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+
+        tmp_file = target + '.tmp'
+        shutil.copyfile(os.path.join(artifact_dir, entry['file']), tmp_file)
+        os.replace(tmp_file, target)
+
+
+def beats(candidate, champion, metric=DEFAULT_METRIC, tolerance=0.0):
+    """True if candidate's metric is at least champion's - tolerance (higher is better)"""
+    new, current = candidate['metrics'].get(metric), champion['metrics'].get(metric)
+    if current is None:
+        return True
+    if new is None:
+        return False
+    return new >= current - tolerance
+
+
+def promote(name, digest, metric=DEFAULT_METRIC, tolerance=0.0, force=False, reason=None, registry_dir=REGISTRY_DIR):
+    """
+    Deploy a registered artifact if it beats the champion (or force).
+
+    Returns (promoted, message).
+    """
+    candidate = load_manifest(name, digest, registry_dir)
+    index = load_index(name, registry_dir)
+
+    if index['champion'] is None:
+        baseline = register_live(name, {role: entry['target'] for role, entry in candidate['files'].items()}, registry_dir)
+        if baseline is not None and baseline['hash'] != digest:
+            index['champion'] = baseline['hash']
+            index['history'].append({'hash': baseline['hash'], 'promotedAt': baseline['registeredAt'], 'reason': 'baseline'})
+
+    if index['champion'] == digest:
+        return False, f"{digest} is already the champion"
+
+    if index['champion'] is not None and not force:
+        champion = load_manifest(name, index['champion'], registry_dir)
+        if not beats(candidate, champion, metric, tolerance):
+            return False, (f"{metric} {candidate['metrics'].get(metric)} does not beat champion "
+                           f"{index['champion']} ({champion['metrics'].get(metric)})")
+
+    deploy(candidate, registry_dir)
+
+    index['champion'] = digest
+    index['history'].append({
+        'hash': digest,
+        'promotedAt': datetime.now().isoformat(),
+        'reason': reason or ('forced' if force else f'{metric} >= champion - {tolerance}')
+    })
+    save_index(name, index, registry_dir)
+    return True, f"{digest} promoted"
+
+
+def rollback(name, steps=1, registry_dir=REGISTRY_DIR):
+    """Re-deploy the champion from `steps` promotions ago; returns its manifest"""
+    index = load_index(name, registry_dir)
+    if len(index['history']) <= steps:
+        raise ValueError(f"'{name}' has {len(index['history'])} promotion(s) - nothing to roll back to")
+
+    target = index['history'][-1 - steps]
+    manifest = load_manifest(name, target['hash'], registry_dir)
+    deploy(manifest, registry_dir)
+
+    rolled_back = index['history'][-steps:]
+    index['history'] = index['history'][:-steps]
+    index['champion'] = target['hash']
+    index['rolledBack'].extend({**entry, 'rolledBackAt': datetime.now().isoformat()} for entry in rolled_back)
+    save_index(name, index, registry_dir)
+    return manifest
+
+
+# ============================================================================
+# METRICS
+# ============================================================================
+
+def packed_latency(packed, X, rows=500):
+    """Single-row p50/p99 (us) of the packed evaluator - what a request pays per prediction"""
+    from export_model import latency, predict_proba_packed
+
+    timings = latency(lambda row: predict_proba_packed(packed, row), list(X[:rows]))
+    return {'latencyP50Us': round(timings['p50Us'], 1), 'latencyP99Us': round(timings['p99Us'], 1)}
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def print_manifest(manifest, champion=None):
+    marker = '*' if manifest['hash'] == champion else ' '
+    metrics = ', '.join(f"{key} {value:.4f}" if isinstance(value, float) else f"{key} {value}"
+                        for key, value in manifest['metrics'].items())
+    print(f" {marker} {manifest['hash']}  {manifest['registeredAt'][:19]}  "
+          f"{manifest['sizeBytes'] / 1024:>8.0f} KB  {metrics or manifest.get('source', '')}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inspect, promote and roll back registered models')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    list_parser = subparsers.add_parser('list', help='Registered artifacts (* = champion)')
+    list_parser.add_argument('name')
+
+    show_parser = subparsers.add_parser('show', help='Print one manifest')
+    show_parser.add_argument('name')
+    show_parser.add_argument('hash')
+
+    promote_parser = subparsers.add_parser('promote', help='Deploy an artifact if it beats the champion')
+    promote_parser.add_argument('name')
+    promote_parser.add_argument('hash')
+    promote_parser.add_argument('--metric', default=DEFAULT_METRIC)
+    promote_parser.add_argument('--tolerance', type=float, default=0.0)
+    promote_parser.add_argument('--force', action='store_true', help='Deploy even if it does not beat the champion')
+
+    rollback_parser = subparsers.add_parser('rollback', help='Re-deploy a previous champion')
+    rollback_parser.add_argument('name')
+    rollback_parser.add_argument('--steps', type=int, default=1)
+
+    args = parser.parse_args()
+
+    if args.command == 'list':
+        index = load_index(args.name)
+        for manifest in list_manifests(args.name):
+            print_manifest(manifest, index['champion'])
+    elif args.command == 'show':
+        print(json.dumps(load_manifest(args.name, args.hash), indent=2))
+    elif args.command == 'promote':
+        promoted, message = promote(args.name, args.hash, args.metric, args.tolerance, args.force)
+        print(message)
+        sys.exit(0 if promoted else 1)
+    elif args.command == 'rollback':
+        manifest = rollback(args.name, args.steps)
+        print(f"Rolled back '{args.name}' to {manifest['hash']} (registered {manifest['registeredAt'][:19]})")
+
+
+if __name__ == '__main__':
+    main()
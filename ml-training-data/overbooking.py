@@ -0,0 +1,306 @@
+"""
+Monte-Carlo Overbooking Simulator
+
+checkTimeSlotAvailability counts every booked seat against capacity as if every
+party will show, even when the model says a third of a slot's bookings are
+likely no-shows. This simulator quantifies what overbooking a slot would risk.
+
+Per night:
+    1. Every reservation covers the SLOT_MINUTES slots from its time to time +
+       its dining duration (learned by dining_durations.py if available, else
+       the fixed 90/120/150 blocks).
+    2. One Bernoulli matrix draws show / no-show for every reservation in
+       every scenario (--simulations x reservations), so a party that shows
+       occupies all of its slots in that scenario.
+    3. Occupied seats per scenario and slot = shows @ seats, a single matrix product.
+    4. The allowance has to hold once the slot is sold out, not just for
+       tonight's book. So each slot's remaining seats (capacity - booked) are
+       filled with parties of --party-size that no-show at the night's
+       average rate, and candidate overbook levels add more of those parties
+       on top. Draws are coupled, so level k+1 is level k plus one more party
+       and the risk can only grow with k.
+
+It reports, per slot, the occupied-seat distribution of the current book
+(mean, p5/p50/p95), the probability of exceeding capacity at each overbook
+level of the filled book, and the bookable seats - capacity plus the largest
+overbook level whose risk stays within --max-risk (never below capacity).
+Those are exported to api/_lib/overbooking.js for the booking path. A full
+night of 100K scenarios takes a few hundred milliseconds.
+
+Bookings made after a run move the real book away from the simulated one, so
+schedule it to re-run frequently (e.g. hourly during booking hours).
+
+Reservations and their no-show probabilities default to the pending
+reservations in the training log (ml_predicted_probability is what
+predictNoShow returned at booking time).
+
+Usage:
+    python overbooking.py                                   # upcoming nights from the training log
+    python overbooking.py reservations.csv --capacity 80 --max-risk 0.02
+    python overbooking.py --date 2026-11-06 --simulations 200000
+"""
+
+import sys
+import io
+if __name__ == '__main__':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+import argparse
+import json
+import os
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from dining_durations import fixed_duration, load_duration_tables, planned_durations
+from reservation_features import schedule_frame, upcoming_rows
+from slot_stats import DEFAULT_CAPACITY
+
+OUTPUT_FILE = '../api/_lib/overbooking.js'
+REPORT_FILE = 'overbooking_report.json'
+
+SIMULATIONS = 100_000
+SLOT_MINUTES = 15
+
+# Accept at most this probability of more guests showing than there are seats
+MAX_RISK = 0.05
+
+# Candidate overbook levels: up to this many extra parties of EXTRA_PARTY_SIZE
+MAX_EXTRA_PARTIES = 10
+EXTRA_PARTY_SIZE = 2
+
+# No-show probability when a reservation has none (features.js default rate)
+DEFAULT_NO_SHOW_PROBABILITY = 0.15
+
+SEED = 42
+
+PROBABILITY_COLUMNS = ['ml_predicted_probability', 'no_show_probability']
+
+
+# ============================================================================
+# RESERVATIONS
+# ============================================================================
+
+def _column(df, names):
+    return next((df[name] for name in names if name in df.columns), None)
+
+
+def reservation_frame(df):
+    """schedule_frame plus the no-show probability per reservation"""
+    probability = _column(df, PROBABILITY_COLUMNS)
+    if probability is None and 'ML Risk Score' in df.columns:
+        probability = df['ML Risk Score'] / 100
+    if probability is None:
+        probability = pd.Series(np.nan, index=df.index)
+
+    frame = schedule_frame(df)
+    no_show = pd.to_numeric(probability, errors='coerce').fillna(DEFAULT_NO_SHOW_PROBABILITY).clip(0, 1)
+    return frame.assign(no_show=no_show.loc[frame.index]).reset_index(drop=True)
+
+
+def durations_for(frame, duration_tables=None):
+    """Minutes each reservation holds its seats (what getDiningDuration returns)"""
+    if duration_tables is None:
+        return fixed_duration(frame['party_size'].to_numpy())
+    return planned_durations(duration_tables, frame)
+
+
+# ============================================================================
+# SIMULATION
+# ============================================================================
+
+def simulate_night(starts, durations, party_sizes, no_show, capacity, simulations=SIMULATIONS,
+                   slot_minutes=SLOT_MINUTES, max_extra_parties=MAX_EXTRA_PARTIES,
+                   extra_party_size=EXTRA_PARTY_SIZE, extra_no_show=None, seed=SEED):
+    """
+    Occupied-seat distribution and capacity-exceedance risk per slot for one night.
+
+    Returns a dict of per-slot arrays. filledSeats is each slot's book after
+    filling it to capacity with parties of extra_party_size;
+    exceedProbability[level][slot] is the risk with `level` more of those
+    parties on top of the filled book.
+    """
+    starts, durations = np.asarray(starts), np.asarray(durations)
+    party_sizes, no_show = np.asarray(party_sizes, dtype=np.float32), np.asarray(no_show, dtype=np.float32)
+
+    first = starts.min() // slot_minutes * slot_minutes
+    slots = np.arange(first, (starts + durations).max(), slot_minutes)
+    present = (starts[None, :] <= slots[:, None]) & (slots[:, None] < (starts + durations)[None, :])
+    seats = present * party_sizes                                        # slots x reservations
+
+    rng = np.random.default_rng(seed)
+    shows = rng.random((simulations, len(starts)), dtype=np.float32) >= no_show
+    occupied = shows.astype(np.float32) @ seats.T                        # scenarios x slots
+
+    booked = seats.sum(axis=1)
+    fill_parties = np.ceil(np.maximum(capacity - booked, 0) / extra_party_size).astype(int)
+
+    # Future bookings: parties of extra_party_size at the night's average no-show rate.
+    # added_seats[:, n] = seats of the first n of them that show, one shared draw per scenario
+    if extra_no_show is None:
+        extra_no_show = float(no_show.mean())
+    added_shows = rng.random((simulations, fill_parties.max() + max_extra_parties), dtype=np.float32) >= extra_no_show
+    added_seats = np.concatenate([
+        np.zeros((simulations, 1), dtype=np.float32),
+        np.cumsum(added_shows, axis=1, dtype=np.float32) * extra_party_size
+    ], axis=1)                                                           # scenarios x parties
+
+    exceed = np.stack([
+        (occupied + added_seats[:, fill_parties + level] > capacity).mean(axis=0)
+        for level in range(max_extra_parties + 1)
+    ])                                                                   # levels x slots
+
+    return {
+        'slots': slots,
+        'bookedSeats': booked,
+        'filledSeats': booked + fill_parties * extra_party_size,
+        'expectedOccupied': occupied.mean(axis=0),
+        'occupiedPercentiles': np.percentile(occupied, [5, 50, 95], axis=0),
+        'walkRisk': (occupied > capacity).mean(axis=0),
+        'extraSeats': np.arange(max_extra_parties + 1) * extra_party_size,
+        'exceedProbability': exceed
+    }
+
+
+def bookable_seats(result, capacity, max_risk=MAX_RISK):
+    """Filled book plus the largest overbook level within max_risk, per slot (at least capacity)"""
+    within = result['exceedProbability'] <= max_risk
+    # Risk grows with the level, so the allowed levels are a prefix: count them
+    allowed_levels = within.cumprod(axis=0).sum(axis=0)
+    bookable = result['filledSeats'] + result['extraSeats'][np.maximum(allowed_levels - 1, 0)]
+    return np.maximum(np.where(allowed_levels > 0, bookable, 0), capacity).astype(int)
+
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def _clock(minute):
+    return f"{int(minute) // 60:02d}:{int(minute) % 60:02d}"
+
+
+def night_summary(result, bookable):
+    return {
+        'startMinute': int(result['slots'][0]),
+        'slots': [_clock(m) for m in result['slots']],
+        'bookedSeats': result['bookedSeats'].astype(int).tolist(),
+        'bookableSeats': bookable.tolist(),
+        'expectedOccupied': np.round(result['expectedOccupied'], 1).tolist(),
+        'walkRisk': np.round(result['walkRisk'], 4).tolist()
+    }
+
+
+def write_js_module(payload, output_file=OUTPUT_FILE):
+    module_js = f"""/**
+ * Overbooking Allowances (Inline for Serverless Compatibility)
+ *
+ * GENERATED by ml-training-data/overbooking.py - do not edit by hand.
+ *
+ * Per night and {payload['slotMinutes']}-minute slot: seats that may be booked while the
+ * simulated probability of more guests showing than {payload['capacity']} seats stays
+ * within {payload['maxRisk']:.0%} ({payload['simulations']:,} scenarios per night).
+ *
+ * Generated: {payload['generatedAt']}
+ */
+
+module.exports = {json.dumps(payload)};
+"""
+
+    tmp_file = output_file + '.tmp'
+    with open(tmp_file, 'w') as f:
+        f.write(module_js)
+    os.replace(tmp_file, output_file)
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Simulate show/no-show scenarios and overbooking risk per slot')
+    parser.add_argument('input', nargs='?', help='CSV of reservations with date, time, party size and no-show '
+                                                  'probability (default: pending reservations in the training log)')
+    parser.add_argument('--date', default=None, help='Only simulate this night (YYYY-MM-DD)')
+    parser.add_argument('--capacity', type=int, default=DEFAULT_CAPACITY, help='Restaurant capacity (seats)')
+    parser.add_argument('--max-risk', type=float, default=MAX_RISK, help='Accepted probability of exceeding capacity')
+    parser.add_argument('--simulations', type=int, default=SIMULATIONS, help='Scenarios per night')
+    parser.add_argument('--party-size', type=int, default=EXTRA_PARTY_SIZE, help='Party size of overbooked parties')
+    parser.add_argument('--max-extra-parties', type=int, default=MAX_EXTRA_PARTIES, help='Highest overbook level')
+    parser.add_argument('--output', default=OUTPUT_FILE, help='JS module for the API')
+    parser.add_argument('--report', default=REPORT_FILE, help='Full per-slot report (JSON)')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("OVERBOOKING SIMULATOR")
+    print("=" * 80)
+
+    if args.input:
+        frame = reservation_frame(pd.read_csv(args.input))
+    else:
+        from training_log import load_training_table
+        frame = reservation_frame(upcoming_rows(load_training_table(), pd.Timestamp(datetime.now().date())))
+    if args.date:
+        frame = frame[frame['date'] == pd.Timestamp(args.date)]
+
+    duration_tables = load_duration_tables()
+    frame['duration'] = durations_for(frame, duration_tables)
+
+    print(f"\nReservations: {len(frame):,} over {frame['date'].nunique()} night(s)")
+    print(f"Durations: {'learned (dining_durations.py)' if duration_tables is not None else 'fixed blocks'}")
+    print(f"Capacity {args.capacity}, max risk {args.max_risk:.0%}, {args.simulations:,} scenarios per night")
+
+    if len(frame) == 0:
+        print("\nNothing to simulate.")
+        sys.exit(1)
+
+    nights, report = {}, {}
+    print(f"\n{'night':<12} {'res':>5} {'peak booked':>12} {'peak risk':>10} {'extra covers':>13} {'ms':>7}")
+    for date, night in frame.groupby('date'):
+        start = time.perf_counter()
+        result = simulate_night(night['start'], night['duration'], night['party_size'], night['no_show'],
+                                args.capacity, args.simulations, max_extra_parties=args.max_extra_parties,
+                                extra_party_size=args.party_size)
+        bookable = bookable_seats(result, args.capacity, args.max_risk)
+        elapsed = time.perf_counter() - start
+
+        key = str(date.date())
+        nights[key] = night_summary(result, bookable)
+        report[key] = {
+            **nights[key],
+            'occupiedPercentiles': {f'p{p}': values.round(1).tolist()
+                                    for p, values in zip([5, 50, 95], result['occupiedPercentiles'])},
+            'filledSeats': result['filledSeats'].astype(int).tolist(),
+            'extraSeats': result['extraSeats'].tolist(),
+            'exceedProbability': np.round(result['exceedProbability'], 4).tolist(),
+            'simulationMs': round(elapsed * 1000, 1)
+        }
+
+        extra = np.maximum(bookable - np.maximum(result['bookedSeats'], args.capacity), 0)
+        print(f"{key:<12} {len(night):>5} {int(result['bookedSeats'].max()):>12} "
+              f"{result['walkRisk'].max():>10.1%} {int(extra.max()):>13} {elapsed * 1000:>7.1f}")
+
+    generated_at = datetime.now(timezone.utc).isoformat()
+    settings = {
+        'generatedAt': generated_at,
+        'capacity': args.capacity,
+        'maxRisk': args.max_risk,
+        'simulations': args.simulations,
+        'slotMinutes': SLOT_MINUTES
+    }
+
+    tmp_file = args.report + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump({**settings, 'extraPartySize': args.party_size, 'nights': report}, f, indent=2)
+    os.replace(tmp_file, args.report)
+
+    write_js_module({**settings, 'nights': nights}, args.output)
+
+    print(f"\nReport written: {args.report}")
+    print(f"API module written: {args.output}")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
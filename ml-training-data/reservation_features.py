@@ -0,0 +1,358 @@
+"""
+Vectorized Reservation Feature Engineering (Python port of api/ml/features.js)
+
+Computes all 23 FEATURE_NAMES columns for a whole DataFrame of reservations
+with vectorized datetime/string ops - the same values extractAllFeatures()
+produces one reservation at a time in the API, including its fallbacks
+(`x || default`, parseInt, invalid-date defaults, NaN -> 0).
+
+Input columns use the reservation keys features.js reads: date, time,
+party_size, booking_created_at (or created_at), special_requests,
+confirmation_sent, confirmation_clicked, confirmation_sent_at. Customer
+history is an optional aligned DataFrame in Customer History field names
+(see customer_features.py); historicalStats is the slot_stats.py lookup dict.
+
+feature_parity.py replays rows through both implementations to catch
+training/serving skew.
+
+schedule_frame() is the shared date / start minute / hour / weekday / party
+size view of a reservation table that slot_stats.py, dining_durations.py,
+overbooking.py and seating_plan.py build on.
+
+Usage:
+    from reservation_features import FEATURE_NAMES, build_features, reservation_frame
+    X = build_features(reservation_frame(table), history, stats)[FEATURE_NAMES]
+"""
+
+import numpy as np
+import pandas as pd
+
+from customer_features import NEW_CUSTOMER_FEATURES, SNAPSHOT_FIELDS, history_to_features
+
+# Same order as ALL_FEATURES in api/ml/feature-config.js
+FEATURE_NAMES = [
+    'booking_lead_time_hours',
+    'hour_of_day',
+    'day_of_week',
+    'is_weekend',
+    'is_prime_time',
+    'month_of_year',
+    'days_until_reservation',
+    'is_repeat_customer',
+    'customer_visit_count',
+    'customer_no_show_rate',
+    'customer_avg_party_size',
+    'days_since_last_visit',
+    'customer_lifetime_value',
+    'party_size',
+    'party_size_category',
+    'is_large_party',
+    'has_special_requests',
+    'confirmation_sent',
+    'confirmation_clicked',
+    'hours_since_confirmation_sent',
+    'historical_no_show_rate_for_day',
+    'historical_no_show_rate_for_time',
+    'occupancy_rate_for_slot'
+]
+
+# features.js fallbacks
+DEFAULT_LEAD_TIME_HOURS = 24
+DEFAULT_HOUR = 19
+DEFAULT_DAY_OF_WEEK = 5
+DEFAULT_MONTH = 1
+DEFAULT_PARTY_SIZE = 2
+DEFAULT_HISTORICAL_RATE = 0.15
+DEFAULT_OCCUPANCY = 0.7
+
+# Research-based defaults when no historicalStats are available (index = day of week, 0 = Sunday)
+DEFAULT_DAY_RATES = np.array([0.18, 0.12, 0.11, 0.12, 0.14, 0.16, 0.17])
+
+# Date, time and party size columns in training-log, features.js and Airtable naming
+DATE_COLUMNS = ['reservation_date', 'date', 'Date']
+TIME_COLUMNS = ['reservation_time', 'time', 'Time']
+PARTY_COLUMNS = ['party_size', 'Party Size']
+
+
+# ============================================================================
+# JS SEMANTICS HELPERS
+# ============================================================================
+
+def _falsy(series):
+    """Elementwise JS falsiness: undefined/null/NaN, '', 0, false"""
+    if series.dtype == object or pd.api.types.is_string_dtype(series):
+        return series.isna() | series.isin(['', 0, False])
+    return series.isna() | (series == 0)
+
+
+def _coalesce(df, names, default=np.nan):
+    """`df[a] || df[b] || default` over whichever columns are present"""
+    result = pd.Series(default, index=df.index, dtype=object)
+    missing = pd.Series(True, index=df.index)
+    for name in names:
+        if name in df:
+            take = missing & ~_falsy(df[name])
+            result = result.where(~take, df[name])
+            missing &= ~take
+    return result
+
+
+def _per_unique(values, func):
+    """
+    Apply `func` (Series -> Series) to the distinct values only and broadcast
+    back. Dates, times and party sizes repeat heavily, so string parsing runs
+    on a few hundred values instead of every row.
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    result = func(pd.Series(uniques, dtype=object)).to_numpy()
+    return pd.Series(result[codes], index=values.index)
+
+
+def _js_dates(values):
+    """
+    new Date(string) for ISO 8601 strings, in UTC (the API runs with TZ=UTC);
+    NaT when invalid. V8's lenient fallback formats ('2025-1-5', day overflow)
+    are not replicated - the API only sees ISO dates.
+    """
+    text = values.where(values.notna(), '').to_numpy(dtype=str)
+
+    # 'Z' (toISOString) and naive strings take pandas' fast path; explicit
+    # offsets (+05:00) need its much slower per-element timezone parser
+    text = np.strings.rstrip(text, 'Z')
+    time_start = np.strings.find(text, 'T')
+    offset = (time_start >= 0) & (np.maximum(np.strings.rfind(text, '+'), np.strings.rfind(text, '-')) > time_start)
+
+    # Blank strings also knock pandas off its fast path, so only parse the rest
+    fast = (text != '') & ~offset
+
+    parsed = np.full(len(text), np.datetime64('NaT'), dtype='datetime64[ns]')
+    parsed[fast] = pd.to_datetime(text[fast], errors='coerce', format='ISO8601').to_numpy(dtype='datetime64[ns]')
+    if offset.any():
+        parsed[offset] = pd.to_datetime(values[offset], errors='coerce', utc=True, format='ISO8601') \
+            .dt.tz_localize(None).to_numpy(dtype='datetime64[ns]')
+    return pd.Series(parsed, index=values.index)
+
+
+def _iso_days(values):
+    """Exactly YYYY-MM-DD strings (NaT otherwise)"""
+    return pd.to_datetime(values.where(values.str.len() == 10), errors='coerce', format='%Y-%m-%d')
+
+
+def _clock_times(values):
+    """Exactly HH:MM or HH:MM:SS strings as offsets from midnight (NaT otherwise)"""
+    valid = values.str.fullmatch(r'([01]\d|2[0-3]):[0-5]\d(:[0-5]\d)?') == True
+    padded = (values.astype(str) + ':00').str.slice(0, 8)
+    return pd.to_timedelta(padded.where(valid), errors='coerce')
+
+
+def _reservation_times(date, time):
+    """new Date(`${date}T${time}`), parsed per distinct date and time"""
+    reservation_time = _per_unique(date, _iso_days) + _per_unique(time, _clock_times)
+
+    # Anything but YYYY-MM-DD + HH:MM[:SS] goes through the full parser
+    other = reservation_time.isna()
+    if other.any():
+        reservation_time[other] = _js_dates(date[other].astype(str) + 'T' + time[other].astype(str))
+    return reservation_time
+
+
+def _parse_int(values):
+    """parseInt(String(value)) - leading integer, NaN otherwise"""
+    return _per_unique(values, lambda v: pd.to_numeric(
+        v.astype(str).str.extract(r'^\s*([+-]?\d+)', expand=False), errors='coerce'
+    )).astype('float64')
+
+
+def _hours_between(later, earlier):
+    return (later - earlier).dt.total_seconds() / 3600
+
+
+def js_day_of_week(dates):
+    """Date.getDay() of each date (0 = Sunday); pandas' dayofweek starts at Monday"""
+    return (dates.dt.dayofweek + 1) % 7
+
+
+# ============================================================================
+# FEATURE GROUPS
+# ============================================================================
+
+def temporal_features(df, reservation_time):
+    date = df['date'] if 'date' in df else pd.Series(np.nan, index=df.index)
+
+    booking_time = _js_dates(_coalesce(df, ['booking_created_at', 'created_at']))
+
+    lead = _hours_between(reservation_time, booking_time).clip(lower=0).fillna(DEFAULT_LEAD_TIME_HOURS)
+
+    hour = _parse_int(_coalesce(df, ['time'], '19:00')).fillna(DEFAULT_HOUR).clip(0, 23)
+
+    day = _per_unique(date, _js_dates)
+    day_of_week = js_day_of_week(day).fillna(DEFAULT_DAY_OF_WEEK)
+    month = day.dt.month.fillna(DEFAULT_MONTH)
+
+    return pd.DataFrame({
+        'booking_lead_time_hours': lead,
+        'hour_of_day': hour,
+        'day_of_week': day_of_week,
+        'is_weekend': day_of_week.isin([0, 5, 6]).astype(int),
+        'is_prime_time': hour.between(18, 21).astype(int),
+        'month_of_year': month,
+        'days_until_reservation': np.floor(lead / 24)
+    }, index=df.index)
+
+
+def customer_features(df, history=None, now=None):
+    """calculateCustomer* from a Customer History frame aligned with df (None = all new customers)"""
+    if history is None:
+        return pd.DataFrame({name: float(value) for name, value in NEW_CUSTOMER_FEATURES.items()}, index=df.index)
+
+    history = history.reindex(index=df.index, columns=SNAPSHOT_FIELDS)
+    now = pd.Timestamp.now(tz='UTC').tz_localize(None) if now is None else now
+    return history_to_features(history, now).astype('float64')
+
+
+def reservation_features(df):
+    raw = _coalesce(df, ['party_size', 'Party Size'], DEFAULT_PARTY_SIZE)
+    party = _parse_int(raw)
+
+    requests = _coalesce(df, ['special_requests', 'Special Requests'], '')
+    has_requests = _per_unique(requests, lambda v: v.astype(str).str.strip() != '')
+
+    return pd.DataFrame({
+        'party_size': party,
+        # NaN compares false in JS and NumPy alike, so an unparseable size is category 2
+        'party_size_category': np.where(party <= 2, 0, np.where(party <= 4, 1, 2)),
+        'is_large_party': (party >= 6).astype(int),
+        'has_special_requests': has_requests.astype(int)
+    }, index=df.index)
+
+
+def engagement_features(df, reservation_time):
+    sent_at_raw = _coalesce(df, ['confirmation_sent_at', 'Confirmation Sent At'])
+    sent_at = _js_dates(sent_at_raw)
+
+    hours = _hours_between(reservation_time, sent_at).clip(lower=0).fillna(0)
+
+    return pd.DataFrame({
+        'confirmation_sent': (~_falsy(_coalesce(df, ['confirmation_sent', 'Confirmation Sent']))).astype(int),
+        'confirmation_clicked': (~_falsy(_coalesce(df, ['confirmation_clicked', 'Confirmation Clicked']))).astype(int),
+        'hours_since_confirmation_sent': hours.where(~_falsy(sent_at_raw), 0)
+    }, index=df.index)
+
+
+def _lookup(table, index, default):
+    """`table[index] || default` for a list-like table"""
+    values = pd.Series(table, dtype='float64').reindex(index.astype(int).to_numpy()).to_numpy()
+    return np.where(np.isnan(values) | (values == 0), default, values)
+
+
+def calculated_features(day_of_week, hour, historical_stats=None):
+    stats = historical_stats or {}
+
+    if stats.get('byDay') is not None:
+        day_rate = _lookup(stats['byDay'], day_of_week, DEFAULT_HISTORICAL_RATE)
+    else:
+        day_rate = DEFAULT_DAY_RATES[day_of_week.astype(int)]
+
+    if stats.get('byTimeSlot') is not None:
+        time_rate = _lookup(stats['byTimeSlot'], hour, DEFAULT_HISTORICAL_RATE)
+    else:
+        time_rate = np.select(
+            [hour.between(18, 20), hour.between(21, 23), hour.between(11, 14)],
+            [0.12, 0.22, 0.14], DEFAULT_HISTORICAL_RATE
+        )
+
+    if stats.get('occupancyBySlot') is not None:
+        occupancy = _lookup(stats['occupancyBySlot'], hour, DEFAULT_OCCUPANCY)
+    else:
+        occupancy = np.select(
+            [hour.between(18, 20), hour.between(21, 23), hour.between(11, 14)],
+            [0.85, 0.60, 0.70], 0.50
+        )
+
+    if stats.get('occupancyByDayHour') is not None:
+        # A real 0 counts here (features.js checks typeof === 'number')
+        table = np.asarray(stats['occupancyByDayHour'], dtype='float64')
+        cell = table[day_of_week.astype(int).to_numpy(), hour.astype(int).to_numpy()]
+        occupancy = np.where(np.isnan(cell), occupancy, cell)
+
+    return pd.DataFrame({
+        'historical_no_show_rate_for_day': day_rate,
+        'historical_no_show_rate_for_time': time_rate,
+        'occupancy_rate_for_slot': occupancy
+    }, index=day_of_week.index)
+
+
+# ============================================================================
+# MAIN ENTRY POINTS
+# ============================================================================
+
+def build_features(df, history=None, historical_stats=None, now=None):
+    """
+    All FEATURE_NAMES for every row of `df` (float64, in FEATURE_NAMES order).
+
+    history:          Customer History fields per row (None = new customers)
+    historical_stats: slot_stats.py lookup tables (None = features.js defaults)
+    now:              "today" for days_since_last_visit - a Timestamp or a
+                      per-row Series (e.g. booking time for training rows)
+    """
+    date = df['date'] if 'date' in df else pd.Series(np.nan, index=df.index)
+    time = df['time'] if 'time' in df else pd.Series(np.nan, index=df.index)
+    # No default time here, unlike calculateHourOfDay
+    reservation_time = _reservation_times(date, time)
+
+    temporal = temporal_features(df, reservation_time)
+
+    features = pd.concat([
+        temporal,
+        customer_features(df, history, now),
+        reservation_features(df),
+        engagement_features(df, reservation_time),
+        calculated_features(temporal['day_of_week'], temporal['hour_of_day'], historical_stats)
+    ], axis=1)[FEATURE_NAMES].astype('float64')
+
+    # extractAllFeatures replaces any non-numeric/NaN value with 0
+    return features.fillna(0)
+
+
+def reservation_frame(table):
+    """Map a restaurant_training_data.csv table to the reservation keys features.js reads"""
+    return pd.DataFrame({
+        'date': table['reservation_date'],
+        'time': table['reservation_time'],
+        'booking_created_at': table['created_at'],
+        'party_size': table['party_size'],
+        'special_requests': table['special_requests']
+    }, index=table.index)
+
+
+# ============================================================================
+# SCHEDULE FRAME
+# ============================================================================
+
+def _first_column(df, names):
+    return next((df[name] for name in names if name in df.columns), None)
+
+
+def schedule_frame(df):
+    """
+    date, start minute, hour, JS day of week and party size per reservation,
+    indexed like df. Rows without a date, HH:MM time or party size are dropped.
+    """
+    date = pd.to_datetime(_first_column(df, DATE_COLUMNS), errors='coerce').dt.normalize()
+    clock = _first_column(df, TIME_COLUMNS).astype(str).str.extract(r'^\s*(\d+):(\d+)').astype(float)
+
+    frame = pd.DataFrame({
+        'date': date,
+        'start': clock[0] * 60 + clock[1],
+        'hour': clock[0],
+        'dow': js_day_of_week(date),
+        'party_size': pd.to_numeric(_first_column(df, PARTY_COLUMNS), errors='coerce')
+    }, index=df.index).dropna(subset=['date', 'start', 'party_size'])
+
+    return frame.astype({'start': int, 'hour': int, 'dow': int, 'party_size': int})
+
+
+def upcoming_rows(table, today):
+    """Pending reservations of the training log dated today or later"""
+    date = pd.to_datetime(table['reservation_date'], errors='coerce').dt.normalize()
+    return table[(table['actual_outcome'] == 'pending') & (date >= today)]
@@ -5,48 +5,149 @@ This script trains a custom XGBoost model using your actual restaurant reservati
 instead of the hotel booking data. Run this when you have 100+ completed reservations.
 
 Usage:
-    python retrain_custom_model.py
+    python retrain_custom_model.py                        # full retrain (asks before training on <50 samples)
+    python retrain_custom_model.py --incremental --yes    # nightly cron: warm-start on new outcomes only
+    python retrain_custom_model.py --incremental --yes --threads 2   # leave cores for other cron jobs
 
 The script will:
-1. Load restaurant_training_data.csv (collected automatically)
+1. Compact the training event log into restaurant_training_data.csv and load it
+   (customer features are recomputed as of each reservation by customer_features.py)
 2. Train XGBoost on YOUR customer behavior patterns
-3. Export model to api/ml/model-data.js
-4. Show performance comparison with hotel-trained model
+   (--incremental: continue boosting the current model on outcomes recorded
+   since the last run, instead of retraining from scratch)
+3. Compare against the current model on a fixed holdout set and only promote
+   the new model if its AUC holds up (--force to promote anyway)
+4. Register the model-data.js / model-trees.js exports, booster and state in
+   model_registry.py, and deploy them atomically only when promoted
+   (python model_registry.py rollback custom undoes a promotion)
+
+The holdout set is chosen by hashing reservation_id, so it is the same on every
+run and never used for training in either mode.
 """
 
 import sys
 import io
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
+import argparse
+import os
+import shutil
+import tempfile
+import zlib
 import pandas as pd
 import numpy as np
-from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report, roc_auc_score
 import xgboost as xgb
 import json
 from datetime import datetime
 
+from customer_features import point_in_time_history
+from export_model import PARITY_TOLERANCE, pack_trees, predict_proba_packed, write_js_module
+from model_registry import packed_latency, promote, register
+from reservation_features import build_features, reservation_frame
+from training_log import compact, load_training_table
+
+MODEL_FILE = 'no_show_model_v3_custom.json'
+STATE_FILE = 'custom_model_state.json'
+OUTPUT_FILE = '../api/ml/model-data.js'
+TREES_FILE = '../api/ml/model-trees.js'
+
+REGISTRY_NAME = 'custom'
+
+# Registry role -> live file, in deploy order (the incremental watermark goes last)
+REGISTRY_TARGETS = {
+    'booster': MODEL_FILE,
+    'modelTrees': TREES_FILE,
+    'modelData': OUTPUT_FILE,
+    'state': STATE_FILE
+}
+
+MIN_SAMPLES = 50
+INCREMENTAL_ROUNDS = 10
+
+# Candidate may lose at most this much holdout AUC vs. the current model
+AUC_TOLERANCE = 0.005
+
+XGB_PARAMS = {
+    'objective': 'binary:logistic',
+    'eval_metric': 'logloss',
+    'max_depth': 5,       # Shallower trees to prevent overfitting
+    'learning_rate': 0.1,
+    'subsample': 0.8,
+    'colsample_bytree': 0.8,
+    'tree_method': 'hist',
+    'max_bin': 256,
+    'seed': 42
+}
+
+parser = argparse.ArgumentParser(description='Retrain the no-show model on your restaurant data')
+parser.add_argument('--incremental', action='store_true', help='Warm-start from the current model on new outcomes only')
+parser.add_argument('--rounds', type=int, default=INCREMENTAL_ROUNDS, help='Boosting rounds to add in incremental mode')
+parser.add_argument('--yes', action='store_true', help='Never prompt; train even below the recommended sample count')
+parser.add_argument('--force', action='store_true', help='Promote the new model even if holdout AUC drops')
+parser.add_argument('--threads', type=int, default=None, help='XGBoost threads (default: all cores)')
+args = parser.parse_args()
+
+if args.threads:
+    XGB_PARAMS['nthread'] = args.threads
+
+
+def is_holdout(reservation_ids, test_size):
+    """Stable holdout membership: the same reservations are held out on every run"""
+    buckets = np.array([zlib.crc32(str(r).encode()) % 100 for r in reservation_ids])
+    return buckets < int(test_size * 100)
+
+
+def feature_importances(booster, feature_names):
+    """Normalized gain importance (what XGBClassifier.feature_importances_ reports)"""
+    scores = booster.get_score(importance_type='gain')
+    values = np.array([scores.get(f'f{i}', 0.0) for i in range(len(feature_names))])
+    return values / values.sum() if values.sum() > 0 else values
+
+
+def holdout_auc(booster, X, y):
+    """ROC-AUC on the holdout set, or None when it only contains one class"""
+    if len(np.unique(y)) < 2:
+        return None
+    return roc_auc_score(y, booster.predict(xgb.DMatrix(X)))
+
+
 print("=" * 80)
-print("CUSTOM RESTAURANT MODEL TRAINING")
+print("CUSTOM RESTAURANT MODEL TRAINING" + (" (INCREMENTAL)" if args.incremental else ""))
 print("Retraining on YOUR actual reservation data")
 print("=" * 80)
 
+previous_state = None
+if os.path.exists(STATE_FILE) and os.path.exists(MODEL_FILE):
+    with open(STATE_FILE, 'r') as f:
+        previous_state = json.load(f)
+
+if args.incremental and previous_state is None:
+    print(f"\nNo previous model ({MODEL_FILE} + {STATE_FILE}) - running a full retrain instead")
+    args.incremental = False
+
 # ============================================================================
 # 1. LOAD YOUR TRAINING DATA
 # ============================================================================
 
+print("\nCompacting training event log...")
+compaction = compact()
+print(f"   New events: {compaction['events']} ({compaction['newReservations']} new reservations)")
+
 print("\nLoading your restaurant training data...")
+df = load_training_table()
 
-try:
-    df = pd.read_csv('restaurant_training_data.csv')
-except FileNotFoundError:
-    print("\nERROR: restaurant_training_data.csv not found!")
-    print("This file is created automatically as customers make reservations.")
+if len(df) == 0:
+    print("\nERROR: No reservations logged yet!")
+    print("Training events are logged automatically as customers make reservations.")
     print("You need at least 100 completed reservations to retrain.")
     sys.exit(1)
 
 print(f"   Total reservations logged: {len(df)}")
 
+# Customer history as of each reservation (same aggregates as the API's snapshot)
+history, history_as_of = point_in_time_history(df)
+
 # Filter to only completed outcomes (showed_up, no_show, cancelled)
 df_completed = df[df['actual_outcome'].isin(['showed_up', 'no_show', 'cancelled'])].copy()
 
@@ -55,15 +156,21 @@ print(f"   - Showed up: {len(df_completed[df_completed['actual_outcome'] == 'sho
 print(f"   - No-shows: {len(df_completed[df_completed['actual_outcome'] == 'no_show'])}")
 print(f"   - Cancelled: {len(df_completed[df_completed['actual_outcome'] == 'cancelled'])}")
 
-if len(df_completed) < 50:
+if len(df_completed) < MIN_SAMPLES and not args.incremental:
     print(f"\nWARNING: Only {len(df_completed)} completed reservations!")
     print("Recommended minimum: 100 samples for reliable training")
     print(f"You need {100 - len(df_completed)} more completed reservations.")
 
-    response = input("\nContinue anyway? (yes/no): ")
-    if response.lower() != 'yes':
-        print("Training cancelled. Collect more data and try again!")
-        sys.exit(0)
+    if not args.yes:
+        # Never block on input() when running from cron
+        if not sys.stdin.isatty():
+            print("Non-interactive run - skipping training (pass --yes to train anyway)")
+            sys.exit(0)
+
+        response = input("\nContinue anyway? (yes/no): ")
+        if response.lower() != 'yes':
+            print("Training cancelled. Collect more data and try again!")
+            sys.exit(0)
 
 # ============================================================================
 # 2. PREPARE FEATURES
@@ -77,28 +184,26 @@ df_completed['target'] = (df_completed['actual_outcome'] != 'showed_up').astype(
 no_show_rate = df_completed['target'].mean()
 print(f"   YOUR no-show rate: {no_show_rate:.1%} ({df_completed['target'].sum()} / {len(df_completed)})")
 
-# Features already in CSV (no engineering needed!)
+# Computed from the raw reservation fields exactly as api/ml/features.js
+# computes them at prediction time (reservation_features.py)
 FEATURE_NAMES = [
     'booking_lead_time_hours',
     'party_size',
     'is_repeat_customer',
     'customer_visit_count',
     'customer_no_show_rate',
-    'days_since_last_visit'
+    'days_since_last_visit',
+    'has_special_requests'
 ]
 
-# Handle special_requests (convert to binary)
-df_completed['has_special_requests'] = (df_completed['special_requests'].str.strip() != '').astype(int)
-FEATURE_NAMES.append('has_special_requests')
-
-# Handle missing values
-for col in FEATURE_NAMES:
-    if col not in df_completed.columns:
-        df_completed[col] = 0
-    df_completed[col] = df_completed[col].fillna(0)
+features = build_features(
+    reservation_frame(df_completed),
+    history.loc[df_completed.index],
+    now=history_as_of.loc[df_completed.index]
+)
 
-X = df_completed[FEATURE_NAMES].values
-y = df_completed['target'].values
+X = features[FEATURE_NAMES].to_numpy(dtype=np.float32)
+y = df_completed['target'].to_numpy()
 
 print(f"   Features: {len(FEATURE_NAMES)}")
 print(f"   Samples: {len(X)}")
@@ -112,54 +217,85 @@ print("\nSplitting dataset...")
 # Use smaller test size for small datasets
 test_size = 0.2 if len(X) > 100 else 0.15
 
-X_train, X_test, y_train, y_test = train_test_split(
-    X, y, test_size=test_size, random_state=42, stratify=y
-)
+holdout = is_holdout(df_completed['reservation_id'], test_size)
+outcome_time = pd.to_datetime(df_completed['outcome_timestamp'], utc=True, errors='coerce', format='ISO8601')
+
+train_mask = ~holdout
+if args.incremental:
+    # Only outcomes recorded since the model was last trained
+    trained_through = pd.Timestamp(previous_state['trainedThrough'])
+    train_mask &= (outcome_time > trained_through).to_numpy()
 
-print(f"   Training: {len(X_train)} samples ({y_train.mean():.1%} no-show rate)")
-print(f"   Testing: {len(X_test)} samples ({y_test.mean():.1%} no-show rate)")
+X_train, y_train = X[train_mask], y[train_mask]
+X_test, y_test = X[holdout], y[holdout]
+
+print(f"   Training: {len(X_train)} samples" + (f" ({y_train.mean():.1%} no-show rate)" if len(y_train) else ""))
+print(f"   Holdout: {len(X_test)} samples" + (f" ({y_test.mean():.1%} no-show rate)" if len(y_test) else ""))
+
+if len(X_train) == 0:
+    print("\nNo new completed reservations since the last training run - nothing to do.")
+    sys.exit(0)
 
 # ============================================================================
 # 4. TRAIN CUSTOM XGBOOST MODEL
 # ============================================================================
 
-print("\nTraining YOUR custom XGBoost model...")
+dtrain = xgb.DMatrix(X_train, label=y_train)
 
-model = xgb.XGBClassifier(
-    n_estimators=50,  # Fewer trees for smaller datasets
-    max_depth=5,      # Shallower trees to prevent overfitting
-    learning_rate=0.1,
-    subsample=0.8,
-    colsample_bytree=0.8,
-    random_state=42,
-    eval_metric='logloss'
-)
+if args.incremental:
+    print(f"\nContinuing YOUR model with {args.rounds} new boosting rounds...")
+    booster = xgb.train(XGB_PARAMS, dtrain, num_boost_round=args.rounds, xgb_model=MODEL_FILE)
+else:
+    print("\nTraining YOUR custom XGBoost model...")
+    booster = xgb.train(XGB_PARAMS, dtrain, num_boost_round=50)  # Fewer trees for smaller datasets
 
-model.fit(X_train, y_train, verbose=False)
+n_estimators = booster.num_boosted_rounds()
+total_samples = len(X_train) + (previous_state['samples'] if args.incremental else 0)
 
-print("   Model trained successfully!")
+print(f"   Model trained successfully! ({n_estimators} trees)")
 
 # ============================================================================
-# 5. EVALUATE MODEL
+# 5. EVALUATE MODEL (holdout gate)
 # ============================================================================
 
 print("\nEvaluating YOUR model...")
 
-y_pred = model.predict(X_test)
-y_pred_proba = model.predict_proba(X_test)[:, 1]
-
-print("\n" + "="*80)
-print("CLASSIFICATION REPORT:")
-print("="*80)
-print(classification_report(y_test, y_pred, target_names=['Showed Up', 'No-Show']))
-
-auc_score = roc_auc_score(y_test, y_pred_proba)
-print(f"\nROC-AUC Score: {auc_score:.4f}")
+auc_score = holdout_auc(booster, X_test, y_test)
+
+if auc_score is None:
+    print("   Holdout has a single class - ROC-AUC not available")
+else:
+    y_pred_proba = booster.predict(xgb.DMatrix(X_test))
+    y_pred = (y_pred_proba > 0.5).astype(int)
+
+    print("\n" + "="*80)
+    print("CLASSIFICATION REPORT:")
+    print("="*80)
+    print(classification_report(y_test, y_pred, labels=[0, 1], target_names=['Showed Up', 'No-Show'], zero_division=0))
+    print(f"\nROC-AUC Score: {auc_score:.4f}")
+
+champion_auc = None
+if previous_state is not None:
+    champion = xgb.Booster()
+    champion.load_model(MODEL_FILE)
+    champion_auc = holdout_auc(champion, X_test, y_test)
+    if champion_auc is not None:
+        print(f"Current model ROC-AUC: {champion_auc:.4f}")
+
+if args.force or previous_state is None:
+    gate_passed = True
+elif auc_score is None or champion_auc is None:
+    gate_passed = False
+    print("\nCannot compare against the current model on this holdout - keeping it (use --force to override)")
+else:
+    gate_passed = auc_score >= champion_auc - AUC_TOLERANCE
+    if not gate_passed:
+        print(f"\nNew model AUC {auc_score:.4f} is below current {champion_auc:.4f} (tolerance {AUC_TOLERANCE}) - NOT promoted")
 
 # Feature importance
 feature_importance = pd.DataFrame({
     'feature': FEATURE_NAMES,
-    'importance': model.feature_importances_
+    'importance': feature_importances(booster, FEATURE_NAMES)
 }).sort_values('importance', ascending=False)
 
 print("\n" + "="*80)
@@ -168,11 +304,13 @@ print("="*80)
 print(feature_importance.to_string(index=False))
 
 # ============================================================================
-# 6. EXPORT CUSTOM MODEL
+# 6. REGISTER AND PROMOTE CUSTOM MODEL
 # ============================================================================
 
 print("\nExporting YOUR custom model...")
 
+auc_text = f"{auc_score:.1%}" if auc_score is not None else "n/a"
+
 # Create Node.js compatible model data
 model_export_js = f"""/**
  * ML Model Data - CUSTOM RESTAURANT MODEL v3.0.0
@@ -180,9 +318,9 @@ model_export_js = f"""/**
  * Trained on YOUR actual restaurant data!
  *
  * Training Date: {datetime.now().strftime('%Y-%m-%d')}
- * Training Samples: {len(df_completed)}
+ * Training Samples: {total_samples}
  * Your No-Show Rate: {no_show_rate:.1%}
- * Model Performance: {auc_score:.1%} AUC
+ * Model Performance: {auc_text} AUC
  */
 
 module.exports = {{
@@ -190,12 +328,12 @@ module.exports = {{
   trainedAt: "{datetime.now().isoformat()}",
   trainingDataset: {{
     name: "Your Restaurant Data",
-    samples: {len(df_completed)},
+    samples: {total_samples},
     noShowRate: {no_show_rate:.3f}
   }},
   featureNames: {json.dumps(FEATURE_NAMES)},
   config: {{
-    nEstimators: 50,
+    nEstimators: {n_estimators},
     maxDepth: 5,
     learningRate: 0.1,
     subsample: 0.8,
@@ -203,36 +341,90 @@ module.exports = {{
     seed: 42
   }},
   performance: {{
-    rocAuc: {auc_score:.4f},
+    rocAuc: {json.dumps(None if auc_score is None else round(float(auc_score), 4))},
     trainSize: {len(X_train)},
     testSize: {len(X_test)},
     noShowRate: {no_show_rate:.3f}
   }},
   model: {{
-    featureImportance: {json.dumps([float(x) for x in model.feature_importances_])}
+    featureImportance: {json.dumps([float(x) for x in feature_importance.sort_index()['importance']])}
   }},
   version: "3.0.0",
-  notes: "Custom model trained on {len(df_completed)} reservations from YOUR restaurant. Achieves {auc_score:.1%} AUC on your specific customer base."
+  notes: "Custom model trained on {total_samples} reservations from YOUR restaurant. Achieves {auc_text} AUC on your specific customer base."
 }};
 """
 
-# Save to production file
-output_file = '../api/ml/model-data.js'
-with open(output_file, 'w') as f:
+# Packed trees so predict.js scores with the real model
+packed = pack_trees(json.loads(booster.save_raw('json')))
+if len(X_test) > 0:
+    parity = np.max(np.abs(predict_proba_packed(packed, X_test) - booster.predict(xgb.DMatrix(X_test))))
+    if parity > PARITY_TOLERANCE:
+        print(f"ERROR: packed trees differ from booster by {parity:.2e} - export NOT written")
+        sys.exit(1)
+
+# Write every artifact to a staging dir - the live files are only replaced on promotion
+staging_dir = tempfile.mkdtemp(prefix='custom-model-')
+staged = {role: os.path.join(staging_dir, os.path.basename(target)) for role, target in REGISTRY_TARGETS.items()}
+
+with open(staged['modelData'], 'w') as f:
     f.write(model_export_js)
 
-print(f"   Custom model saved to: {output_file}")
+write_js_module(packed, staged['modelTrees'], '3.0.0', FEATURE_NAMES, MODEL_FILE)
+booster.save_model(staged['booster'])
+
+# Watermark for the next incremental run. Trained rows without a parseable
+# outcome_timestamp fall back to when they were logged, then to the previous watermark
+trained_through = outcome_time[train_mask].max()
+if pd.isna(trained_through):
+    logged_at = pd.to_datetime(df_completed['created_at'], utc=True, errors='coerce', format='ISO8601')
+    trained_through = logged_at[train_mask].max()
+if args.incremental:
+    previous_watermark = pd.Timestamp(previous_state['trainedThrough'])
+    trained_through = previous_watermark if pd.isna(trained_through) else max(trained_through, previous_watermark)
+
+if pd.isna(trained_through):
+    print("\nNo outcome or creation timestamps on the trained rows - refusing to write a NaT watermark")
+    shutil.rmtree(staging_dir)
+    sys.exit(1)
 
-# Also save full XGBoost model
-model.save_model('no_show_model_v3_custom.json')
-print(f"   Full XGBoost saved to: no_show_model_v3_custom.json")
+with open(staged['state'], 'w') as f:
+    json.dump({
+        'trainedAt': datetime.now().isoformat(),
+        'trainedThrough': trained_through.isoformat(),
+        'mode': 'incremental' if args.incremental else 'full',
+        'samples': int(total_samples),
+        'nEstimators': int(n_estimators),
+        'holdoutAuc': None if auc_score is None else float(auc_score)
+    }, f, indent=2)
+
+manifest = register(REGISTRY_NAME, staged, REGISTRY_TARGETS, metrics={
+    'rocAuc': None if auc_score is None else float(auc_score),
+    'championAuc': None if champion_auc is None else float(champion_auc),
+    'trainSize': int(len(X_train)),
+    'testSize': int(len(X_test)),
+    **packed_latency(packed, X_test if len(X_test) else X_train)
+}, mode='incremental' if args.incremental else 'full', nEstimators=int(n_estimators))
+shutil.rmtree(staging_dir)
+
+print(f"   Registered as {manifest['hash']} ({manifest['sizeBytes'] / 1024:.0f} KB, "
+      f"p50 {manifest['metrics']['latencyP50Us']:.0f} us per prediction)")
+
+if not gate_passed:
+    print(f"   Not deployed - to deploy it anyway: python model_registry.py promote {REGISTRY_NAME} {manifest['hash']} --force")
+    sys.exit(0)
+
+# The holdout gate above already compared against the champion on today's holdout
+promoted, message = promote(REGISTRY_NAME, manifest['hash'], force=True,
+                            reason='forced' if args.force else 'holdout gate')
+print(f"   {message}: {', '.join(REGISTRY_TARGETS.values())}")
+print(f"   Undo with: python model_registry.py rollback {REGISTRY_NAME}")
 
 print("\n" + "="*80)
 print("CUSTOM MODEL TRAINING COMPLETE!")
 print("="*80)
 print(f"Model Version: 3.0.0 (CUSTOM)")
-print(f"Training Samples: {len(df_completed)} YOUR reservations")
-print(f"ROC-AUC Score: {auc_score:.4f}")
+print(f"Training Samples: {total_samples} YOUR reservations")
+print(f"ROC-AUC Score: {auc_text}")
 print(f"Your No-Show Rate: {no_show_rate:.1%}")
 print(f"Top Predictor: {feature_importance.iloc[0]['feature']}")
 print("="*80)
@@ -0,0 +1,482 @@
+"""
+Nightly Seating Plan Optimizer
+
+assignTables in api/_lib/table-assignment.js seats one party at a time. It
+takes the first exact fit, then the first table up to 2 seats larger, then
+the first table combination it finds by scanning every pair and every triple
+of free tables (findTableCombination, O(n^3)), and only then a larger table.
+Each decision ignores the parties still to come, so an early two-top on a
+six-top or a pair broken up for a small group can leave a later large party
+with nowhere to sit.
+
+This script plans the whole night at once. Every reservation holds its tables
+from its time for its dining duration (learned by dining_durations.py if
+available, else the fixed 90/120/150 blocks), and it may use a single table
+or any combination the greedy path could use:
+
+    - any single table seating the party
+    - 2 tables in the same location (up to 2 spare seats)
+    - 3 tables in the same location (up to 3 spare seats)
+    - 2 tables anywhere (up to 4 spare seats)
+
+The assignment is a 0/1 program over table classes (tables with the same
+location and capacity are interchangeable). It picks one option per
+reservation, and at every reservation start time the parties holding a class
+use no more tables than it has. Start times cover every overlap of interval
+bookings, and with those counts satisfied, handing out free tables in start
+order always succeeds. The objective seats as many parties as possible, then
+minimizes combined tables, then spare seats. It is solved with scipy's MILP
+solver (HiGHS) within --time-limit. A best-fit pass in arrival order (the
+cheapest free option instead of the first) is the fallback. It is used when
+no MILP solver is available, or when the time limit cuts the solve short with
+a worse plan.
+
+The report replays the greedy path on the same night. It compares parties
+left unseated, seats wasted and combinations needed. The plan is exported to
+api/_lib/seating-plan.js by reservation ID, so check-in can offer the planned
+tables instead of searching for free combinations per arrival.
+
+Usage:
+    python seating_plan.py                                  # upcoming nights, tables from Airtable
+    python seating_plan.py --date 2026-11-06 --time-limit 30
+    python seating_plan.py reservations.csv --tables tables.csv
+"""
+
+import sys
+import io
+if __name__ == '__main__':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+import argparse
+import json
+import os
+import time
+from datetime import datetime, timezone
+from itertools import combinations, combinations_with_replacement
+
+import numpy as np
+import pandas as pd
+
+from dining_durations import fixed_duration, load_duration_tables, planned_durations
+from reservation_features import schedule_frame, upcoming_rows
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.join(BASE_DIR, '..', 'scripts')
+
+OUTPUT_FILE = '../api/_lib/seating-plan.js'
+REPORT_FILE = 'seating_plan_report.json'
+
+# Solver budget per night (seconds)
+TIME_LIMIT = 10.0
+
+# Objective weights: an unseated party outweighs any number of combinations,
+# a combined table outweighs a few spare seats
+UNSEATED_COST = 1000
+COMBINED_TABLE_COST = 3
+WASTED_SEAT_COST = 1
+
+# Combinations findTableCombination accepts: (tables, same location only, max spare seats)
+COMBINATION_RULES = [(2, True, 2), (3, True, 3), (2, False, 4)]
+
+TABLE_FIELDS = ['Table Number', 'Capacity', 'Location', 'Is Active']
+
+
+# ============================================================================
+# LOADING
+# ============================================================================
+
+def fetch_tables():
+    """Active tables from Airtable (scripts/airtable_client.py), in table number order"""
+    sys.path.insert(0, SCRIPTS_DIR)
+    from airtable_client import AirtableClient, TABLES_TABLE_ID
+
+    records = AirtableClient().list_records(TABLES_TABLE_ID, fields=TABLE_FIELDS)
+    return table_frame(pd.DataFrame([r['fields'] for r in records], columns=TABLE_FIELDS))
+
+
+def table_frame(df):
+    """number, capacity and location per active table, in table number order"""
+    df = df.rename(columns={'table_number': 'Table Number', 'capacity': 'Capacity',
+                            'location': 'Location', 'is_active': 'Is Active'})
+    active = df['Is Active'].fillna(True).astype(bool) if 'Is Active' in df.columns else True
+
+    tables = pd.DataFrame({
+        'number': df['Table Number'],
+        'capacity': pd.to_numeric(df['Capacity'], errors='coerce'),
+        'location': df['Location'].fillna('Main') if 'Location' in df.columns else 'Main'
+    })[active].dropna(subset=['number', 'capacity'])
+
+    tables['capacity'] = tables['capacity'].astype(int)
+    order = pd.to_numeric(tables['number'], errors='coerce')
+    return tables.assign(order=order).sort_values(['order', 'number'], kind='stable').drop(columns='order').reset_index(drop=True)
+
+
+def reservation_frame(df):
+    """schedule_frame plus the reservation ID and HH:MM time per reservation"""
+    df = df.rename(columns={'Reservation ID': 'reservation_id', 'Time': 'reservation_time', 'time': 'reservation_time'})
+    frame = schedule_frame(df)
+
+    ids = df['reservation_id'].astype(str) if 'reservation_id' in df.columns else df.index.astype(str).to_series(index=df.index)
+    frame.insert(0, 'reservation_id', ids.loc[frame.index])
+    frame.insert(2, 'time', df.loc[frame.index, 'reservation_time'].astype(str).str.strip().str[:5])
+    return frame.reset_index(drop=True)
+
+
+# ============================================================================
+# OPTIONS
+# ============================================================================
+
+def table_classes(tables):
+    """Interchangeable tables (same location and capacity): capacity, location and table indexes per class"""
+    groups = tables.groupby(['location', 'capacity'], sort=False).indices
+    return (np.array([capacity for _, capacity in groups]),
+            np.array([location for location, _ in groups], dtype=object),
+            [np.sort(indexes) for indexes in groups.values()])
+
+
+def table_options(tables):
+    """
+    Every single table and every combination the greedy path may use, as
+    counts per table class (tables of a class are interchangeable, so the
+    solver never has to tell them apart).
+
+    Returns (uses, capacity, table_count, max_spare, class_tables): uses[o][c]
+    is how many tables of class c option o takes; max_spare is -1 for single
+    tables (any spare seats allowed).
+    """
+    class_capacity, class_location, class_tables = table_classes(tables)
+    available = np.array([len(indexes) for indexes in class_tables])
+
+    spare_by_combo = {(c,): -1 for c in range(len(class_tables))}
+    for size, same_only, spare in COMBINATION_RULES:
+        for combo in combinations_with_replacement(range(len(class_tables)), size):
+            if (np.bincount(combo, minlength=len(available)) > available).any():
+                continue
+            if same_only and len(set(class_location[list(combo)])) > 1:
+                continue
+            spare_by_combo[combo] = max(spare_by_combo.get(combo, spare), spare)
+
+    uses = np.array([np.bincount(combo, minlength=len(available)) for combo in spare_by_combo])
+    return uses, uses @ class_capacity, uses.sum(axis=1), np.array(list(spare_by_combo.values())), class_tables
+
+
+def feasible_options(party_size, option_capacity, max_spare):
+    """Options that seat a party under the greedy path's rules"""
+    spare = option_capacity - party_size
+    return np.flatnonzero((spare >= 0) & ((max_spare < 0) | (spare <= max_spare)))
+
+
+def option_cost(table_count, seats, party_size):
+    return COMBINED_TABLE_COST * (table_count - 1) + WASTED_SEAT_COST * (seats - party_size)
+
+
+def plan_cost(night, tables, plan):
+    """Objective value of a plan (lower is better)"""
+    capacity = tables['capacity'].to_numpy()
+    return sum(UNSEATED_COST if p is None else option_cost(len(p), capacity[list(p)].sum(), party_size)
+               for p, party_size in zip(plan, night['party_size'].to_numpy()))
+
+
+def pick_tables(option_uses, free, class_tables):
+    """First free tables (table number order) of each class an option uses, or None"""
+    picked = []
+    for c in np.flatnonzero(option_uses):
+        candidates = [t for t in class_tables[c] if t in free][:option_uses[c]]
+        if len(candidates) < option_uses[c]:
+            return None
+        picked.extend(candidates)
+    return tuple(sorted(picked))
+
+
+# ============================================================================
+# ARRIVAL-ORDER PLANS (greedy path and best-fit fallback)
+# ============================================================================
+
+def greedy_choice(party_size, free, tables):
+    """assignTables' pick among free tables (indexes in table number order), or None"""
+    capacity = tables['capacity'].to_numpy()
+    location = tables['location'].to_numpy()
+
+    for t in free:                                          # findExactMatch
+        if capacity[t] == party_size:
+            return (t,)
+    for t in free:                                          # findSizeUp (within 2 seats)
+        if party_size < capacity[t] <= party_size + 2:
+            return (t,)
+
+    for size, same_only, spare in COMBINATION_RULES:        # findTableCombination
+        for combo in combinations(free, size):
+            total = capacity[list(combo)].sum()
+            if party_size <= total <= party_size + spare and \
+                    (not same_only or len(set(location[list(combo)])) == 1):
+                return combo
+
+    larger = sorted((t for t in free if capacity[t] >= party_size), key=lambda t: capacity[t])
+    return (larger[0],) if larger else None                # findLargerTable
+
+
+def replay_arrivals(night, tables, choose):
+    """Seat parties in arrival order, releasing tables when earlier parties finish"""
+    free_at = np.zeros(len(tables))
+    plan = [None] * len(night)
+
+    for i in np.argsort(night['start'].to_numpy(), kind='stable'):
+        start, duration = night['start'].iat[i], night['duration'].iat[i]
+        free = [t for t in range(len(tables)) if free_at[t] <= start]
+        choice = choose(night['party_size'].iat[i], free, i)
+        if choice is not None:
+            free_at[list(choice)] = start + duration
+            plan[i] = tuple(choice)
+    return plan
+
+
+def greedy_plan(night, tables):
+    return replay_arrivals(night, tables, lambda party_size, free, _: greedy_choice(party_size, free, tables))
+
+
+def best_fit_plan(night, tables, options):
+    """Fallback heuristic: arrival order, cheapest option with enough free tables instead of the first"""
+    uses, option_capacity, table_count, max_spare, class_tables = options
+    costs = option_cost(table_count, option_capacity, 0)
+
+    def choose(party_size, free, _):
+        free = set(free)
+        for o in sorted(feasible_options(party_size, option_capacity, max_spare), key=lambda o: costs[o]):
+            picked = pick_tables(uses[o], free, class_tables)
+            if picked is not None:
+                return picked
+        return None
+
+    return replay_arrivals(night, tables, choose)
+
+
+# ============================================================================
+# JOINT ASSIGNMENT (MILP)
+# ============================================================================
+
+def optimal_plan(night, tables, options, time_limit=TIME_LIMIT):
+    """
+    Joint assignment of the whole night. Returns (plan, status) where status is
+    'optimal' or 'time-limit', or (None, reason) when no MILP solution exists.
+    """
+    try:
+        from scipy.optimize import Bounds, LinearConstraint, milp
+        from scipy.sparse import csr_matrix, vstack
+    except ImportError:
+        return None, 'scipy.optimize.milp unavailable'
+
+    uses, option_capacity, table_count, max_spare, class_tables = options
+    party, start = night['party_size'].to_numpy(), night['start'].to_numpy()
+    end = start + night['duration'].to_numpy()
+
+    # One variable per (reservation, feasible option)
+    feasible = [feasible_options(party_size, option_capacity, max_spare) for party_size in party]
+    var_res = np.repeat(np.arange(len(party)), [len(f) for f in feasible])
+    var_option = np.concatenate(feasible)
+    if len(var_res) == 0:
+        return [None] * len(night), 'optimal'
+
+    cost = option_cost(table_count[var_option], option_capacity[var_option], party[var_res])
+
+    # Each reservation takes at most one option
+    one_option = csr_matrix((np.ones(len(var_res)), (var_res, np.arange(len(var_res)))), shape=(len(party), len(var_res)))
+
+    # Parties holding a class at any start time use at most the tables it has
+    points = np.unique(start)
+    var_active = ((start[var_res][None, :] <= points[:, None]) & (points[:, None] < end[var_res][None, :]))
+    class_rows = [csr_matrix(var_active * uses[var_option, c]) for c in range(len(class_tables))]
+    class_limits = np.repeat([len(indexes) for indexes in class_tables], len(points))
+
+    # Seating a party saves UNSEATED_COST and costs its option
+    result = milp(
+        c=cost - UNSEATED_COST,
+        constraints=[LinearConstraint(one_option, 0, 1), LinearConstraint(vstack(class_rows), 0, class_limits)],
+        integrality=np.ones(len(var_res)),
+        bounds=Bounds(0, 1),
+        options={'time_limit': time_limit, 'disp': False}
+    )
+    if result.x is None:
+        return None, result.message
+
+    chosen = {var_res[v]: var_option[v] for v in np.flatnonzero(result.x > 0.5)}
+
+    # Class counts hold at every start time, so seating in start order always finds free tables
+    plan = replay_arrivals(night, tables, lambda _, free, i: (
+        pick_tables(uses[chosen[i]], set(free), class_tables) if i in chosen else None
+    ))
+    return plan, 'optimal' if result.status == 0 else 'time-limit'
+
+
+# ============================================================================
+# COMPARISON
+# ============================================================================
+
+def plan_metrics(night, tables, plan):
+    """Parties seated, seats wasted and combinations needed by a plan"""
+    capacity = tables['capacity'].to_numpy()
+    party, duration = night['party_size'].to_numpy(), night['duration'].to_numpy()
+
+    seated = np.array([p is not None for p in plan])
+    seats = np.array([capacity[list(p)].sum() if p else 0 for p in plan])
+    tables_used = np.array([len(p) if p else 0 for p in plan])
+    wasted = np.where(seated, seats - party, 0)
+
+    return {
+        'parties': int(len(plan)),
+        'seated': int(seated.sum()),
+        'unseated': int((~seated).sum()),
+        'unseatedCovers': int(party[~seated].sum()),
+        'wastedSeats': int(wasted.sum()),
+        'wastedSeatMinutes': int((wasted * duration).sum()),
+        'combinations': int((tables_used > 1).sum()),
+        'combinedTables': int(np.maximum(tables_used - 1, 0).sum())
+    }
+
+
+def plan_night(night, tables, time_limit=TIME_LIMIT):
+    """Optimized plan (or best-fit fallback) and greedy replay for one night"""
+    options = table_options(tables)
+
+    start = time.perf_counter()
+    plan, status = optimal_plan(night, tables, options, time_limit)
+    fallback = best_fit_plan(night, tables, options)
+    if plan is None:
+        print(f"   MILP unavailable ({status}) - using best-fit")
+    # A solve cut short by the time limit can trail the heuristic; keep the better plan
+    if plan is None or plan_cost(night, tables, fallback) < plan_cost(night, tables, plan):
+        plan, status = fallback, 'best-fit'
+    plan_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    greedy = greedy_plan(night, tables)
+    greedy_seconds = time.perf_counter() - start
+
+    return plan, status, {
+        'method': status,
+        'plan': {**plan_metrics(night, tables, plan), 'seconds': round(plan_seconds, 3)},
+        'greedy': {**plan_metrics(night, tables, greedy), 'seconds': round(greedy_seconds, 3)}
+    }
+
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def _table_number(number):
+    return int(number) if isinstance(number, (int, np.integer)) or str(number).isdigit() else str(number)
+
+
+def plan_assignments(night, tables, plan):
+    """Reservation ID -> date, time and planned table numbers"""
+    numbers = tables['number'].to_numpy()
+    return {
+        night['reservation_id'].iat[i]: {
+            'date': str(night['date'].iat[i].date()),
+            'time': night['time'].iat[i],
+            'tables': [_table_number(numbers[t]) for t in p]
+        }
+        for i, p in enumerate(plan) if p is not None
+    }
+
+
+def write_js_module(payload, output_file=OUTPUT_FILE):
+    module_js = f"""/**
+ * Nightly Seating Plan (Inline for Serverless Compatibility)
+ *
+ * GENERATED by ml-training-data/seating_plan.py - do not edit by hand.
+ *
+ * Tables planned per reservation ID, from a joint assignment of each night's
+ * reservations ({len(payload['assignments'])} reservations over {len(payload['nights'])} night(s)).
+ *
+ * Generated: {payload['generatedAt']}
+ */
+
+module.exports = {json.dumps(payload)};
+"""
+
+    tmp_file = output_file + '.tmp'
+    with open(tmp_file, 'w') as f:
+        f.write(module_js)
+    os.replace(tmp_file, output_file)
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Plan table assignments for whole nights of reservations')
+    parser.add_argument('input', nargs='?', help='CSV of reservations with ID, date, time and party size '
+                                                  '(default: pending reservations in the training log)')
+    parser.add_argument('--tables', default=None, help='CSV of tables (default: Tables from Airtable)')
+    parser.add_argument('--date', default=None, help='Only plan this night (YYYY-MM-DD)')
+    parser.add_argument('--time-limit', type=float, default=TIME_LIMIT, help='Solver budget per night (seconds)')
+    parser.add_argument('--output', default=OUTPUT_FILE, help='JS module for the API')
+    parser.add_argument('--report', default=REPORT_FILE, help='Plan vs greedy report (JSON)')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("SEATING PLAN OPTIMIZER")
+    print("=" * 80)
+
+    tables = table_frame(pd.read_csv(args.tables)) if args.tables else fetch_tables()
+
+    if args.input:
+        frame = reservation_frame(pd.read_csv(args.input))
+    else:
+        from training_log import load_training_table
+        frame = reservation_frame(upcoming_rows(load_training_table(), pd.Timestamp(datetime.now().date())))
+    if args.date:
+        frame = frame[frame['date'] == pd.Timestamp(args.date)].reset_index(drop=True)
+
+    duration_tables = load_duration_tables()
+    frame['duration'] = (planned_durations(duration_tables, frame) if duration_tables is not None
+                         else fixed_duration(frame['party_size'].to_numpy()))
+
+    print(f"\nTables: {len(tables)} active ({tables['capacity'].sum()} seats)")
+    print(f"Reservations: {len(frame):,} over {frame['date'].nunique()} night(s)")
+    print(f"Durations: {'learned (dining_durations.py)' if duration_tables is not None else 'fixed blocks'}")
+
+    if len(frame) == 0 or len(tables) == 0:
+        print("\nNothing to plan.")
+        sys.exit(1)
+
+    assignments, nights = {}, {}
+    print(f"\n{'night':<12} {'res':>5} {'unseated':>14} {'wasted seats':>14} {'combinations':>14} {'method':>12}")
+    print(f"{'':<12} {'':>5} {'plan / greedy':>14} {'plan / greedy':>14} {'plan / greedy':>14}")
+    for date, night in frame.groupby('date'):
+        night = night.reset_index(drop=True)
+        plan, status, comparison = plan_night(night, tables, args.time_limit)
+
+        key = str(date.date())
+        nights[key] = comparison
+        assignments.update(plan_assignments(night, tables, plan))
+
+        p, g = comparison['plan'], comparison['greedy']
+        print(f"{key:<12} {len(night):>5} {p['unseated']:>6} / {g['unseated']:<5} {p['wastedSeats']:>6} / {g['wastedSeats']:<5} "
+              f"{p['combinations']:>6} / {g['combinations']:<5} {status:>12}")
+
+    totals = {name: {metric: sum(n[name][metric] for n in nights.values())
+                     for metric in ['seated', 'unseated', 'wastedSeats', 'wastedSeatMinutes', 'combinations']}
+              for name in ['plan', 'greedy']}
+    print(f"\nTotal: plan seats {totals['plan']['seated']} parties with {totals['plan']['wastedSeats']} wasted seats "
+          f"and {totals['plan']['combinations']} combinations")
+    print(f"       greedy seats {totals['greedy']['seated']} parties with {totals['greedy']['wastedSeats']} wasted seats "
+          f"and {totals['greedy']['combinations']} combinations")
+
+    generated_at = datetime.now(timezone.utc).isoformat()
+
+    tmp_file = args.report + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump({'createdAt': generated_at, 'timeLimit': args.time_limit, 'totals': totals, 'nights': nights}, f, indent=2)
+    os.replace(tmp_file, args.report)
+
+    write_js_module({'generatedAt': generated_at, 'nights': sorted(nights), 'assignments': assignments}, args.output)
+
+    print(f"\nReport written: {args.report}")
+    print(f"API module written: {args.output}")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,263 @@
+"""
+Historical No-Show and Occupancy Tables by Day and Time Slot
+
+Builds the `historicalStats` lookup that api/ml/features.js reads for
+historical_no_show_rate_for_day / _for_time and occupancy_rate_for_slot,
+instead of its hard-coded defaults:
+
+    byDay[day_of_week]                  no-show rate (0 = Sunday, like Date.getDay())
+    byTimeSlot[hour]                    no-show rate
+    occupancyBySlot[hour]               seated covers / capacity
+    byDayHour[day_of_week][hour]        no-show rate
+    occupancyByDayHour[day_of_week][hour]
+
+Every service day is weighted by 0.5 ** (age_days / half_life), so recent
+weeks dominate. The decayed sums live in slot_stats.json; each run decays
+them to the new as-of date and folds in only the service days completed
+since the last run (a day is folded once it is SETTLE_DAYS old, so late
+outcomes have landed). Rates are shrunk toward the overall rate so sparse
+slots don't swing to 0 or 1.
+
+"No-show" means not showed_up (no-shows and cancellations), the same target
+retrain_custom_model.py trains on.
+
+Usage:
+    python slot_stats.py                     # incremental update
+    python slot_stats.py --full              # rebuild from the whole table
+    python slot_stats.py --half-life 14 --capacity 80 --full
+"""
+
+import sys
+import io
+if __name__ == '__main__':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+import argparse
+import json
+import os
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from reservation_features import js_day_of_week
+from training_log import load_training_table
+
+STATE_FILE = 'slot_stats.json'
+OUTPUT_FILE = '../api/ml/slot-stats.js'
+
+DAYS = 7
+HOURS = 24
+
+HALF_LIFE_DAYS = 28
+SETTLE_DAYS = 2
+
+# Pseudo-reservations of the overall rate added to every slot
+PRIOR_STRENGTH = 5.0
+
+DEFAULT_NO_SHOW_RATE = 0.15
+DEFAULT_CAPACITY = 60       # restaurant.fields.Capacity fallback in check-availability.js
+
+RESOLVED_OUTCOMES = ['showed_up', 'no_show', 'cancelled']
+
+
+# ============================================================================
+# SLOT FRAME
+# ============================================================================
+
+def slot_frame(table):
+    """Reservation date, (JS) day of week, hour and outcome flags per resolved reservation"""
+    date = pd.to_datetime(table['reservation_date'], errors='coerce').dt.normalize()
+    # parseInt(time.split(':')[0]) in features.js
+    hour = pd.to_numeric(table['reservation_time'].astype(str).str.extract(r'^\s*(\d+)', expand=False), errors='coerce')
+    outcome = table['actual_outcome'].astype(str)
+
+    df = pd.DataFrame({
+        'date': date,
+        'dow': js_day_of_week(date),
+        'hour': hour.clip(0, HOURS - 1),
+        'no_show': (outcome != 'showed_up').astype('float64'),
+        'covers': pd.to_numeric(table['party_size'], errors='coerce').fillna(0) * (outcome == 'showed_up')
+    })
+
+    df = df[outcome.isin(RESOLVED_OUTCOMES).to_numpy() & df['date'].notna().to_numpy() & df['hour'].notna().to_numpy()]
+    return df.astype({'dow': 'int64', 'hour': 'int64'})
+
+
+# ============================================================================
+# DECAYED STATE
+# ============================================================================
+
+def empty_state(half_life_days=HALF_LIFE_DAYS):
+    return {
+        'asOf': None,
+        'halfLifeDays': half_life_days,
+        'noShows': np.zeros((DAYS, HOURS)).tolist(),
+        'resolved': np.zeros((DAYS, HOURS)).tolist(),
+        'covers': np.zeros((DAYS, HOURS)).tolist(),
+        'serviceDays': np.zeros(DAYS).tolist()
+    }
+
+
+def load_state(state_file=STATE_FILE):
+    if not os.path.exists(state_file):
+        return None
+    with open(state_file, 'r') as f:
+        return json.load(f)
+
+
+def save_state(state, state_file=STATE_FILE):
+    tmp_file = state_file + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_file, state_file)
+
+
+def fold_days(state, slots, through):
+    """
+    Advance the state to `through` (a date): decay the existing sums, then add
+    every service day after the previous as-of date up to and including `through`.
+    """
+    half_life = state['halfLifeDays']
+    through = pd.Timestamp(through).normalize()
+    as_of = pd.Timestamp(state['asOf']) if state['asOf'] else None
+
+    sums = {name: np.asarray(state[name], dtype=np.float64) for name in ['noShows', 'resolved', 'covers', 'serviceDays']}
+
+    if as_of is not None:
+        decay = 0.5 ** ((through - as_of).days / half_life)
+        for name in sums:
+            sums[name] *= decay
+
+    new = slots[(slots['date'] <= through) & ((slots['date'] > as_of) if as_of is not None else True)]
+
+    weight = 0.5 ** ((through - new['date']).dt.days.to_numpy() / half_life)
+    cells = (new['dow'].to_numpy(), new['hour'].to_numpy())
+
+    np.add.at(sums['noShows'], cells, weight * new['no_show'].to_numpy())
+    np.add.at(sums['resolved'], cells, weight)
+    np.add.at(sums['covers'], cells, weight * new['covers'].to_numpy())
+
+    days = new.drop_duplicates('date')
+    np.add.at(sums['serviceDays'], days['dow'].to_numpy(), 0.5 ** ((through - days['date']).dt.days.to_numpy() / half_life))
+
+    state = {**state, 'asOf': through.strftime('%Y-%m-%d')}
+    state.update({name: values.tolist() for name, values in sums.items()})
+    return state, len(new), len(days)
+
+
+# ============================================================================
+# LOOKUP TABLES
+# ============================================================================
+
+def shrunk_rate(no_shows, resolved, prior):
+    return (no_shows + PRIOR_STRENGTH * prior) / (resolved + PRIOR_STRENGTH)
+
+
+def lookup_tables(state, capacity=DEFAULT_CAPACITY):
+    """historicalStats for features.js, computed from the decayed sums"""
+    no_shows = np.asarray(state['noShows'])
+    resolved = np.asarray(state['resolved'])
+    covers = np.asarray(state['covers'])
+    service_days = np.asarray(state['serviceDays'])
+
+    overall = no_shows.sum() / resolved.sum() if resolved.sum() > 0 else DEFAULT_NO_SHOW_RATE
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        occupancy = np.nan_to_num(covers / (service_days[:, None] * capacity)).clip(0, 1)
+        occupancy_by_slot = np.nan_to_num(covers.sum(axis=0) / (service_days.sum() * capacity)).clip(0, 1)
+
+    def rounded(values):
+        return np.round(values, 4).tolist()
+
+    return {
+        'overallNoShowRate': round(float(overall), 4),
+        'byDay': rounded(shrunk_rate(no_shows.sum(axis=1), resolved.sum(axis=1), overall)),
+        'byTimeSlot': rounded(shrunk_rate(no_shows.sum(axis=0), resolved.sum(axis=0), overall)),
+        'occupancyBySlot': rounded(occupancy_by_slot),
+        'byDayHour': rounded(shrunk_rate(no_shows, resolved, overall)),
+        'occupancyByDayHour': rounded(occupancy)
+    }
+
+
+def load_lookup_tables(state_file=STATE_FILE):
+    """Lookup tables stored by the last run (None if slot_stats.py has not run)"""
+    state = load_state(state_file)
+    return state.get('tables') if state else None
+
+
+def write_js_module(tables, state, output_file=OUTPUT_FILE):
+    payload = {
+        'generatedAt': datetime.now(timezone.utc).isoformat(),
+        'asOf': state['asOf'],
+        'halfLifeDays': state['halfLifeDays'],
+        **tables
+    }
+
+    module_js = f"""/**
+ * Historical No-Show / Occupancy Tables (Inline for Serverless Compatibility)
+ *
+ * GENERATED by ml-training-data/slot_stats.py - do not edit by hand.
+ *
+ * Passed to extractAllFeatures() as historicalStats. Indexed by day of week
+ * (0 = Sunday) and hour; time-decayed with a {state['halfLifeDays']}-day half-life.
+ *
+ * As of: {state['asOf']}
+ */
+
+module.exports = {json.dumps(payload)};
+"""
+
+    tmp_file = output_file + '.tmp'
+    with open(tmp_file, 'w') as f:
+        f.write(module_js)
+    os.replace(tmp_file, output_file)
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Build time-decayed no-show and occupancy tables by day and hour')
+    parser.add_argument('--full', action='store_true', help='Rebuild from every logged reservation')
+    parser.add_argument('--half-life', type=float, default=HALF_LIFE_DAYS, help='Decay half-life in days (with --full)')
+    parser.add_argument('--capacity', type=int, default=DEFAULT_CAPACITY, help='Restaurant capacity (seats)')
+    parser.add_argument('--output', default=OUTPUT_FILE, help='JS module for the API')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("HISTORICAL SLOT STATS" + (" (FULL REBUILD)" if args.full else ""))
+    print("=" * 80)
+
+    state = None if args.full else load_state()
+    if state is None:
+        state = empty_state(args.half_life)
+
+    slots = slot_frame(load_training_table())
+    through = pd.Timestamp(datetime.now(timezone.utc).date()) - pd.Timedelta(days=SETTLE_DAYS)
+
+    if state['asOf'] and pd.Timestamp(state['asOf']) >= through:
+        print(f"\nAlready up to date (as of {state['asOf']})")
+    else:
+        state, n_reservations, n_days = fold_days(state, slots, through)
+        print(f"\nFolded in {n_reservations:,} reservations from {n_days} service day(s)")
+
+    tables = lookup_tables(state, args.capacity)
+    state['tables'] = tables
+    state['capacity'] = args.capacity
+    save_state(state)
+    write_js_module(tables, state, args.output)
+
+    day_names = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat']
+    print(f"\nAs of {state['asOf']} (half-life {state['halfLifeDays']} days)")
+    print(f"Overall no-show rate: {tables['overallNoShowRate']:.1%}")
+    print("   " + "  ".join(f"{name}: {rate:.1%}" for name, rate in zip(day_names, tables['byDay'])))
+
+    print(f"\nState written: {STATE_FILE}")
+    print(f"API module written: {args.output}")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
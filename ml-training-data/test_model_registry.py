@@ -0,0 +1,180 @@
+"""
+Tests for model_registry.py: register, promote (champion gate and first-
+promotion baseline) and rollback, against a registry and live files in tmp_path.
+
+Usage:
+    python -m pytest test_model_registry.py
+"""
+
+import pytest
+
+from model_registry import beats, list_manifests, load_index, load_manifest, promote, register, rollback
+
+
+def write(path, text):
+    path.write_text(text)
+    return str(path)
+
+
+@pytest.fixture
+def registry_dir(tmp_path):
+    return str(tmp_path / 'model-registry')
+
+
+@pytest.fixture
+def live(tmp_path):
+    """Live targets (absolute, so they resolve outside ml-training-data/)"""
+    return {'booster': str(tmp_path / 'live' / 'model.json'), 'metadata': str(tmp_path / 'live' / 'metadata.json')}
+
+
+def stage(tmp_path, name, booster, metadata):
+    staging = tmp_path / name
+    staging.mkdir()
+    return {'booster': write(staging / 'model.json', booster), 'metadata': write(staging / 'metadata.json', metadata)}
+
+
+def read_live(live):
+    return {role: open(path).read() for role, path in live.items()}
+
+
+# ============================================================================
+# REGISTER
+# ============================================================================
+
+def test_register_stores_files_without_deploying(tmp_path, registry_dir, live):
+    staged = stage(tmp_path, 'a', 'booster-a', '{"v": "a"}')
+    manifest = register('v2', staged, live, metrics={'rocAuc': 0.8}, registry_dir=registry_dir, note='first')
+
+    assert manifest['name'] == 'v2'
+    assert manifest['metrics'] == {'rocAuc': 0.8}
+    assert manifest['note'] == 'first'
+    assert manifest['sizeBytes'] == len('booster-a') + len('{"v": "a"}')
+    assert manifest['files']['booster']['target'] == live['booster']
+    assert load_manifest('v2', manifest['hash'], registry_dir) == manifest
+    assert load_index('v2', registry_dir)['champion'] is None
+    assert not any((tmp_path / 'live').glob('*'))
+
+
+def test_register_same_content_returns_existing_manifest(tmp_path, registry_dir, live):
+    first = register('v2', stage(tmp_path, 'a', 'booster', 'meta'), live, metrics={'rocAuc': 0.8}, registry_dir=registry_dir)
+    again = register('v2', stage(tmp_path, 'b', 'booster', 'meta'), live, metrics={'rocAuc': 0.9}, registry_dir=registry_dir)
+
+    assert again == first
+    assert len(list_manifests('v2', registry_dir)) == 1
+
+
+def test_load_manifest_unknown_hash(registry_dir):
+    with pytest.raises(KeyError):
+        load_manifest('v2', '0' * 16, registry_dir)
+
+
+# ============================================================================
+# PROMOTE
+# ============================================================================
+
+def test_beats_gate():
+    champion = {'metrics': {'rocAuc': 0.80}}
+    assert beats({'metrics': {'rocAuc': 0.80}}, champion)
+    assert beats({'metrics': {'rocAuc': 0.81}}, champion)
+    assert not beats({'metrics': {'rocAuc': 0.79}}, champion)
+    assert beats({'metrics': {'rocAuc': 0.795}}, champion, tolerance=0.01)
+    assert not beats({'metrics': {}}, champion)
+    assert beats({'metrics': {}}, {'metrics': {}})
+    assert beats({'metrics': {'prAuc': 0.5, 'rocAuc': 0.7}}, {'metrics': {'prAuc': 0.4, 'rocAuc': 0.8}}, metric='prAuc')
+
+
+def test_first_promotion_registers_live_files_as_baseline(tmp_path, registry_dir, live):
+    (tmp_path / 'live').mkdir()
+    write(tmp_path / 'live' / 'model.json', 'booster-old')
+    write(tmp_path / 'live' / 'metadata.json', 'meta-old')
+
+    manifest = register('v2', stage(tmp_path, 'a', 'booster-a', 'meta-a'), live, metrics={'rocAuc': 0.8}, registry_dir=registry_dir)
+    promoted, _ = promote('v2', manifest['hash'], registry_dir=registry_dir)
+
+    assert promoted
+    assert read_live(live) == {'booster': 'booster-a', 'metadata': 'meta-a'}
+
+    index = load_index('v2', registry_dir)
+    assert index['champion'] == manifest['hash']
+    assert [entry['reason'] for entry in index['history']][0] == 'baseline'
+
+    baseline = load_manifest('v2', index['history'][0]['hash'], registry_dir)
+    assert baseline['source'] == 'live files before first promotion'
+    assert baseline['metrics'] == {}
+
+
+def test_first_promotion_without_live_files(tmp_path, registry_dir, live):
+    manifest = register('v2', stage(tmp_path, 'a', 'booster-a', 'meta-a'), live, metrics={'rocAuc': 0.8}, registry_dir=registry_dir)
+    promoted, _ = promote('v2', manifest['hash'], registry_dir=registry_dir)
+
+    assert promoted
+    assert read_live(live) == {'booster': 'booster-a', 'metadata': 'meta-a'}
+    assert [entry['hash'] for entry in load_index('v2', registry_dir)['history']] == [manifest['hash']]
+
+
+def test_promote_keeps_champion_when_candidate_is_worse(tmp_path, registry_dir, live):
+    good = register('v2', stage(tmp_path, 'a', 'booster-a', 'meta-a'), live, metrics={'rocAuc': 0.8}, registry_dir=registry_dir)
+    worse = register('v2', stage(tmp_path, 'b', 'booster-b', 'meta-b'), live, metrics={'rocAuc': 0.7}, registry_dir=registry_dir)
+    promote('v2', good['hash'], registry_dir=registry_dir)
+
+    promoted, message = promote('v2', worse['hash'], registry_dir=registry_dir)
+
+    assert not promoted
+    assert 'does not beat champion' in message
+    assert load_index('v2', registry_dir)['champion'] == good['hash']
+    assert read_live(live) == {'booster': 'booster-a', 'metadata': 'meta-a'}
+
+    promoted, _ = promote('v2', worse['hash'], tolerance=0.2, registry_dir=registry_dir)
+    assert promoted
+    assert read_live(live) == {'booster': 'booster-b', 'metadata': 'meta-b'}
+
+
+def test_promote_force_and_current_champion(tmp_path, registry_dir, live):
+    good = register('v2', stage(tmp_path, 'a', 'booster-a', 'meta-a'), live, metrics={'rocAuc': 0.8}, registry_dir=registry_dir)
+    worse = register('v2', stage(tmp_path, 'b', 'booster-b', 'meta-b'), live, metrics={'rocAuc': 0.7}, registry_dir=registry_dir)
+    promote('v2', good['hash'], registry_dir=registry_dir)
+
+    promoted, message = promote('v2', good['hash'], registry_dir=registry_dir)
+    assert not promoted
+    assert 'already the champion' in message
+
+    promoted, _ = promote('v2', worse['hash'], force=True, registry_dir=registry_dir)
+    assert promoted
+    assert load_index('v2', registry_dir)['history'][-1]['reason'] == 'forced'
+    assert read_live(live)['booster'] == 'booster-b'
+
+
+# ============================================================================
+# ROLLBACK
+# ============================================================================
+
+def test_rollback_redeploys_previous_champion(tmp_path, registry_dir, live):
+    first = register('v2', stage(tmp_path, 'a', 'booster-a', 'meta-a'), live, metrics={'rocAuc': 0.8}, registry_dir=registry_dir)
+    second = register('v2', stage(tmp_path, 'b', 'booster-b', 'meta-b'), live, metrics={'rocAuc': 0.9}, registry_dir=registry_dir)
+    promote('v2', first['hash'], registry_dir=registry_dir)
+    promote('v2', second['hash'], registry_dir=registry_dir)
+
+    manifest = rollback('v2', registry_dir=registry_dir)
+
+    assert manifest['hash'] == first['hash']
+    assert read_live(live) == {'booster': 'booster-a', 'metadata': 'meta-a'}
+
+    index = load_index('v2', registry_dir)
+    assert index['champion'] == first['hash']
+    assert [entry['hash'] for entry in index['history']] == [first['hash']]
+    assert [entry['hash'] for entry in index['rolledBack']] == [second['hash']]
+
+    # The rolled-back artifact stays registered and can be promoted again
+    promoted, _ = promote('v2', second['hash'], registry_dir=registry_dir)
+    assert promoted
+
+
+def test_rollback_without_previous_champion(tmp_path, registry_dir, live):
+    manifest = register('v2', stage(tmp_path, 'a', 'booster-a', 'meta-a'), live, registry_dir=registry_dir)
+    promote('v2', manifest['hash'], registry_dir=registry_dir)
+
+    with pytest.raises(ValueError):
+        rollback('v2', registry_dir=registry_dir)
+    with pytest.raises(ValueError):
+        rollback('custom', registry_dir=registry_dir)
+
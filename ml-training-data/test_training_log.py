@@ -0,0 +1,156 @@
+"""
+Tests for training_log.py compaction: incremental merges, partial lines,
+re-logged reservations, orphan outcomes and full rebuilds (which keep rows
+the old CSV logger wrote), against an event log and table in tmp_path.
+
+Usage:
+    python -m pytest test_training_log.py
+"""
+
+import json
+
+import pandas as pd
+import pytest
+
+from training_log import apply_types, compact, load_state, load_training_table, write_training_table
+
+
+def created(reservation_id, party_size=2, date='2026-11-06'):
+    return {
+        'type': 'reservation_created',
+        'reservation_id': reservation_id,
+        'location_id': 'main',
+        'created_at': '2026-10-17T10:00:00Z',
+        'reservation_date': date,
+        'reservation_time': '19:00',
+        'customer_email': f'{reservation_id.lower()}@example.com',
+        'party_size': party_size,
+        'booking_lead_time_hours': 48,
+        'ml_predicted_probability': 0.2,
+        'ml_predicted_risk_level': 'medium'
+    }
+
+
+def outcome(reservation_id, actual_outcome, seated_at='', completed_at=''):
+    return {
+        'type': 'outcome',
+        'reservation_id': reservation_id,
+        'actual_outcome': actual_outcome,
+        'outcome_timestamp': '2026-11-06T19:05:00Z',
+        'seated_at': seated_at,
+        'completed_at': completed_at
+    }
+
+
+@pytest.fixture
+def paths(tmp_path):
+    events_dir = tmp_path / 'training-events'
+    events_dir.mkdir()
+    return {
+        'events_dir': str(events_dir),
+        'table_file': str(tmp_path / 'restaurant_training_data.csv'),
+        'state_file': str(events_dir / 'compaction_state.json')
+    }
+
+
+def append(paths, events, segment='events-2026-10-17.jsonl', partial=''):
+    with open(f"{paths['events_dir']}/{segment}", 'a') as f:
+        for event in events:
+            f.write(json.dumps(event) + '\n')
+        f.write(partial)
+
+
+def outcomes_by_id(paths):
+    table = load_training_table(paths['table_file'])
+    return dict(zip(table['reservation_id'], table['actual_outcome'].astype(str)))
+
+
+def test_compact_joins_reservations_and_outcomes(paths):
+    append(paths, [created('RES-1'), created('RES-2', party_size=4), outcome('RES-1', 'showed_up', '19:02', '20:30')])
+
+    summary = compact(**paths)
+
+    assert summary['events'] == 3
+    assert summary['newReservations'] == 2
+    assert summary['rows'] == 2
+    assert outcomes_by_id(paths) == {'RES-1': 'showed_up', 'RES-2': 'pending'}
+
+    table = load_training_table(paths['table_file']).set_index('reservation_id')
+    assert table.loc['RES-1', 'seated_at'] == '19:02'
+    assert table.loc['RES-2', 'party_size'] == 4
+
+
+def test_compact_only_reads_new_complete_lines(paths):
+    partial = json.dumps(outcome('RES-1', 'no_show'))
+    append(paths, [created('RES-1')], partial=partial[:20])
+
+    assert compact(**paths)['events'] == 1
+    offset = load_state(paths['state_file'])['segments']['events-2026-10-17.jsonl']
+
+    # Finish the half-written line; the next run picks it up
+    append(paths, [], partial=partial[20:] + '\n')
+    summary = compact(**paths)
+
+    assert summary['events'] == 1
+    assert summary['newReservations'] == 0
+    assert outcomes_by_id(paths) == {'RES-1': 'no_show'}
+    assert load_state(paths['state_file'])['segments']['events-2026-10-17.jsonl'] > offset
+
+    assert compact(**paths)['events'] == 0
+
+
+def test_latest_outcome_wins_and_relogged_reservation_keeps_it(paths):
+    append(paths, [created('RES-1'), outcome('RES-1', 'cancelled')])
+    compact(**paths)
+
+    append(paths, [outcome('RES-1', 'showed_up'), created('RES-1', party_size=6)], segment='events-2026-10-18.jsonl')
+    summary = compact(**paths)
+
+    assert summary['rows'] == 1
+    table = load_training_table(paths['table_file'])
+    assert table['actual_outcome'].astype(str).tolist() == ['showed_up']
+    assert table['party_size'].tolist() == [6]
+
+
+def test_orphan_outcomes_are_retried(paths):
+    append(paths, [outcome('RES-9', 'no_show')])
+
+    summary = compact(**paths)
+    assert summary['rows'] == 0
+    assert summary['orphanOutcomes'] == 1
+
+    append(paths, [created('RES-9')], segment='events-2026-10-18.jsonl')
+    summary = compact(**paths)
+
+    assert summary['orphanOutcomes'] == 0
+    assert outcomes_by_id(paths) == {'RES-9': 'no_show'}
+
+
+def test_full_rebuild_matches_incremental(paths):
+    append(paths, [created('RES-1'), created('RES-2')])
+    compact(**paths)
+    append(paths, [outcome('RES-2', 'no_show'), created('RES-3', party_size=3)], segment='events-2026-10-18.jsonl')
+    compact(**paths)
+    incremental = load_training_table(paths['table_file'])
+
+    summary = compact(full=True, **paths)
+    rebuilt = load_training_table(paths['table_file'])
+
+    assert summary['events'] == 4
+    assert rebuilt.sort_values('reservation_id').reset_index(drop=True).equals(
+        incremental.sort_values('reservation_id').reset_index(drop=True)
+    )
+
+
+def test_full_rebuild_keeps_rows_without_events(paths):
+    # Written by the old CSV logger, before the event log existed
+    legacy = {key: value for key, value in created('RES-OLD').items() if key != 'type'}
+    write_training_table(apply_types(pd.DataFrame([dict(legacy, actual_outcome='no_show')])), paths['table_file'])
+
+    append(paths, [created('RES-1'), outcome('RES-1', 'showed_up')])
+    compact(**paths)
+
+    summary = compact(full=True, **paths)
+
+    assert summary['rows'] == 2
+    assert outcomes_by_id(paths) == {'RES-OLD': 'no_show', 'RES-1': 'showed_up'}
@@ -0,0 +1,240 @@
+"""
+Training Thread Scaling Report
+
+The nightly retrain shares a small box with other cron jobs, so how many
+cores it takes matters as much as how long it runs. This script trains the v2
+model (config from model_v2_metadata.json, tree_method hist) at each thread
+count and max_bin, and records for every run:
+
+    - wall time (best of --repeats) and CPU time
+    - speedup and parallel efficiency vs. 1 thread
+    - ROC-AUC on the same test split train_model.py uses
+
+It then recommends the cheapest setting - fewest threads, then least CPU time -
+that finishes within --budget seconds without losing more than AUC_TOLERANCE
+AUC. Without --budget, the budget is the fastest run plus KNEE_TOLERANCE, i.e.
+the point where adding threads stops paying off.
+
+Usage:
+    python thread_scaling.py                                 # 1/2/4/8 threads, max_bin 256
+    python thread_scaling.py --threads 1,2,4 --max-bins 64,256 --repeats 3
+    python thread_scaling.py --budget 120                    # nightly window in seconds
+
+Data defaults to the feature matrix cached by train_model.py.
+"""
+
+import sys
+import io
+if __name__ == '__main__':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+import argparse
+import json
+import os
+import platform
+import time
+from datetime import datetime
+
+import numpy as np
+import xgboost as xgb
+from sklearn.metrics import roc_auc_score
+from sklearn.model_selection import train_test_split
+
+from feature_cache import latest_cached_features
+from hyperparam_search import config_to_params
+
+METADATA_FILE = 'model_v2_metadata.json'
+REPORT_FILE = 'thread_scaling_report.json'
+
+THREADS = [1, 2, 4, 8]
+MAX_BINS = [256]
+REPEATS = 2
+
+# Same split as train_model.py
+TEST_SIZE = 0.2
+SPLIT_SEED = 42
+
+# A setting may lose at most this much test AUC vs. the best run
+AUC_TOLERANCE = 0.002
+
+# Default budget: within 10% of the fastest run
+KNEE_TOLERANCE = 0.10
+
+
+# ============================================================================
+# DATA
+# ============================================================================
+
+def load_dataset(data_file, label_column, feature_names):
+    """(X, y) from a CSV, or from train_model.py's feature cache when no CSV is given"""
+    if data_file:
+        import pandas as pd
+        df = pd.read_csv(data_file)
+        return df[feature_names].to_numpy(dtype=np.float32), df[label_column].to_numpy()
+
+    cached = latest_cached_features()
+    if cached is None:
+        raise FileNotFoundError("No cached feature matrix - run train_model.py first or pass --data")
+
+    X, y, metadata = cached
+    if metadata['featureNames'] != feature_names:
+        raise ValueError("Cached feature matrix does not match the model's feature names")
+    return np.asarray(X), np.asarray(y)
+
+
+def load_config(metadata_file):
+    """v2 training config (hyperparameters only - the search summary is dropped)"""
+    with open(metadata_file, 'r') as f:
+        metadata = json.load(f)
+
+    config = dict(metadata.get('config', {}))
+    config.pop('search', None)
+    return config, metadata['featureNames']
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def _cpu_seconds():
+    usage = os.times()
+    return usage.user + usage.system
+
+
+def time_training(config, threads, max_bin, X_train, y_train, X_test, y_test, repeats):
+    """Train at one setting `repeats` times; best wall time, its CPU time, and test AUC"""
+    best = None
+    for _ in range(repeats):
+        model = xgb.XGBClassifier(
+            **config_to_params({**config, 'treeMethod': 'hist', 'maxBin': max_bin}),
+            n_jobs=threads,
+            eval_metric='logloss'
+        )
+
+        wall_start, cpu_start = time.perf_counter(), _cpu_seconds()
+        model.fit(X_train, y_train, verbose=False)
+        wall, cpu = time.perf_counter() - wall_start, _cpu_seconds() - cpu_start
+
+        if best is None or wall < best['wallSeconds']:
+            best = {'wallSeconds': wall, 'cpuSeconds': cpu}
+
+    auc = roc_auc_score(y_test, model.predict_proba(X_test)[:, 1])
+
+    return {
+        'threads': threads,
+        'maxBin': max_bin,
+        'wallSeconds': round(best['wallSeconds'], 3),
+        'cpuSeconds': round(best['cpuSeconds'], 3),
+        'testAuc': round(float(auc), 5)
+    }
+
+
+def add_scaling(runs):
+    """Speedup and efficiency vs. the single-thread run at the same max_bin"""
+    for run in runs:
+        single = next((r for r in runs if r['maxBin'] == run['maxBin'] and r['threads'] == 1), None)
+        if single is None:
+            continue
+        run['speedup'] = round(single['wallSeconds'] / run['wallSeconds'], 2)
+        run['efficiency'] = round(run['speedup'] / run['threads'], 2)
+    return runs
+
+
+def recommend(runs, budget=None):
+    """Fewest threads (then least CPU) within the time budget and AUC tolerance"""
+    if budget is None:
+        budget = min(r['wallSeconds'] for r in runs) * (1 + KNEE_TOLERANCE)
+
+    best_auc = max(r['testAuc'] for r in runs)
+    eligible = [r for r in runs if r['wallSeconds'] <= budget and r['testAuc'] >= best_auc - AUC_TOLERANCE]
+    if not eligible:
+        return None, budget
+
+    return min(eligible, key=lambda r: (r['threads'], r['cpuSeconds'])), budget
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def parse_list(text):
+    return [int(value) for value in text.split(',') if value.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure v2 training wall time and AUC across thread counts')
+    parser.add_argument('--threads', type=parse_list, default=THREADS, help='Comma-separated thread counts')
+    parser.add_argument('--max-bins', type=parse_list, default=MAX_BINS, help='Comma-separated max_bin values')
+    parser.add_argument('--repeats', type=int, default=REPEATS, help='Training runs per setting (best wall time wins)')
+    parser.add_argument('--budget', type=float, default=None, help='Wall-time budget in seconds for the recommendation')
+    parser.add_argument('--metadata', default=METADATA_FILE, help='Metadata file with config and featureNames')
+    parser.add_argument('--data', default=None, help='CSV with the feature columns (default: cached matrix)')
+    parser.add_argument('--label', default='is_canceled', help='Label column when --data is given')
+    parser.add_argument('--output', default=REPORT_FILE, help='Report file')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("TRAINING THREAD SCALING REPORT")
+    print("=" * 80)
+
+    config, feature_names = load_config(args.metadata)
+    X, y = load_dataset(args.data, args.label, feature_names)
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=TEST_SIZE, random_state=SPLIT_SEED, stratify=y
+    )
+
+    cpu_count = os.cpu_count()
+    print(f"\nSamples: {len(X):,} ({len(X_train):,} train / {len(X_test):,} test)")
+    print(f"Config: {json.dumps(config)}")
+    print(f"CPU cores: {cpu_count}")
+    if max(args.threads) > cpu_count:
+        print(f"   Note: thread counts above {cpu_count} oversubscribe this machine")
+
+    print(f"\n{'threads':>8} {'max_bin':>8} {'wall s':>9} {'cpu s':>9} {'speedup':>8} {'eff':>6} {'AUC':>8}")
+    runs = []
+    for max_bin in args.max_bins:
+        for threads in args.threads:
+            runs.append(time_training(config, threads, max_bin, X_train, y_train, X_test, y_test, args.repeats))
+            add_scaling(runs)
+            run = runs[-1]
+            print(f"{run['threads']:>8} {run['maxBin']:>8} {run['wallSeconds']:>9.2f} {run['cpuSeconds']:>9.2f} "
+                  f"{run.get('speedup', float('nan')):>8.2f} {run.get('efficiency', float('nan')):>6.2f} {run['testAuc']:>8.4f}")
+
+    choice, budget = recommend(runs, args.budget)
+
+    report = {
+        'createdAt': datetime.now().isoformat(),
+        'environment': {
+            'cpuCount': cpu_count,
+            'machine': platform.machine(),
+            'python': platform.python_version(),
+            'xgboost': xgb.__version__
+        },
+        'samples': {'train': len(X_train), 'test': len(X_test)},
+        'config': config,
+        'runs': runs,
+        'recommendation': {
+            'budgetSeconds': round(budget, 3),
+            'aucTolerance': AUC_TOLERANCE,
+            'setting': choice
+        }
+    }
+
+    tmp_file = args.output + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(report, f, indent=2)
+    os.replace(tmp_file, args.output)
+
+    print(f"\nBudget: {budget:.1f}s, AUC within {AUC_TOLERANCE} of best")
+    if choice is None:
+        print("No setting meets the budget - raise --budget or lower max_bin / nEstimators")
+    else:
+        print(f"Recommended: --threads {choice['threads']} --max-bin {choice['maxBin']} "
+              f"({choice['wallSeconds']:.1f}s wall, {choice['cpuSeconds']:.1f}s CPU, AUC {choice['testAuc']:.4f})")
+
+    print(f"\nReport written: {args.output}")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,356 @@
+"""
+Per-Location No-Show Models
+
+retrain_custom_model.py fits one model on every logged reservation. With many
+locations that model gets slower to retrain and blurs the patterns of each
+location. This script partitions completed reservations by location_id and
+fits one small model per location in a process pool:
+
+    - a location with at least MIN_LOCATION_SAMPLES completed reservations
+      gets its own model. It is kept only if its holdout AUC is within
+      AUC_TOLERANCE of the pooled global model's on that same holdout.
+    - smaller locations, and locations whose own model loses, are served by
+      the global model trained on all locations
+    - a location's model is refit only when its rows changed (a hash kept in
+      location-models/state.json). The global model is refit only once the
+      pooled data has grown by GLOBAL_REFIT_GROWTH, so adding a location
+      costs one small fit.
+
+Every model uses the custom model's 7 features, computed by
+reservation_features.py the same way features.js does. The models are written
+as one bundle, api/ml/location-models.js. predict.js picks a model from it by
+reservation.location_id (or the LOCATION_ID env var). Reservations logged
+without either are pooled under UNLABELLED_LOCATION, and predict.js routes
+unlabelled reservations to that entry. A location missing from the bundle keeps
+the default model. Both internal keys are dunder names, so they can never clash
+with a real location_id. The bundle is deployed through model_registry.py under
+the name 'locations'.
+
+Usage:
+    python train_locations.py                    # refit changed locations, write the bundle
+    python train_locations.py --full             # refit every location and the global model
+    python train_locations.py --min-samples 300 --jobs 4
+"""
+
+import sys
+import io
+if __name__ == '__main__':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from customer_features import point_in_time_history
+from export_model import pack_trees, packed_payload
+from model_registry import promote, register
+from reservation_features import build_features, reservation_frame
+from training_log import compact, load_training_table
+
+MODELS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'location-models')
+STATE_FILE = os.path.join(MODELS_DIR, 'state.json')
+BUNDLE_FILE = '../api/ml/location-models.js'
+
+BUNDLE_FORMAT = 'location-bundle-v1'
+# Internal keys, never valid location_ids
+GLOBAL_MODEL = '__global__'
+UNLABELLED_LOCATION = '__unlabelled__'  # reservations logged without a location_id (same key in predict.js)
+
+REGISTRY_NAME = 'locations'
+
+MIN_LOCATION_SAMPLES = 200
+GLOBAL_REFIT_GROWTH = 0.2
+HOLDOUT_SIZE = 0.2
+
+# A location keeps its own model unless it loses more than this much holdout AUC to the global model
+AUC_TOLERANCE = 0.005
+
+FEATURE_NAMES = [
+    'booking_lead_time_hours',
+    'party_size',
+    'is_repeat_customer',
+    'customer_visit_count',
+    'customer_no_show_rate',
+    'days_since_last_visit',
+    'has_special_requests'
+]
+
+XGB_PARAMS = {
+    'objective': 'binary:logistic',
+    'eval_metric': 'logloss',
+    'max_depth': 4,
+    'learning_rate': 0.1,
+    'subsample': 0.8,
+    'colsample_bytree': 0.8,
+    'tree_method': 'hist',
+    'nthread': 1,  # parallelism comes from the process pool
+    'seed': 42
+}
+NUM_ROUNDS = 50
+
+
+# ============================================================================
+# DATA
+# ============================================================================
+
+def load_dataset():
+    """Completed reservations as (features, target, location, holdout)"""
+    df = load_training_table()
+    history, history_as_of = point_in_time_history(df)
+
+    completed = df[df['actual_outcome'].isin(['showed_up', 'no_show', 'cancelled'])]
+    features = build_features(
+        reservation_frame(completed),
+        history.loc[completed.index],
+        now=history_as_of.loc[completed.index]
+    )
+
+    buckets = completed['reservation_id'].map(lambda r: zlib.crc32(str(r).encode()) % 100)
+
+    return pd.DataFrame({
+        **{name: features[name].astype(np.float32) for name in FEATURE_NAMES},
+        'target': (completed['actual_outcome'] != 'showed_up').astype(np.int8),
+        'location': completed['location_id'].replace('', UNLABELLED_LOCATION),
+        'holdout': buckets < int(HOLDOUT_SIZE * 100)
+    })
+
+
+def rows_hash(rows):
+    """Changes whenever a location's rows (features or outcomes) change"""
+    hashed = pd.util.hash_pandas_object(rows[FEATURE_NAMES + ['target', 'holdout']], index=False)
+    return hashlib.sha256(hashed.to_numpy().tobytes()).hexdigest()[:16]
+
+
+def model_path(key):
+    return os.path.join(MODELS_DIR, hashlib.sha256(key.encode('utf-8')).hexdigest()[:16] + '.json')
+
+
+def load_state():
+    if not os.path.exists(STATE_FILE):
+        return {'global': None, 'locations': {}}
+    with open(STATE_FILE, 'r') as f:
+        return json.load(f)
+
+
+def save_state(state):
+    tmp_file = STATE_FILE + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_file, STATE_FILE)
+
+
+# ============================================================================
+# TRAINING (process pool)
+# ============================================================================
+
+def fit_model(task):
+    """Fit one model on its training rows and save it; returns (key, seconds)"""
+    import xgboost as xgb
+
+    key, X, y, output_file = task
+
+    start = time.perf_counter()
+    booster = xgb.train(XGB_PARAMS, xgb.DMatrix(X, label=y), num_boost_round=NUM_ROUNDS)
+    booster.save_model(output_file)
+    return key, time.perf_counter() - start
+
+
+def load_model(key):
+    import xgboost as xgb
+
+    booster = xgb.Booster()
+    booster.load_model(model_path(key))
+    return booster
+
+
+def holdout_auc(booster, rows):
+    """ROC-AUC on a location's holdout rows, or None when it has a single class"""
+    import xgboost as xgb
+    from sklearn.metrics import roc_auc_score
+
+    if rows['target'].nunique() < 2:
+        return None
+    return float(roc_auc_score(rows['target'], booster.predict(xgb.DMatrix(rows[FEATURE_NAMES].to_numpy()))))
+
+
+def plan_fits(data, state, min_samples, full):
+    """Which models need a (re)fit this run, as pool tasks"""
+    tasks = []
+
+    train = data[~data['holdout']]
+    previous_global = state['global']
+    if (full or previous_global is None or not os.path.exists(model_path(GLOBAL_MODEL))
+            or len(train) >= previous_global['trainRows'] * (1 + GLOBAL_REFIT_GROWTH)):
+        tasks.append((GLOBAL_MODEL, train[FEATURE_NAMES].to_numpy(), train['target'].to_numpy(), model_path(GLOBAL_MODEL)))
+
+    for location, rows in data.groupby('location'):
+        if len(rows) < min_samples:
+            continue
+
+        previous = state['locations'].get(location)
+        if not full and previous and previous.get('dataHash') == rows_hash(rows) and os.path.exists(model_path(location)):
+            continue
+
+        location_train = rows[~rows['holdout']]
+        tasks.append((location, location_train[FEATURE_NAMES].to_numpy(), location_train['target'].to_numpy(),
+                      model_path(location)))
+
+    return tasks
+
+
+# ============================================================================
+# BUNDLE
+# ============================================================================
+
+def write_bundle(output_file, assignments, version):
+    """
+    One CommonJS module with every distinct model (packed like model-trees.js)
+    and the location -> model key map predict.js routes by.
+    """
+    import xgboost as xgb
+
+    models = {}
+    for key in sorted(set(assignments.values())):
+        booster = xgb.Booster()
+        booster.load_model(model_path(key))
+        packed = pack_trees(json.loads(booster.save_raw('json')))
+        models[key] = packed_payload(packed, version, FEATURE_NAMES, os.path.basename(model_path(key)))
+
+    bundle = {
+        'format': BUNDLE_FORMAT,
+        'version': version,
+        'exportedAt': datetime.now().isoformat(),
+        'featureNames': FEATURE_NAMES,
+        'locations': dict(sorted(assignments.items())),
+        'models': models
+    }
+
+    module_js = f"""/**
+ * Per-Location No-Show Models (Inline for Serverless Compatibility)
+ *
+ * GENERATED by ml-training-data/train_locations.py - do not edit by hand.
+ *
+ * locations maps location_id -> model key; each model is a packed tree export
+ * (same format as model-trees.js). {UNLABELLED_LOCATION} holds reservations without a
+ * location_id; locations not listed use the default model.
+ *
+ * Locations: {len(assignments)}, models: {len(models)}
+ */
+
+module.exports = {json.dumps(bundle, indent=2)};
+"""
+
+    with open(output_file, 'w') as f:
+        f.write(module_js)
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def format_auc(auc):
+    return f"{auc:.4f}" if auc is not None else "n/a"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Train per-location no-show models with a pooled fallback')
+    parser.add_argument('--min-samples', type=int, default=MIN_LOCATION_SAMPLES,
+                        help='Completed reservations a location needs for its own model')
+    parser.add_argument('--jobs', type=int, default=None, help='Worker processes (default: all cores)')
+    parser.add_argument('--full', action='store_true', help='Refit every location and the global model')
+    parser.add_argument('--version', default='3.0.0', help='Model version recorded in the bundle')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("PER-LOCATION NO-SHOW MODELS")
+    print("=" * 80)
+
+    print("\nCompacting training event log...")
+    compaction = compact()
+    print(f"   New events: {compaction['events']} ({compaction['newReservations']} new reservations)")
+
+    data = load_dataset()
+    if len(data) == 0:
+        print("\nERROR: No completed reservations logged yet!")
+        sys.exit(1)
+
+    counts = data['location'].value_counts()
+    print(f"\nCompleted reservations: {len(data):,} across {len(counts)} location(s)")
+    print(f"   Own model (>= {args.min_samples}): {int((counts >= args.min_samples).sum())}, "
+          f"pooled: {int((counts < args.min_samples).sum())}")
+
+    os.makedirs(MODELS_DIR, exist_ok=True)
+    state = load_state()
+
+    tasks = plan_fits(data, state, args.min_samples, args.full)
+    n_models = int((counts >= args.min_samples).sum()) + 1
+    print(f"\nFitting {len(tasks)} of {n_models} model(s) (the rest are unchanged)...")
+
+    if tasks:
+        n_jobs = args.jobs or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(tasks))) as pool:
+            for key, seconds in pool.map(fit_model, tasks):
+                print(f"   {key:<24} {seconds:6.2f}s")
+
+    refit = {task[0] for task in tasks}
+    if GLOBAL_MODEL in refit:
+        state['global'] = {'trainRows': int((~data['holdout']).sum()), 'trainedAt': datetime.now().isoformat()}
+
+    # Each location: its own model if it holds up against the global model on its holdout
+    global_model = load_model(GLOBAL_MODEL)
+    assignments = {}
+
+    print(f"\n{'location':<24} {'rows':>7} {'own AUC':>8} {'global AUC':>11}  model")
+    for location, rows in data.groupby('location'):
+        holdout = rows[rows['holdout']]
+        global_auc = holdout_auc(global_model, holdout)
+        own_auc = None
+
+        if len(rows) >= args.min_samples:
+            if location in refit:
+                state['locations'][location] = {'dataHash': rows_hash(rows), 'trainedAt': datetime.now().isoformat()}
+            own_auc = holdout_auc(load_model(location), holdout)
+
+        keep_own = own_auc is not None and (global_auc is None or own_auc >= global_auc - AUC_TOLERANCE)
+        assignments[location] = location if keep_own else GLOBAL_MODEL
+
+        if location in state['locations']:
+            state['locations'][location].update({'rows': int(len(rows)), 'holdoutAuc': own_auc, 'globalHoldoutAuc': global_auc})
+
+        print(f"{location:<24} {len(rows):>7} {format_auc(own_auc):>8} {format_auc(global_auc):>11}  {assignments[location]}")
+
+    save_state(state)
+
+    # Stage the bundle and deploy it through the registry (rollback: model_registry.py rollback locations)
+    staging_dir = tempfile.mkdtemp(prefix='location-models-')
+    staged = os.path.join(staging_dir, os.path.basename(BUNDLE_FILE))
+    write_bundle(staged, assignments, args.version)
+
+    manifest = register(REGISTRY_NAME, {'bundle': staged}, {'bundle': BUNDLE_FILE}, metrics={
+        'locations': len(assignments),
+        'ownModels': sum(1 for key in assignments.values() if key != GLOBAL_MODEL),
+        'samples': int(len(data))
+    })
+    shutil.rmtree(staging_dir)
+
+    # Every location was gated against the global model above
+    promoted, message = promote(REGISTRY_NAME, manifest['hash'], force=True, reason='per-location holdout gate')
+
+    print(f"\nBundle: {BUNDLE_FILE} ({manifest['sizeBytes'] / 1024:.0f} KB, "
+          f"{len(set(assignments.values()))} models for {len(assignments)} locations)")
+    print(f"   {message} (undo with: python model_registry.py rollback {REGISTRY_NAME})")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,286 @@
+"""
+Compact the Append-Only Training Event Log
+
+api/ml/data-logger.js appends two kinds of events to training-events/events-YYYY-MM-DD.jsonl:
+  - reservation_created: reservation + customer features + ML prediction
+  - outcome: showed_up / no_show / cancelled for a reservation_id
+
+This script joins them into restaurant_training_data.csv - one deduplicated row
+per reservation, latest outcome wins - which retrain_custom_model.py trains on.
+
+Compaction is incremental: compaction_state.json records how many bytes of each
+segment were already applied, so each run only reads events written since the
+last one and merges them into the existing table.
+
+Usage:
+    python training_log.py            # incremental compaction
+    python training_log.py --full     # rebuild the table from every segment
+
+A full rebuild keeps table rows with no reservation_created event (rows written by
+the old CSV logger before the event log existed); every other row is rebuilt
+from its events.
+"""
+
+import sys
+import io
+if __name__ == '__main__':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+import argparse
+import json
+import os
+
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+EVENTS_DIR = os.path.join(BASE_DIR, 'training-events')
+TABLE_FILE = os.path.join(BASE_DIR, 'restaurant_training_data.csv')
+STATE_FILE = os.path.join(EVENTS_DIR, 'compaction_state.json')
+
+# Column order of restaurant_training_data.csv
+COLUMNS = [
+    'reservation_id',
+    'location_id',
+    'created_at',
+    'reservation_date',
+    'reservation_time',
+    'customer_email',
+    'customer_phone',
+    'customer_name',
+    'party_size',
+    'special_requests',
+    'booking_lead_time_hours',
+    'is_repeat_customer',
+    'customer_visit_count',
+    'customer_no_show_rate',
+    'days_since_last_visit',
+    'ml_predicted_probability',
+    'ml_predicted_risk_level',
+    'actual_outcome',
+    'outcome_timestamp',
+    'seated_at',
+    'completed_at'
+]
+
+OUTCOME_COLUMNS = ['actual_outcome', 'outcome_timestamp', 'seated_at', 'completed_at']
+
+OUTCOMES = ['pending', 'showed_up', 'no_show', 'cancelled']
+
+# Rows parsed per chunk when loading the table
+READ_CHUNK_ROWS = 100_000
+
+STRING_COLUMNS = [
+    'reservation_id', 'location_id', 'created_at', 'reservation_date', 'reservation_time',
+    'customer_email', 'customer_phone', 'customer_name', 'special_requests',
+    'ml_predicted_risk_level', 'outcome_timestamp', 'seated_at', 'completed_at'
+]
+
+NUMERIC_DTYPES = {
+    'party_size': 'int16',
+    'booking_lead_time_hours': 'float32',
+    'is_repeat_customer': 'int8',
+    'customer_visit_count': 'int32',
+    'customer_no_show_rate': 'float32',
+    'days_since_last_visit': 'float32',
+    'ml_predicted_probability': 'float32'
+}
+
+
+# ============================================================================
+# TYPED TABLE
+# ============================================================================
+
+def apply_types(df):
+    """Cast a training table to compact, consistent dtypes"""
+    df = df.reindex(columns=COLUMNS)
+
+    for column in STRING_COLUMNS:
+        df[column] = df[column].fillna('').astype(str)
+
+    for column, dtype in NUMERIC_DTYPES.items():
+        values = pd.to_numeric(df[column], errors='coerce')
+        if dtype.startswith('int'):
+            values = values.fillna(0)
+        df[column] = values.astype(dtype)
+
+    outcome = df['actual_outcome'].where(df['actual_outcome'].isin(OUTCOMES), 'pending')
+    df['actual_outcome'] = pd.Categorical(outcome, categories=OUTCOMES)
+    return df
+
+
+def load_training_table(table_file=TABLE_FILE):
+    """Load the compacted table with its dtypes (empty table if none yet)"""
+    if not os.path.exists(table_file):
+        return apply_types(pd.DataFrame(columns=COLUMNS))
+
+    # Typed chunk by chunk: the all-string parse of the whole file never exists at once
+    chunks = pd.read_csv(table_file, dtype=str, keep_default_na=False, chunksize=READ_CHUNK_ROWS)
+    return pd.concat([apply_types(chunk) for chunk in chunks], ignore_index=True)
+
+
+def write_training_table(df, table_file=TABLE_FILE):
+    """Write atomically so a crash never leaves a half-written table"""
+    tmp_file = table_file + '.tmp'
+    df.to_csv(tmp_file, index=False, columns=COLUMNS)
+    os.replace(tmp_file, table_file)
+
+
+# ============================================================================
+# EVENT SEGMENTS
+# ============================================================================
+
+def list_segments(events_dir=EVENTS_DIR):
+    if not os.path.isdir(events_dir):
+        return []
+    return sorted(
+        name for name in os.listdir(events_dir)
+        if name.startswith('events-') and name.endswith('.jsonl')
+    )
+
+
+def load_state(state_file=STATE_FILE):
+    if not os.path.exists(state_file):
+        return {'segments': {}, 'orphanOutcomes': []}
+    with open(state_file, 'r') as f:
+        return json.load(f)
+
+
+def save_state(state, state_file=STATE_FILE):
+    tmp_file = state_file + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_file, state_file)
+
+
+def read_new_events(state, events_dir=EVENTS_DIR):
+    """
+    Read events appended since the offsets in `state`.
+
+    Only complete lines are consumed; a line still being written is left for
+    the next run. Returns (events, new_offsets).
+    """
+    events = []
+    offsets = dict(state.get('segments', {}))
+
+    for segment in list_segments(events_dir):
+        path = os.path.join(events_dir, segment)
+        start = offsets.get(segment, 0)
+        if os.path.getsize(path) <= start:
+            continue
+
+        with open(path, 'rb') as f:
+            f.seek(start)
+            chunk = f.read()
+
+        complete = chunk[:chunk.rfind(b'\n') + 1]
+        for line in complete.splitlines():
+            if line.strip():
+                events.append(json.loads(line))
+
+        offsets[segment] = start + len(complete)
+
+    return events, offsets
+
+
+# ============================================================================
+# COMPACTION
+# ============================================================================
+
+def merge_events(table, events, orphan_outcomes=()):
+    """
+    Merge new events into the table.
+
+    New reservations are upserted (latest event per reservation_id wins), then
+    outcomes are applied in log order. Outcomes whose reservation has not been
+    logged yet are returned as orphans and retried on the next compaction.
+    """
+    created = [e for e in events if e.get('type') == 'reservation_created']
+    outcomes = list(orphan_outcomes) + [e for e in events if e.get('type') == 'outcome']
+
+    table = table.astype({'actual_outcome': str}).drop_duplicates('reservation_id', keep='last')
+
+    if created:
+        new_rows = pd.DataFrame(created).drop_duplicates('reservation_id', keep='last')
+        new_rows = new_rows.reindex(columns=[c for c in COLUMNS if c not in OUTCOME_COLUMNS])
+
+        # A re-logged reservation keeps any outcome it already has
+        replaced = table['reservation_id'].isin(new_rows['reservation_id'])
+        new_rows = new_rows.merge(table.loc[replaced, ['reservation_id'] + OUTCOME_COLUMNS], how='left', on='reservation_id')
+        new_rows['actual_outcome'] = new_rows['actual_outcome'].fillna('pending')
+
+        table = pd.concat([table[~replaced], new_rows], ignore_index=True)
+
+    table = table.set_index('reservation_id', drop=False)
+
+    orphans = []
+    if outcomes:
+        latest = pd.DataFrame(outcomes).drop_duplicates('reservation_id', keep='last')
+        latest = latest.set_index('reservation_id').reindex(columns=OUTCOME_COLUMNS).fillna('')
+
+        known = latest.index.isin(table.index)
+        orphan_ids = set(latest.index[~known])
+        orphans = [o for o in outcomes if o['reservation_id'] in orphan_ids]
+
+        matched = latest[known]
+        table.loc[matched.index, OUTCOME_COLUMNS] = matched[OUTCOME_COLUMNS].to_numpy()
+
+    return apply_types(table.reset_index(drop=True)), orphans
+
+
+def compact(full=False, events_dir=EVENTS_DIR, table_file=TABLE_FILE, state_file=STATE_FILE):
+    """Run one compaction pass; returns a summary dict"""
+    state = {'segments': {}, 'orphanOutcomes': []} if full else load_state(state_file)
+
+    events, offsets = read_new_events(state, events_dir)
+    table = load_training_table(table_file)
+    if full:
+        # Rows with no reservation_created event (pre-event-log history) have nothing to be rebuilt from
+        logged = {e.get('reservation_id') for e in events if e.get('type') == 'reservation_created'}
+        table = table[~table['reservation_id'].isin(logged)].reset_index(drop=True)
+
+    rows_before = len(table)
+    table, orphans = merge_events(table, events, state.get('orphanOutcomes', []))
+
+    write_training_table(table, table_file)
+    os.makedirs(events_dir, exist_ok=True)
+    save_state({'segments': offsets, 'orphanOutcomes': orphans}, state_file)
+
+    return {
+        'events': len(events),
+        'newReservations': len(table) - rows_before,
+        'rows': len(table),
+        'orphanOutcomes': len(orphans),
+        'outcomes': table['actual_outcome'].value_counts().to_dict()
+    }
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Compact the training event log into the training table')
+    parser.add_argument('--full', action='store_true', help='Rebuild from every segment instead of new events only')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("TRAINING LOG COMPACTION" + (" (FULL REBUILD)" if args.full else ""))
+    print("=" * 80)
+
+    summary = compact(full=args.full)
+
+    print(f"\nEvents processed: {summary['events']:,}")
+    print(f"New reservations: {summary['newReservations']:,}")
+    print(f"Table rows: {summary['rows']:,}")
+    for outcome in OUTCOMES:
+        print(f"   - {outcome}: {summary['outcomes'].get(outcome, 0):,}")
+    if summary['orphanOutcomes']:
+        print(f"Outcomes waiting for their reservation: {summary['orphanOutcomes']}")
+
+    print(f"\nTable written: {TABLE_FILE}")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,329 @@
+"""
+Data-Driven Waitlist Wait Estimates
+
+calculateEstimatedWait in api/waitlist.js quotes 15 minutes per party ahead
+plus a bump for large parties. Quotes that run long are what make guests walk
+away. This script replays past waitlist entries against the Service Records
+timeline. It rebuilds what was known when each guest was quoted:
+
+    queue position    Priority - 1 (waitlist.js stores the queue length + 1)
+    party size        small (< 4), medium (4-5), large (6+), like the formula
+    tables turning    parties seated >= TURNING_AFTER_MINUTES ago and still at the table
+    hour              local hour the guest was added
+
+It then fits the minutes until the guest was notified (Notified At - Added At)
+by median regression. That is the MAE-optimal linear fit, so one long wait does
+not drag every quote up. The coefficients are exported to
+api/_lib/wait-time-model.js:
+
+    minutes = byHour[hour] + perPartyAhead * position + perTurningTable * turning + partyOffsets[size]
+
+so a quote is a handful of multiply-adds. Hours with fewer than MIN_HOUR_SAMPLES
+entries use the overall intercept.
+
+Backtest: fit on all but the last BACKTEST_FRACTION of service days and compare
+on those days: MAE of the model, of the current formula and of the quote
+actually stored (which includes host overrides), plus how often each
+under-quotes by more than UNDERQUOTE_MINUTES. The exported model is refitted
+on every day.
+
+Usage:
+    python wait_times.py                                       # Waitlist + Service Records from Airtable
+    python wait_times.py --waitlist waitlist.csv --service-records service.csv
+    python wait_times.py --backtest-fraction 0.3
+
+CSV inputs use the Airtable field names as columns.
+"""
+
+import sys
+import io
+if __name__ == '__main__':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+import argparse
+import json
+import os
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.join(BASE_DIR, '..', 'scripts')
+
+OUTPUT_FILE = '../api/_lib/wait-time-model.js'
+REPORT_FILE = 'wait_times_report.json'
+
+RESTAURANT_TIMEZONE = 'Europe/Amsterdam'
+
+# A seated party counts as "turning" once it has been at the table this long
+TURNING_AFTER_MINUTES = 60
+
+# Hours with fewer entries share the overall intercept
+MIN_HOUR_SAMPLES = 30
+
+BACKTEST_FRACTION = 0.25
+UNDERQUOTE_MINUTES = 10
+
+# Waits outside this range are data errors (never notified, notified by mistake)
+MAX_WAIT_MINUTES = 240
+
+# Quotes are rounded to 5 minutes and clamped, as in waitlist.js
+QUOTE_STEP = 5
+MIN_QUOTE = 5
+MAX_QUOTE = 180
+
+HOURS = 24
+
+WAITLIST_FIELDS = ['Party Size', 'Added At', 'Notified At', 'Priority', 'Estimated Wait', 'Status']
+SERVICE_FIELDS = ['Seated At', 'Departed At', 'Status']
+
+
+# ============================================================================
+# LOADING
+# ============================================================================
+
+def fetch_records(table_name, fields):
+    """Every record of a table from Airtable, as a DataFrame of the requested fields"""
+    sys.path.insert(0, SCRIPTS_DIR)
+    import airtable_client
+
+    table_id = {'waitlist': airtable_client.WAITLIST_TABLE_ID,
+                'service': airtable_client.SERVICE_RECORDS_TABLE_ID}[table_name]
+    records = airtable_client.AirtableClient().list_records(table_id, fields=fields)
+    return pd.DataFrame([r['fields'] for r in records], columns=fields)
+
+
+def _timestamps(values):
+    return pd.to_datetime(values, utc=True, errors='coerce', format='ISO8601')
+
+
+# ============================================================================
+# REPLAY
+# ============================================================================
+
+def party_bucket(party_size):
+    """0 = small (< 4), 1 = medium (4-5), 2 = large (6+)"""
+    party_size = np.asarray(party_size)
+    return np.select([party_size >= 6, party_size >= 4], [2, 1], default=0)
+
+
+def turning_tables(at, seated, departed, chunk=2048):
+    """
+    Parties seated at least TURNING_AFTER_MINUTES before each time in `at` and
+    not yet departed (NaT departure = still seated), counted with chunked
+    broadcasting.
+    """
+    at = at.to_numpy(dtype='datetime64[ns]')
+    turning_from = (seated + pd.Timedelta(minutes=TURNING_AFTER_MINUTES)).to_numpy(dtype='datetime64[ns]')
+    departed = departed.fillna(pd.Timestamp.max.tz_localize('UTC')).to_numpy(dtype='datetime64[ns]')
+
+    valid = ~np.isnat(turning_from)
+    turning_from, departed = turning_from[valid], departed[valid]
+
+    counts = np.zeros(len(at), dtype=int)
+    for start in range(0, len(at), chunk):
+        t = at[start:start + chunk, None]
+        counts[start:start + chunk] = ((turning_from <= t) & (departed > t)).sum(axis=1)
+    return counts
+
+
+def replay_waitlist(waitlist, service_records):
+    """
+    One row per notified waitlist entry: the state at the time it was quoted
+    and the minutes until its table was ready.
+    """
+    added = _timestamps(waitlist['Added At'])
+    notified = _timestamps(waitlist['Notified At'])
+    wait = (notified - added).dt.total_seconds() / 60
+
+    frame = pd.DataFrame({
+        'added_at': added,
+        'position': pd.to_numeric(waitlist['Priority'], errors='coerce') - 1,
+        'party_size': pd.to_numeric(waitlist['Party Size'], errors='coerce'),
+        'quoted': pd.to_numeric(waitlist['Estimated Wait'], errors='coerce'),
+        'wait': wait
+    })
+    frame = frame[frame[['added_at', 'position', 'party_size', 'wait']].notna().all(axis=1)
+                  & frame['wait'].between(0, MAX_WAIT_MINUTES) & (frame['position'] >= 0)]
+    frame = frame.sort_values('added_at', kind='stable').reset_index(drop=True)
+
+    local = frame['added_at'].dt.tz_convert(RESTAURANT_TIMEZONE)
+    frame['date'] = local.dt.tz_localize(None).dt.normalize()
+    frame['hour'] = local.dt.hour
+    frame['party'] = party_bucket(frame['party_size'])
+    frame['turning'] = turning_tables(
+        frame['added_at'], _timestamps(service_records['Seated At']), _timestamps(service_records['Departed At'])
+    )
+    return frame
+
+
+# ============================================================================
+# MODEL
+# ============================================================================
+
+def formula_quote(position, party_size):
+    """calculateEstimatedWait's fixed formula, vectorized"""
+    wait = np.asarray(position) * 15 + np.array([0, 5, 10])[party_bucket(party_size)]
+    return np.maximum(np.ceil(wait / 5) * 5, 10)
+
+
+def fit_wait_model(frame):
+    """Median regression on position, turning, party bucket and well-sampled hours"""
+    from sklearn.linear_model import QuantileRegressor
+
+    counts = frame['hour'].value_counts()
+    hours = sorted(counts[counts >= MIN_HOUR_SAMPLES].index)[1:]  # the first well-sampled hour is the baseline
+
+    columns = [frame['position'], frame['turning'], frame['party'] == 1, frame['party'] == 2]
+    columns += [frame['hour'] == hour for hour in hours]
+    X = np.column_stack(columns).astype(float)
+
+    regressor = QuantileRegressor(quantile=0.5, alpha=0.0, solver='highs').fit(X, frame['wait'])
+    coef = regressor.coef_
+
+    by_hour = np.full(HOURS, regressor.intercept_)
+    for hour, offset in zip(hours, coef[4:]):
+        by_hour[hour] += offset
+
+    return {
+        'byHour': np.round(by_hour, 2).tolist(),
+        'perPartyAhead': round(float(coef[0]), 3),
+        'perTurningTable': round(float(coef[1]), 3),
+        'partyOffsets': [0.0, round(float(coef[2]), 2), round(float(coef[3]), 2)],
+        'defaultTurning': int(frame['turning'].median())
+    }
+
+
+def model_quote(model, frame):
+    """What waitlist.js quotes with the exported model"""
+    minutes = (np.asarray(model['byHour'])[frame['hour']]
+               + model['perPartyAhead'] * frame['position']
+               + model['perTurningTable'] * frame['turning']
+               + np.asarray(model['partyOffsets'])[frame['party']])
+    # Math.round semantics (round half up)
+    return np.clip(np.floor(minutes / QUOTE_STEP + 0.5) * QUOTE_STEP, MIN_QUOTE, MAX_QUOTE)
+
+
+def quote_errors(quote, wait):
+    error = np.asarray(wait) - np.asarray(quote)
+    return {
+        'mae': round(float(np.abs(error).mean()), 2),
+        'underQuotedRate': round(float((error > UNDERQUOTE_MINUTES).mean()), 3)
+    }
+
+
+def backtest(frame, fraction=BACKTEST_FRACTION):
+    """Fit on the earlier service days, score the last `fraction` of them"""
+    days = np.sort(frame['date'].unique())
+    cutoff = days[int(len(days) * (1 - fraction))]
+    train, test = frame[frame['date'] < cutoff], frame[frame['date'] >= cutoff]
+
+    model = fit_wait_model(train)
+    result = {
+        'trainEntries': int(len(train)),
+        'testEntries': int(len(test)),
+        'testFrom': str(pd.Timestamp(cutoff).date()),
+        'model': quote_errors(model_quote(model, test), test['wait']),
+        'formula': quote_errors(formula_quote(test['position'], test['party_size']), test['wait'])
+    }
+
+    quoted = test['quoted'].notna()
+    if quoted.any():
+        result['storedQuote'] = quote_errors(test.loc[quoted, 'quoted'], test.loc[quoted, 'wait'])
+    return result
+
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def write_js_module(model, info, output_file=OUTPUT_FILE):
+    payload = {**info, 'timezone': RESTAURANT_TIMEZONE, 'turningAfterMinutes': TURNING_AFTER_MINUTES,
+               'quoteStep': QUOTE_STEP, 'minQuote': MIN_QUOTE, 'maxQuote': MAX_QUOTE, **model}
+
+    module_js = f"""/**
+ * Waitlist Wait-Time Model (Inline for Serverless Compatibility)
+ *
+ * GENERATED by ml-training-data/wait_times.py - do not edit by hand.
+ *
+ * minutes = byHour[hour] + perPartyAhead * partiesAhead
+ *         + perTurningTable * turningTables + partyOffsets[small | medium | large]
+ *
+ * Generated: {info['generatedAt']} ({info['samples']} waitlist entries)
+ */
+
+module.exports = {json.dumps(payload)};
+"""
+
+    tmp_file = output_file + '.tmp'
+    with open(tmp_file, 'w') as f:
+        f.write(module_js)
+    os.replace(tmp_file, output_file)
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Fit and backtest the waitlist wait-time model')
+    parser.add_argument('--waitlist', default=None, help='Waitlist CSV (default: fetch from Airtable)')
+    parser.add_argument('--service-records', default=None, help='Service Records CSV (default: fetch from Airtable)')
+    parser.add_argument('--backtest-fraction', type=float, default=BACKTEST_FRACTION,
+                        help='Share of the most recent service days held out')
+    parser.add_argument('--output', default=OUTPUT_FILE, help='JS module for the API')
+    parser.add_argument('--report', default=REPORT_FILE, help='Backtest report (JSON)')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("WAITLIST WAIT-TIME MODEL")
+    print("=" * 80)
+
+    waitlist = pd.read_csv(args.waitlist) if args.waitlist else fetch_records('waitlist', WAITLIST_FIELDS)
+    service_records = (pd.read_csv(args.service_records) if args.service_records
+                       else fetch_records('service', SERVICE_FIELDS))
+
+    frame = replay_waitlist(waitlist, service_records)
+    n_days = frame['date'].nunique()
+    print(f"\nNotified waitlist entries: {len(frame):,} of {len(waitlist):,} over {n_days} service day(s)")
+    print(f"Service records: {len(service_records):,}")
+
+    if n_days < 2 or len(frame) < MIN_HOUR_SAMPLES:
+        print(f"\nNeed at least {MIN_HOUR_SAMPLES} notified entries over 2+ days - nothing written")
+        sys.exit(1)
+
+    result = backtest(frame, args.backtest_fraction)
+    print(f"\nBacktest: fitted on {result['trainEntries']:,}, tested on {result['testEntries']:,} entries from {result['testFrom']}")
+    print(f"   {'quote':<14} {'MAE (min)':>10} {f'> {UNDERQUOTE_MINUTES} min short':>16}")
+    for name, key in [('model', 'model'), ('formula', 'formula'), ('stored quote', 'storedQuote')]:
+        if key in result:
+            print(f"   {name:<14} {result[key]['mae']:>10.1f} {result[key]['underQuotedRate']:>16.1%}")
+
+    model = fit_wait_model(frame)
+    print(f"\nModel: {model['perPartyAhead']:+.1f} min per party ahead, {model['perTurningTable']:+.1f} per turning table, "
+          f"party offsets {model['partyOffsets'][1]:+.1f} / {model['partyOffsets'][2]:+.1f}")
+
+    generated_at = datetime.now(timezone.utc).isoformat()
+    report = {'createdAt': generated_at, 'samples': int(len(frame)), 'days': int(n_days),
+              'backtest': result, 'model': model}
+
+    tmp_file = args.report + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(report, f, indent=2)
+    os.replace(tmp_file, args.report)
+    print(f"\nReport written: {args.report}")
+
+    if result['model']['mae'] >= result['formula']['mae']:
+        print("\nModel does not beat the current formula on the backtest - API module NOT written")
+        sys.exit(1)
+
+    write_js_module(model, {'generatedAt': generated_at, 'samples': int(len(frame)),
+                            'backtestMae': result['model']['mae'], 'formulaMae': result['formula']['mae']}, args.output)
+
+    print(f"API module written: {args.output}")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
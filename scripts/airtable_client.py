@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Shared Airtable client for the Python maintenance scripts
+
+- One pooled requests.Session (keep-alive) for every call
+- list endpoints follow Airtable's `offset` cursor and stream records as a generator
+- deletes/updates go out in batches of 10 records per request (Airtable's maximum)
+- a token bucket keeps us under Airtable's 5 requests/second per base;
+  429 responses are retried after the 30s penalty window
+- small formula builders (equals, contains, older_than, all_of, any_of) so
+  filters run server-side and only the needed `fields` are requested
+
+Usage:
+    from airtable_client import AirtableClient, SERVICE_RECORDS_TABLE_ID
+
+    client = AirtableClient()   # reads AIRTABLE_API_KEY (and AIRTABLE_BASE_ID, if set)
+    for record in client.iter_records(SERVICE_RECORDS_TABLE_ID, filter_formula="{Status} = 'Active'"):
+        ...
+
+    stale = client.list_records(
+        WAITLIST_TABLE_ID,
+        filter_formula=older_than('Added At', hours=24),
+        fields=['Customer Name', 'Added At']
+    )
+    client.delete_records(SERVICE_RECORDS_TABLE_ID, [r['id'] for r in stale])
+"""
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+import requests
+from requests.adapters import HTTPAdapter
+
+API_URL = 'https://api.airtable.com/v0'
+BASE_ID = os.getenv('AIRTABLE_BASE_ID', 'appm7zo5vOf3c3rqm')  # one base per location
+
+RESERVATIONS_TABLE_ID = 'tbloL2huXFYQluomn'
+SERVICE_RECORDS_TABLE_ID = 'tblEEHaoicXQA7NcL'
+WAITLIST_TABLE_ID = 'tblkpCGy1z2YbJbOa'
+TABLES_TABLE_ID = 'tbl0r7fkhuoasis56'
+
+PAGE_SIZE = 100              # Airtable's maximum page size
+BATCH_SIZE = 10              # Airtable's maximum records per create/update/delete
+REQUESTS_PER_SECOND = 5      # Airtable's per-base rate limit
+RATE_LIMIT_PENALTY_SECONDS = 30
+MAX_RETRIES = 3
+
+
+class AirtableError(Exception):
+    """Non-2xx response from the Airtable API"""
+
+    def __init__(self, status_code, message):
+        super().__init__(f"Airtable API error {status_code}: {message}")
+        self.status_code = status_code
+        self.message = message
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens/second, bursts up to `capacity`"""
+
+    def __init__(self, rate=REQUESTS_PER_SECOND, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                wait = (1 - self.tokens) / self.rate
+
+            time.sleep(wait)
+
+
+def hours_since(timestamp, now):
+    """Hours between an Airtable ISO timestamp and `now` (None if missing/unparseable)"""
+    if not timestamp:
+        return None
+    try:
+        then = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if then.tzinfo is None:
+        then = then.replace(tzinfo=timezone.utc)
+    return (now - then).total_seconds() / 3600
+
+
+# ----------------------------------------------------------------------------
+# filterByFormula builders
+# ----------------------------------------------------------------------------
+
+def field_ref(name):
+    return '{' + name + '}'
+
+
+def quote(value):
+    """Formula literal: numbers as-is, everything else as an escaped string"""
+    if isinstance(value, bool):
+        return 'TRUE()' if value else 'FALSE()'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return "'" + str(value).replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+
+def equals(name, value):
+    return f"{field_ref(name)} = {quote(value)}"
+
+
+def contains(name, text):
+    """Case-sensitive substring match (like Python's `in`)"""
+    return f"FIND({quote(text)}, {field_ref(name)})"
+
+
+def older_than(name, hours):
+    """Date field more than `hours` before now (records with the field blank don't match)"""
+    minutes = round(hours * 60)
+    return f"IS_BEFORE({field_ref(name)}, DATEADD(NOW(), -{minutes}, 'minutes'))"
+
+
+def all_of(*clauses):
+    clauses = [c for c in clauses if c]
+    return clauses[0] if len(clauses) == 1 else f"AND({', '.join(clauses)})"
+
+
+def any_of(*clauses):
+    clauses = [c for c in clauses if c]
+    return clauses[0] if len(clauses) == 1 else f"OR({', '.join(clauses)})"
+
+
+def chunked(items, size=BATCH_SIZE):
+    """Split a list into consecutive chunks of at most `size` items"""
+    items = list(items)
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+class AirtableClient:
+    def __init__(self, api_key=None, base_id=BASE_ID, rate=REQUESTS_PER_SECOND):
+        api_key = api_key or os.getenv('AIRTABLE_API_KEY')
+        if not api_key:
+            raise ValueError('AIRTABLE_API_KEY is not set')
+
+        self.base_url = f'{API_URL}/{base_id}'
+        self.bucket = TokenBucket(rate)
+
+        self.session = requests.Session()
+        self.session.headers.update({'Authorization': f'Bearer {api_key}'})
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=10))
+
+    # ------------------------------------------------------------------------
+    # Transport
+    # ------------------------------------------------------------------------
+
+    def request(self, method, table_id, record_id=None, **kwargs):
+        """Rate-limited request against a table; returns the decoded JSON body"""
+        url = f'{self.base_url}/{table_id}' + (f'/{record_id}' if record_id else '')
+
+        for attempt in range(MAX_RETRIES + 1):
+            self.bucket.acquire()
+            response = self.session.request(method, url, **kwargs)
+
+            if response.status_code == 429 and attempt < MAX_RETRIES:
+                time.sleep(RATE_LIMIT_PENALTY_SECONDS)
+                continue
+
+            if not response.ok:
+                try:
+                    message = response.json().get('error', response.text)
+                except ValueError:
+                    message = response.text
+                raise AirtableError(response.status_code, message)
+
+            return response.json()
+
+    # ------------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------------
+
+    def iter_records(self, table_id, filter_formula=None, fields=None, sort=None, page_size=PAGE_SIZE):
+        """
+        Stream every matching record, following `offset` across pages.
+
+        fields: list of field names to return (others are not sent)
+        sort:   list of (field, 'asc' | 'desc') tuples
+        """
+        params = {'pageSize': page_size}
+        if filter_formula:
+            params['filterByFormula'] = filter_formula
+        if fields:
+            params['fields[]'] = list(fields)
+        for i, (field, direction) in enumerate(sort or []):
+            params[f'sort[{i}][field]'] = field
+            params[f'sort[{i}][direction]'] = direction
+
+        while True:
+            data = self.request('GET', table_id, params=params)
+            yield from data.get('records', [])
+
+            offset = data.get('offset')
+            if not offset:
+                return
+            params['offset'] = offset
+
+    def list_records(self, table_id, **kwargs):
+        """All matching records as a list (see iter_records for arguments)"""
+        return list(self.iter_records(table_id, **kwargs))
+
+    def get_record(self, table_id, record_id):
+        return self.request('GET', table_id, record_id)
+
+    # ------------------------------------------------------------------------
+    # Batched writes
+    # ------------------------------------------------------------------------
+
+    def update_records(self, table_id, updates):
+        """
+        PATCH records in batches of 10.
+
+        updates: list of {'id': ..., 'fields': {...}}
+        Returns the updated records.
+        """
+        updated = []
+        for batch in chunked(updates):
+            data = self.request('PATCH', table_id, json={'records': batch})
+            updated.extend(data.get('records', []))
+        return updated
+
+    def create_records(self, table_id, fields_list):
+        """Create records (list of field dicts) in batches of 10; returns the created records"""
+        created = []
+        for batch in chunked(fields_list):
+            data = self.request('POST', table_id, json={'records': [{'fields': f} for f in batch]})
+            created.extend(data.get('records', []))
+        return created
+
+    def delete_records(self, table_id, record_ids):
+        """Delete records in batches of 10; returns the IDs Airtable confirmed deleted"""
+        deleted = []
+        for batch in chunked(record_ids):
+            data = self.request('DELETE', table_id, params={'records[]': batch})
+            deleted.extend(r['id'] for r in data.get('records', []) if r.get('deleted'))
+        return deleted
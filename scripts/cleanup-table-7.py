@@ -2,28 +2,22 @@
 """
 Clean up Table 7 - Remove stale service_id reference
 """
-import os
-import requests
 import json
 
-AIRTABLE_API_KEY = os.getenv('AIRTABLE_API_KEY')
-BASE_ID = 'appm7zo5vOf3c3rqm'
-TABLES_TABLE_ID = 'tbl0r7fkhuoasis56'
+from airtable_client import AirtableClient, AirtableError, TABLES_TABLE_ID
+
+client = AirtableClient()
 
 # Step 1: Find Table 7
 filter_formula = "{table_number} = '7'"
-url = f'https://api.airtable.com/v0/{BASE_ID}/{TABLES_TABLE_ID}?filterByFormula={filter_formula}'
-headers = {'Authorization': f'Bearer {AIRTABLE_API_KEY}'}
 
 print("Step 1: Finding Table 7...")
-response = requests.get(url, headers=headers)
-data = response.json()
-
-if 'error' in data:
-    print(f"ERROR: {data['error']}")
+try:
+    records = client.list_records(TABLES_TABLE_ID, filter_formula=filter_formula)
+except AirtableError as e:
+    print(f"ERROR: {e.message}")
     exit(1)
 
-records = data.get('records', [])
 print(f"Found {len(records)} record(s)\n")
 
 if not records:
@@ -51,21 +45,20 @@ print(f"\nCleaning up Table 7...")
 print(f"   - Removing service_id: {current_service_id}")
 print(f"   - Setting status to 'Available'")
 
-update_url = f'https://api.airtable.com/v0/{BASE_ID}/{TABLES_TABLE_ID}/{table_record["id"]}'
 update_data = {
+    'id': table_record['id'],
     'fields': {
         'current_service_id': '',  # Clear the service ID
         'status': 'Available'       # Reset to available
     }
 }
 
-update_response = requests.patch(update_url, headers=headers, json=update_data)
-
-if update_response.status_code == 200:
+try:
+    updated = client.update_records(TABLES_TABLE_ID, [update_data])
     print("\nSUCCESS! Table 7 has been cleaned up.")
     print(f"Updated fields:")
-    print(json.dumps(update_response.json()['fields'], indent=2))
-else:
+    print(json.dumps(updated[0]['fields'], indent=2))
+except AirtableError as e:
     print(f"\nFAILED to update Table 7")
-    print(f"Status: {update_response.status_code}")
-    print(f"Response: {update_response.text}")
+    print(f"Status: {e.status_code}")
+    print(f"Response: {e.message}")
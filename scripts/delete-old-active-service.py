@@ -2,26 +2,36 @@
 """
 Find and delete old active service record with Service ID: SVC-20251025-5888
 """
-import os
-import requests
 from datetime import datetime, timezone
-import json
 
-AIRTABLE_API_KEY = os.getenv('AIRTABLE_API_KEY')
-BASE_ID = 'appm7zo5vOf3c3rqm'
-SERVICE_RECORDS_TABLE_ID = 'tblEEHaoicXQA7NcL'
-
-# Step 1: Find the record with filter
-filter_formula = "{Status} = 'Active'"
-url = f'https://api.airtable.com/v0/{BASE_ID}/{SERVICE_RECORDS_TABLE_ID}?filterByFormula={filter_formula}'
-headers = {'Authorization': f'Bearer {AIRTABLE_API_KEY}'}
-
-print("Step 1: Finding active service records...")
-response = requests.get(url, headers=headers)
-data = response.json()
-
-records = data.get('records', [])
-print(f"Found {len(records)} active service records\n")
+from airtable_client import (
+    AirtableClient,
+    AirtableError,
+    SERVICE_RECORDS_TABLE_ID,
+    all_of,
+    any_of,
+    contains,
+    equals,
+    older_than,
+)
+
+MAX_AGE_HOURS = 12
+
+client = AirtableClient()
+
+# Step 1: Find candidate records with filter (Active, and test customer or old)
+filter_formula = all_of(
+    equals('Status', 'Active'),
+    any_of(contains('Customer Name', 'Test'), older_than('Seated At', MAX_AGE_HOURS))
+)
+
+print("Step 1: Finding old/test active service records...")
+records = client.list_records(
+    SERVICE_RECORDS_TABLE_ID,
+    filter_formula=filter_formula,
+    fields=['Service ID', 'Customer Name', 'Seated At', 'Status']
+)
+print(f"Found {len(records)} candidate service records\n")
 
 # Step 2: Identify old test records
 now = datetime.now(timezone.utc)
@@ -57,7 +67,7 @@ for r in records:
         should_delete = True
         reason.append("Test customer")
 
-    if hours_ago > 12:
+    if hours_ago > MAX_AGE_HOURS:
         should_delete = True
         reason.append(f"Old record ({round(hours_ago, 1)}h)")
 
@@ -82,14 +92,17 @@ if records_to_delete:
     print(f"\n{'='*60}")
     print("Proceeding with deletion...")
 
-    for rec in records_to_delete:
-        delete_url = f'https://api.airtable.com/v0/{BASE_ID}/{SERVICE_RECORDS_TABLE_ID}/{rec["airtable_id"]}'
-        delete_response = requests.delete(delete_url, headers=headers)
+    try:
+        deleted = set(client.delete_records(SERVICE_RECORDS_TABLE_ID, [rec['airtable_id'] for rec in records_to_delete]))
+    except AirtableError as e:
+        print(f"❌ Batch delete failed: {e}")
+        deleted = set()
 
-        if delete_response.status_code == 200:
+    for rec in records_to_delete:
+        if rec['airtable_id'] in deleted:
             print(f"✅ Deleted: {rec['service_id']} ({rec['customer_name']})")
         else:
-            print(f"❌ Failed to delete {rec['service_id']}: {delete_response.text}")
+            print(f"❌ Failed to delete {rec['service_id']}")
 
     print(f"\n{'='*60}")
     print("Cleanup complete!")
@@ -2,23 +2,14 @@
 """
 Find old service records older than 12 hours
 """
-import os
 import sys
-import requests
 from datetime import datetime, timezone
 import json
 
-AIRTABLE_API_KEY = os.getenv('AIRTABLE_API_KEY')
-BASE_ID = 'appm7zo5vOf3c3rqm'
-SERVICE_RECORDS_TABLE_ID = 'tblEEHaoicXQA7NcL'
+from airtable_client import AirtableClient, SERVICE_RECORDS_TABLE_ID
 
-url = f'https://api.airtable.com/v0/{BASE_ID}/{SERVICE_RECORDS_TABLE_ID}'
-headers = {'Authorization': f'Bearer {AIRTABLE_API_KEY}'}
-
-response = requests.get(url, headers=headers)
-data = response.json()
-
-records = data.get('records', [])
+client = AirtableClient()
+records = client.list_records(SERVICE_RECORDS_TABLE_ID)
 now = datetime.now(timezone.utc)
 old_records = []
 
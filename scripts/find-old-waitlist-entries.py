@@ -1,29 +1,27 @@
 #!/usr/bin/env python3
 """
 Find old waitlist entries older than 24 hours
+
+The age filter runs in Airtable (filterByFormula), so only stale entries -
+and only the fields printed below - are downloaded.
 """
-import os
 import sys
-import requests
 from datetime import datetime, timezone
 import json
 
-AIRTABLE_API_KEY = os.getenv('AIRTABLE_API_KEY')
-BASE_ID = 'appm7zo5vOf3c3rqm'
-WAITLIST_TABLE_ID = 'tblkpCGy1z2YbJbOa'
-
-url = f'https://api.airtable.com/v0/{BASE_ID}/{WAITLIST_TABLE_ID}'
-headers = {'Authorization': f'Bearer {AIRTABLE_API_KEY}'}
+from airtable_client import AirtableClient, WAITLIST_TABLE_ID, older_than
 
-response = requests.get(url, headers=headers)
-data = response.json()
+MAX_AGE_HOURS = 24
 
-records = data.get('records', [])
+client = AirtableClient()
+records = client.list_records(
+    WAITLIST_TABLE_ID,
+    filter_formula=older_than('Added At', MAX_AGE_HOURS),
+    fields=['Added At', 'Customer Name', 'Status', 'Party Size']
+)
 now = datetime.now(timezone.utc)
 old_records = []
 
-print(f"Total waitlist entries: {len(records)}")
-
 for r in records:
     added_at = r['fields'].get('Added At', '')
     customer_name = r['fields'].get('Customer Name', 'N/A')
@@ -36,7 +34,7 @@ for r in records:
             added_time = datetime.fromisoformat(added_at.replace('Z', '+00:00'))
             hours_ago = (now - added_time).total_seconds() / 3600
 
-            if hours_ago > 24:
+            if hours_ago > MAX_AGE_HOURS:
                 old_records.append({
                     'id': r['id'],
                     'name': customer_name,
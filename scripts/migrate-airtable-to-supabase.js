@@ -95,7 +95,8 @@ async function migrateReservations() {
     ml_risk_level: r.fields['ML Risk Level'] || null,
     ml_confidence: r.fields['ML Confidence'] || null,
     ml_model_version: r.fields['ML Model Version'] || null,
-    ml_prediction_timestamp: r.fields['ML Prediction Timestamp'] || null
+    ml_prediction_timestamp: r.fields['ML Prediction Timestamp'] || null,
+    ml_risk_drivers: r.fields['ML Risk Drivers'] || null
   }));
 
   const { data, error } = await supabase
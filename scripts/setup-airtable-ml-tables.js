@@ -359,6 +359,10 @@ async function addMLFieldsToReservations(customerHistoryTableId) {
       name: 'ML Top Factors',
       type: 'multilineText'
     },
+    {
+      name: 'ML Risk Drivers',
+      type: 'multilineText'
+    },
     {
       name: 'ML Prediction Timestamp',
       type: 'dateTime',
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Reconcile floor state in one pass: service records, waitlist and tables
+
+Replaces running delete-old-active-service.py, find-old-waitlist-entries.py and
+cleanup-table-7.py one after another. All three tables are fetched concurrently,
+cross-referenced in memory, and fixes are applied as 10-record batches with
+bounded concurrency (the shared client's token bucket keeps us at 5 req/s).
+
+What gets fixed:
+  - Active service records seated > 12h ago, or for "Test" customers -> deleted
+  - Waitlist entries added > 24h ago -> deleted
+  - Tables whose Current Service ID is not a surviving Active service record
+    (or that are Occupied with no service at all) -> Available, ID cleared
+Active service records whose tables don't point back at them are reported only.
+
+Usage:
+    python scripts/sweep-floor-state.py                  # dry-run report
+    python scripts/sweep-floor-state.py --apply
+    python scripts/sweep-floor-state.py --service-hours 8 --waitlist-hours 12 --apply
+"""
+import argparse
+import asyncio
+import json
+import sys
+from datetime import datetime, timezone
+
+from airtable_client import (
+    AirtableClient,
+    AirtableError,
+    SERVICE_RECORDS_TABLE_ID,
+    TABLES_TABLE_ID,
+    WAITLIST_TABLE_ID,
+    chunked,
+    equals,
+    hours_since,
+    older_than,
+)
+
+SERVICE_MAX_HOURS = 12
+WAITLIST_MAX_HOURS = 24
+DEFAULT_CONCURRENCY = 4
+
+
+def parse_table_numbers(value):
+    """'Table IDs' is stored as a comma-separated string of table numbers (or a list)"""
+    if isinstance(value, list):
+        return [str(v).strip() for v in value if str(v).strip()]
+    return [v.strip() for v in str(value or '').split(',') if v.strip()]
+
+
+SERVICE_FIELDS = ['Service ID', 'Customer Name', 'Seated At', 'Table IDs']
+WAITLIST_FIELDS = ['Customer Name', 'Status', 'Added At']
+TABLE_FIELDS = ['Table Number', 'Current Service ID', 'Status']
+
+
+async def fetch_floor_state(client, waitlist_hours=WAITLIST_MAX_HOURS):
+    """
+    Fetch the three tables concurrently (each paginates on its own thread),
+    projected to the fields plan_sweep reads. Every Active service record and
+    every table is needed for cross-referencing; only stale waitlist entries are.
+    """
+    service_records, waitlist, tables = await asyncio.gather(
+        asyncio.to_thread(client.list_records, SERVICE_RECORDS_TABLE_ID,
+                          filter_formula=equals('Status', 'Active'), fields=SERVICE_FIELDS),
+        asyncio.to_thread(client.list_records, WAITLIST_TABLE_ID,
+                          filter_formula=older_than('Added At', waitlist_hours), fields=WAITLIST_FIELDS),
+        asyncio.to_thread(client.list_records, TABLES_TABLE_ID, fields=TABLE_FIELDS)
+    )
+    return service_records, waitlist, tables
+
+
+def plan_sweep(service_records, waitlist, tables, now, service_hours=SERVICE_MAX_HOURS, waitlist_hours=WAITLIST_MAX_HOURS):
+    """
+    Decide every fix from the fetched records (no I/O).
+
+    Returns a dict of deletions, table resets and report-only findings, each
+    entry carrying the reason it was selected.
+    """
+    plan = {'deleteServiceRecords': [], 'deleteWaitlist': [], 'resetTables': [], 'warnings': []}
+
+    kept_services = {}
+    for r in service_records:
+        fields = r['fields']
+        customer = fields.get('Customer Name', 'N/A')
+        age = hours_since(fields.get('Seated At'), now)
+
+        reasons = []
+        if 'Test' in customer:
+            reasons.append('Test customer')
+        if age is not None and age > service_hours:
+            reasons.append(f'Old record ({round(age, 1)}h)')
+
+        if reasons:
+            plan['deleteServiceRecords'].append({
+                'id': r['id'],
+                'service_id': fields.get('Service ID', 'N/A'),
+                'customer_name': customer,
+                'reason': ', '.join(reasons)
+            })
+        elif fields.get('Service ID'):
+            kept_services[fields['Service ID']] = r
+
+    for r in waitlist:
+        fields = r['fields']
+        age = hours_since(fields.get('Added At'), now)
+        if age is not None and age > waitlist_hours:
+            plan['deleteWaitlist'].append({
+                'id': r['id'],
+                'customer_name': fields.get('Customer Name', 'N/A'),
+                'status': fields.get('Status', 'N/A'),
+                'reason': f'Old entry ({round(age, 1)}h)'
+            })
+
+    table_service = {}
+    for t in tables:
+        fields = t['fields']
+        table_number = str(fields.get('Table Number', '')).strip()
+        service_id = fields.get('Current Service ID') or ''
+        status = fields.get('Status', 'Available')
+        table_service[table_number] = service_id
+
+        if service_id and service_id not in kept_services:
+            reason = f'Points at missing/stale service {service_id}'
+        elif not service_id and status == 'Occupied':
+            reason = 'Occupied with no service record'
+        else:
+            continue
+
+        plan['resetTables'].append({
+            'id': t['id'],
+            'table_number': table_number,
+            'reason': reason
+        })
+
+    for service_id, r in kept_services.items():
+        for table_number in parse_table_numbers(r['fields'].get('Table IDs')):
+            if table_service.get(table_number) != service_id:
+                plan['warnings'].append(
+                    f"Service {service_id} is seated at table {table_number}, "
+                    f"but the table points at {table_service.get(table_number) or 'nothing'}"
+                )
+
+    return plan
+
+
+async def apply_plan(client, plan, concurrency=DEFAULT_CONCURRENCY):
+    """Run every batch of the plan concurrently, at most `concurrency` in flight"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(description, func, *args):
+        async with semaphore:
+            try:
+                return description, await asyncio.to_thread(func, *args), None
+            except AirtableError as e:
+                return description, [], e
+
+    jobs = []
+    for batch in chunked(plan['deleteServiceRecords']):
+        jobs.append(run('service records', client.delete_records, SERVICE_RECORDS_TABLE_ID, [r['id'] for r in batch]))
+    for batch in chunked(plan['deleteWaitlist']):
+        jobs.append(run('waitlist', client.delete_records, WAITLIST_TABLE_ID, [r['id'] for r in batch]))
+    for batch in chunked(plan['resetTables']):
+        updates = [{'id': t['id'], 'fields': {'Status': 'Available', 'Current Service ID': ''}} for t in batch]
+        jobs.append(run('tables', client.update_records, TABLES_TABLE_ID, updates))
+
+    summary = {'service records': 0, 'waitlist': 0, 'tables': 0}
+    errors = []
+    for description, done, error in await asyncio.gather(*jobs):
+        summary[description] += len(done)
+        if error:
+            errors.append(f'{description}: {error}')
+
+    return summary, errors
+
+
+def print_report(plan):
+    print(f"{'='*60}")
+    print(f"Service records to delete: {len(plan['deleteServiceRecords'])}")
+    for r in plan['deleteServiceRecords']:
+        print(f"  - {r['service_id']} ({r['customer_name']}): {r['reason']}")
+
+    print(f"\nWaitlist entries to delete: {len(plan['deleteWaitlist'])}")
+    for r in plan['deleteWaitlist']:
+        print(f"  - {r['customer_name']} [{r['status']}]: {r['reason']}")
+
+    print(f"\nTables to reset to Available: {len(plan['resetTables'])}")
+    for t in plan['resetTables']:
+        print(f"  - Table {t['table_number']}: {t['reason']}")
+
+    if plan['warnings']:
+        print(f"\nWarnings (not changed): {len(plan['warnings'])}")
+        for warning in plan['warnings']:
+            print(f"  - {warning}")
+    print(f"{'='*60}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description='Reconcile service records, waitlist and tables in one pass')
+    parser.add_argument('--apply', action='store_true', help='Apply the fixes (default: dry-run report)')
+    parser.add_argument('--service-hours', type=float, default=SERVICE_MAX_HOURS, help='Max age of an Active service record')
+    parser.add_argument('--waitlist-hours', type=float, default=WAITLIST_MAX_HOURS, help='Max age of a waitlist entry')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, help='Batches in flight at once')
+    parser.add_argument('--json', action='store_true', help='Print the plan as JSON')
+    args = parser.parse_args()
+
+    client = AirtableClient()
+
+    print("Fetching service records, waitlist and tables...")
+    service_records, waitlist, tables = await fetch_floor_state(client, args.waitlist_hours)
+    print(f"Active service records: {len(service_records)}, stale waitlist entries: {len(waitlist)}, tables: {len(tables)}\n")
+
+    plan = plan_sweep(service_records, waitlist, tables, datetime.now(timezone.utc), args.service_hours, args.waitlist_hours)
+
+    if args.json:
+        print(json.dumps(plan, indent=2))
+    else:
+        print_report(plan)
+
+    if not args.apply:
+        print("\nDry run - re-run with --apply to make these changes")
+        return
+
+    summary, errors = await apply_plan(client, plan, args.concurrency)
+
+    print(f"\n✅ Deleted {summary['service records']} service record(s), {summary['waitlist']} waitlist entr(ies); "
+          f"reset {summary['tables']} table(s)")
+    for error in errors:
+        print(f"❌ {error}")
+
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())